@@ -0,0 +1,24 @@
+import importlib
+
+# Training, rendering and export code behind the optimizer examples of the article. The experiment scripts live in
+# two_dims/ and manifold/ and import from this package; the modules with a command line are run from the repository
+# root, e.g. python -m optimizers.bench.
+#
+# Submodules are imported on first access (optimizers.transport, ...), so importing the package, or a numpy-only
+# module like trajectory, does not pull in torch or the rendering backends.
+
+SUBMODULES = [
+    "batched", "bench", "bench_step", "build_data", "density", "divergence", "framestore", "keyframes", "landscape",
+    "losses", "metrics", "raster", "render", "replay", "scaling", "schedule", "serve", "stats", "stream", "sweep",
+    "train", "trajectory", "transport", "utils",
+]
+
+
+def __getattr__(name):
+    if(name in SUBMODULES):
+        return importlib.import_module("." + name, __name__)
+    raise AttributeError("module {0!r} has no attribute {1!r}".format(__name__, name))
+
+
+def __dir__():
+    return sorted(list(globals()) + SUBMODULES)
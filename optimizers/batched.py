@@ -0,0 +1,237 @@
+import math
+
+import numpy as np
+import torch
+import torch.nn as nn
+
+from .train import make_config, make_distribution, draw, CRITIC_FREE
+from .utils import Net
+from .schedule import make_schedule, learn_rate_scale
+
+# Train N independent generator/critic pairs at once. Every layer of every member is stacked into one
+# (N, in, out) weight tensor, so a step of all N members costs one batched matmul per layer instead of N small
+# forward passes. Members differ in their initialization seed and optionally in their learning rate; each has its
+# own RMSprop state, weight clipping and losses.
+#
+#   trainer = BatchedTrainer(CONFIG, seeds=range(32)).run()
+#   trainer.critic_loss        # (32,) tensor, one loss per member
+#   trainer.member_generator(3).forward(...)
+
+
+class BatchedNet(nn.Module):
+    def __init__(self, n_models, layer_dims, output="linear", seeds=None):
+        '''
+        :param n_models: number of stacked members
+        :param layer_dims: layer sizes, as for utils.Net
+        :param output: "linear" or "sigmoid"
+        :param seeds: one initialization seed per member
+        '''
+        super(BatchedNet, self).__init__()
+        self.n_models = n_models
+        self.layer_dims = list(layer_dims)
+        self.output = output
+        self.weights = nn.ParameterList()
+        self.biases = nn.ParameterList()
+        for i in range(1, len(layer_dims)):
+            self.weights.append(nn.Parameter(torch.empty((n_models, layer_dims[i - 1], layer_dims[i]))))
+            self.biases.append(nn.Parameter(torch.empty((n_models, 1, layer_dims[i]))))
+        self.reset_parameters(seeds)
+
+    def reset_parameters(self, seeds=None):
+        # same distribution as the nn.Linear default, drawn from each member's own generator
+        seeds = list(seeds) if seeds is not None else [None] * self.n_models
+        with torch.no_grad():
+            for k, seed in enumerate(seeds):
+                gen = torch.Generator()
+                if(seed is None):
+                    gen.seed()
+                else:
+                    gen.manual_seed(int(seed))
+                for w, b in zip(self.weights, self.biases):
+                    bound = 1 / math.sqrt(w.shape[1])
+                    w[k].uniform_(-bound, bound, generator=gen)
+                    b[k].uniform_(-bound, bound, generator=gen)
+
+    def forward(self, input):
+        '''
+        :param input: (n_models, batch, in) tensor
+        :return: (n_models, batch, out) tensor
+        '''
+        x = input
+        last = len(self.weights) - 1
+        for i, (w, b) in enumerate(zip(self.weights, self.biases)):
+            x = torch.baddbmm(b, x, w)
+            if(i < last):
+                x = torch.relu(x)
+        if(self.output == "sigmoid"):
+            x = torch.sigmoid(x)
+        return x
+
+    def clip_weights(self, clip):
+        '''
+        :param clip: scalar, or (n_models,) tensor for a per-member clip value
+        '''
+        with torch.no_grad():
+            for w in self.weights:
+                if(torch.is_tensor(clip)):
+                    bound = clip.reshape((-1, 1, 1))
+                    w.copy_(torch.minimum(torch.maximum(w, -bound), bound))
+                else:
+                    w.clamp_(-clip, clip)
+
+    def member(self, k):
+        '''
+        :return: a utils.Net with the weights of member k
+        '''
+        net = Net(self.layer_dims, output=self.output)
+        with torch.no_grad():
+            for layer, w, b in zip(net.linears, self.weights, self.biases):
+                layer.weight.copy_(w[k].t())
+                layer.bias.copy_(b[k, 0])
+        return net
+
+
+class BatchedRMSprop():
+    # torch.optim.RMSprop with a separate learning rate for every member
+    def __init__(self, params, lr, alpha=0.99, eps=1e-8):
+        '''
+        :param lr: (n_models,) learning rates
+        '''
+        self.params = list(params)
+        self.lr = torch.as_tensor(lr, dtype=torch.float)
+        self.alpha = alpha
+        self.eps = eps
+        self.square_avg = [torch.zeros_like(p) for p in self.params]
+
+    def zero_grad(self):
+        for p in self.params:
+            p.grad = None
+
+    @torch.no_grad()
+    def step(self):
+        for p, avg in zip(self.params, self.square_avg):
+            if(p.grad is None):
+                continue
+            avg.mul_(self.alpha).addcmul_(p.grad, p.grad, value=1 - self.alpha)
+            lr = self.lr.reshape((-1,) + (1,) * (p.dim() - 1))
+            p.sub_(lr * p.grad / (avg.sqrt() + self.eps))
+
+    def state_dict(self):
+        return {"lr": self.lr, "square_avg": self.square_avg}
+
+    def load_state_dict(self, state):
+        self.lr = state["lr"]
+        for avg, saved in zip(self.square_avg, state["square_avg"]):
+            avg.copy_(saved)
+
+
+class BatchedTrainer():
+    def __init__(self, config, seeds, learn_rates=None):
+        '''
+        :param config: config dict as for train.Trainer; learn_rate is used for members without their own
+        :param seeds: one seed per member; seeds[0] also seeds the shared sample stream
+        :param learn_rates: optional learning rate per member
+        '''
+        self.config = make_config(config)
+        c = self.config
+        if(c["loss"] in CRITIC_FREE):
+            raise ValueError("BatchedTrainer only supports the gan and wgan losses, not {0}".format(c["loss"]))
+        seeds = list(seeds)
+        self.n_models = n = len(seeds)
+        torch.manual_seed(seeds[0])
+        np.random.seed(seeds[0])
+
+        self.source = make_distribution(c["source"])
+        self.latent = make_distribution(c["latent"])
+        disc_output = c["disc_output"] or ("sigmoid" if c["loss"] == "gan" else "linear")
+        self.discriminator = BatchedNet(n, c["disc_layers"], output=disc_output, seeds=[s * 2 + 1 for s in seeds])
+        self.generator = BatchedNet(n, c["gen_layers"], output="linear", seeds=[s * 2 for s in seeds])
+
+        lr = learn_rates if learn_rates is not None else [c["learn_rate"]] * n
+        # the schedule scales every member's own rate
+        self.schedule = make_schedule(c)
+        self.base_lr = torch.as_tensor(lr, dtype=torch.float)
+        self.disc_optim = BatchedRMSprop(self.discriminator.parameters(), lr)
+        self.gen_optim = BatchedRMSprop(self.generator.parameters(), lr)
+
+        batch = c["sample_size"]
+        self.unit_buf = torch.empty((n * batch, c["gen_layers"][0]))
+        self.source_buf = torch.empty((n * batch, c["disc_layers"][0]))
+
+        self.iteration = 0
+        self.critic_loss = None
+        self.gen_loss = None
+        self.gen_samples = None
+
+    def draw(self, dist, buf):
+        # one call draws the batches of every member
+        return draw(dist, buf.shape[0], buf).reshape((self.n_models, self.config["sample_size"], -1))
+
+    def critic_step(self):
+        c = self.config
+        unit_samples = self.draw(self.latent, self.unit_buf)
+        source_samples = self.draw(self.source, self.source_buf)
+        with torch.no_grad():
+            gen_samples = self.generator(unit_samples)
+
+        self.disc_optim.zero_grad()
+        out = self.discriminator(torch.cat((source_samples, gen_samples), dim=1))
+        d_real, d_fake = out[:, :c["sample_size"]], out[:, c["sample_size"]:]
+        if(c["loss"] == "gan"):
+            loss = -torch.mean(torch.log(d_real) + torch.log(1 - d_fake), dim=(1, 2))
+        else:
+            loss = torch.mean(d_fake, dim=(1, 2)) - torch.mean(d_real, dim=(1, 2))
+        # members share no parameters, so the gradient of the sum is every member's own gradient
+        loss.sum().backward()
+        self.disc_optim.step()
+        if(c["loss"] == "wgan"):
+            self.discriminator.clip_weights(c["clip"])
+        self.critic_loss = loss.detach()
+
+    def generator_step(self):
+        c = self.config
+        unit_samples = self.draw(self.latent, self.unit_buf)
+        self.gen_optim.zero_grad()
+        self.discriminator.requires_grad_(False)
+        try:
+            gen_samples = self.generator(unit_samples)
+            d_fake = self.discriminator(gen_samples)
+            if(c["loss"] == "gan"):
+                loss = torch.mean(torch.log(1 - d_fake), dim=(1, 2))
+            else:
+                loss = -torch.mean(d_fake, dim=(1, 2))
+            loss.sum().backward()
+        finally:
+            # as in Net.generator_step, a failed pass must not leave the critics frozen
+            self.discriminator.requires_grad_(True)
+        self.gen_optim.step()
+        self.gen_loss = loss.detach()
+        self.gen_samples = gen_samples.detach()
+
+    def step(self):
+        for k in range(self.config["critic_steps"]):
+            self.critic_step()
+        self.generator_step()
+        self.iteration += 1
+
+    def run(self, callback=None):
+        '''
+        Train every member for the configured number of iterations.
+        :param callback: optional function called as callback(i, trainer) after every iteration
+        '''
+        c = self.config
+        for i in range(self.iteration, c["num_iter"]):
+            lr = self.base_lr * learn_rate_scale(self.schedule, i, c["num_iter"])
+            self.disc_optim.lr = self.gen_optim.lr = lr
+            self.step()
+            if(callback is not None):
+                callback(i, self)
+            if(c["verbose"] and i % c["log_every"] == 0):
+                print("Iter {0} - critic loss per member: {1}".format(i, np.round(self.critic_loss.numpy(), 4)))
+        return self
+
+    def member_generator(self, k):
+        return self.generator.member(k)
+
+    def member_discriminator(self, k):
+        return self.discriminator.member(k)
@@ -0,0 +1,289 @@
+import argparse
+import json
+import os
+import subprocess
+import time
+
+import numpy as np
+
+# Benchmarks for the hot paths of the training scripts. Each case is timed in calls per second and the results
+# are appended to a JSON history keyed by commit; a case which got slower than in the previous entry by more than
+# the threshold is flagged as a regression.
+#
+#   python -m optimizers.bench                        run everything, save to bench_history.json
+#   python -m optimizers.bench -k transport -k frame  only cases whose name contains one of the patterns
+#   python -m optimizers.bench --no-save              compare against the history without writing to it
+
+HISTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bench_history.json")
+
+BATCH_SIZES = [64, 1024, 65536]
+# critic and generator sizes used by the scripts
+NET_SIZES = [
+    [2, 512, 512, 512, 1],
+    [2, 256, 256, 256, 1],
+    [2, 32, 32, 32, 1],
+    [1, 128, 128, 128, 2],
+    [1, 32, 32, 32, 2],
+]
+TRANSPORT_BINS = [8, 64, 512, 2048]
+
+
+def timeit(fn, min_time=0.2, min_calls=3):
+    '''
+    :return: calls per second of fn, measured over at least min_time seconds after one warmup call
+    '''
+    fn()
+    calls = 0
+    start = time.perf_counter()
+    elapsed = 0
+    while(elapsed < min_time or calls < min_calls):
+        fn()
+        calls += 1
+        elapsed = time.perf_counter() - start
+    return calls / elapsed
+
+
+def sampler_cases(selected):
+    import torch
+    from .utils import Gaussian, LineGaussian, ManifoldGaussian, Uniform, random_frame
+    from .stream import SampleStream
+
+    dists = {
+        "gaussian": Gaussian(np.array([4, 4]), np.array([[0.5, -0.3], [-0.3, 0.5]])),
+        "line_gaussian": LineGaussian(np.array([2, 2]), np.array(2), np.array([1, -1])),
+        "uniform": Uniform(-1, 1, 2),
+        # a plane in the largest dimension of the scaling runs, see scaling.py
+        "manifold_gaussian_512": ManifoldGaussian(np.zeros(512), 1, random_frame(512, 2, 0)),
+    }
+    for name, dist in dists.items():
+        for n in BATCH_SIZES:
+            buf = torch.empty((n, dist.dim))
+            yield "sample/{0}/{1}".format(name, n), lambda dist=dist, n=n, buf=buf: dist.sample(n, out=buf)
+        # one batch of the training loop's block stream, drawn 128 batches at a time
+        if(selected("sample/{0}/stream64".format(name))):
+            stream = SampleStream(dist, 64, dist.dim, block=128)
+            yield "sample/{0}/stream64".format(name), stream.next
+
+
+def net_cases(selected):
+    import torch
+    from .utils import Net
+
+    for dims in NET_SIZES:
+        name = "x".join(str(d) for d in dims)
+        net = Net(dims)
+        batch = torch.randn((64, dims[0]))
+
+        def forward(net=net, batch=batch):
+            with torch.no_grad():
+                net.forward(batch)
+
+        def backward(net=net, batch=batch):
+            net.zero_grad(set_to_none=True)
+            net.forward(batch).mean().backward()
+
+        yield "net/forward/{0}".format(name), forward
+        yield "net/backward/{0}".format(name), backward
+        yield "net/clip_weights/{0}".format(name), lambda net=net: net.clip_weights(0.01)
+
+
+def step_cases(selected):
+    from . import bench_step
+
+    for fused, name in ((False, "step/legacy/2x512x512x512x1"), (True, "step/fused/2x512x512x512x1")):
+        if(selected(name)):
+            yield name, bench_step.make_iteration(fused=fused)
+
+    from .train import Trainer
+    # one critic-free generator update on the manifold network sizes
+    for loss in ("sliced", "sinkhorn"):
+        if(not selected("step/{0}/1x32x32x32x2".format(loss))):
+            continue
+        trainer = Trainer({"loss": loss, "source": {"type": "line_gaussian", "m": [2, 2], "s": 2, "slope": [1, -1]},
+                           "latent": {"type": "gaussian", "m": [0], "S": [[1]]}, "gen_layers": [1, 32, 32, 32, 2],
+                           "verbose": False, "seed": 0})
+        yield "step/{0}/1x32x32x32x2".format(loss), trainer.step
+
+
+def frame_cases(selected):
+    from .raster import FrameRenderer, BLUE, ORANGE
+    from .density import DensityGrid
+
+    mean = np.array([4, 4])
+    cov = np.array([[0.5, -0.3], [-0.3, 0.5]])
+    contour = FrameRenderer(xlim=(2, 6), ylim=(2, 6))
+    contour.contour(contour.gaussian(mean, cov), ORANGE, static=True)
+
+    def contour_frame():
+        contour.begin()
+        contour.contour(contour.gaussian(mean + 0.1, cov), BLUE)
+
+    scatter = FrameRenderer(xlim=(0, 4), ylim=(0, 4))
+    points = np.random.rand(50, 2) * 4
+
+    def scatter_frame():
+        scatter.begin()
+        scatter.scatter(points, BLUE)
+
+    yield "frame/surfacegaussian/contour", contour_frame
+    yield "frame/surfacegaussian/scatter", scatter_frame
+
+    for n in [5000, 1000000]:
+        if(not selected("frame/surfacemap/{0}".format(n))):
+            continue
+        samples = np.random.multivariate_normal(mean, cov, n)
+
+        def surfacemap(samples=samples):
+            DensityGrid(-8, 8, 0.01).add(samples).sparse()
+
+        yield "frame/surfacemap/{0}".format(n), surfacemap
+
+
+def landscape_cases(selected):
+    from .utils import Net
+    from .landscape import CriticGrid
+    # the critic of two_dims/wgan_nice_graph.py over the recorded grid
+    critic = Net([2, 256, 256, 256, 1])
+    for gradient in (False, True):
+        grid = CriticGrid((2, 6), (2, 6), resolution=64, gradient=gradient)
+        name = "gradient" if gradient else "value"
+        yield "landscape/{0}64".format(name), lambda grid=grid: grid.evaluate(critic)
+
+    records = ["landscape/record/{0}64".format(name) for name in ("value", "gradient")]
+    if(not selected("landscape/wgan_step/2x256x256x256x1") and not any(selected(name) for name in records)):
+        return
+    import tempfile
+    from .train import Trainer
+    from .landscape import LandscapeRecorder
+    # the overhead of recording a frame, against one iteration of two_dims/wgan_nice_graph.py it is recorded for
+    trainer = Trainer({"loss": "wgan", "source": {"type": "gaussian", "m": [4, 4], "S": [[0.5, -0.3], [-0.3, 0.5]]},
+                       "latent": {"type": "gaussian", "m": [0, 0], "S": np.eye(2)},
+                       "disc_layers": [2, 256, 256, 256, 1], "gen_layers": [2, 256, 256, 256, 2], "critic_steps": 5,
+                       "clip": 0.01, "sample_size": 64, "verbose": False, "seed": 0})
+    yield "landscape/wgan_step/2x256x256x256x1", trainer.step
+    directory = tempfile.mkdtemp()
+    for name, gradient in zip(records, (False, True)):
+        if(selected(name)):
+            recorder = LandscapeRecorder(os.path.join(directory, "critic{0}.pvfs".format(int(gradient))),
+                                         CriticGrid((2, 6), (2, 6), resolution=64, gradient=gradient))
+            yield name, lambda recorder=recorder: recorder.record(0, trainer.discriminator)
+
+
+def transport_cases(selected):
+    from . import transport
+
+    try:
+        import ot
+    except ImportError as e:
+        # the network simplex needs POT
+        ot = e
+
+    rng = np.random.RandomState(0)
+    for bins in TRANSPORT_BINS:
+        a = rng.randint(0, 10, bins).astype(float) + 1
+        b = rng.randint(0, 10, bins).astype(float) + 1
+        b *= a.sum() / b.sum()
+        yield "transport/exact_1d/{0}".format(bins), lambda a=a, b=b: transport.emd_1d(a, b)
+        if(bins <= 512):
+            yield ("transport/network_simplex/{0}".format(bins),
+                   ot if isinstance(ot, ImportError) else lambda a=a, b=b: transport.emd(a, b))
+            yield "transport/sinkhorn/{0}".format(bins), lambda a=a, b=b: transport.sinkhorn(a, b)
+
+    if(not selected("transport/service/cached64") and not selected("transport/service/sinkhorn_warm64")):
+        return
+    from .serve import PlanService
+    # a repeated query, and a sinkhorn query after editing two bins, of the plan service
+    service = PlanService()
+    a = rng.randint(0, 10, 64).astype(float) + 1
+    b = a[::-1].copy()
+    service.plan(a, b)
+    yield "transport/service/cached64", lambda: service.plan(a, b)
+    edited = [a.copy(), a.copy()]
+    edited[1][[3, 4]] += [1, -1]
+
+    def warm_query():
+        edited.reverse()
+        service.cache.clear()
+        service.plan(edited[0], b, method="sinkhorn")
+
+    yield "transport/service/sinkhorn_warm64", warm_query
+
+
+GROUPS = [sampler_cases, net_cases, step_cases, frame_cases, landscape_cases, transport_cases]
+
+
+def run(patterns=None, min_time=0.2):
+    '''
+    Each group yields (name, function to time) for the cases selected by name, or (name, ImportError) for a case
+    whose dependency is missing, and only builds the fixtures of the selected cases.
+    :param patterns: only run cases whose name contains one of these strings
+    :return: dict of case name -> calls per second
+    '''
+    def selected(name):
+        return not patterns or any(p in name for p in patterns)
+
+    results = {}
+    for group in GROUPS:
+        try:
+            cases = list(group(selected))
+        except ImportError as e:
+            print("{0:<48} skipped ({1})".format(group.__name__, e))
+            continue
+        for name, fn in cases:
+            if(not selected(name)):
+                continue
+            if(isinstance(fn, ImportError)):
+                print("{0:<48} skipped ({1})".format(name, fn))
+                continue
+            results[name] = timeit(fn, min_time)
+            print("{0:<48} {1:12.1f} /s".format(name, results[name]))
+    return results
+
+
+def current_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"],
+                                       cwd=os.path.dirname(os.path.abspath(__file__))).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def load_history(path):
+    if(not os.path.exists(path)):
+        return []
+    with open(path) as f:
+        return json.load(f)
+
+
+def regressions(results, history, threshold):
+    '''
+    Compare against the most recent entry of the history which measured each case.
+    :return: list of (name, previous, current) for cases that slowed down by more than threshold
+    '''
+    found = []
+    for name, value in results.items():
+        previous = [entry["results"][name] for entry in history if name in entry["results"]]
+        if(previous and value < previous[-1] * (1 - threshold)):
+            found.append((name, previous[-1], value))
+    return found
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the optimizers hot paths")
+    parser.add_argument("-k", dest="patterns", action="append", help="only run cases containing this string")
+    parser.add_argument("--history", default=HISTORY)
+    parser.add_argument("--threshold", type=float, default=0.1, help="relative slowdown reported as a regression")
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds to time each case for")
+    parser.add_argument("--no-save", action="store_true")
+    args = parser.parse_args()
+
+    results = run(args.patterns, args.min_time)
+    history = load_history(args.history)
+    slower = regressions(results, history, args.threshold)
+    for name, previous, value in slower:
+        print("REGRESSION {0}: {1:.1f}/s -> {2:.1f}/s ({3:+.0%})".format(name, previous, value, value / previous - 1))
+
+    if(not args.no_save):
+        history.append({"commit": current_commit(), "time": time.strftime("%Y-%m-%dT%H:%M:%S"), "results": results})
+        with open(args.history, "w") as f:
+            json.dump(history, f, indent=1)
@@ -0,0 +1,96 @@
+import time
+
+import numpy as np
+import torch
+import torch.nn as nn
+
+from .utils import Gaussian, Net
+
+# Compare the fused Net.critic_step / Net.generator_step against the loop the scripts used to run, on the
+# run_gan.py network sizes: python -m optimizers.bench_step
+
+SAMPLE_SIZE = 64
+CRITIC_STEPS = 5
+CLIP = 0.01
+LEARN_RATE = 0.00005
+
+
+def legacy_clip(net, clip):
+    for layer in net.out:
+        if(isinstance(layer, nn.Linear)):
+            layer.weight.data = np.clip(layer.weight.detach(), -clip, clip)
+
+
+def legacy_iteration(discriminator, generator, disc_optim, gen_optim, unit, source):
+    for k in range(CRITIC_STEPS):
+        unit_samples = torch.tensor(unit.sample(SAMPLE_SIZE).numpy(), dtype=torch.float)
+        source_samples = torch.tensor(source.sample(SAMPLE_SIZE).numpy(), dtype=torch.float)
+
+        gen_samples = generator.forward(unit_samples).detach()
+        w1_estim = torch.mean(discriminator.forward(gen_samples)) - torch.mean(discriminator.forward(source_samples))
+        w1_estim.backward()
+        disc_optim.step()
+        disc_optim.zero_grad()
+        gen_optim.zero_grad()
+        legacy_clip(discriminator, CLIP)
+
+    unit_samples = torch.tensor(unit.sample(SAMPLE_SIZE).numpy(), dtype=torch.float)
+    gen_samples = generator.forward(unit_samples)
+    w1_grad_estim = -torch.mean(discriminator.forward(gen_samples))
+    w1_grad_estim.backward()
+    gen_optim.step()
+    disc_optim.zero_grad()
+    gen_optim.zero_grad()
+
+
+def fused_iteration(discriminator, generator, disc_optim, gen_optim, unit, source, bufs):
+    unit_buf, source_buf = bufs
+    for k in range(CRITIC_STEPS):
+        with torch.no_grad():
+            gen_samples = generator.forward(unit.sample(SAMPLE_SIZE, out=unit_buf))
+        discriminator.critic_step(source.sample(SAMPLE_SIZE, out=source_buf), gen_samples, disc_optim, clip=CLIP)
+    generator.generator_step(discriminator, unit.sample(SAMPLE_SIZE, out=unit_buf), gen_optim)
+
+
+def make_iteration(fused, compile=None):
+    '''
+    :return: a function running one training iteration of fresh networks, either fused or as the legacy loop
+    '''
+    torch.manual_seed(0)
+    discriminator = Net([2, 512, 512, 512, 1], output="linear")
+    generator = Net([1, 128, 128, 128, 2], output="linear")
+    if(compile is not None):
+        discriminator.compile_forward(compile)
+        generator.compile_forward(compile)
+    disc_optim = torch.optim.RMSprop(discriminator.parameters(), lr=LEARN_RATE)
+    gen_optim = torch.optim.RMSprop(generator.parameters(), lr=LEARN_RATE)
+    unit = Gaussian(np.array([0]), np.eye(1))
+    source = Gaussian(np.array([2, 2]), np.array([[0.7, 0], [0, 0.1]]))
+    bufs = (torch.empty((SAMPLE_SIZE, 1)), torch.empty((SAMPLE_SIZE, 2)))
+
+    def run():
+        if(fused):
+            fused_iteration(discriminator, generator, disc_optim, gen_optim, unit, source, bufs)
+        else:
+            legacy_iteration(discriminator, generator, disc_optim, gen_optim, unit, source)
+    return run
+
+
+def bench(name, fused, compile=None, iters=50, warmup=5):
+    run = make_iteration(fused, compile)
+    for i in range(warmup):
+        run()
+    start = time.perf_counter()
+    for i in range(iters):
+        run()
+    elapsed = time.perf_counter() - start
+    print("{0:<24} {1:8.2f} it/s".format(name, iters / elapsed))
+    return iters / elapsed
+
+
+if __name__ == "__main__":
+    torch.set_num_threads(1)
+    base = bench("legacy loop", fused=False)
+    fused = bench("fused step", fused=True)
+    script = bench("fused step + script", fused=True, compile="script")
+    print("speedup: {0:.2f}x fused, {1:.2f}x scripted".format(fused / base, script / base))
@@ -0,0 +1,310 @@
+import argparse
+import ast
+import base64
+import hashlib
+import inspect
+import json
+import os
+import re
+import subprocess
+import sys
+
+import numpy as np
+
+# Rebuild the experiment entries of src/data.ts from the outputs of the scripts which produce them. Every entry is
+# keyed by a hash of its script with every module of this package it imports, its output files and the function
+# serializing them; entries whose hash is in the cache are written from the cache without reading their outputs, and
+# with --run only scripts which changed (or whose outputs are missing) are run again. Only the keys an entry produces
+# are replaced in data.ts, everything else in the file is left as it is.
+#
+#   python -m optimizers.build_data               rebuild every changed automatic entry
+#   python -m optimizers.build_data --run         also rerun the scripts of changed entries first
+#   python -m optimizers.build_data ganEasy       rebuild named entries, including manual ones
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+DATA_TS = os.path.join(ROOT, "..", "src", "data.ts")
+CACHE = os.path.join(ROOT, ".data_cache.json")
+
+
+def script_constants(script):
+    '''
+    :return: dict of the module level NAME = literal and NAME = np.array(literal) assignments of a script
+    '''
+    with open(os.path.join(ROOT, script)) as f:
+        tree = ast.parse(f.read())
+    found = {}
+    for node in tree.body:
+        if(not isinstance(node, ast.Assign) or len(node.targets) != 1 or not isinstance(node.targets[0], ast.Name)):
+            continue
+        value = node.value
+        if(isinstance(value, ast.Call) and ast.unparse(value.func) in ("np.array", "numpy.array") and value.args):
+            value = value.args[0]
+        try:
+            found[node.targets[0].id] = ast.literal_eval(value)
+        except ValueError:
+            pass
+    return found
+
+
+def read_bytes(path):
+    with open(os.path.join(ROOT, path), "rb") as f:
+        return f.read()
+
+
+def manifold_values(entry):
+    c = script_constants(entry["script"])
+    return {
+        "targetSlope": c["TARGET_SLOPE"],
+        "targetMean": c["TARGET_M"],
+        "pointsTrajectory": base64.b64encode(read_bytes(entry["outputs"][0])).decode(),
+    }
+
+
+def easy_values(entry):
+    c = script_constants(entry["script"])
+    # float64 first, so rounded float32 outputs serialize as 0.08 rather than 0.07999999821186066
+    mean, cov = [np.load(os.path.join(ROOT, path)).astype(np.float64) for path in entry["outputs"]]
+    return {
+        "targetMean": c["TARGET_M"],
+        "targetCov": c["TARGET_S"],
+        "mean": np.round(mean, 2).tolist(),
+        "cov": np.round(cov, 2).tolist(),
+    }
+
+
+# the article's example histograms, compared pairwise in the divergence tables
+ARTICLE_HISTOGRAMS = [
+    ("chisqr1", "leftHistBins"), ("chisqr1", "rightHistBins"),
+    ("chisqr2", "leftHistBins"), ("chisqr2", "centerHistBins"), ("chisqr2", "rightHistBins"),
+    ("entropyExs", "highEntropy"), ("entropyExs", "medEntropy"), ("entropyExs", "lowEntropy"),
+    ("xEntropyExs", "q"), ("simpleHist", "hist"),
+]
+
+
+def article_histograms():
+    with open(DATA_TS) as f:
+        text = f.read()
+    return {"{0}.{1}".format(name, key): get_value(text, [name], key) for name, key in ARTICLE_HISTOGRAMS}
+
+
+def divergence_values(entry):
+    from .divergence import tables
+    return tables(article_histograms())
+
+
+def transport_values(entry):
+    from .transport import solve
+    c = script_constants(entry["script"])
+    plan = solve(c["y"], c["x"], method="exact").toarray()
+    return {"opt_matrix": "\n".join(",".join(str(int(v)) for v in row) for row in plan)}
+
+
+# inputs optionally returns further bytes the entry depends on, for values read from data.ts itself.
+# manual entries are only rebuilt when named: the article's easy examples come from earlier runs than the frame
+# files in two_dims/, and the solver may return a different optimal plan of the same cost than the one shown
+ENTRIES = {
+    "wganManifold": {"path": ["optimizers", "wganManifold"], "script": "manifold/wgan_nice_graph.py",
+                     "outputs": ["manifold/w_points.traj"], "build": manifold_values},
+    "ganManifold": {"path": ["optimizers", "ganManifold"], "script": "manifold/gan_nice_graph.py",
+                    "outputs": ["manifold/g_points.traj"], "build": manifold_values},
+    "wganEasy": {"path": ["optimizers", "wganEasy"], "script": "two_dims/wgan_nice_graph.py",
+                 "outputs": ["two_dims/w_frame_mean.npy", "two_dims/w_frame_cov.npy"], "build": easy_values,
+                 "manual": True},
+    "ganEasy": {"path": ["optimizers", "ganEasy"], "script": "two_dims/gan_nice_graph.py",
+                "outputs": ["two_dims/frame_mean.npy", "two_dims/frame_cov.npy"], "build": easy_values,
+                "manual": True},
+    "transportEx": {"path": ["transportEx"], "script": "two_dims/mip_transport.py", "outputs": [],
+                    "build": transport_values, "manual": True},
+    "divergenceTables": {"path": ["divergenceTables"], "script": "divergence.py", "outputs": [],
+                         "inputs": lambda: json.dumps(article_histograms()).encode(), "build": divergence_values},
+}
+
+
+def digest(*parts):
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(hashlib.sha256(part).digest())
+    return h.hexdigest()
+
+
+def package_imports(source):
+    '''
+    :return: paths relative to ROOT of the modules of this package imported by source, as optimizers.name or
+             relative to the package
+    '''
+    names = []
+    for node in ast.walk(ast.parse(source)):
+        if(isinstance(node, ast.Import)):
+            names += [alias.name for alias in node.names]
+        elif(isinstance(node, ast.ImportFrom) and node.level == 0 and node.module):
+            names += [node.module] + [node.module + "." + alias.name for alias in node.names]
+        elif(isinstance(node, ast.ImportFrom) and node.level == 1):
+            module = "optimizers." + node.module if node.module else "optimizers"
+            names += [module] + [module + "." + alias.name for alias in node.names]
+    paths = [os.path.join(*name.split(".")[1:]) + ".py" for name in names if name.startswith("optimizers.")]
+    return sorted(set(path for path in paths if os.path.isfile(os.path.join(ROOT, path))))
+
+
+def package_sources(paths):
+    '''
+    :param paths: scripts or modules relative to ROOT
+    :return: paths and every module of this package they import, directly or through other modules, sorted
+    '''
+    found = set()
+    pending = list(paths)
+    while(pending):
+        path = pending.pop()
+        if(path not in found):
+            found.add(path)
+            pending += package_imports(read_bytes(path))
+    return sorted(found)
+
+
+def sources_hash(paths):
+    # the paths are hashed too, so moving code between modules changes the hash
+    return digest(*[part for path in paths for part in (path.encode(), read_bytes(path))])
+
+
+def script_hash(entry):
+    return sources_hash(package_sources([entry["script"]]))
+
+
+def entry_hash(entry):
+    # outputs which do not exist yet hash as empty, so the entry is rebuilt once they do
+    outputs = [read_bytes(p) if os.path.exists(os.path.join(ROOT, p)) else b"" for p in entry["outputs"]]
+    if("inputs" in entry):
+        outputs.append(entry["inputs"]())
+    build = inspect.getsource(entry["build"])
+    # the serializing function reads its values with modules of this package too, e.g. the transport solver
+    modules = sources_hash(package_sources(package_imports(build)))
+    return digest(script_hash(entry).encode(), build.encode(), modules.encode(), *outputs)
+
+
+def run_script(entry):
+    script = os.path.join(ROOT, entry["script"])
+    subprocess.check_call([sys.executable, os.path.basename(script)], cwd=os.path.dirname(script))
+
+
+def matching_brace(text, start):
+    '''
+    :return: index of the brace closing the one at start, skipping over string literals
+    '''
+    depth = 0
+    i = start
+    while(i < len(text)):
+        ch = text[i]
+        if(ch == '"'):
+            i = text.index('"', i + 1)
+            while(text[i - 1] == "\\"):
+                i = text.index('"', i + 1)
+        elif(ch == "{"):
+            depth += 1
+        elif(ch == "}"):
+            depth -= 1
+            if(depth == 0):
+                return i
+        i += 1
+    raise ValueError("Unbalanced braces in data.ts")
+
+
+def find_object(text, path):
+    '''
+    :return: (start, end) of the body of the object at path, e.g. ["optimizers", "wganManifold"]
+    '''
+    start, end = 0, len(text)
+    for depth, name in enumerate(path):
+        pattern = r"export const {0} = \{{" if depth == 0 else r'"{0}":\s*\{{'
+        match = re.compile(pattern.format(re.escape(name))).search(text, start, end)
+        if(match is None):
+            raise KeyError("{0} not found in data.ts".format(".".join(path[:depth + 1])))
+        start, end = match.end(), matching_brace(text, match.end() - 1)
+    return start, end
+
+
+def get_value(text, path, key):
+    '''
+    :return: the (single line, JSON) value of key in the object at path
+    '''
+    start, end = find_object(text, path)
+    match = re.compile(r'^[ \t]*"{0}":\s*(.*?),?$'.format(re.escape(key)), re.M).search(text, start, end)
+    if(match is None):
+        raise KeyError("{0}.{1} not found in data.ts".format(".".join(path), key))
+    return json.loads(match.group(1))
+
+
+def set_value(text, path, key, value):
+    '''
+    Replace the (single line) value of key in the object at path, or add the key at the end of the object. A
+    missing top level object is added at the end of the file.
+    '''
+    serialized = json.dumps(value)
+    if(not re.search(r"export const {0} = \{{".format(re.escape(path[0])), text)):
+        text = text.rstrip("\n") + "\n\nexport const {0} = {{\n}}".format(path[0])
+    start, end = find_object(text, path)
+    match = re.compile(r'^([ \t]*"{0}":\s*)(.*?)(,?)$'.format(re.escape(key)), re.M).search(text, start, end)
+    if(match is not None):
+        return text[:match.start(2)] + serialized + text[match.end(2):]
+    body = text[start:end].rstrip()
+    separator = "," if body.strip() and not body.endswith(",") else ""
+    indent = " " * 4 * len(path)
+    return text[:start] + body + separator + "\n" + indent + '"{0}": {1}'.format(key, serialized) \
+        + "\n" + " " * 4 * (len(path) - 1) + text[end:]
+
+
+def load_cache():
+    if(not os.path.exists(CACHE)):
+        return {}
+    with open(CACHE) as f:
+        return json.load(f)
+
+
+def build(names=None, run=False, force=False):
+    '''
+    :param names: entries to build, defaults to every automatic entry
+    :param run: rerun the scripts of entries whose script changed or whose outputs are missing
+    :param force: ignore the cache
+    :return: names of the entries whose values were rebuilt
+    '''
+    names = names or [name for name, entry in ENTRIES.items() if not entry.get("manual")]
+    cache = {} if force else load_cache()
+    with open(DATA_TS) as f:
+        original = f.read()
+    text = original
+    rebuilt = []
+    for name in names:
+        entry = ENTRIES[name]
+        cached = cache.get(name, {})
+        missing = any(not os.path.exists(os.path.join(ROOT, p)) for p in entry["outputs"])
+        if(run and (missing or cached.get("script") != script_hash(entry))):
+            print("{0}: running {1}".format(name, entry["script"]))
+            run_script(entry)
+        key = entry_hash(entry)
+        if(cached.get("hash") == key):
+            values = cached["values"]
+            print("{0}: cached".format(name))
+        else:
+            values = entry["build"](entry)
+            cache[name] = {"hash": key, "script": script_hash(entry), "values": values}
+            rebuilt.append(name)
+            print("{0}: rebuilt".format(name))
+        for k, v in values.items():
+            text = set_value(text, entry["path"], k, v)
+    if(text != original):
+        with open(DATA_TS, "w") as f:
+            f.write(text)
+        print("Updated {0}".format(os.path.normpath(DATA_TS)))
+    with open(CACHE, "w") as f:
+        json.dump(cache, f)
+    return rebuilt
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild the experiment entries of src/data.ts")
+    parser.add_argument("names", nargs="*", help="entries to build, of " + ", ".join(ENTRIES))
+    parser.add_argument("--run", action="store_true", help="rerun the scripts of changed entries")
+    parser.add_argument("--force", action="store_true", help="ignore the cache")
+    args = parser.parse_args()
+    unknown = [name for name in args.names if name not in ENTRIES]
+    if(unknown):
+        parser.error("unknown entries: {0}".format(", ".join(unknown)))
+    build(args.names, args.run, args.force)
@@ -0,0 +1,104 @@
+import numpy as np
+
+# Streaming 2D histogram of sample points on a regular grid. Batches are binned with one bincount call each and
+# only the per-cell counts are kept, so any number of samples can be folded into a frame.
+
+
+class DensityGrid():
+    def __init__(self, low, high, quant, max_dense_cells=2**24):
+        '''
+        :param low: lower corner of the grid, a scalar or one value per axis
+        :param high: upper corner of the grid, a scalar or one value per axis
+        :param quant: side length of a cell
+        :param max_dense_cells: above this many cells, counts are kept sparse instead of in a dense array
+        '''
+        self.low = np.broadcast_to(np.asarray(low, dtype=float), (2,)).copy()
+        self.high = np.broadcast_to(np.asarray(high, dtype=float), (2,)).copy()
+        self.quant = quant
+        self.shape = tuple(int(x) for x in np.round((self.high - self.low) / quant))
+        self.size = self.shape[0] * self.shape[1]
+        self.is_dense = self.size <= max_dense_cells
+        self.reset()
+
+    def reset(self):
+        self.total = 0
+        self.dropped = 0
+        if(self.is_dense):
+            self.counts = np.zeros(self.size, dtype=np.int64)
+        else:
+            self.cells = np.zeros(0, dtype=np.int64)
+            self.counts = np.zeros(0, dtype=np.int64)
+
+    def to_idx(self, points):
+        '''
+        :param points: (n, 2) array of coordinates
+        :return: (n,) flat cell indices, -1 for points outside of the grid
+        '''
+        idx = np.floor((np.asarray(points) - self.low) / self.quant).astype(np.int64)
+        inside = np.all((idx >= 0) & (idx < self.shape), axis=1)
+        flat = idx[:, 0] * self.shape[1] + idx[:, 1]
+        flat[~inside] = -1
+        return flat
+
+    def from_idx(self, rows, cols):
+        '''
+        :return: coordinates of the lower corner of the given cells
+        '''
+        return rows * self.quant + self.low[0], cols * self.quant + self.low[1]
+
+    def add(self, points):
+        '''
+        Bin a batch of points into the grid. Points outside of the grid are counted in self.dropped.
+        :param points: (n, 2) array of coordinates
+        '''
+        flat = self.to_idx(points)
+        flat = flat[flat >= 0]
+        self.dropped += len(points) - len(flat)
+        self.total += len(flat)
+        if(self.is_dense):
+            # bincount touches every cell, so small batches on large grids are added point by point instead
+            if(len(flat) * 8 < self.size):
+                np.add.at(self.counts, flat, 1)
+            else:
+                self.counts += np.bincount(flat, minlength=self.size)
+        else:
+            cells, inverse = np.unique(np.concatenate((self.cells, flat)), return_inverse=True)
+            weights = np.concatenate((self.counts, np.ones(len(flat), dtype=np.int64)))
+            self.counts = np.bincount(inverse, weights=weights).astype(np.int64)
+            self.cells = cells
+        return self
+
+    def sparse(self, normalize=True):
+        '''
+        :param normalize: divide the counts by the number of binned points
+        :return: (rows, cols, mass) arrays for the nonempty cells
+        '''
+        if(self.is_dense):
+            cells = np.flatnonzero(self.counts)
+            mass = self.counts[cells]
+        else:
+            cells, mass = self.cells, self.counts
+        if(normalize):
+            mass = mass / max(self.total, 1)
+        rows, cols = np.divmod(cells, self.shape[1])
+        return rows, cols, mass
+
+    def coords(self, normalize=True):
+        '''
+        :return: (x, y, mass) column vectors for the nonempty cells, with x and y the lower corner of each cell
+        '''
+        rows, cols, mass = self.sparse(normalize)
+        x, y = self.from_idx(rows, cols)
+        return x.reshape((-1, 1)), y.reshape((-1, 1)), mass.reshape((-1, 1))
+
+    def dense(self, normalize=True):
+        '''
+        :return: the grid as a shape[0] x shape[1] matrix, indexed [x, y]
+        '''
+        if(self.is_dense):
+            mat = self.counts.reshape(self.shape)
+            return mat / max(self.total, 1) if normalize else mat.copy()
+        mat = np.zeros(self.size)
+        rows, cols, mass = self.sparse(normalize)
+        mat[rows * self.shape[1] + cols] = mass
+        return mat.reshape(self.shape)
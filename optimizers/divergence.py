@@ -0,0 +1,88 @@
+import numpy as np
+
+# Divergences between histograms, vectorized over any number of leading batch dimensions: every function takes
+# arrays of shape (..., bins) and returns one value per histogram (pair), so thousands of candidate examples are
+# compared in a few array operations. Pairs broadcast, e.g. p[:, None] against q[None, :] gives every combination.
+#
+# Information quantities are in bits, as in the article's binary tree construction. Histograms are bin counts and
+# are normalized where a distribution is needed; chi_square works on the raw counts like the article's example.
+
+TABLE_FUNCTIONS = ["cross_entropy", "kl", "jsd", "chi_square", "w1"]
+
+
+def normalize(h):
+    h = np.asarray(h, dtype=np.float64)
+    return h / h.sum(axis=-1, keepdims=True)
+
+
+def xlogy(x, y):
+    # x * log2(y), with 0 * log(0) = 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(x == 0, 0.0, x * np.log2(np.where(x == 0, 1.0, y)))
+
+
+def entropy(h):
+    p = normalize(h)
+    return -np.sum(xlogy(p, p), axis=-1)
+
+
+def cross_entropy(h_p, h_q):
+    '''
+    Expected bits to encode samples of p with the code of q: -sum p log q. Infinite where q misses mass of p.
+    '''
+    return -np.sum(xlogy(normalize(h_p), normalize(h_q)), axis=-1)
+
+
+def kl(h_p, h_q):
+    '''
+    KL(p || q) = cross entropy - entropy. Infinite where q misses mass of p.
+    '''
+    p, q = np.broadcast_arrays(normalize(h_p), normalize(h_q))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.where(p == 0, 1.0, p / q)
+    return np.sum(xlogy(p, ratio), axis=-1)
+
+
+def jsd(h_p, h_q):
+    '''
+    Jensen-Shannon divergence, the mean KL of p and q to their average. Always finite, at most 1 bit.
+    '''
+    p, q = normalize(h_p), normalize(h_q)
+    m = (p + q) / 2
+    return (kl(p, m) + kl(q, m)) / 2
+
+
+def chi_square(h_observed, h_expected):
+    '''
+    Pearson's statistic sum (o - e)^2 / e over the raw counts. Infinite where an expected count is zero and the
+    observed one is not.
+    '''
+    o = np.asarray(h_observed, dtype=np.float64)
+    e = np.asarray(h_expected, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        terms = np.where(o == e, 0.0, (o - e) ** 2 / e)
+    return np.sum(terms, axis=-1)
+
+
+def w1(h_p, h_q):
+    '''
+    1-Wasserstein distance between the normalized histograms, with bins one unit apart: in 1D the optimal plan
+    moves exactly the difference of the cumulative masses across every bin boundary.
+    '''
+    return np.sum(np.abs(np.cumsum(normalize(h_p) - normalize(h_q), axis=-1)), axis=-1)
+
+
+def tables(histograms, decimals=4):
+    '''
+    Precompute every quantity between all pairs of a set of named histograms of equal length.
+    :param histograms: dict of name -> bin counts
+    :return: JSON-ready dict with the names, their entropies and one matrix per divergence, where row i and
+             column j holds the divergence of histogram i from histogram j
+    '''
+    names = list(histograms)
+    h = np.array([histograms[name] for name in names], dtype=np.float64)
+    result = {"names": names, "entropy": np.round(entropy(h), decimals).tolist()}
+    for name in TABLE_FUNCTIONS:
+        values = globals()[name](h[:, None, :], h[None, :, :])
+        result[name] = np.round(values, decimals).tolist()
+    return result
@@ -0,0 +1,145 @@
+import json
+import os
+import struct
+
+import numpy as np
+
+# Append-only frame store on a memory-mapped file, so long runs keep constant memory and everything written before
+# an interruption can be read back. Every record holds the training iteration and one array per field:
+#
+#   store = FrameStore("frames.pvfs", {"mean": (2,), "cov": (2, 2)})
+#   store.append(i, mean=mean, cov=cov)
+#   store["mean"][100:200]       # lazily read slice of the memmap
+#
+# Layout: b"PVFS", uint32 length of the JSON field description (plus any metadata of the writer), uint64 number of
+# records, the JSON, zero padding to 64 bytes, then the records. The record count in the header is only updated after
+# a record is written, so a partially written record is never read back. The file grows by doubling its capacity, and
+# closing a store that was written to trims the unused capacity.
+
+MAGIC = b"PVFS"
+VERSION = 1
+HEADER_ALIGN = 64
+
+
+def record_dtype(fields, dtype):
+    return np.dtype([("iteration", "<i8")] + [(name, dtype, tuple(shape)) for name, shape in fields])
+
+
+class FrameStore():
+    def __init__(self, path, fields=None, dtype="<f8", capacity=256, meta=None):
+        '''
+        :param path: file to append to; an existing store is opened and appended to
+        :param fields: dict of field name -> frame shape; required to create a store, checked against an existing one
+        :param dtype: value type of every field
+        :param capacity: records to allocate when creating the file
+        :param meta: JSON-serializable dict saved with a new store, e.g. how to interpret its values; an existing
+                     store keeps its own, available as self.meta
+        '''
+        self.path = path
+        # only a store that was written to trims its file on close, a reader never shrinks it under a writer
+        self.written = False
+        if(os.path.exists(path) and os.path.getsize(path) > 0):
+            self._open()
+            if(fields is not None and [(k, tuple(v)) for k, v in fields.items()] != self.fields):
+                raise ValueError("{0} was written with fields {1}, not {2}".format(path, self.fields, fields))
+        else:
+            if(fields is None):
+                raise ValueError("Fields are needed to create a frame store")
+            self._create([(k, tuple(v)) for k, v in fields.items()], np.dtype(dtype).str, capacity, meta or {})
+            self.written = True
+
+    def _create(self, fields, dtype, capacity, meta):
+        description = json.dumps({"version": VERSION, "dtype": dtype, "fields": fields, "meta": meta}).encode()
+        self.header_size = -(-(16 + len(description)) // HEADER_ALIGN) * HEADER_ALIGN
+        self.fields = fields
+        self.meta = meta
+        self.dtype = record_dtype(fields, dtype)
+        with open(self.path, "wb") as f:
+            f.write(MAGIC + struct.pack("<IQ", len(description), 0) + description)
+            f.truncate(self.header_size + capacity * self.dtype.itemsize)
+        self._map(0)
+
+    def _open(self):
+        with open(self.path, "rb") as f:
+            magic, size, count = struct.unpack("<4sIQ", f.read(16))
+            if(magic != MAGIC):
+                raise ValueError("{0} is not a frame store".format(self.path))
+            description = json.loads(f.read(size).decode())
+        if(description["version"] != VERSION):
+            raise ValueError("Unsupported frame store version: {0}".format(description["version"]))
+        self.header_size = -(-(16 + size) // HEADER_ALIGN) * HEADER_ALIGN
+        self.fields = [(k, tuple(v)) for k, v in description["fields"]]
+        self.meta = description.get("meta", {})
+        self.dtype = record_dtype(self.fields, description["dtype"])
+        self._map(count)
+
+    def _map(self, count):
+        capacity = (os.path.getsize(self.path) - self.header_size) // self.dtype.itemsize
+        self.header = np.memmap(self.path, dtype="<u8", mode="r+", offset=8, shape=(1,))
+        self.records = np.memmap(self.path, dtype=self.dtype, mode="r+", offset=self.header_size, shape=(capacity,))
+        self.count = count
+
+    def _grow(self):
+        self.records.flush()
+        capacity = max(2 * len(self.records), 1)
+        del self.records
+        with open(self.path, "r+b") as f:
+            f.truncate(self.header_size + capacity * self.dtype.itemsize)
+        self._map(self.count)
+
+    def append(self, iteration, **values):
+        '''
+        Write one record.
+        :param iteration: training iteration of the frame
+        :param values: one array per field
+        '''
+        if(self.count == len(self.records)):
+            self._grow()
+        record = self.records[self.count]
+        record["iteration"] = iteration
+        for name, _ in self.fields:
+            record[name] = values[name]
+        self.count += 1
+        self.header[0] = self.count
+        self.written = True
+
+    def truncate(self, iteration):
+        '''
+        Drop the records from iteration on, e.g. those written after the checkpoint a run resumes from.
+        '''
+        self.count = int(np.searchsorted(self.iterations, iteration))
+        self.header[0] = self.count
+        self.written = True
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, key):
+        '''
+        A field name gives that field of every record, anything else indexes the records; both are memmap views.
+        '''
+        if(isinstance(key, str)):
+            return self.records[key][:self.count]
+        return self.records[:self.count][key]
+
+    @property
+    def iterations(self):
+        return self.records["iteration"][:self.count]
+
+    def flush(self):
+        self.records.flush()
+        self.header.flush()
+
+    def close(self):
+        self.flush()
+        del self.records
+        del self.header
+        if(self.written):
+            with open(self.path, "r+b") as f:
+                f.truncate(self.header_size + self.count * self.dtype.itemsize)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
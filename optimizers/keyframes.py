@@ -0,0 +1,61 @@
+import numpy as np
+
+# Adaptive frame capture: a snapshot is kept only when it moved far enough from the last kept one, so the number of
+# frames follows how much the generator changes rather than the number of iterations. Early in training nearly every
+# candidate is kept; once the generator settles, frames thin out down to one every max_spacing iterations.
+#
+#   keyframes = Keyframes(threshold=0.02, min_spacing=5, max_spacing=200)
+#   def on_iter(i, trainer):
+#       if(keyframes.ready(i)):
+#           pts = snapshot(trainer.generator)
+#           if(keyframes.offer(i, pts)):
+#               pipeline.submit(pts)
+#   save_trajectory("w_points.traj", keyframes.frames, iterations=keyframes.iterations)
+
+
+def rms_distance(a, b):
+    return float(np.sqrt(np.mean((np.asarray(a, dtype=float) - np.asarray(b, dtype=float)) ** 2)))
+
+
+class Keyframes():
+    def __init__(self, threshold, min_spacing=1, max_spacing=None, distance=rms_distance, keep_frames=True):
+        '''
+        :param threshold: distance from the last kept frame above which a frame is kept
+        :param min_spacing: iterations between kept frames at least
+        :param max_spacing: iterations after which a frame is kept regardless of the distance
+        :param distance: function distance(frame, last_kept_frame), root mean square difference by default
+        :param keep_frames: collect the kept frames in self.frames; off when they are stored elsewhere
+        '''
+        self.threshold = threshold
+        self.min_spacing = min_spacing
+        self.max_spacing = max_spacing
+        self.distance = distance
+        self.keep_frames = keep_frames
+        self.last = None
+        self.iterations = []
+        self.frames = []
+
+    def ready(self, i):
+        '''
+        :return: whether a frame of iteration i could be kept, so snapshots are only taken when they may be used
+        '''
+        return not self.iterations or i - self.iterations[-1] >= self.min_spacing
+
+    def offer(self, i, frame, force=False):
+        '''
+        Keep the frame of iteration i if it moved more than the threshold from the last kept frame, or if
+        max_spacing iterations passed since it. The first frame offered is always kept.
+        :param force: keep the frame regardless, e.g. for the last iteration of a run
+        :return: whether the frame was kept
+        '''
+        if(not force and not self.ready(i)):
+            return False
+        if(not force and self.last is not None):
+            overdue = self.max_spacing is not None and i - self.iterations[-1] >= self.max_spacing
+            if(not overdue and self.distance(frame, self.last) <= self.threshold):
+                return False
+        self.last = np.array(frame, copy=True)
+        self.iterations.append(i)
+        if(self.keep_frames):
+            self.frames.append(self.last)
+        return True
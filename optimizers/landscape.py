@@ -0,0 +1,160 @@
+import os
+
+import numpy as np
+import torch
+
+from .framestore import FrameStore
+
+# The critic of a 2D run evaluated over a fixed grid, recorded alongside the kept frames of the run to show what the
+# discriminator computes and which gradients the generator gets from it. On the 64x64 grid of the wgan scripts, the
+# critic values cost about 0.6 of a wgan iteration and the values with the input gradient about 1.6 iterations (see
+# python -m optimizers.bench -k landscape/). So the scripts record the values, the default, with every kept frame,
+# which are at least 5 iterations apart, and the gradient field only with every 10th of them.
+#
+# CriticGrid allocates the grid points once and evaluates the whole grid in one batched forward pass: without
+# gradients under no_grad, with the input gradient field from a single backward pass of that forward pass, which
+# leaves the gradients of the critic's parameters untouched.
+#
+# LandscapeRecorder quantizes every frame to multiples of a quantum and appends its difference to the previous
+# frame to a FrameStore, as 16-bit integers. The quantum of every channel is a fraction of the first frame's range,
+# so the differences fit whatever the scale of the critic. Differences too large for the integer type are clipped
+# and the rest is carried into the next frame's difference, so the recorded frames catch up instead of drifting:
+#
+#   recorder = LandscapeRecorder("critic.pvfs", CriticGrid((2, 6), (2, 6), resolution=64))
+#   recorder.record(i, trainer.discriminator)      # with every kept frame
+#   frames, iterations = load_landscape("critic.pvfs")     # frames: (n, 64, 64, 1)
+#
+# A grid with gradient=True records (n, 64, 64, 3) frames of value, d/dx and d/dy.
+
+
+class CriticGrid():
+    def __init__(self, xlim, ylim, resolution=64, gradient=False):
+        '''
+        :param xlim: (low, high) of the x axis
+        :param ylim: (low, high) of the y axis
+        :param resolution: grid points per axis
+        :param gradient: also evaluate the gradient of the critic with respect to its input
+        '''
+        self.xlim = tuple(float(x) for x in xlim)
+        self.ylim = tuple(float(y) for y in ylim)
+        self.resolution = resolution
+        self.gradient = gradient
+        self.shape = (resolution, resolution, 3 if gradient else 1)
+        xs = torch.linspace(self.xlim[0], self.xlim[1], resolution)
+        ys = torch.linspace(self.ylim[0], self.ylim[1], resolution)
+        # rows follow y and columns x, as the grid is drawn
+        yy, xx = torch.meshgrid(ys, xs, indexing="ij")
+        self.points = torch.stack((xx.reshape(-1), yy.reshape(-1)), dim=1)
+        if(gradient):
+            self.points.requires_grad_(True)
+
+    def evaluate(self, critic):
+        '''
+        :param critic: network taking (n, 2) inputs to (n, 1) outputs
+        :return: (resolution, resolution, channels) array of the critic value, followed by d/dx and d/dy when the
+                 grid has gradients
+        '''
+        if(not self.gradient):
+            with torch.no_grad():
+                return critic.forward(self.points).reshape(self.shape).numpy()
+        with torch.enable_grad():
+            values = critic.forward(self.points)
+            grad, = torch.autograd.grad(values.sum(), self.points)
+        return torch.cat((values.detach(), grad), dim=1).reshape(self.shape).numpy()
+
+    def meta(self):
+        return {"xlim": self.xlim, "ylim": self.ylim, "resolution": self.resolution, "gradient": self.gradient}
+
+
+class LandscapeRecorder():
+    def __init__(self, path, grid, quantum=None, dtype="<i2", levels=1024):
+        '''
+        :param path: FrameStore file to append to; frames of an existing store are continued from
+        :param grid: CriticGrid to evaluate
+        :param quantum: step of the fixed-point values, by default the largest magnitude of every channel in the first
+                        frame over levels
+        :param dtype: signed integer type of the stored differences
+        :param levels: steps of the default quantum in the first frame's range; the differences of later frames fit
+                       into 16 bits up to 32 times that range
+        '''
+        self.path = path
+        self.grid = grid
+        self.dtype = dtype
+        self.levels = levels
+        # frames with differences that did not fit into dtype
+        self.clipped = 0
+        # the store is created with the first frame when that frame sets the quantum
+        self.store = None
+        self.previous = np.zeros(self.grid.shape, dtype=np.int64)
+        if(quantum is not None or (os.path.exists(path) and os.path.getsize(path) > 0)):
+            self._open(quantum)
+
+    def _open(self, quantum):
+        if(quantum is not None):
+            quantum = np.broadcast_to(quantum, self.grid.shape[-1:]).tolist()
+        meta = dict(self.grid.meta(), quantum=quantum)
+        self.store = FrameStore(self.path, {"delta": self.grid.shape}, dtype=self.dtype, meta=meta)
+        # an existing store keeps the integer type and quantum it was created with
+        self.limits = np.iinfo(self.store.dtype["delta"].base)
+        self.quantum = np.asarray(self.store.meta["quantum"], dtype=float)
+        self._restore()
+
+    def _restore(self):
+        # the fixed-point values of the last recorded frame, the sum of every difference so far
+        self.previous = np.zeros(self.grid.shape, dtype=np.int64)
+        for start in range(0, len(self.store), 256):
+            self.previous += self.store["delta"][start:start + 256].sum(axis=0, dtype=np.int64)
+
+    def record(self, iteration, critic):
+        '''
+        Evaluate the critic on the grid and append the frame.
+        :return: the evaluated (resolution, resolution, channels) frame
+        '''
+        values = self.grid.evaluate(critic)
+        if(self.store is None):
+            scale = np.abs(values).reshape((-1, values.shape[-1])).max(axis=0)
+            self._open(np.maximum(scale, 1e-12) / self.levels)
+        fixed = np.round(values / self.quantum).astype(np.int64)
+        change = fixed - self.previous
+        delta = np.clip(change, self.limits.min, self.limits.max)
+        if(np.any(delta != change)):
+            self.clipped += 1
+        self.previous += delta
+        self.store.append(iteration, delta=delta)
+        return values
+
+    def truncate(self, iteration):
+        '''
+        Drop the frames from iteration on, e.g. those written after the checkpoint a run resumes from.
+        '''
+        if(self.store is not None):
+            self.store.truncate(iteration)
+            self._restore()
+
+    def close(self):
+        if(self.store is not None):
+            self.store.close()
+
+
+def load_landscape(path, iterations=None, block=256):
+    '''
+    Decode a recorded landscape. The frames are summed up a block at a time, so only the selected frames are held
+    in memory.
+    :param iterations: optional iterations to return the frames of, e.g. those of the kept keyframes
+    :return: (frames, resolution, resolution, channels) float array and the iteration of every frame
+    '''
+    store = FrameStore(path)
+    quantum = np.asarray(store.meta["quantum"], dtype=float)
+    keep = np.ones(len(store), dtype=bool) if iterations is None else np.isin(store.iterations, iterations)
+    frames = np.empty((int(keep.sum()),) + store.fields[0][1])
+    current = np.zeros(store.fields[0][1], dtype=np.int64)
+    n = 0
+    for start in range(0, len(store), block):
+        fixed = current + np.cumsum(store["delta"][start:start + block], axis=0, dtype=np.int64)
+        selected = fixed[keep[start:start + block]]
+        frames[n:n + len(selected)] = selected * quantum
+        n += len(selected)
+        current = fixed[-1]
+    kept_iterations = np.array(store.iterations[keep])
+    store.close()
+    return frames, kept_iterations
@@ -0,0 +1,77 @@
+import math
+
+import torch
+
+# Critic-free distances between two batches of samples, differentiable in both. With these the generator is
+# trained directly against source samples (Trainer with loss="sliced" or "sinkhorn"), one generator update per
+# batch instead of critic_steps discriminator updates for each of them.
+
+
+def sliced_wasserstein(x, y, projections=128, p=2):
+    '''
+    Sliced p-Wasserstein distance (to the power p): both batches are projected onto random unit directions, and in
+    1D the optimal coupling matches sorted samples.
+    :param x, y: (n, d) tensors with the same number of samples
+    :param projections: number of random directions, all projected in one matmul
+    '''
+    theta = torch.randn((x.shape[1], projections), dtype=x.dtype)
+    theta = theta / theta.norm(dim=0, keepdim=True)
+    x_proj = torch.sort(x.mm(theta), dim=0)[0]
+    y_proj = torch.sort(y.mm(theta), dim=0)[0]
+    return torch.mean(torch.abs(x_proj - y_proj) ** p)
+
+
+def squared_distances(x, y):
+    # half squared euclidean cost; written out rather than torch.cdist, whose gradient is nan at zero distance
+    return 0.5 * torch.sum((x[:, None, :] - y[None, :, :]) ** 2, dim=2)
+
+
+def epsilon_schedule(diameter, eps, scaling):
+    '''
+    Geometric decrease of the temperature from the scale of the cost down to eps: the potentials found at a
+    large temperature are a close start for the next one, so few iterations are needed per step.
+    '''
+    e = 0.5 * diameter ** 2
+    while(e > eps):
+        yield e
+        e = e * scaling
+    yield eps
+
+
+def entropic_ot(x, y, eps=0.01, scaling=0.5, n_iter=10):
+    '''
+    Entropy regularized transport cost between the uniform measures on x and y, by log-domain Sinkhorn iterations.
+    The potentials are found without tracking gradients; one last (differentiable) update then gives the cost, whose
+    gradient with respect to the samples is exact at convergence.
+    '''
+    log_a = torch.full((x.shape[0],), -math.log(x.shape[0]), dtype=x.dtype)
+    log_b = torch.full((y.shape[0],), -math.log(y.shape[0]), dtype=y.dtype)
+    C = squared_distances(x, y)
+
+    with torch.no_grad():
+        C_d = C.detach()
+        diameter = float(torch.sqrt(2 * C_d.max()))
+        f = torch.zeros_like(log_a)
+        g = torch.zeros_like(log_b)
+        schedule = list(epsilon_schedule(diameter, eps, scaling)) + [eps] * n_iter
+        for e in schedule:
+            # symmetric update, averaged with the previous potentials for stability
+            f_new = -e * torch.logsumexp(log_b[None, :] + (g[None, :] - C_d) / e, dim=1)
+            g_new = -e * torch.logsumexp(log_a[:, None] + (f[:, None] - C_d) / e, dim=0)
+            f, g = 0.5 * (f + f_new), 0.5 * (g + g_new)
+
+    f_out = -eps * torch.logsumexp(log_b[None, :] + (g[None, :] - C) / eps, dim=1)
+    g_out = -eps * torch.logsumexp(log_a[:, None] + (f[:, None] - C) / eps, dim=0)
+    return torch.mean(f_out) + torch.mean(g_out)
+
+
+def sinkhorn_divergence(x, y, eps=0.01, scaling=0.5, n_iter=10):
+    '''
+    Debiased Sinkhorn divergence OT(x, y) - (OT(x, x) + OT(y, y)) / 2, which is zero when both batches agree.
+    :param eps: final temperature, in units of the half squared distance
+    :param scaling: factor by which the temperature decreases per iteration
+    :param n_iter: extra iterations at the final temperature
+    '''
+    return (entropic_ot(x, y, eps, scaling, n_iter)
+            - 0.5 * entropic_ot(x, x, eps, scaling, n_iter)
+            - 0.5 * entropic_ot(y, y, eps, scaling, n_iter))
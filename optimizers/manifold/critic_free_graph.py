@@ -0,0 +1,96 @@
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from optimizers.utils import *
+from optimizers.train import Trainer, make_config, make_distribution, to_tensor
+from optimizers.render import FramePipeline
+from optimizers.raster import FrameRenderer, BLUE, ORANGE
+from optimizers.trajectory import save_trajectory
+from optimizers.keyframes import Keyframes
+from optimizers.framestore import FrameStore
+from optimizers.stats import line_w1, line_w2
+import cv2
+
+# Same target and generator as wgan_nice_graph.py, trained without a critic on a sample distance, see losses.py:
+#   python critic_free_graph.py sliced
+#   python critic_free_graph.py sinkhorn
+
+TARGET_M = np.array([2, 2])
+TARGET_S = np.array(2)
+TARGET_SLOPE = np.array([1, -1])
+LOSS = sys.argv[1] if len(sys.argv) > 1 else "sliced"
+
+
+CONFIG = make_config(
+	loss=LOSS,
+	source={"type": "line_gaussian", "m": TARGET_M, "s": TARGET_S, "slope": TARGET_SLOPE},
+	latent={"type": "gaussian", "m": [0], "S": np.eye(1)},
+	gen_layers=[1, 32, 32, 32, 2],
+	num_iter=10000,
+	sample_size=64,
+	learn_rate=0.0005,
+	# num_iter is the budget; the run ends early once the windowed W2 to the target is small or stops improving
+	stop_window=200, stop_distance=0.05, min_iter=1000,
+	snapshot_dir="{0}_snapshots".format(LOSS),
+	snapshot_every=20,
+)
+
+source = make_distribution(CONFIG["source"])
+
+big_sample = to_tensor(np.linspace(-2, 2, 50).reshape((50, 1)))
+
+# target samples are drawn once into the renderer's static layer
+renderer = FrameRenderer(xlim=(0, 4), ylim=(0, 4))
+renderer.scatter(source.sample(200).numpy(), ORANGE, static=True)
+
+def snapshot(generator):
+	return generator.forward(big_sample).detach().numpy()
+
+def make_surfacegaussian(gen_samples):
+	frame = renderer.begin()
+	renderer.scatter(gen_samples, BLUE)
+	return frame
+
+avi = cv2.VideoWriter("{0}_nice.avi".format(LOSS), cv2.VideoWriter_fourcc('M','J','P','G'), 20.0, (640, 480))
+
+# frames are rendered in worker processes and written to the video in order on a background thread. The workers are
+# forked before the trainer starts its sampling threads, see render.py
+pipeline = FramePipeline(make_surfacegaussian, avi.write)
+
+trainer = Trainer(CONFIG)
+unit = trainer.latent
+pipeline.profiler = trainer.profiler
+
+# a frame is kept once the points moved by more than two quanta of the exported trajectory
+keyframes = Keyframes(threshold=0.02, min_spacing=5, max_spacing=200, keep_frames=False)
+# frames are written to a memory-mapped store as they are produced, so memory stays constant and an interrupted
+# run keeps its frames; frames after the checkpoint a run resumes from are dropped. Every frame also stores
+# W1 along the line, mean distance from it and W2 to the target
+frames = FrameStore("{0}_frames.pvfs".format(LOSS), {"points": (50, 2), "distance": (3,)})
+frames.truncate(trainer.iteration)
+
+# the generator batches of the current iteration, all drawn from the same weights, are kept for the distances
+recent = []
+trainer.sample_hooks.append(recent.append)
+
+
+def on_iter(i, trainer):
+	if(keyframes.ready(i) or trainer.is_last(i)):
+		pts = snapshot(trainer.generator)
+		if(keyframes.offer(i, pts, force=trainer.is_last(i))):
+			pipeline.submit(pts)
+			samples = torch.cat(recent).numpy()
+			w2 = line_w2(samples, TARGET_M, TARGET_S, TARGET_SLOPE)
+			distance = line_w1(samples, TARGET_M, TARGET_S, TARGET_SLOPE) + (w2,)
+			frames.append(i, points=pts, distance=distance)
+	del recent[:]
+
+trainer.run(on_iter)
+pipeline.close()
+avi.release()
+
+frames.flush()
+
+save_trajectory("{0}_points.traj".format(LOSS), frames["points"], iterations=frames.iterations)
+np.save("{0}_distance.npy".format(LOSS), frames["distance"])
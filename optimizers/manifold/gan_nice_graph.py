@@ -1,11 +1,16 @@
-from utils import *
-import matplotlib.pyplot as plt
-import scipy.stats
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from optimizers.utils import *
+from optimizers.train import Trainer, make_config, make_distribution, to_tensor
+from optimizers.render import FramePipeline
+from optimizers.raster import FrameRenderer, BLUE, ORANGE
+from optimizers.trajectory import save_trajectory
+from optimizers.keyframes import Keyframes
+from optimizers.framestore import FrameStore
+from optimizers.stats import line_w1, line_w2
 import cv2
-from PIL import Image
-import plotly.graph_objects as go
-
-from mpl_toolkits.mplot3d import Axes3D
 
 # Generate matrices for wgan at each step by doing a ton of samples, quantizing, and setting the right indices
 # Do this at each step
@@ -14,91 +19,82 @@ TARGET_M = np.array([2, 2])
 TARGET_S = np.array(2)
 TARGET_SLOPE = np.array([1, -1])
 
-CRITIC_STEPS = 100
-
-
-NUM_ITER = 10000
-
-SAMPLE_SIZE = 64
-LEARN_RATE = 0.00005
-
-
-discriminator = Net([2, 32, 32, 32, 1], output="sigmoid")
-generator = Net([1, 32, 32, 32, 2], output="linear")
-
-source = LineGaussian(TARGET_M, TARGET_S, TARGET_SLOPE)
-unit = Gaussian(np.array([0]), np.eye(1))
-
-disc_optim = torch.optim.RMSprop(discriminator.parameters(), lr=LEARN_RATE)
-gen_optim = torch.optim.RMSprop(generator.parameters(), lr=LEARN_RATE)
-
-
-big_sample = torch.tensor(np.linspace(-2, 2, 50), dtype=torch.float)
-
-def make_surfacegaussian(generator):
-	big_sample = torch.tensor(unit.sample(50), dtype=torch.float)
-	gen_samples = generator.forward(big_sample).detach().numpy()
-	source_sample = source.sample(50)
-
-
-	fig = plt.figure()
-	ax = fig.add_subplot(111)
-	ax.scatter(*gen_samples.T)
-	ax.scatter(*source_sample.T)
-
-	plt.xlim(0, 4)
-	plt.ylim(0, 4)
-	canvas = plt.get_current_fig_manager().canvas
-	canvas.draw()
-
-	return (np.array(Image.frombytes('RGB', canvas.get_width_height(),
-									 canvas.tostring_rgb())), gen_samples)
-
-
-points = []
+CONFIG = make_config(
+	loss="gan",
+	source={"type": "line_gaussian", "m": TARGET_M, "s": TARGET_S, "slope": TARGET_SLOPE},
+	latent={"type": "gaussian", "m": [0], "S": np.eye(1)},
+	disc_layers=[2, 32, 32, 32, 1],
+	gen_layers=[1, 32, 32, 32, 2],
+	critic_steps=100,
+	num_iter=10000,
+	sample_size=64,
+	learn_rate=0.00005,
+	# num_iter is the budget; the run ends early once the windowed W2 to the target is small or stops improving
+	stop_window=200, stop_distance=0.05, min_iter=1000,
+	checkpoint_path="gan_manifold.ckpt",
+	snapshot_dir="gan_snapshots",
+	snapshot_every=20,
+)
+
+source = make_distribution(CONFIG["source"])
+
+# the same latent points every snapshot, so consecutive frames differ only where the generator moved
+big_sample = to_tensor(np.linspace(-2, 2, 50).reshape((50, 1)))
+
+# target samples are drawn once into the renderer's static layer
+renderer = FrameRenderer(xlim=(0, 4), ylim=(0, 4))
+renderer.scatter(source.sample(50).numpy(), ORANGE, static=True)
+
+def snapshot(generator):
+	return generator.forward(big_sample).detach().numpy()
+
+def make_surfacegaussian(gen_samples):
+	frame = renderer.begin()
+	renderer.scatter(gen_samples, BLUE)
+	return frame
 
 avi = cv2.VideoWriter("gan_nice.avi", cv2.VideoWriter_fourcc('M','J','P','G'), 20.0, (640, 480))
 
-for k in range(100):
-	unit_samples = torch.tensor(unit.sample(SAMPLE_SIZE), dtype=torch.float)
-	source_samples = torch.tensor(source.sample(SAMPLE_SIZE), dtype=torch.float)
-
-	gen_samples = generator.forward(unit_samples).detach()
-	disc_loss = -torch.mean(torch.log(discriminator(source_samples)) + torch.log(1 - discriminator(gen_samples)))
-	disc_loss.backward()
-	disc_optim.step()
-	disc_optim.zero_grad()
-	gen_optim.zero_grad()
-
-
-for i in range(NUM_ITER):
-	for k in range(CRITIC_STEPS):
-		unit_samples = torch.tensor(unit.sample(SAMPLE_SIZE), dtype=torch.float)
-		source_samples = torch.tensor(source.sample(SAMPLE_SIZE), dtype=torch.float)
-
-		gen_samples = generator.forward(unit_samples).detach()
-		disc_loss = -torch.mean(torch.log(discriminator(source_samples)) + torch.log(1 - discriminator(gen_samples)))
-		disc_loss.backward()
-		disc_optim.step()
-		disc_optim.zero_grad()
-		gen_optim.zero_grad()
-
-	unit_samples = torch.tensor(unit.sample(SAMPLE_SIZE), dtype=torch.float)
-	gen_samples = generator.forward(unit_samples)
-	gen_loss = torch.mean(torch.log(1 - discriminator(gen_samples)))
-	gen_loss.backward()
-	gen_optim.step()
-	disc_optim.zero_grad()
-	gen_optim.zero_grad()
-
-	source_samples = torch.tensor(source.sample(SAMPLE_SIZE), dtype=torch.float)
-
-	if(i % 20 == 0):
-		frame, pts = make_surfacegaussian(generator)
-		points.append(pts)
-		avi.write(frame)
-
-	print("{1}, Estimated mean: {0}".format((np.mean(gen_samples.detach().numpy(), axis=0)), i))
-
-
-np.save("g_points.npy", np.array(points))
+# frames are rendered in worker processes and written to the video in order on a background thread. The workers are
+# forked before the trainer starts its sampling threads, see render.py
+pipeline = FramePipeline(make_surfacegaussian, avi.write)
+
+trainer = Trainer(CONFIG)
+unit = trainer.latent
+pipeline.profiler = trainer.profiler
+
+# a frame is kept once the points moved by more than two quanta of the exported trajectory
+keyframes = Keyframes(threshold=0.02, min_spacing=5, max_spacing=200, keep_frames=False)
+# frames are written to a memory-mapped store as they are produced, so memory stays constant and an interrupted
+# run keeps its frames; frames after the checkpoint a run resumes from are dropped. Every frame also stores
+# W1 along the line, mean distance from it and W2 to the target
+frames = FrameStore("g_frames.pvfs", {"points": (50, 2), "distance": (3,)})
+frames.truncate(trainer.iteration)
+
+# the generator batches of the current iteration, all drawn from the same weights, are kept for the distances
+recent = []
+trainer.sample_hooks.append(recent.append)
+
+
+if(trainer.iteration == 0):
+	trainer.train_critic(100)
+
+def on_iter(i, trainer):
+	if(keyframes.ready(i) or trainer.is_last(i)):
+		pts = snapshot(trainer.generator)
+		if(keyframes.offer(i, pts, force=trainer.is_last(i))):
+			pipeline.submit(pts)
+			samples = torch.cat(recent).numpy()
+			w2 = line_w2(samples, TARGET_M, TARGET_S, TARGET_SLOPE)
+			distance = line_w1(samples, TARGET_M, TARGET_S, TARGET_SLOPE) + (w2,)
+			frames.append(i, points=pts, distance=distance)
+	del recent[:]
+
+trainer.run(on_iter)
+pipeline.close()
+avi.release()
+
+frames.flush()
+
+save_trajectory("g_points.traj", frames["points"], iterations=frames.iterations)
+np.save("g_distance.npy", frames["distance"])
@@ -0,0 +1,19 @@
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import numpy as np
+from optimizers.train import to_tensor
+from optimizers.replay import checkpoint_config, replay
+from optimizers.trajectory import save_trajectory
+
+# Regenerate the exported points of a manifold run from its generator snapshots, without training again.
+# python replay_points.py wgan_manifold.ckpt w_points.traj
+
+checkpoint, out = sys.argv[1], sys.argv[2]
+
+big_sample = to_tensor(np.linspace(-2, 2, 50).reshape((50, 1)))
+
+frames = replay(checkpoint_config(checkpoint), lambda i, generator, latent: (i, generator.forward(big_sample).numpy()))
+save_trajectory(out, np.array([pts for i, pts in frames]), iterations=[i for i, pts in frames])
+print("Wrote {0} frames to {1}".format(len(frames), out))
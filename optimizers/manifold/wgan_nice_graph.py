@@ -1,12 +1,17 @@
-from utils import *
-import matplotlib.pyplot as plt
-import scipy.stats
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from optimizers.utils import *
+from optimizers.train import Trainer, make_config, make_distribution, to_tensor
+from optimizers.render import FramePipeline
+from optimizers.raster import FrameRenderer, BLUE, ORANGE
+from optimizers.trajectory import save_trajectory
+from optimizers.keyframes import Keyframes
+from optimizers.framestore import FrameStore
+from optimizers.landscape import CriticGrid, LandscapeRecorder, load_landscape
+from optimizers.stats import line_w1, line_w2
 import cv2
-from PIL import Image
-import json
-import plotly.graph_objects as go
-
-from mpl_toolkits.mplot3d import Axes3D
 
 # Generate matrices for wgan at each step by doing a ton of samples, quantizing, and setting the right indices
 # Do this at each step
@@ -16,90 +21,103 @@ TARGET_S = np.array(2)
 TARGET_SLOPE = np.array([1, -1])
 
 
-# Manifold learning
-CRITIC_STEPS = 100
-
-CLIP = 0.01
-
-NUM_ITER = 10000
-
-SAMPLE_SIZE = 64
-LEARN_RATE = 0.0005
-
-HALF_LR_EVERY = 20000
-
-discriminator = Net([2, 32, 32, 32, 1], output="linear")
-generator = Net([1, 32, 32, 32, 2], output="linear")
-
-source = LineGaussian(TARGET_M, TARGET_S, TARGET_SLOPE)
-unit = Gaussian(np.array([0]), np.eye(1))
-
-
-disc_optim = torch.optim.RMSprop(discriminator.parameters(), lr=LEARN_RATE)
-gen_optim = torch.optim.RMSprop(generator.parameters(), lr=LEARN_RATE)
-
-
-big_sample = torch.tensor(np.linspace(-2, 2, 50).reshape((50, 1)), dtype=torch.float)
-
-def make_surfacegaussian(generator):
-	gen_samples = generator.forward(big_sample).detach().numpy()
-	source_sample = source.sample(200)
-
-	fig = plt.figure()
-	ax = fig.add_subplot(111)
-	ax.scatter(*gen_samples.T)
-	ax.scatter(*source_sample.T)
-
-	plt.xlim(0, 4)
-	plt.ylim(0, 4)
-	canvas = plt.get_current_fig_manager().canvas
-	canvas.draw()
-
-	return (np.array(Image.frombytes('RGB', canvas.get_width_height(),
-								 canvas.tostring_rgb())), gen_samples)
-
-points = []
+CONFIG = make_config(
+	loss="wgan",
+	source={"type": "line_gaussian", "m": TARGET_M, "s": TARGET_S, "slope": TARGET_SLOPE},
+	latent={"type": "gaussian", "m": [0], "S": np.eye(1)},
+	disc_layers=[2, 32, 32, 32, 1],
+	gen_layers=[1, 32, 32, 32, 2],
+	critic_steps=100,
+	clip=0.01,
+	num_iter=10000,
+	sample_size=64,
+	learn_rate=0.0005,
+	half_lr_every=20000,
+	# num_iter is the budget; the run ends early once the windowed W2 to the target is small or stops improving
+	stop_window=200, stop_distance=0.05, min_iter=1000,
+	checkpoint_path="wgan_manifold.ckpt",
+	snapshot_dir="wgan_snapshots",
+	snapshot_every=20,
+)
+
+source = make_distribution(CONFIG["source"])
+
+big_sample = to_tensor(np.linspace(-2, 2, 50).reshape((50, 1)))
+
+# target samples are drawn once into the renderer's static layer
+renderer = FrameRenderer(xlim=(0, 4), ylim=(0, 4))
+renderer.scatter(source.sample(200).numpy(), ORANGE, static=True)
+
+def snapshot(generator):
+	return generator.forward(big_sample).detach().numpy()
+
+def make_surfacegaussian(gen_samples):
+	frame = renderer.begin()
+	renderer.scatter(gen_samples, BLUE)
+	return frame
 
 avi = cv2.VideoWriter("wgan_nice.avi", cv2.VideoWriter_fourcc('M','J','P','G'), 20.0, (640, 480))
 
-
-
-for i in range(NUM_ITER):
-	for k in range(CRITIC_STEPS):
-		unit_samples = torch.tensor(unit.sample(SAMPLE_SIZE), dtype=torch.float)
-		source_samples = torch.tensor(source.sample(SAMPLE_SIZE), dtype=torch.float)
-
-
-		gen_samples = generator.forward(unit_samples).detach()
-		w1_estim = torch.mean(discriminator.forward(gen_samples)) - torch.mean(discriminator.forward(source_samples))
-		w1_estim.backward()
-		disc_optim.step()
-		disc_optim.zero_grad()
-		gen_optim.zero_grad()
-		discriminator.clip_weights(CLIP)
-
-	unit_samples = torch.tensor(unit.sample(SAMPLE_SIZE), dtype=torch.float)
-	gen_samples = generator.forward(unit_samples)
-	w1_grad_estim = -torch.mean(discriminator.forward(gen_samples))
-
-	w1_grad_estim.backward()
-	gen_optim.step()
-	disc_optim.zero_grad()
-	gen_optim.zero_grad()
-
-
-	source_samples = torch.tensor(source.sample(SAMPLE_SIZE), dtype=torch.float)
-
-	if(i % 20 == 0):
-		frame, pts = make_surfacegaussian(generator)
-		points.append(pts)
-		avi.write(frame)
-	if(i % HALF_LR_EVERY == (HALF_LR_EVERY - 1)):
-		LEARN_RATE = LEARN_RATE/2
-		disc_optim = torch.optim.RMSprop(discriminator.parameters(), lr=LEARN_RATE)
-		gen_optim = torch.optim.RMSprop(generator.parameters(), lr=LEARN_RATE)
-
-	print("Estimated mean: {0}".format(np.mean(gen_samples.detach().numpy(), axis=0)))
-	print("Iter {0} - Approximated Wasserstein Distance: {1}".format(i, w1_estim))
-
-np.save("w_points.json", json.dumps([[[round(float(x), 2) for x in y] for y in z] for z in points]))
+# frames are rendered in worker processes and written to the video in order on a background thread. The workers are
+# forked before the trainer starts its sampling threads, see render.py
+pipeline = FramePipeline(make_surfacegaussian, avi.write)
+
+trainer = Trainer(CONFIG)
+unit = trainer.latent
+pipeline.profiler = trainer.profiler
+
+# a frame is kept once the points moved by more than two quanta of the exported trajectory
+keyframes = Keyframes(threshold=0.02, min_spacing=5, max_spacing=200, keep_frames=False)
+# frames are written to a memory-mapped store as they are produced, so memory stays constant and an interrupted
+# run keeps its frames; frames after the checkpoint a run resumes from are dropped. Every frame also stores
+# W1 along the line, mean distance from it and W2 to the target
+frames = FrameStore("w_frames.pvfs", {"points": (50, 2), "distance": (3,)})
+frames.truncate(trainer.iteration)
+
+# the generator batches of the current iteration, all drawn from the same weights, are kept for the distances
+recent = []
+trainer.sample_hooks.append(recent.append)
+
+# the critic on a fixed 64x64 grid, evaluated in one batched pass and recorded with every kept frame as quantized
+# differences to the previous one, and its input gradient field with every 10th kept frame. A frame of values costs
+# about 0.6 of an iteration and one with the gradient about 1.6 (see python -m optimizers.bench -k landscape/), so only
+# kept frames are recorded
+GRADIENT_EVERY = 10
+landscape = LandscapeRecorder("w_critic.pvfs", CriticGrid((0, 4), (0, 4), resolution=64))
+landscape.truncate(trainer.iteration)
+gradients = LandscapeRecorder("w_critic_grad.pvfs", CriticGrid((0, 4), (0, 4), resolution=64, gradient=True))
+gradients.truncate(trainer.iteration)
+
+
+def on_iter(i, trainer):
+	if(keyframes.ready(i) or trainer.is_last(i)):
+		pts = snapshot(trainer.generator)
+		if(keyframes.offer(i, pts, force=trainer.is_last(i))):
+			landscape.record(i, trainer.discriminator)
+			if(len(frames) % GRADIENT_EVERY == 0):
+				gradients.record(i, trainer.discriminator)
+			pipeline.submit(pts)
+			samples = torch.cat(recent).numpy()
+			w2 = line_w2(samples, TARGET_M, TARGET_S, TARGET_SLOPE)
+			distance = line_w1(samples, TARGET_M, TARGET_S, TARGET_SLOPE) + (w2,)
+			frames.append(i, points=pts, distance=distance)
+	del recent[:]
+
+trainer.run(on_iter)
+pipeline.close()
+avi.release()
+
+frames.flush()
+landscape.close()
+gradients.close()
+
+# the critic of every kept frame, alongside the frame's statistics
+critic, _ = load_landscape("w_critic.pvfs", iterations=frames.iterations)
+np.save("w_critic.npy", critic.astype(np.float32))
+# value, d/dx and d/dy of every 10th kept frame
+gradient, gradient_iter = load_landscape("w_critic_grad.pvfs", iterations=frames.iterations)
+np.save("w_critic_grad.npy", gradient.astype(np.float32))
+np.save("w_critic_grad_iter.npy", gradient_iter)
+
+save_trajectory("w_points.traj", frames["points"], iterations=frames.iterations)
+np.save("w_distance.npy", frames["distance"])
@@ -0,0 +1,164 @@
+import json
+import os
+import struct
+import time
+from contextlib import contextmanager
+
+import numpy as np
+
+# Instrumentation for the training loops.
+#
+# Profiler:   wall time and call counts per named phase (sampling, critic steps, rendering, ...) plus free counters,
+#             with a summary table at the end of a run.
+# MetricsLog: fixed set of per-iteration scalars kept in a preallocated ring buffer and appended to disk in blocks,
+#             either as NDJSON or as raw float64 rows behind a small header.
+
+
+class Profiler():
+    def __init__(self):
+        self.totals = {}
+        self.calls = {}
+        self.counters = {}
+        self.start = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def add(self, name, seconds, calls=1):
+        self.totals[name] = self.totals.get(name, 0.0) + seconds
+        self.calls[name] = self.calls.get(name, 0) + calls
+
+    def count(self, name, n=1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def summary(self):
+        '''
+        :return: a table of every phase's total time, calls, time per call and share of the wall time so far
+        '''
+        wall = time.perf_counter() - self.start
+        lines = ["{0:<20} {1:>10} {2:>10} {3:>12} {4:>7}".format(
+            "phase", "total (s)", "calls", "per call (ms)", "share")]
+        for name, total in sorted(self.totals.items(), key=lambda x: -x[1]):
+            calls = self.calls[name]
+            lines.append("{0:<20} {1:>10.2f} {2:>10d} {3:>12.3f} {4:>6.1%}".format(
+                name, total, calls, 1000 * total / max(calls, 1), total / wall))
+        lines.append("{0:<20} {1:>10.2f}".format("wall", wall))
+        for name, n in sorted(self.counters.items()):
+            lines.append("{0:<20} {1:>10d}".format(name, n))
+        return "\n".join(lines)
+
+
+class MetricsLog():
+    MAGIC = b"PVML"
+
+    def __init__(self, path, fields, capacity=1024):
+        '''
+        :param path: file to append to; ending in .ndjson (or .json) writes one JSON object per line, anything else
+                     writes binary float64 rows
+        :param fields: names of the values recorded each time
+        :param capacity: rows held in memory; the buffer is flushed to disk whenever it fills up
+        '''
+        self.path = path
+        self.fields = list(fields)
+        self.buffer = np.zeros((capacity, len(self.fields)))
+        self.capacity = capacity
+        self.written = 0     # rows recorded so far
+        self.flushed = 0     # rows already on disk
+        self.binary = not path.endswith((".ndjson", ".json"))
+        if(self.binary):
+            self._check_header()
+
+    def _check_header(self):
+        header = json.dumps(self.fields).encode()
+        if(os.path.exists(self.path) and os.path.getsize(self.path) > 0):
+            existing = read_metrics_header(self.path)[0]
+            if(existing != self.fields):
+                raise ValueError("{0} was written with fields {1}, not {2}".format(self.path, existing, self.fields))
+            return
+        with open(self.path, "wb") as f:
+            f.write(self.MAGIC + struct.pack("<I", len(header)) + header)
+            f.write(b"\0" * (-f.tell() % 8))
+
+    def record(self, *values):
+        '''
+        Record one row, with values in the order of self.fields.
+        '''
+        if(self.written - self.flushed == self.capacity):
+            self.flush()
+        self.buffer[self.written % self.capacity] = values
+        self.written += 1
+
+    def last(self, n=None):
+        '''
+        :return: up to n of the most recent rows, oldest first
+        '''
+        n = min(n or self.capacity, self.written, self.capacity)
+        idx = np.arange(self.written - n, self.written) % self.capacity
+        return self.buffer[idx]
+
+    def flush(self):
+        rows = self.written - self.flushed
+        if(rows == 0):
+            return
+        idx = np.arange(self.flushed, self.written) % self.capacity
+        block = self.buffer[idx]
+        if(self.binary):
+            with open(self.path, "ab") as f:
+                f.write(block.astype("<f8").tobytes())
+        else:
+            with open(self.path, "a") as f:
+                f.write("".join(json.dumps(dict(zip(self.fields, row.tolist()))) + "\n" for row in block))
+        self.flushed = self.written
+
+    def truncate(self, iteration):
+        '''
+        Drop the rows from iteration on, e.g. those flushed after the checkpoint a run resumes from. The first field
+        holds the iteration of every row.
+        '''
+        self.flush()
+        if(not os.path.exists(self.path)):
+            return
+        fields, rows = read_metrics(self.path)
+        later = np.flatnonzero(rows[:, 0] >= iteration) if len(rows) else []
+        if(len(later) == 0):
+            return
+        if(self.binary):
+            offset = read_metrics_header(self.path)[1]
+            with open(self.path, "r+b") as f:
+                f.truncate(offset + int(later[0]) * len(self.fields) * 8)
+        else:
+            with open(self.path, "w") as f:
+                f.write("".join(json.dumps(dict(zip(fields, row.tolist()))) + "\n" for row in rows[:later[0]]))
+
+    def close(self):
+        self.flush()
+
+
+def read_metrics_header(path):
+    with open(path, "rb") as f:
+        magic = f.read(4)
+        if(magic != MetricsLog.MAGIC):
+            raise ValueError("{0} is not a binary metrics log".format(path))
+        size = struct.unpack("<I", f.read(4))[0]
+        fields = json.loads(f.read(size).decode())
+    offset = 8 + size
+    return fields, offset + (-offset % 8)
+
+
+def read_metrics(path):
+    '''
+    :return: (fields, rows) of a metrics log in either format
+    '''
+    if(path.endswith((".ndjson", ".json"))):
+        with open(path) as f:
+            records = [json.loads(line) for line in f if line.strip()]
+        fields = list(records[0]) if records else []
+        return fields, np.array([[r[k] for k in fields] for r in records])
+    fields, offset = read_metrics_header(path)
+    rows = np.fromfile(path, dtype="<f8", offset=offset)
+    return fields, rows.reshape((-1, len(fields)))
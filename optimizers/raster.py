@@ -0,0 +1,119 @@
+import numpy as np
+
+# Small NumPy rasterizer for the training videos. Frames are drawn into one preallocated RGB buffer: everything
+# which does not change during a run (background, axes, target density or target samples) is drawn once into a
+# static layer, and each frame starts from a copy of it. Memory use does not depend on the number of frames.
+
+BLUE = (31, 119, 180)
+ORANGE = (255, 127, 14)
+BLACK = (0, 0, 0)
+WHITE = (255, 255, 255)
+
+
+class FrameRenderer():
+    def __init__(self, xlim, ylim, width=640, height=480, margin=40, background=WHITE):
+        '''
+        :param xlim: (low, high) data range of the x axis
+        :param ylim: (low, high) data range of the y axis
+        :param width: frame width in pixels
+        :param height: frame height in pixels
+        :param margin: pixels between the plot area and the edge of the frame
+        '''
+        self.xlim = xlim
+        self.ylim = ylim
+        self.shape = (height, width, 3)
+        self.plot = (slice(margin, height - margin), slice(margin, width - margin))
+        self.plot_shape = (height - 2 * margin, width - 2 * margin)
+        self.margin = margin
+
+        # data coordinates of the center of every pixel of the plot area, rows running top to bottom
+        h, w = self.plot_shape
+        xs = xlim[0] + (np.arange(w) + 0.5) * (xlim[1] - xlim[0]) / w
+        ys = ylim[1] - (np.arange(h) + 0.5) * (ylim[1] - ylim[0]) / h
+        self.X, self.Y = np.meshgrid(xs, ys)
+
+        self.static = np.empty(self.shape, dtype=np.uint8)
+        self.static[:] = background
+        self.buffer = np.empty(self.shape, dtype=np.uint8)
+        self.axes()
+
+    def axes(self, color=BLACK, tick=5):
+        '''
+        Draw the plot frame and a tick at every integer coordinate into the static layer.
+        '''
+        img = self.static
+        top, bottom = self.margin - 1, self.shape[0] - self.margin
+        left, right = self.margin - 1, self.shape[1] - self.margin
+        img[top, left:right + 1] = color
+        img[bottom, left:right + 1] = color
+        img[top:bottom + 1, left] = color
+        img[top:bottom + 1, right] = color
+        for x in range(int(np.ceil(self.xlim[0])), int(np.floor(self.xlim[1])) + 1):
+            col = self.to_pixels(np.array([[x, self.ylim[0]]]))[0, 1] + self.margin
+            img[bottom:bottom + tick, min(col, right)] = color
+        for y in range(int(np.ceil(self.ylim[0])), int(np.floor(self.ylim[1])) + 1):
+            row = self.to_pixels(np.array([[self.xlim[0], y]]))[0, 0] + self.margin
+            img[min(row, bottom), left - tick + 1:left + 1] = color
+
+    def to_pixels(self, points):
+        '''
+        :param points: (n, 2) array of data coordinates
+        :return: (n, 2) integer array of (row, col) within the plot area
+        '''
+        h, w = self.plot_shape
+        cols = np.floor((points[:, 0] - self.xlim[0]) / (self.xlim[1] - self.xlim[0]) * w)
+        rows = np.floor((self.ylim[1] - points[:, 1]) / (self.ylim[1] - self.ylim[0]) * h)
+        return np.stack((rows, cols), axis=1).astype(np.int64)
+
+    def gaussian(self, mean, cov):
+        '''
+        :return: density of N(mean, cov) at every pixel of the plot area
+        '''
+        cov = np.asarray(cov, dtype=float)
+        inv = np.linalg.pinv(cov)
+        det = max(np.linalg.det(cov), 1e-300)
+        dx = self.X - mean[0]
+        dy = self.Y - mean[1]
+        q = inv[0, 0] * dx * dx + (inv[0, 1] + inv[1, 0]) * dx * dy + inv[1, 1] * dy * dy
+        return np.exp(-0.5 * q) / (2 * np.pi * np.sqrt(det))
+
+    def begin(self):
+        '''
+        Start a new frame from the static layer.
+        :return: the frame buffer, which is reused by the next call to begin
+        '''
+        np.copyto(self.buffer, self.static)
+        return self.buffer
+
+    def contour(self, field, color, levels=7, static=False):
+        '''
+        Draw iso-lines of a field over the plot area. A pixel is on a line when it is in a different band between
+        levels than its right or lower neighbour.
+        :param field: array of plot_shape, e.g. from gaussian()
+        :param levels: number of evenly spaced levels strictly between 0 and the maximum of field, or a list
+        :param static: draw into the static layer instead of the current frame
+        '''
+        if(np.isscalar(levels)):
+            levels = np.linspace(0, field.max(), levels + 2)[1:-1]
+        band = np.digitize(field, levels)
+        edge = np.zeros(band.shape, dtype=bool)
+        edge[:, :-1] |= band[:, :-1] != band[:, 1:]
+        edge[:-1, :] |= band[:-1, :] != band[1:, :]
+        img = self.static if static else self.buffer
+        img[self.plot][edge] = color
+
+    def scatter(self, points, color, radius=2, static=False):
+        '''
+        Draw each point as a filled disk of the given pixel radius. Points outside of the plot area are skipped.
+        :param points: (n, 2) array of data coordinates
+        :param static: draw into the static layer instead of the current frame
+        '''
+        h, w = self.plot_shape
+        pix = self.to_pixels(np.asarray(points, dtype=float))
+        offsets = [(dr, dc) for dr in range(-radius, radius + 1) for dc in range(-radius, radius + 1)
+                   if dr * dr + dc * dc <= radius * radius]
+        pix = (pix[:, None, :] + np.array(offsets)[None, :, :]).reshape((-1, 2))
+        inside = (pix[:, 0] >= 0) & (pix[:, 0] < h) & (pix[:, 1] >= 0) & (pix[:, 1] < w)
+        pix = pix[inside]
+        img = self.static if static else self.buffer
+        img[self.plot][pix[:, 0], pix[:, 1]] = color
@@ -0,0 +1,99 @@
+import multiprocessing
+import queue
+import threading
+import time
+import warnings
+
+# Frame rendering off the training thread. The training loop submits small snapshots (means, covariances, point
+# arrays); a pool of worker processes rasterizes them and a background thread hands the finished frames to the
+# encoder in submission order. At most max_pending frames are in flight, from submit until the encoder returns,
+# after which submit blocks until the encoder catches up, so a slow renderer throttles training instead of piling up
+# memory.
+#
+# The workers are forked, and forking copies only the calling thread: a lock another thread holds at that moment,
+# e.g. in the prefetch threads of a Trainer's sample streams or in torch's intra-op pool, stays held in the workers
+# forever. So the pipeline is created before the Trainer, and its profiler is set once the Trainer exists:
+#
+#   pipeline = FramePipeline(render, avi.write)
+#   trainer = Trainer(CONFIG)
+#   pipeline.profiler = trainer.profiler
+
+
+class FramePipeline():
+    def __init__(self, render, encode, workers=2, max_pending=None, context=None, profiler=None):
+        '''
+        :param render: picklable function render(*snapshot) -> frame, run in the worker processes
+        :param encode: function encode(frame), called on a background thread of this process in submission order
+        :param workers: number of render processes
+        :param max_pending: number of frames which may be queued or rendering at once, defaults to 4 per worker
+        :param context: multiprocessing start method, defaults to fork where available since the scripts which
+                        define render functions do their training at module level, which spawn and forkserver workers
+                        would run again. Forking warns when other threads are alive, see above
+        :param profiler: optional metrics.Profiler, also settable later as self.profiler; time spent waiting for
+                         renders and encoding on the background thread is added to it as "render (bg)" and
+                         "encode (bg)"
+        '''
+        if(context is None):
+            context = "fork" if "fork" in multiprocessing.get_all_start_methods() else None
+        if(context == "fork" and threading.active_count() > 1):
+            warnings.warn("FramePipeline forks its workers while {0} threads are running, which can deadlock them; "
+                          "create it before the Trainer".format(threading.active_count()), RuntimeWarning)
+        self.render = render
+        self.encode = encode
+        self.pool = multiprocessing.get_context(context).Pool(workers)
+        # a frame takes a slot before it is handed to the pool and gives it back once it is encoded
+        self.slots = threading.BoundedSemaphore(max_pending or 4 * workers)
+        self.pending = queue.Queue()
+        self.profiler = profiler
+        self.error = None
+        self.frames = 0
+        self.thread = threading.Thread(target=self._encode_loop, daemon=True)
+        self.thread.start()
+
+    def _encode_loop(self):
+        while True:
+            result = self.pending.get()
+            if(result is None):
+                return
+            try:
+                if(self.error is None):
+                    start = time.perf_counter()
+                    frame = result.get()
+                    rendered = time.perf_counter()
+                    self.encode(frame)
+                    self.frames += 1
+                    if(self.profiler is not None):
+                        self.profiler.add("render (bg)", rendered - start)
+                        self.profiler.add("encode (bg)", time.perf_counter() - rendered)
+            except Exception as e:
+                self.error = e
+            finally:
+                self.slots.release()
+
+    def _check(self):
+        if(self.error is not None):
+            raise RuntimeError("Frame rendering failed") from self.error
+
+    def submit(self, *snapshot):
+        '''
+        Queue one frame for rendering. Blocks while max_pending frames are already in flight.
+        '''
+        self._check()
+        self.slots.acquire()
+        self.pending.put(self.pool.apply_async(self.render, snapshot))
+
+    def close(self):
+        '''
+        Wait for every submitted frame to be encoded and shut the workers down.
+        '''
+        self.pending.put(None)
+        self.thread.join()
+        self.pool.close()
+        self.pool.join()
+        self._check()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,65 @@
+import os
+import re
+
+import torch
+
+from .train import make_config, make_distribution
+from .utils import Net
+
+# Offline pass over the generator snapshots saved during training (config["snapshot_dir"]). Frames or exported
+# points can be regenerated with different parameters without training again:
+#
+#   for i, generator in iter_generators(CONFIG):
+#       points.append(generator.forward(big_sample).detach().numpy())
+
+SNAPSHOT_NAME = re.compile(r"generator_(\d+)\.pt$")
+
+
+def snapshot_files(snapshot_dir):
+    '''
+    :return: sorted list of (iteration, path) for every generator snapshot in the directory
+    '''
+    found = []
+    for name in os.listdir(snapshot_dir):
+        match = SNAPSHOT_NAME.match(name)
+        if(match):
+            found.append((int(match.group(1)), os.path.join(snapshot_dir, name)))
+    return sorted(found)
+
+
+def checkpoint_config(path):
+    '''
+    :return: the config stored in a training checkpoint
+    '''
+    return torch.load(path, weights_only=False)["config"]
+
+
+def load_generator(config, path):
+    generator = Net(config["gen_layers"], output="linear")
+    generator.load_state_dict(torch.load(path))
+    generator.eval()
+    return generator
+
+
+def iter_generators(config, snapshot_dir=None, every=1):
+    '''
+    Yield (iteration, generator) for the saved snapshots of a run, in training order.
+    :param config: the config of the run
+    :param snapshot_dir: defaults to config["snapshot_dir"]
+    :param every: only yield every n-th snapshot
+    '''
+    config = make_config(config)
+    snapshot_dir = snapshot_dir or config["snapshot_dir"]
+    for i, path in snapshot_files(snapshot_dir)[::every]:
+        yield i, load_generator(config, path)
+
+
+def replay(config, render, snapshot_dir=None, every=1):
+    '''
+    Call render(i, generator, latent) for every saved snapshot and collect the results.
+    :param render: function of the iteration, the generator net and the latent distribution of the config
+    :return: list of render results in training order
+    '''
+    latent = make_distribution(make_config(config)["latent"])
+    with torch.no_grad():
+        return [render(i, generator, latent) for i, generator in iter_generators(config, snapshot_dir, every)]
@@ -0,0 +1,115 @@
+import argparse
+import json
+import resource
+
+import numpy as np
+
+from .train import make_config, run_config
+from .sweep import run_sweep
+from .utils import random_frame
+
+# How training cost grows with the dimension of the data, for the "Scaling to Higher Dimensions" section. For every
+# d the generator starts as a point cloud around the origin and learns a k-dimensional Gaussian manifold in R^d
+# centered a fixed distance away along a random direction; the run stops once its windowed W2 distance to the
+# target is small or stops improving (see schedule.Convergence), or when it exceeds the time budget.
+#
+#   python -m optimizers.scaling                                  d = 2 ... 512, k = 1, wgan
+#   python -m optimizers.scaling --dims 2 16 128 -k 2 --loss sliced
+#
+# Every run gets its own worker process, so the peak memory reported is that of the run alone.
+
+DIMS = [2, 4, 8, 16, 32, 64, 128, 256, 512]
+# distance of the target center from the origin, where the generator starts
+OFFSET = 4
+
+
+def scaling_config(d, k=1, loss="wgan", hidden=128, seed=0, **overrides):
+    '''
+    :param d: dimension of the data
+    :param k: dimension of the target manifold and of the latent space
+    :param hidden: width of the three hidden layers of generator and critic
+    :return: config training a generator onto a random k-dimensional Gaussian manifold in R^d
+    '''
+    rng = np.random.RandomState(seed)
+    direction = rng.randn(d)
+    m = OFFSET * direction / np.linalg.norm(direction)
+    base = {
+        "loss": loss,
+        "source": {"type": "manifold_gaussian", "m": m, "s": 1, "frame": random_frame(d, k, seed)},
+        "latent": {"type": "gaussian", "m": np.zeros(k), "S": np.eye(k)},
+        "disc_layers": [d, hidden, hidden, hidden, 1],
+        "gen_layers": [k, hidden, hidden, hidden, d],
+        "num_iter": 20000,
+        "stop_window": 100,
+        "stop_distance": 0.1,
+        "min_iter": 200,
+        "seed": seed,
+    }
+    return make_config(base, **overrides)
+
+
+def run_measured(config):
+    '''
+    run_config plus the peak resident memory of the worker process, in MB.
+    '''
+    summary = run_config(config)
+    # ru_maxrss is in kilobytes on Linux
+    summary["peak_memory_mb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    del summary["generator"]
+    return summary
+
+
+def row(summary):
+    c = summary["config"]
+    return {
+        "d": c["gen_layers"][-1],
+        "k": c["gen_layers"][0],
+        "loss": c["loss"],
+        "seconds": summary["seconds"],
+        "iterations": summary["iterations"],
+        "ms_per_iteration": 1000 * summary["seconds"] / max(summary["iterations"], 1),
+        "stop_reason": summary["stop_reason"],
+        "distance": summary["distance"],
+        "peak_memory_mb": summary["peak_memory_mb"],
+    }
+
+
+def run_scaling(dims=DIMS, k=1, loss="wgan", workers=1, threads=1, **overrides):
+    '''
+    Train one run per dimension.
+    :param workers: runs trained at once; more than one skews the timings when they share cores
+    :param overrides: config values for every run, e.g. max_seconds
+    :return: one row of measurements per dimension
+    '''
+    configs = [scaling_config(d, k, loss, **overrides) for d in dims]
+    summaries = run_sweep(configs, workers=workers, threads=threads, run=run_measured, fresh_workers=True)
+    return [row(s) for s in summaries]
+
+
+def print_table(rows):
+    print("{0:>6} {1:>4} {2:>10} {3:>10} {4:>10} {5:>10} {6:>10} {7:>10}".format(
+        "d", "k", "seconds", "iters", "ms/iter", "memory MB", "distance", "stopped"))
+    for r in rows:
+        distance = float("nan") if r["distance"] is None else r["distance"]
+        print("{0:>6} {1:>4} {2:>10.1f} {3:>10} {4:>10.2f} {5:>10.0f} {6:>10.3f} {7:>10}".format(
+            r["d"], r["k"], r["seconds"], r["iterations"], r["ms_per_iteration"], r["peak_memory_mb"], distance,
+            r["stop_reason"] or "num_iter"))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure training cost as the data dimension grows.")
+    parser.add_argument("--dims", type=int, nargs="+", default=DIMS, help="data dimensions to train")
+    parser.add_argument("-k", type=int, default=1, help="dimension of the target manifold")
+    parser.add_argument("--loss", default="wgan", help="gan, wgan, sliced or sinkhorn")
+    parser.add_argument("--num-iter", type=int, default=20000, help="most iterations per run")
+    parser.add_argument("--max-seconds", type=float, default=600, help="time budget per run")
+    parser.add_argument("--workers", type=int, default=1, help="runs trained at once")
+    parser.add_argument("--threads", type=int, default=1, help="torch threads per run")
+    parser.add_argument("--output", default="scaling_results.json", help="JSON file to write the rows to")
+    args = parser.parse_args()
+
+    rows = run_scaling(args.dims, args.k, args.loss, workers=args.workers, threads=args.threads,
+                       num_iter=args.num_iter, max_seconds=args.max_seconds)
+    print_table(rows)
+    with open(args.output, "w") as f:
+        json.dump(rows, f, indent=1)
@@ -0,0 +1,132 @@
+import math
+from collections import deque
+
+import numpy as np
+
+from .utils import Gaussian, LineGaussian, ManifoldGaussian
+from .stats import gaussian_w2, line_w2, manifold_w2, to_numpy
+
+# How fast a run learns and when it stops.
+#
+# Learning rate schedules are a multiplier of the configured learning rate as a function of the iteration. The
+# trainers write the scaled rate into their existing optimizers, so the running averages of RMSprop survive every
+# change and a resumed run picks up the same rate. Schedules are dicts, so configs stay picklable:
+#
+#   {"type": "step", "every": 1000, "factor": 0.5}     # half_lr_every=1000 is short for this
+#   {"type": "exponential", "gamma": 0.999}
+#   {"type": "cosine", "min": 0.1}                     # down to 0.1 of the rate at num_iter
+#
+# Convergence stops a run once the distance of the generator to the target, averaged over windows of iterations,
+# is below a threshold or stopped improving (a plateau), instead of always training for num_iter iterations.
+
+SCHEDULES = ("constant", "step", "exponential", "cosine")
+
+
+def make_schedule(config):
+    '''
+    :return: the learning rate schedule of a config, None for a constant rate
+    '''
+    if(config["lr_schedule"] is not None):
+        if(config["lr_schedule"]["type"] not in SCHEDULES):
+            raise ValueError("Unknown learning rate schedule: {0}".format(config["lr_schedule"]["type"]))
+        return config["lr_schedule"]
+    if(config["half_lr_every"]):
+        return {"type": "step", "every": config["half_lr_every"], "factor": 0.5}
+    return None
+
+
+def learn_rate_scale(schedule, i, num_iter):
+    '''
+    :return: the multiplier of the learning rate at iteration i
+    '''
+    if(schedule is None or schedule["type"] == "constant"):
+        return 1.0
+    if(schedule["type"] == "step"):
+        return schedule.get("factor", 0.5) ** (i // schedule["every"])
+    if(schedule["type"] == "exponential"):
+        return schedule["gamma"] ** i
+    if(schedule["type"] == "cosine"):
+        low = schedule.get("min", 0.0)
+        return low + (1 - low) * (1 + math.cos(math.pi * min(i / num_iter, 1))) / 2
+    raise ValueError("Unknown learning rate schedule: {0}".format(schedule["type"]))
+
+
+def set_learn_rate(optim, lr):
+    # in place, so the optimizer state is kept
+    for group in optim.param_groups:
+        group["lr"] = lr
+
+
+def target_distance(dist):
+    '''
+    :return: a function giving the 2-Wasserstein distance of a batch of samples to dist, or None when dist has no
+             closed form: the Gaussian distance of the batch moments for Gaussian targets, the exact distance
+             along and from the line for LineGaussian targets and the distance within and from the subspace for
+             ManifoldGaussian targets
+    '''
+    if(isinstance(dist, Gaussian)):
+        return lambda samples: gaussian_w2(*moments(samples), dist.m, dist.S)
+    if(isinstance(dist, LineGaussian)):
+        return lambda samples: line_w2(samples, dist.m, dist.s[0], dist.slope)
+    if(isinstance(dist, ManifoldGaussian)):
+        return lambda samples: manifold_w2(samples, dist.m, dist.s, dist.frame)
+    return None
+
+
+def moments(samples):
+    x = to_numpy(samples)
+    return x.mean(axis=0), np.atleast_2d(np.cov(x, rowvar=False))
+
+
+class Convergence():
+    def __init__(self, window=100, threshold=None, tol=0.01, patience=5, min_iter=0):
+        '''
+        :param window: iterations whose distances are averaged into one window
+        :param threshold: stop once a window's mean distance is below this
+        :param tol: relative improvement of the best window mean that counts as progress
+        :param patience: stop after this many windows in a row without progress
+        :param min_iter: never stop before this iteration
+        '''
+        self.window = window
+        self.threshold = threshold
+        self.tol = tol
+        self.patience = patience
+        self.min_iter = min_iter
+        self.values = deque(maxlen=window)
+        self.best = np.inf
+        self.stale = 0
+        self.means = []
+
+    def update(self, i, distance):
+        '''
+        Add the distance of iteration i.
+        :return: None to continue, or the reason to stop, "converged" or "plateau"
+        '''
+        self.values.append(distance)
+        if(len(self.values) < self.window):
+            return None
+        mean = float(np.mean(self.values))
+        self.values.clear()
+        self.means.append(mean)
+        if(mean < self.best * (1 - self.tol)):
+            self.best = mean
+            self.stale = 0
+        else:
+            self.stale += 1
+        if(i + 1 < self.min_iter):
+            return None
+        if(self.threshold is not None and mean < self.threshold):
+            return "converged"
+        if(self.stale >= self.patience):
+            return "plateau"
+        return None
+
+    def state_dict(self):
+        return {"values": list(self.values), "best": self.best, "stale": self.stale, "means": list(self.means)}
+
+    def load_state_dict(self, state):
+        self.values.clear()
+        self.values.extend(state["values"])
+        self.best = state["best"]
+        self.stale = state["stale"]
+        self.means = list(state["means"])
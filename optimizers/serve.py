@@ -0,0 +1,211 @@
+import argparse
+import hashlib
+import json
+import sys
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock
+
+import numpy as np
+
+from .transport import solve, sinkhorn, emd_1d, plan_cost
+
+# Optimal plans for edited histograms while authoring the transport section, served locally instead of precomputed
+# by two_dims/mip_transport.py.
+#
+#   python -m optimizers.serve --port 8765       POST {"a": [...], "b": [...]} to http://localhost:8765/plan
+#   python -m optimizers.serve --stdio           one JSON request per line on stdin, one response per line on stdout
+#
+# A request holds the histograms a and b and optionally method ("exact" or "sinkhorn"), p and reg (in units of the
+# cost of moving mass by one bin, see transport.sinkhorn). The response has the plan as nested rows (rows are the
+# bins of a), the same plan as the CSV string HeatMap.fromCSVStr reads, its cost, the L1 distance of its marginals
+# from a and b relative to the total mass (sinkhorn plans are approximate, see transport.sinkhorn), and whether it
+# came from the cache or a warm start. Repeated queries are answered from an LRU cache keyed by the request. The
+# exact plan for the line cost is the linear time emd_1d, so only sinkhorn has anything to warm start: when few bins
+# changed since the last query of the same shape, it starts from that query's potentials. Requests of the HTTP
+# server run on their own threads, so the cache and the last potentials are only read and written under a lock,
+# while the solves themselves run concurrently.
+
+
+def check_histogram(name, h):
+    h = np.asarray(h, dtype=np.float64)
+    if(h.ndim != 1 or len(h) == 0):
+        raise ValueError("{0} must be a non-empty list of numbers, got shape {1}".format(name, h.shape))
+    if(not np.all(np.isfinite(h)) or np.any(h < 0)):
+        raise ValueError("{0} must be finite and non-negative".format(name))
+    return h
+
+
+class PlanService():
+    def __init__(self, cache_size=256, warm_bins=4):
+        '''
+        :param cache_size: responses kept in the LRU cache
+        :param warm_bins: warm start sinkhorn when at most this many bins changed since the last query of its shape
+        '''
+        self.cache = OrderedDict()
+        self.cache_size = cache_size
+        self.warm_bins = warm_bins
+        # last histograms and potentials per (method, reg, p, n, m)
+        self.previous = {}
+        self.hits = 0
+        self.misses = 0
+        self.lock = Lock()
+
+    def key(self, a, b, method, p, reg):
+        h = hashlib.sha1(json.dumps([method, p, reg, len(a), len(b)]).encode())
+        h.update(a.tobytes())
+        h.update(b.tobytes())
+        return h.hexdigest()
+
+    def plan(self, a, b, method="exact", p=1, reg=1.0):
+        '''
+        :param a: histogram of length n
+        :param b: histogram of length m with the same total mass
+        :return: JSON-ready response dict
+        :raises ValueError: for histograms that are not 1-D, empty, negative or not finite, or without equal positive
+                            mass
+        '''
+        a = check_histogram("a", a)
+        b = check_histogram("b", b)
+        if(a.sum() <= 0 or not np.isclose(a.sum(), b.sum())):
+            raise ValueError("Histograms must have equal positive mass, got {0} and {1}".format(a.sum(), b.sum()))
+        start = time.perf_counter()
+        key = self.key(a, b, method, p, reg)
+        with self.lock:
+            if(key in self.cache):
+                self.cache.move_to_end(key)
+                self.hits += 1
+                return dict(self.cache[key], cached=True, ms=1000 * (time.perf_counter() - start))
+            self.misses += 1
+
+        warm = False
+        if(method == "sinkhorn"):
+            shape = (method, reg, p, len(a), len(b))
+            init = None
+            with self.lock:
+                last = self.previous.get(shape)
+                if(last is not None and np.sum(last[0] != a) + np.sum(last[1] != b) <= self.warm_bins):
+                    init, warm = last[2], True
+            plan, potentials = sinkhorn(a, b, p=p, reg=reg, init=init, return_potentials=True)
+            with self.lock:
+                self.previous[shape] = (a, b, potentials)
+        elif(method == "exact" and p >= 1):
+            plan = emd_1d(a, b)
+        else:
+            plan = solve(a, b, method=method, p=p)
+
+        cost = plan_cost(plan, p=p)
+        if(not np.isfinite(cost)):
+            # NaN is not valid JSON
+            raise ValueError("The {0} plan did not converge".format(method))
+        dense = plan.toarray()
+        marginal_error = (np.abs(dense.sum(axis=1) - a).sum() + np.abs(dense.sum(axis=0) - b).sum()) / a.sum()
+        rows = dense.tolist()
+        response = {
+            "plan": rows,
+            "csv": "\n".join(",".join(map("{0:.6g}".format, row)) for row in rows),
+            "cost": cost,
+            "marginal_error": float(marginal_error),
+            "warm": warm,
+        }
+        with self.lock:
+            self.cache[key] = response
+            if(len(self.cache) > self.cache_size):
+                self.cache.popitem(last=False)
+        return dict(response, cached=False, ms=1000 * (time.perf_counter() - start))
+
+    def handle(self, request):
+        '''
+        Answer one decoded request; errors are returned as {"error": message}.
+        '''
+        try:
+            return self.plan(request["a"], request["b"], method=request.get("method", "exact"),
+                             p=request.get("p", 1), reg=request.get("reg", 1.0))
+        except Exception as e:
+            # anything a malformed request raises is answered instead of ending the server or the stdio loop
+            return {"error": "{0}: {1}".format(type(e).__name__, e)}
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "cached": len(self.cache)}
+
+
+def make_handler(service):
+    class Handler(BaseHTTPRequestHandler):
+        def send_json(self, status, body):
+            data = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            # the article is served from another local port while authoring
+            self.send_header("Access-Control-Allow-Origin", "*")
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_OPTIONS(self):
+            self.send_response(204)
+            self.send_header("Access-Control-Allow-Origin", "*")
+            self.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
+            self.send_header("Access-Control-Allow-Headers", "Content-Type")
+            self.end_headers()
+
+        def do_GET(self):
+            if(self.path == "/stats"):
+                self.send_json(200, service.stats())
+            else:
+                self.send_json(404, {"error": "Unknown path: {0}".format(self.path)})
+
+        def do_POST(self):
+            if(self.path != "/plan"):
+                self.send_json(404, {"error": "Unknown path: {0}".format(self.path)})
+                return
+            try:
+                request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+            except ValueError as e:
+                self.send_json(400, {"error": "Invalid JSON: {0}".format(e)})
+                return
+            response = service.handle(request)
+            self.send_json(400 if "error" in response else 200, response)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def serve_http(service, host="127.0.0.1", port=8765):
+    server = ThreadingHTTPServer((host, port), make_handler(service))
+    print("Serving transport plans on http://{0}:{1}/plan".format(host, port))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    server.server_close()
+
+
+def serve_stdio(service, stdin=sys.stdin, stdout=sys.stdout):
+    for line in stdin:
+        if(not line.strip()):
+            continue
+        try:
+            response = service.handle(json.loads(line))
+        except ValueError as e:
+            response = {"error": "Invalid JSON: {0}".format(e)}
+        stdout.write(json.dumps(response) + "\n")
+        stdout.flush()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve optimal transport plans between histograms.")
+    parser.add_argument("--stdio", action="store_true", help="read requests from stdin instead of serving HTTP")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--cache-size", type=int, default=256, help="responses kept in the LRU cache")
+    parser.add_argument("--warm-bins", type=int, default=4, help="changed bins up to which sinkhorn warm starts")
+    args = parser.parse_args()
+
+    service = PlanService(args.cache_size, args.warm_bins)
+    if(args.stdio):
+        serve_stdio(service)
+    else:
+        serve_http(service, args.host, args.port)
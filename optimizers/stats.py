@@ -0,0 +1,140 @@
+import numpy as np
+
+# Streaming generator statistics and closed-form distances to the training targets.
+#
+# StreamingMoments folds batches into a running mean and covariance (Chan et al.'s pairwise form of Welford's
+# update), so frame statistics can come from the generator samples the training loop already draws. Those samples
+# are all drawn before the iteration's generator update, so the statistics describe the weights at the start of the
+# iteration, as do the exact moments of an affine generator in Trainer.batch_moments.
+
+
+def to_numpy(samples):
+    if(hasattr(samples, "detach")):
+        samples = samples.detach().numpy()
+    return np.asarray(samples, dtype=np.float64)
+
+
+class StreamingMoments():
+    def __init__(self, dim):
+        self.dim = dim
+        self.reset()
+
+    def reset(self):
+        self.n = 0
+        self.mean = np.zeros(self.dim)
+        self.m2 = np.zeros((self.dim, self.dim))
+
+    def update(self, samples):
+        '''
+        Fold a batch into the running moments.
+        :param samples: (n, dim) array or tensor
+        '''
+        x = to_numpy(samples).reshape((-1, self.dim))
+        n_b = x.shape[0]
+        if(n_b == 0):
+            return self
+        mean_b = x.mean(axis=0)
+        centered = x - mean_b
+        m2_b = centered.T.dot(centered)
+        n = self.n + n_b
+        delta = mean_b - self.mean
+        self.m2 += m2_b + np.outer(delta, delta) * (self.n * n_b / n)
+        self.mean = self.mean + delta * (n_b / n)
+        self.n = n
+        return self
+
+    @property
+    def cov(self):
+        '''
+        Unbiased covariance estimate, as np.cov.
+        '''
+        return self.m2 / max(self.n - 1, 1)
+
+
+def sqrtm_psd(S):
+    w, V = np.linalg.eigh(S)
+    return (V * np.sqrt(np.clip(w, 0, None))).dot(V.T)
+
+
+def gaussian_w2(m1, S1, m2, S2):
+    '''
+    2-Wasserstein distance between N(m1, S1) and N(m2, S2):
+    W2^2 = |m1 - m2|^2 + tr(S1 + S2 - 2 (S2^1/2 S1 S2^1/2)^1/2)
+    '''
+    m1, m2 = np.asarray(m1, dtype=float), np.asarray(m2, dtype=float)
+    S1, S2 = np.atleast_2d(S1).astype(float), np.atleast_2d(S2).astype(float)
+    root = sqrtm_psd(S2)
+    bures = np.trace(S1 + S2 - 2 * sqrtm_psd(root.dot(S1).dot(root)))
+    return float(np.sqrt(max(np.sum((m1 - m2) ** 2) + bures, 0)))
+
+
+def gaussian_kl(m1, S1, m2, S2):
+    '''
+    KL(N(m1, S1) || N(m2, S2)). Infinite when either covariance is singular.
+    '''
+    m1, m2 = np.asarray(m1, dtype=float), np.asarray(m2, dtype=float)
+    S1, S2 = np.atleast_2d(S1).astype(float), np.atleast_2d(S2).astype(float)
+    sign1, logdet1 = np.linalg.slogdet(S1)
+    sign2, logdet2 = np.linalg.slogdet(S2)
+    if(sign1 <= 0 or sign2 <= 0):
+        return np.inf
+    inv2 = np.linalg.inv(S2)
+    diff = m2 - m1
+    return float(0.5 * (np.trace(inv2.dot(S1)) + diff.dot(inv2).dot(diff) - len(m1) + logdet2 - logdet1))
+
+
+def line_coordinates(samples, m, slope):
+    '''
+    Split samples into their coordinate along the line m + t * slope and their distance from it.
+    '''
+    x = to_numpy(samples)
+    slope = np.asarray(slope, dtype=float)
+    slope = slope / np.linalg.norm(slope)
+    rel = x - np.asarray(m, dtype=float)
+    along = rel.dot(slope)
+    perp = np.linalg.norm(rel - np.outer(along, slope), axis=1)
+    return along, perp
+
+
+def normal_quantiles(n, s):
+    # midpoint quantiles of N(0, s^2), the sorted positions an n-sample from the target is matched to
+    import scipy.stats
+    return scipy.stats.norm.ppf((np.arange(n) + 0.5) / n) * s
+
+
+def line_w1(samples, m, s, slope):
+    '''
+    1-Wasserstein distance between the projection of the samples onto the line and the LineGaussian target
+    N(0, s^2) along it, computed exactly by matching sorted projections to target quantiles.
+    :return: (w1 along the line, mean distance of the samples from the line)
+    '''
+    along, perp = line_coordinates(samples, m, slope)
+    w1 = np.mean(np.abs(np.sort(along) - normal_quantiles(len(along), float(s))))
+    return float(w1), float(perp.mean())
+
+
+def line_w2(samples, m, s, slope):
+    '''
+    2-Wasserstein distance between the samples and the LineGaussian target. The target lies on the line, so the
+    squared distance from the line adds to the 1D squared W2 along it regardless of the coupling.
+    '''
+    along, perp = line_coordinates(samples, m, slope)
+    w2_sq = np.mean((np.sort(along) - normal_quantiles(len(along), float(s))) ** 2) + np.mean(perp ** 2)
+    return float(np.sqrt(w2_sq))
+
+
+def manifold_w2(samples, m, s, frame):
+    '''
+    2-Wasserstein distance between the samples and the ManifoldGaussian target N(m, F diag(s^2) F^T) on the subspace
+    spanned by the orthonormal (d, k) frame F. As for line_w2, the squared distance from the subspace adds to the
+    squared W2 within it; the latter is the Gaussian W2 of the moments of the k frame coordinates, so the cost is
+    linear in d and the estimate does not degrade with it.
+    '''
+    x = to_numpy(samples) - np.asarray(m, dtype=float)
+    frame = np.asarray(frame, dtype=float)
+    coords = x.dot(frame)
+    perp_sq = np.sum(x ** 2, axis=1) - np.sum(coords ** 2, axis=1)
+    k = frame.shape[1]
+    within = gaussian_w2(coords.mean(axis=0), np.atleast_2d(np.cov(coords, rowvar=False)), np.zeros(k),
+                         np.diag(np.broadcast_to(np.asarray(s, dtype=float), (k,)) ** 2))
+    return float(np.sqrt(within ** 2 + max(np.mean(perp_sq), 0)))
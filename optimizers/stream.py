@@ -0,0 +1,98 @@
+import copy
+from concurrent.futures import ThreadPoolExecutor
+
+import torch
+
+from .utils import Sampler
+
+# Batches for the training steps, drawn a block at a time. One vectorized sample call fills a block of many batches
+# and next() hands out views into it; while one block is consumed the next is drawn on a background thread, so the
+# steps never wait for sampling.
+#
+# A stream draws from its own copy of the distribution and its own torch.Generator (seeded from the global one),
+# so the background draws neither race with the training thread nor depend on its timing: a seeded run draws the
+# same batches with or without prefetching.
+
+
+class SampleStream():
+    def __init__(self, dist, batch, dim, block=32, prefetch=True, seed=None):
+        '''
+        :param dist: distribution to draw from; utils.Sampler subclasses are drawn from in place, anything else with
+                     a sample(n) method is converted and copied in without prefetching
+        :param batch: samples per batch
+        :param dim: dimension of the samples
+        :param block: batches per block
+        :param prefetch: draw the next block on a background thread
+        :param seed: seed of the stream's generator, drawn from the global torch generator by default
+        '''
+        self.batch = batch
+        self.block = block
+        self.native = isinstance(dist, Sampler)
+        # a copy, so the noise buffer of the original is free for the training thread
+        self.dist = copy.copy(dist)
+        if(self.native):
+            self.dist._noise = None
+        self.prefetch = prefetch and self.native
+        self.generator = torch.Generator()
+        self.generator.manual_seed(int(torch.randint(2 ** 62, (1,))) if seed is None else seed)
+
+        self.bufs = [torch.empty((block * batch, dim)) for k in range(2)]
+        self.executor = ThreadPoolExecutor(1) if self.prefetch else None
+        self.pending = None
+        self.current = 0
+        self.state = self._fill(self.bufs[0])
+        self.pos = 0
+        self._start_prefetch()
+
+    def _fill(self, buf):
+        # returns the generator state the block was drawn from, so a checkpoint can redraw it
+        state = self.generator.get_state()
+        if(self.native):
+            self.dist.sample(len(buf), out=buf, generator=self.generator)
+        else:
+            buf.copy_(torch.as_tensor(self.dist.sample(len(buf)), dtype=torch.float))
+        return state
+
+    def _start_prefetch(self):
+        if(self.prefetch):
+            self.pending = self.executor.submit(self._fill, self.bufs[1 - self.current])
+
+    def _advance(self):
+        other = 1 - self.current
+        if(self.pending is not None):
+            self.state = self.pending.result()
+            self.pending = None
+        else:
+            self.state = self._fill(self.bufs[other])
+        self.current = other
+        self.pos = 0
+        self._start_prefetch()
+
+    def next(self):
+        '''
+        :return: the next (batch, dim) batch, a view which stays valid until the following call
+        '''
+        if(self.pos == self.block):
+            self._advance()
+        start = self.pos * self.batch
+        self.pos += 1
+        return self.bufs[self.current][start:start + self.batch]
+
+    def state_dict(self):
+        return {"generator": self.state, "pos": self.pos}
+
+    def load_state_dict(self, state):
+        '''
+        Continue from a saved position: the current block is redrawn from the generator state it was drawn from.
+        '''
+        if(self.pending is not None):
+            self.pending.result()
+            self.pending = None
+        self.generator.set_state(state["generator"])
+        self.state = self._fill(self.bufs[self.current])
+        self.pos = state["pos"]
+        self._start_prefetch()
+
+    def close(self):
+        if(self.executor is not None):
+            self.executor.shutdown(wait=True)
@@ -0,0 +1,62 @@
+import itertools
+import multiprocessing
+
+import numpy as np
+import torch
+
+from .train import make_config, run_config
+
+# Run a grid of training configs in parallel. Every worker process is pinned to a fixed number of torch threads
+# and every config gets a fixed seed, so a sweep is reproducible no matter how its runs are scheduled.
+
+
+def grid(base=None, **axes):
+    '''
+    Expand a base config over the cartesian product of the given axes.
+    Example: grid(base, learn_rate=[5e-4, 5e-5], critic_steps=[1, 5, 20]) gives 6 configs.
+    :param base: config dict shared by every point of the grid
+    :param axes: config key -> list of values to try
+    :return: list of full config dicts
+    '''
+    keys = sorted(axes)
+    return [make_config(base, **dict(zip(keys, values))) for values in itertools.product(*[axes[k] for k in keys])]
+
+
+def _init_worker(threads):
+    torch.set_num_threads(threads)
+
+
+def run_sweep(configs, workers=None, threads=1, base_seed=0, run=run_config, fresh_workers=False):
+    '''
+    Train every config on a pool of worker processes.
+    :param configs: list of (possibly partial) config dicts
+    :param workers: number of processes, defaults to as many as fit on the machine with the given threads each
+    :param threads: torch threads per worker
+    :param base_seed: configs without a seed get base_seed + their index in the list
+    :param run: picklable function training one config and returning its summary
+    :param fresh_workers: run every config in a new process, so per-process measurements like peak memory are
+                          those of a single run
+    :return: list of run summaries (see train.summarize), in the same order as configs
+    '''
+    configs = [make_config(c) for c in configs]
+    for idx, config in enumerate(configs):
+        if(config["seed"] is None):
+            config["seed"] = base_seed + idx
+        config["verbose"] = False
+
+    if(workers is None):
+        workers = max(1, multiprocessing.cpu_count() // threads)
+    workers = min(workers, len(configs))
+
+    with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(threads,),
+                              maxtasksperchild=1 if fresh_workers else None) as pool:
+        return pool.map(run, configs, chunksize=1)
+
+
+if __name__ == "__main__":
+    base = make_config(num_iter=500, critic_steps=5)
+    results = run_sweep(grid(base, loss=["gan", "wgan"], learn_rate=[0.0005, 0.00005], critic_steps=[1, 5, 20]))
+    for r in results:
+        c = r["config"]
+        print("{0} lr={1} critic_steps={2} - mean {3} ({4:.1f}s)".format(
+            c["loss"], c["learn_rate"], c["critic_steps"], np.round(r["mean"], 3), r["seconds"]))
@@ -0,0 +1,21 @@
+import pytest
+
+torch = pytest.importorskip("torch")
+
+from optimizers.batched import BatchedTrainer
+
+
+@pytest.mark.parametrize("loss", ["wgan", "gan"])
+def test_members_match_batched_forward(loss):
+    trainer = BatchedTrainer({"loss": loss, "disc_layers": [2, 16, 16, 1], "gen_layers": [2, 16, 16, 2],
+                              "num_iter": 3, "critic_steps": 2, "verbose": False}, seeds=range(4)).run()
+    latent = torch.randn((4, 32, 2))
+    points = torch.randn((4, 32, 2))
+    with torch.no_grad():
+        generated = trainer.generator(latent)
+        scores = trainer.discriminator(points)
+        for k in range(4):
+            torch.testing.assert_close(trainer.member_generator(k).forward(latent[k]), generated[k])
+            torch.testing.assert_close(trainer.member_discriminator(k).forward(points[k]), scores[k])
+    if(loss == "wgan"):
+        assert all(w.abs().max() <= trainer.config["clip"] for w in trainer.discriminator.weights)
@@ -0,0 +1,14 @@
+from optimizers.build_data import ENTRIES, package_imports, package_sources
+
+
+def test_script_sources_include_imported_modules():
+    sources = package_sources([ENTRIES["wganManifold"]["script"]])
+    # imported by the script, and through train.py
+    for module in ("manifold/wgan_nice_graph.py", "utils.py", "train.py", "stats.py", "schedule.py"):
+        assert module in sources
+
+
+def test_relative_imports():
+    assert package_imports("from .transport import solve") == ["transport.py"]
+    assert package_imports("from . import divergence, transport") == ["divergence.py", "transport.py"]
+    assert package_imports("import numpy as np\nfrom optimizers.utils import *") == ["utils.py"]
@@ -0,0 +1,29 @@
+import numpy as np
+import pytest
+
+from optimizers.density import DensityGrid
+
+
+@pytest.mark.parametrize("max_dense_cells", [2**24, 0])
+def test_density_matches_histogram2d(max_dense_cells):
+    rng = np.random.RandomState(0)
+    points = rng.randn(20000, 2) * [1.0, 0.5]
+    grid = DensityGrid(-3, [3, 2], 0.1, max_dense_cells=max_dense_cells)
+    assert grid.is_dense == (max_dense_cells > 0)
+    # batches both smaller and larger than the bincount cutoff
+    for batch in np.array_split(points, [10, 5000]):
+        grid.add(batch)
+
+    edges = [np.linspace(-3, 3, 61), np.linspace(-3, 2, 51)]
+    expected, _, _ = np.histogram2d(points[:, 0], points[:, 1], bins=edges)
+    inside = int(expected.sum())
+    assert grid.total == inside
+    assert grid.dropped == len(points) - inside
+    np.testing.assert_array_equal(grid.dense(normalize=False), expected)
+    np.testing.assert_allclose(grid.dense(), expected / inside)
+
+    x, y, mass = grid.coords(normalize=False)
+    rows, cols = np.nonzero(expected)
+    np.testing.assert_allclose(np.sort(x.ravel()), np.sort(edges[0][rows]), atol=1e-12)
+    np.testing.assert_allclose(np.sort(y.ravel()), np.sort(edges[1][cols]), atol=1e-12)
+    assert mass.sum() == inside
@@ -0,0 +1,35 @@
+import numpy as np
+
+from optimizers import divergence
+
+
+def gaussian_histogram(m, s, bins=400):
+    # a density sampled at the bin centers, bins one unit apart as in w1
+    x = np.arange(bins) + 0.5
+    return np.exp(-(x - m) ** 2 / (2 * s ** 2))
+
+
+def test_gaussian_closed_forms():
+    p = gaussian_histogram(180, 20)
+    q = gaussian_histogram(210, 25)
+    # KL of Gaussians, in bits
+    expected = (np.log(25 / 20) + (20 ** 2 + 30 ** 2) / (2 * 25 ** 2) - 0.5) / np.log(2)
+    np.testing.assert_allclose(divergence.kl(p, q), expected, rtol=1e-3)
+    np.testing.assert_allclose(divergence.cross_entropy(p, q) - divergence.entropy(p), expected, rtol=1e-3)
+    # W1 of a translate is the shift, and agrees with W2 = sqrt(dm^2 + ds^2) for equal widths
+    np.testing.assert_allclose(divergence.w1(p, gaussian_histogram(210, 20)), 30, rtol=1e-3)
+    assert 0 < divergence.jsd(p, q) < 1
+
+
+def test_tables_match_pairwise():
+    rng = np.random.RandomState(0)
+    histograms = {name: rng.randint(1, 10, 8) for name in "abc"}
+    tables = divergence.tables(histograms, decimals=12)
+    assert tables["names"] == ["a", "b", "c"]
+    for name in divergence.TABLE_FUNCTIONS:
+        matrix = np.array(tables[name])
+        np.testing.assert_allclose(np.diag(matrix), 0 if name != "cross_entropy" else tables["entropy"], atol=1e-9)
+        for i, p in enumerate("abc"):
+            for j, q in enumerate("abc"):
+                value = getattr(divergence, name)(histograms[p], histograms[q])
+                np.testing.assert_allclose(matrix[i, j], value, atol=1e-9)
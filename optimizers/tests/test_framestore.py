@@ -0,0 +1,49 @@
+import os
+
+import numpy as np
+import pytest
+
+from optimizers.framestore import FrameStore
+
+
+def test_append_truncate_reopen(tmp_path):
+    path = str(tmp_path / "frames.pvfs")
+    rng = np.random.RandomState(0)
+    means = rng.randn(300, 2)
+    covs = rng.randn(300, 2, 2)
+    # a small capacity, so the file grows several times
+    store = FrameStore(path, {"mean": (2,), "cov": (2, 2)}, capacity=4, meta={"target": [4, 4]})
+    for i in range(300):
+        store.append(3 * i, mean=means[i], cov=covs[i])
+    store.close()
+    # closing trims the capacity left over from the last doubling
+    assert os.path.getsize(path) == store.header_size + 300 * store.dtype.itemsize
+
+    store = FrameStore(path, {"mean": (2,), "cov": (2, 2)})
+    assert len(store) == 300
+    assert store.meta == {"target": [4, 4]}
+    np.testing.assert_array_equal(store.iterations, 3 * np.arange(300))
+    np.testing.assert_array_equal(store["mean"], means)
+    np.testing.assert_array_equal(store[10:12]["cov"], covs[10:12])
+
+    # as when resuming from a checkpoint at iteration 150, then appending again
+    store.truncate(150)
+    assert len(store) == 50
+    store.append(150, mean=[1, 2], cov=np.eye(2))
+    store.close()
+
+    store = FrameStore(path)
+    assert len(store) == 51
+    np.testing.assert_array_equal(store["mean"][:50], means[:50])
+    np.testing.assert_array_equal(store["mean"][50], [1, 2])
+    assert store.iterations[-1] == 150
+    store.close()
+
+
+def test_fields_are_checked(tmp_path):
+    path = str(tmp_path / "frames.pvfs")
+    FrameStore(path, {"mean": (2,)}).close()
+    with pytest.raises(ValueError):
+        FrameStore(path, {"mean": (3,)})
+    with pytest.raises(ValueError):
+        FrameStore(str(tmp_path / "missing.pvfs"))
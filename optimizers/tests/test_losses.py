@@ -0,0 +1,27 @@
+import pytest
+
+torch = pytest.importorskip("torch")
+
+from optimizers.losses import sinkhorn_divergence, sliced_wasserstein
+
+
+def test_distances_of_shifted_batches():
+    torch.manual_seed(0)
+    x = torch.randn((256, 2), dtype=torch.float64)
+    shift = torch.tensor([0.3, -0.4], dtype=torch.float64)
+    assert float(sliced_wasserstein(x, x)) == 0
+    assert abs(float(sinkhorn_divergence(x, x))) < 1e-6
+    # a translate is matched to itself along every direction: the squared shift along a unit direction averages to
+    # |shift|^2 / d, and the debiased divergence tends to the half squared cost of the shift
+    assert float(sliced_wasserstein(x, x + shift, projections=4096)) == pytest.approx(0.25 / 2, rel=0.05)
+    assert float(sinkhorn_divergence(x, x + shift)) == pytest.approx(0.5 * 0.25, rel=0.05)
+
+
+@pytest.mark.parametrize("loss", [sliced_wasserstein, sinkhorn_divergence])
+def test_gradient_moves_samples_toward_target(loss):
+    torch.manual_seed(0)
+    y = torch.randn((128, 2), dtype=torch.float64)
+    x = (y + 1).requires_grad_(True)
+    loss(x, y).backward()
+    # the batch is pulled back along the shift
+    assert torch.all(x.grad.sum(dim=0) > 0)
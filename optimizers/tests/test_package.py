@@ -0,0 +1,26 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def imported_after(code):
+    # a fresh interpreter, since the test session has imported torch already
+    out = subprocess.check_output([sys.executable, "-c", code + "\nimport sys\nprint(' '.join(sorted(sys.modules)))"],
+                                  cwd=ROOT)
+    return set(out.decode().split())
+
+
+def test_package_import_is_lazy():
+    modules = imported_after("import optimizers\nfrom optimizers import trajectory, density")
+    assert "optimizers.trajectory" in modules and "optimizers.density" in modules
+    assert "optimizers.train" not in modules
+    assert not {"torch", "matplotlib", "cv2", "scipy"} & modules
+
+
+def test_submodules_load_on_access():
+    modules = imported_after("import optimizers\noptimizers.stats")
+    assert "optimizers.stats" in modules
+    code = "import optimizers\ntry:\n    optimizers.missing\nexcept AttributeError:\n    print('raised')"
+    assert "raised" in imported_after(code)
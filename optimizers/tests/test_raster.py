@@ -0,0 +1,32 @@
+import numpy as np
+
+from optimizers.raster import FrameRenderer, BLUE, ORANGE, WHITE
+
+
+def test_gaussian_density():
+    renderer = FrameRenderer(xlim=(0, 8), ylim=(0, 6))
+    field = renderer.gaussian(np.array([4, 3]), np.array([[0.5, -0.3], [-0.3, 0.5]]))
+    assert field.shape == renderer.plot_shape
+    # a Riemann sum over the pixels of a density well inside the plot area
+    pixel = 8 / renderer.plot_shape[1] * 6 / renderer.plot_shape[0]
+    np.testing.assert_allclose(field.sum() * pixel, 1, rtol=1e-3)
+    row, col = np.unravel_index(np.argmax(field), field.shape)
+    np.testing.assert_allclose([renderer.X[row, col], renderer.Y[row, col]], [4, 3], atol=0.02)
+
+
+def test_frames_start_from_the_static_layer():
+    renderer = FrameRenderer(xlim=(0, 4), ylim=(0, 4))
+    renderer.contour(renderer.gaussian([2, 2], np.eye(2) * 0.3), ORANGE, static=True)
+    static = renderer.static.copy()
+
+    frame = renderer.begin()
+    renderer.scatter(np.array([[1.0, 1.0], [10.0, 10.0]]), BLUE)
+    # the point outside of the plot area is skipped, the one inside is drawn at its pixel
+    row, col = renderer.to_pixels(np.array([[1.0, 1.0]]))[0] + renderer.margin
+    assert tuple(frame[row, col]) == BLUE
+    np.testing.assert_array_equal(renderer.static, static)
+    assert np.any(np.all(static == ORANGE, axis=2))
+
+    frame = renderer.begin()
+    np.testing.assert_array_equal(frame, static)
+    assert tuple(frame[renderer.margin + 1, renderer.margin + 1]) == WHITE
@@ -0,0 +1,23 @@
+import time
+
+from optimizers.render import FramePipeline
+
+
+def render(i):
+    time.sleep(0.001)
+    return i
+
+
+def test_frames_in_flight():
+    encoded = []
+
+    def encode(frame):
+        # a slow encoder, so submit has to wait for it
+        time.sleep(0.01)
+        encoded.append(frame)
+
+    with FramePipeline(render, encode, workers=2, max_pending=3) as pipeline:
+        for i in range(20):
+            pipeline.submit(i)
+            assert i + 1 - len(encoded) <= 3
+    assert encoded == list(range(20))
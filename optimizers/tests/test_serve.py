@@ -0,0 +1,30 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from optimizers.serve import PlanService
+
+
+def test_cache_and_warm_start():
+    service = PlanService()
+    a = np.arange(1, 17, dtype=float)
+    b = a[::-1].copy()
+    first = service.plan(a, b, method="sinkhorn")
+    assert not first["cached"] and not first["warm"]
+    assert first["marginal_error"] < 1e-5
+    assert service.plan(a, b, method="sinkhorn")["cached"]
+
+    edited = a.copy()
+    edited[[3, 4]] += [1, -1]
+    assert service.plan(edited, b, method="sinkhorn")["warm"]
+
+
+def test_concurrent_queries():
+    service = PlanService(cache_size=0)
+    rng = np.random.RandomState(0)
+    queries = [rng.randint(1, 10, 32).astype(float) for _ in range(16)]
+    b = np.full(32, 1.0)
+    with ThreadPoolExecutor(8) as pool:
+        responses = list(pool.map(lambda a: service.plan(a, b * a.sum() / 32, method="sinkhorn"), queries))
+    assert all(r["marginal_error"] < 1e-5 for r in responses)
+    assert service.stats()["misses"] == len(queries)
@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+
+from optimizers.stream import SampleStream
+from optimizers.utils import Gaussian
+
+
+def target():
+    return Gaussian(np.array([4, 4]), np.array([[0.5, -0.3], [-0.3, 0.5]]))
+
+
+def batches(stream, n):
+    # next() returns views into the block buffers, so they are copied before the buffers are reused
+    return [stream.next().clone() for k in range(n)]
+
+
+def test_prefetch_draws_the_same_batches():
+    streams = [SampleStream(target(), 64, 2, block=8, prefetch=prefetch, seed=0) for prefetch in (False, True)]
+    plain, prefetched = [batches(stream, 50) for stream in streams]
+    for stream in streams:
+        stream.close()
+    for a, b in zip(plain, prefetched):
+        torch.testing.assert_close(a, b)
+    samples = torch.cat(plain).double().numpy()
+    np.testing.assert_allclose(samples.mean(axis=0), [4, 4], atol=0.05)
+
+
+def test_resume_from_state():
+    stream = SampleStream(target(), 64, 2, block=8, seed=0)
+    batches(stream, 13)
+    state = stream.state_dict()
+    expected = batches(stream, 20)
+    stream.close()
+
+    resumed = SampleStream(target(), 64, 2, block=8, seed=1)
+    resumed.load_state_dict(state)
+    for a, b in zip(expected, batches(resumed, 20)):
+        torch.testing.assert_close(a, b)
+    resumed.close()
@@ -0,0 +1,84 @@
+import pytest
+
+torch = pytest.importorskip("torch")
+
+from optimizers.train import Trainer, make_config
+from optimizers.metrics import read_metrics
+
+
+def small_config(path, **overrides):
+    base = {
+        "loss": "wgan",
+        "disc_layers": [2, 16, 16, 1],
+        "gen_layers": [2, 16, 16, 2],
+        "num_iter": 40,
+        "verbose": False,
+        "prefetch": False,
+        "seed": 0,
+        "checkpoint_path": str(path),
+    }
+    return make_config(base, **overrides)
+
+
+def test_resume_after_time_limit(tmp_path):
+    path = tmp_path / "run.pt"
+    metrics_path = str(tmp_path / "metrics.bin")
+    trainer = Trainer(small_config(path, max_seconds=0, metrics_path=metrics_path)).run()
+    assert trainer.stop_reason == "time"
+    assert trainer.iteration < 40
+    stopped = path.read_bytes()
+
+    resumed = Trainer.from_checkpoint(str(path), max_seconds=None).run()
+    assert resumed.stop_reason is None
+    assert resumed.iteration == 40
+    assert len(read_metrics(metrics_path)[1]) == 40
+
+    # a checkpoint older than the log, as after a crash, records the rows past it again instead of adding them
+    path.write_bytes(stopped)
+    Trainer(small_config(path, metrics_path=metrics_path)).run()
+    _, rows = read_metrics(metrics_path)
+    assert len(rows) == 40
+    assert list(rows[:, 0]) == list(range(40))
+
+
+def test_fresh_run_replaces_metrics(tmp_path):
+    for suffix in ("bin", "ndjson"):
+        metrics_path = str(tmp_path / "metrics.{0}".format(suffix))
+        config = small_config(tmp_path / "run.pt", checkpoint_path=None, num_iter=4, metrics_path=metrics_path)
+        Trainer(config).run()
+        Trainer(config).run()
+        _, rows = read_metrics(metrics_path)
+        assert list(rows[:, 0]) == [0, 1, 2, 3]
+
+
+def test_resume_after_convergence(tmp_path):
+    path = tmp_path / "run.pt"
+    config = small_config(path, stop_window=10, stop_distance=1e9)
+    trainer = Trainer(config).run()
+    assert trainer.stop_reason == "converged"
+    assert trainer.iteration == 10
+
+    # the same stopping config stays stopped
+    same = Trainer(config).run()
+    assert same.stop_reason == "converged"
+    assert same.iteration == 10
+
+    # a larger num_iter and a lower threshold train on
+    resumed = Trainer.from_checkpoint(str(path), num_iter=60, stop_distance=None, stop_patience=100).run()
+    assert resumed.stop_reason is None
+    assert resumed.iteration == 60
+
+
+def test_batch_moments_match_batches(tmp_path):
+    config = small_config(tmp_path / "run.pt", gen_layers=[2, 2], checkpoint_path=None,
+                          source={"type": "gaussian", "m": [4, 4], "S": [[0.5, -0.3], [-0.3, 0.5]]},
+                          latent={"type": "gaussian", "m": [0, 0], "S": [[1, 0], [0, 1]]})
+    trainer = Trainer(config)
+    assert trainer.exact_moments
+    before = trainer.output_moments()
+    trainer.step()
+    # the exact moments describe the weights the batches came from, not those after the generator update
+    mean, cov = trainer.batch_moments
+    assert torch.allclose(torch.tensor(mean), torch.tensor(before[0]))
+    assert torch.allclose(torch.tensor(cov), torch.tensor(before[1]))
+    assert not torch.allclose(torch.tensor(mean), torch.tensor(trainer.output_moments()[0]))
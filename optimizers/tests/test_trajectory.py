@@ -0,0 +1,17 @@
+import numpy as np
+import pytest
+
+from optimizers.trajectory import decode_iterations, decode_trajectory, encode_trajectory
+
+
+@pytest.mark.parametrize("encoding", ["delta", "float16"])
+def test_round_trip(encoding):
+    frames = np.cumsum(np.random.RandomState(0).normal(scale=0.05, size=(20, 50, 2)), axis=0)
+    data = encode_trajectory(frames, encoding=encoding, iterations=np.arange(20) * 5)
+    assert np.allclose(decode_trajectory(data), frames, atol=0.01)
+    assert list(decode_iterations(data)) == list(np.arange(20) * 5)
+
+
+def test_empty_trajectory_is_rejected():
+    with pytest.raises(ValueError):
+        encode_trajectory(np.zeros((0, 50, 2)))
@@ -0,0 +1,32 @@
+import warnings
+
+import numpy as np
+import pytest
+
+from optimizers.transport import emd_1d, plan_cost, sinkhorn
+
+
+@pytest.mark.parametrize("bins", [512, 1000])
+def test_sinkhorn_converges(bins):
+    rng = np.random.RandomState(0)
+    a = rng.rand(bins)
+    b = rng.rand(bins)
+    b *= a.sum() / b.sum()
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", RuntimeWarning)
+        plan = sinkhorn(a, b)
+    dense = plan.toarray()
+    assert np.abs(dense.sum(axis=1) - a).sum() < 1e-5 * a.sum()
+    assert np.abs(dense.sum(axis=0) - b).sum() < 1e-5 * a.sum()
+    # the entropic plan costs a little more than the exact one, never less
+    exact = plan_cost(emd_1d(a, b))
+    assert exact * (1 - 1e-6) <= plan_cost(plan) <= 1.1 * exact
+
+
+def test_sinkhorn_warns_before_convergence():
+    rng = np.random.RandomState(0)
+    a = rng.rand(512)
+    b = rng.rand(512)
+    b *= a.sum() / b.sum()
+    with pytest.warns(RuntimeWarning, match="marginal error"):
+        sinkhorn(a, b, n_iter=10)
@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+
+from optimizers.utils import (Gaussian, ManifoldGaussian, Net, Uniform, pushforward_moments, random_frame,
+                             sqrt_factor)
+
+
+def test_sample_into_out():
+    dist = Gaussian(np.array([4, 4]), np.array([[0.5, -0.3], [-0.3, 0.5]]))
+    out = torch.empty((64, 2))
+    drawn = dist.sample(64, out=out, generator=torch.Generator().manual_seed(0))
+    assert drawn.data_ptr() == out.data_ptr()
+    np.testing.assert_array_equal(out.numpy(), dist.sample(64, generator=torch.Generator().manual_seed(0)).numpy())
+
+    uniform = Uniform(-1, 1, 3)
+    out = torch.empty((64, 3))
+    assert uniform.sample(64, out=out).data_ptr() == out.data_ptr()
+    assert out.min() >= -1 and out.max() <= 1
+
+
+@pytest.mark.parametrize("S", [[[0.5, -0.3], [-0.3, 0.5]], [[1.0, 1.0], [1.0, 1.0]]])
+def test_gaussian_sample_covariance(S):
+    # the second covariance is singular and sampled with the symmetric square root instead of Cholesky
+    S = np.array(S)
+    L = sqrt_factor(S)
+    np.testing.assert_allclose(L.dot(L.T), S, atol=1e-12)
+    samples = Gaussian(np.array([4, 4]), S).sample(200000, generator=torch.Generator().manual_seed(0)).double().numpy()
+    np.testing.assert_allclose(samples.mean(axis=0), [4, 4], atol=0.01)
+    np.testing.assert_allclose(np.cov(samples.T), S, atol=0.01)
+
+
+def test_generator_step_failure_unfreezes_critic():
+    generator = Net([2, 8, 2])
+    critic = Net([3, 8, 1])
+    optim = torch.optim.SGD(generator.parameters(), lr=0.1)
+    with pytest.raises(RuntimeError):
+        # the critic takes 3 inputs, the generator gives 2
+        generator.generator_step(critic, torch.randn((4, 2)), optim)
+    assert all(param.requires_grad for param in critic.parameters())
+
+
+def test_manifold_gaussian_moments():
+    frame = random_frame(6, 3, seed=0)
+    dist = ManifoldGaussian(np.arange(6.0), [0.5, 1.0, 2.0], frame)
+    mean, cov = dist.moments()
+    np.testing.assert_allclose(dist.frame.T.dot(dist.frame), np.eye(3), atol=1e-12)
+    # the covariance spans the frame and is singular off it
+    assert np.linalg.matrix_rank(cov, tol=1e-9) == 3
+    np.testing.assert_allclose(cov.dot(frame), frame * [0.25, 1.0, 4.0], atol=1e-12)
+    samples = dist.sample(200000, generator=torch.Generator().manual_seed(0)).double().numpy()
+    np.testing.assert_allclose(samples.mean(axis=0), mean, atol=0.02)
+    np.testing.assert_allclose(np.cov(samples.T), cov, atol=0.05)
+
+
+def test_pushforward_moments_of_affine_net():
+    torch.manual_seed(0)
+    latent = Gaussian(np.array([1.0, -1.0, 0.5]), np.array([[1.0, 0.2, 0.0], [0.2, 0.5, 0.1], [0.0, 0.1, 2.0]]))
+    generator = Net([3, 2])
+    mean, cov = pushforward_moments(generator, latent)
+    with torch.no_grad():
+        outputs = generator.forward(latent.sample(200000, generator=torch.Generator().manual_seed(0))).double().numpy()
+    np.testing.assert_allclose(outputs.mean(axis=0), mean, atol=0.02)
+    np.testing.assert_allclose(np.cov(outputs.T), cov, atol=0.02)
+    # hidden layers with activations have no closed form
+    assert pushforward_moments(Net([3, 8, 2]), latent) is None
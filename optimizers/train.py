@@ -0,0 +1,494 @@
+import os
+import random
+import time
+
+import numpy as np
+import torch
+
+from .utils import Gaussian, LineGaussian, ManifoldGaussian, Uniform, Net, Sampler, GAUSSIANS, pushforward_moments
+from .metrics import Profiler, MetricsLog
+from .losses import sliced_wasserstein, sinkhorn_divergence
+from .stream import SampleStream
+from .schedule import make_schedule, learn_rate_scale, set_learn_rate, target_distance, Convergence
+from .stats import gaussian_w2
+
+# Shared critic/generator training loop. Every experiment is described by a plain config dict so that it can be
+# pickled into sweep workers (see sweep.py) and rebuilt there from scratch.
+
+DEFAULTS = {
+    "loss": "wgan",             # "gan", "wgan", or the critic-free "sliced" / "sinkhorn", see losses.py
+    "source": {"type": "gaussian", "m": [4, 4], "S": [[0.5, -0.3], [-0.3, 0.5]]},
+    "latent": {"type": "gaussian", "m": [0, 0], "S": [[1, 0], [0, 1]]},
+    "disc_layers": [2, 256, 256, 256, 1],
+    "gen_layers": [2, 256, 256, 256, 2],
+    "disc_output": None,        # defaults to sigmoid for gan and linear for wgan
+    "critic_steps": 5,
+    "clip": 0.01,               # only used by wgan
+    "projections": 128,         # random directions per step of the sliced loss
+    "sinkhorn_eps": 0.01,       # final temperature, iterations at it and temperature decrease of the sinkhorn loss
+    "sinkhorn_iter": 10,
+    "sinkhorn_scaling": 0.5,
+    "num_iter": 2000,           # the most iterations to train for, fewer when a stopping criterion is set
+    "sample_size": 64,
+    "learn_rate": 0.0005,
+    "half_lr_every": None,      # short for a step lr_schedule halving the rate every half_lr_every iterations
+    "lr_schedule": None,        # learning rate multiplier over the iterations, see schedule.py
+    "stop_window": None,        # iterations per window of the distance to the target; None always trains num_iter
+    "stop_distance": None,      # stop once a window's mean distance is below this
+    "stop_tol": 0.01,           # stop after stop_patience windows without stop_tol relative improvement
+    "stop_patience": 5,
+    "min_iter": 0,              # never stop before this iteration
+    "max_seconds": None,        # stop once a run trained for this long
+    "compile": None,            # None, "script" (TorchScript) or "compile" (torch.compile), see Net.compile_forward
+    "prefetch": True,           # draw the next block of batches on a background thread, see stream.py
+    "stream_iterations": 4,     # iterations worth of batches drawn per block
+    "seed": None,
+    "verbose": True,
+    "log_every": 100,           # print progress every log_every iterations when verbose
+    "metrics_path": None,       # per-iteration losses and generator mean are appended here, see metrics.MetricsLog
+    "checkpoint_path": None,    # full training state is saved here every checkpoint_every iterations
+    "checkpoint_every": 500,
+    "snapshot_dir": None,       # generator weights are saved here every snapshot_every iterations, see replay.py
+    "snapshot_every": 20,
+}
+
+LOSSES = ("gan", "wgan", "sliced", "sinkhorn")
+# losses which train the generator directly against source samples, without a discriminator
+CRITIC_FREE = ("sliced", "sinkhorn")
+# the config values deciding when a run stops; a run resumed with any of them changed trains on past its old stop
+STOP_KEYS = ("num_iter", "max_seconds", "stop_window", "stop_distance", "stop_tol", "stop_patience", "min_iter")
+
+
+def make_config(base=None, **overrides):
+    '''
+    Build a full config from the defaults, an optional base config and keyword overrides.
+    :param base: config dict (possibly partial) to start from
+    :param overrides: individual config values
+    :return: a new config dict with every key of DEFAULTS
+    '''
+    config = dict(DEFAULTS)
+    for source in (base or {}, overrides):
+        for key, value in source.items():
+            if(key not in DEFAULTS):
+                raise ValueError("Unknown config key: {0}".format(key))
+            config[key] = value
+    if(config["loss"] not in LOSSES):
+        raise ValueError("Unknown loss: {0}".format(config["loss"]))
+    return config
+
+
+def make_distribution(spec):
+    '''
+    Build a sampler from a spec dict. Objects which already have a sample method are returned unchanged.
+    :param spec: dict with a "type" of gaussian, line_gaussian, manifold_gaussian or uniform and that type's parameters
+    :return: an object with a sample(n) method
+    '''
+    if(hasattr(spec, "sample")):
+        return spec
+    kind = spec["type"]
+    if(kind == "gaussian"):
+        return Gaussian(np.array(spec["m"]), np.array(spec["S"]))
+    if(kind == "line_gaussian"):
+        return LineGaussian(np.array(spec["m"]), np.array(spec["s"]), np.array(spec["slope"]))
+    if(kind == "manifold_gaussian"):
+        return ManifoldGaussian(np.array(spec["m"]), np.array(spec["s"]), np.array(spec["frame"]))
+    if(kind == "uniform"):
+        return Uniform(spec["low"], spec["high"], spec["dim"])
+    raise ValueError("Unknown distribution type: {0}".format(kind))
+
+
+def make_distance(config):
+    '''
+    :return: the sample distance of a critic-free config, as a function distance(samples, target)
+    '''
+    if(config["loss"] == "sliced"):
+        return lambda x, y: sliced_wasserstein(x, y, projections=config["projections"])
+    return lambda x, y: sinkhorn_divergence(x, y, eps=config["sinkhorn_eps"], scaling=config["sinkhorn_scaling"],
+                                            n_iter=config["sinkhorn_iter"])
+
+
+def seed_everything(seed):
+    random.seed(seed)
+    np.random.seed(seed)
+    torch.manual_seed(seed)
+
+
+def to_tensor(samples):
+    if(isinstance(samples, torch.Tensor)):
+        return samples
+    return torch.tensor(samples, dtype=torch.float)
+
+
+def draw(dist, n, out=None):
+    '''
+    Sample n points from dist as a float tensor, writing into out when dist supports it.
+    '''
+    if(isinstance(dist, Sampler)):
+        return dist.sample(n, out=out)
+    return to_tensor(dist.sample(n))
+
+
+class Trainer():
+    def __init__(self, config, resume=True):
+        '''
+        :param config: (possibly partial) config dict
+        :param resume: continue from config["checkpoint_path"] if that file exists
+        '''
+        self.config = make_config(config)
+        c = self.config
+        if(c["seed"] is not None):
+            seed_everything(c["seed"])
+
+        self.source = make_distribution(c["source"])
+        self.latent = make_distribution(c["latent"])
+
+        self.critic_free = c["loss"] in CRITIC_FREE
+        self.discriminator = None
+        self.distance = None
+        if(self.critic_free):
+            self.distance = make_distance(c)
+        else:
+            disc_output = c["disc_output"] or ("sigmoid" if c["loss"] == "gan" else "linear")
+            self.discriminator = Net(c["disc_layers"], output=disc_output)
+        self.generator = Net(c["gen_layers"], output="linear")
+        if(c["compile"] is not None):
+            self.generator.compile_forward(c["compile"])
+            if(self.discriminator is not None):
+                self.discriminator.compile_forward(c["compile"])
+
+        self.schedule = make_schedule(c)
+        self.learn_rate = c["learn_rate"] * learn_rate_scale(self.schedule, 0, c["num_iter"])
+        self.make_optimizers()
+
+        # the batches of stream_iterations iterations are drawn in one call per distribution
+        critic_batches = 0 if self.critic_free else c["critic_steps"]
+        self.latent_stream = SampleStream(self.latent, c["sample_size"], c["gen_layers"][0],
+                                          block=c["stream_iterations"] * (critic_batches + 1), prefetch=c["prefetch"])
+        self.source_stream = SampleStream(self.source, c["sample_size"], c["gen_layers"][-1],
+                                          block=c["stream_iterations"] * max(critic_batches, 1), prefetch=c["prefetch"])
+
+        self.iteration = 0
+        self.critic_loss = None
+        self.gen_loss = None
+        self.gen_samples = None
+        # functions called with every batch of generator samples the steps produce (critic fakes included), so
+        # statistics can be tracked without pushing extra samples through the generator, see stats.py
+        self.sample_hooks = []
+
+        # the distance to the target of every iteration's generator batches, averaged over windows to decide when
+        # to stop; targets without a closed form distance fall back to the loss of critic-free and wgan runs. An
+        # affine generator maps a Gaussian latent to an exactly Gaussian output, whose distance to a Gaussian
+        # target is computed from its push-forward moments without any samples
+        self.convergence = None
+        self.stop_reason = None
+        self.exact_distance = (self.generator.affine() is not None and isinstance(self.latent, GAUSSIANS)
+                               and isinstance(self.source, GAUSSIANS))
+        # the exact moments of the weights the last iteration's batches came from, see step
+        self.exact_moments = self.output_moments() is not None
+        self.batch_moments = None
+        self.target_distance = target_distance(self.source)
+        self.recent = []
+        if(c["stop_window"] is not None):
+            if(self.target_distance is None and c["loss"] == "gan"):
+                raise ValueError("Stopping a gan run needs a Gaussian, LineGaussian or ManifoldGaussian source")
+            self.convergence = Convergence(c["stop_window"], threshold=c["stop_distance"], tol=c["stop_tol"],
+                                           patience=c["stop_patience"], min_iter=c["min_iter"])
+            if(self.target_distance is not None and not self.exact_distance):
+                self.sample_hooks.append(self.recent.append)
+
+        self.profiler = Profiler()
+        self.metrics = None
+        if(c["metrics_path"] is not None):
+            fields = (["iteration", "critic_loss", "gen_loss"] +
+                      ["mean_{0}".format(k) for k in range(c["gen_layers"][-1])])
+            self.metrics = MetricsLog(c["metrics_path"], fields)
+
+        if(resume and c["checkpoint_path"] is not None and os.path.exists(c["checkpoint_path"])):
+            self.load_checkpoint(c["checkpoint_path"])
+
+    def make_optimizers(self):
+        self.disc_optim = None
+        if(self.discriminator is not None):
+            self.disc_optim = torch.optim.RMSprop(self.discriminator.parameters(), lr=self.learn_rate)
+        self.gen_optim = torch.optim.RMSprop(self.generator.parameters(), lr=self.learn_rate)
+
+    def critic_step(self):
+        c = self.config
+        prof = self.profiler
+        with prof.phase("sample"):
+            unit_samples = self.latent_stream.next()
+            source_samples = self.source_stream.next()
+
+        with prof.phase("critic"):
+            with torch.no_grad():
+                gen_samples = self.generator.forward(unit_samples)
+            for hook in self.sample_hooks:
+                hook(gen_samples)
+            clip = c["clip"] if c["loss"] == "wgan" else None
+            self.critic_loss = self.discriminator.critic_step(source_samples, gen_samples, self.disc_optim,
+                                                              loss=c["loss"], clip=clip)
+
+    def generator_step(self):
+        c = self.config
+        prof = self.profiler
+        with prof.phase("sample"):
+            unit_samples = self.latent_stream.next()
+            if(self.critic_free):
+                source_samples = self.source_stream.next()
+        with prof.phase("generator"):
+            if(self.critic_free):
+                self.gen_loss, self.gen_samples = self.generator.distance_step(source_samples, unit_samples,
+                                                                               self.gen_optim, self.distance)
+            else:
+                self.gen_loss, self.gen_samples = self.generator.generator_step(self.discriminator, unit_samples,
+                                                                                self.gen_optim, loss=c["loss"])
+        for hook in self.sample_hooks:
+            hook(self.gen_samples)
+
+    def iteration_distance(self):
+        '''
+        :return: the distance to the target of the generator batches of the last iteration
+        '''
+        if(self.exact_distance):
+            return gaussian_w2(*self.batch_moments, *self.source.moments())
+        if(self.target_distance is not None):
+            distance = self.target_distance(torch.cat(self.recent))
+            del self.recent[:]
+            return distance
+        if(self.critic_free):
+            return float(self.gen_loss)
+        # the wgan critic loss estimates minus the Wasserstein distance
+        return -float(self.critic_loss)
+
+    def is_last(self, i):
+        '''
+        :return: whether iteration i is the last of the run, for callbacks which finish up
+        '''
+        return i == self.config["num_iter"] - 1 or self.stop_reason is not None
+
+    def update_learn_rate(self, i):
+        lr = self.config["learn_rate"] * learn_rate_scale(self.schedule, i, self.config["num_iter"])
+        if(lr != self.learn_rate):
+            self.learn_rate = lr
+            for optim in (self.gen_optim, self.disc_optim):
+                if(optim is not None):
+                    set_learn_rate(optim, lr)
+
+    def train_critic(self, steps):
+        for k in range(steps):
+            self.critic_step()
+
+    def step(self):
+        # the batches of an iteration are all drawn before its generator update, so statistics folded in from them
+        # describe the weights at the start of the iteration; the exact moments of an affine generator are taken
+        # from the same weights, so both agree on every frame
+        if(self.exact_moments):
+            self.batch_moments = self.output_moments()
+        if(not self.critic_free):
+            self.train_critic(self.config["critic_steps"])
+        self.generator_step()
+        self.iteration += 1
+
+    def output_moments(self):
+        '''
+        :return: the exact (mean, cov) of the generator's outputs when the generator is affine, else None; see
+                 utils.pushforward_moments
+        '''
+        return pushforward_moments(self.generator, self.latent)
+
+    def generate(self, n):
+        '''
+        Push n fresh latent samples through the generator.
+        :param n: number of samples
+        :return: numpy array of generator outputs
+        '''
+        with torch.no_grad():
+            return self.generator.forward(draw(self.latent, n)).numpy()
+
+    def state_dict(self):
+        '''
+        Everything needed to continue training exactly where it stopped, including the random number generators.
+        '''
+        return {
+            "iteration": self.iteration,
+            "learn_rate": self.learn_rate,
+            "generator": self.generator.state_dict(),
+            "discriminator": self.discriminator.state_dict() if self.discriminator is not None else None,
+            "gen_optim": self.gen_optim.state_dict(),
+            "disc_optim": self.disc_optim.state_dict() if self.disc_optim is not None else None,
+            "critic_loss": self.critic_loss,
+            "gen_loss": self.gen_loss,
+            "gen_samples": self.gen_samples,
+            "convergence": self.convergence.state_dict() if self.convergence is not None else None,
+            "stop_reason": self.stop_reason,
+            "stop_config": {k: self.config[k] for k in STOP_KEYS},
+            "streams": {"latent": self.latent_stream.state_dict(), "source": self.source_stream.state_dict()},
+            "rng": {
+                "torch": torch.get_rng_state(),
+                "numpy": np.random.get_state(),
+                "python": random.getstate(),
+            },
+        }
+
+    def load_state_dict(self, state):
+        self.iteration = state["iteration"]
+        self.learn_rate = state["learn_rate"]
+        self.generator.load_state_dict(state["generator"])
+        self.make_optimizers()
+        self.gen_optim.load_state_dict(state["gen_optim"])
+        if(self.discriminator is not None):
+            self.discriminator.load_state_dict(state["discriminator"])
+            self.disc_optim.load_state_dict(state["disc_optim"])
+        self.critic_loss = state["critic_loss"]
+        self.gen_loss = state["gen_loss"]
+        self.gen_samples = state["gen_samples"]
+        if(self.convergence is not None and state.get("convergence") is not None):
+            self.convergence.load_state_dict(state["convergence"])
+        self.stop_reason = state.get("stop_reason")
+        # the time limit is a budget per call of run(), and a run resumed with other stopping values is meant to go
+        # on; a plateau gets its patience back
+        stop_config = state.get("stop_config")
+        if(self.stop_reason == "time" or
+           (stop_config is not None and stop_config != {k: self.config[k] for k in STOP_KEYS})):
+            if(self.stop_reason == "plateau" and self.convergence is not None):
+                self.convergence.stale = 0
+            self.stop_reason = None
+        if("streams" in state):
+            self.latent_stream.load_state_dict(state["streams"]["latent"])
+            self.source_stream.load_state_dict(state["streams"]["source"])
+        torch.set_rng_state(state["rng"]["torch"])
+        np.random.set_state(state["rng"]["numpy"])
+        random.setstate(state["rng"]["python"])
+        # rows flushed after the checkpoint was saved are recorded again
+        if(self.metrics is not None):
+            self.metrics.truncate(self.iteration)
+
+    def save_checkpoint(self, path):
+        '''
+        Write the training state to path. The file is replaced atomically so a crash while saving keeps the
+        previous checkpoint.
+        '''
+        tmp = path + ".tmp"
+        torch.save({"config": self.config, "state": self.state_dict()}, tmp)
+        os.replace(tmp, path)
+
+    def load_checkpoint(self, path):
+        checkpoint = torch.load(path, weights_only=False)
+        self.load_state_dict(checkpoint["state"])
+
+    @classmethod
+    def from_checkpoint(cls, path, **overrides):
+        '''
+        Rebuild a trainer from the config stored in a checkpoint and continue from its state.
+        :param overrides: config values to change, e.g. a larger num_iter
+        '''
+        checkpoint = torch.load(path, weights_only=False)
+        trainer = cls(make_config(checkpoint["config"], **overrides), resume=False)
+        trainer.load_state_dict(checkpoint["state"])
+        return trainer
+
+    def save_snapshot(self, i):
+        os.makedirs(self.config["snapshot_dir"], exist_ok=True)
+        path = os.path.join(self.config["snapshot_dir"], "generator_{0:07d}.pt".format(i))
+        torch.save(self.generator.state_dict(), path)
+
+    def report(self, i):
+        print("Estimated mean: {0}".format(np.mean(self.gen_samples.numpy(), axis=0)))
+        if(self.config["loss"] == "gan"):
+            print("Iter {0} - Discriminator Loss: {1}".format(i, float(self.critic_loss)))
+        elif(self.critic_free):
+            print("Iter {0} - {1} distance: {2}".format(i, self.config["loss"].capitalize(), float(self.gen_loss)))
+        else:
+            print("Iter {0} - Approximated Wasserstein Distance: {1}".format(i, float(self.critic_loss)))
+
+    def record(self, i):
+        mean = self.gen_samples.mean(dim=0).tolist()
+        self.metrics.record(i, scalar(self.critic_loss), float(self.gen_loss), *mean)
+
+    def run(self, callback=None):
+        '''
+        Train until a stopping criterion is met, or for the configured number of iterations. The reason a run
+        stopped early is left in stop_reason.
+        :param callback: optional function called as callback(i, trainer) after every iteration; is_last(i) tells
+                         it whether the run ends after iteration i (a time limit only ends the run after it)
+        :return: this trainer
+        '''
+        c = self.config
+        prof = self.profiler
+        start = time.time()
+        # a run starting from scratch replaces the rows of an earlier run in the log; a resumed run already dropped
+        # those past its checkpoint and appends
+        if(self.metrics is not None and self.iteration == 0 and self.metrics.written == 0):
+            self.metrics.truncate(0)
+        for i in range(self.iteration, c["num_iter"]):
+            if(self.stop_reason is not None):
+                break
+            self.update_learn_rate(i)
+            self.step()
+            prof.count("iterations")
+            if(self.convergence is not None):
+                with prof.phase("convergence"):
+                    self.stop_reason = self.convergence.update(i, self.iteration_distance())
+            if(self.stop_reason is None and c["max_seconds"] is not None and time.time() - start > c["max_seconds"]):
+                self.stop_reason = "time"
+            if(callback is not None):
+                with prof.phase("callback"):
+                    callback(i, self)
+            if(self.metrics is not None):
+                with prof.phase("metrics"):
+                    self.record(i)
+            if(c["verbose"] and i % c["log_every"] == 0):
+                self.report(i)
+            if(c["snapshot_dir"] is not None and i % c["snapshot_every"] == 0):
+                with prof.phase("checkpoint"):
+                    self.save_snapshot(i)
+            if(c["checkpoint_path"] is not None and (i + 1) % c["checkpoint_every"] == 0):
+                with prof.phase("checkpoint"):
+                    self.save_checkpoint(c["checkpoint_path"])
+                    if(self.metrics is not None):
+                        self.metrics.flush()
+        if(c["checkpoint_path"] is not None):
+            self.save_checkpoint(c["checkpoint_path"])
+        if(self.metrics is not None):
+            self.metrics.flush()
+        if(c["verbose"]):
+            if(self.stop_reason is not None):
+                print("Stopped after {0} iterations: {1}".format(self.iteration, self.stop_reason))
+            print(prof.summary())
+        return self
+
+
+def scalar(loss):
+    # critic-free runs have no critic loss
+    return float(loss) if loss is not None else float("nan")
+
+
+def summarize(trainer, seconds, n=5000):
+    convergence = trainer.convergence
+    moments = trainer.output_moments()
+    if(moments is None):
+        gen_samples = trainer.generate(n)
+        moments = np.mean(gen_samples, axis=0), np.cov(gen_samples, rowvar=False)
+    mean, cov = moments
+    return {
+        "config": trainer.config,
+        "seconds": seconds,
+        "iterations": trainer.iteration,
+        "stop_reason": trainer.stop_reason,
+        # mean distance to the target over the last window, when the run tracked it
+        "distance": convergence.means[-1] if convergence is not None and convergence.means else None,
+        "critic_loss": scalar(trainer.critic_loss),
+        "gen_loss": float(trainer.gen_loss),
+        "mean": mean,
+        "cov": cov,
+        "generator": {k: v.clone() for k, v in trainer.generator.state_dict().items()},
+    }
+
+
+def run_config(config):
+    '''
+    Train one config to completion and return a picklable summary of the result.
+    '''
+    start = time.time()
+    trainer = Trainer(config).run()
+    return summarize(trainer, time.time() - start)
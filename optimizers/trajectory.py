@@ -0,0 +1,147 @@
+import struct
+
+import numpy as np
+
+# Compact binary format for point trajectories (frames x points x dims), used for the generator points shown in
+# the article. Little-endian layout:
+#
+#   offset  size
+#   0       4     magic b"PVTR"
+#   4       1     version
+#   5       1     encoding: 0 = float16 frames, 1 = fixed-point with frames stored as deltas to the previous frame
+#   6       1     bytes per value of the first frame (1, 2 or 4; 2 for float16)
+#   7       1     bytes per value of the following frames
+#   8       4     number of frames
+#   12      4     number of points per frame
+#   16      2     dimensions per point
+#   18      2     flags: bit 0 set when the iteration index of every frame follows the frames
+#   20      8     quantum: fixed-point step, 0 for float16
+#   28      4     reserved
+#   32            first frame, zero-padded to a multiple of 4 bytes, then every following frame
+#   ...           if flagged, zero-padded to a multiple of 4 bytes: one uint32 iteration index per frame
+#
+# Fixed-point values are signed integers, x = value * quantum. Frames after the first store the difference to the
+# previous frame, which for slowly moving points fits in a byte. Iteration indices are written for keyframes taken
+# at irregular intervals (see keyframes.py), so that playback can interpolate between them.
+
+MAGIC = b"PVTR"
+VERSION = 1
+HEADER = struct.Struct("<4sBBBBIIHHdI")
+FLOAT16 = 0
+DELTA = 1
+INT_TYPES = {1: np.int8, 2: np.int16, 4: np.int32}
+HAS_ITERATIONS = 1
+
+
+def int_width(values):
+    '''
+    :return: the smallest number of bytes of a signed integer type which holds every value
+    '''
+    if(values.size == 0):
+        return 1
+    for width, dtype in sorted(INT_TYPES.items()):
+        info = np.iinfo(dtype)
+        if(values.min() >= info.min and values.max() <= info.max):
+            return width
+    raise ValueError("Values do not fit in 32 bits, use a larger quantum")
+
+
+def pad4(data):
+    return data + b"\0" * (-len(data) % 4)
+
+
+def encode_trajectory(frames, quantum=0.01, encoding="delta", iterations=None):
+    '''
+    :param frames: array of shape (frames, points, dims)
+    :param quantum: fixed-point step for the delta encoding
+    :param encoding: "delta" for fixed-point deltas or "float16" for raw half precision frames
+    :param iterations: optional training iteration of every frame
+    :return: the encoded bytes
+    '''
+    frames = np.asarray(frames, dtype=np.float64)
+    n, points, dims = frames.shape
+    if(n == 0):
+        # the format always has a first frame
+        raise ValueError("Cannot encode a trajectory without frames")
+    if(encoding == "float16"):
+        body = frames.astype("<f2")
+        kind, w_first, w_delta, quantum = FLOAT16, 2, 2, 0.0
+        first, rest = body[:1].tobytes(), body[1:].tobytes()
+    elif(encoding == "delta"):
+        fixed = np.round(frames / quantum).astype(np.int64)
+        deltas = np.diff(fixed, axis=0)
+        kind, w_first, w_delta = DELTA, int_width(fixed[:1]), int_width(deltas)
+        first = fixed[:1].astype("<i{0}".format(w_first)).tobytes()
+        rest = deltas.astype("<i{0}".format(w_delta)).tobytes()
+    else:
+        raise ValueError("Unknown trajectory encoding: {0}".format(encoding))
+
+    flags = 0
+    if(iterations is not None):
+        iterations = np.asarray(iterations)
+        if(iterations.shape != (n,)):
+            raise ValueError("Expected {0} iteration indices, got shape {1}".format(n, iterations.shape))
+        flags = HAS_ITERATIONS
+        rest = pad4(rest) + iterations.astype("<u4").tobytes()
+    return HEADER.pack(MAGIC, VERSION, kind, w_first, w_delta, n, points, dims, flags, quantum, 0) + pad4(first) + rest
+
+
+def read_header(data):
+    magic, version, encoding, w_first, w_delta, n, points, dims, flags, quantum, _ = HEADER.unpack_from(data)
+    if(magic != MAGIC):
+        raise ValueError("Not a trajectory file")
+    if(version != VERSION):
+        raise ValueError("Unsupported trajectory version: {0}".format(version))
+    if(n == 0):
+        raise ValueError("Trajectory has no frames")
+    return encoding, w_first, w_delta, n, points, dims, flags, quantum
+
+
+def decode_trajectory(data):
+    '''
+    :param data: bytes produced by encode_trajectory
+    :return: float32 array of shape (frames, points, dims)
+    '''
+    encoding, w_first, w_delta, n, points, dims, flags, quantum = read_header(data)
+    size = points * dims
+    offset = HEADER.size
+    first_bytes = size * w_first
+    if(encoding == FLOAT16):
+        first = np.frombuffer(data, "<f2", size, offset)
+        rest = np.frombuffer(data, "<f2", (n - 1) * size, offset + first_bytes + (-first_bytes % 4))
+        return np.concatenate((first, rest)).astype(np.float32).reshape((n, points, dims))
+    first = np.frombuffer(data, "<i{0}".format(w_first), size, offset).astype(np.int64)
+    deltas = np.frombuffer(data, "<i{0}".format(w_delta), (n - 1) * size,
+                           offset + first_bytes + (-first_bytes % 4)).astype(np.int64)
+    fixed = np.cumsum(np.concatenate((first, deltas)).reshape((n, size)), axis=0)
+    return (fixed * quantum).astype(np.float32).reshape((n, points, dims))
+
+
+def decode_iterations(data):
+    '''
+    :return: the iteration index of every frame, or None when the trajectory has none
+    '''
+    encoding, w_first, w_delta, n, points, dims, flags, quantum = read_header(data)
+    if(not flags & HAS_ITERATIONS):
+        return None
+    size = points * dims
+    first_bytes = size * w_first
+    rest_bytes = (n - 1) * size * w_delta
+    offset = HEADER.size + first_bytes + (-first_bytes % 4) + rest_bytes + (-rest_bytes % 4)
+    return np.frombuffer(data, "<u4", n, offset).astype(np.int64)
+
+
+def save_trajectory(path, frames, quantum=0.01, encoding="delta", iterations=None):
+    with open(path, "wb") as f:
+        f.write(encode_trajectory(frames, quantum, encoding, iterations))
+
+
+def load_trajectory(path, with_iterations=False):
+    '''
+    :return: the frames, or (frames, iteration indices or None) with with_iterations
+    '''
+    with open(path, "rb") as f:
+        data = f.read()
+    if(with_iterations):
+        return decode_trajectory(data), decode_iterations(data)
+    return decode_trajectory(data)
@@ -0,0 +1,301 @@
+import warnings
+
+import numpy as np
+import scipy.sparse
+
+# Optimal transport between two histograms. Plans are returned as scipy.sparse.coo_matrix with rows indexed by the
+# bins of a and columns by the bins of b, in the same mass units as the inputs.
+#
+# emd_1d:   exact, for histograms on a line with cost |i - j|^p (p >= 1); the monotone coupling is optimal, O(n + m)
+# emd:      exact network simplex for an arbitrary cost matrix (needs POT, https://pythonot.github.io)
+# sinkhorn: approximate entropic plan, over-relaxed iterations with reg scaling, linear time per iteration for the
+#           line cost
+
+
+def cost_matrix(n, m=None, p=1):
+    '''
+    :return: the n x m matrix |i - j|^p of distances between bin indices
+    '''
+    m = n if m is None else m
+    return np.abs(np.arange(n).reshape((-1, 1)) - np.arange(m).reshape((1, -1))).astype(float) ** p
+
+
+def check_masses(a, b):
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    if(not np.isclose(a.sum(), b.sum())):
+        raise ValueError("Histograms must have equal mass, got {0} and {1}".format(a.sum(), b.sum()))
+    return a, b
+
+
+def emd_1d(a, b):
+    '''
+    Exact plan between two histograms on the same line under any convex cost of |i - j|, such as |i - j|^p with
+    p >= 1. Mass is matched in sorted order: every interval between consecutive breakpoints of the two cumulative
+    sums is one nonzero cell of the plan.
+    :param a: histogram of length n
+    :param b: histogram of length m with the same total mass
+    :return: n x m sparse plan
+    '''
+    a, b = check_masses(a, b)
+    cum_a = np.cumsum(a)
+    cum_b = np.cumsum(b)
+    cum_b[-1] = cum_a[-1]
+    breaks = np.union1d(cum_a, cum_b)
+    breaks = breaks[breaks > 0]
+    mass = np.diff(breaks, prepend=0)
+    keep = mass > 0
+    mid = (breaks - mass / 2)[keep]
+    rows = np.searchsorted(cum_a, mid)
+    cols = np.searchsorted(cum_b, mid)
+    return scipy.sparse.coo_matrix((mass[keep], (rows, cols)), shape=(len(a), len(b)))
+
+
+def emd(a, b, cost=None, p=1, max_iter=1000000):
+    '''
+    Exact plan for an arbitrary cost matrix, solved with the network simplex from POT.
+    :param cost: n x m cost matrix, defaults to cost_matrix(n, m, p)
+    :return: n x m sparse plan
+    '''
+    import ot
+
+    a, b = check_masses(a, b)
+    if(cost is None):
+        cost = cost_matrix(len(a), len(b), p)
+    plan = ot.emd(a, b, np.ascontiguousarray(cost, dtype=float), numItermax=max_iter)
+    return scipy.sparse.coo_matrix(plan)
+
+
+def line_softmin(g, x, y, k, eps):
+    '''
+    The soft minimum eps * log sum_j exp((g_j - |x_i - y_j|) / eps) for every i, in O(len(x) + len(y)): the terms with
+    y_j <= x_i and with y_j > x_i are running log-sums in opposite directions.
+    :param x, y: sorted positions on the line
+    :param k: np.searchsorted(y, x, side="right")
+    '''
+    left = np.logaddexp.accumulate((g + y) / eps)
+    right = np.logaddexp.accumulate(((g - y) / eps)[::-1])[::-1]
+    left = np.append(-np.inf, left)[k] - x / eps
+    right = np.append(right, -np.inf)[k] + x / eps
+    return eps * np.logaddexp(left, right)
+
+
+def sinkhorn(a, b, cost=None, p=1, reg=1.0, n_iter=10000, tol=1e-6, relax=1.9, threshold=1e-12, absorb=1e50, init=None,
+             return_potentials=False):
+    '''
+    Entropy-regularized plan. The regularization is halved stage by stage from the largest cost down to reg, each stage
+    starting from the potentials of the last, so that small values of reg stay stable. Every stage runs over-relaxed
+    Sinkhorn updates until the marginals are within tol. For the default line cost |i - j| the updates run on the log
+    potentials in linear time per iteration (line_softmin), otherwise as matrix-vector products with the scalings
+    absorbed into log-domain potentials whenever they grow past absorb. A warm start from the potentials of a similar
+    problem skips the lowering and usually converges in a few iterations. Warns with a RuntimeWarning when the final
+    stage stops at n_iter before reaching tol. This is not the fast path: at reg=1 a solve takes a fraction of a second
+    at hundreds of bins and seconds at thousands, while emd_1d gives the exact plan for the line cost in linear time.
+    :param reg: entropic regularization, relative to the typical cost of moving mass to the nearest other bin (the
+                median over the rows of the smallest positive cost, 1 for the line cost). The plan is blurred over
+                about reg bins whatever the number of bins, while relative to the largest cost the blur would grow
+                with the histograms; smaller values are closer to the exact plan but take more iterations
+    :param n_iter: most iterations per stage
+    :param tol: stop once the row marginals are this close to a in L1, relative to the total mass (every stage ends
+                on a plain update of the columns, which leaves them exact)
+    :param relax: over-relaxation in [1, 2) of the updates of stages that take more than 20 iterations, 1 is plain
+                  Sinkhorn. Small values of reg converge many times faster above 1
+    :param threshold: cells with less than this fraction of the total mass are left out of the sparse plan, which is
+                      built without ever holding the dense one
+    :param init: optional (f, g) potentials to start from, as returned with return_potentials
+    :param return_potentials: also return the final (f, g) potentials
+    :return: n x m sparse plan, or (plan, (f, g)) with return_potentials
+    '''
+    a, b = check_masses(a, b)
+    line = cost is None and p == 1
+    if(cost is None and not line):
+        cost = cost_matrix(len(a), len(b), p)
+    total = a.sum()
+    a = a / total
+    b = b / total
+    if(line):
+        scale = max(len(a), len(b), 2) - 1
+        unit = 1
+    else:
+        scale = max(cost.max(), 1e-12)
+        # the typical cost of moving mass to the nearest other bin
+        positive = np.where(cost > 0, cost, np.inf).min(axis=1)
+        unit = np.median(positive[np.isfinite(positive)]) if np.isfinite(positive).any() else scale
+    f = np.zeros(len(a)) if init is None else np.array(init[0], dtype=float)
+    g = np.zeros(len(b)) if init is None else np.array(init[1], dtype=float)
+
+    low = min(reg * unit, scale)
+    schedule = np.geomspace(scale, low, int(np.ceil(np.log2(scale / low))) + 1)
+    if(init is not None):
+        schedule = schedule[-1:]
+    if(line):
+        f, g, err = sinkhorn_line(a, b, f, g, schedule, n_iter, tol, relax)
+    else:
+        f, g, err = sinkhorn_dense(a, b, cost, f, g, schedule, n_iter, tol, relax, absorb)
+    if(not err <= tol):
+        warnings.warn("Sinkhorn stopped after {0} iterations with marginal error {1:.3g} > tol={2:.3g}; raise n_iter "
+                      "or reg".format(n_iter, err, tol), RuntimeWarning)
+
+    plan = support_plan(a, b, f, g, cost, schedule[-1], threshold)
+    plan.data *= total
+    if(return_potentials):
+        return plan, (f, g)
+    return plan
+
+
+def support_plan(a, b, f, g, cost, eps, threshold, block=256):
+    '''
+    The plan of the potentials f and g, evaluated a block of rows at a time and keeping only the cells of at least
+    threshold, so only its support is held in memory.
+    :param cost: n x m costs, or None for the line cost |i - j|
+    :return: n x m sparse plan
+    '''
+    y = np.arange(len(b))
+    rows, cols, data = [], [], []
+    for start in range(0, len(a), block):
+        stop = min(start + block, len(a))
+        c = np.abs(np.arange(start, stop).reshape((-1, 1)) - y) if cost is None else cost[start:stop]
+        p = np.exp((f[start:stop].reshape((-1, 1)) + g.reshape((1, -1)) - c) / eps)
+        # empty bins carry no mass whatever their potentials
+        p[a[start:stop] == 0] = 0
+        p[:, b == 0] = 0
+        i, j = np.nonzero(p >= threshold)
+        rows.append(i + start)
+        cols.append(j)
+        data.append(p[i, j])
+    return scipy.sparse.coo_matrix((np.concatenate(data), (np.concatenate(rows), np.concatenate(cols))),
+                                   shape=(len(a), len(b)))
+
+
+def sinkhorn_line(a, b, f, g, schedule, n_iter, tol, relax):
+    '''
+    Log-domain Sinkhorn for the line cost |i - j| over the bins with mass; the potentials of empty bins are set to
+    their c-transforms so that a warm start stays finite where mass appears.
+    :return: (f, g, final relative marginal error)
+    '''
+    rows = a > 0
+    cols = b > 0
+    x = np.flatnonzero(rows).astype(float)
+    y = np.flatnonzero(cols).astype(float)
+    kx = np.searchsorted(y, x, side="right")
+    ky = np.searchsorted(x, y, side="right")
+    log_a = np.log(a[rows])
+    log_b = np.log(b[cols])
+    fs = f[rows]
+    gs = g[cols]
+    err = np.inf
+    for stage, eps in enumerate(schedule):
+        final = stage == len(schedule) - 1
+        w = 1.0
+        first = None
+        target = tol if final else max(tol, 1e-3)
+        for i in range(n_iter):
+            update = eps * log_a - line_softmin(gs, x, y, kx, eps)
+            # after a plain g update the columns are exact, so the row marginals measure convergence
+            err = np.abs(1 - np.exp((fs - update) / eps)).dot(a[rows])
+            if(err < target):
+                if(w == 1.0):
+                    break
+                # the columns of an over-relaxed update are not exact, so the stage finishes on plain updates
+                w = 1.0
+            elif(first is None):
+                first = err
+            elif(not err <= first):
+                # over-relaxation only converges close to the fixed point
+                w = 1.0
+            elif(i == 20):
+                # stages that plain updates do not finish quickly are over-relaxed
+                w = relax
+            fs = fs + w * (update - fs)
+            gs = gs + w * (eps * log_b - line_softmin(fs, y, x, ky, eps) - gs)
+        if(w != 1.0):
+            # a stage stopped at n_iter ends on plain updates too
+            fs = eps * log_a - line_softmin(gs, x, y, kx, eps)
+            gs = eps * log_b - line_softmin(fs, y, x, ky, eps)
+            err = np.abs(1 - np.exp((fs - eps * log_a + line_softmin(gs, x, y, kx, eps)) / eps)).dot(a[rows])
+
+    eps = schedule[-1]
+    grid_x = np.arange(len(a), dtype=float)
+    grid_y = np.arange(len(b), dtype=float)
+    f = -line_softmin(gs, grid_x, y, np.searchsorted(y, grid_x, side="right"), eps)
+    g = -line_softmin(fs, grid_y, x, np.searchsorted(x, grid_y, side="right"), eps)
+    f[rows] = fs
+    g[cols] = gs
+    return f, g, err
+
+
+def sinkhorn_dense(a, b, cost, f, g, schedule, n_iter, tol, relax, absorb):
+    '''
+    Sinkhorn scaling with matrix-vector products on a dense kernel.
+    :return: (f, g, final relative marginal error)
+    '''
+    def kernel(eps):
+        return np.exp((f.reshape((-1, 1)) + g.reshape((1, -1)) - cost) / eps)
+
+    err = np.inf
+    for stage, eps in enumerate(schedule):
+        final = stage == len(schedule) - 1
+        k = kernel(eps)
+        u = np.ones(len(a))
+        v = np.ones(len(b))
+        w = 1.0
+        first = None
+        target = tol if final else max(tol, 1e-3)
+        for i in range(n_iter):
+            kv = k.dot(v)
+            # after a plain v update the columns are exact, so the row marginals measure convergence
+            err = np.abs(u * kv - a).sum()
+            if(err < target):
+                if(w == 1.0):
+                    break
+                w = 1.0
+            elif(first is None):
+                first = err
+            elif(not err <= first):
+                w = 1.0
+            elif(i == 20):
+                w = relax
+            with np.errstate(divide="ignore", invalid="ignore"):
+                # empty bins keep a zero scaling
+                u = np.where(a > 0, u ** (1 - w) * (a / np.maximum(kv, 1e-300)) ** w, 0)
+                v = np.where(b > 0, v ** (1 - w) * (b / np.maximum(k.T.dot(u), 1e-300)) ** w, 0)
+            if(u.max() > absorb or v.max() > absorb):
+                f += eps * np.log(np.maximum(u, 1e-300))
+                g += eps * np.log(np.maximum(v, 1e-300))
+                k = kernel(eps)
+                u = np.ones(len(a))
+                v = np.ones(len(b))
+        if(w != 1.0):
+            # a stage stopped at n_iter ends on plain updates too
+            with np.errstate(divide="ignore", invalid="ignore"):
+                u = np.where(a > 0, a / np.maximum(k.dot(v), 1e-300), 0)
+                v = np.where(b > 0, b / np.maximum(k.T.dot(u), 1e-300), 0)
+            err = np.abs(u * k.dot(v) - a).sum()
+        f += eps * np.log(np.maximum(u, 1e-300))
+        g += eps * np.log(np.maximum(v, 1e-300))
+    return f, g, err
+
+
+def solve(a, b, method="exact", cost=None, p=1, **kwargs):
+    '''
+    Optimal plan between two histograms. With the default line cost the exact solve uses emd_1d, otherwise emd.
+    :param method: "exact" or "sinkhorn"
+    :return: n x m sparse plan
+    '''
+    if(method == "exact"):
+        if(cost is None and p >= 1):
+            return emd_1d(a, b)
+        return emd(a, b, cost=cost, p=p, **kwargs)
+    if(method == "sinkhorn"):
+        return sinkhorn(a, b, cost=cost, p=p, **kwargs)
+    raise ValueError("Unknown transport method: {0}".format(method))
+
+
+def plan_cost(plan, cost=None, p=1):
+    '''
+    :return: total cost of a sparse plan
+    '''
+    plan = scipy.sparse.coo_matrix(plan)
+    if(cost is None):
+        return float(np.sum(plan.data * np.abs(plan.row - plan.col) ** p))
+    return float(np.sum(plan.data * np.asarray(cost)[plan.row, plan.col]))
@@ -1,11 +1,16 @@
-from utils import *
-import matplotlib.pyplot as plt
-import scipy.stats
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from optimizers.utils import *
+from optimizers.train import Trainer, make_config, to_tensor
+from optimizers.render import FramePipeline
+from optimizers.raster import FrameRenderer, BLUE, ORANGE
+from optimizers.stats import StreamingMoments, gaussian_w2, gaussian_kl
+from optimizers.keyframes import Keyframes
+from optimizers.framestore import FrameStore
+from optimizers.density import DensityGrid
 import cv2
-from PIL import Image
-import plotly.graph_objects as go
-
-from mpl_toolkits.mplot3d import Axes3D
 
 # Generate matrices for wgan at each step by doing a ton of samples, quantizing, and setting the right indices
 # Do this at each step
@@ -13,47 +18,53 @@ from mpl_toolkits.mplot3d import Axes3D
 TARGET_M = np.array([4, 4])
 TARGET_S = np.array([[0.5, 0.1], [0.1, 0.2]])
 
-CRITIC_STEPS = 20
-
-
-NUM_ITER = 1500
+CONFIG = make_config(
+    loss="gan",
+    source={"type": "gaussian", "m": TARGET_M, "S": TARGET_S},
+    latent={"type": "gaussian", "m": [0, 0], "S": [[1, 0], [0, 1]]},
+    #latent={"type": "uniform", "low": -1, "high": 1, "dim": 2},
+    disc_layers=[2, 512, 512, 512, 1],
+    gen_layers=[2, 128, 128, 128, 2],
+    critic_steps=20,
+    num_iter=1500,
+    sample_size=64,
+    learn_rate=0.00005,
+    # num_iter is the budget; the run ends early once the windowed W2 to the target is small or stops improving
+    stop_window=100, stop_distance=0.05, min_iter=200,
+)
+
+# the target density is drawn once into the renderer's static layer
+renderer = FrameRenderer(xlim=(2, 6), ylim=(2, 6))
+renderer.contour(renderer.gaussian(TARGET_M, TARGET_S), ORANGE, static=True)
+
+def make_surfacegaussian(mean, cov):
+    frame = renderer.begin()
+    renderer.contour(renderer.gaussian(mean, cov), BLUE)
+    return frame
 
-SAMPLE_SIZE = 64
-LEARN_RATE = 0.00005
-
-
-discriminator = Net([2, 512, 512, 512, 1], output="sigmoid")
-generator = Net([2, 128, 128, 128, 2], output="linear")
+avi = cv2.VideoWriter("gan_nice.avi", cv2.VideoWriter_fourcc('M','J','P','G'), 20.0, (640, 480))
 
-source = Gaussian(TARGET_M, TARGET_S)
-unit = Gaussian(np.array([0, 0]), np.array([[1, 0], [0, 1]]))
-#unit = Uniform(-1, 1, 2)
+# frames are rendered in worker processes and written to the video in order on a background thread. The workers are
+# forked before the trainer starts its sampling threads, see render.py
+pipeline = FramePipeline(make_surfacegaussian, avi.write)
 
-disc_optim = torch.optim.RMSprop(discriminator.parameters(), lr=LEARN_RATE)
-gen_optim = torch.optim.RMSprop(generator.parameters(), lr=LEARN_RATE)
+trainer = Trainer(CONFIG)
+unit = trainer.latent
+pipeline.profiler = trainer.profiler
 
 
-def make_surfacemap(generator):
-    quant = 0.01
-    def to_idx(n):
-        if(isinstance(n, int)):
-            return int((n+range) / quant)
-        else:
-            return ((n+range) / quant).astype(int)
-    def from_idx(n):
-        return (n*quant) - range
-    big_sample = torch.tensor(unit.sample(5000), dtype=torch.float)
-    gen_samples = generator.forward(big_sample).detach().numpy()
-    mat = np.zeros((2*int(range/quant), 2*int(range/quant)))
-    for x, y in gen_samples:
-        mat[to_idx(x), to_idx(y)] += 1
-    mat /= np.sum(mat)
-    idxs = np.nonzero(mat)
-    z = mat[idxs]
-    a = (from_idx(idxs[0]).reshape((-1, 1)), from_idx(idxs[1]).reshape((-1, 1)), z.reshape((-1, 1)))
+def make_surfacemap(generator, n=5000, batch=5000, extent=8, quant=0.01):
+    # only this debugging plot needs matplotlib
+    import matplotlib.pyplot as plt
+    grid = DensityGrid(-extent, extent, quant)
+    with torch.no_grad():
+        for k in range(0, n, batch):
+            grid.add(generator.forward(to_tensor(unit.sample(min(batch, n - k)))).numpy())
+    a = grid.coords()
 
-    X, Y = np.meshgrid(np.arange(-range, range, quant), np.arange(-range, range, quant))
-    Z = mat[to_idx(X), to_idx(Y)]
+    axis = np.arange(-extent, extent, quant)[:grid.shape[0]]
+    X, Y = np.meshgrid(axis, axis)
+    Z = grid.dense().T
 
     fig = plt.figure()
     ax = fig.add_subplot(111, projection='3d')
@@ -61,64 +72,43 @@ def make_surfacemap(generator):
     plt.show()
     return a
 
-def make_surfacegaussian(generator):
-    big_sample = torch.tensor(unit.sample(5000), dtype=torch.float)
-    gen_samples = generator.forward(big_sample).detach().numpy()
-    mean = np.mean(gen_samples, axis=0)
-    cov = np.cov(gen_samples, rowvar=False)
-    range = [2, 6]
-    quant = 0.01
-
-    XY = np.meshgrid(np.arange(range[0], range[1] , quant), np.arange(range[0], range[1], quant))
-    X, Y = XY
-    XY = np.transpose(XY, (1, 2, 0))
-    Z_gen = scipy.stats.multivariate_normal.pdf(XY, mean=mean, cov=cov)
-
-    Z_source = scipy.stats.multivariate_normal.pdf(XY, mean=TARGET_M, cov=TARGET_S)
-    fig = plt.figure()
-    ax = fig.add_subplot(111)
-    ax.contour(X, Y, Z_gen)
-    ax.contour(X, Y, Z_source)
-    canvas = plt.get_current_fig_manager().canvas
-    canvas.draw()
-
-    return (np.array(Image.frombytes('RGB', canvas.get_width_height(),
-                                    canvas.tostring_rgb())), [mean, cov])
-
-surfacemaps = []
-
-avi = cv2.VideoWriter("gan_nice.avi", cv2.VideoWriter_fourcc('M','J','P','G'), 20.0, (640, 480))
-
-
-
-for i in range(NUM_ITER):
-    for k in range(CRITIC_STEPS):
-        unit_samples = torch.tensor(unit.sample(SAMPLE_SIZE), dtype=torch.float)
-        source_samples = torch.tensor(source.sample(SAMPLE_SIZE), dtype=torch.float)
-
-        gen_samples = generator.forward(unit_samples).detach()
-        disc_loss = -torch.mean(torch.log(discriminator(source_samples)) + torch.log(1 - discriminator(gen_samples)))
-        disc_loss.backward()
-        disc_optim.step()
-        disc_optim.zero_grad()
-        gen_optim.zero_grad()
-
-    unit_samples = torch.tensor(unit.sample(SAMPLE_SIZE), dtype=torch.float)
-    gen_samples = generator.forward(unit_samples)
-    gen_loss = torch.mean(torch.log(1 - discriminator(gen_samples)))
-    gen_loss.backward()
-    gen_optim.step()
-    disc_optim.zero_grad()
-    gen_optim.zero_grad()
-
-    source_samples = torch.tensor(source.sample(SAMPLE_SIZE), dtype=torch.float)
-
-    if(i % 2 == 0):
-        frame, fig = make_surfacegaussian(generator)
-        surfacemaps.append(fig)
-        avi.write(frame)
-
-    print("Estimated mean: {0}".format(np.mean(gen_samples.detach().numpy(), axis=0)))
-
-np.save("frame_mean.npy", np.array([x[0] for x in surfacemaps]))
-np.save("frame_cov.npy", np.array([x[1] for x in surfacemaps]))
+# frame statistics are folded in from the generator batches of the current iteration (critic fakes included),
+# which all come from the weights before its generator update, instead of pushing an extra 5000 samples through it.
+# An affine generator (gen_layers=[2, 2]) has exact push-forward moments of those same weights instead, without
+# sampling noise
+moments = StreamingMoments(2)
+if(not trainer.exact_moments):
+    trainer.sample_hooks.append(moments.update)
+
+def frame_moments():
+    if(trainer.exact_moments):
+        return trainer.batch_moments
+    return moments.mean, moments.cov
+
+# frames are written to a memory-mapped store as they are produced, so memory stays constant and an interrupted
+# run keeps its frames; W2 and KL to the target are stored with every frame
+frames = FrameStore("frames.pvfs", {"mean": (2,), "cov": (2, 2), "distance": (2,)})
+frames.truncate(trainer.iteration)
+# a frame is kept once mean and covariance moved by more than the noise of one iteration's batches
+keyframes = Keyframes(threshold=0.05, min_spacing=2, max_spacing=50, keep_frames=False)
+
+
+def on_iter(i, trainer):
+    if(keyframes.ready(i) or trainer.is_last(i)):
+        mean, cov = frame_moments()
+        if(keyframes.offer(i, np.concatenate((mean, cov.ravel())), force=trainer.is_last(i))):
+            distance = [gaussian_w2(mean, cov, TARGET_M, TARGET_S), gaussian_kl(mean, cov, TARGET_M, TARGET_S)]
+            frames.append(i, mean=mean, cov=cov, distance=distance)
+            pipeline.submit(mean, cov)
+    moments.reset()
+
+trainer.run(on_iter)
+pipeline.close()
+avi.release()
+
+frames.flush()
+
+np.save("frame_mean.npy", frames["mean"])
+np.save("frame_cov.npy", frames["cov"])
+np.save("frame_distance.npy", frames["distance"])
+np.save("frame_iter.npy", frames.iterations)
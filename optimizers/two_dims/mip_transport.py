@@ -1,37 +1,24 @@
-from ortools.linear_solver import pywraplp as lp
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
 import numpy as np
+from optimizers.transport import solve, plan_cost
 
 x = [2, 7, 5, 2, 5, 1, 3, 2] # 27
 y = [2, 3, 2, 2, 4, 6, 7, 1] # 27
 
-solver = lp.Solver("mip", lp.Solver.CBC_MIXED_INTEGER_PROGRAMMING)
-
-infinity = solver.infinity()
-
-a = [[solver.IntVar(0.0, infinity, "a_{0}_{1}".format(i, j)) for j in range(8)] for i in range(8)]
-
-for j in range(len(a)):
-	solver.Add(sum([a[i][j] for i in range(8)]) == x[j])
-
-for i in range(len(a)):
-	solver.Add(sum([a[i][j] for j in range(8)]) == y[i])
-
-solver.Minimize(sum([abs(i - j) * a[i][j] for i in range(8) for j in range(8)]))
-
-
-print('Number of variables =', solver.NumVariables())
-print('Number of constraints =', solver.NumConstraints())
-
-result_status = solver.Solve()
+# a[i][j] moves mass from bin j of x to bin i of y, with cost |i - j|
+a = solve(y, x, method="exact")
 
-print('Objective value =', solver.Objective().Value())
+print('Objective value =', plan_cost(a))
 
-assert result_status == lp.Solver.OPTIMAL
+a_vals = a.toarray()
 
-assert solver.VerifySolution(1e-7, True)
+assert np.allclose(a_vals.sum(axis=0), x)
+assert np.allclose(a_vals.sum(axis=1), y)
 
-a_vals = [ [a[i][j].solution_value() for j in range(8)] for i in range(8)]
-print(np.array(a_vals))
+print(a_vals)
 
 print("OPT CSV:")
-print("\\n".join([",".join([str(int(x)) for x in r]) for r in a_vals]))
\ No newline at end of file
+print("\\n".join([",".join([str(int(x)) for x in r]) for r in a_vals]))
@@ -1,6 +1,10 @@
-from utils import *
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from optimizers.utils import *
+from optimizers.train import Trainer, make_config, to_tensor
 import numpy as np
-import matplotlib.pyplot as plt
 import torch
 
 
@@ -15,54 +19,31 @@ def line_sample(s):
     y = np.full_like(x, 20)
     return np.concatenate((x,y), axis=1)
 
-CRITIC_STEPS = 1
-
-CLIP = 0.01
-
-NUM_ITER = 10000
-
-SAMPLE_SIZE = 64
-LEARN_RATE = 0.00005
+class LineSample():
+    def sample(self, n):
+        return line_sample(n)
+
+CONFIG = make_config(
+    loss="gan",
+    #source={"type": "gaussian", "m": TARGET_M, "S": TARGET_S},
+    source=LineSample(),
+    latent={"type": "gaussian", "m": [0], "S": [[1]]},
+    disc_layers=[2, 512, 512, 512, 1],
+    gen_layers=[1, 128, 128, 128, 2],
+    critic_steps=1,
+    num_iter=10000,
+    sample_size=64,
+    learn_rate=0.00005,
+)
 
 # Training
 
-discriminator = Net([2, 512, 512, 512, 1], output="sigmoid")
-generator = Net([1, 128, 128, 128, 2], output="linear")
-
-source = Gaussian(TARGET_M, TARGET_S)
-unit = Gaussian(np.array([0]), np.array([[1]]))
-
-disc_optim = torch.optim.RMSprop(discriminator.parameters(), lr=LEARN_RATE)
-gen_optim = torch.optim.RMSprop(generator.parameters(), lr=LEARN_RATE)
-
-
-for i in range(NUM_ITER):
-    for k in range(CRITIC_STEPS):
-        unit_samples = torch.tensor(unit.sample(SAMPLE_SIZE), dtype=torch.float)
-        #source_samples = torch.tensor(source.sample(SAMPLE_SIZE), dtype=torch.float)
-        source_samples = torch.tensor(line_sample(SAMPLE_SIZE), dtype=torch.float)
-
-        gen_samples = generator.forward(unit_samples).detach()
-        disc_loss = -torch.mean(torch.log(discriminator(source_samples)) + torch.log(1 - discriminator(gen_samples)))
-        disc_loss.backward()
-        disc_optim.step()
-        disc_optim.zero_grad()
-        gen_optim.zero_grad()
-
-    unit_samples = torch.tensor(unit.sample(SAMPLE_SIZE), dtype=torch.float)
-    gen_samples = generator.forward(unit_samples)
-    gen_loss = torch.mean(torch.log(1 - discriminator(gen_samples)))
-    gen_loss.backward()
-    gen_optim.step()
-    disc_optim.zero_grad()
-    gen_optim.zero_grad()
-
-    #source_samples = source.sample(SAMPLE_SIZE)
-    source_samples = torch.tensor(line_sample(SAMPLE_SIZE), dtype=torch.float)
+def on_iter(i, trainer):
     if(i % 100 == 0):
-        plt.scatter(gen_samples.data[:, 0], gen_samples.data[:, 1])
+        import matplotlib.pyplot as plt
+        source_samples = to_tensor(line_sample(CONFIG["sample_size"]))
+        plt.scatter(trainer.gen_samples[:, 0], trainer.gen_samples[:, 1])
         plt.scatter(source_samples[:, 0], source_samples[:, 1])
         plt.show()
 
-    print("Estimated mean: {0}".format(np.mean(gen_samples.detach().numpy(), axis=0)))
-    print("Iter {0} - Discriminator Loss: {1}".format(i, disc_loss))
\ No newline at end of file
+Trainer(CONFIG).run(on_iter)
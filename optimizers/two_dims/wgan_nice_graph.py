@@ -1,11 +1,16 @@
-from utils import *
-import matplotlib.pyplot as plt
-import scipy.stats
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from optimizers.utils import *
+from optimizers.train import Trainer, make_config, to_tensor
+from optimizers.render import FramePipeline
+from optimizers.raster import FrameRenderer, BLUE, ORANGE
+from optimizers.stats import StreamingMoments, gaussian_w2, gaussian_kl
+from optimizers.keyframes import Keyframes
+from optimizers.framestore import FrameStore
+from optimizers.landscape import CriticGrid, LandscapeRecorder, load_landscape
 import cv2
-from PIL import Image
-import plotly.graph_objects as go
-
-from mpl_toolkits.mplot3d import Axes3D
 
 # Generate matrices for wgan at each step by doing a ton of samples, quantizing, and setting the right indices
 # Do this at each step
@@ -13,99 +18,102 @@ from mpl_toolkits.mplot3d import Axes3D
 TARGET_M = np.array([4, 4])
 TARGET_S = np.array([[0.5, -0.3], [-0.3, 0.5]])
 
-
-
-# Manifold learning
-CRITIC_STEPS = 5
-
-CLIP = 0.01
-
-NUM_ITER = 2000
-
-SAMPLE_SIZE = 64
-LEARN_RATE = 0.0005
-
-HALF_LR_EVERY = 20000
-
-discriminator = Net([2, 256, 256, 256, 1], output="linear")
-generator = Net([2, 256, 256, 256, 2], output="linear")
-
-source = Gaussian(TARGET_M, TARGET_S)
-unit = Gaussian(np.array([0, 0]), np.eye(2))
-
-
-disc_optim = torch.optim.RMSprop(discriminator.parameters(), lr=LEARN_RATE)
-gen_optim = torch.optim.RMSprop(generator.parameters(), lr=LEARN_RATE)
-
-
-def make_surfacegaussian(generator):
-    big_sample = torch.tensor(unit.sample(5000), dtype=torch.float)
-    gen_samples = generator.forward(big_sample).detach().numpy()
-    mean = np.mean(gen_samples, axis=0)
-    cov = np.cov(gen_samples, rowvar=False)
-    range = [2, 6]
-    quant = 0.01
-
-    XY = np.meshgrid(np.arange(range[0], range[1] , quant), np.arange(range[0], range[1], quant))
-    X, Y = XY
-    XY = np.transpose(XY, (1, 2, 0))
-    Z_gen = scipy.stats.multivariate_normal.pdf(XY, mean=mean, cov=cov)
-
-    Z_source = scipy.stats.multivariate_normal.pdf(XY, mean=TARGET_M, cov=TARGET_S)
-
-    fig = plt.figure()
-    ax = fig.add_subplot(111)
-    ax.contour(X, Y, Z_gen)
-    ax.contour(X, Y, Z_source)
-    canvas = plt.get_current_fig_manager().canvas
-    canvas.draw()
-
-    return (np.array(Image.frombytes('RGB', canvas.get_width_height(),
-                                    canvas.tostring_rgb())), [mean, cov])
-
-surfacemaps = []
+CONFIG = make_config(
+    loss="wgan",
+    source={"type": "gaussian", "m": TARGET_M, "S": TARGET_S},
+    latent={"type": "gaussian", "m": [0, 0], "S": np.eye(2)},
+    disc_layers=[2, 256, 256, 256, 1],
+    gen_layers=[2, 256, 256, 256, 2],
+    critic_steps=5,
+    clip=0.01,
+    num_iter=2000,
+    sample_size=64,
+    learn_rate=0.0005,
+    half_lr_every=20000,
+    # num_iter is the budget; the run ends early once the windowed W2 to the target is small or stops improving
+    stop_window=100, stop_distance=0.05, min_iter=200,
+)
+
+# the target density is drawn once into the renderer's static layer
+renderer = FrameRenderer(xlim=(2, 6), ylim=(2, 6))
+renderer.contour(renderer.gaussian(TARGET_M, TARGET_S), ORANGE, static=True)
+
+def make_surfacegaussian(mean, cov):
+    frame = renderer.begin()
+    renderer.contour(renderer.gaussian(mean, cov), BLUE)
+    return frame
 
 avi = cv2.VideoWriter("wgan_nice.avi", cv2.VideoWriter_fourcc('M','J','P','G'), 20.0, (640, 480))
 
-
-
-for i in range(NUM_ITER):
-    for k in range(CRITIC_STEPS):
-        unit_samples = torch.tensor(unit.sample(SAMPLE_SIZE), dtype=torch.float)
-        source_samples = torch.tensor(source.sample(SAMPLE_SIZE), dtype=torch.float)
-
-
-        gen_samples = generator.forward(unit_samples).detach()
-        w1_estim = torch.mean(discriminator.forward(gen_samples)) - torch.mean(discriminator.forward(source_samples))
-        w1_estim.backward()
-        disc_optim.step()
-        disc_optim.zero_grad()
-        gen_optim.zero_grad()
-        discriminator.clip_weights(CLIP)
-
-    unit_samples = torch.tensor(unit.sample(SAMPLE_SIZE), dtype=torch.float)
-    gen_samples = generator.forward(unit_samples)
-    w1_grad_estim = -torch.mean(discriminator.forward(gen_samples))
-
-    w1_grad_estim.backward()
-    gen_optim.step()
-    disc_optim.zero_grad()
-    gen_optim.zero_grad()
-
-
-    source_samples = torch.tensor(source.sample(SAMPLE_SIZE), dtype=torch.float)
-
-    if(i % 10 == 0):
-        frame, fig = make_surfacegaussian(generator)
-        surfacemaps.append(fig)
-        avi.write(frame)
-    if(i % HALF_LR_EVERY == (HALF_LR_EVERY - 1)):
-        LEARN_RATE = LEARN_RATE/2
-        disc_optim = torch.optim.RMSprop(discriminator.parameters(), lr=LEARN_RATE)
-        gen_optim = torch.optim.RMSprop(generator.parameters(), lr=LEARN_RATE)
-
-    print("Estimated mean: {0}".format(np.mean(gen_samples.detach().numpy(), axis=0)))
-    print("Iter {0} - Approximated Wasserstein Distance: {1}".format(i, w1_estim))
-
-np.save("w_frame_mean.npy", np.array([x[0] for x in surfacemaps]))
-np.save("w_frame_cov.npy", np.array([x[1] for x in surfacemaps]))
+# frames are rendered in worker processes and written to the video in order on a background thread. The workers are
+# forked before the trainer starts its sampling threads, see render.py
+pipeline = FramePipeline(make_surfacegaussian, avi.write)
+
+trainer = Trainer(CONFIG)
+unit = trainer.latent
+pipeline.profiler = trainer.profiler
+
+
+# frame statistics are folded in from the generator batches of the current iteration (critic fakes included),
+# which all come from the weights before its generator update, instead of pushing an extra 5000 samples through it.
+# An affine generator (gen_layers=[2, 2]) has exact push-forward moments of those same weights instead, without
+# sampling noise
+moments = StreamingMoments(2)
+if(not trainer.exact_moments):
+    trainer.sample_hooks.append(moments.update)
+
+def frame_moments():
+    if(trainer.exact_moments):
+        return trainer.batch_moments
+    return moments.mean, moments.cov
+
+# frames are written to a memory-mapped store as they are produced, so memory stays constant and an interrupted
+# run keeps its frames; W2 and KL to the target are stored with every frame
+frames = FrameStore("w_frames.pvfs", {"mean": (2,), "cov": (2, 2), "distance": (2,)})
+frames.truncate(trainer.iteration)
+# a frame is kept once mean and covariance moved by more than the noise of one iteration's batches
+keyframes = Keyframes(threshold=0.1, min_spacing=5, max_spacing=100, keep_frames=False)
+
+# the critic on a fixed 64x64 grid, evaluated in one batched pass and recorded with every kept frame as quantized
+# differences to the previous one, and its input gradient field with every 10th kept frame. A frame of values costs
+# about 0.6 of an iteration and one with the gradient about 1.6 (see python -m optimizers.bench -k landscape/), so only
+# kept frames are recorded
+GRADIENT_EVERY = 10
+landscape = LandscapeRecorder("w_critic.pvfs", CriticGrid((2, 6), (2, 6), resolution=64))
+landscape.truncate(trainer.iteration)
+gradients = LandscapeRecorder("w_critic_grad.pvfs", CriticGrid((2, 6), (2, 6), resolution=64, gradient=True))
+gradients.truncate(trainer.iteration)
+
+
+def on_iter(i, trainer):
+    if(keyframes.ready(i) or trainer.is_last(i)):
+        mean, cov = frame_moments()
+        if(keyframes.offer(i, np.concatenate((mean, cov.ravel())), force=trainer.is_last(i))):
+            landscape.record(i, trainer.discriminator)
+            if(len(frames) % GRADIENT_EVERY == 0):
+                gradients.record(i, trainer.discriminator)
+            distance = [gaussian_w2(mean, cov, TARGET_M, TARGET_S), gaussian_kl(mean, cov, TARGET_M, TARGET_S)]
+            frames.append(i, mean=mean, cov=cov, distance=distance)
+            pipeline.submit(mean, cov)
+    moments.reset()
+
+trainer.run(on_iter)
+pipeline.close()
+avi.release()
+
+frames.flush()
+landscape.close()
+gradients.close()
+
+# the critic of every kept frame, alongside the frame's statistics
+critic, _ = load_landscape("w_critic.pvfs", iterations=frames.iterations)
+np.save("w_critic.npy", critic.astype(np.float32))
+# value, d/dx and d/dy of every 10th kept frame
+gradient, gradient_iter = load_landscape("w_critic_grad.pvfs", iterations=frames.iterations)
+np.save("w_critic_grad.npy", gradient.astype(np.float32))
+np.save("w_critic_grad_iter.npy", gradient_iter)
+
+np.save("w_frame_mean.npy", frames["mean"])
+np.save("w_frame_cov.npy", frames["cov"])
+np.save("w_frame_distance.npy", frames["distance"])
+np.save("w_frame_iter.npy", frames.iterations)
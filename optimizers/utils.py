@@ -0,0 +1,262 @@
+import numpy as np
+import torch.nn as nn
+import torch
+
+def sqrt_factor(S):
+    '''
+    Return L with L L^T = S. Uses the Cholesky factor when S is positive definite and falls back to a symmetric
+    square root for singular (degenerate) covariances.
+    '''
+    S = np.atleast_2d(np.asarray(S, dtype=np.float64))
+    try:
+        return np.linalg.cholesky(S)
+    except np.linalg.LinAlgError:
+        w, V = np.linalg.eigh(S)
+        return V * np.sqrt(np.clip(w, 0, None))
+
+# Samplers draw float32 torch tensors directly. Every sample method accepts an optional out tensor of shape
+# (n, dim) to write into and an optional torch.Generator to draw from, and reuses an internal noise buffer between
+# calls of the same size.
+
+class Sampler():
+    def noise(self, n, k, generator=None):
+        if(getattr(self, "_noise", None) is None or self._noise.shape != (n, k)):
+            self._noise = torch.empty((n, k))
+        return torch.randn((n, k), out=self._noise, generator=generator)
+
+# Define the target gaussian
+class Gaussian(Sampler):
+    def __init__(self, m, S):
+        self.m = m
+        self.S = S
+        self.dim = m.flatten().shape[0]
+        self.m_t = torch.tensor(np.asarray(m, dtype=np.float64).flatten(), dtype=torch.float)
+        self.L_t = torch.tensor(sqrt_factor(S).T, dtype=torch.float)
+
+    def sample(self, n, out=None, generator=None):
+        '''
+        Return n samples of the same dimensionality as m
+        :param n: number of samples to return
+        :param out: optional (n, dim) float tensor to write the samples into
+        :param generator: optional torch.Generator to draw from
+        :return: samples from this gaussian distribution
+        '''
+        return torch.addmm(self.m_t, self.noise(n, self.dim, generator), self.L_t, out=out)
+
+    def moments(self):
+        return np.asarray(self.m, dtype=np.float64).flatten(), np.atleast_2d(np.asarray(self.S, dtype=np.float64))
+
+def orthonormal_frame(frame):
+    '''
+    Orthonormalize the columns of frame, keeping the direction of each.
+    :param frame: (d, k) array of k linearly independent directions, or a single (d,) direction
+    '''
+    frame = np.asarray(frame, dtype=np.float64)
+    q, r = np.linalg.qr(frame.reshape((frame.shape[0], -1)))
+    return q * np.sign(np.diag(r))
+
+def random_frame(d, k, seed=None):
+    '''
+    Return a uniformly random (d, k) orthonormal frame.
+    '''
+    return orthonormal_frame(np.random.RandomState(seed).randn(d, k))
+
+class ManifoldGaussian(Sampler):
+    def __init__(self, m, s, frame):
+        '''
+        Gaussian on the k-dimensional affine subspace of R^d through m spanned by the columns of frame.
+        :param m: (d,) center
+        :param s: standard deviation along every direction of the frame, a scalar or one value per direction
+        :param frame: (d, k) directions, orthonormalized
+        '''
+        self.m = m
+        self.frame = orthonormal_frame(frame)
+        self.dim, self.k = self.frame.shape
+        self.s = np.broadcast_to(np.asarray(s, dtype=np.float64), (self.k,)).copy()
+        self.m_t = torch.tensor(np.asarray(m, dtype=np.float64).flatten(), dtype=torch.float)
+        self.step_t = torch.tensor((self.frame * self.s).T, dtype=torch.float)
+
+    def sample(self, n, out=None, generator=None):
+        '''
+        Return n samples of dimension d on the subspace
+        :param n: number of samples
+        :param out: optional (n, dim) float tensor to write the samples into
+        :param generator: optional torch.Generator to draw from
+        '''
+        return torch.addmm(self.m_t, self.noise(n, self.k, generator), self.step_t, out=out)
+
+    def moments(self):
+        return np.asarray(self.m, dtype=np.float64).flatten(), (self.frame * self.s ** 2).dot(self.frame.T)
+
+class LineGaussian(ManifoldGaussian):
+    def __init__(self, m, s, slope):
+        '''
+        Gaussian on the line through m along slope, with standard deviation s along it.
+        '''
+        super(LineGaussian, self).__init__(m, s, np.asarray(slope).reshape((-1, 1)))
+        self.slope = self.frame[:, 0]
+
+class Uniform(Sampler):
+    def __init__(self, low, high, dim):
+        self.low = low
+        self.high = high
+        self.dim = dim
+
+    def sample(self, n, out=None, generator=None):
+        if(out is None):
+            out = torch.empty((n, self.dim))
+        return out.uniform_(self.low, self.high, generator=generator)
+
+    def moments(self):
+        return np.full(self.dim, (self.low + self.high) / 2.0), np.eye(self.dim) * (self.high - self.low) ** 2 / 12.0
+
+# samplers whose push-forward through an affine map is again Gaussian
+GAUSSIANS = (Gaussian, ManifoldGaussian)
+
+def affine_map(modules):
+    '''
+    Compose layers into a single affine map x -> A x + c.
+    :param modules: nn.Linear layers, in order
+    :return: (A, c) as float64 arrays, or None if any of the modules is not an nn.Linear
+    '''
+    A, c = None, None
+    for module in modules:
+        if(not isinstance(module, nn.Linear)):
+            return None
+        W = module.weight.detach().double().numpy()
+        b = module.bias.detach().double().numpy() if module.bias is not None else np.zeros(W.shape[0])
+        A, c = (W, b) if A is None else (W.dot(A), W.dot(c) + b)
+    return A, c
+
+def pushforward_moments(generator, latent):
+    '''
+    Exact mean and covariance of the generator's outputs for latent inputs. An affine generator x -> A x + c maps
+    latent moments (m, S) to (A m + c, A S A^T), so no samples are needed.
+    :return: (mean, cov), or None when the generator is not affine or the latent has no known moments
+    '''
+    affine = generator.affine() if hasattr(generator, "affine") else None
+    if(affine is None or not hasattr(latent, "moments")):
+        return None
+    A, c = affine
+    m, S = latent.moments()
+    return A.dot(m) + c, A.dot(S).dot(A.T)
+
+class Generator(nn.Module):
+    def __init__(self, input_dim, output_dim):
+        super(Generator, self).__init__()
+        self.out = nn.Linear(input_dim, output_dim, bias=True) # learn a linear transformation of gaussian
+    def forward(self, input):
+        return self.out(input)
+
+    def affine(self):
+        return affine_map([self.out])
+
+
+class Net(nn.Module):
+    # MLP net with set input dimensionality, given intermediate layer dims, and fixed outputs
+    def __init__(self, layer_dims, output="linear"):
+        super(Net, self).__init__()
+        layers = []
+        for i in range(1, len(layer_dims) - 1):
+            layers.append(nn.Linear(layer_dims[i - 1], layer_dims[i]))
+            layers.append(nn.ReLU())
+        if(output=="sigmoid"):
+            layers.append(nn.Linear(layer_dims[-2], layer_dims[-1]))
+            layers.append(nn.Sigmoid())
+        if(output=="linear"):
+            layers.append(nn.Linear(layer_dims[-2], layer_dims[-1]))
+
+        self.out = nn.Sequential(*layers)
+        self.linears = [layer for layer in layers if isinstance(layer, nn.Linear)]
+        # set through __dict__ so the compiled copy of self.out is not registered as a second submodule
+        self.__dict__["compiled"] = None
+
+    def compile_forward(self, mode="script"):
+        '''
+        Compile the forward pass. The compiled module shares its parameters with self.out.
+        :param mode: "script" for TorchScript, "compile" for torch.compile, None to go back to eager
+        '''
+        if(mode == "script"):
+            self.__dict__["compiled"] = torch.jit.script(self.out)
+        elif(mode == "compile"):
+            self.__dict__["compiled"] = torch.compile(self.out)
+        elif(mode is None):
+            self.__dict__["compiled"] = None
+        else:
+            raise ValueError("Unknown compile mode: {0}".format(mode))
+        return self
+
+    def forward(self, input):
+        if(self.compiled is not None):
+            return self.compiled(input)
+        return self.out(input)
+
+    def affine(self):
+        '''
+        :return: (A, c) of the map x -> A x + c this net computes, or None unless it has no hidden layers or
+                 activations, e.g. Net([2, 2])
+        '''
+        return affine_map(list(self.out))
+
+    def clip_weights(self, clip):
+        with torch.no_grad():
+            for layer in self.linears:
+                layer.weight.clamp_(-clip, clip)
+
+    def critic_loss(self, real, fake, loss="wgan"):
+        '''
+        Critic loss over one forward pass of the concatenated real and fake batches.
+        :param loss: "gan" (self has a sigmoid output) or "wgan"
+        '''
+        out = self.forward(torch.cat((real, fake)))
+        d_real, d_fake = out[:real.shape[0]], out[real.shape[0]:]
+        if(loss == "gan"):
+            return -torch.mean(torch.log(d_real) + torch.log(1 - d_fake))
+        return torch.mean(d_fake) - torch.mean(d_real)
+
+    def critic_step(self, real, fake, optim, loss="wgan", clip=None):
+        '''
+        One optimizer step of this net as the critic. Returns the (detached) loss.
+        :param fake: generator samples, which must not require grad
+        :param clip: clip weights to [-clip, clip] after the step
+        '''
+        optim.zero_grad(set_to_none=True)
+        value = self.critic_loss(real, fake, loss)
+        value.backward()
+        optim.step()
+        if(clip is not None):
+            self.clip_weights(clip)
+        return value.detach()
+
+    def generator_step(self, critic, latent, optim, loss="wgan"):
+        '''
+        One optimizer step of this net as the generator against a fixed critic. The critic's parameters are frozen
+        for the backward pass so no gradient is computed for them. Returns the (detached) loss and the samples.
+        '''
+        optim.zero_grad(set_to_none=True)
+        critic.requires_grad_(False)
+        try:
+            samples = self.forward(latent)
+            if(loss == "gan"):
+                value = torch.mean(torch.log(1 - critic(samples)))
+            else:
+                value = -torch.mean(critic(samples))
+            value.backward()
+        finally:
+            # a failed pass must not leave the critic frozen for the following critic steps
+            critic.requires_grad_(True)
+        optim.step()
+        return value.detach(), samples.detach()
+
+    def distance_step(self, target, latent, optim, distance):
+        '''
+        One optimizer step of this net as a generator trained directly on a distance between its samples and a
+        batch of target samples, without a critic. Returns the (detached) distance and the samples.
+        :param distance: function distance(samples, target) -> scalar tensor, see losses.py
+        '''
+        optim.zero_grad(set_to_none=True)
+        samples = self.forward(latent)
+        value = distance(samples, target)
+        value.backward()
+        optim.step()
+        return value.detach(), samples.detach()
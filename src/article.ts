@@ -10,6 +10,7 @@ import { SVGIndicatorTransport, SVGTransportMatrix } from "./view/transport";
 import { SVGAnimatedGaussian, SVGAnimatedPoints } from "./view/gaussian"
 import { CONF, Model } from "./model/model";
 import { Gaussian2D, Line2D } from "./model/gaussian";
+import { playbackFrames } from "./model/trajectory";
 import { SVGLabeledBinaryTree, SVGBinaryTree } from "./view/binarytree";
 // This script controls all of the animations in the article
 
@@ -306,14 +307,14 @@ export function main() {
     $("#gan-comp-easy-pause").click(() => { svgWEAnim.pause(); svgGEAnim.pause(); });
     $("#gan-comp-easy-reset").click(() => { svgWEAnim.reset(); svgGEAnim.reset(); });
 
-    let wMPoints = optimizers["wganManifold"]["points"];
+    let wMPoints = playbackFrames(optimizers["wganManifold"]["pointsTrajectory"]);
     let wMTargetMean = optimizers["wganManifold"]["targetMean"];
     let wMTargetSlope = optimizers["wganManifold"]["targetSlope"];
     let wMTarget = new Line2D(wMTargetSlope, wMTargetMean);
 
     let svgWMAnim = new SVGAnimatedPoints("wgan-manifold", "#wgan-manifold-optim-ex", 15, wMPoints, wMTarget, [[-2, 4], [-2, 4]], conf);
 
-    let gMPoints = optimizers["ganManifold"]["points"];
+    let gMPoints = playbackFrames(optimizers["ganManifold"]["pointsTrajectory"]);
     let gMTargetMean = optimizers["ganManifold"]["targetMean"];
     let gMTargetSlope = optimizers["ganManifold"]["targetSlope"];
     let gMTarget = new Line2D(gMTargetSlope, gMTargetMean);
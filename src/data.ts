@@ -33,12 +33,12 @@ export const optimizers = {
     "wganManifold": {
         "targetSlope": [1, -1],
         "targetMean": [2, 2],
-        "points": [[[-0.22, 0.28], [-0.21, 0.28], [-0.21, 0.27], [-0.2, 0.27], [-0.2, 0.26], [-0.19, 0.25], [-0.19, 0.25], [-0.19, 0.24], [-0.18, 0.24], [-0.18, 0.23], [-0.18, 0.23], [-0.17, 0.22], [-0.17, 0.21], [-0.17, 0.21], [-0.17, 0.2], [-0.17, 0.2], [-0.18, 0.19], [-0.18, 0.18], [-0.18, 0.18], [-0.18, 0.17], [-0.18, 0.16], [-0.18, 0.16], [-0.18, 0.15], [-0.18, 0.15], [-0.18, 0.14], [-0.18, 0.14], [-0.18, 0.13], [-0.17, 0.13], [-0.17, 0.13], [-0.17, 0.13], [-0.17, 0.13], [-0.17, 0.14], [-0.17, 0.14], [-0.17, 0.14], [-0.17, 0.14], [-0.17, 0.15], [-0.17, 0.15], [-0.17, 0.15], [-0.17, 0.16], [-0.18, 0.16], [-0.18, 0.16], [-0.18, 0.16], [-0.18, 0.17], [-0.19, 0.17], [-0.19, 0.17], [-0.19, 0.17], [-0.19, 0.18], [-0.19, 0.18], [-0.2, 0.18], [-0.2, 0.18]], [[1.21, 2.63], [1.17, 2.55], [1.14, 2.48], [1.1, 2.41], [1.06, 2.34], [1.02, 2.26], [0.99, 2.19], [0.95, 2.12], [0.91, 2.05], [0.88, 1.98], [0.84, 1.91], [0.8, 1.84], [0.77, 1.78], [0.74, 1.72], [0.71, 1.66], [0.68, 1.6], [0.65, 1.55], [0.62, 1.49], [0.6, 1.44], [0.57, 1.4], [0.56, 1.37], [0.55, 1.34], [0.53, 1.32], [0.52, 1.29], [0.51, 1.26], [0.5, 1.25], [0.5, 1.24], [0.49, 1.24], [0.5, 1.24], [0.5, 1.25], [0.51, 1.27], [0.52, 1.29], [0.53, 1.3], [0.54, 1.32], [0.56, 1.36], [0.58, 1.42], [0.6, 1.47], [0.63, 1.53], [0.66, 1.58], [0.68, 1.64], [0.71, 1.69], [0.73, 1.75], [0.76, 1.81], [0.79, 1.87], [0.82, 1.93], [0.85, 1.99], [0.88, 2.05], [0.91, 2.11], [0.94, 2.17], [0.96, 2.23]], [[2.59, 3.5], [2.51, 3.4], [2.44, 3.3], [2.36, 3.2], [2.28, 3.1], [2.2, 3.0], [2.12, 2.9], [2.05, 2.8], [1.97, 2.71], [1.89, 2.61], [1.82, 2.51], [1.75, 2.42], [1.68, 2.33], [1.61, 2.25], [1.55, 2.17], [1.49, 2.09], [1.42, 2.01], [1.36, 1.93], [1.31, 1.86], [1.27, 1.81], [1.23, 1.77], [1.21, 1.73], [1.18, 1.69], [1.15, 1.66], [1.13, 1.62], [1.11, 1.6], [1.1, 1.59], [1.1, 1.59], [1.1, 1.59], [1.12, 1.61], [1.13, 1.63], [1.15, 1.65], [1.17, 1.68], [1.19, 1.7], [1.23, 1.75], [1.28, 1.82], [1.33, 1.89], [1.39, 1.97], [1.44, 2.04], [1.5, 2.12], [1.55, 2.19], [1.61, 2.26], [1.67, 2.34], [1.73, 2.42], [1.79, 2.5], [1.85, 2.58], [1.92, 2.66], [1.98, 2.74], [2.04, 2.83], [2.1, 2.91]], [[3.47, 3.31], [3.37, 3.22], [3.27, 3.13], [3.16, 3.03], [3.06, 2.94], [2.96, 2.84], [2.86, 2.75], [2.75, 2.66], [2.65, 2.56], [2.55, 2.47], [2.45, 2.38], [2.35, 2.29], [2.26, 2.21], [2.18, 2.13], [2.09, 2.06], [2.01, 1.98], [1.93, 1.9], [1.85, 1.83], [1.78, 1.76], [1.72, 1.71], [1.68, 1.67], [1.64, 1.64], [1.6, 1.6], [1.57, 1.57], [1.53, 1.54], [1.52, 1.52], [1.51, 1.52], [1.5, 1.51], [1.51, 1.52], [1.54, 1.54], [1.56, 1.56], [1.58, 1.58], [1.61, 1.6], [1.63, 1.63], [1.69, 1.68], [1.76, 1.74], [1.83, 1.81], [1.91, 1.88], [1.98, 1.95], [2.06, 2.03], [2.14, 2.1], [2.21, 2.17], [2.3, 2.24], [2.38, 2.32], [2.46, 2.4], [2.55, 2.48], [2.63, 2.56], [2.72, 2.63], [2.8, 2.71], [2.88, 2.79]], [[3.45, 3.38], [3.35, 3.28], [3.25, 3.19], [3.14, 3.09], [3.04, 3.0], [2.94, 2.9], [2.84, 2.81], [2.74, 2.71], [2.64, 2.62], [2.54, 2.52], [2.44, 2.43], [2.34, 2.34], [2.25, 2.26], [2.17, 2.18], [2.09, 2.1], [2.0, 2.03], [1.92, 1.95], [1.84, 1.87], [1.77, 1.81], [1.72, 1.76], [1.68, 1.72], [1.64, 1.68], [1.61, 1.65], [1.57, 1.62], [1.54, 1.58], [1.52, 1.57], [1.51, 1.56], [1.51, 1.56], [1.52, 1.57], [1.54, 1.59], [1.57, 1.61], [1.59, 1.63], [1.62, 1.66], [1.64, 1.68], [1.7, 1.73], [1.77, 1.8], [1.84, 1.87], [1.92, 1.95], [1.99, 2.02], [2.07, 2.09], [2.15, 2.17], [2.23, 2.24], [2.31, 2.32], [2.39, 2.4], [2.48, 2.48], [2.56, 2.56], [2.65, 2.64], [2.73, 2.72], [2.81, 2.8], [2.9, 2.88]], [[3.44, 3.33], [3.34, 3.24], [3.24, 3.15], [3.14, 3.05], [3.04, 2.96], [2.94, 2.87], [2.84, 2.77], [2.73, 2.68], [2.63, 2.59], [2.54, 2.5], [2.44, 2.41], [2.34, 2.32], [2.26, 2.24], [2.17, 2.16], [2.09, 2.08], [2.01, 2.01], [1.93, 1.93], [1.85, 1.86], [1.78, 1.8], [1.73, 1.75], [1.68, 1.71], [1.65, 1.67], [1.62, 1.64], [1.58, 1.61], [1.55, 1.58], [1.53, 1.56], [1.52, 1.56], [1.52, 1.55], [1.53, 1.56], [1.56, 1.59], [1.58, 1.61], [1.6, 1.63], [1.63, 1.65], [1.66, 1.68], [1.71, 1.73], [1.78, 1.8], [1.85, 1.87], [1.93, 1.94], [2.01, 2.01], [2.09, 2.08], [2.16, 2.16], [2.24, 2.23], [2.32, 2.31], [2.41, 2.39], [2.49, 2.47], [2.58, 2.55], [2.66, 2.63], [2.75, 2.71], [2.83, 2.78], [2.92, 2.86]], [[3.46, 3.34], [3.36, 3.24], [3.26, 3.15], [3.16, 3.06], [3.06, 2.96], [2.96, 2.87], [2.85, 2.78], [2.75, 2.68], [2.65, 2.59], [2.55, 2.5], [2.46, 2.41], [2.36, 2.32], [2.27, 2.24], [2.19, 2.17], [2.11, 2.09], [2.03, 2.02], [1.94, 1.94], [1.86, 1.87], [1.8, 1.8], [1.74, 1.75], [1.7, 1.71], [1.66, 1.68], [1.63, 1.65], [1.6, 1.62], [1.56, 1.58], [1.54, 1.57], [1.54, 1.56], [1.53, 1.56], [1.55, 1.57], [1.57, 1.59], [1.59, 1.61], [1.61, 1.63], [1.64, 1.65], [1.66, 1.68], [1.72, 1.73], [1.79, 1.79], [1.86, 1.86], [1.93, 1.93], [2.01, 2.01], [2.09, 2.08], [2.17, 2.15], [2.24, 2.22], [2.32, 2.3], [2.41, 2.38], [2.49, 2.45], [2.57, 2.53], [2.66, 2.61], [2.74, 2.69], [2.83, 2.77], [2.91, 2.85]], [[3.33, 3.28], [3.23, 3.19], [3.13, 3.1], [3.04, 3.0], [2.94, 2.91], [2.84, 2.82], [2.75, 2.73], [2.65, 2.64], [2.56, 2.55], [2.46, 2.46], [2.37, 2.38], [2.28, 2.29], [2.19, 2.21], [2.11, 2.14], [2.03, 2.07], [1.96, 1.99], [1.88, 1.92], [1.8, 1.85], [1.74, 1.79], [1.69, 1.74], [1.65, 1.7], [1.61, 1.67], [1.58, 1.64], [1.55, 1.6], [1.51, 1.57], [1.5, 1.56], [1.49, 1.55], [1.49, 1.55], [1.5, 1.56], [1.52, 1.58], [1.54, 1.6], [1.57, 1.62], [1.59, 1.65], [1.62, 1.67], [1.67, 1.72], [1.74, 1.79], [1.81, 1.85], [1.88, 1.93], [1.96, 2.0], [2.03, 2.07], [2.11, 2.14], [2.18, 2.21], [2.26, 2.29], [2.34, 2.36], [2.42, 2.44], [2.5, 2.52], [2.59, 2.6], [2.67, 2.68], [2.75, 2.75], [2.83, 2.83]], [[3.42, 3.22], [3.32, 3.13], [3.22, 3.05], [3.12, 2.96], [3.03, 2.87], [2.93, 2.78], [2.83, 2.69], [2.73, 2.6], [2.63, 2.52], [2.54, 2.43], [2.44, 2.34], [2.35, 2.26], [2.26, 2.18], [2.18, 2.11], [2.1, 2.04], [2.02, 1.97], [1.94, 1.9], [1.86, 1.83], [1.8, 1.77], [1.75, 1.72], [1.71, 1.68], [1.67, 1.65], [1.64, 1.62], [1.61, 1.59], [1.57, 1.56], [1.56, 1.55], [1.55, 1.54], [1.55, 1.54], [1.56, 1.55], [1.59, 1.57], [1.61, 1.59], [1.63, 1.61], [1.66, 1.64], [1.69, 1.66], [1.74, 1.71], [1.81, 1.78], [1.88, 1.84], [1.96, 1.91], [2.03, 1.99], [2.11, 2.06], [2.19, 2.13], [2.27, 2.2], [2.35, 2.27], [2.43, 2.35], [2.52, 2.43], [2.6, 2.5], [2.68, 2.58], [2.77, 2.66], [2.85, 2.74], [2.94, 2.81]], [[3.4, 3.27], [3.3, 3.18], [3.2, 3.09], [3.1, 3.0], [3.01, 2.91], [2.91, 2.82], [2.81, 2.73], [2.71, 2.64], [2.62, 2.55], [2.52, 2.47], [2.43, 2.38], [2.34, 2.3], [2.25, 2.22], [2.17, 2.15], [2.09, 2.08], [2.02, 2.0], [1.94, 1.93], [1.86, 1.86], [1.8, 1.8], [1.75, 1.76], [1.71, 1.72], [1.67, 1.69], [1.64, 1.66], [1.61, 1.63], [1.57, 1.6], [1.56, 1.58], [1.55, 1.58], [1.55, 1.57], [1.56, 1.59], [1.59, 1.61], [1.61, 1.63], [1.63, 1.65], [1.66, 1.67], [1.69, 1.7], [1.74, 1.75], [1.81, 1.81], [1.88, 1.88], [1.95, 1.95], [2.03, 2.02], [2.11, 2.1], [2.18, 2.17], [2.26, 2.24], [2.34, 2.31], [2.42, 2.39], [2.51, 2.47], [2.59, 2.55], [2.67, 2.62], [2.76, 2.7], [2.84, 2.78], [2.92, 2.86]], [[3.34, 3.27], [3.25, 3.19], [3.15, 3.1], [3.06, 3.01], [2.96, 2.92], [2.87, 2.83], [2.77, 2.74], [2.68, 2.66], [2.59, 2.57], [2.49, 2.48], [2.4, 2.4], [2.31, 2.32], [2.23, 2.24], [2.15, 2.17], [2.08, 2.1], [2.0, 2.03], [1.93, 1.96], [1.85, 1.89], [1.79, 1.83], [1.74, 1.79], [1.7, 1.75], [1.67, 1.72], [1.64, 1.69], [1.61, 1.66], [1.58, 1.63], [1.57, 1.62], [1.56, 1.62], [1.56, 1.62], [1.58, 1.63], [1.6, 1.66], [1.63, 1.68], [1.65, 1.7], [1.68, 1.73], [1.71, 1.76], [1.76, 1.8], [1.83, 1.87], [1.9, 1.94], [1.98, 2.02], [2.06, 2.09], [2.14, 2.17], [2.22, 2.24], [2.29, 2.32], [2.37, 2.39], [2.46, 2.47], [2.54, 2.55], [2.63, 2.63], [2.71, 2.71], [2.8, 2.79], [2.88, 2.87], [2.97, 2.96]], [[3.29, 3.15], [3.2, 3.07], [3.11, 2.98], [3.01, 2.9], [2.92, 2.82], [2.83, 2.73], [2.74, 2.65], [2.64, 2.56], [2.55, 2.48], [2.46, 2.4], [2.37, 2.32], [2.29, 2.24], [2.21, 2.17], [2.13, 2.1], [2.06, 2.03], [1.98, 1.96], [1.91, 1.9], [1.84, 1.83], [1.78, 1.78], [1.73, 1.73], [1.69, 1.7], [1.66, 1.67], [1.63, 1.64], [1.6, 1.61], [1.57, 1.59], [1.55, 1.57], [1.55, 1.57], [1.55, 1.57], [1.57, 1.58], [1.59, 1.61], [1.61, 1.63], [1.64, 1.65], [1.66, 1.67], [1.69, 1.7], [1.74, 1.74], [1.81, 1.81], [1.88, 1.88], [1.95, 1.95], [2.03, 2.02], [2.11, 2.09], [2.18, 2.16], [2.26, 2.23], [2.33, 2.3], [2.42, 2.37], [2.5, 2.45], [2.58, 2.53], [2.67, 2.6], [2.75, 2.68], [2.83, 2.76], [2.91, 2.84]], [[3.3, 3.18], [3.21, 3.1], [3.11, 3.01], [3.02, 2.93], [2.93, 2.85], [2.84, 2.76], [2.74, 2.68], [2.65, 2.59], [2.56, 2.51], [2.47, 2.43], [2.38, 2.35], [2.3, 2.27], [2.22, 2.2], [2.14, 2.13], [2.07, 2.06], [1.99, 1.99], [1.92, 1.92], [1.85, 1.86], [1.79, 1.8], [1.74, 1.76], [1.7, 1.73], [1.67, 1.7], [1.64, 1.67], [1.61, 1.64], [1.58, 1.61], [1.57, 1.6], [1.57, 1.6], [1.56, 1.6], [1.58, 1.61], [1.6, 1.63], [1.63, 1.65], [1.65, 1.68], [1.68, 1.7], [1.71, 1.73], [1.75, 1.77], [1.82, 1.84], [1.89, 1.9], [1.97, 1.98], [2.05, 2.05], [2.12, 2.12], [2.2, 2.19], [2.27, 2.26], [2.35, 2.33], [2.43, 2.41], [2.51, 2.49], [2.6, 2.56], [2.68, 2.64], [2.76, 2.72], [2.85, 2.8], [2.93, 2.87]], [[3.24, 3.21], [3.15, 3.12], [3.06, 3.04], [2.97, 2.95], [2.88, 2.87], [2.79, 2.79], [2.7, 2.7], [2.61, 2.62], [2.52, 2.54], [2.43, 2.45], [2.35, 2.37], [2.26, 2.3], [2.19, 2.22], [2.11, 2.16], [2.04, 2.09], [1.97, 2.02], [1.9, 1.95], [1.83, 1.89], [1.77, 1.83], [1.73, 1.79], [1.69, 1.76], [1.66, 1.73], [1.63, 1.7], [1.6, 1.67], [1.57, 1.64], [1.56, 1.63], [1.56, 1.63], [1.56, 1.63], [1.57, 1.65], [1.6, 1.67], [1.62, 1.69], [1.64, 1.71], [1.67, 1.74], [1.7, 1.77], [1.75, 1.81], [1.82, 1.88], [1.89, 1.95], [1.96, 2.02], [2.04, 2.09], [2.11, 2.16], [2.19, 2.24], [2.26, 2.31], [2.34, 2.38], [2.42, 2.46], [2.5, 2.54], [2.58, 2.61], [2.67, 2.69], [2.75, 2.77], [2.83, 2.85], [2.91, 2.93]], [[3.3, 3.11], [3.21, 3.03], [3.12, 2.95], [3.03, 2.87], [2.94, 2.78], [2.85, 2.7], [2.76, 2.62], [2.67, 2.54], [2.58, 2.46], [2.49, 2.38], [2.4, 2.31], [2.31, 2.23], [2.24, 2.16], [2.16, 2.1], [2.09, 2.03], [2.02, 1.97], [1.94, 1.9], [1.87, 1.84], [1.81, 1.78], [1.77, 1.75], [1.73, 1.71], [1.7, 1.68], [1.67, 1.66], [1.64, 1.63], [1.61, 1.6], [1.6, 1.59], [1.6, 1.59], [1.6, 1.59], [1.61, 1.61], [1.64, 1.63], [1.66, 1.65], [1.69, 1.67], [1.72, 1.7], [1.74, 1.72], [1.79, 1.77], [1.86, 1.83], [1.93, 1.89], [2.01, 1.96], [2.08, 2.03], [2.16, 2.1], [2.24, 2.17], [2.31, 2.24], [2.39, 2.31], [2.47, 2.38], [2.56, 2.46], [2.64, 2.54], [2.73, 2.61], [2.81, 2.69], [2.89, 2.76], [2.98, 2.84]], [[3.23, 3.09], [3.14, 3.01], [3.05, 2.93], [2.96, 2.85], [2.88, 2.77], [2.79, 2.7], [2.7, 2.62], [2.61, 2.54], [2.52, 2.46], [2.44, 2.38], [2.35, 2.3], [2.27, 2.23], [2.19, 2.16], [2.12, 2.1], [2.05, 2.03], [1.98, 1.97], [1.91, 1.9], [1.84, 1.84], [1.78, 1.79], [1.74, 1.75], [1.7, 1.72], [1.67, 1.69], [1.64, 1.66], [1.61, 1.63], [1.58, 1.61], [1.57, 1.6], [1.57, 1.6], [1.57, 1.6], [1.59, 1.61], [1.61, 1.63], [1.63, 1.65], [1.66, 1.67], [1.68, 1.7], [1.71, 1.72], [1.76, 1.77], [1.82, 1.83], [1.89, 1.89], [1.97, 1.96], [2.04, 2.03], [2.11, 2.1], [2.19, 2.16], [2.26, 2.23], [2.34, 2.3], [2.42, 2.38], [2.5, 2.45], [2.58, 2.53], [2.66, 2.6], [2.75, 2.68], [2.83, 2.75], [2.91, 2.83]], [[3.27, 3.13], [3.18, 3.05], [3.09, 2.97], [3.0, 2.89], [2.91, 2.81], [2.82, 2.73], [2.74, 2.65], [2.65, 2.57], [2.56, 2.49], [2.47, 2.41], [2.39, 2.33], [2.3, 2.26], [2.23, 2.19], [2.16, 2.13], [2.08, 2.06], [2.01, 2.0], [1.94, 1.93], [1.87, 1.87], [1.81, 1.82], [1.77, 1.78], [1.74, 1.75], [1.71, 1.72], [1.68, 1.69], [1.65, 1.67], [1.62, 1.64], [1.61, 1.63], [1.61, 1.63], [1.61, 1.63], [1.62, 1.65], [1.65, 1.67], [1.67, 1.69], [1.7, 1.71], [1.72, 1.74], [1.75, 1.76], [1.8, 1.8], [1.87, 1.87], [1.93, 1.93], [2.01, 2.0], [2.08, 2.07], [2.16, 2.14], [2.24, 2.21], [2.31, 2.28], [2.39, 2.35], [2.47, 2.42], [2.55, 2.5], [2.63, 2.57], [2.72, 2.65], [2.8, 2.73], [2.88, 2.8], [2.97, 2.88]], [[3.17, 3.0], [3.08, 2.93], [3.0, 2.85], [2.91, 2.78], [2.83, 2.7], [2.74, 2.63], [2.66, 2.55], [2.57, 2.48], [2.49, 2.4], [2.41, 2.33], [2.32, 2.25], [2.24, 2.18], [2.17, 2.12], [2.1, 2.06], [2.04, 2.0], [1.97, 1.94], [1.9, 1.88], [1.84, 1.82], [1.78, 1.77], [1.74, 1.74], [1.71, 1.71], [1.68, 1.68], [1.66, 1.66], [1.63, 1.64], [1.6, 1.61], [1.6, 1.61], [1.6, 1.61], [1.6, 1.61], [1.62, 1.63], [1.65, 1.65], [1.67, 1.68], [1.7, 1.7], [1.73, 1.73], [1.76, 1.76], [1.81, 1.8], [1.88, 1.86], [1.95, 1.93], [2.03, 2.0], [2.1, 2.07], [2.18, 2.14], [2.26, 2.21], [2.34, 2.28], [2.41, 2.35], [2.49, 2.42], [2.58, 2.5], [2.66, 2.58], [2.75, 2.65], [2.83, 2.73], [2.92, 2.81], [3.0, 2.88]], [[3.1, 3.02], [3.01, 2.94], [2.93, 2.87], [2.85, 2.79], [2.77, 2.72], [2.68, 2.64], [2.6, 2.57], [2.52, 2.49], [2.44, 2.42], [2.36, 2.35], [2.28, 2.27], [2.2, 2.2], [2.13, 2.14], [2.07, 2.08], [2.0, 2.02], [1.93, 1.96], [1.87, 1.9], [1.81, 1.84], [1.75, 1.79], [1.72, 1.76], [1.69, 1.73], [1.66, 1.71], [1.63, 1.69], [1.61, 1.66], [1.58, 1.64], [1.58, 1.63], [1.58, 1.64], [1.58, 1.64], [1.6, 1.66], [1.63, 1.69], [1.66, 1.71], [1.68, 1.74], [1.72, 1.76], [1.75, 1.79], [1.79, 1.83], [1.86, 1.9], [1.93, 1.97], [2.01, 2.04], [2.08, 2.11], [2.16, 2.18], [2.24, 2.25], [2.31, 2.32], [2.39, 2.39], [2.47, 2.47], [2.55, 2.55], [2.64, 2.62], [2.72, 2.7], [2.8, 2.78], [2.89, 2.86], [2.97, 2.94]], [[3.06, 2.95], [2.98, 2.88], [2.9, 2.8], [2.82, 2.73], [2.74, 2.66], [2.66, 2.59], [2.58, 2.52], [2.5, 2.45], [2.42, 2.37], [2.34, 2.3], [2.26, 2.23], [2.19, 2.17], [2.12, 2.11], [2.06, 2.05], [1.99, 1.99], [1.93, 1.93], [1.86, 1.87], [1.8, 1.82], [1.75, 1.77], [1.72, 1.74], [1.69, 1.71], [1.66, 1.69], [1.64, 1.67], [1.61, 1.65], [1.59, 1.62], [1.58, 1.62], [1.58, 1.62], [1.59, 1.63], [1.61, 1.65], [1.64, 1.67], [1.66, 1.7], [1.69, 1.72], [1.72, 1.75], [1.75, 1.78], [1.8, 1.82], [1.87, 1.88], [1.94, 1.94], [2.01, 2.01], [2.09, 2.08], [2.16, 2.15], [2.24, 2.22], [2.31, 2.29], [2.39, 2.36], [2.47, 2.43], [2.55, 2.51], [2.63, 2.59], [2.72, 2.66], [2.8, 2.74], [2.88, 2.82], [2.97, 2.89]], [[3.08, 2.94], [3.0, 2.86], [2.92, 2.79], [2.84, 2.72], [2.76, 2.65], [2.68, 2.58], [2.6, 2.51], [2.52, 2.44], [2.44, 2.37], [2.36, 2.3], [2.28, 2.23], [2.21, 2.17], [2.14, 2.11], [2.08, 2.05], [2.02, 1.99], [1.95, 1.94], [1.89, 1.88], [1.83, 1.83], [1.77, 1.78], [1.74, 1.75], [1.71, 1.72], [1.69, 1.7], [1.66, 1.68], [1.64, 1.65], [1.61, 1.63], [1.61, 1.63], [1.61, 1.63], [1.61, 1.64], [1.63, 1.66], [1.66, 1.68], [1.69, 1.7], [1.72, 1.73], [1.75, 1.76], [1.78, 1.78], [1.82, 1.82], [1.89, 1.89], [1.96, 1.95], [2.03, 2.02], [2.11, 2.09], [2.19, 2.16], [2.27, 2.23], [2.34, 2.3], [2.42, 2.37], [2.5, 2.44], [2.58, 2.51], [2.66, 2.59], [2.75, 2.66], [2.83, 2.74], [2.91, 2.82], [3.0, 2.89]], [[3.09, 3.01], [3.01, 2.94], [2.93, 2.87], [2.85, 2.79], [2.77, 2.72], [2.69, 2.65], [2.61, 2.58], [2.53, 2.5], [2.45, 2.43], [2.37, 2.36], [2.3, 2.29], [2.22, 2.22], [2.16, 2.16], [2.09, 2.11], [2.03, 2.05], [1.96, 1.99], [1.9, 1.93], [1.84, 1.87], [1.78, 1.83], [1.75, 1.8], [1.72, 1.77], [1.69, 1.74], [1.67, 1.72], [1.64, 1.69], [1.62, 1.67], [1.61, 1.67], [1.61, 1.67], [1.61, 1.67], [1.63, 1.69], [1.66, 1.71], [1.68, 1.74], [1.71, 1.76], [1.74, 1.78], [1.76, 1.81], [1.8, 1.85], [1.87, 1.91], [1.94, 1.97], [2.01, 2.04], [2.09, 2.11], [2.16, 2.18], [2.24, 2.25], [2.31, 2.32], [2.39, 2.39], [2.46, 2.46], [2.55, 2.53], [2.63, 2.61], [2.71, 2.68], [2.79, 2.76], [2.87, 2.84], [2.96, 2.91]], [[3.01, 2.95], [2.94, 2.88], [2.86, 2.81], [2.78, 2.74], [2.7, 2.67], [2.63, 2.6], [2.55, 2.53], [2.47, 2.46], [2.4, 2.39], [2.32, 2.33], [2.25, 2.26], [2.18, 2.19], [2.11, 2.14], [2.05, 2.08], [1.99, 2.02], [1.92, 1.96], [1.86, 1.91], [1.8, 1.86], [1.75, 1.81], [1.72, 1.78], [1.69, 1.75], [1.66, 1.73], [1.64, 1.71], [1.61, 1.68], [1.59, 1.66], [1.58, 1.65], [1.58, 1.66], [1.59, 1.66], [1.6, 1.67], [1.63, 1.7], [1.65, 1.72], [1.68, 1.74], [1.7, 1.77], [1.73, 1.79], [1.77, 1.83], [1.84, 1.89], [1.9, 1.95], [1.97, 2.01], [2.05, 2.08], [2.12, 2.15], [2.19, 2.22], [2.26, 2.28], [2.34, 2.35], [2.41, 2.42], [2.49, 2.49], [2.57, 2.57], [2.65, 2.64], [2.73, 2.72], [2.81, 2.79], [2.89, 2.87]], [[3.06, 2.92], [2.98, 2.85], [2.9, 2.78], [2.82, 2.71], [2.75, 2.64], [2.67, 2.58], [2.59, 2.51], [2.51, 2.44], [2.44, 2.37], [2.36, 2.3], [2.28, 2.24], [2.21, 2.18], [2.15, 2.12], [2.09, 2.06], [2.02, 2.01], [1.96, 1.95], [1.9, 1.9], [1.84, 1.85], [1.79, 1.8], [1.76, 1.77], [1.73, 1.75], [1.7, 1.72], [1.67, 1.7], [1.65, 1.68], [1.63, 1.65], [1.62, 1.65], [1.62, 1.65], [1.62, 1.65], [1.64, 1.67], [1.67, 1.69], [1.69, 1.72], [1.72, 1.74], [1.74, 1.76], [1.77, 1.79], [1.81, 1.82], [1.88, 1.88], [1.95, 1.94], [2.02, 2.01], [2.09, 2.07], [2.17, 2.14], [2.24, 2.21], [2.32, 2.27], [2.39, 2.34], [2.46, 2.41], [2.55, 2.48], [2.63, 2.56], [2.71, 2.63], [2.79, 2.7], [2.87, 2.78], [2.95, 2.85]], [[3.05, 2.92], [2.98, 2.85], [2.9, 2.78], [2.82, 2.72], [2.75, 2.65], [2.67, 2.58], [2.59, 2.51], [2.52, 2.45], [2.44, 2.38], [2.36, 2.31], [2.29, 2.25], [2.22, 2.19], [2.16, 2.13], [2.09, 2.07], [2.03, 2.02], [1.97, 1.96], [1.91, 1.91], [1.85, 1.86], [1.8, 1.81], [1.77, 1.78], [1.74, 1.76], [1.71, 1.73], [1.68, 1.71], [1.66, 1.69], [1.63, 1.67], [1.62, 1.66], [1.63, 1.66], [1.63, 1.66], [1.64, 1.68], [1.67, 1.7], [1.69, 1.72], [1.71, 1.74], [1.74, 1.76], [1.77, 1.78], [1.8, 1.82], [1.87, 1.88], [1.94, 1.93], [2.01, 2.0], [2.08, 2.06], [2.15, 2.13], [2.22, 2.19], [2.3, 2.26], [2.37, 2.33], [2.44, 2.39], [2.52, 2.46], [2.6, 2.54], [2.68, 2.61], [2.76, 2.68], [2.84, 2.75], [2.92, 2.83]], [[3.02, 2.89], [2.94, 2.83], [2.87, 2.76], [2.8, 2.7], [2.72, 2.63], [2.65, 2.56], [2.57, 2.5], [2.5, 2.43], [2.42, 2.37], [2.35, 2.3], [2.27, 2.24], [2.21, 2.18], [2.14, 2.12], [2.08, 2.07], [2.02, 2.02], [1.96, 1.96], [1.9, 1.91], [1.84, 1.86], [1.79, 1.81], [1.76, 1.79], [1.73, 1.76], [1.71, 1.74], [1.68, 1.71], [1.66, 1.69], [1.63, 1.67], [1.62, 1.66], [1.63, 1.67], [1.63, 1.67], [1.65, 1.68], [1.67, 1.7], [1.69, 1.73], [1.72, 1.75], [1.74, 1.77], [1.77, 1.79], [1.81, 1.82], [1.87, 1.88], [1.94, 1.94], [2.0, 2.0], [2.08, 2.06], [2.15, 2.13], [2.22, 2.19], [2.29, 2.26], [2.37, 2.32], [2.44, 2.39], [2.52, 2.46], [2.6, 2.53], [2.68, 2.6], [2.76, 2.68], [2.84, 2.75], [2.92, 2.82]], [[2.97, 2.88], [2.89, 2.82], [2.82, 2.75], [2.75, 2.69], [2.67, 2.62], [2.6, 2.56], [2.53, 2.49], [2.46, 2.43], [2.38, 2.36], [2.31, 2.3], [2.24, 2.24], [2.17, 2.18], [2.11, 2.13], [2.06, 2.07], [2.0, 2.02], [1.94, 1.97], [1.88, 1.91], [1.82, 1.87], [1.77, 1.82], [1.74, 1.8], [1.72, 1.77], [1.69, 1.75], [1.67, 1.73], [1.64, 1.7], [1.62, 1.68], [1.61, 1.68], [1.61, 1.68], [1.61, 1.68], [1.63, 1.7], [1.65, 1.72], [1.68, 1.74], [1.7, 1.76], [1.73, 1.78], [1.75, 1.8], [1.79, 1.83], [1.85, 1.89], [1.92, 1.95], [1.98, 2.01], [2.06, 2.07], [2.13, 2.14], [2.2, 2.2], [2.27, 2.27], [2.34, 2.33], [2.41, 2.4], [2.49, 2.47], [2.57, 2.54], [2.65, 2.61], [2.72, 2.68], [2.8, 2.75], [2.88, 2.83]], [[3.05, 2.92], [2.97, 2.85], [2.9, 2.78], [2.82, 2.72], [2.75, 2.65], [2.67, 2.59], [2.6, 2.52], [2.53, 2.46], [2.45, 2.39], [2.38, 2.33], [2.3, 2.27], [2.24, 2.21], [2.18, 2.16], [2.12, 2.1], [2.06, 2.05], [1.99, 2.0], [1.93, 1.94], [1.88, 1.89], [1.83, 1.85], [1.8, 1.83], [1.77, 1.8], [1.75, 1.78], [1.72, 1.75], [1.69, 1.73], [1.67, 1.71], [1.66, 1.71], [1.67, 1.71], [1.67, 1.71], [1.69, 1.73], [1.71, 1.75], [1.73, 1.77], [1.76, 1.79], [1.78, 1.81], [1.81, 1.83], [1.85, 1.86], [1.91, 1.92], [1.98, 1.98], [2.05, 2.04], [2.12, 2.1], [2.19, 2.17], [2.26, 2.24], [2.34, 2.3], [2.41, 2.37], [2.48, 2.43], [2.56, 2.5], [2.64, 2.57], [2.72, 2.65], [2.8, 2.72], [2.88, 2.79], [2.96, 2.86]], [[3.0, 2.86], [2.93, 2.79], [2.85, 2.73], [2.78, 2.67], [2.71, 2.6], [2.64, 2.54], [2.56, 2.48], [2.49, 2.41], [2.42, 2.35], [2.35, 2.29], [2.28, 2.23], [2.21, 2.17], [2.15, 2.12], [2.09, 2.07], [2.03, 2.02], [1.98, 1.97], [1.92, 1.92], [1.86, 1.87], [1.81, 1.83], [1.78, 1.8], [1.76, 1.78], [1.73, 1.76], [1.71, 1.74], [1.68, 1.71], [1.66, 1.69], [1.65, 1.69], [1.65, 1.69], [1.66, 1.69], [1.67, 1.71], [1.7, 1.73], [1.72, 1.75], [1.74, 1.77], [1.77, 1.79], [1.8, 1.81], [1.83, 1.84], [1.89, 1.89], [1.96, 1.95], [2.03, 2.01], [2.1, 2.07], [2.17, 2.14], [2.24, 2.2], [2.31, 2.26], [2.38, 2.33], [2.46, 2.39], [2.53, 2.46], [2.61, 2.53], [2.69, 2.6], [2.77, 2.67], [2.85, 2.74], [2.93, 2.81]], [[2.99, 2.82], [2.91, 2.76], [2.84, 2.7], [2.77, 2.64], [2.7, 2.57], [2.63, 2.51], [2.56, 2.45], [2.48, 2.39], [2.41, 2.33], [2.34, 2.27], [2.27, 2.21], [2.21, 2.16], [2.15, 2.11], [2.09, 2.06], [2.03, 2.01], [1.98, 1.96], [1.92, 1.91], [1.86, 1.86], [1.82, 1.82], [1.79, 1.8], [1.76, 1.77], [1.74, 1.75], [1.71, 1.73], [1.69, 1.71], [1.66, 1.69], [1.66, 1.68], [1.66, 1.68], [1.66, 1.69], [1.68, 1.7], [1.7, 1.72], [1.72, 1.74], [1.75, 1.76], [1.77, 1.78], [1.8, 1.8], [1.83, 1.82], [1.89, 1.88], [1.96, 1.93], [2.02, 1.99], [2.09, 2.05], [2.16, 2.11], [2.23, 2.18], [2.31, 2.24], [2.38, 2.3], [2.45, 2.36], [2.52, 2.43], [2.6, 2.5], [2.68, 2.57], [2.76, 2.64], [2.83, 2.7], [2.91, 2.77]], [[2.94, 2.84], [2.87, 2.78], [2.8, 2.72], [2.73, 2.66], [2.66, 2.6], [2.59, 2.54], [2.52, 2.48], [2.45, 2.42], [2.38, 2.36], [2.31, 2.3], [2.24, 2.24], [2.18, 2.18], [2.13, 2.14], [2.07, 2.09], [2.01, 2.04], [1.96, 1.99], [1.9, 1.94], [1.85, 1.89], [1.8, 1.85], [1.78, 1.83], [1.75, 1.81], [1.73, 1.79], [1.7, 1.76], [1.68, 1.74], [1.66, 1.72], [1.65, 1.72], [1.66, 1.72], [1.66, 1.73], [1.68, 1.74], [1.7, 1.76], [1.72, 1.79], [1.75, 1.8], [1.77, 1.82], [1.8, 1.85], [1.83, 1.87], [1.89, 1.93], [1.96, 1.99], [2.03, 2.05], [2.1, 2.11], [2.17, 2.17], [2.24, 2.24], [2.31, 2.3], [2.38, 2.36], [2.45, 2.43], [2.53, 2.5], [2.6, 2.57], [2.68, 2.64], [2.76, 2.71], [2.84, 2.78], [2.92, 2.85]], [[2.91, 2.83], [2.84, 2.77], [2.77, 2.71], [2.7, 2.65], [2.63, 2.59], [2.56, 2.53], [2.49, 2.47], [2.43, 2.41], [2.36, 2.35], [2.29, 2.29], [2.22, 2.23], [2.16, 2.18], [2.11, 2.14], [2.05, 2.09], [2.0, 2.04], [1.94, 1.99], [1.88, 1.94], [1.83, 1.89], [1.79, 1.85], [1.76, 1.83], [1.73, 1.81], [1.71, 1.79], [1.69, 1.77], [1.66, 1.74], [1.64, 1.73], [1.64, 1.72], [1.64, 1.72], [1.64, 1.73], [1.66, 1.74], [1.68, 1.77], [1.71, 1.79], [1.73, 1.8], [1.76, 1.82], [1.78, 1.85], [1.81, 1.87], [1.87, 1.93], [1.94, 1.98], [2.0, 2.04], [2.07, 2.1], [2.14, 2.17], [2.21, 2.23], [2.28, 2.29], [2.35, 2.36], [2.42, 2.42], [2.5, 2.49], [2.57, 2.56], [2.65, 2.63], [2.73, 2.7], [2.81, 2.77], [2.88, 2.84]], [[2.93, 2.75], [2.86, 2.69], [2.79, 2.63], [2.72, 2.57], [2.65, 2.51], [2.58, 2.46], [2.52, 2.4], [2.45, 2.34], [2.38, 2.28], [2.31, 2.23], [2.24, 2.17], [2.19, 2.12], [2.13, 2.08], [2.08, 2.03], [2.02, 1.98], [1.96, 1.94], [1.91, 1.89], [1.86, 1.85], [1.81, 1.81], [1.79, 1.79], [1.76, 1.77], [1.74, 1.74], [1.71, 1.72], [1.69, 1.7], [1.67, 1.69], [1.66, 1.68], [1.67, 1.68], [1.67, 1.69], [1.69, 1.7], [1.71, 1.72], [1.73, 1.74], [1.76, 1.76], [1.78, 1.78], [1.81, 1.8], [1.84, 1.82], [1.9, 1.87], [1.96, 1.93], [2.03, 1.98], [2.1, 2.04], [2.17, 2.1], [2.24, 2.17], [2.31, 2.23], [2.38, 2.29], [2.45, 2.35], [2.52, 2.41], [2.6, 2.48], [2.68, 2.55], [2.76, 2.61], [2.83, 2.68], [2.91, 2.75]], [[2.94, 2.8], [2.87, 2.74], [2.8, 2.68], [2.73, 2.62], [2.66, 2.57], [2.59, 2.51], [2.53, 2.45], [2.46, 2.39], [2.39, 2.33], [2.32, 2.27], [2.25, 2.22], [2.2, 2.17], [2.14, 2.12], [2.08, 2.08], [2.03, 2.03], [1.97, 1.98], [1.91, 1.93], [1.86, 1.89], [1.82, 1.85], [1.79, 1.82], [1.76, 1.8], [1.74, 1.78], [1.72, 1.76], [1.69, 1.74], [1.67, 1.72], [1.66, 1.71], [1.66, 1.71], [1.67, 1.72], [1.68, 1.73], [1.7, 1.75], [1.73, 1.77], [1.75, 1.78], [1.77, 1.8], [1.79, 1.82], [1.82, 1.84], [1.88, 1.89], [1.94, 1.94], [2.01, 2.0], [2.07, 2.06], [2.14, 2.12], [2.21, 2.18], [2.28, 2.24], [2.35, 2.3], [2.42, 2.36], [2.49, 2.42], [2.56, 2.49], [2.64, 2.55], [2.72, 2.62], [2.79, 2.69], [2.87, 2.75]], [[2.86, 2.76], [2.79, 2.7], [2.73, 2.64], [2.66, 2.59], [2.6, 2.53], [2.53, 2.48], [2.46, 2.42], [2.4, 2.36], [2.33, 2.31], [2.27, 2.25], [2.2, 2.19], [2.15, 2.15], [2.09, 2.1], [2.04, 2.06], [1.98, 2.01], [1.93, 1.96], [1.88, 1.92], [1.82, 1.87], [1.78, 1.83], [1.76, 1.81], [1.73, 1.79], [1.71, 1.77], [1.68, 1.75], [1.66, 1.73], [1.64, 1.71], [1.63, 1.7], [1.63, 1.7], [1.63, 1.71], [1.65, 1.72], [1.67, 1.74], [1.69, 1.75], [1.71, 1.77], [1.73, 1.78], [1.75, 1.8], [1.78, 1.82], [1.84, 1.87], [1.9, 1.92], [1.96, 1.97], [2.02, 2.03], [2.09, 2.09], [2.15, 2.14], [2.22, 2.2], [2.29, 2.26], [2.35, 2.32], [2.42, 2.38], [2.49, 2.44], [2.57, 2.51], [2.64, 2.57], [2.71, 2.64], [2.79, 2.7]], [[2.88, 2.75], [2.81, 2.69], [2.75, 2.63], [2.68, 2.58], [2.62, 2.52], [2.55, 2.47], [2.48, 2.41], [2.42, 2.36], [2.35, 2.3], [2.29, 2.25], [2.22, 2.19], [2.17, 2.15], [2.12, 2.1], [2.06, 2.06], [2.01, 2.01], [1.95, 1.97], [1.9, 1.92], [1.85, 1.88], [1.81, 1.84], [1.78, 1.82], [1.75, 1.8], [1.73, 1.78], [1.71, 1.76], [1.68, 1.73], [1.66, 1.72], [1.66, 1.71], [1.66, 1.71], [1.66, 1.71], [1.67, 1.73], [1.7, 1.75], [1.72, 1.76], [1.74, 1.77], [1.76, 1.79], [1.78, 1.81], [1.81, 1.82], [1.86, 1.87], [1.92, 1.92], [1.98, 1.97], [2.05, 2.03], [2.12, 2.09], [2.18, 2.15], [2.25, 2.2], [2.32, 2.26], [2.38, 2.32], [2.45, 2.38], [2.53, 2.44], [2.6, 2.51], [2.67, 2.57], [2.75, 2.64], [2.82, 2.7]], [[2.89, 2.73], [2.82, 2.68], [2.76, 2.62], [2.69, 2.57], [2.63, 2.51], [2.56, 2.46], [2.5, 2.41], [2.43, 2.35], [2.37, 2.3], [2.3, 2.24], [2.24, 2.19], [2.19, 2.15], [2.14, 2.1], [2.08, 2.06], [2.03, 2.02], [1.98, 1.97], [1.92, 1.93], [1.87, 1.89], [1.83, 1.85], [1.81, 1.83], [1.78, 1.81], [1.76, 1.79], [1.74, 1.77], [1.71, 1.75], [1.69, 1.73], [1.69, 1.73], [1.69, 1.73], [1.69, 1.73], [1.71, 1.75], [1.73, 1.77], [1.75, 1.79], [1.78, 1.8], [1.8, 1.81], [1.82, 1.83], [1.85, 1.85], [1.91, 1.9], [1.97, 1.95], [2.03, 2.0], [2.1, 2.06], [2.17, 2.12], [2.24, 2.18], [2.3, 2.24], [2.37, 2.29], [2.44, 2.35], [2.51, 2.41], [2.59, 2.48], [2.66, 2.54], [2.74, 2.61], [2.81, 2.67], [2.89, 2.74]], [[2.84, 2.72], [2.77, 2.67], [2.71, 2.61], [2.65, 2.56], [2.58, 2.51], [2.52, 2.45], [2.46, 2.4], [2.4, 2.35], [2.33, 2.3], [2.27, 2.24], [2.21, 2.19], [2.16, 2.15], [2.11, 2.11], [2.06, 2.07], [2.0, 2.02], [1.95, 1.98], [1.9, 1.93], [1.85, 1.89], [1.81, 1.86], [1.79, 1.84], [1.76, 1.82], [1.74, 1.8], [1.72, 1.78], [1.7, 1.76], [1.68, 1.74], [1.67, 1.74], [1.68, 1.74], [1.68, 1.75], [1.7, 1.76], [1.72, 1.78], [1.74, 1.8], [1.76, 1.81], [1.79, 1.83], [1.81, 1.85], [1.84, 1.86], [1.89, 1.91], [1.95, 1.96], [2.02, 2.01], [2.08, 2.07], [2.15, 2.13], [2.22, 2.19], [2.29, 2.25], [2.35, 2.31], [2.42, 2.36], [2.49, 2.42], [2.56, 2.49], [2.64, 2.55], [2.71, 2.62], [2.79, 2.68], [2.86, 2.75]], [[2.87, 2.66], [2.8, 2.6], [2.74, 2.55], [2.67, 2.5], [2.61, 2.44], [2.55, 2.4], [2.49, 2.35], [2.42, 2.29], [2.36, 2.24], [2.3, 2.19], [2.24, 2.14], [2.19, 2.1], [2.14, 2.07], [2.09, 2.03], [2.04, 1.98], [1.98, 1.94], [1.93, 1.9], [1.88, 1.86], [1.84, 1.83], [1.82, 1.81], [1.8, 1.79], [1.78, 1.77], [1.75, 1.75], [1.73, 1.73], [1.71, 1.72], [1.71, 1.71], [1.71, 1.72], [1.71, 1.72], [1.73, 1.73], [1.75, 1.75], [1.77, 1.77], [1.8, 1.78], [1.82, 1.79], [1.84, 1.81], [1.87, 1.83], [1.92, 1.87], [1.99, 1.92], [2.05, 1.97], [2.11, 2.02], [2.18, 2.08], [2.25, 2.14], [2.32, 2.19], [2.39, 2.25], [2.45, 2.31], [2.52, 2.36], [2.6, 2.42], [2.67, 2.49], [2.75, 2.55], [2.82, 2.61], [2.9, 2.67]], [[2.86, 2.75], [2.8, 2.7], [2.73, 2.64], [2.67, 2.59], [2.61, 2.54], [2.55, 2.49], [2.49, 2.44], [2.43, 2.38], [2.36, 2.33], [2.3, 2.28], [2.24, 2.23], [2.19, 2.19], [2.14, 2.15], [2.09, 2.11], [2.04, 2.07], [1.99, 2.02], [1.94, 1.98], [1.89, 1.94], [1.85, 1.91], [1.83, 1.89], [1.81, 1.87], [1.79, 1.85], [1.76, 1.83], [1.74, 1.81], [1.72, 1.8], [1.72, 1.79], [1.72, 1.8], [1.73, 1.8], [1.74, 1.82], [1.77, 1.84], [1.79, 1.85], [1.81, 1.86], [1.83, 1.88], [1.86, 1.89], [1.88, 1.91], [1.94, 1.95], [2.0, 2.01], [2.06, 2.06], [2.13, 2.11], [2.19, 2.17], [2.26, 2.23], [2.33, 2.29], [2.4, 2.35], [2.47, 2.4], [2.53, 2.46], [2.61, 2.53], [2.68, 2.59], [2.76, 2.66], [2.83, 2.72], [2.91, 2.79]], [[2.79, 2.68], [2.73, 2.63], [2.67, 2.58], [2.6, 2.52], [2.55, 2.47], [2.49, 2.43], [2.43, 2.38], [2.37, 2.33], [2.31, 2.28], [2.25, 2.23], [2.19, 2.18], [2.14, 2.14], [2.09, 2.1], [2.05, 2.06], [2.0, 2.02], [1.95, 1.98], [1.9, 1.94], [1.85, 1.9], [1.82, 1.87], [1.79, 1.86], [1.77, 1.84], [1.75, 1.82], [1.73, 1.8], [1.71, 1.78], [1.69, 1.76], [1.68, 1.76], [1.69, 1.76], [1.69, 1.77], [1.71, 1.78], [1.73, 1.8], [1.75, 1.81], [1.77, 1.82], [1.79, 1.84], [1.82, 1.85], [1.84, 1.87], [1.89, 1.91], [1.95, 1.96], [2.01, 2.01], [2.08, 2.06], [2.14, 2.12], [2.21, 2.17], [2.28, 2.23], [2.34, 2.29], [2.41, 2.34], [2.48, 2.4], [2.55, 2.46], [2.62, 2.52], [2.69, 2.58], [2.77, 2.65], [2.84, 2.71]], [[2.8, 2.64], [2.73, 2.59], [2.67, 2.54], [2.61, 2.49], [2.55, 2.44], [2.49, 2.39], [2.44, 2.35], [2.38, 2.3], [2.32, 2.25], [2.26, 2.2], [2.2, 2.15], [2.15, 2.12], [2.1, 2.08], [2.06, 2.04], [2.01, 2.0], [1.96, 1.96], [1.91, 1.92], [1.86, 1.88], [1.82, 1.85], [1.8, 1.83], [1.78, 1.82], [1.76, 1.8], [1.74, 1.78], [1.71, 1.76], [1.7, 1.74], [1.69, 1.74], [1.69, 1.74], [1.7, 1.75], [1.71, 1.76], [1.74, 1.78], [1.75, 1.79], [1.77, 1.8], [1.8, 1.81], [1.82, 1.82], [1.84, 1.83], [1.89, 1.88], [1.95, 1.92], [2.01, 1.97], [2.08, 2.02], [2.14, 2.08], [2.21, 2.13], [2.27, 2.19], [2.34, 2.24], [2.4, 2.29], [2.47, 2.35], [2.54, 2.41], [2.61, 2.47], [2.69, 2.53], [2.76, 2.59], [2.83, 2.65]], [[2.8, 2.65], [2.74, 2.6], [2.68, 2.55], [2.62, 2.49], [2.56, 2.45], [2.5, 2.4], [2.44, 2.35], [2.38, 2.31], [2.32, 2.26], [2.26, 2.21], [2.21, 2.16], [2.16, 2.13], [2.11, 2.09], [2.06, 2.05], [2.02, 2.01], [1.97, 1.97], [1.92, 1.93], [1.87, 1.9], [1.83, 1.87], [1.81, 1.85], [1.79, 1.83], [1.77, 1.81], [1.74, 1.79], [1.72, 1.77], [1.7, 1.76], [1.7, 1.75], [1.7, 1.75], [1.71, 1.76], [1.72, 1.77], [1.74, 1.79], [1.76, 1.8], [1.78, 1.81], [1.8, 1.82], [1.82, 1.83], [1.85, 1.84], [1.9, 1.88], [1.95, 1.93], [2.01, 1.97], [2.08, 2.03], [2.14, 2.08], [2.21, 2.13], [2.27, 2.19], [2.34, 2.24], [2.4, 2.29], [2.47, 2.35], [2.54, 2.4], [2.61, 2.46], [2.68, 2.52], [2.75, 2.58], [2.83, 2.65]], [[2.74, 2.65], [2.68, 2.6], [2.63, 2.55], [2.57, 2.5], [2.51, 2.46], [2.45, 2.41], [2.4, 2.36], [2.34, 2.32], [2.28, 2.27], [2.22, 2.22], [2.17, 2.18], [2.12, 2.14], [2.08, 2.1], [2.03, 2.07], [1.99, 2.03], [1.94, 1.99], [1.89, 1.95], [1.85, 1.91], [1.81, 1.88], [1.79, 1.87], [1.77, 1.85], [1.75, 1.83], [1.72, 1.81], [1.7, 1.79], [1.68, 1.78], [1.68, 1.77], [1.68, 1.78], [1.69, 1.78], [1.7, 1.79], [1.72, 1.81], [1.74, 1.82], [1.76, 1.83], [1.78, 1.84], [1.8, 1.85], [1.83, 1.86], [1.88, 1.9], [1.93, 1.95], [1.99, 1.99], [2.05, 2.05], [2.12, 2.1], [2.18, 2.15], [2.25, 2.21], [2.31, 2.26], [2.37, 2.31], [2.44, 2.37], [2.51, 2.42], [2.58, 2.48], [2.65, 2.54], [2.72, 2.6], [2.79, 2.67]], [[2.73, 2.6], [2.67, 2.55], [2.61, 2.5], [2.56, 2.46], [2.5, 2.41], [2.44, 2.37], [2.39, 2.32], [2.33, 2.28], [2.28, 2.23], [2.22, 2.19], [2.17, 2.15], [2.12, 2.11], [2.08, 2.08], [2.03, 2.04], [1.99, 2.01], [1.94, 1.97], [1.89, 1.93], [1.85, 1.89], [1.81, 1.86], [1.79, 1.85], [1.77, 1.83], [1.75, 1.81], [1.73, 1.79], [1.71, 1.77], [1.69, 1.76], [1.69, 1.75], [1.69, 1.76], [1.69, 1.76], [1.71, 1.77], [1.73, 1.79], [1.75, 1.79], [1.76, 1.8], [1.78, 1.81], [1.81, 1.82], [1.83, 1.83], [1.88, 1.87], [1.93, 1.91], [1.99, 1.96], [2.05, 2.01], [2.11, 2.06], [2.18, 2.11], [2.24, 2.16], [2.3, 2.21], [2.37, 2.27], [2.43, 2.32], [2.5, 2.37], [2.57, 2.43], [2.64, 2.49], [2.71, 2.55], [2.78, 2.6]], [[2.73, 2.66], [2.68, 2.61], [2.62, 2.56], [2.56, 2.51], [2.51, 2.47], [2.45, 2.42], [2.4, 2.38], [2.34, 2.33], [2.29, 2.29], [2.23, 2.24], [2.18, 2.2], [2.13, 2.16], [2.09, 2.13], [2.04, 2.09], [2.0, 2.06], [1.95, 2.02], [1.9, 1.98], [1.86, 1.94], [1.82, 1.91], [1.8, 1.9], [1.78, 1.88], [1.76, 1.86], [1.74, 1.84], [1.72, 1.82], [1.7, 1.8], [1.7, 1.8], [1.7, 1.8], [1.7, 1.81], [1.72, 1.82], [1.74, 1.83], [1.75, 1.84], [1.77, 1.85], [1.79, 1.86], [1.81, 1.87], [1.83, 1.88], [1.88, 1.91], [1.94, 1.96], [2.0, 2.0], [2.06, 2.05], [2.12, 2.1], [2.18, 2.16], [2.25, 2.21], [2.31, 2.26], [2.37, 2.31], [2.44, 2.37], [2.5, 2.42], [2.57, 2.48], [2.64, 2.54], [2.71, 2.6], [2.78, 2.66]], [[2.76, 2.57], [2.7, 2.53], [2.65, 2.48], [2.59, 2.44], [2.53, 2.39], [2.48, 2.35], [2.43, 2.31], [2.37, 2.27], [2.32, 2.22], [2.26, 2.18], [2.21, 2.14], [2.16, 2.11], [2.12, 2.07], [2.08, 2.04], [2.03, 2.01], [1.98, 1.97], [1.94, 1.93], [1.89, 1.9], [1.86, 1.87], [1.84, 1.86], [1.82, 1.84], [1.8, 1.82], [1.77, 1.8], [1.75, 1.78], [1.74, 1.77], [1.73, 1.76], [1.73, 1.77], [1.74, 1.77], [1.75, 1.78], [1.77, 1.79], [1.79, 1.8], [1.81, 1.81], [1.83, 1.82], [1.85, 1.82], [1.87, 1.83], [1.92, 1.87], [1.98, 1.91], [2.04, 1.95], [2.1, 2.0], [2.16, 2.05], [2.23, 2.1], [2.29, 2.15], [2.35, 2.2], [2.42, 2.25], [2.48, 2.3], [2.55, 2.35], [2.62, 2.41], [2.69, 2.47], [2.76, 2.52], [2.83, 2.58]], [[2.77, 2.57], [2.71, 2.52], [2.66, 2.48], [2.6, 2.43], [2.54, 2.39], [2.49, 2.35], [2.44, 2.31], [2.38, 2.27], [2.33, 2.22], [2.27, 2.18], [2.22, 2.14], [2.18, 2.11], [2.13, 2.08], [2.09, 2.04], [2.04, 2.01], [2.0, 1.97], [1.95, 1.94], [1.91, 1.9], [1.87, 1.88], [1.85, 1.86], [1.83, 1.85], [1.81, 1.83], [1.79, 1.81], [1.77, 1.79], [1.75, 1.77], [1.74, 1.77], [1.75, 1.77], [1.75, 1.78], [1.77, 1.79], [1.79, 1.8], [1.8, 1.8], [1.82, 1.81], [1.84, 1.82], [1.86, 1.82], [1.88, 1.83], [1.93, 1.86], [1.99, 1.91], [2.04, 1.95], [2.1, 1.99], [2.17, 2.04], [2.23, 2.09], [2.3, 2.14], [2.36, 2.19], [2.43, 2.24], [2.49, 2.29], [2.55, 2.34], [2.63, 2.4], [2.7, 2.45], [2.77, 2.51], [2.84, 2.57]], [[2.73, 2.53], [2.67, 2.49], [2.62, 2.44], [2.56, 2.4], [2.51, 2.36], [2.46, 2.32], [2.4, 2.28], [2.35, 2.24], [2.3, 2.2], [2.24, 2.16], [2.2, 2.12], [2.15, 2.09], [2.11, 2.06], [2.07, 2.03], [2.02, 2.0], [1.98, 1.96], [1.93, 1.93], [1.89, 1.89], [1.86, 1.87], [1.84, 1.85], [1.82, 1.84], [1.8, 1.82], [1.78, 1.8], [1.76, 1.78], [1.74, 1.77], [1.74, 1.77], [1.74, 1.77], [1.74, 1.77], [1.76, 1.78], [1.78, 1.79], [1.79, 1.79], [1.81, 1.8], [1.83, 1.81], [1.85, 1.81], [1.87, 1.82], [1.92, 1.85], [1.97, 1.89], [2.03, 1.93], [2.09, 1.97], [2.15, 2.02], [2.21, 2.07], [2.28, 2.12], [2.34, 2.17], [2.4, 2.21], [2.47, 2.26], [2.53, 2.31], [2.6, 2.36], [2.67, 2.42], [2.74, 2.47], [2.81, 2.53]], [[2.71, 2.5], [2.65, 2.46], [2.6, 2.42], [2.55, 2.38], [2.5, 2.34], [2.45, 2.3], [2.4, 2.26], [2.35, 2.22], [2.29, 2.19], [2.24, 2.15], [2.2, 2.11], [2.15, 2.08], [2.11, 2.06], [2.07, 2.03], [2.03, 2.0], [1.99, 1.96], [1.94, 1.93], [1.9, 1.9], [1.87, 1.88], [1.86, 1.86], [1.84, 1.85], [1.82, 1.83], [1.8, 1.82], [1.78, 1.8], [1.76, 1.78], [1.76, 1.78], [1.76, 1.79], [1.77, 1.79], [1.79, 1.8], [1.8, 1.81], [1.82, 1.81], [1.84, 1.82], [1.86, 1.83], [1.88, 1.83], [1.9, 1.84], [1.95, 1.87], [2.01, 1.91], [2.06, 1.95], [2.12, 1.99], [2.19, 2.04], [2.25, 2.09], [2.32, 2.14], [2.38, 2.19], [2.45, 2.23], [2.51, 2.28], [2.57, 2.33], [2.64, 2.38], [2.72, 2.44], [2.79, 2.49], [2.86, 2.55]], [[2.61, 2.51], [2.56, 2.47], [2.51, 2.43], [2.46, 2.39], [2.41, 2.35], [2.36, 2.31], [2.31, 2.28], [2.27, 2.24], [2.22, 2.2], [2.17, 2.17], [2.13, 2.13], [2.09, 2.11], [2.05, 2.08], [2.01, 2.05], [1.97, 2.02], [1.93, 1.99], [1.89, 1.96], [1.85, 1.92], [1.82, 1.9], [1.8, 1.89], [1.79, 1.88], [1.77, 1.86], [1.75, 1.84], [1.73, 1.83], [1.71, 1.81], [1.71, 1.81], [1.72, 1.81], [1.72, 1.82], [1.74, 1.83], [1.76, 1.83], [1.77, 1.84], [1.79, 1.84], [1.81, 1.85], [1.83, 1.85], [1.85, 1.86], [1.89, 1.88], [1.95, 1.92], [2.0, 1.97], [2.06, 2.01], [2.12, 2.06], [2.18, 2.1], [2.25, 2.15], [2.31, 2.2], [2.37, 2.25], [2.43, 2.29], [2.49, 2.34], [2.56, 2.39], [2.63, 2.45], [2.7, 2.5], [2.77, 2.56]], [[2.57, 2.43], [2.52, 2.39], [2.48, 2.35], [2.43, 2.32], [2.38, 2.28], [2.33, 2.24], [2.29, 2.21], [2.24, 2.18], [2.2, 2.14], [2.15, 2.11], [2.11, 2.08], [2.07, 2.05], [2.03, 2.03], [2.0, 2.0], [1.96, 1.97], [1.92, 1.94], [1.88, 1.91], [1.84, 1.88], [1.81, 1.86], [1.8, 1.85], [1.78, 1.84], [1.76, 1.82], [1.74, 1.81], [1.73, 1.79], [1.71, 1.78], [1.71, 1.77], [1.71, 1.78], [1.72, 1.78], [1.74, 1.79], [1.75, 1.8], [1.77, 1.8], [1.79, 1.8], [1.81, 1.81], [1.83, 1.81], [1.85, 1.81], [1.89, 1.84], [1.95, 1.88], [2.0, 1.91], [2.06, 1.95], [2.12, 2.0], [2.18, 2.05], [2.24, 2.09], [2.3, 2.14], [2.37, 2.18], [2.43, 2.23], [2.49, 2.27], [2.56, 2.32], [2.62, 2.37], [2.69, 2.43], [2.76, 2.48]], [[2.53, 2.42], [2.48, 2.39], [2.43, 2.35], [2.39, 2.31], [2.34, 2.28], [2.3, 2.24], [2.25, 2.21], [2.21, 2.18], [2.17, 2.15], [2.12, 2.11], [2.08, 2.09], [2.05, 2.06], [2.01, 2.04], [1.97, 2.01], [1.94, 1.99], [1.9, 1.96], [1.86, 1.93], [1.83, 1.9], [1.8, 1.88], [1.79, 1.87], [1.77, 1.86], [1.75, 1.84], [1.74, 1.83], [1.72, 1.81], [1.7, 1.8], [1.7, 1.8], [1.71, 1.8], [1.72, 1.81], [1.73, 1.82], [1.75, 1.82], [1.77, 1.83], [1.79, 1.83], [1.81, 1.83], [1.83, 1.84], [1.85, 1.84], [1.89, 1.86], [1.95, 1.9], [2.0, 1.94], [2.06, 1.98], [2.12, 2.03], [2.18, 2.07], [2.25, 2.12], [2.31, 2.17], [2.37, 2.21], [2.43, 2.26], [2.49, 2.3], [2.56, 2.35], [2.63, 2.41], [2.7, 2.46], [2.76, 2.51]], [[2.55, 2.45], [2.5, 2.41], [2.46, 2.37], [2.41, 2.34], [2.36, 2.3], [2.32, 2.27], [2.27, 2.23], [2.23, 2.2], [2.18, 2.17], [2.14, 2.13], [2.1, 2.1], [2.06, 2.08], [2.02, 2.05], [1.99, 2.03], [1.95, 2.0], [1.91, 1.98], [1.87, 1.95], [1.84, 1.92], [1.81, 1.9], [1.8, 1.89], [1.78, 1.88], [1.77, 1.86], [1.75, 1.85], [1.73, 1.83], [1.72, 1.82], [1.72, 1.82], [1.73, 1.83], [1.74, 1.83], [1.76, 1.85], [1.78, 1.85], [1.8, 1.86], [1.82, 1.86], [1.85, 1.87], [1.87, 1.87], [1.89, 1.88], [1.93, 1.9], [1.99, 1.95], [2.05, 1.99], [2.11, 2.03], [2.17, 2.08], [2.24, 2.13], [2.3, 2.17], [2.37, 2.22], [2.43, 2.27], [2.5, 2.32], [2.56, 2.37], [2.63, 2.42], [2.7, 2.47], [2.77, 2.53], [2.84, 2.58]], [[2.55, 2.41], [2.5, 2.38], [2.46, 2.34], [2.41, 2.31], [2.36, 2.27], [2.32, 2.24], [2.27, 2.21], [2.23, 2.17], [2.18, 2.14], [2.14, 2.11], [2.1, 2.08], [2.06, 2.06], [2.03, 2.03], [1.99, 2.01], [1.96, 1.98], [1.92, 1.96], [1.88, 1.93], [1.84, 1.9], [1.82, 1.88], [1.8, 1.87], [1.79, 1.86], [1.77, 1.84], [1.75, 1.83], [1.74, 1.81], [1.72, 1.8], [1.72, 1.8], [1.73, 1.81], [1.74, 1.81], [1.76, 1.82], [1.78, 1.82], [1.8, 1.83], [1.82, 1.83], [1.84, 1.84], [1.86, 1.84], [1.88, 1.84], [1.92, 1.86], [1.98, 1.9], [2.04, 1.94], [2.1, 1.98], [2.16, 2.03], [2.22, 2.07], [2.29, 2.12], [2.35, 2.16], [2.41, 2.21], [2.48, 2.25], [2.54, 2.3], [2.61, 2.35], [2.68, 2.4], [2.75, 2.45], [2.82, 2.51]], [[2.58, 2.44], [2.53, 2.4], [2.48, 2.37], [2.44, 2.33], [2.39, 2.29], [2.35, 2.26], [2.3, 2.23], [2.26, 2.2], [2.21, 2.17], [2.16, 2.13], [2.13, 2.1], [2.09, 2.08], [2.05, 2.06], [2.02, 2.03], [1.98, 2.01], [1.94, 1.98], [1.9, 1.95], [1.87, 1.92], [1.84, 1.9], [1.83, 1.89], [1.81, 1.88], [1.79, 1.87], [1.77, 1.85], [1.76, 1.83], [1.74, 1.82], [1.74, 1.82], [1.75, 1.82], [1.76, 1.83], [1.77, 1.83], [1.79, 1.84], [1.81, 1.84], [1.83, 1.84], [1.86, 1.84], [1.88, 1.84], [1.9, 1.84], [1.94, 1.87], [1.99, 1.9], [2.05, 1.94], [2.11, 1.98], [2.17, 2.02], [2.23, 2.07], [2.3, 2.11], [2.36, 2.16], [2.42, 2.2], [2.49, 2.25], [2.55, 2.29], [2.62, 2.34], [2.69, 2.39], [2.76, 2.44], [2.83, 2.49]], [[2.59, 2.43], [2.54, 2.4], [2.5, 2.36], [2.45, 2.33], [2.4, 2.29], [2.36, 2.26], [2.31, 2.23], [2.27, 2.2], [2.23, 2.17], [2.18, 2.13], [2.14, 2.11], [2.1, 2.08], [2.07, 2.06], [2.03, 2.04], [2.0, 2.01], [1.96, 1.99], [1.92, 1.96], [1.88, 1.93], [1.86, 1.91], [1.85, 1.9], [1.83, 1.89], [1.81, 1.87], [1.79, 1.86], [1.78, 1.84], [1.76, 1.83], [1.76, 1.83], [1.77, 1.83], [1.78, 1.84], [1.79, 1.84], [1.81, 1.84], [1.83, 1.84], [1.85, 1.84], [1.87, 1.84], [1.89, 1.84], [1.91, 1.84], [1.95, 1.86], [2.01, 1.9], [2.07, 1.93], [2.12, 1.97], [2.19, 2.02], [2.25, 2.06], [2.31, 2.1], [2.38, 2.15], [2.44, 2.19], [2.5, 2.23], [2.57, 2.28], [2.63, 2.32], [2.7, 2.37], [2.77, 2.42], [2.84, 2.48]], [[2.53, 2.47], [2.49, 2.44], [2.44, 2.4], [2.4, 2.37], [2.35, 2.33], [2.31, 2.3], [2.27, 2.27], [2.22, 2.24], [2.18, 2.21], [2.14, 2.18], [2.1, 2.15], [2.07, 2.13], [2.03, 2.11], [2.0, 2.08], [1.96, 2.06], [1.92, 2.03], [1.89, 2.0], [1.85, 1.97], [1.83, 1.96], [1.81, 1.95], [1.8, 1.93], [1.78, 1.92], [1.76, 1.9], [1.75, 1.89], [1.73, 1.87], [1.73, 1.87], [1.74, 1.87], [1.75, 1.88], [1.76, 1.88], [1.78, 1.88], [1.8, 1.88], [1.82, 1.88], [1.84, 1.88], [1.86, 1.88], [1.88, 1.88], [1.92, 1.9], [1.97, 1.94], [2.03, 1.97], [2.08, 2.01], [2.14, 2.05], [2.21, 2.1], [2.27, 2.14], [2.33, 2.18], [2.39, 2.23], [2.45, 2.27], [2.51, 2.31], [2.58, 2.36], [2.65, 2.41], [2.72, 2.46], [2.79, 2.51]], [[2.53, 2.41], [2.49, 2.38], [2.44, 2.34], [2.4, 2.31], [2.35, 2.28], [2.31, 2.25], [2.27, 2.22], [2.23, 2.19], [2.19, 2.16], [2.14, 2.13], [2.11, 2.11], [2.08, 2.09], [2.04, 2.07], [2.01, 2.04], [1.97, 2.02], [1.94, 2.0], [1.9, 1.97], [1.87, 1.95], [1.84, 1.93], [1.83, 1.92], [1.82, 1.91], [1.8, 1.89], [1.78, 1.88], [1.76, 1.86], [1.75, 1.85], [1.75, 1.85], [1.76, 1.85], [1.77, 1.86], [1.78, 1.86], [1.8, 1.85], [1.82, 1.85], [1.84, 1.85], [1.86, 1.85], [1.88, 1.85], [1.9, 1.84], [1.94, 1.86], [1.99, 1.89], [2.05, 1.93], [2.1, 1.96], [2.16, 2.0], [2.22, 2.05], [2.29, 2.09], [2.35, 2.13], [2.41, 2.17], [2.47, 2.21], [2.53, 2.25], [2.6, 2.3], [2.67, 2.35], [2.74, 2.4], [2.8, 2.44]], [[2.5, 2.39], [2.46, 2.36], [2.42, 2.32], [2.37, 2.29], [2.33, 2.26], [2.29, 2.24], [2.25, 2.21], [2.21, 2.18], [2.17, 2.16], [2.13, 2.13], [2.1, 2.11], [2.07, 2.09], [2.04, 2.07], [2.0, 2.05], [1.97, 2.03], [1.94, 2.0], [1.9, 1.98], [1.87, 1.95], [1.85, 1.94], [1.84, 1.93], [1.82, 1.92], [1.81, 1.91], [1.79, 1.89], [1.77, 1.88], [1.76, 1.86], [1.76, 1.86], [1.77, 1.87], [1.78, 1.87], [1.8, 1.87], [1.82, 1.87], [1.84, 1.87], [1.86, 1.87], [1.88, 1.87], [1.9, 1.87], [1.92, 1.86], [1.96, 1.88], [2.02, 1.91], [2.07, 1.95], [2.13, 1.98], [2.19, 2.03], [2.25, 2.07], [2.32, 2.11], [2.38, 2.15], [2.44, 2.19], [2.51, 2.24], [2.57, 2.28], [2.63, 2.32], [2.7, 2.37], [2.77, 2.42], [2.84, 2.47]], [[2.36, 2.29], [2.32, 2.26], [2.28, 2.23], [2.25, 2.2], [2.21, 2.17], [2.17, 2.15], [2.14, 2.13], [2.1, 2.1], [2.07, 2.08], [2.03, 2.06], [2.0, 2.04], [1.97, 2.02], [1.94, 2.01], [1.91, 1.99], [1.88, 1.97], [1.86, 1.95], [1.82, 1.93], [1.79, 1.91], [1.77, 1.9], [1.77, 1.89], [1.75, 1.88], [1.74, 1.87], [1.73, 1.86], [1.71, 1.84], [1.7, 1.83], [1.7, 1.83], [1.71, 1.84], [1.72, 1.84], [1.74, 1.84], [1.76, 1.84], [1.78, 1.84], [1.8, 1.84], [1.83, 1.84], [1.85, 1.83], [1.87, 1.83], [1.9, 1.84], [1.96, 1.87], [2.01, 1.91], [2.07, 1.94], [2.13, 1.98], [2.19, 2.02], [2.25, 2.06], [2.31, 2.1], [2.37, 2.14], [2.43, 2.18], [2.49, 2.22], [2.56, 2.26], [2.62, 2.31], [2.69, 2.36], [2.76, 2.4]], [[2.42, 2.29], [2.38, 2.26], [2.35, 2.24], [2.31, 2.21], [2.27, 2.18], [2.23, 2.16], [2.2, 2.14], [2.16, 2.11], [2.13, 2.09], [2.09, 2.07], [2.06, 2.05], [2.03, 2.04], [2.0, 2.02], [1.97, 2.0], [1.94, 1.99], [1.92, 1.97], [1.88, 1.95], [1.85, 1.92], [1.83, 1.91], [1.83, 1.91], [1.81, 1.9], [1.8, 1.89], [1.78, 1.87], [1.77, 1.86], [1.76, 1.85], [1.76, 1.85], [1.77, 1.85], [1.78, 1.86], [1.8, 1.85], [1.82, 1.85], [1.84, 1.85], [1.87, 1.85], [1.89, 1.84], [1.91, 1.84], [1.93, 1.83], [1.96, 1.84], [2.02, 1.88], [2.08, 1.91], [2.13, 1.94], [2.2, 1.98], [2.26, 2.02], [2.32, 2.06], [2.38, 2.1], [2.45, 2.14], [2.51, 2.18], [2.57, 2.22], [2.64, 2.25], [2.71, 2.3], [2.77, 2.35], [2.84, 2.39]], [[2.38, 2.31], [2.34, 2.29], [2.31, 2.26], [2.27, 2.23], [2.23, 2.21], [2.2, 2.19], [2.17, 2.17], [2.13, 2.14], [2.1, 2.12], [2.06, 2.1], [2.03, 2.08], [2.01, 2.07], [1.98, 2.05], [1.95, 2.04], [1.92, 2.02], [1.89, 2.0], [1.86, 1.98], [1.83, 1.96], [1.82, 1.95], [1.81, 1.94], [1.8, 1.93], [1.78, 1.92], [1.77, 1.91], [1.75, 1.89], [1.74, 1.88], [1.75, 1.88], [1.76, 1.89], [1.77, 1.89], [1.79, 1.88], [1.81, 1.88], [1.83, 1.88], [1.85, 1.88], [1.87, 1.87], [1.9, 1.87], [1.92, 1.86], [1.95, 1.87], [2.01, 1.9], [2.07, 1.94], [2.12, 1.97], [2.18, 2.01], [2.24, 2.05], [2.31, 2.09], [2.37, 2.13], [2.43, 2.17], [2.49, 2.21], [2.56, 2.25], [2.62, 2.28], [2.69, 2.33], [2.76, 2.38], [2.83, 2.42]], [[2.34, 2.23], [2.31, 2.2], [2.27, 2.18], [2.24, 2.16], [2.2, 2.13], [2.17, 2.11], [2.14, 2.09], [2.11, 2.07], [2.07, 2.06], [2.04, 2.04], [2.01, 2.02], [1.99, 2.01], [1.96, 2.0], [1.94, 1.99], [1.91, 1.97], [1.89, 1.96], [1.85, 1.94], [1.83, 1.92], [1.81, 1.91], [1.81, 1.91], [1.8, 1.9], [1.78, 1.89], [1.77, 1.87], [1.76, 1.86], [1.75, 1.85], [1.75, 1.85], [1.77, 1.86], [1.78, 1.86], [1.8, 1.85], [1.82, 1.85], [1.85, 1.85], [1.87, 1.85], [1.89, 1.84], [1.92, 1.83], [1.94, 1.83], [1.97, 1.84], [2.03, 1.87], [2.09, 1.9], [2.15, 1.93], [2.21, 1.97], [2.27, 2.01], [2.34, 2.05], [2.4, 2.08], [2.46, 2.12], [2.53, 2.16], [2.59, 2.2], [2.66, 2.24], [2.72, 2.28], [2.79, 2.33], [2.86, 2.37]], [[2.33, 2.28], [2.3, 2.26], [2.26, 2.23], [2.23, 2.21], [2.2, 2.19], [2.17, 2.17], [2.13, 2.15], [2.1, 2.13], [2.07, 2.11], [2.04, 2.09], [2.01, 2.08], [1.99, 2.07], [1.96, 2.06], [1.94, 2.04], [1.91, 2.03], [1.88, 2.01], [1.85, 1.99], [1.83, 1.97], [1.81, 1.96], [1.81, 1.96], [1.8, 1.95], [1.78, 1.94], [1.77, 1.92], [1.76, 1.91], [1.75, 1.9], [1.75, 1.9], [1.77, 1.91], [1.78, 1.91], [1.8, 1.9], [1.82, 1.9], [1.85, 1.89], [1.87, 1.89], [1.89, 1.88], [1.92, 1.88], [1.94, 1.87], [1.97, 1.88], [2.03, 1.91], [2.09, 1.94], [2.15, 1.97], [2.21, 2.01], [2.27, 2.05], [2.34, 2.09], [2.4, 2.13], [2.46, 2.16], [2.53, 2.2], [2.59, 2.24], [2.65, 2.28], [2.72, 2.32], [2.79, 2.37], [2.86, 2.42]], [[2.35, 2.29], [2.32, 2.27], [2.28, 2.24], [2.25, 2.22], [2.22, 2.2], [2.18, 2.18], [2.15, 2.17], [2.12, 2.15], [2.09, 2.13], [2.06, 2.11], [2.03, 2.1], [2.01, 2.08], [1.98, 2.07], [1.95, 2.06], [1.93, 2.04], [1.9, 2.03], [1.87, 2.01], [1.84, 1.99], [1.83, 1.98], [1.82, 1.97], [1.81, 1.97], [1.8, 1.95], [1.78, 1.94], [1.77, 1.92], [1.76, 1.91], [1.77, 1.91], [1.78, 1.92], [1.79, 1.91], [1.81, 1.9], [1.83, 1.9], [1.86, 1.89], [1.88, 1.88], [1.9, 1.87], [1.92, 1.86], [1.94, 1.86], [1.98, 1.86], [2.04, 1.89], [2.09, 1.92], [2.15, 1.95], [2.21, 1.98], [2.27, 2.02], [2.34, 2.06], [2.4, 2.09], [2.46, 2.13], [2.53, 2.17], [2.59, 2.2], [2.65, 2.24], [2.72, 2.28], [2.79, 2.32], [2.86, 2.37]], [[2.34, 2.26], [2.3, 2.24], [2.27, 2.21], [2.24, 2.19], [2.2, 2.17], [2.17, 2.16], [2.14, 2.14], [2.11, 2.12], [2.08, 2.11], [2.05, 2.09], [2.03, 2.08], [2.0, 2.07], [1.98, 2.06], [1.95, 2.04], [1.93, 2.03], [1.9, 2.01], [1.87, 1.99], [1.84, 1.98], [1.83, 1.97], [1.83, 1.96], [1.82, 1.96], [1.8, 1.94], [1.79, 1.93], [1.78, 1.92], [1.77, 1.91], [1.78, 1.91], [1.79, 1.91], [1.8, 1.9], [1.82, 1.89], [1.85, 1.89], [1.87, 1.88], [1.89, 1.87], [1.92, 1.86], [1.94, 1.85], [1.96, 1.84], [2.0, 1.85], [2.06, 1.88], [2.11, 1.9], [2.17, 1.93], [2.23, 1.97], [2.3, 2.0], [2.36, 2.04], [2.43, 2.07], [2.49, 2.11], [2.55, 2.15], [2.62, 2.18], [2.68, 2.22], [2.75, 2.26], [2.82, 2.3], [2.89, 2.34]], [[2.33, 2.25], [2.29, 2.23], [2.26, 2.21], [2.23, 2.19], [2.2, 2.17], [2.17, 2.16], [2.14, 2.14], [2.11, 2.12], [2.08, 2.11], [2.05, 2.09], [2.03, 2.08], [2.0, 2.07], [1.98, 2.06], [1.95, 2.05], [1.93, 2.03], [1.9, 2.02], [1.87, 2.0], [1.85, 1.98], [1.83, 1.97], [1.83, 1.97], [1.82, 1.96], [1.8, 1.95], [1.79, 1.93], [1.78, 1.92], [1.77, 1.91], [1.78, 1.91], [1.79, 1.91], [1.8, 1.9], [1.82, 1.89], [1.85, 1.88], [1.87, 1.87], [1.89, 1.86], [1.92, 1.85], [1.94, 1.84], [1.96, 1.82], [1.99, 1.82], [2.05, 1.85], [2.11, 1.88], [2.17, 1.9], [2.23, 1.93], [2.29, 1.97], [2.36, 2.0], [2.42, 2.04], [2.48, 2.07], [2.55, 2.1], [2.61, 2.14], [2.67, 2.17], [2.74, 2.21], [2.81, 2.25], [2.88, 2.29]], [[2.28, 2.27], [2.25, 2.25], [2.22, 2.23], [2.19, 2.21], [2.16, 2.2], [2.13, 2.18], [2.11, 2.17], [2.08, 2.15], [2.05, 2.13], [2.02, 2.12], [2.0, 2.11], [1.98, 2.1], [1.95, 2.09], [1.93, 2.08], [1.91, 2.07], [1.88, 2.05], [1.86, 2.04], [1.83, 2.02], [1.82, 2.01], [1.81, 2.01], [1.8, 2.0], [1.79, 1.99], [1.78, 1.97], [1.77, 1.96], [1.76, 1.95], [1.77, 1.95], [1.78, 1.95], [1.79, 1.93], [1.81, 1.92], [1.84, 1.91], [1.86, 1.9], [1.89, 1.9], [1.91, 1.88], [1.93, 1.87], [1.96, 1.86], [1.99, 1.85], [2.05, 1.88], [2.11, 1.91], [2.16, 1.93], [2.22, 1.96], [2.29, 2.0], [2.35, 2.03], [2.41, 2.06], [2.48, 2.1], [2.54, 2.13], [2.6, 2.16], [2.67, 2.2], [2.73, 2.23], [2.8, 2.28], [2.87, 2.32]], [[2.28, 2.2], [2.25, 2.18], [2.22, 2.17], [2.19, 2.15], [2.16, 2.13], [2.13, 2.12], [2.1, 2.11], [2.07, 2.09], [2.05, 2.08], [2.02, 2.07], [2.0, 2.06], [1.98, 2.05], [1.96, 2.04], [1.93, 2.03], [1.91, 2.02], [1.89, 2.01], [1.86, 1.99], [1.83, 1.98], [1.82, 1.97], [1.82, 1.96], [1.81, 1.96], [1.8, 1.94], [1.78, 1.93], [1.77, 1.91], [1.76, 1.9], [1.77, 1.9], [1.78, 1.89], [1.79, 1.87], [1.81, 1.86], [1.84, 1.85], [1.86, 1.83], [1.88, 1.82], [1.9, 1.8], [1.93, 1.79], [1.95, 1.77], [1.98, 1.76], [2.03, 1.78], [2.09, 1.81], [2.15, 1.83], [2.21, 1.85], [2.27, 1.88], [2.33, 1.91], [2.39, 1.94], [2.45, 1.97], [2.52, 2.0], [2.58, 2.03], [2.64, 2.06], [2.71, 2.09], [2.77, 2.13], [2.84, 2.16]], [[2.28, 2.26], [2.25, 2.24], [2.22, 2.22], [2.19, 2.21], [2.16, 2.19], [2.14, 2.18], [2.11, 2.17], [2.08, 2.15], [2.06, 2.14], [2.03, 2.13], [2.01, 2.12], [1.99, 2.12], [1.97, 2.11], [1.95, 2.1], [1.92, 2.09], [1.9, 2.08], [1.87, 2.06], [1.85, 2.04], [1.84, 2.03], [1.83, 2.03], [1.83, 2.02], [1.81, 2.01], [1.8, 1.99], [1.79, 1.98], [1.78, 1.97], [1.79, 1.97], [1.8, 1.96], [1.81, 1.94], [1.83, 1.92], [1.86, 1.91], [1.88, 1.9], [1.91, 1.88], [1.93, 1.86], [1.95, 1.85], [1.97, 1.83], [2.0, 1.82], [2.06, 1.84], [2.12, 1.86], [2.17, 1.89], [2.23, 1.91], [2.3, 1.94], [2.36, 1.97], [2.42, 2.0], [2.48, 2.03], [2.55, 2.06], [2.61, 2.09], [2.67, 2.12], [2.74, 2.15], [2.81, 2.19], [2.88, 2.23]], [[2.21, 2.21], [2.19, 2.19], [2.16, 2.18], [2.13, 2.17], [2.11, 2.16], [2.08, 2.15], [2.06, 2.13], [2.03, 2.12], [2.01, 2.11], [1.99, 2.11], [1.97, 2.1], [1.95, 2.1], [1.93, 2.09], [1.91, 2.08], [1.89, 2.07], [1.87, 2.06], [1.84, 2.05], [1.82, 2.03], [1.81, 2.02], [1.81, 2.02], [1.8, 2.02], [1.79, 2.0], [1.78, 1.99], [1.77, 1.97], [1.76, 1.96], [1.77, 1.96], [1.78, 1.95], [1.79, 1.93], [1.81, 1.91], [1.84, 1.89], [1.86, 1.88], [1.89, 1.87], [1.91, 1.84], [1.93, 1.82], [1.96, 1.8], [1.99, 1.79], [2.04, 1.81], [2.1, 1.83], [2.16, 1.85], [2.21, 1.88], [2.28, 1.91], [2.34, 1.93], [2.4, 1.96], [2.46, 1.99], [2.53, 2.02], [2.59, 2.05], [2.65, 2.07], [2.72, 2.11], [2.79, 2.14], [2.86, 2.18]], [[2.19, 2.24], [2.17, 2.23], [2.14, 2.22], [2.12, 2.21], [2.1, 2.2], [2.07, 2.19], [2.05, 2.18], [2.02, 2.16], [2.0, 2.15], [1.98, 2.15], [1.96, 2.14], [1.94, 2.14], [1.92, 2.13], [1.91, 2.13], [1.88, 2.12], [1.86, 2.11], [1.84, 2.09], [1.82, 2.08], [1.81, 2.07], [1.8, 2.07], [1.8, 2.06], [1.78, 2.04], [1.77, 2.03], [1.76, 2.01], [1.75, 2.0], [1.76, 2.0], [1.77, 1.98], [1.79, 1.96], [1.81, 1.94], [1.84, 1.93], [1.86, 1.91], [1.89, 1.9], [1.91, 1.87], [1.93, 1.85], [1.95, 1.83], [1.98, 1.82], [2.04, 1.84], [2.1, 1.86], [2.15, 1.88], [2.21, 1.9], [2.28, 1.93], [2.34, 1.96], [2.4, 1.98], [2.46, 2.01], [2.52, 2.04], [2.59, 2.07], [2.65, 2.09], [2.71, 2.12], [2.78, 2.16], [2.85, 2.19]], [[2.22, 2.22], [2.19, 2.21], [2.17, 2.2], [2.14, 2.19], [2.12, 2.18], [2.09, 2.17], [2.07, 2.16], [2.05, 2.15], [2.02, 2.14], [2.0, 2.14], [1.99, 2.14], [1.97, 2.13], [1.95, 2.13], [1.93, 2.12], [1.91, 2.11], [1.89, 2.1], [1.86, 2.09], [1.84, 2.07], [1.83, 2.06], [1.83, 2.06], [1.82, 2.05], [1.81, 2.04], [1.8, 2.02], [1.79, 2.01], [1.78, 1.99], [1.79, 1.99], [1.8, 1.97], [1.82, 1.95], [1.84, 1.93], [1.87, 1.91], [1.89, 1.89], [1.92, 1.87], [1.94, 1.84], [1.96, 1.82], [1.99, 1.8], [2.02, 1.78], [2.08, 1.8], [2.13, 1.82], [2.19, 1.83], [2.25, 1.85], [2.31, 1.88], [2.38, 1.91], [2.44, 1.93], [2.5, 1.96], [2.57, 1.98], [2.63, 2.01], [2.69, 2.03], [2.76, 2.06], [2.83, 2.09], [2.9, 2.13]], [[2.2, 2.23], [2.17, 2.22], [2.15, 2.21], [2.13, 2.21], [2.11, 2.2], [2.08, 2.19], [2.06, 2.18], [2.04, 2.17], [2.02, 2.17], [2.0, 2.16], [1.98, 2.16], [1.97, 2.16], [1.95, 2.15], [1.93, 2.15], [1.91, 2.14], [1.89, 2.13], [1.87, 2.12], [1.85, 2.1], [1.84, 2.1], [1.84, 2.1], [1.83, 2.09], [1.82, 2.07], [1.81, 2.06], [1.8, 2.04], [1.79, 2.03], [1.8, 2.02], [1.82, 2.0], [1.84, 1.97], [1.86, 1.95], [1.89, 1.93], [1.91, 1.91], [1.94, 1.89], [1.96, 1.86], [1.99, 1.84], [2.01, 1.81], [2.05, 1.8], [2.1, 1.81], [2.16, 1.83], [2.22, 1.85], [2.28, 1.86], [2.35, 1.89], [2.41, 1.91], [2.48, 1.94], [2.54, 1.96], [2.6, 1.99], [2.67, 2.01], [2.73, 2.04], [2.8, 2.06], [2.87, 2.1], [2.94, 2.13]], [[2.15, 2.2], [2.13, 2.2], [2.11, 2.19], [2.09, 2.18], [2.07, 2.18], [2.04, 2.17], [2.02, 2.17], [2.0, 2.16], [1.98, 2.15], [1.97, 2.15], [1.96, 2.16], [1.94, 2.15], [1.92, 2.15], [1.91, 2.15], [1.89, 2.14], [1.87, 2.13], [1.85, 2.12], [1.83, 2.11], [1.82, 2.1], [1.82, 2.1], [1.82, 2.1], [1.81, 2.08], [1.8, 2.06], [1.79, 2.05], [1.79, 2.04], [1.8, 2.02], [1.81, 2.0], [1.84, 1.98], [1.86, 1.95], [1.89, 1.93], [1.92, 1.91], [1.95, 1.89], [1.97, 1.86], [2.0, 1.83], [2.03, 1.81], [2.06, 1.79], [2.12, 1.8], [2.18, 1.82], [2.24, 1.84], [2.3, 1.85], [2.37, 1.88], [2.44, 1.9], [2.5, 1.92], [2.57, 1.95], [2.63, 1.97], [2.7, 2.0], [2.77, 2.02], [2.83, 2.04], [2.91, 2.08], [2.98, 2.12]], [[2.12, 2.23], [2.1, 2.22], [2.08, 2.22], [2.06, 2.21], [2.04, 2.21], [2.02, 2.2], [2.0, 2.2], [1.98, 2.19], [1.96, 2.18], [1.95, 2.19], [1.94, 2.19], [1.93, 2.19], [1.91, 2.19], [1.9, 2.18], [1.88, 2.18], [1.86, 2.17], [1.84, 2.16], [1.82, 2.14], [1.81, 2.14], [1.81, 2.14], [1.81, 2.13], [1.8, 2.11], [1.79, 2.09], [1.78, 2.08], [1.77, 2.06], [1.79, 2.05], [1.8, 2.02], [1.82, 1.99], [1.85, 1.97], [1.88, 1.94], [1.91, 1.92], [1.94, 1.9], [1.96, 1.86], [1.99, 1.83], [2.01, 1.8], [2.05, 1.78], [2.11, 1.79], [2.17, 1.81], [2.23, 1.82], [2.29, 1.84], [2.35, 1.86], [2.42, 1.88], [2.48, 1.9], [2.55, 1.92], [2.61, 1.94], [2.68, 1.97], [2.74, 1.99], [2.81, 2.02], [2.89, 2.05], [2.96, 2.08]], [[2.09, 2.19], [2.07, 2.19], [2.06, 2.19], [2.04, 2.18], [2.02, 2.18], [2.0, 2.17], [1.98, 2.17], [1.96, 2.16], [1.94, 2.16], [1.93, 2.16], [1.92, 2.17], [1.91, 2.17], [1.89, 2.17], [1.88, 2.16], [1.86, 2.16], [1.84, 2.15], [1.82, 2.14], [1.8, 2.12], [1.8, 2.12], [1.8, 2.12], [1.79, 2.11], [1.78, 2.09], [1.77, 2.07], [1.77, 2.06], [1.76, 2.04], [1.78, 2.02], [1.8, 1.99], [1.82, 1.96], [1.84, 1.93], [1.87, 1.91], [1.9, 1.88], [1.93, 1.85], [1.95, 1.81], [1.98, 1.78], [2.01, 1.75], [2.04, 1.72], [2.1, 1.73], [2.16, 1.74], [2.22, 1.75], [2.28, 1.77], [2.35, 1.78], [2.41, 1.8], [2.48, 1.82], [2.54, 1.84], [2.61, 1.85], [2.67, 1.87], [2.74, 1.9], [2.81, 1.92], [2.88, 1.95], [2.95, 1.98]], [[2.07, 2.2], [2.05, 2.2], [2.03, 2.19], [2.01, 2.19], [1.99, 2.19], [1.98, 2.18], [1.96, 2.18], [1.94, 2.17], [1.92, 2.17], [1.91, 2.18], [1.9, 2.18], [1.89, 2.18], [1.88, 2.18], [1.86, 2.18], [1.84, 2.17], [1.83, 2.17], [1.81, 2.15], [1.79, 2.14], [1.78, 2.13], [1.78, 2.13], [1.78, 2.12], [1.77, 2.1], [1.76, 2.09], [1.75, 2.07], [1.75, 2.05], [1.77, 2.02], [1.79, 1.99], [1.81, 1.96], [1.83, 1.92], [1.86, 1.9], [1.89, 1.87], [1.92, 1.83], [1.95, 1.79], [1.98, 1.75], [2.0, 1.71], [2.04, 1.67], [2.1, 1.68], [2.16, 1.68], [2.22, 1.69], [2.28, 1.7], [2.34, 1.71], [2.41, 1.72], [2.47, 1.73], [2.54, 1.75], [2.6, 1.76], [2.67, 1.78], [2.74, 1.8], [2.8, 1.82], [2.88, 1.85], [2.95, 1.88]], [[2.08, 2.26], [2.06, 2.26], [2.04, 2.25], [2.02, 2.25], [2.0, 2.24], [1.98, 2.24], [1.97, 2.23], [1.95, 2.23], [1.93, 2.22], [1.91, 2.22], [1.9, 2.23], [1.89, 2.23], [1.88, 2.22], [1.86, 2.22], [1.84, 2.21], [1.82, 2.2], [1.8, 2.19], [1.78, 2.18], [1.78, 2.17], [1.78, 2.17], [1.77, 2.16], [1.77, 2.14], [1.76, 2.12], [1.75, 2.1], [1.75, 2.07], [1.77, 2.05], [1.79, 2.01], [1.82, 1.97], [1.85, 1.93], [1.88, 1.89], [1.91, 1.86], [1.94, 1.82], [1.97, 1.77], [2.0, 1.73], [2.03, 1.69], [2.07, 1.65], [2.13, 1.65], [2.19, 1.66], [2.26, 1.66], [2.32, 1.66], [2.39, 1.67], [2.46, 1.69], [2.52, 1.7], [2.59, 1.71], [2.66, 1.73], [2.73, 1.74], [2.8, 1.76], [2.87, 1.78], [2.95, 1.8], [3.02, 1.83]], [[2.11, 2.37], [2.08, 2.36], [2.06, 2.35], [2.04, 2.35], [2.02, 2.34], [2.0, 2.33], [1.98, 2.32], [1.95, 2.31], [1.93, 2.3], [1.92, 2.3], [1.91, 2.3], [1.89, 2.3], [1.87, 2.29], [1.85, 2.29], [1.83, 2.27], [1.82, 2.26], [1.79, 2.25], [1.77, 2.23], [1.76, 2.22], [1.76, 2.21], [1.76, 2.2], [1.75, 2.18], [1.74, 2.16], [1.73, 2.13], [1.73, 2.1], [1.75, 2.07], [1.77, 2.02], [1.8, 1.97], [1.83, 1.93], [1.87, 1.89], [1.9, 1.85], [1.93, 1.8], [1.96, 1.75], [1.99, 1.7], [2.02, 1.65], [2.06, 1.61], [2.12, 1.61], [2.19, 1.61], [2.25, 1.61], [2.31, 1.61], [2.38, 1.61], [2.45, 1.62], [2.52, 1.63], [2.59, 1.64], [2.66, 1.65], [2.73, 1.67], [2.8, 1.68], [2.87, 1.7], [2.95, 1.73], [3.03, 1.76]], [[2.1, 2.4], [2.08, 2.4], [2.06, 2.39], [2.04, 2.38], [2.02, 2.37], [1.99, 2.36], [1.97, 2.35], [1.95, 2.34], [1.93, 2.33], [1.91, 2.33], [1.9, 2.33], [1.88, 2.32], [1.87, 2.32], [1.85, 2.31], [1.83, 2.3], [1.81, 2.29], [1.79, 2.27], [1.76, 2.25], [1.76, 2.24], [1.76, 2.23], [1.75, 2.21], [1.74, 2.19], [1.74, 2.17], [1.73, 2.13], [1.73, 2.1], [1.75, 2.06], [1.78, 2.01], [1.81, 1.96], [1.84, 1.92], [1.88, 1.87], [1.91, 1.83], [1.95, 1.78], [1.98, 1.72], [2.01, 1.67], [2.05, 1.61], [2.09, 1.57], [2.15, 1.57], [2.22, 1.56], [2.28, 1.56], [2.35, 1.56], [2.42, 1.56], [2.49, 1.57], [2.56, 1.58], [2.63, 1.59], [2.7, 1.6], [2.77, 1.61], [2.84, 1.63], [2.92, 1.65], [3.0, 1.68], [3.08, 1.7]], [[2.08, 2.45], [2.05, 2.44], [2.03, 2.43], [2.01, 2.42], [1.99, 2.41], [1.97, 2.4], [1.95, 2.39], [1.92, 2.38], [1.9, 2.37], [1.89, 2.36], [1.87, 2.36], [1.86, 2.35], [1.84, 2.35], [1.82, 2.34], [1.8, 2.33], [1.78, 2.31], [1.76, 2.3], [1.74, 2.27], [1.73, 2.26], [1.73, 2.25], [1.73, 2.23], [1.72, 2.21], [1.72, 2.18], [1.71, 2.14], [1.72, 2.1], [1.74, 2.06], [1.77, 2.01], [1.8, 1.95], [1.83, 1.9], [1.87, 1.85], [1.91, 1.81], [1.94, 1.75], [1.98, 1.69], [2.02, 1.63], [2.05, 1.57], [2.1, 1.53], [2.16, 1.52], [2.23, 1.51], [2.29, 1.5], [2.36, 1.5], [2.43, 1.5], [2.51, 1.5], [2.58, 1.51], [2.65, 1.51], [2.72, 1.53], [2.8, 1.54], [2.87, 1.56], [2.95, 1.57], [3.03, 1.6], [3.11, 1.62]], [[2.04, 2.52], [2.01, 2.5], [1.99, 2.49], [1.97, 2.48], [1.95, 2.47], [1.93, 2.46], [1.91, 2.44], [1.89, 2.43], [1.86, 2.42], [1.85, 2.42], [1.84, 2.41], [1.82, 2.4], [1.8, 2.4], [1.79, 2.39], [1.77, 2.37], [1.75, 2.36], [1.72, 2.34], [1.7, 2.31], [1.7, 2.3], [1.7, 2.29], [1.69, 2.27], [1.69, 2.24], [1.68, 2.2], [1.68, 2.16], [1.69, 2.12], [1.71, 2.07], [1.74, 2.01], [1.78, 1.95], [1.82, 1.89], [1.86, 1.84], [1.9, 1.78], [1.93, 1.71], [1.97, 1.64], [2.01, 1.58], [2.05, 1.51], [2.1, 1.46], [2.17, 1.45], [2.23, 1.44], [2.3, 1.42], [2.37, 1.41], [2.45, 1.41], [2.52, 1.41], [2.59, 1.42], [2.67, 1.42], [2.74, 1.43], [2.82, 1.45], [2.9, 1.46], [2.97, 1.47], [3.06, 1.49], [3.14, 1.52]], [[2.08, 2.61], [2.06, 2.6], [2.03, 2.58], [2.01, 2.57], [1.99, 2.56], [1.97, 2.54], [1.94, 2.53], [1.92, 2.51], [1.9, 2.5], [1.88, 2.49], [1.87, 2.48], [1.85, 2.47], [1.83, 2.46], [1.82, 2.45], [1.8, 2.43], [1.78, 2.42], [1.75, 2.39], [1.73, 2.36], [1.72, 2.34], [1.73, 2.33], [1.72, 2.3], [1.72, 2.27], [1.72, 2.22], [1.72, 2.17], [1.73, 2.12], [1.76, 2.06], [1.8, 1.99], [1.84, 1.92], [1.88, 1.86], [1.92, 1.79], [1.97, 1.73], [2.01, 1.66], [2.06, 1.58], [2.1, 1.51], [2.15, 1.44], [2.2, 1.38], [2.27, 1.36], [2.34, 1.35], [2.42, 1.33], [2.49, 1.32], [2.57, 1.31], [2.65, 1.31], [2.73, 1.32], [2.81, 1.33], [2.89, 1.33], [2.97, 1.34], [3.06, 1.35], [3.14, 1.37], [3.23, 1.38], [3.32, 1.4]], [[2.0, 2.7], [1.98, 2.69], [1.96, 2.67], [1.93, 2.65], [1.91, 2.64], [1.89, 2.62], [1.87, 2.6], [1.85, 2.58], [1.83, 2.57], [1.81, 2.56], [1.8, 2.55], [1.78, 2.54], [1.77, 2.52], [1.75, 2.51], [1.73, 2.49], [1.71, 2.47], [1.69, 2.44], [1.67, 2.41], [1.66, 2.38], [1.67, 2.36], [1.67, 2.33], [1.67, 2.28], [1.68, 2.23], [1.68, 2.17], [1.69, 2.12], [1.73, 2.05], [1.77, 1.97], [1.82, 1.89], [1.86, 1.81], [1.92, 1.74], [1.97, 1.67], [2.01, 1.58], [2.06, 1.49], [2.11, 1.41], [2.16, 1.33], [2.22, 1.27], [2.3, 1.24], [2.37, 1.21], [2.45, 1.19], [2.53, 1.17], [2.61, 1.17], [2.69, 1.17], [2.78, 1.17], [2.86, 1.17], [2.94, 1.17], [3.03, 1.18], [3.11, 1.2], [3.2, 1.21], [3.29, 1.23], [3.38, 1.24]], [[1.93, 2.88], [1.91, 2.86], [1.89, 2.84], [1.87, 2.81], [1.84, 2.79], [1.82, 2.77], [1.8, 2.75], [1.78, 2.73], [1.76, 2.7], [1.75, 2.69], [1.73, 2.67], [1.72, 2.66], [1.7, 2.64], [1.68, 2.62], [1.67, 2.59], [1.65, 2.57], [1.63, 2.54], [1.61, 2.5], [1.6, 2.47], [1.61, 2.44], [1.62, 2.4], [1.63, 2.34], [1.63, 2.28], [1.64, 2.22], [1.66, 2.15], [1.7, 2.07], [1.76, 1.98], [1.81, 1.89], [1.87, 1.8], [1.92, 1.72], [1.98, 1.64], [2.04, 1.54], [2.09, 1.44], [2.15, 1.34], [2.2, 1.26], [2.27, 1.19], [2.35, 1.15], [2.43, 1.12], [2.51, 1.09], [2.6, 1.08], [2.69, 1.07], [2.77, 1.07], [2.86, 1.07], [2.95, 1.07], [3.04, 1.08], [3.13, 1.09], [3.21, 1.1], [3.31, 1.11], [3.4, 1.12], [3.49, 1.13]], [[1.84, 2.97], [1.81, 2.94], [1.79, 2.92], [1.77, 2.89], [1.75, 2.86], [1.73, 2.84], [1.71, 2.81], [1.69, 2.79], [1.67, 2.76], [1.66, 2.75], [1.65, 2.73], [1.63, 2.71], [1.62, 2.69], [1.6, 2.66], [1.59, 2.63], [1.57, 2.61], [1.56, 2.56], [1.54, 2.52], [1.54, 2.48], [1.56, 2.45], [1.57, 2.39], [1.58, 2.32], [1.59, 2.25], [1.6, 2.18], [1.63, 2.11], [1.68, 2.02], [1.75, 1.91], [1.81, 1.81], [1.87, 1.71], [1.94, 1.62], [2.01, 1.52], [2.07, 1.41], [2.13, 1.3], [2.2, 1.2], [2.26, 1.1], [2.33, 1.02], [2.42, 0.98], [2.51, 0.94], [2.59, 0.92], [2.69, 0.9], [2.78, 0.9], [2.87, 0.9], [2.96, 0.91], [3.06, 0.91], [3.15, 0.91], [3.24, 0.91], [3.33, 0.91], [3.43, 0.91], [3.53, 0.92], [3.63, 0.93]], [[1.81, 3.18], [1.79, 3.14], [1.76, 3.11], [1.74, 3.08], [1.71, 3.04], [1.69, 3.01], [1.68, 2.98], [1.66, 2.95], [1.64, 2.92], [1.63, 2.9], [1.61, 2.87], [1.6, 2.84], [1.59, 2.82], [1.57, 2.79], [1.56, 2.76], [1.55, 2.72], [1.53, 2.67], [1.51, 2.62], [1.52, 2.57], [1.54, 2.52], [1.56, 2.45], [1.57, 2.37], [1.59, 2.3], [1.6, 2.22], [1.64, 2.14], [1.7, 2.04], [1.77, 1.92], [1.84, 1.81], [1.92, 1.7], [1.99, 1.59], [2.07, 1.48], [2.14, 1.36], [2.22, 1.24], [2.29, 1.13], [2.36, 1.02], [2.44, 0.94], [2.54, 0.89], [2.63, 0.86], [2.72, 0.84], [2.82, 0.84], [2.92, 0.83], [3.02, 0.83], [3.12, 0.83], [3.22, 0.83], [3.32, 0.82], [3.42, 0.82], [3.52, 0.82], [3.62, 0.82], [3.73, 0.82], [3.83, 0.82]], [[1.75, 3.36], [1.72, 3.31], [1.7, 3.27], [1.67, 3.23], [1.65, 3.19], [1.62, 3.15], [1.6, 3.12], [1.58, 3.08], [1.57, 3.04], [1.55, 3.01], [1.54, 2.98], [1.53, 2.95], [1.52, 2.92], [1.51, 2.88], [1.49, 2.84], [1.48, 2.79], [1.47, 2.74], [1.45, 2.68], [1.46, 2.63], [1.49, 2.56], [1.51, 2.48], [1.52, 2.4], [1.54, 2.31], [1.56, 2.23], [1.6, 2.14], [1.68, 2.02], [1.75, 1.89], [1.83, 1.77], [1.91, 1.64], [1.99, 1.53], [2.07, 1.4], [2.16, 1.27], [2.24, 1.14], [2.31, 1.02], [2.39, 0.89], [2.48, 0.81], [2.58, 0.77], [2.67, 0.74], [2.77, 0.73], [2.87, 0.72], [2.97, 0.71], [3.07, 0.71], [3.18, 0.7], [3.28, 0.69], [3.38, 0.68], [3.48, 0.68], [3.59, 0.67], [3.69, 0.66], [3.8, 0.66], [3.91, 0.66]], [[1.68, 3.64], [1.66, 3.59], [1.64, 3.54], [1.61, 3.5], [1.59, 3.45], [1.56, 3.4], [1.54, 3.35], [1.52, 3.31], [1.5, 3.26], [1.48, 3.22], [1.47, 3.18], [1.46, 3.15], [1.45, 3.1], [1.44, 3.06], [1.43, 3.02], [1.41, 2.97], [1.4, 2.91], [1.39, 2.85], [1.4, 2.79], [1.43, 2.71], [1.45, 2.62], [1.48, 2.53], [1.5, 2.44], [1.52, 2.34], [1.57, 2.24], [1.65, 2.11], [1.74, 1.96], [1.82, 1.82], [1.91, 1.69], [2.0, 1.56], [2.09, 1.42], [2.18, 1.27], [2.27, 1.12], [2.35, 0.99], [2.44, 0.86], [2.53, 0.77], [2.63, 0.72], [2.73, 0.7], [2.83, 0.68], [2.94, 0.67], [3.05, 0.66], [3.15, 0.65], [3.26, 0.64], [3.36, 0.63], [3.47, 0.62], [3.57, 0.61], [3.68, 0.6], [3.79, 0.59], [3.91, 0.59], [4.02, 0.59]], [[1.6, 3.81], [1.57, 3.76], [1.55, 3.7], [1.53, 3.65], [1.51, 3.6], [1.48, 3.54], [1.46, 3.49], [1.44, 3.44], [1.42, 3.38], [1.41, 3.34], [1.4, 3.3], [1.39, 3.25], [1.38, 3.2], [1.37, 3.16], [1.36, 3.11], [1.35, 3.05], [1.34, 2.98], [1.33, 2.9], [1.35, 2.82], [1.38, 2.73], [1.41, 2.63], [1.44, 2.53], [1.46, 2.43], [1.49, 2.33], [1.55, 2.22], [1.64, 2.06], [1.73, 1.91], [1.82, 1.75], [1.92, 1.6], [2.01, 1.46], [2.11, 1.3], [2.21, 1.14], [2.31, 0.98], [2.4, 0.84], [2.49, 0.69], [2.59, 0.62], [2.69, 0.59], [2.79, 0.56], [2.9, 0.54], [3.01, 0.52], [3.12, 0.51], [3.23, 0.49], [3.34, 0.47], [3.45, 0.45], [3.56, 0.44], [3.67, 0.43], [3.78, 0.42], [3.9, 0.41], [4.02, 0.4], [4.14, 0.39]], [[1.51, 4.02], [1.49, 3.96], [1.47, 3.9], [1.46, 3.84], [1.44, 3.78], [1.42, 3.72], [1.39, 3.66], [1.37, 3.6], [1.35, 3.54], [1.34, 3.49], [1.33, 3.44], [1.32, 3.38], [1.32, 3.33], [1.31, 3.28], [1.3, 3.22], [1.29, 3.15], [1.28, 3.07], [1.28, 2.99], [1.31, 2.88], [1.35, 2.78], [1.38, 2.67], [1.41, 2.57], [1.44, 2.46], [1.48, 2.35], [1.54, 2.22], [1.64, 2.05], [1.74, 1.89], [1.85, 1.72], [1.95, 1.55], [2.05, 1.4], [2.16, 1.23], [2.27, 1.05], [2.37, 0.88], [2.47, 0.73], [2.57, 0.57], [2.67, 0.52], [2.78, 0.48], [2.89, 0.45], [3.0, 0.43], [3.12, 0.41], [3.23, 0.38], [3.35, 0.36], [3.46, 0.34], [3.58, 0.32], [3.7, 0.3], [3.82, 0.29], [3.93, 0.27], [4.06, 0.26], [4.18, 0.24], [4.3, 0.23]], [[1.3, 4.3], [1.28, 4.23], [1.27, 4.16], [1.25, 4.09], [1.24, 4.02], [1.23, 3.95], [1.21, 3.88], [1.2, 3.81], [1.19, 3.74], [1.17, 3.68], [1.17, 3.61], [1.17, 3.55], [1.17, 3.49], [1.17, 3.43], [1.18, 3.35], [1.18, 3.26], [1.18, 3.17], [1.19, 3.07], [1.23, 2.95], [1.29, 2.84], [1.33, 2.72], [1.37, 2.6], [1.41, 2.48], [1.45, 2.36], [1.53, 2.22], [1.65, 2.03], [1.76, 1.85], [1.88, 1.66], [2.0, 1.48], [2.11, 1.31], [2.23, 1.12], [2.35, 0.93], [2.46, 0.75], [2.57, 0.58], [2.67, 0.44], [2.78, 0.39], [2.9, 0.35], [3.01, 0.32], [3.13, 0.29], [3.25, 0.26], [3.38, 0.23], [3.5, 0.2], [3.62, 0.18], [3.75, 0.16], [3.87, 0.14], [3.99, 0.11], [4.12, 0.09], [4.25, 0.07], [4.38, 0.05], [4.51, 0.03]], [[1.13, 4.55], [1.12, 4.48], [1.11, 4.4], [1.09, 4.32], [1.08, 4.24], [1.07, 4.16], [1.06, 4.08], [1.05, 4.0], [1.04, 3.92], [1.03, 3.85], [1.03, 3.78], [1.03, 3.71], [1.04, 3.64], [1.05, 3.56], [1.06, 3.47], [1.07, 3.38], [1.08, 3.28], [1.09, 3.15], [1.14, 3.02], [1.2, 2.9], [1.25, 2.77], [1.3, 2.64], [1.35, 2.51], [1.4, 2.39], [1.49, 2.23], [1.62, 2.03], [1.74, 1.83], [1.87, 1.62], [2.0, 1.43], [2.13, 1.25], [2.26, 1.04], [2.39, 0.83], [2.51, 0.65], [2.62, 0.46], [2.72, 0.35], [2.84, 0.29], [2.95, 0.25], [3.08, 0.21], [3.2, 0.17], [3.33, 0.14], [3.45, 0.11], [3.58, 0.08], [3.71, 0.05], [3.83, 0.03], [3.96, 0.0], [4.09, -0.03], [4.22, -0.05], [4.36, -0.08], [4.49, -0.1], [4.62, -0.12]], [[1.0, 4.61], [0.99, 4.53], [0.98, 4.45], [0.97, 4.37], [0.95, 4.29], [0.94, 4.21], [0.94, 4.13], [0.93, 4.05], [0.92, 3.97], [0.92, 3.89], [0.92, 3.82], [0.93, 3.74], [0.94, 3.67], [0.95, 3.59], [0.97, 3.5], [0.99, 3.4], [1.01, 3.29], [1.03, 3.16], [1.09, 3.03], [1.16, 2.9], [1.22, 2.77], [1.27, 2.64], [1.32, 2.51], [1.38, 2.37], [1.49, 2.21], [1.63, 2.0], [1.77, 1.8], [1.91, 1.59], [2.05, 1.39], [2.19, 1.2], [2.33, 0.99], [2.47, 0.78], [2.6, 0.59], [2.72, 0.41], [2.83, 0.3], [2.95, 0.25], [3.07, 0.2], [3.2, 0.16], [3.33, 0.13], [3.46, 0.09], [3.6, 0.06], [3.73, 0.03], [3.87, -0.0], [4.0, -0.03], [4.14, -0.06], [4.27, -0.08], [4.41, -0.11], [4.55, -0.14], [4.69, -0.16], [4.83, -0.19]], [[0.85, 4.61], [0.85, 4.53], [0.84, 4.45], [0.83, 4.37], [0.83, 4.29], [0.82, 4.21], [0.81, 4.14], [0.81, 4.06], [0.8, 3.98], [0.8, 3.9], [0.8, 3.83], [0.81, 3.75], [0.83, 3.68], [0.85, 3.6], [0.88, 3.51], [0.9, 3.4], [0.93, 3.29], [0.97, 3.16], [1.04, 3.03], [1.12, 2.9], [1.18, 2.77], [1.25, 2.64], [1.31, 2.51], [1.38, 2.37], [1.5, 2.21], [1.65, 2.0], [1.81, 1.79], [1.96, 1.58], [2.12, 1.38], [2.27, 1.19], [2.43, 0.97], [2.58, 0.77], [2.71, 0.58], [2.84, 0.39], [2.96, 0.3], [3.09, 0.24], [3.22, 0.2], [3.36, 0.16], [3.5, 0.12], [3.64, 0.09], [3.78, 0.05], [3.92, 0.02], [4.07, -0.01], [4.21, -0.03], [4.35, -0.06], [4.49, -0.09], [4.64, -0.12], [4.79, -0.14], [4.94, -0.17], [5.08, -0.2]], [[0.68, 4.64], [0.68, 4.56], [0.68, 4.48], [0.68, 4.4], [0.67, 4.32], [0.67, 4.24], [0.67, 4.16], [0.67, 4.08], [0.67, 4.0], [0.67, 3.92], [0.67, 3.85], [0.68, 3.78], [0.7, 3.71], [0.73, 3.63], [0.76, 3.54], [0.79, 3.44], [0.83, 3.32], [0.87, 3.19], [0.95, 3.06], [1.04, 2.93], [1.11, 2.8], [1.18, 2.67], [1.25, 2.54], [1.33, 2.4], [1.47, 2.23], [1.63, 2.03], [1.8, 1.82], [1.97, 1.61], [2.13, 1.41], [2.3, 1.22], [2.47, 1.01], [2.63, 0.8], [2.78, 0.62], [2.92, 0.43], [3.05, 0.32], [3.18, 0.27], [3.32, 0.23], [3.47, 0.19], [3.61, 0.16], [3.76, 0.12], [3.9, 0.09], [4.05, 0.06], [4.2, 0.03], [4.35, 0.01], [4.5, -0.02], [4.65, -0.05], [4.8, -0.07], [4.95, -0.1], [5.1, -0.12], [5.26, -0.15]], [[0.56, 4.79], [0.57, 4.71], [0.57, 4.62], [0.57, 4.54], [0.57, 4.45], [0.57, 4.37], [0.57, 4.28], [0.58, 4.2], [0.58, 4.12], [0.58, 4.03], [0.58, 3.95], [0.59, 3.87], [0.62, 3.8], [0.65, 3.72], [0.68, 3.62], [0.72, 3.51], [0.76, 3.39], [0.81, 3.25], [0.9, 3.11], [0.99, 2.98], [1.08, 2.84], [1.16, 2.7], [1.23, 2.57], [1.32, 2.43], [1.47, 2.25], [1.64, 2.04], [1.82, 1.83], [2.0, 1.61], [2.18, 1.41], [2.36, 1.21], [2.55, 0.98], [2.72, 0.78], [2.87, 0.58], [3.02, 0.4], [3.15, 0.3], [3.3, 0.25], [3.45, 0.21], [3.6, 0.17], [3.75, 0.13], [3.9, 0.09], [4.05, 0.06], [4.21, 0.03], [4.37, 0.0], [4.52, -0.03], [4.68, -0.05], [4.83, -0.08], [4.99, -0.11], [5.15, -0.14], [5.31, -0.16], [5.47, -0.19]], [[0.47, 4.83], [0.47, 4.75], [0.48, 4.66], [0.48, 4.58], [0.48, 4.49], [0.49, 4.4], [0.49, 4.32], [0.5, 4.23], [0.5, 4.15], [0.51, 4.06], [0.51, 3.98], [0.52, 3.9], [0.55, 3.82], [0.59, 3.74], [0.63, 3.63], [0.67, 3.52], [0.72, 3.39], [0.77, 3.25], [0.86, 3.11], [0.97, 2.97], [1.06, 2.83], [1.14, 2.69], [1.22, 2.55], [1.32, 2.41], [1.47, 2.23], [1.66, 2.01], [1.85, 1.79], [2.04, 1.57], [2.23, 1.36], [2.42, 1.15], [2.61, 0.92], [2.78, 0.72], [2.94, 0.52], [3.09, 0.34], [3.23, 0.26], [3.38, 0.21], [3.53, 0.17], [3.69, 0.12], [3.84, 0.09], [4.0, 0.05], [4.16, 0.02], [4.32, -0.01], [4.48, -0.04], [4.64, -0.07], [4.8, -0.1], [4.96, -0.13], [5.12, -0.16], [5.29, -0.18], [5.46, -0.21], [5.62, -0.24]], [[0.33, 4.77], [0.33, 4.69], [0.34, 4.6], [0.35, 4.52], [0.36, 4.44], [0.37, 4.35], [0.38, 4.27], [0.39, 4.19], [0.39, 4.1], [0.4, 4.02], [0.41, 3.94], [0.42, 3.86], [0.45, 3.78], [0.49, 3.7], [0.53, 3.6], [0.58, 3.49], [0.64, 3.36], [0.69, 3.22], [0.79, 3.08], [0.9, 2.94], [1.0, 2.8], [1.08, 2.66], [1.17, 2.52], [1.27, 2.37], [1.43, 2.19], [1.63, 1.97], [1.83, 1.75], [2.02, 1.52], [2.22, 1.31], [2.42, 1.1], [2.62, 0.87], [2.8, 0.66], [2.96, 0.47], [3.12, 0.29], [3.26, 0.21], [3.41, 0.16], [3.57, 0.11], [3.73, 0.07], [3.89, 0.03], [4.05, -0.01], [4.21, -0.04], [4.38, -0.07], [4.54, -0.1], [4.7, -0.13], [4.87, -0.16], [5.03, -0.2], [5.19, -0.23], [5.36, -0.26], [5.53, -0.28], [5.7, -0.31]], [[0.32, 4.85], [0.32, 4.76], [0.33, 4.67], [0.34, 4.58], [0.35, 4.5], [0.36, 4.41], [0.37, 4.33], [0.38, 4.24], [0.39, 4.15], [0.4, 4.07], [0.41, 3.99], [0.43, 3.91], [0.47, 3.83], [0.52, 3.73], [0.57, 3.62], [0.62, 3.5], [0.68, 3.37], [0.74, 3.23], [0.84, 3.08], [0.95, 2.94], [1.05, 2.8], [1.14, 2.66], [1.23, 2.51], [1.34, 2.37], [1.51, 2.18], [1.71, 1.95], [1.91, 1.73], [2.12, 1.5], [2.32, 1.28], [2.53, 1.07], [2.73, 0.84], [2.91, 0.63], [3.08, 0.43], [3.24, 0.27], [3.38, 0.19], [3.54, 0.14], [3.71, 0.09], [3.87, 0.05], [4.04, 0.01], [4.21, -0.03], [4.38, -0.06], [4.55, -0.09], [4.72, -0.12], [4.89, -0.16], [5.06, -0.19], [5.23, -0.22], [5.4, -0.25], [5.57, -0.28], [5.75, -0.31], [5.93, -0.34]], [[0.22, 4.86], [0.23, 4.77], [0.24, 4.68], [0.25, 4.59], [0.26, 4.51], [0.27, 4.42], [0.29, 4.34], [0.3, 4.25], [0.31, 4.16], [0.32, 4.08], [0.34, 4.0], [0.36, 3.92], [0.4, 3.84], [0.45, 3.74], [0.5, 3.64], [0.55, 3.52], [0.61, 3.39], [0.67, 3.25], [0.78, 3.1], [0.89, 2.96], [0.99, 2.82], [1.08, 2.68], [1.17, 2.54], [1.28, 2.39], [1.45, 2.2], [1.65, 1.98], [1.86, 1.75], [2.06, 1.53], [2.27, 1.31], [2.48, 1.1], [2.68, 0.87], [2.87, 0.66], [3.04, 0.46], [3.2, 0.3], [3.34, 0.22], [3.5, 0.17], [3.66, 0.12], [3.83, 0.08], [3.99, 0.04], [4.16, 0.0], [4.32, -0.03], [4.49, -0.06], [4.66, -0.09], [4.83, -0.12], [5.0, -0.15], [5.16, -0.18], [5.33, -0.21], [5.51, -0.24], [5.68, -0.27], [5.86, -0.29]], [[0.13, 4.91], [0.14, 4.82], [0.15, 4.73], [0.17, 4.63], [0.18, 4.55], [0.2, 4.46], [0.21, 4.37], [0.23, 4.28], [0.24, 4.2], [0.26, 4.11], [0.28, 4.03], [0.3, 3.95], [0.33, 3.87], [0.39, 3.77], [0.44, 3.66], [0.5, 3.54], [0.56, 3.41], [0.63, 3.27], [0.74, 3.12], [0.85, 2.98], [0.96, 2.84], [1.05, 2.69], [1.15, 2.55], [1.25, 2.41], [1.43, 2.22], [1.64, 1.99], [1.84, 1.76], [2.05, 1.54], [2.26, 1.32], [2.47, 1.1], [2.68, 0.87], [2.87, 0.66], [3.05, 0.46], [3.21, 0.29], [3.36, 0.21], [3.52, 0.16], [3.68, 0.11], [3.85, 0.07], [4.01, 0.03], [4.18, -0.0], [4.35, -0.04], [4.52, -0.07], [4.69, -0.1], [4.86, -0.13], [5.03, -0.16], [5.2, -0.19], [5.37, -0.22], [5.54, -0.25], [5.72, -0.28], [5.89, -0.31]], [[0.05, 4.86], [0.06, 4.77], [0.08, 4.68], [0.09, 4.6], [0.11, 4.51], [0.13, 4.42], [0.14, 4.33], [0.16, 4.25], [0.18, 4.16], [0.2, 4.07], [0.22, 4.0], [0.24, 3.92], [0.28, 3.84], [0.33, 3.74], [0.39, 3.64], [0.45, 3.51], [0.52, 3.38], [0.59, 3.25], [0.7, 3.1], [0.82, 2.96], [0.93, 2.81], [1.02, 2.67], [1.12, 2.53], [1.23, 2.38], [1.41, 2.19], [1.62, 1.97], [1.83, 1.74], [2.05, 1.51], [2.26, 1.3], [2.47, 1.08], [2.69, 0.85], [2.88, 0.63], [3.06, 0.43], [3.22, 0.28], [3.37, 0.2], [3.53, 0.15], [3.7, 0.1], [3.86, 0.06], [4.03, 0.02], [4.2, -0.02], [4.37, -0.05], [4.54, -0.08], [4.71, -0.11], [4.88, -0.14], [5.05, -0.17], [5.22, -0.2], [5.39, -0.23], [5.57, -0.26], [5.75, -0.29], [5.92, -0.32]], [[0.11, 4.64], [0.12, 4.56], [0.13, 4.48], [0.15, 4.4], [0.16, 4.31], [0.18, 4.23], [0.2, 4.15], [0.21, 4.07], [0.23, 3.99], [0.25, 3.91], [0.27, 3.84], [0.31, 3.76], [0.37, 3.67], [0.43, 3.58], [0.48, 3.47], [0.55, 3.35], [0.61, 3.23], [0.67, 3.1], [0.78, 2.96], [0.9, 2.83], [1.0, 2.7], [1.09, 2.57], [1.18, 2.43], [1.28, 2.3], [1.45, 2.12], [1.66, 1.91], [1.86, 1.7], [2.06, 1.49], [2.27, 1.28], [2.47, 1.09], [2.66, 0.87], [2.84, 0.68], [3.01, 0.49], [3.17, 0.34], [3.31, 0.27], [3.47, 0.22], [3.63, 0.18], [3.79, 0.15], [3.95, 0.11], [4.12, 0.08], [4.28, 0.05], [4.45, 0.02], [4.61, -0.0], [4.78, -0.03], [4.95, -0.05], [5.11, -0.08], [5.28, -0.11], [5.45, -0.13], [5.62, -0.16], [5.8, -0.18]], [[0.14, 4.7], [0.15, 4.61], [0.16, 4.53], [0.17, 4.45], [0.19, 4.36], [0.21, 4.28], [0.22, 4.2], [0.24, 4.12], [0.26, 4.04], [0.28, 3.96], [0.31, 3.88], [0.36, 3.8], [0.41, 3.7], [0.47, 3.61], [0.53, 3.5], [0.58, 3.38], [0.64, 3.26], [0.7, 3.14], [0.8, 3.01], [0.91, 2.88], [1.01, 2.75], [1.09, 2.62], [1.18, 2.5], [1.27, 2.36], [1.43, 2.2], [1.62, 2.0], [1.81, 1.8], [2.0, 1.6], [2.2, 1.41], [2.38, 1.23], [2.56, 1.03], [2.73, 0.85], [2.89, 0.67], [3.04, 0.5], [3.18, 0.43], [3.32, 0.39], [3.47, 0.36], [3.63, 0.33], [3.78, 0.3], [3.94, 0.27], [4.09, 0.25], [4.25, 0.23], [4.41, 0.21], [4.56, 0.19], [4.72, 0.17], [4.88, 0.16], [5.04, 0.14], [5.2, 0.12], [5.36, 0.11], [5.53, 0.09]], [[0.24, 4.6], [0.25, 4.51], [0.26, 4.43], [0.27, 4.35], [0.29, 4.27], [0.3, 4.19], [0.32, 4.11], [0.34, 4.02], [0.36, 3.94], [0.4, 3.85], [0.45, 3.77], [0.5, 3.68], [0.56, 3.59], [0.61, 3.48], [0.67, 3.37], [0.72, 3.26], [0.77, 3.15], [0.83, 3.02], [0.92, 2.9], [1.02, 2.77], [1.11, 2.65], [1.19, 2.53], [1.27, 2.4], [1.36, 2.28], [1.51, 2.12], [1.7, 1.93], [1.88, 1.73], [2.06, 1.54], [2.24, 1.36], [2.4, 1.19], [2.58, 1.0], [2.73, 0.82], [2.88, 0.65], [3.03, 0.5], [3.16, 0.43], [3.3, 0.4], [3.45, 0.37], [3.6, 0.34], [3.75, 0.31], [3.9, 0.29], [4.06, 0.27], [4.21, 0.25], [4.37, 0.23], [4.52, 0.21], [4.67, 0.2], [4.83, 0.18], [4.98, 0.16], [5.14, 0.15], [5.31, 0.13], [5.47, 0.12]], [[0.31, 4.52], [0.32, 4.43], [0.33, 4.35], [0.35, 4.27], [0.36, 4.19], [0.38, 4.11], [0.4, 4.02], [0.43, 3.94], [0.47, 3.85], [0.51, 3.77], [0.56, 3.68], [0.61, 3.6], [0.66, 3.49], [0.72, 3.39], [0.76, 3.28], [0.81, 3.18], [0.86, 3.07], [0.91, 2.95], [1.0, 2.83], [1.1, 2.71], [1.18, 2.59], [1.25, 2.47], [1.33, 2.35], [1.42, 2.23], [1.56, 2.08], [1.73, 1.89], [1.91, 1.7], [2.07, 1.52], [2.24, 1.35], [2.4, 1.18], [2.56, 1.01], [2.7, 0.84], [2.84, 0.67], [2.98, 0.54], [3.1, 0.48], [3.24, 0.45], [3.38, 0.42], [3.53, 0.4], [3.68, 0.37], [3.82, 0.35], [3.97, 0.33], [4.12, 0.32], [4.27, 0.3], [4.42, 0.29], [4.57, 0.27], [4.72, 0.26], [4.87, 0.25], [5.03, 0.23], [5.18, 0.22], [5.34, 0.21]], [[0.23, 4.66], [0.25, 4.57], [0.26, 4.49], [0.27, 4.4], [0.29, 4.32], [0.3, 4.24], [0.32, 4.15], [0.34, 4.07], [0.37, 3.97], [0.42, 3.89], [0.47, 3.8], [0.52, 3.71], [0.58, 3.61], [0.64, 3.5], [0.69, 3.38], [0.74, 3.27], [0.79, 3.16], [0.84, 3.03], [0.94, 2.91], [1.04, 2.78], [1.12, 2.66], [1.2, 2.54], [1.28, 2.42], [1.37, 2.29], [1.51, 2.14], [1.69, 1.95], [1.87, 1.76], [2.04, 1.57], [2.2, 1.4], [2.37, 1.23], [2.53, 1.05], [2.68, 0.87], [2.82, 0.71], [2.96, 0.56], [3.08, 0.5], [3.22, 0.47], [3.37, 0.44], [3.51, 0.42], [3.66, 0.4], [3.81, 0.37], [3.95, 0.35], [4.1, 0.34], [4.25, 0.32], [4.4, 0.31], [4.55, 0.3], [4.7, 0.28], [4.85, 0.27], [5.0, 0.26], [5.16, 0.25], [5.32, 0.24]], [[0.26, 4.61], [0.27, 4.53], [0.28, 4.44], [0.29, 4.36], [0.31, 4.28], [0.32, 4.19], [0.34, 4.11], [0.36, 4.02], [0.4, 3.93], [0.45, 3.84], [0.51, 3.75], [0.56, 3.65], [0.62, 3.54], [0.68, 3.43], [0.73, 3.32], [0.78, 3.2], [0.83, 3.09], [0.89, 2.96], [0.99, 2.84], [1.09, 2.71], [1.18, 2.59], [1.26, 2.47], [1.34, 2.34], [1.43, 2.22], [1.57, 2.06], [1.76, 1.86], [1.94, 1.67], [2.1, 1.48], [2.27, 1.31], [2.44, 1.13], [2.59, 0.95], [2.74, 0.77], [2.89, 0.61], [3.02, 0.49], [3.14, 0.43], [3.29, 0.4], [3.43, 0.37], [3.58, 0.34], [3.73, 0.32], [3.88, 0.3], [4.03, 0.28], [4.18, 0.26], [4.34, 0.25], [4.49, 0.23], [4.64, 0.21], [4.79, 0.2], [4.95, 0.18], [5.11, 0.17], [5.26, 0.15], [5.42, 0.14]], [[0.2, 4.68], [0.22, 4.59], [0.23, 4.51], [0.25, 4.42], [0.26, 4.34], [0.28, 4.25], [0.3, 4.16], [0.32, 4.08], [0.35, 3.98], [0.41, 3.89], [0.47, 3.8], [0.53, 3.7], [0.59, 3.59], [0.65, 3.48], [0.71, 3.36], [0.76, 3.25], [0.82, 3.13], [0.88, 3.0], [0.98, 2.88], [1.09, 2.75], [1.18, 2.63], [1.26, 2.5], [1.34, 2.38], [1.43, 2.25], [1.58, 2.09], [1.77, 1.89], [1.96, 1.69], [2.13, 1.5], [2.29, 1.32], [2.46, 1.15], [2.62, 0.96], [2.77, 0.79], [2.92, 0.62], [3.06, 0.5], [3.19, 0.44], [3.33, 0.4], [3.48, 0.37], [3.63, 0.34], [3.78, 0.32], [3.93, 0.3], [4.08, 0.28], [4.24, 0.26], [4.39, 0.24], [4.54, 0.22], [4.7, 0.21], [4.85, 0.19], [5.01, 0.17], [5.17, 0.16], [5.33, 0.15], [5.49, 0.13]], [[0.09, 4.69], [0.1, 4.61], [0.12, 4.52], [0.14, 4.43], [0.16, 4.35], [0.18, 4.26], [0.2, 4.18], [0.22, 4.09], [0.25, 4.01], [0.31, 3.92], [0.38, 3.83], [0.44, 3.73], [0.51, 3.62], [0.58, 3.51], [0.64, 3.39], [0.7, 3.28], [0.76, 3.16], [0.84, 3.03], [0.95, 2.91], [1.06, 2.78], [1.15, 2.65], [1.24, 2.53], [1.32, 2.4], [1.42, 2.28], [1.58, 2.11], [1.77, 1.92], [1.96, 1.72], [2.14, 1.53], [2.31, 1.35], [2.48, 1.18], [2.64, 0.99], [2.8, 0.81], [2.95, 0.64], [3.09, 0.51], [3.22, 0.45], [3.36, 0.41], [3.51, 0.38], [3.66, 0.35], [3.82, 0.33], [3.97, 0.3], [4.12, 0.28], [4.28, 0.26], [4.43, 0.24], [4.59, 0.23], [4.74, 0.21], [4.9, 0.19], [5.05, 0.18], [5.21, 0.16], [5.38, 0.15], [5.54, 0.13]], [[-0.08, 4.62], [-0.06, 4.54], [-0.03, 4.46], [-0.01, 4.37], [0.01, 4.29], [0.03, 4.2], [0.06, 4.12], [0.08, 4.04], [0.11, 3.96], [0.16, 3.88], [0.22, 3.8], [0.29, 3.71], [0.36, 3.6], [0.44, 3.49], [0.51, 3.38], [0.57, 3.26], [0.64, 3.14], [0.72, 3.02], [0.83, 2.89], [0.94, 2.77], [1.04, 2.64], [1.13, 2.52], [1.22, 2.39], [1.32, 2.26], [1.48, 2.1], [1.67, 1.9], [1.86, 1.71], [2.05, 1.51], [2.22, 1.33], [2.39, 1.15], [2.56, 0.97], [2.71, 0.79], [2.86, 0.62], [3.01, 0.48], [3.13, 0.41], [3.27, 0.38], [3.42, 0.35], [3.57, 0.32], [3.71, 0.29], [3.86, 0.26], [4.01, 0.24], [4.16, 0.22], [4.31, 0.2], [4.46, 0.18], [4.62, 0.16], [4.77, 0.14], [4.92, 0.12], [5.07, 0.11], [5.23, 0.09], [5.39, 0.07]], [[-0.02, 4.64], [0.01, 4.55], [0.03, 4.47], [0.05, 4.39], [0.07, 4.3], [0.1, 4.22], [0.12, 4.15], [0.15, 4.07], [0.19, 3.98], [0.26, 3.89], [0.34, 3.81], [0.41, 3.72], [0.48, 3.61], [0.56, 3.5], [0.62, 3.39], [0.69, 3.27], [0.76, 3.15], [0.84, 3.03], [0.95, 2.9], [1.07, 2.78], [1.16, 2.65], [1.25, 2.53], [1.34, 2.4], [1.44, 2.27], [1.61, 2.1], [1.8, 1.9], [2.0, 1.7], [2.18, 1.51], [2.35, 1.33], [2.53, 1.15], [2.69, 0.97], [2.84, 0.78], [3.0, 0.61], [3.15, 0.47], [3.28, 0.4], [3.42, 0.36], [3.57, 0.33], [3.72, 0.3], [3.88, 0.27], [4.03, 0.24], [4.19, 0.21], [4.34, 0.19], [4.5, 0.17], [4.66, 0.14], [4.81, 0.12], [4.97, 0.1], [5.13, 0.08], [5.29, 0.06], [5.45, 0.05], [5.62, 0.03]], [[-0.1, 4.69], [-0.08, 4.6], [-0.05, 4.52], [-0.03, 4.44], [-0.0, 4.35], [0.03, 4.27], [0.06, 4.19], [0.09, 4.11], [0.12, 4.03], [0.19, 3.96], [0.27, 3.87], [0.34, 3.78], [0.42, 3.68], [0.49, 3.57], [0.57, 3.46], [0.64, 3.34], [0.71, 3.22], [0.79, 3.09], [0.91, 2.97], [1.03, 2.84], [1.13, 2.71], [1.22, 2.59], [1.31, 2.46], [1.41, 2.33], [1.58, 2.16], [1.77, 1.96], [1.97, 1.76], [2.16, 1.56], [2.33, 1.37], [2.51, 1.19], [2.67, 1.0], [2.83, 0.82], [2.98, 0.64], [3.13, 0.47], [3.26, 0.4], [3.41, 0.35], [3.56, 0.32], [3.71, 0.28], [3.86, 0.25], [4.01, 0.22], [4.16, 0.19], [4.32, 0.16], [4.47, 0.14], [4.63, 0.11], [4.78, 0.09], [4.94, 0.07], [5.09, 0.05], [5.25, 0.03], [5.41, 0.01], [5.57, -0.01]], [[-0.12, 4.71], [-0.09, 4.63], [-0.07, 4.55], [-0.04, 4.46], [-0.01, 4.38], [0.02, 4.3], [0.05, 4.22], [0.08, 4.14], [0.13, 4.06], [0.2, 3.98], [0.28, 3.9], [0.36, 3.81], [0.43, 3.7], [0.51, 3.59], [0.59, 3.48], [0.66, 3.36], [0.73, 3.24], [0.81, 3.11], [0.93, 2.98], [1.05, 2.86], [1.15, 2.73], [1.24, 2.6], [1.34, 2.47], [1.44, 2.34], [1.6, 2.17], [1.8, 1.96], [1.99, 1.76], [2.18, 1.56], [2.35, 1.37], [2.53, 1.19], [2.69, 0.99], [2.84, 0.81], [2.99, 0.63], [3.14, 0.45], [3.27, 0.37], [3.42, 0.32], [3.56, 0.28], [3.71, 0.24], [3.86, 0.21], [4.02, 0.18], [4.17, 0.15], [4.32, 0.12], [4.47, 0.09], [4.63, 0.06], [4.78, 0.04], [4.93, 0.01], [5.09, -0.01], [5.25, -0.04], [5.41, -0.06], [5.57, -0.08]], [[-0.21, 4.84], [-0.18, 4.76], [-0.15, 4.67], [-0.12, 4.59], [-0.09, 4.5], [-0.05, 4.42], [-0.02, 4.34], [0.02, 4.26], [0.06, 4.17], [0.12, 4.1], [0.2, 4.02], [0.28, 3.93], [0.36, 3.83], [0.44, 3.72], [0.52, 3.6], [0.59, 3.48], [0.66, 3.36], [0.75, 3.23], [0.88, 3.1], [1.0, 2.97], [1.1, 2.84], [1.19, 2.71], [1.28, 2.58], [1.39, 2.45], [1.55, 2.28], [1.75, 2.07], [1.94, 1.87], [2.13, 1.66], [2.31, 1.47], [2.48, 1.29], [2.65, 1.09], [2.8, 0.91], [2.95, 0.73], [3.1, 0.55], [3.24, 0.42], [3.38, 0.37], [3.52, 0.33], [3.67, 0.3], [3.82, 0.26], [3.97, 0.23], [4.12, 0.2], [4.27, 0.17], [4.42, 0.14], [4.57, 0.11], [4.72, 0.09], [4.87, 0.06], [5.02, 0.04], [5.18, 0.02], [5.33, -0.0], [5.49, -0.02]], [[-0.21, 4.64], [-0.18, 4.56], [-0.15, 4.48], [-0.13, 4.4], [-0.09, 4.32], [-0.06, 4.24], [-0.03, 4.17], [0.01, 4.09], [0.06, 4.01], [0.14, 3.93], [0.23, 3.85], [0.31, 3.77], [0.39, 3.66], [0.47, 3.55], [0.55, 3.44], [0.62, 3.32], [0.69, 3.21], [0.79, 3.08], [0.91, 2.95], [1.03, 2.83], [1.13, 2.7], [1.22, 2.58], [1.31, 2.45], [1.41, 2.32], [1.57, 2.15], [1.76, 1.94], [1.95, 1.74], [2.12, 1.54], [2.29, 1.36], [2.46, 1.18], [2.61, 0.99], [2.76, 0.8], [2.9, 0.62], [3.05, 0.44], [3.17, 0.33], [3.3, 0.28], [3.43, 0.23], [3.57, 0.19], [3.72, 0.15], [3.86, 0.11], [4.0, 0.08], [4.14, 0.04], [4.29, 0.01], [4.43, -0.03], [4.58, -0.06], [4.72, -0.08], [4.87, -0.11], [5.02, -0.14], [5.17, -0.17], [5.32, -0.2]], [[-0.13, 4.59], [-0.1, 4.51], [-0.07, 4.43], [-0.05, 4.35], [-0.01, 4.28], [0.02, 4.2], [0.06, 4.13], [0.12, 4.04], [0.19, 3.95], [0.27, 3.87], [0.36, 3.79], [0.45, 3.7], [0.52, 3.6], [0.6, 3.49], [0.68, 3.38], [0.75, 3.27], [0.82, 3.15], [0.91, 3.03], [1.03, 2.91], [1.14, 2.79], [1.24, 2.66], [1.33, 2.54], [1.42, 2.42], [1.52, 2.29], [1.67, 2.13], [1.86, 1.93], [2.04, 1.74], [2.21, 1.55], [2.37, 1.37], [2.53, 1.19], [2.68, 1.01], [2.82, 0.83], [2.97, 0.65], [3.11, 0.48], [3.24, 0.38], [3.37, 0.33], [3.51, 0.28], [3.64, 0.24], [3.79, 0.21], [3.93, 0.17], [4.08, 0.14], [4.22, 0.11], [4.37, 0.07], [4.51, 0.04], [4.66, 0.01], [4.81, -0.01], [4.95, -0.04], [5.1, -0.07], [5.26, -0.09], [5.41, -0.12]], [[-0.11, 4.53], [-0.08, 4.45], [-0.05, 4.38], [-0.03, 4.3], [0.01, 4.22], [0.05, 4.15], [0.1, 4.06], [0.17, 3.98], [0.24, 3.89], [0.32, 3.81], [0.41, 3.74], [0.49, 3.64], [0.57, 3.54], [0.65, 3.43], [0.72, 3.33], [0.79, 3.22], [0.86, 3.11], [0.95, 2.99], [1.06, 2.87], [1.18, 2.75], [1.27, 2.63], [1.36, 2.51], [1.44, 2.39], [1.54, 2.26], [1.69, 2.11], [1.87, 1.91], [2.03, 1.73], [2.2, 1.54], [2.36, 1.37], [2.51, 1.2], [2.65, 1.02], [2.79, 0.84], [2.93, 0.68], [3.07, 0.51], [3.19, 0.39], [3.32, 0.34], [3.45, 0.3], [3.59, 0.25], [3.73, 0.22], [3.87, 0.19], [4.01, 0.16], [4.15, 0.12], [4.29, 0.09], [4.43, 0.06], [4.57, 0.03], [4.72, 0.0], [4.86, -0.02], [5.01, -0.05], [5.16, -0.07], [5.31, -0.09]], [[-0.17, 4.6], [-0.14, 4.53], [-0.11, 4.45], [-0.08, 4.37], [-0.04, 4.29], [-0.0, 4.22], [0.04, 4.14], [0.1, 4.05], [0.18, 3.96], [0.26, 3.88], [0.35, 3.81], [0.44, 3.71], [0.52, 3.61], [0.6, 3.5], [0.67, 3.39], [0.74, 3.28], [0.81, 3.17], [0.91, 3.05], [1.02, 2.93], [1.14, 2.81], [1.24, 2.69], [1.32, 2.57], [1.41, 2.45], [1.5, 2.32], [1.65, 2.16], [1.83, 1.97], [2.0, 1.79], [2.16, 1.61], [2.32, 1.43], [2.46, 1.26], [2.6, 1.09], [2.74, 0.91], [2.88, 0.74], [3.01, 0.58], [3.14, 0.44], [3.26, 0.39], [3.39, 0.35], [3.52, 0.31], [3.66, 0.28], [3.8, 0.25], [3.94, 0.22], [4.07, 0.19], [4.21, 0.16], [4.35, 0.13], [4.49, 0.1], [4.63, 0.07], [4.77, 0.05], [4.91, 0.03], [5.06, 0.0], [5.21, -0.02]], [[-0.27, 4.61], [-0.24, 4.53], [-0.2, 4.45], [-0.17, 4.37], [-0.14, 4.28], [-0.1, 4.21], [-0.06, 4.13], [-0.01, 4.05], [0.07, 3.96], [0.16, 3.88], [0.25, 3.8], [0.35, 3.7], [0.44, 3.59], [0.52, 3.49], [0.6, 3.38], [0.67, 3.26], [0.75, 3.15], [0.85, 3.03], [0.97, 2.9], [1.09, 2.78], [1.19, 2.66], [1.28, 2.54], [1.37, 2.42], [1.47, 2.29], [1.62, 2.13], [1.81, 1.93], [1.98, 1.75], [2.14, 1.56], [2.3, 1.38], [2.45, 1.21], [2.59, 1.03], [2.73, 0.85], [2.87, 0.68], [3.0, 0.5], [3.12, 0.38], [3.25, 0.33], [3.38, 0.29], [3.5, 0.24], [3.64, 0.21], [3.78, 0.17], [3.92, 0.14], [4.05, 0.11], [4.19, 0.07], [4.33, 0.04], [4.47, 0.01], [4.61, -0.02], [4.75, -0.04], [4.89, -0.07], [5.04, -0.09], [5.18, -0.12]], [[-0.32, 4.76], [-0.28, 4.67], [-0.25, 4.59], [-0.21, 4.5], [-0.18, 4.42], [-0.14, 4.34], [-0.09, 4.26], [-0.04, 4.17], [0.04, 4.08], [0.14, 3.99], [0.23, 3.91], [0.33, 3.81], [0.42, 3.7], [0.51, 3.59], [0.59, 3.47], [0.67, 3.36], [0.74, 3.24], [0.85, 3.11], [0.97, 2.99], [1.1, 2.86], [1.2, 2.74], [1.29, 2.61], [1.38, 2.49], [1.48, 2.36], [1.64, 2.2], [1.83, 2.0], [2.0, 1.81], [2.17, 1.62], [2.33, 1.44], [2.48, 1.27], [2.63, 1.09], [2.77, 0.91], [2.91, 0.73], [3.04, 0.56], [3.17, 0.42], [3.3, 0.37], [3.43, 0.33], [3.56, 0.28], [3.7, 0.25], [3.84, 0.22], [3.98, 0.19], [4.12, 0.15], [4.26, 0.12], [4.4, 0.09], [4.54, 0.06], [4.68, 0.03], [4.82, 0.01], [4.96, -0.02], [5.11, -0.04], [5.26, -0.06]], [[-0.36, 4.75], [-0.32, 4.67], [-0.28, 4.58], [-0.25, 4.5], [-0.21, 4.41], [-0.17, 4.33], [-0.12, 4.25], [-0.06, 4.16], [0.02, 4.07], [0.12, 3.98], [0.22, 3.89], [0.33, 3.78], [0.42, 3.67], [0.5, 3.56], [0.59, 3.45], [0.67, 3.33], [0.75, 3.21], [0.85, 3.08], [0.98, 2.96], [1.1, 2.83], [1.21, 2.71], [1.3, 2.58], [1.39, 2.46], [1.5, 2.33], [1.66, 2.16], [1.85, 1.96], [2.02, 1.77], [2.19, 1.58], [2.36, 1.4], [2.51, 1.22], [2.65, 1.04], [2.8, 0.86], [2.94, 0.68], [3.07, 0.51], [3.2, 0.38], [3.33, 0.33], [3.46, 0.28], [3.59, 0.23], [3.73, 0.2], [3.87, 0.17], [4.01, 0.13], [4.15, 0.1], [4.29, 0.06], [4.43, 0.03], [4.57, -0.0], [4.72, -0.03], [4.86, -0.06], [5.0, -0.08], [5.15, -0.11], [5.3, -0.13]], [[-0.38, 4.82], [-0.35, 4.73], [-0.31, 4.64], [-0.27, 4.56], [-0.23, 4.47], [-0.19, 4.38], [-0.14, 4.3], [-0.08, 4.21], [0.01, 4.11], [0.11, 4.02], [0.21, 3.92], [0.32, 3.82], [0.41, 3.7], [0.5, 3.59], [0.58, 3.47], [0.67, 3.35], [0.75, 3.23], [0.86, 3.1], [0.99, 2.97], [1.11, 2.84], [1.22, 2.72], [1.31, 2.59], [1.41, 2.46], [1.51, 2.33], [1.68, 2.16], [1.87, 1.96], [2.05, 1.76], [2.22, 1.57], [2.39, 1.38], [2.54, 1.21], [2.69, 1.02], [2.83, 0.84], [2.97, 0.66], [3.11, 0.48], [3.23, 0.35], [3.37, 0.3], [3.5, 0.25], [3.63, 0.2], [3.77, 0.17], [3.92, 0.13], [4.06, 0.09], [4.2, 0.06], [4.34, 0.02], [4.48, -0.02], [4.62, -0.05], [4.76, -0.08], [4.91, -0.12], [5.06, -0.15], [5.21, -0.17], [5.35, -0.2]], [[-0.45, 4.89], [-0.41, 4.8], [-0.37, 4.71], [-0.33, 4.62], [-0.29, 4.53], [-0.24, 4.44], [-0.19, 4.35], [-0.12, 4.25], [-0.03, 4.15], [0.07, 4.06], [0.18, 3.95], [0.29, 3.85], [0.39, 3.73], [0.48, 3.61], [0.56, 3.49], [0.65, 3.37], [0.73, 3.25], [0.84, 3.11], [0.97, 2.99], [1.1, 2.86], [1.21, 2.73], [1.3, 2.6], [1.4, 2.47], [1.5, 2.34], [1.67, 2.17], [1.86, 1.96], [2.04, 1.77], [2.21, 1.57], [2.38, 1.39], [2.53, 1.21], [2.67, 1.03], [2.82, 0.84], [2.95, 0.66], [3.09, 0.48], [3.21, 0.35], [3.34, 0.3], [3.48, 0.26], [3.61, 0.21], [3.75, 0.17], [3.89, 0.13], [4.02, 0.1], [4.16, 0.06], [4.3, 0.02], [4.44, -0.02], [4.58, -0.05], [4.72, -0.08], [4.86, -0.11], [5.01, -0.14], [5.16, -0.17], [5.3, -0.2]], [[-0.43, 4.86], [-0.39, 4.77], [-0.35, 4.68], [-0.31, 4.59], [-0.27, 4.49], [-0.22, 4.4], [-0.15, 4.31], [-0.07, 4.21], [0.02, 4.1], [0.13, 4.0], [0.24, 3.89], [0.35, 3.79], [0.44, 3.67], [0.53, 3.56], [0.62, 3.44], [0.7, 3.32], [0.78, 3.2], [0.89, 3.06], [1.02, 2.94], [1.15, 2.81], [1.25, 2.68], [1.34, 2.56], [1.44, 2.43], [1.55, 2.3], [1.71, 2.13], [1.89, 1.93], [2.06, 1.74], [2.23, 1.55], [2.39, 1.36], [2.54, 1.19], [2.68, 1.01], [2.82, 0.83], [2.96, 0.65], [3.09, 0.47], [3.21, 0.35], [3.34, 0.3], [3.47, 0.26], [3.6, 0.21], [3.74, 0.18], [3.88, 0.14], [4.02, 0.1], [4.16, 0.06], [4.29, 0.03], [4.43, -0.01], [4.57, -0.04], [4.71, -0.07], [4.85, -0.1], [5.0, -0.13], [5.15, -0.16], [5.29, -0.19]], [[-0.45, 4.87], [-0.4, 4.78], [-0.36, 4.68], [-0.32, 4.59], [-0.28, 4.5], [-0.22, 4.41], [-0.15, 4.3], [-0.06, 4.2], [0.03, 4.1], [0.14, 3.99], [0.25, 3.88], [0.36, 3.77], [0.46, 3.66], [0.55, 3.54], [0.63, 3.42], [0.71, 3.3], [0.8, 3.18], [0.91, 3.05], [1.04, 2.92], [1.17, 2.79], [1.27, 2.66], [1.36, 2.54], [1.46, 2.41], [1.56, 2.28], [1.72, 2.11], [1.91, 1.91], [2.08, 1.72], [2.24, 1.53], [2.4, 1.35], [2.55, 1.17], [2.69, 0.99], [2.83, 0.81], [2.97, 0.63], [3.1, 0.45], [3.22, 0.34], [3.35, 0.29], [3.48, 0.25], [3.61, 0.2], [3.75, 0.17], [3.89, 0.13], [4.03, 0.09], [4.17, 0.05], [4.3, 0.02], [4.44, -0.02], [4.58, -0.05], [4.72, -0.08], [4.86, -0.11], [5.01, -0.14], [5.16, -0.17], [5.31, -0.2]], [[-0.45, 4.89], [-0.41, 4.79], [-0.37, 4.7], [-0.32, 4.61], [-0.27, 4.51], [-0.21, 4.41], [-0.13, 4.31], [-0.04, 4.2], [0.05, 4.09], [0.16, 3.98], [0.27, 3.87], [0.38, 3.76], [0.48, 3.65], [0.57, 3.53], [0.66, 3.41], [0.74, 3.29], [0.82, 3.17], [0.93, 3.04], [1.06, 2.91], [1.19, 2.78], [1.29, 2.65], [1.38, 2.53], [1.47, 2.4], [1.58, 2.27], [1.74, 2.1], [1.91, 1.91], [2.08, 1.72], [2.25, 1.53], [2.4, 1.35], [2.55, 1.17], [2.68, 1.0], [2.82, 0.82], [2.96, 0.64], [3.09, 0.46], [3.2, 0.36], [3.33, 0.31], [3.46, 0.26], [3.59, 0.22], [3.73, 0.18], [3.87, 0.15], [4.0, 0.11], [4.14, 0.08], [4.28, 0.04], [4.41, 0.01], [4.55, -0.03], [4.69, -0.06], [4.83, -0.09], [4.98, -0.12], [5.12, -0.14], [5.27, -0.17]], [[-0.55, 5.0], [-0.51, 4.9], [-0.46, 4.81], [-0.42, 4.71], [-0.37, 4.62], [-0.32, 4.52], [-0.24, 4.42], [-0.15, 4.31], [-0.05, 4.2], [0.06, 4.09], [0.17, 3.98], [0.29, 3.86], [0.39, 3.75], [0.48, 3.63], [0.57, 3.51], [0.65, 3.38], [0.74, 3.26], [0.86, 3.12], [0.99, 2.99], [1.11, 2.86], [1.22, 2.74], [1.31, 2.61], [1.41, 2.48], [1.51, 2.35], [1.67, 2.19], [1.85, 1.99], [2.01, 1.8], [2.17, 1.61], [2.33, 1.44], [2.47, 1.26], [2.61, 1.09], [2.74, 0.91], [2.88, 0.74], [3.01, 0.57], [3.13, 0.44], [3.25, 0.39], [3.38, 0.35], [3.5, 0.3], [3.64, 0.27], [3.77, 0.24], [3.91, 0.21], [4.04, 0.18], [4.17, 0.15], [4.3, 0.11], [4.44, 0.08], [4.57, 0.05], [4.71, 0.02], [4.85, -0.0], [4.99, -0.02], [5.13, -0.05]], [[-0.51, 4.9], [-0.46, 4.8], [-0.42, 4.71], [-0.37, 4.61], [-0.32, 4.51], [-0.24, 4.41], [-0.16, 4.31], [-0.06, 4.2], [0.04, 4.09], [0.15, 3.98], [0.26, 3.87], [0.37, 3.75], [0.48, 3.64], [0.57, 3.53], [0.65, 3.41], [0.74, 3.29], [0.82, 3.17], [0.94, 3.03], [1.07, 2.9], [1.19, 2.78], [1.3, 2.65], [1.39, 2.53], [1.48, 2.4], [1.59, 2.27], [1.75, 2.11], [1.92, 1.92], [2.08, 1.73], [2.25, 1.54], [2.4, 1.37], [2.54, 1.2], [2.68, 1.02], [2.82, 0.85], [2.95, 0.67], [3.09, 0.5], [3.2, 0.38], [3.33, 0.34], [3.46, 0.29], [3.59, 0.25], [3.73, 0.21], [3.87, 0.18], [4.0, 0.15], [4.14, 0.11], [4.28, 0.08], [4.41, 0.04], [4.55, 0.01], [4.69, -0.02], [4.83, -0.05], [4.98, -0.07], [5.12, -0.1], [5.27, -0.13]], [[-0.39, 4.75], [-0.34, 4.65], [-0.29, 4.56], [-0.23, 4.46], [-0.15, 4.36], [-0.07, 4.26], [0.02, 4.15], [0.11, 4.04], [0.21, 3.93], [0.31, 3.83], [0.42, 3.73], [0.52, 3.63], [0.62, 3.52], [0.7, 3.41], [0.78, 3.3], [0.85, 3.18], [0.93, 3.07], [1.04, 2.94], [1.16, 2.82], [1.28, 2.7], [1.38, 2.58], [1.46, 2.47], [1.55, 2.34], [1.65, 2.22], [1.78, 2.07], [1.93, 1.89], [2.09, 1.71], [2.24, 1.54], [2.38, 1.37], [2.51, 1.21], [2.64, 1.05], [2.77, 0.88], [2.9, 0.71], [3.02, 0.54], [3.13, 0.43], [3.26, 0.39], [3.38, 0.35], [3.5, 0.3], [3.63, 0.27], [3.77, 0.24], [3.9, 0.21], [4.03, 0.18], [4.16, 0.15], [4.3, 0.12], [4.43, 0.09], [4.56, 0.06], [4.69, 0.03], [4.83, 0.01], [4.98, -0.01], [5.12, -0.04]], [[-0.41, 4.85], [-0.36, 4.76], [-0.31, 4.66], [-0.25, 4.56], [-0.18, 4.46], [-0.09, 4.36], [-0.01, 4.26], [0.08, 4.15], [0.18, 4.04], [0.29, 3.93], [0.39, 3.83], [0.5, 3.72], [0.59, 3.61], [0.68, 3.5], [0.76, 3.39], [0.83, 3.27], [0.91, 3.15], [1.02, 3.02], [1.14, 2.9], [1.26, 2.78], [1.36, 2.66], [1.44, 2.54], [1.53, 2.42], [1.62, 2.29], [1.75, 2.15], [1.91, 1.97], [2.06, 1.79], [2.21, 1.61], [2.34, 1.44], [2.48, 1.28], [2.6, 1.12], [2.73, 0.96], [2.85, 0.79], [2.97, 0.62], [3.09, 0.5], [3.21, 0.46], [3.33, 0.42], [3.45, 0.38], [3.57, 0.35], [3.7, 0.32], [3.83, 0.3], [3.96, 0.27], [4.09, 0.24], [4.22, 0.21], [4.35, 0.18], [4.48, 0.16], [4.61, 0.13], [4.75, 0.11], [4.89, 0.09], [5.02, 0.07]], [[-0.35, 4.78], [-0.3, 4.68], [-0.25, 4.58], [-0.18, 4.48], [-0.1, 4.38], [-0.01, 4.28], [0.08, 4.17], [0.16, 4.06], [0.26, 3.95], [0.36, 3.84], [0.47, 3.74], [0.57, 3.63], [0.66, 3.53], [0.75, 3.42], [0.82, 3.3], [0.9, 3.19], [0.97, 3.07], [1.08, 2.94], [1.2, 2.82], [1.32, 2.7], [1.41, 2.58], [1.5, 2.46], [1.58, 2.34], [1.67, 2.21], [1.8, 2.06], [1.95, 1.88], [2.11, 1.7], [2.25, 1.52], [2.39, 1.35], [2.52, 1.19], [2.64, 1.02], [2.76, 0.85], [2.89, 0.67], [3.01, 0.5], [3.11, 0.41], [3.23, 0.36], [3.35, 0.32], [3.47, 0.27], [3.6, 0.24], [3.73, 0.21], [3.86, 0.17], [3.98, 0.14], [4.11, 0.1], [4.24, 0.07], [4.37, 0.04], [4.5, 0.01], [4.63, -0.02], [4.77, -0.04], [4.91, -0.07], [5.05, -0.09]], [[-0.43, 4.91], [-0.39, 4.81], [-0.34, 4.72], [-0.29, 4.62], [-0.22, 4.52], [-0.14, 4.42], [-0.05, 4.31], [0.04, 4.2], [0.14, 4.09], [0.25, 3.98], [0.36, 3.87], [0.46, 3.76], [0.56, 3.65], [0.65, 3.54], [0.73, 3.42], [0.8, 3.3], [0.88, 3.18], [1.0, 3.05], [1.12, 2.93], [1.24, 2.8], [1.33, 2.68], [1.42, 2.55], [1.51, 2.43], [1.6, 2.3], [1.74, 2.14], [1.89, 1.96], [2.05, 1.78], [2.2, 1.59], [2.33, 1.42], [2.46, 1.25], [2.59, 1.09], [2.71, 0.91], [2.83, 0.73], [2.95, 0.56], [3.06, 0.43], [3.18, 0.39], [3.29, 0.34], [3.41, 0.29], [3.53, 0.26], [3.66, 0.22], [3.79, 0.19], [3.91, 0.16], [4.04, 0.12], [4.17, 0.09], [4.29, 0.06], [4.42, 0.03], [4.55, -0.0], [4.69, -0.03], [4.82, -0.05], [4.96, -0.08]], [[-0.48, 4.73], [-0.44, 4.65], [-0.39, 4.55], [-0.34, 4.46], [-0.27, 4.36], [-0.2, 4.26], [-0.11, 4.17], [-0.01, 4.06], [0.09, 3.95], [0.19, 3.85], [0.3, 3.75], [0.41, 3.64], [0.51, 3.54], [0.6, 3.42], [0.68, 3.31], [0.76, 3.2], [0.84, 3.08], [0.95, 2.95], [1.07, 2.83], [1.19, 2.71], [1.29, 2.59], [1.37, 2.46], [1.46, 2.34], [1.55, 2.21], [1.68, 2.06], [1.83, 1.88], [1.99, 1.69], [2.13, 1.51], [2.27, 1.34], [2.39, 1.17], [2.51, 1.0], [2.63, 0.82], [2.75, 0.65], [2.87, 0.47], [2.97, 0.37], [3.08, 0.32], [3.19, 0.27], [3.3, 0.22], [3.43, 0.18], [3.55, 0.14], [3.67, 0.11], [3.79, 0.07], [3.92, 0.04], [4.04, 0.0], [4.16, -0.03], [4.29, -0.06], [4.41, -0.09], [4.55, -0.12], [4.68, -0.15], [4.81, -0.18]], [[-0.37, 4.75], [-0.32, 4.65], [-0.27, 4.56], [-0.2, 4.47], [-0.12, 4.37], [-0.03, 4.27], [0.05, 4.18], [0.14, 4.07], [0.24, 3.97], [0.35, 3.87], [0.45, 3.77], [0.56, 3.66], [0.66, 3.56], [0.74, 3.45], [0.82, 3.34], [0.89, 3.22], [0.97, 3.11], [1.08, 2.98], [1.2, 2.86], [1.32, 2.74], [1.41, 2.62], [1.49, 2.5], [1.57, 2.38], [1.66, 2.25], [1.78, 2.11], [1.93, 1.93], [2.08, 1.75], [2.22, 1.57], [2.35, 1.4], [2.48, 1.24], [2.6, 1.08], [2.72, 0.9], [2.84, 0.73], [2.96, 0.56], [3.06, 0.44], [3.18, 0.39], [3.29, 0.34], [3.41, 0.3], [3.53, 0.26], [3.66, 0.23], [3.78, 0.19], [3.91, 0.16], [4.03, 0.13], [4.16, 0.09], [4.29, 0.06], [4.41, 0.03], [4.54, 0.0], [4.68, -0.02], [4.81, -0.05], [4.95, -0.07]], [[-0.42, 4.7], [-0.37, 4.61], [-0.33, 4.52], [-0.26, 4.43], [-0.19, 4.34], [-0.1, 4.25], [-0.02, 4.15], [0.08, 4.05], [0.18, 3.95], [0.29, 3.85], [0.4, 3.76], [0.51, 3.66], [0.61, 3.56], [0.69, 3.45], [0.77, 3.34], [0.85, 3.23], [0.93, 3.12], [1.05, 3.0], [1.17, 2.88], [1.29, 2.76], [1.38, 2.65], [1.47, 2.53], [1.55, 2.41], [1.64, 2.29], [1.76, 2.15], [1.91, 1.97], [2.06, 1.79], [2.21, 1.62], [2.34, 1.46], [2.47, 1.3], [2.59, 1.14], [2.71, 0.98], [2.83, 0.81], [2.95, 0.64], [3.06, 0.5], [3.18, 0.45], [3.29, 0.4], [3.41, 0.36], [3.53, 0.32], [3.65, 0.29], [3.78, 0.26], [3.9, 0.23], [4.03, 0.2], [4.15, 0.17], [4.28, 0.14], [4.4, 0.11], [4.53, 0.08], [4.66, 0.05], [4.8, 0.03], [4.93, 0.01]], [[-0.41, 4.59], [-0.36, 4.5], [-0.31, 4.42], [-0.25, 4.33], [-0.17, 4.24], [-0.08, 4.15], [0.01, 4.05], [0.1, 3.95], [0.2, 3.85], [0.31, 3.76], [0.42, 3.67], [0.53, 3.57], [0.63, 3.48], [0.72, 3.37], [0.8, 3.27], [0.88, 3.16], [0.96, 3.05], [1.08, 2.93], [1.2, 2.82], [1.32, 2.7], [1.42, 2.59], [1.5, 2.47], [1.59, 2.36], [1.68, 2.24], [1.8, 2.1], [1.95, 1.93], [2.1, 1.75], [2.24, 1.58], [2.38, 1.42], [2.51, 1.27], [2.63, 1.11], [2.75, 0.94], [2.87, 0.78], [2.99, 0.61], [3.11, 0.47], [3.22, 0.42], [3.34, 0.38], [3.45, 0.33], [3.58, 0.29], [3.7, 0.26], [3.83, 0.23], [3.96, 0.19], [4.08, 0.16], [4.21, 0.13], [4.34, 0.1], [4.46, 0.07], [4.59, 0.04], [4.73, 0.01], [4.86, -0.01], [5.0, -0.04]], [[-0.37, 4.5], [-0.32, 4.41], [-0.26, 4.32], [-0.2, 4.24], [-0.11, 4.15], [-0.02, 4.06], [0.07, 3.97], [0.16, 3.87], [0.26, 3.78], [0.37, 3.69], [0.48, 3.6], [0.59, 3.5], [0.69, 3.41], [0.78, 3.31], [0.86, 3.21], [0.93, 3.1], [1.02, 3.0], [1.13, 2.88], [1.25, 2.77], [1.37, 2.66], [1.46, 2.54], [1.55, 2.43], [1.63, 2.31], [1.71, 2.2], [1.83, 2.06], [1.98, 1.89], [2.13, 1.72], [2.26, 1.55], [2.39, 1.39], [2.52, 1.24], [2.64, 1.08], [2.76, 0.91], [2.88, 0.75], [3.0, 0.58], [3.11, 0.44], [3.22, 0.39], [3.34, 0.35], [3.45, 0.3], [3.57, 0.26], [3.7, 0.22], [3.82, 0.19], [3.95, 0.16], [4.07, 0.12], [4.2, 0.09], [4.32, 0.06], [4.45, 0.02], [4.58, -0.01], [4.71, -0.04], [4.84, -0.06], [4.98, -0.09]], [[-0.38, 4.49], [-0.33, 4.41], [-0.27, 4.32], [-0.2, 4.24], [-0.12, 4.15], [-0.03, 4.06], [0.06, 3.97], [0.15, 3.88], [0.26, 3.78], [0.37, 3.7], [0.48, 3.61], [0.59, 3.52], [0.69, 3.42], [0.77, 3.32], [0.86, 3.22], [0.93, 3.12], [1.02, 3.01], [1.13, 2.89], [1.25, 2.78], [1.37, 2.67], [1.47, 2.56], [1.55, 2.45], [1.63, 2.33], [1.71, 2.22], [1.83, 2.08], [1.98, 1.91], [2.14, 1.74], [2.27, 1.57], [2.4, 1.41], [2.52, 1.26], [2.65, 1.11], [2.76, 0.94], [2.88, 0.77], [3.0, 0.61], [3.11, 0.45], [3.22, 0.39], [3.34, 0.34], [3.45, 0.29], [3.57, 0.25], [3.69, 0.21], [3.82, 0.18], [3.94, 0.14], [4.07, 0.11], [4.19, 0.08], [4.32, 0.04], [4.44, 0.01], [4.57, -0.03], [4.7, -0.06], [4.83, -0.08], [4.97, -0.11]], [[-0.35, 4.48], [-0.3, 4.4], [-0.24, 4.31], [-0.17, 4.23], [-0.08, 4.14], [0.0, 4.05], [0.1, 3.96], [0.19, 3.86], [0.29, 3.77], [0.4, 3.68], [0.51, 3.6], [0.62, 3.51], [0.72, 3.41], [0.81, 3.31], [0.89, 3.21], [0.97, 3.11], [1.05, 3.0], [1.17, 2.89], [1.29, 2.78], [1.41, 2.67], [1.5, 2.55], [1.58, 2.44], [1.67, 2.33], [1.74, 2.22], [1.86, 2.08], [2.01, 1.91], [2.17, 1.73], [2.3, 1.57], [2.43, 1.41], [2.55, 1.26], [2.67, 1.1], [2.79, 0.93], [2.91, 0.77], [3.03, 0.6], [3.13, 0.44], [3.25, 0.38], [3.37, 0.33], [3.48, 0.28], [3.6, 0.24], [3.72, 0.2], [3.85, 0.16], [3.97, 0.13], [4.1, 0.09], [4.22, 0.06], [4.35, 0.02], [4.47, -0.02], [4.6, -0.05], [4.73, -0.08], [4.86, -0.11], [5.0, -0.14]], [[-0.47, 4.53], [-0.42, 4.45], [-0.38, 4.37], [-0.32, 4.29], [-0.25, 4.21], [-0.17, 4.12], [-0.07, 4.04], [0.03, 3.94], [0.14, 3.85], [0.25, 3.76], [0.36, 3.67], [0.48, 3.58], [0.58, 3.49], [0.68, 3.39], [0.76, 3.29], [0.84, 3.19], [0.93, 3.08], [1.05, 2.96], [1.17, 2.85], [1.3, 2.74], [1.39, 2.63], [1.48, 2.52], [1.57, 2.4], [1.66, 2.28], [1.78, 2.15], [1.93, 1.98], [2.08, 1.8], [2.22, 1.63], [2.35, 1.47], [2.48, 1.32], [2.6, 1.17], [2.72, 1.0], [2.83, 0.83], [2.95, 0.67], [3.06, 0.5], [3.17, 0.42], [3.29, 0.37], [3.4, 0.32], [3.52, 0.28], [3.63, 0.24], [3.75, 0.2], [3.88, 0.17], [4.0, 0.13], [4.12, 0.1], [4.24, 0.06], [4.36, 0.03], [4.49, -0.01], [4.61, -0.04], [4.74, -0.07], [4.87, -0.09]], [[-0.42, 4.56], [-0.37, 4.49], [-0.32, 4.41], [-0.27, 4.33], [-0.2, 4.25], [-0.1, 4.16], [-0.01, 4.08], [0.09, 3.98], [0.2, 3.89], [0.31, 3.8], [0.42, 3.71], [0.54, 3.62], [0.65, 3.53], [0.74, 3.43], [0.82, 3.33], [0.9, 3.23], [0.99, 3.12], [1.11, 3.01], [1.24, 2.9], [1.36, 2.79], [1.46, 2.67], [1.55, 2.56], [1.63, 2.45], [1.72, 2.33], [1.85, 2.2], [2.0, 2.03], [2.15, 1.86], [2.29, 1.69], [2.43, 1.54], [2.56, 1.39], [2.68, 1.24], [2.81, 1.07], [2.93, 0.91], [3.05, 0.75], [3.16, 0.59], [3.29, 0.51], [3.41, 0.45], [3.52, 0.4], [3.65, 0.36], [3.77, 0.33], [3.89, 0.29], [4.02, 0.26], [4.15, 0.23], [4.27, 0.19], [4.4, 0.16], [4.53, 0.13], [4.65, 0.1], [4.78, 0.07], [4.92, 0.04], [5.06, 0.02]], [[-0.49, 4.49], [-0.44, 4.41], [-0.39, 4.34], [-0.34, 4.26], [-0.27, 4.18], [-0.19, 4.09], [-0.09, 4.01], [0.01, 3.91], [0.12, 3.82], [0.24, 3.73], [0.36, 3.64], [0.48, 3.55], [0.59, 3.46], [0.69, 3.36], [0.78, 3.26], [0.86, 3.15], [0.96, 3.05], [1.08, 2.93], [1.21, 2.82], [1.34, 2.71], [1.44, 2.6], [1.53, 2.48], [1.62, 2.37], [1.72, 2.25], [1.84, 2.11], [2.0, 1.94], [2.16, 1.77], [2.3, 1.6], [2.44, 1.44], [2.57, 1.29], [2.69, 1.14], [2.82, 0.97], [2.94, 0.81], [3.07, 0.64], [3.18, 0.48], [3.31, 0.41], [3.42, 0.36], [3.54, 0.31], [3.66, 0.27], [3.79, 0.23], [3.91, 0.19], [4.04, 0.16], [4.17, 0.12], [4.3, 0.09], [4.43, 0.05], [4.56, 0.02], [4.69, -0.02], [4.82, -0.05], [4.96, -0.08], [5.09, -0.1]], [[-0.61, 4.54], [-0.56, 4.46], [-0.51, 4.38], [-0.46, 4.31], [-0.41, 4.23], [-0.34, 4.15], [-0.25, 4.07], [-0.15, 3.98], [-0.04, 3.89], [0.09, 3.79], [0.21, 3.7], [0.34, 3.61], [0.46, 3.52], [0.55, 3.42], [0.65, 3.31], [0.74, 3.21], [0.83, 3.1], [0.96, 2.98], [1.1, 2.86], [1.23, 2.75], [1.33, 2.64], [1.42, 2.52], [1.52, 2.41], [1.62, 2.29], [1.76, 2.14], [1.91, 1.97], [2.07, 1.8], [2.22, 1.63], [2.36, 1.47], [2.49, 1.31], [2.62, 1.16], [2.75, 0.99], [2.87, 0.83], [2.99, 0.66], [3.11, 0.5], [3.22, 0.42], [3.34, 0.37], [3.46, 0.32], [3.58, 0.28], [3.7, 0.24], [3.82, 0.2], [3.95, 0.17], [4.07, 0.14], [4.2, 0.1], [4.32, 0.07], [4.45, 0.03], [4.58, -0.0], [4.7, -0.03], [4.84, -0.06], [4.97, -0.09]], [[-0.61, 4.57], [-0.56, 4.49], [-0.51, 4.41], [-0.45, 4.33], [-0.4, 4.26], [-0.33, 4.18], [-0.24, 4.09], [-0.14, 4.0], [-0.03, 3.9], [0.1, 3.81], [0.23, 3.72], [0.35, 3.62], [0.48, 3.53], [0.58, 3.42], [0.67, 3.32], [0.76, 3.21], [0.86, 3.1], [0.99, 2.98], [1.13, 2.86], [1.26, 2.75], [1.37, 2.63], [1.46, 2.51], [1.56, 2.4], [1.66, 2.28], [1.8, 2.13], [1.96, 1.96], [2.13, 1.78], [2.27, 1.61], [2.41, 1.44], [2.55, 1.29], [2.68, 1.14], [2.81, 0.97], [2.93, 0.8], [3.06, 0.63], [3.18, 0.47], [3.3, 0.4], [3.42, 0.35], [3.54, 0.31], [3.66, 0.26], [3.78, 0.22], [3.91, 0.18], [4.04, 0.15], [4.17, 0.11], [4.3, 0.08], [4.43, 0.04], [4.56, 0.01], [4.68, -0.03], [4.82, -0.06], [4.95, -0.09], [5.09, -0.12]], [[-0.64, 4.65], [-0.59, 4.57], [-0.54, 4.49], [-0.49, 4.4], [-0.43, 4.32], [-0.36, 4.25], [-0.28, 4.16], [-0.18, 4.07], [-0.06, 3.97], [0.06, 3.88], [0.19, 3.78], [0.32, 3.68], [0.44, 3.59], [0.54, 3.48], [0.64, 3.38], [0.73, 3.27], [0.82, 3.16], [0.96, 3.03], [1.09, 2.92], [1.22, 2.8], [1.33, 2.69], [1.42, 2.57], [1.52, 2.45], [1.62, 2.33], [1.76, 2.19], [1.92, 2.01], [2.08, 1.84], [2.23, 1.67], [2.37, 1.51], [2.5, 1.35], [2.63, 1.2], [2.76, 1.03], [2.88, 0.87], [3.0, 0.7], [3.12, 0.54], [3.24, 0.46], [3.36, 0.41], [3.48, 0.36], [3.6, 0.32], [3.72, 0.28], [3.84, 0.25], [3.97, 0.21], [4.1, 0.18], [4.22, 0.15], [4.35, 0.11], [4.47, 0.08], [4.6, 0.05], [4.73, 0.02], [4.87, -0.01], [5.0, -0.04]], [[-0.52, 4.48], [-0.47, 4.4], [-0.42, 4.32], [-0.36, 4.24], [-0.29, 4.15], [-0.2, 4.06], [-0.09, 3.96], [0.01, 3.87], [0.13, 3.77], [0.25, 3.68], [0.37, 3.59], [0.5, 3.49], [0.61, 3.4], [0.71, 3.3], [0.81, 3.19], [0.89, 3.09], [0.99, 2.98], [1.12, 2.86], [1.25, 2.75], [1.38, 2.63], [1.48, 2.52], [1.57, 2.41], [1.67, 2.29], [1.76, 2.17], [1.89, 2.03], [2.05, 1.86], [2.21, 1.68], [2.35, 1.51], [2.48, 1.35], [2.62, 1.2], [2.75, 1.04], [2.87, 0.87], [3.0, 0.71], [3.12, 0.54], [3.23, 0.4], [3.35, 0.35], [3.47, 0.3], [3.59, 0.25], [3.72, 0.2], [3.84, 0.16], [3.97, 0.13], [4.1, 0.09], [4.23, 0.05], [4.36, 0.01], [4.5, -0.02], [4.63, -0.06], [4.76, -0.09], [4.89, -0.13], [5.03, -0.15], [5.17, -0.18]], [[-0.72, 4.79], [-0.66, 4.7], [-0.61, 4.61], [-0.55, 4.53], [-0.5, 4.44], [-0.44, 4.36], [-0.36, 4.28], [-0.26, 4.19], [-0.15, 4.09], [-0.02, 3.99], [0.11, 3.89], [0.24, 3.79], [0.37, 3.68], [0.48, 3.57], [0.58, 3.46], [0.67, 3.35], [0.77, 3.23], [0.91, 3.11], [1.04, 2.99], [1.18, 2.87], [1.29, 2.75], [1.39, 2.63], [1.48, 2.51], [1.59, 2.38], [1.74, 2.23], [1.91, 2.05], [2.07, 1.87], [2.22, 1.7], [2.36, 1.53], [2.49, 1.38], [2.62, 1.22], [2.75, 1.05], [2.88, 0.88], [3.0, 0.72], [3.12, 0.55], [3.24, 0.48], [3.36, 0.42], [3.47, 0.38], [3.6, 0.34], [3.72, 0.3], [3.84, 0.26], [3.97, 0.23], [4.09, 0.2], [4.22, 0.17], [4.35, 0.13], [4.47, 0.1], [4.6, 0.07], [4.73, 0.04], [4.87, 0.01], [5.0, -0.01]], [[-0.64, 4.66], [-0.58, 4.58], [-0.53, 4.5], [-0.48, 4.41], [-0.42, 4.33], [-0.34, 4.24], [-0.24, 4.15], [-0.14, 4.05], [-0.02, 3.95], [0.11, 3.85], [0.24, 3.75], [0.37, 3.65], [0.49, 3.55], [0.59, 3.44], [0.69, 3.33], [0.78, 3.22], [0.88, 3.11], [1.02, 2.98], [1.15, 2.86], [1.29, 2.74], [1.4, 2.63], [1.49, 2.51], [1.59, 2.39], [1.69, 2.27], [1.83, 2.12], [1.99, 1.94], [2.15, 1.77], [2.29, 1.59], [2.43, 1.43], [2.57, 1.27], [2.7, 1.11], [2.83, 0.94], [2.95, 0.77], [3.07, 0.61], [3.19, 0.46], [3.31, 0.4], [3.43, 0.35], [3.55, 0.3], [3.67, 0.26], [3.8, 0.22], [3.92, 0.18], [4.05, 0.15], [4.18, 0.11], [4.31, 0.07], [4.44, 0.04], [4.57, 0.0], [4.7, -0.03], [4.83, -0.06], [4.97, -0.09], [5.11, -0.11]], [[-0.69, 4.74], [-0.63, 4.65], [-0.58, 4.57], [-0.52, 4.48], [-0.47, 4.4], [-0.39, 4.31], [-0.3, 4.21], [-0.19, 4.11], [-0.07, 4.01], [0.06, 3.91], [0.19, 3.8], [0.32, 3.7], [0.45, 3.6], [0.55, 3.49], [0.65, 3.38], [0.74, 3.26], [0.85, 3.15], [0.98, 3.02], [1.12, 2.9], [1.26, 2.78], [1.37, 2.66], [1.46, 2.54], [1.56, 2.42], [1.66, 2.3], [1.81, 2.15], [1.97, 1.97], [2.13, 1.79], [2.28, 1.61], [2.42, 1.45], [2.55, 1.29], [2.68, 1.13], [2.81, 0.96], [2.94, 0.79], [3.06, 0.62], [3.18, 0.47], [3.3, 0.41], [3.41, 0.36], [3.53, 0.31], [3.65, 0.27], [3.78, 0.23], [3.91, 0.19], [4.03, 0.16], [4.16, 0.12], [4.29, 0.09], [4.42, 0.05], [4.55, 0.02], [4.68, -0.01], [4.81, -0.04], [4.95, -0.07], [5.09, -0.1]], [[-0.7, 4.73], [-0.65, 4.65], [-0.59, 4.56], [-0.54, 4.47], [-0.48, 4.39], [-0.41, 4.3], [-0.31, 4.21], [-0.2, 4.11], [-0.08, 4.0], [0.05, 3.9], [0.18, 3.79], [0.31, 3.69], [0.45, 3.59], [0.55, 3.48], [0.65, 3.37], [0.75, 3.25], [0.85, 3.13], [0.99, 3.01], [1.13, 2.88], [1.26, 2.76], [1.37, 2.64], [1.47, 2.52], [1.57, 2.4], [1.67, 2.28], [1.81, 2.13], [1.98, 1.95], [2.14, 1.77], [2.29, 1.59], [2.43, 1.43], [2.56, 1.27], [2.69, 1.11], [2.82, 0.94], [2.95, 0.77], [3.07, 0.6], [3.19, 0.45], [3.3, 0.39], [3.42, 0.34], [3.54, 0.3], [3.67, 0.25], [3.79, 0.21], [3.92, 0.18], [4.05, 0.14], [4.18, 0.11], [4.3, 0.07], [4.43, 0.03], [4.56, -0.0], [4.69, -0.03], [4.83, -0.07], [4.96, -0.09], [5.1, -0.12]], [[-0.7, 4.75], [-0.64, 4.67], [-0.59, 4.58], [-0.53, 4.49], [-0.48, 4.4], [-0.4, 4.31], [-0.3, 4.21], [-0.19, 4.11], [-0.06, 4.0], [0.07, 3.9], [0.2, 3.79], [0.33, 3.69], [0.46, 3.58], [0.57, 3.47], [0.67, 3.36], [0.76, 3.24], [0.87, 3.13], [1.01, 3.0], [1.14, 2.88], [1.28, 2.75], [1.39, 2.63], [1.49, 2.51], [1.59, 2.39], [1.69, 2.27], [1.84, 2.12], [2.0, 1.94], [2.16, 1.76], [2.31, 1.58], [2.45, 1.41], [2.58, 1.26], [2.71, 1.1], [2.84, 0.93], [2.97, 0.76], [3.09, 0.58], [3.21, 0.44], [3.33, 0.38], [3.45, 0.33], [3.57, 0.28], [3.69, 0.24], [3.82, 0.2], [3.95, 0.16], [4.08, 0.13], [4.21, 0.09], [4.34, 0.05], [4.47, 0.02], [4.6, -0.02], [4.73, -0.05], [4.86, -0.08], [5.0, -0.11], [5.14, -0.14]], [[-0.74, 4.8], [-0.68, 4.72], [-0.63, 4.63], [-0.57, 4.54], [-0.51, 4.45], [-0.44, 4.36], [-0.34, 4.26], [-0.23, 4.15], [-0.11, 4.04], [0.03, 3.94], [0.16, 3.83], [0.29, 3.73], [0.43, 3.62], [0.53, 3.51], [0.64, 3.4], [0.73, 3.28], [0.83, 3.16], [0.97, 3.03], [1.11, 2.91], [1.25, 2.78], [1.36, 2.66], [1.46, 2.54], [1.56, 2.42], [1.67, 2.29], [1.81, 2.14], [1.98, 1.96], [2.14, 1.78], [2.29, 1.6], [2.43, 1.43], [2.56, 1.28], [2.69, 1.12], [2.82, 0.94], [2.95, 0.77], [3.07, 0.6], [3.19, 0.45], [3.31, 0.39], [3.43, 0.34], [3.54, 0.29], [3.67, 0.25], [3.79, 0.21], [3.92, 0.17], [4.05, 0.14], [4.18, 0.1], [4.31, 0.07], [4.44, 0.03], [4.56, -0.0], [4.69, -0.04], [4.83, -0.07], [4.97, -0.09], [5.11, -0.12]], [[-0.76, 4.84], [-0.71, 4.75], [-0.65, 4.66], [-0.59, 4.57], [-0.54, 4.48], [-0.46, 4.39], [-0.37, 4.3], [-0.26, 4.19], [-0.14, 4.08], [-0.0, 3.98], [0.13, 3.87], [0.26, 3.76], [0.4, 3.66], [0.5, 3.55], [0.61, 3.43], [0.7, 3.31], [0.81, 3.19], [0.95, 3.06], [1.09, 2.94], [1.22, 2.82], [1.34, 2.69], [1.43, 2.57], [1.53, 2.45], [1.64, 2.32], [1.79, 2.17], [1.95, 1.99], [2.12, 1.81], [2.27, 1.63], [2.41, 1.46], [2.54, 1.31], [2.67, 1.15], [2.8, 0.98], [2.93, 0.81], [3.05, 0.64], [3.17, 0.48], [3.29, 0.42], [3.41, 0.37], [3.52, 0.32], [3.65, 0.28], [3.77, 0.24], [3.9, 0.2], [4.03, 0.17], [4.15, 0.13], [4.28, 0.1], [4.41, 0.06], [4.54, 0.03], [4.67, -0.01], [4.8, -0.04], [4.94, -0.06], [5.08, -0.09]], [[-0.75, 4.82], [-0.69, 4.73], [-0.63, 4.64], [-0.58, 4.55], [-0.52, 4.45], [-0.44, 4.36], [-0.34, 4.26], [-0.23, 4.16], [-0.1, 4.04], [0.03, 3.94], [0.17, 3.83], [0.3, 3.73], [0.43, 3.62], [0.54, 3.51], [0.64, 3.39], [0.74, 3.27], [0.84, 3.15], [0.98, 3.02], [1.12, 2.9], [1.26, 2.78], [1.37, 2.65], [1.47, 2.53], [1.57, 2.41], [1.68, 2.28], [1.82, 2.13], [1.99, 1.95], [2.15, 1.77], [2.3, 1.59], [2.44, 1.42], [2.58, 1.26], [2.71, 1.1], [2.84, 0.93], [2.96, 0.76], [3.09, 0.59], [3.21, 0.44], [3.33, 0.38], [3.44, 0.33], [3.56, 0.28], [3.69, 0.24], [3.81, 0.2], [3.94, 0.16], [4.07, 0.12], [4.2, 0.09], [4.33, 0.05], [4.46, 0.02], [4.59, -0.02], [4.72, -0.05], [4.86, -0.08], [5.0, -0.11], [5.14, -0.14]], [[-0.63, 4.63], [-0.58, 4.54], [-0.52, 4.45], [-0.46, 4.36], [-0.37, 4.26], [-0.27, 4.16], [-0.16, 4.05], [-0.04, 3.94], [0.08, 3.83], [0.21, 3.73], [0.34, 3.62], [0.47, 3.52], [0.6, 3.42], [0.7, 3.31], [0.8, 3.2], [0.89, 3.08], [0.99, 2.97], [1.13, 2.84], [1.27, 2.72], [1.41, 2.6], [1.52, 2.48], [1.61, 2.36], [1.71, 2.24], [1.81, 2.12], [1.94, 1.97], [2.11, 1.78], [2.27, 1.6], [2.41, 1.42], [2.56, 1.25], [2.69, 1.1], [2.83, 0.93], [2.96, 0.75], [3.09, 0.58], [3.21, 0.4], [3.32, 0.3], [3.44, 0.25], [3.56, 0.2], [3.69, 0.14], [3.82, 0.09], [3.95, 0.05], [4.08, 0.01], [4.22, -0.03], [4.35, -0.07], [4.49, -0.11], [4.62, -0.15], [4.76, -0.19], [4.9, -0.22], [5.04, -0.26], [5.18, -0.29], [5.33, -0.32]], [[-0.81, 4.87], [-0.76, 4.78], [-0.7, 4.69], [-0.64, 4.6], [-0.58, 4.51], [-0.52, 4.42], [-0.43, 4.33], [-0.33, 4.24], [-0.21, 4.13], [-0.07, 4.02], [0.06, 3.91], [0.2, 3.81], [0.34, 3.7], [0.45, 3.58], [0.55, 3.47], [0.65, 3.35], [0.76, 3.23], [0.9, 3.1], [1.04, 2.97], [1.18, 2.85], [1.3, 2.73], [1.39, 2.6], [1.5, 2.48], [1.61, 2.35], [1.76, 2.2], [1.92, 2.02], [2.09, 1.84], [2.24, 1.66], [2.38, 1.49], [2.51, 1.33], [2.64, 1.17], [2.78, 1.0], [2.9, 0.83], [3.03, 0.66], [3.15, 0.5], [3.27, 0.44], [3.38, 0.39], [3.5, 0.35], [3.62, 0.31], [3.75, 0.27], [3.87, 0.23], [4.0, 0.2], [4.13, 0.16], [4.26, 0.13], [4.38, 0.1], [4.51, 0.06], [4.64, 0.03], [4.77, 0.0], [4.91, -0.03], [5.04, -0.05]], [[-0.75, 4.77], [-0.69, 4.68], [-0.64, 4.59], [-0.58, 4.5], [-0.52, 4.41], [-0.44, 4.33], [-0.35, 4.23], [-0.23, 4.12], [-0.11, 4.01], [0.03, 3.91], [0.16, 3.8], [0.3, 3.7], [0.43, 3.59], [0.54, 3.48], [0.65, 3.36], [0.74, 3.25], [0.85, 3.13], [0.99, 3.0], [1.13, 2.87], [1.27, 2.75], [1.38, 2.63], [1.48, 2.51], [1.58, 2.39], [1.69, 2.26], [1.83, 2.11], [1.99, 1.93], [2.16, 1.75], [2.3, 1.57], [2.44, 1.41], [2.58, 1.25], [2.71, 1.09], [2.84, 0.92], [2.97, 0.75], [3.09, 0.57], [3.21, 0.43], [3.33, 0.38], [3.45, 0.33], [3.57, 0.28], [3.69, 0.24], [3.82, 0.2], [3.95, 0.16], [4.08, 0.13], [4.21, 0.09], [4.34, 0.06], [4.47, 0.02], [4.6, -0.01], [4.73, -0.05], [4.87, -0.08], [5.01, -0.1], [5.14, -0.13]], [[-0.78, 4.82], [-0.73, 4.73], [-0.67, 4.64], [-0.61, 4.55], [-0.55, 4.46], [-0.48, 4.37], [-0.38, 4.27], [-0.27, 4.17], [-0.14, 4.06], [-0.01, 3.95], [0.13, 3.84], [0.27, 3.74], [0.4, 3.63], [0.51, 3.52], [0.62, 3.4], [0.71, 3.28], [0.82, 3.16], [0.96, 3.03], [1.1, 2.91], [1.24, 2.78], [1.36, 2.66], [1.45, 2.54], [1.55, 2.42], [1.66, 2.29], [1.81, 2.14], [1.97, 1.96], [2.14, 1.78], [2.28, 1.6], [2.43, 1.43], [2.56, 1.27], [2.69, 1.11], [2.82, 0.94], [2.95, 0.77], [3.07, 0.6], [3.19, 0.45], [3.31, 0.4], [3.43, 0.35], [3.55, 0.3], [3.67, 0.26], [3.8, 0.22], [3.93, 0.18], [4.06, 0.15], [4.19, 0.11], [4.31, 0.08], [4.44, 0.04], [4.57, 0.01], [4.7, -0.03], [4.84, -0.05], [4.98, -0.08], [5.12, -0.11]], [[-0.78, 4.8], [-0.72, 4.71], [-0.66, 4.62], [-0.61, 4.53], [-0.55, 4.44], [-0.48, 4.36], [-0.4, 4.28], [-0.3, 4.18], [-0.18, 4.08], [-0.04, 3.97], [0.1, 3.86], [0.24, 3.75], [0.37, 3.65], [0.49, 3.53], [0.6, 3.42], [0.69, 3.3], [0.8, 3.18], [0.95, 3.05], [1.09, 2.92], [1.23, 2.8], [1.35, 2.68], [1.44, 2.56], [1.55, 2.43], [1.66, 2.3], [1.8, 2.15], [1.97, 1.97], [2.14, 1.79], [2.28, 1.61], [2.42, 1.44], [2.56, 1.28], [2.69, 1.12], [2.82, 0.95], [2.95, 0.78], [3.08, 0.6], [3.2, 0.46], [3.32, 0.41], [3.43, 0.36], [3.55, 0.31], [3.68, 0.27], [3.8, 0.23], [3.93, 0.19], [4.06, 0.16], [4.19, 0.12], [4.32, 0.09], [4.45, 0.05], [4.58, 0.02], [4.71, -0.01], [4.85, -0.04], [4.99, -0.07], [5.13, -0.1]], [[-0.74, 4.75], [-0.68, 4.66], [-0.63, 4.57], [-0.57, 4.48], [-0.51, 4.4], [-0.44, 4.31], [-0.36, 4.22], [-0.25, 4.12], [-0.12, 4.02], [0.01, 3.91], [0.15, 3.8], [0.29, 3.7], [0.43, 3.59], [0.54, 3.48], [0.65, 3.36], [0.75, 3.25], [0.85, 3.13], [1.0, 3.0], [1.14, 2.87], [1.28, 2.75], [1.4, 2.62], [1.49, 2.5], [1.6, 2.38], [1.71, 2.25], [1.85, 2.1], [2.02, 1.92], [2.18, 1.73], [2.33, 1.55], [2.47, 1.39], [2.6, 1.23], [2.74, 1.07], [2.87, 0.89], [3.0, 0.72], [3.13, 0.55], [3.24, 0.42], [3.36, 0.36], [3.48, 0.31], [3.6, 0.26], [3.73, 0.22], [3.86, 0.18], [3.99, 0.14], [4.12, 0.11], [4.26, 0.07], [4.39, 0.03], [4.52, -0.0], [4.65, -0.04], [4.79, -0.07], [4.92, -0.1], [5.07, -0.13], [5.21, -0.16]], [[-0.64, 4.57], [-0.58, 4.49], [-0.53, 4.41], [-0.47, 4.32], [-0.41, 4.25], [-0.34, 4.17], [-0.25, 4.08], [-0.14, 3.99], [-0.02, 3.88], [0.12, 3.78], [0.25, 3.68], [0.39, 3.58], [0.52, 3.48], [0.63, 3.38], [0.73, 3.27], [0.83, 3.16], [0.93, 3.04], [1.07, 2.92], [1.21, 2.8], [1.35, 2.68], [1.46, 2.57], [1.55, 2.45], [1.65, 2.33], [1.74, 2.21], [1.87, 2.07], [2.03, 1.89], [2.19, 1.72], [2.32, 1.55], [2.46, 1.38], [2.59, 1.23], [2.72, 1.08], [2.85, 0.91], [2.98, 0.75], [3.11, 0.58], [3.22, 0.45], [3.34, 0.4], [3.46, 0.36], [3.58, 0.31], [3.7, 0.27], [3.83, 0.23], [3.96, 0.2], [4.09, 0.16], [4.22, 0.13], [4.34, 0.09], [4.47, 0.06], [4.6, 0.03], [4.74, -0.01], [4.87, -0.03], [5.01, -0.06], [5.15, -0.09]], [[-0.65, 4.59], [-0.6, 4.51], [-0.54, 4.42], [-0.49, 4.34], [-0.43, 4.26], [-0.35, 4.19], [-0.27, 4.11], [-0.16, 4.02], [-0.04, 3.92], [0.09, 3.82], [0.23, 3.72], [0.36, 3.62], [0.49, 3.52], [0.6, 3.42], [0.7, 3.31], [0.8, 3.2], [0.9, 3.09], [1.04, 2.97], [1.17, 2.85], [1.31, 2.73], [1.42, 2.62], [1.51, 2.5], [1.6, 2.38], [1.69, 2.27], [1.82, 2.13], [1.98, 1.95], [2.13, 1.78], [2.27, 1.61], [2.41, 1.45], [2.53, 1.31], [2.66, 1.16], [2.79, 0.99], [2.91, 0.83], [3.03, 0.67], [3.15, 0.53], [3.27, 0.48], [3.38, 0.44], [3.5, 0.39], [3.62, 0.35], [3.74, 0.32], [3.87, 0.28], [3.99, 0.25], [4.12, 0.22], [4.25, 0.19], [4.37, 0.16], [4.5, 0.13], [4.62, 0.1], [4.76, 0.07], [4.89, 0.05], [5.03, 0.02]], [[-0.62, 4.55], [-0.57, 4.47], [-0.52, 4.39], [-0.46, 4.31], [-0.4, 4.23], [-0.32, 4.16], [-0.23, 4.08], [-0.13, 3.98], [-0.0, 3.88], [0.13, 3.79], [0.26, 3.69], [0.39, 3.59], [0.52, 3.49], [0.63, 3.39], [0.73, 3.29], [0.82, 3.18], [0.92, 3.07], [1.06, 2.95], [1.19, 2.83], [1.33, 2.72], [1.43, 2.6], [1.52, 2.49], [1.61, 2.37], [1.7, 2.26], [1.83, 2.12], [1.98, 1.95], [2.13, 1.78], [2.26, 1.62], [2.4, 1.46], [2.52, 1.32], [2.65, 1.17], [2.77, 1.01], [2.9, 0.85], [3.01, 0.69], [3.13, 0.55], [3.25, 0.5], [3.36, 0.45], [3.48, 0.41], [3.6, 0.37], [3.72, 0.34], [3.84, 0.3], [3.96, 0.27], [4.09, 0.24], [4.21, 0.21], [4.34, 0.18], [4.46, 0.15], [4.59, 0.12], [4.72, 0.1], [4.85, 0.07], [4.99, 0.05]], [[-0.6, 4.58], [-0.55, 4.5], [-0.5, 4.41], [-0.44, 4.34], [-0.38, 4.26], [-0.3, 4.18], [-0.21, 4.1], [-0.11, 4.01], [0.01, 3.91], [0.15, 3.81], [0.28, 3.71], [0.41, 3.61], [0.54, 3.51], [0.64, 3.41], [0.74, 3.31], [0.83, 3.2], [0.93, 3.08], [1.07, 2.96], [1.2, 2.85], [1.33, 2.73], [1.44, 2.62], [1.53, 2.5], [1.62, 2.38], [1.7, 2.27], [1.82, 2.13], [1.98, 1.96], [2.12, 1.79], [2.26, 1.62], [2.39, 1.46], [2.51, 1.32], [2.64, 1.17], [2.76, 1.0], [2.88, 0.84], [2.99, 0.68], [3.11, 0.53], [3.22, 0.47], [3.33, 0.43], [3.45, 0.38], [3.56, 0.34], [3.68, 0.31], [3.8, 0.27], [3.93, 0.24], [4.05, 0.21], [4.17, 0.18], [4.3, 0.14], [4.42, 0.11], [4.54, 0.08], [4.67, 0.05], [4.8, 0.03], [4.93, 0.0]], [[-0.62, 4.58], [-0.56, 4.5], [-0.51, 4.42], [-0.45, 4.34], [-0.39, 4.26], [-0.32, 4.19], [-0.24, 4.11], [-0.15, 4.03], [-0.03, 3.94], [0.1, 3.84], [0.23, 3.74], [0.37, 3.65], [0.5, 3.55], [0.6, 3.44], [0.7, 3.34], [0.8, 3.23], [0.9, 3.12], [1.03, 3.0], [1.17, 2.88], [1.3, 2.77], [1.4, 2.66], [1.49, 2.54], [1.58, 2.42], [1.67, 2.31], [1.79, 2.17], [1.95, 2.0], [2.09, 1.83], [2.22, 1.67], [2.35, 1.51], [2.48, 1.37], [2.6, 1.22], [2.72, 1.05], [2.84, 0.89], [2.96, 0.73], [3.07, 0.58], [3.18, 0.51], [3.3, 0.47], [3.41, 0.43], [3.52, 0.39], [3.64, 0.35], [3.76, 0.32], [3.88, 0.29], [4.0, 0.26], [4.12, 0.23], [4.25, 0.2], [4.37, 0.17], [4.49, 0.14], [4.62, 0.11], [4.75, 0.08], [4.88, 0.06]], [[-0.58, 4.55], [-0.53, 4.47], [-0.48, 4.39], [-0.42, 4.32], [-0.36, 4.24], [-0.29, 4.17], [-0.21, 4.1], [-0.11, 4.01], [0.01, 3.92], [0.14, 3.83], [0.27, 3.73], [0.4, 3.63], [0.53, 3.54], [0.63, 3.43], [0.73, 3.33], [0.82, 3.22], [0.92, 3.11], [1.06, 2.99], [1.19, 2.87], [1.32, 2.76], [1.43, 2.64], [1.52, 2.53], [1.61, 2.41], [1.69, 2.3], [1.81, 2.16], [1.97, 1.99], [2.11, 1.82], [2.24, 1.65], [2.37, 1.49], [2.49, 1.35], [2.61, 1.2], [2.74, 1.04], [2.86, 0.88], [2.97, 0.72], [3.08, 0.57], [3.2, 0.52], [3.31, 0.47], [3.42, 0.43], [3.54, 0.39], [3.65, 0.36], [3.77, 0.33], [3.89, 0.3], [4.02, 0.27], [4.14, 0.24], [4.26, 0.21], [4.38, 0.18], [4.5, 0.15], [4.63, 0.12], [4.76, 0.1], [4.89, 0.07]], [[-0.49, 4.57], [-0.44, 4.49], [-0.38, 4.41], [-0.32, 4.34], [-0.25, 4.26], [-0.18, 4.19], [-0.09, 4.11], [0.01, 4.02], [0.13, 3.92], [0.25, 3.83], [0.38, 3.73], [0.51, 3.63], [0.63, 3.53], [0.73, 3.43], [0.83, 3.33], [0.92, 3.22], [1.02, 3.11], [1.15, 2.98], [1.28, 2.87], [1.41, 2.75], [1.51, 2.64], [1.59, 2.52], [1.67, 2.41], [1.75, 2.29], [1.87, 2.15], [2.02, 1.98], [2.16, 1.81], [2.29, 1.64], [2.42, 1.48], [2.54, 1.34], [2.66, 1.19], [2.78, 1.02], [2.9, 0.87], [3.02, 0.7], [3.13, 0.55], [3.24, 0.5], [3.35, 0.45], [3.46, 0.41], [3.58, 0.37], [3.7, 0.34], [3.82, 0.3], [3.94, 0.27], [4.06, 0.24], [4.19, 0.21], [4.31, 0.18], [4.43, 0.15], [4.56, 0.12], [4.68, 0.09], [4.82, 0.06], [4.95, 0.04]], [[-0.64, 4.36], [-0.58, 4.29], [-0.53, 4.21], [-0.47, 4.14], [-0.41, 4.07], [-0.34, 4.0], [-0.26, 3.93], [-0.17, 3.85], [-0.05, 3.76], [0.08, 3.67], [0.21, 3.58], [0.34, 3.49], [0.48, 3.39], [0.58, 3.29], [0.68, 3.19], [0.78, 3.09], [0.88, 2.98], [1.02, 2.86], [1.15, 2.75], [1.29, 2.64], [1.39, 2.53], [1.48, 2.41], [1.57, 2.3], [1.65, 2.19], [1.78, 2.05], [1.93, 1.88], [2.07, 1.71], [2.2, 1.54], [2.34, 1.38], [2.46, 1.24], [2.58, 1.09], [2.7, 0.92], [2.82, 0.76], [2.93, 0.6], [3.04, 0.47], [3.15, 0.42], [3.26, 0.37], [3.37, 0.32], [3.48, 0.28], [3.6, 0.24], [3.72, 0.21], [3.84, 0.18], [3.96, 0.14], [4.08, 0.11], [4.2, 0.08], [4.32, 0.04], [4.44, 0.01], [4.57, -0.02], [4.7, -0.04], [4.83, -0.07]], [[-0.55, 4.48], [-0.5, 4.4], [-0.45, 4.32], [-0.39, 4.25], [-0.33, 4.18], [-0.25, 4.11], [-0.18, 4.04], [-0.08, 3.95], [0.04, 3.86], [0.17, 3.77], [0.3, 3.68], [0.43, 3.58], [0.56, 3.49], [0.66, 3.38], [0.76, 3.28], [0.86, 3.18], [0.96, 3.07], [1.09, 2.95], [1.22, 2.83], [1.36, 2.72], [1.46, 2.61], [1.54, 2.49], [1.63, 2.38], [1.71, 2.26], [1.83, 2.13], [1.99, 1.96], [2.13, 1.79], [2.26, 1.62], [2.39, 1.46], [2.51, 1.32], [2.64, 1.17], [2.76, 1.0], [2.88, 0.85], [3.0, 0.68], [3.11, 0.54], [3.22, 0.49], [3.33, 0.45], [3.45, 0.4], [3.56, 0.36], [3.68, 0.33], [3.81, 0.29], [3.93, 0.26], [4.05, 0.23], [4.18, 0.2], [4.3, 0.17], [4.42, 0.14], [4.55, 0.11], [4.67, 0.08], [4.81, 0.06], [4.94, 0.04]], [[-0.55, 4.48], [-0.5, 4.4], [-0.45, 4.32], [-0.39, 4.25], [-0.33, 4.18], [-0.25, 4.11], [-0.18, 4.04], [-0.08, 3.95], [0.04, 3.86], [0.17, 3.77], [0.3, 3.68], [0.43, 3.58], [0.56, 3.49], [0.66, 3.38], [0.76, 3.28], [0.86, 3.18], [0.96, 3.07], [1.09, 2.95], [1.22, 2.83], [1.36, 2.72], [1.46, 2.61], [1.54, 2.49], [1.63, 2.38], [1.71, 2.26], [1.83, 2.13], [1.99, 1.96], [2.13, 1.79], [2.26, 1.62], [2.39, 1.46], [2.51, 1.32], [2.64, 1.17], [2.76, 1.0], [2.88, 0.85], [3.0, 0.68], [3.11, 0.54], [3.22, 0.49], [3.33, 0.45], [3.45, 0.4], [3.57, 0.36], [3.68, 0.33], [3.81, 0.29], [3.93, 0.26], [4.05, 0.23], [4.18, 0.2], [4.3, 0.17], [4.42, 0.14], [4.55, 0.11], [4.67, 0.08], [4.81, 0.06], [4.94, 0.04]], [[-0.56, 4.47], [-0.5, 4.4], [-0.45, 4.32], [-0.39, 4.25], [-0.33, 4.17], [-0.26, 4.1], [-0.18, 4.03], [-0.08, 3.95], [0.04, 3.86], [0.17, 3.77], [0.3, 3.67], [0.43, 3.58], [0.56, 3.48], [0.66, 3.38], [0.76, 3.28], [0.85, 3.17], [0.95, 3.06], [1.09, 2.95], [1.22, 2.83], [1.35, 2.72], [1.46, 2.6], [1.54, 2.49], [1.63, 2.37], [1.71, 2.26], [1.83, 2.12], [1.99, 1.95], [2.13, 1.78], [2.26, 1.62], [2.39, 1.46], [2.51, 1.32], [2.63, 1.16], [2.76, 1.0], [2.88, 0.84], [3.0, 0.68], [3.11, 0.54], [3.22, 0.49], [3.33, 0.44], [3.44, 0.4], [3.56, 0.36], [3.68, 0.32], [3.8, 0.29], [3.93, 0.26], [4.05, 0.23], [4.17, 0.2], [4.3, 0.17], [4.42, 0.14], [4.54, 0.11], [4.67, 0.08], [4.8, 0.05], [4.93, 0.03]], [[-0.58, 4.52], [-0.53, 4.44], [-0.48, 4.36], [-0.42, 4.29], [-0.36, 4.21], [-0.28, 4.14], [-0.21, 4.07], [-0.11, 3.99], [0.01, 3.9], [0.13, 3.81], [0.26, 3.71], [0.4, 3.62], [0.53, 3.52], [0.63, 3.42], [0.73, 3.31], [0.83, 3.21], [0.93, 3.1], [1.06, 2.98], [1.2, 2.86], [1.33, 2.75], [1.44, 2.63], [1.52, 2.52], [1.61, 2.4], [1.69, 2.28], [1.82, 2.15], [1.97, 1.98], [2.12, 1.81], [2.25, 1.64], [2.38, 1.48], [2.5, 1.33], [2.63, 1.18], [2.75, 1.02], [2.87, 0.86], [2.99, 0.7], [3.1, 0.55], [3.22, 0.5], [3.33, 0.45], [3.44, 0.41], [3.56, 0.37], [3.68, 0.34], [3.8, 0.3], [3.92, 0.27], [4.04, 0.24], [4.17, 0.21], [4.29, 0.18], [4.41, 0.15], [4.54, 0.12], [4.66, 0.09], [4.8, 0.07], [4.93, 0.05]], [[-0.55, 4.47], [-0.5, 4.4], [-0.45, 4.32], [-0.39, 4.25], [-0.32, 4.17], [-0.25, 4.1], [-0.17, 4.03], [-0.06, 3.94], [0.06, 3.85], [0.18, 3.76], [0.31, 3.66], [0.45, 3.57], [0.57, 3.47], [0.68, 3.37], [0.78, 3.27], [0.87, 3.16], [0.97, 3.05], [1.11, 2.93], [1.24, 2.82], [1.37, 2.7], [1.48, 2.59], [1.56, 2.47], [1.64, 2.36], [1.72, 2.25], [1.84, 2.11], [2.0, 1.94], [2.13, 1.77], [2.26, 1.61], [2.39, 1.45], [2.52, 1.3], [2.64, 1.15], [2.76, 0.99], [2.89, 0.83], [3.0, 0.67], [3.11, 0.53], [3.23, 0.47], [3.34, 0.43], [3.45, 0.38], [3.57, 0.34], [3.69, 0.31], [3.81, 0.27], [3.93, 0.24], [4.06, 0.21], [4.18, 0.18], [4.3, 0.15], [4.43, 0.11], [4.55, 0.08], [4.68, 0.06], [4.81, 0.03], [4.95, 0.01]], [[-0.56, 4.48], [-0.5, 4.4], [-0.45, 4.33], [-0.39, 4.25], [-0.32, 4.18], [-0.25, 4.11], [-0.17, 4.04], [-0.07, 3.95], [0.05, 3.86], [0.18, 3.77], [0.31, 3.67], [0.44, 3.58], [0.57, 3.48], [0.67, 3.38], [0.77, 3.28], [0.86, 3.17], [0.97, 3.06], [1.1, 2.94], [1.23, 2.83], [1.37, 2.71], [1.47, 2.6], [1.56, 2.49], [1.63, 2.37], [1.71, 2.26], [1.84, 2.12], [1.99, 1.95], [2.13, 1.79], [2.26, 1.62], [2.39, 1.46], [2.51, 1.32], [2.63, 1.17], [2.76, 1.0], [2.88, 0.85], [3.0, 0.68], [3.11, 0.54], [3.22, 0.48], [3.34, 0.44], [3.45, 0.39], [3.57, 0.35], [3.69, 0.31], [3.81, 0.28], [3.93, 0.25], [4.06, 0.22], [4.18, 0.19], [4.3, 0.15], [4.43, 0.12], [4.55, 0.09], [4.68, 0.06], [4.81, 0.04], [4.94, 0.02]], [[-0.52, 4.46], [-0.47, 4.38], [-0.42, 4.3], [-0.36, 4.23], [-0.29, 4.16], [-0.22, 4.09], [-0.13, 4.01], [-0.03, 3.93], [0.09, 3.83], [0.22, 3.74], [0.35, 3.64], [0.48, 3.55], [0.61, 3.45], [0.71, 3.35], [0.81, 3.25], [0.9, 3.14], [1.0, 3.03], [1.14, 2.92], [1.27, 2.8], [1.4, 2.69], [1.5, 2.58], [1.59, 2.46], [1.66, 2.35], [1.74, 2.24], [1.86, 2.1], [2.02, 1.93], [2.15, 1.76], [2.28, 1.6], [2.41, 1.44], [2.53, 1.3], [2.65, 1.15], [2.78, 0.98], [2.9, 0.83], [3.02, 0.66], [3.13, 0.52], [3.24, 0.47], [3.36, 0.42], [3.47, 0.38], [3.59, 0.34], [3.71, 0.3], [3.83, 0.27], [3.95, 0.24], [4.08, 0.21], [4.2, 0.17], [4.33, 0.14], [4.45, 0.11], [4.58, 0.08], [4.7, 0.05], [4.84, 0.03], [4.97, 0.0]], [[-0.57, 4.51], [-0.51, 4.43], [-0.46, 4.35], [-0.4, 4.28], [-0.34, 4.2], [-0.26, 4.13], [-0.19, 4.06], [-0.09, 3.98], [0.03, 3.89], [0.16, 3.79], [0.29, 3.7], [0.42, 3.6], [0.55, 3.5], [0.65, 3.4], [0.76, 3.3], [0.85, 3.19], [0.95, 3.08], [1.09, 2.96], [1.22, 2.85], [1.35, 2.73], [1.46, 2.62], [1.54, 2.5], [1.62, 2.39], [1.7, 2.28], [1.82, 2.14], [1.97, 1.97], [2.11, 1.8], [2.24, 1.64], [2.37, 1.48], [2.49, 1.34], [2.61, 1.19], [2.74, 1.02], [2.86, 0.87], [2.97, 0.7], [3.09, 0.56], [3.2, 0.5], [3.31, 0.46], [3.42, 0.41], [3.54, 0.37], [3.66, 0.34], [3.78, 0.3], [3.9, 0.27], [4.02, 0.24], [4.15, 0.21], [4.27, 0.18], [4.39, 0.15], [4.51, 0.12], [4.64, 0.09], [4.77, 0.07], [4.9, 0.05]], [[-0.56, 4.5], [-0.51, 4.42], [-0.45, 4.34], [-0.39, 4.26], [-0.33, 4.19], [-0.25, 4.12], [-0.18, 4.05], [-0.08, 3.96], [0.04, 3.87], [0.17, 3.78], [0.3, 3.69], [0.43, 3.59], [0.56, 3.49], [0.67, 3.39], [0.77, 3.29], [0.86, 3.18], [0.96, 3.07], [1.1, 2.95], [1.23, 2.84], [1.36, 2.72], [1.47, 2.61], [1.55, 2.49], [1.63, 2.38], [1.71, 2.27], [1.83, 2.13], [1.99, 1.96], [2.12, 1.79], [2.25, 1.62], [2.38, 1.47], [2.51, 1.32], [2.63, 1.17], [2.75, 1.01], [2.87, 0.85], [2.99, 0.69], [3.1, 0.54], [3.21, 0.49], [3.33, 0.44], [3.44, 0.4], [3.55, 0.36], [3.67, 0.32], [3.79, 0.29], [3.92, 0.26], [4.04, 0.23], [4.16, 0.2], [4.29, 0.16], [4.41, 0.13], [4.53, 0.1], [4.66, 0.08], [4.79, 0.05], [4.92, 0.03]], [[-0.56, 4.48], [-0.51, 4.4], [-0.45, 4.33], [-0.39, 4.25], [-0.33, 4.18], [-0.26, 4.11], [-0.18, 4.03], [-0.08, 3.95], [0.04, 3.86], [0.17, 3.77], [0.3, 3.67], [0.43, 3.58], [0.56, 3.48], [0.67, 3.38], [0.77, 3.27], [0.86, 3.17], [0.96, 3.06], [1.1, 2.94], [1.23, 2.83], [1.36, 2.71], [1.47, 2.6], [1.55, 2.48], [1.63, 2.37], [1.71, 2.26], [1.83, 2.12], [1.98, 1.95], [2.12, 1.78], [2.25, 1.61], [2.38, 1.46], [2.5, 1.31], [2.62, 1.16], [2.75, 1.0], [2.87, 0.84], [2.99, 0.68], [3.1, 0.53], [3.21, 0.48], [3.32, 0.43], [3.43, 0.39], [3.55, 0.35], [3.67, 0.31], [3.79, 0.28], [3.91, 0.25], [4.04, 0.22], [4.16, 0.18], [4.28, 0.15], [4.4, 0.12], [4.53, 0.09], [4.66, 0.06], [4.79, 0.04], [4.92, 0.02]], [[-0.58, 4.52], [-0.53, 4.44], [-0.48, 4.36], [-0.42, 4.28], [-0.35, 4.21], [-0.28, 4.14], [-0.2, 4.06], [-0.11, 3.99], [0.01, 3.9], [0.14, 3.81], [0.27, 3.71], [0.4, 3.61], [0.53, 3.52], [0.63, 3.41], [0.74, 3.31], [0.83, 3.2], [0.93, 3.09], [1.07, 2.97], [1.2, 2.86], [1.33, 2.74], [1.44, 2.63], [1.52, 2.51], [1.61, 2.4], [1.68, 2.29], [1.81, 2.15], [1.96, 1.98], [2.1, 1.81], [2.23, 1.64], [2.36, 1.49], [2.48, 1.34], [2.6, 1.19], [2.72, 1.03], [2.85, 0.87], [2.96, 0.71], [3.08, 0.56], [3.19, 0.5], [3.3, 0.46], [3.41, 0.41], [3.53, 0.38], [3.64, 0.34], [3.76, 0.31], [3.89, 0.27], [4.01, 0.24], [4.13, 0.21], [4.25, 0.18], [4.37, 0.15], [4.5, 0.12], [4.62, 0.09], [4.75, 0.07], [4.89, 0.05]], [[-0.57, 4.5], [-0.51, 4.42], [-0.46, 4.34], [-0.4, 4.27], [-0.34, 4.19], [-0.26, 4.12], [-0.19, 4.05], [-0.09, 3.97], [0.03, 3.88], [0.16, 3.79], [0.29, 3.69], [0.42, 3.59], [0.55, 3.5], [0.65, 3.39], [0.76, 3.29], [0.85, 3.18], [0.95, 3.07], [1.09, 2.96], [1.22, 2.84], [1.35, 2.73], [1.46, 2.61], [1.54, 2.5], [1.62, 2.38], [1.7, 2.27], [1.82, 2.14], [1.97, 1.97], [2.11, 1.8], [2.24, 1.63], [2.37, 1.47], [2.5, 1.33], [2.62, 1.18], [2.74, 1.01], [2.86, 0.86], [2.98, 0.69], [3.09, 0.55], [3.2, 0.49], [3.31, 0.45], [3.43, 0.4], [3.54, 0.36], [3.66, 0.33], [3.78, 0.29], [3.9, 0.26], [4.03, 0.23], [4.15, 0.2], [4.27, 0.17], [4.39, 0.14], [4.52, 0.11], [4.64, 0.08], [4.78, 0.06], [4.91, 0.03]], [[-0.66, 4.64], [-0.6, 4.55], [-0.55, 4.47], [-0.49, 4.39], [-0.43, 4.31], [-0.36, 4.23], [-0.28, 4.16], [-0.2, 4.08], [-0.08, 4.01], [0.05, 3.91], [0.18, 3.81], [0.31, 3.71], [0.45, 3.61], [0.55, 3.5], [0.66, 3.39], [0.75, 3.28], [0.86, 3.17], [1.0, 3.05], [1.13, 2.94], [1.26, 2.82], [1.37, 2.7], [1.46, 2.59], [1.55, 2.47], [1.63, 2.35], [1.75, 2.22], [1.9, 2.04], [2.04, 1.87], [2.17, 1.71], [2.3, 1.55], [2.43, 1.4], [2.54, 1.25], [2.66, 1.09], [2.79, 0.93], [2.9, 0.77], [3.01, 0.61], [3.13, 0.55], [3.23, 0.51], [3.34, 0.47], [3.46, 0.43], [3.57, 0.4], [3.69, 0.36], [3.81, 0.33], [3.92, 0.31], [4.04, 0.28], [4.16, 0.25], [4.28, 0.22], [4.4, 0.19], [4.52, 0.16], [4.65, 0.14], [4.78, 0.12]], [[-0.58, 4.56], [-0.53, 4.48], [-0.47, 4.4], [-0.41, 4.32], [-0.35, 4.25], [-0.28, 4.17], [-0.2, 4.1], [-0.11, 4.02], [0.01, 3.93], [0.14, 3.84], [0.27, 3.74], [0.4, 3.64], [0.53, 3.55], [0.64, 3.44], [0.74, 3.34], [0.83, 3.23], [0.93, 3.12], [1.07, 3.0], [1.2, 2.89], [1.33, 2.77], [1.44, 2.66], [1.52, 2.54], [1.6, 2.43], [1.68, 2.31], [1.8, 2.18], [1.95, 2.01], [2.08, 1.84], [2.21, 1.67], [2.34, 1.52], [2.46, 1.37], [2.58, 1.22], [2.7, 1.06], [2.82, 0.9], [2.93, 0.74], [3.04, 0.6], [3.15, 0.54], [3.26, 0.5], [3.37, 0.45], [3.49, 0.42], [3.6, 0.38], [3.72, 0.35], [3.84, 0.32], [3.96, 0.29], [4.08, 0.26], [4.2, 0.23], [4.32, 0.2], [4.44, 0.18], [4.56, 0.15], [4.69, 0.13], [4.82, 0.11]], [[-0.48, 4.4], [-0.43, 4.32], [-0.37, 4.25], [-0.31, 4.18], [-0.24, 4.11], [-0.16, 4.04], [-0.07, 3.95], [0.04, 3.86], [0.16, 3.76], [0.29, 3.67], [0.42, 3.58], [0.55, 3.48], [0.67, 3.39], [0.77, 3.29], [0.87, 3.19], [0.96, 3.08], [1.06, 2.97], [1.19, 2.85], [1.33, 2.74], [1.46, 2.63], [1.56, 2.52], [1.63, 2.4], [1.7, 2.3], [1.77, 2.18], [1.9, 2.05], [2.04, 1.88], [2.17, 1.71], [2.3, 1.55], [2.43, 1.39], [2.55, 1.25], [2.67, 1.1], [2.8, 0.93], [2.92, 0.77], [3.03, 0.61], [3.14, 0.49], [3.25, 0.44], [3.36, 0.4], [3.47, 0.35], [3.59, 0.31], [3.71, 0.28], [3.84, 0.24], [3.96, 0.21], [4.08, 0.18], [4.21, 0.15], [4.33, 0.11], [4.45, 0.08], [4.58, 0.05], [4.71, 0.03], [4.84, 0.0], [4.98, -0.02]], [[-0.55, 4.5], [-0.5, 4.42], [-0.44, 4.35], [-0.38, 4.27], [-0.32, 4.2], [-0.24, 4.12], [-0.17, 4.05], [-0.07, 3.97], [0.05, 3.88], [0.18, 3.78], [0.31, 3.69], [0.44, 3.59], [0.57, 3.49], [0.68, 3.39], [0.78, 3.29], [0.87, 3.18], [0.97, 3.07], [1.1, 2.95], [1.24, 2.84], [1.37, 2.73], [1.47, 2.61], [1.55, 2.5], [1.63, 2.39], [1.7, 2.27], [1.82, 2.14], [1.97, 1.97], [2.11, 1.8], [2.23, 1.64], [2.36, 1.48], [2.48, 1.34], [2.6, 1.19], [2.72, 1.03], [2.84, 0.87], [2.96, 0.71], [3.07, 0.57], [3.18, 0.51], [3.29, 0.47], [3.4, 0.43], [3.51, 0.39], [3.63, 0.36], [3.75, 0.32], [3.87, 0.29], [3.99, 0.26], [4.11, 0.23], [4.23, 0.2], [4.35, 0.17], [4.47, 0.14], [4.6, 0.12], [4.73, 0.1], [4.86, 0.07]], [[-0.55, 4.5], [-0.5, 4.42], [-0.44, 4.35], [-0.38, 4.27], [-0.32, 4.2], [-0.24, 4.12], [-0.17, 4.05], [-0.07, 3.97], [0.05, 3.88], [0.18, 3.78], [0.31, 3.69], [0.44, 3.59], [0.57, 3.49], [0.68, 3.39], [0.78, 3.29], [0.87, 3.18], [0.97, 3.07], [1.1, 2.95], [1.24, 2.84], [1.37, 2.73], [1.47, 2.61], [1.55, 2.5], [1.63, 2.39], [1.7, 2.27], [1.82, 2.14], [1.97, 1.97], [2.11, 1.8], [2.23, 1.64], [2.36, 1.48], [2.48, 1.34], [2.6, 1.19], [2.72, 1.03], [2.84, 0.87], [2.96, 0.71], [3.07, 0.57], [3.18, 0.51], [3.29, 0.47], [3.4, 0.43], [3.51, 0.39], [3.63, 0.36], [3.75, 0.32], [3.87, 0.29], [3.99, 0.26], [4.11, 0.23], [4.23, 0.2], [4.35, 0.17], [4.47, 0.14], [4.6, 0.12], [4.73, 0.1], [4.86, 0.07]], [[-0.55, 4.5], [-0.5, 4.42], [-0.44, 4.35], [-0.38, 4.27], [-0.32, 4.2], [-0.24, 4.12], [-0.17, 4.05], [-0.07, 3.97], [0.05, 3.88], [0.18, 3.78], [0.31, 3.69], [0.44, 3.59], [0.57, 3.49], [0.68, 3.39], [0.78, 3.29], [0.87, 3.18], [0.97, 3.07], [1.1, 2.95], [1.24, 2.84], [1.37, 2.73], [1.47, 2.61], [1.55, 2.5], [1.63, 2.39], [1.7, 2.27], [1.82, 2.14], [1.97, 1.97], [2.11, 1.8], [2.23, 1.64], [2.36, 1.48], [2.48, 1.34], [2.6, 1.19], [2.72, 1.03], [2.84, 0.87], [2.96, 0.71], [3.07, 0.57], [3.18, 0.51], [3.29, 0.47], [3.4, 0.43], [3.51, 0.39], [3.63, 0.36], [3.75, 0.32], [3.87, 0.29], [3.99, 0.26], [4.11, 0.23], [4.23, 0.2], [4.35, 0.17], [4.47, 0.14], [4.6, 0.12], [4.73, 0.1], [4.86, 0.07]], [[-0.55, 4.5], [-0.5, 4.42], [-0.44, 4.35], [-0.38, 4.27], [-0.32, 4.2], [-0.24, 4.12], [-0.17, 4.05], [-0.07, 3.97], [0.05, 3.88], [0.18, 3.78], [0.31, 3.69], [0.44, 3.59], [0.57, 3.49], [0.68, 3.39], [0.78, 3.29], [0.87, 3.18], [0.97, 3.07], [1.1, 2.95], [1.24, 2.84], [1.37, 2.73], [1.47, 2.61], [1.55, 2.5], [1.63, 2.39], [1.7, 2.27], [1.82, 2.14], [1.97, 1.97], [2.11, 1.8], [2.23, 1.64], [2.36, 1.48], [2.48, 1.34], [2.6, 1.19], [2.72, 1.03], [2.84, 0.87], [2.96, 0.71], [3.07, 0.57], [3.18, 0.51], [3.29, 0.47], [3.4, 0.43], [3.51, 0.39], [3.63, 0.36], [3.75, 0.32], [3.87, 0.29], [3.99, 0.26], [4.11, 0.23], [4.23, 0.2], [4.35, 0.17], [4.47, 0.14], [4.6, 0.12], [4.73, 0.1], [4.86, 0.07]], [[-0.54, 4.48], [-0.48, 4.4], [-0.43, 4.33], [-0.37, 4.25], [-0.3, 4.18], [-0.23, 4.11], [-0.15, 4.03], [-0.05, 3.95], [0.07, 3.86], [0.2, 3.76], [0.33, 3.67], [0.46, 3.57], [0.59, 3.48], [0.69, 3.37], [0.79, 3.27], [0.89, 3.16], [0.99, 3.05], [1.12, 2.94], [1.25, 2.82], [1.38, 2.71], [1.49, 2.6], [1.57, 2.48], [1.64, 2.37], [1.71, 2.26], [1.84, 2.12], [1.99, 1.95], [2.12, 1.79], [2.25, 1.62], [2.38, 1.46], [2.5, 1.32], [2.62, 1.17], [2.74, 1.01], [2.86, 0.85], [2.97, 0.69], [3.08, 0.55], [3.19, 0.5], [3.3, 0.46], [3.41, 0.41], [3.53, 0.38], [3.64, 0.34], [3.76, 0.31], [3.89, 0.28], [4.01, 0.25], [4.13, 0.22], [4.25, 0.19], [4.37, 0.16], [4.49, 0.13], [4.62, 0.1], [4.75, 0.08], [4.88, 0.06]], [[-0.54, 4.48], [-0.48, 4.4], [-0.43, 4.33], [-0.37, 4.25], [-0.3, 4.18], [-0.23, 4.11], [-0.15, 4.03], [-0.05, 3.95], [0.07, 3.86], [0.2, 3.76], [0.33, 3.67], [0.46, 3.57], [0.59, 3.48], [0.69, 3.37], [0.79, 3.27], [0.89, 3.16], [0.99, 3.05], [1.12, 2.94], [1.25, 2.82], [1.38, 2.71], [1.49, 2.6], [1.57, 2.48], [1.64, 2.37], [1.71, 2.26], [1.84, 2.12], [1.99, 1.95], [2.12, 1.79], [2.25, 1.62], [2.38, 1.46], [2.5, 1.32], [2.62, 1.17], [2.74, 1.01], [2.86, 0.85], [2.97, 0.69], [3.08, 0.55], [3.19, 0.5], [3.3, 0.46], [3.41, 0.41], [3.53, 0.38], [3.64, 0.34], [3.76, 0.31], [3.89, 0.28], [4.01, 0.25], [4.13, 0.22], [4.25, 0.19], [4.37, 0.16], [4.49, 0.13], [4.62, 0.1], [4.75, 0.08], [4.88, 0.06]], [[-0.53, 4.48], [-0.48, 4.4], [-0.43, 4.32], [-0.37, 4.25], [-0.3, 4.17], [-0.23, 4.1], [-0.15, 4.03], [-0.04, 3.95], [0.08, 3.85], [0.2, 3.76], [0.33, 3.66], [0.46, 3.57], [0.59, 3.47], [0.69, 3.37], [0.8, 3.26], [0.89, 3.16], [0.99, 3.05], [1.12, 2.93], [1.25, 2.82], [1.38, 2.7], [1.49, 2.59], [1.57, 2.48], [1.64, 2.37], [1.72, 2.25], [1.84, 2.12], [1.99, 1.95], [2.12, 1.78], [2.25, 1.62], [2.38, 1.46], [2.5, 1.32], [2.62, 1.17], [2.74, 1.0], [2.86, 0.85], [2.97, 0.69], [3.08, 0.55], [3.19, 0.5], [3.3, 0.45], [3.41, 0.41], [3.53, 0.37], [3.65, 0.34], [3.77, 0.3], [3.89, 0.27], [4.01, 0.24], [4.13, 0.21], [4.25, 0.18], [4.37, 0.15], [4.5, 0.12], [4.62, 0.1], [4.75, 0.07], [4.88, 0.05]], [[-0.48, 4.37], [-0.43, 4.29], [-0.37, 4.22], [-0.31, 4.15], [-0.25, 4.08], [-0.18, 4.01], [-0.09, 3.94], [0.01, 3.85], [0.13, 3.76], [0.26, 3.67], [0.39, 3.57], [0.52, 3.48], [0.65, 3.39], [0.75, 3.29], [0.85, 3.18], [0.94, 3.08], [1.04, 2.97], [1.18, 2.86], [1.31, 2.74], [1.44, 2.63], [1.54, 2.52], [1.62, 2.41], [1.68, 2.3], [1.76, 2.19], [1.89, 2.05], [2.03, 1.88], [2.16, 1.71], [2.29, 1.54], [2.43, 1.38], [2.55, 1.24], [2.67, 1.09], [2.79, 0.93], [2.92, 0.77], [3.03, 0.6], [3.14, 0.49], [3.25, 0.44], [3.36, 0.4], [3.47, 0.35], [3.59, 0.31], [3.71, 0.27], [3.84, 0.24], [3.96, 0.21], [4.09, 0.18], [4.21, 0.14], [4.33, 0.11], [4.46, 0.08], [4.59, 0.05], [4.72, 0.03], [4.85, 0.0], [4.98, -0.02]], [[-0.51, 4.4], [-0.46, 4.33], [-0.4, 4.25], [-0.34, 4.18], [-0.28, 4.11], [-0.21, 4.04], [-0.13, 3.97], [-0.03, 3.9], [0.09, 3.81], [0.21, 3.72], [0.34, 3.62], [0.48, 3.53], [0.6, 3.43], [0.71, 3.33], [0.81, 3.23], [0.9, 3.13], [1.0, 3.02], [1.14, 2.9], [1.27, 2.79], [1.4, 2.68], [1.5, 2.56], [1.58, 2.45], [1.65, 2.34], [1.73, 2.23], [1.85, 2.09], [2.0, 1.92], [2.13, 1.76], [2.27, 1.59], [2.4, 1.43], [2.52, 1.29], [2.64, 1.14], [2.76, 0.97], [2.89, 0.82], [3.0, 0.65], [3.11, 0.53], [3.22, 0.48], [3.33, 0.44], [3.45, 0.39], [3.57, 0.35], [3.69, 0.32], [3.81, 0.29], [3.93, 0.25], [4.05, 0.22], [4.18, 0.19], [4.3, 0.16], [4.43, 0.13], [4.55, 0.1], [4.68, 0.08], [4.81, 0.05], [4.95, 0.03]], [[-0.49, 4.38], [-0.44, 4.3], [-0.38, 4.23], [-0.32, 4.16], [-0.26, 4.09], [-0.19, 4.02], [-0.11, 3.95], [-0.02, 3.88], [0.1, 3.8], [0.22, 3.71], [0.35, 3.62], [0.48, 3.52], [0.61, 3.43], [0.72, 3.33], [0.82, 3.23], [0.91, 3.12], [1.01, 3.02], [1.14, 2.9], [1.28, 2.79], [1.41, 2.68], [1.51, 2.56], [1.58, 2.45], [1.65, 2.34], [1.73, 2.23], [1.85, 2.1], [2.0, 1.93], [2.13, 1.76], [2.26, 1.6], [2.39, 1.44], [2.51, 1.3], [2.63, 1.15], [2.75, 0.99], [2.88, 0.83], [3.0, 0.67], [3.1, 0.55], [3.21, 0.5], [3.33, 0.46], [3.44, 0.41], [3.56, 0.38], [3.68, 0.34], [3.8, 0.31], [3.92, 0.28], [4.04, 0.25], [4.17, 0.22], [4.29, 0.19], [4.41, 0.16], [4.54, 0.13], [4.67, 0.11], [4.8, 0.09], [4.93, 0.07]], [[-0.53, 4.45], [-0.48, 4.37], [-0.42, 4.29], [-0.36, 4.22], [-0.31, 4.15], [-0.24, 4.08], [-0.16, 4.01], [-0.07, 3.94], [0.04, 3.87], [0.16, 3.78], [0.29, 3.68], [0.42, 3.59], [0.55, 3.49], [0.66, 3.39], [0.76, 3.29], [0.86, 3.18], [0.96, 3.07], [1.09, 2.96], [1.23, 2.85], [1.36, 2.73], [1.46, 2.62], [1.54, 2.51], [1.61, 2.4], [1.69, 2.28], [1.81, 2.15], [1.96, 1.98], [2.09, 1.81], [2.22, 1.65], [2.35, 1.49], [2.47, 1.35], [2.59, 1.2], [2.71, 1.04], [2.83, 0.88], [2.95, 0.72], [3.06, 0.58], [3.17, 0.54], [3.28, 0.5], [3.39, 0.46], [3.51, 0.42], [3.63, 0.39], [3.75, 0.36], [3.87, 0.33], [3.99, 0.3], [4.11, 0.27], [4.23, 0.24], [4.35, 0.21], [4.48, 0.18], [4.6, 0.16], [4.73, 0.14], [4.86, 0.12]], [[-0.53, 4.45], [-0.48, 4.37], [-0.42, 4.29], [-0.36, 4.22], [-0.31, 4.15], [-0.24, 4.08], [-0.16, 4.01], [-0.07, 3.94], [0.04, 3.87], [0.16, 3.78], [0.29, 3.68], [0.42, 3.59], [0.55, 3.49], [0.66, 3.39], [0.76, 3.29], [0.86, 3.18], [0.96, 3.07], [1.09, 2.96], [1.23, 2.85], [1.36, 2.73], [1.46, 2.62], [1.54, 2.51], [1.61, 2.4], [1.69, 2.28], [1.81, 2.15], [1.96, 1.98], [2.09, 1.81], [2.22, 1.65], [2.35, 1.49], [2.47, 1.35], [2.59, 1.2], [2.71, 1.04], [2.83, 0.88], [2.95, 0.72], [3.06, 0.58], [3.17, 0.54], [3.28, 0.5], [3.39, 0.46], [3.51, 0.42], [3.63, 0.39], [3.75, 0.36], [3.87, 0.33], [3.99, 0.3], [4.11, 0.27], [4.23, 0.24], [4.35, 0.21], [4.48, 0.18], [4.6, 0.16], [4.73, 0.14], [4.86, 0.12]], [[-0.51, 4.41], [-0.46, 4.34], [-0.4, 4.26], [-0.35, 4.19], [-0.29, 4.12], [-0.22, 4.05], [-0.14, 3.98], [-0.05, 3.91], [0.06, 3.83], [0.19, 3.74], [0.32, 3.65], [0.45, 3.56], [0.58, 3.46], [0.69, 3.36], [0.79, 3.26], [0.88, 3.15], [0.98, 3.04], [1.12, 2.93], [1.25, 2.82], [1.38, 2.71], [1.48, 2.59], [1.56, 2.48], [1.63, 2.37], [1.71, 2.26], [1.83, 2.12], [1.98, 1.96], [2.11, 1.79], [2.24, 1.62], [2.37, 1.46], [2.49, 1.32], [2.61, 1.17], [2.73, 1.01], [2.85, 0.86], [2.97, 0.7], [3.08, 0.56], [3.19, 0.52], [3.3, 0.48], [3.41, 0.44], [3.53, 0.4], [3.65, 0.36], [3.77, 0.33], [3.89, 0.3], [4.01, 0.27], [4.13, 0.25], [4.26, 0.22], [4.38, 0.19], [4.5, 0.16], [4.63, 0.13], [4.76, 0.11], [4.89, 0.09]], [[-0.51, 4.41], [-0.46, 4.34], [-0.4, 4.26], [-0.35, 4.19], [-0.29, 4.12], [-0.21, 4.05], [-0.14, 3.98], [-0.05, 3.91], [0.06, 3.83], [0.19, 3.74], [0.32, 3.65], [0.45, 3.56], [0.58, 3.46], [0.69, 3.36], [0.79, 3.26], [0.88, 3.15], [0.98, 3.04], [1.12, 2.93], [1.25, 2.82], [1.38, 2.71], [1.48, 2.59], [1.56, 2.48], [1.63, 2.37], [1.71, 2.26], [1.83, 2.12], [1.98, 1.95], [2.11, 1.79], [2.24, 1.62], [2.37, 1.46], [2.49, 1.32], [2.61, 1.17], [2.73, 1.01], [2.85, 0.85], [2.97, 0.7], [3.08, 0.56], [3.19, 0.52], [3.3, 0.48], [3.41, 0.44], [3.53, 0.4], [3.65, 0.36], [3.77, 0.33], [3.89, 0.3], [4.01, 0.27], [4.14, 0.24], [4.26, 0.21], [4.38, 0.19], [4.5, 0.16], [4.63, 0.13], [4.76, 0.11], [4.89, 0.09]], [[-0.51, 4.41], [-0.46, 4.34], [-0.4, 4.26], [-0.35, 4.19], [-0.29, 4.12], [-0.21, 4.05], [-0.14, 3.98], [-0.05, 3.91], [0.06, 3.83], [0.19, 3.74], [0.32, 3.65], [0.45, 3.56], [0.58, 3.46], [0.69, 3.36], [0.79, 3.26], [0.88, 3.15], [0.98, 3.04], [1.12, 2.93], [1.25, 2.82], [1.38, 2.71], [1.48, 2.59], [1.56, 2.48], [1.63, 2.37], [1.71, 2.26], [1.83, 2.12], [1.98, 1.95], [2.11, 1.79], [2.24, 1.62], [2.37, 1.46], [2.49, 1.32], [2.61, 1.17], [2.73, 1.01], [2.85, 0.85], [2.97, 0.7], [3.08, 0.56], [3.19, 0.52], [3.3, 0.48], [3.41, 0.44], [3.53, 0.4], [3.65, 0.36], [3.77, 0.33], [3.89, 0.3], [4.01, 0.27], [4.14, 0.24], [4.26, 0.21], [4.38, 0.19], [4.5, 0.16], [4.63, 0.13], [4.76, 0.11], [4.89, 0.09]], [[-0.51, 4.42], [-0.45, 4.34], [-0.4, 4.27], [-0.34, 4.2], [-0.28, 4.12], [-0.21, 4.05], [-0.13, 3.99], [-0.04, 3.91], [0.08, 3.83], [0.2, 3.74], [0.33, 3.65], [0.46, 3.56], [0.59, 3.46], [0.7, 3.36], [0.8, 3.26], [0.89, 3.15], [0.99, 3.04], [1.13, 2.93], [1.26, 2.82], [1.39, 2.71], [1.49, 2.59], [1.57, 2.48], [1.64, 2.37], [1.72, 2.26], [1.84, 2.12], [1.99, 1.96], [2.12, 1.79], [2.25, 1.62], [2.38, 1.46], [2.5, 1.32], [2.62, 1.17], [2.74, 1.01], [2.87, 0.86], [2.99, 0.7], [3.1, 0.57], [3.21, 0.52], [3.32, 0.48], [3.43, 0.44], [3.55, 0.4], [3.67, 0.37], [3.79, 0.34], [3.91, 0.31], [4.03, 0.28], [4.16, 0.25], [4.28, 0.22], [4.4, 0.19], [4.53, 0.16], [4.65, 0.14], [4.79, 0.12], [4.92, 0.09]], [[-0.51, 4.4], [-0.46, 4.33], [-0.4, 4.26], [-0.34, 4.18], [-0.28, 4.11], [-0.21, 4.04], [-0.14, 3.97], [-0.04, 3.9], [0.07, 3.82], [0.2, 3.73], [0.33, 3.64], [0.46, 3.55], [0.59, 3.45], [0.69, 3.35], [0.79, 3.25], [0.89, 3.14], [0.99, 3.04], [1.12, 2.92], [1.25, 2.81], [1.39, 2.7], [1.49, 2.59], [1.57, 2.47], [1.64, 2.36], [1.71, 2.25], [1.84, 2.12], [1.98, 1.95], [2.11, 1.78], [2.24, 1.61], [2.37, 1.46], [2.49, 1.32], [2.61, 1.17], [2.74, 1.0], [2.86, 0.85], [2.98, 0.69], [3.09, 0.56], [3.2, 0.52], [3.31, 0.47], [3.42, 0.43], [3.54, 0.39], [3.66, 0.36], [3.78, 0.33], [3.9, 0.3], [4.02, 0.27], [4.14, 0.24], [4.27, 0.21], [4.39, 0.18], [4.51, 0.15], [4.64, 0.13], [4.77, 0.11], [4.9, 0.08]], [[-0.51, 4.4], [-0.46, 4.33], [-0.4, 4.26], [-0.34, 4.18], [-0.28, 4.11], [-0.21, 4.04], [-0.14, 3.97], [-0.04, 3.9], [0.07, 3.82], [0.2, 3.73], [0.33, 3.64], [0.46, 3.55], [0.59, 3.45], [0.69, 3.35], [0.79, 3.25], [0.89, 3.14], [0.99, 3.04], [1.12, 2.92], [1.25, 2.81], [1.39, 2.7], [1.49, 2.59], [1.57, 2.47], [1.64, 2.36], [1.71, 2.25], [1.84, 2.12], [1.98, 1.95], [2.11, 1.78], [2.24, 1.61], [2.37, 1.46], [2.49, 1.32], [2.61, 1.17], [2.74, 1.0], [2.86, 0.85], [2.98, 0.69], [3.09, 0.56], [3.2, 0.52], [3.31, 0.47], [3.42, 0.43], [3.54, 0.39], [3.66, 0.36], [3.78, 0.33], [3.9, 0.3], [4.02, 0.27], [4.14, 0.24], [4.27, 0.21], [4.39, 0.18], [4.51, 0.15], [4.64, 0.13], [4.77, 0.11], [4.9, 0.08]], [[-0.44, 4.25], [-0.38, 4.18], [-0.33, 4.11], [-0.27, 4.05], [-0.21, 3.98], [-0.14, 3.91], [-0.07, 3.85], [0.02, 3.78], [0.13, 3.72], [0.25, 3.63], [0.38, 3.54], [0.51, 3.45], [0.64, 3.36], [0.75, 3.26], [0.85, 3.16], [0.94, 3.06], [1.05, 2.96], [1.18, 2.85], [1.31, 2.74], [1.44, 2.63], [1.54, 2.52], [1.61, 2.41], [1.67, 2.3], [1.75, 2.19], [1.87, 2.06], [2.01, 1.89], [2.14, 1.73], [2.27, 1.56], [2.4, 1.41], [2.51, 1.27], [2.63, 1.12], [2.75, 0.96], [2.87, 0.81], [3.0, 0.65], [3.1, 0.56], [3.21, 0.52], [3.33, 0.47], [3.44, 0.43], [3.55, 0.4], [3.67, 0.36], [3.8, 0.34], [3.92, 0.31], [4.04, 0.28], [4.16, 0.25], [4.29, 0.22], [4.41, 0.19], [4.54, 0.17], [4.66, 0.15], [4.8, 0.13], [4.93, 0.11]], [[-0.52, 4.38], [-0.47, 4.3], [-0.41, 4.23], [-0.35, 4.16], [-0.3, 4.09], [-0.24, 4.02], [-0.17, 3.95], [-0.09, 3.89], [0.0, 3.83], [0.12, 3.76], [0.25, 3.68], [0.38, 3.59], [0.51, 3.5], [0.62, 3.4], [0.73, 3.3], [0.82, 3.19], [0.93, 3.08], [1.07, 2.97], [1.2, 2.86], [1.33, 2.75], [1.43, 2.64], [1.51, 2.53], [1.58, 2.42], [1.65, 2.31], [1.77, 2.17], [1.92, 2.01], [2.05, 1.84], [2.17, 1.67], [2.3, 1.52], [2.42, 1.38], [2.54, 1.23], [2.66, 1.07], [2.77, 0.92], [2.89, 0.76], [3.0, 0.63], [3.11, 0.59], [3.22, 0.55], [3.33, 0.51], [3.44, 0.48], [3.56, 0.45], [3.68, 0.42], [3.79, 0.39], [3.91, 0.36], [4.03, 0.34], [4.15, 0.31], [4.27, 0.28], [4.39, 0.26], [4.51, 0.24], [4.64, 0.22], [4.77, 0.2]], [[-0.49, 4.38], [-0.44, 4.3], [-0.38, 4.23], [-0.32, 4.16], [-0.27, 4.09], [-0.21, 4.02], [-0.14, 3.95], [-0.06, 3.88], [0.04, 3.82], [0.16, 3.75], [0.29, 3.67], [0.42, 3.57], [0.56, 3.48], [0.67, 3.38], [0.77, 3.28], [0.87, 3.17], [0.97, 3.06], [1.11, 2.95], [1.24, 2.84], [1.37, 2.73], [1.47, 2.62], [1.55, 2.5], [1.62, 2.39], [1.69, 2.28], [1.82, 2.15], [1.96, 1.98], [2.09, 1.81], [2.22, 1.65], [2.34, 1.49], [2.46, 1.35], [2.58, 1.2], [2.7, 1.04], [2.82, 0.88], [2.94, 0.72], [3.05, 0.61], [3.16, 0.57], [3.27, 0.53], [3.38, 0.49], [3.5, 0.45], [3.62, 0.42], [3.74, 0.4], [3.86, 0.37], [3.98, 0.34], [4.1, 0.31], [4.22, 0.28], [4.34, 0.26], [4.46, 0.24], [4.59, 0.22], [4.72, 0.2], [4.85, 0.18]], [[-0.45, 4.3], [-0.39, 4.23], [-0.34, 4.16], [-0.28, 4.09], [-0.23, 4.02], [-0.16, 3.96], [-0.09, 3.89], [-0.01, 3.83], [0.1, 3.76], [0.22, 3.68], [0.35, 3.6], [0.48, 3.5], [0.62, 3.41], [0.72, 3.31], [0.83, 3.21], [0.92, 3.11], [1.03, 3.0], [1.16, 2.88], [1.3, 2.77], [1.43, 2.67], [1.52, 2.55], [1.59, 2.44], [1.66, 2.33], [1.74, 2.22], [1.86, 2.09], [2.0, 1.92], [2.13, 1.75], [2.26, 1.58], [2.39, 1.43], [2.51, 1.29], [2.63, 1.14], [2.75, 0.97], [2.87, 0.81], [2.99, 0.66], [3.1, 0.56], [3.21, 0.52], [3.32, 0.48], [3.43, 0.44], [3.55, 0.4], [3.67, 0.37], [3.79, 0.34], [3.92, 0.31], [4.04, 0.28], [4.16, 0.25], [4.28, 0.23], [4.41, 0.2], [4.53, 0.18], [4.66, 0.15], [4.79, 0.13], [4.93, 0.11]], [[-0.35, 4.15], [-0.29, 4.09], [-0.24, 4.02], [-0.18, 3.96], [-0.12, 3.89], [-0.05, 3.83], [0.03, 3.76], [0.13, 3.69], [0.25, 3.61], [0.37, 3.52], [0.51, 3.43], [0.64, 3.34], [0.76, 3.25], [0.87, 3.15], [0.97, 3.06], [1.07, 2.96], [1.17, 2.85], [1.3, 2.74], [1.43, 2.63], [1.56, 2.52], [1.64, 2.41], [1.71, 2.3], [1.77, 2.2], [1.85, 2.09], [1.97, 1.95], [2.1, 1.78], [2.24, 1.61], [2.37, 1.45], [2.5, 1.29], [2.62, 1.15], [2.74, 1.0], [2.86, 0.83], [2.98, 0.67], [3.1, 0.53], [3.2, 0.47], [3.32, 0.43], [3.44, 0.38], [3.55, 0.33], [3.68, 0.3], [3.8, 0.27], [3.93, 0.23], [4.06, 0.2], [4.18, 0.17], [4.31, 0.14], [4.44, 0.11], [4.57, 0.08], [4.7, 0.06], [4.83, 0.03], [4.97, 0.01], [5.11, -0.01]], [[-0.5, 4.42], [-0.45, 4.34], [-0.4, 4.26], [-0.34, 4.19], [-0.28, 4.12], [-0.23, 4.04], [-0.15, 3.97], [-0.08, 3.91], [0.02, 3.84], [0.14, 3.77], [0.28, 3.68], [0.41, 3.59], [0.54, 3.49], [0.65, 3.39], [0.76, 3.29], [0.86, 3.18], [0.96, 3.07], [1.1, 2.95], [1.24, 2.84], [1.37, 2.73], [1.47, 2.62], [1.55, 2.5], [1.62, 2.39], [1.69, 2.28], [1.81, 2.14], [1.96, 1.97], [2.08, 1.81], [2.21, 1.64], [2.34, 1.48], [2.46, 1.34], [2.57, 1.19], [2.69, 1.03], [2.81, 0.87], [2.93, 0.71], [3.04, 0.61], [3.15, 0.57], [3.26, 0.53], [3.37, 0.49], [3.49, 0.46], [3.61, 0.43], [3.72, 0.4], [3.84, 0.37], [3.96, 0.35], [4.08, 0.32], [4.2, 0.29], [4.33, 0.27], [4.45, 0.24], [4.57, 0.22], [4.7, 0.21], [4.83, 0.19]], [[-0.48, 4.38], [-0.44, 4.3], [-0.38, 4.23], [-0.32, 4.16], [-0.26, 4.08], [-0.21, 4.01], [-0.13, 3.95], [-0.06, 3.88], [0.05, 3.81], [0.17, 3.74], [0.3, 3.65], [0.44, 3.56], [0.57, 3.46], [0.68, 3.36], [0.79, 3.25], [0.88, 3.15], [0.99, 3.04], [1.13, 2.92], [1.26, 2.81], [1.39, 2.7], [1.49, 2.59], [1.57, 2.48], [1.64, 2.37], [1.71, 2.25], [1.84, 2.12], [1.97, 1.95], [2.1, 1.78], [2.23, 1.61], [2.36, 1.45], [2.48, 1.31], [2.6, 1.16], [2.71, 1.0], [2.83, 0.84], [2.95, 0.69], [3.06, 0.59], [3.17, 0.55], [3.29, 0.51], [3.4, 0.47], [3.51, 0.44], [3.63, 0.41], [3.75, 0.38], [3.87, 0.35], [3.99, 0.32], [4.11, 0.29], [4.23, 0.27], [4.36, 0.24], [4.48, 0.22], [4.61, 0.2], [4.74, 0.18], [4.87, 0.16]], [[-0.48, 4.38], [-0.43, 4.3], [-0.38, 4.23], [-0.32, 4.16], [-0.26, 4.09], [-0.21, 4.01], [-0.13, 3.95], [-0.06, 3.88], [0.05, 3.81], [0.17, 3.74], [0.3, 3.65], [0.44, 3.56], [0.57, 3.46], [0.68, 3.36], [0.79, 3.26], [0.89, 3.15], [0.99, 3.04], [1.13, 2.92], [1.26, 2.81], [1.39, 2.7], [1.49, 2.59], [1.57, 2.48], [1.64, 2.37], [1.71, 2.25], [1.84, 2.12], [1.98, 1.95], [2.1, 1.78], [2.23, 1.61], [2.36, 1.45], [2.48, 1.32], [2.6, 1.16], [2.72, 1.0], [2.83, 0.84], [2.95, 0.69], [3.06, 0.59], [3.17, 0.55], [3.29, 0.51], [3.4, 0.47], [3.51, 0.44], [3.63, 0.41], [3.75, 0.38], [3.87, 0.35], [3.99, 0.32], [4.11, 0.3], [4.23, 0.27], [4.36, 0.24], [4.48, 0.22], [4.61, 0.2], [4.74, 0.18], [4.87, 0.16]], [[-0.42, 4.28], [-0.36, 4.2], [-0.31, 4.14], [-0.25, 4.07], [-0.19, 4.0], [-0.12, 3.93], [-0.05, 3.87], [0.04, 3.79], [0.15, 3.73], [0.28, 3.64], [0.41, 3.55], [0.54, 3.46], [0.67, 3.36], [0.78, 3.26], [0.88, 3.16], [0.98, 3.06], [1.08, 2.95], [1.21, 2.84], [1.35, 2.73], [1.47, 2.62], [1.57, 2.51], [1.63, 2.4], [1.7, 2.29], [1.78, 2.18], [1.9, 2.05], [2.04, 1.88], [2.16, 1.71], [2.29, 1.55], [2.42, 1.39], [2.54, 1.25], [2.66, 1.1], [2.78, 0.94], [2.91, 0.78], [3.03, 0.62], [3.13, 0.54], [3.25, 0.5], [3.36, 0.46], [3.48, 0.42], [3.59, 0.38], [3.72, 0.35], [3.84, 0.32], [3.96, 0.29], [4.09, 0.26], [4.21, 0.23], [4.34, 0.21], [4.46, 0.18], [4.59, 0.16], [4.72, 0.14], [4.86, 0.12], [4.99, 0.1]], [[-0.45, 4.34], [-0.4, 4.27], [-0.34, 4.19], [-0.29, 4.12], [-0.23, 4.05], [-0.17, 3.98], [-0.1, 3.92], [-0.02, 3.85], [0.09, 3.78], [0.21, 3.71], [0.34, 3.62], [0.48, 3.53], [0.61, 3.44], [0.72, 3.33], [0.82, 3.23], [0.92, 3.13], [1.03, 3.02], [1.16, 2.9], [1.3, 2.79], [1.43, 2.68], [1.53, 2.57], [1.6, 2.46], [1.67, 2.35], [1.75, 2.24], [1.87, 2.11], [2.01, 1.94], [2.14, 1.77], [2.27, 1.61], [2.4, 1.45], [2.52, 1.31], [2.64, 1.16], [2.76, 1.0], [2.88, 0.84], [3.0, 0.68], [3.11, 0.58], [3.23, 0.55], [3.35, 0.51], [3.46, 0.47], [3.58, 0.43], [3.7, 0.4], [3.83, 0.38], [3.95, 0.35], [4.07, 0.32], [4.2, 0.29], [4.32, 0.27], [4.45, 0.24], [4.57, 0.22], [4.71, 0.2], [4.84, 0.18], [4.97, 0.16]], [[-0.49, 4.39], [-0.45, 4.3], [-0.39, 4.23], [-0.33, 4.16], [-0.28, 4.09], [-0.22, 4.02], [-0.15, 3.95], [-0.07, 3.88], [0.03, 3.82], [0.15, 3.75], [0.28, 3.67], [0.41, 3.57], [0.55, 3.48], [0.66, 3.37], [0.76, 3.27], [0.86, 3.17], [0.97, 3.06], [1.11, 2.94], [1.25, 2.83], [1.38, 2.72], [1.48, 2.61], [1.56, 2.49], [1.63, 2.39], [1.7, 2.27], [1.83, 2.14], [1.97, 1.97], [2.1, 1.8], [2.23, 1.63], [2.36, 1.48], [2.48, 1.34], [2.6, 1.19], [2.72, 1.02], [2.84, 0.87], [2.96, 0.71], [3.07, 0.6], [3.19, 0.57], [3.3, 0.53], [3.41, 0.48], [3.53, 0.45], [3.65, 0.42], [3.77, 0.39], [3.89, 0.36], [4.02, 0.33], [4.14, 0.31], [4.26, 0.28], [4.38, 0.26], [4.51, 0.23], [4.64, 0.21], [4.77, 0.2], [4.9, 0.18]], [[-0.49, 4.38], [-0.45, 4.3], [-0.39, 4.22], [-0.33, 4.15], [-0.28, 4.08], [-0.22, 4.01], [-0.15, 3.94], [-0.07, 3.88], [0.03, 3.81], [0.15, 3.75], [0.28, 3.66], [0.41, 3.57], [0.55, 3.47], [0.66, 3.37], [0.77, 3.27], [0.87, 3.16], [0.97, 3.05], [1.11, 2.94], [1.25, 2.82], [1.38, 2.71], [1.48, 2.6], [1.56, 2.49], [1.63, 2.38], [1.7, 2.27], [1.83, 2.13], [1.97, 1.96], [2.1, 1.8], [2.23, 1.63], [2.36, 1.47], [2.48, 1.33], [2.6, 1.18], [2.72, 1.02], [2.84, 0.86], [2.96, 0.7], [3.07, 0.6], [3.19, 0.56], [3.3, 0.52], [3.41, 0.48], [3.53, 0.44], [3.65, 0.41], [3.77, 0.39], [3.89, 0.36], [4.02, 0.33], [4.14, 0.3], [4.26, 0.28], [4.38, 0.25], [4.51, 0.23], [4.64, 0.21], [4.77, 0.19], [4.9, 0.17]], [[-0.49, 4.37], [-0.45, 4.29], [-0.39, 4.22], [-0.33, 4.14], [-0.27, 4.07], [-0.22, 4.0], [-0.14, 3.94], [-0.07, 3.87], [0.03, 3.81], [0.15, 3.74], [0.28, 3.65], [0.42, 3.56], [0.55, 3.46], [0.66, 3.36], [0.77, 3.26], [0.87, 3.15], [0.97, 3.05], [1.11, 2.93], [1.25, 2.82], [1.38, 2.71], [1.48, 2.6], [1.56, 2.48], [1.63, 2.37], [1.71, 2.26], [1.83, 2.13], [1.97, 1.96], [2.1, 1.79], [2.23, 1.62], [2.36, 1.47], [2.48, 1.33], [2.6, 1.17], [2.72, 1.01], [2.84, 0.85], [2.96, 0.7], [3.07, 0.59], [3.19, 0.56], [3.3, 0.52], [3.42, 0.47], [3.53, 0.44], [3.65, 0.41], [3.77, 0.38], [3.9, 0.35], [4.02, 0.32], [4.14, 0.29], [4.26, 0.27], [4.39, 0.24], [4.51, 0.22], [4.64, 0.2], [4.77, 0.18], [4.9, 0.16]], [[-0.49, 4.37], [-0.45, 4.29], [-0.39, 4.22], [-0.33, 4.14], [-0.27, 4.07], [-0.22, 4.0], [-0.14, 3.94], [-0.07, 3.87], [0.03, 3.81], [0.15, 3.74], [0.28, 3.65], [0.42, 3.56], [0.55, 3.46], [0.66, 3.36], [0.77, 3.26], [0.87, 3.15], [0.97, 3.05], [1.11, 2.93], [1.25, 2.82], [1.38, 2.71], [1.48, 2.6], [1.56, 2.48], [1.63, 2.37], [1.71, 2.26], [1.83, 2.13], [1.97, 1.96], [2.1, 1.79], [2.23, 1.62], [2.36, 1.47], [2.48, 1.33], [2.6, 1.17], [2.72, 1.01], [2.84, 0.85], [2.96, 0.7], [3.07, 0.59], [3.19, 0.56], [3.3, 0.52], [3.42, 0.47], [3.53, 0.44], [3.65, 0.41], [3.77, 0.38], [3.9, 0.35], [4.02, 0.32], [4.14, 0.29], [4.26, 0.27], [4.39, 0.24], [4.51, 0.22], [4.64, 0.2], [4.77, 0.18], [4.9, 0.16]], [[-0.49, 4.37], [-0.44, 4.29], [-0.39, 4.21], [-0.33, 4.14], [-0.27, 4.07], [-0.21, 4.0], [-0.14, 3.94], [-0.07, 3.87], [0.03, 3.8], [0.16, 3.74], [0.29, 3.65], [0.42, 3.56], [0.55, 3.46], [0.67, 3.36], [0.77, 3.26], [0.87, 3.15], [0.98, 3.04], [1.12, 2.93], [1.25, 2.82], [1.38, 2.71], [1.48, 2.59], [1.56, 2.48], [1.63, 2.37], [1.71, 2.26], [1.83, 2.13], [1.97, 1.96], [2.1, 1.79], [2.23, 1.62], [2.36, 1.47], [2.48, 1.33], [2.6, 1.17], [2.72, 1.01], [2.84, 0.85], [2.97, 0.7], [3.08, 0.59], [3.19, 0.56], [3.31, 0.52], [3.42, 0.47], [3.53, 0.44], [3.65, 0.41], [3.78, 0.38], [3.9, 0.35], [4.02, 0.32], [4.14, 0.29], [4.27, 0.27], [4.39, 0.24], [4.51, 0.22], [4.64, 0.2], [4.77, 0.18], [4.91, 0.16]], [[-0.49, 4.37], [-0.44, 4.29], [-0.39, 4.21], [-0.33, 4.14], [-0.27, 4.07], [-0.21, 4.0], [-0.14, 3.93], [-0.07, 3.87], [0.03, 3.8], [0.16, 3.74], [0.29, 3.65], [0.42, 3.56], [0.55, 3.46], [0.67, 3.36], [0.77, 3.26], [0.87, 3.15], [0.98, 3.04], [1.12, 2.93], [1.25, 2.82], [1.38, 2.71], [1.49, 2.59], [1.56, 2.48], [1.63, 2.37], [1.71, 2.26], [1.83, 2.13], [1.97, 1.96], [2.1, 1.79], [2.23, 1.62], [2.36, 1.46], [2.48, 1.32], [2.6, 1.17], [2.72, 1.01], [2.84, 0.85], [2.97, 0.7], [3.08, 0.59], [3.19, 0.56], [3.31, 0.51], [3.42, 0.47], [3.54, 0.44], [3.66, 0.41], [3.78, 0.38], [3.9, 0.35], [4.02, 0.32], [4.14, 0.29], [4.27, 0.27], [4.39, 0.24], [4.52, 0.22], [4.64, 0.2], [4.78, 0.18], [4.91, 0.16]], [[-0.39, 4.17], [-0.33, 4.1], [-0.28, 4.04], [-0.22, 3.97], [-0.16, 3.9], [-0.09, 3.84], [-0.02, 3.77], [0.08, 3.71], [0.19, 3.64], [0.32, 3.55], [0.45, 3.46], [0.58, 3.37], [0.71, 3.28], [0.82, 3.18], [0.92, 3.08], [1.02, 2.98], [1.12, 2.88], [1.26, 2.76], [1.4, 2.66], [1.52, 2.54], [1.61, 2.44], [1.68, 2.33], [1.75, 2.22], [1.82, 2.11], [1.94, 1.98], [2.08, 1.81], [2.21, 1.65], [2.34, 1.48], [2.47, 1.33], [2.59, 1.19], [2.71, 1.04], [2.84, 0.87], [2.96, 0.72], [3.08, 0.57], [3.19, 0.5], [3.31, 0.46], [3.43, 0.41], [3.54, 0.37], [3.66, 0.33], [3.79, 0.3], [3.92, 0.27], [4.04, 0.24], [4.17, 0.21], [4.3, 0.18], [4.43, 0.15], [4.56, 0.13], [4.69, 0.1], [4.82, 0.08], [4.96, 0.06], [5.1, 0.03]], [[-0.59, 4.51], [-0.54, 4.43], [-0.49, 4.34], [-0.43, 4.26], [-0.37, 4.19], [-0.31, 4.11], [-0.25, 4.04], [-0.18, 3.97], [-0.09, 3.91], [0.01, 3.85], [0.14, 3.78], [0.27, 3.69], [0.4, 3.6], [0.52, 3.49], [0.63, 3.39], [0.73, 3.28], [0.84, 3.17], [0.98, 3.05], [1.12, 2.94], [1.25, 2.83], [1.36, 2.71], [1.44, 2.6], [1.51, 2.49], [1.59, 2.38], [1.71, 2.25], [1.85, 2.08], [1.98, 1.91], [2.1, 1.75], [2.23, 1.59], [2.35, 1.45], [2.46, 1.3], [2.58, 1.14], [2.7, 0.98], [2.81, 0.83], [2.93, 0.7], [3.04, 0.66], [3.15, 0.63], [3.26, 0.59], [3.37, 0.56], [3.48, 0.53], [3.6, 0.51], [3.71, 0.48], [3.83, 0.46], [3.95, 0.43], [4.06, 0.41], [4.18, 0.39], [4.29, 0.37], [4.42, 0.35], [4.54, 0.33], [4.67, 0.32]], [[-0.52, 4.43], [-0.48, 4.34], [-0.42, 4.26], [-0.36, 4.19], [-0.3, 4.12], [-0.24, 4.05], [-0.18, 3.97], [-0.1, 3.91], [-0.01, 3.84], [0.11, 3.78], [0.24, 3.7], [0.37, 3.61], [0.51, 3.51], [0.62, 3.41], [0.73, 3.3], [0.83, 3.2], [0.93, 3.09], [1.07, 2.97], [1.21, 2.86], [1.34, 2.75], [1.44, 2.63], [1.51, 2.52], [1.58, 2.41], [1.66, 2.3], [1.78, 2.17], [1.91, 2.0], [2.04, 1.83], [2.17, 1.66], [2.29, 1.51], [2.41, 1.37], [2.53, 1.22], [2.64, 1.06], [2.76, 0.9], [2.88, 0.74], [2.98, 0.64], [3.1, 0.61], [3.21, 0.57], [3.33, 0.54], [3.44, 0.51], [3.55, 0.48], [3.67, 0.45], [3.79, 0.43], [3.91, 0.4], [4.03, 0.37], [4.14, 0.35], [4.26, 0.33], [4.39, 0.31], [4.51, 0.29], [4.64, 0.27], [4.77, 0.26]], [[-0.47, 4.36], [-0.42, 4.28], [-0.36, 4.21], [-0.31, 4.14], [-0.25, 4.06], [-0.19, 3.99], [-0.11, 3.93], [-0.04, 3.86], [0.07, 3.79], [0.19, 3.72], [0.32, 3.63], [0.45, 3.54], [0.58, 3.45], [0.69, 3.34], [0.8, 3.24], [0.9, 3.14], [1.0, 3.03], [1.14, 2.91], [1.27, 2.8], [1.4, 2.69], [1.5, 2.58], [1.56, 2.47], [1.63, 2.37], [1.71, 2.25], [1.83, 2.12], [1.96, 1.95], [2.08, 1.78], [2.21, 1.62], [2.34, 1.46], [2.45, 1.32], [2.57, 1.17], [2.69, 1.01], [2.81, 0.85], [2.93, 0.7], [3.03, 0.61], [3.14, 0.58], [3.26, 0.54], [3.38, 0.51], [3.49, 0.48], [3.61, 0.45], [3.73, 0.42], [3.85, 0.4], [3.97, 0.37], [4.09, 0.34], [4.21, 0.32], [4.33, 0.3], [4.46, 0.28], [4.59, 0.26], [4.72, 0.24], [4.84, 0.23]], [[-0.49, 4.39], [-0.44, 4.31], [-0.39, 4.23], [-0.33, 4.16], [-0.27, 4.09], [-0.21, 4.02], [-0.15, 3.95], [-0.07, 3.88], [0.01, 3.82], [0.13, 3.76], [0.26, 3.69], [0.39, 3.6], [0.52, 3.51], [0.63, 3.41], [0.73, 3.31], [0.83, 3.2], [0.93, 3.1], [1.07, 2.98], [1.2, 2.87], [1.33, 2.76], [1.43, 2.65], [1.5, 2.55], [1.57, 2.44], [1.64, 2.33], [1.76, 2.2], [1.89, 2.04], [2.02, 1.88], [2.14, 1.71], [2.27, 1.56], [2.38, 1.42], [2.5, 1.28], [2.61, 1.12], [2.73, 0.96], [2.84, 0.81], [2.95, 0.69], [3.07, 0.66], [3.18, 0.63], [3.29, 0.6], [3.41, 0.57], [3.52, 0.54], [3.64, 0.52], [3.76, 0.49], [3.87, 0.47], [3.99, 0.45], [4.11, 0.42], [4.22, 0.4], [4.34, 0.38], [4.47, 0.37], [4.59, 0.35], [4.72, 0.34]], [[-0.44, 4.28], [-0.39, 4.21], [-0.34, 4.13], [-0.28, 4.06], [-0.22, 3.99], [-0.17, 3.93], [-0.09, 3.86], [-0.02, 3.8], [0.08, 3.74], [0.2, 3.67], [0.33, 3.59], [0.46, 3.5], [0.59, 3.41], [0.7, 3.31], [0.8, 3.21], [0.9, 3.11], [1.0, 3.0], [1.14, 2.89], [1.27, 2.78], [1.4, 2.67], [1.49, 2.56], [1.56, 2.46], [1.62, 2.36], [1.7, 2.25], [1.82, 2.11], [1.95, 1.95], [2.07, 1.78], [2.2, 1.62], [2.33, 1.46], [2.44, 1.33], [2.56, 1.18], [2.68, 1.02], [2.8, 0.86], [2.91, 0.71], [3.02, 0.62], [3.13, 0.59], [3.25, 0.55], [3.37, 0.52], [3.48, 0.49], [3.6, 0.46], [3.72, 0.44], [3.84, 0.41], [3.96, 0.39], [4.08, 0.36], [4.2, 0.34], [4.32, 0.32], [4.45, 0.3], [4.58, 0.28], [4.7, 0.26], [4.83, 0.25]], [[-0.47, 4.34], [-0.42, 4.27], [-0.37, 4.19], [-0.31, 4.12], [-0.26, 4.05], [-0.2, 3.98], [-0.13, 3.91], [-0.06, 3.85], [0.03, 3.79], [0.14, 3.73], [0.27, 3.66], [0.4, 3.57], [0.53, 3.48], [0.64, 3.38], [0.75, 3.28], [0.84, 3.18], [0.95, 3.07], [1.08, 2.96], [1.21, 2.85], [1.34, 2.74], [1.44, 2.63], [1.51, 2.52], [1.58, 2.42], [1.65, 2.31], [1.77, 2.18], [1.9, 2.02], [2.03, 1.85], [2.15, 1.69], [2.28, 1.54], [2.39, 1.4], [2.51, 1.26], [2.62, 1.1], [2.74, 0.94], [2.86, 0.79], [2.96, 0.68], [3.08, 0.65], [3.19, 0.62], [3.31, 0.59], [3.42, 0.56], [3.54, 0.54], [3.66, 0.51], [3.77, 0.49], [3.89, 0.47], [4.01, 0.44], [4.13, 0.42], [4.25, 0.4], [4.37, 0.38], [4.49, 0.37], [4.62, 0.35], [4.74, 0.34]], [[-0.42, 4.25], [-0.37, 4.18], [-0.31, 4.1], [-0.26, 4.04], [-0.2, 3.97], [-0.14, 3.9], [-0.07, 3.84], [0.0, 3.77], [0.1, 3.71], [0.23, 3.65], [0.35, 3.57], [0.48, 3.48], [0.61, 3.39], [0.72, 3.29], [0.82, 3.19], [0.92, 3.09], [1.02, 2.99], [1.16, 2.88], [1.29, 2.77], [1.41, 2.66], [1.51, 2.55], [1.57, 2.45], [1.64, 2.35], [1.71, 2.24], [1.83, 2.11], [1.96, 1.94], [2.09, 1.78], [2.21, 1.62], [2.34, 1.46], [2.46, 1.33], [2.57, 1.18], [2.69, 1.02], [2.81, 0.86], [2.93, 0.71], [3.03, 0.62], [3.15, 0.59], [3.26, 0.56], [3.38, 0.53], [3.5, 0.5], [3.62, 0.48], [3.74, 0.45], [3.86, 0.42], [3.98, 0.4], [4.11, 0.37], [4.23, 0.35], [4.35, 0.33], [4.47, 0.31], [4.6, 0.3], [4.73, 0.28], [4.86, 0.26]], [[-0.43, 4.29], [-0.38, 4.22], [-0.33, 4.14], [-0.27, 4.07], [-0.22, 4.0], [-0.16, 3.94], [-0.09, 3.87], [-0.02, 3.81], [0.08, 3.75], [0.2, 3.69], [0.33, 3.61], [0.46, 3.52], [0.59, 3.43], [0.7, 3.33], [0.8, 3.23], [0.9, 3.13], [1.0, 3.02], [1.13, 2.91], [1.27, 2.8], [1.39, 2.7], [1.49, 2.59], [1.55, 2.48], [1.62, 2.38], [1.69, 2.27], [1.81, 2.14], [1.94, 1.98], [2.07, 1.81], [2.19, 1.65], [2.32, 1.5], [2.44, 1.36], [2.55, 1.21], [2.67, 1.05], [2.79, 0.9], [2.91, 0.75], [3.01, 0.65], [3.13, 0.62], [3.24, 0.58], [3.36, 0.55], [3.48, 0.53], [3.6, 0.51], [3.72, 0.48], [3.84, 0.46], [3.96, 0.43], [4.08, 0.41], [4.2, 0.39], [4.32, 0.37], [4.45, 0.35], [4.57, 0.33], [4.7, 0.32], [4.83, 0.3]], [[-0.43, 4.28], [-0.38, 4.2], [-0.33, 4.13], [-0.27, 4.06], [-0.22, 3.99], [-0.16, 3.93], [-0.09, 3.86], [-0.01, 3.8], [0.08, 3.74], [0.2, 3.67], [0.33, 3.6], [0.46, 3.51], [0.59, 3.42], [0.7, 3.32], [0.8, 3.22], [0.9, 3.12], [1.0, 3.02], [1.14, 2.9], [1.27, 2.8], [1.39, 2.69], [1.49, 2.58], [1.55, 2.48], [1.62, 2.37], [1.7, 2.26], [1.81, 2.13], [1.94, 1.97], [2.07, 1.8], [2.2, 1.64], [2.32, 1.49], [2.44, 1.35], [2.55, 1.2], [2.67, 1.04], [2.79, 0.89], [2.91, 0.74], [3.01, 0.64], [3.13, 0.61], [3.24, 0.58], [3.36, 0.55], [3.48, 0.52], [3.6, 0.5], [3.72, 0.47], [3.84, 0.45], [3.96, 0.42], [4.08, 0.4], [4.2, 0.38], [4.32, 0.35], [4.45, 0.34], [4.57, 0.32], [4.7, 0.31], [4.83, 0.29]], [[-0.43, 4.28], [-0.38, 4.21], [-0.33, 4.13], [-0.27, 4.06], [-0.22, 4.0], [-0.16, 3.93], [-0.09, 3.86], [-0.01, 3.8], [0.08, 3.74], [0.2, 3.68], [0.33, 3.6], [0.46, 3.51], [0.59, 3.42], [0.7, 3.32], [0.8, 3.23], [0.9, 3.12], [1.0, 3.02], [1.14, 2.91], [1.27, 2.8], [1.39, 2.69], [1.49, 2.58], [1.55, 2.48], [1.62, 2.37], [1.7, 2.27], [1.81, 2.14], [1.94, 1.97], [2.07, 1.81], [2.2, 1.64], [2.32, 1.49], [2.44, 1.35], [2.55, 1.21], [2.67, 1.05], [2.79, 0.89], [2.91, 0.74], [3.01, 0.64], [3.13, 0.61], [3.24, 0.58], [3.36, 0.55], [3.48, 0.52], [3.6, 0.5], [3.72, 0.47], [3.84, 0.45], [3.96, 0.43], [4.08, 0.4], [4.2, 0.38], [4.32, 0.36], [4.45, 0.34], [4.58, 0.32], [4.7, 0.31], [4.83, 0.29]], [[-0.43, 4.28], [-0.38, 4.21], [-0.33, 4.13], [-0.27, 4.06], [-0.22, 4.0], [-0.16, 3.93], [-0.09, 3.86], [-0.01, 3.8], [0.08, 3.74], [0.2, 3.68], [0.33, 3.6], [0.46, 3.51], [0.59, 3.42], [0.7, 3.32], [0.8, 3.23], [0.9, 3.12], [1.0, 3.02], [1.14, 2.91], [1.27, 2.8], [1.39, 2.69], [1.49, 2.58], [1.55, 2.48], [1.62, 2.37], [1.7, 2.27], [1.82, 2.14], [1.95, 1.97], [2.07, 1.81], [2.2, 1.64], [2.32, 1.49], [2.44, 1.35], [2.56, 1.21], [2.67, 1.05], [2.79, 0.89], [2.91, 0.74], [3.01, 0.64], [3.13, 0.61], [3.25, 0.58], [3.36, 0.55], [3.48, 0.52], [3.6, 0.5], [3.72, 0.47], [3.84, 0.45], [3.96, 0.43], [4.08, 0.4], [4.21, 0.38], [4.33, 0.36], [4.45, 0.34], [4.58, 0.32], [4.71, 0.31], [4.84, 0.29]], [[-0.32, 4.12], [-0.27, 4.05], [-0.22, 3.98], [-0.17, 3.92], [-0.11, 3.85], [-0.04, 3.79], [0.03, 3.73], [0.13, 3.66], [0.24, 3.6], [0.36, 3.52], [0.49, 3.44], [0.62, 3.35], [0.75, 3.26], [0.85, 3.17], [0.95, 3.07], [1.04, 2.97], [1.14, 2.87], [1.27, 2.76], [1.4, 2.66], [1.52, 2.55], [1.6, 2.45], [1.66, 2.35], [1.73, 2.25], [1.8, 2.14], [1.92, 2.01], [2.05, 1.85], [2.17, 1.68], [2.3, 1.52], [2.43, 1.37], [2.55, 1.23], [2.67, 1.08], [2.79, 0.92], [2.91, 0.77], [3.03, 0.62], [3.13, 0.55], [3.25, 0.52], [3.37, 0.49], [3.49, 0.45], [3.61, 0.42], [3.74, 0.4], [3.87, 0.37], [3.99, 0.34], [4.12, 0.32], [4.24, 0.29], [4.37, 0.27], [4.5, 0.25], [4.63, 0.23], [4.76, 0.21], [4.89, 0.19], [5.03, 0.17]], [[-0.38, 4.24], [-0.33, 4.16], [-0.27, 4.09], [-0.22, 4.03], [-0.16, 3.96], [-0.1, 3.89], [-0.02, 3.83], [0.06, 3.77], [0.17, 3.7], [0.29, 3.63], [0.42, 3.54], [0.55, 3.46], [0.68, 3.36], [0.78, 3.27], [0.88, 3.17], [0.98, 3.07], [1.08, 2.96], [1.21, 2.85], [1.35, 2.74], [1.47, 2.64], [1.55, 2.53], [1.61, 2.43], [1.68, 2.33], [1.76, 2.22], [1.87, 2.09], [2.0, 1.92], [2.13, 1.76], [2.26, 1.59], [2.38, 1.44], [2.5, 1.31], [2.62, 1.16], [2.74, 1.0], [2.86, 0.85], [2.98, 0.69], [3.08, 0.61], [3.2, 0.58], [3.32, 0.54], [3.44, 0.51], [3.57, 0.49], [3.69, 0.46], [3.82, 0.44], [3.94, 0.41], [4.07, 0.39], [4.19, 0.37], [4.32, 0.34], [4.44, 0.32], [4.57, 0.3], [4.7, 0.29], [4.83, 0.27], [4.97, 0.25]], [[-0.49, 4.07], [-0.45, 3.99], [-0.39, 3.92], [-0.34, 3.85], [-0.28, 3.79], [-0.22, 3.73], [-0.15, 3.67], [-0.07, 3.61], [0.03, 3.55], [0.16, 3.48], [0.29, 3.39], [0.42, 3.31], [0.56, 3.22], [0.67, 3.12], [0.78, 3.03], [0.87, 2.93], [0.98, 2.83], [1.12, 2.72], [1.25, 2.61], [1.37, 2.5], [1.46, 2.4], [1.53, 2.3], [1.59, 2.19], [1.67, 2.08], [1.78, 1.95], [1.91, 1.78], [2.04, 1.62], [2.16, 1.45], [2.29, 1.3], [2.4, 1.16], [2.52, 1.0], [2.63, 0.84], [2.75, 0.68], [2.86, 0.55], [2.95, 0.48], [3.07, 0.45], [3.18, 0.41], [3.3, 0.37], [3.41, 0.34], [3.53, 0.31], [3.65, 0.28], [3.77, 0.25], [3.89, 0.23], [4.01, 0.2], [4.13, 0.18], [4.25, 0.15], [4.37, 0.13], [4.5, 0.11], [4.63, 0.08], [4.75, 0.06]], [[-0.39, 4.34], [-0.34, 4.26], [-0.29, 4.19], [-0.24, 4.12], [-0.18, 4.05], [-0.12, 3.98], [-0.04, 3.91], [0.03, 3.85], [0.14, 3.79], [0.26, 3.72], [0.38, 3.65], [0.51, 3.55], [0.64, 3.46], [0.75, 3.36], [0.85, 3.26], [0.95, 3.16], [1.05, 3.05], [1.19, 2.93], [1.32, 2.83], [1.44, 2.71], [1.53, 2.61], [1.59, 2.5], [1.65, 2.4], [1.73, 2.29], [1.84, 2.16], [1.97, 1.99], [2.09, 1.83], [2.22, 1.66], [2.34, 1.51], [2.46, 1.37], [2.57, 1.22], [2.69, 1.06], [2.81, 0.9], [2.92, 0.75], [3.03, 0.65], [3.14, 0.61], [3.26, 0.58], [3.38, 0.55], [3.5, 0.53], [3.62, 0.5], [3.74, 0.48], [3.87, 0.46], [3.99, 0.44], [4.11, 0.41], [4.23, 0.39], [4.36, 0.37], [4.48, 0.36], [4.61, 0.34], [4.75, 0.33], [4.88, 0.32]], [[-0.48, 4.16], [-0.43, 4.08], [-0.38, 4.0], [-0.33, 3.93], [-0.27, 3.87], [-0.21, 3.81], [-0.14, 3.74], [-0.06, 3.68], [0.03, 3.63], [0.16, 3.57], [0.29, 3.49], [0.42, 3.4], [0.55, 3.32], [0.67, 3.22], [0.77, 3.12], [0.87, 3.02], [0.97, 2.92], [1.11, 2.8], [1.24, 2.7], [1.37, 2.59], [1.46, 2.48], [1.52, 2.38], [1.59, 2.28], [1.66, 2.17], [1.78, 2.03], [1.91, 1.87], [2.03, 1.7], [2.16, 1.53], [2.29, 1.38], [2.4, 1.24], [2.52, 1.09], [2.63, 0.92], [2.75, 0.77], [2.87, 0.61], [2.97, 0.54], [3.08, 0.5], [3.2, 0.46], [3.31, 0.43], [3.43, 0.4], [3.55, 0.37], [3.67, 0.34], [3.79, 0.32], [3.91, 0.29], [4.03, 0.26], [4.15, 0.24], [4.27, 0.22], [4.4, 0.2], [4.52, 0.18], [4.65, 0.16], [4.78, 0.14]], [[-0.44, 4.29], [-0.39, 4.21], [-0.34, 4.14], [-0.28, 4.06], [-0.22, 4.0], [-0.17, 3.93], [-0.09, 3.86], [-0.02, 3.8], [0.08, 3.75], [0.2, 3.69], [0.33, 3.61], [0.46, 3.52], [0.59, 3.44], [0.7, 3.34], [0.81, 3.24], [0.9, 3.13], [1.01, 3.03], [1.14, 2.91], [1.28, 2.8], [1.4, 2.69], [1.49, 2.59], [1.56, 2.48], [1.62, 2.38], [1.7, 2.27], [1.82, 2.14], [1.95, 1.97], [2.07, 1.81], [2.2, 1.64], [2.33, 1.49], [2.44, 1.35], [2.56, 1.2], [2.68, 1.04], [2.8, 0.89], [2.92, 0.73], [3.02, 0.63], [3.14, 0.59], [3.26, 0.56], [3.37, 0.53], [3.5, 0.5], [3.62, 0.48], [3.74, 0.46], [3.86, 0.43], [3.99, 0.41], [4.11, 0.39], [4.23, 0.36], [4.36, 0.34], [4.48, 0.33], [4.61, 0.31], [4.75, 0.3], [4.88, 0.28]], [[-0.44, 4.29], [-0.39, 4.21], [-0.34, 4.13], [-0.28, 4.06], [-0.22, 3.99], [-0.17, 3.93], [-0.09, 3.86], [-0.02, 3.8], [0.08, 3.74], [0.2, 3.68], [0.33, 3.61], [0.46, 3.52], [0.59, 3.43], [0.7, 3.33], [0.8, 3.23], [0.9, 3.13], [1.01, 3.02], [1.14, 2.91], [1.28, 2.8], [1.4, 2.69], [1.49, 2.58], [1.55, 2.48], [1.62, 2.38], [1.7, 2.27], [1.82, 2.14], [1.94, 1.97], [2.07, 1.81], [2.2, 1.64], [2.33, 1.49], [2.44, 1.35], [2.56, 1.2], [2.68, 1.04], [2.8, 0.88], [2.91, 0.73], [3.02, 0.63], [3.14, 0.59], [3.26, 0.56], [3.37, 0.53], [3.49, 0.5], [3.62, 0.48], [3.74, 0.46], [3.86, 0.43], [3.98, 0.41], [4.11, 0.38], [4.23, 0.36], [4.35, 0.34], [4.48, 0.32], [4.61, 0.31], [4.74, 0.3], [4.88, 0.28]], [[-0.44, 4.29], [-0.39, 4.21], [-0.34, 4.13], [-0.28, 4.06], [-0.23, 3.99], [-0.17, 3.93], [-0.09, 3.86], [-0.02, 3.8], [0.08, 3.74], [0.2, 3.68], [0.33, 3.61], [0.46, 3.52], [0.59, 3.43], [0.7, 3.33], [0.8, 3.23], [0.9, 3.13], [1.01, 3.02], [1.14, 2.91], [1.28, 2.8], [1.4, 2.69], [1.49, 2.58], [1.55, 2.48], [1.62, 2.38], [1.7, 2.27], [1.82, 2.14], [1.94, 1.97], [2.07, 1.81], [2.2, 1.64], [2.33, 1.49], [2.44, 1.35], [2.56, 1.2], [2.68, 1.04], [2.8, 0.88], [2.91, 0.73], [3.02, 0.63], [3.14, 0.59], [3.25, 0.56], [3.37, 0.53], [3.49, 0.5], [3.62, 0.48], [3.74, 0.45], [3.86, 0.43], [3.98, 0.41], [4.11, 0.38], [4.23, 0.36], [4.35, 0.34], [4.48, 0.32], [4.61, 0.31], [4.74, 0.29], [4.88, 0.28]], [[-0.44, 4.29], [-0.39, 4.21], [-0.34, 4.13], [-0.28, 4.06], [-0.23, 3.99], [-0.17, 3.93], [-0.09, 3.86], [-0.02, 3.8], [0.08, 3.74], [0.2, 3.68], [0.32, 3.61], [0.46, 3.52], [0.59, 3.43], [0.7, 3.33], [0.8, 3.23], [0.9, 3.13], [1.0, 3.02], [1.14, 2.91], [1.28, 2.8], [1.4, 2.69], [1.49, 2.58], [1.55, 2.48], [1.62, 2.37], [1.7, 2.27], [1.82, 2.14], [1.94, 1.97], [2.07, 1.81], [2.2, 1.64], [2.33, 1.49], [2.44, 1.35], [2.56, 1.2], [2.68, 1.04], [2.8, 0.88], [2.91, 0.73], [3.02, 0.63], [3.14, 0.59], [3.25, 0.56], [3.37, 0.53], [3.49, 0.5], [3.62, 0.48], [3.74, 0.45], [3.86, 0.43], [3.98, 0.41], [4.11, 0.38], [4.23, 0.36], [4.35, 0.34], [4.48, 0.32], [4.61, 0.31], [4.74, 0.29], [4.88, 0.28]], [[-0.43, 4.27], [-0.38, 4.2], [-0.33, 4.12], [-0.27, 4.05], [-0.22, 3.98], [-0.16, 3.92], [-0.08, 3.85], [-0.01, 3.79], [0.09, 3.73], [0.21, 3.67], [0.34, 3.6], [0.47, 3.51], [0.6, 3.42], [0.71, 3.32], [0.82, 3.22], [0.91, 3.12], [1.02, 3.01], [1.15, 2.9], [1.29, 2.79], [1.41, 2.68], [1.5, 2.57], [1.56, 2.47], [1.63, 2.37], [1.71, 2.26], [1.83, 2.13], [1.95, 1.96], [2.08, 1.8], [2.21, 1.63], [2.33, 1.48], [2.45, 1.34], [2.57, 1.19], [2.69, 1.03], [2.81, 0.87], [2.92, 0.72], [3.03, 0.62], [3.15, 0.59], [3.27, 0.55], [3.38, 0.52], [3.5, 0.49], [3.63, 0.47], [3.75, 0.45], [3.87, 0.42], [4.0, 0.4], [4.12, 0.37], [4.24, 0.35], [4.37, 0.33], [4.49, 0.31], [4.63, 0.3], [4.76, 0.28], [4.89, 0.27]], [[-0.37, 4.18], [-0.32, 4.1], [-0.27, 4.03], [-0.21, 3.96], [-0.16, 3.89], [-0.09, 3.83], [-0.02, 3.77], [0.06, 3.71], [0.17, 3.65], [0.29, 3.58], [0.42, 3.51], [0.55, 3.42], [0.68, 3.33], [0.79, 3.23], [0.89, 3.14], [0.99, 3.04], [1.09, 2.93], [1.22, 2.82], [1.35, 2.72], [1.47, 2.61], [1.54, 2.51], [1.6, 2.41], [1.67, 2.31], [1.74, 2.2], [1.85, 2.07], [1.98, 1.91], [2.11, 1.74], [2.23, 1.58], [2.36, 1.43], [2.47, 1.29], [2.59, 1.14], [2.71, 0.98], [2.82, 0.83], [2.94, 0.67], [3.04, 0.6], [3.16, 0.56], [3.28, 0.53], [3.39, 0.5], [3.52, 0.47], [3.64, 0.45], [3.76, 0.42], [3.89, 0.4], [4.01, 0.37], [4.13, 0.35], [4.26, 0.33], [4.38, 0.31], [4.51, 0.29], [4.64, 0.28], [4.77, 0.26], [4.91, 0.25]], [[-0.39, 4.23], [-0.34, 4.16], [-0.29, 4.08], [-0.24, 4.01], [-0.18, 3.95], [-0.12, 3.88], [-0.05, 3.82], [0.03, 3.76], [0.13, 3.7], [0.26, 3.64], [0.38, 3.56], [0.51, 3.48], [0.64, 3.39], [0.75, 3.29], [0.85, 3.19], [0.95, 3.09], [1.05, 2.99], [1.19, 2.88], [1.32, 2.77], [1.44, 2.66], [1.51, 2.56], [1.58, 2.46], [1.64, 2.35], [1.72, 2.25], [1.83, 2.12], [1.95, 1.96], [2.08, 1.79], [2.2, 1.63], [2.33, 1.48], [2.44, 1.34], [2.56, 1.2], [2.68, 1.04], [2.79, 0.88], [2.91, 0.73], [3.02, 0.63], [3.13, 0.6], [3.25, 0.57], [3.36, 0.54], [3.48, 0.51], [3.61, 0.49], [3.73, 0.47], [3.85, 0.44], [3.97, 0.42], [4.09, 0.4], [4.22, 0.38], [4.34, 0.36], [4.47, 0.34], [4.6, 0.33], [4.73, 0.31], [4.86, 0.3]], [[-0.39, 4.23], [-0.34, 4.16], [-0.29, 4.08], [-0.24, 4.01], [-0.18, 3.95], [-0.12, 3.88], [-0.05, 3.82], [0.03, 3.76], [0.13, 3.7], [0.26, 3.64], [0.38, 3.56], [0.51, 3.48], [0.64, 3.39], [0.75, 3.29], [0.85, 3.19], [0.95, 3.09], [1.05, 2.99], [1.19, 2.88], [1.31, 2.77], [1.44, 2.66], [1.51, 2.56], [1.58, 2.46], [1.64, 2.35], [1.72, 2.25], [1.83, 2.12], [1.95, 1.96], [2.08, 1.8], [2.2, 1.63], [2.33, 1.48], [2.44, 1.34], [2.56, 1.2], [2.68, 1.04], [2.79, 0.88], [2.91, 0.73], [3.01, 0.63], [3.13, 0.6], [3.25, 0.57], [3.36, 0.54], [3.48, 0.51], [3.61, 0.49], [3.73, 0.47], [3.85, 0.44], [3.97, 0.42], [4.09, 0.4], [4.22, 0.38], [4.34, 0.36], [4.47, 0.34], [4.6, 0.33], [4.73, 0.31], [4.86, 0.3]], [[-0.39, 4.23], [-0.34, 4.16], [-0.29, 4.08], [-0.24, 4.01], [-0.18, 3.95], [-0.12, 3.88], [-0.05, 3.82], [0.03, 3.76], [0.13, 3.7], [0.26, 3.64], [0.38, 3.56], [0.51, 3.48], [0.64, 3.39], [0.75, 3.29], [0.85, 3.19], [0.95, 3.09], [1.05, 2.99], [1.19, 2.88], [1.31, 2.77], [1.44, 2.66], [1.51, 2.56], [1.58, 2.46], [1.64, 2.35], [1.72, 2.25], [1.83, 2.12], [1.95, 1.96], [2.08, 1.8], [2.2, 1.63], [2.33, 1.48], [2.44, 1.34], [2.56, 1.2], [2.68, 1.04], [2.79, 0.88], [2.91, 0.73], [3.01, 0.63], [3.13, 0.6], [3.25, 0.57], [3.36, 0.54], [3.48, 0.51], [3.61, 0.49], [3.73, 0.47], [3.85, 0.44], [3.97, 0.42], [4.09, 0.4], [4.22, 0.38], [4.34, 0.36], [4.47, 0.34], [4.6, 0.33], [4.73, 0.31], [4.86, 0.3]], [[-0.39, 4.23], [-0.34, 4.16], [-0.29, 4.08], [-0.24, 4.01], [-0.18, 3.95], [-0.12, 3.88], [-0.05, 3.82], [0.03, 3.76], [0.13, 3.7], [0.26, 3.64], [0.38, 3.56], [0.51, 3.48], [0.64, 3.39], [0.75, 3.29], [0.85, 3.19], [0.95, 3.09], [1.05, 2.99], [1.19, 2.88], [1.31, 2.77], [1.44, 2.66], [1.51, 2.56], [1.58, 2.46], [1.64, 2.35], [1.72, 2.25], [1.83, 2.12], [1.95, 1.96], [2.08, 1.8], [2.2, 1.63], [2.33, 1.48], [2.44, 1.34], [2.56, 1.2], [2.68, 1.04], [2.79, 0.88], [2.91, 0.73], [3.01, 0.63], [3.13, 0.6], [3.25, 0.57], [3.36, 0.54], [3.48, 0.51], [3.61, 0.49], [3.73, 0.47], [3.85, 0.44], [3.97, 0.42], [4.09, 0.4], [4.22, 0.38], [4.34, 0.36], [4.47, 0.34], [4.6, 0.33], [4.73, 0.31], [4.86, 0.3]], [[-0.39, 4.23], [-0.34, 4.16], [-0.29, 4.08], [-0.24, 4.01], [-0.18, 3.95], [-0.12, 3.88], [-0.05, 3.82], [0.03, 3.76], [0.13, 3.7], [0.26, 3.64], [0.38, 3.56], [0.51, 3.48], [0.64, 3.39], [0.75, 3.29], [0.85, 3.19], [0.95, 3.09], [1.05, 2.99], [1.19, 2.88], [1.31, 2.77], [1.44, 2.66], [1.51, 2.56], [1.58, 2.46], [1.64, 2.35], [1.72, 2.25], [1.83, 2.12], [1.95, 1.96], [2.08, 1.79], [2.2, 1.63], [2.33, 1.48], [2.44, 1.34], [2.56, 1.2], [2.68, 1.04], [2.79, 0.88], [2.91, 0.73], [3.01, 0.63], [3.13, 0.6], [3.25, 0.57], [3.36, 0.54], [3.48, 0.51], [3.61, 0.49], [3.73, 0.47], [3.85, 0.44], [3.97, 0.42], [4.09, 0.4], [4.22, 0.38], [4.34, 0.36], [4.47, 0.34], [4.6, 0.33], [4.73, 0.31], [4.86, 0.3]], [[-0.39, 4.24], [-0.35, 4.16], [-0.29, 4.09], [-0.24, 4.02], [-0.18, 3.95], [-0.12, 3.88], [-0.05, 3.82], [0.03, 3.76], [0.13, 3.7], [0.25, 3.64], [0.38, 3.57], [0.51, 3.48], [0.64, 3.39], [0.75, 3.29], [0.85, 3.2], [0.95, 3.1], [1.05, 2.99], [1.18, 2.88], [1.31, 2.77], [1.44, 2.66], [1.51, 2.56], [1.57, 2.46], [1.64, 2.36], [1.71, 2.25], [1.83, 2.12], [1.95, 1.96], [2.08, 1.8], [2.2, 1.63], [2.33, 1.48], [2.44, 1.35], [2.56, 1.2], [2.68, 1.04], [2.79, 0.88], [2.91, 0.73], [3.01, 0.64], [3.13, 0.6], [3.25, 0.57], [3.36, 0.54], [3.48, 0.51], [3.61, 0.49], [3.73, 0.47], [3.85, 0.45], [3.97, 0.42], [4.09, 0.4], [4.22, 0.38], [4.34, 0.36], [4.46, 0.34], [4.59, 0.33], [4.73, 0.32], [4.86, 0.3]], [[-0.4, 4.24], [-0.36, 4.16], [-0.31, 4.09], [-0.25, 4.02], [-0.2, 3.95], [-0.13, 3.89], [-0.06, 3.83], [0.02, 3.76], [0.12, 3.71], [0.24, 3.65], [0.36, 3.57], [0.49, 3.49], [0.62, 3.4], [0.73, 3.3], [0.84, 3.2], [0.93, 3.1], [1.03, 3.0], [1.17, 2.89], [1.3, 2.78], [1.42, 2.67], [1.5, 2.57], [1.56, 2.47], [1.63, 2.36], [1.7, 2.26], [1.82, 2.13], [1.94, 1.97], [2.07, 1.8], [2.19, 1.64], [2.32, 1.49], [2.43, 1.35], [2.55, 1.2], [2.67, 1.04], [2.78, 0.89], [2.9, 0.73], [3.0, 0.64], [3.12, 0.61], [3.24, 0.58], [3.35, 0.54], [3.47, 0.52], [3.59, 0.5], [3.72, 0.47], [3.84, 0.45], [3.96, 0.43], [4.08, 0.4], [4.2, 0.38], [4.33, 0.36], [4.45, 0.35], [4.58, 0.33], [4.71, 0.32], [4.84, 0.31]], [[-0.37, 4.19], [-0.33, 4.12], [-0.28, 4.04], [-0.22, 3.98], [-0.17, 3.91], [-0.1, 3.85], [-0.03, 3.79], [0.05, 3.73], [0.16, 3.67], [0.28, 3.6], [0.41, 3.53], [0.54, 3.44], [0.67, 3.35], [0.77, 3.26], [0.88, 3.16], [0.97, 3.06], [1.07, 2.96], [1.21, 2.85], [1.33, 2.74], [1.46, 2.63], [1.53, 2.53], [1.59, 2.43], [1.66, 2.33], [1.73, 2.22], [1.84, 2.1], [1.97, 1.93], [2.09, 1.77], [2.22, 1.61], [2.34, 1.45], [2.46, 1.32], [2.57, 1.17], [2.69, 1.01], [2.81, 0.86], [2.92, 0.7], [3.03, 0.62], [3.14, 0.59], [3.26, 0.55], [3.37, 0.52], [3.5, 0.5], [3.62, 0.47], [3.74, 0.45], [3.86, 0.43], [3.99, 0.4], [4.11, 0.38], [4.23, 0.36], [4.36, 0.34], [4.48, 0.32], [4.61, 0.31], [4.75, 0.29], [4.88, 0.28]], [[-0.35, 4.17], [-0.3, 4.1], [-0.25, 4.02], [-0.2, 3.95], [-0.14, 3.89], [-0.08, 3.83], [-0.0, 3.76], [0.08, 3.7], [0.19, 3.65], [0.31, 3.58], [0.43, 3.51], [0.56, 3.42], [0.69, 3.33], [0.8, 3.24], [0.9, 3.14], [1.0, 3.04], [1.1, 2.94], [1.23, 2.83], [1.35, 2.72], [1.47, 2.62], [1.54, 2.52], [1.6, 2.42], [1.66, 2.32], [1.74, 2.21], [1.84, 2.09], [1.96, 1.93], [2.09, 1.77], [2.21, 1.61], [2.33, 1.45], [2.45, 1.32], [2.56, 1.17], [2.68, 1.01], [2.79, 0.86], [2.91, 0.71], [3.01, 0.63], [3.12, 0.6], [3.24, 0.56], [3.36, 0.53], [3.48, 0.51], [3.6, 0.49], [3.72, 0.46], [3.84, 0.44], [3.96, 0.42], [4.08, 0.39], [4.21, 0.37], [4.33, 0.36], [4.45, 0.34], [4.59, 0.32], [4.72, 0.31], [4.85, 0.3]], [[-0.35, 4.15], [-0.3, 4.07], [-0.25, 4.0], [-0.2, 3.93], [-0.14, 3.87], [-0.07, 3.81], [-0.0, 3.74], [0.08, 3.68], [0.19, 3.62], [0.31, 3.56], [0.44, 3.48], [0.57, 3.4], [0.7, 3.31], [0.81, 3.21], [0.91, 3.12], [1.01, 3.02], [1.11, 2.91], [1.25, 2.8], [1.37, 2.7], [1.48, 2.59], [1.56, 2.49], [1.62, 2.39], [1.69, 2.29], [1.76, 2.18], [1.87, 2.06], [1.99, 1.89], [2.12, 1.73], [2.25, 1.56], [2.37, 1.41], [2.49, 1.28], [2.61, 1.13], [2.73, 0.96], [2.85, 0.81], [2.97, 0.66], [3.07, 0.58], [3.19, 0.54], [3.3, 0.51], [3.42, 0.48], [3.55, 0.45], [3.67, 0.43], [3.8, 0.4], [3.92, 0.37], [4.05, 0.35], [4.17, 0.33], [4.3, 0.3], [4.42, 0.28], [4.55, 0.27], [4.69, 0.25], [4.82, 0.23], [4.95, 0.22]], [[-0.52, 4.28], [-0.47, 4.2], [-0.42, 4.12], [-0.37, 4.04], [-0.31, 3.96], [-0.25, 3.89], [-0.19, 3.83], [-0.12, 3.76], [-0.03, 3.7], [0.08, 3.65], [0.21, 3.58], [0.34, 3.51], [0.48, 3.42], [0.59, 3.32], [0.71, 3.22], [0.81, 3.12], [0.92, 3.01], [1.06, 2.9], [1.2, 2.79], [1.33, 2.68], [1.44, 2.57], [1.5, 2.47], [1.58, 2.36], [1.65, 2.26], [1.78, 2.13], [1.91, 1.97], [2.05, 1.8], [2.18, 1.64], [2.31, 1.48], [2.43, 1.35], [2.56, 1.2], [2.68, 1.04], [2.8, 0.88], [2.93, 0.73], [3.04, 0.61], [3.16, 0.58], [3.28, 0.55], [3.4, 0.52], [3.52, 0.49], [3.65, 0.46], [3.77, 0.44], [3.9, 0.41], [4.02, 0.39], [4.15, 0.36], [4.28, 0.34], [4.4, 0.32], [4.53, 0.3], [4.66, 0.28], [4.8, 0.27], [4.93, 0.25]], [[-0.6, 4.49], [-0.55, 4.4], [-0.5, 4.31], [-0.44, 4.23], [-0.38, 4.14], [-0.32, 4.07], [-0.26, 3.99], [-0.19, 3.92], [-0.1, 3.86], [0.0, 3.8], [0.14, 3.73], [0.27, 3.65], [0.42, 3.55], [0.53, 3.45], [0.65, 3.34], [0.76, 3.23], [0.87, 3.12], [1.01, 3.0], [1.16, 2.89], [1.29, 2.77], [1.4, 2.66], [1.48, 2.55], [1.55, 2.44], [1.63, 2.33], [1.76, 2.2], [1.9, 2.04], [2.04, 1.87], [2.17, 1.7], [2.3, 1.54], [2.43, 1.4], [2.55, 1.25], [2.67, 1.09], [2.8, 0.93], [2.92, 0.78], [3.04, 0.66], [3.16, 0.62], [3.28, 0.59], [3.4, 0.56], [3.52, 0.53], [3.64, 0.51], [3.77, 0.49], [3.89, 0.46], [4.02, 0.44], [4.14, 0.42], [4.27, 0.4], [4.4, 0.38], [4.52, 0.36], [4.66, 0.35], [4.79, 0.33], [4.92, 0.32]], [[-0.56, 4.41], [-0.51, 4.32], [-0.46, 4.23], [-0.4, 4.14], [-0.35, 4.06], [-0.28, 3.99], [-0.22, 3.91], [-0.14, 3.84], [-0.05, 3.78], [0.06, 3.71], [0.2, 3.63], [0.34, 3.54], [0.49, 3.44], [0.61, 3.33], [0.72, 3.23], [0.83, 3.12], [0.94, 3.01], [1.08, 2.89], [1.23, 2.77], [1.36, 2.66], [1.46, 2.55], [1.53, 2.44], [1.6, 2.34], [1.68, 2.23], [1.81, 2.09], [1.94, 1.92], [2.08, 1.75], [2.21, 1.58], [2.35, 1.42], [2.47, 1.28], [2.59, 1.12], [2.72, 0.96], [2.84, 0.8], [2.97, 0.64], [3.07, 0.55], [3.19, 0.52], [3.32, 0.48], [3.44, 0.45], [3.56, 0.41], [3.69, 0.39], [3.81, 0.36], [3.94, 0.33], [4.07, 0.3], [4.19, 0.28], [4.32, 0.26], [4.45, 0.23], [4.58, 0.21], [4.71, 0.19], [4.85, 0.18], [4.99, 0.16]], [[-0.5, 4.45], [-0.45, 4.36], [-0.4, 4.27], [-0.34, 4.19], [-0.28, 4.11], [-0.22, 4.03], [-0.16, 3.96], [-0.08, 3.89], [0.01, 3.82], [0.14, 3.76], [0.27, 3.68], [0.42, 3.58], [0.56, 3.48], [0.68, 3.38], [0.8, 3.27], [0.9, 3.17], [1.01, 3.06], [1.16, 2.94], [1.3, 2.82], [1.43, 2.71], [1.53, 2.6], [1.6, 2.5], [1.67, 2.39], [1.75, 2.28], [1.88, 2.15], [2.01, 1.98], [2.15, 1.82], [2.28, 1.65], [2.42, 1.49], [2.55, 1.35], [2.67, 1.2], [2.8, 1.04], [2.93, 0.88], [3.06, 0.72], [3.17, 0.62], [3.3, 0.59], [3.42, 0.56], [3.55, 0.52], [3.68, 0.5], [3.81, 0.47], [3.94, 0.45], [4.07, 0.42], [4.2, 0.4], [4.33, 0.37], [4.46, 0.35], [4.6, 0.34], [4.73, 0.32], [4.87, 0.3], [5.01, 0.29], [5.15, 0.27]], [[-0.54, 4.4], [-0.5, 4.31], [-0.45, 4.22], [-0.39, 4.14], [-0.33, 4.06], [-0.27, 3.98], [-0.21, 3.91], [-0.13, 3.84], [-0.04, 3.78], [0.08, 3.71], [0.21, 3.63], [0.36, 3.54], [0.5, 3.44], [0.63, 3.34], [0.74, 3.23], [0.85, 3.13], [0.96, 3.02], [1.11, 2.9], [1.25, 2.79], [1.39, 2.67], [1.49, 2.56], [1.55, 2.46], [1.63, 2.35], [1.71, 2.24], [1.83, 2.11], [1.97, 1.94], [2.1, 1.77], [2.24, 1.6], [2.37, 1.44], [2.5, 1.3], [2.62, 1.15], [2.75, 0.98], [2.88, 0.83], [3.0, 0.67], [3.11, 0.57], [3.24, 0.54], [3.36, 0.5], [3.48, 0.47], [3.61, 0.44], [3.74, 0.41], [3.87, 0.38], [4.0, 0.36], [4.12, 0.33], [4.25, 0.3], [4.38, 0.28], [4.51, 0.26], [4.65, 0.24], [4.78, 0.22], [4.92, 0.21], [5.06, 0.19]], [[-0.51, 4.38], [-0.47, 4.29], [-0.42, 4.2], [-0.36, 4.12], [-0.3, 4.04], [-0.24, 3.97], [-0.18, 3.89], [-0.1, 3.82], [-0.01, 3.76], [0.12, 3.69], [0.26, 3.61], [0.4, 3.51], [0.55, 3.41], [0.67, 3.31], [0.78, 3.2], [0.89, 3.1], [1.0, 2.99], [1.14, 2.87], [1.29, 2.76], [1.42, 2.64], [1.51, 2.53], [1.58, 2.43], [1.65, 2.32], [1.73, 2.21], [1.86, 2.08], [1.99, 1.91], [2.13, 1.74], [2.26, 1.57], [2.4, 1.41], [2.52, 1.27], [2.65, 1.11], [2.77, 0.94], [2.9, 0.78], [3.03, 0.62], [3.14, 0.53], [3.26, 0.5], [3.38, 0.46], [3.51, 0.42], [3.63, 0.39], [3.76, 0.36], [3.89, 0.33], [4.02, 0.3], [4.15, 0.27], [4.28, 0.25], [4.41, 0.22], [4.54, 0.2], [4.67, 0.18], [4.81, 0.16], [4.95, 0.14], [5.09, 0.12]], [[-0.54, 4.44], [-0.49, 4.35], [-0.44, 4.26], [-0.39, 4.18], [-0.33, 4.1], [-0.27, 4.02], [-0.21, 3.95], [-0.13, 3.87], [-0.04, 3.81], [0.08, 3.74], [0.22, 3.66], [0.36, 3.56], [0.51, 3.47], [0.63, 3.36], [0.74, 3.25], [0.85, 3.14], [0.96, 3.03], [1.11, 2.91], [1.25, 2.8], [1.39, 2.68], [1.49, 2.57], [1.56, 2.46], [1.63, 2.35], [1.71, 2.24], [1.84, 2.11], [1.98, 1.93], [2.11, 1.76], [2.25, 1.59], [2.38, 1.43], [2.51, 1.28], [2.63, 1.13], [2.76, 0.96], [2.89, 0.8], [3.01, 0.63], [3.12, 0.54], [3.25, 0.5], [3.37, 0.47], [3.49, 0.43], [3.62, 0.39], [3.75, 0.36], [3.88, 0.34], [4.01, 0.31], [4.13, 0.28], [4.26, 0.25], [4.4, 0.23], [4.53, 0.21], [4.66, 0.18], [4.79, 0.16], [4.93, 0.15], [5.07, 0.13]], [[-0.55, 4.46], [-0.5, 4.37], [-0.45, 4.28], [-0.4, 4.19], [-0.34, 4.11], [-0.28, 4.04], [-0.21, 3.96], [-0.14, 3.89], [-0.05, 3.82], [0.07, 3.76], [0.21, 3.68], [0.35, 3.58], [0.49, 3.48], [0.62, 3.38], [0.73, 3.27], [0.84, 3.16], [0.95, 3.05], [1.1, 2.93], [1.24, 2.81], [1.38, 2.7], [1.48, 2.58], [1.55, 2.47], [1.62, 2.37], [1.71, 2.26], [1.83, 2.12], [1.97, 1.95], [2.11, 1.77], [2.24, 1.6], [2.38, 1.44], [2.5, 1.3], [2.63, 1.14], [2.75, 0.97], [2.88, 0.81], [3.01, 0.65], [3.12, 0.55], [3.24, 0.51], [3.37, 0.47], [3.49, 0.44], [3.61, 0.4], [3.74, 0.37], [3.87, 0.35], [4.0, 0.32], [4.13, 0.29], [4.26, 0.26], [4.39, 0.24], [4.52, 0.22], [4.65, 0.19], [4.79, 0.17], [4.92, 0.16], [5.06, 0.14]], [[-0.59, 4.54], [-0.54, 4.44], [-0.49, 4.35], [-0.43, 4.26], [-0.37, 4.18], [-0.31, 4.1], [-0.25, 4.02], [-0.17, 3.95], [-0.09, 3.88], [0.03, 3.82], [0.16, 3.74], [0.3, 3.65], [0.45, 3.54], [0.57, 3.44], [0.69, 3.33], [0.8, 3.22], [0.91, 3.1], [1.06, 2.98], [1.2, 2.86], [1.34, 2.74], [1.45, 2.63], [1.52, 2.52], [1.6, 2.41], [1.68, 2.29], [1.8, 2.16], [1.95, 1.98], [2.08, 1.81], [2.22, 1.63], [2.35, 1.47], [2.48, 1.33], [2.6, 1.17], [2.73, 1.0], [2.86, 0.84], [2.98, 0.67], [3.1, 0.56], [3.22, 0.52], [3.34, 0.49], [3.46, 0.45], [3.59, 0.41], [3.71, 0.39], [3.84, 0.36], [3.97, 0.33], [4.1, 0.3], [4.22, 0.27], [4.35, 0.25], [4.48, 0.23], [4.61, 0.21], [4.75, 0.19], [4.89, 0.17], [5.03, 0.15]], [[-0.54, 4.54], [-0.49, 4.45], [-0.43, 4.36], [-0.38, 4.27], [-0.32, 4.19], [-0.26, 4.11], [-0.19, 4.03], [-0.12, 3.95], [-0.03, 3.88], [0.1, 3.81], [0.23, 3.73], [0.38, 3.63], [0.52, 3.52], [0.65, 3.41], [0.76, 3.3], [0.87, 3.19], [0.98, 3.08], [1.13, 2.95], [1.27, 2.83], [1.41, 2.71], [1.51, 2.6], [1.58, 2.49], [1.65, 2.38], [1.73, 2.26], [1.86, 2.12], [2.0, 1.95], [2.14, 1.77], [2.27, 1.59], [2.41, 1.43], [2.54, 1.28], [2.66, 1.12], [2.79, 0.95], [2.92, 0.78], [3.05, 0.62], [3.16, 0.52], [3.28, 0.48], [3.41, 0.44], [3.53, 0.4], [3.66, 0.36], [3.79, 0.33], [3.92, 0.3], [4.05, 0.27], [4.18, 0.24], [4.31, 0.21], [4.44, 0.18], [4.58, 0.16], [4.71, 0.14], [4.85, 0.11], [4.99, 0.09], [5.13, 0.07]], [[-0.6, 4.57], [-0.55, 4.47], [-0.5, 4.38], [-0.44, 4.29], [-0.38, 4.21], [-0.32, 4.13], [-0.26, 4.05], [-0.19, 3.97], [-0.1, 3.9], [0.0, 3.84], [0.13, 3.77], [0.27, 3.68], [0.42, 3.58], [0.54, 3.48], [0.65, 3.37], [0.76, 3.25], [0.87, 3.14], [1.03, 3.01], [1.17, 2.89], [1.31, 2.77], [1.42, 2.66], [1.49, 2.54], [1.57, 2.43], [1.65, 2.32], [1.77, 2.19], [1.91, 2.01], [2.05, 1.83], [2.18, 1.66], [2.32, 1.49], [2.44, 1.34], [2.57, 1.18], [2.69, 1.01], [2.82, 0.84], [2.95, 0.68], [3.07, 0.54], [3.19, 0.5], [3.31, 0.46], [3.42, 0.42], [3.55, 0.38], [3.67, 0.35], [3.8, 0.32], [3.92, 0.29], [4.05, 0.26], [4.18, 0.23], [4.31, 0.2], [4.43, 0.18], [4.56, 0.16], [4.7, 0.14], [4.83, 0.12], [4.97, 0.1]], [[-0.5, 4.46], [-0.45, 4.37], [-0.4, 4.28], [-0.34, 4.2], [-0.29, 4.12], [-0.23, 4.04], [-0.17, 3.96], [-0.09, 3.89], [-0.0, 3.82], [0.12, 3.76], [0.25, 3.68], [0.39, 3.59], [0.54, 3.49], [0.66, 3.38], [0.77, 3.27], [0.88, 3.16], [0.99, 3.05], [1.14, 2.92], [1.28, 2.81], [1.41, 2.69], [1.51, 2.57], [1.58, 2.47], [1.65, 2.36], [1.73, 2.24], [1.85, 2.11], [1.99, 1.93], [2.12, 1.75], [2.26, 1.57], [2.39, 1.41], [2.52, 1.26], [2.64, 1.1], [2.77, 0.92], [2.9, 0.76], [3.02, 0.59], [3.14, 0.48], [3.26, 0.44], [3.38, 0.4], [3.5, 0.35], [3.63, 0.32], [3.76, 0.28], [3.88, 0.25], [4.01, 0.22], [4.14, 0.18], [4.27, 0.15], [4.4, 0.13], [4.54, 0.1], [4.67, 0.08], [4.8, 0.05], [4.94, 0.03], [5.08, 0.01]], [[-0.56, 4.57], [-0.52, 4.47], [-0.46, 4.38], [-0.41, 4.29], [-0.35, 4.2], [-0.29, 4.12], [-0.22, 4.04], [-0.15, 3.97], [-0.07, 3.9], [0.04, 3.84], [0.18, 3.76], [0.32, 3.67], [0.46, 3.57], [0.59, 3.46], [0.7, 3.35], [0.81, 3.23], [0.92, 3.11], [1.08, 2.99], [1.22, 2.87], [1.36, 2.75], [1.47, 2.63], [1.54, 2.52], [1.62, 2.4], [1.7, 2.29], [1.82, 2.15], [1.96, 1.97], [2.1, 1.79], [2.23, 1.61], [2.37, 1.44], [2.5, 1.29], [2.62, 1.13], [2.75, 0.95], [2.87, 0.79], [3.0, 0.62], [3.11, 0.51], [3.24, 0.47], [3.36, 0.42], [3.48, 0.38], [3.6, 0.34], [3.73, 0.31], [3.86, 0.28], [3.99, 0.25], [4.11, 0.21], [4.24, 0.19], [4.37, 0.16], [4.51, 0.14], [4.64, 0.11], [4.77, 0.09], [4.91, 0.07], [5.05, 0.05]], [[-0.55, 4.53], [-0.5, 4.44], [-0.45, 4.35], [-0.39, 4.26], [-0.33, 4.17], [-0.27, 4.09], [-0.21, 4.02], [-0.14, 3.94], [-0.05, 3.87], [0.07, 3.81], [0.21, 3.73], [0.35, 3.63], [0.5, 3.53], [0.62, 3.42], [0.73, 3.31], [0.84, 3.19], [0.95, 3.08], [1.1, 2.95], [1.25, 2.83], [1.39, 2.71], [1.49, 2.6], [1.56, 2.49], [1.63, 2.38], [1.71, 2.26], [1.84, 2.13], [1.97, 1.95], [2.11, 1.77], [2.24, 1.59], [2.37, 1.43], [2.5, 1.28], [2.62, 1.11], [2.75, 0.94], [2.87, 0.77], [3.0, 0.61], [3.11, 0.5], [3.23, 0.46], [3.35, 0.42], [3.47, 0.38], [3.59, 0.34], [3.72, 0.31], [3.85, 0.28], [3.98, 0.25], [4.1, 0.21], [4.23, 0.18], [4.36, 0.16], [4.49, 0.13], [4.62, 0.11], [4.76, 0.09], [4.9, 0.07], [5.03, 0.05]], [[-0.53, 4.52], [-0.48, 4.43], [-0.43, 4.33], [-0.38, 4.25], [-0.32, 4.16], [-0.25, 4.08], [-0.19, 4.01], [-0.11, 3.93], [-0.02, 3.86], [0.1, 3.8], [0.24, 3.71], [0.38, 3.61], [0.53, 3.51], [0.65, 3.4], [0.77, 3.29], [0.87, 3.18], [0.98, 3.06], [1.14, 2.93], [1.28, 2.82], [1.42, 2.7], [1.52, 2.58], [1.58, 2.47], [1.66, 2.36], [1.74, 2.25], [1.86, 2.11], [1.99, 1.93], [2.13, 1.75], [2.26, 1.58], [2.4, 1.41], [2.52, 1.26], [2.64, 1.1], [2.77, 0.93], [2.89, 0.76], [3.02, 0.59], [3.13, 0.5], [3.25, 0.46], [3.37, 0.41], [3.49, 0.37], [3.62, 0.33], [3.75, 0.3], [3.87, 0.27], [4.0, 0.24], [4.13, 0.21], [4.26, 0.18], [4.39, 0.15], [4.52, 0.13], [4.65, 0.1], [4.79, 0.08], [4.93, 0.06], [5.07, 0.04]], [[-0.56, 4.56], [-0.52, 4.46], [-0.46, 4.37], [-0.41, 4.28], [-0.35, 4.19], [-0.28, 4.11], [-0.22, 4.03], [-0.14, 3.95], [-0.05, 3.88], [0.07, 3.82], [0.21, 3.73], [0.36, 3.63], [0.51, 3.52], [0.63, 3.41], [0.75, 3.3], [0.86, 3.19], [0.97, 3.07], [1.12, 2.94], [1.27, 2.82], [1.41, 2.7], [1.51, 2.58], [1.58, 2.47], [1.65, 2.36], [1.73, 2.25], [1.85, 2.11], [1.99, 1.93], [2.12, 1.75], [2.26, 1.57], [2.39, 1.4], [2.52, 1.25], [2.64, 1.09], [2.77, 0.92], [2.89, 0.75], [3.02, 0.58], [3.13, 0.49], [3.25, 0.45], [3.37, 0.41], [3.49, 0.36], [3.61, 0.33], [3.74, 0.29], [3.87, 0.26], [4.0, 0.23], [4.13, 0.2], [4.26, 0.17], [4.39, 0.14], [4.52, 0.12], [4.65, 0.09], [4.79, 0.07], [4.92, 0.05], [5.06, 0.03]], [[-0.65, 4.69], [-0.6, 4.59], [-0.54, 4.49], [-0.49, 4.4], [-0.43, 4.31], [-0.36, 4.22], [-0.3, 4.14], [-0.23, 4.05], [-0.14, 3.98], [-0.03, 3.92], [0.11, 3.84], [0.25, 3.74], [0.4, 3.63], [0.53, 3.52], [0.65, 3.41], [0.76, 3.29], [0.87, 3.17], [1.03, 3.04], [1.18, 2.92], [1.32, 2.8], [1.43, 2.68], [1.51, 2.56], [1.58, 2.45], [1.66, 2.34], [1.78, 2.2], [1.92, 2.02], [2.05, 1.84], [2.19, 1.66], [2.32, 1.5], [2.45, 1.35], [2.57, 1.18], [2.69, 1.01], [2.82, 0.84], [2.94, 0.67], [3.06, 0.55], [3.18, 0.52], [3.29, 0.48], [3.41, 0.43], [3.53, 0.4], [3.66, 0.37], [3.78, 0.34], [3.91, 0.31], [4.03, 0.28], [4.16, 0.25], [4.28, 0.22], [4.41, 0.2], [4.54, 0.18], [4.67, 0.16], [4.81, 0.14], [4.94, 0.12]], [[-0.57, 4.57], [-0.52, 4.47], [-0.47, 4.37], [-0.41, 4.28], [-0.35, 4.2], [-0.29, 4.12], [-0.22, 4.04], [-0.14, 3.96], [-0.05, 3.89], [0.08, 3.82], [0.22, 3.73], [0.36, 3.62], [0.51, 3.52], [0.64, 3.41], [0.75, 3.3], [0.86, 3.18], [0.98, 3.07], [1.13, 2.94], [1.27, 2.82], [1.41, 2.7], [1.51, 2.58], [1.58, 2.47], [1.65, 2.36], [1.73, 2.25], [1.86, 2.11], [1.99, 1.93], [2.13, 1.75], [2.26, 1.57], [2.4, 1.4], [2.52, 1.25], [2.64, 1.09], [2.77, 0.91], [2.9, 0.74], [3.02, 0.58], [3.13, 0.49], [3.25, 0.45], [3.37, 0.4], [3.49, 0.36], [3.62, 0.32], [3.75, 0.29], [3.88, 0.26], [4.0, 0.22], [4.13, 0.19], [4.26, 0.16], [4.39, 0.14], [4.52, 0.11], [4.66, 0.09], [4.79, 0.07], [4.93, 0.05], [5.07, 0.02]], [[-0.57, 4.57], [-0.52, 4.47], [-0.47, 4.37], [-0.41, 4.28], [-0.35, 4.2], [-0.29, 4.12], [-0.22, 4.04], [-0.14, 3.96], [-0.05, 3.89], [0.08, 3.82], [0.22, 3.73], [0.36, 3.62], [0.51, 3.52], [0.64, 3.41], [0.75, 3.3], [0.86, 3.18], [0.98, 3.07], [1.13, 2.94], [1.27, 2.82], [1.41, 2.7], [1.51, 2.58], [1.58, 2.47], [1.65, 2.36], [1.73, 2.25], [1.86, 2.11], [1.99, 1.93], [2.13, 1.75], [2.26, 1.57], [2.4, 1.4], [2.52, 1.25], [2.64, 1.09], [2.77, 0.91], [2.9, 0.74], [3.02, 0.58], [3.13, 0.49], [3.25, 0.45], [3.37, 0.4], [3.49, 0.36], [3.62, 0.32], [3.75, 0.29], [3.88, 0.26], [4.0, 0.22], [4.13, 0.19], [4.26, 0.16], [4.39, 0.14], [4.52, 0.11], [4.66, 0.09], [4.79, 0.07], [4.93, 0.05], [5.07, 0.02]], [[-0.49, 4.46], [-0.44, 4.37], [-0.39, 4.28], [-0.33, 4.19], [-0.27, 4.12], [-0.21, 4.04], [-0.14, 3.96], [-0.06, 3.89], [0.05, 3.81], [0.18, 3.74], [0.32, 3.64], [0.47, 3.54], [0.61, 3.43], [0.74, 3.32], [0.85, 3.22], [0.96, 3.1], [1.07, 2.99], [1.22, 2.86], [1.36, 2.75], [1.49, 2.63], [1.58, 2.52], [1.65, 2.41], [1.72, 2.3], [1.8, 2.18], [1.92, 2.04], [2.05, 1.87], [2.19, 1.69], [2.32, 1.51], [2.46, 1.34], [2.59, 1.19], [2.71, 1.03], [2.84, 0.85], [2.97, 0.68], [3.09, 0.52], [3.2, 0.45], [3.32, 0.4], [3.45, 0.36], [3.57, 0.31], [3.7, 0.28], [3.83, 0.24], [3.96, 0.21], [4.09, 0.18], [4.22, 0.14], [4.36, 0.12], [4.49, 0.09], [4.63, 0.06], [4.76, 0.04], [4.9, 0.01], [5.04, -0.01], [5.19, -0.03]], [[-0.58, 4.58], [-0.53, 4.49], [-0.48, 4.39], [-0.42, 4.3], [-0.36, 4.22], [-0.3, 4.13], [-0.23, 4.05], [-0.16, 3.98], [-0.06, 3.91], [0.06, 3.84], [0.19, 3.76], [0.34, 3.66], [0.48, 3.55], [0.61, 3.44], [0.72, 3.33], [0.83, 3.22], [0.94, 3.1], [1.1, 2.97], [1.24, 2.85], [1.38, 2.73], [1.48, 2.62], [1.55, 2.51], [1.62, 2.39], [1.7, 2.28], [1.83, 2.14], [1.96, 1.97], [2.09, 1.79], [2.23, 1.61], [2.36, 1.44], [2.48, 1.29], [2.61, 1.13], [2.73, 0.96], [2.86, 0.79], [2.98, 0.62], [3.09, 0.52], [3.21, 0.48], [3.33, 0.44], [3.45, 0.4], [3.58, 0.37], [3.7, 0.34], [3.83, 0.3], [3.95, 0.27], [4.08, 0.24], [4.21, 0.21], [4.34, 0.19], [4.47, 0.17], [4.6, 0.14], [4.73, 0.12], [4.87, 0.1], [5.01, 0.08]], [[-0.58, 4.58], [-0.53, 4.49], [-0.48, 4.39], [-0.42, 4.3], [-0.36, 4.22], [-0.3, 4.13], [-0.23, 4.05], [-0.16, 3.98], [-0.06, 3.91], [0.06, 3.84], [0.19, 3.76], [0.34, 3.66], [0.48, 3.55], [0.61, 3.44], [0.72, 3.33], [0.83, 3.22], [0.94, 3.1], [1.1, 2.97], [1.24, 2.85], [1.38, 2.73], [1.48, 2.62], [1.55, 2.51], [1.62, 2.39], [1.7, 2.28], [1.83, 2.14], [1.96, 1.97], [2.09, 1.79], [2.23, 1.61], [2.36, 1.44], [2.48, 1.29], [2.61, 1.13], [2.73, 0.96], [2.86, 0.79], [2.98, 0.62], [3.09, 0.52], [3.21, 0.48], [3.33, 0.44], [3.45, 0.4], [3.58, 0.37], [3.7, 0.34], [3.83, 0.3], [3.95, 0.27], [4.08, 0.24], [4.21, 0.21], [4.34, 0.19], [4.47, 0.17], [4.6, 0.14], [4.73, 0.12], [4.87, 0.1], [5.01, 0.08]], [[-0.6, 4.62], [-0.56, 4.52], [-0.5, 4.43], [-0.45, 4.34], [-0.39, 4.25], [-0.32, 4.16], [-0.26, 4.08], [-0.19, 4.0], [-0.1, 3.93], [0.02, 3.87], [0.15, 3.79], [0.29, 3.7], [0.44, 3.59], [0.56, 3.48], [0.68, 3.37], [0.79, 3.26], [0.9, 3.14], [1.05, 3.01], [1.19, 2.89], [1.33, 2.77], [1.44, 2.65], [1.51, 2.54], [1.58, 2.43], [1.66, 2.32], [1.79, 2.18], [1.92, 2.01], [2.05, 1.83], [2.19, 1.65], [2.32, 1.49], [2.44, 1.34], [2.56, 1.18], [2.69, 1.0], [2.81, 0.84], [2.94, 0.67], [3.05, 0.56], [3.17, 0.52], [3.29, 0.48], [3.4, 0.44], [3.52, 0.4], [3.65, 0.37], [3.77, 0.34], [3.9, 0.31], [4.02, 0.28], [4.15, 0.25], [4.27, 0.23], [4.4, 0.21], [4.53, 0.18], [4.66, 0.16], [4.8, 0.14], [4.93, 0.13]], [[-0.57, 4.55], [-0.52, 4.45], [-0.47, 4.36], [-0.41, 4.27], [-0.35, 4.18], [-0.29, 4.1], [-0.23, 4.02], [-0.16, 3.94], [-0.06, 3.87], [0.05, 3.81], [0.19, 3.73], [0.34, 3.63], [0.48, 3.53], [0.61, 3.42], [0.72, 3.31], [0.83, 3.19], [0.95, 3.08], [1.1, 2.95], [1.24, 2.83], [1.38, 2.71], [1.49, 2.59], [1.56, 2.48], [1.63, 2.37], [1.71, 2.26], [1.83, 2.12], [1.97, 1.94], [2.1, 1.76], [2.23, 1.59], [2.37, 1.42], [2.49, 1.27], [2.62, 1.1], [2.74, 0.93], [2.87, 0.76], [2.99, 0.59], [3.1, 0.51], [3.22, 0.46], [3.34, 0.42], [3.46, 0.38], [3.59, 0.35], [3.71, 0.31], [3.84, 0.28], [3.97, 0.25], [4.1, 0.22], [4.23, 0.19], [4.36, 0.17], [4.48, 0.14], [4.62, 0.12], [4.75, 0.1], [4.89, 0.08], [5.03, 0.06]], [[-0.54, 4.56], [-0.5, 4.46], [-0.44, 4.37], [-0.39, 4.28], [-0.33, 4.19], [-0.27, 4.11], [-0.21, 4.03], [-0.14, 3.96], [-0.05, 3.89], [0.07, 3.82], [0.2, 3.75], [0.35, 3.65], [0.49, 3.55], [0.61, 3.44], [0.73, 3.33], [0.84, 3.22], [0.95, 3.1], [1.1, 2.98], [1.24, 2.86], [1.38, 2.74], [1.48, 2.62], [1.55, 2.51], [1.62, 2.4], [1.7, 2.29], [1.82, 2.15], [1.96, 1.98], [2.09, 1.8], [2.23, 1.62], [2.36, 1.46], [2.48, 1.31], [2.61, 1.14], [2.73, 0.97], [2.86, 0.8], [2.98, 0.64], [3.09, 0.54], [3.21, 0.5], [3.33, 0.46], [3.45, 0.42], [3.57, 0.39], [3.7, 0.36], [3.83, 0.33], [3.95, 0.3], [4.08, 0.27], [4.21, 0.24], [4.34, 0.22], [4.47, 0.19], [4.6, 0.17], [4.73, 0.15], [4.87, 0.13], [5.01, 0.11]], [[-0.5, 4.47], [-0.45, 4.37], [-0.4, 4.28], [-0.35, 4.2], [-0.29, 4.11], [-0.23, 4.04], [-0.17, 3.96], [-0.09, 3.88], [0.0, 3.82], [0.12, 3.75], [0.26, 3.67], [0.4, 3.57], [0.55, 3.47], [0.67, 3.37], [0.78, 3.26], [0.89, 3.15], [1.0, 3.03], [1.15, 2.91], [1.3, 2.79], [1.43, 2.67], [1.52, 2.56], [1.59, 2.45], [1.66, 2.34], [1.74, 2.23], [1.86, 2.1], [1.99, 1.92], [2.13, 1.74], [2.26, 1.56], [2.4, 1.4], [2.52, 1.25], [2.64, 1.09], [2.77, 0.91], [2.9, 0.75], [3.02, 0.58], [3.13, 0.5], [3.25, 0.46], [3.37, 0.42], [3.49, 0.38], [3.62, 0.34], [3.74, 0.31], [3.87, 0.28], [4.0, 0.24], [4.13, 0.22], [4.26, 0.19], [4.39, 0.16], [4.52, 0.14], [4.65, 0.12], [4.79, 0.1], [4.93, 0.07], [5.07, 0.05]], [[-0.49, 4.42], [-0.44, 4.33], [-0.39, 4.24], [-0.34, 4.16], [-0.28, 4.07], [-0.22, 4.0], [-0.16, 3.92], [-0.08, 3.85], [0.01, 3.78], [0.14, 3.72], [0.27, 3.64], [0.42, 3.54], [0.56, 3.44], [0.68, 3.34], [0.79, 3.23], [0.9, 3.12], [1.01, 3.01], [1.16, 2.88], [1.3, 2.77], [1.44, 2.65], [1.52, 2.54], [1.59, 2.43], [1.66, 2.32], [1.74, 2.21], [1.86, 2.08], [1.99, 1.9], [2.12, 1.72], [2.26, 1.55], [2.39, 1.38], [2.51, 1.24], [2.64, 1.07], [2.76, 0.9], [2.89, 0.73], [3.01, 0.57], [3.12, 0.49], [3.24, 0.45], [3.36, 0.41], [3.48, 0.37], [3.61, 0.33], [3.73, 0.3], [3.86, 0.27], [3.99, 0.24], [4.12, 0.21], [4.25, 0.18], [4.38, 0.15], [4.51, 0.13], [4.64, 0.11], [4.78, 0.09], [4.92, 0.06], [5.05, 0.04]], [[-0.51, 4.5], [-0.46, 4.41], [-0.41, 4.32], [-0.36, 4.23], [-0.3, 4.15], [-0.24, 4.07], [-0.18, 3.99], [-0.1, 3.92], [-0.01, 3.85], [0.11, 3.79], [0.24, 3.7], [0.38, 3.61], [0.53, 3.51], [0.65, 3.41], [0.76, 3.3], [0.87, 3.19], [0.98, 3.07], [1.13, 2.95], [1.27, 2.83], [1.41, 2.71], [1.5, 2.6], [1.57, 2.49], [1.64, 2.38], [1.72, 2.27], [1.84, 2.14], [1.97, 1.96], [2.11, 1.79], [2.24, 1.61], [2.38, 1.44], [2.5, 1.3], [2.62, 1.13], [2.75, 0.96], [2.87, 0.8], [3.0, 0.63], [3.11, 0.54], [3.23, 0.5], [3.35, 0.46], [3.47, 0.42], [3.59, 0.38], [3.72, 0.35], [3.85, 0.32], [3.97, 0.29], [4.1, 0.26], [4.23, 0.24], [4.36, 0.21], [4.49, 0.19], [4.62, 0.17], [4.76, 0.15], [4.9, 0.13], [5.03, 0.11]], [[-0.55, 4.55], [-0.51, 4.45], [-0.45, 4.36], [-0.4, 4.27], [-0.34, 4.19], [-0.28, 4.1], [-0.22, 4.03], [-0.15, 3.95], [-0.06, 3.88], [0.05, 3.82], [0.18, 3.74], [0.32, 3.65], [0.47, 3.55], [0.59, 3.45], [0.71, 3.34], [0.82, 3.22], [0.93, 3.11], [1.08, 2.98], [1.22, 2.87], [1.36, 2.75], [1.46, 2.63], [1.53, 2.52], [1.6, 2.41], [1.68, 2.3], [1.8, 2.16], [1.94, 1.99], [2.07, 1.82], [2.2, 1.64], [2.34, 1.47], [2.46, 1.32], [2.58, 1.16], [2.71, 0.99], [2.83, 0.82], [2.96, 0.66], [3.07, 0.56], [3.19, 0.52], [3.31, 0.48], [3.43, 0.44], [3.55, 0.4], [3.67, 0.37], [3.8, 0.34], [3.93, 0.31], [4.05, 0.28], [4.18, 0.26], [4.31, 0.23], [4.43, 0.21], [4.56, 0.19], [4.7, 0.17], [4.84, 0.15], [4.97, 0.13]], [[-0.57, 4.57], [-0.53, 4.47], [-0.47, 4.38], [-0.42, 4.29], [-0.36, 4.2], [-0.3, 4.12], [-0.24, 4.04], [-0.17, 3.96], [-0.08, 3.89], [0.04, 3.83], [0.18, 3.74], [0.32, 3.65], [0.46, 3.55], [0.59, 3.44], [0.7, 3.33], [0.81, 3.22], [0.92, 3.11], [1.07, 2.98], [1.22, 2.86], [1.35, 2.74], [1.46, 2.62], [1.52, 2.51], [1.6, 2.4], [1.68, 2.29], [1.8, 2.15], [1.93, 1.98], [2.07, 1.8], [2.2, 1.63], [2.33, 1.46], [2.45, 1.31], [2.58, 1.15], [2.7, 0.97], [2.83, 0.81], [2.95, 0.64], [3.06, 0.54], [3.18, 0.51], [3.3, 0.47], [3.41, 0.43], [3.54, 0.39], [3.66, 0.36], [3.79, 0.33], [3.91, 0.3], [4.04, 0.27], [4.16, 0.25], [4.29, 0.22], [4.42, 0.2], [4.55, 0.18], [4.68, 0.16], [4.82, 0.14], [4.95, 0.12]], [[-0.56, 4.55], [-0.51, 4.46], [-0.46, 4.36], [-0.41, 4.27], [-0.35, 4.18], [-0.29, 4.1], [-0.22, 4.02], [-0.15, 3.95], [-0.06, 3.88], [0.05, 3.82], [0.19, 3.74], [0.33, 3.65], [0.47, 3.54], [0.6, 3.44], [0.71, 3.33], [0.82, 3.22], [0.93, 3.1], [1.08, 2.98], [1.22, 2.86], [1.36, 2.74], [1.46, 2.63], [1.53, 2.52], [1.6, 2.41], [1.68, 2.29], [1.8, 2.16], [1.93, 1.99], [2.07, 1.81], [2.2, 1.63], [2.33, 1.46], [2.46, 1.32], [2.58, 1.15], [2.7, 0.98], [2.83, 0.81], [2.95, 0.65], [3.06, 0.55], [3.18, 0.51], [3.3, 0.48], [3.42, 0.43], [3.54, 0.4], [3.66, 0.37], [3.79, 0.34], [3.91, 0.31], [4.04, 0.28], [4.17, 0.26], [4.29, 0.23], [4.42, 0.21], [4.55, 0.19], [4.69, 0.17], [4.82, 0.15], [4.96, 0.13]], [[-0.41, 4.32], [-0.36, 4.23], [-0.31, 4.14], [-0.26, 4.06], [-0.2, 3.98], [-0.14, 3.91], [-0.06, 3.84], [0.02, 3.77], [0.14, 3.69], [0.28, 3.61], [0.42, 3.51], [0.56, 3.42], [0.7, 3.32], [0.82, 3.22], [0.93, 3.11], [1.03, 3.0], [1.14, 2.89], [1.28, 2.77], [1.42, 2.66], [1.54, 2.54], [1.62, 2.44], [1.69, 2.33], [1.76, 2.23], [1.84, 2.11], [1.95, 1.98], [2.08, 1.8], [2.22, 1.62], [2.35, 1.45], [2.49, 1.28], [2.61, 1.13], [2.74, 0.97], [2.87, 0.8], [3.0, 0.63], [3.12, 0.49], [3.22, 0.42], [3.35, 0.38], [3.47, 0.33], [3.6, 0.29], [3.73, 0.25], [3.86, 0.22], [3.99, 0.18], [4.13, 0.15], [4.26, 0.12], [4.4, 0.09], [4.53, 0.07], [4.67, 0.04], [4.8, 0.02], [4.95, -0.01], [5.09, -0.03], [5.23, -0.05]], [[-0.46, 4.36], [-0.41, 4.27], [-0.36, 4.19], [-0.31, 4.1], [-0.25, 4.02], [-0.19, 3.94], [-0.12, 3.87], [-0.04, 3.8], [0.05, 3.73], [0.19, 3.66], [0.32, 3.58], [0.47, 3.48], [0.61, 3.38], [0.73, 3.28], [0.84, 3.17], [0.95, 3.06], [1.05, 2.95], [1.2, 2.83], [1.35, 2.71], [1.48, 2.6], [1.56, 2.49], [1.63, 2.38], [1.7, 2.28], [1.78, 2.16], [1.9, 2.03], [2.04, 1.85], [2.17, 1.67], [2.31, 1.49], [2.45, 1.33], [2.57, 1.18], [2.7, 1.01], [2.83, 0.84], [2.96, 0.67], [3.08, 0.52], [3.19, 0.45], [3.31, 0.41], [3.44, 0.37], [3.56, 0.32], [3.69, 0.29], [3.82, 0.25], [3.95, 0.22], [4.09, 0.19], [4.22, 0.16], [4.35, 0.14], [4.49, 0.11], [4.62, 0.09], [4.76, 0.06], [4.9, 0.04], [5.04, 0.02], [5.18, -0.01]], [[-0.49, 4.46], [-0.45, 4.37], [-0.4, 4.28], [-0.34, 4.19], [-0.29, 4.1], [-0.23, 4.03], [-0.17, 3.95], [-0.09, 3.87], [0.0, 3.81], [0.12, 3.74], [0.26, 3.66], [0.41, 3.57], [0.55, 3.47], [0.67, 3.36], [0.79, 3.25], [0.89, 3.14], [1.0, 3.03], [1.15, 2.91], [1.3, 2.79], [1.43, 2.67], [1.52, 2.56], [1.59, 2.45], [1.66, 2.34], [1.75, 2.23], [1.86, 2.09], [2.0, 1.92], [2.14, 1.74], [2.27, 1.56], [2.41, 1.4], [2.53, 1.25], [2.66, 1.08], [2.79, 0.91], [2.92, 0.74], [3.04, 0.58], [3.15, 0.5], [3.27, 0.46], [3.4, 0.42], [3.52, 0.38], [3.65, 0.35], [3.78, 0.32], [3.91, 0.29], [4.04, 0.25], [4.17, 0.23], [4.3, 0.2], [4.43, 0.18], [4.57, 0.15], [4.7, 0.13], [4.84, 0.11], [4.98, 0.09], [5.12, 0.07]], [[-0.56, 4.55], [-0.51, 4.46], [-0.46, 4.36], [-0.41, 4.27], [-0.35, 4.18], [-0.29, 4.1], [-0.23, 4.02], [-0.16, 3.94], [-0.08, 3.87], [0.03, 3.81], [0.17, 3.74], [0.31, 3.65], [0.45, 3.55], [0.58, 3.45], [0.69, 3.34], [0.8, 3.23], [0.91, 3.11], [1.06, 2.99], [1.21, 2.87], [1.35, 2.75], [1.45, 2.63], [1.52, 2.53], [1.59, 2.41], [1.67, 2.3], [1.8, 2.17], [1.93, 1.99], [2.07, 1.82], [2.2, 1.64], [2.33, 1.47], [2.46, 1.32], [2.58, 1.16], [2.71, 0.99], [2.83, 0.82], [2.96, 0.66], [3.07, 0.56], [3.19, 0.52], [3.31, 0.48], [3.43, 0.44], [3.55, 0.41], [3.68, 0.38], [3.81, 0.35], [3.93, 0.32], [4.06, 0.29], [4.19, 0.27], [4.32, 0.25], [4.44, 0.22], [4.57, 0.2], [4.71, 0.19], [4.85, 0.17], [4.98, 0.15]], [[-0.52, 4.49], [-0.48, 4.4], [-0.42, 4.31], [-0.37, 4.22], [-0.32, 4.13], [-0.25, 4.05], [-0.19, 3.97], [-0.12, 3.9], [-0.03, 3.83], [0.08, 3.77], [0.22, 3.68], [0.36, 3.6], [0.51, 3.5], [0.63, 3.39], [0.74, 3.28], [0.85, 3.17], [0.96, 3.06], [1.11, 2.93], [1.26, 2.82], [1.4, 2.7], [1.49, 2.58], [1.56, 2.48], [1.63, 2.36], [1.71, 2.25], [1.84, 2.12], [1.97, 1.94], [2.11, 1.76], [2.24, 1.58], [2.38, 1.42], [2.5, 1.27], [2.63, 1.11], [2.75, 0.93], [2.88, 0.76], [3.01, 0.6], [3.11, 0.52], [3.24, 0.48], [3.36, 0.44], [3.48, 0.4], [3.61, 0.37], [3.73, 0.34], [3.86, 0.3], [3.99, 0.27], [4.12, 0.25], [4.25, 0.22], [4.38, 0.2], [4.51, 0.17], [4.64, 0.15], [4.78, 0.13], [4.92, 0.11], [5.06, 0.09]], [[-0.52, 4.49], [-0.48, 4.4], [-0.42, 4.31], [-0.37, 4.22], [-0.32, 4.13], [-0.25, 4.05], [-0.19, 3.97], [-0.12, 3.9], [-0.03, 3.83], [0.08, 3.77], [0.22, 3.68], [0.36, 3.6], [0.51, 3.5], [0.63, 3.39], [0.74, 3.28], [0.85, 3.17], [0.96, 3.06], [1.11, 2.93], [1.26, 2.82], [1.4, 2.7], [1.49, 2.58], [1.56, 2.48], [1.63, 2.36], [1.71, 2.25], [1.84, 2.12], [1.97, 1.94], [2.11, 1.76], [2.24, 1.58], [2.38, 1.42], [2.5, 1.27], [2.63, 1.11], [2.75, 0.93], [2.88, 0.77], [3.01, 0.6], [3.11, 0.52], [3.24, 0.48], [3.36, 0.44], [3.48, 0.4], [3.61, 0.37], [3.73, 0.34], [3.86, 0.3], [3.99, 0.27], [4.12, 0.25], [4.25, 0.22], [4.38, 0.2], [4.51, 0.17], [4.64, 0.15], [4.78, 0.13], [4.92, 0.11], [5.06, 0.09]], [[-0.52, 4.5], [-0.48, 4.41], [-0.43, 4.32], [-0.37, 4.23], [-0.32, 4.14], [-0.26, 4.06], [-0.19, 3.98], [-0.12, 3.9], [-0.04, 3.83], [0.08, 3.77], [0.22, 3.69], [0.36, 3.61], [0.51, 3.5], [0.63, 3.4], [0.74, 3.29], [0.85, 3.18], [0.96, 3.07], [1.11, 2.94], [1.26, 2.82], [1.39, 2.71], [1.49, 2.59], [1.56, 2.48], [1.63, 2.37], [1.71, 2.26], [1.83, 2.12], [1.97, 1.95], [2.11, 1.77], [2.24, 1.59], [2.38, 1.43], [2.5, 1.28], [2.63, 1.11], [2.75, 0.94], [2.88, 0.77], [3.0, 0.61], [3.11, 0.53], [3.23, 0.49], [3.36, 0.45], [3.48, 0.41], [3.6, 0.37], [3.73, 0.34], [3.86, 0.31], [3.99, 0.28], [4.12, 0.25], [4.25, 0.23], [4.38, 0.21], [4.51, 0.18], [4.64, 0.16], [4.78, 0.14], [4.92, 0.12], [5.06, 0.1]], [[-0.52, 4.5], [-0.48, 4.41], [-0.43, 4.32], [-0.37, 4.23], [-0.32, 4.14], [-0.26, 4.06], [-0.19, 3.98], [-0.12, 3.9], [-0.04, 3.83], [0.08, 3.77], [0.22, 3.69], [0.36, 3.61], [0.51, 3.5], [0.63, 3.4], [0.74, 3.29], [0.85, 3.18], [0.96, 3.07], [1.11, 2.94], [1.26, 2.82], [1.39, 2.71], [1.49, 2.59], [1.56, 2.48], [1.63, 2.37], [1.71, 2.26], [1.83, 2.12], [1.97, 1.95], [2.11, 1.77], [2.24, 1.59], [2.38, 1.43], [2.5, 1.28], [2.63, 1.11], [2.75, 0.94], [2.88, 0.77], [3.0, 0.61], [3.11, 0.53], [3.23, 0.49], [3.36, 0.45], [3.48, 0.41], [3.6, 0.37], [3.73, 0.34], [3.86, 0.31], [3.99, 0.28], [4.12, 0.25], [4.25, 0.23], [4.38, 0.21], [4.51, 0.18], [4.64, 0.16], [4.78, 0.14], [4.92, 0.12], [5.06, 0.1]], [[-0.54, 4.54], [-0.5, 4.44], [-0.45, 4.35], [-0.39, 4.26], [-0.34, 4.17], [-0.27, 4.09], [-0.21, 4.01], [-0.15, 3.93], [-0.06, 3.86], [0.05, 3.8], [0.19, 3.72], [0.33, 3.64], [0.48, 3.54], [0.6, 3.43], [0.71, 3.33], [0.82, 3.21], [0.93, 3.1], [1.08, 2.97], [1.23, 2.85], [1.37, 2.73], [1.47, 2.62], [1.54, 2.51], [1.61, 2.4], [1.69, 2.29], [1.82, 2.15], [1.95, 1.98], [2.09, 1.8], [2.22, 1.62], [2.36, 1.45], [2.48, 1.31], [2.61, 1.14], [2.73, 0.97], [2.86, 0.8], [2.99, 0.64], [3.1, 0.54], [3.22, 0.51], [3.34, 0.47], [3.46, 0.43], [3.59, 0.39], [3.71, 0.36], [3.84, 0.33], [3.97, 0.3], [4.1, 0.28], [4.23, 0.25], [4.36, 0.23], [4.49, 0.21], [4.62, 0.18], [4.76, 0.17], [4.89, 0.15], [5.03, 0.13]], [[-0.55, 4.57], [-0.5, 4.47], [-0.45, 4.38], [-0.4, 4.28], [-0.34, 4.19], [-0.28, 4.11], [-0.22, 4.03], [-0.15, 3.95], [-0.06, 3.88], [0.05, 3.82], [0.18, 3.74], [0.32, 3.66], [0.47, 3.56], [0.59, 3.45], [0.7, 3.35], [0.81, 3.23], [0.93, 3.12], [1.08, 2.99], [1.22, 2.87], [1.36, 2.75], [1.46, 2.64], [1.52, 2.53], [1.6, 2.42], [1.68, 2.31], [1.8, 2.17], [1.93, 2.0], [2.06, 1.82], [2.2, 1.65], [2.33, 1.48], [2.45, 1.33], [2.57, 1.17], [2.7, 1.0], [2.82, 0.83], [2.95, 0.67], [3.05, 0.57], [3.17, 0.54], [3.29, 0.5], [3.41, 0.46], [3.53, 0.43], [3.66, 0.4], [3.78, 0.38], [3.91, 0.35], [4.03, 0.32], [4.16, 0.3], [4.29, 0.27], [4.42, 0.25], [4.54, 0.23], [4.68, 0.22], [4.81, 0.2], [4.95, 0.18]], [[-0.5, 4.49], [-0.45, 4.4], [-0.4, 4.3], [-0.35, 4.21], [-0.29, 4.13], [-0.23, 4.05], [-0.17, 3.97], [-0.1, 3.89], [-0.01, 3.83], [0.11, 3.76], [0.24, 3.68], [0.38, 3.6], [0.53, 3.49], [0.65, 3.39], [0.76, 3.28], [0.87, 3.17], [0.98, 3.06], [1.13, 2.94], [1.27, 2.82], [1.41, 2.7], [1.5, 2.59], [1.56, 2.48], [1.64, 2.37], [1.71, 2.26], [1.83, 2.12], [1.97, 1.95], [2.1, 1.77], [2.23, 1.6], [2.37, 1.43], [2.49, 1.29], [2.61, 1.12], [2.73, 0.95], [2.86, 0.79], [2.98, 0.62], [3.09, 0.54], [3.21, 0.51], [3.33, 0.47], [3.45, 0.43], [3.57, 0.4], [3.7, 0.37], [3.82, 0.34], [3.95, 0.31], [4.08, 0.28], [4.21, 0.26], [4.34, 0.24], [4.47, 0.22], [4.6, 0.2], [4.73, 0.18], [4.87, 0.16], [5.01, 0.14]], [[-0.53, 4.6], [-0.48, 4.5], [-0.43, 4.41], [-0.37, 4.32], [-0.32, 4.23], [-0.26, 4.14], [-0.19, 4.06], [-0.13, 3.98], [-0.04, 3.91], [0.07, 3.85], [0.2, 3.78], [0.34, 3.69], [0.49, 3.59], [0.61, 3.48], [0.72, 3.38], [0.83, 3.26], [0.94, 3.15], [1.09, 3.02], [1.24, 2.9], [1.37, 2.78], [1.47, 2.67], [1.53, 2.56], [1.61, 2.45], [1.69, 2.34], [1.81, 2.2], [1.94, 2.03], [2.08, 1.85], [2.21, 1.68], [2.35, 1.51], [2.47, 1.36], [2.59, 1.2], [2.72, 1.03], [2.84, 0.86], [2.96, 0.7], [3.07, 0.6], [3.19, 0.56], [3.31, 0.52], [3.44, 0.49], [3.56, 0.46], [3.69, 0.43], [3.81, 0.4], [3.94, 0.37], [4.06, 0.35], [4.19, 0.32], [4.32, 0.3], [4.45, 0.28], [4.58, 0.26], [4.72, 0.25], [4.85, 0.23], [4.99, 0.21]], [[-0.68, 4.52], [-0.63, 4.43], [-0.58, 4.33], [-0.53, 4.24], [-0.47, 4.14], [-0.41, 4.05], [-0.35, 3.97], [-0.28, 3.9], [-0.21, 3.82], [-0.1, 3.76], [0.01, 3.7], [0.15, 3.62], [0.3, 3.54], [0.43, 3.43], [0.55, 3.33], [0.66, 3.22], [0.78, 3.1], [0.93, 2.98], [1.08, 2.86], [1.22, 2.74], [1.34, 2.62], [1.41, 2.51], [1.49, 2.4], [1.57, 2.28], [1.69, 2.15], [1.83, 1.98], [1.96, 1.8], [2.1, 1.62], [2.23, 1.45], [2.35, 1.3], [2.47, 1.14], [2.6, 0.96], [2.72, 0.8], [2.84, 0.63], [2.95, 0.54], [3.06, 0.5], [3.18, 0.46], [3.29, 0.42], [3.41, 0.39], [3.53, 0.36], [3.65, 0.33], [3.77, 0.3], [3.9, 0.28], [4.02, 0.25], [4.14, 0.23], [4.27, 0.21], [4.39, 0.19], [4.53, 0.17], [4.66, 0.15], [4.79, 0.13]], [[-0.54, 4.51], [-0.49, 4.41], [-0.45, 4.32], [-0.39, 4.23], [-0.34, 4.14], [-0.28, 4.05], [-0.21, 3.98], [-0.14, 3.9], [-0.05, 3.83], [0.06, 3.77], [0.2, 3.69], [0.34, 3.61], [0.49, 3.51], [0.62, 3.4], [0.73, 3.3], [0.84, 3.18], [0.96, 3.07], [1.11, 2.94], [1.26, 2.83], [1.4, 2.71], [1.5, 2.59], [1.57, 2.48], [1.64, 2.37], [1.72, 2.26], [1.84, 2.13], [1.98, 1.95], [2.12, 1.77], [2.25, 1.59], [2.39, 1.43], [2.51, 1.28], [2.64, 1.12], [2.77, 0.94], [2.9, 0.77], [3.02, 0.61], [3.13, 0.54], [3.25, 0.5], [3.37, 0.46], [3.5, 0.42], [3.62, 0.39], [3.75, 0.36], [3.88, 0.33], [4.01, 0.3], [4.14, 0.28], [4.27, 0.25], [4.41, 0.23], [4.54, 0.21], [4.67, 0.19], [4.81, 0.17], [4.95, 0.15], [5.09, 0.13]], [[-0.53, 4.48], [-0.48, 4.38], [-0.43, 4.29], [-0.38, 4.2], [-0.32, 4.11], [-0.26, 4.03], [-0.2, 3.95], [-0.13, 3.87], [-0.04, 3.81], [0.08, 3.75], [0.22, 3.67], [0.36, 3.58], [0.51, 3.48], [0.63, 3.37], [0.75, 3.27], [0.86, 3.16], [0.97, 3.04], [1.12, 2.92], [1.27, 2.8], [1.41, 2.69], [1.5, 2.57], [1.57, 2.47], [1.64, 2.36], [1.72, 2.24], [1.84, 2.11], [1.98, 1.93], [2.11, 1.76], [2.25, 1.58], [2.39, 1.41], [2.51, 1.27], [2.64, 1.1], [2.76, 0.93], [2.89, 0.76], [3.01, 0.6], [3.12, 0.53], [3.24, 0.49], [3.36, 0.46], [3.49, 0.42], [3.61, 0.39], [3.74, 0.36], [3.87, 0.33], [4.0, 0.3], [4.13, 0.27], [4.26, 0.25], [4.39, 0.22], [4.52, 0.2], [4.66, 0.18], [4.79, 0.16], [4.93, 0.15], [5.07, 0.13]], [[-0.53, 4.49], [-0.49, 4.4], [-0.44, 4.3], [-0.39, 4.21], [-0.33, 4.12], [-0.27, 4.04], [-0.21, 3.96], [-0.14, 3.89], [-0.05, 3.82], [0.06, 3.76], [0.2, 3.68], [0.35, 3.6], [0.5, 3.49], [0.62, 3.39], [0.74, 3.28], [0.85, 3.17], [0.96, 3.06], [1.11, 2.93], [1.26, 2.82], [1.4, 2.7], [1.49, 2.59], [1.56, 2.48], [1.63, 2.37], [1.72, 2.25], [1.84, 2.12], [1.97, 1.95], [2.11, 1.77], [2.24, 1.59], [2.38, 1.42], [2.5, 1.28], [2.63, 1.11], [2.75, 0.94], [2.88, 0.77], [3.01, 0.61], [3.11, 0.54], [3.23, 0.5], [3.36, 0.46], [3.48, 0.43], [3.6, 0.39], [3.73, 0.37], [3.86, 0.34], [3.99, 0.31], [4.12, 0.28], [4.25, 0.26], [4.38, 0.23], [4.51, 0.21], [4.64, 0.19], [4.78, 0.18], [4.92, 0.16], [5.06, 0.14]], [[-0.53, 4.49], [-0.49, 4.4], [-0.44, 4.3], [-0.39, 4.21], [-0.33, 4.12], [-0.27, 4.04], [-0.21, 3.96], [-0.14, 3.89], [-0.05, 3.82], [0.06, 3.76], [0.2, 3.68], [0.35, 3.6], [0.5, 3.49], [0.62, 3.39], [0.74, 3.28], [0.85, 3.17], [0.96, 3.06], [1.11, 2.93], [1.26, 2.82], [1.4, 2.7], [1.49, 2.59], [1.56, 2.48], [1.63, 2.37], [1.72, 2.25], [1.84, 2.12], [1.97, 1.95], [2.11, 1.77], [2.24, 1.59], [2.38, 1.42], [2.5, 1.28], [2.63, 1.11], [2.75, 0.94], [2.88, 0.77], [3.01, 0.61], [3.11, 0.54], [3.23, 0.5], [3.36, 0.46], [3.48, 0.43], [3.6, 0.39], [3.73, 0.37], [3.86, 0.34], [3.99, 0.31], [4.12, 0.28], [4.25, 0.26], [4.38, 0.23], [4.51, 0.21], [4.64, 0.19], [4.78, 0.18], [4.92, 0.16], [5.06, 0.14]], [[-0.53, 4.49], [-0.49, 4.4], [-0.44, 4.3], [-0.39, 4.21], [-0.33, 4.12], [-0.27, 4.04], [-0.21, 3.96], [-0.14, 3.89], [-0.05, 3.82], [0.06, 3.76], [0.2, 3.68], [0.35, 3.6], [0.5, 3.49], [0.62, 3.39], [0.74, 3.28], [0.85, 3.17], [0.96, 3.06], [1.11, 2.93], [1.26, 2.82], [1.4, 2.7], [1.49, 2.59], [1.56, 2.48], [1.63, 2.37], [1.72, 2.25], [1.84, 2.12], [1.97, 1.95], [2.11, 1.77], [2.24, 1.59], [2.38, 1.42], [2.5, 1.28], [2.63, 1.11], [2.75, 0.94], [2.88, 0.77], [3.01, 0.61], [3.11, 0.54], [3.23, 0.5], [3.36, 0.46], [3.48, 0.43], [3.6, 0.39], [3.73, 0.37], [3.86, 0.34], [3.99, 0.31], [4.12, 0.28], [4.25, 0.26], [4.38, 0.23], [4.51, 0.21], [4.64, 0.19], [4.78, 0.18], [4.92, 0.16], [5.06, 0.14]], [[-0.53, 4.49], [-0.49, 4.4], [-0.44, 4.3], [-0.39, 4.21], [-0.33, 4.12], [-0.27, 4.04], [-0.21, 3.96], [-0.14, 3.89], [-0.05, 3.82], [0.06, 3.76], [0.2, 3.68], [0.35, 3.6], [0.5, 3.49], [0.62, 3.39], [0.74, 3.28], [0.85, 3.17], [0.96, 3.06], [1.11, 2.93], [1.26, 2.82], [1.4, 2.7], [1.49, 2.59], [1.56, 2.48], [1.63, 2.37], [1.72, 2.25], [1.84, 2.12], [1.97, 1.95], [2.11, 1.77], [2.24, 1.59], [2.38, 1.42], [2.5, 1.28], [2.63, 1.11], [2.75, 0.94], [2.88, 0.77], [3.01, 0.61], [3.11, 0.54], [3.23, 0.5], [3.36, 0.46], [3.48, 0.43], [3.6, 0.39], [3.73, 0.37], [3.86, 0.34], [3.99, 0.31], [4.12, 0.28], [4.25, 0.26], [4.38, 0.23], [4.51, 0.21], [4.64, 0.19], [4.78, 0.18], [4.92, 0.16], [5.06, 0.14]], [[-0.54, 4.5], [-0.49, 4.41], [-0.45, 4.31], [-0.39, 4.22], [-0.34, 4.13], [-0.28, 4.05], [-0.21, 3.97], [-0.14, 3.89], [-0.05, 3.83], [0.06, 3.77], [0.2, 3.69], [0.34, 3.6], [0.49, 3.5], [0.62, 3.4], [0.73, 3.29], [0.84, 3.18], [0.95, 3.07], [1.11, 2.94], [1.25, 2.82], [1.39, 2.71], [1.49, 2.59], [1.56, 2.49], [1.63, 2.37], [1.71, 2.26], [1.83, 2.13], [1.97, 1.95], [2.1, 1.78], [2.24, 1.6], [2.37, 1.43], [2.5, 1.28], [2.62, 1.12], [2.75, 0.95], [2.88, 0.78], [3.0, 0.62], [3.11, 0.55], [3.23, 0.51], [3.35, 0.47], [3.47, 0.43], [3.6, 0.4], [3.73, 0.37], [3.85, 0.34], [3.98, 0.31], [4.11, 0.29], [4.24, 0.26], [4.37, 0.24], [4.5, 0.22], [4.64, 0.2], [4.78, 0.18], [4.91, 0.16], [5.05, 0.15]], [[-0.54, 4.51], [-0.5, 4.41], [-0.45, 4.32], [-0.39, 4.22], [-0.34, 4.13], [-0.28, 4.05], [-0.21, 3.97], [-0.14, 3.9], [-0.06, 3.83], [0.06, 3.77], [0.19, 3.69], [0.34, 3.6], [0.49, 3.5], [0.61, 3.4], [0.73, 3.29], [0.84, 3.18], [0.95, 3.07], [1.1, 2.94], [1.25, 2.83], [1.39, 2.71], [1.49, 2.59], [1.55, 2.49], [1.63, 2.38], [1.71, 2.26], [1.83, 2.13], [1.97, 1.95], [2.1, 1.78], [2.24, 1.6], [2.37, 1.43], [2.5, 1.29], [2.62, 1.12], [2.75, 0.95], [2.87, 0.78], [3.0, 0.62], [3.1, 0.55], [3.23, 0.51], [3.35, 0.47], [3.47, 0.43], [3.6, 0.4], [3.73, 0.37], [3.85, 0.34], [3.98, 0.31], [4.11, 0.29], [4.24, 0.26], [4.37, 0.24], [4.5, 0.22], [4.64, 0.2], [4.77, 0.18], [4.91, 0.16], [5.05, 0.15]], [[-0.54, 4.51], [-0.5, 4.41], [-0.45, 4.32], [-0.39, 4.22], [-0.34, 4.13], [-0.28, 4.05], [-0.21, 3.97], [-0.14, 3.89], [-0.06, 3.83], [0.06, 3.77], [0.19, 3.69], [0.34, 3.6], [0.49, 3.5], [0.61, 3.4], [0.73, 3.29], [0.84, 3.18], [0.95, 3.07], [1.1, 2.94], [1.25, 2.83], [1.39, 2.71], [1.49, 2.59], [1.55, 2.49], [1.63, 2.38], [1.71, 2.26], [1.83, 2.13], [1.97, 1.95], [2.1, 1.78], [2.24, 1.6], [2.37, 1.43], [2.5, 1.29], [2.62, 1.12], [2.75, 0.95], [2.87, 0.78], [3.0, 0.62], [3.1, 0.55], [3.23, 0.51], [3.35, 0.47], [3.47, 0.43], [3.6, 0.4], [3.73, 0.37], [3.85, 0.34], [3.98, 0.31], [4.11, 0.29], [4.24, 0.26], [4.37, 0.24], [4.5, 0.22], [4.64, 0.2], [4.77, 0.18], [4.91, 0.16], [5.05, 0.15]], [[-0.51, 4.44], [-0.46, 4.35], [-0.41, 4.25], [-0.36, 4.17], [-0.31, 4.08], [-0.25, 4.0], [-0.18, 3.92], [-0.11, 3.84], [-0.02, 3.78], [0.1, 3.72], [0.24, 3.63], [0.38, 3.55], [0.53, 3.44], [0.66, 3.34], [0.77, 3.24], [0.88, 3.13], [0.99, 3.01], [1.15, 2.89], [1.29, 2.77], [1.43, 2.66], [1.52, 2.55], [1.59, 2.44], [1.66, 2.33], [1.74, 2.22], [1.86, 2.08], [1.99, 1.91], [2.13, 1.73], [2.27, 1.55], [2.4, 1.39], [2.52, 1.24], [2.65, 1.08], [2.78, 0.9], [2.9, 0.74], [3.03, 0.58], [3.13, 0.52], [3.25, 0.48], [3.38, 0.44], [3.5, 0.4], [3.63, 0.37], [3.76, 0.34], [3.89, 0.3], [4.02, 0.28], [4.15, 0.25], [4.28, 0.23], [4.41, 0.2], [4.54, 0.18], [4.68, 0.16], [4.82, 0.14], [4.96, 0.12], [5.09, 0.1]], [[-0.6, 4.59], [-0.55, 4.49], [-0.5, 4.39], [-0.45, 4.3], [-0.39, 4.21], [-0.33, 4.12], [-0.27, 4.04], [-0.2, 3.96], [-0.12, 3.88], [-0.02, 3.82], [0.1, 3.76], [0.24, 3.68], [0.39, 3.59], [0.52, 3.48], [0.64, 3.38], [0.75, 3.27], [0.86, 3.15], [1.02, 3.02], [1.17, 2.9], [1.31, 2.79], [1.42, 2.67], [1.49, 2.56], [1.56, 2.45], [1.64, 2.33], [1.77, 2.2], [1.9, 2.03], [2.04, 1.86], [2.17, 1.68], [2.3, 1.51], [2.43, 1.37], [2.55, 1.21], [2.67, 1.03], [2.8, 0.87], [2.92, 0.7], [3.03, 0.62], [3.15, 0.58], [3.27, 0.55], [3.38, 0.51], [3.51, 0.48], [3.63, 0.46], [3.76, 0.43], [3.88, 0.4], [4.01, 0.38], [4.13, 0.36], [4.26, 0.34], [4.39, 0.32], [4.51, 0.3], [4.65, 0.28], [4.78, 0.27], [4.92, 0.25]], [[-0.65, 4.66], [-0.6, 4.56], [-0.55, 4.46], [-0.5, 4.36], [-0.44, 4.27], [-0.38, 4.17], [-0.31, 4.09], [-0.25, 4.01], [-0.18, 3.93], [-0.08, 3.86], [0.04, 3.8], [0.18, 3.73], [0.32, 3.64], [0.46, 3.53], [0.57, 3.43], [0.69, 3.31], [0.81, 3.19], [0.96, 3.07], [1.12, 2.94], [1.26, 2.82], [1.38, 2.7], [1.45, 2.59], [1.53, 2.48], [1.61, 2.36], [1.73, 2.23], [1.87, 2.05], [2.01, 1.88], [2.14, 1.7], [2.28, 1.53], [2.4, 1.38], [2.52, 1.22], [2.65, 1.05], [2.77, 0.88], [2.9, 0.71], [3.0, 0.62], [3.12, 0.59], [3.24, 0.55], [3.36, 0.52], [3.48, 0.49], [3.6, 0.46], [3.73, 0.44], [3.85, 0.41], [3.98, 0.39], [4.1, 0.36], [4.23, 0.35], [4.35, 0.33], [4.48, 0.31], [4.62, 0.29], [4.75, 0.28], [4.88, 0.26]], [[-0.51, 4.46], [-0.46, 4.36], [-0.41, 4.27], [-0.36, 4.18], [-0.31, 4.09], [-0.25, 4.0], [-0.19, 3.93], [-0.12, 3.85], [-0.04, 3.78], [0.07, 3.72], [0.2, 3.66], [0.35, 3.57], [0.49, 3.48], [0.62, 3.37], [0.74, 3.27], [0.85, 3.16], [0.96, 3.04], [1.12, 2.92], [1.26, 2.8], [1.4, 2.68], [1.49, 2.57], [1.56, 2.47], [1.63, 2.36], [1.72, 2.24], [1.83, 2.11], [1.97, 1.93], [2.1, 1.76], [2.24, 1.58], [2.37, 1.41], [2.5, 1.27], [2.62, 1.1], [2.75, 0.93], [2.87, 0.76], [2.99, 0.62], [3.1, 0.55], [3.22, 0.51], [3.34, 0.47], [3.46, 0.44], [3.59, 0.41], [3.72, 0.38], [3.85, 0.35], [3.97, 0.32], [4.1, 0.3], [4.23, 0.28], [4.37, 0.26], [4.5, 0.24], [4.63, 0.22], [4.77, 0.2], [4.9, 0.18], [5.04, 0.16]], [[-0.5, 4.46], [-0.46, 4.37], [-0.41, 4.28], [-0.35, 4.19], [-0.3, 4.1], [-0.24, 4.01], [-0.18, 3.94], [-0.11, 3.86], [-0.03, 3.79], [0.08, 3.73], [0.21, 3.66], [0.35, 3.58], [0.5, 3.49], [0.63, 3.38], [0.74, 3.28], [0.85, 3.17], [0.97, 3.05], [1.12, 2.93], [1.27, 2.81], [1.41, 2.69], [1.5, 2.58], [1.57, 2.47], [1.64, 2.36], [1.72, 2.25], [1.84, 2.11], [1.97, 1.94], [2.11, 1.76], [2.24, 1.58], [2.38, 1.42], [2.5, 1.27], [2.63, 1.11], [2.75, 0.94], [2.88, 0.77], [3.0, 0.62], [3.1, 0.55], [3.23, 0.52], [3.35, 0.48], [3.47, 0.44], [3.6, 0.41], [3.73, 0.39], [3.85, 0.36], [3.98, 0.33], [4.11, 0.31], [4.24, 0.28], [4.37, 0.26], [4.5, 0.24], [4.64, 0.22], [4.77, 0.21], [4.91, 0.19], [5.05, 0.17]], [[-0.51, 4.48], [-0.46, 4.39], [-0.42, 4.3], [-0.36, 4.21], [-0.31, 4.11], [-0.25, 4.03], [-0.19, 3.95], [-0.12, 3.87], [-0.04, 3.8], [0.07, 3.75], [0.2, 3.68], [0.34, 3.59], [0.49, 3.5], [0.62, 3.4], [0.73, 3.29], [0.84, 3.18], [0.96, 3.07], [1.11, 2.94], [1.26, 2.82], [1.39, 2.7], [1.49, 2.59], [1.56, 2.48], [1.63, 2.37], [1.71, 2.26], [1.83, 2.13], [1.97, 1.95], [2.1, 1.78], [2.24, 1.6], [2.37, 1.43], [2.49, 1.29], [2.62, 1.12], [2.74, 0.95], [2.87, 0.78], [2.99, 0.63], [3.09, 0.56], [3.22, 0.53], [3.34, 0.49], [3.46, 0.45], [3.59, 0.42], [3.71, 0.4], [3.84, 0.37], [3.97, 0.34], [4.1, 0.32], [4.23, 0.29], [4.36, 0.27], [4.49, 0.25], [4.62, 0.24], [4.76, 0.22], [4.9, 0.2], [5.04, 0.18]], [[-0.43, 4.33], [-0.39, 4.23], [-0.34, 4.15], [-0.29, 4.06], [-0.24, 3.97], [-0.18, 3.89], [-0.12, 3.82], [-0.04, 3.75], [0.05, 3.68], [0.17, 3.62], [0.31, 3.54], [0.46, 3.45], [0.61, 3.35], [0.73, 3.25], [0.85, 3.14], [0.96, 3.03], [1.07, 2.92], [1.22, 2.8], [1.37, 2.68], [1.49, 2.57], [1.58, 2.46], [1.65, 2.35], [1.72, 2.24], [1.8, 2.13], [1.92, 1.99], [2.05, 1.81], [2.19, 1.63], [2.33, 1.45], [2.47, 1.29], [2.59, 1.14], [2.72, 0.97], [2.85, 0.79], [2.98, 0.62], [3.09, 0.51], [3.2, 0.44], [3.33, 0.4], [3.45, 0.36], [3.58, 0.32], [3.71, 0.29], [3.85, 0.25], [3.98, 0.22], [4.12, 0.2], [4.25, 0.17], [4.39, 0.15], [4.52, 0.12], [4.66, 0.1], [4.8, 0.07], [4.94, 0.05], [5.08, 0.03], [5.23, 0.01]], [[-0.55, 4.52], [-0.5, 4.42], [-0.46, 4.33], [-0.4, 4.24], [-0.35, 4.15], [-0.29, 4.06], [-0.23, 3.98], [-0.17, 3.9], [-0.09, 3.82], [0.01, 3.76], [0.13, 3.7], [0.27, 3.63], [0.42, 3.54], [0.55, 3.44], [0.67, 3.33], [0.78, 3.22], [0.9, 3.1], [1.05, 2.98], [1.2, 2.86], [1.35, 2.74], [1.44, 2.62], [1.52, 2.51], [1.59, 2.4], [1.67, 2.29], [1.8, 2.15], [1.94, 1.98], [2.07, 1.8], [2.21, 1.62], [2.35, 1.45], [2.48, 1.3], [2.6, 1.13], [2.73, 0.96], [2.86, 0.79], [2.98, 0.63], [3.09, 0.55], [3.21, 0.52], [3.34, 0.48], [3.46, 0.44], [3.59, 0.41], [3.71, 0.38], [3.84, 0.35], [3.97, 0.32], [4.1, 0.3], [4.23, 0.28], [4.36, 0.26], [4.5, 0.24], [4.63, 0.22], [4.77, 0.2], [4.91, 0.18], [5.04, 0.16]], [[-0.38, 4.23], [-0.33, 4.15], [-0.28, 4.07], [-0.23, 3.98], [-0.18, 3.9], [-0.13, 3.82], [-0.07, 3.75], [0.01, 3.68], [0.1, 3.62], [0.22, 3.56], [0.36, 3.48], [0.5, 3.4], [0.65, 3.3], [0.78, 3.2], [0.89, 3.09], [1.0, 2.99], [1.11, 2.88], [1.27, 2.76], [1.41, 2.64], [1.52, 2.53], [1.61, 2.42], [1.68, 2.32], [1.75, 2.21], [1.83, 2.1], [1.95, 1.96], [2.09, 1.78], [2.23, 1.6], [2.37, 1.42], [2.5, 1.26], [2.63, 1.11], [2.76, 0.93], [2.9, 0.76], [3.03, 0.59], [3.14, 0.49], [3.25, 0.42], [3.38, 0.38], [3.51, 0.33], [3.64, 0.29], [3.77, 0.26], [3.91, 0.22], [4.04, 0.19], [4.18, 0.17], [4.32, 0.14], [4.46, 0.12], [4.6, 0.09], [4.74, 0.07], [4.88, 0.04], [5.02, 0.02], [5.17, -0.0], [5.31, -0.03]], [[-0.47, 4.39], [-0.42, 4.3], [-0.37, 4.21], [-0.31, 4.13], [-0.26, 4.04], [-0.21, 3.95], [-0.15, 3.87], [-0.08, 3.8], [0.0, 3.73], [0.11, 3.68], [0.23, 3.61], [0.38, 3.53], [0.52, 3.45], [0.65, 3.34], [0.76, 3.24], [0.87, 3.13], [0.98, 3.02], [1.14, 2.9], [1.28, 2.78], [1.41, 2.67], [1.49, 2.56], [1.56, 2.45], [1.64, 2.35], [1.72, 2.23], [1.83, 2.1], [1.97, 1.93], [2.1, 1.75], [2.24, 1.57], [2.38, 1.41], [2.5, 1.26], [2.63, 1.1], [2.76, 0.92], [2.88, 0.76], [3.01, 0.61], [3.11, 0.54], [3.23, 0.5], [3.36, 0.46], [3.48, 0.42], [3.61, 0.39], [3.74, 0.36], [3.87, 0.33], [4.0, 0.31], [4.13, 0.28], [4.26, 0.26], [4.39, 0.24], [4.52, 0.22], [4.66, 0.2], [4.8, 0.18], [4.94, 0.16], [5.08, 0.15]], [[-0.48, 4.44], [-0.43, 4.35], [-0.38, 4.26], [-0.33, 4.17], [-0.27, 4.08], [-0.22, 4.0], [-0.16, 3.92], [-0.09, 3.84], [-0.01, 3.77], [0.09, 3.72], [0.21, 3.66], [0.36, 3.58], [0.5, 3.49], [0.63, 3.39], [0.74, 3.29], [0.85, 3.18], [0.96, 3.06], [1.12, 2.94], [1.26, 2.82], [1.39, 2.71], [1.48, 2.6], [1.55, 2.49], [1.62, 2.38], [1.7, 2.27], [1.82, 2.14], [1.96, 1.97], [2.09, 1.79], [2.23, 1.61], [2.36, 1.45], [2.49, 1.3], [2.61, 1.13], [2.74, 0.96], [2.87, 0.79], [2.99, 0.64], [3.1, 0.57], [3.22, 0.53], [3.34, 0.49], [3.46, 0.45], [3.59, 0.43], [3.72, 0.4], [3.85, 0.37], [3.98, 0.34], [4.11, 0.32], [4.24, 0.3], [4.37, 0.28], [4.5, 0.26], [4.63, 0.24], [4.77, 0.22], [4.91, 0.2], [5.05, 0.19]], [[-0.5, 4.46], [-0.45, 4.37], [-0.4, 4.28], [-0.34, 4.19], [-0.29, 4.1], [-0.24, 4.01], [-0.18, 3.93], [-0.11, 3.85], [-0.03, 3.78], [0.07, 3.72], [0.19, 3.67], [0.33, 3.59], [0.48, 3.5], [0.6, 3.4], [0.72, 3.3], [0.83, 3.19], [0.94, 3.08], [1.09, 2.95], [1.24, 2.84], [1.38, 2.72], [1.46, 2.61], [1.53, 2.5], [1.6, 2.39], [1.68, 2.28], [1.8, 2.15], [1.94, 1.98], [2.07, 1.8], [2.21, 1.62], [2.35, 1.46], [2.47, 1.31], [2.59, 1.14], [2.72, 0.97], [2.85, 0.81], [2.97, 0.65], [3.08, 0.57], [3.2, 0.53], [3.32, 0.5], [3.44, 0.46], [3.57, 0.43], [3.7, 0.4], [3.82, 0.38], [3.95, 0.35], [4.08, 0.33], [4.21, 0.3], [4.34, 0.28], [4.47, 0.27], [4.61, 0.25], [4.74, 0.23], [4.88, 0.21], [5.02, 0.2]], [[-0.5, 4.46], [-0.45, 4.37], [-0.4, 4.28], [-0.34, 4.19], [-0.29, 4.1], [-0.24, 4.01], [-0.18, 3.93], [-0.11, 3.85], [-0.03, 3.78], [0.07, 3.72], [0.19, 3.67], [0.33, 3.59], [0.48, 3.5], [0.6, 3.4], [0.72, 3.3], [0.83, 3.19], [0.94, 3.08], [1.09, 2.95], [1.24, 2.84], [1.38, 2.72], [1.46, 2.61], [1.53, 2.5], [1.6, 2.39], [1.68, 2.28], [1.8, 2.15], [1.94, 1.98], [2.07, 1.8], [2.21, 1.62], [2.35, 1.46], [2.47, 1.31], [2.59, 1.14], [2.72, 0.97], [2.85, 0.81], [2.97, 0.65], [3.08, 0.57], [3.2, 0.53], [3.32, 0.5], [3.44, 0.46], [3.57, 0.43], [3.7, 0.4], [3.82, 0.38], [3.95, 0.35], [4.08, 0.33], [4.21, 0.3], [4.34, 0.28], [4.47, 0.27], [4.61, 0.25], [4.74, 0.23], [4.88, 0.21], [5.02, 0.2]], [[-0.5, 4.46], [-0.45, 4.37], [-0.4, 4.28], [-0.34, 4.19], [-0.29, 4.1], [-0.24, 4.01], [-0.18, 3.93], [-0.11, 3.85], [-0.03, 3.78], [0.07, 3.72], [0.19, 3.67], [0.33, 3.59], [0.48, 3.5], [0.6, 3.4], [0.72, 3.3], [0.83, 3.19], [0.94, 3.08], [1.09, 2.95], [1.24, 2.83], [1.38, 2.72], [1.46, 2.61], [1.53, 2.5], [1.6, 2.39], [1.68, 2.28], [1.8, 2.15], [1.94, 1.98], [2.07, 1.8], [2.21, 1.62], [2.35, 1.46], [2.47, 1.31], [2.6, 1.14], [2.72, 0.97], [2.85, 0.81], [2.97, 0.65], [3.08, 0.57], [3.2, 0.53], [3.32, 0.5], [3.44, 0.46], [3.57, 0.43], [3.7, 0.4], [3.82, 0.38], [3.95, 0.35], [4.08, 0.32], [4.21, 0.3], [4.34, 0.28], [4.47, 0.26], [4.61, 0.25], [4.74, 0.23], [4.88, 0.21], [5.02, 0.2]], [[-0.47, 4.43], [-0.42, 4.34], [-0.37, 4.25], [-0.32, 4.16], [-0.27, 4.07], [-0.21, 3.98], [-0.15, 3.91], [-0.09, 3.83], [-0.01, 3.76], [0.1, 3.7], [0.22, 3.64], [0.37, 3.56], [0.51, 3.48], [0.64, 3.37], [0.75, 3.27], [0.86, 3.16], [0.97, 3.05], [1.12, 2.93], [1.27, 2.81], [1.4, 2.69], [1.48, 2.59], [1.55, 2.48], [1.63, 2.37], [1.71, 2.26], [1.83, 2.12], [1.96, 1.95], [2.1, 1.78], [2.23, 1.6], [2.37, 1.43], [2.49, 1.29], [2.62, 1.12], [2.75, 0.95], [2.87, 0.78], [3.0, 0.63], [3.1, 0.56], [3.22, 0.52], [3.35, 0.48], [3.47, 0.44], [3.6, 0.42], [3.73, 0.39], [3.85, 0.36], [3.98, 0.33], [4.11, 0.31], [4.24, 0.29], [4.38, 0.27], [4.51, 0.25], [4.64, 0.23], [4.78, 0.21], [4.92, 0.19], [5.06, 0.17]], [[-0.47, 4.42], [-0.42, 4.33], [-0.37, 4.24], [-0.32, 4.16], [-0.27, 4.07], [-0.21, 3.98], [-0.15, 3.9], [-0.09, 3.83], [-0.0, 3.76], [0.1, 3.7], [0.22, 3.64], [0.37, 3.56], [0.51, 3.47], [0.64, 3.37], [0.75, 3.27], [0.86, 3.16], [0.97, 3.05], [1.13, 2.92], [1.27, 2.81], [1.4, 2.69], [1.49, 2.58], [1.56, 2.47], [1.63, 2.37], [1.71, 2.25], [1.83, 2.12], [1.96, 1.95], [2.1, 1.77], [2.23, 1.59], [2.37, 1.43], [2.49, 1.28], [2.62, 1.12], [2.75, 0.95], [2.87, 0.78], [3.0, 0.62], [3.1, 0.55], [3.22, 0.52], [3.35, 0.48], [3.47, 0.44], [3.6, 0.41], [3.73, 0.38], [3.85, 0.35], [3.98, 0.33], [4.11, 0.3], [4.25, 0.28], [4.38, 0.26], [4.51, 0.24], [4.64, 0.22], [4.78, 0.21], [4.92, 0.19], [5.06, 0.17]], [[-0.5, 4.46], [-0.45, 4.37], [-0.4, 4.28], [-0.35, 4.19], [-0.29, 4.1], [-0.24, 4.01], [-0.18, 3.93], [-0.12, 3.86], [-0.03, 3.79], [0.07, 3.73], [0.19, 3.67], [0.33, 3.59], [0.48, 3.51], [0.6, 3.4], [0.72, 3.3], [0.83, 3.19], [0.94, 3.08], [1.09, 2.95], [1.24, 2.84], [1.38, 2.72], [1.46, 2.61], [1.53, 2.5], [1.6, 2.39], [1.69, 2.28], [1.8, 2.15], [1.94, 1.98], [2.08, 1.8], [2.21, 1.62], [2.35, 1.46], [2.47, 1.31], [2.6, 1.14], [2.72, 0.97], [2.85, 0.8], [2.97, 0.65], [3.08, 0.57], [3.2, 0.53], [3.32, 0.5], [3.44, 0.46], [3.57, 0.43], [3.7, 0.4], [3.83, 0.38], [3.95, 0.35], [4.08, 0.33], [4.21, 0.3], [4.34, 0.28], [4.47, 0.27], [4.61, 0.25], [4.74, 0.23], [4.88, 0.21], [5.02, 0.2]], [[-0.48, 4.45], [-0.43, 4.36], [-0.38, 4.27], [-0.33, 4.18], [-0.27, 4.09], [-0.22, 4.01], [-0.16, 3.93], [-0.09, 3.85], [-0.01, 3.78], [0.09, 3.72], [0.22, 3.66], [0.36, 3.58], [0.5, 3.5], [0.63, 3.39], [0.74, 3.29], [0.85, 3.18], [0.96, 3.07], [1.12, 2.94], [1.26, 2.83], [1.4, 2.71], [1.48, 2.6], [1.55, 2.49], [1.62, 2.38], [1.7, 2.27], [1.82, 2.14], [1.96, 1.97], [2.09, 1.79], [2.23, 1.61], [2.36, 1.45], [2.49, 1.3], [2.61, 1.14], [2.74, 0.96], [2.87, 0.8], [2.99, 0.64], [3.1, 0.57], [3.22, 0.53], [3.34, 0.49], [3.46, 0.46], [3.59, 0.43], [3.72, 0.4], [3.85, 0.37], [3.98, 0.35], [4.11, 0.32], [4.24, 0.3], [4.37, 0.28], [4.5, 0.26], [4.63, 0.24], [4.77, 0.23], [4.91, 0.21], [5.05, 0.19]], [[-0.48, 4.43], [-0.43, 4.34], [-0.38, 4.25], [-0.33, 4.16], [-0.28, 4.07], [-0.22, 3.99], [-0.16, 3.91], [-0.1, 3.83], [-0.01, 3.76], [0.09, 3.7], [0.21, 3.65], [0.35, 3.56], [0.5, 3.48], [0.63, 3.38], [0.74, 3.27], [0.85, 3.16], [0.96, 3.05], [1.12, 2.93], [1.26, 2.81], [1.39, 2.69], [1.48, 2.59], [1.55, 2.48], [1.62, 2.37], [1.7, 2.26], [1.82, 2.12], [1.95, 1.95], [2.09, 1.77], [2.23, 1.6], [2.36, 1.43], [2.49, 1.28], [2.61, 1.12], [2.74, 0.95], [2.86, 0.78], [2.99, 0.63], [3.09, 0.55], [3.21, 0.52], [3.34, 0.48], [3.46, 0.44], [3.59, 0.41], [3.72, 0.38], [3.84, 0.35], [3.97, 0.33], [4.1, 0.3], [4.23, 0.28], [4.37, 0.26], [4.5, 0.24], [4.63, 0.22], [4.77, 0.21], [4.91, 0.19], [5.04, 0.17]], [[-0.48, 4.43], [-0.43, 4.34], [-0.38, 4.25], [-0.33, 4.17], [-0.28, 4.08], [-0.22, 3.99], [-0.16, 3.91], [-0.1, 3.83], [-0.01, 3.76], [0.09, 3.71], [0.21, 3.65], [0.36, 3.57], [0.5, 3.48], [0.63, 3.38], [0.74, 3.27], [0.85, 3.17], [0.96, 3.05], [1.12, 2.93], [1.26, 2.81], [1.39, 2.7], [1.48, 2.59], [1.55, 2.48], [1.62, 2.37], [1.7, 2.26], [1.82, 2.12], [1.95, 1.95], [2.09, 1.78], [2.23, 1.6], [2.36, 1.43], [2.49, 1.29], [2.61, 1.12], [2.74, 0.95], [2.87, 0.78], [2.99, 0.63], [3.09, 0.56], [3.22, 0.52], [3.34, 0.48], [3.46, 0.44], [3.59, 0.41], [3.72, 0.39], [3.85, 0.36], [3.98, 0.33], [4.11, 0.31], [4.24, 0.28], [4.37, 0.26], [4.5, 0.24], [4.63, 0.23], [4.77, 0.21], [4.91, 0.19], [5.05, 0.17]], [[-0.43, 4.36], [-0.38, 4.27], [-0.33, 4.19], [-0.28, 4.1], [-0.23, 4.01], [-0.17, 3.93], [-0.11, 3.85], [-0.04, 3.78], [0.04, 3.71], [0.15, 3.65], [0.28, 3.59], [0.42, 3.51], [0.57, 3.42], [0.69, 3.31], [0.8, 3.21], [0.91, 3.1], [1.03, 2.99], [1.18, 2.87], [1.32, 2.75], [1.44, 2.64], [1.53, 2.54], [1.59, 2.43], [1.67, 2.32], [1.75, 2.21], [1.86, 2.08], [2.0, 1.9], [2.13, 1.73], [2.27, 1.55], [2.4, 1.39], [2.53, 1.24], [2.65, 1.07], [2.78, 0.9], [2.91, 0.73], [3.03, 0.59], [3.13, 0.52], [3.26, 0.49], [3.38, 0.45], [3.51, 0.41], [3.64, 0.38], [3.76, 0.35], [3.89, 0.32], [4.03, 0.29], [4.16, 0.27], [4.29, 0.25], [4.42, 0.23], [4.56, 0.21], [4.69, 0.19], [4.83, 0.17], [4.97, 0.15], [5.11, 0.13]], [[-0.36, 4.25], [-0.31, 4.17], [-0.26, 4.08], [-0.21, 4.0], [-0.16, 3.92], [-0.11, 3.83], [-0.04, 3.76], [0.03, 3.69], [0.12, 3.63], [0.24, 3.57], [0.38, 3.49], [0.52, 3.41], [0.66, 3.32], [0.78, 3.22], [0.89, 3.12], [1.0, 3.01], [1.11, 2.91], [1.26, 2.79], [1.39, 2.67], [1.49, 2.57], [1.57, 2.47], [1.64, 2.36], [1.71, 2.25], [1.79, 2.15], [1.89, 2.02], [2.03, 1.84], [2.16, 1.67], [2.3, 1.49], [2.43, 1.33], [2.56, 1.18], [2.68, 1.02], [2.81, 0.85], [2.93, 0.68], [3.05, 0.56], [3.15, 0.49], [3.28, 0.46], [3.4, 0.42], [3.53, 0.38], [3.66, 0.35], [3.79, 0.32], [3.92, 0.29], [4.05, 0.26], [4.18, 0.24], [4.32, 0.22], [4.45, 0.2], [4.58, 0.17], [4.72, 0.15], [4.86, 0.13], [5.0, 0.11], [5.14, 0.1]], [[-0.39, 4.26], [-0.34, 4.18], [-0.29, 4.09], [-0.24, 4.01], [-0.19, 3.92], [-0.14, 3.84], [-0.08, 3.76], [-0.0, 3.7], [0.08, 3.63], [0.19, 3.58], [0.33, 3.51], [0.47, 3.43], [0.61, 3.35], [0.73, 3.25], [0.84, 3.15], [0.95, 3.05], [1.06, 2.94], [1.21, 2.82], [1.35, 2.71], [1.46, 2.6], [1.54, 2.5], [1.6, 2.4], [1.67, 2.29], [1.75, 2.18], [1.85, 2.05], [1.99, 1.89], [2.12, 1.71], [2.26, 1.54], [2.39, 1.38], [2.51, 1.24], [2.63, 1.07], [2.76, 0.9], [2.88, 0.74], [3.0, 0.6], [3.1, 0.54], [3.23, 0.5], [3.35, 0.46], [3.47, 0.43], [3.6, 0.4], [3.73, 0.37], [3.86, 0.34], [3.98, 0.32], [4.12, 0.3], [4.25, 0.27], [4.38, 0.25], [4.51, 0.24], [4.64, 0.22], [4.78, 0.2], [4.92, 0.18], [5.06, 0.16]], [[-0.39, 4.31], [-0.34, 4.23], [-0.29, 4.14], [-0.24, 4.06], [-0.19, 3.97], [-0.14, 3.89], [-0.08, 3.81], [-0.01, 3.74], [0.08, 3.68], [0.18, 3.62], [0.31, 3.56], [0.45, 3.48], [0.59, 3.4], [0.72, 3.3], [0.83, 3.2], [0.94, 3.1], [1.05, 2.99], [1.2, 2.87], [1.33, 2.76], [1.44, 2.65], [1.52, 2.55], [1.59, 2.44], [1.66, 2.34], [1.73, 2.23], [1.84, 2.1], [1.97, 1.94], [2.1, 1.77], [2.23, 1.59], [2.36, 1.44], [2.48, 1.29], [2.6, 1.13], [2.72, 0.96], [2.84, 0.8], [2.96, 0.66], [3.06, 0.6], [3.18, 0.56], [3.3, 0.52], [3.42, 0.49], [3.55, 0.47], [3.67, 0.44], [3.8, 0.41], [3.92, 0.39], [4.05, 0.37], [4.18, 0.35], [4.31, 0.33], [4.44, 0.31], [4.57, 0.3], [4.7, 0.28], [4.84, 0.27], [4.98, 0.25]], [[-0.39, 4.31], [-0.34, 4.23], [-0.29, 4.14], [-0.24, 4.06], [-0.19, 3.97], [-0.14, 3.89], [-0.08, 3.81], [-0.01, 3.74], [0.08, 3.68], [0.18, 3.62], [0.31, 3.56], [0.45, 3.48], [0.6, 3.4], [0.72, 3.3], [0.83, 3.2], [0.94, 3.1], [1.05, 2.99], [1.2, 2.87], [1.33, 2.76], [1.44, 2.65], [1.52, 2.55], [1.59, 2.44], [1.66, 2.34], [1.73, 2.23], [1.84, 2.1], [1.97, 1.94], [2.1, 1.77], [2.23, 1.59], [2.36, 1.44], [2.48, 1.29], [2.6, 1.13], [2.72, 0.96], [2.85, 0.8], [2.96, 0.66], [3.06, 0.6], [3.18, 0.56], [3.3, 0.53], [3.42, 0.49], [3.55, 0.47], [3.67, 0.44], [3.8, 0.41], [3.93, 0.39], [4.05, 0.37], [4.18, 0.35], [4.31, 0.33], [4.44, 0.31], [4.57, 0.3], [4.71, 0.28], [4.84, 0.27], [4.98, 0.25]], [[-0.39, 4.31], [-0.34, 4.23], [-0.29, 4.14], [-0.24, 4.06], [-0.19, 3.97], [-0.14, 3.89], [-0.08, 3.81], [-0.01, 3.74], [0.08, 3.68], [0.18, 3.62], [0.31, 3.56], [0.45, 3.48], [0.6, 3.4], [0.72, 3.3], [0.83, 3.2], [0.94, 3.1], [1.05, 2.99], [1.2, 2.87], [1.33, 2.76], [1.44, 2.65], [1.52, 2.55], [1.59, 2.44], [1.66, 2.34], [1.73, 2.23], [1.84, 2.1], [1.97, 1.94], [2.1, 1.77], [2.23, 1.59], [2.36, 1.44], [2.48, 1.29], [2.6, 1.13], [2.72, 0.96], [2.85, 0.8], [2.96, 0.66], [3.06, 0.6], [3.18, 0.56], [3.3, 0.53], [3.42, 0.49], [3.55, 0.47], [3.67, 0.44], [3.8, 0.41], [3.93, 0.39], [4.05, 0.37], [4.18, 0.35], [4.31, 0.33], [4.44, 0.31], [4.57, 0.3], [4.71, 0.28], [4.84, 0.27], [4.98, 0.25]], [[-0.39, 4.31], [-0.34, 4.23], [-0.29, 4.14], [-0.24, 4.06], [-0.19, 3.97], [-0.14, 3.89], [-0.08, 3.81], [-0.01, 3.74], [0.08, 3.68], [0.18, 3.62], [0.31, 3.56], [0.45, 3.48], [0.6, 3.4], [0.72, 3.3], [0.83, 3.2], [0.94, 3.1], [1.05, 2.99], [1.2, 2.87], [1.33, 2.76], [1.44, 2.65], [1.52, 2.55], [1.59, 2.44], [1.66, 2.34], [1.73, 2.23], [1.84, 2.1], [1.97, 1.94], [2.1, 1.77], [2.23, 1.59], [2.36, 1.44], [2.48, 1.29], [2.6, 1.13], [2.72, 0.96], [2.85, 0.8], [2.96, 0.66], [3.06, 0.6], [3.18, 0.56], [3.3, 0.53], [3.42, 0.49], [3.55, 0.47], [3.67, 0.44], [3.8, 0.41], [3.93, 0.39], [4.05, 0.37], [4.18, 0.35], [4.31, 0.33], [4.44, 0.31], [4.57, 0.3], [4.7, 0.28], [4.84, 0.27], [4.98, 0.25]], [[-0.39, 4.31], [-0.34, 4.23], [-0.29, 4.14], [-0.24, 4.06], [-0.19, 3.97], [-0.14, 3.89], [-0.08, 3.81], [-0.01, 3.74], [0.08, 3.68], [0.18, 3.62], [0.31, 3.56], [0.45, 3.48], [0.6, 3.4], [0.72, 3.3], [0.83, 3.2], [0.94, 3.1], [1.05, 2.99], [1.2, 2.87], [1.33, 2.76], [1.44, 2.65], [1.52, 2.55], [1.59, 2.44], [1.66, 2.34], [1.73, 2.23], [1.84, 2.1], [1.97, 1.94], [2.1, 1.77], [2.23, 1.6], [2.36, 1.44], [2.48, 1.29], [2.6, 1.13], [2.72, 0.96], [2.85, 0.8], [2.96, 0.66], [3.06, 0.6], [3.18, 0.56], [3.3, 0.53], [3.42, 0.49], [3.55, 0.47], [3.67, 0.44], [3.8, 0.41], [3.93, 0.39], [4.05, 0.37], [4.18, 0.35], [4.31, 0.33], [4.44, 0.31], [4.57, 0.3], [4.71, 0.28], [4.84, 0.27], [4.98, 0.25]], [[-0.59, 4.68], [-0.55, 4.57], [-0.5, 4.47], [-0.45, 4.37], [-0.39, 4.28], [-0.34, 4.19], [-0.28, 4.1], [-0.21, 4.01], [-0.15, 3.94], [-0.06, 3.87], [0.05, 3.81], [0.17, 3.75], [0.31, 3.68], [0.44, 3.59], [0.55, 3.49], [0.66, 3.39], [0.78, 3.27], [0.94, 3.14], [1.09, 3.03], [1.22, 2.91], [1.33, 2.79], [1.39, 2.68], [1.47, 2.57], [1.54, 2.46], [1.66, 2.33], [1.79, 2.16], [1.92, 1.99], [2.04, 1.82], [2.17, 1.66], [2.29, 1.51], [2.41, 1.35], [2.53, 1.18], [2.64, 1.02], [2.76, 0.86], [2.87, 0.75], [2.98, 0.72], [3.09, 0.69], [3.2, 0.66], [3.32, 0.64], [3.44, 0.62], [3.56, 0.6], [3.67, 0.58], [3.79, 0.56], [3.91, 0.54], [4.03, 0.52], [4.15, 0.51], [4.27, 0.5], [4.4, 0.49], [4.52, 0.48], [4.65, 0.47]], [[-0.42, 4.34], [-0.37, 4.25], [-0.31, 4.17], [-0.26, 4.08], [-0.21, 4.0], [-0.16, 3.91], [-0.11, 3.83], [-0.05, 3.76], [0.04, 3.69], [0.14, 3.64], [0.25, 3.58], [0.39, 3.51], [0.53, 3.43], [0.65, 3.35], [0.76, 3.25], [0.87, 3.15], [0.99, 3.03], [1.14, 2.92], [1.27, 2.8], [1.38, 2.7], [1.47, 2.59], [1.53, 2.49], [1.6, 2.38], [1.68, 2.27], [1.78, 2.15], [1.91, 1.98], [2.04, 1.82], [2.17, 1.65], [2.3, 1.49], [2.42, 1.34], [2.54, 1.18], [2.66, 1.01], [2.78, 0.85], [2.9, 0.7], [3.0, 0.64], [3.11, 0.6], [3.23, 0.57], [3.35, 0.53], [3.47, 0.51], [3.6, 0.49], [3.72, 0.46], [3.84, 0.44], [3.97, 0.42], [4.09, 0.4], [4.22, 0.38], [4.35, 0.37], [4.48, 0.35], [4.61, 0.34], [4.74, 0.33], [4.88, 0.31]], [[-0.4, 4.3], [-0.35, 4.22], [-0.3, 4.14], [-0.25, 4.05], [-0.2, 3.97], [-0.15, 3.88], [-0.1, 3.8], [-0.03, 3.73], [0.05, 3.66], [0.15, 3.61], [0.27, 3.56], [0.41, 3.48], [0.55, 3.41], [0.67, 3.32], [0.78, 3.22], [0.89, 3.12], [1.01, 3.01], [1.16, 2.89], [1.29, 2.78], [1.4, 2.67], [1.48, 2.57], [1.55, 2.46], [1.62, 2.36], [1.69, 2.25], [1.79, 2.13], [1.92, 1.96], [2.05, 1.8], [2.19, 1.62], [2.32, 1.46], [2.44, 1.32], [2.56, 1.16], [2.68, 0.99], [2.8, 0.83], [2.92, 0.68], [3.02, 0.62], [3.14, 0.59], [3.26, 0.55], [3.38, 0.52], [3.5, 0.49], [3.63, 0.47], [3.75, 0.44], [3.88, 0.42], [4.0, 0.4], [4.13, 0.38], [4.26, 0.37], [4.39, 0.35], [4.52, 0.33], [4.65, 0.32], [4.79, 0.31], [4.92, 0.29]], [[-0.37, 4.28], [-0.32, 4.2], [-0.28, 4.11], [-0.23, 4.03], [-0.18, 3.95], [-0.13, 3.86], [-0.07, 3.78], [-0.0, 3.71], [0.08, 3.65], [0.18, 3.6], [0.3, 3.54], [0.44, 3.47], [0.59, 3.39], [0.71, 3.3], [0.82, 3.2], [0.93, 3.1], [1.04, 2.99], [1.19, 2.87], [1.33, 2.76], [1.43, 2.66], [1.51, 2.55], [1.58, 2.45], [1.65, 2.34], [1.72, 2.24], [1.82, 2.11], [1.95, 1.95], [2.08, 1.78], [2.21, 1.61], [2.34, 1.45], [2.47, 1.3], [2.59, 1.14], [2.71, 0.98], [2.83, 0.81], [2.95, 0.67], [3.05, 0.61], [3.17, 0.57], [3.29, 0.54], [3.41, 0.51], [3.54, 0.48], [3.67, 0.46], [3.79, 0.43], [3.92, 0.41], [4.05, 0.39], [4.17, 0.37], [4.3, 0.36], [4.43, 0.34], [4.56, 0.32], [4.7, 0.31], [4.84, 0.29], [4.97, 0.28]], [[-0.37, 4.28], [-0.32, 4.2], [-0.28, 4.11], [-0.23, 4.03], [-0.18, 3.95], [-0.13, 3.86], [-0.07, 3.78], [-0.0, 3.71], [0.08, 3.65], [0.18, 3.6], [0.3, 3.54], [0.44, 3.47], [0.59, 3.39], [0.71, 3.3], [0.82, 3.2], [0.93, 3.1], [1.04, 2.99], [1.19, 2.87], [1.33, 2.76], [1.43, 2.66], [1.51, 2.55], [1.58, 2.45], [1.65, 2.34], [1.72, 2.24], [1.82, 2.11], [1.95, 1.95], [2.08, 1.78], [2.21, 1.61], [2.34, 1.45], [2.47, 1.3], [2.59, 1.14], [2.71, 0.98], [2.83, 0.81], [2.95, 0.67], [3.05, 0.61], [3.17, 0.57], [3.29, 0.54], [3.41, 0.51], [3.54, 0.48], [3.67, 0.46], [3.79, 0.43], [3.92, 0.41], [4.05, 0.39], [4.17, 0.37], [4.3, 0.36], [4.43, 0.34], [4.56, 0.32], [4.7, 0.31], [4.84, 0.29], [4.97, 0.28]], [[-0.37, 4.28], [-0.32, 4.2], [-0.28, 4.11], [-0.23, 4.03], [-0.18, 3.95], [-0.13, 3.86], [-0.07, 3.78], [-0.0, 3.71], [0.08, 3.65], [0.18, 3.6], [0.3, 3.54], [0.44, 3.47], [0.59, 3.39], [0.71, 3.3], [0.82, 3.2], [0.93, 3.1], [1.04, 2.99], [1.19, 2.87], [1.33, 2.76], [1.43, 2.66], [1.51, 2.55], [1.58, 2.45], [1.65, 2.34], [1.72, 2.24], [1.82, 2.11], [1.95, 1.95], [2.08, 1.78], [2.21, 1.61], [2.34, 1.45], [2.47, 1.3], [2.59, 1.14], [2.71, 0.98], [2.83, 0.81], [2.95, 0.67], [3.05, 0.61], [3.17, 0.57], [3.29, 0.54], [3.41, 0.51], [3.54, 0.48], [3.67, 0.46], [3.79, 0.43], [3.92, 0.41], [4.05, 0.39], [4.17, 0.37], [4.3, 0.36], [4.43, 0.34], [4.56, 0.32], [4.7, 0.31], [4.84, 0.29], [4.97, 0.28]], [[-0.41, 4.33], [-0.36, 4.25], [-0.31, 4.16], [-0.26, 4.08], [-0.21, 3.99], [-0.15, 3.91], [-0.1, 3.82], [-0.04, 3.75], [0.05, 3.68], [0.15, 3.63], [0.26, 3.58], [0.4, 3.51], [0.54, 3.43], [0.66, 3.34], [0.77, 3.24], [0.89, 3.14], [1.0, 3.03], [1.15, 2.91], [1.28, 2.8], [1.39, 2.7], [1.47, 2.59], [1.54, 2.49], [1.61, 2.38], [1.69, 2.27], [1.79, 2.15], [1.92, 1.98], [2.05, 1.82], [2.18, 1.65], [2.31, 1.49], [2.43, 1.34], [2.55, 1.18], [2.67, 1.02], [2.79, 0.85], [2.91, 0.7], [3.01, 0.64], [3.13, 0.6], [3.25, 0.57], [3.37, 0.54], [3.49, 0.51], [3.62, 0.49], [3.74, 0.47], [3.87, 0.44], [3.99, 0.42], [4.12, 0.41], [4.25, 0.39], [4.37, 0.37], [4.5, 0.36], [4.64, 0.35], [4.77, 0.33], [4.91, 0.32]], [[-0.34, 4.25], [-0.29, 4.16], [-0.24, 4.08], [-0.2, 4.0], [-0.15, 3.92], [-0.1, 3.83], [-0.05, 3.75], [0.03, 3.69], [0.11, 3.62], [0.21, 3.57], [0.34, 3.52], [0.48, 3.44], [0.62, 3.36], [0.74, 3.27], [0.85, 3.18], [0.96, 3.07], [1.07, 2.96], [1.22, 2.85], [1.35, 2.74], [1.45, 2.64], [1.53, 2.54], [1.6, 2.43], [1.67, 2.33], [1.74, 2.22], [1.84, 2.1], [1.97, 1.93], [2.1, 1.77], [2.23, 1.59], [2.36, 1.44], [2.49, 1.29], [2.61, 1.13], [2.73, 0.96], [2.86, 0.8], [2.97, 0.67], [3.07, 0.6], [3.19, 0.57], [3.31, 0.53], [3.44, 0.5], [3.57, 0.47], [3.69, 0.45], [3.82, 0.43], [3.95, 0.4], [4.08, 0.38], [4.21, 0.36], [4.34, 0.35], [4.47, 0.33], [4.6, 0.31], [4.74, 0.3], [4.87, 0.29], [5.01, 0.27]], [[-0.39, 4.3], [-0.34, 4.21], [-0.29, 4.13], [-0.24, 4.05], [-0.19, 3.96], [-0.14, 3.88], [-0.09, 3.8], [-0.02, 3.72], [0.06, 3.66], [0.16, 3.61], [0.27, 3.56], [0.41, 3.48], [0.56, 3.41], [0.68, 3.32], [0.79, 3.23], [0.9, 3.12], [1.01, 3.01], [1.16, 2.9], [1.3, 2.78], [1.4, 2.68], [1.48, 2.58], [1.55, 2.47], [1.62, 2.37], [1.69, 2.26], [1.8, 2.13], [1.93, 1.97], [2.06, 1.8], [2.19, 1.63], [2.32, 1.47], [2.44, 1.32], [2.57, 1.16], [2.69, 0.99], [2.81, 0.83], [2.93, 0.68], [3.03, 0.62], [3.15, 0.58], [3.27, 0.55], [3.39, 0.52], [3.51, 0.49], [3.64, 0.47], [3.77, 0.44], [3.89, 0.42], [4.02, 0.4], [4.15, 0.38], [4.27, 0.36], [4.4, 0.35], [4.53, 0.33], [4.67, 0.32], [4.8, 0.3], [4.94, 0.29]], [[-0.38, 4.34], [-0.33, 4.25], [-0.28, 4.17], [-0.23, 4.08], [-0.18, 4.0], [-0.13, 3.91], [-0.08, 3.83], [-0.01, 3.76], [0.08, 3.69], [0.17, 3.64], [0.29, 3.58], [0.43, 3.51], [0.57, 3.43], [0.69, 3.34], [0.81, 3.24], [0.92, 3.13], [1.03, 3.02], [1.18, 2.9], [1.32, 2.79], [1.42, 2.68], [1.5, 2.58], [1.57, 2.47], [1.64, 2.36], [1.72, 2.25], [1.82, 2.12], [1.95, 1.96], [2.09, 1.78], [2.22, 1.61], [2.35, 1.44], [2.47, 1.3], [2.6, 1.13], [2.72, 0.96], [2.85, 0.79], [2.97, 0.64], [3.07, 0.57], [3.19, 0.54], [3.31, 0.5], [3.43, 0.46], [3.56, 0.43], [3.68, 0.4], [3.81, 0.37], [3.94, 0.35], [4.07, 0.32], [4.2, 0.3], [4.33, 0.28], [4.46, 0.26], [4.59, 0.25], [4.73, 0.23], [4.86, 0.21], [5.0, 0.19]], [[-0.36, 4.31], [-0.31, 4.23], [-0.26, 4.14], [-0.21, 4.06], [-0.16, 3.97], [-0.12, 3.89], [-0.07, 3.8], [-0.0, 3.73], [0.08, 3.66], [0.18, 3.61], [0.3, 3.56], [0.44, 3.48], [0.58, 3.4], [0.71, 3.31], [0.82, 3.21], [0.94, 3.1], [1.05, 2.99], [1.21, 2.87], [1.35, 2.75], [1.46, 2.64], [1.54, 2.54], [1.61, 2.43], [1.68, 2.32], [1.75, 2.21], [1.86, 2.08], [1.99, 1.91], [2.13, 1.74], [2.27, 1.56], [2.4, 1.4], [2.52, 1.25], [2.65, 1.08], [2.78, 0.91], [2.9, 0.74], [3.02, 0.6], [3.12, 0.54], [3.25, 0.5], [3.37, 0.46], [3.49, 0.42], [3.62, 0.39], [3.75, 0.36], [3.88, 0.33], [4.01, 0.3], [4.15, 0.28], [4.28, 0.26], [4.41, 0.24], [4.54, 0.22], [4.68, 0.2], [4.82, 0.18], [4.96, 0.16], [5.1, 0.14]], [[-0.45, 4.49], [-0.4, 4.4], [-0.35, 4.31], [-0.29, 4.22], [-0.24, 4.13], [-0.19, 4.04], [-0.14, 3.95], [-0.08, 3.86], [-0.01, 3.79], [0.09, 3.73], [0.2, 3.67], [0.33, 3.62], [0.47, 3.53], [0.6, 3.44], [0.71, 3.34], [0.83, 3.24], [0.94, 3.12], [1.1, 3.0], [1.25, 2.88], [1.37, 2.76], [1.46, 2.65], [1.53, 2.54], [1.6, 2.43], [1.68, 2.32], [1.78, 2.19], [1.92, 2.02], [2.05, 1.85], [2.18, 1.67], [2.31, 1.51], [2.44, 1.36], [2.56, 1.19], [2.68, 1.02], [2.81, 0.85], [2.93, 0.69], [3.03, 0.61], [3.15, 0.57], [3.27, 0.54], [3.39, 0.5], [3.52, 0.47], [3.64, 0.44], [3.77, 0.41], [3.89, 0.39], [4.02, 0.36], [4.15, 0.34], [4.27, 0.33], [4.4, 0.31], [4.53, 0.29], [4.67, 0.27], [4.81, 0.26], [4.94, 0.24]], [[-0.43, 4.41], [-0.38, 4.33], [-0.32, 4.24], [-0.27, 4.15], [-0.22, 4.06], [-0.17, 3.97], [-0.12, 3.88], [-0.06, 3.8], [0.02, 3.73], [0.11, 3.67], [0.23, 3.62], [0.36, 3.55], [0.51, 3.47], [0.63, 3.38], [0.75, 3.28], [0.86, 3.17], [0.98, 3.06], [1.14, 2.94], [1.28, 2.82], [1.4, 2.71], [1.48, 2.6], [1.55, 2.49], [1.63, 2.38], [1.7, 2.27], [1.81, 2.14], [1.94, 1.97], [2.07, 1.8], [2.21, 1.62], [2.34, 1.46], [2.46, 1.31], [2.59, 1.14], [2.71, 0.97], [2.84, 0.8], [2.96, 0.64], [3.06, 0.57], [3.18, 0.53], [3.3, 0.5], [3.42, 0.46], [3.55, 0.43], [3.67, 0.4], [3.8, 0.37], [3.93, 0.34], [4.05, 0.32], [4.18, 0.3], [4.31, 0.28], [4.44, 0.26], [4.58, 0.24], [4.71, 0.22], [4.85, 0.2], [4.99, 0.19]], [[-0.43, 4.42], [-0.38, 4.33], [-0.32, 4.24], [-0.27, 4.15], [-0.22, 4.06], [-0.17, 3.97], [-0.12, 3.88], [-0.06, 3.8], [0.02, 3.73], [0.11, 3.67], [0.23, 3.62], [0.36, 3.55], [0.51, 3.47], [0.63, 3.38], [0.75, 3.28], [0.86, 3.17], [0.98, 3.06], [1.14, 2.94], [1.28, 2.82], [1.4, 2.71], [1.48, 2.6], [1.55, 2.49], [1.63, 2.38], [1.7, 2.27], [1.81, 2.14], [1.94, 1.97], [2.07, 1.8], [2.21, 1.62], [2.34, 1.46], [2.46, 1.31], [2.59, 1.14], [2.71, 0.97], [2.84, 0.8], [2.96, 0.64], [3.06, 0.57], [3.18, 0.53], [3.3, 0.5], [3.42, 0.46], [3.55, 0.43], [3.67, 0.4], [3.8, 0.37], [3.93, 0.34], [4.05, 0.32], [4.18, 0.3], [4.31, 0.28], [4.44, 0.26], [4.58, 0.24], [4.71, 0.22], [4.85, 0.2], [4.99, 0.19]], [[-0.43, 4.42], [-0.38, 4.33], [-0.32, 4.24], [-0.27, 4.15], [-0.22, 4.06], [-0.17, 3.97], [-0.12, 3.88], [-0.06, 3.8], [0.02, 3.73], [0.11, 3.67], [0.23, 3.62], [0.36, 3.55], [0.51, 3.47], [0.63, 3.38], [0.75, 3.28], [0.86, 3.17], [0.98, 3.06], [1.14, 2.94], [1.28, 2.82], [1.4, 2.71], [1.48, 2.6], [1.55, 2.49], [1.63, 2.38], [1.7, 2.27], [1.81, 2.14], [1.94, 1.97], [2.07, 1.8], [2.21, 1.62], [2.34, 1.46], [2.46, 1.31], [2.59, 1.14], [2.71, 0.97], [2.84, 0.8], [2.96, 0.64], [3.06, 0.57], [3.18, 0.53], [3.3, 0.5], [3.42, 0.46], [3.55, 0.43], [3.67, 0.4], [3.8, 0.37], [3.93, 0.34], [4.05, 0.32], [4.18, 0.3], [4.31, 0.28], [4.44, 0.26], [4.58, 0.24], [4.71, 0.22], [4.85, 0.2], [4.99, 0.19]], [[-0.38, 4.35], [-0.33, 4.26], [-0.28, 4.18], [-0.23, 4.09], [-0.18, 4.0], [-0.13, 3.92], [-0.08, 3.83], [-0.02, 3.75], [0.07, 3.69], [0.17, 3.63], [0.29, 3.58], [0.43, 3.5], [0.57, 3.42], [0.7, 3.33], [0.81, 3.22], [0.93, 3.12], [1.05, 3.0], [1.2, 2.88], [1.34, 2.76], [1.46, 2.65], [1.54, 2.55], [1.61, 2.44], [1.68, 2.33], [1.75, 2.22], [1.86, 2.09], [1.99, 1.92], [2.13, 1.75], [2.26, 1.57], [2.4, 1.4], [2.52, 1.26], [2.65, 1.09], [2.77, 0.91], [2.9, 0.74], [3.02, 0.6], [3.12, 0.54], [3.25, 0.5], [3.37, 0.46], [3.49, 0.42], [3.62, 0.38], [3.75, 0.35], [3.88, 0.32], [4.01, 0.3], [4.14, 0.28], [4.28, 0.25], [4.41, 0.23], [4.54, 0.21], [4.68, 0.19], [4.82, 0.17], [4.96, 0.15], [5.1, 0.14]], [[-0.36, 4.33], [-0.31, 4.24], [-0.26, 4.15], [-0.21, 4.07], [-0.16, 3.98], [-0.11, 3.9], [-0.06, 3.81], [0.0, 3.73], [0.08, 3.66], [0.19, 3.61], [0.31, 3.55], [0.45, 3.48], [0.6, 3.39], [0.72, 3.3], [0.84, 3.19], [0.95, 3.09], [1.07, 2.97], [1.22, 2.85], [1.37, 2.73], [1.47, 2.63], [1.56, 2.52], [1.62, 2.41], [1.7, 2.3], [1.77, 2.19], [1.87, 2.06], [2.01, 1.89], [2.14, 1.71], [2.28, 1.53], [2.41, 1.37], [2.54, 1.22], [2.66, 1.05], [2.79, 0.88], [2.92, 0.71], [3.03, 0.57], [3.14, 0.51], [3.26, 0.47], [3.39, 0.42], [3.51, 0.38], [3.64, 0.35], [3.77, 0.32], [3.9, 0.29], [4.03, 0.26], [4.16, 0.24], [4.3, 0.22], [4.43, 0.19], [4.56, 0.17], [4.7, 0.15], [4.84, 0.13], [4.98, 0.11], [5.12, 0.09]], [[-0.28, 4.64], [-0.23, 4.55], [-0.18, 4.45], [-0.13, 4.36], [-0.09, 4.26], [-0.04, 4.17], [0.01, 4.08], [0.08, 4.0], [0.16, 3.92], [0.27, 3.86], [0.39, 3.8], [0.52, 3.72], [0.67, 3.64], [0.79, 3.54], [0.9, 3.43], [1.01, 3.32], [1.13, 3.2], [1.28, 3.07], [1.42, 2.95], [1.53, 2.83], [1.62, 2.72], [1.68, 2.61], [1.76, 2.5], [1.83, 2.38], [1.94, 2.25], [2.07, 2.08], [2.21, 1.9], [2.35, 1.72], [2.49, 1.55], [2.61, 1.41], [2.74, 1.24], [2.87, 1.06], [3.0, 0.89], [3.13, 0.72], [3.24, 0.65], [3.37, 0.61], [3.5, 0.58], [3.62, 0.54], [3.76, 0.51], [3.89, 0.49], [4.03, 0.46], [4.16, 0.44], [4.3, 0.41], [4.44, 0.39], [4.57, 0.38], [4.71, 0.36], [4.85, 0.35], [5.0, 0.33], [5.14, 0.32], [5.29, 0.3]], [[-0.29, 4.66], [-0.24, 4.57], [-0.19, 4.47], [-0.15, 4.37], [-0.1, 4.28], [-0.05, 4.18], [-0.0, 4.08], [0.06, 4.0], [0.15, 3.92], [0.24, 3.86], [0.37, 3.8], [0.5, 3.73], [0.64, 3.63], [0.75, 3.54], [0.87, 3.43], [0.97, 3.31], [1.09, 3.19], [1.23, 3.06], [1.37, 2.93], [1.48, 2.82], [1.56, 2.7], [1.63, 2.59], [1.7, 2.47], [1.77, 2.36], [1.87, 2.22], [2.0, 2.04], [2.14, 1.87], [2.27, 1.68], [2.4, 1.51], [2.53, 1.35], [2.65, 1.18], [2.78, 1.0], [2.9, 0.82], [3.02, 0.66], [3.13, 0.59], [3.25, 0.55], [3.37, 0.51], [3.49, 0.47], [3.62, 0.44], [3.75, 0.41], [3.88, 0.38], [4.01, 0.36], [4.14, 0.33], [4.27, 0.32], [4.41, 0.3], [4.54, 0.28], [4.68, 0.26], [4.82, 0.24], [4.96, 0.22], [5.1, 0.21]], [[-0.43, 4.57], [-0.39, 4.46], [-0.34, 4.37], [-0.29, 4.27], [-0.24, 4.18], [-0.19, 4.08], [-0.13, 3.99], [-0.08, 3.89], [-0.02, 3.81], [0.07, 3.75], [0.18, 3.68], [0.3, 3.62], [0.44, 3.53], [0.57, 3.44], [0.68, 3.34], [0.79, 3.23], [0.91, 3.11], [1.07, 2.98], [1.21, 2.85], [1.34, 2.73], [1.43, 2.62], [1.5, 2.5], [1.57, 2.39], [1.65, 2.27], [1.75, 2.14], [1.88, 1.96], [2.02, 1.78], [2.15, 1.6], [2.29, 1.42], [2.41, 1.27], [2.53, 1.09], [2.66, 0.91], [2.78, 0.74], [2.9, 0.59], [3.0, 0.52], [3.12, 0.48], [3.24, 0.44], [3.36, 0.4], [3.48, 0.37], [3.6, 0.34], [3.73, 0.31], [3.86, 0.29], [3.99, 0.26], [4.11, 0.24], [4.24, 0.22], [4.37, 0.2], [4.5, 0.18], [4.64, 0.16], [4.77, 0.14], [4.91, 0.12]], [[-0.35, 4.68], [-0.3, 4.58], [-0.25, 4.48], [-0.2, 4.39], [-0.16, 4.29], [-0.11, 4.19], [-0.06, 4.09], [-0.01, 4.0], [0.07, 3.92], [0.16, 3.85], [0.27, 3.79], [0.4, 3.72], [0.54, 3.63], [0.66, 3.53], [0.77, 3.43], [0.88, 3.31], [1.0, 3.19], [1.15, 3.06], [1.29, 2.93], [1.41, 2.81], [1.5, 2.69], [1.57, 2.58], [1.64, 2.46], [1.71, 2.34], [1.82, 2.21], [1.95, 2.03], [2.08, 1.85], [2.22, 1.66], [2.35, 1.49], [2.47, 1.34], [2.6, 1.16], [2.72, 0.98], [2.85, 0.81], [2.97, 0.65], [3.07, 0.58], [3.19, 0.54], [3.32, 0.5], [3.44, 0.46], [3.56, 0.43], [3.69, 0.4], [3.82, 0.38], [3.95, 0.35], [4.08, 0.33], [4.21, 0.31], [4.34, 0.3], [4.47, 0.28], [4.61, 0.26], [4.75, 0.24], [4.88, 0.23], [5.02, 0.21]], [[-0.4, 4.61], [-0.35, 4.51], [-0.3, 4.41], [-0.25, 4.32], [-0.2, 4.22], [-0.15, 4.12], [-0.1, 4.03], [-0.05, 3.93], [0.02, 3.85], [0.12, 3.79], [0.22, 3.72], [0.35, 3.66], [0.49, 3.56], [0.62, 3.47], [0.73, 3.36], [0.85, 3.24], [0.96, 3.12], [1.12, 2.99], [1.26, 2.86], [1.39, 2.74], [1.47, 2.62], [1.54, 2.51], [1.61, 2.39], [1.69, 2.28], [1.79, 2.14], [1.92, 1.96], [2.06, 1.78], [2.19, 1.59], [2.32, 1.41], [2.45, 1.26], [2.57, 1.08], [2.7, 0.9], [2.82, 0.72], [2.93, 0.58], [3.04, 0.52], [3.16, 0.47], [3.28, 0.43], [3.4, 0.39], [3.52, 0.36], [3.65, 0.33], [3.77, 0.3], [3.9, 0.28], [4.03, 0.25], [4.16, 0.23], [4.29, 0.21], [4.42, 0.19], [4.56, 0.17], [4.69, 0.15], [4.83, 0.13], [4.96, 0.11]], [[-0.36, 4.56], [-0.31, 4.46], [-0.26, 4.37], [-0.21, 4.27], [-0.16, 4.18], [-0.11, 4.08], [-0.06, 3.99], [-0.01, 3.9], [0.06, 3.82], [0.16, 3.75], [0.27, 3.69], [0.4, 3.62], [0.54, 3.53], [0.66, 3.43], [0.77, 3.33], [0.89, 3.22], [1.0, 3.1], [1.15, 2.96], [1.29, 2.84], [1.4, 2.72], [1.49, 2.61], [1.55, 2.5], [1.62, 2.38], [1.7, 2.27], [1.8, 2.13], [1.93, 1.96], [2.06, 1.78], [2.19, 1.59], [2.32, 1.42], [2.44, 1.27], [2.57, 1.09], [2.69, 0.91], [2.81, 0.74], [2.93, 0.6], [3.03, 0.53], [3.15, 0.49], [3.27, 0.45], [3.39, 0.41], [3.51, 0.37], [3.64, 0.34], [3.76, 0.31], [3.89, 0.29], [4.02, 0.27], [4.15, 0.25], [4.28, 0.23], [4.41, 0.21], [4.54, 0.19], [4.68, 0.17], [4.81, 0.15], [4.95, 0.13]], [[-0.38, 4.61], [-0.34, 4.51], [-0.29, 4.41], [-0.24, 4.32], [-0.19, 4.22], [-0.14, 4.12], [-0.09, 4.03], [-0.04, 3.93], [0.04, 3.85], [0.13, 3.79], [0.24, 3.72], [0.36, 3.66], [0.51, 3.57], [0.63, 3.47], [0.74, 3.37], [0.86, 3.25], [0.97, 3.13], [1.12, 3.0], [1.26, 2.87], [1.38, 2.75], [1.47, 2.64], [1.53, 2.53], [1.61, 2.41], [1.68, 2.29], [1.78, 2.16], [1.91, 1.98], [2.04, 1.8], [2.18, 1.62], [2.31, 1.44], [2.43, 1.29], [2.55, 1.11], [2.68, 0.93], [2.8, 0.76], [2.91, 0.61], [3.02, 0.55], [3.14, 0.5], [3.25, 0.46], [3.37, 0.43], [3.5, 0.39], [3.62, 0.36], [3.75, 0.34], [3.88, 0.31], [4.01, 0.29], [4.13, 0.27], [4.26, 0.25], [4.39, 0.23], [4.52, 0.21], [4.66, 0.19], [4.8, 0.18], [4.93, 0.16]], [[-0.39, 4.62], [-0.35, 4.52], [-0.3, 4.42], [-0.25, 4.33], [-0.2, 4.23], [-0.15, 4.13], [-0.1, 4.04], [-0.04, 3.94], [0.03, 3.86], [0.13, 3.79], [0.23, 3.73], [0.36, 3.66], [0.51, 3.57], [0.64, 3.47], [0.75, 3.36], [0.86, 3.25], [0.98, 3.12], [1.13, 2.99], [1.27, 2.86], [1.4, 2.74], [1.48, 2.63], [1.55, 2.51], [1.62, 2.4], [1.69, 2.28], [1.79, 2.14], [1.93, 1.97], [2.06, 1.79], [2.19, 1.6], [2.33, 1.43], [2.45, 1.27], [2.57, 1.09], [2.69, 0.91], [2.82, 0.73], [2.93, 0.6], [3.03, 0.53], [3.15, 0.49], [3.27, 0.45], [3.39, 0.41], [3.52, 0.38], [3.65, 0.35], [3.77, 0.32], [3.9, 0.3], [4.03, 0.27], [4.16, 0.25], [4.29, 0.23], [4.42, 0.21], [4.55, 0.19], [4.69, 0.17], [4.83, 0.15], [4.96, 0.13]], [[-0.47, 4.71], [-0.42, 4.6], [-0.37, 4.51], [-0.32, 4.41], [-0.27, 4.31], [-0.21, 4.21], [-0.16, 4.11], [-0.11, 4.01], [-0.04, 3.92], [0.05, 3.85], [0.16, 3.78], [0.28, 3.72], [0.43, 3.63], [0.56, 3.53], [0.67, 3.43], [0.78, 3.31], [0.9, 3.19], [1.06, 3.05], [1.21, 2.92], [1.34, 2.79], [1.43, 2.68], [1.5, 2.56], [1.57, 2.45], [1.65, 2.33], [1.76, 2.19], [1.89, 2.01], [2.02, 1.83], [2.16, 1.64], [2.29, 1.46], [2.41, 1.31], [2.54, 1.13], [2.66, 0.95], [2.78, 0.77], [2.9, 0.62], [3.0, 0.55], [3.12, 0.51], [3.24, 0.47], [3.36, 0.43], [3.49, 0.39], [3.61, 0.36], [3.74, 0.34], [3.86, 0.31], [3.99, 0.29], [4.12, 0.27], [4.25, 0.25], [4.38, 0.23], [4.51, 0.21], [4.65, 0.19], [4.78, 0.17], [4.92, 0.15]], [[-0.36, 4.55], [-0.32, 4.45], [-0.27, 4.36], [-0.22, 4.26], [-0.17, 4.16], [-0.12, 4.07], [-0.07, 3.97], [-0.01, 3.88], [0.07, 3.8], [0.17, 3.74], [0.28, 3.67], [0.42, 3.59], [0.57, 3.5], [0.7, 3.39], [0.81, 3.28], [0.93, 3.17], [1.04, 3.04], [1.2, 2.91], [1.34, 2.78], [1.45, 2.67], [1.54, 2.55], [1.6, 2.44], [1.68, 2.33], [1.75, 2.21], [1.85, 2.07], [1.98, 1.89], [2.12, 1.7], [2.26, 1.52], [2.39, 1.34], [2.51, 1.19], [2.64, 1.01], [2.77, 0.82], [2.89, 0.64], [3.0, 0.53], [3.11, 0.46], [3.23, 0.42], [3.35, 0.37], [3.48, 0.33], [3.61, 0.3], [3.74, 0.26], [3.87, 0.24], [4.0, 0.21], [4.14, 0.19], [4.27, 0.17], [4.4, 0.14], [4.53, 0.12], [4.67, 0.09], [4.81, 0.07], [4.95, 0.05], [5.09, 0.03]], [[-0.43, 4.66], [-0.39, 4.56], [-0.34, 4.46], [-0.29, 4.36], [-0.23, 4.26], [-0.18, 4.16], [-0.13, 4.06], [-0.08, 3.97], [-0.0, 3.88], [0.1, 3.81], [0.2, 3.74], [0.33, 3.67], [0.48, 3.58], [0.61, 3.48], [0.73, 3.37], [0.85, 3.25], [0.96, 3.13], [1.12, 2.99], [1.27, 2.86], [1.39, 2.74], [1.48, 2.62], [1.54, 2.51], [1.62, 2.39], [1.69, 2.28], [1.79, 2.14], [1.93, 1.96], [2.06, 1.78], [2.2, 1.59], [2.33, 1.41], [2.45, 1.26], [2.58, 1.08], [2.7, 0.9], [2.83, 0.72], [2.94, 0.58], [3.04, 0.51], [3.16, 0.47], [3.28, 0.43], [3.4, 0.39], [3.53, 0.36], [3.66, 0.32], [3.78, 0.3], [3.91, 0.27], [4.04, 0.25], [4.17, 0.23], [4.3, 0.21], [4.43, 0.19], [4.57, 0.17], [4.71, 0.15], [4.84, 0.13], [4.98, 0.11]], [[-0.46, 4.7], [-0.42, 4.6], [-0.37, 4.49], [-0.31, 4.39], [-0.26, 4.29], [-0.21, 4.19], [-0.15, 4.09], [-0.1, 4.0], [-0.03, 3.91], [0.07, 3.84], [0.18, 3.77], [0.31, 3.7], [0.46, 3.6], [0.59, 3.5], [0.71, 3.39], [0.83, 3.27], [0.95, 3.14], [1.11, 3.01], [1.25, 2.88], [1.38, 2.75], [1.47, 2.64], [1.54, 2.52], [1.61, 2.4], [1.69, 2.28], [1.79, 2.15], [1.93, 1.97], [2.06, 1.78], [2.2, 1.59], [2.33, 1.42], [2.46, 1.26], [2.58, 1.08], [2.71, 0.9], [2.84, 0.72], [2.95, 0.58], [3.06, 0.51], [3.18, 0.46], [3.3, 0.42], [3.42, 0.38], [3.55, 0.35], [3.67, 0.32], [3.8, 0.29], [3.93, 0.27], [4.06, 0.24], [4.19, 0.22], [4.32, 0.2], [4.45, 0.18], [4.59, 0.16], [4.73, 0.14], [4.87, 0.12], [5.0, 0.1]], [[-0.45, 4.68], [-0.41, 4.57], [-0.36, 4.47], [-0.3, 4.37], [-0.25, 4.27], [-0.2, 4.17], [-0.15, 4.07], [-0.09, 3.97], [-0.01, 3.89], [0.09, 3.82], [0.2, 3.75], [0.33, 3.67], [0.48, 3.57], [0.62, 3.47], [0.74, 3.36], [0.85, 3.24], [0.97, 3.11], [1.13, 2.98], [1.28, 2.85], [1.41, 2.72], [1.49, 2.61], [1.56, 2.49], [1.63, 2.38], [1.71, 2.26], [1.81, 2.12], [1.95, 1.94], [2.08, 1.75], [2.22, 1.56], [2.35, 1.39], [2.48, 1.23], [2.6, 1.05], [2.73, 0.86], [2.85, 0.69], [2.97, 0.56], [3.07, 0.49], [3.19, 0.44], [3.32, 0.4], [3.44, 0.36], [3.57, 0.33], [3.69, 0.29], [3.82, 0.27], [3.96, 0.24], [4.09, 0.22], [4.22, 0.2], [4.35, 0.17], [4.48, 0.15], [4.62, 0.13], [4.76, 0.11], [4.89, 0.09], [5.03, 0.07]], [[-0.47, 4.7], [-0.42, 4.59], [-0.37, 4.49], [-0.32, 4.39], [-0.27, 4.29], [-0.21, 4.19], [-0.16, 4.09], [-0.1, 3.99], [-0.03, 3.91], [0.07, 3.83], [0.18, 3.76], [0.32, 3.69], [0.47, 3.59], [0.61, 3.49], [0.73, 3.37], [0.84, 3.25], [0.96, 3.12], [1.12, 2.99], [1.27, 2.86], [1.4, 2.73], [1.49, 2.61], [1.56, 2.5], [1.63, 2.38], [1.71, 2.26], [1.81, 2.12], [1.94, 1.94], [2.08, 1.76], [2.22, 1.57], [2.35, 1.39], [2.47, 1.23], [2.6, 1.05], [2.73, 0.87], [2.85, 0.69], [2.97, 0.56], [3.07, 0.49], [3.19, 0.45], [3.32, 0.4], [3.44, 0.36], [3.57, 0.33], [3.69, 0.3], [3.82, 0.27], [3.95, 0.25], [4.09, 0.22], [4.22, 0.2], [4.35, 0.18], [4.48, 0.15], [4.62, 0.13], [4.76, 0.11], [4.89, 0.09], [5.03, 0.07]], [[-0.5, 4.75], [-0.46, 4.63], [-0.4, 4.53], [-0.35, 4.43], [-0.3, 4.33], [-0.24, 4.23], [-0.19, 4.12], [-0.13, 4.02], [-0.05, 3.94], [0.05, 3.86], [0.16, 3.79], [0.29, 3.71], [0.45, 3.61], [0.58, 3.51], [0.7, 3.39], [0.82, 3.27], [0.94, 3.15], [1.1, 3.01], [1.26, 2.88], [1.39, 2.75], [1.47, 2.63], [1.54, 2.51], [1.62, 2.4], [1.7, 2.28], [1.8, 2.14], [1.94, 1.95], [2.07, 1.77], [2.21, 1.58], [2.34, 1.4], [2.47, 1.24], [2.59, 1.06], [2.72, 0.88], [2.84, 0.7], [2.96, 0.56], [3.06, 0.49], [3.18, 0.45], [3.31, 0.41], [3.43, 0.37], [3.55, 0.33], [3.68, 0.3], [3.81, 0.28], [3.94, 0.25], [4.07, 0.23], [4.2, 0.21], [4.34, 0.18], [4.47, 0.16], [4.6, 0.14], [4.74, 0.12], [4.88, 0.1], [5.02, 0.08]], [[-0.52, 4.77], [-0.48, 4.66], [-0.42, 4.56], [-0.37, 4.45], [-0.31, 4.35], [-0.26, 4.25], [-0.2, 4.14], [-0.15, 4.04], [-0.07, 3.96], [0.03, 3.88], [0.14, 3.81], [0.28, 3.73], [0.43, 3.63], [0.57, 3.53], [0.69, 3.41], [0.81, 3.29], [0.93, 3.16], [1.09, 3.02], [1.24, 2.89], [1.38, 2.76], [1.47, 2.64], [1.54, 2.53], [1.61, 2.41], [1.69, 2.29], [1.79, 2.15], [1.93, 1.96], [2.06, 1.78], [2.2, 1.59], [2.34, 1.41], [2.46, 1.25], [2.59, 1.07], [2.71, 0.88], [2.84, 0.7], [2.95, 0.57], [3.06, 0.5], [3.18, 0.46], [3.3, 0.41], [3.42, 0.37], [3.55, 0.34], [3.68, 0.31], [3.81, 0.28], [3.94, 0.26], [4.07, 0.24], [4.2, 0.21], [4.33, 0.19], [4.46, 0.17], [4.6, 0.15], [4.73, 0.13], [4.87, 0.11], [5.01, 0.09]], [[-0.5, 4.73], [-0.46, 4.62], [-0.4, 4.52], [-0.35, 4.42], [-0.29, 4.31], [-0.24, 4.21], [-0.19, 4.11], [-0.13, 4.01], [-0.05, 3.92], [0.05, 3.85], [0.16, 3.78], [0.3, 3.7], [0.45, 3.59], [0.59, 3.49], [0.71, 3.37], [0.84, 3.25], [0.96, 3.12], [1.12, 2.98], [1.28, 2.85], [1.41, 2.72], [1.5, 2.6], [1.57, 2.48], [1.65, 2.36], [1.72, 2.24], [1.83, 2.1], [1.97, 1.91], [2.1, 1.72], [2.24, 1.53], [2.38, 1.35], [2.5, 1.19], [2.63, 1.01], [2.76, 0.82], [2.89, 0.64], [3.0, 0.52], [3.11, 0.45], [3.23, 0.41], [3.35, 0.37], [3.48, 0.33], [3.61, 0.29], [3.74, 0.26], [3.87, 0.23], [4.0, 0.21], [4.14, 0.18], [4.27, 0.16], [4.4, 0.14], [4.54, 0.11], [4.68, 0.09], [4.82, 0.07], [4.96, 0.05], [5.1, 0.02]], [[-0.51, 4.76], [-0.47, 4.65], [-0.42, 4.55], [-0.36, 4.44], [-0.31, 4.34], [-0.25, 4.24], [-0.2, 4.14], [-0.14, 4.03], [-0.07, 3.95], [0.03, 3.87], [0.14, 3.8], [0.27, 3.73], [0.42, 3.63], [0.56, 3.52], [0.68, 3.41], [0.8, 3.29], [0.92, 3.16], [1.09, 3.02], [1.24, 2.89], [1.38, 2.76], [1.47, 2.64], [1.54, 2.52], [1.61, 2.4], [1.69, 2.28], [1.79, 2.14], [1.93, 1.96], [2.06, 1.77], [2.2, 1.58], [2.34, 1.4], [2.46, 1.24], [2.59, 1.06], [2.71, 0.87], [2.84, 0.69], [2.95, 0.57], [3.05, 0.5], [3.17, 0.46], [3.29, 0.42], [3.42, 0.38], [3.54, 0.35], [3.67, 0.32], [3.8, 0.29], [3.93, 0.27], [4.06, 0.25], [4.19, 0.23], [4.32, 0.2], [4.45, 0.18], [4.59, 0.16], [4.73, 0.14], [4.86, 0.12], [5.0, 0.1]], [[-0.46, 4.67], [-0.42, 4.56], [-0.37, 4.46], [-0.31, 4.36], [-0.26, 4.26], [-0.21, 4.16], [-0.15, 4.06], [-0.1, 3.96], [-0.02, 3.87], [0.08, 3.8], [0.19, 3.73], [0.33, 3.65], [0.49, 3.55], [0.63, 3.44], [0.75, 3.33], [0.87, 3.21], [0.99, 3.08], [1.16, 2.94], [1.31, 2.8], [1.44, 2.68], [1.53, 2.56], [1.6, 2.44], [1.68, 2.32], [1.75, 2.2], [1.86, 2.06], [2.0, 1.87], [2.14, 1.68], [2.28, 1.48], [2.42, 1.3], [2.54, 1.14], [2.67, 0.95], [2.81, 0.76], [2.93, 0.58], [3.04, 0.49], [3.15, 0.42], [3.28, 0.38], [3.4, 0.33], [3.53, 0.29], [3.66, 0.25], [3.8, 0.22], [3.93, 0.2], [4.07, 0.17], [4.2, 0.15], [4.34, 0.12], [4.47, 0.1], [4.61, 0.07], [4.75, 0.05], [4.89, 0.02], [5.04, 0.0], [5.18, -0.02]], [[-0.46, 4.68], [-0.41, 4.58], [-0.36, 4.47], [-0.3, 4.37], [-0.25, 4.27], [-0.2, 4.17], [-0.14, 4.07], [-0.09, 3.97], [-0.01, 3.88], [0.09, 3.81], [0.21, 3.74], [0.36, 3.65], [0.51, 3.55], [0.65, 3.44], [0.77, 3.32], [0.89, 3.2], [1.02, 3.07], [1.18, 2.93], [1.34, 2.79], [1.47, 2.66], [1.55, 2.54], [1.63, 2.43], [1.7, 2.31], [1.77, 2.19], [1.88, 2.04], [2.02, 1.85], [2.16, 1.65], [2.3, 1.46], [2.44, 1.28], [2.57, 1.11], [2.7, 0.93], [2.83, 0.74], [2.96, 0.56], [3.06, 0.48], [3.17, 0.41], [3.3, 0.36], [3.43, 0.32], [3.56, 0.28], [3.69, 0.24], [3.83, 0.22], [3.96, 0.19], [4.1, 0.16], [4.24, 0.14], [4.37, 0.11], [4.51, 0.09], [4.65, 0.06], [4.79, 0.04], [4.93, 0.01], [5.08, -0.01], [5.22, -0.03]], [[-0.51, 4.78], [-0.46, 4.67], [-0.41, 4.56], [-0.35, 4.46], [-0.3, 4.35], [-0.24, 4.25], [-0.19, 4.14], [-0.13, 4.04], [-0.05, 3.95], [0.05, 3.87], [0.16, 3.8], [0.3, 3.71], [0.46, 3.61], [0.6, 3.5], [0.72, 3.38], [0.84, 3.26], [0.97, 3.13], [1.13, 2.99], [1.29, 2.85], [1.42, 2.72], [1.51, 2.6], [1.58, 2.48], [1.66, 2.36], [1.73, 2.24], [1.84, 2.09], [1.98, 1.9], [2.12, 1.71], [2.26, 1.51], [2.39, 1.33], [2.52, 1.17], [2.65, 0.98], [2.78, 0.79], [2.91, 0.61], [3.01, 0.52], [3.12, 0.45], [3.24, 0.4], [3.37, 0.36], [3.49, 0.32], [3.62, 0.29], [3.76, 0.26], [3.89, 0.24], [4.02, 0.21], [4.16, 0.19], [4.29, 0.16], [4.43, 0.14], [4.56, 0.11], [4.7, 0.09], [4.84, 0.07], [4.98, 0.05], [5.12, 0.03]], [[-0.44, 4.65], [-0.38, 4.54], [-0.33, 4.44], [-0.28, 4.34], [-0.22, 4.24], [-0.17, 4.14], [-0.12, 4.04], [-0.06, 3.94], [0.03, 3.85], [0.13, 3.78], [0.25, 3.71], [0.4, 3.61], [0.56, 3.51], [0.7, 3.39], [0.82, 3.28], [0.94, 3.15], [1.06, 3.03], [1.22, 2.89], [1.37, 2.75], [1.49, 2.63], [1.57, 2.51], [1.64, 2.39], [1.72, 2.28], [1.79, 2.16], [1.9, 2.01], [2.04, 1.82], [2.17, 1.62], [2.31, 1.43], [2.45, 1.25], [2.58, 1.09], [2.71, 0.9], [2.84, 0.71], [2.96, 0.55], [3.06, 0.46], [3.17, 0.39], [3.3, 0.35], [3.43, 0.31], [3.56, 0.26], [3.69, 0.23], [3.83, 0.2], [3.96, 0.18], [4.1, 0.15], [4.24, 0.13], [4.37, 0.1], [4.51, 0.07], [4.65, 0.05], [4.79, 0.02], [4.93, -0.0], [5.08, -0.02], [5.22, -0.05]], [[-0.52, 4.8], [-0.48, 4.69], [-0.42, 4.58], [-0.37, 4.47], [-0.31, 4.37], [-0.26, 4.26], [-0.2, 4.16], [-0.15, 4.05], [-0.07, 3.96], [0.03, 3.88], [0.14, 3.81], [0.28, 3.73], [0.43, 3.62], [0.57, 3.52], [0.69, 3.4], [0.81, 3.28], [0.94, 3.15], [1.1, 3.01], [1.26, 2.87], [1.39, 2.74], [1.48, 2.62], [1.55, 2.5], [1.63, 2.38], [1.7, 2.25], [1.81, 2.11], [1.95, 1.92], [2.08, 1.73], [2.22, 1.53], [2.36, 1.35], [2.48, 1.19], [2.61, 1.0], [2.74, 0.81], [2.86, 0.63], [2.97, 0.54], [3.07, 0.47], [3.19, 0.43], [3.32, 0.39], [3.44, 0.35], [3.57, 0.32], [3.7, 0.29], [3.83, 0.27], [3.96, 0.24], [4.09, 0.22], [4.23, 0.2], [4.36, 0.17], [4.49, 0.15], [4.63, 0.13], [4.77, 0.11], [4.91, 0.09], [5.04, 0.07]], [[-0.49, 4.77], [-0.44, 4.66], [-0.38, 4.56], [-0.33, 4.45], [-0.28, 4.35], [-0.22, 4.24], [-0.17, 4.14], [-0.11, 4.03], [-0.03, 3.94], [0.07, 3.87], [0.18, 3.79], [0.33, 3.71], [0.48, 3.6], [0.62, 3.5], [0.74, 3.38], [0.86, 3.26], [0.98, 3.12], [1.15, 2.98], [1.3, 2.85], [1.43, 2.72], [1.51, 2.6], [1.58, 2.48], [1.66, 2.36], [1.73, 2.24], [1.84, 2.09], [1.98, 1.9], [2.12, 1.71], [2.25, 1.52], [2.39, 1.34], [2.51, 1.17], [2.64, 0.99], [2.77, 0.8], [2.9, 0.62], [3.0, 0.53], [3.11, 0.46], [3.23, 0.42], [3.35, 0.38], [3.48, 0.34], [3.61, 0.31], [3.74, 0.28], [3.87, 0.26], [4.01, 0.23], [4.14, 0.21], [4.27, 0.18], [4.41, 0.16], [4.54, 0.14], [4.68, 0.12], [4.82, 0.1], [4.96, 0.07], [5.1, 0.05]], [[-0.49, 4.77], [-0.44, 4.66], [-0.38, 4.56], [-0.33, 4.45], [-0.28, 4.35], [-0.22, 4.24], [-0.17, 4.14], [-0.11, 4.03], [-0.03, 3.94], [0.07, 3.87], [0.18, 3.79], [0.33, 3.71], [0.48, 3.6], [0.62, 3.5], [0.74, 3.38], [0.86, 3.26], [0.98, 3.12], [1.15, 2.98], [1.3, 2.85], [1.43, 2.72], [1.51, 2.6], [1.58, 2.48], [1.66, 2.36], [1.73, 2.24], [1.84, 2.09], [1.98, 1.9], [2.12, 1.71], [2.25, 1.52], [2.39, 1.34], [2.51, 1.17], [2.64, 0.99], [2.77, 0.8], [2.9, 0.62], [3.0, 0.53], [3.11, 0.46], [3.23, 0.42], [3.35, 0.38], [3.48, 0.34], [3.61, 0.31], [3.74, 0.28], [3.87, 0.26], [4.01, 0.23], [4.14, 0.21], [4.27, 0.18], [4.41, 0.16], [4.54, 0.14], [4.68, 0.12], [4.82, 0.1], [4.96, 0.07], [5.1, 0.05]], [[-0.5, 4.77], [-0.46, 4.66], [-0.4, 4.56], [-0.35, 4.45], [-0.29, 4.35], [-0.24, 4.24], [-0.18, 4.14], [-0.13, 4.03], [-0.05, 3.94], [0.05, 3.87], [0.16, 3.79], [0.31, 3.71], [0.46, 3.6], [0.6, 3.5], [0.72, 3.38], [0.84, 3.26], [0.96, 3.13], [1.13, 2.98], [1.28, 2.85], [1.41, 2.72], [1.5, 2.6], [1.57, 2.48], [1.64, 2.36], [1.72, 2.24], [1.83, 2.09], [1.96, 1.91], [2.1, 1.71], [2.24, 1.52], [2.37, 1.34], [2.5, 1.17], [2.63, 0.99], [2.75, 0.8], [2.88, 0.62], [2.98, 0.53], [3.09, 0.46], [3.21, 0.42], [3.34, 0.38], [3.46, 0.34], [3.59, 0.3], [3.72, 0.28], [3.85, 0.25], [3.98, 0.23], [4.12, 0.21], [4.25, 0.18], [4.38, 0.16], [4.51, 0.14], [4.65, 0.11], [4.79, 0.09], [4.93, 0.07], [5.07, 0.05]], [[-0.46, 4.71], [-0.41, 4.6], [-0.36, 4.5], [-0.3, 4.4], [-0.25, 4.29], [-0.2, 4.19], [-0.14, 4.09], [-0.09, 3.99], [-0.0, 3.9], [0.1, 3.82], [0.21, 3.75], [0.36, 3.66], [0.51, 3.56], [0.65, 3.45], [0.77, 3.33], [0.89, 3.21], [1.01, 3.08], [1.17, 2.94], [1.33, 2.81], [1.45, 2.68], [1.54, 2.56], [1.61, 2.44], [1.68, 2.32], [1.75, 2.2], [1.86, 2.06], [2.0, 1.87], [2.14, 1.67], [2.27, 1.48], [2.41, 1.3], [2.53, 1.14], [2.66, 0.95], [2.79, 0.76], [2.92, 0.59], [3.02, 0.5], [3.13, 0.44], [3.25, 0.39], [3.38, 0.35], [3.5, 0.31], [3.63, 0.28], [3.77, 0.25], [3.9, 0.23], [4.03, 0.2], [4.17, 0.18], [4.3, 0.15], [4.44, 0.13], [4.57, 0.1], [4.71, 0.08], [4.85, 0.06], [4.99, 0.04], [5.13, 0.01]], [[-0.46, 4.71], [-0.41, 4.6], [-0.36, 4.5], [-0.3, 4.4], [-0.25, 4.29], [-0.2, 4.19], [-0.14, 4.09], [-0.09, 3.99], [-0.0, 3.9], [0.1, 3.82], [0.21, 3.75], [0.36, 3.66], [0.51, 3.56], [0.65, 3.45], [0.77, 3.33], [0.89, 3.21], [1.01, 3.08], [1.18, 2.94], [1.33, 2.81], [1.45, 2.68], [1.54, 2.56], [1.61, 2.44], [1.68, 2.32], [1.75, 2.2], [1.86, 2.06], [2.0, 1.87], [2.14, 1.67], [2.27, 1.48], [2.41, 1.3], [2.53, 1.14], [2.66, 0.95], [2.79, 0.76], [2.92, 0.59], [3.02, 0.5], [3.13, 0.44], [3.25, 0.39], [3.38, 0.35], [3.5, 0.31], [3.63, 0.28], [3.77, 0.25], [3.9, 0.23], [4.03, 0.2], [4.17, 0.18], [4.3, 0.15], [4.44, 0.13], [4.57, 0.1], [4.71, 0.08], [4.85, 0.06], [4.99, 0.04], [5.14, 0.01]], [[-0.41, 4.62], [-0.36, 4.52], [-0.31, 4.42], [-0.25, 4.32], [-0.2, 4.22], [-0.15, 4.12], [-0.1, 4.01], [-0.04, 3.92], [0.05, 3.83], [0.15, 3.76], [0.28, 3.69], [0.43, 3.59], [0.58, 3.49], [0.72, 3.38], [0.84, 3.26], [0.96, 3.14], [1.08, 3.01], [1.24, 2.87], [1.38, 2.74], [1.49, 2.62], [1.58, 2.5], [1.65, 2.39], [1.72, 2.27], [1.79, 2.15], [1.89, 2.0], [2.03, 1.82], [2.17, 1.62], [2.31, 1.43], [2.44, 1.25], [2.57, 1.09], [2.69, 0.9], [2.82, 0.71], [2.94, 0.56], [3.04, 0.48], [3.15, 0.41], [3.28, 0.36], [3.4, 0.32], [3.53, 0.28], [3.66, 0.25], [3.8, 0.22], [3.93, 0.2], [4.07, 0.17], [4.2, 0.15], [4.34, 0.12], [4.47, 0.1], [4.61, 0.07], [4.75, 0.05], [4.89, 0.02], [5.04, 0.0], [5.18, -0.02]], [[-0.51, 4.8], [-0.46, 4.69], [-0.41, 4.59], [-0.35, 4.48], [-0.3, 4.38], [-0.24, 4.27], [-0.19, 4.16], [-0.13, 4.06], [-0.06, 3.97], [0.05, 3.89], [0.16, 3.82], [0.29, 3.73], [0.45, 3.63], [0.58, 3.53], [0.7, 3.41], [0.82, 3.29], [0.94, 3.16], [1.1, 3.02], [1.25, 2.89], [1.39, 2.76], [1.47, 2.64], [1.54, 2.52], [1.62, 2.4], [1.69, 2.27], [1.8, 2.13], [1.93, 1.94], [2.07, 1.76], [2.2, 1.56], [2.34, 1.38], [2.46, 1.22], [2.59, 1.03], [2.71, 0.85], [2.84, 0.66], [2.94, 0.57], [3.04, 0.5], [3.16, 0.46], [3.29, 0.42], [3.41, 0.38], [3.54, 0.35], [3.66, 0.32], [3.79, 0.3], [3.92, 0.28], [4.05, 0.26], [4.18, 0.24], [4.31, 0.21], [4.45, 0.19], [4.58, 0.17], [4.72, 0.15], [4.86, 0.13], [4.99, 0.11]], [[-0.47, 4.74], [-0.42, 4.63], [-0.37, 4.53], [-0.31, 4.42], [-0.26, 4.32], [-0.2, 4.22], [-0.15, 4.11], [-0.1, 4.01], [-0.01, 3.92], [0.09, 3.85], [0.2, 3.77], [0.34, 3.69], [0.5, 3.58], [0.63, 3.48], [0.75, 3.36], [0.87, 3.24], [0.99, 3.11], [1.15, 2.97], [1.3, 2.84], [1.42, 2.71], [1.51, 2.59], [1.58, 2.48], [1.65, 2.36], [1.72, 2.24], [1.83, 2.09], [1.96, 1.9], [2.1, 1.71], [2.24, 1.52], [2.37, 1.34], [2.49, 1.18], [2.62, 0.99], [2.75, 0.8], [2.87, 0.63], [2.97, 0.54], [3.08, 0.47], [3.2, 0.43], [3.32, 0.39], [3.45, 0.35], [3.57, 0.32], [3.7, 0.3], [3.84, 0.27], [3.97, 0.25], [4.1, 0.23], [4.23, 0.2], [4.36, 0.18], [4.49, 0.16], [4.63, 0.14], [4.77, 0.12], [4.91, 0.1], [5.05, 0.08]], [[-0.47, 4.74], [-0.42, 4.63], [-0.37, 4.53], [-0.31, 4.42], [-0.26, 4.32], [-0.21, 4.22], [-0.15, 4.11], [-0.1, 4.01], [-0.01, 3.92], [0.09, 3.85], [0.2, 3.77], [0.34, 3.68], [0.49, 3.58], [0.63, 3.48], [0.75, 3.36], [0.87, 3.24], [0.99, 3.11], [1.15, 2.97], [1.3, 2.84], [1.42, 2.71], [1.51, 2.59], [1.58, 2.48], [1.65, 2.36], [1.72, 2.23], [1.83, 2.09], [1.96, 1.9], [2.1, 1.71], [2.24, 1.52], [2.37, 1.34], [2.49, 1.18], [2.62, 0.99], [2.75, 0.8], [2.87, 0.63], [2.97, 0.54], [3.08, 0.47], [3.2, 0.43], [3.32, 0.39], [3.45, 0.35], [3.57, 0.32], [3.7, 0.29], [3.84, 0.27], [3.97, 0.25], [4.1, 0.23], [4.23, 0.2], [4.36, 0.18], [4.49, 0.16], [4.63, 0.14], [4.77, 0.12], [4.91, 0.09], [5.05, 0.07]], [[-0.47, 4.74], [-0.42, 4.63], [-0.37, 4.53], [-0.31, 4.42], [-0.26, 4.32], [-0.21, 4.22], [-0.15, 4.11], [-0.1, 4.01], [-0.01, 3.92], [0.09, 3.85], [0.2, 3.77], [0.34, 3.68], [0.49, 3.58], [0.63, 3.48], [0.75, 3.36], [0.87, 3.24], [0.99, 3.11], [1.15, 2.97], [1.3, 2.84], [1.42, 2.71], [1.51, 2.59], [1.58, 2.48], [1.65, 2.36], [1.72, 2.23], [1.83, 2.09], [1.96, 1.9], [2.1, 1.71], [2.24, 1.52], [2.37, 1.34], [2.49, 1.18], [2.62, 0.99], [2.75, 0.8], [2.87, 0.63], [2.97, 0.54], [3.08, 0.47], [3.2, 0.43], [3.32, 0.39], [3.45, 0.35], [3.57, 0.32], [3.7, 0.29], [3.84, 0.27], [3.97, 0.25], [4.1, 0.23], [4.23, 0.2], [4.36, 0.18], [4.49, 0.16], [4.63, 0.14], [4.77, 0.12], [4.91, 0.09], [5.05, 0.07]], [[-0.49, 4.75], [-0.44, 4.64], [-0.39, 4.54], [-0.34, 4.44], [-0.28, 4.33], [-0.23, 4.23], [-0.17, 4.12], [-0.12, 4.02], [-0.04, 3.93], [0.06, 3.85], [0.17, 3.78], [0.31, 3.7], [0.47, 3.59], [0.6, 3.49], [0.72, 3.38], [0.84, 3.25], [0.96, 3.13], [1.12, 2.99], [1.27, 2.85], [1.4, 2.72], [1.49, 2.6], [1.56, 2.49], [1.63, 2.37], [1.7, 2.25], [1.81, 2.1], [1.94, 1.91], [2.08, 1.72], [2.22, 1.53], [2.35, 1.35], [2.47, 1.19], [2.6, 1.0], [2.72, 0.81], [2.85, 0.63], [2.95, 0.55], [3.05, 0.48], [3.17, 0.44], [3.3, 0.4], [3.42, 0.36], [3.55, 0.33], [3.68, 0.3], [3.81, 0.28], [3.94, 0.25], [4.07, 0.23], [4.2, 0.21], [4.33, 0.19], [4.46, 0.16], [4.6, 0.14], [4.74, 0.12], [4.87, 0.1], [5.01, 0.08]], [[-0.49, 4.76], [-0.44, 4.65], [-0.39, 4.55], [-0.33, 4.44], [-0.28, 4.34], [-0.22, 4.23], [-0.17, 4.13], [-0.11, 4.03], [-0.03, 3.94], [0.07, 3.86], [0.18, 3.78], [0.32, 3.7], [0.47, 3.6], [0.61, 3.5], [0.73, 3.38], [0.84, 3.26], [0.97, 3.13], [1.13, 2.99], [1.28, 2.85], [1.4, 2.73], [1.49, 2.61], [1.56, 2.49], [1.63, 2.37], [1.71, 2.25], [1.81, 2.1], [1.95, 1.92], [2.08, 1.73], [2.22, 1.53], [2.35, 1.35], [2.48, 1.19], [2.6, 1.01], [2.73, 0.82], [2.85, 0.64], [2.95, 0.55], [3.06, 0.48], [3.18, 0.44], [3.3, 0.4], [3.43, 0.36], [3.55, 0.33], [3.68, 0.3], [3.81, 0.28], [3.94, 0.26], [4.07, 0.24], [4.2, 0.21], [4.33, 0.19], [4.47, 0.17], [4.6, 0.15], [4.74, 0.13], [4.88, 0.11], [5.02, 0.09]], [[-0.44, 4.69], [-0.38, 4.59], [-0.33, 4.48], [-0.28, 4.38], [-0.23, 4.28], [-0.17, 4.18], [-0.12, 4.07], [-0.06, 3.97], [0.02, 3.89], [0.12, 3.81], [0.24, 3.74], [0.39, 3.65], [0.54, 3.55], [0.67, 3.44], [0.79, 3.32], [0.91, 3.2], [1.03, 3.08], [1.19, 2.94], [1.34, 2.8], [1.45, 2.68], [1.54, 2.56], [1.61, 2.44], [1.68, 2.32], [1.75, 2.2], [1.86, 2.06], [2.0, 1.87], [2.13, 1.68], [2.27, 1.48], [2.4, 1.31], [2.53, 1.14], [2.66, 0.96], [2.78, 0.77], [2.91, 0.6], [3.01, 0.52], [3.12, 0.45], [3.24, 0.4], [3.36, 0.37], [3.49, 0.33], [3.62, 0.29], [3.75, 0.27], [3.89, 0.25], [4.02, 0.22], [4.15, 0.2], [4.29, 0.17], [4.42, 0.15], [4.55, 0.13], [4.69, 0.1], [4.83, 0.08], [4.97, 0.06], [5.12, 0.04]], [[-0.33, 4.5], [-0.28, 4.4], [-0.23, 4.3], [-0.18, 4.21], [-0.13, 4.11], [-0.08, 4.01], [-0.03, 3.91], [0.03, 3.82], [0.12, 3.74], [0.22, 3.67], [0.36, 3.6], [0.51, 3.5], [0.66, 3.4], [0.79, 3.29], [0.91, 3.17], [1.03, 3.05], [1.15, 2.93], [1.3, 2.79], [1.44, 2.66], [1.55, 2.55], [1.63, 2.43], [1.7, 2.32], [1.77, 2.2], [1.84, 2.08], [1.95, 1.93], [2.09, 1.74], [2.23, 1.55], [2.37, 1.35], [2.5, 1.17], [2.63, 1.01], [2.76, 0.82], [2.89, 0.63], [3.01, 0.5], [3.11, 0.42], [3.22, 0.35], [3.35, 0.31], [3.48, 0.26], [3.62, 0.22], [3.75, 0.19], [3.89, 0.17], [4.03, 0.14], [4.17, 0.11], [4.31, 0.08], [4.45, 0.06], [4.59, 0.03], [4.73, 0.0], [4.87, -0.02], [5.02, -0.05], [5.16, -0.07], [5.31, -0.1]], [[-0.51, 4.82], [-0.47, 4.7], [-0.42, 4.6], [-0.36, 4.49], [-0.31, 4.39], [-0.25, 4.28], [-0.2, 4.18], [-0.14, 4.07], [-0.08, 3.97], [0.02, 3.9], [0.13, 3.82], [0.25, 3.75], [0.4, 3.65], [0.54, 3.55], [0.65, 3.44], [0.77, 3.32], [0.89, 3.19], [1.06, 3.05], [1.21, 2.92], [1.35, 2.78], [1.44, 2.66], [1.51, 2.55], [1.58, 2.42], [1.66, 2.3], [1.77, 2.16], [1.9, 1.97], [2.04, 1.78], [2.18, 1.58], [2.31, 1.4], [2.44, 1.24], [2.56, 1.05], [2.69, 0.86], [2.81, 0.68], [2.92, 0.58], [3.02, 0.52], [3.14, 0.47], [3.26, 0.43], [3.38, 0.4], [3.51, 0.37], [3.64, 0.34], [3.77, 0.32], [3.9, 0.3], [4.03, 0.28], [4.16, 0.25], [4.28, 0.23], [4.42, 0.21], [4.55, 0.19], [4.69, 0.17], [4.82, 0.16], [4.96, 0.14]], [[-0.42, 4.69], [-0.37, 4.59], [-0.32, 4.48], [-0.27, 4.38], [-0.21, 4.28], [-0.16, 4.18], [-0.11, 4.07], [-0.06, 3.97], [0.02, 3.88], [0.12, 3.81], [0.22, 3.73], [0.36, 3.66], [0.51, 3.56], [0.65, 3.45], [0.76, 3.34], [0.88, 3.23], [1.0, 3.1], [1.16, 2.96], [1.31, 2.82], [1.43, 2.69], [1.52, 2.58], [1.59, 2.46], [1.67, 2.34], [1.74, 2.21], [1.85, 2.07], [1.98, 1.88], [2.12, 1.68], [2.26, 1.49], [2.39, 1.31], [2.52, 1.14], [2.65, 0.95], [2.78, 0.76], [2.9, 0.61], [3.0, 0.53], [3.1, 0.46], [3.23, 0.42], [3.35, 0.38], [3.48, 0.34], [3.61, 0.31], [3.75, 0.29], [3.88, 0.26], [4.01, 0.24], [4.14, 0.22], [4.28, 0.19], [4.41, 0.17], [4.55, 0.15], [4.69, 0.13], [4.83, 0.11], [4.97, 0.09], [5.11, 0.07]], [[-0.43, 4.74], [-0.39, 4.63], [-0.34, 4.53], [-0.28, 4.42], [-0.23, 4.32], [-0.18, 4.22], [-0.12, 4.11], [-0.07, 4.01], [-0.0, 3.92], [0.09, 3.84], [0.2, 3.77], [0.33, 3.69], [0.47, 3.6], [0.61, 3.49], [0.72, 3.39], [0.84, 3.27], [0.96, 3.14], [1.12, 3.0], [1.27, 2.86], [1.4, 2.73], [1.48, 2.61], [1.56, 2.49], [1.63, 2.37], [1.71, 2.25], [1.82, 2.1], [1.95, 1.91], [2.09, 1.72], [2.23, 1.52], [2.36, 1.33], [2.49, 1.17], [2.62, 0.98], [2.74, 0.79], [2.87, 0.62], [2.97, 0.54], [3.07, 0.47], [3.2, 0.42], [3.32, 0.39], [3.45, 0.35], [3.58, 0.32], [3.71, 0.3], [3.84, 0.27], [3.97, 0.25], [4.11, 0.23], [4.24, 0.2], [4.37, 0.18], [4.5, 0.16], [4.64, 0.14], [4.78, 0.12], [4.92, 0.09], [5.06, 0.07]], [[-0.47, 4.82], [-0.43, 4.71], [-0.37, 4.6], [-0.32, 4.5], [-0.27, 4.39], [-0.21, 4.29], [-0.16, 4.18], [-0.11, 4.08], [-0.04, 3.98], [0.05, 3.9], [0.16, 3.83], [0.28, 3.75], [0.42, 3.66], [0.56, 3.56], [0.68, 3.45], [0.79, 3.34], [0.91, 3.21], [1.07, 3.06], [1.22, 2.93], [1.36, 2.79], [1.44, 2.67], [1.52, 2.55], [1.59, 2.43], [1.67, 2.3], [1.78, 2.16], [1.92, 1.97], [2.05, 1.77], [2.19, 1.58], [2.33, 1.39], [2.45, 1.23], [2.58, 1.04], [2.7, 0.85], [2.83, 0.66], [2.93, 0.58], [3.04, 0.51], [3.16, 0.47], [3.28, 0.43], [3.4, 0.39], [3.53, 0.36], [3.66, 0.34], [3.79, 0.32], [3.92, 0.3], [4.05, 0.27], [4.18, 0.25], [4.31, 0.23], [4.45, 0.21], [4.58, 0.19], [4.72, 0.17], [4.86, 0.15], [5.0, 0.13]], [[-0.38, 4.91], [-0.33, 4.8], [-0.28, 4.69], [-0.23, 4.58], [-0.18, 4.48], [-0.13, 4.37], [-0.08, 4.26], [-0.03, 4.15], [0.03, 4.05], [0.13, 3.97], [0.23, 3.89], [0.35, 3.81], [0.49, 3.73], [0.63, 3.62], [0.74, 3.51], [0.85, 3.4], [0.97, 3.27], [1.13, 3.12], [1.28, 2.98], [1.41, 2.85], [1.5, 2.73], [1.57, 2.61], [1.65, 2.48], [1.73, 2.36], [1.84, 2.21], [1.97, 2.02], [2.11, 1.83], [2.25, 1.63], [2.39, 1.44], [2.52, 1.28], [2.65, 1.09], [2.78, 0.9], [2.91, 0.71], [3.01, 0.62], [3.12, 0.56], [3.24, 0.52], [3.37, 0.48], [3.5, 0.45], [3.63, 0.42], [3.77, 0.4], [3.9, 0.38], [4.04, 0.36], [4.17, 0.34], [4.31, 0.33], [4.44, 0.31], [4.58, 0.29], [4.72, 0.27], [4.86, 0.26], [5.01, 0.24], [5.15, 0.22]], [[-0.48, 4.83], [-0.44, 4.71], [-0.38, 4.61], [-0.33, 4.5], [-0.28, 4.39], [-0.22, 4.29], [-0.17, 4.18], [-0.12, 4.07], [-0.06, 3.97], [0.03, 3.89], [0.13, 3.81], [0.25, 3.74], [0.39, 3.65], [0.53, 3.54], [0.64, 3.44], [0.76, 3.33], [0.88, 3.2], [1.04, 3.05], [1.2, 2.91], [1.34, 2.78], [1.43, 2.66], [1.5, 2.54], [1.58, 2.41], [1.67, 2.29], [1.78, 2.14], [1.91, 1.94], [2.05, 1.75], [2.19, 1.55], [2.33, 1.37], [2.46, 1.2], [2.59, 1.01], [2.72, 0.82], [2.85, 0.65], [2.95, 0.57], [3.05, 0.5], [3.18, 0.46], [3.3, 0.42], [3.43, 0.39], [3.57, 0.36], [3.7, 0.34], [3.83, 0.32], [3.96, 0.3], [4.09, 0.28], [4.23, 0.26], [4.36, 0.24], [4.49, 0.22], [4.63, 0.2], [4.77, 0.18], [4.91, 0.16], [5.05, 0.14]], [[-0.42, 4.73], [-0.37, 4.62], [-0.32, 4.51], [-0.27, 4.41], [-0.21, 4.31], [-0.16, 4.2], [-0.11, 4.1], [-0.06, 4.0], [-0.0, 3.9], [0.09, 3.82], [0.2, 3.75], [0.32, 3.67], [0.48, 3.57], [0.61, 3.46], [0.73, 3.36], [0.85, 3.24], [0.97, 3.11], [1.13, 2.97], [1.28, 2.83], [1.41, 2.7], [1.5, 2.58], [1.57, 2.46], [1.65, 2.34], [1.72, 2.21], [1.83, 2.06], [1.97, 1.87], [2.11, 1.67], [2.26, 1.47], [2.39, 1.29], [2.52, 1.12], [2.65, 0.93], [2.78, 0.74], [2.9, 0.59], [3.01, 0.51], [3.12, 0.45], [3.24, 0.4], [3.37, 0.37], [3.5, 0.33], [3.64, 0.31], [3.78, 0.29], [3.91, 0.26], [4.05, 0.24], [4.18, 0.22], [4.32, 0.2], [4.45, 0.17], [4.59, 0.15], [4.73, 0.13], [4.87, 0.11], [5.02, 0.09], [5.16, 0.07]], [[-0.44, 4.76], [-0.39, 4.65], [-0.34, 4.55], [-0.29, 4.44], [-0.24, 4.34], [-0.18, 4.23], [-0.13, 4.13], [-0.08, 4.02], [-0.02, 3.92], [0.07, 3.84], [0.18, 3.77], [0.3, 3.69], [0.45, 3.59], [0.58, 3.49], [0.7, 3.39], [0.82, 3.27], [0.94, 3.14], [1.1, 2.99], [1.25, 2.86], [1.38, 2.73], [1.47, 2.6], [1.55, 2.48], [1.62, 2.36], [1.7, 2.24], [1.81, 2.09], [1.95, 1.89], [2.09, 1.7], [2.23, 1.5], [2.37, 1.31], [2.5, 1.15], [2.63, 0.95], [2.76, 0.76], [2.88, 0.61], [2.99, 0.53], [3.09, 0.46], [3.22, 0.42], [3.35, 0.38], [3.48, 0.35], [3.61, 0.33], [3.75, 0.3], [3.88, 0.28], [4.02, 0.26], [4.15, 0.24], [4.28, 0.21], [4.42, 0.19], [4.55, 0.17], [4.7, 0.15], [4.84, 0.13], [4.98, 0.11], [5.12, 0.09]], [[-0.44, 4.76], [-0.39, 4.65], [-0.34, 4.55], [-0.29, 4.44], [-0.24, 4.34], [-0.18, 4.23], [-0.13, 4.13], [-0.08, 4.02], [-0.02, 3.92], [0.07, 3.84], [0.18, 3.77], [0.3, 3.69], [0.45, 3.59], [0.58, 3.49], [0.7, 3.39], [0.82, 3.27], [0.94, 3.14], [1.1, 2.99], [1.25, 2.86], [1.38, 2.73], [1.47, 2.6], [1.55, 2.48], [1.62, 2.36], [1.7, 2.24], [1.81, 2.09], [1.95, 1.89], [2.09, 1.7], [2.23, 1.5], [2.37, 1.31], [2.5, 1.15], [2.63, 0.95], [2.76, 0.76], [2.88, 0.61], [2.99, 0.53], [3.09, 0.46], [3.22, 0.42], [3.35, 0.38], [3.48, 0.35], [3.61, 0.33], [3.75, 0.3], [3.88, 0.28], [4.02, 0.26], [4.15, 0.24], [4.28, 0.21], [4.42, 0.19], [4.55, 0.17], [4.7, 0.15], [4.84, 0.13], [4.98, 0.11], [5.12, 0.09]], [[-0.44, 4.76], [-0.39, 4.65], [-0.34, 4.55], [-0.29, 4.44], [-0.24, 4.34], [-0.18, 4.23], [-0.13, 4.13], [-0.08, 4.02], [-0.02, 3.92], [0.07, 3.84], [0.18, 3.77], [0.3, 3.69], [0.45, 3.59], [0.58, 3.49], [0.7, 3.39], [0.82, 3.27], [0.94, 3.14], [1.1, 2.99], [1.25, 2.86], [1.38, 2.73], [1.47, 2.6], [1.55, 2.48], [1.62, 2.36], [1.7, 2.24], [1.81, 2.09], [1.95, 1.89], [2.09, 1.7], [2.23, 1.5], [2.37, 1.31], [2.5, 1.15], [2.63, 0.95], [2.76, 0.76], [2.88, 0.61], [2.99, 0.53], [3.09, 0.46], [3.22, 0.42], [3.35, 0.38], [3.48, 0.35], [3.61, 0.33], [3.75, 0.3], [3.88, 0.28], [4.02, 0.26], [4.15, 0.24], [4.28, 0.21], [4.42, 0.19], [4.55, 0.17], [4.7, 0.15], [4.84, 0.13], [4.98, 0.11], [5.12, 0.09]], [[-0.44, 4.76], [-0.39, 4.65], [-0.34, 4.55], [-0.29, 4.44], [-0.24, 4.34], [-0.18, 4.23], [-0.13, 4.13], [-0.08, 4.02], [-0.02, 3.92], [0.07, 3.84], [0.18, 3.77], [0.3, 3.69], [0.45, 3.59], [0.58, 3.49], [0.7, 3.39], [0.82, 3.27], [0.94, 3.14], [1.1, 2.99], [1.25, 2.86], [1.38, 2.73], [1.47, 2.6], [1.55, 2.48], [1.62, 2.36], [1.7, 2.24], [1.81, 2.09], [1.95, 1.89], [2.09, 1.7], [2.23, 1.5], [2.37, 1.31], [2.5, 1.15], [2.63, 0.95], [2.76, 0.76], [2.88, 0.61], [2.99, 0.53], [3.09, 0.46], [3.22, 0.42], [3.35, 0.38], [3.48, 0.35], [3.61, 0.33], [3.75, 0.3], [3.88, 0.28], [4.02, 0.26], [4.15, 0.24], [4.28, 0.21], [4.42, 0.19], [4.55, 0.17], [4.7, 0.15], [4.84, 0.13], [4.98, 0.11], [5.12, 0.09]], [[-0.44, 4.76], [-0.39, 4.65], [-0.34, 4.55], [-0.29, 4.44], [-0.24, 4.34], [-0.18, 4.23], [-0.13, 4.13], [-0.08, 4.02], [-0.02, 3.92], [0.07, 3.84], [0.18, 3.77], [0.3, 3.69], [0.45, 3.59], [0.58, 3.49], [0.7, 3.39], [0.82, 3.27], [0.94, 3.14], [1.1, 2.99], [1.25, 2.86], [1.38, 2.73], [1.47, 2.6], [1.55, 2.48], [1.62, 2.36], [1.7, 2.24], [1.81, 2.09], [1.95, 1.89], [2.09, 1.7], [2.23, 1.5], [2.37, 1.31], [2.5, 1.15], [2.63, 0.95], [2.76, 0.76], [2.88, 0.61], [2.99, 0.53], [3.09, 0.46], [3.22, 0.42], [3.35, 0.38], [3.48, 0.35], [3.61, 0.33], [3.75, 0.3], [3.88, 0.28], [4.02, 0.26], [4.15, 0.24], [4.28, 0.21], [4.42, 0.19], [4.55, 0.17], [4.7, 0.15], [4.84, 0.13], [4.98, 0.11], [5.12, 0.09]], [[-0.44, 4.76], [-0.39, 4.65], [-0.34, 4.55], [-0.29, 4.44], [-0.24, 4.34], [-0.18, 4.23], [-0.13, 4.13], [-0.08, 4.02], [-0.02, 3.92], [0.07, 3.84], [0.18, 3.77], [0.3, 3.69], [0.45, 3.59], [0.58, 3.49], [0.7, 3.39], [0.82, 3.27], [0.94, 3.14], [1.1, 2.99], [1.25, 2.86], [1.38, 2.73], [1.47, 2.6], [1.55, 2.48], [1.62, 2.36], [1.7, 2.24], [1.81, 2.09], [1.95, 1.89], [2.09, 1.7], [2.23, 1.5], [2.37, 1.31], [2.5, 1.15], [2.63, 0.95], [2.76, 0.76], [2.88, 0.61], [2.99, 0.53], [3.09, 0.46], [3.22, 0.42], [3.35, 0.38], [3.48, 0.35], [3.61, 0.33], [3.75, 0.3], [3.88, 0.28], [4.02, 0.26], [4.15, 0.24], [4.28, 0.21], [4.42, 0.19], [4.55, 0.17], [4.7, 0.15], [4.84, 0.13], [4.98, 0.11], [5.12, 0.09]], [[-0.33, 4.59], [-0.29, 4.49], [-0.24, 4.39], [-0.19, 4.29], [-0.14, 4.19], [-0.09, 4.09], [-0.04, 3.99], [0.01, 3.89], [0.08, 3.79], [0.18, 3.72], [0.29, 3.65], [0.43, 3.56], [0.58, 3.46], [0.71, 3.36], [0.83, 3.25], [0.95, 3.13], [1.07, 3.0], [1.22, 2.86], [1.36, 2.73], [1.47, 2.61], [1.56, 2.49], [1.63, 2.37], [1.7, 2.25], [1.77, 2.13], [1.88, 1.98], [2.02, 1.79], [2.16, 1.59], [2.3, 1.39], [2.44, 1.21], [2.56, 1.05], [2.69, 0.86], [2.82, 0.66], [2.93, 0.56], [3.03, 0.48], [3.14, 0.41], [3.27, 0.37], [3.4, 0.33], [3.54, 0.3], [3.67, 0.28], [3.81, 0.26], [3.95, 0.23], [4.08, 0.21], [4.22, 0.19], [4.35, 0.16], [4.49, 0.14], [4.63, 0.11], [4.77, 0.09], [4.91, 0.07], [5.06, 0.05], [5.2, 0.03]], [[-0.41, 4.7], [-0.36, 4.59], [-0.31, 4.49], [-0.26, 4.38], [-0.21, 4.28], [-0.15, 4.18], [-0.1, 4.07], [-0.05, 3.97], [0.01, 3.87], [0.11, 3.79], [0.22, 3.72], [0.34, 3.64], [0.5, 3.54], [0.63, 3.43], [0.75, 3.32], [0.87, 3.2], [0.99, 3.07], [1.15, 2.93], [1.3, 2.79], [1.42, 2.67], [1.51, 2.55], [1.58, 2.43], [1.65, 2.31], [1.72, 2.18], [1.83, 2.03], [1.97, 1.84], [2.11, 1.65], [2.25, 1.45], [2.38, 1.27], [2.51, 1.1], [2.64, 0.91], [2.76, 0.72], [2.88, 0.6], [2.98, 0.52], [3.08, 0.45], [3.21, 0.41], [3.34, 0.38], [3.47, 0.34], [3.6, 0.32], [3.73, 0.3], [3.87, 0.28], [4.0, 0.26], [4.13, 0.23], [4.27, 0.21], [4.4, 0.19], [4.53, 0.17], [4.67, 0.15], [4.81, 0.13], [4.95, 0.11], [5.09, 0.09]], [[-0.47, 4.86], [-0.43, 4.74], [-0.38, 4.63], [-0.32, 4.53], [-0.27, 4.42], [-0.22, 4.31], [-0.16, 4.2], [-0.11, 4.09], [-0.05, 3.99], [0.04, 3.91], [0.14, 3.83], [0.26, 3.75], [0.4, 3.66], [0.54, 3.55], [0.66, 3.44], [0.78, 3.33], [0.9, 3.2], [1.06, 3.05], [1.21, 2.91], [1.35, 2.78], [1.44, 2.66], [1.51, 2.54], [1.58, 2.42], [1.66, 2.29], [1.77, 2.14], [1.91, 1.95], [2.04, 1.76], [2.18, 1.56], [2.31, 1.38], [2.44, 1.22], [2.57, 1.03], [2.69, 0.84], [2.81, 0.68], [2.91, 0.6], [3.02, 0.54], [3.14, 0.5], [3.26, 0.46], [3.39, 0.43], [3.52, 0.41], [3.65, 0.39], [3.78, 0.37], [3.91, 0.35], [4.04, 0.33], [4.17, 0.31], [4.3, 0.29], [4.43, 0.28], [4.56, 0.26], [4.7, 0.24], [4.84, 0.23], [4.98, 0.21]], [[-0.33, 4.61], [-0.28, 4.51], [-0.23, 4.41], [-0.18, 4.3], [-0.13, 4.2], [-0.08, 4.1], [-0.03, 4.0], [0.02, 3.9], [0.09, 3.81], [0.2, 3.73], [0.31, 3.66], [0.45, 3.56], [0.61, 3.46], [0.74, 3.36], [0.86, 3.24], [0.98, 3.12], [1.1, 2.99], [1.25, 2.85], [1.39, 2.72], [1.5, 2.6], [1.58, 2.48], [1.65, 2.36], [1.72, 2.24], [1.78, 2.12], [1.89, 1.97], [2.03, 1.78], [2.16, 1.59], [2.3, 1.39], [2.43, 1.22], [2.56, 1.05], [2.68, 0.86], [2.81, 0.67], [2.91, 0.58], [3.01, 0.5], [3.12, 0.43], [3.25, 0.4], [3.38, 0.36], [3.51, 0.33], [3.65, 0.31], [3.78, 0.29], [3.91, 0.27], [4.05, 0.24], [4.18, 0.22], [4.32, 0.2], [4.45, 0.18], [4.59, 0.15], [4.73, 0.13], [4.87, 0.11], [5.01, 0.09], [5.15, 0.07]], [[-0.42, 4.77], [-0.37, 4.66], [-0.32, 4.55], [-0.27, 4.44], [-0.21, 4.34], [-0.16, 4.23], [-0.11, 4.12], [-0.06, 4.02], [0.0, 3.92], [0.1, 3.84], [0.21, 3.76], [0.33, 3.68], [0.49, 3.58], [0.62, 3.47], [0.74, 3.37], [0.86, 3.25], [0.98, 3.12], [1.14, 2.97], [1.29, 2.83], [1.4, 2.71], [1.49, 2.59], [1.56, 2.47], [1.64, 2.35], [1.7, 2.23], [1.81, 2.08], [1.95, 1.89], [2.08, 1.7], [2.22, 1.5], [2.35, 1.32], [2.47, 1.16], [2.6, 0.97], [2.72, 0.78], [2.83, 0.65], [2.93, 0.57], [3.04, 0.51], [3.16, 0.47], [3.28, 0.44], [3.41, 0.41], [3.54, 0.39], [3.67, 0.37], [3.8, 0.35], [3.93, 0.33], [4.06, 0.31], [4.19, 0.29], [4.32, 0.27], [4.45, 0.25], [4.59, 0.23], [4.73, 0.22], [4.87, 0.2], [5.0, 0.18]], [[-0.42, 4.77], [-0.37, 4.66], [-0.32, 4.55], [-0.27, 4.44], [-0.21, 4.34], [-0.16, 4.23], [-0.11, 4.12], [-0.06, 4.02], [0.0, 3.92], [0.1, 3.84], [0.21, 3.76], [0.33, 3.68], [0.49, 3.58], [0.62, 3.47], [0.74, 3.37], [0.86, 3.25], [0.98, 3.12], [1.14, 2.97], [1.29, 2.83], [1.4, 2.71], [1.49, 2.59], [1.56, 2.47], [1.64, 2.35], [1.7, 2.23], [1.81, 2.08], [1.95, 1.89], [2.08, 1.7], [2.22, 1.5], [2.35, 1.32], [2.47, 1.16], [2.6, 0.97], [2.72, 0.78], [2.83, 0.65], [2.93, 0.57], [3.04, 0.51], [3.16, 0.47], [3.28, 0.44], [3.41, 0.41], [3.54, 0.39], [3.67, 0.37], [3.8, 0.35], [3.93, 0.33], [4.06, 0.31], [4.19, 0.29], [4.32, 0.27], [4.45, 0.25], [4.59, 0.23], [4.73, 0.22], [4.87, 0.2], [5.0, 0.18]], [[-0.42, 4.77], [-0.37, 4.65], [-0.32, 4.55], [-0.27, 4.44], [-0.21, 4.34], [-0.16, 4.23], [-0.11, 4.12], [-0.06, 4.02], [0.0, 3.92], [0.1, 3.84], [0.21, 3.76], [0.33, 3.68], [0.49, 3.58], [0.62, 3.47], [0.74, 3.37], [0.86, 3.25], [0.98, 3.11], [1.14, 2.97], [1.29, 2.83], [1.4, 2.71], [1.49, 2.59], [1.56, 2.47], [1.64, 2.35], [1.7, 2.23], [1.81, 2.08], [1.95, 1.89], [2.08, 1.7], [2.22, 1.5], [2.35, 1.32], [2.47, 1.16], [2.6, 0.97], [2.72, 0.78], [2.83, 0.65], [2.93, 0.57], [3.04, 0.51], [3.16, 0.47], [3.28, 0.44], [3.41, 0.41], [3.54, 0.39], [3.67, 0.37], [3.8, 0.35], [3.93, 0.33], [4.06, 0.31], [4.19, 0.29], [4.32, 0.27], [4.45, 0.25], [4.59, 0.23], [4.73, 0.22], [4.87, 0.2], [5.0, 0.18]], [[-0.36, 4.7], [-0.31, 4.59], [-0.26, 4.49], [-0.21, 4.38], [-0.16, 4.28], [-0.11, 4.17], [-0.06, 4.07], [-0.01, 3.96], [0.06, 3.87], [0.16, 3.79], [0.27, 3.72], [0.4, 3.63], [0.56, 3.53], [0.69, 3.42], [0.81, 3.31], [0.92, 3.19], [1.05, 3.06], [1.2, 2.92], [1.35, 2.78], [1.45, 2.66], [1.54, 2.54], [1.61, 2.42], [1.68, 2.3], [1.75, 2.18], [1.86, 2.03], [1.99, 1.84], [2.13, 1.65], [2.26, 1.45], [2.4, 1.28], [2.52, 1.11], [2.65, 0.92], [2.77, 0.73], [2.88, 0.62], [2.98, 0.54], [3.09, 0.48], [3.21, 0.44], [3.34, 0.4], [3.47, 0.38], [3.6, 0.36], [3.74, 0.34], [3.87, 0.31], [4.0, 0.29], [4.14, 0.27], [4.27, 0.25], [4.4, 0.23], [4.54, 0.21], [4.68, 0.19], [4.82, 0.17], [4.96, 0.16], [5.1, 0.14]], [[-0.39, 4.72], [-0.35, 4.61], [-0.29, 4.5], [-0.24, 4.4], [-0.19, 4.29], [-0.14, 4.19], [-0.09, 4.08], [-0.03, 3.98], [0.03, 3.88], [0.13, 3.8], [0.24, 3.73], [0.37, 3.64], [0.52, 3.54], [0.66, 3.43], [0.78, 3.32], [0.9, 3.2], [1.02, 3.07], [1.18, 2.93], [1.33, 2.79], [1.44, 2.67], [1.53, 2.55], [1.6, 2.43], [1.67, 2.31], [1.74, 2.19], [1.85, 2.04], [1.99, 1.85], [2.13, 1.65], [2.27, 1.45], [2.4, 1.27], [2.53, 1.11], [2.65, 0.92], [2.78, 0.73], [2.9, 0.61], [3.0, 0.53], [3.11, 0.46], [3.23, 0.42], [3.36, 0.39], [3.49, 0.36], [3.63, 0.34], [3.76, 0.31], [3.9, 0.29], [4.03, 0.27], [4.16, 0.25], [4.3, 0.23], [4.43, 0.2], [4.57, 0.18], [4.71, 0.16], [4.85, 0.14], [4.99, 0.13], [5.13, 0.11]], [[-0.44, 4.82], [-0.4, 4.71], [-0.35, 4.6], [-0.29, 4.49], [-0.24, 4.38], [-0.19, 4.28], [-0.13, 4.17], [-0.08, 4.06], [-0.02, 3.96], [0.07, 3.88], [0.18, 3.8], [0.3, 3.72], [0.45, 3.62], [0.59, 3.51], [0.71, 3.41], [0.83, 3.29], [0.95, 3.16], [1.11, 3.01], [1.26, 2.87], [1.39, 2.74], [1.47, 2.62], [1.55, 2.5], [1.62, 2.38], [1.7, 2.26], [1.8, 2.11], [1.94, 1.92], [2.08, 1.73], [2.22, 1.53], [2.35, 1.35], [2.47, 1.19], [2.6, 1.0], [2.73, 0.81], [2.85, 0.66], [2.95, 0.58], [3.05, 0.52], [3.18, 0.48], [3.3, 0.45], [3.43, 0.42], [3.56, 0.4], [3.7, 0.38], [3.83, 0.36], [3.96, 0.34], [4.09, 0.32], [4.22, 0.3], [4.35, 0.28], [4.49, 0.26], [4.63, 0.24], [4.77, 0.23], [4.9, 0.21], [5.04, 0.19]], [[-0.45, 4.79], [-0.41, 4.67], [-0.36, 4.57], [-0.3, 4.46], [-0.25, 4.35], [-0.2, 4.25], [-0.14, 4.14], [-0.09, 4.03], [-0.03, 3.93], [0.06, 3.85], [0.17, 3.77], [0.29, 3.69], [0.44, 3.59], [0.58, 3.49], [0.7, 3.38], [0.82, 3.26], [0.94, 3.13], [1.1, 2.99], [1.25, 2.85], [1.38, 2.72], [1.47, 2.6], [1.54, 2.48], [1.61, 2.36], [1.69, 2.24], [1.79, 2.09], [1.93, 1.9], [2.07, 1.71], [2.21, 1.51], [2.34, 1.33], [2.47, 1.16], [2.59, 0.97], [2.72, 0.78], [2.84, 0.64], [2.94, 0.57], [3.04, 0.5], [3.17, 0.46], [3.29, 0.43], [3.42, 0.4], [3.55, 0.38], [3.68, 0.36], [3.81, 0.34], [3.95, 0.32], [4.08, 0.3], [4.21, 0.28], [4.34, 0.26], [4.47, 0.24], [4.61, 0.22], [4.75, 0.2], [4.89, 0.18], [5.03, 0.17]], [[-0.42, 4.73], [-0.37, 4.61], [-0.32, 4.51], [-0.27, 4.4], [-0.21, 4.3], [-0.16, 4.19], [-0.11, 4.09], [-0.06, 3.98], [0.0, 3.88], [0.1, 3.81], [0.21, 3.73], [0.34, 3.65], [0.49, 3.54], [0.63, 3.44], [0.75, 3.33], [0.87, 3.21], [0.99, 3.08], [1.15, 2.94], [1.3, 2.8], [1.42, 2.68], [1.51, 2.55], [1.58, 2.44], [1.65, 2.31], [1.72, 2.19], [1.83, 2.04], [1.97, 1.85], [2.11, 1.66], [2.25, 1.46], [2.38, 1.28], [2.51, 1.11], [2.64, 0.92], [2.77, 0.73], [2.88, 0.61], [2.98, 0.53], [3.09, 0.46], [3.21, 0.43], [3.34, 0.39], [3.47, 0.36], [3.61, 0.34], [3.74, 0.32], [3.87, 0.3], [4.01, 0.27], [4.14, 0.25], [4.27, 0.23], [4.41, 0.21], [4.54, 0.19], [4.68, 0.17], [4.82, 0.15], [4.96, 0.13], [5.11, 0.11]], [[-0.43, 4.79], [-0.38, 4.67], [-0.33, 4.56], [-0.28, 4.46], [-0.23, 4.35], [-0.17, 4.24], [-0.12, 4.14], [-0.07, 4.03], [-0.01, 3.93], [0.09, 3.85], [0.2, 3.77], [0.32, 3.69], [0.48, 3.59], [0.62, 3.48], [0.73, 3.38], [0.85, 3.25], [0.97, 3.12], [1.14, 2.98], [1.29, 2.84], [1.4, 2.72], [1.49, 2.59], [1.57, 2.47], [1.64, 2.35], [1.71, 2.23], [1.82, 2.08], [1.96, 1.89], [2.1, 1.7], [2.24, 1.5], [2.37, 1.32], [2.5, 1.16], [2.62, 0.97], [2.75, 0.77], [2.87, 0.64], [2.97, 0.56], [3.08, 0.5], [3.2, 0.46], [3.33, 0.42], [3.46, 0.39], [3.59, 0.37], [3.72, 0.35], [3.86, 0.33], [3.99, 0.31], [4.12, 0.29], [4.26, 0.27], [4.39, 0.25], [4.52, 0.23], [4.66, 0.21], [4.8, 0.2], [4.94, 0.18], [5.08, 0.16]], [[-0.45, 4.82], [-0.41, 4.7], [-0.36, 4.59], [-0.3, 4.48], [-0.25, 4.38], [-0.19, 4.27], [-0.14, 4.16], [-0.09, 4.05], [-0.03, 3.95], [0.06, 3.87], [0.17, 3.79], [0.3, 3.71], [0.45, 3.61], [0.59, 3.51], [0.71, 3.4], [0.83, 3.28], [0.95, 3.15], [1.11, 3.0], [1.26, 2.87], [1.38, 2.74], [1.47, 2.62], [1.55, 2.5], [1.62, 2.37], [1.69, 2.25], [1.8, 2.1], [1.94, 1.91], [2.08, 1.72], [2.22, 1.52], [2.35, 1.34], [2.48, 1.18], [2.6, 0.99], [2.73, 0.8], [2.85, 0.66], [2.95, 0.58], [3.05, 0.52], [3.18, 0.48], [3.3, 0.44], [3.43, 0.41], [3.56, 0.39], [3.7, 0.37], [3.83, 0.35], [3.96, 0.33], [4.09, 0.31], [4.22, 0.29], [4.36, 0.27], [4.49, 0.26], [4.63, 0.24], [4.77, 0.22], [4.91, 0.2], [5.05, 0.19]], [[-0.45, 4.8], [-0.41, 4.69], [-0.35, 4.58], [-0.3, 4.47], [-0.25, 4.36], [-0.19, 4.26], [-0.14, 4.15], [-0.09, 4.04], [-0.03, 3.94], [0.07, 3.86], [0.18, 3.78], [0.3, 3.7], [0.45, 3.6], [0.59, 3.49], [0.71, 3.39], [0.83, 3.27], [0.95, 3.14], [1.12, 2.99], [1.26, 2.86], [1.39, 2.73], [1.48, 2.61], [1.55, 2.49], [1.62, 2.36], [1.7, 2.24], [1.81, 2.09], [1.94, 1.9], [2.08, 1.71], [2.22, 1.51], [2.35, 1.33], [2.48, 1.17], [2.61, 0.98], [2.73, 0.79], [2.85, 0.65], [2.95, 0.57], [3.06, 0.51], [3.18, 0.47], [3.31, 0.43], [3.43, 0.4], [3.57, 0.38], [3.7, 0.36], [3.83, 0.34], [3.96, 0.32], [4.1, 0.3], [4.23, 0.28], [4.36, 0.26], [4.5, 0.25], [4.63, 0.23], [4.77, 0.21], [4.91, 0.19], [5.05, 0.18]], [[-0.45, 4.79], [-0.4, 4.67], [-0.35, 4.56], [-0.3, 4.46], [-0.24, 4.35], [-0.19, 4.24], [-0.14, 4.14], [-0.08, 4.03], [-0.03, 3.93], [0.07, 3.85], [0.18, 3.77], [0.3, 3.69], [0.46, 3.59], [0.6, 3.48], [0.71, 3.38], [0.83, 3.26], [0.96, 3.13], [1.12, 2.98], [1.27, 2.84], [1.39, 2.72], [1.48, 2.6], [1.55, 2.48], [1.63, 2.35], [1.7, 2.23], [1.81, 2.08], [1.94, 1.89], [2.08, 1.7], [2.22, 1.5], [2.36, 1.32], [2.48, 1.16], [2.61, 0.97], [2.74, 0.78], [2.85, 0.64], [2.95, 0.56], [3.06, 0.5], [3.18, 0.46], [3.31, 0.42], [3.44, 0.4], [3.57, 0.38], [3.7, 0.36], [3.84, 0.34], [3.97, 0.32], [4.1, 0.3], [4.23, 0.27], [4.37, 0.25], [4.5, 0.23], [4.64, 0.22], [4.78, 0.2], [4.92, 0.18], [5.06, 0.16]], [[-0.45, 4.81], [-0.41, 4.69], [-0.36, 4.59], [-0.3, 4.48], [-0.25, 4.37], [-0.2, 4.26], [-0.14, 4.16], [-0.09, 4.05], [-0.03, 3.95], [0.06, 3.87], [0.17, 3.79], [0.29, 3.71], [0.45, 3.61], [0.59, 3.5], [0.7, 3.4], [0.82, 3.28], [0.95, 3.15], [1.11, 3.0], [1.26, 2.86], [1.38, 2.74], [1.47, 2.61], [1.54, 2.49], [1.62, 2.37], [1.69, 2.25], [1.8, 2.1], [1.94, 1.91], [2.07, 1.72], [2.21, 1.52], [2.35, 1.34], [2.47, 1.18], [2.6, 0.99], [2.73, 0.8], [2.84, 0.66], [2.94, 0.58], [3.05, 0.51], [3.17, 0.48], [3.3, 0.44], [3.43, 0.41], [3.56, 0.39], [3.69, 0.37], [3.82, 0.35], [3.96, 0.33], [4.09, 0.31], [4.22, 0.29], [4.35, 0.27], [4.48, 0.25], [4.62, 0.24], [4.76, 0.22], [4.9, 0.2], [5.04, 0.19]], [[-0.45, 4.8], [-0.41, 4.69], [-0.36, 4.58], [-0.31, 4.47], [-0.25, 4.37], [-0.2, 4.26], [-0.14, 4.15], [-0.09, 4.05], [-0.03, 3.94], [0.06, 3.86], [0.17, 3.78], [0.29, 3.71], [0.44, 3.6], [0.59, 3.5], [0.7, 3.39], [0.82, 3.27], [0.94, 3.14], [1.11, 3.0], [1.26, 2.86], [1.38, 2.73], [1.47, 2.61], [1.54, 2.49], [1.62, 2.37], [1.69, 2.25], [1.8, 2.1], [1.94, 1.91], [2.07, 1.72], [2.21, 1.52], [2.34, 1.34], [2.47, 1.18], [2.6, 0.99], [2.73, 0.8], [2.84, 0.65], [2.94, 0.58], [3.05, 0.51], [3.17, 0.47], [3.3, 0.44], [3.43, 0.41], [3.56, 0.39], [3.69, 0.37], [3.82, 0.35], [3.95, 0.33], [4.09, 0.31], [4.22, 0.29], [4.35, 0.27], [4.48, 0.25], [4.62, 0.24], [4.76, 0.22], [4.9, 0.2], [5.04, 0.18]], [[-0.54, 4.91], [-0.5, 4.79], [-0.45, 4.67], [-0.39, 4.57], [-0.34, 4.46], [-0.28, 4.35], [-0.23, 4.24], [-0.17, 4.13], [-0.12, 4.02], [-0.03, 3.93], [0.07, 3.85], [0.18, 3.77], [0.32, 3.68], [0.46, 3.58], [0.58, 3.47], [0.7, 3.36], [0.82, 3.24], [0.98, 3.09], [1.14, 2.95], [1.28, 2.82], [1.37, 2.7], [1.44, 2.58], [1.52, 2.45], [1.6, 2.33], [1.71, 2.18], [1.84, 1.99], [1.98, 1.8], [2.11, 1.61], [2.25, 1.43], [2.37, 1.27], [2.5, 1.08], [2.62, 0.89], [2.75, 0.72], [2.85, 0.64], [2.95, 0.57], [3.07, 0.54], [3.19, 0.5], [3.31, 0.47], [3.44, 0.45], [3.57, 0.43], [3.69, 0.41], [3.82, 0.4], [3.95, 0.38], [4.08, 0.36], [4.2, 0.34], [4.33, 0.33], [4.47, 0.31], [4.6, 0.3], [4.74, 0.28], [4.87, 0.27]], [[-0.39, 4.74], [-0.35, 4.63], [-0.3, 4.52], [-0.25, 4.42], [-0.2, 4.31], [-0.15, 4.21], [-0.1, 4.11], [-0.05, 4.0], [0.01, 3.9], [0.09, 3.82], [0.2, 3.75], [0.31, 3.67], [0.44, 3.59], [0.58, 3.49], [0.69, 3.39], [0.8, 3.29], [0.92, 3.17], [1.07, 3.03], [1.22, 2.89], [1.34, 2.77], [1.42, 2.66], [1.49, 2.54], [1.56, 2.42], [1.63, 2.3], [1.73, 2.16], [1.86, 1.98], [1.99, 1.79], [2.13, 1.61], [2.25, 1.44], [2.38, 1.28], [2.5, 1.1], [2.62, 0.92], [2.74, 0.75], [2.83, 0.68], [2.93, 0.62], [3.05, 0.58], [3.17, 0.55], [3.29, 0.52], [3.41, 0.5], [3.54, 0.48], [3.67, 0.47], [3.79, 0.46], [3.92, 0.44], [4.05, 0.43], [4.17, 0.41], [4.3, 0.4], [4.43, 0.38], [4.57, 0.37], [4.7, 0.36], [4.83, 0.35]], [[-0.3, 4.6], [-0.26, 4.5], [-0.21, 4.4], [-0.16, 4.3], [-0.11, 4.2], [-0.06, 4.1], [-0.02, 4.0], [0.03, 3.9], [0.09, 3.8], [0.18, 3.73], [0.29, 3.66], [0.41, 3.59], [0.55, 3.5], [0.68, 3.4], [0.79, 3.3], [0.9, 3.19], [1.02, 3.07], [1.17, 2.93], [1.31, 2.81], [1.41, 2.69], [1.5, 2.58], [1.57, 2.46], [1.63, 2.34], [1.7, 2.23], [1.8, 2.09], [1.93, 1.9], [2.06, 1.72], [2.2, 1.54], [2.33, 1.37], [2.45, 1.21], [2.57, 1.03], [2.69, 0.84], [2.81, 0.7], [2.9, 0.63], [3.01, 0.57], [3.13, 0.53], [3.25, 0.5], [3.38, 0.47], [3.51, 0.45], [3.64, 0.44], [3.77, 0.42], [3.9, 0.4], [4.03, 0.39], [4.16, 0.37], [4.28, 0.35], [4.42, 0.34], [4.55, 0.32], [4.69, 0.31], [4.82, 0.29], [4.96, 0.28]], [[-0.32, 4.62], [-0.28, 4.51], [-0.23, 4.41], [-0.18, 4.31], [-0.13, 4.21], [-0.08, 4.11], [-0.03, 4.01], [0.02, 3.91], [0.08, 3.81], [0.17, 3.74], [0.27, 3.67], [0.39, 3.6], [0.53, 3.51], [0.66, 3.41], [0.77, 3.31], [0.88, 3.21], [1.0, 3.09], [1.15, 2.95], [1.29, 2.82], [1.4, 2.7], [1.48, 2.59], [1.55, 2.47], [1.61, 2.36], [1.68, 2.24], [1.78, 2.1], [1.92, 1.92], [2.05, 1.73], [2.18, 1.55], [2.31, 1.38], [2.43, 1.22], [2.55, 1.04], [2.68, 0.86], [2.79, 0.71], [2.89, 0.64], [2.99, 0.57], [3.11, 0.54], [3.23, 0.51], [3.35, 0.48], [3.48, 0.46], [3.61, 0.44], [3.74, 0.43], [3.87, 0.41], [4.0, 0.4], [4.13, 0.38], [4.26, 0.36], [4.39, 0.35], [4.52, 0.33], [4.66, 0.32], [4.79, 0.3], [4.93, 0.29]], [[-0.3, 4.62], [-0.26, 4.52], [-0.21, 4.42], [-0.16, 4.31], [-0.11, 4.21], [-0.07, 4.11], [-0.02, 4.01], [0.03, 3.91], [0.09, 3.82], [0.18, 3.74], [0.29, 3.67], [0.4, 3.6], [0.55, 3.51], [0.67, 3.41], [0.79, 3.31], [0.9, 3.21], [1.01, 3.09], [1.17, 2.95], [1.3, 2.82], [1.41, 2.71], [1.49, 2.59], [1.56, 2.48], [1.63, 2.36], [1.69, 2.24], [1.79, 2.1], [1.93, 1.92], [2.06, 1.74], [2.19, 1.55], [2.32, 1.38], [2.44, 1.22], [2.56, 1.04], [2.69, 0.86], [2.8, 0.71], [2.9, 0.64], [3.0, 0.58], [3.12, 0.54], [3.24, 0.51], [3.37, 0.48], [3.5, 0.46], [3.63, 0.45], [3.76, 0.43], [3.89, 0.42], [4.02, 0.4], [4.15, 0.38], [4.27, 0.37], [4.41, 0.35], [4.54, 0.34], [4.68, 0.32], [4.81, 0.31], [4.95, 0.3]], [[-0.31, 4.61], [-0.26, 4.51], [-0.22, 4.41], [-0.17, 4.31], [-0.12, 4.21], [-0.07, 4.11], [-0.02, 4.01], [0.03, 3.91], [0.09, 3.81], [0.18, 3.74], [0.29, 3.67], [0.4, 3.6], [0.54, 3.51], [0.67, 3.41], [0.78, 3.31], [0.9, 3.2], [1.01, 3.08], [1.16, 2.94], [1.3, 2.82], [1.41, 2.7], [1.49, 2.58], [1.56, 2.47], [1.62, 2.35], [1.69, 2.24], [1.79, 2.09], [1.92, 1.91], [2.06, 1.73], [2.19, 1.55], [2.32, 1.38], [2.44, 1.22], [2.56, 1.04], [2.69, 0.85], [2.8, 0.71], [2.9, 0.64], [3.0, 0.57], [3.12, 0.54], [3.24, 0.5], [3.37, 0.48], [3.5, 0.46], [3.63, 0.44], [3.76, 0.43], [3.88, 0.41], [4.01, 0.39], [4.14, 0.38], [4.27, 0.36], [4.4, 0.34], [4.54, 0.33], [4.67, 0.32], [4.81, 0.3], [4.95, 0.29]], [[-0.19, 4.42], [-0.14, 4.32], [-0.1, 4.23], [-0.05, 4.13], [-0.0, 4.04], [0.04, 3.94], [0.09, 3.85], [0.14, 3.75], [0.21, 3.66], [0.31, 3.6], [0.42, 3.53], [0.55, 3.45], [0.7, 3.35], [0.82, 3.26], [0.93, 3.16], [1.04, 3.05], [1.15, 2.92], [1.3, 2.79], [1.41, 2.67], [1.51, 2.56], [1.6, 2.45], [1.66, 2.34], [1.71, 2.22], [1.78, 2.11], [1.88, 1.96], [2.01, 1.78], [2.15, 1.6], [2.28, 1.41], [2.41, 1.24], [2.53, 1.08], [2.65, 0.9], [2.78, 0.71], [2.88, 0.62], [2.98, 0.55], [3.08, 0.49], [3.21, 0.45], [3.33, 0.42], [3.46, 0.39], [3.6, 0.38], [3.73, 0.36], [3.87, 0.34], [4.0, 0.32], [4.13, 0.3], [4.26, 0.28], [4.4, 0.26], [4.53, 0.24], [4.67, 0.22], [4.81, 0.21], [4.95, 0.19], [5.09, 0.17]], [[-0.28, 4.62], [-0.24, 4.52], [-0.19, 4.42], [-0.14, 4.32], [-0.1, 4.22], [-0.05, 4.12], [0.0, 4.02], [0.05, 3.91], [0.11, 3.82], [0.2, 3.74], [0.3, 3.67], [0.42, 3.6], [0.56, 3.51], [0.69, 3.41], [0.8, 3.31], [0.91, 3.21], [1.02, 3.09], [1.17, 2.96], [1.3, 2.83], [1.4, 2.72], [1.48, 2.6], [1.55, 2.49], [1.61, 2.37], [1.68, 2.25], [1.78, 2.11], [1.91, 1.93], [2.03, 1.75], [2.16, 1.57], [2.29, 1.4], [2.41, 1.24], [2.53, 1.06], [2.65, 0.88], [2.76, 0.74], [2.85, 0.67], [2.95, 0.6], [3.07, 0.57], [3.19, 0.54], [3.31, 0.51], [3.44, 0.49], [3.57, 0.48], [3.7, 0.47], [3.82, 0.45], [3.95, 0.44], [4.08, 0.42], [4.2, 0.41], [4.33, 0.39], [4.46, 0.38], [4.6, 0.37], [4.73, 0.36], [4.86, 0.34]], [[-0.23, 4.56], [-0.19, 4.46], [-0.14, 4.36], [-0.09, 4.26], [-0.05, 4.16], [0.0, 4.07], [0.05, 3.97], [0.09, 3.87], [0.16, 3.77], [0.26, 3.7], [0.36, 3.63], [0.48, 3.56], [0.63, 3.47], [0.75, 3.37], [0.86, 3.27], [0.97, 3.17], [1.08, 3.04], [1.23, 2.91], [1.35, 2.79], [1.45, 2.67], [1.53, 2.56], [1.6, 2.45], [1.66, 2.33], [1.72, 2.21], [1.82, 2.07], [1.95, 1.89], [2.08, 1.71], [2.21, 1.53], [2.34, 1.36], [2.46, 1.2], [2.58, 1.03], [2.7, 0.84], [2.81, 0.71], [2.9, 0.64], [3.0, 0.58], [3.12, 0.55], [3.24, 0.51], [3.37, 0.49], [3.5, 0.47], [3.63, 0.46], [3.76, 0.44], [3.89, 0.43], [4.02, 0.41], [4.15, 0.4], [4.27, 0.38], [4.41, 0.37], [4.54, 0.35], [4.68, 0.34], [4.81, 0.33], [4.95, 0.31]], [[-0.14, 4.35], [-0.1, 4.26], [-0.05, 4.17], [-0.01, 4.07], [0.04, 3.98], [0.08, 3.89], [0.12, 3.79], [0.18, 3.7], [0.25, 3.62], [0.35, 3.55], [0.46, 3.49], [0.59, 3.41], [0.73, 3.32], [0.85, 3.22], [0.96, 3.13], [1.07, 3.02], [1.18, 2.9], [1.31, 2.77], [1.42, 2.66], [1.52, 2.55], [1.6, 2.43], [1.66, 2.32], [1.71, 2.21], [1.78, 2.1], [1.88, 1.96], [2.01, 1.78], [2.14, 1.6], [2.27, 1.41], [2.39, 1.25], [2.51, 1.09], [2.63, 0.92], [2.76, 0.73], [2.86, 0.64], [2.95, 0.57], [3.06, 0.51], [3.18, 0.47], [3.31, 0.44], [3.43, 0.42], [3.57, 0.4], [3.7, 0.38], [3.83, 0.36], [3.96, 0.35], [4.09, 0.33], [4.22, 0.31], [4.36, 0.29], [4.49, 0.27], [4.63, 0.26], [4.77, 0.24], [4.9, 0.23], [5.04, 0.21]], [[-0.23, 4.57], [-0.19, 4.47], [-0.14, 4.37], [-0.1, 4.27], [-0.05, 4.17], [-0.0, 4.07], [0.04, 3.97], [0.09, 3.88], [0.16, 3.78], [0.25, 3.71], [0.35, 3.64], [0.47, 3.57], [0.62, 3.47], [0.74, 3.38], [0.85, 3.28], [0.96, 3.17], [1.07, 3.05], [1.21, 2.92], [1.33, 2.79], [1.44, 2.68], [1.52, 2.56], [1.58, 2.45], [1.64, 2.34], [1.7, 2.22], [1.8, 2.08], [1.93, 1.9], [2.06, 1.71], [2.18, 1.53], [2.31, 1.37], [2.42, 1.21], [2.54, 1.03], [2.66, 0.85], [2.76, 0.72], [2.86, 0.65], [2.96, 0.59], [3.07, 0.56], [3.19, 0.52], [3.32, 0.5], [3.44, 0.48], [3.57, 0.47], [3.7, 0.46], [3.82, 0.44], [3.95, 0.43], [4.08, 0.41], [4.2, 0.39], [4.33, 0.38], [4.46, 0.37], [4.6, 0.35], [4.73, 0.34], [4.86, 0.33]], [[-0.23, 4.56], [-0.18, 4.46], [-0.13, 4.36], [-0.09, 4.26], [-0.04, 4.16], [0.01, 4.06], [0.05, 3.96], [0.1, 3.86], [0.17, 3.77], [0.26, 3.7], [0.36, 3.63], [0.48, 3.56], [0.63, 3.46], [0.75, 3.36], [0.86, 3.27], [0.97, 3.16], [1.08, 3.04], [1.22, 2.9], [1.34, 2.78], [1.44, 2.67], [1.52, 2.55], [1.59, 2.44], [1.65, 2.33], [1.71, 2.21], [1.81, 2.07], [1.94, 1.89], [2.06, 1.7], [2.19, 1.52], [2.31, 1.36], [2.43, 1.2], [2.55, 1.02], [2.67, 0.84], [2.77, 0.72], [2.87, 0.64], [2.97, 0.58], [3.08, 0.55], [3.2, 0.52], [3.33, 0.49], [3.45, 0.48], [3.58, 0.46], [3.71, 0.45], [3.84, 0.43], [3.96, 0.42], [4.09, 0.4], [4.21, 0.39], [4.34, 0.37], [4.48, 0.36], [4.61, 0.35], [4.74, 0.33], [4.88, 0.32]], [[-0.23, 4.56], [-0.18, 4.46], [-0.13, 4.36], [-0.09, 4.26], [-0.04, 4.16], [0.01, 4.06], [0.05, 3.96], [0.1, 3.86], [0.17, 3.77], [0.26, 3.7], [0.36, 3.63], [0.48, 3.56], [0.63, 3.46], [0.75, 3.36], [0.86, 3.27], [0.97, 3.16], [1.08, 3.04], [1.22, 2.9], [1.34, 2.78], [1.44, 2.67], [1.53, 2.55], [1.59, 2.44], [1.65, 2.33], [1.71, 2.21], [1.81, 2.07], [1.94, 1.89], [2.06, 1.7], [2.19, 1.52], [2.31, 1.36], [2.43, 1.2], [2.55, 1.02], [2.67, 0.84], [2.77, 0.72], [2.87, 0.64], [2.97, 0.58], [3.08, 0.55], [3.2, 0.52], [3.33, 0.49], [3.45, 0.48], [3.58, 0.46], [3.71, 0.45], [3.84, 0.43], [3.96, 0.42], [4.09, 0.4], [4.21, 0.39], [4.34, 0.37], [4.48, 0.36], [4.61, 0.35], [4.74, 0.33], [4.88, 0.32]], [[-0.23, 4.56], [-0.18, 4.46], [-0.13, 4.36], [-0.09, 4.26], [-0.04, 4.16], [0.01, 4.06], [0.05, 3.96], [0.1, 3.86], [0.17, 3.77], [0.26, 3.7], [0.36, 3.63], [0.48, 3.56], [0.63, 3.46], [0.75, 3.36], [0.86, 3.27], [0.97, 3.16], [1.08, 3.04], [1.22, 2.9], [1.34, 2.78], [1.44, 2.67], [1.53, 2.55], [1.59, 2.44], [1.65, 2.33], [1.71, 2.21], [1.81, 2.07], [1.94, 1.89], [2.06, 1.7], [2.19, 1.52], [2.31, 1.36], [2.43, 1.2], [2.55, 1.02], [2.67, 0.84], [2.77, 0.72], [2.87, 0.64], [2.97, 0.58], [3.08, 0.55], [3.2, 0.52], [3.33, 0.49], [3.45, 0.48], [3.58, 0.46], [3.71, 0.45], [3.84, 0.43], [3.96, 0.42], [4.09, 0.4], [4.21, 0.39], [4.34, 0.37], [4.48, 0.36], [4.61, 0.35], [4.74, 0.33], [4.88, 0.32]], [[-0.23, 4.56], [-0.18, 4.46], [-0.13, 4.36], [-0.09, 4.26], [-0.04, 4.16], [0.01, 4.06], [0.05, 3.96], [0.1, 3.86], [0.17, 3.77], [0.26, 3.7], [0.36, 3.63], [0.48, 3.56], [0.63, 3.46], [0.75, 3.36], [0.86, 3.27], [0.97, 3.16], [1.08, 3.04], [1.22, 2.9], [1.34, 2.78], [1.44, 2.67], [1.53, 2.55], [1.59, 2.44], [1.65, 2.33], [1.71, 2.21], [1.81, 2.07], [1.94, 1.89], [2.06, 1.7], [2.19, 1.52], [2.31, 1.36], [2.43, 1.2], [2.55, 1.02], [2.67, 0.84], [2.77, 0.72], [2.87, 0.64], [2.97, 0.58], [3.08, 0.55], [3.2, 0.52], [3.33, 0.49], [3.45, 0.48], [3.58, 0.46], [3.71, 0.45], [3.84, 0.43], [3.96, 0.42], [4.09, 0.4], [4.21, 0.39], [4.34, 0.37], [4.48, 0.36], [4.61, 0.35], [4.74, 0.33], [4.88, 0.32]], [[-0.23, 4.57], [-0.19, 4.47], [-0.14, 4.37], [-0.09, 4.27], [-0.05, 4.17], [-0.0, 4.08], [0.05, 3.98], [0.09, 3.88], [0.16, 3.78], [0.25, 3.71], [0.35, 3.64], [0.47, 3.57], [0.62, 3.48], [0.74, 3.38], [0.85, 3.28], [0.95, 3.18], [1.07, 3.05], [1.21, 2.92], [1.33, 2.8], [1.44, 2.68], [1.52, 2.57], [1.58, 2.45], [1.64, 2.34], [1.7, 2.22], [1.8, 2.08], [1.93, 1.9], [2.05, 1.72], [2.18, 1.54], [2.3, 1.37], [2.42, 1.21], [2.54, 1.03], [2.66, 0.85], [2.76, 0.73], [2.86, 0.65], [2.96, 0.59], [3.07, 0.56], [3.19, 0.53], [3.31, 0.5], [3.44, 0.49], [3.57, 0.47], [3.7, 0.46], [3.82, 0.44], [3.95, 0.43], [4.07, 0.41], [4.2, 0.4], [4.33, 0.38], [4.46, 0.37], [4.6, 0.36], [4.73, 0.35], [4.86, 0.33]], [[-0.23, 4.57], [-0.19, 4.47], [-0.14, 4.37], [-0.1, 4.27], [-0.05, 4.17], [-0.0, 4.07], [0.04, 3.98], [0.09, 3.88], [0.16, 3.78], [0.25, 3.71], [0.35, 3.64], [0.47, 3.57], [0.62, 3.48], [0.74, 3.38], [0.85, 3.28], [0.95, 3.18], [1.07, 3.05], [1.21, 2.92], [1.33, 2.8], [1.43, 2.68], [1.52, 2.57], [1.58, 2.45], [1.64, 2.34], [1.7, 2.22], [1.8, 2.08], [1.93, 1.9], [2.05, 1.72], [2.18, 1.54], [2.3, 1.37], [2.42, 1.21], [2.54, 1.03], [2.66, 0.85], [2.76, 0.73], [2.86, 0.65], [2.96, 0.59], [3.07, 0.56], [3.19, 0.53], [3.31, 0.5], [3.44, 0.49], [3.57, 0.47], [3.7, 0.46], [3.82, 0.44], [3.95, 0.43], [4.07, 0.41], [4.2, 0.4], [4.33, 0.38], [4.46, 0.37], [4.6, 0.36], [4.73, 0.34], [4.86, 0.33]], [[-0.23, 4.57], [-0.19, 4.47], [-0.14, 4.37], [-0.1, 4.27], [-0.05, 4.17], [-0.0, 4.07], [0.04, 3.97], [0.09, 3.88], [0.16, 3.78], [0.25, 3.71], [0.35, 3.64], [0.47, 3.57], [0.62, 3.48], [0.74, 3.38], [0.85, 3.28], [0.95, 3.18], [1.07, 3.05], [1.21, 2.92], [1.33, 2.8], [1.43, 2.68], [1.52, 2.57], [1.58, 2.45], [1.64, 2.34], [1.7, 2.22], [1.8, 2.08], [1.93, 1.9], [2.05, 1.72], [2.18, 1.54], [2.3, 1.37], [2.42, 1.21], [2.54, 1.03], [2.66, 0.85], [2.76, 0.72], [2.86, 0.65], [2.96, 0.59], [3.07, 0.56], [3.19, 0.53], [3.31, 0.5], [3.44, 0.48], [3.57, 0.47], [3.69, 0.46], [3.82, 0.44], [3.95, 0.43], [4.07, 0.41], [4.2, 0.4], [4.33, 0.38], [4.46, 0.37], [4.59, 0.36], [4.73, 0.34], [4.86, 0.33]], [[-0.21, 4.54], [-0.17, 4.44], [-0.12, 4.34], [-0.07, 4.24], [-0.03, 4.15], [0.02, 4.05], [0.06, 3.95], [0.11, 3.85], [0.18, 3.76], [0.27, 3.69], [0.38, 3.62], [0.5, 3.55], [0.64, 3.45], [0.77, 3.35], [0.87, 3.26], [0.98, 3.15], [1.1, 3.03], [1.24, 2.89], [1.35, 2.77], [1.46, 2.66], [1.54, 2.54], [1.6, 2.43], [1.66, 2.32], [1.72, 2.2], [1.82, 2.06], [1.95, 1.88], [2.07, 1.7], [2.2, 1.51], [2.32, 1.35], [2.44, 1.19], [2.56, 1.01], [2.68, 0.83], [2.78, 0.71], [2.88, 0.64], [2.98, 0.58], [3.09, 0.54], [3.21, 0.51], [3.34, 0.49], [3.47, 0.47], [3.59, 0.46], [3.72, 0.44], [3.85, 0.43], [3.98, 0.41], [4.1, 0.4], [4.23, 0.38], [4.36, 0.37], [4.49, 0.35], [4.63, 0.34], [4.76, 0.33], [4.9, 0.31]], [[-0.28, 4.36], [-0.25, 4.26], [-0.2, 4.17], [-0.15, 4.07], [-0.1, 3.98], [-0.05, 3.89], [-0.0, 3.79], [0.04, 3.7], [0.11, 3.61], [0.2, 3.54], [0.3, 3.48], [0.42, 3.41], [0.57, 3.32], [0.7, 3.22], [0.81, 3.13], [0.92, 3.02], [1.03, 2.9], [1.18, 2.77], [1.29, 2.66], [1.4, 2.54], [1.48, 2.43], [1.54, 2.32], [1.6, 2.21], [1.66, 2.09], [1.76, 1.95], [1.89, 1.77], [2.01, 1.59], [2.14, 1.41], [2.26, 1.24], [2.38, 1.08], [2.49, 0.9], [2.61, 0.72], [2.71, 0.62], [2.8, 0.55], [2.9, 0.48], [3.01, 0.44], [3.13, 0.41], [3.25, 0.38], [3.37, 0.37], [3.5, 0.35], [3.62, 0.33], [3.75, 0.31], [3.87, 0.29], [3.99, 0.27], [4.12, 0.25], [4.24, 0.23], [4.37, 0.21], [4.5, 0.19], [4.63, 0.18], [4.76, 0.16]], [[-0.16, 4.46], [-0.11, 4.37], [-0.07, 4.27], [-0.02, 4.17], [0.02, 4.08], [0.07, 3.98], [0.11, 3.89], [0.16, 3.79], [0.22, 3.7], [0.32, 3.63], [0.42, 3.56], [0.55, 3.48], [0.7, 3.39], [0.82, 3.3], [0.93, 3.2], [1.04, 3.09], [1.15, 2.97], [1.29, 2.84], [1.39, 2.72], [1.5, 2.61], [1.58, 2.5], [1.64, 2.39], [1.69, 2.28], [1.76, 2.16], [1.86, 2.02], [1.99, 1.85], [2.12, 1.67], [2.25, 1.49], [2.37, 1.33], [2.49, 1.17], [2.61, 1.0], [2.73, 0.82], [2.83, 0.7], [2.93, 0.63], [3.03, 0.57], [3.15, 0.53], [3.28, 0.5], [3.4, 0.47], [3.53, 0.45], [3.66, 0.44], [3.79, 0.42], [3.92, 0.41], [4.05, 0.4], [4.18, 0.38], [4.32, 0.37], [4.45, 0.35], [4.58, 0.34], [4.72, 0.32], [4.86, 0.31], [4.99, 0.3]], [[-0.19, 4.45], [-0.14, 4.35], [-0.1, 4.25], [-0.05, 4.16], [-0.01, 4.06], [0.04, 3.97], [0.08, 3.87], [0.13, 3.78], [0.2, 3.68], [0.29, 3.61], [0.39, 3.55], [0.52, 3.48], [0.66, 3.39], [0.78, 3.29], [0.89, 3.2], [1.0, 3.09], [1.11, 2.98], [1.25, 2.84], [1.36, 2.73], [1.46, 2.62], [1.54, 2.51], [1.6, 2.4], [1.66, 2.28], [1.72, 2.17], [1.82, 2.03], [1.95, 1.86], [2.08, 1.68], [2.21, 1.5], [2.33, 1.34], [2.45, 1.18], [2.57, 1.01], [2.69, 0.83], [2.79, 0.71], [2.89, 0.64], [2.99, 0.58], [3.11, 0.54], [3.23, 0.51], [3.35, 0.48], [3.48, 0.47], [3.61, 0.45], [3.74, 0.44], [3.87, 0.42], [4.0, 0.41], [4.13, 0.39], [4.26, 0.38], [4.39, 0.36], [4.52, 0.35], [4.66, 0.34], [4.79, 0.32], [4.93, 0.31]], [[-0.21, 4.51], [-0.17, 4.41], [-0.12, 4.31], [-0.08, 4.21], [-0.03, 4.12], [0.02, 4.02], [0.06, 3.92], [0.11, 3.83], [0.17, 3.73], [0.26, 3.66], [0.37, 3.59], [0.49, 3.53], [0.63, 3.44], [0.75, 3.34], [0.86, 3.25], [0.96, 3.15], [1.07, 3.03], [1.21, 2.9], [1.33, 2.78], [1.43, 2.67], [1.51, 2.56], [1.58, 2.45], [1.63, 2.33], [1.7, 2.22], [1.8, 2.08], [1.93, 1.9], [2.05, 1.73], [2.18, 1.55], [2.31, 1.39], [2.42, 1.23], [2.54, 1.06], [2.66, 0.88], [2.77, 0.74], [2.87, 0.67], [2.97, 0.61], [3.08, 0.58], [3.2, 0.55], [3.32, 0.52], [3.45, 0.5], [3.58, 0.49], [3.71, 0.48], [3.83, 0.46], [3.96, 0.45], [4.09, 0.44], [4.22, 0.42], [4.35, 0.41], [4.48, 0.4], [4.61, 0.39], [4.75, 0.38], [4.88, 0.36]], [[-0.21, 4.5], [-0.16, 4.4], [-0.12, 4.3], [-0.07, 4.21], [-0.02, 4.11], [0.02, 4.01], [0.07, 3.91], [0.11, 3.82], [0.18, 3.72], [0.27, 3.65], [0.37, 3.59], [0.49, 3.52], [0.63, 3.43], [0.76, 3.34], [0.87, 3.24], [0.97, 3.14], [1.08, 3.02], [1.22, 2.89], [1.33, 2.77], [1.44, 2.66], [1.52, 2.55], [1.58, 2.44], [1.64, 2.32], [1.7, 2.21], [1.8, 2.07], [1.93, 1.9], [2.06, 1.72], [2.19, 1.54], [2.31, 1.38], [2.43, 1.23], [2.55, 1.05], [2.67, 0.87], [2.78, 0.74], [2.87, 0.66], [2.97, 0.6], [3.09, 0.57], [3.21, 0.54], [3.33, 0.51], [3.46, 0.5], [3.59, 0.48], [3.71, 0.47], [3.84, 0.46], [3.97, 0.44], [4.1, 0.43], [4.23, 0.42], [4.36, 0.4], [4.49, 0.39], [4.62, 0.38], [4.76, 0.36], [4.89, 0.35]], [[-0.21, 4.5], [-0.16, 4.4], [-0.12, 4.3], [-0.07, 4.21], [-0.02, 4.11], [0.02, 4.01], [0.07, 3.92], [0.11, 3.82], [0.18, 3.73], [0.27, 3.65], [0.37, 3.59], [0.49, 3.52], [0.63, 3.43], [0.75, 3.34], [0.86, 3.24], [0.97, 3.14], [1.08, 3.02], [1.22, 2.89], [1.33, 2.77], [1.44, 2.66], [1.52, 2.55], [1.58, 2.44], [1.64, 2.33], [1.7, 2.21], [1.8, 2.08], [1.93, 1.9], [2.06, 1.72], [2.19, 1.54], [2.31, 1.38], [2.43, 1.23], [2.55, 1.05], [2.67, 0.87], [2.78, 0.74], [2.87, 0.66], [2.97, 0.6], [3.09, 0.57], [3.21, 0.54], [3.33, 0.51], [3.46, 0.5], [3.59, 0.48], [3.71, 0.47], [3.84, 0.46], [3.97, 0.44], [4.1, 0.43], [4.23, 0.42], [4.36, 0.4], [4.49, 0.39], [4.62, 0.38], [4.76, 0.37], [4.89, 0.35]], [[-0.21, 4.5], [-0.17, 4.4], [-0.12, 4.31], [-0.07, 4.21], [-0.03, 4.11], [0.02, 4.01], [0.07, 3.92], [0.11, 3.82], [0.17, 3.73], [0.27, 3.65], [0.37, 3.59], [0.49, 3.52], [0.63, 3.44], [0.75, 3.34], [0.86, 3.24], [0.97, 3.14], [1.07, 3.03], [1.22, 2.89], [1.33, 2.78], [1.43, 2.66], [1.52, 2.55], [1.58, 2.44], [1.64, 2.33], [1.7, 2.21], [1.8, 2.08], [1.93, 1.9], [2.06, 1.72], [2.19, 1.54], [2.31, 1.38], [2.43, 1.23], [2.55, 1.05], [2.66, 0.87], [2.77, 0.74], [2.87, 0.67], [2.97, 0.61], [3.09, 0.57], [3.21, 0.54], [3.33, 0.52], [3.45, 0.5], [3.58, 0.48], [3.71, 0.47], [3.84, 0.46], [3.97, 0.44], [4.1, 0.43], [4.22, 0.42], [4.35, 0.4], [4.49, 0.39], [4.62, 0.38], [4.75, 0.37], [4.89, 0.36]], [[-0.22, 4.52], [-0.18, 4.41], [-0.14, 4.32], [-0.09, 4.22], [-0.04, 4.12], [0.0, 4.02], [0.05, 3.93], [0.1, 3.83], [0.16, 3.74], [0.25, 3.66], [0.35, 3.6], [0.47, 3.53], [0.61, 3.45], [0.73, 3.35], [0.84, 3.26], [0.94, 3.16], [1.05, 3.04], [1.19, 2.91], [1.31, 2.79], [1.42, 2.68], [1.5, 2.57], [1.56, 2.45], [1.62, 2.34], [1.68, 2.23], [1.78, 2.09], [1.91, 1.91], [2.04, 1.73], [2.17, 1.56], [2.29, 1.4], [2.41, 1.24], [2.53, 1.07], [2.65, 0.89], [2.76, 0.75], [2.85, 0.67], [2.95, 0.61], [3.07, 0.58], [3.19, 0.55], [3.31, 0.52], [3.44, 0.51], [3.56, 0.49], [3.69, 0.48], [3.82, 0.47], [3.95, 0.45], [4.07, 0.44], [4.2, 0.43], [4.33, 0.41], [4.46, 0.4], [4.59, 0.39], [4.73, 0.38], [4.86, 0.37]], [[-0.22, 4.51], [-0.18, 4.41], [-0.13, 4.31], [-0.08, 4.22], [-0.04, 4.12], [0.01, 4.02], [0.06, 3.92], [0.1, 3.83], [0.16, 3.73], [0.25, 3.66], [0.36, 3.59], [0.48, 3.53], [0.61, 3.45], [0.74, 3.35], [0.84, 3.25], [0.95, 3.16], [1.06, 3.04], [1.2, 2.91], [1.32, 2.79], [1.42, 2.68], [1.5, 2.56], [1.57, 2.45], [1.63, 2.34], [1.69, 2.22], [1.79, 2.09], [1.92, 1.91], [2.04, 1.73], [2.17, 1.55], [2.3, 1.39], [2.41, 1.24], [2.53, 1.07], [2.65, 0.89], [2.76, 0.74], [2.86, 0.67], [2.96, 0.61], [3.07, 0.58], [3.19, 0.55], [3.32, 0.52], [3.44, 0.5], [3.57, 0.49], [3.7, 0.48], [3.82, 0.47], [3.95, 0.45], [4.08, 0.44], [4.21, 0.43], [4.33, 0.41], [4.47, 0.4], [4.6, 0.39], [4.73, 0.38], [4.87, 0.37]], [[-0.22, 4.51], [-0.18, 4.41], [-0.13, 4.31], [-0.08, 4.22], [-0.04, 4.12], [0.01, 4.02], [0.06, 3.92], [0.1, 3.83], [0.16, 3.73], [0.25, 3.66], [0.36, 3.59], [0.48, 3.53], [0.61, 3.44], [0.74, 3.35], [0.85, 3.25], [0.95, 3.16], [1.06, 3.04], [1.2, 2.9], [1.32, 2.79], [1.42, 2.67], [1.5, 2.56], [1.57, 2.45], [1.63, 2.34], [1.69, 2.22], [1.79, 2.09], [1.92, 1.91], [2.04, 1.73], [2.17, 1.55], [2.3, 1.39], [2.41, 1.24], [2.53, 1.07], [2.65, 0.89], [2.76, 0.74], [2.86, 0.67], [2.96, 0.61], [3.07, 0.58], [3.19, 0.55], [3.32, 0.52], [3.44, 0.5], [3.57, 0.49], [3.7, 0.48], [3.82, 0.46], [3.95, 0.45], [4.08, 0.44], [4.21, 0.42], [4.34, 0.41], [4.47, 0.4], [4.6, 0.39], [4.73, 0.38], [4.87, 0.36]], [[-0.23, 4.53], [-0.19, 4.43], [-0.14, 4.33], [-0.09, 4.23], [-0.05, 4.13], [-0.0, 4.04], [0.05, 3.94], [0.09, 3.84], [0.15, 3.75], [0.24, 3.67], [0.35, 3.61], [0.47, 3.54], [0.6, 3.46], [0.72, 3.36], [0.83, 3.27], [0.94, 3.17], [1.04, 3.05], [1.19, 2.92], [1.3, 2.8], [1.41, 2.69], [1.49, 2.58], [1.56, 2.47], [1.62, 2.35], [1.68, 2.24], [1.78, 2.1], [1.91, 1.92], [2.03, 1.75], [2.16, 1.57], [2.29, 1.41], [2.4, 1.26], [2.52, 1.08], [2.64, 0.9], [2.75, 0.75], [2.85, 0.68], [2.95, 0.62], [3.06, 0.59], [3.18, 0.56], [3.3, 0.53], [3.43, 0.52], [3.56, 0.5], [3.68, 0.49], [3.81, 0.48], [3.94, 0.47], [4.06, 0.45], [4.19, 0.44], [4.32, 0.43], [4.45, 0.41], [4.58, 0.4], [4.72, 0.39], [4.85, 0.38]], [[-0.22, 4.53], [-0.18, 4.43], [-0.13, 4.33], [-0.08, 4.23], [-0.04, 4.13], [0.01, 4.04], [0.05, 3.94], [0.1, 3.84], [0.16, 3.75], [0.25, 3.68], [0.35, 3.61], [0.47, 3.54], [0.59, 3.47], [0.72, 3.38], [0.83, 3.28], [0.93, 3.18], [1.03, 3.08], [1.17, 2.95], [1.28, 2.83], [1.39, 2.72], [1.47, 2.61], [1.54, 2.5], [1.59, 2.38], [1.66, 2.27], [1.75, 2.14], [1.88, 1.96], [2.01, 1.79], [2.13, 1.61], [2.25, 1.45], [2.37, 1.3], [2.49, 1.13], [2.61, 0.96], [2.72, 0.79], [2.81, 0.72], [2.91, 0.66], [3.02, 0.63], [3.14, 0.6], [3.26, 0.58], [3.38, 0.56], [3.51, 0.55], [3.63, 0.54], [3.76, 0.52], [3.88, 0.51], [4.01, 0.5], [4.13, 0.49], [4.26, 0.48], [4.39, 0.47], [4.52, 0.46], [4.65, 0.45], [4.78, 0.44]], [[-0.24, 4.55], [-0.2, 4.44], [-0.15, 4.34], [-0.11, 4.25], [-0.06, 4.15], [-0.01, 4.05], [0.04, 3.95], [0.08, 3.85], [0.14, 3.76], [0.22, 3.68], [0.32, 3.61], [0.44, 3.55], [0.56, 3.48], [0.69, 3.38], [0.8, 3.29], [0.91, 3.19], [1.01, 3.08], [1.15, 2.95], [1.27, 2.83], [1.38, 2.72], [1.46, 2.6], [1.53, 2.49], [1.59, 2.38], [1.66, 2.26], [1.76, 2.12], [1.89, 1.94], [2.02, 1.76], [2.15, 1.59], [2.28, 1.42], [2.4, 1.27], [2.52, 1.09], [2.64, 0.91], [2.76, 0.75], [2.86, 0.68], [2.96, 0.62], [3.08, 0.58], [3.2, 0.55], [3.32, 0.53], [3.45, 0.51], [3.57, 0.49], [3.7, 0.48], [3.83, 0.47], [3.96, 0.46], [4.09, 0.44], [4.22, 0.43], [4.35, 0.41], [4.48, 0.4], [4.61, 0.39], [4.75, 0.38], [4.88, 0.37]], [[-0.25, 4.58], [-0.21, 4.48], [-0.16, 4.38], [-0.11, 4.28], [-0.07, 4.18], [-0.02, 4.08], [0.03, 3.98], [0.08, 3.88], [0.13, 3.78], [0.21, 3.7], [0.31, 3.64], [0.42, 3.57], [0.55, 3.5], [0.67, 3.41], [0.79, 3.31], [0.9, 3.21], [1.0, 3.1], [1.14, 2.97], [1.27, 2.85], [1.38, 2.73], [1.46, 2.62], [1.53, 2.51], [1.59, 2.39], [1.66, 2.28], [1.76, 2.14], [1.89, 1.96], [2.02, 1.78], [2.15, 1.6], [2.28, 1.44], [2.4, 1.28], [2.52, 1.11], [2.64, 0.92], [2.76, 0.76], [2.85, 0.69], [2.95, 0.63], [3.07, 0.6], [3.19, 0.57], [3.31, 0.54], [3.44, 0.52], [3.57, 0.51], [3.7, 0.5], [3.82, 0.48], [3.95, 0.47], [4.08, 0.46], [4.21, 0.45], [4.34, 0.43], [4.47, 0.42], [4.6, 0.41], [4.74, 0.4], [4.87, 0.39]], [[-0.24, 4.54], [-0.2, 4.44], [-0.15, 4.34], [-0.1, 4.24], [-0.06, 4.15], [-0.01, 4.05], [0.04, 3.95], [0.08, 3.85], [0.13, 3.76], [0.21, 3.68], [0.31, 3.61], [0.43, 3.54], [0.55, 3.48], [0.68, 3.38], [0.79, 3.29], [0.9, 3.19], [1.0, 3.09], [1.15, 2.95], [1.27, 2.83], [1.38, 2.72], [1.46, 2.61], [1.53, 2.5], [1.59, 2.38], [1.65, 2.27], [1.75, 2.13], [1.88, 1.96], [2.01, 1.78], [2.14, 1.6], [2.27, 1.44], [2.38, 1.29], [2.5, 1.12], [2.62, 0.94], [2.74, 0.77], [2.84, 0.7], [2.94, 0.64], [3.05, 0.6], [3.17, 0.57], [3.29, 0.54], [3.42, 0.53], [3.55, 0.51], [3.67, 0.5], [3.8, 0.49], [3.93, 0.48], [4.06, 0.47], [4.18, 0.45], [4.31, 0.44], [4.44, 0.43], [4.58, 0.42], [4.71, 0.41], [4.84, 0.39]], [[-0.19, 4.47], [-0.15, 4.37], [-0.11, 4.27], [-0.06, 4.18], [-0.02, 4.08], [0.03, 3.99], [0.08, 3.89], [0.12, 3.79], [0.17, 3.7], [0.26, 3.63], [0.36, 3.56], [0.48, 3.49], [0.61, 3.42], [0.74, 3.33], [0.85, 3.23], [0.96, 3.14], [1.06, 3.02], [1.21, 2.89], [1.32, 2.78], [1.43, 2.66], [1.51, 2.55], [1.57, 2.44], [1.63, 2.33], [1.69, 2.22], [1.79, 2.08], [1.92, 1.9], [2.05, 1.72], [2.18, 1.55], [2.31, 1.39], [2.43, 1.23], [2.55, 1.06], [2.67, 0.88], [2.78, 0.73], [2.88, 0.66], [2.98, 0.6], [3.1, 0.56], [3.22, 0.53], [3.34, 0.51], [3.47, 0.49], [3.6, 0.48], [3.73, 0.47], [3.86, 0.45], [3.99, 0.44], [4.12, 0.42], [4.25, 0.41], [4.38, 0.4], [4.51, 0.38], [4.65, 0.37], [4.78, 0.36], [4.92, 0.35]], [[-0.19, 4.47], [-0.15, 4.37], [-0.11, 4.27], [-0.06, 4.18], [-0.02, 4.08], [0.03, 3.99], [0.08, 3.89], [0.12, 3.79], [0.17, 3.7], [0.26, 3.63], [0.36, 3.56], [0.48, 3.49], [0.61, 3.42], [0.74, 3.33], [0.85, 3.23], [0.96, 3.14], [1.06, 3.02], [1.21, 2.89], [1.32, 2.78], [1.43, 2.66], [1.51, 2.55], [1.57, 2.44], [1.63, 2.33], [1.69, 2.21], [1.79, 2.08], [1.92, 1.9], [2.05, 1.72], [2.18, 1.55], [2.31, 1.39], [2.43, 1.23], [2.55, 1.06], [2.67, 0.88], [2.78, 0.73], [2.88, 0.66], [2.98, 0.6], [3.1, 0.56], [3.22, 0.53], [3.34, 0.51], [3.47, 0.49], [3.6, 0.48], [3.73, 0.47], [3.86, 0.45], [3.99, 0.44], [4.12, 0.42], [4.25, 0.41], [4.38, 0.4], [4.51, 0.38], [4.65, 0.37], [4.78, 0.36], [4.92, 0.35]], [[-0.14, 4.37], [-0.1, 4.27], [-0.05, 4.18], [-0.01, 4.08], [0.03, 3.99], [0.08, 3.9], [0.12, 3.8], [0.17, 3.71], [0.23, 3.62], [0.32, 3.55], [0.42, 3.49], [0.55, 3.42], [0.69, 3.34], [0.81, 3.24], [0.92, 3.15], [1.03, 3.05], [1.14, 2.93], [1.28, 2.8], [1.39, 2.69], [1.49, 2.58], [1.58, 2.46], [1.63, 2.35], [1.69, 2.24], [1.76, 2.13], [1.86, 1.99], [1.99, 1.81], [2.13, 1.63], [2.26, 1.45], [2.39, 1.29], [2.51, 1.13], [2.63, 0.95], [2.76, 0.77], [2.86, 0.66], [2.96, 0.58], [3.07, 0.52], [3.19, 0.49], [3.32, 0.45], [3.45, 0.43], [3.58, 0.41], [3.72, 0.4], [3.85, 0.38], [3.98, 0.37], [4.12, 0.35], [4.25, 0.33], [4.38, 0.32], [4.52, 0.3], [4.66, 0.28], [4.8, 0.27], [4.94, 0.25], [5.08, 0.24]], [[-0.2, 4.46], [-0.16, 4.36], [-0.12, 4.26], [-0.07, 4.17], [-0.02, 4.07], [0.02, 3.98], [0.07, 3.88], [0.11, 3.78], [0.16, 3.69], [0.24, 3.61], [0.35, 3.55], [0.46, 3.48], [0.58, 3.42], [0.71, 3.32], [0.82, 3.23], [0.93, 3.13], [1.04, 3.02], [1.19, 2.89], [1.3, 2.78], [1.41, 2.66], [1.49, 2.55], [1.56, 2.44], [1.62, 2.33], [1.69, 2.21], [1.79, 2.08], [1.92, 1.9], [2.05, 1.72], [2.19, 1.54], [2.31, 1.38], [2.43, 1.22], [2.56, 1.05], [2.68, 0.86], [2.8, 0.72], [2.89, 0.64], [3.0, 0.58], [3.12, 0.55], [3.24, 0.51], [3.37, 0.49], [3.5, 0.47], [3.63, 0.46], [3.76, 0.44], [3.89, 0.43], [4.02, 0.42], [4.15, 0.4], [4.28, 0.39], [4.41, 0.37], [4.55, 0.36], [4.68, 0.34], [4.82, 0.33], [4.96, 0.32]], [[-0.23, 4.54], [-0.2, 4.43], [-0.15, 4.33], [-0.11, 4.24], [-0.06, 4.14], [-0.01, 4.04], [0.04, 3.95], [0.08, 3.85], [0.13, 3.75], [0.21, 3.67], [0.31, 3.6], [0.42, 3.54], [0.54, 3.47], [0.66, 3.38], [0.78, 3.29], [0.89, 3.19], [0.99, 3.08], [1.14, 2.95], [1.26, 2.83], [1.37, 2.72], [1.46, 2.61], [1.53, 2.49], [1.59, 2.38], [1.65, 2.26], [1.75, 2.13], [1.89, 1.95], [2.02, 1.77], [2.15, 1.59], [2.28, 1.43], [2.4, 1.28], [2.52, 1.1], [2.64, 0.92], [2.76, 0.76], [2.86, 0.68], [2.96, 0.62], [3.08, 0.58], [3.2, 0.55], [3.32, 0.53], [3.45, 0.51], [3.58, 0.5], [3.71, 0.49], [3.84, 0.47], [3.96, 0.46], [4.09, 0.45], [4.22, 0.43], [4.35, 0.42], [4.48, 0.41], [4.62, 0.4], [4.75, 0.38], [4.89, 0.37]], [[-0.19, 4.47], [-0.15, 4.37], [-0.11, 4.27], [-0.06, 4.17], [-0.02, 4.08], [0.03, 3.98], [0.07, 3.89], [0.12, 3.79], [0.17, 3.7], [0.25, 3.62], [0.35, 3.56], [0.46, 3.49], [0.59, 3.42], [0.72, 3.33], [0.83, 3.24], [0.94, 3.14], [1.05, 3.03], [1.19, 2.9], [1.31, 2.78], [1.41, 2.67], [1.5, 2.56], [1.56, 2.44], [1.62, 2.33], [1.69, 2.22], [1.79, 2.08], [1.93, 1.9], [2.06, 1.72], [2.19, 1.54], [2.32, 1.38], [2.44, 1.23], [2.56, 1.05], [2.68, 0.87], [2.8, 0.72], [2.9, 0.65], [3.0, 0.59], [3.12, 0.55], [3.25, 0.52], [3.37, 0.49], [3.5, 0.48], [3.63, 0.46], [3.76, 0.45], [3.89, 0.44], [4.03, 0.42], [4.16, 0.41], [4.29, 0.39], [4.42, 0.38], [4.55, 0.36], [4.69, 0.35], [4.83, 0.34], [4.96, 0.32]], [[-0.19, 4.47], [-0.15, 4.37], [-0.11, 4.27], [-0.06, 4.17], [-0.02, 4.08], [0.03, 3.98], [0.07, 3.89], [0.12, 3.79], [0.17, 3.7], [0.25, 3.62], [0.35, 3.56], [0.46, 3.49], [0.59, 3.42], [0.72, 3.33], [0.83, 3.23], [0.94, 3.14], [1.05, 3.03], [1.19, 2.9], [1.31, 2.78], [1.41, 2.67], [1.5, 2.56], [1.56, 2.44], [1.62, 2.33], [1.69, 2.22], [1.79, 2.08], [1.92, 1.9], [2.06, 1.72], [2.19, 1.54], [2.32, 1.38], [2.44, 1.23], [2.56, 1.05], [2.68, 0.87], [2.8, 0.72], [2.9, 0.65], [3.0, 0.59], [3.12, 0.55], [3.25, 0.52], [3.37, 0.49], [3.5, 0.48], [3.63, 0.46], [3.76, 0.45], [3.89, 0.44], [4.03, 0.42], [4.16, 0.41], [4.29, 0.39], [4.42, 0.38], [4.55, 0.36], [4.69, 0.35], [4.83, 0.34], [4.96, 0.32]], [[-0.18, 4.45], [-0.15, 4.35], [-0.1, 4.25], [-0.05, 4.15], [-0.01, 4.06], [0.04, 3.96], [0.08, 3.87], [0.13, 3.77], [0.18, 3.68], [0.26, 3.6], [0.37, 3.54], [0.48, 3.47], [0.61, 3.4], [0.73, 3.31], [0.85, 3.21], [0.96, 3.12], [1.06, 3.01], [1.21, 2.88], [1.32, 2.76], [1.43, 2.65], [1.51, 2.54], [1.57, 2.43], [1.63, 2.31], [1.7, 2.2], [1.8, 2.06], [1.94, 1.88], [2.07, 1.7], [2.2, 1.52], [2.33, 1.36], [2.45, 1.21], [2.57, 1.03], [2.7, 0.85], [2.81, 0.71], [2.91, 0.63], [3.02, 0.57], [3.14, 0.53], [3.26, 0.5], [3.39, 0.48], [3.52, 0.46], [3.65, 0.45], [3.78, 0.43], [3.92, 0.42], [4.05, 0.4], [4.18, 0.39], [4.31, 0.37], [4.44, 0.36], [4.58, 0.34], [4.72, 0.33], [4.86, 0.32], [4.99, 0.3]], [[-0.15, 4.4], [-0.12, 4.3], [-0.07, 4.21], [-0.02, 4.11], [0.02, 4.02], [0.07, 3.92], [0.11, 3.83], [0.16, 3.73], [0.22, 3.64], [0.3, 3.57], [0.4, 3.5], [0.51, 3.44], [0.65, 3.36], [0.77, 3.27], [0.88, 3.18], [0.99, 3.08], [1.09, 2.97], [1.23, 2.84], [1.34, 2.73], [1.45, 2.62], [1.53, 2.51], [1.59, 2.4], [1.65, 2.28], [1.71, 2.17], [1.81, 2.03], [1.94, 1.86], [2.08, 1.68], [2.21, 1.5], [2.33, 1.34], [2.45, 1.19], [2.58, 1.01], [2.7, 0.83], [2.81, 0.7], [2.91, 0.63], [3.01, 0.57], [3.13, 0.53], [3.26, 0.5], [3.38, 0.48], [3.51, 0.46], [3.64, 0.44], [3.78, 0.43], [3.91, 0.42], [4.04, 0.4], [4.17, 0.39], [4.3, 0.37], [4.43, 0.35], [4.57, 0.34], [4.7, 0.33], [4.84, 0.31], [4.98, 0.3]], [[-0.12, 4.37], [-0.09, 4.28], [-0.04, 4.18], [0.0, 4.09], [0.05, 3.99], [0.09, 3.9], [0.14, 3.81], [0.18, 3.71], [0.24, 3.62], [0.33, 3.55], [0.43, 3.49], [0.55, 3.42], [0.68, 3.35], [0.8, 3.25], [0.91, 3.16], [1.02, 3.07], [1.12, 2.95], [1.25, 2.83], [1.36, 2.71], [1.47, 2.6], [1.55, 2.49], [1.6, 2.38], [1.66, 2.27], [1.73, 2.16], [1.83, 2.02], [1.96, 1.84], [2.09, 1.67], [2.22, 1.49], [2.35, 1.33], [2.47, 1.18], [2.59, 1.0], [2.71, 0.82], [2.82, 0.7], [2.92, 0.62], [3.02, 0.56], [3.14, 0.53], [3.27, 0.5], [3.39, 0.47], [3.53, 0.46], [3.66, 0.44], [3.79, 0.43], [3.92, 0.41], [4.05, 0.4], [4.18, 0.39], [4.31, 0.37], [4.45, 0.35], [4.58, 0.34], [4.72, 0.33], [4.86, 0.31], [4.99, 0.3]], [[-0.08, 4.3], [-0.04, 4.2], [0.0, 4.11], [0.05, 4.02], [0.09, 3.93], [0.13, 3.84], [0.18, 3.74], [0.22, 3.65], [0.29, 3.57], [0.37, 3.49], [0.47, 3.43], [0.59, 3.37], [0.73, 3.29], [0.85, 3.2], [0.96, 3.11], [1.06, 3.01], [1.17, 2.9], [1.29, 2.77], [1.4, 2.66], [1.51, 2.55], [1.59, 2.44], [1.64, 2.33], [1.7, 2.22], [1.76, 2.11], [1.87, 1.98], [2.0, 1.8], [2.13, 1.62], [2.26, 1.44], [2.39, 1.29], [2.51, 1.13], [2.63, 0.95], [2.75, 0.77], [2.86, 0.67], [2.96, 0.59], [3.06, 0.53], [3.19, 0.5], [3.31, 0.47], [3.44, 0.45], [3.58, 0.43], [3.71, 0.41], [3.85, 0.4], [3.98, 0.38], [4.11, 0.37], [4.25, 0.35], [4.38, 0.34], [4.51, 0.32], [4.65, 0.3], [4.79, 0.29], [4.93, 0.28], [5.07, 0.26]], [[-0.16, 4.47], [-0.13, 4.37], [-0.08, 4.27], [-0.04, 4.17], [0.01, 4.08], [0.05, 3.98], [0.1, 3.88], [0.15, 3.79], [0.2, 3.69], [0.28, 3.61], [0.38, 3.55], [0.49, 3.48], [0.62, 3.42], [0.74, 3.32], [0.86, 3.23], [0.97, 3.13], [1.07, 3.02], [1.21, 2.89], [1.32, 2.78], [1.43, 2.67], [1.51, 2.55], [1.57, 2.44], [1.63, 2.33], [1.69, 2.21], [1.8, 2.08], [1.93, 1.9], [2.06, 1.72], [2.19, 1.54], [2.32, 1.38], [2.44, 1.23], [2.56, 1.05], [2.69, 0.87], [2.8, 0.72], [2.9, 0.65], [3.0, 0.59], [3.12, 0.55], [3.24, 0.52], [3.37, 0.5], [3.5, 0.49], [3.63, 0.47], [3.76, 0.46], [3.89, 0.44], [4.03, 0.43], [4.16, 0.42], [4.29, 0.4], [4.42, 0.39], [4.55, 0.37], [4.69, 0.36], [4.83, 0.35], [4.96, 0.34]], [[-0.23, 4.54], [-0.19, 4.43], [-0.15, 4.33], [-0.1, 4.23], [-0.05, 4.13], [-0.01, 4.04], [0.04, 3.94], [0.09, 3.84], [0.14, 3.74], [0.22, 3.66], [0.32, 3.59], [0.42, 3.52], [0.55, 3.46], [0.67, 3.37], [0.78, 3.27], [0.9, 3.17], [1.0, 3.07], [1.14, 2.94], [1.26, 2.82], [1.37, 2.71], [1.45, 2.6], [1.52, 2.48], [1.58, 2.37], [1.64, 2.26], [1.74, 2.12], [1.87, 1.94], [2.0, 1.76], [2.13, 1.58], [2.26, 1.42], [2.38, 1.27], [2.5, 1.09], [2.62, 0.91], [2.74, 0.75], [2.83, 0.68], [2.93, 0.62], [3.05, 0.58], [3.17, 0.55], [3.29, 0.53], [3.42, 0.51], [3.55, 0.5], [3.67, 0.49], [3.8, 0.47], [3.93, 0.46], [4.06, 0.45], [4.18, 0.43], [4.31, 0.42], [4.45, 0.41], [4.58, 0.4], [4.71, 0.38], [4.84, 0.37]], [[-0.19, 4.51], [-0.15, 4.4], [-0.11, 4.3], [-0.06, 4.21], [-0.02, 4.11], [0.03, 4.01], [0.08, 3.92], [0.12, 3.82], [0.17, 3.72], [0.25, 3.64], [0.35, 3.57], [0.46, 3.51], [0.59, 3.44], [0.71, 3.35], [0.82, 3.25], [0.94, 3.16], [1.04, 3.05], [1.18, 2.92], [1.29, 2.81], [1.4, 2.69], [1.49, 2.58], [1.55, 2.47], [1.6, 2.36], [1.67, 2.24], [1.77, 2.11], [1.9, 1.93], [2.03, 1.75], [2.16, 1.57], [2.29, 1.41], [2.41, 1.26], [2.53, 1.08], [2.65, 0.9], [2.76, 0.75], [2.86, 0.68], [2.96, 0.62], [3.08, 0.58], [3.2, 0.55], [3.33, 0.53], [3.45, 0.51], [3.58, 0.5], [3.71, 0.49], [3.84, 0.48], [3.97, 0.46], [4.1, 0.45], [4.23, 0.44], [4.36, 0.42], [4.49, 0.41], [4.63, 0.4], [4.76, 0.39], [4.89, 0.38]], [[-0.18, 4.5], [-0.15, 4.39], [-0.1, 4.29], [-0.06, 4.19], [-0.01, 4.1], [0.03, 4.0], [0.08, 3.9], [0.13, 3.81], [0.18, 3.71], [0.26, 3.63], [0.36, 3.56], [0.47, 3.5], [0.59, 3.43], [0.72, 3.34], [0.83, 3.24], [0.94, 3.15], [1.05, 3.04], [1.19, 2.91], [1.3, 2.8], [1.41, 2.68], [1.49, 2.57], [1.55, 2.46], [1.61, 2.35], [1.68, 2.23], [1.78, 2.1], [1.91, 1.92], [2.04, 1.74], [2.17, 1.56], [2.29, 1.4], [2.41, 1.25], [2.54, 1.07], [2.66, 0.89], [2.77, 0.74], [2.87, 0.67], [2.97, 0.61], [3.09, 0.57], [3.21, 0.54], [3.34, 0.52], [3.47, 0.51], [3.59, 0.49], [3.72, 0.48], [3.85, 0.47], [3.98, 0.45], [4.11, 0.44], [4.24, 0.43], [4.37, 0.41], [4.51, 0.4], [4.64, 0.39], [4.78, 0.38], [4.91, 0.37]], [[-0.17, 4.46], [-0.13, 4.36], [-0.09, 4.26], [-0.04, 4.17], [0.0, 4.07], [0.05, 3.97], [0.1, 3.88], [0.14, 3.78], [0.2, 3.69], [0.28, 3.61], [0.38, 3.54], [0.49, 3.48], [0.62, 3.41], [0.74, 3.31], [0.86, 3.22], [0.97, 3.12], [1.07, 3.02], [1.21, 2.89], [1.32, 2.77], [1.43, 2.66], [1.51, 2.55], [1.57, 2.44], [1.63, 2.33], [1.69, 2.21], [1.79, 2.07], [1.93, 1.9], [2.06, 1.72], [2.19, 1.54], [2.31, 1.38], [2.43, 1.23], [2.55, 1.05], [2.68, 0.87], [2.79, 0.73], [2.89, 0.66], [2.99, 0.59], [3.11, 0.56], [3.23, 0.53], [3.36, 0.51], [3.49, 0.49], [3.62, 0.48], [3.75, 0.46], [3.88, 0.45], [4.01, 0.44], [4.14, 0.42], [4.27, 0.41], [4.4, 0.39], [4.54, 0.38], [4.67, 0.37], [4.81, 0.36], [4.94, 0.34]], [[-0.17, 4.46], [-0.13, 4.36], [-0.09, 4.26], [-0.04, 4.17], [0.0, 4.07], [0.05, 3.97], [0.1, 3.88], [0.14, 3.78], [0.2, 3.69], [0.28, 3.61], [0.38, 3.54], [0.49, 3.48], [0.62, 3.41], [0.74, 3.31], [0.86, 3.22], [0.97, 3.12], [1.07, 3.02], [1.21, 2.89], [1.32, 2.77], [1.43, 2.66], [1.51, 2.55], [1.57, 2.44], [1.63, 2.33], [1.69, 2.21], [1.79, 2.07], [1.93, 1.9], [2.06, 1.72], [2.19, 1.54], [2.31, 1.38], [2.43, 1.23], [2.55, 1.05], [2.68, 0.87], [2.79, 0.73], [2.89, 0.66], [2.99, 0.59], [3.11, 0.56], [3.23, 0.53], [3.36, 0.51], [3.49, 0.49], [3.62, 0.48], [3.75, 0.46], [3.88, 0.45], [4.01, 0.44], [4.14, 0.42], [4.27, 0.41], [4.4, 0.39], [4.54, 0.38], [4.67, 0.37], [4.81, 0.36], [4.94, 0.34]], [[-0.17, 4.46], [-0.13, 4.36], [-0.09, 4.26], [-0.04, 4.17], [0.0, 4.07], [0.05, 3.97], [0.1, 3.88], [0.14, 3.78], [0.2, 3.69], [0.28, 3.61], [0.38, 3.54], [0.49, 3.48], [0.62, 3.41], [0.74, 3.31], [0.86, 3.22], [0.97, 3.12], [1.07, 3.02], [1.21, 2.89], [1.32, 2.77], [1.43, 2.66], [1.51, 2.55], [1.57, 2.44], [1.63, 2.33], [1.69, 2.21], [1.79, 2.07], [1.93, 1.9], [2.06, 1.72], [2.19, 1.54], [2.31, 1.38], [2.43, 1.23], [2.55, 1.05], [2.68, 0.87], [2.79, 0.73], [2.89, 0.66], [2.99, 0.59], [3.11, 0.56], [3.23, 0.53], [3.36, 0.51], [3.49, 0.49], [3.62, 0.48], [3.75, 0.46], [3.88, 0.45], [4.01, 0.44], [4.14, 0.42], [4.27, 0.41], [4.4, 0.39], [4.54, 0.38], [4.67, 0.37], [4.81, 0.36], [4.94, 0.34]], [[-0.17, 4.46], [-0.13, 4.36], [-0.09, 4.26], [-0.04, 4.17], [0.0, 4.07], [0.05, 3.97], [0.1, 3.88], [0.14, 3.78], [0.2, 3.69], [0.28, 3.61], [0.38, 3.54], [0.49, 3.48], [0.62, 3.41], [0.74, 3.31], [0.86, 3.22], [0.97, 3.12], [1.07, 3.02], [1.21, 2.89], [1.32, 2.77], [1.43, 2.66], [1.51, 2.55], [1.57, 2.44], [1.63, 2.33], [1.69, 2.21], [1.79, 2.07], [1.93, 1.9], [2.06, 1.72], [2.19, 1.54], [2.31, 1.38], [2.43, 1.23], [2.55, 1.05], [2.68, 0.87], [2.79, 0.73], [2.89, 0.66], [2.99, 0.59], [3.11, 0.56], [3.23, 0.53], [3.36, 0.51], [3.49, 0.49], [3.62, 0.48], [3.75, 0.46], [3.88, 0.45], [4.01, 0.44], [4.14, 0.42], [4.27, 0.41], [4.4, 0.39], [4.54, 0.38], [4.67, 0.37], [4.81, 0.36], [4.94, 0.34]], [[-0.17, 4.47], [-0.13, 4.36], [-0.09, 4.26], [-0.04, 4.17], [0.0, 4.07], [0.05, 3.98], [0.1, 3.88], [0.14, 3.78], [0.2, 3.69], [0.27, 3.61], [0.38, 3.54], [0.49, 3.48], [0.62, 3.41], [0.74, 3.32], [0.86, 3.22], [0.97, 3.13], [1.07, 3.02], [1.21, 2.89], [1.32, 2.77], [1.43, 2.66], [1.51, 2.55], [1.57, 2.44], [1.63, 2.33], [1.69, 2.21], [1.79, 2.08], [1.92, 1.9], [2.06, 1.72], [2.19, 1.54], [2.31, 1.38], [2.43, 1.23], [2.55, 1.05], [2.68, 0.87], [2.79, 0.73], [2.89, 0.66], [2.99, 0.59], [3.11, 0.56], [3.23, 0.53], [3.36, 0.51], [3.49, 0.49], [3.62, 0.48], [3.75, 0.46], [3.88, 0.45], [4.01, 0.44], [4.14, 0.42], [4.27, 0.41], [4.4, 0.4], [4.54, 0.38], [4.67, 0.37], [4.81, 0.36], [4.94, 0.35]], [[-0.19, 4.5], [-0.15, 4.4], [-0.11, 4.29], [-0.06, 4.2], [-0.02, 4.1], [0.03, 4.0], [0.08, 3.91], [0.12, 3.81], [0.17, 3.71], [0.25, 3.63], [0.36, 3.57], [0.46, 3.5], [0.59, 3.43], [0.72, 3.34], [0.83, 3.25], [0.94, 3.15], [1.04, 3.04], [1.19, 2.91], [1.3, 2.8], [1.4, 2.69], [1.49, 2.57], [1.55, 2.46], [1.61, 2.35], [1.67, 2.23], [1.77, 2.1], [1.9, 1.92], [2.03, 1.74], [2.17, 1.56], [2.29, 1.41], [2.41, 1.25], [2.53, 1.08], [2.65, 0.89], [2.77, 0.75], [2.86, 0.67], [2.97, 0.61], [3.08, 0.58], [3.2, 0.55], [3.33, 0.52], [3.46, 0.51], [3.59, 0.5], [3.72, 0.48], [3.84, 0.47], [3.97, 0.46], [4.1, 0.44], [4.23, 0.43], [4.36, 0.42], [4.5, 0.4], [4.63, 0.39], [4.76, 0.38], [4.9, 0.37]], [[-0.18, 4.47], [-0.14, 4.37], [-0.1, 4.27], [-0.05, 4.17], [-0.0, 4.08], [0.04, 3.98], [0.09, 3.88], [0.13, 3.79], [0.19, 3.69], [0.27, 3.61], [0.37, 3.55], [0.48, 3.48], [0.6, 3.41], [0.73, 3.32], [0.84, 3.22], [0.95, 3.13], [1.06, 3.02], [1.2, 2.89], [1.31, 2.78], [1.42, 2.67], [1.5, 2.55], [1.56, 2.44], [1.62, 2.33], [1.68, 2.22], [1.78, 2.08], [1.91, 1.9], [2.05, 1.72], [2.18, 1.54], [2.3, 1.39], [2.42, 1.23], [2.54, 1.06], [2.67, 0.88], [2.78, 0.73], [2.88, 0.66], [2.98, 0.6], [3.1, 0.56], [3.22, 0.53], [3.35, 0.51], [3.48, 0.49], [3.61, 0.48], [3.74, 0.47], [3.87, 0.45], [4.0, 0.44], [4.13, 0.43], [4.25, 0.41], [4.39, 0.4], [4.52, 0.38], [4.66, 0.37], [4.79, 0.36], [4.93, 0.35]], [[-0.18, 4.47], [-0.14, 4.37], [-0.1, 4.27], [-0.05, 4.17], [-0.0, 4.08], [0.04, 3.98], [0.09, 3.89], [0.13, 3.79], [0.19, 3.69], [0.27, 3.61], [0.37, 3.55], [0.48, 3.48], [0.61, 3.42], [0.73, 3.32], [0.84, 3.23], [0.96, 3.13], [1.06, 3.02], [1.2, 2.89], [1.31, 2.78], [1.42, 2.67], [1.5, 2.56], [1.56, 2.45], [1.62, 2.33], [1.68, 2.22], [1.78, 2.08], [1.91, 1.9], [2.05, 1.72], [2.18, 1.55], [2.3, 1.39], [2.42, 1.24], [2.54, 1.06], [2.67, 0.88], [2.78, 0.73], [2.88, 0.66], [2.98, 0.6], [3.1, 0.56], [3.22, 0.53], [3.35, 0.51], [3.48, 0.49], [3.61, 0.48], [3.74, 0.47], [3.87, 0.45], [4.0, 0.44], [4.13, 0.43], [4.25, 0.41], [4.39, 0.4], [4.52, 0.39], [4.66, 0.37], [4.79, 0.36], [4.93, 0.35]], [[-0.19, 4.47], [-0.15, 4.37], [-0.11, 4.27], [-0.06, 4.17], [-0.02, 4.08], [0.03, 3.98], [0.07, 3.88], [0.12, 3.79], [0.17, 3.69], [0.25, 3.61], [0.35, 3.55], [0.46, 3.48], [0.59, 3.41], [0.72, 3.32], [0.83, 3.23], [0.94, 3.13], [1.04, 3.03], [1.18, 2.9], [1.3, 2.78], [1.4, 2.67], [1.49, 2.56], [1.55, 2.45], [1.6, 2.33], [1.67, 2.22], [1.77, 2.08], [1.9, 1.91], [2.03, 1.73], [2.16, 1.55], [2.29, 1.39], [2.41, 1.24], [2.53, 1.06], [2.65, 0.88], [2.76, 0.73], [2.86, 0.66], [2.96, 0.6], [3.08, 0.56], [3.2, 0.53], [3.33, 0.51], [3.46, 0.5], [3.59, 0.48], [3.72, 0.47], [3.84, 0.46], [3.97, 0.44], [4.1, 0.43], [4.23, 0.41], [4.36, 0.4], [4.5, 0.39], [4.63, 0.37], [4.76, 0.36], [4.9, 0.35]], [[-0.18, 4.49], [-0.14, 4.39], [-0.1, 4.29], [-0.05, 4.19], [-0.01, 4.1], [0.04, 4.0], [0.08, 3.9], [0.13, 3.81], [0.18, 3.71], [0.26, 3.63], [0.36, 3.56], [0.47, 3.5], [0.6, 3.43], [0.72, 3.34], [0.84, 3.24], [0.95, 3.15], [1.05, 3.04], [1.19, 2.91], [1.3, 2.8], [1.41, 2.68], [1.49, 2.57], [1.55, 2.46], [1.61, 2.35], [1.68, 2.23], [1.78, 2.1], [1.91, 1.92], [2.04, 1.74], [2.17, 1.56], [2.3, 1.41], [2.42, 1.25], [2.54, 1.08], [2.66, 0.9], [2.77, 0.75], [2.87, 0.67], [2.97, 0.61], [3.09, 0.58], [3.21, 0.55], [3.34, 0.52], [3.47, 0.51], [3.6, 0.5], [3.73, 0.48], [3.86, 0.47], [3.99, 0.46], [4.11, 0.44], [4.24, 0.43], [4.37, 0.42], [4.51, 0.4], [4.64, 0.39], [4.78, 0.38], [4.91, 0.37]], [[-0.18, 4.5], [-0.15, 4.4], [-0.1, 4.3], [-0.06, 4.2], [-0.01, 4.1], [0.04, 4.0], [0.08, 3.91], [0.13, 3.81], [0.18, 3.72], [0.26, 3.63], [0.36, 3.57], [0.47, 3.5], [0.6, 3.44], [0.72, 3.34], [0.84, 3.25], [0.95, 3.15], [1.05, 3.04], [1.19, 2.91], [1.31, 2.8], [1.41, 2.69], [1.5, 2.57], [1.56, 2.46], [1.61, 2.35], [1.68, 2.24], [1.78, 2.1], [1.91, 1.92], [2.04, 1.74], [2.17, 1.56], [2.3, 1.41], [2.42, 1.25], [2.54, 1.08], [2.66, 0.9], [2.78, 0.75], [2.87, 0.67], [2.98, 0.61], [3.1, 0.58], [3.22, 0.55], [3.34, 0.53], [3.47, 0.51], [3.6, 0.5], [3.73, 0.49], [3.86, 0.47], [3.99, 0.46], [4.12, 0.45], [4.25, 0.43], [4.38, 0.42], [4.52, 0.41], [4.65, 0.4], [4.79, 0.38], [4.92, 0.37]], [[-0.17, 4.45], [-0.14, 4.35], [-0.09, 4.25], [-0.05, 4.16], [-0.0, 4.06], [0.04, 3.97], [0.09, 3.87], [0.14, 3.77], [0.19, 3.68], [0.27, 3.6], [0.37, 3.54], [0.48, 3.47], [0.61, 3.4], [0.74, 3.31], [0.85, 3.21], [0.96, 3.12], [1.06, 3.01], [1.21, 2.88], [1.32, 2.77], [1.42, 2.66], [1.51, 2.54], [1.57, 2.43], [1.62, 2.32], [1.69, 2.21], [1.79, 2.07], [1.92, 1.89], [2.05, 1.71], [2.19, 1.53], [2.31, 1.38], [2.43, 1.22], [2.55, 1.04], [2.68, 0.86], [2.79, 0.72], [2.89, 0.65], [2.99, 0.59], [3.11, 0.55], [3.23, 0.52], [3.36, 0.5], [3.49, 0.48], [3.62, 0.47], [3.75, 0.45], [3.88, 0.44], [4.01, 0.43], [4.14, 0.41], [4.27, 0.4], [4.4, 0.38], [4.54, 0.37], [4.68, 0.36], [4.81, 0.34], [4.95, 0.33]], [[-0.19, 4.51], [-0.15, 4.41], [-0.11, 4.31], [-0.06, 4.21], [-0.02, 4.11], [0.03, 4.02], [0.07, 3.92], [0.12, 3.82], [0.17, 3.73], [0.25, 3.64], [0.35, 3.58], [0.46, 3.51], [0.59, 3.44], [0.71, 3.35], [0.83, 3.26], [0.94, 3.16], [1.04, 3.06], [1.18, 2.92], [1.3, 2.81], [1.4, 2.7], [1.49, 2.58], [1.55, 2.47], [1.61, 2.36], [1.67, 2.25], [1.77, 2.11], [1.9, 1.93], [2.04, 1.75], [2.17, 1.57], [2.29, 1.42], [2.41, 1.26], [2.53, 1.09], [2.66, 0.91], [2.77, 0.75], [2.87, 0.68], [2.97, 0.62], [3.09, 0.58], [3.21, 0.55], [3.34, 0.53], [3.47, 0.51], [3.6, 0.5], [3.73, 0.49], [3.86, 0.48], [3.98, 0.46], [4.11, 0.45], [4.24, 0.44], [4.37, 0.42], [4.51, 0.41], [4.64, 0.4], [4.78, 0.39], [4.91, 0.37]], [[-0.19, 4.49], [-0.15, 4.38], [-0.11, 4.28], [-0.07, 4.18], [-0.02, 4.09], [0.03, 3.99], [0.07, 3.9], [0.12, 3.8], [0.17, 3.7], [0.25, 3.62], [0.35, 3.56], [0.46, 3.49], [0.59, 3.42], [0.71, 3.33], [0.83, 3.24], [0.94, 3.14], [1.04, 3.04], [1.19, 2.9], [1.3, 2.79], [1.4, 2.68], [1.49, 2.57], [1.55, 2.45], [1.61, 2.34], [1.67, 2.23], [1.77, 2.09], [1.9, 1.91], [2.04, 1.73], [2.17, 1.56], [2.29, 1.4], [2.41, 1.24], [2.53, 1.07], [2.66, 0.89], [2.77, 0.74], [2.87, 0.66], [2.97, 0.6], [3.09, 0.57], [3.21, 0.54], [3.34, 0.51], [3.47, 0.5], [3.6, 0.49], [3.73, 0.47], [3.86, 0.46], [3.98, 0.45], [4.11, 0.43], [4.24, 0.42], [4.37, 0.4], [4.51, 0.39], [4.64, 0.38], [4.78, 0.37], [4.91, 0.35]], [[-0.19, 4.5], [-0.15, 4.39], [-0.11, 4.29], [-0.06, 4.2], [-0.01, 4.1], [0.03, 4.0], [0.08, 3.91], [0.12, 3.81], [0.18, 3.72], [0.25, 3.63], [0.36, 3.57], [0.47, 3.5], [0.59, 3.44], [0.72, 3.34], [0.83, 3.25], [0.94, 3.15], [1.04, 3.05], [1.19, 2.92], [1.3, 2.8], [1.41, 2.69], [1.49, 2.58], [1.55, 2.47], [1.61, 2.35], [1.68, 2.24], [1.78, 2.1], [1.91, 1.93], [2.04, 1.75], [2.17, 1.57], [2.3, 1.41], [2.42, 1.26], [2.54, 1.08], [2.66, 0.9], [2.78, 0.75], [2.88, 0.68], [2.98, 0.62], [3.1, 0.58], [3.22, 0.55], [3.34, 0.53], [3.47, 0.51], [3.6, 0.5], [3.73, 0.49], [3.86, 0.47], [3.99, 0.46], [4.12, 0.45], [4.25, 0.43], [4.38, 0.42], [4.52, 0.41], [4.65, 0.4], [4.79, 0.39], [4.92, 0.37]], [[-0.21, 4.65], [-0.18, 4.54], [-0.13, 4.44], [-0.09, 4.33], [-0.04, 4.23], [0.01, 4.13], [0.05, 4.03], [0.1, 3.93], [0.15, 3.83], [0.22, 3.74], [0.33, 3.67], [0.43, 3.6], [0.55, 3.53], [0.67, 3.45], [0.78, 3.35], [0.9, 3.25], [1.0, 3.15], [1.14, 3.02], [1.25, 2.91], [1.36, 2.79], [1.44, 2.68], [1.5, 2.57], [1.56, 2.46], [1.62, 2.34], [1.72, 2.21], [1.85, 2.03], [1.98, 1.86], [2.1, 1.68], [2.23, 1.52], [2.34, 1.38], [2.46, 1.21], [2.58, 1.03], [2.69, 0.86], [2.79, 0.78], [2.89, 0.72], [3.0, 0.69], [3.12, 0.66], [3.24, 0.64], [3.36, 0.63], [3.48, 0.62], [3.61, 0.61], [3.73, 0.6], [3.86, 0.59], [3.98, 0.58], [4.11, 0.57], [4.24, 0.57], [4.37, 0.56], [4.5, 0.55], [4.63, 0.54], [4.76, 0.54]], [[-0.22, 4.61], [-0.18, 4.51], [-0.14, 4.4], [-0.09, 4.3], [-0.05, 4.2], [-0.0, 4.1], [0.05, 4.0], [0.09, 3.9], [0.14, 3.8], [0.21, 3.72], [0.3, 3.64], [0.41, 3.58], [0.52, 3.51], [0.64, 3.43], [0.75, 3.34], [0.86, 3.24], [0.96, 3.14], [1.1, 3.03], [1.22, 2.91], [1.32, 2.8], [1.41, 2.68], [1.47, 2.57], [1.53, 2.46], [1.59, 2.34], [1.69, 2.21], [1.81, 2.04], [1.94, 1.86], [2.07, 1.68], [2.19, 1.53], [2.31, 1.38], [2.42, 1.22], [2.54, 1.04], [2.66, 0.87], [2.75, 0.78], [2.85, 0.72], [2.96, 0.69], [3.08, 0.66], [3.2, 0.64], [3.32, 0.62], [3.44, 0.61], [3.56, 0.6], [3.69, 0.59], [3.81, 0.58], [3.94, 0.58], [4.06, 0.57], [4.19, 0.56], [4.31, 0.55], [4.44, 0.54], [4.57, 0.54], [4.7, 0.53]], [[-0.11, 4.41], [-0.07, 4.31], [-0.03, 4.21], [0.01, 4.12], [0.06, 4.02], [0.1, 3.93], [0.14, 3.84], [0.19, 3.74], [0.24, 3.65], [0.31, 3.57], [0.41, 3.51], [0.51, 3.44], [0.63, 3.38], [0.75, 3.3], [0.86, 3.2], [0.97, 3.11], [1.06, 3.02], [1.18, 2.9], [1.29, 2.79], [1.4, 2.68], [1.47, 2.57], [1.53, 2.46], [1.58, 2.36], [1.64, 2.24], [1.74, 2.11], [1.87, 1.94], [1.99, 1.76], [2.12, 1.59], [2.24, 1.44], [2.36, 1.29], [2.47, 1.12], [2.59, 0.94], [2.7, 0.8], [2.79, 0.73], [2.89, 0.67], [3.01, 0.63], [3.13, 0.61], [3.25, 0.59], [3.37, 0.57], [3.5, 0.56], [3.62, 0.55], [3.75, 0.54], [3.87, 0.53], [4.0, 0.52], [4.12, 0.51], [4.25, 0.5], [4.38, 0.49], [4.51, 0.48], [4.64, 0.47], [4.77, 0.46]], [[-0.09, 4.42], [-0.06, 4.32], [-0.02, 4.23], [0.03, 4.13], [0.07, 4.04], [0.11, 3.95], [0.16, 3.85], [0.2, 3.76], [0.25, 3.67], [0.32, 3.59], [0.42, 3.52], [0.52, 3.46], [0.64, 3.4], [0.75, 3.32], [0.86, 3.23], [0.97, 3.14], [1.06, 3.04], [1.18, 2.93], [1.29, 2.82], [1.4, 2.72], [1.47, 2.61], [1.53, 2.5], [1.59, 2.39], [1.65, 2.28], [1.75, 2.15], [1.87, 1.97], [2.0, 1.8], [2.13, 1.62], [2.25, 1.47], [2.37, 1.33], [2.48, 1.16], [2.6, 0.98], [2.72, 0.83], [2.81, 0.75], [2.91, 0.69], [3.03, 0.66], [3.15, 0.63], [3.27, 0.61], [3.39, 0.6], [3.52, 0.59], [3.64, 0.58], [3.77, 0.57], [3.9, 0.56], [4.02, 0.55], [4.15, 0.54], [4.28, 0.53], [4.41, 0.52], [4.55, 0.52], [4.68, 0.51], [4.81, 0.5]], [[-0.04, 4.32], [-0.01, 4.22], [0.03, 4.13], [0.07, 4.04], [0.11, 3.95], [0.16, 3.86], [0.2, 3.77], [0.24, 3.68], [0.3, 3.59], [0.37, 3.51], [0.47, 3.45], [0.58, 3.39], [0.7, 3.33], [0.82, 3.24], [0.93, 3.15], [1.03, 3.06], [1.12, 2.96], [1.24, 2.85], [1.35, 2.74], [1.46, 2.63], [1.53, 2.52], [1.58, 2.41], [1.64, 2.31], [1.7, 2.19], [1.8, 2.06], [1.93, 1.89], [2.06, 1.71], [2.19, 1.54], [2.31, 1.39], [2.43, 1.24], [2.55, 1.07], [2.67, 0.89], [2.78, 0.76], [2.88, 0.68], [2.98, 0.62], [3.1, 0.59], [3.22, 0.56], [3.35, 0.54], [3.47, 0.53], [3.6, 0.52], [3.73, 0.5], [3.86, 0.49], [3.99, 0.48], [4.12, 0.47], [4.25, 0.46], [4.39, 0.45], [4.52, 0.44], [4.66, 0.43], [4.79, 0.42], [4.93, 0.41]], [[-0.16, 4.48], [-0.12, 4.37], [-0.08, 4.28], [-0.03, 4.18], [0.01, 4.09], [0.05, 3.99], [0.1, 3.9], [0.14, 3.8], [0.19, 3.71], [0.26, 3.63], [0.35, 3.56], [0.45, 3.5], [0.56, 3.43], [0.67, 3.36], [0.78, 3.27], [0.88, 3.18], [0.98, 3.09], [1.11, 2.98], [1.21, 2.88], [1.31, 2.77], [1.4, 2.66], [1.45, 2.55], [1.51, 2.44], [1.57, 2.33], [1.67, 2.2], [1.79, 2.03], [1.92, 1.85], [2.04, 1.68], [2.16, 1.52], [2.28, 1.38], [2.39, 1.22], [2.5, 1.04], [2.62, 0.88], [2.71, 0.79], [2.81, 0.73], [2.92, 0.7], [3.03, 0.68], [3.15, 0.66], [3.27, 0.64], [3.39, 0.63], [3.51, 0.63], [3.63, 0.62], [3.75, 0.61], [3.87, 0.6], [3.99, 0.59], [4.12, 0.59], [4.25, 0.58], [4.37, 0.58], [4.5, 0.57], [4.63, 0.57]], [[-0.07, 4.37], [-0.04, 4.27], [0.0, 4.18], [0.04, 4.09], [0.09, 4.0], [0.13, 3.91], [0.17, 3.81], [0.21, 3.72], [0.26, 3.63], [0.34, 3.55], [0.43, 3.49], [0.53, 3.43], [0.65, 3.37], [0.75, 3.29], [0.86, 3.2], [0.96, 3.11], [1.06, 3.02], [1.17, 2.92], [1.28, 2.81], [1.38, 2.7], [1.45, 2.59], [1.51, 2.49], [1.56, 2.38], [1.62, 2.26], [1.72, 2.14], [1.85, 1.96], [1.97, 1.79], [2.1, 1.61], [2.21, 1.46], [2.33, 1.32], [2.44, 1.15], [2.56, 0.97], [2.67, 0.82], [2.76, 0.75], [2.86, 0.7], [2.97, 0.66], [3.08, 0.64], [3.2, 0.62], [3.33, 0.61], [3.45, 0.6], [3.57, 0.59], [3.7, 0.58], [3.82, 0.57], [3.94, 0.56], [4.07, 0.55], [4.19, 0.55], [4.32, 0.54], [4.45, 0.53], [4.58, 0.53], [4.71, 0.52]], [[0.01, 4.26], [0.05, 4.16], [0.09, 4.07], [0.13, 3.98], [0.17, 3.9], [0.21, 3.81], [0.25, 3.72], [0.29, 3.63], [0.35, 3.55], [0.42, 3.47], [0.52, 3.41], [0.62, 3.35], [0.74, 3.29], [0.86, 3.21], [0.96, 3.12], [1.06, 3.03], [1.15, 2.94], [1.25, 2.83], [1.36, 2.72], [1.46, 2.62], [1.53, 2.51], [1.58, 2.41], [1.63, 2.3], [1.7, 2.19], [1.79, 2.06], [1.92, 1.88], [2.05, 1.71], [2.17, 1.54], [2.29, 1.39], [2.41, 1.24], [2.52, 1.07], [2.64, 0.89], [2.74, 0.77], [2.84, 0.7], [2.94, 0.65], [3.05, 0.61], [3.17, 0.59], [3.3, 0.57], [3.42, 0.56], [3.55, 0.55], [3.68, 0.54], [3.8, 0.53], [3.93, 0.52], [4.06, 0.5], [4.19, 0.49], [4.32, 0.48], [4.45, 0.48], [4.58, 0.47], [4.72, 0.46], [4.85, 0.45]], [[-0.06, 4.39], [-0.03, 4.29], [0.02, 4.2], [0.06, 4.11], [0.1, 4.01], [0.14, 3.92], [0.18, 3.83], [0.23, 3.74], [0.28, 3.65], [0.35, 3.57], [0.44, 3.5], [0.54, 3.44], [0.66, 3.38], [0.77, 3.31], [0.88, 3.22], [0.98, 3.12], [1.07, 3.03], [1.18, 2.93], [1.29, 2.82], [1.39, 2.71], [1.47, 2.6], [1.52, 2.49], [1.58, 2.38], [1.64, 2.27], [1.74, 2.14], [1.86, 1.97], [1.99, 1.79], [2.11, 1.62], [2.24, 1.47], [2.35, 1.32], [2.47, 1.15], [2.58, 0.97], [2.69, 0.82], [2.79, 0.75], [2.88, 0.7], [3.0, 0.66], [3.11, 0.64], [3.23, 0.62], [3.36, 0.61], [3.48, 0.6], [3.61, 0.59], [3.73, 0.58], [3.86, 0.57], [3.98, 0.56], [4.11, 0.55], [4.24, 0.55], [4.37, 0.54], [4.5, 0.53], [4.63, 0.53], [4.76, 0.52]], [[0.03, 4.23], [0.07, 4.14], [0.11, 4.05], [0.14, 3.96], [0.18, 3.87], [0.22, 3.79], [0.26, 3.7], [0.31, 3.61], [0.37, 3.53], [0.44, 3.46], [0.54, 3.39], [0.65, 3.34], [0.77, 3.28], [0.88, 3.19], [0.99, 3.1], [1.08, 3.01], [1.17, 2.92], [1.27, 2.81], [1.38, 2.71], [1.48, 2.6], [1.54, 2.49], [1.6, 2.39], [1.65, 2.28], [1.72, 2.17], [1.81, 2.04], [1.94, 1.86], [2.07, 1.69], [2.19, 1.51], [2.31, 1.36], [2.43, 1.22], [2.55, 1.04], [2.67, 0.87], [2.77, 0.75], [2.86, 0.68], [2.96, 0.62], [3.08, 0.59], [3.2, 0.57], [3.33, 0.55], [3.46, 0.54], [3.59, 0.53], [3.72, 0.52], [3.84, 0.51], [3.97, 0.49], [4.1, 0.48], [4.23, 0.47], [4.36, 0.46], [4.5, 0.45], [4.63, 0.44], [4.77, 0.43], [4.9, 0.42]], [[-0.02, 4.31], [0.01, 4.22], [0.05, 4.13], [0.09, 4.04], [0.13, 3.95], [0.17, 3.86], [0.22, 3.77], [0.26, 3.68], [0.31, 3.59], [0.39, 3.51], [0.48, 3.45], [0.59, 3.39], [0.7, 3.33], [0.82, 3.25], [0.92, 3.16], [1.02, 3.07], [1.11, 2.98], [1.22, 2.87], [1.32, 2.77], [1.43, 2.66], [1.49, 2.55], [1.55, 2.44], [1.6, 2.34], [1.67, 2.22], [1.76, 2.09], [1.89, 1.92], [2.01, 1.75], [2.14, 1.57], [2.26, 1.42], [2.37, 1.28], [2.49, 1.1], [2.61, 0.93], [2.71, 0.8], [2.8, 0.73], [2.9, 0.67], [3.02, 0.64], [3.14, 0.61], [3.26, 0.59], [3.38, 0.58], [3.51, 0.57], [3.64, 0.56], [3.76, 0.55], [3.89, 0.54], [4.01, 0.53], [4.14, 0.52], [4.27, 0.51], [4.4, 0.5], [4.53, 0.5], [4.66, 0.49], [4.8, 0.48]], [[-0.05, 4.38], [-0.02, 4.28], [0.02, 4.19], [0.06, 4.09], [0.1, 4.0], [0.14, 3.91], [0.18, 3.82], [0.22, 3.73], [0.27, 3.64], [0.35, 3.56], [0.43, 3.49], [0.53, 3.43], [0.65, 3.37], [0.75, 3.3], [0.86, 3.21], [0.96, 3.12], [1.06, 3.03], [1.17, 2.93], [1.28, 2.82], [1.38, 2.71], [1.46, 2.6], [1.51, 2.49], [1.57, 2.38], [1.63, 2.27], [1.73, 2.14], [1.86, 1.96], [1.98, 1.79], [2.11, 1.61], [2.23, 1.46], [2.35, 1.31], [2.47, 1.14], [2.58, 0.96], [2.69, 0.81], [2.79, 0.74], [2.89, 0.68], [3.0, 0.65], [3.12, 0.63], [3.24, 0.61], [3.37, 0.6], [3.49, 0.59], [3.62, 0.58], [3.74, 0.57], [3.87, 0.56], [3.99, 0.55], [4.12, 0.54], [4.25, 0.53], [4.38, 0.53], [4.51, 0.52], [4.64, 0.51], [4.77, 0.5]], [[-0.03, 4.33], [0.01, 4.23], [0.04, 4.14], [0.08, 4.05], [0.13, 3.96], [0.17, 3.87], [0.21, 3.78], [0.25, 3.69], [0.3, 3.6], [0.37, 3.52], [0.46, 3.46], [0.56, 3.4], [0.68, 3.34], [0.79, 3.27], [0.9, 3.18], [0.99, 3.09], [1.09, 2.99], [1.2, 2.89], [1.31, 2.78], [1.41, 2.67], [1.48, 2.57], [1.54, 2.46], [1.59, 2.35], [1.66, 2.24], [1.76, 2.1], [1.88, 1.93], [2.01, 1.75], [2.14, 1.58], [2.26, 1.42], [2.38, 1.28], [2.5, 1.1], [2.61, 0.92], [2.72, 0.79], [2.82, 0.72], [2.92, 0.66], [3.03, 0.63], [3.15, 0.61], [3.28, 0.59], [3.4, 0.58], [3.53, 0.57], [3.66, 0.55], [3.79, 0.54], [3.91, 0.53], [4.04, 0.52], [4.17, 0.51], [4.3, 0.51], [4.43, 0.5], [4.56, 0.49], [4.7, 0.48], [4.83, 0.47]], [[-0.03, 4.33], [0.01, 4.23], [0.04, 4.14], [0.08, 4.05], [0.13, 3.96], [0.17, 3.87], [0.21, 3.78], [0.25, 3.69], [0.3, 3.6], [0.37, 3.52], [0.46, 3.46], [0.56, 3.4], [0.68, 3.34], [0.79, 3.27], [0.9, 3.18], [0.99, 3.09], [1.09, 2.99], [1.2, 2.89], [1.31, 2.78], [1.41, 2.67], [1.48, 2.57], [1.54, 2.46], [1.59, 2.35], [1.66, 2.24], [1.76, 2.1], [1.88, 1.93], [2.01, 1.75], [2.14, 1.58], [2.26, 1.42], [2.38, 1.28], [2.5, 1.1], [2.61, 0.92], [2.72, 0.79], [2.82, 0.72], [2.92, 0.66], [3.03, 0.63], [3.15, 0.61], [3.28, 0.59], [3.4, 0.58], [3.53, 0.57], [3.66, 0.56], [3.79, 0.54], [3.91, 0.53], [4.04, 0.52], [4.17, 0.51], [4.3, 0.51], [4.43, 0.5], [4.56, 0.49], [4.7, 0.48], [4.83, 0.47]], [[-0.04, 4.35], [-0.01, 4.25], [0.03, 4.16], [0.07, 4.07], [0.11, 3.98], [0.16, 3.89], [0.2, 3.79], [0.24, 3.7], [0.29, 3.62], [0.36, 3.54], [0.45, 3.47], [0.55, 3.41], [0.67, 3.35], [0.77, 3.28], [0.88, 3.19], [0.98, 3.1], [1.07, 3.01], [1.19, 2.91], [1.29, 2.8], [1.4, 2.69], [1.47, 2.58], [1.53, 2.47], [1.58, 2.36], [1.65, 2.25], [1.74, 2.12], [1.87, 1.94], [2.0, 1.77], [2.13, 1.59], [2.25, 1.44], [2.36, 1.29], [2.48, 1.12], [2.6, 0.94], [2.71, 0.8], [2.8, 0.73], [2.9, 0.67], [3.02, 0.64], [3.14, 0.61], [3.26, 0.6], [3.39, 0.58], [3.51, 0.57], [3.64, 0.56], [3.77, 0.55], [3.89, 0.54], [4.02, 0.53], [4.15, 0.52], [4.28, 0.52], [4.41, 0.51], [4.54, 0.5], [4.67, 0.49], [4.81, 0.48]], [[0.0, 4.3], [0.03, 4.2], [0.07, 4.11], [0.11, 4.02], [0.15, 3.93], [0.19, 3.84], [0.23, 3.75], [0.27, 3.66], [0.33, 3.58], [0.4, 3.5], [0.49, 3.44], [0.6, 3.38], [0.71, 3.32], [0.82, 3.24], [0.93, 3.15], [1.03, 3.07], [1.12, 2.97], [1.23, 2.87], [1.33, 2.76], [1.44, 2.65], [1.51, 2.54], [1.56, 2.44], [1.62, 2.33], [1.68, 2.21], [1.78, 2.08], [1.91, 1.91], [2.04, 1.73], [2.17, 1.55], [2.29, 1.4], [2.41, 1.25], [2.53, 1.08], [2.65, 0.9], [2.76, 0.78], [2.85, 0.71], [2.95, 0.65], [3.07, 0.61], [3.19, 0.59], [3.32, 0.57], [3.45, 0.56], [3.58, 0.55], [3.7, 0.54], [3.83, 0.53], [3.96, 0.52], [4.09, 0.51], [4.22, 0.5], [4.35, 0.49], [4.49, 0.48], [4.62, 0.47], [4.76, 0.46], [4.89, 0.45]]]
+        "pointsTrajectory": "UFZUUgEBAQL0AQAAMgAAAAIAAAB7FK5H4XqEPwAAAADqHOsc6xvsG+wa7RntGe0Y7hjuF+4X7xbvFe8V7xTvFO4T7hLuEu4R7hDuEO4P7g/uDu4O7g3vDe8N7w3vDe8O7w7vDu8O7w/vD+8P7xDuEO4Q7hDuEe0R7RHtEe0S7RLsEuwSjwDrAIoA4wCHAN0AggDWAH4A0AB5AMkAdgDCAHIAvABtALUAagCvAGYAqABhAKIAXgCdAFsAlwBYAJIAVQCMAFMAiABQAIMATgB+AEsAewBKAHkASQB2AEcAdQBGAHIARQBwAEQAbwBEAG8AQgBvAEMAbwBDAHAARAByAEUAcwBGAHQARwB2AEkAegBLAH8ATQCEAFAAigBTAI4AVgCUAFkAmQBbAJ8AXgCkAGIAqgBlALAAaAC2AGsAuwBuAMEAcgDHAHQAzQCKAFcAhgBVAIIAUgB+AE8AegBMAHYASgBxAEcAbgBEAGoAQgBlAD8AYgA8AF8AOgBbADcAVwA1AFQAMwBRADEATQAuAEoALABHACoARgApAEMAKABCACcAQQAlAD8AJQA+ACQAPQAjADwAIwA9ACMAPAAjAD4AJAA+ACQAPwAkAEAAJgBBACYAQwAnAEYAKABJACoATAAsAE4ALgBSADAAVAAyAFgAMwBbADUAXgA3AGEAOQBkADsAaAA9AGsAPwBuAEIAcgBEAFgA7f9WAO7/UwDv/1AA7/9OAPD/TADw/0oA8f9GAPL/RADx/0IA8v8/APP/PADz/zoA9P85APT/NgD1/zQA9f8zAPX/MQD2/y8A9v8tAPb/LQD2/ysA9/8qAPf/KgD3/ygA+P8pAPj/KQD5/ygA+P8pAPn/KgD5/ysA+f8rAPn/LAD4/ywA+f8uAPn/MAD4/zIA+P80APf/NgD3/zgA9/87APf/PAD3/z8A9v9BAPb/QwD2/0YA9v9HAPb/SgD1/0wA9P9OAPT//v8HAP7/BgD+/wYA/v8GAP7/BgD+/wYA/v8GAP//BQD//wYA//8FAP//BQD//wUA//8FAP//BQAAAAQA//8FAP//BQD//wQA//8FAAAABQAAAAUAAAAEAAEABQAAAAUAAQAEAAAABQAAAAQAAQAFAAEABQAAAAUAAQAFAAEABQABAAYAAQAFAAEABQABAAYAAQAGAAEABwABAAcAAQAGAAEABwACAAcAAQAIAAEACAACAAgAAQAIAAIACAABAAkAAQAJAAIACQD///v////8/////P8AAPz/AAD8/wAA/f8AAPz////9/////f8AAP7/AAD+/wAA/v8BAP7/AAD+/wAA/v8BAP7/AQD+/wEA//8BAP//AQD//wAA//8BAP//AQD//wEA//8BAAAAAQD//wEAAAABAP//AQD//wIAAAABAAAAAQAAAAEA//8CAAAAAQAAAAEAAAABAAAAAQD//wIA//8CAP//AQD//wEA//8BAP//AgD//wEA//8CAP//AQD//wIA//8CAP7/AgD+/wIAAQACAAAAAgAAAAIAAQACAAAAAgAAAAEAAQACAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAEAAgABAAIAAQABAAEAAQABAAIAAAABAAAAAgAAAAEAAQABAAEAAgABAAEAAAABAAEAAgAAAAEAAQACAAEAAQAAAAEAAAABAAAAAQAAAAAAAAABAAAAAQD//wEA//8AAP//AAAAAAAAAAABAP//AAD//wAA//8AAP//AAD+/////v8AAP7////+/wAA////////8//6//P/+//z//v/9P/6//T/+//0//v/9v/7//b//P/3//z/9//8//f//f/4//3/+P/9//j//f/4//7/+f/9//r//v/6//7/+v////v////7////+/////v////7//7/+/////z////7/////P////v////7////+/////z////7/wAA/P////v////7/wAA+/////v/AAD7////+v////r////6////+v////n//v/5////+f////n////5////+P/+//j//v8JAPr/CQD6/wkA+/8IAPz/CQD8/wkA/P8IAPz/CAD8/wcA/f8IAP3/BwD8/wcA/f8HAP3/BwD9/wcA/f8GAP7/BgD+/wYA/v8GAP7/BgD+/wYA/v8GAP7/BgD+/wYA//8GAP//BgD//wYA//8GAP//BgD//wcA//8HAP//BgD//wcA//8HAP//BwD//wcA//8HAP//CAD+/wcA//8IAP//CAD//wkA//8JAP7/CQD//woA//8KAP7/CQD+/woA/v8KAP//CwD+//7/BQD+/wUA/v8EAP7/BAD+/wQA/v8EAP7/BAD+/wQA//8DAP7/BAD//wQA//8EAP//BAD//wQA//8EAAAAAwAAAAMAAAADAAAAAwAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAMAAAAEAAAAAwAAAAQAAAAEAAAABAAAAAQAAAADAAAABAAAAAQAAAADAAAABAD//wQAAAADAAAABAD//wQA//8EAP//BAD//wQA//8EAP//BQD//wQA//8EAP//BAD+/wUA+v8AAPv/AQD7/wEA/P8BAPv/AQD8/wEA/P8BAP3/AgD9/wIA/f8BAP3/AgD9/wIA/v8CAP7/AgD//wIA/v8DAP//AwD//wMA//8DAP//AwD//wMAAAADAAAAAwAAAAMAAQADAAEABAABAAQAAQAFAAIABAABAAUAAgAFAAIABQACAAYAAgAGAAIABQACAAYAAgAGAAMABwADAAcAAwAHAAQABwADAAgAAwAIAAQACAADAAgABAAIAAQACQAEAAkABAAJAAUACgD7//T/+//0//z/9P/7//X//P/2//z/9v/9//f//P/2//z/9//9//j//f/4//7/+P/+//n//v/5//7/+f/+//n//v/6////+v////v////6////+/////v////7////+/////z//v/7////+/////v////7////+//+//v////7//7/+v/+//r//v/6//7/+v/+//r//f/5//3/+f/9//j//P/4//3/9//8//f//P/2//z/9v/7//b//P/1//v/9f/7//X/+v/0/wEAAwABAAMAAAADAAEAAwABAAMAAQADAAAAAwABAAMAAQADAAEAAwABAAMAAQADAAEAAwABAAMAAQADAAEAAwABAAIAAQADAAEAAgABAAMAAQADAAEAAwABAAMAAQADAAEAAgACAAMAAgADAAEAAwABAAMAAQACAAIAAgABAAMAAgADAAIAAwABAAMAAQADAAEAAgACAAMAAgADAAEAAwACAAMAAQADAAIAAwABAAQAAQAEAAIAAwABAAQAAQAEAAIABAACAAMA+v8DAPr/AgD7/wMA+/8CAPv/AgD7/wMA/P8CAPz/AwD8/wMA/P8CAP3/AgD8/wMA/f8CAP3/AwD9/wMA/v8DAP7/AwD+/wMA/v8DAP//AwD//wMA//8DAP//AwD//wMA//8DAP//AwD//wMAAAADAP//BAAAAAQA//8EAP//AwD//wQA//8EAAAABAAAAAQAAAAFAP//BAD//wQA//8EAP//BQD//wUA//8FAP//BQD//wUA/v8FAP//BQD//wUA/v8FAP7/BgAGAPb/BgD3/wYA9/8GAPj/BgD3/wYA9/8GAPj/BgD4/wYA+P8GAPn/BQD6/wUA+f8FAPr/BQD6/wUA+v8FAPv/BAD7/wQA+/8EAPv/BAD8/wQA+/8EAPv/BAD8/wQA/P8EAPz/BAD8/wQA/P8EAPz/BAD8/wQA/P8EAPz/BQD8/wUA/P8EAPv/BAD8/wQA+/8EAPr/BQD6/wQA+v8FAPr/BQD5/wUA+f8FAPn/BQD4/wYA+P8GAPn/BgD4/wYA+P8GAPf/BwD3//n//v/5//7/+f/+//n//v/6////+v8AAPr/AAD6/wAA+v8AAPv/AAD7/////P8AAPv/AAD8/wAA/P8AAPz/AAD9/wAA/f8AAP3/AQD9/wAA/f8BAP3/AQD9/wAA/f8AAP3/AQD9/wEA/f8BAP3/AQD+/wAA/f8AAP3/AAD9/wAA/P8AAP3/AAD9/wAA/P8AAPz/AAD8/wAA/P8AAPv/AAD7////+/////v////7/wAA+v////r////5////+v////r////5////BAAEAAQABAAEAAQABAAEAAMABAADAAMABAADAAQAAwAEAAMAAwADAAQAAwADAAMABAADAAQAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwAEAAMABAADAAQAAwAEAAQABAADAAQAAwAEAAMABAADAAMABAAEAAQABAAEAAQABAAEAAQABAAEAAQAAwAFAAQABAAEAAQABAAEAAQABQAEAAUABQAFAAUABQAFAAUABAAFAAUABQAEAAYABQAFAAUABQAFAAYABQD2//P/9v/0//f/9P/3//X/+P/1//j/9v/4//b/+P/3//n/9//6//j/+f/4//r/+P/6//n/+v/5//z/+v/8//r//P/7//3/+//9//v//f/8//3//P/9//z//v/9//7//f/+//3////+/////v////7/AAD+/wAA/v8AAP//AAD//wEA//8BAAAAAQAAAAEA//8CAAAAAgAAAAIAAAACAAAAAgAAAAMAAAACAAAAAgAAAAMAAAADAAEAAwAAAAMAAAAEAAEAAwAAAPn/AgD5/wEA+f8CAPr/AQD6/wIA+v8BAPr/AgD7/wEA+/8CAPv/AgD8/wIA/P8CAPz/AgD9/wIA/P8CAPz/AgD9/wIA/f8CAP3/AgD+/wIA/v8CAP7/AwD9/wMA/v8CAP7/AwD+/wIA/v8DAP7/AwD+/wMA/v8EAP//AwD+/wQA//8DAP//AwD+/wMA/v8EAP7/BAD+/wQA/v8EAP7/BAD+/wQA/f8EAP7/BAD+/wUA/f8FAP7/BAD9/wUA/f8FAP3/BQD9/wYA/P/5//3/+v/9//n//f/6//3/+v/+//v//v/7//7//P/+//v//v/7//7//P////3////9/////f////3/AAD9/////f////7/AAD+/wAA/v8AAP7/AAD+/wEA/v8AAP//AQD+/wAA//8AAP7/AQD//wEA//8BAP7/AAD//wEA/v8AAP//AAD//wEA//8BAP7/AQD9/wAA/f8BAP3/AAD9/wAA/f8AAP3/AAD9/wAA/P8AAPz////9/wAA/P8AAPz////8/wAA+/8CAP//AgD+/wIA//8CAP//AgD//wIA//8CAP//AgD//wIAAAACAAAAAgAAAAIAAAACAAAAAgAAAAMAAAACAAEAAwABAAMAAQACAAEAAgABAAIAAQADAAEAAgABAAMAAAACAAEAAwABAAMAAQACAAEAAgABAAIAAQADAAAAAwABAAMAAQADAAAAAgAAAAIAAQACAAEAAgABAAIAAQADAAEAAwABAAMAAQADAAEAAwABAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAEABwABAAgAAQAIAAEABwABAAcAAQAHAAEABwABAAYAAQAGAAEABgACAAYAAQAFAAIABQABAAYAAQAGAAEABQABAAUAAQAEAAEABQABAAUAAQAFAAAABAABAAQAAAAEAAEABAAAAAQAAAAEAAAAAwAAAAMAAAADAP//BAD//wMA//8CAP7/AwD+/wMA/v8CAP7/AgD+/wIA/v8CAP3/AgD9/wIA/f8CAP3/AgD8/wIA/f8CAP3/AgD8/wIA/P8CAPz/AgD8/wIA+P/6//n/+v/5//r/+f/7//n/+//6//v/+v/7//r//P/7//z/+//9//v//f/8//3/+//+//z//f/8//3//P/9//z//v/8/////f/+//3//v/9//7//f////3////9/////f////3//v/9/////v////3//v/9/////f/+//3//v/8/////f/+//3//v/9//7//P/+//z//f/8//3//P/9//v//f/7//z/+//8//v//P/6//z/+v/8//r//P/6//z/+v/7//n//P8FAP3/BAD9/wQA/f8EAP3/BQD9/wQA/v8EAP7/BAD+/wQA/v8EAP3/AwD+/wMA//8EAP7/BAD+/wMA//8EAP//BAD//wQA//8EAP//BAD//wQAAAAEAP//AwD//wQAAAAEAP//BAAAAAQA//8DAP//BAAAAAQA//8EAAAABAAAAAQA//8EAAAABAD//wQA//8FAP//BQAAAAQA//8FAP//BQD//wYA//8FAP//BQD//wYA//8GAP//BgD//wYA/v8GAP//BgD+////AAAAAAAAAAAAAAAAAQAAAAEAAAAAAAAAAAABAAEAAAABAAAAAQABAAEAAQABAAEAAQAAAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAAAAgAAAAEAAQABAAEAAQAAAAEAAAABAAAAAAD//wAAAAAAAAAA/////wAA//8AAP////////////////7////+//7//v////7////+//7//f/+//3//v/9//7//f/+//3//f/9//7//f/9//z//v/9//7//v/+//3//v/+//7//v////7//v/+//////////7//////////v//////AAD//wAA//8AAP//AAD//wAA//8AAP//AQD//wAAAAABAAAAAAAAAAAAAAAAAAAAAAAAAAEAAAABAAEAAAAAAAAAAAABAAEAAQAAAAEAAAABAAEAAAAAAAAAAAABAP//AAAAAAAAAAAAAAAAAAD//wAAAAD//wAAAAAAAAAAAAD//wAA//8AAAAAAAAAAAAA///7////+/////v////7////+/////v/AAD8/////P8AAPz////8/wAA/f8AAPz/AAD9/wEA/v8AAP7/AAD+/wEA/v8AAP7/AQD+/wEA/v8BAP//AQD+/wEA//8CAP7/AQD//wEA//8CAP7/AQD+/wEA/v8CAP7/AgD//wEA/v8BAP//AQD+/wEA/v8BAP7/AQD+/wEA/v8BAP7/AQD+/wEA/v8BAP7/AQD9/wEA/f8BAP3/AQD9/wEA/f8BAPz/AAD8/wAA/P8BAAgABAAIAAMACAADAAcAAwAIAAMABwADAAcAAwAHAAMABwADAAcAAwAGAAMABwADAAcAAwAGAAMABgADAAUAAwAFAAMABgACAAYAAwAGAAMABQADAAYAAwAFAAIABQADAAUAAwAFAAMABgADAAYAAwAGAAMABgADAAUAAwAGAAMABQADAAYAAwAGAAMABgADAAYAAwAHAAMABgADAAYAAwAGAAQABwADAAcABAAHAAMABwADAAcAAwAHAAQACAAEAAgABAAIAAMA+//6//z/+v/7//v//P/7//z/+//9//v//P/8//z/+//9//z//f/8//7//P/9//z//f/8//3//f/9//3////9/////v/+//7//v/+//7//f////7//v/+//////////7////+/////v/+//7////+//7//v////7////+//7//v////7////+//7//v/+//3//v/9//7//f/+//3//v/9//7//P/9//z//f/8//7//P/9//z//f/8//3/+//9//v//f/7//3/+/////z//v/9/////f////3////9/////f8AAP3////+/////v////7////+/wAA//8AAP//AAD//wAA//8AAP//AAD//wAA//8BAP//AQAAAAAA//8BAP//AAD//wEAAAAAAAAAAQD//wEA//8AAAAAAQD//wAA//8AAP//AQD//wAA//8AAP//AAD+/wAA//8AAP7////+/////v////3////+/wAA/v8AAP3////9/////f////3////9/////f/+//z//v/8//v/AgD8/wIA/P8CAPz/AgD8/wMA/P8DAPz/AwD9/wMA/f8DAP3/AwD9/wMA/f8CAP7/AwD+/wMA/v8DAP7/AwD+/wMA//8DAP7/AwD//wMA//8EAP//BAD//wMA//8DAAAAAwD//wQAAAAEAAAABAAAAAQAAAAEAAAABQAAAAQAAAAEAAAABQAAAAUAAAAFAAAABgABAAYAAQAGAAEABgABAAYAAAAGAAAABgAAAAcAAQAHAAAABwAAAAcAAAAHAAEACAABAAgA/f////3////9/////f////3////9/////f////7////+/////v////7////+/wAA/v8AAP7/AAD//wAA/v8AAP7/AAD+/wAA//8AAP7/AAD+/wAA/v8AAP//AQD+/wAA/v8BAP//AAD+/wAA/v8AAP7/AAD+/wEA//8AAP7/AAD//wAA/v8AAP7/AAD+/wAA/v////3////9/////f8AAP3////9/////f8AAP3////9/////f////3////9/////f////z///8CAPj/AgD4/wIA+P8CAPj/AgD4/wIA+f8DAPn/AgD5/wIA+f8CAPr/AgD6/wMA+v8CAPr/AwD6/wIA+v8CAPv/AwD7/wMA/P8CAPz/AwD8/wMA/P8DAPv/AgD7/wMA/P8DAPz/AgD8/wMA/P8DAPz/AwD8/wMA+/8CAPv/AwD8/wIA/P8DAPv/AwD7/wMA+v8CAPv/AwD6/wMA+v8DAPn/AwD6/wMA+v8DAPn/AwD5/wIA+P8DAPj/AwD4/wMA9/8CAPf/AwD3/wEABQABAAUAAQAFAAEABQABAAYAAQAFAAEABQABAAUAAQAFAAEABAABAAUAAQAFAAEABAAAAAUAAQAFAAEABAAAAAQAAAAEAAEABAAAAAMAAAADAAAABAABAAQAAAAEAAAAAwAAAAMA//8DAAAAAwD//wMA//8DAAAAAwD//wIA//8CAP7/AgD+/wIA/v8CAP7/AQD+/wIA/f8CAP3/AgD9/wEA/f8BAP3/AQD9/wEA/f8BAPz/AQD8/wAA/P8BAPz/AQD8/wAA+P/8//j//P/5//z/+f/9//r//P/6//3/+f/9//r//f/6//7/+//+//v//f/7//7/+//+//z//v/7//7//P/+//3////8//7//P/+//3////9/////f////z////9/////f////3////9/////P////3////9/////P/+//z////8//7//P/+//z//v/8//7//P/+//v//f/7//3/+//9//r//P/6//z/+v/8//n//P/5//z/+f/7//n//P/4//v/+P/7//j/+/8CAP//AgD//wIA//8CAP//AgD//wIA//8CAP//AgAAAAIA//8CAAAAAgAAAAIAAAADAAAAAgAAAAMAAAACAAEAAgAAAAMAAQADAAEAAgABAAIAAQACAAEAAwABAAIAAAACAAEAAwABAAMAAQADAAAAAgABAAMAAQADAAEAAwAAAAMAAQADAAEAAwAAAAIAAAACAAAAAgAAAAMAAAADAAAAAwABAAMAAAADAAAAAwAAAAMAAAAEAAAAAwAAAAMAAAAEAAAAAwAAAAEA/v8BAP//AQD//wEA//8BAP//AQD//wIAAAABAP//AgAAAAEA//8CAAAAAgAAAAIAAAACAAAAAgABAAMAAAACAAEAAgABAAIAAQADAAEAAwABAAMAAQADAAEAAwACAAMAAQADAAIAAwACAAMAAgAEAAIAAwACAAMAAwAEAAMABAACAAQAAgAEAAMABQADAAUAAwAFAAMABQADAAUAAwAGAAMABQAEAAUAAwAGAAMABgADAAYABAAGAAMABwAEAAYAAwAHAAQA+/////v////7/////P////v/AAD8/////P////3/AAD8/wAA/f8AAP3/AAD9/wAA/f8BAP7/AQD9/wAA/f8BAP7/AAD+/wAA/v8BAP7/AQD+/wEA/v8BAP7/AQD//wEA//8BAP7/AQD//wEA//8CAP//AQD//wEA//8BAP7/AQD//wIA//8CAP//AQD+/wEA/v8BAP//AQD+/wEA/v8BAP7/AQD//wEA/v8CAP7/AQD+/wEA/f8BAP7/AQD9/wEA/v8BAP3/AQADAPr/AwD5/wMA+v8CAPr/AwD5/wMA+/8DAPv/AgD6/wMA+v8DAPv/AwD7/wMA+/8DAPz/AwD8/wQA/P8DAPz/AwD9/wMA/f8DAP3/AwD9/wQA/f8EAP3/AwD9/wMA/f8DAP7/BAD9/wMA/v8DAP3/AwD9/wMA/f8DAP3/BAD9/wMA/P8DAPz/AwD9/wMA/P8EAPz/AwD8/wMA+/8DAPv/AwD7/wMA+v8EAPr/AwD7/wMA+v8EAPn/AwD6/wQA+f8DAPn/BAD4////CQAAAAoA//8JAAAACQAAAAoAAAAJAAAACQABAAkAAAAJAAAACQAAAAkAAAAJAAAACAAAAAgAAAAJAAEACAABAAgAAQAIAAEACAABAAgAAQAIAAEACAABAAgAAQAIAAEACAABAAgAAQAIAAIACAABAAkAAgAJAAIACAABAAgAAQAJAAIACAABAAgAAgAIAAEACQABAAkAAgAJAAEACQABAAkAAQAKAAEACgACAAkAAQAKAAEACwABAAoAAQALAAEACwABAAwA+f/5//n/+f/6//r/+f/5//r/+f/6//r/+v/6//r/+//7//v/+//7//v/+//7//v/+//7//z/+//8//v//P/8//z//P/8//z//f/8//z//f/8//3//P/9//3//f/9//3//f/8//z//f/9//z//P/9//3//P/8//z//P/8//z//P/8//z//P/8//z//P/7//z/+//7//v/+//7//v/+//7//v/+v/7//r/+v/6//r/+v/7//r/+v/5//r/+f/5//j/+v/5//n/+P8BAPz/AAD8/wAA/P8BAP3/AAD9/wAA/P8BAP3/AQD9/wEA/f8BAP3/AQD9/wEA/v8BAP7/AQD+/wEA/v8BAP7/AQD+/wEA/v8AAP7/AQD9/wEA/v8BAP7/AQD+/wAA/v8BAP7/AQD+/wAA/v8BAP7/AAD+/wEA/v8AAP7/AAD+/wEA/f8AAP3/AAD8/wAA/f8AAPz/AAD8/wAA/P8AAPz/AAD8/////P8AAPv////7////+/////v////7/wAA+/////r////6/wAAAQABAAEAAQABAAEAAAABAAEAAQABAAAAAAAAAAEAAAABAAAAAQABAAEAAQABAAEAAQAAAAEAAQABAAEAAQABAAEAAQACAAEAAgABAAIAAQABAAEAAQAAAAEAAQABAAAAAgABAAEAAQABAAEAAQABAAEAAAABAAEAAQABAAEAAAABAAAAAQABAAEAAQAAAAAAAQAAAAAAAAABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA//8AAP////////////8AAAAA+v8AAPr/AAD7/wAA+/8BAPv/AQD7/wEA/P8BAPz/AQD8/wEA/P8BAPz/AgD8/wEA/f8BAP3/AgD9/wIA/f8CAP3/AgD+/wEA/v8BAP7/AgD+/wIA/v8CAP7/AgD+/wIA/v8CAP7/AgD+/wMA/v8CAP7/AgD+/wIA/v8CAP7/AgD+/wIA/v8CAP7/AgD+/wIA/v8CAP7/AgD9/wIA/v8CAP3/AgD+/wIA/f8CAP3/AgD9/wIA/f8CAP3/AgD9/wIA/f8CAPz/AgD///v////7//7/+/////z////7/////P////z////8/wAA/P8AAP3/AAD9/wAA/f8AAP7/AAD9/wAA/v8AAP7/AAD+/wAA/v8AAP7/AAD+/wAA/v8AAP7/AQD+/wEA/v8BAP7/AQD+/wEA/v8AAP7/AQD+/wEA/v8BAP3/AAD9/wAA/f8BAP3/AAD9/wAA/f8AAPz/AAD9/wAA/P////z/AAD8////+/////v/AAD8////+/////v////7////+/////v////5/wAABgABAAYAAQAGAAAABQABAAYAAQAFAAEABgABAAUAAQAGAAEABQABAAUAAQAFAAEABQABAAUAAQAFAAEABQABAAUAAQAFAAEABQABAAUAAQAFAAEABQABAAUAAQAFAAEABAABAAUAAQAEAAEABQABAAUAAQAEAAAABQABAAUAAQAFAAAABQAAAAUAAAAEAAEABQABAAQAAQAEAAEABAAAAAUAAQAFAAEABQAAAAQAAQAFAAAABQAAAAUAAAAFAAAABQAAAAYAAwD3/wIA+P8DAPj/AwD5/wIA+P8DAPn/AwD5/wMA+v8DAPn/AwD6/wMA+v8DAPv/AwD6/wQA+/8DAPv/AwD7/wQA+/8DAPz/BAD8/wQA/P8EAPz/BAD8/wMA/P8DAPz/BAD9/wMA/P8DAP3/BAD8/wMA/P8DAPz/BAD8/wQA/P8EAPz/BAD7/wQA+/8EAPz/BAD7/wQA+/8EAPv/BAD7/wUA+v8EAPr/BAD6/wUA+v8EAPn/BQD5/wUA+f8FAPn/BQD4/wUA+P8BAAAAAQD//wEAAAABAP//AQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAEAAQAAAAEAAAACAAAAAQABAAIAAAABAAEAAQAAAAEAAQABAAEAAgABAAIAAQABAAAAAQABAAIAAAABAAEAAgABAAIAAQABAAAAAQAAAAEAAAABAAAAAQAAAAEA//8BAAAAAAAAAAAA//8BAP//AAD//wEA//8BAP//AQD//wEA//8AAP//AQD//wEA/v8BAP//AQD///z//P/8//3//P/8//z//f/9//3//f/9//z//f/9//3//f/+//3//v/+//7//f/+//7//v/+/////v////7////+/////v//////////////////////////////////////AAAAAAAA//8AAP////////////////////////////////////////////////7//v////7////+//7//v/+//7//v/+//7//v/9//3//v/9//7//f/9//z//f/9//3//P/9//z//v/9//7//f/+//7////+/////v////7/AAD+/wAA/v//////AAD//wAA//8AAP//AAAAAAAAAAABAAAAAQAAAAEAAAABAAEAAQABAAIAAQACAAEAAgABAAIAAgACAAIAAgABAAIAAQACAAIAAwACAAMAAgACAAIAAwACAAMAAgADAAIAAwACAAMAAgADAAIABAACAAMAAgADAAIABAACAAQAAgAEAAIABAACAAUAAgAEAAIABAACAAQAAgAFAAIABQACAAUAAgD2/wEA9/8BAPf/AQD3/wEA9/8BAPf/AQD3/wIA+P8CAPn/AQD5/wIA+f8CAPr/AwD6/wIA+v8CAPr/AgD6/wMA+/8DAPv/AgD7/wIA+v8DAPv/AwD7/wMA+/8CAPv/AwD7/wMA+/8DAPz/AgD7/wMA+/8DAPz/AgD7/wMA+/8CAPv/AgD7/wIA+/8CAPr/AQD6/wEA+v8CAPr/AgD5/wIA+f8BAPn/AQD5/wEA+P8CAPj/AQD4/wEA+P8BAPf/AQD3/wEA9/8BAPz/+P/8//j//f/4//3/+f/9//n//f/5//7/+f/9//r//v/6//7/+v/+//v//v/6//7/+/////v////7////+/////v////8/////P8AAPz////8/////P////3/AAD8/wAA/f8AAPz////9/wAA/P8AAPz////9/wAA/P8AAPz/AAD8/wAA/P8AAPv/AAD8/wAA/P8AAPr/AAD6/wAA+v8AAPv////6////+v8AAPn/AAD6/wAA+f8AAPn////4////+f////j//P////z/AAD7/wAA/P////z/AAD9/wAA/P8AAP3/AAD9/wEA/f8AAP3/AQD+/wEA/v8BAP3/AQD+/wIA/v8CAP7/AgD//wIA//8CAP//AgD//wIA//8CAAAAAgD//wIA//8CAP//AwAAAAIAAAADAP//AwAAAAIAAAADAAAAAwAAAAIAAAADAAAAAwAAAAIAAAACAAAAAwAAAAMAAAADAAAAAgABAAMAAQADAAAAAwAAAAMAAAADAAAAAwABAAQAAQADAAAAAwACAAMAAgACAAMAAgACAAMAAgACAAIAAwACAAIAAgACAAEAAgACAAIAAgABAAEAAgABAAEAAgACAAEAAQABAAIAAQACAAEAAgABAAIAAQACAAEAAgACAAIAAQACAAEAAgACAAIAAgACAAIAAwACAAIAAwADAAMAAwADAAMAAwADAAQABAAEAAMABAAEAAQABAAEAAUABQAFAAUABQAFAAUABgAGAAUABQAGAAUABgAGAAcABgAHAAcABwAHAAcABgAHAAcACAAHAAAA/P8AAP3/AAD9/wAA/f8AAP3/AAD9/wAA/v8AAP3/AAD9/wAA/v8AAP7/AAD+/wEA/v8AAP7/AQD+/wEA/v8BAP7/AAD+/wEA/v8AAP7/AQD+/wAA/v8AAP7/AQD+/wAA/v8AAP7/AAD+/wAA/v8AAP3/AAD9/wAA/f8AAP3////9/////f////z////8////+/////v////7////+//+//r////7//7/+v/+//r//v/5//7/+f/+//n//v/5//7/+P/+//n/AwADAAMAAgACAAMAAwACAAMAAgADAAIAAwACAAMAAwADAAMAAgACAAMAAgADAAIAAgADAAMAAgACAAMAAgACAAIAAgADAAIAAgACAAMAAgACAAIAAgADAAIAAgACAAIAAgACAAIAAgACAAEAAgACAAEAAQABAAIAAQABAAEAAQACAAAAAgAAAAIAAAACAAEAAQAAAAEAAAABAAAAAQD//wEAAAABAP//AQAAAAEA//8BAAAAAQD//wEA//8BAP//AQD//wEA/v8BAP//AQAAAAIA//8BAAAAAQAAAAEAAAABAAAAAQAAAAIAAAACAAAAAQABAAEAAAACAAAAAQABAAIAAAACAAEAAgABAAEAAQACAAEAAgABAAIAAQACAAAAAgABAAIAAQACAAEAAgABAAIAAQACAAEAAgABAAIAAAACAAAAAgAAAAEAAAABAAAAAQAAAAEA//8CAAAAAgD//wEA//8CAAAAAgD//wEA//8CAP//AgD//wEA/v8CAP//AQD+/wEA/v8BAP7/AQD///r/BAD7/wQA+v8EAPv/BAD7/wQA+/8EAPz/BAD7/wQA+/8EAPz/BQD8/wQA/f8FAPz/BQD9/wQA/P8FAPz/BAD9/wQA/f8EAP3/BQD8/wUA/f8EAP3/BQD9/wQA/f8FAP3/BAD9/wQA/f8EAP3/BAD9/wQA/f8EAP3/BAD9/wQA/f8EAP3/BAD9/wQA/f8EAPz/BAD8/wQA/P8EAPv/AwD8/wQA/P8EAPv/AwD7/wQA+/8EAPr/AwD7/wQA+/8EAPv/BAD7/wMAAAD6/wAA+v8AAPr/AAD6/wAA+/8AAPv/AAD7/wEA+/8BAPv/AAD7/wEA/P8BAPz/AQD8/wEA/P8BAPz/AgD9/wEA/f8CAP7/AQD9/wIA/f8CAP7/AgD9/wIA/v8BAP3/AgD+/wIA/v8CAP7/AgD+/wIA/v8CAP3/AgD9/wIA/f8CAP3/AgD9/wIA/P8CAPz/AgD7/wIA/P8CAPv/AgD7/wEA+/8CAPv/AgD7/wIA+v8CAPr/AgD6/wIA+v8CAPr/AgD6/wEA+f/9//7//f/+//7//v/9//7//v/+//7////+/////v////7/AAD//wAA//8AAP//AAAAAAAA//8BAAAAAQAAAAAAAAABAAAAAAABAAEAAQABAAAAAQABAAIAAQABAAEAAgABAAEAAQABAAEAAgABAAEAAgABAAIAAgACAAIAAgACAAIAAgACAAIAAgACAAIAAgADAAIAAgACAAMAAgADAAMAAwACAAMAAgADAAIAAwACAAQAAwAEAAMAAwACAAMAAgADAAIABAADAPL/9v/y//b/8v/3//T/9//0//f/9P/3//X/+P/1//j/9v/4//b/+f/2//n/9v/5//b/+v/3//r/9//6//j/+//4//v/+P/8//j//P/5//z/+f/8//n//P/6//3/+v/8//r//f/6//3/+v/9//r//f/6//3/+v/9//r//f/6//3/+//9//v//P/7//3/+v/8//r//P/6//z/+v/8//r/+//6//v/+f/7//n/+//5//v/+P/6//j/+v/5//r/+P/6//j/+v/4//n/BgAAAAYAAAAHAAEABgABAAYAAQAGAAEABgABAAYAAQAGAAEABgABAAYAAQAGAAIABgABAAYAAQAGAAIABgACAAYAAgAGAAEABgABAAYAAgAGAAIABgACAAUAAQAGAAIABgACAAYAAgAGAAEABgACAAYAAQAGAAEABgABAAcAAQAGAAAABgABAAYAAAAGAAAABgABAAcAAAAGAAAABwAAAAcAAAAHAAAABwAAAAgAAAAIAAAACAAAAAgA//8JAP//CAD//wgA///8/wIA/P8DAPz/AgD8/wIA/P8DAP3/AwD9/wMA/f8DAP3/AwD9/wMA/f8DAP7/AwD+/wMA/v8EAP7/AwD9/wMA/v8DAP7/BAD//wQA/v8DAP//AwD+/wMA//8EAP7/AwD+/wMA//8DAP//BAD//wMA//8DAP//AwD//wMA/v8DAP7/AwD//wMA//8DAP//AwD//wIA//8DAP//AwD+/wMA/v8DAP//AwD//wMA/v8DAP7/AwD//wMA/v8DAP7/AwD//wMA//8DAPz/+P/9//f//P/4//3/+f/9//j//f/4//3/+P/+//n//f/6//7/+v/+//r//v/6//7/+/////v////7/wAA/P////z/AAD8/////P8AAP3/AAD9/wAA/f8AAPz/AQD9/wEA/f8AAP3/AQD9/wEA/f8BAP3/AQD9/wIA/f8CAP3/AgD9/wIA/P8CAP3/AgD9/wIA/f8CAPz/AwD8/wMA/P8DAPz/AwD8/wMA+/8DAPv/BAD7/wMA+/8EAPz/AwD7/wMA+/8DAPv///8FAP//BgD//wUA//8FAAAABgAAAAYA//8GAP//BgAAAAUAAAAFAAAABgAAAAYAAAAGAAAABQAAAAYA//8FAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAEAAAABAAAAAQAAAAFAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAFAAAABAAAAAQAAAAEAP//BAAAAAQAAAAEAAAABQACAAEAAgABAAIAAQACAAEAAgABAAEAAQACAAIAAgACAAIAAgACAAIAAgACAAIAAQACAAEAAQACAAIAAQACAAIAAgACAAEAAgACAAIAAQABAAEAAgACAAEAAQACAAEAAQABAAEAAgABAAEAAQABAAAAAQAAAAEAAAABAAAAAQD//wEA//8AAP7/AAD//wEA/v8BAP7/AAD+/wAA/v8AAP3/AAD9/wAA/f8AAPz/AAD9/wAA/f8AAPz/AAD8/wAA/P8AAPv/AAD7/////f/+//3////9/////f/+//3////+/////f////3////+/////v8AAP7//////wAA//8AAP7/AAD//wAA/v8AAP7/AAD//wAA//8BAP//AQD//wAA//8BAP//AQAAAAEAAAABAAAAAQD//wEA//8BAP//AgD//wEA//8BAP//AgD//wIA//8CAP7/AgD//wIA//8CAP7/AgD+/wIA//8DAP7/AgD+/wMA/v8DAP7/AgD+/wMA/v8DAP7/AwD+/wMA/v8DAP3//////////////wAA//8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQAAAAAAAAABAAAAAQABAAAAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAP//AAD//wAA//8AAP//AAD//wAA/v////3////9/wAA/v8AAP3/AAD8/////f8AAPz////9/////P8AAPv////8////+/////v////7////+//7/wIA/P8CAPz/AgD8/wIA/P8DAPz/AgD9/wMA/f8DAP3/AgD9/wMA/f8DAP7/AwD9/wMA/v8DAP7/BAD+/wMA//8EAP7/BAD//wQA/v8EAP7/BAD//wQA//8EAP//BAD//wQA//8EAP//BAD//wMA//8DAP//AwD//wMAAAAEAP//AwD//wMAAAAEAAAAAwAAAAMAAAADAP//AwD//wMAAAADAP//AwD//wIAAAADAP//AwD//wIAAAADAP//AgD//wMA//8DAAAA+f8AAPn/AAD6/wAA+v8AAPn/AAD6////+v////r/AAD7/wAA+/8AAPv/AAD7/wEA+/8AAPv/AAD7/wEA/P8AAPv/AAD8/wAA/P8BAPv/AQD8/wEA+/8AAPz/AAD7/wAA+/8AAPv/AAD6/wAA+v8AAPr/AAD6/wAA+f////j////4/wAA+P////f////3//7/9v/+//b////2////9f/+//T//v/0//7/9P/9//P//v/z//7/8//9//L//v/y//3/8f/9//D/AAAGAAAABgAAAAUAAAAGAAAABgABAAYAAQAGAAEABgABAAYAAQAGAAEABgABAAcAAQAHAAIABwABAAcAAQAHAAEABwACAAYAAgAGAAEABwACAAYAAQAHAAIABgACAAcAAgAHAAIABwACAAcAAgAHAAIABgACAAYAAgAHAAMABgADAAYAAgAGAAIABgACAAYAAwAGAAMABQACAAYAAgAGAAMABgADAAYAAwAGAAMABgADAAYAAwAGAAMABgADAAYABAAGAAQABwD5//v/+v/7//r//P/6//z/+//9//r//f/7//z/+//9//v//f/8//7//P/+//z//v/8//7//P/+//3//v/9//7//f////3////9/////v////3/AAD+/////v8AAP7////+/////v////7////+/////v////7//v/+//7//v////7//v/+//3////9/////f/+//3//v/9/////P/+//3//v/9//7//P/+//z//v/8//7//P/+//z//v/7//7//P/+//v//v/7//7/AwD+/wQA/v8EAP//BAD//wQA//8EAP//BQD//wQA//8EAP//BAD//wQA//8EAP//BAAAAAUA//8FAP//BQAAAAQAAAAFAAAABQD//wUAAAAEAP//BAD//wQA//8EAP//BAD//wQA//8DAAAAAwAAAAMAAAAEAAAAAwAAAAMAAAADAAAAAwD//wMA//8DAAAAAwAAAAMA//8DAAAAAgAAAAIAAAADAAAAAgAAAAIA//8CAAAAAgAAAAIA//8BAP//AgD//wEAAwD+/wIA/v8DAP7/AgD+/wIA/v8CAP7/AgD+/wMA//8CAP//AgD//wMAAAADAP//AwAAAAIA//8DAP//AwD//wIAAAACAP//AgD//wMA//8CAP//AwAAAAMA//8DAAAAAwD//wMA//8DAP//AwD//wMA//8DAP7/AwD+/wMA/f8DAP3/AwD9/wQA/f8EAPz/BAD8/wMA/P8EAPv/BAD7/wMA+/8EAPv/BAD7/wQA+/8FAPr/BAD6/wQA+v8FAPr/BQD5/wUA+v/+/wEA/v8BAP7/AQD//wIA//8CAP//AgD//wIA//8CAAAAAwAAAAIA//8CAAAAAwAAAAIAAAADAAAAAwAAAAMAAQADAAEAAwABAAQAAQAEAAEABAABAAMAAQAEAAEAAwABAAQAAQADAAIAAwACAAIAAgACAAIAAgACAAIAAgACAAIAAgADAAIAAgABAAMAAgACAAEAAwABAAMAAgADAAEABAABAAMAAAAEAAEABAAAAAMAAQAEAAAABAABAAQAAAAEAAEABAAAAPv//f/8//7//P/+//z//f/8//7//P/+//z////8/////P/+//3////+/wAA/f////3/AAD+/wAA/v8AAP7/AAD+/wAA/v8BAP7/AAD+/wAA//8BAP//AQD//wAA//8BAAAAAQAAAAAA//8AAAAAAQAAAAAAAAAAAAEAAAABAAAAAQAAAAEA//8CAAAAAQD//wIA//8CAP//AgD//wIA//8CAP//AwD//wIA/v8DAP//AwD+/wMA//8EAP7/AwD+/wQA/v8EAP///f8DAP3/AgD9/wMA/f8DAP3/AwD+/wMA/v8DAP7/AwD+/wMA/v8EAP7/AwD//wQA//8EAP//AwD//wQA//8EAP//BAD//wMA//8EAP//BAD//wMA//8DAP//AwD//wMA/v8CAP//AwD//wIA/v8BAP//AgD//wEA//8BAP//AQD//wAA//8AAP7///////////////////////7///////7//v/+//7//v/+//7//f/+//3//v/9//3//f/+//7//v/9//7//P/9//z//f/9//7//f/+//3//v/9//7//f/+//3//v/9//7//v/+//3//v/+//7//v/+//7//v/+//7//v/+//7//v/+//7//v////7////+//7//v/+//7//v/+/////v////7////9/wAA/f8AAP3////8/////f////z////7////+/////v/AAD7////+v////r////5////+f////n/AAD4////+P8AAPj////4/wAA9/////b/AAD3/wAA9v////b////2//7/AQD+/wEA/f8AAP3/AQD9/wEA/v8BAP7/AQD+/wEA/v8BAP7/AgD+/wEA/v8BAP//AQD+/wIA/v8BAP//AgD//wEA//8CAP7/AQD+/wEA//8BAP//AQD//wIA/v8BAP//AQD//wAA//8AAP//AAD///////////////////7/AAD+/wAA/f////z/AAD7/wAA+/8AAPr/AAD6/wAA+f////n/AAD4////9/8AAPf////3/wAA9/8AAPb////2/wAA9v8AAPb/AQAGAAEABgABAAYAAQAGAAEABQAAAAYAAQAFAAEABgABAAUAAAAEAAAABQAAAAUAAAAEAAAABAAAAAQA//8DAP//BAD//wQAAAAEAAAABAD//wQAAAAEAAAAAwAAAAMAAAACAAAAAwAAAAIAAQABAAIAAQACAP//AgD//wIA//8CAP7/AgD+/wMA/v8DAP7/AwD9/wMA/v8EAP3/BAD8/wUA/P8FAP3/BQD9/wUA/P8GAP3/BgD8/wYA/P8HAPz/BwD7/wcA+/8DAAsAAgAKAAIACgACAAoAAgAKAAIACQABAAkAAAAIAAAACAABAAgAAQAHAAAABwD//wcA//8HAP//BgAAAAYA//8GAP//BQD+/wUA/v8EAP//BAD+/wQA/v8EAP7/AwD+/wMA/v8CAP7/AQD+/wAA/v8AAP//AAD////////+/////v////3////8/////P////z/AAD7////+/////v////6////+f8AAPn/AAD5/wAA+P8AAPn/AAD4/wAA+P8AAPn/AQD5////AwAAAAQAAAAEAAAAAwAAAAMA//8DAP//AwAAAAMAAAADAP//AwD//wMA//8CAAAAAwAAAAIAAAADAP//AwAAAAIA//8CAAAAAgAAAAIA//8BAP//AQAAAAEAAAAAAAAAAAAAAP//AQD//wEA//8BAP//AQD+/wEA/v8CAP7/AgD9/wIA/f8DAPz/AwD8/wMA/P8DAPv/AwD7/wQA+/8EAPv/BAD7/wQA+/8EAPv/BAD7/wQA+v8EAPv/BQD7/wUA+/8FAPr//v8FAP3/BAD9/wQA/f8EAP3/BAD+/wQA/v8EAP3/BAD9/wQA/v8DAP3/AwD+/wMA/f8DAP3/AwD9/wMA/f8CAP3/AwD+/wIA/f8CAP3/AgD+/wIA/v8CAP7/AQD+/wEA//8AAP//AAD//wAA/////////v////7/AAD+/////f8AAP3/AQD8/wAA/P8BAPz/AQD7/wEA+/8BAPr/AQD6/wEA+v8CAPn/AgD5/wIA+P8CAPn/AwD5/wMA+f8DAPj/AwD4/wMA+P/8/wcA/P8GAPz/BgD8/wYA/P8GAPz/BgD8/wUA/f8FAPz/BQD8/wYA/f8FAPz/BQD8/wUA/f8FAP3/BAD9/wUA/P8EAPz/BAD9/wQA/f8EAPz/BAD9/wMA/P8CAP3/AgD9/wIA/f8BAP3/AAD+/wAA//////////////3////8////+/////v/AAD6/wAA+f8BAPn/AAD5/wEA+P8BAPf/AgD3/wEA9/8BAPf/AgD3/wIA9v8CAPf/AwD2/wIA9v8DAPX/AwD2/wQACQAFAAoABAAJAAQACQAEAAkABAAIAAMACQADAAgABAAIAAMABwADAAcAAwAHAAMABgADAAYAAwAGAAMABgADAAUAAwAFAAIABAADAAQAAwADAAMAAwAEAAIABAABAAQAAAAFAP//BgD+/wYA/f8GAP3/BgD7/wcA+/8IAPv/CQD6/wkA+f8KAPn/CgD4/woA9/8LAPf/DAD3/wwA9/8MAPb/DQD2/w4A9v8OAPf/DwD2/w8A9f8QAPX/EQD2/xEA9f8SAPT/+P8JAPj/CQD5/wkA+P8IAPj/CAD4/wgA+f8HAPn/BwD5/wcA+f8HAPn/BwD5/wcA+v8GAPn/BgD5/wYA+f8FAPr/BQD6/wUA+v8EAPr/AwD7/wMA+/8BAPz/AQD8/wAA/P8AAP3////9//7//v/9//7/+/8AAPv/AAD6/wAA+P8AAPf/AQD2/wEA9f8CAPX/AwD0/wMA8v8DAPL/BADx/wQA8v8EAPL/BQDx/wUA8P8FAPD/BgDw/wUA8f8GAPD/BgDx/wYA8P/5/xIA+f8RAPn/EQD6/xAA+f8PAPn/DwD5/w8A+f8PAPn/DQD6/w0A+f8MAPr/DAD5/wwA+f8LAPr/CgD6/woA+v8KAPr/CQD6/wkA+v8IAPv/BwD8/wYA+/8FAPz/BQD9/wMA/f8CAP//AQD//wAAAQD//wAA/v8BAP3/AwD8/wMA+/8EAPn/BAD5/wUA+P8FAPf/BgD3/wYA9v8HAPf/CAD2/wgA9v8IAPb/CQD2/woA9/8KAPf/CgD2/wsA9v8LAPX/CwD1//f/CQD2/wgA9v8IAPb/CAD3/wcA9/8HAPf/BgD3/wYA9/8GAPf/BgD4/wYA9/8FAPj/BQD4/wQA+P8EAPj/BAD5/wIA+f8CAPr/AQD7/wEA+/////v//v/8//3//P/8//3//P/+//v////5/wAA+P8AAPf/AgD2/wMA9P8DAPP/BADy/wUA8v8GAPD/BgDv/wcA7/8IAO7/CADv/wkA7v8JAO//CgDv/woA8P8LAPD/CwDv/wsA7v8MAO3/DADs/w0A7P8OAOz//f8VAP7/FAD9/xMA/f8TAPz/EgD8/xEA/f8RAP3/EAD9/xAA/f8PAPz/DgD9/w0A/f8NAP3/DQD9/w0A/v8LAP3/CwD9/woA/v8JAP7/BwD//wYA//8FAAAABQAAAAQAAQADAAIAAgACAAEAAwAAAAUA//8FAP3/BgD8/wcA+/8JAPr/CQD5/woA+P8LAPj/DAD3/wwA+P8NAPj/DQD6/w4A+f8PAPn/EAD4/xAA+P8RAPf/EgD3/xMA9/8TAPf/FAD2/xQA9f/6/xIA+f8RAPr/EAD5/w8A+v8PAPn/DgD4/w4A+P8NAPn/DAD4/wsA+f8LAPn/CwD5/woA+v8JAPn/CAD5/wcA+v8HAPr/BgD6/wYA+/8EAPv/AwD7/wMA+/8BAPz/AQD8/wAA/v/+//7//f////z////6/wAA+v8AAPj/AgD3/wIA9v8CAPX/AwDz/wQA8/8EAPT/BAD0/wUA9f8FAPT/BQD0/wUA9P8GAPP/BgDy/wYA8v8GAPL/BwDx/wcA8P8HAPD/CADw//n/HAD6/xwA+v8bAPr/GwD6/xoA+v8ZAPr/FwD6/xcA+f8WAPn/FQD5/xQA+f8UAPn/EgD5/xIA+v8SAPn/EgD5/xEA+v8RAPr/EAD6/w8A+v8OAPz/DQD8/w0A/P8LAP3/CgD9/wkA//8HAP//BQAAAAUAAQADAAIAAgACAAAAAwD+/wQA/f8FAP3/BQD8/wUA+/8GAPz/BgD7/wcA+/8IAPv/CAD6/wgA+v8IAPr/CQD6/wkA+f8JAPn/CgD5/wsA+f8LAPn/+P8RAPf/EQD3/xAA+P8PAPj/DwD4/w4A+P8OAPj/DQD4/wwA+f8MAPn/DAD5/woA+f8KAPn/CgD5/wkA+v8IAPr/BwD6/wUA+/8DAPv/AgD8/wEA/P8AAPz////9/////v/+////+/////v/AAD5/wEA9/8BAPb/AgD0/wMA8/8EAPL/BQDx/wUA7/8GAPH/BgDz/wYA8v8HAPL/BwDx/wcA8f8IAPD/CADv/wkA7v8JAO7/CgDu/woA7v8LAO7/CwDt/wwA7P/3/xUA+P8UAPj/FAD5/xMA+f8SAPr/EgD5/xEA+f8QAPn/EAD5/w8A+f8OAPn/DQD6/w0A+v8MAPr/CwD6/woA+v8JAPv/CQD8/wYA/f8FAP3/BAD9/wQA/v8DAP//AgD//wAAAAD//wEA/v8DAP3/AwD7/wQA+v8FAPn/BgD3/wYA9v8HAPX/CAD0/wgA9v8JAPX/CgD1/woA9f8LAPX/CwDz/wwA8/8MAPP/DQDz/w4A8v8PAPL/DwDx/xAA8f8QAPD/EADw/+v/HADr/xsA7P8aAOv/GQDs/xgA7f8XAO7/FgDv/xUA8P8UAO//EwDw/xEA8f8RAPH/EADy/w8A9P8NAPX/CwD2/woA9/8IAPj/BwD6/wYA+/8FAPz/AwD9/wIA/f8BAP//AAABAP7/AgD8/wMA+v8FAPn/BgD3/wcA9f8IAPT/CQDz/woA8f8KAPP/CwDz/wwA8/8MAPP/DQDy/w0A8f8PAPH/DwDw/xAA8P8RAPD/EQDw/xEA7v8TAO7/EwDt/xQA7f8VAOz/7/8ZAPD/GQDw/xgA8P8XAPD/FgDw/xUA8f8UAPH/EwDx/xIA8v8RAPL/EQDy/xAA8/8PAPT/DQD0/wwA9f8MAPb/CwD2/wgA9/8HAPf/BgD4/wUA+f8EAPr/AwD7/wMA/P8BAP3/AAD+//7////8/wAA+/8CAPr/AwD4/wQA9v8FAPb/BQD0/wUA9/8GAPb/BQD2/wcA9f8HAPT/CAD0/wcA9P8IAPT/CQDz/wgA8/8JAPL/CgDy/woA8v8LAPH/CwDx/wsA8f/z/wYA8/8FAPP/BQD0/wUA8/8FAPP/BQD0/wUA9P8FAPT/BQD1/wQA9f8EAPb/AwD2/wMA9v8DAPf/AwD4/wIA+f8BAPr/AQD7/wEA/P8AAP3/AAD9/wAA/f8AAP7//v8AAP7/AQD9/wMA/f8EAP3/BQD8/wYA+/8HAPv/CAD7/wkA+v8KAPv/CwD7/wsA/P8MAPv/DAD7/w0A/P8NAPv/DwD7/w8A+/8QAPv/EQD6/xIA+v8SAPv/EwD6/xMA+v8UAPr/FQD5//H/AADy/wAA8v8AAPL/AAD0/wAA9P8AAPP/AQD0/wEA9P8BAPT/AQD0/wEA9P8BAPX/AQD2/wEA9/8BAPf/AAD4/wAA+v8AAPv/AAD8/wAA/P8AAP7/AAD//wAAAAAAAAEAAAACAAAABAD//wUA//8HAP//CAD//woA/v8LAP//CwD//wwA/v8NAAAADgD//w8AAAAQAAAAEQD//xIAAAASAP//EwD//xQA//8VAAAAFQAAABYA//8XAP//GAAAABkA//8ZAP//7/8DAO//AwDw/wMA8f8DAPD/AwDx/wMA8v8CAPL/AgDz/wIA8/8CAPP/AgDz/wMA8/8DAPT/AwD0/wMA9f8EAPb/AwD2/wMA9/8DAPj/AwD5/wMA+f8DAPr/AwD7/wMA/f8CAP7/AwD//wMAAQADAAEAAwADAAMABAAEAAUAAwAHAAQACAAEAAkAAgAJAAMACgADAAsAAwALAAQADAADAAwABAANAAQADQAEAA4ABAAPAAQAEAAEABAABQAQAAQAEAAFABIABQD0/w8A9f8PAPX/DgD1/w4A9v8NAPb/DQD2/wwA9/8MAPf/DAD3/wsA9/8KAPf/CQD4/wkA+P8JAPj/CAD5/wcA+f8HAPr/BgD7/wUA+/8FAP3/BAD+/wMA/v8DAP//AwAAAAIAAQABAAIAAQADAAAABQAAAAYA//8IAP3/CQD+/wkA/P8KAP3/CgD+/wwA/v8NAP7/DQD+/w4A/f8OAP3/DwD9/xAA/f8RAP3/EQD8/xIA/f8SAP3/EwD8/xQA/P8VAPz/FQD8//f/BAD2/wQA9/8EAPf/BAD3/wQA+P8DAPj/BAD4/wMA+P8DAPn/AwD5/wMA+f8DAPn/AgD6/wIA+/8BAPv/AQD8/wAA/P8AAPz/AAD+/////v////7///////7/AAD+/wAA/v8CAP3/AwD8/wQA/P8FAPv/BgD6/wYA+v8GAPr/BwD6/wcA+v8IAPz/CAD8/wgA/P8JAPv/CQD8/woA/P8LAPz/CwD8/wsA/P8MAPz/DAD7/w0A+/8NAPv/DgD8/w8A+/8PAPv/8v/6//L/+v/y//r/8//6//T/+//0//v/9f/7//X//P/1//v/9f/8//b//P/2//z/9v/8//b//P/2//3/9//9//j//f/4//3/+f/9//n//f/6//3/+v/9//v//f/7//z//P/8//3//P/+//z//v/7////+/8AAPv/AQD7/wIA+v8CAPv/AwD7/wMA+/8DAPv/BAD6/wQA+/8FAPr/BQD6/wUA+v8GAPr/BgD6/wYA+v8HAPr/BwD5/wcA+f8HAPj/BwD5/wgA+f///wgA//8HAP//BwD//wYA//8GAP//BgD//wYA//8FAAAABQAAAAUAAAAFAAEABQACAAUAAwADAAQAAgAEAAEABAABAAUAAQAFAAAABQAAAAUAAAAGAAAABgD//wcAAAAIAP//CAD+/wgA/v8KAP7/CgD9/wsA/f8LAP3/CwD9/wwA/P8MAP7/DAD+/w0A/v8OAP7/DgD+/w8A/v8QAP7/EQD+/xEA/v8SAP7/EwD9/xMA/f8UAP7/FQD+/xUA/v8WAP3/FwD9//b/AQD3/wEA9/8BAPf/AQD3/wEA9/8BAPj/AQD4/wEA+P8BAPj/AQD5/wEA+f8BAPn/AQD5/wEA+f8CAPn/AgD5/wIA+f8CAPr/AgD6/wIA+v8CAPr/AgD6/wMA+v8CAPr/AgD6/wMA+/8CAPr/AwD7/wMA+/8DAPv/AwD8/wMA/P8DAPz/AwD8/wMA/P8DAPv/AwD8/wMA+/8DAPv/AwD6/wMA+v8DAPr/AwD6/wQA+v8EAPn/BAD5/wQA+v8EAPn/BAD5/wUA9/8FAPf/BQD3/wUA+P8EAPj/BAD5/wQA+P8DAPn/AwD5/wQA+v8DAPr/AwD6/wMA+f8DAPr/AwD6/wIA+/8CAPv/AgD8/wIA/P8CAPz/AgD9/wIA/f8BAP7/AQD9/wIA/v8CAP//AQD+/wEA//8BAP//AQD//wAAAAAAAAAAAAABAAAAAQD//wIA//8CAP//AgD//wIA//8CAP//AgAAAAMA//8DAP//AwD//wMA//8DAP//BAD//wQA//8DAP//BAD//wMA/v/4//v/+P/7//n/+//4//3/+f/8//n//P/5//z/+f/9//r//P/6//z/+v/9//r//f/7//3/+v/9//v//v/7//3//P/9//z//v/8//7//f/+//3//f/9//7//f/+//7//f/+//3//v/+/////v8AAP3/AAD+/wAA/v8BAP7/AQD9/wEA/f8BAP//AQD//wEA//8CAP//AQD//wIA//8CAP7/AgD//wIA//8CAP//AgD//wIA//8CAP//AgD//wMA//8DAP//AwD//wYA6v8GAOv/BQDs/wYA7P8FAOz/BQDt/wYA7v8FAO7/BQDv/wUA8P8FAPD/BwDw/wkA7/8KAPD/CQDv/woA8P8JAPH/CADx/wgA8v8IAPP/BwD1/wcA9v8GAPb/BQD4/wQA+f8EAPr/AwD8/wEA/v8BAP7/AAABAP3/AgD8/wUA+/8GAPv/BgD6/wcA+v8HAPn/CAD5/wkA+P8JAPj/CgD3/woA9/8KAPb/CwD2/wsA9v8MAPX/DAD1/wwA9P8NAPP/DQD0/w4AAwAGAAMABQADAAUAAgAFAAMABQADAAUAAgAFAAMABQADAAUAAwAFAAQABAAFAAQABAADAAQAAwAFAAMAAwADAAMAAwADAAQAAgAFAAEABQABAAUAAAAFAAAABwD//wYA/v8IAPz/CQD7/woA+v8LAPn/DQD3/w4A9v8QAPX/EQD0/xIA8/8QAPP/EADx/xEA8P8SAPD/EgDv/xMA7v8TAO3/FADs/xUA7P8VAOr/FgDp/xYA6f8YAOj/GQDn/xkA5v8bAOX/GwAKAPb/CgD2/woA9v8KAPb/CgD3/wkA9/8KAPf/CgD2/woA9v8MAPX/DgD1/w4A9P8PAPX/DgDz/w4A8/8OAPT/DQD1/w0A9P8MAPX/CwD1/woA9v8KAPf/CQD2/wkA+P8IAPj/CAD5/wcA+f8GAPr/BAD7/wIA/P8CAP3/AAD9/////v///wAA/v8AAP7/AQD+/wEA/f8BAP3/AQD8/wIA/f8CAPz/AgD8/wIA/P8CAPv/AwD7/wIA+v8CAPr/AwD7/wIA+v8DAAcA+P8HAPj/BwD4/wgA+P8HAPj/CAD4/wgA9/8JAPj/CwD3/wsA+P8LAPf/CwD4/woA9v8LAPf/CQD3/wkA+P8JAPj/CAD5/wgA+f8IAPr/BwD6/wYA+v8GAPv/BgD7/wUA/P8DAPz/AwD9/wEA/v8AAP//AAD///7/AQD9/wIA/P8CAPv/BAD6/wUA+v8FAPn/BQD5/wYA+f8GAPj/BgD3/wYA9/8HAPb/BwD2/wgA9v8HAPX/CAD1/wkA9f8IAPP/CQDz/wkA+P8OAPn/DgD5/w4A+P8NAPn/DQD4/w0A+P8NAPf/DQD2/wwA9/8MAPf/DAD3/wsA+P8MAPj/CwD5/woA+f8JAPn/CQD5/wgA+v8IAPr/BwD6/wcA+/8HAPv/BwD7/wYA+/8GAPz/BgD8/wYA/f8FAPz/BQD9/wUA/f8EAP7/AwD+/wQA/v8CAP7/AgD+/wIA//8CAP7/AgD+/wMA//8CAP7/AgD+/wIA/v8CAP7/AgD+/wMA/v8CAP7/AgD9/wMA/v8DAP7/AwADAPv/AgD8/wIA+/8CAPz/AgD8/wIA+/8CAPz/AgD7/wMA/P8DAPv/BAD7/wQA+v8EAPn/BAD5/wQA+v8EAPn/BAD5/wUA+f8FAPn/BQD5/wYA+f8GAPn/BgD4/wYA+f8GAPj/BwD3/wcA9/8GAPf/BwD3/wcA9v8GAPb/BgD2/wcA9v8GAPn/BgD5/wcA+f8GAPn/BwD4/wcA+P8HAPn/CAD5/wgA+P8JAPn/CQD4/wkA9/8JAPj/CgD3/wsA9/8KAPb/CgD2//r/BwD7/wYA+/8HAPz/BgD7/wYA/P8GAPz/BQD8/wYA+/8FAPz/BQD8/wUA/f8FAP3/BQD9/wUA/v8EAP7/BQD//wQA//8EAP//BAAAAAQAAAAEAAAAAwAAAAQAAAADAAEAAwABAAMAAgACAAMAAgACAAEAAgACAAMAAQADAAIAAwABAAQAAQAFAAEABAAAAAUAAAAFAAAABQAAAAUAAAAFAAAABgAAAAUA//8FAP//BgAAAAYA//8GAP//BgD//wcAAAAHAP//9f8BAPT/AgD1/wEA9f8BAPb/AQD2/wEA9v8CAPb/AQD2/wMA9v8DAPf/AwD3/wMA+P8DAPn/AwD5/wMA+v8DAPr/AwD8/wMA/f8DAP3/AwD9/wIA/v8DAP7/AgD//wMAAAACAAAAAwAAAAMAAQADAAIAAwACAAMAAgADAAMAAgADAAIAAwABAAMAAQADAAEAAwABAAMAAQAEAAEABAAAAAQAAAAEAAAABAAAAAUAAQAEAAAABQAAAAQAAQAEAAAABQAAAAUAAADv//n/8P/5//H/+v/x//r/8f/6//H/+v/y//r/8v/7//L/+//x//z/8P/9//H//v/x//7/8v/+//P////z//7/9P/+//T////0//7/9P////X////1////9v////b//v/2////9v/+//b////3//7/9//+//f//f/4//7/9//+//f//v/4//3/9//8//f//f/3//3/9//9//X//P/1//z/9f/8//T//P/0//z/8//7//T/+//z//v/8//6//L/+//x//r/8f/6/wYAAgAHAAEABgABAAYAAgAGAAEABwACAAYAAwAHAAMACAACAAoAAQAMAAEADAABAAwAAQAMAAEACwABAAwAAQAMAAEADAABAAwAAQANAAEADAABAAwAAQAMAAEADAABAA0AAAANAAAADgD//w0AAAANAAAADgAAAA0AAAANAP//DgD//w4A//8PAP//DwD+/w8A/v8PAP7/EQD+/xEA/v8SAP3/EgD9/xMA/f8UAPz/EwD8/xQA/P8VAPz/FgD7/xYA/P8XAPz/+P8FAPf/BQD4/wUA+P8FAPn/BQD5/wUA+v8EAPr/BAD5/wUA+f8HAPn/BgD5/wYA+v8HAPn/BwD7/wcA+/8HAPv/BwD7/wYA/P8HAPz/BgD9/wYA/f8GAP3/BgD9/wYA/f8GAP3/BgD9/wYA/v8FAP7/BAD+/wQA/v8DAP//BAD+/wMA/v8AAP7/AAD//////////////v/+//7//v/+//3//v/+//3//f/9//3//f/9//3//f/9//z//f/8//3//P/8//v//P/+/wIA//8DAP7/AwD//wIA//8DAP//AwD//wMA//8DAAEAAwABAAIAAQADAAIAAwABAAIAAgACAAIAAgACAAIAAgACAAIAAgACAAEAAgACAAIAAgACAAEAAwABAAMAAQACAAEAAwAAAAIAAAACAAAAAgAAAAIAAAACAP//AQD//wEA//8BAP7/AQD9/wEA/f8AAPz/AAD8/wAA/P8BAPz/AQD8/wAA/P8AAPv/AAD7/wAA+/////r/AAD6/wAA+f8AAPn/AAD5//f/DQD3/w0A+P8MAPj/DQD4/wwA+f8MAPn/DAD6/wwA+f8LAPj/DAD4/wwA+P8MAPn/DQD5/w0A+f8MAPn/DAD5/wwA+v8MAPv/DAD7/wsA+/8LAPv/CwD6/wsA+/8LAPv/CwD7/wsA+/8LAPv/CgD8/woA+/8KAPz/CgD8/woA/P8KAPz/CgD9/wUA/P8FAPz/BQD8/wYA/P8FAPv/BQD7/wUA+/8FAPv/BQD6/wUA+v8FAPr/BQD5/wUA+f8GAPj/BgD4/wYAAADs/wAA7P8AAO3////t/wAA7v///+7////v////7/8AAPD/AgDv/wMA7/8DAPD/AwDv/wMA7/8DAPD/AwDw/wMA8f8EAPH/AwDx/wMA8v8DAPL/AwDz/wMA8/8CAPP/AgDz/wEA8/8BAPP////0//7/9f/+//X//P/2//z/9f/7//X/+//1//n/9//4//f/9//2//b/9f/2//X/9f/0//T/9P/z//P/8//z//L/8v/y//H/8f/y//H/8f/w//D/8P/v/+//7v8IAPv/CAD7/wgA+/8IAPv/CAD8/wgA/P8JAPz/CwD7/w0A+v8NAPr/DQD6/w4A+f8NAPr/DQD6/w0A+v8NAPv/DQD6/wwA+/8MAPz/CwD8/wsA/P8LAPz/CwD9/wsA/f8KAP7/CgD//wkAAAAJAAEACAABAAcAAQAHAAIABgADAAcAAwAGAAQABwAFAAcABQAIAAUABwAFAAcABgAHAAYACAAGAAgABwAIAAYACAAHAAgABwAJAAcACAAHAAgABwAJAAgACQAIAAIA+v8CAPr/AgD7/wIA+/8CAPr/AwD7/wQA+f8FAPr/BQD6/wUA+v8FAPv/BAD6/wUA+v8FAPr/BAD7/wQA+/8EAPz/BAD8/wMA/P8EAPz/AwD9/wMA/f8CAP3/AgD9/wIA/v8BAP7//////////////wAA/v8BAP3/AQD9/wEA/P8DAPz/AwD7/wEA+/8BAPr/AgD7/wEA+v8BAPr/AgD5/wIA+f8BAPj/AgD4/wIA9/8CAPf/AQD3/wIA9/8CAPb/AgD2/wMA+v8HAPr/CAD6/wcA+/8HAPv/BwD7/wcA+v8IAPn/BwD6/wcA+v8HAPr/BwD7/wcA+/8HAPv/BwD7/wYA+/8GAPv/BgD8/wYA/P8GAPz/BgD9/wYA/P8GAP3/BgD8/wYA/P8FAPz/BgD9/wYA/P8HAPz/BgD7/wYA+/8HAPv/BwD7/wYA+v8HAPv/BQD6/wUA+v8FAPn/BgD5/wYA+f8GAPn/BgD4/wcA+P8HAPj/BwD4/wcA9/8HAPf/BwD2/wgA9v8HAPb/BwD2/wEA9v8AAPf/AAD3/wAA9v////b////2////9f8AAPX/AAD2/wAA9v////f////4//7/+P////n////5//7/+v/+//r//v/7//3/+//9//v//f/8//3//P/9//3//f/9//3//v/8//7//P/+//v//v/7////+/////r////6////+v////j//v/6////+v////r//v/5//7/+f/+//j//v/4//7/+P/+//f//v/3//7/9//+//f//v/3//7/9v/+//f//f/2//v/DwD8/w4A+/8OAPz/DQD8/w4A/P8NAP3/DQD9/wwA/f8MAP7/CwD+/wsA/v8LAP7/CwD//woA//8JAAAACgD//wkAAAAIAAAACQABAAgAAQAIAAEABwABAAcAAQAHAAIABwACAAcAAgAGAAMABgADAAYAAwAGAAQABgAEAAYABAAFAAQABgAFAAQABQAEAAUABAAGAAQABgAEAAYABQAGAAUABwAEAAcABQAHAAUABwAFAAcABQAHAAUABwAFAAcABQAIAAYA/P////z/AAD9/////P8AAP3////9/////f////7////+/////v///////v8AAP3/AAD9/////f8AAP7/AAD9/wEA/f8AAP3/AQD9/wAA/f8BAP3/AQD9/wEA/f8CAP3/AgD8/wIA/P8CAPz/AgD8/wMA/P8DAPv/AgD7/wMA+/8DAPv/AwD7/wMA/P8DAPz/AwD7/wMA+/8DAPv/AwD7/wMA+v8DAPv/AwD6/wMA+v8DAPr/BAD6/wQA+f8EAPr/BAD5/wQA+f/+/wcA/f8GAP3/BgD+/wYA/v8GAP7/BQD+/wUA/v8FAP//BAD//wQA//8DAP//BAD//wMAAAADAP//AgAAAAIAAAACAAEAAgABAAEAAQABAAEAAQABAAEAAgAAAAEAAAACAAAAAgAAAAMA//8DAP//AwD+/wMA//8EAP7/AwD+/wMA/v8EAP3/AwD9/wQA/f8EAP3/BAD9/wQA/f8FAPz/BQD8/wUA/P8FAPz/BQD7/wUA+/8EAPv/BQD6/wYA+f8GAPr/BQD5//n/BwD6/wcA+v8HAPr/BgD6/wYA+/8GAPv/BQD8/wQA/P8EAPz/BAD9/wMA/f8DAP7/AwD+/wIA/v8CAP7/AgD+/wIA/v8BAP7/AgD//wIA//8BAP//AQD//wEA//8BAP//AQD//wAA//8BAP//AAD//wEA//8AAP7/AQD//wAA/v8AAP7/AAD+/wAA/f8AAP7/AQD+/wEA/v8AAP3/AAD8/wEA/P8AAPz/AAD8/wAA/P8AAPz/AAD7/wEA+/8BAPv/AAD7/wAAAgD9/wIA/f8CAP3/AgD9/wIA/P8CAPz/BAD8/wUA/P8FAPv/BgD6/wYA+v8GAPr/BQD6/wUA+/8GAPv/BQD7/wUA+/8FAPv/BQD7/wUA+/8EAPv/BAD8/wQA/P8FAPz/BAD8/wMA/f8CAP3/AgD+/wEA/f8BAP7/AQD+/wAA//8BAP//AAD//wAAAAAAAAAA//8AAP//AAD//wEA//8BAAAAAAAAAAAA//8BAP//AQD//wEA//8BAP//AQD//wEA//8BAP//AQD+/wEA//8BAP//AAD//wAA//8BAAAAAQAAAP//AQD//wEAAAABAP//AQD//wEA/v8CAP//AgD+/wEA/v8BAP7/AgD+/wIA//8CAP7/AgD+/wIA/v8CAP7/AgD+/wEA/v8BAP7/AgD+/wIA/v8BAP7/AQD//wEA/v8BAP7/AQD+/wEA/v8BAP7/AQD//wEA//8BAP//AQD//wEA//8BAP//AQD//wEA//8BAP//AQD//wEA//8BAP//AQD//wEA//8BAP//AgD//wAAAgD//wEA//8CAAAAAgABAAEAAQAAAAIAAQACAAAAAgD//wIA//8CAP//AgD//wIA//8CAP//AwD//wMA//8CAP//AgD//wIA//8CAP//AgD//wIA//8BAP//AgD//wIA//8AAAAAAAAAAAEAAAAAAAAAAAAAAP//AQD//wEA//8BAP//AQD+/wIA/v8CAP7/AQD+/wIA/v8BAP7/AgD9/wIA/f8DAP7/AgD9/wMA/f8CAP3/AgD9/wIA/f8CAPz/AwD8/wMA9v8LAPb/CwD3/wsA9v8KAPb/CwD1/wsA9f8LAPX/CwD2/wsA9v8LAPb/CwD3/woA9/8KAPf/CgD3/woA9/8JAPj/CQD5/wgA+f8IAPj/CAD5/wkA+f8IAPr/CAD5/wgA+f8JAPr/CAD5/wgA+P8IAPn/CQD4/wkA+f8JAPj/CQD4/woA+P8LAPn/CAD4/wgA+P8JAPf/CAD3/wkA9v8JAPf/CgD2/woA9f8LAPX/CgD1/wsA9P8LAPT/CwDz/wwA8/8MAPL/DAAEAPb/BQD2/wQA9v8FAPb/BQD1/wgA9f8IAPX/CQD1/wkA9f8JAPX/CQD1/wgA9f8JAPX/CQD2/wgA9v8JAPf/CAD3/wgA9/8IAPf/CAD4/wgA9/8IAPj/BwD4/wgA+P8IAPj/BwD5/wcA+f8IAPn/BwD5/wcA+v8HAPn/CAD6/wcA+f8IAPn/BwD6/wgA+/8IAPr/CQD7/wkA+v8KAPr/CQD6/woA+f8LAPn/CwD5/wsA+f8MAPn/DAD5/w0A+f8NAPj/DgD4/wwA8f8MAPH/DQDx/w4A8f8RAPH/EQDx/xIA8P8RAPD/EQDw/xAA8f8QAPL/DwD0/w4A9P8NAPT/DQD1/wsA9f8LAPb/CgD3/wkA+P8JAPj/CAD5/wcA+v8HAPr/BgD7/wMA/P8BAP3/AQD+////AAD+/wAA/f8BAPz/AwD7/wMA+/8EAPn/BAD5/wUA+f8FAPj/BgD3/wUA9v8GAPb/BgD2/wYA9f8HAPT/BwD1/wgA9P8IAPP/CADy/wgA8f8IAPL/CQDx/wkA/v8KAP7/CwD+/woA/v8KAP3/CgD+/woA/f8LAP3/CwD9/wsA/v8KAP3/CgD+/wkA/f8JAP7/CQD+/wkA/v8JAP7/CAD+/wgA/v8IAP7/CAD+/wgA/v8HAP7/CAD9/wcA/f8IAP7/CAD9/wgA/f8HAPz/BwD9/wcA/P8HAPz/CAD7/wgA+/8IAPz/BwD7/wcA+/8HAPv/CAD6/wgA+f8IAPn/CQD5/wkA+f8JAPj/CQD4/wkA+P8KAPj/CgD4/woA9/8KAPb/CwAGAPn/BgD4/wYA+P8HAPj/CAD4/wgA+P8JAPf/CAD3/wgA9/8HAPf/CAD3/wcA9/8HAPj/BwD4/wYA9/8HAPj/BgD4/wYA+P8GAPj/BgD4/wUA+P8GAPj/BQD4/wUA+P8FAPf/BAD3/wUA9/8EAPf/BQD3/wQA9/8EAPb/AwD1/wQA9P8EAPT/AgD3/wIA9v8CAPb/AgD1/wMA9f8DAPX/AwDz/wIA8/8CAPL/AgDy/wIA8v8CAPH/AgDx/wIA8f8CAPD/AwDw//j/DQD3/w0A9/8OAPX/DgD0/w4A8/8OAPP/DgD0/w4A9P8OAPX/DgD1/w0A9f8NAPb/DAD2/wwA9/8MAPb/CwD3/wsA+P8LAPj/CwD4/woA+P8KAPj/CQD5/wkA+f8JAPr/CAD6/wgA+v8IAPv/BwD6/wcA+v8GAPv/BwD7/wYA+v8GAPr/BgD7/wIA+/8DAPr/AgD6/wIA+f8CAPn/AQD5/wIA+f8CAPn/AgD5/wIA+P8CAPj/AgD4/wIA+P8BAPf/AgD3/wEA+//u//v/8P/7/+//+//w//v/8P/6//D/+v/y//v/8v/7//L/+v/z//r/9P/7//T/+//1//v/9P/7//X//P/2//z/9v/7//b/+//2//v/9//8//f/+//3//v/9//7//f/+v/4//r/+P/6//f/+f/4//r/+P/5//j/+P/3//j/9//4//j/+P/3//f/+v/2//n/9v/5//X/+f/2//j/9f/4//T/+P/0//f/9P/4//P/9//z//f/8//3//L/9//y//f/8v/2//H/9v8LAAIADAAAAAwAAQAOAAEADwABABEAAQAQAAEADwABAA8AAgAQAAIADwACAA8AAgAPAAIADgADAA4AAwANAAIADQADAA0AAwANAAMADQADAAwAAwAMAAQACwAEAAsABAAKAAUACgAFAAkABgAJAAYACAAGAAkABwAJAAgACQAIAAkACAAJAAkACQAHAAoABwAKAAcACwAIAAoACAALAAkACwAIAAwACQALAAkADAAJAA0ACQAMAAkADQAJAA0ACgANAAoADgALAPv/+//7//z/+v/8//r//P/5//3/+f/+//n//f/6//7/+v/+//r//v/7////+/8AAPv/AAD7/wAA+/8AAPz/AQD8/wEA/f8CAP3/AgD9/wIA/f8DAP7/AwD+/wMA/v8EAP7/BAD+/wQA/v8EAP//BQD//wYA//8GAP//BgD//wgA//8IAP//CAAAAAYAAAAGAAAABgAAAAYAAAAGAP//BgAAAAcA//8HAAAABwD//wgA//8IAP//CAD//wgA/v8HAP//CAD+/wgAAQD1/wEA9f8CAPb/AQD2/wIA9v8CAPb/AwD2/wIA9v8CAPb/AgD3/wIA9/8CAPf/AgD4/wMA+P8DAPn/AwD5/wMA+f8DAPn/AwD6/wMA+v8EAPr/AwD6/wQA+/8EAPv/BAD7/wQA/P8EAPz/AwD8/wQA/P8EAP3/BAD9/wQA/P8EAP3/BAD9/wUA/f8EAP3/BQD+/wQA/f8FAP3/BQD9/wUA/f8GAPz/BQD8/wYA/P8GAPz/BgD8/wYA/P8HAPz/BgD8/wcA+/8EAPf/BAD3/wUA9v8FAPf/BgD3/wYA9/8GAPj/BgD4/wYA+f8GAPn/BgD5/wYA+f8GAPn/BgD6/wYA+v8FAPr/BgD7/wUA+/8FAPv/BQD8/wQA+/8FAPz/BAD7/wMA/P8DAPz/AwD8/wMA/f8CAP3/AQD9/wEA/f8BAP3/AQD9/wEA/f8BAP3/AAD9/wAA/f8AAP3/AAD9/////f8AAPz////8/////f////z////8//7//P////v////7//7/+//+//v//v/7/////////wAA//8AAAAAAAD//wAA//8AAP//AAD//wEAAAAAAAAAAQAAAAEAAAACAAAAAQD//wEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAQACAAAAAgAAAAIAAAACAAAAAgAAAAIAAQACAAEAAgABAAIAAAACAAEAAwAAAAMAAAACAAAAAwAAAAEAAAAAAAAA//8AAP//AAD///////8AAP/////+/wAA////////AAD+//////////7////+/////v////7/AwD//wMA//8DAP//AwD//wQA//8DAP//BAD//wQA/v8DAP//AwD+/wMA//8DAP//AwD//wQA//8DAP//BAD//wMA//8EAAAABAAAAAQAAAADAP//AwD//wQAAAADAAAAAwAAAAMAAAADAP//AwAAAAMAAAADAAAAAgD//wMA//8DAAAAAwD//wIA//8DAP//AwD//wMA//8DAP//AwD//wMA/v8DAP//AwD+/wMA/v8DAP7/AwD9/wMA/v8DAP7/AwD9/wMA/f/0/wUA9P8FAPL/BgDx/wYA7/8HAO//BwDv/wgA8P8IAPH/CADx/wgA8f8HAPL/BwDy/wgA8/8IAPP/CADz/wgA9P8IAPT/BwD0/wcA9f8HAPX/CAD2/wgA9v8HAPj/BgD4/wcA+P8HAPf/BwD4/wYA+P8GAPn/BgD5/wcA+f8HAPj/BgD4/wcA+f8GAPj/BAD4/wQA+P8EAPj/BAD3/wQA9v8EAPf/BAD2/wQA9v8EAPX/BAD1/wUA9f8EAPT/BAD0/wQA8/8FAAUAAwAFAAQABgAEAAUABAAFAAQABwAEAAYABAAGAAQABgAEAAYABAAGAAQABgAEAAcABAAGAAQABgAEAAYABAAGAAQABgAFAAcABQAGAAUABwAEAAcABAAGAAUABgAFAAcABQAHAAUABwAGAAcABgAIAAcACAAHAAgABwAJAAcACgAIAAoACAAKAAkADAAJAAwACAAMAAgADQAIAA4ACQAOAAkADgAJAA8ACgAPAAkAEAAKABEACgAQAAsAEQALABIACwATAAsA+f/5//n/+P/5//n/+f/5//n/+f/3//n/+P/5//j/+f/4//n/+f/5//r/+f/6//n/+v/5//v/+f/8//n//P/4//3/+f/9//j//f/4//7/+P/+//n//v/4////+P8AAPj////3/wAA9/8BAPf/AQD3/wEA9v8BAPb/AQD2/wEA9v8BAPb/AgD1/wIA9f8CAPb/AQD3/wIA9/8BAPf/AgD2/wIA9v8CAPb/AgD1/wMA9v8DAPX/AwD1/wQA9P8EAPT/BAD0/wMA9P/0/wUA9P8FAPT/BAD0/wUA8v8FAPH/BgDw/wYA8P8HAPD/BwDx/wYA8f8GAPL/BgDz/wYA8v8GAPP/BQD0/wYA8/8FAPT/BQD1/wQA9f8EAPX/BAD1/wQA9v8EAPb/BAD4/wMA9/8DAPf/AwD4/wMA+P8DAPj/AgD5/wIA+f8CAPn/AgD4/wIA+f8CAPf/AQD4/wEA+P8BAPj/AQD3/wEA9/8BAPf/AQD2/wIA9v8BAPX/AgD1/wEA9f8CAPT/AgD0/wIA9P8BAAAAAwAAAAMAAAADAAEAAgABAAMAAQADAAEAAgABAAIAAQABAAEAAgACAAIAAQABAAIAAQADAAAAAgABAAIAAAADAAAAAwAAAAMAAAADAAAABAD//wQA//8EAP//BAD//wQA//8FAP//BgD+/wUA/v8FAP3/BgD+/wYA/v8GAP7/BgD9/wcA/f8HAP3/CAD+/wgA/v8IAP//CAD+/wgA/v8JAP7/CQD+/woA/f8KAP7/CwD9/wsA/v8KAP3/DAD9/wsA/f8MAP3//f8IAP3/CAD9/wgA/P8HAP3/BgD9/wcA/P8HAPz/BwD9/wcA/P8HAPz/BgD9/wYA/P8GAPz/BgD9/wYA/f8GAPz/BgD9/wUA/P8GAPz/BQD8/wYA/P8GAPz/BQD8/wUA/P8GAPz/BQD7/wYA/P8GAPz/BwD7/wYA+/8GAPv/BgD7/wcA+v8HAPr/BwD6/wYA+v8GAPr/BQD6/wYA+v8GAPn/BwD5/wYA+f8HAPj/BwD4/wcA9/8HAPj/CAD3/wgA+P8IAPf/CAAMAO//DADv/wwA7/8NAPD/DgDv/xAA7f8TAOz/EwDs/xMA7P8TAOz/EgDt/xIA7f8RAO3/EQDu/xEA7f8QAO7/EQDu/xAA7/8QAO//EADv/w8A7/8PAPD/DwDw/w4A8P8NAPD/DQDx/w0A8P8MAPD/CwDw/wwA8f8MAPD/CwDw/wwA8P8MAPD/CwDy/wsA9f8LAPX/CwD1/wwA9P8MAPT/DQD0/w0A9P8NAPP/DgDy/w8A8/8QAPL/EADy/xAA8f8QAPL/EQDy/+z/HwDt/x4A7f8dAO3/HQDr/x0A6P8eAOX/IADl/yAA5P8gAOX/HwDm/x4A5v8eAOj/HADp/xsA6f8bAOr/GgDq/xkA6/8ZAOv/GADs/xgA7f8XAO7/FgDt/xYA7/8VAPH/FADy/xMA8v8TAPP/EwD0/xIA8/8SAPP/EgD0/xIA9P8RAPT/EgD1/w8A9f8NAPX/DAD0/w0A9P8OAPT/DgDz/w0A8/8OAPL/DwDy/xAA8f8PAPD/EADw/xAA8P8RAPD/EADv/xEACADz/wgA9P8IAPX/BwD0/wgA9f8KAPT/DADz/wwA8v8NAPL/DQDy/w0A8v8NAPL/DADz/wsA8/8LAPP/CwDz/wsA9P8LAPP/CwDz/wsA8/8LAPT/CgD0/wsA9P8KAPX/CQD1/wgA9f8IAPb/BwD1/wcA9v8IAPX/CAD1/wgA9f8HAPX/BwD1/wcA9/8HAPj/BwD5/wgA+P8HAPj/CAD4/wgA+P8IAPj/CQD3/wkA9v8JAPf/CgD2/woA9v8KAPb/CgD2/wsA9v/7/wgA+/8HAPv/BwD8/wcA+/8HAPv/BwD6/wYA+/8GAPv/BgD7/wYA+/8FAPv/BQD8/wUA/P8FAPz/BQD8/wQA/f8EAPz/BAD9/wQA/f8EAP3/AwD9/wMA/f8DAP3/AwD+/wMA/v8DAP7/AgD//wIA//8CAP7/AgD+/wIA/v8CAP//AgD//wEA//8BAP//AQD+/wEA/v8BAP7/AQD+/wEA//8BAP7/AQD+/wEA/v8CAP7/AQD+/wIA/v8CAP7/AgD+/wIA/v8BAP/////+/wAA//////7//////////v//////AAD//wAA/////////////////////wAA//8AAP//AAD//wEA//8AAP7/AQD//wEA/v8AAP7/AAD+/wEA/v8BAP7/AQD+/wAA/v8BAP7/AQD+/wEA/v8BAP7/AQD+/wEA/v8BAP7/AQD+/wEA/v8BAP7/AAD+/wEA/v8BAP//AgD+/wEA/v8BAP//AgD+/wIA//8BAP7/AQD+/wEA/v8BAP7/AgD9/wEA/v8BAP7/AAACAAEAAgAAAAIAAQACAAAAAQABAAEAAQAAAAEAAAACAAAAAgAAAAIAAAACAAAAAQD//wIA//8CAP//AQD//wIAAAACAP//AQAAAAIA//8CAP//AgD//wIA//8CAP//AwD//wIA//8CAP//AgD//wIA/v8CAP//AgD//wIA//8CAP//AgD+/wIA//8DAP//AwD//wMA/v8CAP//AwD//wMA/v8DAP//AwD+/wQA/v8EAP//BAD+/wQA/v8DAP//BAD+/wQA/v/8/wUA/P8FAPz/BQD8/wUA/f8FAPz/BQD8/wUA/P8EAPv/BAD8/wQA/P8EAPz/BAD9/wQA/P8EAP3/BAD9/wQA/P8DAPz/AwD9/wMA/f8DAP3/AwD9/wMA/f8DAP7/AgD9/wIA/v8CAP7/AgD+/wIA/v8CAP7/AgD+/wIA/v8BAP7/AQD+/wIA/v8BAP7/AQD+/wEA/f8BAP7/AQD9/wEA/f8BAP3/AQD9/wEA/f8CAP3/AQD8/wIA/P8BAP3/AQD9/wIA/f8CAP7/BAD9/wMA/v8DAP7/AwD9/wMA/v8DAP3/BAD9/wQA/f8EAP3/BAD9/wQA/f8DAP3/BAD9/wQA/f8DAP3/AwD+/wMA/v8DAP7/AwD9/wQA/v8DAP3/AwD9/wMA/f8DAP7/AwD9/wMA/v8DAP7/AwD+/wMA/v8DAP7/AwD+/wQA/v8EAP7/BAD+/wMA/v8DAP7/AwD+/wMA/v8DAP7/AwD+/wMA/v8DAP3/AwD9/wMA/f8DAP7/AwD+/wMA/f8DAP3/AwD9/wMAAQD+/wIA/v8CAP7/AQD+/wIA/f8CAP3/AwD8/wMA/f8EAPz/AwD8/wQA/P8EAP3/AwD8/wQA/P8DAPz/BAD8/wMA/P8DAPz/AwD8/wQA/P8DAPz/BAD8/wQA/P8EAPz/AwD8/wQA/P8DAPz/AwD8/wMA/P8EAPv/BAD7/wQA+/8DAPv/BAD7/wQA/P8EAPz/AwD8/wQA/P8EAPz/BAD8/wQA/P8EAPv/BQD8/wUA+/8FAPz/BQD7/wUA/P8GAPz/BgD7/wYA+/8MAO3/CwDt/wsA7f8MAO3/DwDt/xEA7P8SAOv/EwDq/xIA6/8SAOv/EQDr/xEA6/8RAOz/EADs/xAA7f8PAO3/DwDu/w8A7v8PAO7/DwDu/w8A7/8OAO//DgDv/w0A8P8MAPD/DADv/wwA7/8LAO//DADv/wsA8P8MAO//DADu/w0A7v8MAO3/CwDy/wsA8/8MAPP/DQDy/w0A8f8OAPH/DgDx/w8A8f8PAPD/EADw/xAA7/8RAO//EgDv/xIA7v8SAO7/EwDu/+7/GADu/xgA7v8YAO7/GADr/xkA5/8aAOX/HADj/x4A4/8eAOT/HQDk/x0A5f8dAOb/HADn/xsA5/8bAOj/GwDp/xoA6f8aAOn/GQDp/xkA6v8ZAOr/GADr/xgA7P8XAO7/FwDt/xgA7v8YAO//GADu/xgA7v8XAO3/GADu/xkA7f8ZAO7/GgDv/xQA7/8TAO7/EwDt/xUA7P8WAOz/FgDr/xYA6v8XAOr/FwDp/xgA6P8ZAOf/GQDm/xkA5f8aAOX/GgDj/xsABgD2/wcA9v8GAPb/BgD2/wYA9v8IAPf/CAD2/woA9P8KAPT/CgD1/woA9f8KAPX/CQD1/wkA9v8KAPX/CQD2/wkA9v8JAPb/CQD2/wkA9v8IAPb/CQD3/wgA9/8IAPf/BwD3/wcA9/8HAPf/BgD3/wYA+P8HAPj/BwD4/wYA+P8HAPj/BgD3/wYA+f8GAPr/BwD6/wcA+f8HAPn/BwD5/wgA+f8IAPn/CAD5/wgA+f8JAPj/CQD5/wkA+P8KAPj/CgD5/woA+P/9/wUA/P8FAP3/BQD9/wUA/f8FAPz/BAD9/wQA/P8FAP3/BQD8/wQA/f8EAP3/BAD9/wQA/f8EAP3/BAD9/wMA/f8DAP3/AwD9/wQA/f8DAP7/AwD9/wMA/f8DAP3/AwD+/wMA/v8DAP7/AwD+/wMA//8CAP7/AgD+/wIA/v8CAP7/AgD+/wMA/v8CAP7/AgD+/wIA/v8CAP7/AgD+/wIA/v8CAP7/AgD+/wIA/f8CAP3/AgD9/wIA/f8CAP3/AwD9/wIA/v8CAAAA/v8BAP7/AQD+/wAA/v8AAP7/AAD///7/AQD9/wEA/P8CAP3/AgD9/wIA/f8BAP3/AgD+/wEA/v8CAP7/AgD+/wIA//8CAP//AQD//wIA//8CAP//AgAAAAEAAAABAP//AQAAAAEAAAABAAAAAQD//wEAAAABAAAAAQAAAAEAAAABAAEAAAABAAEAAQABAAAAAQAAAAEAAQABAAAAAQAAAAEAAAABAAAAAQABAAEAAQABAAEAAQABAAIAAQABAAEAAQABAAEABAD7/wQA+/8DAPv/BAD7/wQA/P8EAPv/BAD6/wUA+v8GAPr/BQD6/wUA+v8FAPv/BgD6/wUA+/8FAPr/BgD7/wUA+/8FAPv/BQD7/wUA+/8FAPr/BQD6/wUA+/8FAPv/BQD7/wUA+/8EAPr/BQD6/wUA+/8EAPv/BQD7/wUA+v8FAPr/BQD7/wQA/P8EAPv/BQD7/wUA+/8FAPv/BgD7/wYA+/8GAPv/BwD7/wcA+v8HAPv/BwD6/wgA+v8HAPr/CAD6/wgA+v8KAO7/CgDv/woA8P8KAPD/CgDx/woA8v8LAPL/CwDz/woA8v8LAPP/CgD0/woA9P8JAPX/CQD2/wgA9/8IAPf/CAD3/wcA+P8HAPn/BwD5/wYA+/8GAPv/BQD7/wMA/P8CAP3/AQD9/wEA/////wAA////////AAD+/wEA/v8CAP7/AwD+/wMA/v8DAP7/BAD+/wUA/v8FAP3/BQD9/wUA/f8GAP3/BQD8/wYA+/8GAPv/BgD7/wcA+/8GAPv/BwD6/wcA+v8HAP//AgD+/wIA//8BAP7/AgD+/wEA//8CAP7/AwD+/wMA/v8EAP3/BAD+/wQA/f8EAP3/BAD9/wQA/f8EAP3/BAD9/wUA/f8FAPz/BQD8/wUA/P8FAPz/BQD7/wUA+/8GAPv/BgD7/wYA+v8GAPv/BgD7/wcA+v8IAPr/CAD6/wgA+f8IAPj/CQD5/wgA+f8IAPj/CAD4/wgA+P8IAPf/CQD3/wgA9v8JAPb/CQD3/woA9v8KAPb/CgD0/wsA9f8KAPT/CwD0/wsAAwD8/wMA/P8CAP3/AwD9/wMA/f8DAP3/BAD9/wMA/P8EAPz/BAD9/wMA/f8DAP3/AwD9/wMA/f8DAP7/AgD+/wIA/v8CAP7/AgD+/wIA//8BAP7/AQD//wEA//8BAP//AQD//wAAAAAAAAAA//8BAP//AQD//wEA//8BAP7/AgD//wIA/v8CAP7/AgD+/wIA/v8BAP7/AgD+/wIA/v8CAP3/AgD9/wIA/f8CAPz/AgD9/wIA/P8CAP3/AgD8/wMA/P8CAPz/AwACAAMAAgADAAIAAgACAAMAAgADAAIAAgACAAIAAgADAAEAAwACAAIAAgACAAIAAgACAAIAAQACAAEAAgABAAIAAQABAAEAAQABAAIAAAABAAEAAgABAAEAAQABAAAAAQD//wEAAAABAP//AQAAAAAA//8AAP//AAD//wAA//////7////+/////v/+//3//f/9//7//f/9//z//f/8//3//P/9//3//f/8//3//P/9//z//P/8//z/+//8//v/+//7//z/+v/7//7/AAD//wAA//8BAP//AAD//wAA/v8BAP3/AQD8/wIA/P8DAPv/AwD7/wMA/P8EAPz/BAD8/wMA/P8DAP3/AwD9/wQA/P8EAP3/AwD9/wQA/P8EAPz/BAD8/wQA/f8EAP3/BAD9/wQA/f8EAPz/BQD8/wUA/f8FAPz/BQD8/wUA/P8FAP3/BQD8/wUA/P8EAP3/BAD8/wUA/P8FAPz/BAD8/wUA+/8FAPv/BQD7/wUA+/8GAPv/BgD7/wYA+/8GAPv/BQD7/wYABAD9/wMA/f8DAP3/AwD+/wMA/v8DAP7/AwD//wQA/v8EAP7/BAD//wQA//8DAP7/AwD//wMA//8DAP//AgD//wIA//8DAP//AgD//wIA//8DAP7/AwD//wMA//8CAP//AgD//wIA//8CAP//AgD+/wIA/v8BAP7/AQD+/wIA//8CAP//AQD//wEA//8CAAEAAQAAAAEAAAACAAAAAQABAAEAAQABAAEAAgABAAIAAQABAAEAAQABAAEAAQABAAEAAQACAAEAAQAJAAIACQACAAoAAgAKAAIACwACAAsAAgAMAAEADAABAAwAAAALAAAACwAAAAsAAAAKAP//CgAAAAoAAAAKAAAACgAAAAkA//8JAAAACQD//wgAAAAHAP//BgAAAAYA//8GAP//BQD//wUA//8FAP//BQD//wUA//8FAP//BAD+/wQA//8FAP7/BQD+/wQA/v8EAP7/BAD+/wQA/v8FAP7/BQD9/wUA/f8EAP3/BQD9/wUA/f8FAP3/BgD9/wUA/f8GAPz/BgD9//H/6//y/+z/8f/s//H/7P/w/+3/8P/t/+//7v/u/+//7v/w/+//8P/v//H/7//y//H/8v/x//L/8f/y//L/8//y//P/8//0//P/9P/0//X/9P/1//X/9f/2//X/9v/2//f/9v/3//b/9//2//f/9v/4//b/+P/2//j/9v/4//b/+P/1//f/9v/3//j/9//4//f/+P/3//f/9v/3//b/9v/2//f/9v/3//b/9v/1//b/9f/2//X/9f/0//X/9f/1//T/9v/0//X/CQAMAAgACwAIAAsACAALAAgACwAJAAsACAALAAkACgAJAAoACQAKAAkACgAJAAkACAAKAAgACQAIAAkACAAJAAgACQAHAAkABwAIAAcACAAHAAgABgAIAAYACAAGAAcABQAIAAYACAAGAAgABgAIAAUACAAFAAgABgAIAAYACAAGAAkABwAIAAcABwAHAAcABwAIAAgACAAIAAgACAAJAAkACAAJAAgACQAJAAoACQAKAAkACgAKAAsACgAKAAoACwAKAAsACwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAP////8AAAAAAAAAAAAAAAAAAP///////wAA//8AAAAAAAAAAAAAAAAAAP//AAAAAAAA//8AAAAAAAAAAP//////////AAAAAAAAAAD//wAAAAD//wAAAAAAAP//AAAAAAAA//8AAP//AAD//wAAAAAAAAAAAAAAAP////8AAAAAAAD//wAAAAAAAAAAAAAAAAAA/////wAA//8AAAAA/////wAAAAAAAAAAAAD//wAAAAAAAAAAAAD//wAAAAAAAP///////////v8FAP3/BAD9/wQA/f8EAP3/BAD+/wQA/f8EAP3/BAD9/wQA/P8EAPz/BAD9/wQA/f8EAP3/BAD9/wMA/v8EAP7/BAD9/wMA/v8DAP7/AwD+/wMA/v8DAP7/AwD+/wIA//8DAP7/AwD//wMA//8CAP//AgD//wEAAAACAP//AgD//wIA//8CAP//AQAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQD//wEA//8BAAAAAQD//wEA//8BAAAAAQD//wEAAAACAAAAAgADAPv/AwD8/wMA/P8DAPz/BAD8/wMA/P8EAPz/BQD7/wUA+/8FAPv/BQD7/wUA+/8EAPv/BQD7/wUA/P8EAPv/BAD7/wUA+/8EAPz/BAD7/wQA/P8EAPv/AwD8/wMA/f8CAPz/AwD8/wEA/P8BAP3/AQD9/wIA/f8BAP3/AQD9/wIA/f8BAP3/AQD+/wEA/f8BAP7/AQD9/wEA/f8BAP3/AQD9/wEA/f8CAP3/AQD9/wEA/f8CAPz/AQD8/wIA/f8BAPz/AgD8////AQAAAAAAAAABAAAAAAAAAAEAAAABAAAAAQD//wEA//8BAAAAAQAAAAEA//8BAAAAAQD//wEA//8BAP//AQAAAAEA//8BAP//AQAAAAEA//8BAAAAAgD//wEA//8BAAAAAQD//wEAAAACAAAAAQAAAAEA//8CAP//AgAAAAEA//8CAAAAAQAAAAEA//8BAAAAAQAAAAEAAAABAAAAAAAAAAEAAAABAAAAAQAAAAEAAAAAAAAAAQAAAAEAAAAAAAAAAQD//wEABAD+/wMA/v8DAP3/AwD+/wMA/v8DAP7/BAD9/wQA/v8EAP3/BAD9/wQA/f8EAP3/BAD9/wQA/f8EAP3/BAD9/wMA/f8EAP7/BAD9/wMA/v8DAP7/AwD9/wMA/v8DAP7/AgD+/wMA/v8CAP3/AgD+/wIA/v8CAP7/AgD+/wIA/v8CAP7/AgD+/wIA/v8CAP//AgD+/wIA//8CAP//AgD//wIA//8CAP//AgD//wIA/v8DAP//AgD//wMA//8CAP//AwD//wMA/v/7/wUA/P8FAPz/BQD8/wUA+/8EAPz/BAD6/wUA+v8FAPr/BgD6/wUA+v8GAPr/BQD6/wUA+v8FAPv/BQD7/wUA+/8FAPv/BAD7/wUA+/8EAPz/BAD7/wQA/P8EAPz/BAD8/wQA+/8EAPz/BAD8/wQA/P8EAPz/BAD8/wQA/P8EAPz/BAD7/wQA/P8EAPz/AwD7/wQA+/8DAPv/AwD7/wQA+/8DAPv/AwD6/wMA+/8EAPr/BAD6/wQA+f8EAPr/BAD5/wQA+f8FAAEA//8AAP//AQD//wEA/v8BAP//AQD//wEA//8BAP7/AQD+/wEA//8BAP//AQD//wEA//8CAP//AQD//wEA//8BAP//AQD//wEA//8BAP//AQD//wEA//8BAP//AQD//wEA//8CAP//AQD//wEA/v8BAP//AgD+/wIA/v8BAP//AQD+/wIA//8BAP7/AQD//wIA/v8CAP//AQD//wEA/v8BAP//AgD//wIA//8BAP//AgD+/wIA/v8CAP7/AgD//wIA/v8CAP7/AAD+/wAA/v8AAP//AAD//wAA////////AAD+/wAA//8AAP//AAD//wAA/v8AAP//AAD//wAA//8AAP7/AAD//wAA//8AAP//AAD//wAA//8AAP//AAD//wAA//8AAP//AAD///////8AAP//AAD//wAA/////////////wAA//8AAP//AAD//wAA//8AAP////////////8AAP//AAD//wAA////////AAD//wAA/v///////////wAA//8AAP7/AAD//wAA///+/wQA/v8EAP3/AwD9/wMA/v8DAP7/AwD+/wMA/f8EAP3/BAD9/wQA/f8EAP3/AwD9/wQA/P8DAP3/BAD9/wMA/f8DAP3/AwD9/wMA/f8DAP3/AwD9/wMA/v8DAP3/AwD+/wMA/v8DAP7/AwD+/wMA/v8DAP7/AwD+/wMA/f8DAP7/AwD9/wMA/v8DAP7/AgD+/wMA/v8CAP7/AwD9/wMA/f8DAP7/AgD9/wIA/f8DAP3/AwD9/wMA/f8DAPz/AwD8/wMA/f8DAAEA/v8CAP7/AgD+/wIA//8BAP7/AgD+/wEA//8CAP7/AgD+/wIA/v8CAP7/AgD+/wIA/v8CAP7/AgD+/wIA/v8CAP7/AgD//wIA/v8CAP//AgD+/wIA//8BAP7/AgD+/wEA//8BAP//AQD//wEA//8BAP7/AgD//wIA//8CAP7/AQD//wIA/v8BAP//AQD//wEA//8CAP//AQD+/wIA//8CAP7/AQD//wIA//8CAP//AgD//wIA//8CAP//AgD//wMA//8CAP7/9/8OAPf/DQD3/w0A9/8MAPf/DAD2/wsA9/8LAPX/CwD1/w0A9f8MAPX/DAD1/wwA9v8LAPb/CwD2/woA9v8KAPf/CgD3/wkA9/8KAPf/CQD3/wkA+P8JAPn/CQD5/wgA+f8IAPn/BwD5/wcA+f8IAPn/CAD5/wcA+P8HAPj/CAD5/wcA+P8IAPj/BgD5/wYA+P8GAPf/BwD4/wcA9/8HAPf/BwD3/wcA9f8IAPX/CAD1/wgA9f8IAPT/CAD0/wgA8/8IAPP/CQAIAPj/BwD5/wgA+f8IAPn/CAD6/wgA+v8IAPr/CQD6/wkA+P8JAPn/CQD5/wkA+f8IAPr/CQD6/wgA+/8IAPv/BwD7/wcA+/8HAPv/BwD7/wcA/P8GAPv/BQD8/wUA/P8FAPz/BQD9/wQA/f8EAPz/BAD9/wMA/f8EAP3/BAD9/wMA/f8DAP3/AwD//wIA//8DAP//AwD+/wMA//8DAP7/AwD//wMA//8EAP7/BAD+/wQA/v8EAP7/BAD//wQA//8EAP//BAD//woA8P8KAPD/CgDx/woA8v8LAPL/DADz/w0A8f8PAPD/DwDv/w8A7/8PAPD/DwDw/w4A8P8NAPH/DQDx/w0A8f8NAPH/DADx/w0A8f8NAPL/DADy/wsA8v8KAPP/CQDz/woA8/8JAPP/CQDz/wkA9P8JAPP/CQD0/wkA9P8KAPP/CgDz/woA8/8KAPX/CgD2/woA9v8KAPb/CgD1/wsA9v8MAPX/DAD1/wwA9f8NAPX/DQD0/w0A9P8OAPP/DwD0/w8A8/8QAPP/+f8KAPn/CgD5/woA+f8JAPj/CQD4/wgA9v8KAPX/CwD1/wwA9f8LAPX/CwD1/wsA9v8KAPf/CgD3/woA9/8KAPf/CgD3/woA9/8KAPf/CgD3/wkA+P8KAPn/CQD5/wkA+P8JAPn/CQD6/wkA+f8JAPn/CQD5/wkA+f8JAPj/CgD4/woA+f8KAPn/CAD5/wcA+f8HAPn/CAD4/wgA+P8IAPf/CAD3/wgA9/8IAPb/CAD2/wkA9v8JAPX/CQD1/wkA9f8KAPT/CQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABAP7/AgD+/wEA/v8BAP7/AgD+/wEA//8CAP7/AgD+/wIA/v8CAP7/AgD+/wIA/v8CAP//AQD+/wEA/v8CAP7/AgD+/wIA//8BAP7/AQD+/wIA//8CAP7/AQD+/wEA//8CAP7/AgD+/wEA//8CAP7/AgD+/wIA/v8CAP7/AgD+/wIA/v8BAP7/AQD+/wEA//8BAP//AQD+/wIA//8BAP7/AQD//wIA//8CAP//AgD//wIA//8CAP//AgD//wIA/v8CAP7/AgD//wAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQAAAAAAAAAAAP//AAAAAAAA//8AAP//AAAAAAEAAAABAP//AAAAAAAA//8AAAAAAAD//wAAAAABAP//AAAAAAAAAAAAAP//AAAAAAAA//8AAP//AAAAAAAAAAABAP//AAAAAAAAAAAAAP//AAAAAAAAAAAAAAAAAAAAAAAA//8AAAAAAAAAAAAAAAAAAAAAAAD//wAAAAAAAP//AQAAAAEA//8AAP//AAD//wAA//8AAP//AAD//wEA//8AAAAAAAD//wAA//8FAPX/BQD1/wYA9v8GAPb/BQD3/wUA9/8GAPf/BQD2/wUA9/8GAPf/BgD3/wYA9/8GAPj/BgD4/wUA+P8FAPj/BQD4/wYA+f8GAPj/BgD5/wUA+f8FAPn/BAD5/wQA+v8FAPn/BAD5/wQA+f8EAPj/BQD4/wUA+P8FAPj/BQD5/wYA+P8GAPf/BgD6/wYA+v8GAPv/BgD6/wYA+v8GAPn/BwD6/wcA+v8IAPr/CAD5/wgA+f8JAPn/CQD5/woA+f8KAPn/CgD5//3/AwD9/wQA/f8DAP3/AwD9/wMA/f8DAPz/AwD8/wUA/P8FAPv/BQD7/wUA/P8FAPv/BAD8/wQA/P8FAPz/BQD8/wUA/P8EAPz/BQD8/wUA/P8EAPz/BAD9/wQA/f8EAPz/BAD9/wQA/f8FAP7/BQD9/wUA/f8FAP3/BQD9/wQA/f8FAP3/BQD9/wQA/f8EAP3/BAD+/wQA/v8EAP7/BQD9/wUA/f8EAPz/BAD9/wUA/f8FAP3/BQD8/wUA/P8FAPz/BQD9/wUAAgD+/wIA/f8CAP7/AgD+/wIA/v8CAP7/AgD+/wEA/v8BAP//AQD//wEAAAAAAP//AQAAAAEAAAABAAAAAQD//wEAAAAAAAAAAQAAAAEAAAABAAAAAAAAAAAAAAAAAAAAAAABAAAAAQAAAAAA//8BAP//AQD//wEA//8BAP//AgD//wEAAAACAP//AgD//wIAAAACAP//AgD//wMA//8CAP//AgD//wMA//8DAP//AwD//wMA/v8DAP//AwD//wMA//8EAP7/BAD8/wcA/P8HAPz/BgD8/wYA+/8GAPv/BgD7/wYA+/8GAPr/BwD6/wcA+v8GAPr/BwD6/wYA+v8GAPr/BgD7/wYA+/8FAPv/BgD7/wYA+/8FAPv/BgD8/wYA/P8GAPz/BQD8/wUA/P8FAPz/BQD8/wUA/P8FAPz/BQD8/wUA/P8FAPv/BQD7/wUA/P8DAPz/BAD7/wQA+/8FAPv/BAD7/wUA+/8FAPv/BQD7/wUA+v8FAPr/BQD6/wUA+v8FAPn/BQD5/wUA+f8FAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAgD8/wIA/f8CAP3/AQD9/wIA/f8CAP3/AgD9/wIA/f8CAPz/AwD8/wMA/f8DAP3/AwD9/wMA/f8DAP3/AgD9/wIA/f8DAP3/AgD9/wIA/v8CAP3/AgD9/wIA/f8CAP7/AgD9/wIA/v8CAP7/AgD9/wIA/f8CAP3/AgD9/wIA/f8CAP7/AgD+/wIA/v8CAP7/AgD+/wIA/v8CAP7/AgD9/wIA/f8CAP3/AgD9/wIA/v8DAP7/AwD+/wIA/v8DAP3/AwD9/wMA/f8AAAAAAAAAAAAAAAAAAAAAAAAAAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAD//wAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA//8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQD//wAA//8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABAAEAAAAAAAEAAQABAAEAAAAAAAAAAQABAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAQABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAACAAEAAgAAAAIAAQACAAAAAgAAAAIAAAACAAAAAgABAAIAAQACAAEAAgABAAIAAQACAAEAAgAAAAMAAAACAAEAAwABAAMAAAAAAP7//////wAA//8AAP7/AAD//wAA//////7/AAD///////8AAP//AAD//wAA//8AAP////////////8AAP//AAAAAP//////////AAD//wAAAAAAAP//AAD///////8AAAAA//////////////////8AAP//AAD//wAAAAD/////////////////////AAD//////////////////////////////////////v///////////////v/////////+/////v///wAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABwDx/wgA8f8HAPH/BwDz/wcA8/8HAPP/BwD0/wYA9P8GAPb/BQD2/wUA9v8FAPb/BQD3/wYA9/8GAPf/BQD4/wYA+P8GAPn/BgD5/wUA+f8FAPn/BAD6/wMA+v8EAPr/AwD6/wMA+v8DAPv/AwD7/wMA+/8CAPv/AgD7/wEA/P8BAPz/AgD8/wEAAAABAAAAAgAAAAIAAAABAAEAAQAAAAIAAQACAAEAAgABAAIAAQACAAEAAgABAAMAAgACAAIAAwACAAMAAwD4/w0A9/8MAPj/DAD4/wsA9/8LAPb/CwD2/woA9f8LAPP/CwDz/w0A8/8OAPP/DgDz/w4A8/8OAPT/DgD0/w0A9P8MAPX/DAD1/wwA9f8MAPX/DAD2/wwA9/8MAPb/DAD2/wsA9/8MAPf/CwD2/wsA9v8LAPf/CwD3/wsA9/8LAPb/CwD1/wsA9v8HAPb/BwD1/wgA9f8IAPX/CAD1/wkA9P8IAPP/CADz/wgA8/8JAPL/CQDy/wkA8f8JAPH/CQDw/wkA8P8JAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAP//BAD//wQA//8EAP//BAD+/wUA/v8FAP7/BAD+/wUA/v8EAP7/BAD+/wQA/v8EAP7/BAD+/wQA/f8EAP3/BAD9/wUA/v8EAP3/BAD9/wUA/v8EAP3/BAD9/wQA/f8EAP3/BQD8/wUA/P8FAP7/BQD+/wUA/v8FAP7/BgD9/wYA/f8GAP7/BwD+/wcA/v8HAP3/BwD9/wcA/v8HAP7/CAD+/wgA/v8IAP7/BAD4/wUA+f8EAPn/BAD5/wQA+f8FAPr/BQD6/wUA+/8GAPr/BgD5/wYA+f8GAPn/BgD5/wUA+f8GAPn/BQD6/wYA+v8FAPn/BgD5/wYA+v8FAPn/BAD6/wQA+v8FAPr/BAD6/wQA+v8EAPr/BAD5/wUA+v8FAPr/BQD6/wUA+f8FAPn/BQD6/wUA+/8FAPv/BQD7/wUA+/8FAPv/BQD7/wUA+v8GAPr/BgD6/wYA+v8GAPv/BwD6/wcA+v8HAPn/BwD5/wgA+f8KAPH/CgDy/woA8v8KAPP/CwDz/wsA8/8MAPP/DgDy/w8A8f8PAPD/EADv/xAA8P8OAPD/DwDw/w4A8f8PAPH/DgDx/w4A8v8NAPL/DQDx/wwA8v8MAPL/CwDz/wsA8/8LAPL/CgDy/wsA8v8LAPP/CwDy/wsA8v8LAPL/CwDy/wsA8v8LAPP/CgD3/wsA9/8MAPb/DAD1/w0A9v8NAPb/DgD1/w4A9f8OAPX/DwD1/xAA9P8QAPT/EQD0/xEA9P8SAPT/EgD0//H/GwDw/xkA8P8YAPD/FwDw/xcA7v8VAO7/FQDr/xYA6f8XAOn/GQDp/xkA6f8ZAOr/GADq/xgA6/8XAOv/FgDr/xYA7P8VAO3/FQDt/xUA7/8VAPD/FADx/xMA8P8TAPD/EwDy/xMA8P8UAPD/EwDw/xMA8P8TAO//EwDv/xQA7/8UAO//EgDw/w4A7/8OAO7/DwDu/xAA7f8QAO3/EADr/xEA6v8RAOr/EgDp/xIA6P8SAOj/EwDn/xIA5v8TAOX/FADk/xQAAgD8/wEA/P8CAP3/AgD9/wIA/P8CAP3/AgD+/wIA/f8DAP3/AwD9/wIA/f8DAP3/AwD9/wMA/f8DAPz/AgD9/wMA/f8DAP3/AgD9/wIA/f8CAP3/AgD+/wIA/v8CAP3/AwD+/wEA/v8CAP3/AgD9/wIA/f8CAP3/AwD9/wIA/f8CAP3/AgD+/wIA/v8CAP7/AwD+/wMA/v8CAP7/AgD+/wMA/v8DAP7/AwD9/wMA/f8DAP7/AwD9/wMA/v8EAP7/BAD9/wQA/f8AAAAAAQAAAAAAAAAAAAAAAAABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQAAAAAAAAAAAAAAAAAAAAAAAQAAAAAAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAYA9v8HAPb/BwD3/wcA9/8HAPf/CQD4/wgA+P8KAPf/CgD4/wsA9v8LAPb/CgD2/woA9v8KAPb/CQD2/wkA9/8JAPf/CAD4/wkA+P8IAPj/CAD4/wYA+P8GAPj/BwD5/wYA+f8GAPn/BgD5/wYA+v8GAPr/BgD5/wYA+v8GAPr/CAD6/wgA+f8HAPv/CAD7/wcA+/8IAPv/CAD6/wkA+v8JAPr/CQD6/woA+v8KAPn/CwD6/woA+v8LAPr/CwD6/wwA+v8MAPr//f8GAPz/BwD9/wUA/P8FAPz/BQD7/wUA+/8FAPr/BgD6/wUA+f8HAPn/BwD6/wcA+v8IAPr/BwD6/wcA+v8HAPv/BwD7/wYA+/8GAPz/BgD8/wYA/f8GAP3/BgD9/wYA/f8GAP3/BgD+/wYA/v8GAP7/BgD+/wYA/v8GAP7/BgD9/wYA/f8GAP7/BAD+/wUA//8FAP7/BQD//wUA/v8FAP//BgD//wYA/v8GAP//BgD+/wYA//8GAP7/BgD//wYA/v8GAP7/BgD8/wUA+/8DAPv/BAD8/wQA+/8EAPv/BAD7/wMA+/8DAPr/BAD6/wQA+v8FAPn/BAD6/wQA+v8EAPr/BAD6/wQA+v8EAPv/BAD7/wQA+/8EAPv/BAD8/wMA/P8EAPv/AwD8/wMA/P8DAPz/AwD8/wIA/P8DAPz/AwD8/wMA/P8CAPz/AwD8/wMA/P8CAPz/AgD7/wIA+/8BAPv/AgD7/wIA+v8BAPr/AQD7/wEA+v8CAPr/AQD5/wIA+v8BAPn/AQD5/wIA+f8CAAAA//8AAAAAAAD//wAA//8AAP//AAD//wAA//8AAAAAAAD//wAAAAAAAP//AAAAAAAA//8AAAAAAQAAAAEA//8AAP//AAAAAAAA//8AAP//AAD//wAAAAAAAP//AAAAAAAA//8AAP//AAAAAAAAAAAAAP//AAD//wAA//8AAAAAAAD//wAA//8AAAAAAAD//wAA//8AAAAAAAD//wAA//8AAAAAAAAAAAAAAAAAAP//AAAAAAAA//8AAAAAAAAAAAAA//8AAP//AAD//wAA//8AAAAAAAD//wEA//8AAP//AQAAAAAA//8AAAAAAAD//wAA//8BAP//AAD//wAA//8AAP//AAD//wAAAAAAAP//AAAAAAAAAAAAAAAAAAD//wAA//8BAP//AAAAAAAAAAAAAP//AAD//wAAAAAAAAAAAAD//wAA//8AAP//AAAAAAAA//8AAAAAAAAAAAEA//8AAAAAAAAAAAAA//8BAP//AAD//wAA//8AAP//AQD//wAA//8AAP//AAD//wAA//8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABAAAAAAD//wAAAAAAAAAAAQAAAAAAAAAAAAAAAAD//wEAAAABAAAAAAAAAAAAAAABAAAAAAAAAAAAAAABAP//AQAAAAAAAAAAAAAAAAD//wAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEAAAABAAAAAAAAAAEAAAAAAAAAAAAAAAAAAAABAAAAAAAAAAAAAAAAAAAAAQAAAAAAAAAAAAAAAAAAAAAAAAABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAD//wAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA//8AAP//AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAD//wAAAAABAAAAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAAKAOz/CwDt/wsA7/8LAO//CwDv/wwA8P8MAPD/DwDw/xAA8P8QAO3/EADt/xAA7f8QAO7/DwDu/w8A7v8PAO//DgDw/w4A7/8PAPD/DgDv/wwA8f8MAPH/DADx/wsA8f8LAPH/CwDx/wsA8v8LAPL/CwDz/wsA8/8LAPP/DADy/wwA8/8LAPP/CwD3/wwA9v8MAPb/DAD2/wwA9f8NAPX/DgD1/w4A9f8PAPX/EAD1/xAA9P8RAPX/EQD0/xIA9P8SAPT/EwDz/+z/IgDr/yEA6/8eAOv/HQDr/x0A6v8bAOn/GwDm/xoA5P8bAOH/HgDh/yAA4f8gAOH/IADi/x8A4/8fAOP/HgDk/x0A5P8dAOT/HADl/x0A5/8bAOj/GwDo/xsA6f8bAOn/GwDp/xsA6f8aAOj/GwDo/xoA6P8aAOf/GgDm/xsA5v8aAOX/GgDm/xQA5f8UAOT/FgDk/xYA4/8XAOH/FwDg/xgA3/8YAN7/GQDd/xkA2/8aANr/GgDY/xsA2P8bANb/GwDV/x0ABwD4/wYA9/8HAPj/BwD5/wcA+f8HAPr/BwD5/wgA+v8IAPn/CgD5/woA+P8KAPj/CwD3/woA+P8KAPf/CgD4/wkA+P8JAPj/CQD4/wkA+P8IAPj/BwD4/wcA+P8HAPj/BwD4/wYA+P8GAPj/BwD3/wYA+P8GAPj/BwD4/wYA+P8GAPj/BwD3/wUA+v8GAPv/BgD6/wcA+/8HAPv/BwD7/wcA+v8IAPv/CAD6/wgA+v8IAPr/CAD6/woA+v8JAPr/CgD6/woA+v8FAPn/BgD6/wYA+/8FAPv/BQD6/wUA+v8HAPz/BgD7/wgA+/8IAPr/CAD5/wgA+f8HAPr/BwD5/wcA+v8HAPr/BwD6/wcA+v8GAPr/BgD6/wYA+/8FAPv/BQD8/wUA+/8FAPv/BQD7/wQA+/8EAPz/BQD7/wQA+/8EAPv/BQD7/wUA+/8FAPz/BQD9/wQA/f8FAP3/BQD9/wUA/f8GAP3/BgD9/wYA/f8GAP3/BgD9/wcA/f8HAP3/BwD9/wgA/f8IAP3/BwD9//7/AwD+/wMA/f8CAP7/AgD+/wMA/v8DAPz/AgD9/wIA+v8DAPr/BAD6/wYA+v8GAPr/BgD6/wcA+f8HAPn/BgD5/wcA+f8HAPn/BwD5/wcA+f8HAPr/CAD6/wcA+f8IAPn/CAD5/wkA+v8KAPn/CQD5/woA+f8KAPn/CwD4/wsA+P8LAPf/CwD4/wgA+f8IAPj/CQD3/wkA+P8JAPf/CQD3/woA9/8JAPb/CgD2/wsA9v8KAPX/CgD0/woA9P8LAPP/CwD0/wsABQD1/wUA9v8FAPb/BQD2/wUA9v8EAPf/BgD3/wUA+P8HAPj/BwD3/wcA9v8HAPb/BwD2/wcA9v8HAPb/BwD3/wcA9v8HAPf/BwD3/wcA9/8GAPf/BgD3/wUA+P8GAPj/BgD3/wYA9/8FAPb/BgD3/wYA9v8GAPf/BgD2/wcA9v8HAPb/BwD2/wcA+f8GAPn/BwD4/wgA+P8HAPj/CAD4/wgA+P8IAPj/CQD4/wkA9/8JAPj/CgD4/wsA+P8LAPf/CwD3/wsA9//9/wYA/f8GAP3/BgD9/wYA/P8GAP3/BQD8/wUA/P8FAPv/BQD6/wYA+v8HAPr/BwD6/wcA+v8HAPv/BwD6/wcA+/8HAPr/BwD6/wcA+v8HAPv/BwD7/wYA/P8GAPv/BgD7/wcA+/8HAPz/BwD7/wcA+/8IAPv/BwD7/wgA+v8IAPr/CAD7/wgA+v8GAPv/BgD6/wcA+v8HAPr/BwD6/wgA+v8HAPn/CAD5/wgA+f8IAPn/CAD5/wgA+P8IAPf/CQD4/wkA9/8JAAUA9/8FAPf/BgD3/wUA+P8GAPj/BgD4/wYA+f8GAPj/BwD4/wkA+P8IAPf/CAD3/wgA9/8IAPf/BwD3/wgA9/8HAPj/CAD4/wgA+P8HAPj/BwD4/wYA+f8GAPn/BgD5/wYA+f8GAPj/BgD5/wYA+f8GAPj/BwD5/wYA+P8HAPj/BwD4/wcA+P8HAPr/BwD6/wcA+v8HAPr/CAD6/wgA+v8IAPr/CQD5/wkA+f8KAPn/CgD5/woA+f8KAPn/CwD5/wsA+f8MAPj///8EAP//BAD+/wQA//8DAP7/AwD+/wQA/v8DAP7/BAD+/wQA/f8EAP7/BAD+/wQA/v8EAP7/BAD+/wQA/v8EAP7/AwD9/wMA/v8DAP7/BAD+/wQA/v8DAP7/AwD+/wMA/v8DAP7/BAD+/wMA/v8DAP7/BAD+/wMA/v8DAP7/AwD+/wQA/v8EAP7/AwD+/wMA/v8CAP7/AgD+/wMA/v8DAP7/AwD+/wQA/v8DAP3/BAD9/wQA/f8EAP7/BAD9/wMA/f8EAP3/BAAAAP//AAD+/wAA//8AAP//AAD//wAA//8AAP//AQD//wAA//8AAP7/AAD//wAA//8AAP//AAD//wAA//8AAP//AAAAAAEA//8AAAAAAAD//wAA//8AAAAAAAD//wEA//8AAP//AAD//wAA//8BAP//AAD//wAA//8AAP//AAD//wAA//8AAP//AAD//wAA//8AAAAAAAAAAAAA//8AAP//AAD//wAA//8AAP//AAD//wAA//8AAP7/AAD//wAA//8AAP//AAD//wAAAAAAAAEAAAAAAAAAAAAAAAEAAAAAAAAAAAAAAAAAAAAAAAAAAQAAAAAAAAAAAAAAAAAAAAAAAAABAAAAAAAAAAAAAAABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABAAAAAQAAAAAAAAABAAAAAAAAAAAAAAAAAAAAAQAAAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQAAAAAAAAAAAAAAAQAAAAAAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQAAAAEAAAAAAAAAAAAAAAAAAAAAAAAAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABAAAAAQAAAAAAAAAAAAAAAQAAAAEAAAALAPD/CwDw/wsA8f8KAPL/CwDx/wwA8v8MAPP/DgDy/xAA8v8QAPD/EADw/xAA8P8QAPD/DwDx/w8A8P8OAPH/DgDx/w0A8f8NAPL/DQDy/wsA8/8LAPP/CwD0/woA8/8KAPP/CgD0/woA8/8KAPT/CwD0/wsA9P8LAPP/DADz/wwA9P8MAPT/DAD3/wwA9/8MAPf/DQD2/w0A9v8OAPb/DwD2/w8A9f8QAPX/EAD1/xAA9f8RAPX/EgD1/xIA9f8SAPT/EwD0//r/DAD6/wsA+/8LAPv/CwD7/wsA+v8KAPv/CgD5/wsA+f8KAPn/CwD5/woA+f8LAPn/CgD5/woA+f8KAPr/CgD6/wkA+v8JAPv/CAD7/wkA+/8IAPv/CAD7/wgA/P8IAPv/CAD7/wcA/P8IAPz/BwD7/wcA+/8IAPv/CAD7/wgA+/8IAPv/BwD7/wYA+/8GAPv/BQD7/wYA/P8HAPv/BgD7/wcA+/8HAPv/BwD7/wgA+/8HAPr/BwD6/wcA+v8IAPr/CAD6/wgA9f/v//T/7//0/+//9P/u//T/7//0//D/8//w//P/8P/y//H/8//x//P/8f/z//H/9P/y//X/8f/2//L/9f/y//b/8//3//P/9v/z//b/8v/3//P/+P/z//f/8v/3//L/9//y//f/8v/3//L/9v/y//f/8v/2//H/9v/w//X/8P/1/+//9P/y//P/8//z//P/8v/z//L/8v/w//H/8P/x/+//8P/v//D/7v/w/+7/7//t//D/7f/v/+z/7//s/+7/7P/t/+r/7f8KABsACwAbAAoAGwAKABsACgAaAAoAGQALABgACgAYAAsAGAAKABgACQAaAAkAGAAIABgACAAYAAcAFwAIABcABwAWAAcAFQAHABYABwAVAAcAFQAGABQABgAVAAYAFQAGABUABgAVAAUAFQAGABUABQAVAAYAFQAFABYABgAWAAYAFgAGABQACAARAAcAEAAIABEACAASAAkAEwAJABMACQAUAAoAFQAKABUACgAVAAoAFQALABYACwAXAAsAFwAMABkADQAaAPf/7v/3/+7/9//t//f/7f/3/+7/9//v//b/7//3/+//9f/w//b/8f/3//D/9//x//f/8v/4//L/+P/y//j/8v/4//P/+P/z//j/8//5//T/+f/z//n/9P/6//T/+f/0//r/8//6//T/+v/z//r/8//7//P/+v/z//v/8//6//L/+v/z//v/8v/6//X/+v/1//r/9P/5//T/+f/z//n/8//5//L/+P/y//j/8f/4//H/+P/x//f/8f/4//D/9//w//b/7//2/+7/BAANAAQADQAEAA4ABQANAAUADQAEAAwABQAMAAQADAAFAAwABAAMAAQADAAEAAwABAAMAAMADAAEAAwAAwALAAQACwADAAsABAAKAAMACgADAAsABAAKAAMACgAEAAoABAALAAQACgAEAAsABAALAAQACwAEAAsABAALAAUADAAFAAwABQAMAAUACQAGAAkABgAKAAYACgAHAAoABwALAAcADAAHAAsACAAMAAgADQAIAAwACQAMAAgADQAJAA0ACgAOAAoADgAAAAAAAAAAAAAA//8AAAAAAAD//wAAAAAAAAAAAAAAAAAA//8AAP//AAAAAAAAAAAAAP//AAD///////8AAAAAAAD//wAAAAAAAAAAAAAAAAAA/////wAAAAAAAAAAAAAAAAAA//8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA/////wAAAAAAAAAAAAAAAAAAAAAAAP//AAAAAAAAAAAAAAAAAAD//wAAAAD//wAAAAD//wAAAAD//wAAAAD//wAAAAAAAAAAAAAAAAAAAAAAAAAAAAD//wAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAP//AAAAAAAAAAAAAAAAAAAAAP//AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA//8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAP//AAAAAAAAAAAAAAAAAAAAAAAAAAAAAP//AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA//8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABAP7/AQD//wEA//8BAP//AQD//wEA//8BAP//AQD//wEA//8BAP//AgD//wEA//8BAP//AQD//wIA//8BAP//AgD//wEA//8BAP//AQD//wEA//8BAP//AQAAAAEA//8BAP//AQD//wEA//8BAP//AAD//wEA//8BAP//AQD//wEA//8BAP//AQD//wEAAAACAP//AQD//wEA//8BAP//AQAAAAEA//8CAP//AQD//wEA//8CAP//AQD//wIA//8CAP//AQD//wYA9/8GAPb/BgD3/wYA9/8GAPf/BwD3/wYA+P8HAPj/CAD4/wgA9/8IAPf/CAD3/wgA9/8IAPf/BwD4/wgA+P8HAPj/BwD4/wYA+f8GAPn/BAD6/wQA+v8EAPr/AwD6/wIA+v8DAPv/AwD6/wIA+/8DAPv/AgD7/wIA+/8CAPv/AQD8/wIA+/8BAP7/AQD9/wEA/v8BAP7/AgD+/wEA/v8BAP3/AgD+/wEA/f8BAP7/AgD+/wEA/v8CAP7/AQD+/wEA/v8CAP7//v8FAP7/BgD+/wUA/f8FAP7/BgD9/wUA/f8FAP3/BQD8/wUA/f8GAPz/BQD8/wYA/P8GAPz/BgD8/wUA/P8FAPz/BgD9/wYA/f8FAP3/BQD9/wUA/v8FAP3/BAD+/wUA/v8FAP3/BQD9/wUA/f8FAP3/BQD9/wUA/f8GAP3/BgD9/wUA/f8GAP7/AwD9/wQA/f8EAP3/BAD8/wQA/f8EAP3/BQD8/wQA/P8FAPz/BQD8/wUA/P8FAPz/BQD8/wUA/P8FAPv/BQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAD//wAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA//8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA//8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQD//wAAAAABAAAAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAP//AAAAAAEAAAAAAAAAAAAAAAAAAAABAAAAAQAAAAAA//8AAAAAAAAAAAAAAAAAAP//AAAAAAEA//8AAAAAAAAAAAAAAAABAAAAAAAAAAAAAAABAAAAAAAAAAAAAAAAAAAAAAAAAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABAAAAAAAAAAAAAAAAAAAAAAD//wAA//8AAAAAAQAAAAAA//8AAP//AAD+/wAA//8AAP7/AAD//wEA//8BAP//AAD//wEA//8BAP7/AAD+/wEA/v8BAP7/AQD//wAA/v8AAP7/AQD//wEA//8BAP7/AQD//wEA//8BAP//AAD//wEA//8BAP//AQD//wAA//8BAP//AQD//wAA//8AAP//AAD//wEA//8AAP//AAD//wEA//8BAP//AAD//wEA/v8BAP//AAD//wAA//8BAP//AAD+/wAA//8AAP//AQD//wAA/v8AAP7/AQADAPv/AwD8/wMA+/8DAPz/AwD8/wMA/P8DAPz/AwD9/wQA/P8EAPv/BQD8/wUA+/8FAPv/BAD8/wQA/P8EAPz/BAD8/wQA/P8DAPz/BAD8/wMA/P8DAPz/AwD9/wMA/P8CAP3/AwD8/wIA/f8DAP3/AgD8/wMA/f8CAP3/AgD9/wMA/f8CAP3/AwD+/wIA/v8CAP3/AgD+/wMA/v8DAP3/AgD+/wIA/v8DAP3/AwD+/wMA/v8DAP7/AwD9/wMA/v8EAP3/BAD9/wIA/v8DAP7/AwD+/wIA/f8DAP7/AgD+/wMA/f8DAP3/AwD+/wMA/v8CAP7/AgD+/wIA/v8DAP7/AgD+/wMA/v8DAP7/AgD+/wIA/v8BAP//AQD//wEA//8AAP//AQD//wAA/////wAAAAAAAP//AAD//wAA//8AAP//AAD//wAA/v8AAP//AQD+/wEA/v8BAP7/AQD//wEA/v8BAP7/AgD+/wEA/v8BAP3/AgD9/wEA/v8BAP3/AgD9/wIA/v8BAP3/AgD9/wIAAAD+/wAA/f8AAP7/AAD+/wAA/v8BAP7/AAD+/wAA/v8AAP3/AAD+/wEA/f8BAP7/AQD+/wEA/f8BAP7/AQD+/wEA/f8CAP3/AgD+/wEA/f8CAP3/AgD9/wMA/f8CAP3/AwD9/wMA/P8DAPz/BAD7/wQA/P8EAPz/BQD8/wUA+/8GAPv/BgD7/wYA+/8HAPr/BgD7/wYA+/8HAPr/BwD6/wgA+v8IAPn/CQD5/wkA+v8JAPn/CQD4/woA+f8KAPn/CgD4/woA+P/v/w0A7/8NAO//DADv/wsA7/8JAO7/CADt/wkA7P8IAOr/CADp/wkA6f8KAOn/CwDq/wsA6v8LAOz/CgDs/woA7f8KAO3/CgDv/wkA8f8JAPT/CAD0/wgA9f8HAPX/CAD3/wcA+P8IAPn/BwD5/wgA+v8HAPr/BwD7/wcA+/8IAPv/BwD8/wcA/f8DAP3/BAD+/wQA/v8EAP3/BAD+/wMA/f8EAP7/BAD9/wQA/v8DAP7/BAD+/wQA/v8DAP3/AwD+/wQA/v8DAPj/FQD4/xQA+P8TAPn/EwD5/xIA+f8SAPn/EAD5/xAA+f8QAPj/DwD5/w8A+f8OAPr/DQD6/w0A+v8MAPv/CwD7/wsA+/8KAPz/CgD8/wkA/P8JAP7/CAD9/wgA/v8HAP7/BwD//wcA//8HAP//BgD//wYAAAAFAP//BQD//wUAAAAFAP//BQAAAAUAAAAEAAAABAAAAAQAAAAEAP//BQAAAAUA//8FAAAABQD//wYA//8GAAAABgD//wYAAAAHAP//BgD//wcABAD4/wQA+P8EAPj/BAD3/wMA+P8EAPj/BAD4/wUA+P8FAPj/BgD3/wYA9v8HAPX/BwD1/wgA9P8HAPX/BwD1/wcA9f8HAPX/BwD0/wcA9f8GAPX/BQD1/wUA9v8FAPb/BQD1/wQA9P8EAPT/BAD0/wUA9P8EAPT/BADz/wUA8/8EAPP/BQDy/wMA9f8DAPb/BAD1/wQA9f8EAPT/BQD0/wQA8/8FAPP/BQDy/wUA8v8FAPL/BQDx/wYA8f8FAPD/BgDx/wcA8P8GAAQABgAEAAYABAAGAAUABwAFAAYABAAGAAUABgAFAAYABAAIAAUABwAFAAgABAAHAAQABwAFAAgABAAHAAUABwAFAAgABQAHAAUABwAFAAcABQAHAAYABwAFAAcABQAHAAYABwAGAAcABwAHAAcABwAHAAgABwAIAAgACAAIAAkACAAJAAgACgAHAAsABwAKAAgACwAHAAwACQAMAAgADQAJAA0ACQANAAoADgAJAA4ACQAPAAsADwALABAACwAQAAsAEAALAPz/+//7//v/+//7//v/+//7//v/+//7//v/+//7//v/+//8//r/+//6//v/+v/8//r//P/7//z/+v/8//v//P/7//z/+//8//v//f/8//z//P/8//v//P/8//z//P/8//v//P/8//z/+//7//z/+//7//v/+//7//v/+//7//r/+//7//r/+//6//v/+v/7//r/+v/5//v/+f/6//n/+v/5//n/+f/6//j/+f/4//n/+P/5//f/+P/4//j/9//4//f/+P/3//j/AwD+/wMA/v8DAP7/AwD+/wMA/v8DAP//AwD+/wMA/v8DAP7/BAD+/wUA/v8EAP3/BQD9/wQA/f8EAP3/BAD9/wQA/f8DAP3/BAD9/wMA/f8CAP3/AwD9/wIA/f8CAP3/AwD9/wIA/f8DAP3/AgD9/wMA/f8CAP3/AwD8/wIA/P8CAPv/AwD7/wMA/P8CAPz/AgD8/wMA+/8CAPv/AgD7/wIA+/8CAPr/AwD6/wMA+/8DAPr/AwD6/wIA+v8DAPr/AwD5/wMA+f/9/wYA/v8GAP7/BgD9/wYA/f8GAP3/BQD9/wYA/f8FAP3/BQD8/wUA/P8FAPz/BQD8/wYA/P8FAPz/BQD8/wQA/P8EAP3/BAD8/wQA/f8EAP7/BAD+/wMA/v8DAP7/AwD+/wMA//8CAP7/AgD//wIA/v8CAP//AQD+/wIA//8CAP//AgD+/wEA/v8BAP//AAD//wEA/v8BAP//AAD//wAA//8BAP//AQD+/wEA/v8AAP//AQD//wEA//8AAP7/AAD+/wEA/v8BAP//AgD//wIA//8CAP//AQD//wEA//8CAAAAAQD//wIA//8BAP//AgD//wIA//8CAP7/AQD//wIA//8CAP//AgD//wIA//8CAP//AQD//wIA//8BAP//AQD//wIAAAACAP//AQD//wIAAAABAP//AQAAAAEA//8CAAAAAQD//wEA//8BAAAAAgAAAAEA//8BAAAAAAAAAAEA//8BAP//AQD//wEA//8BAAAAAQAAAAEA//8BAP//AQD//wEAAAABAP//AQD//wEA/P8IAPz/BwD8/wcA/f8HAP3/BwD9/wYA/P8GAP3/BgD8/wYA/P8GAPv/BgD7/wcA/P8GAPv/BgD8/wYA/P8GAPz/BQD8/wUA/P8FAPz/BAD9/wUA/f8FAP7/BAD9/wMA/f8EAP7/AwD9/wQA/v8DAP3/AwD+/wMA/f8DAP7/AwD+/wMA/f8CAP7/AQD+/wEA/f8CAP3/AQD+/wEA/f8CAP3/AQD9/wEA/f8BAPz/AQD8/wEA/P8BAPz/AgD8/wIA/f8BAP3/AQAFAAAABQABAAYAAQAFAAEABQABAAUAAQAGAAEABQAAAAYAAAAHAP//BwD//wgA/v8HAP7/CAD9/wcA/f8HAP3/BwD+/wcA/f8HAP3/BwD9/wYA/f8GAP3/BQD9/wUA/f8GAPz/BQD9/wYA/P8FAPz/BgD8/wYA+/8GAPv/BgD7/wYA+v8HAPv/BgD8/wYA/P8HAPv/BwD7/wcA+/8IAPr/CAD6/wgA+v8IAPr/CQD6/wkA+f8KAPn/CgD5/woA+P8KAPj/CgD4//r/AwD6/wIA+f8CAPr/AgD6/wIA+v8CAPn/AgD5/wIA+f8CAPb/AwD2/wQA9f8FAPb/BgD1/wcA9f8HAPX/BgD1/wYA9v8GAPb/BgD2/wYA9/8GAPf/BQD4/wUA+P8GAPf/BwD3/wYA9/8GAPf/BwD3/wYA9v8GAPf/BgD2/wYA9v8GAPb/BgD3/wIA9/8CAPb/AgD1/wIA9f8CAPT/AgD0/wIA8/8CAPP/AgDz/wIA8/8CAPH/AgDx/wIA8f8DAPD/AwDw/wMACgD1/woA9v8KAPb/CgD3/wkA9/8JAPf/CQD3/woA+P8KAPj/DAD4/wwA9/8MAPf/DAD3/wwA9v8MAPb/DAD3/wwA9/8LAPf/CwD4/woA+P8JAPf/CQD5/wgA+f8IAPj/CAD4/wgA+P8HAPj/CAD3/wcA+P8IAPj/BwD4/wgA9/8IAPj/BwD3/wcA+v8HAPr/BwD6/wgA+f8IAPr/CQD5/wgA+f8JAPn/CQD4/wkA+P8JAPn/CwD4/wsA+P8KAPf/CwD3/wsA9//6/wsA+f8KAPr/CgD5/wkA+v8IAPr/CAD7/wgA+v8IAPn/CAD4/wgA+f8IAPn/CAD4/wgA+f8IAPn/CAD5/wcA+f8GAPr/BwD6/wYA+/8GAPz/BgD8/wUA/f8EAP3/BQD9/wQA/f8EAP7/BAD9/wQA/v8DAP7/AwD+/wMA/v8DAP3/AwD+/wMA/f8DAP7/AwD+/wIA/v8DAP3/AgD9/wMA/v8DAP7/AwD9/wMA/f8EAP3/AwD9/wQA/f8DAP3/BAD9/wQA/f8EAAEA/P8CAP3/AQD9/wIA/f8CAP3/AgD9/wEA/v8BAP3/AgD9/wMA/f8DAP3/AwD8/wQA/P8DAPz/AwD8/wMA/P8DAP3/AgD8/wMA/P8DAPz/AgD9/wIA/f8BAP7/AQD9/wIA/v8BAP7/AQD+/wEA/v8AAP//AAD//wAA/v8AAP//AAD+/wAA//8AAP//////////AAD//wAA//8AAP//AAD//wAA//8AAP//AAD///////8AAP7////+/wAA//8AAP//AAD+/wAAAgD//wIA//8CAP7/AQD//wEA//8CAP//AgD//wMA//8DAP//AwD//wMA/v8DAP7/AwD+/wMA/v8EAP7/AwD//wMA/v8EAP7/AwD//wMA//8DAP7/AgD+/wMA/v8DAP//AgD+/wIA/v8CAP7/AgD//wMA/v8CAP7/AgD//wIA//8CAP//AgD+/wIAAAACAAAAAgD//wIA//8DAP//AwD//wIA//8CAP//AwAAAAMAAAADAP//AwAAAAMA//8DAP//AwD//wQA///9/wQA/P8DAP3/BAD9/wMA/f8DAP3/AwD9/wIA/f8CAP3/AgD9/wIA/f8CAP7/AgD+/wEA/v8BAP7/AQD//wEA//8BAP7/AQD//wAA//8AAP//AAAAAAAA//8AAP//AAD//wAAAAAAAP//AAAAAP///////wAA//8AAP//AAD//wAA//8AAP//AAD//wAA//8AAAAAAAD/////AAD/////AAD//wAA//8AAP//AAD//wAA//8AAP//AAD//wAA//////////////f/DQD4/w0A+P8MAPj/DAD4/wwA+P8LAPj/CwD3/woA9/8KAPb/CgD2/wsA9f8LAPX/CwD2/wsA9v8LAPb/CgD2/woA9/8KAPf/CgD3/woA+P8KAPn/CQD5/wkA+f8JAPn/CQD5/wkA+f8JAPn/CQD5/woA+f8KAPn/CQD4/wkA+f8JAPj/CQD5/wYA+f8HAPj/BwD4/wcA+P8HAPj/CAD3/wgA9/8IAPb/CAD2/wgA9f8IAPX/CAD1/wkA9P8JAPX/CQD0/wkACAD0/wgA9P8HAPT/CAD0/wgA9f8HAPb/CAD2/wkA9/8JAPf/CwD2/wsA9f8LAPT/CwD1/wsA9f8KAPX/CgD1/wsA9v8KAPb/CQD2/wkA9v8IAPb/BwD3/wcA9/8HAPf/CAD3/wcA9/8IAPf/BwD3/wgA9v8HAPb/BwD3/wgA9v8IAPb/CAD3/wcA+v8HAPn/CAD4/wgA+f8JAPj/CQD4/woA+P8JAPf/CgD3/woA9/8LAPj/CwD3/wwA9/8MAPf/DAD3/w0A9v8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAgA9f8IAPb/CAD3/wgA9/8IAPj/CAD4/wgA+P8IAPn/CgD4/woA+P8KAPf/CwD4/woA9/8KAPf/CgD4/woA+P8JAPj/CQD4/wkA+f8IAPn/BwD6/wcA+v8HAPr/BwD5/wYA+f8GAPr/BgD6/wYA+v8GAPr/BwD6/wcA+v8HAPr/BwD6/wcA+v8HAPz/BwD7/wgA/P8IAPv/CAD8/wgA+/8IAPv/CQD8/wkA+/8KAPz/CgD7/wsA+/8KAPv/CwD6/wsA+v8MAPv/9/8MAPf/DAD3/wsA9/8LAPf/CgD3/wkA9/8JAPb/CQD1/woA9P8KAPP/DADz/wwA8/8MAPP/DADz/wsA8/8MAPP/CwD0/wsA9P8KAPX/CgD2/woA9v8KAPb/CQD2/woA9/8KAPf/CgD2/woA9/8KAPb/CgD1/woA9v8KAPX/CwD1/wsA9f8KAPX/BwD1/wgA9P8IAPT/CQD0/wkA8/8KAPP/CQDy/wkA8v8KAPH/CQDx/woA8P8LAPD/CgDv/wsA7/8LAO7/CwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAP7/BAD9/wMA/v8EAP3/BAD9/wMA/v8DAP3/AwD9/wIA/P8CAPz/AwD8/wMA+/8EAPz/BAD7/wQA/P8EAPz/BAD8/wQA+/8EAPv/BAD7/wQA/P8DAPz/AwD8/wQA/P8EAPz/BAD8/wQA/P8EAPz/BAD8/wUA/P8FAPv/BQD8/wQA+/8FAPz/BQD8/wQA/P8EAPz/BAD7/wQA+v8DAPv/AwD6/wQA+/8EAPr/BAD6/wQA+f8EAPn/BAD5/wQA+f8EAPn/BAD4/wUAAwD5/wQA+f8DAPn/BAD5/wQA+f8DAPr/AwD6/wMA+v8EAPr/AwD6/wQA+v8FAPn/BAD6/wUA+v8EAPr/BAD5/wUA+v8FAPr/BQD6/wUA+v8FAPr/BQD6/wUA+v8FAPr/BAD6/wUA+f8FAPn/BAD6/wUA+f8FAPn/BgD4/wUA+f8GAPj/BQD4/wUA+/8FAPr/BQD6/wYA+v8HAPv/BgD6/wcA+v8HAPr/CAD6/wgA+v8JAPr/CAD5/wkA+v8JAPr/CQD6/woA+f8DAAEAAgABAAMAAQACAAEAAgABAAIAAQACAAEAAgACAAEAAgACAAEAAQACAAEAAgABAAIAAAACAAEAAgABAAMAAAACAAAAAwAAAAMAAAADAP//AwD//wMA//8DAP//AwD//wMA//8EAP//BAAAAAMA//8EAP//BAD//wQA//8EAP//BAD//wUA//8DAP//BAD//wQA//8EAP7/BAD//wUA//8FAP7/BQD+/wUA/v8FAP7/BQD//wUA/v8FAP7/BQD+/wUA/v8FAAQA9/8FAPf/BAD3/wQA+P8EAPj/BAD5/wQA+f8FAPj/BQD5/wUA+f8GAPj/BQD4/wYA+P8GAPn/BQD5/wUA+f8FAPn/BQD5/wYA+f8FAPn/BAD6/wQA+v8EAPr/BAD6/wQA+/8DAPr/BAD6/wMA+v8EAPr/BAD6/wMA+/8EAPr/BAD7/wQA+v8EAPz/BAD8/wQA/P8EAPz/BQD7/wQA+/8EAPv/BQD6/wUA+/8FAPv/BQD6/wUA+/8FAPv/BgD7/wYA+v8GAPr/AQD7/wEA/P8BAPz/AQD8/wEA/P8BAPz/AQD8/wEA/f8BAPz/AgD9/wEA/f8CAP3/AQD9/wEA/f8BAP3/AQD9/wEA/v8BAP3/AAD+/wEA/v8AAP7/AAD+/wAA/v8AAP7/AAD+/wAA/v////7/AAD//////v//////AAD+//////////7//////////////////////////////////////////////wAA//////////////////////////////////////7////+/wgA/v8IAP7/CAD+/wcA/v8IAP7/BwD+/wcA/v8HAP7/BwD9/wcA/f8GAPz/BwD9/wcA/f8HAP3/BwD9/wcA/f8GAP3/BwD9/wYA/f8GAP7/BgD+/wYA/v8GAP7/BgD+/wYA/v8GAP//BwD+/wYA//8GAP//BgD+/wYA//8GAP7/BwD//wYA//8FAP//BQD//wUA//8FAP7/BQD//wUA//8FAP7/BQD+/wUA/v8GAP7/BgD+/wYA/v8GAP7/BgD+/wcA/v8HAPz/BQD7/wQA/P8EAPz/BAD8/wQA/P8DAPz/BAD7/wMA+/8DAPr/AwD6/wQA+v8EAPr/BAD6/wQA+/8EAPv/AwD7/wQA+/8DAPv/BAD7/wQA/P8DAPz/AwD8/wMA/P8DAPz/AgD9/wMA/P8DAPz/AwD8/wMA/P8CAPz/AwD8/wMA/P8CAPz/AwD8/wIA/P8CAPz/AgD8/wIA/P8CAPv/AgD7/wIA/P8CAPv/AgD7/wIA+/8CAPr/AgD6/wIA+v8CAPr/AgD6/wIA/v8CAP7/AgD+/wIA/v8CAP7/AQD+/wIA/v8BAP7/AQD+/wEA//8BAAAAAAAAAAAA//8AAAAA//////////8AAP//AAD//wAAAAD///////8AAP///////wAA//8AAP//AAD///////8AAP7/AAD/////////////AAD//////v8AAP/////+/////v////////////7////////////////////+//////////7////+///////////////+/////v////7///8BAP7/AgD//wEA/v8BAP7/AQD+/wEA/v8CAP7/AgD//wIA//8BAP//AQAAAAEAAAABAP//AQAAAAEAAAABAAAAAQD//wEAAAAAAAAAAQAAAAAAAQABAAEAAAABAAAAAAAAAAEAAAABAAAAAQAAAAAAAAAAAAEAAQAAAAAAAAABAAAAAAAAAAEAAAABAAAAAAAAAAEAAQAAAAAAAQAAAAEAAAABAAAAAQAAAAEAAQABAAAAAQAAAAEAAAABAAEAAQAAAAEAAQABAA8A6f8PAOn/DwDq/w8A6/8PAOz/DwDt/xAA7v8RAO7/FADt/xcA6/8XAOn/FwDp/xcA6v8WAOr/FgDq/xUA6v8VAOv/FADr/xQA7P8SAOz/EADt/xAA7f8QAO7/EADu/w8A7v8PAO3/DwDt/w8A7v8QAO7/DwDt/xAA7v8RAO7/EQDu/xEA8P8QAPP/EQDz/xEA8f8SAPL/EwDx/xQA8f8UAPD/FgDw/xYA8P8XAO//GADw/xkA7/8ZAO//GgDu/xsA7v8bAO7/+/8EAPv/BAD7/wUA+/8EAPv/BAD7/wMA+v8DAPr/AwD3/wQA9/8FAPb/BwD3/wYA9/8GAPf/BgD3/wYA+P8GAPf/BgD4/wYA+f8FAPr/BgD6/wUA+v8FAPr/BQD6/wUA+/8FAPz/BQD7/wUA/P8EAPz/BQD8/wUA/P8EAPz/BAD8/wQA/P8DAP3/AwD8/wMA/f8EAPz/AwD8/wQA/P8DAPz/BAD8/wQA/P8EAPv/BQD8/wQA+/8FAPz/BAD7/wUA+/8FAPv/BAD9/woA/P8KAPz/CQD9/wkA/P8IAPz/CQD7/wgA+/8HAPv/CAD5/wgA+v8IAPr/CQD6/wkA+v8IAPv/CAD6/wgA+/8IAPv/CAD7/wgA+/8HAPz/BwD8/wcA/P8GAP3/BwD8/wYA/P8HAP3/BwD8/wcA/P8HAPz/BwD8/wcA/P8HAPz/BwD8/wYA/P8FAPz/BQD8/wUA/P8GAPz/BgD8/wcA/P8HAPv/BgD7/wcA+/8GAPr/BwD7/wYA+v8HAPr/BwD6/wcA+v8IAPn/CQD6/wkA+v8IAPn/CAD6/wgA+v8HAPr/BwD5/wcA+P8GAPf/BwD3/wgA9v8IAPb/CAD3/wkA9v8JAPf/CQD3/wgA9/8IAPf/CAD4/wgA+f8HAPn/CAD5/wcA+P8HAPr/CAD5/wcA+f8IAPn/CAD4/wcA+f8HAPj/CAD4/wgA9/8IAPj/CAD4/wYA+P8GAPf/BgD3/wYA9v8GAPb/BgD2/wYA9f8HAPX/BgD1/wcA9f8HAPP/BwDz/wcA8/8IAPP/CADy/wgABAD6/wMA+v8EAPv/BAD7/wMA+/8EAPv/BAD7/wQA/P8FAPz/BQD8/wUA+v8FAPv/BgD7/wUA+v8FAPr/BQD6/wUA+/8FAPr/BQD7/wUA+/8EAPv/BAD7/wQA+/8EAPv/BAD7/wQA+/8EAPr/BAD6/wUA+/8EAPv/BQD7/wQA+v8FAPr/BQD6/wQA/P8FAPz/BQD8/wUA/P8GAPz/BQD8/wUA+/8GAPv/BgD8/wYA+/8GAPv/BwD7/wcA+/8HAPr/BwD6/wgA+v8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQAAAAEA//8BAAAAAQAAAAEA//8BAAAAAQAAAAAA//8AAAAAAAAAAAEAAAABAAAAAAAAAAEAAAABAAAAAQAAAAEAAAABAAAAAAD//wEAAAABAAAAAAAAAAEAAAABAP//AAAAAAEAAAABAAAAAQAAAAEAAAABAAAAAAAAAAEAAAAAAP//AQAAAAEA//8BAAAAAQAAAAEA//8AAAAAAAAAAAEAAAABAAAAAAAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAD+/wQA/v8DAP7/AwD+/wMA/v8DAP//AwD+/wMA/f8DAP7/AwD9/wMA/f8DAP3/AwD9/wQA/f8DAP3/BAD9/wMA/f8DAP3/AwD9/wMA/v8CAP7/AwD+/wMA/v8DAP7/AwD//wMA/v8DAP7/AwD+/wMA/v8CAP7/AwD+/wMA/v8DAP7/AwD//wMA//8BAP//AgD+/wIA/v8CAP//AgD+/wIA/v8CAP7/AgD+/wMA/v8CAP7/AgD+/wMA/v8CAP7/AwD9/wMA/f8DAP//AwAAAAMAAAADAP//AgAAAAIA//8CAP//AgAAAAIAAAACAAAAAgD//wIA//8CAP//AgD//wIA//8CAP//AgAAAAIAAAACAP//AgD//wIA//8CAP7/AgD//wIA//8CAP7/AgD+/wIA/f8CAP7/AwD9/wMA/f8CAPz/AwD9/wMA/P8DAPz/AwD7/wMA+/8DAPv/AwD7/wMA+v8EAPv/BAD6/wUA+v8FAPn/BAD5/wUA+f8EAPn/BAD4/wUA+P8FAPj/BQD4/wUABQD4/wUA+f8FAPj/BQD5/wUA+v8FAPr/BQD6/wUA+v8FAPv/BgD6/wYA+v8GAPr/BgD5/wYA+v8GAPn/BgD6/wUA+v8FAPv/BQD7/wUA+/8EAPv/BAD7/wQA+/8DAPv/AwD7/wQA+/8EAPv/AwD7/wQA+/8EAPz/BAD7/wMA+/8EAPz/AwD7/wQA/f8EAP3/BAD9/wQA/f8EAP3/BAD9/wQA/P8EAPz/BQD8/wUA/P8FAP3/BQD9/wYA/f8FAPz/BgD8/wYA/P/9/wsA/f8KAP3/CwD+/wsA/f8KAP3/CQD+/wkA/f8JAP3/CAD8/wkA/P8KAPz/CQD8/woA/P8JAPz/CgD8/wkA/P8JAPz/CAD9/wgA/P8IAP3/CAD9/wgA/f8IAP7/CAD+/wgA/f8IAP7/CAD+/wgA/v8IAP7/BwD+/wgA//8IAP7/BwD+/wgA/v8GAP7/BQD+/wUA//8GAP//BgD//wYA//8GAP//BgD+/wcA/v8GAP7/BgD+/wYA/v8GAP//BwD+/wcA/v8HAPH/+P/x//n/8f/4//D/+P/x//f/8f/3//D/9//x//j/7//3/+//9//t//j/7f/5/+3/+//u//v/7//7/+///P/w//v/8P/8//D//P/x//z/8//7//T/+//0//v/9P/6//T/+//1//v/9P/7//X/+v/0//r/9P/6//T/+v/0//n/9P/6//T/+f/0//r/8//6//P/+v/x//n/8f/5//D/+f/w//n/7//5//D/+f/v//n/7v/5/+7/+f/t//n/7f/4/+3/+P/s//j/DgD//w4A/v8NAP//DgD//w0AAAANAAAADgABAA4AAAAQAAEAEAABABMA//8TAP//EwD9/xMA/f8SAP3/EgD8/xIA/f8SAPz/EgD9/xIA/f8QAP3/EAD9/w8A/f8PAP7/DwD+/w8A/f8QAP3/DwD9/xAA/v8QAP7/EQD+/xEA/v8SAP3/EgD+/xIAAAATAAAAEwAAABUAAAAVAAAAFgAAABcAAAAYAAAAGAAAABkAAAAbAAAAGwAAABwAAAAcAAAAHQAAAB4AAAABAP3/AQD9/wIA/f8BAP3/AgD9/wIA/v8BAP3/AQD9/wEA/v8CAP7/AgD+/wIA/f8CAP3/AQD9/wIA/f8CAP7/AQD9/wEA/v8BAP3/AQD+/wAA/v8AAP//AAD//wAA/v8AAP7/AAD+//////8AAP//AAD+/wAA//8AAP7//////////////////////////////wAA//8AAP//AAD//wAA//8AAP//AAD///////8AAP7////+//////////7////+/wAA/v8AAAAAAQD//wIA//8BAP//AQD//wEA//8BAP//AQD//wIA//8BAP7/AQD+/wEA//8CAP//AQD//wIA//8BAP//AQD//wIA//8BAP//AgD//wEA//8CAP//AQD//wEAAAABAAAAAQD//wIAAAABAP//AQD//wEA//8BAP//AQD//wEA//8BAAAAAQD//wEA//8BAAAAAAD//wEA//8AAP//AQD//wEA//8BAP//AQD//wEA//8BAP//AQD+/wEA//8CAP//AQD//wEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA//8BAAAAAQD//wEAAAABAP//AQD//wEAAAABAAAAAAAAAAEAAAABAAAAAQD//wAA//8BAAAAAQD//wEA//8BAP//AQAAAAEA//8AAP//AQAAAAAAAAABAAAAAAD//wEA//8BAAAAAAD//wEAAAABAP//AQAAAAAA//8BAAAAAQAAAAEA//8BAAAAAQAAAAEA//8BAP//AAAAAAEAAAAAAP//AAD//wAA//8BAP//AAD//wEA//8BAAAAAQAAAAAA//8AAP//AQAAAAEA//8AAAAAAQAAAAAAAAAAAAAAAAAAAAAAAAABAP//AAAAAAAA//8AAAAAAAAAAAAA//8AAAAAAAAAAAAAAAAAAP//AAAAAAEAAAAAAAAAAAD//wAAAAABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQAAAAAAAAAAAP//AAAAAAAA//8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAP//AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAP//AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAwD5/wQA+v8EAPn/AwD7/wMA+/8DAPv/AwD7/wMA+/8EAPv/BAD7/wUA+v8EAPv/BAD6/wUA+v8EAPv/BAD7/wQA+v8FAPv/BAD6/wQA+/8DAPz/BAD7/wMA+/8DAPz/AwD7/wIA/P8DAPv/AwD7/wMA/P8CAPv/AwD8/wMA+/8DAPz/AwD8/wMA/f8CAP3/AwD9/wMA/f8DAP3/AwD9/wQA/P8EAP3/BAD8/wQA/f8EAPz/BAD8/wQA/P8FAPz/BQD8/wQA+//3/w8A9/8OAPf/DgD3/w0A+P8NAPj/DAD3/wwA9/8MAPb/CgD0/woA8v8NAPL/DQDy/w8A8v8OAPP/DgDz/w4A8/8OAPP/DQD0/w0A9P8NAPb/DAD2/wwA9v8MAPb/CwD3/wwA9/8MAPf/DQD2/w0A9v8MAPf/DQD2/w0A9f8NAPb/DQD1/wwA9v8KAPb/CgD1/wsA9P8LAPT/CwDz/wwA8/8NAPL/DADy/w0A8f8NAPH/DgDx/w4A7/8OAO//DgDu/w8A7/8PAPv/BwD7/wcA+/8HAPv/BgD7/wYA+/8FAPz/BQD7/wUA+v8FAPr/BAD6/wQA+v8FAPn/BQD6/wUA+f8FAPr/BAD7/wQA+v8FAPv/BAD7/wMA/P8DAPz/AwD9/wMA/f8DAPz/AwD9/wIA/f8CAP3/AgD+/wIA/f8BAP3/AQD+/wIA/f8BAP7/AQD9/wAA/f8BAP3/AAD+/wEA/f8BAP3/AAD9/wEA/f8BAP3/AQD9/wAA/f8BAPz/AQD9/wEA/f8BAP3/AQD8/wEADgDs/w4A7P8OAO3/DgDu/w0A7v8NAO//DADw/w0A8P8OAPH/DwDy/xAA8v8RAPD/EQDw/xAA8P8RAPD/EADx/w8A8f8QAPH/DgDy/w4A8v8LAPP/CwD0/woA9P8LAPT/CgD0/woA9P8JAPT/CgD0/wkA9P8KAPX/CgD0/woA9P8KAPT/CQD3/woA+f8KAPj/CgD4/woA+P8LAPj/DAD4/wwA9/8MAPf/DAD3/w0A+P8OAPf/DwD3/w8A9/8PAPf/DwD2/xAA9v8BAAAAAAABAAAAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQAAAAAAAQABAAEAAQABAAAAAQAAAAEAAQABAAAAAQABAAEAAQABAAEAAQABAAAAAQAAAAAAAQABAAAAAAABAAEAAAAAAAAAAQABAAAAAAABAAEAAAABAAEAAQABAAAAAAAAAAEAAQABAAEAAQAAAAEAAAABAAEAAAABAAEAAQABAAEAAQAAAAAAAAAAAAAAAQAAAAAAAQABAAEAAQABAP//AgAAAAIA//8CAP//AgD//wEA//8CAP//AQD//wEA//8BAP//AgD//wIA//8BAP//AQD//wIA//8BAP//AQD//wIA//8BAP//AQD+/wEA//8BAP//AQD//wEA//8BAP//AgAAAAEA//8CAAAAAgD//wEA//8CAP//AQD//wEA//8BAP//AQD//wEA//8BAP//AQD//wEA//8BAP7/AQD//wEA//8BAP//AQD//wEA//8BAP//AQD+/wIA//8BAP//AQD//wEACADx/wcA8P8IAPH/BwDx/wcA8v8HAPL/BwDz/wgA9P8JAPT/CgDz/wsA8v8MAPL/DADx/wsA8f8MAPH/DADx/wsA8f8LAPL/CwDy/woA8/8JAPP/CQDz/wkA8/8JAPP/CQDy/wgA8v8JAPH/CQDx/woA8v8KAPH/CgDx/wsA8P8LAPD/CgD0/wsA9P8LAPP/CwDz/wwA8/8MAPP/DgDx/w4A8f8PAPL/DwDx/xAA8v8QAPH/EQDx/xIA7/8SAO//EgDv/xMA7//0/xMA9f8TAPT/EgD1/xIA9f8SAPX/EQD1/xAA8/8PAPL/DgDw/w4A7v8QAO3/EgDt/xMA7v8TAO7/EwDu/xMA7/8SAO//EgDv/xIA8v8RAPL/EADz/xAA8/8QAPP/EAD0/xAA9f8RAPT/EQD0/xEA9P8QAPX/EAD0/xAA9P8RAPT/EQD1/wwA9f8LAPT/DAD1/wwA9P8MAPT/DADy/w0A8v8NAPH/DADx/w0A8P8NAPD/DgDw/w4A7/8PAO//DwDv/w8A7f8PABEA4/8RAOX/EgDm/xEA5v8RAOf/EADo/xAA6f8SAOr/EwDs/xUA7P8XAOr/FwDp/xcA6P8XAOj/FgDo/xYA6f8VAOr/FgDq/xUA6v8RAOv/EQDs/xAA7f8QAO3/EADt/w8A7f8PAOz/EADs/xAA7P8PAO3/DwDt/xAA7P8RAOz/EQDs/xAA8v8QAPP/EQDy/xEA8f8SAPH/EgDx/xQA8P8UAPD/FQDx/xYA8P8XAPD/GADv/xgA7/8ZAO7/GQDu/xoA7v8bAO3/9/8QAPf/DwD3/w4A+P8PAPj/DgD4/w0A+P8MAPf/DAD2/wsA9f8MAPP/DQD0/w0A8/8PAPP/DgDz/w8A8/8OAPP/DgDz/w4A8/8OAPX/DgD0/w4A9P8NAPX/DgD1/w0A9P8OAPT/DwDz/w8A8/8PAPT/DwDz/w8A8/8RAPL/EADx/xEA8/8MAPL/DADx/wwA8f8NAPD/DQDw/w0A7/8OAO//DgDu/w4A7f8OAOz/DgDr/w8A6v8PAOr/EADq/xAA6f8QAOn/EgD//wUA//8FAP//BQD+/wQA//8EAP//BQD//wUA//8EAP//BAD+/wQA/v8FAP7/BQD+/wQA/v8FAP7/BQD+/wUA/v8EAP7/BAD+/wQA/v8EAP//BAD//wQA/v8DAP7/BAD//wQA//8EAP//BAD//wQA/v8EAP//BAD+/wMA/v8EAP//AwD+/wMA//8DAP//AwD+/wMA/v8DAP7/BAD+/wQA/v8EAP7/AwD+/wQA/v8EAP7/BAD+/wQA/f8EAP3/BAD9/wQA/f8EAP7/AgD+/wIA/v8CAP//AgD+/wIA/v8BAP7/AQD+/wEA/v8BAP7/AAD+/wEA/f8BAP7/AQD9/wEA/v8BAP7/AQD+/wIA/f8BAP7/AgD//wEA/v8BAP7/AQD+/wEA/v8BAP7/AQD+/wEA/v8BAP7/AQD//wEA/v8BAP7/AQD+/wEA/v8CAP7/AQD+/wAA/v8AAP7/AQD+/wEA/v8AAP7/AAD9/wEA/f8BAP3/AQD9/wAA/f8AAP3/AQD+/wEA/f8BAP3/AQD9/wEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAP//AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAP//AAAAAAAAAAAAAP//AAAAAAAAAAAAAAAAAAAAAAMA/f8DAP3/AwD9/wIA/f8CAP3/AwD9/wMA/v8CAP7/AgD+/wMA/v8DAP3/BAD9/wMA/v8EAP3/AwD9/wMA/f8DAP3/AwD+/wMA/v8CAP3/AgD+/wIA/v8DAP7/AwD+/wMA/f8CAP3/AwD+/wIA/v8CAP3/AgD+/wIA/v8DAP7/AgD9/wMA/v8CAP//AgD//wMA/v8DAP7/AwD//wMA//8DAP7/AwD+/wMA//8DAP//BAD//wQA//8DAP7/BAD+/wQA/v8EAP3/AAD//wAA//8AAP//AAAAAAAAAAAAAAAAAAD//wAAAAABAAAAAAAAAAAAAAAAAAAAAAD//wAAAAAAAAAAAAAAAAAAAAABAP//AAAAAAAAAAABAP//AQD//wAAAAAAAP//AAAAAAAAAAAAAP//AAD//wAAAAAAAP//AAAAAAAAAAAAAAAAAAD//wAA//8AAAAAAAAAAAAAAAAAAP//AAD//wAA//8AAAAAAAD//wEA//8AAP//AAD//wAA//8AAAAAAAAAAAAAAAD9/wQA/f8EAP3/BAD9/wMA/v8DAP3/AwD9/wMA/f8DAP3/AwD9/wMA/f8DAPz/AwD9/wQA/P8DAP3/AwD9/wMA/f8DAPz/AwD9/wMA/v8DAP3/AwD9/wMA/f8CAP7/AwD9/wMA/v8DAP7/AwD+/wMA/v8DAP7/AwD+/wIA/f8CAP7/AgD9/wMA/v8CAP7/AQD9/wIA/f8CAP3/AgD9/wIA/v8DAP3/AgD9/wMA/P8CAPz/AgD8/wMA/f8DAPz/AgD8/wIA/P8DAAIA//8CAP//AgD//wIA//8CAP//AgAAAAIAAAADAP//AgD//wIA//8DAP//AwD//wIA//8DAP//AgD//wIA//8CAP//AwD//wIA//8CAP//AgD//wIA//8CAP//AQD//wIA//8CAP//AQD//wIA//8BAP//AgD//wEAAAACAP//AgAAAAIA//8CAAAAAgAAAAIA//8CAAAAAgAAAAIAAAACAP//AwAAAAMA//8DAAAAAwAAAAMA//8CAP//AwAAAAMAAAADAP//AAD+/wAA/v8AAP7/AAD+/////v8AAP7/AAD+/////v8AAP7/AAD+//////////7/AAD+/wAA//8AAP7/AAD+/wAA/v8AAP//AAD+/////v8AAP//AAD//wAA//8AAP//AAD+/////v8AAP7/AAD//wAA/v8AAP7/AAD+/wAA//////7/AAD//////v//////AAD//wAA/v8AAP7/AAD+/////v////7////+/////v8AAP7/AAD+/wAA/v8AAP7/AAD+/////v8AAAAAAAAAAAAAAAAAAAEAAAABAAAAAAAAAAAAAAAAAAAAAAAAAAEAAAAAAAEAAQAAAAAAAAAAAAAAAAAAAAEAAAAAAAAAAAAAAAAAAAABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQAAAAAAAAAAAAAAAQAAAAAAAAAAAAEAAAAAAAAAAAABAAEAAAAAAAAAAAAAAAAAAAAAAAEAAQABAAEAAAABAAEAAQAAAAAAAAAAAAAAAAABAAAAAAAAAAAAAQAAAAUA+f8FAPn/BQD6/wUA+f8FAPn/BQD6/wUA+v8GAPv/BQD7/wYA+v8HAPr/BgD6/wcA+v8GAPn/BgD6/wYA+f8HAPr/BgD6/wYA+v8FAPr/BQD7/wQA+/8FAPv/BQD7/wQA/P8FAPv/BAD7/wQA+/8EAPz/BAD7/wQA+/8EAPv/BAD7/wQA/P8EAPz/BAD9/wQA/f8FAP3/BQD9/wQA/P8EAPz/BQD8/wUA/P8FAP3/BQD9/wYA/f8GAPz/BgD8/wYA/P8GAPz/BwD1/wcA9v8HAPX/BwD2/wcA9/8GAPb/BwD3/wcA9/8IAPj/CQD4/woA9v8KAPb/CQD2/wkA9/8JAPf/CQD3/wgA+P8IAPj/BwD4/wUA+f8EAPn/BQD5/wQA+f8EAPr/AwD6/wMA+v8DAPr/AwD6/wMA+v8DAPr/AwD7/wMA+/8CAPv/AgD9/wIA/f8CAP3/AgD9/wIA/f8CAP3/AwD9/wMA/f8CAP3/AgD9/wMA/f8DAP3/AgD8/wMA/P8DAPz/AwD8/wMA/f/9/wEA/f8BAP3/AQD9/wEA/f8AAP3/AQD8/wAA/f8BAPz/AAD7/wEA+/8CAPv/AgD7/wMA+/8DAPv/AwD7/wQA+/8DAPv/AwD8/wQA/f8DAP3/AwD8/wQA/P8EAPz/AwD8/wMA/P8FAPz/BAD8/wUA/P8FAPv/BgD7/wUA+/8FAPv/BgD7/wQA+/8FAPv/BAD7/wQA+v8FAPr/BQD6/wUA+v8FAPn/BgD6/wYA+f8FAPn/BQD5/wcA+P8HAPj/BwD4/wcA+P8GAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQD//wQAAAAFAP//BAD+/wUA/v8FAP7/BQD//wUA//8FAP//BQD//wUA//8FAP7/BQD+/wUA/v8FAP//BAD//wUA/v8FAP//BQD+/wUA/v8GAP3/BQD9/wYA/f8FAP3/BgD8/wYA/P8GAPz/BgD8/wYA+/8GAPv/BgD7/wYA+/8HAPr/BwD6/wcA+v8HAPn/BwD5/wgA+f8IAPn/BwD5/wgA+P8IAPj/CQD4/wkAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABAAAAAAAAAAAAAAAAAAAAAAABAAAAAAAAAAAAAAAAAAAAAAABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA//8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABAAAAAAAAAAAAAADs/yUA6/8iAOv/IQDr/x8A7P8fAOz/HgDs/x0A7P8bAOn/GgDo/xkA5v8ZAOT/GwDj/xwA5P8dAOT/HQDk/x0A5f8cAOb/GwDo/xsA6v8aAO3/GADs/xgA7f8XAO3/FwDu/xcA7v8WAO7/FgDt/xYA7f8WAO3/FgDt/xYA7f8WAOv/FgDs/xQA7f8PAOz/EADr/xAA6v8RAOn/EQDp/xIA6P8TAOb/EwDm/xMA5f8TAOT/EwDj/xQA4v8UAOH/FQDg/xUA3/8WABEA3v8SAOD/EwDi/xMA4/8SAOT/EgDk/xEA5f8QAOf/EwDn/xQA6f8UAOn/FgDo/xYA5/8VAOj/FQDo/xUA6P8VAOj/FADq/xIA6f8QAOv/DgDs/w4A7f8NAO3/DgDt/wwA7v8MAO7/DADv/w0A7/8NAO//DQDv/w0A7/8NAO//DgDv/w4A8P8NAPX/DQD0/w4A9P8PAPP/DwDz/xAA8/8QAPL/EQDy/xIA8v8SAPL/EwDy/xQA8v8VAPH/FQDx/xYA8f8XAPD/AgD8/wIA/f8BAP3/AQD9/wEA/f8BAP3/AQD9/wIA/f8BAP3/AQD9/wIA/v8CAP3/AgD+/wIA/f8CAP3/AgD9/wIA/v8CAP3/AgD+/wIA/f8BAP7/AgD9/wIA/v8BAP7/AQD+/wEA/v8BAP7/AgD9/wIA/f8CAP7/AgD+/wIA/v8CAP7/AgD+/wIA/v8DAP//AwD+/wMA//8DAP7/AwD+/wMA/v8EAP7/AwD+/wQA/v8EAP//BAD+/wQA/v8EAP7/BQD+/wQA/v8DAP7/AwD+/wIA/f8CAP7/AgD+/wIA/v8DAP7/AwD+/wMA//8DAP//AwD+/wMA//8EAP7/BAD+/wQA/v8EAP7/AwD+/wMA/v8EAP7/AwD//wMA/v8DAP//AwD+/wMA//8DAP7/AwD//wMA/v8CAP//AgD//wMA/v8DAP7/AwD//wMA/v8DAP//AwD//wMA/v8DAP//AwD//wQA//8EAP//BAD//wQA//8FAP//BAD//wQA//8EAP//BAD//wUA//8FAP7/BQD//wAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAD8/wUA/P8FAP3/BQD9/wUA/f8EAP7/BQD9/wQA/P8EAP3/AwD9/wMA/P8EAPz/BAD7/wQA+/8EAPv/BAD8/wQA/P8EAPz/BAD7/wQA/P8EAPz/BAD8/wQA/P8EAP3/AwD9/wQA/f8DAP3/BAD9/wQA/f8EAPz/BAD8/wQA/P8EAPz/BAD8/wMA/P8DAPz/AwD8/wMA/P8DAPv/AwD7/wMA+/8EAPv/AwD6/wMA+/8EAPv/AwD6/wMA+v8EAPr/BAD5/wQA+v8EAAcA+P8HAPf/BwD4/wYA+P8GAPn/BQD4/wUA+f8HAPr/BgD6/wYA+v8IAPr/CAD5/wgA+f8IAPn/CAD6/wcA+f8HAPn/BwD6/wcA+v8GAPr/BgD7/wYA+v8GAPv/BQD7/wUA+/8FAPv/BQD7/wUA+v8FAPv/BgD7/wYA+/8GAPr/BwD7/wYA/f8GAPz/BgD9/wYA/P8HAPz/CAD8/wcA/P8IAPz/CAD8/wkA/P8JAPv/CQD8/woA/P8KAPv/CgD7/woA/P8KAPv/+/8FAPv/BQD7/wUA/P8FAPz/BAD8/wUA/P8FAPv/AwD7/wQA+/8EAPn/BAD5/wQA+v8FAPr/BQD6/wUA+v8FAPr/BQD6/wUA+/8EAPv/BAD7/wQA+/8EAPv/BAD7/wQA/P8DAPz/BAD8/wMA/P8EAPz/AwD7/wMA/P8DAPz/AwD7/wMA/P8BAPz/AgD8/wEA/P8CAPv/AgD6/wIA+/8CAPv/AQD6/wIA+v8CAPr/AgD5/wEA+f8CAPn/AgD5/wIA+f8BAPn/AgABAAQAAQAEAAEABAABAAMAAQAEAAEAAwABAAMAAQAEAAIAAwABAAMAAgACAAIAAwABAAIAAQACAAIAAQACAAEAAgABAAIAAAACAAEAAgAAAAIAAAACAAAAAgD//wMA//8CAP//AgD//wMA/v8DAP7/AwD9/wMA/v8DAP3/AwD9/wQA/P8EAPz/BAD7/wQA/P8EAPv/BAD6/wUA+v8EAPn/BAD5/wUA+f8FAPj/BQD4/wYA+P8GAPf/BgD4/wYA9/8GAPf/BgD2/wIA/f8CAP7/AgD9/wIA/v8CAP3/AQD+/wEA/f8BAP3/AAD9/wEA/f8BAP7/AQD9/wEA/f8CAP3/AQD9/wIA/f8CAP3/AwD9/wMA/P8EAPz/BAD8/wQA/P8EAPz/AwD8/wQA/P8EAPv/BAD8/wUA+/8FAPz/BQD7/wUA+/8GAPv/BQD7/wUA/P8FAP3/BgD8/wYA/P8GAPz/BgD8/wcA/P8HAPz/BwD7/wgA/P8IAPz/CAD8/wgA/P8JAPv/CQD7/woA+/8KAPv/9/8SAPf/EQD3/xEA+P8QAPj/EAD5/w8A+f8PAPj/DQD3/w0A9/8MAPb/CwD1/w4A9f8NAPX/DQD1/w0A9f8OAPX/DQD1/w0A9v8NAPf/DAD4/wsA+P8LAPj/CwD5/wsA+P8LAPn/CwD4/wsA9/8LAPf/CwD4/wsA9/8LAPb/CwD3/wsA9/8JAPf/BwD2/wcA9v8IAPb/CAD2/wgA9f8IAPX/CAD0/wkA8/8IAPP/CADy/wkA8v8JAPH/CQDx/wkA8f8KAPD/CgACAPj/AgD5/wMA+f8CAPn/AgD5/wIA+f8CAPn/AgD6/wMA+v8CAPr/AwD7/wMA+f8EAPr/AwD6/wQA+v8DAPn/BAD6/wQA+v8DAPr/AwD7/wIA+/8CAPv/AwD7/wIA+/8DAPv/AgD7/wIA+/8DAPv/AwD7/wIA+/8DAPv/AwD7/wMA+/8DAPv/AwD8/wMA/P8DAPz/AwD8/wMA/P8DAPz/AwD8/wQA+/8DAPz/AwD8/wQA+/8EAPv/BQD7/wQA+/8EAPr/BQD7/wAAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFAPn/BQD5/wQA+v8EAPr/BAD6/wQA+/8EAPv/BAD7/wUA/P8GAPz/BgD8/wcA+/8GAPv/BwD7/wYA+v8HAPv/BwD6/wYA+v8GAPr/BgD6/wYA+/8GAPv/BQD7/wUA+/8FAPv/BQD7/wYA+/8FAPv/BgD6/wYA+/8GAPv/BgD6/wYA+v8GAPz/BgD9/wcA/f8HAPz/BwD8/wcA+/8IAPv/CAD7/wgA/P8JAPz/CgD7/woA+/8KAPv/CgD7/wsA+/8LAPv/CwD7/wIA/v8CAP7/AgD9/wIA/v8CAP7/AgD+/wIA/v8CAP7/AQD9/wIA/v8CAP3/AgD+/wMA/f8CAP3/AwD9/wIA/f8CAP3/AgD9/wMA/f8BAP7/AgD9/wEA/f8CAP3/AgD9/wEA/f8CAP3/AQD8/wIA/P8BAP3/AgD8/wEA/P8CAP3/AgD9/wEA/f8CAP3/AQD9/wIA/P8CAPz/AgD9/wIA/f8CAP3/AgD8/wIA/P8CAP3/AgD8/wIA/P8CAPz/AgD8/wIA/P8CAPv/CAAfAAgAHwAIAB4ACAAdAAcAHAAHABsABwAbAAgAGwAIABoACAAZAAgAGQAHABgABwAZAAcAGAAGABgABgAXAAYAFwAGABYABQAWAAYAFAAGABQABgAUAAYAFAAGABMABwATAAYAEwAHABMABwATAAgAEgAHABMACAATAAgAEgAIABIACgAPAAoADgALAA4ACwAQAAsAEAAMABAADAARAA0AEQANABIADgARAA4AEQAOABMADwATAA8AFAAQABQAEAAVABEAFQD//wIA//8CAP//AgD+/wEA//8CAP//AQD//wAA/v8AAP//AAD9/wAA/v8AAP7/AQD9/////P8AAP3/AAD8/////P////v////7//7/+/////r//v/7//7/+v/9//r//v/5//3/+f/8//n//f/4//z/9//8//j/+v/3//r/9//6//b/+f/1//r/9f/6//T/+v/z//n/8//5//L/+f/y//j/8f/4//H/+P/w//j/7//5//D/+P/v//j/7//3/+7/9//u//b/7f/3//L/9//x//X/8f/2//L/9v/y//b/8v/2//P/9//y//X/7//1/+//9f/t//T/7P/1/+z/9v/u//b/7f/3/+7/+P/u//j/8P/4//D/+P/y//f/8//4//P/9//z//j/9P/3//T/+P/0//j/9P/3//T/+P/1//f/9P/4//T/9//0//f/9P/4//T/+f/z//n/8//5//P/+f/z//n/8v/5//H/+f/x//n/8f/5//H/+f/w//j/7//4/+//+P/u//j/7v/4/+3/+P/t//f/CAALAAkADAAJAAsACQAMAAgACwAIAAsABwAKAAcACwAJAAsACQAKAAkACwAKAAoACgAKAAkACQAJAAkACQAIAAkACAAIAAgACAAIAAcACAAHAAcABwAIAAcABwAGAAcABwAHAAcABwAGAAcABwAGAAYABwAGAAcABwAHAAYABwAHAAcABwAGAAcABgAHAAYACAAGAAgABgAIAAYACQAGAAkABwAJAAYACQAHAAoABwAKAAgACgAIAAsACAALAAgACwAJAAsACQD7//n/+//5//v/+f/7//n//P/5//z/+f/8//r//P/5//v/+f/8//r/+//5//v/+v/7//n//P/6//z/+f/9//n//P/5//3/+f/9//n//v/5//3/+f/9//n//f/5//7/+v/9//n//f/5//7/+f/9//n//f/4//7/+P/9//j//v/4//3/9//8//n//f/6//3/+f/8//n//P/5//z/+f/8//n/+//4//v/+f/7//j/+//4//v/9//7//f/+//3//r/9//7//b/+v/2/wQA+/8EAPv/BAD8/wQA+/8EAPz/BAD8/wQA/P8EAP3/BAD9/wQA/P8FAP3/BQD8/wUA/f8EAPz/BAD9/wQA/v8EAP7/AwD9/wMA/v8BAP7/AgD//wEA//8BAP//AQD//wEA//8BAAAAAAAAAAAAAAAAAAEA//8BAAAAAQD//wEA//8CAAAAAgD//wEA//8CAP//AgD//wIA//8BAP//AQD//wEA//8BAP//AgD//wIA//8CAP//AgD+/wIA//8CAP7/AgD//wIA/v8FAP3/BQD9/wQA/f8FAP3/BAD9/wQA/f8EAP3/AwD+/wMA/f8EAP3/AwD8/wQA/f8EAP3/BAD9/wQA/f8DAP3/AwD9/wQA/f8DAP7/AwD+/wMA/v8DAP//AwD+/wIA/v8DAP7/AgD+/wIA//8DAP//AgD//wIA/v8CAP//AgD//wIA/v8BAP//AgD//wEA/v8BAP7/AgD//wIA/v8CAP//AwD//wIA//8CAP7/AgD+/wIA/v8CAP7/AgD+/wIA//8DAP7/AwD//wEA//8BAP//AQD//wEA//8BAP//AQD//wEAAAABAP//AQAAAAAA//8BAAAAAAAAAAAAAQAAAAEA//8AAAAAAQD//wEA//8BAP//AgD//wEA//8CAP7/AQD//wEA//8BAP7/AgD//wIA//8BAP7/AgD//wIA/v8CAP7/AQD+/wIA/f8CAP//AQD+/wEA//8CAP//AgD+/wIA//8DAP//AgD+/wIA//8CAP7/AwD+/wMA/v8DAP7/AwD+/wMA/v8DAP3/AwD9//j/CQD5/wgA+f8JAPn/CAD5/wgA+v8IAPr/BwD5/wcA+f8GAPj/BgD5/wUA+P8GAPj/BgD4/wYA+P8HAPj/BgD4/wcA+f8GAPr/BgD6/wUA+/8FAPv/BQD7/wUA/P8FAP3/BQD8/wQA/P8EAP3/BAD8/wMA/P8EAP3/BAD9/wQA/P8EAP3/AgD9/wIA/f8CAP3/AgD9/wIA/f8BAPz/AQD9/wIA/P8BAPz/AgD8/wIA/P8CAPz/AgD8/wIA/P8CAPv/AgD8/wIACwDw/woA8f8KAPH/CgDx/woA8f8JAPL/CQDy/woA8/8LAPT/DAD1/wwA9f8OAPP/DgDz/w4A8v8OAPH/DwDy/w4A8f8OAPL/DQDy/wsA9P8LAPP/CgD0/wsA9P8KAPT/CQD0/wkA9P8KAPP/CgD0/woA9P8KAPT/CgD0/wsA8/8LAPP/CgD3/wsA9/8LAPf/CwD2/wwA9v8MAPf/DQD2/w0A9v8OAPb/DwD2/w8A9v8PAPX/DwD1/xAA9P8QAPT/EQD0/xEA9P/5/wsA+f8LAPn/CgD5/woA+v8KAPr/CQD6/wkA+f8JAPn/CAD5/wcA+P8HAPf/CAD3/wgA9/8JAPj/CQD4/wgA+P8JAPj/CAD5/wgA+v8HAPr/BwD6/wcA+v8GAPr/BwD6/wcA+/8HAPr/CAD6/wcA+v8HAPr/BwD6/wcA+f8IAPr/CAD6/wUA+f8FAPn/BQD5/wYA+P8GAPj/BgD4/wYA9/8GAPf/BgD2/wYA9v8GAPb/BwD2/wcA9v8IAPb/CAD1/wgA9f8IAP3/BAD9/wQA/f8DAP7/AwD9/wMA/f8DAP7/AwD+/wMA/f8DAP3/AwD+/wMA/v8DAP7/AgD+/wIA/v8CAP7/AgD//wEA//8CAP7/AgD//wEA//8CAAAAAQD//wEAAAAAAAAAAQAAAAEAAAAAAAAAAAAAAAEAAQAAAAAAAAABAAAAAQAAAAEAAAACAAAAAgD//wIA//8CAP//AgD//wEAAAACAP//AgAAAAIA//8CAP//AgD//wIA//8CAP//AgD//wMA//8CAP//AQD+/wEA/f8BAP7/AQD+/wEA/v8BAP7/AAD+/wEA/f8CAP7/AgD+/wIA/v8CAP3/AgD9/wMA/f8DAP3/AgD9/wIA/f8CAP3/AwD9/wMA/f8CAP3/AgD9/wIA/v8CAP7/AgD9/wIA/f8CAP3/AgD9/wIA/f8CAP3/AgD9/wIA/P8BAP3/AgD+/wEA/v8BAP7/AgD+/wIA/v8CAP7/AgD9/wIA/v8DAP3/AwD+/wMA/v8DAP3/AwD9/wMA/f8DAP3/AgD9/wMA/f/+/wIA//8CAP//AgD+/wIA/v8CAP//AgD//wIA//8CAP7/AgD+/wEA/v8BAP//AgD//wIA//8CAP//AQD//wEA//8BAP//AQD//wEA//8BAAAAAAAAAAEAAAAAAAAAAAAAAAAA//8AAAAAAQAAAAEAAAAAAP//AAAAAAAAAAABAAAAAAAAAAAAAAAAAAAAAQAAAAAAAAAAAAAAAAAAAAEAAAAAAP//AQAAAAAAAAAAAAAAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAP3/BQD8/wQA/f8EAP3/BAD9/wQA/f8EAP3/AwD9/wMA/v8DAP7/AwD+/wMA/f8CAP7/AgD9/wIA/f8CAP7/AgD+/wMA/v8CAP//AgD//wIA/v8CAP7/AQD//wIA//8CAP//AgAAAAEA//8BAP//AQD//wEAAAABAP//AQD//wEA//8BAP//AAD//wAA//8AAP//AQD//wEA/v8AAP//AAD//wEA//8AAP7/AQD+/wEA//8AAP//AQD+/wEA/v8BAP//AQD//wEA/v8CAP7/AwD+/wMA/v8CAP//AgD+/wIA//8CAP7/AgD+/wIA/v8CAP7/AgD//wIA/v8CAP//AgD//wIA//8CAP//AQD//wEA/v8BAP//AQAAAAEAAAACAP//AQD//wEA//8BAP//AQD//wEA//8BAAAAAQD//wEAAAABAP//AAAAAAAA//8BAAAAAQAAAAEA//8AAP//AAAAAAEAAAABAAAAAAAAAAEAAAABAAAAAAD//wEA//8BAAAAAQD//wEA//8BAP//AQACAPz/AgD8/wIA/P8CAP3/AgD8/wIA/P8BAP3/AgD9/wIA/P8CAP3/AgD9/wIA/f8CAPz/AgD8/wIA/P8DAPz/AwD8/wMA/P8EAPz/AwD8/wMA/P8DAPv/BAD7/wMA+/8EAPv/BAD7/wQA+v8EAPr/BAD6/wQA+v8EAPr/BQD6/wUA+v8FAPv/BQD7/wUA+/8FAPz/BgD8/wYA+/8GAPv/BgD7/wYA+/8HAPr/BwD7/wcA+/8IAPr/CAD6/wkA+v8JAPr/CQD5////AwD//wMA/v8DAP//AgD+/wMA//8DAP//AwD//wIA/v8DAP7/AgD+/wIA/f8DAP3/BAD9/wMA/f8EAPz/BAD8/wQA/f8EAPz/BAD9/wQA/f8EAP3/BAD8/wQA/f8EAPz/BAD8/wUA/P8FAPz/BQD8/wUA/P8FAPz/BQD7/wUA+/8FAPv/BQD6/wUA+v8FAPr/BQD6/wUA+f8GAPn/BgD5/wYA+f8GAPj/BwD4/wcA+P8GAPf/BwD3/wcA9/8HAPb/BwD2/wgABQD3/wUA9/8FAPf/BQD4/wUA+P8EAPj/BQD4/wQA+f8FAPj/BQD5/wUA+f8GAPj/BwD4/wcA+P8HAPj/BwD4/wcA+P8HAPj/BwD3/wYA+P8GAPj/BgD4/wcA+P8GAPj/BwD4/wcA9/8IAPf/CAD2/wgA9v8IAPb/CAD1/woA9f8JAPX/CQD4/woA+P8LAPj/CwD3/wsA9/8MAPb/DQD2/w0A9/8OAPb/DgD2/w8A9f8PAPb/EAD1/xAA9f8QAPT/EgD0/xIA9P8AAAEAAQACAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAgABAAMAAAACAAAAAgAAAAIA//8CAP//AwD//wIA//8DAP//AwD+/wIA/v8DAP//AgD//wIA//8CAP7/AgD+/wIA/f8CAP7/AgD+/wMA/f8DAP7/AgD+/wMA/v8CAP//AgD//wIA/v8DAP//AwD//wMA//8DAAAAAwD//wMA//8EAP//AwD//wQA//8EAP//BAD//wQA//8EAP//BAD///v/CgD7/wkA+/8JAPv/CQD7/wgA/P8IAPv/BwD8/wcA/P8HAPz/BgD7/wYA+v8GAPv/BgD7/wYA+/8GAPv/BgD7/wYA+/8GAPv/BgD7/wYA/P8GAPv/BQD8/wUA/P8FAPz/BQD8/wUA/P8GAPz/BQD7/wUA+/8GAPv/BQD7/wUA+/8FAPv/BAD7/wQA+v8EAPr/BAD5/wQA+f8FAPn/BAD5/wUA+P8FAPj/BQD4/wUA+P8FAPf/BQD3/wUA9/8GAPb/BgD2/wYABwDz/wgA8/8IAPT/BwD0/wgA9f8HAPX/BwD2/wcA9v8IAPb/CAD3/wkA9/8KAPb/CgD2/woA9f8KAPb/CgD1/wkA9v8JAPb/CAD2/wcA9/8GAPf/BgD3/wYA+P8GAPj/BgD4/wYA+P8FAPf/BQD4/wYA+P8GAPj/BgD4/wYA+P8FAPr/BQD6/wUA+v8GAPv/BgD7/wcA+v8HAPr/BwD6/wcA+v8IAPr/CAD6/wgA+v8IAPn/CQD6/wkA+f8JAPn/CgD5/woA+P/4/w8A9v8PAPf/DgD3/w0A9/8NAPf/DAD4/wwA9/8LAPb/CwD2/woA9f8KAPT/DADz/wsA8/8NAPP/DADz/w0A9P8MAPT/DAD1/wwA9v8LAPf/CwD3/wsA9/8KAPf/CQD3/woA9/8KAPf/CwD3/woA9/8KAPb/CgD2/woA9v8KAPb/CAD3/wgA9v8IAPX/CAD1/wgA9P8JAPT/CQDz/wkA8/8JAPL/CQDx/wkA8v8KAPH/CgDw/woA8P8LAPD/CwDv/wsA7v8MAAMA/f8EAP3/BAD+/wQA/v8DAP7/BAD+/wMA/v8EAP7/BAD+/wQA//8EAP7/BQD+/wUA/v8FAP7/BQD+/wUA/v8EAP3/BQD9/wQA/v8EAP7/AwD+/wMA/v8DAP7/AwD//wMA/v8DAP7/BAD+/wMA//8DAP//AwD+/wMA//8DAP//BAD//wMA//8EAP//BAD//wMA//8EAP//BAD//wQA//8EAP//BQD//wUA//8EAP7/BQD//wUA//8FAP//BQD//wUA/v8GAP7/AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAD//wAA/v8AAP7/AAD+/wAA//8AAP7/AAD//wAA/v8AAP7/AAD+/wAA/v8AAP7/AAD+/wAA/v8AAP7/AAD+/wAA/v8BAP7/AAD+/wAA/v8AAP//AAD//wAA/v8AAP//AAD//wAA/v8BAP7/AAD//wAA/v8AAP//AAD//wAA/v8AAP7/AAD+/wAA/v8AAP7/AAD//wAA/v8AAP7////+/wAA/v////3/AAD+/wAA/v8AAP3/AAD9/wAA/f////3////9/wAA/f8AAAQA+v8FAPr/BAD6/wUA+/8EAPr/BAD7/wQA+/8EAPz/BQD8/wUA+/8FAPz/BQD7/wUA/P8FAPv/BQD7/wUA+/8FAPv/BAD8/wUA/P8EAPz/BAD8/wQA/P8EAPz/AwD8/wMA/f8EAPz/BAD8/wMA/P8EAPz/AwD9/wMA/P8EAPz/BAD9/wQA/f8EAP7/BAD9/wQA/f8EAP3/BAD+/wUA/f8FAP7/BQD9/wUA/f8FAP3/BgD9/wYA/P8GAP3/BgD9/wYA/f8GAPz/AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEAAAAFAPf/BQD4/wUA+P8FAPj/BQD5/wUA+f8EAPj/BQD5/wUA+f8FAPr/BwD6/wcA+f8HAPn/BwD5/wcA+f8HAPn/BwD5/wYA+f8FAPn/BAD6/wQA+v8EAPv/BAD7/wQA+/8DAPr/AwD7/wMA+/8EAPv/AwD7/wQA+/8DAPv/AwD7/wIA/f8CAP7/AgD9/wMA/f8CAP3/AwD9/wMA/f8DAP3/AwD9/wQA/f8DAP3/BAD9/wMA/f8EAP3/BAD9/wQA/P8FAPz/BAD9//b/EgD2/xEA9v8RAPb/EAD2/xAA9/8PAPf/DwD3/w4A9f8OAPb/DQD0/w0A8v8OAPP/DgDy/w8A8v8PAPL/DwDy/w8A8v8PAPP/DwD2/w4A9f8OAPX/DQD2/w0A9v8MAPf/DQD2/wwA9v8OAPX/DQD2/w0A9f8NAPb/DQD1/w4A9v8KAPb/CQD1/wkA9P8KAPX/CgD0/woA9P8KAPL/CgDy/woA8f8LAPH/CwDw/wwA8P8LAPD/DADv/wwA7/8NAO7/DQDt/w0ABAD6/wQA+v8EAPr/BAD6/wQA+v8EAPv/BAD7/wMA+/8FAPv/BAD8/wQA+/8FAPz/BQD7/wUA+/8FAPv/BQD7/wUA+/8FAPv/BQD7/wMA+/8EAPv/BAD8/wMA/P8DAP3/AwD8/wMA/P8DAPv/BAD8/wMA/P8DAPz/AwD8/wQA+/8DAP3/AwD9/wQA/f8EAP3/AwD9/wQA/f8DAP3/BAD+/wUA/f8FAP3/BQD9/wUA/P8FAP3/BAD9/wUA/f8FAP3/BQD9/wYA/f8AAAAAAAAAAAAAAAAAAAAAAAAAAP//AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA/////wAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA//8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAP//AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAP//AAD//wAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA/v8BAP7/AQD+/wEA/f8CAP7/AQD+/wEA/v8BAP7/AQD9/wEA/f8AAP3/AQD9/wIA/v8BAP3/AQD9/wIA/f8BAP3/AgD9/wIA/f8BAP7/AQD+/wEA/v8BAP7/AQD+/wIA/v8BAP7/AQD+/wEA/v8BAP7/AQD+/wEA/v8BAP3/AQD+/wAA/v8BAP3/AQD9/wEA/v8BAP3/AQD+/wEA/v8BAP3/AQD9/wAA/f8AAP3/AQD9/wEA/f8AAP3/AAD9/wAA/P8BAPz/AQAAAAEAAAABAAAAAQABAAAAAAABAAEAAAAAAAEAAQABAAEAAQABAAEAAQAAAAEAAAAAAAEAAQABAAEAAAAAAAEAAQAAAAEAAAABAAAAAAABAAAAAQAAAAAAAAAAAAEAAAAAAAAAAQABAAAAAQAAAAAAAAAAAAEAAAAAAAEAAQABAAAAAQAAAAAAAQAAAAEAAAAAAAAAAQAAAAAAAAAAAAAAAAAAAAAAAQAAAAEAAAAAAAAAAAABAAEAAAABAAAAAQABAAEAAQABAAUA+f8GAPr/BgD5/wUA+v8FAPr/BQD7/wUA+v8FAPr/BQD7/wUA+/8GAPz/BwD7/wcA+/8GAPr/BgD6/wcA+v8GAPv/BgD7/wYA+/8FAPv/BQD7/wUA+/8FAPv/BAD7/wUA/P8FAPv/BQD7/wUA+/8FAPz/BQD7/wYA+/8FAPv/BgD8/wYA/f8GAP3/BgD8/wYA/f8GAP3/BwD8/wcA/f8IAP3/CAD8/wgA/P8JAPz/CQD8/wgA/P8JAPv/CQD7/wkA+/8KAPv/CwDt/woA7f8KAO7/CgDv/woA7/8JAO//CQDw/wkA8f8KAPH/CgDy/wwA8v8MAPH/DADx/wwA8f8MAPH/DADx/wwA8f8LAPH/CgDy/woA8/8JAPP/CQD0/wkA9P8JAPT/CQDz/wkA8/8KAPP/CgDz/woA8v8KAPP/CgDy/wsA8v8KAPb/CgD2/woA9v8LAPf/DAD1/w0A9f8NAPb/DgD2/w4A9f8PAPX/EAD0/xAA9f8RAPT/EgDz/xIA9P8TAPP/EwDz/xMA8v/u/yAA7f8eAO3/HgDu/xwA7v8cAO//GwDv/xsA7/8ZAOz/FwDs/xcA6f8WAOb/GQDm/xkA5/8aAOb/GwDm/xsA5v8aAOj/GgDp/xoA7P8XAO3/FwDt/xcA7f8WAO7/FgDu/xcA7f8XAO3/FwDt/xcA7f8XAO3/FwDs/xcA7P8XAOz/EgDt/xAA7P8RAOv/EADq/xEA6P8SAOj/EgDn/xEA5v8SAOX/EwDk/xQA4/8TAOH/FADh/xUA4P8VAN//FgDe/xcA3f8YAAkA8/8KAPX/CgD0/wkA9f8KAPX/CQD2/wkA9f8IAPb/CgD3/woA9/8JAPf/CwD3/wsA9/8LAPb/CwD2/wsA9/8LAPf/CgD3/woA9v8IAPf/CAD4/wgA9/8JAPj/CAD3/wgA9/8IAPf/CAD2/wgA9/8IAPf/CAD2/wkA9v8JAPb/CQD5/wgA+/8IAPr/CQD7/wkA+/8KAPr/CgD6/wsA+/8LAPr/CwD6/wsA+v8MAPr/DQD6/w0A+v8OAPr/DgD6/w8A+f8PAPn///8FAP7/BAD+/wUA//8EAP7/BAD+/wQA//8EAP//BAD+/wQA/f8DAP7/BAD9/wMA/P8EAPz/BAD8/wUA/P8EAPz/BAD8/wQA/P8EAP3/BAD8/wMA/f8DAPz/AwD9/wQA/f8DAP3/AwD9/wQA/f8DAP3/AgD9/wMA/f8DAPz/AwD9/wEA/f8BAP3/AQD9/wAA/f8BAP3/AQD9/wEA/P8BAPz/AQD8/wEA/f8BAPz/AQD8/wEA+/8BAPv/AQD7/wEA+/8AAPv/AAD8/wgA/P8IAP3/BwD8/wgA/P8HAP3/BwD8/wcA/P8HAPz/BgD8/wYA/P8GAPv/BgD7/wYA+/8HAPz/BgD7/wcA+/8HAPv/BgD7/wcA/P8GAPz/BgD8/wYA/P8GAPz/BQD8/wYA/f8GAPz/BQD8/wYA/f8GAPz/BgD8/wYA/P8GAPz/BAD8/wQA/f8EAPz/BQD8/wQA+/8EAPv/BAD7/wQA+/8FAPv/BQD6/wQA+v8FAPr/BQD7/wUA+v8FAPr/BQD6/wYA+v8GAAkACQAKAAkACQAJAAkACAAJAAkACAAIAAgACAAIAAcABwAHAAgABwAHAAYABwAGAAcABwAHAAYABgAGAAYABgAGAAYABgAGAAYABQAFAAYABgAGAAUABgAGAAUABgAGAAYABQAFAAUABgAGAAYABQAGAAUABwAFAAcABQAIAAUACAAFAAgABAAIAAUACAAFAAkABQAKAAYACgAGAAsABgALAAYADAAGAAwABwANAAgADQAIAA0ACAAOAAgADgAJAA8ACQAPAAkA9v/4//X/9//2//j/9v/4//b/9//3//j/9//4//f/+P/3//j/9v/4//b/+P/2//n/9v/4//b/+P/2//n/9//5//f/+f/3//n/+P/5//n/+f/5//n/+f/5//n/+f/6//n/+v/5//r/+P/6//j/+v/4//r/+f/6//j/+v/4//r/+P/6//r/+v/7//n/+v/6//r/+f/6//n/+v/6//r/+f/6//n/+v/4//r/+P/6//j/+f/4//n/9//5//f/+f/3//j/9v/4//b/+P8GAPb/BwD3/wYA9v8GAPf/BwD4/wYA9/8GAPj/BgD5/wYA+f8GAPn/BwD6/wcA+f8JAPj/CAD4/wkA+P8JAPf/CQD3/wkA+P8IAPj/BwD4/wcA+P8HAPj/BwD5/wUA+P8FAPj/BgD5/wYA+P8HAPj/BgD4/wYA+P8GAPj/BgD4/wUA+v8GAPr/BwD7/wYA+v8HAPv/BwD6/wcA+/8IAPv/CAD6/wkA+v8JAPr/CQD6/wkA+f8KAPn/CgD5/woA+f8LAPn/CwD5//7/AwD+/wMA/v8EAP7/AwD9/wMA/v8DAP7/AwD+/wIA/v8CAP7/AgD+/wIA/v8CAP3/AgD9/wMA/f8DAP3/AwD9/wMA/f8CAP3/AwD9/wMA/f8CAP7/AgD9/wIA/v8DAP7/AwD+/wIA/v8DAP3/AwD+/wIA/v8DAP7/AgD+/wIA/v8CAP7/AgD9/wEA/v8CAP7/AQD+/wIA/f8CAP3/AQD9/wIA/f8CAP3/AgD8/wEA/f8CAPz/AgD9/wIA/f8CAPz/AgD8/wIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAsA7/8KAPD/CgDw/woA8f8KAPH/CQDy/wkA8v8JAPP/CgDz/wsA9P8LAPT/DQDz/w0A8/8NAPP/DQDy/w0A8v8NAPL/DADz/wsA8/8JAPT/CQD1/wgA9f8IAPX/BwD1/wcA9f8HAPb/BwD1/wcA9f8HAPb/BgD2/wYA9/8GAPb/BQD7/wQA+/8FAPv/BQD7/wUA+/8GAPv/BgD7/wYA/P8HAPv/BgD7/wcA+/8HAPv/BwD7/wgA+v8HAPr/BwD6/wgA+v8IAPr/+P8LAPn/CgD5/woA+f8JAPn/CQD6/wkA+v8IAPr/CAD5/wgA+f8HAPn/BwD3/wgA+P8IAPj/BwD4/wcA+P8HAPj/BwD5/wcA+v8GAPv/BgD7/wYA+/8GAPv/BgD7/wUA+/8FAPv/BQD7/wYA+/8GAPr/BgD7/wUA+/8FAPr/BgD7/wQA+/8EAPr/BAD6/wQA+v8FAPn/BAD5/wQA+P8EAPj/BQD4/wUA9/8EAPj/BQD3/wUA9v8GAPb/BgD2/wYA9f8GAPX/BgD6/xAA+f8PAPn/DgD6/w8A+v8OAPn/DQD6/w0A+v8MAPr/DAD5/wwA+P8LAPj/CwD2/wwA9/8MAPf/DAD3/w0A9/8NAPf/DAD3/wwA+f8LAPn/CwD5/wsA+f8LAPr/CwD6/wsA+v8LAPn/CwD5/wsA+f8LAPn/DAD5/wwA+f8MAPn/CAD5/wgA+v8JAPn/CQD4/wgA+P8JAPj/CQD4/wkA9/8JAPf/CQD3/woA9v8KAPb/CgD2/wsA9f8LAPX/CwD1/wwA9f8MAA4A5/8PAOn/DwDq/w4A6f8OAOr/DgDr/w0A7P8NAO3/DgDu/xAA7v8RAO//EwDt/xUA7P8UAO3/FADs/xQA6/8UAOv/EwDs/xIA7f8PAO7/DgDu/w4A7v8OAO7/DADv/wwA7/8MAO//DADv/wwA7/8MAPD/DADv/wsA7/8MAO//CgD2/woA9v8KAPX/CwD2/wwA9v8MAPb/DQD2/w0A9v8NAPb/DgD1/w4A9f8PAPX/DwD1/xAA8/8RAPP/EQDz/xEA8v8RAPL/9/8QAPf/DwD3/w4A9/8OAPj/DgD4/w0A+P8MAPj/DAD3/wsA9v8LAPb/CgD0/wwA9P8MAPT/CwD0/w0A9P8NAPT/DQD1/wwA9v8LAPb/CwD3/wsA9/8LAPj/CwD4/wsA+P8LAPj/CwD4/wsA+P8LAPj/CgD3/wsA+P8LAPf/CwD4/wcA+P8HAPj/CAD3/wcA9v8IAPb/CAD1/wgA9f8IAPX/CAD0/wkA9P8JAPP/CQDz/wkA8v8KAPL/CgDy/wsA8v8LAPH/CwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAP//AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAP//AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABgD5/wYA+v8GAPr/BgD6/wUA+v8FAPr/BQD7/wUA+v8GAPv/BgD7/wYA/P8HAPv/BwD7/wcA+/8HAPr/BgD6/wcA+/8GAPv/BgD7/wUA+/8FAPv/BQD7/wQA+/8FAPv/BQD7/wQA+/8FAPv/BAD7/wUA/P8FAPv/BQD7/wUA+/8FAP3/BQD9/wUA/f8FAP3/BgD8/wYA/f8GAP3/BwD9/wcA/P8HAPz/CAD8/wgA/P8IAPz/CQD8/wkA/P8JAPv/CQD8/woA/P/9/wIA/P8CAP3/AQD9/wIA/f8BAP3/AgD9/wEA/v8CAP3/AQD9/wEA/f8BAP3/AQD8/wEA/f8BAP3/AQD+/wEA/f8BAP7/AQD+/wEA//8BAP//AQD//wEA//8BAP//AQD//wEAAAABAAAAAAABAAAAAAD//wEAAAAAAAAAAQAAAAIA//8CAP//AgD+/wIA/v8CAP//AgD+/wMA/v8CAP3/AwD+/wMA/v8CAP7/AwD+/wMA/f8DAP3/AwD9/wMA/f8DAP3/AwD9//v/CgD7/woA+v8KAPv/CQD7/wkA+/8JAPz/CQD7/wgA+/8IAPr/CAD6/wcA+f8IAPn/CAD5/wgA+f8JAPn/CQD5/wkA+f8IAPn/CAD7/wcA+v8HAPv/BwD7/wcA/P8HAPv/BwD7/wcA+/8IAPv/CAD7/wgA+v8IAPv/CAD7/wgA+/8FAPv/BQD6/wYA+/8GAPr/BgD6/wYA+f8GAPr/BwD5/wcA+f8HAPn/BwD4/wcA+P8IAPj/CAD4/wgA+P8JAPf/CAD3/wgA///9/////P////3////9/////f////3////9/////f////3////9/////f////3////9/////v////3////9/////f////7////+/////v8AAP7////+/////v////7////+/////v////7////+/////v8AAP3////9/////f////7//////////v////7////+/////v////7//v/+//7//v////7////+/////v////7//v/+//7//v/+//3////9/////v8DAPr/BAD6/wQA+v8DAPr/BAD7/wQA+v8DAPv/AwD7/wMA+/8EAPz/BAD8/wUA/P8FAPv/BQD7/wUA+/8FAPv/BQD7/wUA+/8FAPv/BAD8/wQA+/8EAPz/BAD7/wMA+/8EAPv/BAD7/wQA+/8EAPv/BAD7/wQA+/8FAPv/BQD7/wQA/f8EAPz/BQD8/wQA/f8FAPz/BQD8/wYA/P8GAPz/BgD8/wYA+/8GAPv/BgD7/wcA+/8HAPv/BwD7/wcA+/8HAPv/CAD6////BgD//wYA//8FAP//BgD+/wUA//8FAP//BQD//wUA//8FAP//BAD//wQA/v8EAP//BQD//wQA/v8FAP7/BAD+/wQA//8EAP//BAD+/wQA/v8EAP//AwD//wQA//8EAP//BAD//wQA//8EAP//BAD//wQA//8FAP7/BQD+/wQA//8DAP//AwD//wQA//8DAP//AwD//wMA/v8DAP7/AwD//wMA/v8EAP7/BAD//wQA/v8EAP7/BAD+/wQA/v8FAP7/BQD9/wUA/v8DAP3/AwD9/wMA/v8CAP7/AwD+/wMA/v8CAP7/AgD+/wIA/f8CAP3/AgD+/wIA/f8CAP3/AwD+/wIA/v8DAP7/AwD9/wIA/f8DAP7/AgD+/wMA/v8DAP7/AgD+/wIA/v8CAP7/AgD+/wIA/v8CAP7/AgD+/wIA/v8CAP7/AwD+/wIA/v8CAP3/AgD+/wIA/f8CAP3/AgD9/wIA/v8CAP3/AgD9/wIA/f8CAPz/AgD9/wIA/f8DAP3/AwD9/wIA/f8CAP3/AwAAAP7/AAD//wEA//8AAP//AAD+/wAA//8AAP//AAD//wAA//8BAP//AQD//wAA//8AAP//AAD+/wAA//8AAP//AAD//wEA//8AAP//AQD//wEA//8AAP//AAD//wEA//8BAP//AAD//wAA//8AAP//AAD//wAA//8BAP//AAD//wAA//8AAP//AQD//wAA//8BAP//AAD//wEA//8AAP//AAD//wAA//8BAP//AQD//wAA//8BAP//AAD//wAA//8AAP//AAD//wAA//8BAP7/AAD+/wAA//8BAP//AAD+/wAA//8BAP//AAD//wAA//8AAP//AAD//wEA//8BAP//AAD//wAA//8BAP//AAD//wEA/v8AAP//AAD//wAA//8BAP//AAD//wAA//8AAP//AAD//wAA//8BAP//AAD//wAA//8BAP//AAD//wAA//8AAP//AAD//wAA//8BAAAAAAAAAAAAAAABAAAAAQAAAAAAAAAAAP//AQD//wAA/v8BAP//AQD//wEA//8BAP7/AAACAP//AgD//wMAAAACAP//AgD//wIAAAACAP//AgAAAAIA//8CAP//AgD//wIA//8CAP//AgD//wIA//8CAP//AgD//wIA//8CAP//AgD//wEA//8BAP//AgD//wIA//8CAAAAAgD//wIA//8CAP//AgD//wIA//8CAP//AgD//wIA//8CAP//AQD//wIA//8CAP//AQD//wEA//8BAP7/AQD//wEA//8BAP//AgD+/wIA/v8CAP7/AgD+/wIA/v8CAP7/AwAAAP//AAAAAAAA////////AAAAAAAAAAAAAP//AAAAAAAA//8AAP//AAD//wAAAAD/////AAAAAAAA//8AAP///////wAAAAAAAAAAAAD//wAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA//8AAAAAAAAAAAAAAAAAAAAA//8AAAAAAAAAAAAA//8AAAAAAAAAAAAAAAAAAAAAAAAAAP//AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAD///f/CwD3/woA9/8JAPj/CgD3/wkA+P8JAPf/CQD4/wgA9/8IAPf/BwD2/wcA9f8GAPT/CADz/wgA9P8IAPT/CQD0/woA8/8JAPT/CQD2/wkA9v8JAPb/CQD2/wgA9/8IAPf/CAD2/wgA9/8IAPb/CQD3/wkA9v8JAPb/CQD1/wkA9/8HAPf/BgD2/wYA9v8HAPX/BgD0/wYA9P8GAPT/BgDz/wYA8/8HAPL/BwDy/wcA8f8HAPH/CADx/wcA8P8IAPD/CADv/wkADwDv/w8A8P8PAPH/DgDx/w4A8f8NAPL/DQDz/wwA8/8NAPT/DAD1/w0A9v8NAPb/DAD3/wwA9/8LAPj/CgD5/woA+f8JAPr/CAD6/wYA+/8FAPz/BQD8/wQA/f8DAP3/AgD+/wIA//8BAP//AgAAAAAAAQABAAEAAAACAAAAAwD//wMA/v8EAP7/BQD+/wQA/v8FAP7/BQD9/wUA/f8FAP7/BgD9/wYA/f8GAP3/BwD9/wcA/f8HAPz/BwD9/wcA/P8IAPz/CAAJAPL/CQDz/wkA9P8JAPT/CQD1/wkA9f8IAPX/CAD2/wgA9v8JAPf/CQD3/woA+P8LAPf/CgD3/woA9/8KAPb/CgD2/woA9v8JAPj/BwD4/wgA+P8IAPj/BwD4/wcA+f8HAPn/BwD4/wcA+f8HAPn/CAD5/wcA+f8HAPn/BwD4/wcA+/8HAPv/CAD7/wgA+/8IAPv/CQD7/woA+/8KAPz/CgD7/wsA+v8LAPv/CwD6/wsA+v8MAPr/DAD6/wwA+v8MAPn/DQD5//7/AgD+/wEA/v8BAP7/AQD+/wEA/v8BAP//AQD//wEA//8BAP//AQD+/wEA/v8BAP7/AQD+/wEA/v8BAP7/AgD+/wIA/v8CAP7/AQD//wEA/v8BAP7/AQD+/wIA/v8BAP7/AQD//wIA//8BAP7/AQD+/wEA/v8BAP7/AQD//wIA/v8BAP//AQD+/wAA/v8BAP7/AQD9/wEA/f8BAP3/AAD9/wEA/f8BAP3/AQD9/wEA/v8BAP3/AQD9/wEA/f8BAP3/AQD9/wEAAgAAAAIAAQACAAEAAgAAAAIAAAABAAAAAQAAAAEAAAABAAEAAQAAAAIAAAABAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAQAAAAEAAQABAAAAAQABAAIAAAABAAAAAQAAAAEAAAABAAEAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAQABAAAAAQAAAAIAAAACAAAAAgABAAIAAAACAAEAAgAAAAIAAAABAAEAAgAAAAIAAQACAAAAAgABAAIAAQD/////AAD//////////wAA//8AAAAAAAAAAAAAAAAAAAAA//8AAAAAAAAAAAAAAAD//wAAAAAAAP//AAAAAP//AAD///////8AAAAAAAD//wAA//8AAP///////wAAAAAAAP///////wAA//8AAAAAAAAAAAAAAAAAAAAAAAD//wAAAAAAAAAAAAD//wAAAAAAAP//AAAAAAAAAAAAAP//AAAAAP////////////8AAAAA////////AAD/////AAAAAP//AAD//wwA7f8MAO3/DADu/wwA7v8MAO//CwDv/wsA8P8LAPD/DADx/w0A8v8NAPL/DwDx/xAA8P8PAPH/DwDx/w4A8f8OAPD/DgDx/wsA8f8KAPL/CwDz/woA8/8JAPP/CQDz/wkA8/8JAPP/CQDz/wkA8v8JAPL/CQDy/wkA8v8JAPL/CAD3/wgA9/8IAPj/CQD3/wkA+P8JAPf/CgD4/woA+P8LAPf/DAD3/wwA9/8MAPb/DQD2/w0A9v8NAPX/DgD1/w4A9f8OAPT/9/8UAPb/FAD3/xMA9/8TAPb/EgD3/xIA9/8RAPf/EAD2/xAA9f8OAPT/DgDz/w8A8v8QAPP/DwDz/w8A8/8QAPP/EQDz/xEA9f8QAPX/EAD0/w8A9f8PAPb/DwD2/w4A9v8PAPb/DwD0/w8A9P8QAPT/EAD0/xAA9P8QAPP/EQD0/wwA8/8MAPP/CwDy/wwA8v8MAPH/DADw/wsA8P8MAO//DQDu/w0A7v8OAO7/DgDs/w8A7P8PAOv/EADr/xAA6v8RAOn/EQAFAPr/BQD6/wUA+v8FAPr/BQD6/wUA+/8FAPv/BAD8/wUA+/8GAPz/BgD8/wYA/P8HAPz/BgD8/wYA/P8GAPz/BgD7/wYA+/8FAPz/BQD7/wUA/P8FAPz/BQD8/wQA/P8EAPz/BAD8/wUA/P8FAPz/BQD8/wUA/P8FAP3/BQD8/wUA/f8FAP3/BQD+/wUA/v8FAP3/BgD+/wYA/v8GAP7/BgD9/wcA/v8HAP3/BwD+/wcA/f8IAP7/CAD9/wgA/f8IAP3/CQD9/wkA6/8JAOz/CQDt/wgA7f8JAO7/CADu/wcA7v8JAO//CQDx/wkA8f8KAPL/CwDx/woA8f8KAPH/CgDy/woA8f8KAPL/CADy/wcA8/8HAPT/BwDz/wYA8/8FAPT/BgD1/wYA9f8GAPX/BgD1/wYA9P8FAPX/BQD1/wUA9f8GAPX/BQD5/wUA+f8GAPn/BgD4/wcA+f8GAPn/BwD5/wcA+P8HAPj/BwD4/wcA+P8HAPf/CQD3/wgA9v8JAPf/CQD2/wkA9v8JAPb/9/8WAPf/FQD3/xQA9/8UAPf/EwD4/xIA+P8SAPf/EgD3/xAA9v8QAPX/DwD0/xAA9f8PAPX/EAD1/w8A9f8PAPX/DwD2/w8A9/8NAPj/DQD4/w0A+P8NAPn/DQD4/wwA+P8MAPj/DAD4/wsA9/8MAPj/DAD3/wwA9/8LAPb/DAD2/wgA9/8IAPb/CAD1/wkA9P8IAPX/CADz/wgA8/8JAPP/CgDy/wkA8v8KAPL/CgDw/woA8P8LAO//CwDv/wsA7/8LAO7/DAAAAP//AQD//wEA//8BAP//AQD//wEA//8BAP//AQD+/wEA//8BAP//AQD//wEA//8BAP//AQD+/wEA//8BAP//AQD//wEA/v8BAP//AAD//wAA//8BAP//AQD//wEA//8BAP//AQD//wAA//8BAP//AAD//wEA//8BAP//AQD//wEAAAABAP//AQD//wEA//8BAAAAAQD//wEAAAABAP//AQD//wIA//8BAP//AQD//wEAAAABAP//AgD//wEAAAABAP//AgD//wAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQD//wEA//8BAAAAAQD//wEA//8CAAAAAgD//wIA//8BAP//AQD//wEA//8BAP//AgD//wIA//8BAP7/AgD//wEA//8CAP//AgAAAAEA//8CAP//AQD//wEA//8BAP//AQD//wEA//8CAP//AgD//wEA//8BAP//AQD//wEA//8BAP//AQD//wEA//8BAP//AQD+/wEA//8BAP//AQD//wEA/v8BAP//AQD+/wEA//8BAP//AQD+/wEA//8BAP//AgD+/wEAAAAAAAAAAAAAAAAA//8AAAAAAAAAAP////8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAP//AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAD//wAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAP//AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA//8AAAAAAAAAAAAAAAAAAAAAAAAAAAAA//8AAAAA//8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAP//AAAAAAAAAAAAAAIA/f8CAP3/AgD9/wMA/f8CAP7/AgD+/wIA/v8CAP3/AgD+/wIA/v8DAP7/AwD+/wIA/f8DAP3/AgD+/wMA/f8DAP7/AwD9/wIA/f8DAP7/AgD9/wIA/v8CAP7/AgD+/wIA/v8CAP7/AgD+/wIA/f8CAP7/AgD+/wIA/v8CAP7/AgD//wIA//8CAP//AgD+/wIA/v8DAP//AwD//wIA//8DAP7/AwD//wMA/v8DAP//AwD+/wMA//8DAP7/BAD+/wMA//8EAP7/+f/u//j/7v/4/+//+P/v//n/7//5//D/+v/w//n/8f/5//H/+f/x//j/8v/4//L/+f/z//n/8//6//P/+v/z//n/8//6//T/+v/1//r/9P/6//X/+v/1//r/9f/6//X/+v/1//r/9f/6//X/+v/2//r/9f/6//X/+f/1//n/9f/5//f/+P/3//j/9v/4//b/+P/2//f/9f/2//b/9//1//b/9f/2//T/9f/0//X/8//1//P/9P/y//T/8v/z//H/8//x//L/8f8MAAoADgALAA0ACgANAAoADAAKAAwACQALAAoADAAJAAsACQAMAAkADAAIAA0ABwANAAcADAAIAAwABwAMAAcADAAHAAsABwAKAAYACgAHAAoABwAKAAcACQAHAAoABwAKAAcACgAIAAsACAALAAgACwAJAAsACQAMAAoADAAKAAwACAANAAgADQAJAA4ACQAPAAkADwAJABAACAAQAAkAEQAJABEACgASAAsAEwALABQADAAVAAwAFQANABYADQAXAA0AFwAOAP3////9//7//f/+//3////9//7//f////3//v/9/////v/+//3//v/9/////f8AAPz/AAD8/////P8AAPz/AAD8/wEA/P8AAP3/AQD8/wEA/P8BAPz/AQD9/wAA/P8BAPz/AQD8/wEA/P8BAPz/AQD8/wEA/P8BAPz/AQD8/wEA/P8BAPz/AQD8/wEA/P8BAPv/AQD7/wEA+/8CAPv/AQD7/wIA+/8BAPv/AQD7/wEA+v8BAPr/AQD6/wEA+v8CAPn/AQD6/wEA/v8GAP3/BgD+/wYA/f8FAP7/BgD+/wUA/v8FAP7/BQD9/wUA/f8FAP7/BAD9/wUA/f8FAP3/BQD9/wUA/P8GAPz/BQD8/wYA/f8FAP3/BQD9/wUA/v8FAP3/BQD+/wUA/v8FAP7/BAD9/wUA/f8FAP7/BQD9/wUA/f8FAP3/BQD+/wMA/v8DAP7/AwD9/wQA/f8EAP3/BAD9/wMA/f8EAP3/BAD8/wQA/P8EAPz/BQD8/wQA/P8FAPz/BQD7/wUA/P8GAPv/BQAAAP//AQD//wAA//8BAAAAAQD//wAA//8BAP//AAD//wEA//8BAP//AAAAAAAA//8AAP//AQAAAAEA//8BAP//AQD//wEA//8AAP//AQD//wEA//8AAP//AQD//wAA//8AAP//AAAAAAEA//8BAP//AAD//wEAAAABAP//AQD//wEAAAAAAP//AAD//wEA//8BAP//AQD//wEAAAABAP//AAD//wEAAAABAP//AQD//wEAAAABAP//AQD//wEA//8BAP7/AQD//wAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAAAAAAAAAAAAAD//wAA//8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQAAAAAAAAAAAP//AAAAAAEAAAAAAP//AAAAAAAAAAAAAAAAAAD//wAAAAAAAAAAAAAAAAAAAAABAAAAAAAAAAAAAAAAAP//AQAAAAAAAAABAP//AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAP//AAD//wAAAAABAAAAAQAAAAAAAAAAAAAAAQD//wAA//8AAAAAAAAAAAAAAAAAAAAAAAD//wAA//8AAAAAAAAAAAAA//8AAAAAAQD//wIA//8BAP7/AQD+/wEA//8BAP7/AQD+/wEA//8BAP//AQD+/wEA/v8BAP7/AQD+/wEA/v8BAP7/AgD9/wIA/v8BAP3/AgD+/wEA//8CAP7/AgD+/wEA/v8BAP7/AgD+/wEA/v8BAP7/AQD+/wIA/v8CAP7/AQD+/wIA//8CAP//AQD+/wAA/v8AAP7/AQD+/wEA/v8AAP//AQD+/wEA/v8BAP7/AQD+/wEA/f8BAP7/AQD+/wEA/f8BAP3/AQD+/wEA/f8BAAAA//8AAAAAAQD//wEAAAAAAAAAAQAAAAEA//8AAAAAAAD//wAAAAABAP//AQAAAAAAAAABAAAAAAD//wEAAAABAAAAAQAAAAEAAAAAAAAAAAD//wEAAAABAAAAAQD//wEAAAABAAAAAAAAAAAA//8BAP//AAAAAAAAAAAAAAAAAAD//wEAAAABAAAAAAAAAAAAAAABAAAAAAD//wEAAAABAAAAAAAAAAAAAAABAAAAAQAAAAAAAAABAAAAAQAAAAAAAAABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAD//wAAAAABAAAAAAAAAAAAAAAAAP//AAAAAAAA//8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAP//AAAAAAAAAAAAAP//AQAAAAAAAAAAAAAAAAAAAAAA/////wIA//8CAP//AgD//wEA//8BAP//AgD//wIA//8BAP//AgD//wEA//8CAP//AQD//wIA/v8BAP7/AgD//wEA/v8BAP//AgD+/wEA//8CAP//AgD//wIA//8BAP//AgD//wEA//8BAP//AgD//wIA//8CAP//AgD//wEA//8BAP//AQD//wEA//8BAP//AQD//wEA/v8BAP//AgD//wEA/v8BAP//AgD//wIA/v8BAP7/AgD+/wIA/v8BAP7/AQD//wEA/v8CAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAAAAAABAAAAAQAAAAEAAQAAAAAAAAAAAP//AQAAAAIAAAABAP//AQD//wMA/v8DAP7/AwD+/wMA/v8DAP7/AwD9/wMA/v8DAP3/BAD9/wQA/v8EAP3/BAD8/wQA/f8EAP3/BQD9/wYA/f8EAPz/BAD8/wQA/P8EAPz/BAD8/wUA+/8EAPv/BQD7/wUA+/8EAPr/BAD7/wUA+v8FAPr/BQD6/wYA+v8GAPn/BgD5/wYA/v8CAP7/AQD+/wEA/f8CAP7/AgD+/wEA//8BAP7/AQD+/wEA/f8AAP3/AAD9/wEA/f8BAP3/AAD9/wEA/v8BAP7/AAD+/wAA//8AAP//AAD//////////wAAAAAAAP//AQD+/wEA/v8BAP3/AgD+/wMA/f8DAP3/AwD8/wMA+/8EAPz/BQD8/wUA/P8GAPv/BgD7/wYA+/8HAPv/BgD6/wcA+v8HAPv/CAD7/wgA+v8JAPr/CQD5/wkA+f8JAPn/CgD5/woA+f///wMA//8EAP//BAAAAAMA//8DAP//AwD//wMAAAADAP//AgD//wIA//8DAP7/AgD//wIA/v8DAP//AgD//wIA//8CAP//AgAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAIAAAACAAAAAgAAAAEAAAACAAAAAQAAAAIAAAABAAAAAQD//wEA//8BAP//AgD//wIA//8BAP//AQAAAAIAAAACAP//AQD//wEA//8CAP//AgD//wIA//8CAP//AgD//wIA//8CAAEA/P8BAPz/AQD8/wEA/P8BAP3/AQD9/wEA/f8AAP3/AAD+/wAA/v8AAP3/AQD9/wAA/v8BAP3/AAD+/wAA/v8AAP//AQD+/wAA/v8AAP//AAD//wAA//8AAP///////////////wAA//8AAP//AAD//wAA/v8BAP7/AQD+/wIA/v8BAP//AQD//wEA/v8AAP7/AAD+/wAA/v8BAP7/AAD9/wAA/v8BAP7/AQD+/wEA/f8AAP3/AQD9/wEA/v8BAP3/AQD9/wAABQD5/wUA+f8EAPn/BAD6/wQA+f8EAPr/BAD6/wQA+v8EAPr/BQD7/wUA+/8FAPv/BgD6/wYA+/8GAPr/BgD7/wYA+f8GAPr/BQD7/wUA+v8FAPr/BAD6/wQA+/8EAPv/BAD7/wQA+v8EAPr/BAD7/wQA+/8FAPr/BQD6/wUA+v8EAPz/BAD8/wQA/P8FAPz/BQD8/wUA/f8FAPz/BQD9/wYA/f8GAPz/BgD8/wYA+/8HAPz/BwD8/wcA+/8HAPv/BwD7/wgA/P8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA//8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAUA9v8FAPb/BgD3/wUA9v8FAPf/BQD3/wQA9/8FAPj/BgD4/wYA+P8GAPn/BwD5/wgA+P8HAPf/BwD4/wcA9/8IAPf/BwD3/wcA9/8GAPj/BwD3/wYA9/8GAPf/BwD4/wcA9/8HAPf/CAD3/wgA9v8IAPb/CAD2/wgA9f8JAPX/CAD5/wgA+P8JAPj/CQD5/woA+P8LAPj/CwD4/wwA+P8MAPf/DAD4/w0A9/8NAPf/DQD3/w4A9v8PAPb/DwD2/xAA9f8QAPX/+v8JAPr/CQD5/wgA+v8JAPv/CAD6/wgA+/8IAPr/BwD5/wcA+P8GAPn/BgD3/wYA9f8IAPb/CAD2/wgA9v8IAPb/CQD3/wkA9/8JAPj/CAD3/wkA+f8JAPn/CQD5/wgA+f8JAPn/CQD4/wkA+f8JAPj/CQD4/wkA+f8KAPj/CQD6/wYA+f8GAPn/BgD5/wYA+P8GAPj/BgD4/wYA9/8GAPf/BgD3/wYA9v8HAPb/BwD2/wcA9f8HAPX/CAD0/wcA9P8IAPT/CAD9/wgA/P8HAP3/BwD8/wcA/P8HAP3/BgD9/wcA/f8HAP3/BgD9/wYA/P8FAPz/BgD8/wUA+/8GAPz/BgD8/wYA+/8GAPv/BgD8/wUA/P8GAP3/BgD9/wUA/f8FAPz/BQD8/wUA/f8FAP3/BQD8/wUA/f8FAP3/BgD8/wUA/P8GAPz/BAD9/wQA/P8EAPz/AwD8/wQA+/8EAPv/BAD7/wQA+/8FAPv/BAD6/wQA+v8FAPr/BAD6/wUA+f8FAPr/BgD5/wUA+f8FAAQA+f8FAPr/BAD6/wUA+f8EAPr/BAD6/wMA+v8EAPr/BAD7/wQA+/8EAPz/BAD7/wUA+/8GAPv/BQD7/wUA+/8GAPv/BQD7/wUA+/8EAPv/BAD7/wMA+/8DAPv/BAD8/wQA+/8EAPv/BAD7/wQA+/8EAPv/BAD7/wQA+/8EAPv/BAD8/wQA/f8EAP3/BAD9/wUA/f8FAPz/BQD9/wUA/P8FAPz/BQD9/wcA/P8HAPz/BwD8/wcA/P8HAPv/BwD7/wgA/P8HAPv/AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAP//AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAP//AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABAP7/AAD+/wEA/v8BAP7/AQD+/wEA/v8BAP7/AQD+/wEA/v8BAP7/AgD+/wIA/v8CAP7/AQD+/wIA/v8CAP7/AQD+/wIA/v8BAP7/AgD+/wEA/v8BAP//AQD+/wEA/v8BAP7/AgD+/wEA/v8BAP7/AQD+/wEA/v8BAP7/AgD+/wEA//8BAP7/AgD+/wIA/v8BAP7/AgD//wIA/v8CAP//AgD+/wMA/v8CAP7/AgD+/wIA/v8CAP7/AwD+/wMA/v8DAP7/AwD+/wMA+/8DAPv/AwD8/wMA/P8DAPz/AwD8/wMA/P8DAPz/BAD8/wQA/f8DAPz/AwD9/wQA/P8EAPz/AwD9/wMA/P8DAPz/AgD8/wIA/f8CAP3/AgD9/wIA/f8CAP3/AQD9/wEA/f8AAP7/AQD+/wEA/v8AAP7/AAD+/wEA/v8AAP7/AAD//wAAAAD//wAA//8AAAAAAAD//wAA//8AAP////8AAAAA//8AAP//AAD//wAA//8AAP///////wAA/v8AAP7//////wAAAwD9/wMA/v8DAP3/AgD+/wMA/f8CAP7/AwD+/wIA/v8CAP7/AwD+/wMA//8EAP7/AwD//wMA/v8DAP7/AwD//wMA/v8CAP//AgD+/wIA/v8CAP7/AQD+/wEA//8CAP//AgD//wIA/v8BAP//AQD//wIA//8CAP//AQD//wEA//8BAAAAAQD//wEA//8BAAAAAQAAAAEA//8CAAAAAgAAAAEAAAABAP//AQAAAAEAAAABAAAAAgAAAAEAAAACAAAAAgAAAAEAAAAEAPn/BQD4/wQA+f8FAPn/BAD6/wQA+v8EAPn/BAD6/wUA+/8EAPr/BAD6/wQA+/8FAPr/BQD7/wUA+/8EAPr/BQD7/wQA+v8EAPv/BAD7/wQA+/8EAPv/BAD7/wMA+/8EAPz/BAD8/wQA+/8EAPv/BAD8/wQA+/8EAPv/BAD7/wQA/f8EAP3/BAD9/wUA/f8EAP3/BQD+/wUA/f8FAP3/BgD9/wYA/f8GAP3/BwD8/wcA/f8GAP3/BwD8/wcA/P8HAP3/CAD8//j/EQD3/xEA+P8QAPf/DwD4/w8A+P8OAPj/DgD5/w4A9/8MAPf/DAD3/wwA9v8LAPX/DQD1/wwA9v8MAPf/DAD2/wwA+P8MAPj/DAD4/wwA+P8LAPn/CwD5/wsA+f8KAPn/CgD5/woA+f8KAPn/CgD5/wkA+f8KAPn/CgD6/woA+v8FAPr/BgD6/wYA+f8FAPn/BQD5/wUA+P8GAPj/BgD3/wYA9/8GAPj/BgD3/wcA9/8GAPf/BwD2/wcA9v8HAPb/BwD1/wgA+f8HAPr/BgD5/wYA+v8GAPr/BQD6/wYA+v8GAPr/BQD6/wUA+v8FAPr/BAD5/wQA+f8EAPn/BQD4/wQA+f8EAPn/BQD5/wUA+v8EAPr/BAD6/wUA+/8EAPv/BAD7/wUA+v8EAPr/BAD6/wQA+v8EAPr/BAD6/wQA+v8EAPn/BAD6/wMA+f8DAPn/AwD5/wMA+f8DAPj/AwD4/wIA+P8DAPf/AwD3/wMA9v8DAPb/AwD1/wMA9f8DAPb/BAD1/wQA9P8DAPT/AwAEAP3/BAD9/wQA/f8EAP7/AwD+/wQA/f8EAP7/AwD+/wMA/v8DAP7/AwD+/wQA//8EAP7/BAD+/wQA/v8EAP//BAD+/wQA/v8DAP//AwD+/wQA/v8DAP//AgD//wMA/v8DAP//AwD//wMA//8DAP//AwD//wMA//8DAP//AwD//wIAAAADAAAAAwAAAAMAAAADAAAABAAAAAMAAAADAAAABAAAAAQAAQAEAAAABAAAAAUAAQAFAAAABAAAAAUAAAAFAAEABQABAAEA//8AAP//AQD//wAA/v8BAP//AAD//wAA/v8BAP//AQD//wEA//8BAP//AQD//wAA//8BAP//AQD//wAA//8BAP//AQD//wEA//8BAP//AAD//wAA//8BAP//AQD//wEA//8BAP//AQD//wEA//8AAP//AAD//wEA//8BAP//AQD//wEA//8BAP//AQD//wEA//8BAP//AgAAAAEA//8BAP//AQD//wEA//8BAP//AQD//wEA//8CAP//AQD//wIA//8CAP//AQD8/wIA/f8BAP3/AgD+/wEA/f8CAP3/AgD+/wEA/f8CAP7/AgD+/wIA/v8CAP7/AwD+/wIA/f8DAP7/AwD9/wIA/v8CAP7/AgD9/wIA/v8CAP7/AgD+/wIA/v8BAP7/AQD9/wIA/v8CAP7/AgD+/wIA/v8CAP7/AQD+/wIA/v8CAP//AgD//wIA/v8CAP//AgD//wIA//8CAP7/AwD//wMA/v8DAP7/AwD//wMA/v8DAP7/AwD+/wMA/v8DAP7/AwD+/wMA/f8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEAAAAAAAAAAAAAAAAAAAAAAAAAAQAAAAAAAAAAAAAAAAD//wAAAAAAAAAAAAAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEA//8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEAAAAAAAAAAAAAAAAAAAABAP7/AwD+/wQA/v8DAP7/AwD+/wMA/v8CAP7/AwD+/wMA/f8CAP7/AgD+/wMA/f8CAP3/AgD+/wIA/f8DAP3/AgD9/wIA/v8CAP7/AwD9/wMA/v8CAP7/AgD+/wIA/v8CAP7/AgD+/wIA/f8CAP7/AgD+/wMA/v8CAP7/AwD9/wIA/v8CAP3/AQD+/wIA/f8CAP3/AgD9/wEA/f8CAP3/AgD9/wIA/P8CAPz/AgD8/wIA/P8CAPz/AgD8/wIA/P8CAPv/AgD8/wIAAQD9/wEA/f8BAP7/AQD9/wIA/v8BAP7/AQD9/wEA/v8CAP7/AgD+/wEA/v8CAP7/AQD+/wEA/v8BAP3/AQD+/wIA/v8BAP7/AQD+/wIA/v8BAP7/AQD+/wEA/v8BAP//AQD+/wEA/v8CAP7/AQD+/wEA/v8BAP7/AQD+/wIA//8BAP7/AgD//wEA//8CAP7/AgD+/wIA//8CAP7/AgD+/wIA//8DAP7/AwD+/wMA//8CAP7/AwD+/wIA/v8DAP7/AwD+/wMA/v8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAABAAEAAAAAAAAAAQABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQAAAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABAAAAAAAAAAAAAAAAAP//AAD//wAA//8AAP//AAD+/wAA//8AAP7//////wAA/v8AAP7/AAD+/wAA/v8AAP7//////wAA//8AAP7/AAD+/wEA/v8BAP//AAD+/wAA//8AAP//AAD+/wAA//8AAP//AAD//wEA/v8BAP7/AAD//wAA//8AAP//AAD+/wAA/v8AAP7/AAD+/wAA/v8AAP7/AAD+/wAA/v8BAP7/AAD+/wAA/f8BAP3/AAD9/wAA/v8AAP3/AAD+/wAA/f8AAP3/AAD9/wAAAQACAAEAAgABAAIAAQACAAEAAgABAAIAAQACAAEAAgABAAIAAQACAAEAAQABAAIAAQACAAAAAgABAAEAAQACAAEAAQABAAEAAAACAAEAAQAAAAEAAAABAAEAAgABAAEAAQACAAEAAQABAAEAAQABAAEAAgABAAEAAQACAAEAAgABAAIAAQABAAEAAQABAAIAAQACAAEAAQABAAEAAQACAAEAAQACAAEAAgACAAEAAQABAAIAAQACAAEAAQABAAIAAgACAAEAAgAAAAEA//8BAAAAAQD//wEAAAAAAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAAAAAAAAAABAAAAAAABAAEAAAABAAAAAAAAAAAAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEAAAAAAAAAAQAAAAEAAAABAAAAAAABAAAAAAAAAAAAAAABAAAAAAAAAAAAAQABAAEAAAABAAAAAQABAAEAAQABAAAAAQAAAAEA+/8BAPv/AQD7/wEA/P8BAPz/AAD9/wEA/P8BAPz/AQD8/wEA/f8BAP3/AQD9/wEA/P8CAP3/AQD8/wEA/f8BAP3/AgD9/wEA/f8BAP3/AQD9/wEA/f8BAP3/AQD9/wEA/f8BAP3/AQD9/wIA/f8BAP3/AQD9/wEA/P8CAPz/AQD9/wIA/v8BAP7/AQD9/wEA/f8CAP3/AgD9/wIA/f8CAPz/AgD9/wIA/f8CAPz/AgD9/wIA/P8CAPz/AwD8/wIA/P8DAPz//v8GAP//BgD+/wYA//8FAP7/BQD//wUA/v8FAP7/BQD+/wUA/v8EAP7/BAD+/wQA/v8EAP3/BAD+/wUA/v8EAP7/BQD9/wQA/v8EAP7/BAD+/wQA/v8EAP//BAD+/wQA/v8EAP7/BAD//wQA/v8EAP7/BAD+/wQA/v8FAP7/BQD+/wMA/v8DAP7/AwD+/wMA/v8DAP7/AwD+/wMA/v8DAP7/BAD+/wQA/f8DAP3/BAD9/wQA/f8EAP3/BAD8/wQA/f8FAPz/BAAAAP7/AAD9/wAA/f////3/AAD+/wAA/f8AAP7/AAD+/wAA/f8AAP7/AAD+/wAA/v8AAP7/AAD+/wAA/v8AAP7/AAD+/wEA/v8AAP7/AAD+/wAA//8AAP7/AAD+/wAA/v8AAP7/AAD+/wAA/v8AAP//AAD+/wAA/v8AAP7/AAD+/wAA//8AAP7/AAD+/wAA//8AAP//AAD+/wAA//8AAP//AAD+/wAA/v8AAP//AAD+/wAA/v8AAP7/AAD+/wAA/v8AAP7/AAD+/wAAAQAAAAEAAAABAAEAAgABAAEAAAABAAEAAQAAAAEAAQACAAAAAQABAAEAAQABAAAAAgABAAEAAAABAAAAAQAAAAEAAAACAAAAAQABAAEAAAABAAAAAgAAAAEAAQABAAEAAQABAAIAAAACAAAAAQABAAEAAQACAAEAAQAAAAEAAQABAAEAAgABAAIAAQABAAEAAQAAAAIAAAABAAAAAQAAAAIAAAABAAEAAQABAAIAAQABAAEAAgABAAIAAQACAAEAAgABAAIA/v8PAP3/DwD+/w8A/f8NAP3/DQD+/w0A/f8MAP7/DAD9/wsA/f8LAP3/CgD8/woA/P8JAPv/CwD7/woA/P8KAPz/CgD7/woA+/8LAPv/CgD7/woA+/8KAPv/CwD6/woA+v8LAPr/CgD6/wsA+f8LAPn/CwD4/wwA+P8NAPj/DQD3/wsA9/8KAPf/CgD2/wsA9v8LAPb/CwD1/wwA9P8MAPT/DADz/w0A8/8NAPL/DQDy/w4A8v8PAPH/DwDx/w8A8P8PAPD/EQD///z/AAD9/////P8AAP3////9/////f8AAP3////9/////f////7//f/9//7//v/9//7//f/+//3////8/////P////z/AQD9/wAA/P8BAP3/AAD9/wAA/f8AAP3/AAD9/wAA/P8BAPz/AAD9/wAA/P8BAP3/AAD8/wEA/P8BAP3/AQD8/wAA/P8AAPz/AAD8/wAA/P8AAPz////8////+/////z////7/////P8AAPv/AAD7////+v////r////6/wAA+v///wsA7P8LAOz/CwDt/woA7v8LAO7/CgDv/wkA8P8KAPD/CgDx/woA8f8LAPP/CgDy/wsA8/8LAPP/CwDy/wsA8/8KAPT/CADz/wcA9P8IAPT/BgD1/wYA9f8FAPb/BQD2/wUA9v8GAPb/BQD2/wUA9/8FAPf/BQD3/wUA9v8FAPb/BAD5/wQA+/8EAPv/BQD6/wUA+/8FAPv/BQD7/wYA+/8GAPv/BgD7/wYA+/8GAPr/BgD6/wYA+v8HAPr/BwD6/wcA+f8HAPn/AgABAAEAAQABAAIAAgABAAEAAgABAAIAAgABAAEAAgABAAIAAQACAAEAAQABAAIAAQACAAAAAgAAAAMAAAADAAAAAgAAAAMAAAADAAAABAAAAAQAAAAEAAEAAwABAAQAAQAEAAAAAwABAAQAAQADAAEAAwABAAQAAQAEAAEABAACAAMAAgACAAIAAgACAAMAAgACAAIAAgACAAMAAgADAAIAAwACAAMAAwADAAIAAwADAAMAAwADAAMAAwAEAAQABAAEAAQABAAFAPb/BQD2/wUA9v8EAPf/BAD3/wUA9/8EAPj/BAD4/wUA+P8FAPj/BQD5/wYA+f8GAPn/BwD4/wcA+P8GAPj/BgD4/wYA+P8GAPj/BgD3/wYA9/8FAPf/BQD4/wUA9/8FAPf/BgD4/wYA9/8GAPj/BgD4/wYA9/8HAPf/BwD3/wYA+f8HAPn/BwD5/wcA+f8HAPn/CAD5/wgA+f8IAPn/CQD4/wkA+P8JAPj/CgD4/woA+P8LAPj/CwD4/wsA9/8LAPf/DAD3//T/EAD1/w8A9f8PAPb/DgD2/w4A9f8NAPb/DQD2/wwA9f8MAPX/DAD0/wsA8/8LAPL/CgDx/wwA8f8MAPH/DADy/w0A8/8NAPL/DgDx/w4A8/8OAPP/DgDz/w0A8/8OAPP/DgDy/w4A8v8OAPH/DgDx/w0A8f8OAPD/DwDv/w8A8P8MAO//CwDv/wsA7v8LAO3/DADs/wwA7P8LAOv/CwDq/w0A6f8NAOj/DQDn/w0A5v8NAOX/DgDl/w4A4/8PAOP/DwDi/xAACQD1/wgA9v8IAPb/BwD3/wgA9/8IAPj/BwD3/wcA+P8HAPj/CAD4/wgA+f8IAPn/CQD6/wgA+f8IAPn/CAD5/wgA+f8GAPr/BwD5/wcA+f8FAPn/BgD6/wUA+v8FAPn/BQD6/wYA+f8FAPr/BgD5/wUA+v8FAPr/BQD5/wYA+f8FAPr/BQD8/wUA/f8FAPz/BQD8/wUA/P8GAP3/BgD9/wYA/P8HAPz/BwD8/wcA/P8IAPz/BwD8/wcA/P8IAPv/CAD8/wgA+/8IAPX/CQD1/wkA9f8JAPX/CAD2/wgA9v8IAPf/CAD3/wkA+P8IAPj/CQD4/wkA+P8JAPj/CwD4/woA+P8KAPj/CQD4/wgA9/8IAPf/CAD4/wgA+P8HAPj/BwD4/wgA+f8HAPj/BwD4/wgA+P8HAPn/CAD5/wgA+P8IAPj/CAD4/wcA+/8IAPv/CAD7/wgA+/8JAPv/CgD7/wkA+/8KAPv/CwD7/woA+/8LAPv/DAD6/wwA+v8NAPn/DQD6/w0A+v8OAPn/DgD5//n/DQD4/w0A+f8NAPn/DQD5/wsA+f8LAPn/CwD6/wsA+f8KAPn/CgD4/wkA+P8JAPj/CQD3/woA+P8KAPj/CQD4/wkA+f8KAPn/CgD5/wkA+v8JAPr/CAD7/wgA+v8IAPv/CAD6/wkA+v8IAPr/CAD7/wgA+v8IAPv/CAD6/wgA+/8FAPv/BQD6/wUA+/8FAPr/BQD5/wUA+v8FAPn/BQD5/wUA+f8FAPn/BQD4/wYA+P8GAPj/BwD4/wYA+P8GAPf/BwD3/wcACQDw/woA8f8JAPH/CADx/wgA8v8IAPP/CADz/wgA8/8JAPT/CQD1/woA9f8LAPb/CwD2/wsA9P8LAPT/CgD1/woA9f8JAPT/CQD1/wkA9f8HAPX/CAD2/wcA9v8IAPb/BwD2/wgA9f8IAPb/CAD1/wcA9f8IAPb/CAD1/wkA9v8IAPn/BwD5/wgA+P8IAPn/CQD5/woA+f8KAPn/CwD5/wsA+f8LAPn/CwD4/wwA+P8MAPj/DAD3/w0A9/8NAPf/DgD2/w4A9v/7/wgA+v8IAPr/CAD7/wgA+/8IAPv/BwD8/wcA+/8HAPr/BgD7/wUA+v8GAPr/BQD5/wUA+v8GAPn/BgD6/wYA+v8GAPv/BgD6/wYA+/8GAPv/BgD7/wUA+/8GAPv/BQD7/wUA+/8GAPr/BgD7/wYA+/8GAPr/BgD6/wYA+v8GAPr/BQD6/wUA+v8FAPr/BQD6/wQA+f8EAPj/BAD4/wQA+P8EAPj/BAD4/wUA9/8FAPf/BQD3/wUA9v8FAPb/BgD1/wYA9v8GAP3/BwD9/wYA/f8GAP3/BQD9/wUA/f8FAPz/BQD8/wUA/P8FAPz/BQD7/wQA+v8EAPv/BAD5/wUA+v8FAPr/BQD7/wUA+/8GAPz/BQD7/wUA/f8FAPz/BQD9/wQA/P8FAP3/BQD9/wQA/f8EAP3/BAD9/wQA/v8DAP7/BAD9/wMA/v8BAP//AQD//wEA/v8BAP7/AgD+/wIA//8CAP7/AgD+/wIA/v8CAP7/AgD+/wIA/v8CAP7/AgD+/wMA/v8CAP7/AgD9/wIAAgD7/wMA+/8CAPv/AgD8/wMA/P8DAPz/AwD8/wMA/P8DAPz/AgD8/wMA/f8DAP3/AwD9/wQA/f8EAP3/AwD9/wMA/P8DAPz/AwD8/wMA/P8CAP3/AwD9/wIA/f8DAP3/AwD8/wIA/f8DAPz/AwD9/wMA/P8DAP3/AwD8/wMA/P8DAP7/AwD+/wMA/v8DAP7/AwD+/wQA/v8DAP7/BAD+/wQA/f8FAP3/BAD9/wUA/f8FAP3/BQD+/wUA/f8FAP3/BgD9/wYA/f8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAP//AgD+/wIA//8CAP//AgD+/wIA//8CAP//AQD//wEA//8CAP//AgD//wEA//8BAP//AQD+/wEA/v8BAP//AQD+/wIA//8CAP7/AgD//wIA//8BAP//AQD//wEA//8BAP7/AgD//wEA//8CAP//AQD//wIA/v8BAP7/AgD//wIA//8BAP7/AQD+/wEA//8BAP//AAD+/wEA//8AAP7/AAD+/wAA/v8BAP7/AQD+/wEA/v8BAP7/AQD+/wEA/v8BAP3/AQD+/wEABAD7/wQA+/8EAPv/BAD7/wQA+/8DAPv/AwD8/wMA/P8EAPz/BAD8/wQA/f8FAP3/BAD9/wUA/P8FAPz/BQD9/wUA/P8EAPz/BAD8/wQA/P8EAPz/AwD9/wQA/f8DAPz/BAD8/wQA/f8EAPz/BAD8/wQA/P8FAPz/BQD8/wUA/P8FAP7/BQD+/wUA/v8FAP3/BQD+/wYA/f8GAP7/BwD+/wYA/v8GAP7/BwD+/wcA/v8HAP7/BwD9/wgA/f8IAP3/CQD9/wgA/f8="
     },
     "ganManifold": {
         "targetSlope": [1, -1],
         "targetMean": [2, 2],
-        "points": [[[-0.07, -0.02], [-0.09, -0.0], [-0.07, 0.03], [-0.09, -0.01], [-0.09, -0.01], [-0.06, -0.01], [-0.07, -0.02], [-0.07, 0.05], [-0.09, -0.01], [-0.06, 0.01], [-0.08, -0.01], [-0.06, 0.01], [-0.08, -0.01], [-0.05, 0.08], [-0.07, -0.02], [-0.09, -0.01], [-0.06, 0.01], [-0.06, 0.01], [-0.08, -0.01], [-0.08, -0.02], [-0.07, -0.02], [-0.09, -0.01], [-0.09, -0.01], [-0.07, -0.02], [-0.07, 0.03], [-0.09, -0.01], [-0.09, -0.0], [-0.07, -0.01], [-0.08, -0.01], [-0.09, -0.01], [-0.06, -0.0], [-0.08, -0.02], [-0.06, 0.01], [-0.09, -0.01], [-0.07, -0.02], [-0.06, 0.06], [-0.06, -0.01], [-0.06, -0.0], [-0.06, 0.01], [-0.07, -0.03], [-0.07, -0.02], [-0.08, -0.01], [-0.07, -0.02], [-0.06, 0.06], [-0.08, -0.02], [-0.07, -0.02], [-0.05, 0.07], [-0.08, -0.02], [-0.09, -0.01], [-0.07, -0.02]], [[-0.07, 0.02], [-0.07, 0.03], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.03], [-0.06, 0.01], [-0.04, 0.0], [-0.04, 0.07], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.0], [-0.05, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.01], [-0.05, 0.0], [-0.06, 0.01], [-0.06, 0.01], [-0.06, 0.01], [-0.05, -0.0], [-0.03, 0.02], [-0.06, 0.01], [-0.04, 0.05], [-0.07, 0.01], [-0.03, 0.03], [-0.04, 0.01], [-0.04, 0.02], [-0.06, 0.01], [-0.05, -0.01], [-0.04, 0.01], [-0.06, 0.01], [-0.06, 0.01], [-0.06, 0.01], [-0.04, 0.0], [-0.06, 0.0], [-0.07, 0.01], [-0.07, 0.04], [-0.06, 0.01], [-0.05, -0.0], [-0.06, 0.01], [-0.04, 0.06], [-0.04, 0.01], [-0.04, 0.08], [-0.05, -0.01], [-0.03, 0.03], [-0.06, 0.01], [-0.04, 0.07], [-0.05, -0.0], [-0.04, 0.0]], [[-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.03], [-0.03, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.03, 0.03], [-0.05, -0.0], [-0.08, 0.03], [-0.04, 0.07], [-0.06, 0.0], [-0.05, -0.01], [-0.08, 0.04], [-0.05, -0.01], [-0.04, 0.07], [-0.06, 0.01], [-0.04, -0.0], [-0.04, 0.06], [-0.07, 0.02], [-0.05, -0.0], [-0.08, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.06], [-0.07, 0.02], [-0.03, 0.04], [-0.07, 0.02], [-0.07, 0.01], [-0.06, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.05], [-0.04, -0.0], [-0.0, 0.13], [-0.05, -0.0], [-0.03, 0.04], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.08], [-0.05, -0.01], [-0.06, 0.01], [-0.07, 0.03], [-0.08, 0.03]], [[-0.07, 0.01], [-0.06, 0.0], [-0.03, 0.01], [-0.07, 0.02], [-0.07, 0.03], [-0.07, 0.01], [-0.03, 0.02], [-0.03, 0.1], [-0.04, -0.0], [-0.06, 0.01], [-0.07, 0.03], [-0.05, -0.0], [-0.04, 0.01], [-0.08, 0.04], [-0.04, -0.0], [-0.05, -0.0], [-0.02, 0.11], [-0.06, 0.0], [-0.06, -0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.04, 0.06], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.06, 0.01], [-0.03, 0.02], [-0.04, 0.0], [-0.06, 0.0], [-0.07, 0.01], [-0.06, -0.0], [-0.09, 0.07], [-0.07, 0.02], [-0.06, 0.0], [-0.06, -0.0], [-0.07, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.06], [-0.04, 0.01]], [[-0.06, 0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.03, 0.02], [-0.06, 0.0], [-0.04, 0.05], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.03, 0.04], [-0.07, 0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.03], [-0.03, 0.02], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.03], [-0.03, 0.04], [-0.06, -0.0], [-0.04, -0.0], [-0.04, 0.07], [-0.01, 0.13], [-0.05, -0.01], [-0.07, 0.01], [-0.06, -0.0], [-0.03, 0.09], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.06], [-0.06, 0.0], [-0.09, 0.07], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.06], [-0.04, 0.07], [-0.05, -0.0], [-0.07, 0.01], [-0.06, 0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.04, -0.0]], [[-0.04, -0.0], [-0.07, 0.01], [-0.07, 0.03], [-0.04, 0.0], [-0.03, 0.03], [-0.04, -0.0], [-0.07, 0.01], [-0.07, 0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.03, 0.01], [-0.04, 0.09], [-0.06, -0.0], [-0.05, -0.0], [-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.05], [-0.05, -0.01], [-0.06, 0.01], [-0.04, -0.0], [-0.07, 0.03], [-0.07, 0.02], [-0.04, -0.0], [-0.03, 0.03], [-0.06, 0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.03, 0.03], [-0.06, -0.0], [-0.04, 0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.04, -0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.05], [-0.07, 0.02], [-0.09, 0.07], [-0.07, 0.02], [-0.05, -0.01], [-0.02, 0.11], [-0.03, 0.04], [-0.05, -0.01], [-0.03, 0.03], [-0.06, 0.01], [-0.05, -0.01]], [[-0.03, 0.03], [-0.04, 0.08], [-0.07, 0.02], [-0.06, 0.0], [-0.03, 0.1], [-0.07, 0.01], [-0.07, 0.03], [-0.06, 0.0], [-0.08, 0.04], [-0.05, -0.01], [-0.07, 0.03], [-0.07, 0.03], [-0.06, 0.01], [-0.07, 0.03], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.04, -0.0], [-0.04, 0.0], [-0.03, 0.04], [-0.07, 0.02], [-0.06, 0.0], [-0.04, -0.0], [-0.03, 0.01], [-0.04, 0.0], [-0.07, 0.03], [-0.07, 0.03], [-0.05, -0.01], [-0.04, -0.0], [-0.07, 0.03], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.04, -0.0], [-0.06, 0.0], [-0.04, 0.0], [-0.04, 0.0]], [[-0.04, 0.01], [-0.06, 0.0], [-0.04, 0.06], [-0.07, 0.01], [-0.04, 0.07], [-0.07, 0.02], [-0.08, 0.04], [-0.03, 0.04], [-0.06, 0.01], [-0.05, -0.01], [-0.03, 0.01], [-0.06, 0.0], [-0.08, 0.05], [-0.07, 0.02], [-0.06, 0.01], [-0.07, 0.03], [-0.03, 0.02], [-0.05, -0.01], [-0.04, 0.09], [-0.05, -0.0], [-0.03, 0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.03, 0.02], [-0.05, -0.0], [-0.06, 0.0], [-0.04, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.02], [-0.06, 0.01], [-0.06, 0.0], [-0.08, 0.05], [-0.06, -0.0], [-0.03, 0.09], [-0.04, 0.06], [-0.03, 0.04], [-0.06, -0.0], [-0.06, 0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.05, -0.0]], [[-0.04, 0.07], [-0.04, 0.08], [-0.07, 0.03], [-0.05, -0.01], [-0.06, 0.01], [-0.07, 0.02], [-0.03, 0.09], [-0.06, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.06, 0.01], [-0.04, 0.08], [-0.04, 0.0], [-0.06, -0.0], [-0.03, 0.04], [-0.08, 0.03], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.06, -0.0], [-0.07, 0.02], [-0.03, 0.03], [-0.03, 0.02], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.04, 0.05], [-0.08, 0.04], [-0.06, 0.0], [-0.07, 0.03], [-0.04, -0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.05, -0.0], [-0.04, 0.0], [-0.06, 0.0], [-0.07, 0.01], [-0.04, 0.0], [-0.06, 0.0], [-0.09, 0.06], [-0.03, 0.02], [-0.03, 0.03], [-0.05, -0.0], [-0.03, 0.03], [-0.06, 0.01], [-0.03, 0.04]], [[-0.05, -0.0], [-0.06, 0.01], [-0.08, 0.04], [-0.03, 0.04], [-0.03, 0.03], [-0.07, 0.01], [-0.03, 0.04], [-0.07, 0.02], [-0.06, 0.0], [-0.04, 0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.02], [-0.05, -0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.07, 0.03], [-0.06, 0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.04, 0.04], [-0.04, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.03, 0.03], [-0.07, 0.02], [-0.07, 0.02], [-0.07, 0.02], [-0.04, 0.07], [-0.04, 0.07], [-0.06, 0.0], [-0.03, 0.02], [-0.03, 0.04], [-0.06, -0.0], [-0.03, 0.03], [-0.04, -0.0], [-0.06, 0.01], [-0.07, 0.01], [-0.06, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.03, 0.01], [-0.03, 0.04]], [[-0.03, 0.03], [-0.03, 0.03], [-0.04, -0.0], [-0.04, 0.05], [-0.03, 0.03], [-0.05, -0.01], [-0.04, -0.0], [-0.04, 0.06], [-0.05, -0.01], [-0.0, 0.14], [-0.07, 0.01], [-0.07, 0.01], [-0.07, 0.03], [-0.06, 0.01], [-0.04, -0.0], [-0.07, 0.02], [-0.05, -0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.04, 0.08], [-0.06, 0.01], [-0.03, 0.02], [-0.03, 0.02], [-0.07, 0.03], [-0.05, -0.01], [-0.04, 0.05], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.07], [-0.04, -0.0], [-0.03, 0.03], [-0.05, -0.0], [-0.06, 0.0], [-0.03, 0.02], [-0.08, 0.04], [-0.05, -0.0], [-0.05, -0.01], [-0.04, 0.04], [-0.07, 0.02], [-0.07, 0.02], [-0.03, 0.03], [-0.07, 0.01], [-0.03, 0.1], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.01]], [[-0.04, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.07], [-0.07, 0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.06, -0.0], [-0.05, -0.02], [-0.06, 0.0], [-0.04, 0.09], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.03, 0.04], [-0.04, 0.05], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.02, 0.12], [-0.08, 0.04], [-0.1, 0.09], [-0.04, 0.07], [-0.05, -0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.01], [-0.04, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, -0.0]], [[-0.03, 0.01], [-0.06, 0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.08, 0.03], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.03], [-0.06, 0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.04, 0.07], [-0.05, -0.01], [-0.03, 0.03], [-0.06, 0.0], [-0.03, 0.03], [-0.06, 0.01], [-0.05, -0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.04, 0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.08], [-0.07, 0.01], [-0.06, 0.0], [-0.06, 0.0], [0.02, 0.16], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.04, -0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.04, -0.0], [-0.05, -0.02], [-0.07, 0.02]], [[-0.07, 0.01], [-0.04, 0.0], [-0.07, 0.01], [-0.06, 0.0], [-0.03, 0.03], [-0.04, -0.0], [-0.05, -0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.03, 0.03], [-0.06, 0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.03, 0.02], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.06, 0.01], [-0.04, 0.05], [-0.06, 0.0], [-0.04, 0.07], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.07, 0.03], [-0.07, 0.03], [-0.05, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.03, 0.02], [-0.08, 0.04], [-0.05, -0.0], [-0.06, 0.01], [-0.03, 0.02], [-0.03, 0.1], [-0.07, 0.02], [-0.06, 0.0], [-0.07, 0.03], [-0.06, 0.01], [-0.05, -0.0], [-0.08, 0.04], [-0.06, 0.01], [-0.07, 0.01], [-0.06, 0.01]], [[-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.06, 0.01], [-0.04, 0.07], [-0.06, 0.01], [-0.05, -0.01], [-0.04, 0.01], [-0.05, -0.0], [-0.07, 0.01], [-0.03, 0.02], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.04], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.0], [-0.04, 0.06], [-0.04, 0.0], [-0.03, 0.02], [-0.04, 0.05], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.05], [-0.06, 0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.03, 0.04], [-0.04, 0.05], [-0.05, -0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.04, -0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.03, 0.04], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.0], [-0.06, 0.01], [-0.04, 0.09], [-0.03, 0.02], [-0.07, 0.03]], [[-0.05, -0.01], [-0.03, 0.01], [-0.04, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.08, 0.05], [-0.04, -0.0], [-0.07, 0.02], [-0.03, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.04, -0.0], [-0.04, 0.06], [-0.04, 0.0], [-0.08, 0.04], [-0.06, 0.0], [-0.04, -0.0], [-0.07, 0.03], [-0.04, 0.08], [-0.04, 0.08], [-0.05, -0.01], [-0.04, 0.06], [-0.03, 0.03], [-0.04, 0.06], [-0.03, 0.09], [-0.07, 0.02], [-0.08, 0.05], [-0.05, -0.01], [-0.06, -0.0], [-0.03, 0.02], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.03, 0.03], [-0.04, 0.0], [-0.04, 0.08], [-0.06, 0.0], [-0.07, 0.03], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.02]], [[-0.06, 0.0], [-0.05, -0.01], [-0.06, -0.0], [-0.04, 0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.04, -0.0], [-0.04, 0.05], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.03, 0.02], [-0.04, 0.06], [-0.05, -0.01], [-0.06, 0.01], [-0.04, 0.05], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.03], [-0.05, -0.01], [-0.08, 0.04], [-0.05, -0.01], [-0.04, 0.06], [-0.05, -0.01], [-0.04, 0.07], [-0.07, 0.03], [-0.04, 0.06], [-0.07, 0.01], [-0.06, 0.0], [-0.03, 0.02], [-0.05, -0.0], [-0.07, 0.03], [-0.07, 0.01], [-0.06, 0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.06, 0.01], [-0.05, -0.0], [-0.07, 0.01], [-0.04, 0.07], [-0.05, -0.01], [-0.01, 0.12]], [[-0.07, 0.01], [-0.05, -0.01], [-0.08, 0.05], [-0.03, 0.02], [-0.08, 0.04], [-0.04, -0.0], [-0.04, 0.0], [-0.04, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.02], [-0.08, 0.05], [-0.05, -0.01], [-0.03, 0.02], [-0.08, 0.04], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.02], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.03], [-0.07, 0.01], [-0.06, -0.0], [-0.05, -0.01], [-0.08, 0.04], [-0.05, -0.01], [-0.04, 0.01], [-0.08, 0.05], [-0.07, 0.02], [-0.07, 0.03], [-0.04, -0.0], [-0.07, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.04, 0.01], [-0.05, -0.01], [-0.04, 0.06], [-0.06, 0.0], [-0.03, 0.1], [-0.06, 0.01], [-0.06, 0.0], [-0.03, 0.04]], [[-0.04, 0.0], [-0.03, 0.03], [-0.04, -0.0], [-0.06, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.09], [-0.07, 0.01], [-0.04, -0.0], [-0.07, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.04, 0.07], [-0.07, 0.02], [-0.04, 0.0], [-0.05, -0.0], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.04], [-0.03, 0.02], [-0.08, 0.04], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.02], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.02], [-0.04, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.03, 0.03], [-0.03, 0.02], [-0.07, 0.03], [-0.03, 0.02], [-0.06, -0.0], [-0.04, -0.0], [-0.06, 0.01], [-0.05, -0.0]], [[-0.08, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.02, 0.11], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.08, 0.03], [-0.06, 0.01], [-0.07, 0.02], [-0.06, 0.01], [-0.03, 0.04], [-0.07, 0.03], [-0.06, 0.0], [-0.04, 0.05], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.01], [-0.06, 0.01], [-0.04, 0.05], [-0.06, 0.0], [-0.04, 0.08], [-0.03, 0.04], [-0.04, 0.0], [-0.03, 0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.06, -0.0], [-0.07, 0.01], [-0.05, -0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.01], [-0.06, -0.0], [-0.06, 0.01], [-0.03, 0.03], [-0.07, 0.02], [-0.04, 0.07], [-0.06, -0.0], [-0.03, 0.09], [-0.06, 0.0], [-0.06, 0.01], [-0.04, 0.08], [-0.05, -0.01], [-0.03, 0.04], [-0.05, -0.01], [-0.03, 0.02], [-0.04, 0.05]], [[-0.04, -0.0], [-0.06, 0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.09], [-0.06, 0.0], [-0.04, 0.07], [-0.03, 0.02], [-0.08, 0.03], [-0.03, 0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.08], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.08, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.0], [-0.04, 0.06], [-0.04, 0.0], [-0.07, 0.02], [-0.07, 0.02], [-0.07, 0.03], [-0.06, 0.0], [-0.08, 0.04], [-0.06, 0.0], [-0.04, 0.05], [-0.04, -0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.06, 0.01], [-0.03, 0.02], [-0.04, 0.06], [-0.07, 0.03], [-0.03, 0.04], [-0.04, -0.0], [-0.04, 0.0], [-0.03, 0.04], [-0.07, 0.02], [-0.05, -0.0], [-0.05, -0.01]], [[-0.05, -0.02], [-0.02, 0.11], [-0.05, -0.01], [-0.08, 0.04], [-0.06, -0.0], [-0.03, 0.02], [-0.04, 0.0], [-0.03, 0.02], [-0.07, 0.02], [-0.05, -0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.06, 0.0], [-0.03, 0.1], [-0.06, 0.01], [-0.07, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.03, 0.04], [-0.04, 0.0], [-0.04, -0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.04, 0.05], [-0.09, 0.07], [-0.04, -0.0], [-0.05, -0.0], [-0.04, -0.0], [-0.05, -0.0], [-0.04, 0.05], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.06, 0.0], [-0.04, 0.0], [-0.04, -0.0], [-0.04, 0.0], [-0.06, -0.0], [-0.06, 0.0], [-0.04, -0.0], [-0.04, 0.07], [-0.07, 0.01], [-0.06, 0.01], [-0.04, 0.01], [-0.07, 0.01], [-0.06, 0.01]], [[-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.06, -0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.0], [-0.04, -0.0], [-0.08, 0.04], [-0.07, 0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.03, 0.02], [-0.07, 0.02], [-0.06, 0.0], [-0.08, 0.04], [-0.03, 0.04], [-0.05, -0.01], [-0.06, 0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.03], [-0.08, 0.04], [-0.07, 0.01], [-0.04, 0.0], [-0.06, 0.01], [-0.04, 0.05], [-0.03, 0.02], [-0.04, 0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.04, 0.05], [-0.04, 0.09], [-0.06, 0.01], [-0.04, 0.05], [-0.07, 0.02], [-0.07, 0.03], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.04]], [[-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.03], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.07], [-0.05, -0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.06, 0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.03, 0.04], [-0.05, -0.01], [-0.08, 0.03], [-0.07, 0.02], [-0.04, -0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.04, -0.0], [-0.07, 0.02], [-0.03, 0.04], [-0.04, 0.06], [-0.04, 0.09], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.08, 0.04], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.0], [-0.04, 0.06], [-0.06, 0.0], [-0.04, -0.0]], [[-0.07, 0.03], [-0.04, 0.05], [-0.06, 0.01], [-0.06, 0.0], [-0.08, 0.04], [-0.06, -0.0], [-0.07, 0.02], [-0.04, 0.07], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.1], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.05], [-0.07, 0.01], [-0.06, 0.01], [-0.07, 0.02], [-0.04, 0.07], [-0.04, 0.08], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.07, 0.02], [-0.05, -0.0], [-0.03, 0.03], [-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.06, 0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.04, -0.0], [-0.07, 0.02], [-0.07, 0.02], [-0.04, -0.0], [-0.07, 0.03], [-0.06, -0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.04, 0.0]], [[-0.07, 0.01], [-0.05, -0.01], [-0.03, 0.09], [-0.07, 0.03], [-0.07, 0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.06, -0.0], [-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.06, 0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.08, 0.04], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.03], [-0.05, -0.0], [-0.03, 0.04], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.07, 0.03], [-0.04, 0.0], [-0.05, -0.0], [-0.05, -0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.04, 0.05], [-0.04, 0.0], [-0.05, -0.02], [-0.05, -0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.06, 0.01], [-0.03, 0.09], [-0.04, 0.06], [-0.03, 0.03], [-0.07, 0.03]], [[-0.06, 0.0], [-0.06, 0.0], [-0.03, 0.01], [-0.03, 0.02], [-0.08, 0.03], [-0.03, 0.01], [-0.04, -0.0], [-0.03, 0.03], [-0.03, 0.02], [-0.05, -0.0], [-0.06, 0.0], [-0.04, 0.07], [-0.07, 0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.03, 0.1], [-0.04, -0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.02], [-0.07, 0.02], [-0.07, 0.02], [-0.03, 0.04], [-0.05, -0.01], [-0.06, 0.01], [-0.04, 0.08], [-0.07, 0.01], [-0.05, -0.01], [-0.03, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.04, -0.0], [-0.09, 0.07], [-0.04, -0.0], [-0.05, -0.01], [-0.04, 0.08], [-0.04, -0.0], [-0.08, 0.04], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.0], [-0.05, -0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.07]], [[-0.05, -0.01], [-0.03, 0.03], [-0.03, 0.02], [-0.04, -0.0], [-0.07, 0.01], [-0.04, 0.0], [-0.07, 0.02], [-0.06, 0.01], [-0.03, 0.1], [-0.03, 0.02], [-0.04, -0.0], [-0.07, 0.01], [-0.03, 0.02], [-0.07, 0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.04, 0.05], [-0.06, -0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.07, 0.02], [-0.06, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.03], [-0.05, -0.01], [-0.04, 0.08], [-0.08, 0.03], [-0.06, 0.01], [-0.03, 0.02], [-0.08, 0.05], [-0.03, 0.02], [-0.07, 0.02], [-0.07, 0.01], [-0.07, 0.02], [-0.04, -0.0], [-0.07, 0.02], [-0.04, 0.05], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.04, 0.06], [-0.06, 0.0]], [[-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.07, 0.01], [-0.04, 0.07], [-0.07, 0.03], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.0], [-0.06, -0.0], [0.0, 0.14], [-0.05, -0.01], [-0.07, 0.02], [-0.08, 0.05], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.03], [-0.06, 0.0], [-0.09, 0.07], [-0.03, 0.03], [-0.07, 0.02], [-0.04, 0.0], [-0.04, 0.01], [-0.06, 0.0], [-0.04, 0.0], [-0.06, -0.0], [-0.03, 0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.02, 0.11], [-0.04, 0.0], [-0.04, 0.08], [-0.06, 0.01], [-0.07, 0.03], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.09, 0.06], [-0.05, -0.0], [-0.04, 0.05], [-0.07, 0.02], [-0.09, 0.07], [-0.05, -0.0]], [[-0.06, 0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.07, 0.02], [-0.04, -0.0], [-0.07, 0.02], [-0.05, -0.0], [-0.05, -0.0], [-0.06, -0.0], [-0.04, -0.0], [-0.06, 0.0], [-0.04, 0.0], [-0.02, 0.11], [-0.05, -0.01], [-0.03, 0.03], [-0.04, 0.05], [-0.04, 0.05], [-0.05, -0.01], [-0.07, 0.01], [-0.03, 0.03], [-0.06, 0.0], [-0.04, 0.01], [-0.03, 0.02], [-0.08, 0.05], [-0.03, 0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.03, 0.03], [-0.03, 0.02], [-0.04, 0.05], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.06, -0.0], [-0.05, -0.01], [0.01, 0.15], [-0.06, 0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.04, 0.08], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.03, 0.02], [-0.06, 0.0], [-0.04, 0.0]], [[-0.06, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.04, 0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.03, 0.04], [-0.03, 0.03], [-0.04, 0.06], [-0.06, 0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.08, 0.04], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.04, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.04], [-0.07, 0.03], [-0.05, -0.01], [-0.08, 0.04], [-0.07, 0.02], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.02], [-0.05, -0.0], [-0.06, 0.01], [-0.04, 0.0], [-0.04, 0.05], [-0.08, 0.05], [-0.05, -0.01], [-0.03, 0.01], [-0.03, 0.02], [-0.03, 0.02], [-0.07, 0.02], [-0.03, 0.03], [-0.05, -0.01], [-0.04, 0.07], [-0.04, 0.0], [-0.05, -0.0], [-0.06, 0.01], [-0.05, -0.0], [-0.06, 0.0]], [[-0.05, -0.01], [-0.03, 0.09], [-0.03, 0.04], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.08], [-0.04, 0.07], [-0.03, 0.03], [-0.03, 0.02], [-0.03, 0.02], [-0.08, 0.04], [-0.05, -0.01], [-0.09, 0.07], [-0.07, 0.01], [-0.05, -0.0], [-0.06, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.0], [-0.04, 0.0], [-0.03, 0.03], [-0.06, 0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.03, 0.03], [-0.07, 0.02], [-0.03, 0.09], [-0.05, -0.01], [-0.07, 0.01], [-0.03, 0.03], [-0.07, 0.01], [-0.03, 0.1], [-0.04, 0.05], [-0.04, 0.07], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.01], [-0.07, 0.03], [-0.06, 0.0], [-0.05, -0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.04, 0.0], [-0.05, -0.0]], [[-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.04, 0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.03, 0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.04, 0.05], [-0.08, 0.06], [-0.03, 0.04], [-0.07, 0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.01]], [[-0.06, 0.0], [-0.06, 0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.06, -0.0], [-0.05, -0.01], [-0.08, 0.04], [-0.06, 0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.06, -0.0], [-0.06, -0.0], [-0.04, 0.0], [-0.04, -0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.03, 0.01], [-0.1, 0.09], [-0.04, -0.0], [-0.08, 0.04], [-0.03, 0.02], [-0.04, 0.05], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.03], [-0.07, 0.02], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.0], [-0.07, 0.01], [-0.04, 0.05], [-0.05, -0.01], [-0.03, 0.03], [-0.03, 0.02], [-0.03, 0.02], [-0.06, 0.0], [-0.07, 0.02], [-0.04, 0.01], [-0.04, 0.0], [-0.04, -0.0], [-0.06, -0.0], [-0.06, 0.0], [-0.07, 0.02]], [[-0.08, 0.05], [-0.05, -0.01], [-0.04, 0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.06, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.04, 0.0], [-0.04, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.03, 0.04], [-0.04, 0.08], [-0.06, 0.0], [-0.03, 0.02], [-0.07, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.04, -0.0], [-0.06, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.04, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.09, 0.06], [-0.05, -0.0], [-0.06, 0.0], [-0.07, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01]], [[-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.04, -0.0], [-0.07, 0.02], [-0.04, 0.0], [-0.03, 0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.06, -0.0], [-0.07, 0.02], [-0.06, 0.01], [-0.03, 0.03], [-0.04, 0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.11, 0.12], [-0.08, 0.04], [-0.06, 0.0], [-0.04, 0.0], [-0.03, 0.04], [-0.04, 0.05], [-0.08, 0.05], [-0.08, 0.04], [-0.06, 0.01], [-0.07, 0.01], [-0.08, 0.04], [-0.05, -0.01], [-0.07, 0.01], [-0.08, 0.05], [-0.03, 0.04], [-0.08, 0.04], [-0.04, 0.09], [-0.07, 0.02], [-0.04, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.0], [-0.05, -0.01], [-0.04, 0.06], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01]], [[-0.09, 0.06], [-0.05, -0.0], [-0.04, -0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.03, 0.03], [-0.05, -0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.03, 0.03], [-0.04, -0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.07, 0.03], [-0.06, -0.0], [-0.07, 0.01], [-0.03, 0.03], [-0.08, 0.03], [-0.03, 0.04], [-0.05, -0.01], [-0.03, 0.03], [-0.06, 0.0], [-0.04, 0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.03, 0.04], [-0.04, 0.06], [-0.06, 0.0], [-0.06, 0.01], [-0.04, 0.01], [-0.06, 0.0], [-0.04, -0.0], [-0.04, 0.0], [-0.04, 0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.04, 0.05], [-0.08, 0.03], [-0.05, -0.01], [-0.05, -0.01]], [[-0.07, 0.02], [-0.06, 0.01], [-0.04, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.0], [-0.03, 0.04], [-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.04], [-0.05, -0.01], [-0.04, 0.08], [-0.05, -0.0], [-0.05, -0.01], [-0.04, 0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.06, -0.0], [-0.07, 0.02], [-0.04, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.06, 0.0], [-0.08, 0.04], [-0.06, 0.01], [-0.04, 0.01], [-0.06, 0.01], [-0.03, 0.1], [-0.06, 0.01], [-0.04, 0.05], [-0.08, 0.03], [-0.03, 0.04], [-0.08, 0.03], [-0.04, 0.06], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.08], [-0.01, 0.12], [-0.06, 0.01], [-0.03, 0.03], [-0.03, 0.04], [-0.06, -0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.06, -0.0], [-0.04, 0.0]], [[-0.06, 0.0], [-0.04, -0.0], [-0.08, 0.05], [-0.07, 0.02], [-0.04, 0.05], [-0.06, 0.0], [-0.07, 0.02], [-0.07, 0.03], [-0.04, 0.05], [-0.05, -0.0], [-0.03, 0.03], [-0.04, 0.0], [-0.04, 0.07], [-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.04, -0.0], [-0.05, -0.0], [-0.03, 0.04], [-0.07, 0.03], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.07, 0.03], [-0.07, 0.01], [-0.04, 0.01], [-0.08, 0.04], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.01], [-0.04, 0.05], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.0], [-0.04, 0.07], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.08], [-0.07, 0.02], [-0.05, -0.0], [-0.08, 0.03], [-0.07, 0.02], [-0.03, 0.03], [-0.06, 0.0], [-0.07, 0.01], [-0.06, 0.01], [-0.07, 0.01], [-0.04, -0.0], [-0.05, -0.0]], [[-0.06, 0.0], [-0.03, 0.04], [-0.03, 0.03], [-0.06, 0.01], [-0.03, 0.01], [-0.08, 0.04], [-0.05, -0.0], [-0.01, 0.13], [-0.03, 0.04], [-0.04, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.07, 0.02], [-0.02, 0.11], [-0.07, 0.03], [-0.05, -0.02], [-0.04, 0.07], [-0.05, -0.01], [-0.03, 0.01], [-0.09, 0.06], [-0.02, 0.11], [-0.04, -0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.08, 0.04], [-0.05, -0.01], [-0.07, 0.01], [-0.07, 0.03], [-0.05, -0.01], [-0.04, 0.0], [-0.07, 0.02], [-0.07, 0.02], [-0.04, 0.06], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.01], [-0.03, 0.03], [-0.05, -0.0], [-0.03, 0.03], [-0.07, 0.02], [-0.07, 0.02], [-0.06, 0.01], [-0.06, 0.01], [-0.08, 0.03]], [[-0.04, -0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.03, 0.04], [-0.05, -0.01], [-0.07, 0.01], [-0.06, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.03, 0.03], [-0.06, -0.0], [-0.07, 0.01], [-0.06, 0.01], [-0.07, 0.03], [-0.05, -0.01], [-0.07, 0.03], [-0.05, -0.0], [-0.04, 0.06], [-0.04, -0.0], [-0.04, 0.0], [-0.07, 0.01], [-0.06, 0.01], [-0.07, 0.02], [-0.07, 0.03], [-0.07, 0.01], [-0.05, -0.01], [-0.04, 0.01], [-0.07, 0.02], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.02], [-0.03, 0.03], [-0.06, -0.0], [-0.06, 0.01], [-0.07, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.07, 0.02], [-0.04, 0.04], [-0.03, 0.03], [-0.08, 0.04], [-0.07, 0.02], [-0.06, 0.0], [-0.06, 0.01], [-0.08, 0.04]], [[-0.06, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.05], [-0.03, 0.03], [-0.05, -0.0], [-0.04, 0.05], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.04, -0.0], [-0.06, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.06], [-0.04, 0.05], [-0.05, -0.0], [-0.04, 0.0], [-0.05, -0.0], [-0.04, -0.0], [-0.02, 0.11], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.03], [-0.07, 0.02], [-0.06, 0.0], [-0.04, 0.08], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.02, 0.11], [-0.03, 0.02], [-0.08, 0.03], [-0.08, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.0], [-0.06, -0.0]], [[-0.08, 0.03], [-0.03, 0.03], [-0.06, 0.01], [-0.05, -0.0], [-0.06, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.06, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.04, -0.0], [-0.04, -0.0], [-0.04, 0.05], [-0.03, 0.03], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.01], [-0.04, 0.0], [-0.05, -0.0], [-0.04, 0.0], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.03], [-0.04, -0.0], [-0.07, 0.01], [-0.03, 0.04], [-0.05, -0.01], [-0.03, 0.04], [-0.03, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.03, 0.01], [-0.07, 0.02], [-0.08, 0.03], [-0.04, 0.06], [-0.06, 0.0], [-0.06, 0.0], [-0.08, 0.04], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.07, 0.03], [-0.04, -0.0]], [[-0.05, -0.01], [-0.03, 0.03], [-0.06, 0.01], [-0.03, 0.01], [-0.03, 0.02], [-0.03, 0.03], [-0.09, 0.06], [-0.06, 0.0], [-0.04, 0.05], [-0.05, -0.01], [-0.03, 0.02], [-0.04, 0.08], [-0.05, -0.01], [-0.04, 0.01], [-0.07, 0.01], [-0.03, 0.09], [-0.03, 0.04], [-0.03, 0.04], [-0.04, 0.05], [-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.08, 0.04], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.04, 0.07], [-0.06, 0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.03, 0.01], [-0.06, 0.01], [-0.04, 0.06], [-0.03, 0.03], [-0.05, -0.01], [-0.01, 0.13], [-0.04, 0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.04], [-0.05, -0.01], [-0.03, 0.03], [-0.04, -0.0], [-0.07, 0.01], [-0.07, 0.01], [-0.04, 0.08], [-0.05, -0.0], [-0.03, 0.03]], [[-0.03, 0.02], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.06, -0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.06, 0.01], [-0.06, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.09, 0.07], [-0.03, 0.02], [-0.03, 0.02], [-0.07, 0.02], [-0.06, 0.0], [-0.07, 0.03], [-0.07, 0.02], [-0.04, 0.05], [-0.07, 0.02], [-0.05, -0.01], [-0.03, 0.04], [-0.07, 0.02], [-0.03, 0.01], [-0.07, 0.03], [-0.04, 0.09], [-0.03, 0.04], [-0.08, 0.05], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.07, 0.02], [-0.04, 0.01], [-0.07, 0.01], [-0.06, 0.0], [-0.06, 0.01], [-0.08, 0.04], [-0.04, 0.09], [-0.07, 0.02], [-0.08, 0.03], [-0.06, 0.01], [-0.04, -0.0], [-0.04, 0.01], [-0.06, 0.0], [-0.03, 0.04], [-0.06, -0.0], [-0.05, -0.01], [-0.07, 0.01]], [[-0.03, 0.02], [-0.03, 0.04], [-0.05, -0.0], [-0.06, -0.0], [-0.05, -0.0], [-0.03, 0.02], [-0.06, 0.01], [-0.04, 0.06], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.02], [-0.06, 0.01], [-0.07, 0.03], [-0.07, 0.02], [-0.06, 0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.0], [-0.03, 0.02], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.04, 0.04], [-0.05, -0.01], [-0.06, 0.0], [-0.04, -0.0], [-0.04, 0.06], [-0.03, 0.03], [-0.07, 0.02], [-0.04, 0.06], [-0.08, 0.04], [-0.05, -0.01], [-0.05, -0.02], [-0.03, 0.02], [-0.07, 0.03], [-0.05, -0.01], [-0.05, -0.0], [-0.06, 0.0], [-0.04, 0.09], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.03]], [[-0.06, 0.01], [-0.03, 0.04], [-0.06, 0.0], [-0.05, -0.0], [-0.06, 0.01], [-0.04, 0.05], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.01], [-0.05, -0.01], [-0.04, 0.01], [-0.05, -0.0], [-0.08, 0.04], [-0.04, -0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.04], [-0.04, -0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.04, 0.06], [-0.07, 0.02], [-0.07, 0.03], [-0.04, 0.07], [-0.07, 0.02], [-0.07, 0.02], [-0.04, -0.0], [-0.04, -0.0], [-0.03, 0.03], [-0.03, 0.02], [-0.05, -0.01], [-0.03, 0.09], [-0.06, 0.01], [-0.04, 0.0], [-0.04, -0.0], [-0.03, 0.02], [-0.04, 0.06], [-0.08, 0.04], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.02], [-0.04, 0.0], [-0.07, 0.02], [-0.06, 0.01], [-0.03, 0.04]], [[-0.06, 0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.04, 0.08], [-0.05, -0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.03, 0.03], [-0.06, -0.0], [-0.03, 0.02], [-0.04, -0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.07, 0.01], [-0.05, -0.0], [-0.05, -0.0], [-0.03, 0.02], [-0.06, -0.0], [-0.04, -0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.04, 0.04], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.06, 0.01], [-0.06, 0.01], [-0.05, -0.0], [-0.04, 0.05], [-0.09, 0.07], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.06, -0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.04, 0.0], [-0.06, 0.0], [-0.08, 0.03], [-0.03, 0.04], [-0.06, 0.0], [-0.04, 0.05]], [[-0.05, -0.01], [-0.03, 0.04], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.0], [-0.07, 0.01], [-0.03, 0.04], [-0.03, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.0], [-0.06, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.04, -0.0], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.07, 0.03], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.01], [0.0, 0.14], [-0.08, 0.03], [-0.05, -0.01], [-0.03, 0.02], [-0.04, 0.05], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.04, 0.07], [-0.04, -0.0], [-0.07, 0.02], [-0.07, 0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.08, 0.05], [-0.04, 0.0], [-0.04, -0.0], [-0.05, -0.01]], [[-0.03, 0.04], [-0.07, 0.02], [-0.07, 0.02], [-0.06, 0.01], [-0.07, 0.02], [-0.09, 0.08], [-0.05, -0.0], [-0.08, 0.03], [-0.03, 0.02], [-0.06, 0.0], [-0.04, -0.0], [-0.04, 0.09], [-0.06, 0.0], [-0.08, 0.03], [-0.07, 0.02], [-0.04, -0.0], [-0.06, 0.01], [-0.06, 0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [0.0, 0.14], [-0.03, 0.04], [-0.05, -0.01], [-0.04, 0.09], [-0.05, -0.0], [-0.08, 0.05], [0.01, 0.15], [-0.03, 0.03], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.02, 0.12], [-0.07, 0.03], [-0.04, -0.0], [-0.07, 0.01], [-0.06, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.09], [-0.05, -0.01], [-0.04, 0.05], [-0.08, 0.03], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.03]], [[-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.07, 0.02], [-0.06, 0.01], [-0.04, 0.05], [-0.03, 0.1], [-0.04, 0.06], [-0.04, -0.0], [-0.06, 0.0], [-0.07, 0.01], [-0.04, 0.08], [-0.09, 0.06], [-0.07, 0.02], [-0.05, -0.01], [-0.03, 0.03], [-0.06, 0.0], [-0.07, 0.02], [-0.04, 0.06], [-0.06, -0.0], [-0.03, 0.02], [-0.06, 0.0], [-0.04, 0.0], [-0.03, 0.03], [-0.06, -0.0], [-0.04, -0.0], [-0.05, -0.02], [-0.06, -0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.03, 0.02], [-0.03, 0.02], [-0.08, 0.04], [-0.06, 0.0], [-0.05, -0.01], [-0.08, 0.04], [-0.07, 0.03], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.03, 0.04], [-0.08, 0.03], [-0.06, 0.01], [-0.07, 0.03], [-0.08, 0.04], [-0.04, 0.0], [-0.03, 0.04], [-0.07, 0.01], [-0.05, -0.01]], [[-0.05, -0.0], [-0.07, 0.01], [-0.05, -0.0], [-0.04, -0.0], [-0.07, 0.02], [-0.05, -0.0], [-0.03, 0.02], [-0.04, -0.0], [-0.03, 0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.06, -0.0], [-0.03, 0.03], [-0.07, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.03, 0.02], [-0.07, 0.02], [-0.04, 0.01], [-0.04, 0.01], [-0.07, 0.01], [-0.07, 0.02], [-0.03, 0.04], [-0.06, -0.0], [-0.03, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.08, 0.04], [-0.04, 0.0], [-0.04, 0.07], [-0.05, -0.01], [-0.04, 0.07], [-0.05, -0.0], [-0.08, 0.03], [-0.04, 0.05], [-0.04, 0.06], [-0.04, 0.01], [-0.04, 0.0], [-0.06, 0.0], [-0.04, 0.07], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.07, 0.01], [-0.04, 0.0], [-0.08, 0.03], [-0.06, 0.01]], [[-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.0], [-0.08, 0.05], [-0.07, 0.01], [-0.02, 0.11], [-0.03, 0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.03], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.01], [-0.04, 0.01], [-0.07, 0.02], [-0.04, 0.0], [-0.06, 0.0], [-0.04, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.03], [-0.04, -0.0], [-0.04, 0.07], [-0.08, 0.04], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.07, 0.02], [-0.06, 0.0], [-0.03, 0.03], [-0.03, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.04]], [[-0.03, 0.03], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.05], [-0.06, 0.01], [-0.06, 0.0], [-0.04, 0.0], [-0.08, 0.04], [-0.07, 0.02], [-0.06, 0.01], [-0.02, 0.12], [-0.06, 0.0], [-0.05, -0.0], [-0.04, -0.0], [-0.03, 0.02], [-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.04, 0.01], [-0.07, 0.02], [-0.03, 0.02], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.09], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.08], [-0.08, 0.04], [-0.04, 0.01], [-0.03, 0.04], [-0.05, -0.01], [-0.05, -0.0], [-0.08, 0.05], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02]], [[-0.06, 0.0], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.06, -0.0], [-0.04, -0.0], [-0.03, 0.04], [-0.06, 0.0], [-0.06, 0.01], [-0.06, 0.0], [-0.04, -0.0], [-0.04, 0.0], [-0.05, -0.01], [-0.03, 0.04], [-0.06, 0.01], [-0.04, -0.0], [-0.05, -0.0], [-0.06, 0.01], [-0.0, 0.13], [-0.07, 0.02], [-0.05, -0.0], [-0.06, 0.0], [-0.07, 0.01], [-0.04, -0.0], [-0.04, 0.04], [-0.05, -0.01], [-0.04, 0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.06, 0.01], [-0.08, 0.04], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.08], [-0.06, 0.01], [-0.03, 0.02], [-0.07, 0.03], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.01], [-0.04, 0.05], [-0.05, -0.01], [-0.07, 0.03], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.06, -0.0], [-0.03, 0.03], [-0.06, 0.01]], [[-0.07, 0.02], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.07, 0.03], [-0.03, 0.02], [-0.06, 0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.03, 0.02], [-0.04, 0.01], [-0.04, 0.09], [-0.04, 0.08], [-0.04, 0.0], [-0.07, 0.02], [-0.07, 0.02], [-0.04, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.06], [-0.03, 0.09], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.0, 0.13], [-0.07, 0.02], [-0.05, -0.01], [-0.06, -0.0], [-0.07, 0.02], [-0.05, -0.0], [-0.04, 0.06], [-0.06, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.04, 0.01], [-0.06, 0.01], [-0.07, 0.02], [-0.05, -0.01]], [[-0.04, -0.0], [-0.03, 0.04], [-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.09, 0.06], [-0.07, 0.02], [-0.06, 0.0], [-0.04, 0.07], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.04, 0.07], [-0.06, 0.0], [-0.04, 0.06], [-0.04, 0.01], [-0.07, 0.03], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.03], [-0.08, 0.04], [-0.04, 0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.02], [-0.08, 0.04], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.01], [-0.07, 0.02], [-0.04, -0.0], [-0.06, 0.0], [-0.04, 0.0], [-0.08, 0.04], [-0.04, 0.0], [-0.03, 0.04], [-0.05, -0.01]], [[-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.01], [-0.04, 0.01], [-0.08, 0.05], [-0.05, -0.0], [-0.04, -0.0], [-0.05, -0.0], [-0.03, 0.03], [-0.04, 0.05], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.06, 0.01], [-0.07, 0.01], [-0.04, 0.0], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.06], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.04, 0.0], [-0.07, 0.01], [-0.04, 0.05], [-0.07, 0.01], [-0.03, 0.04], [-0.07, 0.02], [-0.03, 0.02], [-0.07, 0.03], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.04, 0.0], [-0.05, -0.02], [-0.05, -0.01], [-0.03, 0.03], [-0.04, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.0]], [[-0.05, -0.01], [-0.05, -0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.04, 0.04], [-0.06, 0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.04, -0.0], [-0.06, 0.0], [-0.04, 0.0], [-0.06, 0.0], [-0.06, 0.01], [-0.06, -0.0], [-0.08, 0.06], [-0.05, -0.0], [-0.01, 0.12], [-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.0], [-0.07, 0.03], [-0.04, 0.0], [-0.09, 0.06], [-0.05, -0.01], [-0.03, 0.02], [-0.06, 0.0], [-0.03, 0.03], [-0.03, 0.02], [-0.06, 0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.06, -0.0], [-0.07, 0.01], [-0.08, 0.03], [-0.05, -0.0], [-0.04, -0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.07, 0.01], [-0.06, -0.0], [-0.03, 0.09]], [[-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.06, 0.0], [-0.04, -0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.04, 0.04], [-0.07, 0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.06, 0.0], [-0.05, -0.01], [-0.06, -0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.04, 0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.03, 0.02], [-0.05, -0.0], [-0.04, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.04], [-0.04, -0.0], [-0.03, 0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.06, 0.01], [-0.03, 0.1], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.06, 0.01], [-0.07, 0.02]], [[-0.07, 0.01], [-0.04, 0.0], [-0.03, 0.04], [-0.08, 0.04], [-0.04, 0.05], [-0.05, -0.01], [-0.06, 0.01], [-0.06, 0.01], [-0.07, 0.01], [-0.04, 0.06], [-0.03, 0.04], [-0.06, 0.0], [-0.05, -0.01], [-0.08, 0.04], [-0.03, 0.01], [-0.07, 0.03], [-0.03, 0.04], [-0.05, -0.01], [-0.04, 0.01], [-0.07, 0.02], [-0.03, 0.09], [-0.04, -0.0], [-0.06, 0.0], [-0.04, 0.05], [-0.05, -0.02], [-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.06, 0.01], [-0.04, -0.0], [-0.08, 0.04], [-0.05, -0.01], [-0.07, 0.03], [-0.06, 0.01], [-0.07, 0.01], [-0.04, 0.05], [-0.07, 0.01], [-0.06, 0.01], [-0.06, -0.0], [-0.06, 0.0], [-0.03, 0.04], [-0.05, -0.02], [-0.03, 0.02], [-0.06, 0.01], [-0.06, 0.0], [-0.03, 0.03], [-0.07, 0.02], [-0.03, 0.02], [-0.06, 0.0], [-0.05, -0.01]], [[-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.04], [-0.04, -0.0], [-0.07, 0.03], [-0.06, 0.0], [-0.07, 0.01], [-0.06, 0.01], [-0.07, 0.03], [-0.05, -0.01], [-0.04, 0.05], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.03, 0.03], [-0.07, 0.02], [-0.06, 0.01], [-0.03, 0.02], [-0.06, 0.01], [-0.03, 0.02], [-0.04, 0.0], [-0.06, 0.0], [-0.03, 0.1], [-0.05, -0.0], [-0.05, -0.01], [-0.08, 0.05], [-0.06, 0.01], [-0.07, 0.03], [-0.03, 0.02], [-0.06, 0.0], [-0.04, 0.07], [-0.03, 0.03], [-0.07, 0.02], [-0.03, 0.04], [-0.05, -0.01], [-0.03, 0.04], [-0.03, 0.01], [-0.06, 0.0], [-0.06, 0.01], [-0.06, -0.0], [-0.04, 0.07], [-0.07, 0.01], [-0.04, 0.07], [-0.05, -0.01], [-0.07, 0.02]], [[-0.04, 0.07], [-0.03, 0.01], [-0.08, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.04, -0.0], [-0.04, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.07, 0.03], [-0.07, 0.02], [-0.07, 0.01], [-0.06, 0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.06, -0.0], [-0.07, 0.02], [-0.06, 0.01], [-0.05, -0.0], [-0.07, 0.02], [-0.06, 0.01], [-0.05, -0.01], [-0.04, 0.06], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.07], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.06, 0.01], [-0.07, 0.02], [-0.04, 0.0], [-0.03, 0.04], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.04, 0.01], [-0.06, 0.0]], [[-0.07, 0.02], [-0.04, -0.0], [-0.07, 0.03], [-0.06, 0.0], [-0.07, 0.02], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.07, 0.02], [-0.04, -0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.04, 0.07], [-0.04, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.03], [-0.07, 0.03], [-0.06, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.07], [-0.07, 0.03], [-0.04, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.0], [-0.05, -0.0], [-0.04, 0.0], [-0.07, 0.01], [-0.03, 0.03], [-0.05, -0.0], [-0.07, 0.02], [-0.03, 0.04], [-0.07, 0.02], [-0.03, 0.02], [-0.09, 0.07], [-0.07, 0.02], [-0.07, 0.01], [-0.04, 0.07], [-0.07, 0.02], [-0.09, 0.07], [-0.04, 0.0]], [[-0.05, -0.01], [-0.04, 0.06], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.07, 0.03], [-0.05, -0.0], [-0.04, 0.01], [-0.06, 0.01], [-0.03, 0.02], [-0.04, -0.0], [-0.03, 0.04], [-0.07, 0.01], [-0.07, 0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.04, 0.05], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.06], [-0.04, 0.07], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, -0.0], [-0.06, 0.0], [-0.03, 0.04], [-0.07, 0.02], [-0.04, -0.0], [-0.08, 0.04], [-0.07, 0.01], [-0.04, 0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.04, 0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.05, -0.0], [-0.08, 0.04], [-0.04, 0.08], [-0.07, 0.02]], [[-0.04, 0.07], [-0.07, 0.02], [-0.01, 0.12], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.04], [-0.06, 0.0], [-0.07, 0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.06, 0.0], [-0.07, 0.03], [-0.07, 0.01], [-0.05, -0.0], [-0.06, 0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.07, 0.03], [-0.05, -0.01], [-0.07, 0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.03, 0.03], [-0.06, 0.0], [-0.05, -0.01], [-0.06, -0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.08, 0.03], [-0.07, 0.02], [-0.03, 0.04], [-0.03, 0.02], [-0.03, 0.03], [-0.04, 0.06], [-0.07, 0.03], [-0.07, 0.03], [-0.07, 0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.06, -0.0], [-0.06, 0.01]], [[-0.05, -0.0], [-0.08, 0.03], [-0.04, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.02], [-0.07, 0.02], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.02], [-0.08, 0.04], [-0.04, -0.0], [-0.07, 0.03], [-0.03, 0.02], [-0.07, 0.01], [-0.07, 0.02], [-0.08, 0.04], [-0.08, 0.04], [-0.03, 0.04], [-0.04, 0.06], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.03, 0.02], [-0.07, 0.02], [-0.06, 0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.06, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.08, 0.03], [-0.07, 0.01], [-0.06, 0.0], [-0.03, 0.1], [-0.07, 0.02], [-0.04, 0.06], [-0.07, 0.02], [-0.04, 0.05], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.03]], [[-0.04, -0.0], [-0.06, 0.01], [-0.06, 0.0], [-0.08, 0.03], [-0.03, 0.02], [-0.05, -0.01], [-0.07, 0.01], [-0.07, 0.03], [-0.03, 0.02], [-0.05, -0.01], [-0.06, 0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.04, 0.05], [-0.06, -0.0], [-0.04, 0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.05], [-0.07, 0.02], [-0.05, -0.0], [-0.04, -0.0], [-0.07, 0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.04, 0.04], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.07, 0.02], [-0.07, 0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.01], [-0.07, 0.01], [-0.05, -0.0]], [[-0.03, 0.03], [-0.05, -0.01], [-0.08, 0.04], [-0.06, 0.0], [-0.06, 0.0], [-0.07, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.07], [-0.07, 0.03], [-0.06, 0.01], [-0.06, 0.0], [-0.04, 0.0], [-0.04, 0.08], [-0.03, 0.02], [-0.04, -0.0], [-0.06, -0.0], [-0.06, 0.0], [-0.03, 0.03], [-0.04, -0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.07, 0.02], [-0.06, 0.01], [-0.01, 0.12], [-0.04, 0.07], [-0.08, 0.05], [-0.07, 0.02], [-0.04, 0.09], [-0.03, 0.01], [-0.05, -0.0], [-0.06, 0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.08, 0.04], [-0.08, 0.04], [-0.05, -0.0], [-0.07, 0.01], [-0.04, 0.0], [-0.02, 0.11], [-0.05, -0.01], [-0.06, -0.0], [-0.05, -0.0], [-0.08, 0.03], [-0.06, 0.0], [-0.09, 0.07], [-0.04, 0.06], [-0.04, -0.0]], [[-0.07, 0.02], [-0.06, 0.01], [-0.06, 0.0], [-0.03, 0.02], [-0.1, 0.08], [-0.08, 0.04], [-0.07, 0.01], [-0.07, 0.01], [-0.08, 0.05], [-0.06, 0.01], [-0.04, 0.08], [-0.07, 0.03], [-0.07, 0.03], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.0], [-0.05, -0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.07, 0.01], [-0.03, 0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.02], [-0.04, 0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.04, 0.04], [-0.06, -0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.04, 0.0], [-0.07, 0.03], [-0.06, 0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.04, -0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.08, 0.05], [-0.06, 0.01], [-0.06, 0.0], [-0.03, 0.04], [-0.03, 0.02], [-0.05, -0.01], [-0.04, 0.01], [-0.04, 0.07], [-0.05, -0.0], [-0.05, -0.0]], [[-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.06, 0.01], [-0.04, 0.0], [-0.06, 0.01], [-0.08, 0.04], [-0.03, 0.04], [-0.08, 0.05], [-0.04, 0.0], [-0.08, 0.05], [-0.03, 0.04], [-0.07, 0.01], [-0.04, 0.08], [-0.05, -0.01], [-0.08, 0.04], [-0.06, 0.0], [-0.08, 0.05], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.01], [-0.05, -0.01], [-0.04, 0.08], [-0.04, -0.0], [-0.04, -0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.08], [-0.07, 0.02], [-0.03, 0.03], [-0.05, -0.0], [-0.08, 0.05], [-0.04, 0.05], [-0.05, -0.01], [-0.07, 0.01], [-0.08, 0.04], [-0.03, 0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.04, 0.04], [-0.04, 0.05], [-0.06, 0.0], [-0.05, -0.01]], [[-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.03], [-0.03, 0.09], [-0.06, -0.0], [-0.05, -0.0], [-0.04, 0.01], [-0.04, 0.0], [-0.07, 0.02], [-0.07, 0.02], [-0.06, -0.0], [-0.06, -0.0], [-0.04, 0.05], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.0], [-0.03, 0.02], [-0.06, 0.01], [-0.04, 0.0], [-0.04, 0.06], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.0], [-0.03, 0.02], [-0.04, 0.0], [-0.08, 0.06], [-0.05, -0.0], [-0.06, 0.01], [-0.08, 0.04], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.04, 0.06], [-0.07, 0.01], [-0.03, 0.02], [-0.03, 0.04]], [[-0.06, 0.0], [-0.06, 0.01], [-0.06, 0.01], [-0.03, 0.1], [-0.05, -0.01], [-0.04, 0.06], [-0.03, 0.03], [-0.05, -0.0], [-0.03, 0.03], [-0.08, 0.04], [-0.04, 0.0], [-0.07, 0.02], [-0.07, 0.03], [-0.06, 0.0], [-0.07, 0.01], [-0.07, 0.01], [-0.07, 0.02], [-0.03, 0.04], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.05], [-0.04, 0.01], [-0.03, 0.04], [-0.06, 0.01], [-0.04, 0.04], [-0.04, -0.0], [-0.07, 0.03], [-0.02, 0.11], [-0.05, -0.0], [-0.05, -0.01], [-0.04, 0.07], [-0.06, 0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.07, 0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.04], [-0.05, -0.01], [-0.04, 0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.05, -0.01], [-0.04, 0.01]], [[-0.07, 0.03], [-0.04, 0.09], [-0.04, 0.0], [-0.05, -0.01], [-0.08, 0.04], [-0.05, -0.01], [-0.05, -0.0], [-0.04, 0.04], [-0.07, 0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.02, 0.11], [-0.05, -0.01], [-0.04, 0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.04, 0.07], [-0.04, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.03, 0.03], [-0.06, 0.0], [-0.08, 0.05], [-0.07, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.06, -0.0], [-0.04, 0.0], [-0.09, 0.07], [-0.04, -0.0], [-0.04, 0.0], [-0.06, 0.0], [-0.07, 0.03], [-0.04, 0.08], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.08], [-0.05, -0.01], [-0.05, -0.0], [-0.03, 0.03], [-0.03, 0.02], [-0.04, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.06], [-0.06, 0.0], [-0.06, 0.0]], [[-0.04, -0.0], [-0.06, 0.01], [-0.08, 0.04], [-0.07, 0.02], [-0.06, 0.0], [-0.06, 0.01], [-0.06, 0.01], [-0.08, 0.04], [-0.08, 0.04], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.07, 0.01], [-0.03, 0.01], [-0.05, -0.0], [-0.07, 0.02], [-0.02, 0.11], [-0.08, 0.04], [-0.03, 0.02], [-0.05, -0.0], [-0.07, 0.01], [-0.04, -0.0], [-0.04, 0.01], [-0.06, 0.01], [-0.03, 0.02], [-0.05, -0.0], [-0.04, 0.0], [-0.05, -0.0], [-0.04, -0.0], [-0.03, 0.1], [-0.05, -0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.0], [-0.08, 0.03], [-0.05, -0.0], [-0.04, 0.06], [-0.06, 0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.08, 0.05], [-0.04, 0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.04, 0.01]], [[-0.05, -0.01], [-0.04, -0.0], [-0.07, 0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.1], [-0.05, -0.01], [-0.06, 0.01], [-0.02, 0.11], [-0.07, 0.02], [-0.04, 0.0], [-0.06, 0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.04, -0.0], [-0.07, 0.01], [-0.07, 0.02], [-0.07, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.03, 0.01], [-0.07, 0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.06, 0.01], [-0.03, 0.03], [-0.05, -0.02], [-0.04, -0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.08, 0.03], [-0.06, 0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.03, 0.03], [-0.03, 0.03], [-0.06, 0.0], [-0.07, 0.03], [-0.03, 0.1], [-0.04, 0.0], [-0.07, 0.02], [-0.05, -0.0], [-0.06, 0.0], [-0.03, 0.03], [-0.07, 0.02], [-0.04, 0.0], [-0.06, 0.0]], [[-0.03, 0.01], [-0.1, 0.09], [-0.04, 0.0], [-0.04, 0.07], [-0.04, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.03, 0.03], [-0.06, 0.01], [-0.03, 0.03], [-0.05, -0.0], [-0.05, -0.0], [-0.06, 0.01], [-0.04, 0.0], [-0.04, 0.08], [-0.08, 0.04], [-0.06, 0.0], [-0.03, 0.04], [-0.07, 0.01], [-0.07, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.01], [-0.06, 0.0], [-0.04, 0.08], [-0.05, -0.01], [-0.03, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.03, 0.04], [-0.05, -0.0], [-0.04, -0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.03], [-0.05, -0.01], [-0.03, 0.03], [-0.08, 0.05], [-0.07, 0.02], [-0.04, 0.08], [-0.03, 0.1], [-0.08, 0.06], [-0.04, 0.06]], [[-0.03, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.04], [-0.05, -0.01], [-0.05, -0.0], [-0.06, 0.01], [-0.04, -0.0], [-0.08, 0.05], [-0.04, 0.07], [-0.07, 0.03], [-0.05, -0.01], [-0.03, 0.04], [-0.07, 0.01], [-0.04, -0.0], [-0.06, -0.0], [-0.04, 0.07], [-0.04, 0.0], [-0.06, 0.0], [-0.04, -0.0], [-0.08, 0.04], [-0.04, -0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.05], [-0.04, 0.0], [-0.06, 0.01], [-0.03, 0.02], [-0.06, 0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.01], [-0.06, 0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.04, -0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.07, 0.02], [-0.06, -0.0]], [[-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.09, 0.06], [-0.06, 0.01], [-0.08, 0.05], [-0.07, 0.02], [-0.07, 0.02], [-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.08, 0.04], [-0.02, 0.11], [-0.05, -0.01], [-0.07, 0.01], [-0.06, -0.0], [-0.03, 0.01], [-0.06, 0.01], [-0.04, 0.06], [-0.04, 0.0], [-0.03, 0.02], [-0.06, 0.0], [-0.06, 0.01], [-0.04, 0.01], [-0.06, 0.0], [-0.04, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.05], [-0.04, 0.0], [-0.03, 0.1], [-0.05, -0.01], [-0.08, 0.04], [-0.07, 0.02], [-0.06, 0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.09, 0.06], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.0], [-0.04, 0.05], [-0.07, 0.02], [-0.07, 0.01], [-0.04, 0.0], [-0.05, -0.0]], [[-0.03, 0.01], [-0.04, -0.0], [-0.07, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.03, 0.09], [-0.06, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.04, 0.0], [-0.04, 0.08], [-0.05, -0.01], [-0.09, 0.06], [-0.03, 0.02], [-0.07, 0.02], [-0.05, -0.0], [-0.03, 0.02], [-0.06, 0.0], [-0.07, 0.02], [-0.06, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.07, 0.03], [-0.06, 0.0], [-0.06, 0.01], [-0.08, 0.05], [-0.06, 0.0], [-0.06, 0.0], [-0.04, 0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.04, 0.05], [-0.05, -0.01], [-0.06, 0.01], [-0.07, 0.02], [-0.04, 0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.05], [-0.03, 0.04], [-0.05, -0.01], [-0.04, 0.01]], [[-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.0], [-0.08, 0.04], [-0.04, 0.01], [-0.07, 0.03], [-0.05, -0.01], [-0.04, 0.0], [-0.03, 0.01], [-0.06, -0.0], [-0.04, 0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.04, 0.0], [-0.07, 0.02], [-0.07, 0.01], [-0.06, 0.0], [-0.06, 0.01], [-0.04, 0.06], [-0.08, 0.04], [-0.07, 0.01], [-0.07, 0.02], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.07], [-0.04, 0.05], [-0.08, 0.04], [-0.06, 0.0], [-0.06, -0.0], [-0.08, 0.05], [-0.03, 0.04], [-0.04, -0.0], [-0.07, 0.02], [-0.03, 0.04], [-0.04, 0.04], [-0.05, -0.01], [-0.04, 0.01], [-0.04, 0.05], [-0.03, 0.04], [-0.03, 0.04], [-0.01, 0.13], [-0.07, 0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01]], [[-0.06, 0.0], [-0.07, 0.01], [-0.07, 0.02], [-0.03, 0.02], [-0.03, 0.04], [-0.07, 0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.08, 0.03], [-0.06, 0.01], [-0.06, 0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.06, -0.0], [-0.03, 0.03], [-0.07, 0.01], [-0.04, 0.0], [-0.03, 0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.04, -0.0], [-0.07, 0.02], [-0.04, -0.0], [-0.07, 0.01], [-0.08, 0.04], [-0.07, 0.02], [-0.03, 0.04], [-0.08, 0.04], [-0.03, 0.02], [-0.05, -0.0], [-0.02, 0.11], [-0.06, 0.0], [-0.07, 0.02], [-0.02, 0.11], [-0.07, 0.02], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.07, 0.02], [-0.08, 0.03], [-0.03, 0.02], [-0.04, 0.07], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01]], [[-0.04, 0.0], [-0.07, 0.02], [-0.07, 0.01], [-0.04, 0.08], [-0.03, 0.1], [-0.05, -0.01], [-0.05, -0.0], [-0.02, 0.11], [-0.06, 0.0], [-0.07, 0.02], [-0.04, 0.01], [-0.08, 0.05], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.06, 0.0], [-0.03, 0.04], [-0.06, 0.01], [-0.07, 0.02], [-0.05, -0.0], [-0.04, 0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.08], [-0.04, 0.06], [-0.03, 0.02], [-0.04, -0.0], [-0.06, 0.01], [-0.03, 0.04], [-0.04, -0.0], [-0.06, 0.0], [-0.03, 0.04], [-0.03, 0.09], [-0.05, -0.0], [-0.07, 0.03], [-0.06, 0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.08, 0.04], [-0.06, 0.0]], [[-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.03], [-0.04, 0.08], [-0.06, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.03, 0.03], [-0.04, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.03, 0.03], [-0.03, 0.02], [-0.04, 0.08], [-0.06, 0.01], [0.0, 0.14], [-0.08, 0.05], [-0.04, 0.01], [-0.07, 0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.0], [-0.07, 0.03], [-0.05, -0.0], [-0.04, 0.05], [-0.04, 0.08], [-0.05, -0.01], [-0.05, -0.0], [-0.04, -0.0], [-0.04, 0.06], [-0.06, -0.0], [-0.05, -0.0], [-0.03, 0.04], [-0.03, 0.03], [-0.05, -0.0], [-0.04, 0.08], [-0.04, 0.05], [-0.03, 0.02], [-0.05, -0.01], [-0.04, 0.07], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.02], [-0.05, -0.0], [-0.07, 0.02], [-0.04, 0.09], [-0.07, 0.03], [-0.06, 0.01]], [[-0.04, 0.05], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.06, 0.01], [-0.04, -0.0], [-0.03, 0.02], [-0.04, 0.01], [-0.07, 0.03], [-0.04, -0.0], [-0.04, 0.08], [-0.03, 0.02], [-0.03, 0.02], [-0.06, 0.01], [-0.03, 0.02], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.04, 0.01], [-0.05, -0.01], [-0.03, 0.09], [-0.07, 0.02], [-0.08, 0.03], [-0.05, -0.0], [-0.08, 0.03], [-0.06, 0.0], [-0.03, 0.03], [-0.04, -0.0], [-0.07, 0.02], [-0.07, 0.01], [-0.05, -0.01], [-0.06, -0.0], [-0.07, 0.02], [-0.03, 0.02], [-0.06, 0.0], [-0.03, 0.01], [-0.04, -0.0], [-0.04, 0.05], [-0.05, -0.01], [-0.06, -0.0], [-0.05, -0.01], [-0.03, 0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.06, 0.0], [-0.04, 0.08]], [[-0.07, 0.02], [-0.06, 0.0], [-0.03, 0.04], [-0.03, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.08, 0.03], [-0.08, 0.05], [-0.07, 0.02], [-0.04, 0.06], [-0.07, 0.01], [-0.06, 0.01], [-0.04, -0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.07, 0.03], [-0.03, 0.03], [-0.04, -0.0], [-0.04, -0.0], [-0.08, 0.04], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.0], [-0.04, -0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.02], [-0.07, 0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.08, 0.04], [-0.05, -0.01], [-0.03, 0.03], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.04, -0.0], [-0.03, 0.03], [-0.07, 0.02], [-0.04, 0.05], [-0.05, -0.01]], [[-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.06, 0.0], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.04, -0.0], [-0.04, 0.05], [-0.05, -0.01], [-0.04, 0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.07, 0.01], [-0.07, 0.01], [-0.07, 0.01], [-0.07, 0.03], [-0.02, 0.11], [-0.04, 0.06], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.01], [-0.06, 0.0], [-0.08, 0.05], [-0.05, -0.01], [-0.03, 0.04], [-0.03, 0.03], [-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.06, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.04, 0.0], [-0.06, 0.0], [-0.06, 0.0]], [[-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.03], [-0.03, 0.03], [-0.07, 0.02], [-0.03, 0.03], [-0.04, 0.05], [-0.08, 0.04], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.08, 0.03], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.04, 0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.07, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.05], [-0.04, 0.07], [-0.06, 0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.04, 0.05], [-0.02, 0.11], [-0.03, 0.09], [-0.07, 0.02], [-0.09, 0.06], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.06, -0.0], [-0.03, 0.01], [-0.04, 0.05], [-0.03, 0.04], [-0.04, 0.0], [-0.04, 0.07], [-0.07, 0.01], [-0.07, 0.02], [-0.03, 0.09], [-0.03, 0.1], [-0.04, -0.0], [-0.07, 0.02], [-0.07, 0.02], [-0.04, 0.01]], [[-0.07, 0.02], [-0.07, 0.03], [-0.04, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.04, 0.01], [-0.03, 0.02], [-0.04, -0.0], [-0.07, 0.02], [-0.03, 0.03], [-0.06, 0.0], [-0.04, -0.0], [-0.04, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.03, 0.04], [-0.05, -0.0], [-0.04, -0.0], [-0.04, -0.0], [-0.03, 0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.03, 0.1], [-0.03, 0.03], [-0.06, 0.0], [-0.03, 0.03], [-0.06, -0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.07, 0.03], [-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.06, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.01], [-0.08, 0.03], [-0.03, 0.04], [-0.04, 0.0], [-0.06, 0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.04, -0.0]], [[-0.04, 0.05], [-0.04, -0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.04, -0.0], [-0.01, 0.12], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.07], [-0.06, 0.0], [-0.07, 0.02], [-0.04, -0.0], [-0.05, -0.0], [-0.07, 0.03], [-0.07, 0.01], [-0.08, 0.03], [-0.03, 0.02], [-0.05, -0.01], [-0.03, 0.04], [-0.07, 0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.06, -0.0], [-0.07, 0.02], [-0.06, 0.01], [-0.04, -0.0], [-0.03, 0.04], [-0.06, -0.0], [-0.03, 0.01], [-0.07, 0.01], [-0.07, 0.03], [-0.04, -0.0], [-0.07, 0.02], [-0.07, 0.01], [-0.05, -0.01], [-0.03, 0.09], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.0], [-0.03, 0.02], [-0.07, 0.02], [-0.04, 0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.04, -0.0], [-0.04, -0.0], [-0.07, 0.01], [-0.06, 0.0], [-0.04, 0.0], [-0.07, 0.02]], [[-0.03, 0.02], [-0.07, 0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.0], [-0.08, 0.04], [-0.04, 0.0], [-0.03, 0.03], [-0.03, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.06], [-0.06, -0.0], [-0.07, 0.02], [-0.05, -0.0], [-0.05, -0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.07, 0.02], [-0.0, 0.14], [-0.07, 0.02], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.0], [-0.03, 0.1], [-0.03, 0.04], [-0.03, 0.03], [-0.05, -0.0], [-0.03, 0.04], [-0.05, -0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.04, 0.0], [-0.03, 0.02], [-0.07, 0.01], [-0.04, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.08, 0.05], [-0.08, 0.04], [-0.05, -0.0]], [[-0.06, 0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.08, 0.04], [-0.03, 0.04], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.06], [-0.07, 0.01], [-0.05, -0.0], [-0.05, -0.0], [-0.04, 0.0], [-0.03, 0.04], [-0.04, -0.0], [-0.05, -0.01], [-0.03, 0.04], [-0.04, 0.08], [-0.05, -0.01], [-0.04, 0.0], [-0.03, 0.04], [-0.06, 0.0], [-0.04, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.04], [-0.04, 0.06], [-0.04, -0.0], [-0.04, 0.06], [-0.03, 0.01], [-0.0, 0.13], [-0.05, -0.0], [-0.03, 0.03], [-0.07, 0.02], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.07, 0.02], [-0.06, 0.01], [-0.04, -0.0], [-0.04, -0.0], [-0.04, 0.0], [-0.03, 0.02], [-0.07, 0.02], [-0.07, 0.02]], [[-0.06, 0.0], [-0.07, 0.02], [-0.07, 0.03], [-0.08, 0.04], [-0.02, 0.12], [-0.06, 0.0], [-0.06, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.04], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.03, 0.04], [-0.03, 0.03], [-0.03, 0.01], [-0.07, 0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.07, 0.02], [-0.07, 0.01], [-0.07, 0.03], [-0.06, 0.0], [-0.07, 0.03], [-0.06, 0.0], [-0.06, 0.0], [-0.03, 0.03], [-0.07, 0.02], [-0.08, 0.04], [-0.06, 0.0], [-0.06, -0.0], [-0.04, 0.0], [-0.04, 0.05], [-0.06, 0.01], [-0.07, 0.01], [-0.06, 0.0], [-0.03, 0.02], [-0.07, 0.01], [-0.08, 0.03], [-0.03, 0.03], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.07, 0.03], [-0.04, -0.0], [-0.06, 0.0], [-0.06, 0.01], [-0.06, 0.0], [-0.03, 0.03], [-0.05, -0.01]], [[-0.03, 0.03], [-0.04, 0.05], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.04, -0.0], [-0.06, 0.0], [-0.06, 0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.03, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.02], [-0.04, 0.08], [-0.05, -0.01], [-0.04, 0.01], [-0.06, 0.0], [-0.05, -0.02], [-0.05, -0.01], [-0.05, -0.0], [-0.03, 0.04], [-0.06, 0.0], [-0.04, 0.0], [-0.05, -0.0], [-0.03, 0.04], [-0.02, 0.11], [-0.04, 0.0], [-0.03, 0.03], [-0.07, 0.01], [-0.06, 0.0], [-0.03, 0.03], [-0.04, 0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.07, 0.01], [-0.09, 0.07], [-0.05, -0.01], [-0.07, 0.01], [-0.04, 0.08], [-0.05, -0.01], [-0.05, -0.02], [-0.05, -0.01], [-0.05, -0.01]], [[-0.06, 0.0], [-0.03, 0.1], [-0.07, 0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.04, 0.05], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.04, -0.0], [-0.05, -0.0], [-0.03, 0.04], [-0.07, 0.03], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.03, 0.04], [-0.06, 0.0], [-0.03, 0.04], [-0.04, 0.08], [-0.03, 0.04], [-0.05, -0.01], [-0.03, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.03], [-0.05, -0.01], [-0.04, 0.0], [-0.06, 0.01], [-0.07, 0.02], [-0.07, 0.01], [-0.04, 0.01], [-0.06, 0.01], [-0.03, 0.1], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.06, 0.01], [-0.04, -0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.08, 0.04], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01]], [[-0.07, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.03], [-0.03, 0.04], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.0], [-0.03, 0.02], [-0.04, -0.0], [-0.03, 0.02], [-0.06, 0.0], [-0.07, 0.02], [-0.03, 0.02], [-0.03, 0.04], [-0.06, 0.01], [-0.03, 0.03], [-0.06, 0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.06, 0.01], [-0.04, 0.06], [-0.04, 0.05], [-0.04, -0.0], [-0.06, 0.0], [-0.08, 0.03], [-0.04, 0.07], [-0.08, 0.03], [-0.07, 0.03], [-0.04, 0.06], [-0.05, -0.01], [-0.07, 0.02], [-0.08, 0.03], [-0.05, -0.01], [-0.07, 0.01], [-0.07, 0.01], [-0.08, 0.05], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.02], [-0.04, 0.0], [-0.08, 0.04], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.0], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0]], [[-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.02], [-0.06, 0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.03, 0.02], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.05, -0.01], [-0.04, 0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.06, 0.0], [-0.04, -0.0], [-0.04, 0.06], [-0.05, -0.0], [-0.03, 0.02], [-0.05, -0.0], [-0.03, 0.02], [-0.06, 0.01], [-0.06, 0.0], [-0.08, 0.03], [-0.06, 0.0], [-0.04, 0.0], [-0.04, -0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.07, 0.02], [-0.05, -0.0], [-0.04, 0.09], [-0.05, -0.01], [-0.03, 0.1], [-0.03, 0.02], [-0.03, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.1], [-0.02, 0.11], [-0.06, 0.0], [-0.07, 0.01], [-0.04, -0.0]], [[-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.06], [-0.03, 0.1], [-0.06, 0.01], [-0.03, 0.02], [-0.06, -0.0], [-0.07, 0.02], [-0.03, 0.02], [-0.06, 0.0], [-0.05, -0.0], [-0.04, 0.05], [-0.07, 0.02], [-0.03, 0.04], [-0.08, 0.04], [-0.07, 0.02], [-0.07, 0.02], [-0.06, 0.01], [-0.05, -0.0], [-0.04, 0.0], [-0.07, 0.01], [-0.07, 0.01], [-0.07, 0.02], [-0.08, 0.05], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.04], [-0.05, -0.01], [-0.06, 0.01], [-0.04, 0.06], [-0.06, 0.01], [-0.07, 0.02], [-0.04, -0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.07, 0.01], [-0.08, 0.05], [-0.06, 0.0], [-0.03, 0.04], [-0.06, -0.0], [-0.03, 0.02], [-0.07, 0.01], [-0.05, -0.0], [-0.04, -0.0], [-0.08, 0.04], [-0.06, 0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.04, 0.06]], [[-0.05, -0.0], [-0.07, 0.03], [-0.05, -0.0], [-0.07, 0.02], [-0.03, 0.02], [-0.07, 0.03], [-0.04, 0.05], [-0.06, 0.0], [-0.05, -0.0], [-0.06, 0.01], [-0.08, 0.03], [-0.07, 0.02], [-0.07, 0.01], [-0.07, 0.02], [-0.04, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.08], [-0.08, 0.05], [-0.05, -0.01], [-0.07, 0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.03, 0.04], [-0.05, -0.01], [-0.07, 0.03], [-0.04, 0.0], [-0.1, 0.08], [-0.03, 0.03], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.03], [-0.07, 0.02], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01]], [[-0.04, 0.04], [-0.04, -0.0], [-0.03, 0.02], [-0.03, 0.01], [-0.07, 0.01], [-0.07, 0.03], [-0.05, -0.01], [-0.03, 0.03], [-0.07, 0.01], [-0.06, 0.01], [-0.06, 0.01], [-0.03, 0.03], [-0.03, 0.03], [-0.06, 0.0], [-0.04, 0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.04, 0.09], [-0.05, -0.01], [-0.06, 0.0], [-0.08, 0.03], [-0.07, 0.01], [-0.06, 0.01], [-0.05, -0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.04, 0.08], [-0.04, 0.06], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.04], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.04], [-0.06, 0.0], [-0.04, -0.0], [-0.06, -0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.07, 0.02], [-0.07, 0.01]], [[-0.05, -0.0], [-0.07, 0.02], [-0.07, 0.02], [-0.06, 0.0], [-0.04, -0.0], [-0.03, 0.03], [-0.07, 0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.07, 0.01], [-0.06, 0.0], [-0.04, 0.0], [-0.07, 0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.05, -0.0], [-0.07, 0.01], [-0.06, 0.0], [-0.03, 0.03], [-0.06, 0.0], [-0.06, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.03, 0.03], [-0.02, 0.12], [-0.03, 0.03], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.01], [-0.04, -0.0], [-0.06, 0.01], [-0.07, 0.02], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.08, 0.03], [-0.04, 0.05], [-0.03, 0.02], [-0.05, -0.01], [-0.07, 0.03], [-0.04, -0.0]], [[-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.04, 0.01], [-0.07, 0.03], [-0.07, 0.01], [-0.04, 0.07], [-0.06, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.03], [-0.07, 0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.07, 0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.06, 0.01], [-0.05, -0.0], [-0.05, -0.02], [-0.05, -0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.02], [-0.07, 0.02], [-0.04, 0.0], [-0.05, -0.02], [-0.07, 0.01], [-0.03, 0.03], [-0.04, 0.05], [-0.06, 0.0], [-0.06, -0.0], [-0.07, 0.01], [-0.08, 0.03], [-0.03, 0.04], [-0.05, -0.01], [-0.04, 0.07], [-0.04, 0.04], [-0.05, -0.02], [-0.05, -0.01], [-0.05, -0.01]], [[-0.03, 0.03], [-0.04, 0.0], [-0.06, 0.01], [-0.04, 0.01], [-0.07, 0.02], [-0.03, 0.02], [-0.05, -0.01], [-0.04, -0.0], [-0.07, 0.02], [-0.05, -0.0], [-0.07, 0.02], [-0.03, 0.02], [-0.07, 0.02], [-0.04, -0.0], [-0.04, 0.08], [-0.05, -0.0], [-0.03, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.03], [-0.04, -0.0], [-0.05, -0.0], [-0.07, 0.02], [-0.03, 0.02], [-0.05, -0.01], [-0.03, 0.01], [-0.04, -0.0], [-0.04, 0.05], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.08], [-0.03, 0.04], [-0.03, 0.03], [-0.02, 0.12], [-0.07, 0.01], [-0.05, -0.01], [-0.06, -0.0], [-0.06, 0.01], [-0.05, -0.0], [-0.03, 0.02], [-0.03, 0.02], [-0.05, -0.01], [-0.04, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.01], [-0.07, 0.03], [-0.07, 0.02], [-0.03, 0.01], [-0.04, 0.0]], [[-0.05, -0.0], [-0.04, 0.04], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.05], [-0.07, 0.01], [-0.06, 0.01], [-0.06, 0.01], [-0.03, 0.04], [-0.07, 0.03], [-0.05, -0.01], [-0.08, 0.04], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.03, 0.1], [-0.06, 0.0], [-0.06, 0.0], [-0.07, 0.03], [-0.05, -0.02], [-0.06, -0.0], [-0.05, -0.0], [-0.09, 0.06], [-0.03, 0.02], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.03], [-0.08, 0.05], [-0.03, 0.03], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.09], [-0.04, 0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.06, 0.0], [-0.09, 0.06], [-0.06, 0.0], [-0.03, 0.03], [-0.06, 0.0], [-0.04, 0.07], [-0.07, 0.02]], [[-0.06, 0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.05, -0.0], [-0.03, 0.1], [-0.05, -0.01], [-0.06, 0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.08, 0.05], [-0.05, -0.0], [-0.05, -0.01], [-0.04, 0.08], [-0.07, 0.03], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.08, 0.05], [-0.03, 0.1], [-0.03, 0.02], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.06, 0.01], [-0.03, 0.09], [-0.08, 0.05], [-0.06, 0.0], [-0.07, 0.02], [-0.04, -0.0], [-0.04, 0.0], [-0.04, 0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.04, 0.0], [-0.05, -0.01]], [[-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.03], [-0.05, -0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.05], [-0.05, -0.0], [-0.07, 0.02], [-0.04, 0.07], [-0.06, 0.01], [-0.06, 0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.04], [-0.06, 0.01], [-0.07, 0.03], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.01], [-0.07, 0.02], [-0.03, 0.03], [-0.07, 0.01], [-0.06, 0.0], [-0.09, 0.06], [-0.06, 0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.07, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.04, -0.0]], [[-0.07, 0.02], [-0.05, -0.01], [-0.06, -0.0], [-0.03, 0.03], [-0.03, 0.04], [-0.07, 0.02], [-0.03, 0.03], [-0.03, 0.02], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.04], [-0.02, 0.11], [-0.04, -0.0], [-0.03, 0.04], [-0.07, 0.01], [-0.04, 0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.07, 0.02], [-0.03, 0.03], [-0.05, -0.01], [-0.04, 0.0], [-0.03, 0.03], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.03], [-0.04, 0.01], [-0.05, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.06, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.03], [-0.07, 0.01], [-0.06, 0.01], [-0.07, 0.02], [-0.04, 0.07], [-0.06, 0.0], [-0.03, 0.02], [-0.01, 0.13], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.02]], [[-0.07, 0.01], [-0.06, 0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.07, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.04], [-0.08, 0.03], [-0.03, 0.04], [-0.08, 0.04], [-0.05, -0.01], [-0.04, 0.01], [-0.06, -0.0], [-0.08, 0.04], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.06, -0.0], [-0.03, 0.03], [-0.06, 0.0], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.0], [-0.03, 0.03], [-0.04, -0.0], [-0.08, 0.05], [-0.04, -0.0], [-0.05, -0.0], [-0.08, 0.04], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.04, -0.0], [-0.07, 0.03], [-0.04, -0.0]], [[-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.01], [-0.04, 0.01], [-0.07, 0.01], [-0.09, 0.06], [-0.03, 0.04], [-0.07, 0.01], [-0.04, 0.05], [-0.06, 0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.08, 0.04], [-0.06, 0.01], [-0.04, -0.0], [-0.05, -0.02], [-0.08, 0.05], [-0.07, 0.02], [-0.05, -0.01], [-0.03, 0.04], [-0.07, 0.01], [-0.05, -0.0], [-0.03, 0.01], [-0.04, 0.01], [-0.03, 0.04], [-0.05, -0.02], [-0.03, 0.03], [-0.05, -0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.03], [-0.05, -0.0], [-0.04, 0.05], [-0.03, 0.03], [-0.04, -0.0], [-0.05, -0.0], [-0.03, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.04, 0.07], [-0.02, 0.11], [-0.05, -0.0], [-0.06, 0.01], [-0.03, 0.01], [-0.06, 0.01]], [[-0.07, 0.01], [-0.03, 0.02], [-0.03, 0.02], [-0.03, 0.02], [-0.03, 0.03], [-0.05, -0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.05], [-0.08, 0.05], [-0.06, 0.01], [-0.06, 0.0], [-0.04, 0.07], [-0.05, -0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.02], [-0.04, 0.05], [-0.03, 0.02], [-0.07, 0.02], [-0.06, 0.0], [-0.06, 0.01], [-0.05, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.03, 0.02], [-0.07, 0.01], [0.01, 0.15], [-0.03, 0.1], [-0.07, 0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.06, 0.01], [-0.04, -0.0], [-0.04, -0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.01]], [[-0.05, -0.01], [0.0, 0.14], [-0.03, 0.04], [-0.03, 0.02], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.04, -0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.04, 0.04], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.06], [-0.07, 0.02], [-0.04, 0.01], [-0.07, 0.01], [-0.08, 0.04], [-0.03, 0.03], [-0.08, 0.05], [-0.04, 0.01], [-0.03, 0.03], [-0.07, 0.01], [-0.03, 0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.08], [-0.06, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.04, 0.05], [-0.03, 0.02], [-0.01, 0.12], [-0.03, 0.03], [-0.05, -0.0], [-0.07, 0.01], [-0.06, 0.01], [-0.05, -0.0], [-0.05, -0.0], [-0.04, 0.06], [-0.03, 0.03], [-0.03, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01]], [[-0.07, 0.01], [-0.05, -0.01], [-0.04, 0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.07, 0.02], [-0.05, -0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.01], [-0.04, 0.0], [-0.03, 0.04], [-0.05, -0.0], [-0.04, 0.08], [-0.06, -0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.04, 0.08], [-0.07, 0.02], [-0.05, -0.0], [-0.03, 0.1], [-0.06, 0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.03, 0.03], [-0.06, 0.0], [-0.06, 0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.03, 0.03], [-0.03, 0.02], [-0.06, 0.0], [-0.06, 0.0], [-0.07, 0.01], [-0.06, 0.0], [-0.03, 0.04], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.04, 0.07], [-0.07, 0.03], [-0.04, 0.05], [-0.03, 0.03]], [[-0.07, 0.03], [-0.06, 0.0], [-0.03, 0.04], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.03, 0.02], [-0.08, 0.04], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.07, 0.02], [-0.07, 0.01], [-0.06, 0.0], [-0.03, 0.02], [-0.04, -0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.06, 0.0], [-0.03, 0.09], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.04, 0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.04, 0.0], [-0.07, 0.02], [-0.03, 0.04], [-0.06, 0.0], [-0.08, 0.04], [-0.04, -0.0], [-0.03, 0.04], [-0.07, 0.01], [-0.08, 0.05], [-0.05, -0.0], [-0.06, 0.0], [-0.03, 0.03], [-0.07, 0.01], [-0.08, 0.04], [-0.04, 0.01], [-0.07, 0.02], [-0.03, 0.02], [-0.07, 0.01], [-0.05, -0.01]], [[-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.07], [-0.05, -0.01], [-0.03, 0.04], [-0.05, -0.01], [-0.03, 0.02], [-0.07, 0.02], [-0.07, 0.03], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.04, 0.0], [-0.07, 0.01], [-0.08, 0.04], [-0.05, -0.0], [-0.07, 0.01], [-0.07, 0.01], [-0.03, 0.03], [-0.04, 0.05], [-0.07, 0.01], [-0.07, 0.02], [-0.06, -0.0], [-0.05, -0.01], [-0.04, 0.01], [-0.04, 0.07], [-0.04, 0.0], [-0.05, -0.0], [-0.04, 0.08], [-0.05, -0.01], [-0.03, 0.02], [-0.06, 0.0], [-0.04, 0.09], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.06, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.03], [-0.03, 0.02], [-0.07, 0.02], [-0.04, 0.05], [-0.04, 0.0], [-0.07, 0.02]], [[-0.05, -0.01], [-0.03, 0.04], [-0.04, 0.0], [-0.04, 0.06], [-0.03, 0.04], [-0.07, 0.02], [-0.05, -0.01], [-0.09, 0.07], [-0.06, 0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.04, 0.07], [-0.07, 0.02], [-0.04, -0.0], [-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.0], [-0.08, 0.03], [-0.07, 0.01], [-0.07, 0.02], [-0.04, 0.09], [-0.06, 0.0], [-0.06, 0.0], [-0.04, 0.0], [-0.04, 0.07], [-0.06, 0.0], [-0.05, -0.01], [-0.06, -0.0], [-0.07, 0.03], [-0.05, -0.01], [-0.04, -0.0], [-0.04, 0.0], [-0.06, 0.01], [-0.07, 0.01], [-0.04, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.0]], [[-0.04, 0.04], [-0.07, 0.02], [-0.05, -0.01], [-0.04, -0.0], [-0.04, 0.0], [-0.06, 0.0], [-0.06, 0.01], [-0.06, -0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.03, 0.01], [-0.04, -0.0], [-0.07, 0.03], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.0], [-0.08, 0.05], [-0.04, 0.0], [-0.06, 0.0], [-0.04, 0.08], [-0.04, 0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.0], [-0.04, 0.06], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.05], [-0.04, 0.07], [-0.06, 0.0], [-0.06, 0.0], [-0.1, 0.08], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.08], [-0.03, 0.02], [-0.05, -0.01], [-0.07, 0.01], [-0.03, 0.03], [-0.06, 0.01], [-0.07, 0.02], [-0.07, 0.01], [-0.06, 0.0], [-0.06, -0.0], [-0.03, 0.1], [-0.05, -0.01], [-0.04, -0.0], [-0.06, 0.01]], [[-0.04, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.01], [-0.08, 0.05], [-0.03, 0.01], [-0.07, 0.02], [-0.07, 0.01], [-0.07, 0.01], [-0.05, -0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.0], [-0.04, -0.0], [-0.04, -0.0], [-0.07, 0.03], [-0.07, 0.01], [-0.03, 0.03], [-0.08, 0.06], [-0.05, -0.0], [-0.04, 0.06], [-0.05, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.04, 0.01], [-0.07, 0.02], [-0.04, 0.08], [-0.04, 0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.03, 0.04], [-0.06, -0.0], [-0.07, 0.02], [-0.07, 0.01], [-0.04, 0.05], [-0.05, -0.0], [-0.03, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.03], [-0.07, 0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.0], [-0.04, 0.06], [-0.06, -0.0], [-0.03, 0.09], [-0.04, 0.05]], [[-0.03, 0.1], [-0.04, 0.08], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.04], [-0.07, 0.01], [-0.03, 0.01], [-0.05, -0.0], [-0.07, 0.02], [-0.04, 0.09], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.01], [-0.04, 0.07], [-0.06, 0.0], [-0.07, 0.03], [-0.03, 0.02], [-0.05, -0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.06, 0.01], [-0.04, -0.0], [-0.03, 0.03], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.03, 0.03], [-0.06, 0.01], [-0.09, 0.06], [-0.04, 0.07], [-0.04, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.06, 0.0], [-0.07, 0.01], [-0.09, 0.06], [-0.06, 0.0], [-0.06, 0.0], [-0.03, 0.02], [-0.05, -0.01]], [[-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.06, 0.0], [-0.04, 0.0], [-0.03, 0.03], [-0.07, 0.01], [-0.04, 0.06], [-0.06, 0.0], [-0.08, 0.03], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.06, 0.0], [-0.06, 0.01], [-0.07, 0.02], [-0.04, -0.0], [-0.06, 0.0], [-0.04, 0.06], [-0.06, 0.0], [-0.03, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.04], [-0.06, -0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.04, 0.05], [-0.08, 0.03], [-0.07, 0.02], [-0.04, -0.0], [-0.07, 0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.05, -0.02], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.0], [-0.04, -0.0], [-0.05, -0.0], [-0.04, 0.0], [-0.07, 0.02], [-0.05, -0.01]], [[-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.09], [-0.05, -0.01], [-0.08, 0.04], [-0.05, -0.01], [-0.03, 0.04], [-0.03, 0.04], [-0.06, 0.01], [-0.1, 0.08], [-0.07, 0.02], [-0.07, 0.01], [-0.04, 0.04], [-0.07, 0.02], [-0.04, 0.0], [-0.05, -0.01], [-0.08, 0.03], [-0.04, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.01], [-0.08, 0.04], [-0.05, -0.0], [-0.06, 0.0], [-0.06, 0.01], [-0.08, 0.04], [-0.04, 0.0], [-0.07, 0.02], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.03, 0.03], [-0.05, -0.01], [-0.04, -0.0], [-0.06, -0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.06, 0.0], [-0.07, 0.01], [-0.04, -0.0], [-0.07, 0.01], [-0.07, 0.02], [-0.04, -0.0], [-0.06, 0.0]], [[-0.04, 0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.06, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.03], [-0.06, 0.01], [-0.05, -0.0], [-0.07, 0.02], [-0.05, -0.0], [-0.07, 0.02], [-0.07, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.01], [-0.05, -0.01], [-0.04, 0.06], [-0.04, 0.0], [-0.07, 0.02], [-0.03, 0.03], [-0.02, 0.11], [-0.04, 0.0], [-0.06, 0.01], [-0.05, -0.0], [-0.07, 0.01], [-0.06, 0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.06, 0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.07, 0.01], [-0.05, -0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.04, 0.0], [-0.08, 0.04], [-0.05, -0.0], [-0.03, 0.1], [-0.05, -0.01]], [[-0.04, 0.0], [-0.04, 0.05], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.03], [-0.06, 0.0], [-0.05, -0.0], [-0.04, 0.0], [-0.06, 0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.03, 0.04], [-0.04, 0.06], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.03], [-0.03, 0.02], [-0.08, 0.04], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.04, 0.04], [-0.05, -0.01], [-0.08, 0.05], [-0.08, 0.04], [-0.05, -0.01], [-0.04, 0.01], [-0.08, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.05], [-0.07, 0.02], [-0.05, -0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.08, 0.05], [-0.04, 0.0], [0.01, 0.15], [-0.05, -0.01]], [[-0.06, 0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.08, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.07, 0.01], [-0.03, 0.1], [-0.04, 0.0], [-0.04, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.03, 0.03], [-0.04, 0.07], [-0.06, 0.01], [-0.03, 0.03], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.01], [-0.04, 0.07], [-0.06, 0.0], [-0.04, -0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.07, 0.03], [-0.04, 0.04], [-0.05, -0.0], [-0.04, 0.08], [-0.03, 0.02], [-0.06, -0.0], [-0.05, -0.02], [-0.06, 0.0], [-0.03, 0.02], [-0.06, 0.0], [-0.03, 0.03], [-0.07, 0.02], [-0.05, -0.0], [-0.02, 0.11], [-0.06, 0.01], [-0.06, 0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.06, -0.0], [-0.06, 0.0], [-0.06, 0.01], [-0.04, 0.0]], [[-0.07, 0.01], [-0.05, -0.01], [-0.04, 0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.08, 0.04], [-0.06, 0.0], [-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.03, 0.02], [-0.06, 0.0], [-0.06, 0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.04, 0.05], [-0.09, 0.06], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.07, 0.02], [-0.06, 0.01], [-0.07, 0.02], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.08, 0.04], [-0.03, 0.1], [-0.04, 0.0], [-0.07, 0.01], [-0.03, 0.03], [-0.05, -0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.07, 0.03], [-0.07, 0.02], [-0.06, 0.0]], [[-0.08, 0.04], [-0.05, -0.01], [-0.04, 0.05], [-0.08, 0.04], [-0.05, -0.01], [-0.04, 0.08], [-0.06, 0.0], [-0.04, 0.08], [-0.07, 0.03], [-0.06, 0.0], [-0.03, 0.04], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.06, -0.0], [-0.06, 0.01], [-0.07, 0.03], [-0.06, 0.01], [-0.03, 0.03], [-0.06, 0.0], [-0.04, 0.06], [-0.06, 0.0], [-0.07, 0.01], [-0.04, 0.07], [-0.07, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.07, 0.01], [-0.07, 0.01], [-0.07, 0.01], [-0.04, -0.0], [-0.07, 0.02], [-0.04, -0.0], [-0.07, 0.02], [-0.04, 0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.06, 0.0], [-0.04, 0.05], [-0.08, 0.05], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.03], [-0.05, -0.01]], [[-0.05, -0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.07, 0.03], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.1], [-0.06, 0.0], [-0.04, 0.0], [-0.04, -0.0], [-0.07, 0.03], [-0.04, 0.07], [-0.05, -0.01], [-0.04, 0.07], [-0.06, 0.0], [-0.04, 0.01], [-0.07, 0.03], [-0.07, 0.03], [-0.04, -0.0], [-0.06, 0.01], [-0.05, -0.0], [-0.08, 0.03], [-0.03, 0.03], [-0.07, 0.03], [-0.08, 0.04], [-0.06, 0.0], [-0.05, -0.0], [-0.04, 0.06], [-0.07, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.07, 0.02], [-0.03, 0.01], [-0.07, 0.02], [-0.05, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.03], [-0.06, -0.0], [-0.04, -0.0], [-0.07, 0.01], [-0.06, 0.01], [-0.04, 0.0], [-0.04, 0.0]], [[-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.07, 0.02], [-0.04, 0.07], [-0.04, 0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.04, 0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.02], [-0.03, 0.03], [-0.04, -0.0], [-0.03, 0.04], [-0.03, 0.03], [-0.04, -0.0], [-0.05, -0.0], [-0.04, 0.05], [-0.06, 0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.03, 0.02], [-0.07, 0.03], [-0.04, 0.07], [-0.06, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.08], [-0.06, 0.01], [-0.04, 0.06], [-0.04, 0.06], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.05], [-0.07, 0.02], [-0.05, -0.01]], [[-0.03, 0.02], [-0.08, 0.05], [-0.07, 0.01], [-0.05, -0.0], [-0.06, 0.01], [-0.04, 0.0], [-0.05, -0.02], [-0.06, 0.0], [-0.04, -0.0], [-0.03, 0.02], [-0.07, 0.02], [-0.09, 0.06], [-0.05, -0.01], [-0.06, -0.0], [-0.04, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.04], [-0.04, -0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.06, 0.0], [-0.03, 0.02], [-0.07, 0.02], [-0.08, 0.04], [-0.06, 0.0], [-0.07, 0.03], [-0.07, 0.02], [-0.03, 0.04], [-0.03, 0.04], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.03, 0.01], [-0.03, 0.02], [-0.04, 0.07], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.02], [-0.06, 0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.07, 0.01], [-0.07, 0.02], [-0.06, 0.01]], [[-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.0], [-0.04, 0.05], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.0], [-0.03, 0.04], [-0.04, 0.05], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.02], [-0.05, -0.01], [-0.07, 0.01], [-0.03, 0.03], [-0.06, 0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.06], [-0.04, 0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.08, 0.04], [-0.04, 0.08], [-0.07, 0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.08, 0.03], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.04, 0.08], [-0.03, 0.03], [-0.05, -0.01], [-0.07, 0.03], [-0.03, 0.03], [-0.05, -0.01], [-0.07, 0.02]], [[-0.04, 0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.06, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.05], [-0.03, 0.01], [-0.06, 0.01], [-0.03, 0.03], [-0.05, -0.0], [-0.07, 0.03], [-0.04, 0.06], [-0.05, -0.01], [-0.07, 0.01], [-0.07, 0.01], [-0.03, 0.03], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.01], [-0.04, 0.01], [-0.04, -0.0], [-0.05, -0.0], [-0.09, 0.06], [-0.03, 0.03], [-0.04, 0.0], [-0.06, 0.0], [-0.04, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.04, 0.0], [-0.04, 0.0], [-0.07, 0.02], [-0.07, 0.02], [-0.08, 0.04], [-0.03, 0.03], [-0.04, 0.01], [-0.06, 0.01], [-0.08, 0.04], [-0.05, -0.01], [-0.04, 0.06], [-0.05, -0.0]], [[-0.05, -0.01], [-0.06, 0.01], [-0.04, 0.0], [-0.07, 0.02], [-0.05, -0.0], [-0.04, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.07, 0.03], [-0.05, -0.01], [-0.04, 0.0], [-0.04, -0.0], [-0.04, 0.01], [-0.03, 0.09], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.03, 0.01], [-0.05, -0.0], [-0.04, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.05], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.04, -0.0], [-0.06, 0.0], [-0.01, 0.12], [-0.08, 0.04], [-0.03, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.09, 0.06], [-0.05, -0.01], [-0.04, -0.0], [-0.07, 0.01]], [[-0.05, -0.0], [-0.06, 0.0], [-0.07, 0.03], [-0.06, 0.0], [-0.02, 0.1], [-0.07, 0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.03], [-0.05, -0.01], [-0.03, 0.02], [-0.07, 0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.04, 0.07], [-0.05, -0.02], [-0.09, 0.07], [-0.07, 0.02], [-0.08, 0.05], [-0.03, 0.02], [-0.03, 0.1], [-0.03, 0.03], [-0.04, 0.07], [-0.03, 0.03], [-0.07, 0.02], [-0.02, 0.11], [-0.07, 0.01], [-0.03, 0.01], [-0.06, 0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.03], [-0.04, 0.06], [-0.03, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.04, -0.0], [-0.04, -0.0], [-0.04, 0.08], [-0.07, 0.03], [-0.05, -0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.03]], [[-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.1], [-0.04, 0.07], [-0.05, -0.01], [-0.07, 0.01], [-0.04, 0.08], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.08, 0.03], [-0.01, 0.12], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.06, -0.0], [-0.04, 0.04], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.04, -0.0], [-0.07, 0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.07, 0.01], [-0.06, 0.01], [-0.04, 0.07], [-0.05, -0.01], [-0.06, 0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.06, 0.01], [-0.07, 0.01], [-0.04, -0.0], [-0.07, 0.02], [-0.07, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.01]], [[-0.06, -0.0], [-0.04, -0.0], [-0.08, 0.04], [-0.06, 0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.04, 0.07], [-0.04, 0.05], [-0.03, 0.04], [-0.06, 0.0], [-0.01, 0.12], [-0.03, 0.04], [-0.08, 0.04], [-0.04, 0.05], [-0.06, 0.01], [-0.04, 0.07], [-0.04, -0.0], [-0.07, 0.02], [-0.07, 0.02], [-0.03, 0.1], [-0.05, -0.01], [-0.06, -0.0], [-0.03, 0.04], [-0.05, -0.01], [-0.04, 0.05], [-0.08, 0.05], [-0.04, 0.0], [-0.05, -0.0], [-0.07, 0.03], [-0.03, 0.04], [-0.07, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.06, -0.0], [-0.04, 0.01], [-0.06, -0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.04, -0.0], [-0.05, -0.0], [-0.03, 0.01], [-0.07, 0.02], [-0.04, 0.08], [-0.04, 0.0], [-0.07, 0.01], [-0.06, 0.01], [-0.07, 0.03], [-0.06, 0.01]], [[-0.07, 0.01], [-0.06, 0.0], [-0.03, 0.03], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.0], [-0.03, 0.09], [-0.06, 0.01], [-0.04, 0.06], [-0.05, -0.01], [-0.08, 0.04], [-0.06, 0.01], [-0.06, 0.01], [-0.04, -0.0], [-0.05, -0.0], [-0.03, 0.04], [-0.06, 0.01], [-0.05, -0.01], [-0.04, 0.06], [-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.07, 0.02], [-0.03, 0.02], [-0.05, -0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.07, 0.01], [-0.07, 0.01], [-0.04, -0.0], [-0.04, 0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.07, 0.03], [-0.05, -0.01], [-0.08, 0.04], [-0.07, 0.01], [-0.04, 0.07], [-0.05, -0.02], [-0.05, -0.01], [-0.06, -0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.04, 0.05], [-0.05, -0.01], [-0.05, -0.01]], [[-0.05, -0.0], [-0.07, 0.03], [-0.03, 0.09], [-0.08, 0.04], [-0.05, -0.0], [-0.05, -0.0], [-0.04, 0.01], [-0.04, 0.07], [-0.04, 0.07], [-0.05, -0.01], [-0.04, 0.06], [-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.03, 0.02], [-0.06, 0.0], [-0.07, 0.02], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.04, 0.0], [-0.03, 0.02], [-0.06, -0.0], [-0.03, 0.04], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.01], [-0.03, 0.03], [-0.06, 0.01], [-0.06, 0.0], [-0.06, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.0], [-0.07, 0.02], [-0.06, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.04, 0.0], [-0.07, 0.01], [-0.05, -0.0]], [[-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.1], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.02], [-0.03, 0.04], [-0.06, -0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.04], [-0.06, 0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.03, 0.04], [-0.02, 0.12], [-0.07, 0.03], [-0.06, 0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.04, 0.0], [-0.05, -0.0], [-0.05, -0.0], [-0.06, 0.01], [-0.04, 0.05], [-0.04, 0.08], [-0.05, -0.01], [-0.05, -0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.04, 0.0], [-0.03, 0.1], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.04], [-0.05, -0.0], [-0.06, -0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.03], [-0.05, -0.01]], [[-0.05, -0.01], [-0.05, -0.0], [-0.04, 0.0], [-0.09, 0.07], [-0.07, 0.02], [-0.04, 0.08], [-0.05, -0.0], [-0.03, 0.01], [-0.04, 0.04], [-0.03, 0.02], [-0.05, -0.0], [-0.06, 0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.06, 0.01], [-0.06, -0.0], [-0.07, 0.02], [-0.04, 0.06], [-0.06, 0.0], [-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.08, 0.04], [-0.01, 0.12], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.06], [-0.06, 0.01], [-0.04, 0.08], [-0.04, 0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.04, 0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.02, 0.12], [-0.07, 0.03], [-0.06, 0.01]], [[-0.03, 0.04], [-0.04, 0.05], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.07, 0.03], [-0.05, -0.01], [-0.06, 0.01], [-0.03, 0.01], [-0.03, 0.04], [-0.07, 0.02], [-0.06, 0.0], [-0.06, 0.0], [-0.04, 0.01], [-0.07, 0.01], [-0.04, 0.05], [-0.04, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.03], [-0.06, 0.0], [-0.04, 0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.07, 0.03], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.0], [-0.08, 0.04], [-0.05, -0.01], [-0.04, 0.0], [-0.04, 0.06], [-0.05, -0.0], [-0.04, 0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.04, -0.0], [-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.06, -0.0], [-0.06, 0.0], [-0.04, 0.04]], [[-0.03, 0.02], [-0.07, 0.03], [-0.07, 0.01], [-0.07, 0.02], [-0.06, 0.01], [-0.04, 0.07], [-0.05, -0.01], [-0.06, -0.0], [-0.06, 0.01], [-0.05, -0.0], [-0.03, 0.02], [-0.08, 0.03], [-0.08, 0.05], [-0.05, -0.02], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.09, 0.06], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.03, 0.09], [-0.03, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.08, 0.03], [-0.06, 0.0], [-0.07, 0.02], [-0.07, 0.02], [-0.07, 0.01], [-0.03, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.07, 0.01], [-0.07, 0.02], [-0.05, -0.0], [-0.05, -0.01]], [[-0.05, -0.01], [-0.04, 0.07], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.06, 0.0], [0.0, 0.14], [-0.05, -0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.04, 0.08], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.01], [-0.08, 0.06], [-0.06, 0.0], [-0.04, -0.0], [-0.04, -0.0], [-0.03, 0.04], [-0.06, 0.01], [-0.06, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.04, 0.07], [-0.05, -0.02], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.01], [-0.04, -0.0], [-0.03, 0.03], [-0.07, 0.02], [-0.06, -0.0], [-0.04, 0.07], [-0.04, -0.0], [-0.03, 0.03], [-0.07, 0.03]], [[-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.07, 0.01], [-0.07, 0.03], [-0.04, 0.09], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.01], [-0.08, 0.05], [-0.07, 0.02], [-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.1], [-0.04, 0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.01], [-0.04, -0.0], [-0.07, 0.01], [-0.06, -0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.0], [-0.07, 0.03], [-0.06, 0.0], [-0.07, 0.02], [-0.04, 0.0], [-0.06, 0.0], [-0.04, 0.07], [-0.05, -0.01], [-0.07, 0.03], [-0.06, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.02], [-0.05, -0.0], [-0.07, 0.02], [-0.04, -0.0], [-0.06, 0.01], [-0.06, 0.01], [-0.04, 0.0]], [[-0.08, 0.06], [-0.04, -0.0], [-0.07, 0.03], [-0.05, -0.01], [-0.08, 0.03], [-0.02, 0.11], [-0.04, 0.07], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.08, 0.05], [-0.07, 0.02], [-0.07, 0.02], [-0.04, 0.07], [-0.04, 0.06], [-0.05, -0.0], [-0.04, 0.05], [-0.04, -0.0], [-0.03, 0.04], [-0.05, -0.01], [-0.08, 0.03], [-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.02], [-0.03, 0.04], [-0.05, -0.0], [-0.03, 0.04], [-0.05, -0.01], [-0.04, 0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0]], [[-0.06, 0.0], [-0.06, 0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.07, 0.02], [-0.03, 0.03], [-0.04, -0.0], [-0.08, 0.04], [-0.12, 0.12], [-0.06, 0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.04, -0.0], [-0.04, 0.01], [-0.03, 0.04], [-0.04, 0.01], [-0.07, 0.02], [-0.06, 0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.02], [-0.06, 0.0], [-0.03, 0.02], [-0.07, 0.02], [-0.03, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.09, 0.06], [-0.06, 0.0], [-0.06, -0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.0], [-0.07, 0.02], [-0.05, -0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.08, 0.04], [-0.07, 0.02], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01]], [[-0.05, -0.01], [-0.04, 0.08], [-0.06, 0.0], [-0.06, 0.0], [-0.04, 0.07], [-0.07, 0.01], [-0.04, -0.0], [-0.06, 0.01], [-0.03, 0.03], [-0.04, 0.05], [-0.05, -0.01], [-0.08, 0.03], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.07, 0.02], [-0.04, -0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.03, 0.04], [-0.07, 0.01], [-0.05, -0.0], [-0.04, 0.05], [-0.06, 0.0], [-0.04, 0.06], [-0.07, 0.01], [-0.03, 0.04], [-0.03, 0.03], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.01], [-0.07, 0.03], [-0.08, 0.05], [-0.06, 0.0], [-0.05, -0.02], [-0.04, 0.0], [-0.05, -0.01], [-0.04, 0.05], [-0.05, -0.0], [-0.07, 0.02], [-0.08, 0.03], [-0.06, 0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.04, 0.0], [-0.06, 0.0]], [[-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.0], [-0.03, 0.02], [-0.04, -0.0], [-0.05, -0.0], [-0.06, 0.01], [-0.04, -0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.06, 0.01], [-0.08, 0.05], [-0.04, 0.06], [-0.07, 0.02], [-0.04, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.09, 0.07], [-0.03, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.1, 0.09], [-0.06, 0.01], [-0.04, 0.01], [-0.07, 0.01], [-0.08, 0.04], [-0.06, 0.0], [-0.07, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.08, 0.04], [-0.04, 0.07], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.01], [-0.04, 0.09], [-0.06, 0.0], [-0.03, 0.02], [-0.03, 0.04], [-0.04, -0.0], [-0.04, 0.05], [-0.04, 0.05], [-0.05, -0.01], [-0.04, 0.0]], [[-0.05, -0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.07, 0.02], [-0.07, 0.01], [-0.04, 0.05], [-0.04, 0.05], [-0.06, -0.0], [-0.04, 0.01], [-0.03, 0.04], [-0.03, 0.1], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.05], [-0.07, 0.01], [-0.04, 0.0], [-0.03, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.05], [-0.03, 0.02], [-0.05, -0.01], [-0.04, 0.0], [-0.08, 0.04], [-0.06, -0.0], [-0.03, 0.02], [-0.03, 0.04], [-0.04, 0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.04, 0.0], [-0.02, 0.11], [-0.0, 0.13], [-0.07, 0.02], [-0.05, -0.01], [-0.04, -0.0], [-0.06, 0.01], [-0.05, -0.0], [-0.01, 0.12], [-0.07, 0.02], [-0.03, 0.01], [-0.04, 0.07], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.01], [-0.04, -0.0]], [[-0.07, 0.02], [-0.07, 0.03], [-0.03, 0.03], [-0.06, 0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.03, 0.03], [-0.05, -0.0], [-0.05, -0.02], [-0.04, 0.07], [-0.06, 0.0], [-0.05, -0.0], [-0.03, 0.03], [-0.04, -0.0], [-0.05, -0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.0], [-0.03, 0.03], [-0.03, 0.03], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.04, -0.0], [-0.06, 0.01], [-0.06, 0.01], [-0.03, 0.03], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.03], [-0.07, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.04], [-0.03, 0.03], [-0.04, 0.01], [-0.06, -0.0], [-0.03, 0.1], [-0.03, 0.02], [-0.03, 0.01], [-0.05, -0.01], [-0.07, 0.03], [-0.05, -0.0]], [[-0.06, 0.0], [-0.07, 0.01], [-0.04, 0.05], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.08], [-0.04, 0.06], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.05], [-0.04, 0.01], [-0.05, -0.0], [-0.07, 0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.06, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.03, 0.02], [-0.06, 0.0], [-0.06, -0.0], [-0.05, -0.0], [-0.04, -0.0], [-0.07, 0.03], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.03, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.08], [-0.06, 0.0], [-0.04, -0.0], [-0.03, 0.04], [-0.06, -0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.0], [-0.07, 0.01]], [[-0.08, 0.04], [-0.05, -0.01], [-0.03, 0.1], [-0.06, 0.0], [-0.04, 0.07], [-0.04, 0.09], [-0.08, 0.04], [-0.07, 0.02], [-0.04, 0.08], [-0.05, -0.0], [-0.07, 0.02], [-0.04, -0.0], [-0.04, 0.0], [-0.05, -0.01], [-0.03, 0.04], [-0.08, 0.05], [-0.06, -0.0], [-0.03, 0.03], [-0.04, 0.06], [-0.07, 0.03], [-0.06, -0.0], [-0.08, 0.04], [-0.05, -0.01], [-0.03, 0.03], [-0.07, 0.02], [-0.05, -0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.06, -0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.05, -0.01], [-0.07, 0.01], [-0.03, 0.01], [-0.04, -0.0], [-0.06, 0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.02], [-0.06, 0.01], [-0.04, 0.08], [-0.05, -0.01], [-0.07, 0.03], [-0.06, -0.0], [-0.05, -0.01], [-0.04, 0.0]], [[-0.03, 0.04], [-0.09, 0.06], [-0.05, -0.01], [-0.07, 0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.07, 0.02], [-0.04, 0.0], [-0.04, -0.0], [-0.06, 0.0], [-0.04, 0.01], [-0.04, 0.07], [-0.03, 0.1], [-0.07, 0.02], [-0.03, 0.03], [-0.07, 0.02], [-0.05, -0.01], [-0.03, 0.1], [-0.07, 0.02], [-0.07, 0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.03], [-0.06, 0.01], [-0.05, -0.01], [-0.08, 0.04], [-0.03, 0.04], [-0.02, 0.11], [-0.05, -0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.0], [-0.06, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.0], [-0.06, 0.0], [-0.06, -0.0], [-0.07, 0.02], [-0.04, 0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.04, -0.0], [-0.03, 0.02], [-0.03, 0.1], [-0.03, 0.02], [-0.08, 0.04]], [[-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.03, 0.09], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.0], [-0.09, 0.07], [-0.03, 0.02], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.0], [-0.1, 0.09], [-0.04, 0.0], [-0.06, -0.0], [-0.04, 0.06], [-0.07, 0.02], [-0.07, 0.03], [-0.03, 0.03], [-0.07, 0.03], [-0.05, -0.01], [-0.06, -0.0], [-0.05, -0.0], [-0.07, 0.03], [-0.04, 0.08], [-0.03, 0.02], [-0.07, 0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.04, 0.06], [-0.08, 0.03], [-0.04, 0.0], [-0.06, 0.01], [-0.03, 0.04], [-0.06, 0.0], [-0.05, -0.0], [-0.04, 0.06], [-0.06, 0.0], [-0.07, 0.03], [-0.07, 0.01], [-0.03, 0.02], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.04, 0.05]], [[-0.05, -0.0], [-0.03, 0.03], [-0.05, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.08, 0.04], [-0.03, 0.02], [-0.06, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.04, 0.01], [-0.06, 0.01], [-0.03, 0.02], [-0.07, 0.01], [-0.04, 0.05], [-0.03, 0.1], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.07], [-0.05, -0.01], [-0.06, 0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.04, 0.06], [-0.07, 0.01], [-0.06, 0.0], [-0.06, 0.01], [-0.04, -0.0], [-0.03, 0.03], [-0.06, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.0], [-0.03, 0.04], [-0.03, 0.03], [-0.04, -0.0], [-0.05, -0.01], [-0.08, 0.04], [-0.04, 0.07], [-0.05, -0.0], [-0.07, 0.03], [-0.07, 0.03], [-0.03, 0.04], [-0.04, 0.01], [-0.04, 0.0], [-0.06, 0.0], [-0.03, 0.02], [-0.03, 0.03], [-0.04, -0.0]], [[-0.06, 0.0], [-0.07, 0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.04, 0.0], [-0.04, -0.0], [-0.07, 0.02], [-0.03, 0.02], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.03], [-0.05, -0.01], [-0.04, 0.08], [-0.05, -0.01], [-0.04, 0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.06, 0.01], [-0.08, 0.04], [-0.08, 0.05], [-0.07, 0.02], [-0.04, -0.0], [-0.04, 0.08], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.04, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.08, 0.03], [-0.03, 0.03], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.04], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.03, 0.1], [-0.05, -0.01], [-0.07, 0.01]], [[-0.04, 0.05], [-0.07, 0.02], [-0.03, 0.03], [-0.03, 0.03], [-0.07, 0.02], [-0.07, 0.02], [-0.06, 0.01], [-0.04, 0.0], [-0.07, 0.02], [-0.04, 0.08], [-0.05, -0.01], [-0.03, 0.04], [-0.05, -0.01], [-0.07, 0.01], [-0.04, -0.0], [-0.04, -0.0], [-0.07, 0.01], [-0.04, 0.05], [-0.07, 0.03], [-0.07, 0.01], [-0.06, -0.0], [-0.04, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.06, -0.0], [-0.04, 0.0], [-0.07, 0.01], [-0.04, -0.0], [-0.07, 0.01], [-0.03, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.04, 0.0], [-0.05, -0.01], [-0.04, 0.01], [-0.07, 0.02], [-0.04, 0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.02, 0.11], [-0.05, -0.01], [-0.04, 0.0]], [[-0.07, 0.01], [-0.06, 0.01], [-0.07, 0.02], [-0.07, 0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.04, 0.05], [-0.04, 0.01], [-0.04, 0.0], [-0.03, 0.1], [-0.04, 0.08], [-0.06, -0.0], [-0.04, 0.06], [-0.04, -0.0], [-0.03, 0.03], [-0.07, 0.01], [-0.04, 0.07], [-0.04, 0.0], [-0.03, 0.03], [-0.06, 0.0], [-0.06, 0.0], [-0.09, 0.06], [-0.07, 0.03], [-0.07, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.01], [-0.03, 0.03], [-0.05, -0.0], [-0.04, 0.0], [-0.03, 0.04], [-0.03, 0.03], [-0.03, 0.02], [-0.02, 0.11], [-0.03, 0.04], [-0.03, 0.04], [-0.07, 0.01], [-0.04, 0.0], [-0.03, 0.02], [-0.07, 0.02], [-0.05, -0.02], [-0.04, 0.05], [-0.07, 0.02], [-0.07, 0.01], [-0.08, 0.05]], [[-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.04], [-0.04, 0.05], [-0.05, -0.02], [-0.04, 0.08], [-0.04, 0.01], [-0.05, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.0], [-0.03, 0.03], [-0.07, 0.02], [-0.07, 0.03], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.07, 0.02], [-0.03, 0.04], [-0.06, 0.01], [-0.06, 0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.01], [-0.07, 0.01], [-0.01, 0.13], [-0.08, 0.05], [-0.03, 0.02], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.03, 0.03], [-0.05, -0.0], [-0.07, 0.03], [-0.07, 0.02], [-0.04, 0.07], [-0.03, 0.04], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.01]], [[-0.04, 0.0], [-0.06, 0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.06, 0.01], [-0.07, 0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.04, -0.0], [-0.06, 0.0], [-0.03, 0.03], [-0.08, 0.05], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.04], [-0.08, 0.04], [-0.04, -0.0], [-0.04, 0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.08, 0.03], [-0.04, -0.0], [-0.04, 0.07], [-0.04, 0.07], [-0.03, 0.09], [-0.03, 0.03], [-0.04, 0.05], [-0.03, 0.02], [-0.04, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.01], [-0.04, 0.05], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.0], [-0.08, 0.04], [-0.06, 0.0], [-0.03, 0.01], [-0.07, 0.02], [-0.03, 0.1], [-0.07, 0.01], [-0.06, -0.0], [-0.05, -0.01], [-0.06, -0.0], [-0.04, 0.08], [-0.07, 0.01]], [[-0.05, -0.01], [-0.04, 0.0], [-0.07, 0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.0], [-0.08, 0.03], [-0.03, 0.04], [-0.06, 0.0], [-0.08, 0.04], [-0.06, 0.0], [-0.04, 0.07], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.01], [-0.05, -0.02], [-0.06, 0.0], [-0.03, 0.02], [-0.07, 0.03], [-0.06, 0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.04, 0.0], [-0.05, -0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.02], [-0.07, 0.02], [-0.06, 0.01], [-0.07, 0.03], [-0.06, 0.01], [-0.07, 0.03], [-0.06, 0.01], [-0.04, 0.08], [-0.03, 0.03], [-0.03, 0.03], [-0.06, 0.0], [-0.07, 0.03], [-0.07, 0.02], [-0.07, 0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01]], [[-0.04, 0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.04, -0.0], [-0.07, 0.02], [-0.07, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.04, 0.05], [-0.04, 0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.04, 0.07], [-0.06, 0.0], [-0.07, 0.02], [-0.04, 0.01], [-0.05, -0.01], [-0.04, 0.07], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.08, 0.04], [-0.05, -0.0]], [[-0.08, 0.04], [-0.04, 0.0], [-0.06, -0.0], [-0.07, 0.02], [-0.04, 0.07], [-0.03, 0.03], [-0.06, 0.01], [-0.07, 0.01], [-0.03, 0.02], [-0.05, -0.0], [-0.05, -0.0], [-0.07, 0.03], [-0.03, 0.02], [-0.07, 0.01], [-0.04, 0.07], [-0.05, -0.01], [-0.08, 0.03], [-0.03, 0.02], [-0.08, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.04, 0.05], [-0.03, 0.04], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.0], [-0.07, 0.02], [-0.05, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.05], [-0.07, 0.02], [-0.05, -0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.04, 0.08], [-0.04, 0.09], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.06, 0.01], [-0.04, 0.08], [-0.05, -0.01]], [[-0.04, 0.08], [-0.03, 0.03], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.01], [-0.04, 0.08], [-0.07, 0.03], [-0.06, -0.0], [-0.05, -0.0], [-0.03, 0.04], [-0.03, 0.03], [-0.08, 0.04], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.05, -0.0], [-0.05, -0.0], [-0.04, 0.0], [-0.07, 0.02], [-0.06, -0.0], [-0.04, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.0], [-0.04, 0.01], [-0.05, -0.01], [-0.04, 0.06], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.02], [-0.06, 0.0], [-0.07, 0.02], [-0.01, 0.12], [-0.05, -0.01], [-0.08, 0.03], [-0.04, 0.07], [-0.04, 0.01], [-0.05, -0.0], [-0.05, -0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.03, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.08, 0.03], [-0.06, 0.0], [-0.04, 0.0], [-0.04, -0.0]], [[-0.04, 0.0], [-0.06, -0.0], [-0.06, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.07, 0.03], [-0.06, 0.01], [-0.06, 0.01], [-0.04, 0.01], [-0.04, -0.0], [-0.06, 0.01], [-0.03, 0.03], [-0.03, 0.04], [-0.05, -0.01], [-0.04, 0.0], [-0.08, 0.04], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.04, 0.05], [-0.03, 0.03], [-0.04, 0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.03, 0.02], [-0.04, 0.05], [-0.07, 0.02], [-0.03, 0.02], [-0.08, 0.06], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.0], [-0.08, 0.05], [-0.04, -0.0], [-0.06, 0.0], [-0.06, 0.01], [-0.08, 0.05]], [[-0.04, 0.07], [-0.05, -0.0], [-0.06, -0.0], [-0.07, 0.01], [-0.04, -0.0], [-0.04, 0.05], [-0.06, 0.01], [-0.05, -0.02], [-0.06, 0.01], [-0.04, -0.0], [-0.05, -0.0], [-0.03, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.07, 0.01], [-0.07, 0.01], [-0.03, 0.04], [-0.04, 0.05], [-0.06, 0.0], [-0.03, 0.02], [-0.03, 0.04], [-0.04, 0.07], [-0.05, -0.0], [-0.04, 0.06], [-0.01, 0.13], [-0.04, 0.01], [-0.03, 0.09], [-0.03, 0.03], [-0.04, 0.05], [-0.03, 0.02], [-0.03, 0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.07, 0.02], [-0.04, 0.0], [-0.05, -0.01], [-0.09, 0.07], [-0.05, -0.01], [-0.07, 0.03], [-0.04, 0.07], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.08], [-0.07, 0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.07, 0.02]], [[-0.04, 0.06], [-0.06, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.04, -0.0], [-0.03, 0.03], [-0.07, 0.01], [-0.07, 0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.05], [-0.08, 0.04], [-0.07, 0.02], [-0.04, -0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.03], [-0.04, 0.06], [-0.04, 0.09], [-0.05, -0.0], [-0.04, -0.0], [-0.06, 0.01], [-0.07, 0.01], [-0.06, 0.01], [-0.08, 0.03], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.07, 0.03], [-0.02, 0.11], [-0.03, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.06, 0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.08, 0.04], [-0.06, 0.0], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.02]], [[-0.03, 0.03], [-0.07, 0.02], [-0.05, -0.01], [-0.03, 0.04], [-0.04, 0.05], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.04], [-0.03, 0.04], [-0.04, 0.07], [-0.08, 0.03], [-0.07, 0.02], [-0.03, 0.01], [-0.05, -0.0], [-0.03, 0.1], [-0.07, 0.01], [-0.04, 0.0], [-0.08, 0.06], [-0.05, -0.0], [-0.08, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.03, 0.02], [-0.03, 0.03], [-0.04, 0.07], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.0], [-0.05, -0.0], [-0.06, 0.01], [-0.03, 0.02], [-0.03, 0.04], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.07], [-0.06, 0.0], [-0.07, 0.02], [-0.08, 0.04], [-0.03, 0.02], [-0.05, -0.01], [-0.04, 0.01], [-0.04, -0.0], [-0.07, 0.02], [-0.05, -0.01]], [[-0.08, 0.04], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.0], [-0.03, 0.03], [-0.08, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.05, -0.0], [-0.03, 0.02], [-0.06, 0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.03, 0.01], [-0.03, 0.02], [-0.04, 0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.0], [-0.06, 0.0], [-0.04, 0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.05], [-0.04, 0.05], [-0.07, 0.02], [-0.04, 0.01], [-0.07, 0.03], [-0.04, 0.0], [-0.04, 0.0], [-0.07, 0.03]], [[-0.04, 0.05], [-0.07, 0.01], [-0.07, 0.03], [-0.05, -0.0], [-0.07, 0.02], [-0.04, 0.01], [-0.04, 0.04], [-0.06, 0.0], [-0.04, -0.0], [-0.02, 0.11], [-0.04, 0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.04, -0.0], [-0.04, 0.08], [-0.07, 0.03], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.03], [-0.04, 0.05], [-0.06, 0.0], [-0.04, 0.0], [-0.04, -0.0], [-0.07, 0.02], [-0.08, 0.03], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.05], [-0.05, -0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.03, 0.02], [-0.06, 0.0], [-0.06, 0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.06, 0.0], [-0.07, 0.01], [-0.03, 0.02], [-0.06, -0.0], [-0.06, 0.0], [-0.04, -0.0], [-0.04, 0.07], [-0.06, 0.01], [-0.07, 0.01]], [[-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.0], [-0.05, -0.02], [-0.08, 0.05], [-0.06, 0.01], [-0.05, -0.0], [-0.03, 0.09], [-0.07, 0.02], [-0.05, -0.0], [-0.07, 0.02], [-0.07, 0.03], [-0.04, -0.0], [-0.07, 0.01], [-0.03, 0.02], [-0.07, 0.02], [-0.06, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.06], [-0.06, -0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.04, -0.0], [-0.08, 0.04], [-0.04, -0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.02], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.06, -0.0], [-0.08, 0.05], [-0.07, 0.02], [-0.07, 0.03], [-0.05, -0.01], [-0.03, 0.04], [-0.05, -0.01]], [[-0.04, 0.07], [-0.08, 0.03], [-0.04, -0.0], [-0.05, -0.01], [-0.03, 0.1], [-0.06, 0.0], [-0.04, 0.09], [-0.06, 0.0], [-0.03, 0.04], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.02], [-0.05, -0.01], [-0.04, 0.07], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.04, 0.0], [-0.07, 0.02], [-0.04, 0.0], [-0.04, 0.01], [-0.05, -0.0], [-0.04, 0.05], [-0.05, -0.01], [-0.06, 0.01], [-0.04, 0.06], [-0.07, 0.03], [-0.06, -0.0], [-0.07, 0.02], [-0.07, 0.01], [-0.06, 0.0], [-0.03, 0.02], [-0.04, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.01], [-0.04, 0.0], [-0.06, 0.01], [-0.08, 0.04], [-0.03, 0.02], [-0.06, -0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.02, 0.11], [-0.06, 0.01], [-0.04, 0.05], [-0.03, 0.04]], [[-0.04, 0.04], [-0.05, -0.0], [-0.08, 0.03], [-0.04, -0.0], [-0.04, 0.01], [-0.05, -0.0], [-0.05, -0.0], [-0.07, 0.02], [-0.07, 0.02], [-0.08, 0.04], [-0.01, 0.12], [-0.06, 0.01], [-0.03, 0.03], [-0.06, 0.01], [-0.06, 0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.04, 0.0], [-0.05, -0.0], [-0.04, -0.0], [-0.07, 0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.03, 0.03], [-0.04, -0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.03], [-0.06, 0.01], [-0.04, 0.07], [-0.07, 0.02], [-0.08, 0.05], [-0.08, 0.03], [-0.06, 0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.04, 0.01], [-0.03, 0.03], [-0.04, 0.06], [-0.04, 0.06]], [[-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.0], [-0.04, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.0], [-0.08, 0.03], [-0.06, 0.01], [-0.08, 0.03], [-0.05, -0.01], [-0.04, 0.01], [-0.07, 0.02], [-0.04, 0.05], [-0.05, -0.0], [-0.08, 0.04], [-0.07, 0.03], [-0.04, 0.07], [-0.07, 0.02], [-0.05, -0.01], [-0.03, 0.02], [-0.07, 0.02], [-0.04, 0.0], [-0.07, 0.02], [-0.03, 0.02], [-0.06, 0.01], [-0.08, 0.04], [-0.07, 0.01], [-0.07, 0.03], [-0.07, 0.03], [-0.07, 0.01], [-0.04, 0.01], [-0.04, 0.0], [-0.07, 0.02], [-0.07, 0.02], [-0.03, 0.03], [-0.03, 0.04], [-0.07, 0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.07, 0.03], [-0.03, 0.03], [-0.05, -0.01], [-0.04, -0.0], [-0.07, 0.02], [-0.06, -0.0], [-0.06, 0.0]], [[-0.05, -0.01], [-0.06, 0.0], [-0.08, 0.04], [-0.06, 0.01], [-0.03, 0.03], [-0.06, 0.0], [-0.04, -0.0], [-0.06, 0.01], [-0.07, 0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.04, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.07], [-0.07, 0.01], [-0.06, 0.0], [-0.03, 0.04], [-0.03, 0.02], [-0.03, 0.03], [-0.03, 0.02], [-0.05, -0.0], [-0.06, 0.0], [-0.04, -0.0], [-0.07, 0.01], [-0.03, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.06, -0.0], [-0.07, 0.02], [-0.03, 0.02], [-0.06, 0.01], [-0.07, 0.01], [-0.04, 0.0], [-0.04, 0.06], [-0.06, -0.0], [-0.07, 0.02], [-0.04, 0.01], [-0.03, 0.03], [-0.05, -0.02], [-0.06, 0.0], [-0.03, 0.02], [-0.04, 0.08], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.03, 0.04], [-0.07, 0.02]], [[-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.08], [-0.07, 0.02], [-0.05, -0.02], [-0.05, -0.0], [-0.08, 0.03], [-0.03, 0.03], [-0.08, 0.04], [-0.05, -0.0], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.04, 0.05], [-0.06, 0.0], [-0.07, 0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.06, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.01], [-0.07, 0.02], [-0.04, -0.0], [-0.06, 0.0], [-0.08, 0.04], [-0.05, -0.0], [-0.04, 0.0], [-0.04, 0.01], [-0.06, 0.01], [-0.05, -0.0], [-0.03, 0.1], [-0.07, 0.01], [-0.05, -0.0], [-0.07, 0.03], [-0.04, 0.0]], [[-0.04, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.08, 0.04], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.05], [-0.05, -0.01], [-0.09, 0.07], [-0.04, 0.07], [-0.03, 0.02], [-0.04, 0.0], [-0.09, 0.07], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.01], [-0.08, 0.04], [-0.04, 0.07], [-0.07, 0.02], [-0.06, 0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.04, -0.0], [-0.04, 0.05], [-0.04, -0.0], [-0.04, 0.08], [-0.05, -0.01], [-0.06, -0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.04, 0.01], [-0.06, 0.0], [-0.03, 0.02], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.09], [-0.04, -0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.03], [-0.07, 0.02], [-0.06, 0.0]], [[-0.04, -0.0], [-0.06, 0.0], [-0.04, 0.0], [-0.08, 0.04], [-0.07, 0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.05, -0.01], [-0.05, -0.0], [-0.04, 0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.06, 0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.08, 0.04], [-0.06, 0.0], [-0.04, 0.09], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.06, -0.0], [-0.03, 0.02], [-0.03, 0.02], [-0.03, 0.03], [-0.02, 0.11], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.01], [-0.05, -0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.06, -0.0], [-0.03, 0.03], [-0.07, 0.02]], [[-0.07, 0.02], [-0.03, 0.03], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.08, 0.03], [-0.07, 0.01], [-0.07, 0.02], [-0.03, 0.02], [-0.04, 0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.03, 0.02], [-0.04, 0.0], [-0.07, 0.01], [-0.08, 0.03], [-0.06, 0.0], [-0.03, 0.03], [-0.03, 0.02], [-0.04, 0.01], [-0.07, 0.03], [-0.06, 0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.02], [-0.07, 0.02], [-0.03, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.04], [-0.07, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.08, 0.05], [-0.05, -0.0], [-0.04, 0.07], [-0.06, 0.0], [-0.07, 0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.06, 0.01], [-0.05, -0.01]], [[-0.05, -0.01], [-0.03, 0.03], [-0.04, -0.0], [-0.06, 0.01], [-0.07, 0.03], [-0.04, 0.05], [-0.03, 0.03], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.03], [-0.02, 0.11], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.03, 0.03], [-0.04, 0.08], [-0.07, 0.02], [-0.03, 0.09], [-0.03, 0.02], [-0.03, 0.03], [-0.05, -0.0], [-0.03, 0.04], [-0.06, 0.0], [-0.04, 0.01], [-0.06, 0.01], [-0.03, 0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.03, 0.1], [-0.05, -0.0], [-0.05, -0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.04, 0.06], [-0.07, 0.02], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02]], [[-0.06, 0.0], [-0.04, 0.05], [-0.08, 0.04], [-0.06, 0.0], [-0.03, 0.03], [-0.07, 0.03], [-0.07, 0.03], [-0.06, 0.0], [-0.04, -0.0], [-0.05, -0.0], [-0.04, -0.0], [-0.08, 0.03], [-0.04, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.04, 0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.04], [-0.05, -0.0], [-0.03, 0.03], [-0.07, 0.02], [-0.03, 0.1], [-0.05, -0.01], [-0.03, 0.04], [-0.05, -0.01], [-0.03, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.04], [-0.05, -0.02], [-0.06, 0.0], [-0.04, 0.09], [-0.04, -0.0], [-0.04, 0.01], [-0.03, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.08, 0.03], [-0.03, 0.03], [-0.06, 0.01], [-0.03, 0.03]], [[-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.01], [-0.03, 0.04], [-0.06, 0.01], [-0.05, -0.0], [-0.04, 0.0], [-0.04, 0.0], [-0.04, -0.0], [-0.03, 0.02], [-0.04, 0.0], [-0.05, -0.0], [-0.07, 0.02], [-0.07, 0.02], [-0.04, 0.01], [-0.04, 0.09], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.01], [-0.04, 0.06], [-0.03, 0.03], [-0.03, 0.02], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.04, 0.01], [-0.05, -0.0], [-0.06, 0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.03, 0.1], [-0.06, 0.0], [-0.06, 0.0], [-0.07, 0.03], [-0.08, 0.05], [-0.07, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.02], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.03], [-0.07, 0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.04, 0.0]], [[-0.07, 0.01], [-0.04, -0.0], [-0.05, -0.0], [-0.08, 0.04], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.02], [-0.06, 0.01], [-0.07, 0.02], [-0.03, 0.02], [-0.05, -0.0], [-0.08, 0.04], [-0.06, 0.0], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.04, -0.0], [-0.04, -0.0], [-0.05, -0.0], [-0.05, -0.0], [-0.04, 0.0], [0.0, 0.14], [-0.04, 0.06], [-0.05, -0.0], [-0.09, 0.06], [-0.04, 0.07], [-0.06, 0.0], [-0.03, 0.03], [-0.04, -0.0], [-0.04, -0.0], [-0.06, 0.01], [-0.05, -0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.07, 0.02], [-0.04, 0.0], [-0.05, -0.0], [-0.09, 0.06], [-0.03, 0.03], [-0.03, 0.03], [-0.03, 0.02]], [[-0.03, 0.04], [-0.06, 0.0], [-0.08, 0.06], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.01], [-0.04, 0.01], [-0.05, -0.01], [-0.08, 0.03], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.06, -0.0], [-0.05, -0.01], [-0.04, 0.07], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.07], [-0.06, 0.01], [-0.03, 0.01], [-0.06, 0.0], [-0.03, 0.03], [-0.03, 0.02], [-0.07, 0.01], [-0.05, -0.0], [-0.05, -0.0], [-0.04, -0.0], [-0.05, -0.0], [-0.04, 0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.02], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.04, -0.0], [-0.07, 0.02], [-0.04, 0.0], [-0.05, -0.01], [-0.04, 0.07], [-0.06, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.0]], [[-0.03, 0.02], [-0.04, 0.05], [-0.06, 0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.08, 0.04], [-0.06, 0.01], [-0.04, -0.0], [-0.07, 0.03], [-0.04, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.04, -0.0], [-0.08, 0.04], [-0.04, 0.05], [-0.04, 0.08], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.06, 0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.06, -0.0], [-0.04, 0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.03], [-0.05, -0.01], [-0.11, 0.1], [-0.04, -0.0], [-0.03, 0.03], [-0.04, 0.0], [-0.07, 0.01], [-0.06, 0.01], [-0.04, -0.0], [-0.06, -0.0], [-0.04, 0.08], [-0.03, 0.04], [-0.03, 0.02], [-0.07, 0.02], [-0.07, 0.01], [-0.03, 0.04], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.04], [-0.06, 0.01]], [[-0.05, -0.01], [-0.04, 0.08], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.02], [-0.06, 0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.08, 0.05], [-0.05, -0.01], [-0.03, 0.1], [-0.08, 0.03], [-0.05, -0.0], [-0.04, 0.09], [-0.07, 0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.06, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.07, 0.02], [-0.04, 0.08], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.04, 0.06], [-0.08, 0.05], [-0.05, -0.01], [-0.04, 0.07], [-0.07, 0.03], [-0.06, 0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.05, -0.02], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.08, 0.06], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.09], [-0.06, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.08, 0.03], [-0.06, 0.01]], [[-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.02], [-0.04, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.08, 0.04], [-0.03, 0.04], [-0.06, 0.0], [-0.07, 0.02], [-0.07, 0.01], [-0.05, -0.01], [-0.04, 0.07], [-0.07, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.06, 0.0], [-0.05, -0.02], [-0.08, 0.05], [-0.03, 0.01], [-0.06, 0.0], [-0.08, 0.05], [-0.06, 0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.02], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.08, 0.05], [-0.07, 0.01], [-0.07, 0.01], [-0.09, 0.07], [-0.06, 0.0], [-0.04, 0.0], [-0.04, 0.07], [-0.05, -0.01], [-0.06, -0.0]], [[-0.04, -0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.0], [-0.06, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.08, 0.04], [-0.05, -0.0], [-0.03, 0.03], [-0.07, 0.02], [-0.04, 0.0], [-0.04, 0.01], [-0.07, 0.01], [-0.07, 0.02], [-0.08, 0.05], [-0.06, 0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.02], [-0.04, 0.0], [-0.07, 0.02], [-0.03, 0.03], [-0.07, 0.02], [-0.04, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.06, -0.0], [-0.04, 0.05], [-0.07, 0.01], [-0.05, -0.01], [-0.04, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.06, -0.0], [-0.07, 0.02], [-0.03, 0.04], [-0.04, -0.0], [-0.05, -0.01], [-0.04, 0.0]], [[-0.03, 0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.06, 0.0], [-0.04, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.04], [-0.04, 0.01], [-0.07, 0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.07, 0.02], [-0.04, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.04, 0.05], [-0.04, 0.06], [-0.06, 0.01], [-0.06, 0.0], [-0.04, 0.05], [-0.05, -0.0], [-0.06, 0.01], [-0.03, 0.09], [-0.03, 0.03], [-0.03, 0.1], [-0.05, -0.0], [-0.03, 0.04], [-0.06, 0.0], [-0.07, 0.03], [-0.09, 0.06], [-0.05, -0.01], [-0.08, 0.05], [-0.08, 0.04], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.07, 0.02], [-0.07, 0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.03], [-0.05, -0.01]], [[-0.04, 0.06], [-0.05, -0.01], [-0.06, 0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.02], [-0.05, -0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.04, 0.01], [-0.04, 0.0], [-0.06, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.03, 0.02], [-0.06, 0.01], [-0.07, 0.02], [-0.04, 0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.06, 0.01], [-0.03, 0.04], [-0.07, 0.01], [-0.06, -0.0], [-0.07, 0.01], [-0.07, 0.03], [-0.06, 0.0], [-0.07, 0.01], [-0.03, 0.02], [-0.05, -0.0], [-0.07, 0.02], [-0.04, 0.01], [-0.05, -0.01], [-0.04, 0.06], [-0.07, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.03], [-0.06, 0.01], [-0.05, -0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.02, 0.11], [-0.06, 0.0], [-0.04, 0.01], [-0.06, 0.0]], [[-0.07, 0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.03, 0.02], [-0.05, -0.01], [-0.04, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.06, -0.0], [-0.05, -0.0], [-0.03, 0.04], [-0.07, 0.02], [-0.04, 0.05], [-0.05, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.04, -0.0], [-0.04, -0.0], [-0.05, -0.0], [-0.03, 0.03], [-0.07, 0.02], [-0.07, 0.03], [-0.04, 0.05], [-0.05, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.05], [-0.04, 0.0], [-0.05, -0.0], [-0.01, 0.12], [-0.07, 0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.04, 0.08], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.09], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.0], [-0.04, -0.0], [-0.06, -0.0], [-0.05, -0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.07, 0.02]], [[-0.07, 0.02], [-0.04, -0.0], [-0.05, -0.0], [-0.06, 0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.1], [-0.06, 0.0], [-0.07, 0.02], [-0.07, 0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.08, 0.03], [-0.07, 0.02], [-0.03, 0.02], [-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.02, 0.11], [-0.08, 0.04], [-0.05, -0.0], [-0.04, 0.09], [-0.07, 0.02], [-0.03, 0.01], [-0.03, 0.02], [-0.06, 0.01], [-0.04, 0.01], [-0.05, -0.01], [-0.04, 0.06], [-0.04, 0.01], [-0.07, 0.02], [-0.04, -0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.06, -0.0], [-0.03, 0.02], [-0.08, 0.05], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.04], [-0.06, -0.0]], [[-0.04, 0.01], [-0.07, 0.02], [-0.04, 0.0], [-0.04, 0.08], [-0.07, 0.02], [-0.07, 0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.08, 0.04], [-0.04, 0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.03, 0.03], [-0.04, 0.07], [-0.07, 0.02], [-0.04, -0.0], [-0.05, -0.02], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.02], [-0.08, 0.05], [-0.06, 0.0], [-0.04, 0.07], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.03, 0.1], [-0.03, 0.02], [-0.03, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.06, 0.0], [-0.03, 0.02], [-0.05, -0.0], [-0.07, 0.01], [-0.06, 0.01], [-0.07, 0.01], [-0.06, 0.0], [-0.06, 0.01]], [[-0.04, 0.01], [-0.05, -0.01], [-0.04, 0.01], [-0.07, 0.01], [-0.07, 0.02], [-0.05, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.03], [-0.04, 0.07], [-0.06, 0.01], [-0.07, 0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.07, 0.01], [-0.03, 0.04], [-0.04, 0.06], [-0.03, 0.02], [-0.05, -0.01], [-0.06, 0.01], [-0.04, 0.0], [-0.05, -0.0], [-0.07, 0.02], [-0.03, 0.03], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.04, 0.01], [-0.03, 0.03], [-0.06, 0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.04, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.01], [-0.06, 0.0], [-0.04, 0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.06, 0.01]], [[-0.04, 0.01], [-0.05, -0.01], [-0.07, 0.03], [-0.06, 0.0], [-0.04, -0.0], [-0.08, 0.03], [-0.05, -0.0], [-0.04, 0.0], [-0.04, 0.0], [-0.05, -0.0], [-0.07, 0.02], [-0.06, 0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.04, -0.0], [-0.04, 0.0], [-0.06, 0.0], [-0.04, 0.06], [-0.03, 0.02], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.06], [-0.06, 0.01], [-0.04, 0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.06, -0.0], [-0.07, 0.03], [-0.06, 0.0], [-0.05, -0.0], [-0.04, -0.0], [-0.04, 0.0], [-0.05, -0.02], [-0.03, 0.03], [-0.05, -0.01], [-0.06, 0.0], [-0.08, 0.04], [-0.06, 0.0], [-0.07, 0.02], [-0.06, 0.0]], [[-0.05, -0.01], [-0.05, -0.0], [-0.03, 0.03], [-0.03, 0.03], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.08, 0.05], [-0.04, -0.0], [-0.04, 0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.02], [-0.03, 0.04], [-0.05, -0.01], [-0.05, -0.0], [-0.04, 0.05], [-0.06, 0.0], [-0.08, 0.05], [-0.05, -0.01], [-0.03, 0.02], [-0.07, 0.01], [-0.07, 0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.04, -0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.06, 0.01], [-0.06, 0.01], [-0.07, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.08, 0.04], [-0.05, -0.0], [-0.05, -0.0], [-0.04, 0.0], [-0.03, 0.04], [-0.04, -0.0], [-0.04, -0.0], [-0.05, -0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.01, 0.12]], [[-0.04, 0.08], [-0.04, 0.0], [-0.07, 0.02], [-0.05, -0.0], [-0.07, 0.01], [-0.07, 0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.03, 0.02], [-0.06, -0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.07, 0.01], [-0.08, 0.03], [-0.06, 0.01], [-0.08, 0.04], [-0.03, 0.01], [-0.03, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.03, 0.03], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.01], [-0.06, -0.0], [-0.05, -0.02], [-0.03, 0.04], [-0.05, -0.01], [-0.08, 0.03], [-0.04, 0.0], [-0.1, 0.09], [-0.06, 0.0], [-0.07, 0.02], [-0.04, 0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.07], [-0.07, 0.02], [-0.04, 0.06], [-0.07, 0.02], [-0.05, -0.0], [-0.04, 0.01], [-0.05, -0.0], [-0.05, -0.0], [-0.04, 0.0], [-0.06, 0.0]], [[-0.04, 0.01], [-0.06, 0.0], [-0.04, 0.09], [-0.05, -0.01], [-0.07, 0.01], [-0.06, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.02, 0.11], [-0.03, 0.03], [-0.04, 0.07], [-0.05, -0.0], [-0.07, 0.02], [-0.05, -0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.04, -0.0], [-0.04, -0.0], [-0.08, 0.04], [-0.08, 0.04], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.01], [-0.03, 0.09], [-0.05, -0.02], [-0.07, 0.02], [-0.04, -0.0], [-0.04, 0.09], [-0.05, -0.0], [-0.03, 0.03], [-0.04, 0.0], [-0.05, -0.01], [-0.08, 0.03], [-0.05, -0.01], [-0.04, 0.0], [-0.05, -0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.08, 0.05]], [[-0.06, 0.0], [-0.07, 0.02], [-0.06, 0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.04, -0.0], [-0.06, 0.0], [-0.07, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.04, -0.0], [-0.07, 0.03], [-0.05, -0.0], [-0.04, 0.07], [-0.07, 0.03], [-0.05, -0.01], [-0.07, 0.03], [-0.06, -0.0], [-0.08, 0.04], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.03], [-0.03, 0.04], [-0.07, 0.02], [-0.07, 0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.07, 0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.06, -0.0], [-0.07, 0.01], [-0.06, 0.01], [-0.08, 0.04], [-0.03, 0.03], [-0.04, 0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.04, 0.05], [-0.07, 0.03], [-0.07, 0.03], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.02]], [[-0.07, 0.02], [-0.07, 0.03], [-0.07, 0.01], [-0.07, 0.03], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.1], [-0.05, -0.01], [-0.04, 0.0], [-0.03, 0.04], [-0.05, -0.01], [-0.04, 0.04], [-0.05, -0.01], [-0.08, 0.05], [-0.03, 0.03], [-0.07, 0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.04, 0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.03, 0.09], [-0.03, 0.04], [-0.03, 0.04], [-0.06, 0.0], [-0.04, -0.0], [-0.07, 0.02], [-0.07, 0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.04, 0.0], [-0.06, 0.0], [-0.07, 0.01], [-0.08, 0.04], [-0.05, -0.01]], [[-0.04, 0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.07, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.03, 0.1], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.04, -0.0], [-0.07, 0.01], [-0.04, 0.05], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.07, 0.03], [-0.06, 0.0], [-0.05, -0.0], [-0.07, 0.01], [-0.06, -0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.04, 0.0], [-0.04, -0.0], [-0.04, -0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.06, 0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.03, 0.02], [-0.06, 0.0], [-0.05, -0.02], [-0.06, 0.0], [-0.06, -0.0], [-0.06, 0.0], [-0.04, -0.0], [-0.05, -0.0], [-0.08, 0.04], [-0.04, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01]], [[-0.07, 0.01], [-0.04, -0.0], [-0.03, 0.1], [-0.07, 0.02], [-0.04, 0.07], [-0.06, 0.01], [-0.07, 0.03], [-0.07, 0.02], [-0.03, 0.03], [-0.05, -0.01], [-0.06, 0.01], [-0.03, 0.02], [-0.03, 0.04], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.02], [-0.06, 0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.07, 0.02], [-0.03, 0.03], [-0.04, -0.0], [-0.07, 0.03], [-0.04, 0.0], [-0.06, 0.0], [-0.04, 0.09], [-0.06, 0.0], [-0.03, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.06, 0.01], [-0.06, -0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.06, -0.0], [-0.04, 0.06], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.04, -0.0], [-0.06, 0.01]], [[-0.05, -0.01], [-0.06, 0.01], [-0.04, 0.0], [-0.07, 0.02], [-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.06, 0.0], [-0.04, -0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.01], [-0.04, -0.0], [-0.04, -0.0], [-0.05, -0.0], [-0.07, 0.01], [-0.07, 0.03], [-0.03, 0.03], [-0.04, 0.06], [-0.05, -0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.08, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.06, 0.0], [-0.06, 0.01], [-0.05, -0.0], [-0.06, 0.01], [-0.03, 0.03], [-0.03, 0.03], [-0.05, -0.01], [-0.04, 0.05], [-0.04, -0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.06, -0.0]], [[-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.08, 0.04], [-0.06, 0.0], [-0.07, 0.02], [-0.04, 0.08], [-0.05, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.04, -0.0], [-0.07, 0.02], [-0.02, 0.1], [-0.04, 0.06], [-0.07, 0.02], [-0.04, -0.0], [-0.06, 0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.01], [-0.07, 0.02], [-0.03, 0.02], [-0.04, -0.0], [-0.03, 0.03], [-0.05, -0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.03, 0.09], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.03], [-0.06, 0.0], [-0.03, 0.01], [-0.03, 0.03], [-0.07, 0.01], [-0.07, 0.02], [-0.04, -0.0], [-0.03, 0.04], [-0.01, 0.12], [-0.05, -0.0], [-0.07, 0.01], [-0.04, -0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.0], [-0.07, 0.02]], [[-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.03], [-0.05, -0.01], [-0.03, 0.03], [-0.06, 0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.03, 0.02], [-0.07, 0.02], [-0.06, 0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.1], [-0.03, 0.09], [-0.05, -0.0], [-0.04, -0.0], [-0.03, 0.03], [-0.04, -0.0], [-0.06, 0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, -0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.07, 0.02], [-0.07, 0.01], [-0.05, -0.01], [-0.03, 0.09], [-0.06, 0.0], [-0.04, 0.08], [-0.05, -0.01], [-0.07, 0.02], [-0.06, -0.0], [-0.08, 0.03], [-0.04, -0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.08, 0.06], [-0.03, 0.03]], [[-0.03, 0.04], [-0.05, -0.01], [-0.07, 0.01], [-0.07, 0.02], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.04, 0.06], [-0.04, 0.01], [-0.06, -0.0], [-0.04, 0.0], [-0.04, 0.0], [-0.07, 0.03], [-0.04, 0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.03, 0.04], [-0.04, 0.0], [0.05, 0.19], [-0.07, 0.01], [-0.07, 0.02], [-0.04, 0.07], [-0.06, 0.01], [-0.05, -0.01], [-0.07, 0.03], [-0.07, 0.01], [-0.06, 0.0], [-0.03, 0.04], [-0.04, -0.0], [-0.04, 0.07], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.08, 0.03], [-0.07, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.06, -0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.09, 0.06], [-0.05, -0.0], [-0.07, 0.02], [-0.07, 0.02], [-0.04, 0.0], [-0.04, 0.0], [-0.06, 0.0], [-0.05, -0.0]], [[-0.06, 0.0], [-0.05, -0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.03], [-0.06, 0.0], [-0.07, 0.02], [-0.06, 0.01], [-0.04, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.08, 0.04], [-0.07, 0.03], [-0.03, 0.1], [-0.05, -0.01], [-0.03, 0.03], [-0.03, 0.1], [-0.06, 0.01], [-0.08, 0.04], [-0.04, 0.07], [-0.03, 0.02], [-0.04, 0.0], [-0.04, 0.05], [-0.05, -0.01], [-0.05, -0.02], [-0.08, 0.04], [-0.03, 0.04], [-0.06, 0.0], [-0.05, -0.01], [-0.08, 0.03], [-0.05, -0.0], [-0.04, -0.0], [-0.08, 0.04], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.06, 0.0], [-0.06, -0.0], [-0.04, 0.09], [-0.04, -0.0], [-0.07, 0.01], [-0.07, 0.01], [-0.08, 0.05], [-0.04, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0]], [[-0.04, 0.04], [-0.05, -0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.07, 0.02], [-0.04, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.1], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.07, 0.01], [-0.04, -0.0], [-0.09, 0.06], [-0.05, -0.0], [-0.04, 0.0], [-0.06, -0.0], [-0.05, -0.0], [-0.06, -0.0], [-0.03, 0.01], [-0.09, 0.07], [-0.07, 0.02], [-0.09, 0.06], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.05], [-0.03, 0.03], [-0.07, 0.03], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.04]], [[-0.03, 0.02], [-0.04, 0.01], [-0.04, 0.0], [-0.03, 0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.04, 0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.06, 0.01], [-0.09, 0.07], [-0.07, 0.02], [-0.06, -0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.04, 0.07], [-0.04, 0.08], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.04, 0.07], [-0.06, 0.0], [-0.09, 0.06], [-0.04, 0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.08, 0.03], [-0.08, 0.04], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.03], [-0.04, 0.05], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.02], [-0.04, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.01], [-0.04, -0.0], [-0.03, 0.04], [-0.07, 0.01], [-0.04, -0.0]], [[-0.03, 0.1], [-0.08, 0.04], [-0.03, 0.03], [-0.03, 0.03], [-0.03, 0.02], [-0.03, 0.03], [-0.06, 0.01], [-0.04, 0.04], [-0.06, 0.0], [-0.04, -0.0], [-0.03, 0.03], [-0.08, 0.04], [-0.01, 0.12], [-0.07, 0.02], [-0.06, 0.0], [-0.04, -0.0], [-0.04, 0.05], [-0.02, 0.11], [-0.01, 0.12], [-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.03], [-0.05, -0.01], [-0.05, -0.0], [-0.04, 0.0], [-0.05, -0.01], [-0.08, 0.05], [-0.07, 0.03], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.01], [-0.03, 0.09], [-0.02, 0.11], [-0.06, 0.0], [-0.08, 0.03], [-0.07, 0.02], [-0.08, 0.05], [-0.07, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.04, 0.08], [-0.07, 0.02], [-0.04, 0.0]], [[-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.04], [-0.06, 0.0], [-0.06, 0.0], [-0.04, 0.07], [-0.04, 0.06], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.04], [-0.04, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.03], [-0.04, 0.06], [-0.06, 0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.06], [-0.04, 0.0], [-0.03, 0.1], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.01], [-0.08, 0.04], [-0.07, 0.02], [-0.07, 0.02], [-0.04, -0.0], [-0.04, 0.08], [-0.06, 0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.06, -0.0], [-0.05, -0.02], [-0.06, -0.0], [-0.04, 0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.03], [-0.08, 0.04], [-0.04, 0.08], [-0.07, 0.02]], [[-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.03, 0.03], [-0.02, 0.11], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.07, 0.01], [-0.07, 0.02], [-0.03, 0.03], [-0.03, 0.04], [-0.06, 0.0], [-0.07, 0.03], [-0.06, 0.0], [-0.07, 0.01], [-0.07, 0.02], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.04, -0.0], [-0.05, -0.0], [-0.08, 0.04], [-0.04, 0.0], [-0.07, 0.03], [-0.06, 0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.03], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.06, -0.0], [-0.04, 0.06], [-0.09, 0.07], [-0.04, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.03], [-0.02, 0.11], [-0.06, 0.01], [-0.03, 0.03], [-0.04, 0.06], [-0.05, -0.01], [-0.08, 0.04]], [[-0.06, 0.0], [-0.04, 0.0], [-0.04, 0.01], [-0.07, 0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.03, 0.03], [-0.07, 0.02], [-0.06, 0.01], [-0.03, 0.02], [-0.05, -0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.09, 0.08], [-0.04, -0.0], [-0.08, 0.03], [-0.05, -0.01], [-0.06, -0.0], [-0.08, 0.04], [-0.04, 0.05], [-0.08, 0.04], [-0.05, -0.01], [-0.03, 0.04], [-0.06, 0.0], [-0.06, 0.01], [-0.07, 0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.04, -0.0], [-0.06, 0.01], [-0.04, -0.0], [-0.04, 0.07], [-0.04, -0.0], [-0.03, 0.03], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.08], [-0.08, 0.04], [-0.05, -0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.08], [-0.07, 0.02], [-0.07, 0.02], [-0.08, 0.05]], [[-0.05, -0.01], [-0.03, 0.1], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.08], [-0.06, 0.0], [-0.07, 0.03], [-0.04, 0.05], [-0.04, 0.0], [-0.03, 0.03], [-0.04, -0.0], [-0.04, 0.07], [-0.05, -0.01], [-0.08, 0.06], [-0.07, 0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.04, 0.01], [-0.04, 0.08], [-0.06, 0.0], [-0.06, -0.0], [-0.03, 0.02], [-0.06, 0.01], [-0.06, 0.01], [-0.06, -0.0], [-0.02, 0.11], [-0.07, 0.03], [-0.07, 0.01], [-0.06, 0.0], [0.01, 0.14], [-0.03, 0.03], [-0.07, 0.03], [-0.06, 0.01], [-0.07, 0.02], [-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.03], [-0.05, -0.01], [-0.04, 0.05], [-0.06, 0.0], [-0.07, 0.02], [-0.06, 0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.07, 0.02], [-0.02, 0.11]], [[-0.04, 0.0], [-0.05, -0.0], [-0.07, 0.03], [-0.03, 0.1], [-0.06, 0.01], [-0.06, -0.0], [-0.03, 0.03], [-0.04, 0.0], [-0.07, 0.01], [-0.04, -0.0], [-0.07, 0.02], [-0.05, -0.0], [-0.04, 0.0], [-0.06, 0.0], [-0.04, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.04, 0.08], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.05], [-0.09, 0.06], [-0.05, -0.01], [-0.07, 0.01], [-0.03, 0.04], [-0.01, 0.13], [-0.06, -0.0], [-0.03, 0.04], [-0.06, 0.0], [-0.05, -0.0], [-0.04, 0.0], [-0.06, 0.0], [-0.03, 0.04], [-0.07, 0.03], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.0], [-0.04, -0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.03, 0.04], [-0.04, -0.0]], [[-0.05, -0.01], [-0.03, 0.01], [-0.06, 0.0], [-0.04, 0.07], [-0.04, 0.06], [-0.04, 0.07], [-0.04, -0.0], [-0.07, 0.02], [-0.04, 0.07], [-0.05, -0.01], [-0.06, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.03, 0.04], [-0.05, -0.01], [-0.04, -0.0], [-0.04, 0.0], [-0.03, 0.04], [-0.06, 0.0], [-0.04, 0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.08, 0.04], [-0.07, 0.03], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.04, 0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.08, 0.06], [-0.05, -0.01], [-0.04, 0.0], [-0.05, -0.0], [-0.05, -0.0], [-0.07, 0.02], [-0.07, 0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.06, -0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.04, 0.06], [-0.06, -0.0]], [[-0.05, -0.01], [-0.05, -0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.04, -0.0], [-0.07, 0.02], [-0.03, 0.03], [-0.05, -0.01], [-0.06, -0.0], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.04, -0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.03], [-0.07, 0.02], [-0.05, -0.01], [-0.04, -0.0], [-0.04, 0.08], [-0.06, 0.0], [-0.03, 0.04], [-0.04, -0.0], [-0.05, -0.0], [-0.04, 0.07], [-0.05, -0.01], [-0.03, 0.04], [-0.04, -0.0], [-0.04, -0.0], [-0.07, 0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.02], [-0.06, 0.01], [-0.04, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.07, 0.01], [-0.03, 0.04], [-0.03, 0.04], [-0.06, 0.01], [-0.06, 0.01]], [[-0.08, 0.05], [-0.03, 0.02], [-0.05, -0.02], [-0.04, -0.0], [-0.04, 0.01], [-0.04, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.01], [-0.03, 0.02], [-0.07, 0.02], [-0.03, 0.03], [-0.08, 0.06], [-0.08, 0.05], [-0.03, 0.03], [-0.05, -0.01], [-0.06, 0.01], [-0.03, 0.01], [-0.07, 0.02], [-0.03, 0.1], [-0.05, -0.01], [-0.05, -0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.04, 0.0], [-0.06, 0.01], [-0.04, 0.07], [-0.07, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.03, 0.04], [-0.07, 0.02], [-0.05, -0.0], [-0.07, 0.02], [-0.03, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.03, 0.03], [-0.03, 0.03], [-0.03, 0.03], [-0.03, 0.02], [-0.04, -0.0], [-0.06, -0.0], [-0.05, -0.01], [-0.04, 0.06], [-0.07, 0.02], [-0.06, 0.0]], [[-0.07, 0.01], [-0.06, 0.0], [-0.04, 0.05], [-0.05, -0.01], [-0.06, 0.01], [-0.06, -0.0], [-0.07, 0.02], [-0.07, 0.02], [-0.06, -0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.07], [-0.04, 0.05], [-0.08, 0.05], [-0.08, 0.04], [-0.04, 0.05], [-0.01, 0.12], [-0.06, -0.0], [-0.04, 0.07], [-0.03, 0.04], [-0.03, 0.03], [-0.05, -0.01], [-0.04, -0.0], [-0.0, 0.14], [-0.04, 0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.01], [-0.06, 0.01], [-0.04, 0.0], [-0.06, 0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.01], [-0.07, 0.02], [-0.07, 0.01], [-0.08, 0.04], [-0.07, 0.01], [-0.04, 0.0], [-0.07, 0.02], [-0.06, 0.0]], [[-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.03], [-0.04, 0.01], [-0.03, 0.03], [-0.06, 0.0], [-0.07, 0.01], [-0.03, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.04, 0.05], [-0.08, 0.05], [-0.08, 0.05], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.07], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.08, 0.03], [-0.05, -0.01], [-0.09, 0.06], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.04, 0.07], [-0.07, 0.02], [-0.05, -0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.04, 0.05], [-0.04, 0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.03, 0.03], [-0.06, 0.01], [-0.06, 0.01], [-0.03, 0.03], [-0.04, 0.05], [-0.05, -0.0], [-0.07, 0.01]], [[-0.07, 0.02], [-0.05, -0.01], [-0.06, -0.0], [-0.07, 0.03], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.05, -0.0], [-0.04, 0.0], [-0.05, -0.01], [-0.08, 0.04], [-0.04, -0.0], [-0.04, -0.0], [-0.08, 0.06], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.07, 0.02], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.03], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.02, 0.11], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.03, 0.02], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.04, -0.0], [-0.08, 0.04], [-0.05, -0.01], [-0.08, 0.05], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.04, 0.05], [-0.05, -0.01], [-0.03, 0.02], [-0.06, 0.01], [-0.05, -0.0], [-0.07, 0.01]], [[-0.05, -0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.04, -0.0], [-0.05, -0.01], [-0.03, 0.04], [-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.06, 0.0], [-0.04, 0.0], [-0.07, 0.01], [-0.04, -0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.03, 0.04], [-0.06, 0.01], [-0.04, 0.08], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.06], [-0.04, -0.0], [-0.07, 0.02], [-0.03, 0.03], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.03, 0.03], [-0.06, 0.0], [-0.04, 0.05], [-0.07, 0.02], [-0.06, 0.01], [-0.03, 0.02], [-0.08, 0.04], [-0.06, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.03], [-0.05, -0.01], [-0.05, -0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.04, 0.05], [-0.04, 0.05], [-0.06, 0.01]], [[-0.07, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.03], [-0.05, -0.02], [-0.04, -0.0], [-0.04, 0.05], [-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.03, 0.02], [-0.05, -0.01], [-0.07, 0.01], [-0.04, -0.0], [-0.08, 0.04], [-0.08, 0.04], [-0.06, 0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.05], [-0.06, 0.0], [-0.07, 0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.04, 0.05], [-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.04, 0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.04, 0.06], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.0], [-0.07, 0.02], [-0.04, 0.06], [-0.09, 0.08], [-0.05, -0.01], [-0.04, -0.0], [-0.04, 0.01], [-0.03, 0.03]], [[-0.07, 0.03], [-0.04, -0.0], [-0.07, 0.03], [-0.07, 0.02], [-0.05, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.06, -0.0], [-0.08, 0.04], [-0.04, 0.0], [-0.06, 0.01], [-0.04, 0.05], [-0.05, -0.01], [-0.08, 0.05], [-0.01, 0.12], [-0.04, -0.0], [-0.05, -0.0], [-0.06, 0.01], [-0.09, 0.06], [-0.06, 0.01], [-0.05, -0.0], [-0.03, 0.02], [-0.04, 0.0], [-0.04, 0.06], [-0.06, -0.0], [-0.07, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.03, 0.03], [-0.07, 0.01], [-0.03, 0.04], [-0.05, -0.01], [-0.07, 0.01], [-0.03, 0.02], [-0.04, 0.01], [-0.05, -0.0], [-0.04, 0.0], [-0.03, 0.02], [-0.04, 0.06], [-0.08, 0.04], [-0.07, 0.01], [-0.04, -0.0], [-0.04, 0.0], [-0.06, 0.01], [-0.06, 0.0], [-0.04, 0.0]], [[-0.07, 0.01], [-0.04, -0.0], [-0.04, -0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.07, 0.02], [-0.06, -0.0], [-0.04, -0.0], [-0.07, 0.02], [-0.05, -0.0], [-0.04, 0.0], [-0.08, 0.05], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.04, -0.0], [-0.03, 0.02], [-0.07, 0.01], [-0.05, -0.0], [-0.06, -0.0], [-0.03, 0.02], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.04, 0.0], [-0.03, 0.04], [-0.03, 0.02], [-0.03, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.01], [-0.04, 0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.03], [-0.05, -0.01], [-0.06, 0.01], [-0.07, 0.03], [-0.04, 0.07], [-0.03, 0.1], [-0.08, 0.03], [-0.07, 0.02]], [[-0.08, 0.03], [-0.08, 0.04], [-0.05, -0.01], [-0.06, 0.0], [-0.04, -0.0], [-0.03, 0.09], [-0.03, 0.02], [-0.04, 0.05], [-0.04, -0.0], [-0.04, -0.0], [-0.03, 0.04], [-0.03, 0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.0], [-0.04, 0.01], [-0.07, 0.03], [-0.07, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.06, -0.0], [-0.06, -0.0], [-0.06, 0.0], [-0.06, -0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.04, 0.09], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.0], [-0.03, 0.02], [-0.06, 0.0], [-0.04, 0.06], [-0.04, 0.0], [-0.05, -0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.03], [-0.03, 0.02], [-0.08, 0.04], [-0.04, 0.0], [-0.04, -0.0], [-0.04, 0.0], [-0.03, 0.1]], [[-0.06, 0.01], [-0.06, 0.01], [-0.04, 0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.03, 0.04], [-0.04, 0.06], [-0.03, 0.03], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.0], [-0.08, 0.05], [-0.06, 0.0], [-0.06, -0.0], [-0.05, -0.0], [-0.03, 0.02], [-0.03, 0.03], [-0.04, 0.07], [-0.04, 0.0], [-0.06, 0.01], [-0.06, 0.01], [-0.03, 0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.03, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.08, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.03, 0.03], [-0.06, 0.0], [-0.03, 0.02], [-0.04, 0.07], [-0.03, 0.04], [-0.04, 0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.04, 0.06], [-0.03, 0.01], [-0.07, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.07], [-0.05, -0.01], [-0.04, 0.06], [-0.06, 0.0], [-0.05, -0.01]], [[-0.05, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.04], [-0.07, 0.03], [-0.05, -0.01], [-0.07, 0.01], [-0.08, 0.04], [-0.03, 0.1], [-0.08, 0.05], [-0.03, 0.03], [-0.07, 0.02], [-0.04, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.01], [-0.06, 0.0], [-0.07, 0.03], [-0.06, 0.0], [-0.04, 0.07], [-0.03, 0.01], [-0.04, 0.09], [-0.07, 0.03], [-0.03, 0.03], [-0.06, 0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.0], [-0.06, 0.01], [-0.06, 0.0], [-0.03, 0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.06, 0.01], [-0.04, 0.08], [-0.05, -0.0], [-0.06, 0.0], [-0.06, 0.01], [-0.08, 0.04], [-0.03, 0.03], [-0.03, 0.04], [-0.05, -0.01], [-0.03, 0.02], [-0.07, 0.01], [-0.03, 0.03], [-0.08, 0.05], [-0.05, -0.0], [-0.08, 0.05]], [[-0.05, -0.01], [-0.05, -0.0], [-0.06, 0.0], [-0.06, 0.01], [-0.02, 0.11], [-0.03, 0.02], [-0.08, 0.04], [-0.05, -0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.04, -0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.08], [-0.03, 0.04], [-0.07, 0.02], [-0.08, 0.04], [-0.05, -0.01], [-0.08, 0.03], [-0.04, 0.07], [-0.06, 0.01], [-0.05, -0.01], [-0.04, 0.07], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.07], [-0.05, -0.01], [-0.03, 0.03], [-0.04, 0.01], [-0.07, 0.02], [-0.07, 0.01], [-0.07, 0.02], [-0.04, 0.01], [-0.04, 0.08], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.0], [-0.08, 0.03], [-0.07, 0.01], [-0.05, -0.01], [-0.04, 0.08], [-0.04, 0.01], [-0.07, 0.02]], [[-0.07, 0.02], [-0.05, -0.0], [-0.08, 0.04], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.06, 0.0], [-0.08, 0.04], [-0.05, -0.01], [-0.05, -0.0], [-0.04, -0.0], [-0.07, 0.01], [-0.03, 0.01], [-0.07, 0.02], [-0.03, 0.01], [-0.07, 0.02], [-0.04, 0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.04], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.04, 0.05], [-0.07, 0.03], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.07, 0.01], [-0.03, 0.03], [-0.04, 0.0], [-0.05, -0.01], [-0.08, 0.05], [-0.08, 0.05], [-0.07, 0.03], [-0.03, 0.02], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.01], [-0.03, 0.03], [-0.07, 0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01]], [[-0.04, 0.05], [-0.03, 0.01], [-0.07, 0.03], [-0.06, -0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.03, 0.04], [-0.05, -0.01], [-0.04, 0.0], [-0.03, 0.02], [-0.03, 0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.04, 0.05], [-0.08, 0.04], [-0.03, 0.1], [-0.04, 0.01], [-0.06, 0.01], [-0.03, 0.1], [-0.08, 0.04], [-0.03, 0.03], [-0.04, 0.05], [-0.05, -0.01], [-0.05, -0.01], [-0.02, 0.11], [-0.07, 0.02], [-0.06, 0.0], [-0.04, 0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.04, 0.08], [-0.06, 0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.04], [-0.03, 0.02], [-0.07, 0.03], [-0.05, -0.0], [-0.02, 0.11], [-0.05, -0.0], [-0.04, 0.0], [-0.03, 0.03], [-0.05, -0.01]], [[-0.04, -0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.04, 0.06], [-0.03, 0.1], [-0.06, -0.0], [-0.04, 0.0], [-0.04, 0.07], [-0.03, 0.02], [-0.04, 0.07], [-0.05, -0.02], [-0.03, 0.09], [-0.06, 0.0], [-0.06, 0.0], [-0.06, 0.01], [-0.08, 0.05], [-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.04], [-0.06, 0.01], [-0.05, -0.01], [-0.02, 0.12], [-0.07, 0.03], [-0.05, -0.01], [-0.06, -0.0], [-0.04, -0.0], [-0.04, 0.06], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.04, -0.0], [-0.07, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.04, 0.06], [-0.06, 0.01], [-0.05, -0.02], [-0.04, -0.0], [-0.06, 0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.06, 0.01]], [[-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.07, 0.03], [-0.07, 0.02], [-0.07, 0.02], [-0.03, 0.04], [-0.07, 0.02], [-0.04, -0.0], [-0.03, 0.04], [-0.05, -0.01], [-0.06, 0.01], [-0.07, 0.01], [-0.04, 0.05], [-0.07, 0.03], [-0.08, 0.03], [-0.08, 0.04], [-0.06, 0.0], [-0.07, 0.03], [-0.04, -0.0], [-0.07, 0.01], [-0.05, -0.02], [-0.07, 0.01], [-0.06, 0.0], [-0.04, 0.05], [-0.04, 0.0], [-0.08, 0.03], [-0.05, -0.01], [-0.04, 0.06], [-0.07, 0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.0], [-0.05, -0.0], [-0.05, -0.0], [-0.06, 0.01], [-0.06, -0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.08, 0.04], [-0.06, 0.0], [-0.07, 0.01], [-0.03, 0.02], [-0.04, 0.05]], [[-0.05, -0.01], [-0.03, 0.03], [-0.04, 0.07], [-0.07, 0.03], [-0.04, -0.0], [-0.07, 0.03], [-0.03, 0.01], [-0.08, 0.04], [-0.05, -0.01], [-0.05, -0.0], [-0.03, 0.03], [-0.04, 0.0], [-0.06, 0.01], [-0.03, 0.02], [-0.07, 0.02], [-0.03, 0.02], [-0.07, 0.02], [-0.04, 0.07], [-0.08, 0.03], [-0.05, -0.0], [-0.03, 0.02], [-0.07, 0.02], [-0.04, 0.06], [-0.06, 0.0], [-0.07, 0.02], [-0.04, 0.01], [-0.03, 0.04], [-0.05, -0.01], [-0.04, 0.0], [-0.04, -0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.07, 0.02], [-0.03, 0.04], [-0.06, 0.0], [-0.08, 0.05], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.07, 0.02], [-0.04, -0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.04], [-0.06, 0.0], [-0.06, 0.01]], [[-0.05, -0.01], [-0.07, 0.01], [-0.04, 0.05], [-0.03, 0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.04, 0.07], [-0.04, -0.0], [-0.04, 0.0], [-0.04, 0.07], [-0.03, 0.04], [-0.08, 0.04], [-0.04, -0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.0], [-0.07, 0.01], [-0.06, -0.0], [-0.07, 0.01], [-0.03, 0.03], [-0.06, 0.01], [-0.08, 0.03], [-0.08, 0.05], [-0.05, -0.01], [-0.06, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.04], [-0.04, -0.0], [-0.03, 0.02], [-0.03, 0.01], [-0.06, 0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.06, 0.01], [-0.04, -0.0], [-0.04, 0.08], [-0.06, 0.0], [-0.08, 0.04], [-0.04, -0.0]], [[-0.07, 0.02], [-0.03, 0.03], [-0.03, 0.04], [-0.07, 0.02], [-0.03, 0.04], [-0.03, 0.01], [-0.06, 0.01], [-0.07, 0.03], [-0.03, 0.04], [-0.07, 0.02], [-0.06, 0.0], [-0.06, 0.01], [-0.05, -0.0], [-0.03, 0.04], [-0.03, 0.03], [-0.05, -0.01], [-0.07, 0.02], [-0.06, -0.0], [-0.07, 0.01], [-0.06, 0.0], [-0.07, 0.03], [-0.05, -0.01], [-0.04, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.03, 0.03], [-0.06, 0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.04, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.03, 0.03], [-0.04, 0.08], [-0.07, 0.02], [-0.08, 0.04], [-0.05, -0.01], [-0.03, 0.1], [-0.07, 0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.03], [-0.05, -0.01], [-0.09, 0.06]], [[-0.06, 0.0], [-0.06, 0.0], [-0.07, 0.01], [-0.04, -0.0], [-0.06, 0.01], [-0.05, -0.0], [-0.06, 0.0], [-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.01], [0.0, 0.14], [-0.03, 0.04], [-0.07, 0.01], [-0.03, 0.03], [-0.04, -0.0], [-0.03, 0.01], [-0.03, 0.04], [-0.03, 0.02], [-0.04, 0.0], [-0.09, 0.06], [-0.07, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.0], [-0.03, 0.09], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.03], [-0.05, -0.0], [-0.04, 0.0], [-0.07, 0.03], [-0.03, 0.03], [-0.03, 0.04], [-0.04, 0.0], [-0.07, 0.02], [-0.07, 0.02], [-0.02, 0.11], [-0.03, 0.04], [-0.03, 0.03], [-0.06, 0.0], [-0.04, 0.05], [-0.06, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01]], [[-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.02], [-0.05, -0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.03], [-0.04, 0.05], [-0.07, 0.01], [-0.06, 0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.04, -0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.04, 0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.04, 0.01], [-0.07, 0.02], [-0.07, 0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.09], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.04], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.03, 0.02], [-0.08, 0.04], [-0.06, 0.0], [-0.04, 0.0], [-0.05, -0.0], [-0.05, -0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.01, 0.12], [-0.04, -0.0], [-0.06, 0.01], [-0.06, 0.0], [-0.08, 0.05]], [[-0.04, -0.0], [-0.04, -0.0], [-0.03, 0.02], [-0.06, 0.0], [-0.06, 0.0], [-0.03, 0.02], [-0.07, 0.02], [-0.05, -0.0], [-0.03, 0.03], [-0.05, -0.0], [-0.08, 0.04], [-0.05, -0.01], [-0.04, -0.0], [-0.06, 0.01], [-0.07, 0.03], [-0.04, 0.05], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.0], [-0.06, 0.01], [-0.04, 0.05], [-0.07, 0.01], [-0.06, -0.0], [-0.08, 0.03], [-0.07, 0.02], [-0.05, -0.0], [-0.08, 0.03], [-0.04, 0.0], [-0.05, -0.0], [-0.04, 0.06], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.04], [-0.03, 0.04], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.01], [-0.08, 0.04], [-0.07, 0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.04, 0.0], [-0.06, 0.01], [-0.07, 0.03], [-0.06, -0.0], [-0.07, 0.02], [-0.07, 0.03]], [[-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.03, 0.02], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.04, 0.05], [-0.06, 0.0], [-0.05, -0.0], [-0.08, 0.04], [-0.02, 0.11], [-0.03, 0.03], [-0.06, 0.0], [-0.07, 0.01], [-0.04, -0.0], [-0.07, 0.02], [-0.05, -0.0], [-0.03, 0.03], [-0.03, 0.03], [-0.06, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.03], [-0.05, -0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.08, 0.04], [-0.06, 0.0], [-0.06, 0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.06], [-0.05, -0.01], [-0.08, 0.05], [-0.06, 0.0], [-0.07, 0.03], [-0.03, 0.03], [-0.05, -0.01], [-0.01, 0.13], [-0.05, -0.02], [-0.06, 0.0]], [[-0.06, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.03, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.08, 0.04], [-0.03, 0.02], [-0.06, 0.0], [-0.07, 0.02], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.04, 0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.04, -0.0], [-0.04, -0.0], [-0.06, 0.0], [-0.04, 0.0], [-0.07, 0.02], [-0.04, 0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.04, 0.08], [-0.04, 0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.08, 0.03], [-0.07, 0.02], [-0.07, 0.03], [-0.07, 0.02], [-0.03, 0.02], [-0.07, 0.02], [-0.07, 0.02], [-0.08, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.06, 0.0], [-0.03, 0.02], [-0.06, 0.01], [-0.04, -0.0]], [[-0.07, 0.03], [-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.09, 0.06], [-0.06, 0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.05, -0.01], [-0.07, 0.03], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.01], [-0.04, 0.0], [-0.08, 0.05], [-0.06, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.06, 0.0], [-0.03, 0.1], [-0.04, -0.0], [-0.09, 0.06], [-0.06, 0.0], [-0.07, 0.03], [-0.07, 0.03], [-0.04, 0.0], [-0.03, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.04, -0.0]], [[-0.05, -0.01], [-0.08, 0.03], [-0.03, 0.04], [-0.04, 0.01], [-0.04, 0.08], [-0.06, 0.0], [-0.04, -0.0], [-0.07, 0.02], [-0.07, 0.01], [-0.01, 0.12], [-0.05, -0.01], [-0.03, 0.04], [-0.07, 0.02], [-0.09, 0.07], [-0.07, 0.02], [-0.03, 0.02], [-0.06, 0.0], [-0.03, 0.04], [-0.05, -0.01], [-0.04, -0.0], [-0.08, 0.04], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.08, 0.03], [-0.05, -0.01], [-0.06, 0.01], [-0.06, 0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.04, -0.0], [-0.06, 0.0], [-0.03, 0.03], [-0.07, 0.02], [-0.04, 0.0], [-0.05, -0.0], [-0.04, -0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.03, 0.04], [-0.05, -0.0], [-0.06, 0.01], [-0.08, 0.03], [-0.04, -0.0], [-0.07, 0.01], [-0.06, 0.0], [-0.07, 0.03], [-0.06, 0.0]], [[-0.07, 0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.06, 0.0], [-0.07, 0.03], [-0.08, 0.04], [-0.05, -0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.04, 0.01], [-0.03, 0.02], [-0.06, 0.0], [-0.08, 0.05], [-0.03, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.03, 0.02], [-0.07, 0.03], [-0.04, 0.05], [-0.04, -0.0], [-0.04, 0.05], [-0.03, 0.03], [-0.07, 0.01], [-0.07, 0.02], [-0.07, 0.01], [-0.07, 0.03], [-0.07, 0.03], [-0.04, 0.0], [-0.07, 0.01], [-0.04, -0.0], [-0.04, 0.05], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.02], [-0.05, -0.01], [-0.04, 0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.06, 0.0], [-0.07, 0.03], [-0.04, 0.0], [-0.04, 0.01], [-0.05, -0.0], [-0.04, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.01]], [[-0.06, 0.0], [-0.08, 0.04], [-0.07, 0.03], [-0.07, 0.02], [-0.06, 0.01], [-0.07, 0.03], [-0.03, 0.02], [-0.07, 0.02], [-0.06, 0.0], [-0.04, 0.0], [-0.07, 0.03], [-0.08, 0.03], [-0.03, 0.04], [-0.05, -0.01], [-0.04, 0.01], [-0.03, 0.02], [-0.07, 0.02], [-0.05, -0.0], [-0.07, 0.01], [-0.07, 0.02], [-0.09, 0.06], [-0.05, -0.0], [-0.05, -0.0], [-0.08, 0.04], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.04, -0.0], [-0.07, 0.02], [-0.03, 0.04], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.06, 0.01], [-0.04, 0.0], [-0.04, 0.0], [-0.07, 0.02], [-0.03, 0.03], [-0.03, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.03, 0.02], [-0.03, 0.04], [-0.07, 0.01], [-0.09, 0.06], [-0.05, -0.0]], [[-0.07, 0.02], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, -0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.03, 0.04], [-0.05, -0.0], [-0.08, 0.04], [-0.03, 0.1], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.08, 0.05], [-0.03, 0.03], [-0.07, 0.01], [-0.03, 0.03], [-0.03, 0.04], [-0.08, 0.04], [-0.03, 0.04], [-0.04, 0.06], [-0.07, 0.02], [-0.06, 0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.04, 0.08], [-0.05, -0.02], [-0.04, -0.0], [-0.04, 0.0], [-0.06, 0.01], [-0.07, 0.02], [-0.04, -0.0], [-0.04, -0.0], [-0.05, -0.0], [-0.04, 0.05], [-0.05, -0.01], [-0.04, 0.0]], [[-0.05, -0.01], [-0.06, 0.01], [-0.06, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.03], [-0.07, 0.02], [-0.06, 0.01], [-0.05, -0.0], [-0.06, 0.0], [-0.06, 0.01], [-0.04, 0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.09, 0.06], [-0.03, 0.01], [-0.04, 0.05], [-0.03, 0.03], [-0.04, -0.0], [-0.04, 0.05], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.03], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.04, 0.01], [-0.05, -0.01], [-0.04, 0.05], [-0.04, 0.01], [-0.03, 0.03], [-0.06, 0.0], [-0.06, 0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.08, 0.04], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.04], [-0.05, -0.0], [-0.04, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.01], [-0.06, 0.0], [-0.04, 0.06]], [[-0.03, 0.1], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.02], [-0.07, 0.02], [-0.07, 0.02], [-0.04, 0.07], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.06, 0.0], [-0.07, 0.01], [-0.07, 0.02], [-0.04, -0.0], [-0.05, -0.0], [-0.06, 0.01], [-0.04, 0.09], [-0.07, 0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.04, 0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.05, -0.01], [-0.03, 0.02], [-0.08, 0.05], [-0.06, 0.0], [-0.06, 0.0], [-0.04, 0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.0], [-0.08, 0.04], [-0.04, -0.0], [-0.06, 0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.04, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.0], [-0.07, 0.02], [-0.05, -0.01]], [[-0.03, 0.02], [-0.05, -0.0], [-0.03, 0.02], [-0.08, 0.04], [-0.04, 0.08], [-0.06, 0.0], [-0.04, 0.01], [-0.03, 0.02], [-0.04, 0.06], [-0.03, 0.03], [-0.05, -0.0], [-0.05, -0.01], [-0.06, -0.0], [-0.03, 0.01], [-0.03, 0.04], [-0.04, 0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.06, -0.0], [-0.04, 0.07], [-0.05, -0.0], [-0.04, 0.07], [-0.08, 0.04], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.06, -0.0], [-0.07, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.06, 0.01], [-0.06, 0.0], [-0.06, -0.0], [-0.06, -0.0], [-0.04, 0.08], [-0.04, 0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.04, 0.0], [-0.03, 0.03], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.08, 0.03], [-0.04, 0.07], [-0.04, 0.01]], [[-0.04, -0.0], [-0.06, 0.01], [-0.03, 0.03], [-0.06, -0.0], [-0.03, 0.1], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.03], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.08, 0.04], [-0.03, 0.02], [-0.06, -0.0], [-0.02, 0.12], [-0.08, 0.03], [-0.07, 0.01], [-0.03, 0.02], [-0.04, 0.06], [-0.03, 0.02], [-0.04, 0.06], [-0.06, 0.0], [-0.03, 0.02], [-0.05, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.08, 0.03], [-0.05, -0.01], [-0.06, 0.0], [-0.08, 0.03], [-0.05, -0.01], [-0.07, 0.01], [-0.03, 0.03], [-0.07, 0.02], [-0.03, 0.02], [-0.08, 0.03], [-0.05, -0.01], [-0.06, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.01], [-0.06, 0.0]], [[-0.04, 0.0], [-0.06, 0.01], [-0.07, 0.02], [-0.03, 0.1], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.04, 0.05], [-0.08, 0.05], [-0.07, 0.02], [-0.03, 0.03], [-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.04], [-0.06, 0.01], [-0.03, 0.03], [-0.04, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.09, 0.07], [-0.05, -0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.07, 0.03], [-0.05, -0.0], [-0.04, 0.05], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.0], [-0.03, 0.03], [-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.01]], [[-0.05, -0.01], [-0.04, 0.07], [-0.07, 0.02], [-0.08, 0.05], [-0.04, 0.06], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.03, 0.04], [-0.06, 0.01], [-0.04, -0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.0], [-0.04, 0.07], [-0.04, 0.08], [-0.07, 0.02], [-0.08, 0.05], [-0.07, 0.01], [-0.06, 0.01], [-0.03, 0.03], [-0.07, 0.03], [-0.04, 0.0], [-0.07, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.07, 0.01], [-0.05, -0.0], [-0.03, 0.01], [-0.03, 0.01], [-0.06, 0.01], [-0.07, 0.02], [-0.04, 0.0], [-0.06, 0.01], [-0.07, 0.02], [-0.05, -0.0], [-0.04, 0.08], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.04], [-0.05, -0.01], [-0.09, 0.07], [-0.06, 0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.09, 0.06], [-0.05, -0.01]], [[-0.06, -0.0], [-0.06, 0.0], [-0.04, 0.01], [-0.07, 0.02], [-0.04, 0.06], [-0.03, 0.03], [-0.06, 0.01], [-0.03, 0.02], [-0.05, -0.0], [-0.06, 0.0], [-0.03, 0.1], [-0.07, 0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.03, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.08, 0.05], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.03], [-0.03, 0.02], [-0.05, -0.01], [-0.04, 0.08], [-0.04, 0.0], [-0.06, 0.0], [-0.04, 0.0], [-0.04, 0.0], [-0.06, 0.0], [-0.06, -0.0], [-0.03, 0.02], [-0.08, 0.03], [-0.03, 0.01], [-0.05, -0.0], [-0.03, 0.04]], [[-0.05, -0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.06, 0.01], [-0.03, 0.03], [-0.04, 0.06], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.03], [-0.04, -0.0], [-0.07, 0.01], [-0.08, 0.03], [-0.05, -0.01], [-0.07, 0.03], [-0.06, 0.0], [-0.03, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.06, 0.0], [-0.04, 0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.07, 0.01], [-0.03, 0.03], [-0.04, -0.0], [-0.03, 0.04], [-0.09, 0.06], [-0.03, 0.03], [-0.03, 0.04], [-0.08, 0.03], [-0.06, 0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.04, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.07], [-0.03, 0.03], [-0.06, 0.0], [-0.03, 0.1], [-0.05, -0.01], [-0.04, 0.04], [-0.03, 0.02], [-0.05, -0.01]], [[-0.03, 0.02], [-0.06, 0.0], [-0.03, 0.04], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.0], [-0.04, -0.0], [-0.08, 0.05], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.04, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.09], [-0.03, 0.03], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.09, 0.07], [-0.05, -0.01], [-0.06, 0.01], [-0.04, -0.0], [-0.03, 0.1], [-0.06, 0.01], [-0.05, -0.02], [-0.06, 0.0], [-0.05, -0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.07, 0.01], [-0.06, 0.0], [-0.04, 0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.04, 0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.08, 0.04]], [[-0.03, 0.02], [-0.03, 0.04], [-0.06, 0.01], [-0.06, -0.0], [-0.05, -0.01], [-0.07, 0.03], [-0.06, 0.01], [-0.06, 0.0], [-0.08, 0.04], [-0.07, 0.03], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.08, 0.04], [-0.08, 0.04], [-0.06, 0.01], [-0.04, 0.06], [-0.04, 0.08], [-0.04, 0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.02], [-0.08, 0.04], [-0.05, -0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.04, 0.05], [-0.08, 0.03], [-0.05, -0.02], [-0.07, 0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.08, 0.04], [-0.05, -0.01], [-0.07, 0.01], [-0.03, 0.04], [-0.07, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.01], [-0.03, 0.04], [-0.05, -0.01], [-0.07, 0.02]], [[-0.03, 0.02], [-0.1, 0.09], [-0.06, 0.0], [-0.04, 0.06], [-0.06, 0.0], [-0.07, 0.03], [-0.05, -0.01], [-0.07, 0.01], [-0.08, 0.03], [-0.05, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.08, 0.04], [-0.03, 0.04], [-0.03, 0.02], [-0.05, -0.01], [-0.03, 0.02], [-0.07, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.03, 0.02], [-0.06, 0.01], [-0.08, 0.03], [-0.05, -0.01], [-0.07, 0.03], [-0.04, 0.01], [-0.05, -0.0], [-0.07, 0.02], [-0.06, 0.01], [-0.04, -0.0], [-0.06, 0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.01], [-0.07, 0.02], [-0.04, 0.05], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.02], [-0.07, 0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.07, 0.02]], [[-0.04, 0.06], [-0.05, -0.01], [-0.04, 0.05], [-0.04, -0.0], [-0.04, 0.0], [-0.1, 0.1], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.07, 0.02], [-0.07, 0.02], [-0.03, 0.04], [-0.04, 0.09], [-0.03, 0.04], [-0.06, 0.0], [-0.07, 0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.05], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.08, 0.04], [-0.06, 0.0], [-0.04, 0.06], [-0.03, 0.04], [-0.04, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.01], [-0.04, 0.01], [-0.04, -0.0], [-0.04, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.02], [-0.07, 0.01], [-0.03, 0.03], [-0.07, 0.01], [-0.07, 0.02], [-0.03, 0.02], [-0.04, -0.0], [-0.05, -0.0]], [[-0.07, 0.03], [-0.06, 0.0], [-0.03, 0.01], [-0.03, 0.04], [-0.08, 0.04], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.01], [-0.05, -0.0], [-0.06, 0.01], [-0.06, 0.01], [-0.07, 0.02], [-0.03, 0.1], [-0.07, 0.03], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.03], [-0.03, 0.02], [-0.05, -0.02], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.0], [-0.05, -0.0], [-0.06, -0.0], [-0.06, -0.0], [-0.07, 0.03], [-0.05, -0.01], [-0.03, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.04, 0.0], [-0.05, -0.0], [-0.05, -0.0], [-0.03, 0.02]], [[-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.06, 0.0], [-0.06, 0.01], [-0.04, 0.05], [-0.02, 0.11], [-0.07, 0.01], [-0.07, 0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.04, 0.0], [-0.05, -0.01], [-0.01, 0.12], [-0.05, -0.0], [-0.06, 0.0], [-0.08, 0.03], [-0.05, -0.0], [-0.06, 0.01], [-0.08, 0.06], [-0.03, 0.01], [-0.04, 0.07], [-0.04, -0.0], [-0.04, -0.0], [-0.04, 0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.04, -0.0], [-0.06, 0.0], [-0.03, 0.02], [-0.03, 0.04], [-0.06, 0.01], [-0.02, 0.11], [-0.05, -0.0], [-0.05, -0.0], [-0.04, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.01], [-0.06, -0.0], [-0.05, -0.0], [-0.03, 0.09], [-0.06, 0.01], [-0.03, 0.03], [-0.05, -0.0], [-0.03, 0.02], [-0.04, -0.0], [-0.06, 0.0]], [[-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.08], [-0.05, -0.01], [-0.04, 0.07], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.06, -0.0], [-0.07, 0.02], [-0.04, 0.06], [-0.03, 0.02], [-0.07, 0.02], [-0.07, 0.01], [-0.05, -0.01], [-0.03, 0.1], [-0.04, 0.06], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.08, 0.04], [-0.06, 0.0], [-0.04, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.08], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.06], [-0.06, 0.01], [-0.05, -0.01], [-0.03, 0.1], [-0.09, 0.08]], [[-0.04, 0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.03, 0.01], [-0.05, -0.01], [-0.04, 0.06], [-0.03, 0.02], [-0.05, -0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.04, 0.05], [-0.04, 0.09], [-0.03, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.03, 0.04], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.04], [-0.07, 0.02], [-0.06, 0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.03, 0.03], [-0.03, 0.03], [-0.04, 0.06], [-0.07, 0.01], [-0.07, 0.02], [-0.06, 0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.04, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.04, -0.0], [-0.04, 0.0], [-0.06, 0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.04, 0.09], [-0.05, -0.01]], [[-0.06, 0.0], [-0.05, -0.02], [-0.04, 0.0], [-0.06, 0.01], [-0.04, 0.0], [-0.05, -0.02], [-0.06, 0.0], [-0.04, -0.0], [-0.03, 0.04], [-0.04, -0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.04], [-0.03, 0.09], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.05], [-0.05, -0.01], [-0.08, 0.04], [-0.06, 0.01], [-0.07, 0.03], [-0.03, 0.03], [-0.04, 0.06], [-0.03, 0.1], [-0.03, 0.02], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.04], [-0.03, 0.03], [-0.07, 0.03], [-0.06, -0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.03, 0.1], [-0.05, -0.01], [-0.06, -0.0], [-0.07, 0.03], [-0.03, 0.02], [-0.07, 0.01], [-0.07, 0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.04, 0.05], [-0.06, 0.0], [-0.06, 0.0], [-0.06, 0.01]], [[-0.05, -0.01], [-0.06, -0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.04, -0.0], [-0.04, -0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.07, 0.03], [-0.04, 0.0], [-0.04, 0.0], [-0.04, 0.01], [-0.09, 0.07], [-0.03, 0.04], [-0.07, 0.02], [-0.06, 0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.03, 0.03], [-0.05, -0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.05], [-0.02, 0.1], [-0.07, 0.02], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.03], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.0], [-0.07, 0.02], [-0.04, 0.07], [-0.04, 0.0], [-0.07, 0.02], [-0.07, 0.02], [-0.07, 0.03], [-0.07, 0.02], [-0.06, 0.01], [-0.04, -0.0], [-0.04, 0.01], [-0.08, 0.04], [-0.07, 0.01], [-0.05, -0.01]], [[-0.07, 0.03], [-0.04, -0.0], [-0.08, 0.04], [-0.05, -0.0], [-0.04, 0.07], [-0.03, 0.04], [-0.03, 0.1], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.01], [-0.04, -0.0], [-0.07, 0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.07, 0.02], [-0.08, 0.04], [-0.07, 0.02], [-0.06, 0.01], [-0.04, 0.05], [-0.04, -0.0], [-0.04, -0.0], [-0.07, 0.02], [-0.02, 0.11], [-0.03, 0.04], [-0.06, 0.0], [-0.04, 0.05], [-0.05, -0.01], [-0.03, 0.1], [-0.05, -0.01], [-0.02, 0.11], [-0.06, 0.01], [-0.07, 0.01], [-0.03, 0.03], [-0.04, -0.0], [-0.03, 0.02], [-0.04, -0.0], [-0.03, 0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.07, 0.03], [-0.04, 0.05], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.03, 0.03], [-0.04, 0.05], [-0.07, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0]], [[-0.07, 0.01], [-0.07, 0.03], [-0.05, -0.01], [-0.04, 0.06], [-0.04, 0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.06, 0.01], [-0.07, 0.01], [-0.03, 0.04], [-0.03, 0.02], [-0.06, 0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.03, 0.02], [-0.03, 0.04], [-0.03, 0.03], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.04], [-0.04, 0.01], [-0.03, 0.02], [-0.09, 0.07], [-0.06, 0.0], [-0.06, 0.01], [-0.03, 0.03], [-0.04, 0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.03, 0.04], [-0.06, 0.0], [-0.07, 0.02], [-0.03, 0.03], [-0.06, 0.0], [-0.04, -0.0], [-0.04, 0.01], [-0.06, 0.0], [-0.03, 0.03], [-0.06, 0.0], [-0.05, -0.01], [-0.08, 0.04], [-0.03, 0.1]], [[-0.07, 0.02], [-0.04, 0.0], [-0.03, 0.02], [-0.03, 0.03], [-0.04, -0.0], [-0.06, 0.01], [-0.04, 0.05], [-0.07, 0.02], [-0.04, 0.0], [-0.04, 0.07], [-0.03, 0.1], [-0.02, 0.11], [-0.07, 0.02], [-0.08, 0.05], [-0.05, -0.01], [-0.03, 0.02], [-0.06, 0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.05], [-0.03, 0.09], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.0], [-0.02, 0.11], [-0.07, 0.03], [-0.05, -0.01], [-0.08, 0.04], [-0.03, 0.03], [-0.05, -0.0], [-0.06, 0.01], [-0.02, 0.11], [-0.03, 0.02], [-0.06, 0.0], [-0.07, 0.01], [-0.04, 0.01], [-0.03, 0.01], [-0.05, -0.02], [-0.04, 0.05], [-0.06, 0.0], [-0.06, 0.01]], [[-0.06, 0.0], [-0.04, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.06], [-0.06, 0.0], [-0.03, 0.03], [-0.04, -0.0], [-0.07, 0.01], [-0.08, 0.03], [-0.04, 0.01], [-0.04, -0.0], [-0.07, 0.02], [-0.06, 0.01], [-0.07, 0.01], [-0.04, -0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.03, 0.1], [-0.04, 0.01], [-0.06, 0.0], [-0.04, 0.06], [-0.05, -0.01], [-0.08, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.03, 0.02], [-0.03, 0.1], [-0.05, -0.01], [-0.08, 0.05], [-0.05, -0.01], [-0.07, 0.03], [-0.08, 0.05], [-0.07, 0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.04, -0.0], [-0.06, 0.0], [-0.07, 0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.06, 0.01], [-0.05, -0.0]], [[-0.04, -0.0], [-0.04, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.04, 0.0], [-0.06, 0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.03, 0.02], [-0.04, 0.05], [-0.03, 0.03], [-0.06, 0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.03, 0.03], [-0.07, 0.02], [-0.04, -0.0], [-0.07, 0.02], [-0.07, 0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.04, -0.0], [-0.05, -0.0], [-0.06, 0.01], [-0.06, -0.0], [-0.05, -0.01], [-0.08, 0.04], [-0.03, 0.03], [-0.03, 0.04], [-0.04, -0.0], [-0.06, 0.0], [-0.04, 0.04], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.08, 0.04], [-0.03, 0.03]], [[-0.05, -0.0], [-0.06, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.09], [-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.06, -0.0], [-0.06, 0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.03, 0.01], [-0.07, 0.02], [-0.03, 0.03], [-0.06, 0.0], [-0.05, -0.0], [-0.07, 0.03], [-0.03, 0.02], [-0.04, 0.09], [-0.04, -0.0], [-0.02, 0.1], [-0.06, 0.01], [-0.06, -0.0], [-0.05, -0.0], [-0.03, 0.01], [-0.03, 0.04], [-0.06, 0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.0, 0.14], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.04, 0.0], [-0.06, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.04, -0.0], [-0.04, -0.0], [-0.07, 0.02], [-0.03, 0.1], [-0.03, 0.01], [-0.04, 0.01], [-0.04, 0.0], [-0.06, 0.01]], [[-0.05, -0.01], [-0.03, 0.04], [-0.03, 0.03], [-0.04, -0.0], [-0.04, 0.07], [-0.06, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.04, 0.01], [-0.06, 0.0], [-0.07, 0.03], [-0.08, 0.05], [-0.03, 0.03], [-0.04, -0.0], [-0.06, -0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.04, 0.0], [-0.04, 0.05], [-0.04, 0.04], [-0.03, 0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.08], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.02], [-0.03, 0.02], [-0.03, 0.04], [-0.07, 0.01], [-0.06, -0.0], [-0.06, 0.0], [-0.04, 0.0], [-0.06, -0.0], [-0.07, 0.03], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.03]], [[-0.05, -0.01], [-0.03, 0.09], [-0.09, 0.06], [-0.07, 0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.0], [-0.05, -0.01], [-0.03, 0.04], [-0.03, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.08, 0.05], [-0.08, 0.03], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.07, 0.01], [-0.06, 0.0], [-0.03, 0.04], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.04], [-0.05, -0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.08, 0.05], [-0.06, 0.01], [-0.05, -0.0], [-0.06, 0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.04, 0.0], [-0.05, -0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.06, 0.01]], [[-0.05, -0.01], [-0.08, 0.05], [-0.04, -0.0], [-0.04, -0.0], [-0.04, 0.07], [-0.03, 0.02], [-0.03, 0.02], [-0.05, -0.0], [-0.04, -0.0], [-0.03, 0.03], [-0.07, 0.01], [-0.04, 0.0], [-0.04, 0.06], [-0.05, -0.01], [-0.04, 0.08], [-0.04, -0.0], [-0.04, 0.05], [-0.03, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.05], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.03, 0.03], [-0.04, 0.0], [-0.06, 0.0], [-0.04, 0.0], [-0.03, 0.02], [-0.06, 0.01], [-0.04, 0.0], [-0.08, 0.03], [-0.07, 0.02], [-0.03, 0.03], [-0.04, 0.0], [-0.07, 0.02], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.07, 0.03], [-0.06, -0.0], [-0.05, -0.0], [-0.05, -0.02], [-0.04, -0.0]], [[-0.07, 0.02], [-0.08, 0.04], [-0.05, -0.0], [-0.07, 0.02], [-0.03, 0.03], [-0.07, 0.02], [-0.03, 0.01], [-0.08, 0.04], [-0.05, -0.02], [-0.04, 0.0], [-0.03, 0.03], [-0.08, 0.03], [-0.06, 0.0], [-0.04, 0.05], [-0.06, 0.0], [-0.06, 0.0], [-0.07, 0.01], [-0.04, 0.06], [-0.06, 0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.07, 0.03], [-0.05, -0.01], [-0.04, 0.05], [-0.07, 0.01], [-0.07, 0.02], [-0.04, 0.0], [-0.07, 0.02], [-0.03, 0.02], [-0.06, 0.0], [-0.06, 0.0], [-0.04, -0.0], [-0.06, 0.0], [-0.04, 0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.04, -0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.02, 0.12], [-0.03, 0.02], [-0.05, -0.0], [-0.04, 0.01]], [[-0.07, 0.01], [-0.05, -0.01], [-0.1, 0.1], [-0.02, 0.11], [-0.04, 0.0], [-0.05, -0.0], [-0.05, -0.0], [-0.07, 0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.04, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.07, 0.03], [-0.07, 0.03], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.08, 0.04], [-0.07, 0.02], [-0.05, -0.01], [-0.03, 0.04], [-0.08, 0.03], [-0.04, -0.0], [-0.05, -0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.05], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.1], [-0.07, 0.02], [-0.07, 0.02], [-0.04, -0.0], [-0.03, 0.02], [-0.04, -0.0], [-0.05, -0.01], [-0.09, 0.06], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.0], [-0.03, 0.02]], [[-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.06], [-0.05, -0.0], [-0.06, 0.0], [-0.07, 0.03], [-0.07, 0.03], [-0.05, -0.01], [-0.05, -0.0], [-0.06, 0.0], [-0.04, 0.05], [-0.02, 0.11], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.03], [-0.07, 0.02], [-0.08, 0.04], [-0.05, -0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.02], [-0.06, 0.0], [-0.05, -0.0], [-0.06, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.04, 0.07], [-0.08, 0.04], [-0.06, 0.0], [-0.06, 0.01], [-0.07, 0.01], [-0.07, 0.02], [-0.05, -0.0], [-0.03, 0.03], [-0.06, 0.0], [-0.06, -0.0], [-0.08, 0.04], [-0.04, 0.06]], [[-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.02], [-0.06, 0.0], [-0.06, 0.0], [-0.03, 0.02], [-0.03, 0.01], [-0.04, 0.06], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.03, 0.04], [-0.08, 0.04], [-0.06, 0.0], [-0.03, 0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.03, 0.04], [-0.07, 0.01], [-0.07, 0.03], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.02]], [[-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.04], [-0.04, 0.05], [-0.04, 0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.06, 0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.08, 0.04], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.08, 0.03], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.04], [-0.05, -0.01], [-0.07, 0.02], [-0.06, -0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.06, 0.0], [-0.02, 0.11], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.03, 0.02], [-0.03, 0.04], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.07, 0.01], [-0.04, -0.0], [-0.04, 0.06], [-0.07, 0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.08, 0.03]], [[-0.06, 0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.04, 0.06], [-0.03, 0.04], [-0.03, 0.04], [-0.04, -0.0], [-0.06, 0.0], [-0.03, 0.03], [-0.04, 0.07], [-0.06, -0.0], [-0.06, 0.01], [-0.08, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.06, -0.0], [-0.04, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.04, -0.0], [-0.06, 0.0], [-0.06, 0.01], [-0.07, 0.01], [-0.04, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.0], [-0.03, 0.03], [-0.05, -0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.04, -0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.08, 0.04], [-0.07, 0.02], [-0.06, -0.0], [-0.07, 0.02], [-0.03, 0.02], [-0.04, 0.05], [-0.05, -0.01], [-0.06, 0.01], [-0.03, 0.02], [-0.06, 0.0], [-0.07, 0.01]], [[-0.04, -0.0], [-0.06, 0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.03, 0.02], [-0.04, -0.0], [-0.04, 0.06], [-0.07, 0.02], [-0.03, 0.09], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.07], [-0.06, 0.0], [-0.04, 0.0], [-0.05, -0.02], [-0.03, 0.09], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.04, 0.01], [-0.07, 0.02], [-0.04, 0.06], [-0.06, 0.0], [-0.04, 0.08], [-0.03, 0.02], [-0.04, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.1], [-0.04, 0.08], [-0.04, 0.05], [-0.05, -0.01], [-0.03, 0.04], [-0.05, -0.0], [-0.04, 0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.06, -0.0], [-0.08, 0.04], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.06], [-0.03, 0.02], [-0.06, 0.01], [-0.04, -0.0], [-0.05, -0.0], [-0.06, 0.01], [-0.05, -0.01]], [[-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.03, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.04], [-0.03, 0.03], [-0.05, -0.0], [-0.04, -0.0], [-0.06, -0.0], [-0.03, 0.04], [-0.05, -0.01], [-0.05, -0.02], [-0.05, -0.0], [-0.07, 0.03], [-0.04, 0.0], [-0.04, 0.01], [-0.04, 0.0], [-0.05, -0.0], [-0.05, -0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.05, -0.0], [-0.07, 0.02], [-0.04, 0.09], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.04, 0.08], [-0.05, -0.0], [-0.07, 0.01], [-0.06, 0.01], [-0.05, -0.0], [-0.06, -0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.08, 0.04], [-0.04, 0.04], [-0.06, 0.0], [-0.05, -0.01]], [[-0.08, 0.03], [-0.05, -0.01], [-0.04, 0.08], [-0.04, -0.0], [-0.06, 0.01], [-0.04, 0.01], [-0.05, -0.02], [-0.04, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.02], [-0.06, 0.01], [-0.04, 0.06], [-0.07, 0.01], [-0.03, 0.02], [-0.06, 0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.01], [-0.09, 0.06], [-0.05, -0.0], [-0.05, -0.01], [-0.08, 0.03], [-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.0], [-0.06, 0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.08, 0.03], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.08, 0.05], [-0.06, 0.0], [-0.04, 0.01], [-0.03, 0.02], [-0.05, -0.0], [-0.06, 0.0]], [[-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.04, 0.01], [-0.05, -0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.04, 0.05], [-0.05, -0.01], [-0.02, 0.11], [-0.06, -0.0], [-0.04, -0.0], [-0.07, 0.03], [-0.03, 0.01], [-0.07, 0.02], [-0.07, 0.01], [-0.06, -0.0], [-0.07, 0.03], [-0.06, 0.0], [-0.07, 0.02], [-0.08, 0.05], [-0.05, -0.01], [-0.05, -0.0], [-0.06, -0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.02, 0.11], [-0.07, 0.01], [-0.07, 0.03], [-0.06, -0.0], [-0.06, 0.01], [-0.04, 0.05], [-0.04, -0.0], [-0.06, 0.01], [-0.04, -0.0], [-0.06, 0.01], [-0.03, 0.02], [-0.05, -0.0], [-0.03, 0.04], [-0.07, 0.02], [-0.04, 0.06], [-0.06, 0.0], [-0.04, 0.06]], [[-0.06, 0.0], [-0.03, 0.02], [-0.07, 0.03], [-0.06, 0.0], [-0.04, -0.0], [-0.05, -0.0], [-0.07, 0.02], [-0.04, 0.01], [-0.04, 0.08], [-0.05, -0.01], [-0.04, -0.0], [-0.07, 0.02], [-0.06, 0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.06, -0.0], [-0.06, 0.01], [-0.04, -0.0], [-0.04, 0.07], [-0.04, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.03], [-0.1, 0.09], [-0.04, -0.0], [-0.05, -0.02], [-0.03, 0.02], [-0.07, 0.03], [-0.03, 0.04], [-0.04, -0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.07, 0.02], [-0.06, 0.0], [-0.03, 0.1], [-0.07, 0.01], [-0.03, 0.02], [-0.03, 0.02], [-0.06, 0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.04, 0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.0], [-0.05, -0.01]], [[-0.05, -0.0], [-0.06, 0.01], [-0.06, 0.01], [-0.09, 0.06], [-0.07, 0.03], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.01], [-0.06, 0.0], [-0.03, 0.1], [-0.05, -0.01], [-0.07, 0.01], [-0.06, -0.0], [-0.08, 0.04], [-0.04, 0.0], [-0.03, 0.04], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.03, 0.02], [-0.05, -0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.04, 0.01], [-0.07, 0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.04, 0.06], [-0.03, 0.02], [-0.05, -0.01], [-0.06, -0.0], [-0.05, -0.0], [-0.07, 0.03], [-0.03, 0.03], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.06, -0.0], [-0.03, 0.03], [-0.02, 0.11], [-0.07, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0]], [[-0.04, 0.05], [-0.07, 0.02], [-0.05, -0.02], [-0.04, -0.0], [-0.03, 0.03], [-0.07, 0.02], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.04, 0.07], [-0.05, -0.01], [-0.07, 0.01], [-0.03, 0.03], [-0.03, 0.02], [-0.03, 0.02], [-0.04, 0.05], [-0.07, 0.03], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.08, 0.03], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.03], [-0.03, 0.04], [-0.05, -0.01], [-0.08, 0.04], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.0], [-0.06, 0.0], [-0.03, 0.04], [-0.06, 0.0]], [[-0.04, 0.09], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.05, -0.0], [-0.03, 0.04], [-0.04, -0.0], [-0.06, 0.01], [-0.06, 0.01], [-0.06, 0.01], [-0.05, -0.0], [-0.04, 0.0], [-0.04, -0.0], [-0.05, -0.0], [-0.08, 0.03], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.06, -0.0], [-0.07, 0.03], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.03], [-0.03, 0.03], [-0.06, 0.01], [-0.03, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.04, 0.08], [-0.04, -0.0]], [[-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.09], [-0.06, 0.0], [-0.03, 0.01], [-0.03, 0.03], [-0.07, 0.01], [-0.03, 0.04], [-0.05, -0.0], [-0.06, 0.0], [-0.03, 0.03], [-0.04, 0.05], [-0.03, 0.03], [-0.06, 0.0], [-0.04, -0.0], [-0.03, 0.02], [-0.03, 0.03], [-0.03, 0.1], [-0.07, 0.01], [-0.08, 0.06], [-0.05, -0.0], [-0.06, 0.01], [-0.04, 0.05], [-0.05, -0.01], [-0.06, 0.01], [-0.07, 0.03], [-0.07, 0.01], [-0.06, -0.0], [-0.03, 0.09], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.04, 0.05], [-0.07, 0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.03, 0.01], [-0.07, 0.02], [-0.08, 0.05], [-0.04, -0.0]], [[-0.06, 0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.09, 0.06], [-0.06, 0.01], [-0.03, 0.03], [-0.07, 0.02], [-0.03, 0.04], [-0.05, -0.0], [-0.04, -0.0], [-0.06, 0.01], [-0.04, 0.0], [-0.06, 0.0], [-0.05, -0.02], [-0.04, 0.08], [-0.04, -0.0], [-0.05, -0.0], [-0.03, 0.1], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.0], [-0.04, -0.0], [-0.06, 0.0], [-0.04, 0.07], [-0.02, 0.11], [-0.06, -0.0], [-0.07, 0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.0], [-0.04, -0.0], [-0.07, 0.03], [-0.07, 0.03], [-0.05, -0.01], [-0.08, 0.04], [-0.05, -0.01], [-0.03, 0.03], [-0.04, -0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.07, 0.02], [-0.04, 0.0], [-0.06, 0.01], [-0.06, 0.0], [-0.04, -0.0]], [[-0.03, 0.03], [-0.05, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.04, 0.06], [-0.06, 0.01], [-0.02, 0.11], [-0.09, 0.06], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.06, 0.0], [-0.04, 0.09], [-0.03, 0.04], [-0.04, -0.0], [-0.03, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.06, 0.0], [-0.04, 0.0], [-0.05, -0.01], [-0.07, 0.03], [-0.07, 0.01], [-0.07, 0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.04, -0.0], [-0.03, 0.1], [-0.05, -0.01], [-0.04, 0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.04, 0.0], [-0.06, 0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.06, 0.01]], [[-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.04, 0.05], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.04, 0.05], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.09, 0.06], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.03, 0.02], [-0.03, 0.04], [-0.07, 0.03], [-0.08, 0.03], [-0.03, 0.01], [-0.06, 0.01], [-0.06, 0.01], [-0.03, 0.03], [-0.07, 0.02], [-0.03, 0.04], [-0.03, 0.1], [-0.03, 0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.07, 0.02], [-0.03, 0.03], [-0.03, 0.1], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.0], [-0.04, -0.0], [-0.07, 0.02]], [[-0.05, -0.01], [-0.03, 0.03], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.08], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.07, 0.03], [-0.05, -0.01], [-0.03, 0.04], [-0.07, 0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.03, 0.02], [-0.04, 0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.04, 0.07], [-0.06, 0.0], [-0.03, 0.03], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.03, 0.03], [-0.07, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.04], [-0.06, 0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0]], [[-0.03, 0.03], [-0.07, 0.02], [-0.06, 0.0], [-0.03, 0.04], [-0.08, 0.03], [-0.03, 0.02], [-0.08, 0.04], [-0.03, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.03], [-0.05, -0.01], [-0.03, 0.01], [-0.04, 0.0], [-0.07, 0.01], [-0.08, 0.05], [-0.05, -0.01], [-0.03, 0.03], [-0.03, 0.03], [-0.07, 0.02], [-0.07, 0.02], [-0.03, 0.03], [-0.03, 0.04], [-0.03, 0.02], [-0.08, 0.03], [-0.03, 0.04], [-0.06, 0.01], [-0.08, 0.03], [-0.06, -0.0], [-0.04, 0.06], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.04, 0.0], [-0.04, 0.0], [-0.04, 0.06], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.03, 0.03], [-0.03, 0.03], [-0.04, 0.0], [-0.04, 0.05], [-0.04, 0.06], [-0.04, 0.05], [-0.06, 0.0], [-0.06, 0.0], [-0.03, 0.04], [-0.04, 0.07], [-0.07, 0.03]], [[-0.05, -0.01], [-0.04, 0.01], [-0.04, -0.0], [-0.04, 0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.04, 0.01], [-0.07, 0.03], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.03, 0.03], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.06, 0.0], [-0.06, 0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.03, 0.02], [-0.06, 0.0], [-0.06, -0.0], [-0.05, -0.01], [-0.03, 0.09], [-0.05, -0.01], [-0.04, -0.0], [-0.04, 0.01], [-0.07, 0.03], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.04, 0.01], [-0.03, 0.02], [-0.05, -0.0], [-0.03, 0.02], [-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.06, 0.0], [-0.06, -0.0], [-0.04, -0.0], [-0.04, -0.0]], [[-0.06, 0.0], [-0.05, -0.01], [-0.08, 0.03], [-0.03, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.06], [-0.01, 0.12], [-0.06, 0.01], [-0.07, 0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.04, -0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.04], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.0], [-0.06, -0.0], [-0.06, 0.0], [-0.03, 0.04], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.03, 0.03], [-0.04, -0.0], [-0.04, 0.0], [-0.03, 0.03], [-0.06, 0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.04, 0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.0]], [[-0.05, -0.01], [-0.06, 0.01], [-0.08, 0.03], [-0.06, 0.01], [-0.05, -0.0], [-0.07, 0.02], [-0.08, 0.06], [-0.07, 0.02], [-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.07, 0.01], [-0.06, 0.01], [-0.06, 0.01], [-0.02, 0.11], [-0.04, 0.0], [-0.07, 0.01], [-0.06, -0.0], [-0.04, 0.05], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.06, 0.01], [-0.04, 0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.04, 0.0], [-0.06, 0.0], [-0.04, 0.07], [-0.06, 0.0], [-0.07, 0.02], [-0.04, 0.01], [-0.04, 0.07], [-0.07, 0.02], [-0.05, -0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.03, 0.04], [-0.05, -0.01], [-0.04, 0.06], [-0.06, 0.0], [-0.04, 0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.06, 0.0], [-0.03, 0.02], [-0.07, 0.02], [-0.07, 0.02], [-0.06, 0.0]], [[-0.05, -0.0], [-0.07, 0.02], [-0.03, 0.03], [-0.03, 0.03], [-0.07, 0.02], [-0.04, 0.09], [-0.05, -0.01], [-0.04, 0.05], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.06, -0.0], [-0.08, 0.04], [-0.06, -0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.0], [-0.03, 0.02], [-0.04, 0.01], [-0.08, 0.04], [-0.06, 0.0], [-0.07, 0.02], [-0.03, 0.02], [-0.06, 0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.04, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.06, 0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0]], [[-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.06, -0.0], [-0.03, 0.04], [-0.04, -0.0], [-0.04, 0.05], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.03, 0.01], [-0.06, -0.0], [-0.06, 0.0], [-0.04, 0.0], [-0.03, 0.03], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.03, 0.04], [-0.07, 0.02], [-0.07, 0.03], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.02], [-0.03, 0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.03, 0.02], [-0.07, 0.02], [-0.04, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.04, -0.0], [-0.08, 0.04], [-0.03, 0.02], [-0.07, 0.01], [-0.05, -0.0], [-0.04, -0.0], [-0.04, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.04, -0.0]], [[-0.06, 0.0], [-0.04, 0.05], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.02], [-0.03, 0.04], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.06, -0.0], [-0.04, 0.05], [-0.03, 0.04], [-0.03, 0.04], [-0.08, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.06, -0.0], [-0.04, -0.0], [-0.05, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.05], [-0.05, -0.0], [-0.04, 0.07], [-0.06, 0.0], [-0.07, 0.01], [-0.06, -0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.08, 0.05], [-0.06, 0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.07, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.01], [-0.05, -0.01], [-0.03, 0.1]], [[-0.07, 0.03], [-0.04, 0.06], [-0.07, 0.02], [-0.02, 0.11], [-0.07, 0.02], [-0.06, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.01], [-0.08, 0.03], [-0.06, -0.0], [-0.05, -0.0], [-0.06, -0.0], [-0.04, 0.01], [-0.07, 0.01], [-0.05, -0.0], [-0.06, 0.0], [-0.06, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.05], [-0.04, 0.05], [-0.07, 0.02], [-0.04, 0.06], [-0.03, 0.02], [-0.07, 0.02], [-0.07, 0.01], [-0.08, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.02, 0.1], [-0.06, 0.01], [-0.06, 0.0], [-0.08, 0.04], [-0.04, 0.01], [-0.09, 0.06], [-0.08, 0.04], [-0.07, 0.01], [-0.04, 0.06], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.03], [-0.03, 0.04], [-0.07, 0.01], [-0.07, 0.02], [-0.07, 0.01], [-0.04, -0.0]], [[-0.05, -0.01], [-0.06, 0.0], [-0.02, 0.12], [-0.07, 0.01], [-0.03, 0.02], [-0.04, 0.01], [-0.04, 0.07], [-0.05, -0.01], [-0.07, 0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.09], [-0.06, 0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.04, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.03, 0.03], [-0.03, 0.03], [-0.04, 0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.08, 0.03], [-0.04, -0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.03, 0.03], [-0.04, 0.0], [-0.08, 0.06], [-0.04, -0.0], [-0.09, 0.06], [-0.04, 0.0], [-0.06, 0.0], [-0.03, 0.03], [-0.06, 0.0], [-0.07, 0.03], [-0.05, -0.0], [-0.06, -0.0], [-0.06, 0.0], [-0.04, -0.0], [-0.05, -0.0]], [[-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.01], [-0.03, 0.03], [-0.01, 0.12], [-0.05, -0.01], [-0.03, 0.04], [-0.05, -0.01], [-0.04, 0.06], [-0.04, -0.0], [-0.07, 0.01], [-0.07, 0.02], [-0.05, -0.0], [-0.03, 0.03], [-0.08, 0.05], [-0.05, -0.01], [-0.07, 0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.06, 0.0], [-0.03, 0.02], [-0.06, 0.0], [-0.06, 0.0], [-0.03, 0.02], [-0.06, -0.0], [-0.05, -0.01], [-0.06, -0.0], [-0.04, -0.0], [-0.04, -0.0], [-0.07, 0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.06, -0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.01, 0.12], [-0.03, 0.02], [-0.07, 0.02], [-0.05, -0.0], [-0.05, -0.0], [-0.05, -0.0], [-0.05, -0.0], [-0.03, 0.02], [-0.04, 0.0], [-0.03, 0.02], [-0.06, 0.01]], [[-0.07, 0.02], [-0.07, 0.01], [-0.06, 0.0], [-0.03, 0.03], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.01], [-0.07, 0.01], [-0.04, 0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.08, 0.04], [-0.05, -0.01], [-0.03, 0.03], [-0.07, 0.01], [-0.05, -0.0], [-0.06, 0.01], [-0.08, 0.06], [-0.03, 0.02], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.06, 0.0], [-0.04, 0.01], [-0.03, 0.01], [-0.05, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.09], [-0.06, 0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.07, 0.01], [-0.03, 0.09], [-0.05, -0.0], [-0.06, 0.01], [-0.03, 0.03], [-0.06, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.08], [-0.04, -0.0], [-0.05, -0.01], [-0.06, -0.0], [-0.03, 0.04], [-0.05, -0.01]], [[-0.06, 0.01], [-0.07, 0.02], [-0.03, 0.03], [-0.06, 0.0], [-0.06, 0.01], [-0.04, -0.0], [-0.07, 0.03], [-0.07, 0.02], [-0.05, -0.01], [-0.08, 0.04], [-0.06, 0.0], [-0.03, 0.04], [-0.03, 0.02], [-0.07, 0.02], [-0.03, 0.02], [-0.05, -0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.0], [-0.06, -0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.03, 0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.03, 0.02], [-0.03, 0.04], [-0.06, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.01], [-0.08, 0.04], [-0.05, -0.01], [-0.03, 0.04], [-0.05, -0.01], [-0.03, 0.01], [-0.02, 0.11], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.08, 0.06], [-0.08, 0.04], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01]], [[-0.07, 0.02], [-0.08, 0.04], [-0.05, -0.01], [-0.04, 0.05], [-0.07, 0.02], [-0.03, 0.04], [-0.06, 0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.04, 0.04], [-0.03, 0.02], [-0.06, 0.0], [-0.03, 0.04], [-0.08, 0.03], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.01], [-0.03, 0.02], [-0.06, 0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.08, 0.06], [-0.06, 0.0], [-0.06, 0.0], [-0.04, 0.01], [-0.06, 0.0], [-0.03, 0.09], [-0.04, 0.01], [-0.04, -0.0], [-0.07, 0.02], [-0.09, 0.07], [-0.06, 0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.07, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.04], [-0.06, 0.01], [-0.04, 0.06], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.07, 0.01]], [[-0.07, 0.02], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.04, -0.0], [-0.01, 0.13], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.04, -0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.08, 0.03], [-0.04, 0.08], [-0.06, 0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.03, 0.03], [-0.03, 0.03], [-0.04, 0.06], [-0.03, 0.02], [-0.07, 0.02], [-0.03, 0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.04, 0.0], [-0.03, 0.04], [-0.05, -0.01], [-0.06, 0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.0], [-0.06, 0.01], [-0.03, 0.03], [-0.07, 0.02], [-0.07, 0.02], [-0.06, 0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.01], [-0.05, -0.0], [-0.04, -0.0], [-0.06, 0.0], [-0.04, 0.0], [-0.07, 0.01], [-0.03, 0.03]], [[-0.05, -0.01], [-0.04, 0.01], [-0.04, -0.0], [-0.06, 0.01], [-0.07, 0.02], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.03, 0.03], [-0.07, 0.02], [-0.07, 0.01], [-0.06, 0.0], [-0.03, 0.03], [-0.1, 0.09], [-0.06, 0.0], [-0.01, 0.13], [-0.04, 0.06], [-0.08, 0.06], [-0.07, 0.02], [-0.04, 0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.05], [-0.04, 0.06], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.08], [-0.05, -0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.04, 0.09], [-0.06, 0.0], [-0.04, 0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.04, 0.0], [-0.02, 0.12], [-0.03, 0.03], [-0.04, 0.06], [-0.04, 0.0]], [[-0.07, 0.02], [-0.04, 0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.06, 0.0], [-0.04, 0.06], [-0.03, 0.03], [-0.07, 0.01], [-0.04, 0.01], [-0.06, 0.01], [-0.05, -0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.04], [-0.06, 0.01], [-0.07, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.06, 0.01], [-0.03, 0.1], [-0.06, 0.0], [-0.04, 0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.08, 0.04], [-0.04, 0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.03], [-0.07, 0.01], [-0.07, 0.02], [-0.03, 0.01], [-0.04, 0.05], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.06, 0.01], [-0.06, -0.0], [-0.03, 0.04], [-0.04, 0.07]], [[-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.03, 0.1], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.07, 0.02], [-0.06, 0.0], [-0.04, -0.0], [-0.03, 0.04], [-0.04, -0.0], [-0.05, -0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.04, 0.01], [-0.03, 0.02], [-0.07, 0.02], [-0.07, 0.02], [-0.04, 0.05], [-0.07, 0.02], [-0.07, 0.02], [-0.08, 0.04], [-0.04, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.08, 0.04], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.01], [-0.06, 0.0], [-0.03, 0.02], [-0.03, 0.02], [-0.03, 0.04], [-0.05, -0.01], [-0.07, 0.03], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.05], [-0.03, 0.03], [-0.07, 0.02], [-0.06, 0.0], [-0.06, 0.01]], [[-0.04, 0.06], [-0.04, 0.0], [-0.03, 0.1], [-0.05, -0.0], [-0.04, 0.08], [-0.06, 0.01], [-0.07, 0.02], [-0.03, 0.04], [-0.04, 0.05], [-0.04, -0.0], [-0.07, 0.02], [-0.04, 0.07], [-0.05, -0.01], [-0.06, -0.0], [-0.07, 0.02], [-0.07, 0.02], [-0.07, 0.03], [-0.03, 0.04], [-0.07, 0.02], [-0.06, 0.01], [-0.05, -0.02], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.09, 0.06], [-0.05, -0.0], [-0.06, 0.0], [-0.07, 0.01], [-0.07, 0.02], [-0.01, 0.13], [-0.07, 0.03], [-0.06, 0.0], [-0.06, 0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.04, 0.0], [-0.06, 0.0], [-0.04, 0.06], [-0.06, 0.0], [-0.05, -0.01], [-0.08, 0.03], [-0.05, -0.01], [-0.08, 0.05], [-0.03, 0.01], [-0.05, -0.01], [-0.04, 0.01], [-0.05, -0.02], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.01]], [[-0.04, 0.05], [-0.07, 0.01], [-0.04, 0.07], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.04], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.0], [-0.08, 0.04], [-0.05, -0.01], [-0.06, 0.0], [-0.06, -0.0], [-0.06, 0.0], [-0.06, 0.01], [-0.03, 0.04], [-0.04, -0.0], [-0.04, 0.05], [-0.07, 0.02], [-0.07, 0.01], [-0.05, -0.01], [-0.06, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.08, 0.04], [-0.03, 0.01], [-0.04, 0.06], [-0.04, 0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.08, 0.04], [-0.07, 0.01], [-0.04, 0.09], [-0.08, 0.05], [-0.06, 0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.03], [-0.05, -0.0], [-0.04, -0.0], [-0.06, 0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.06, -0.0], [-0.03, 0.02]], [[-0.04, -0.0], [-0.06, 0.0], [-0.06, 0.01], [-0.06, 0.0], [-0.03, 0.04], [-0.03, 0.04], [-0.04, -0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.04, 0.06], [-0.07, 0.03], [-0.04, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.04], [-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.03, 0.03], [-0.03, 0.02], [-0.04, 0.05], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.04, 0.05], [-0.05, -0.01], [-0.04, 0.07], [-0.04, 0.0], [-0.06, 0.01], [-0.06, 0.0], [-0.03, 0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.01]], [[-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.04, -0.0], [-0.07, 0.02], [-0.04, 0.05], [-0.03, 0.02], [-0.07, 0.03], [-0.07, 0.01], [-0.04, 0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.04, 0.0], [-0.07, 0.02], [-0.03, 0.03], [-0.05, -0.01], [-0.04, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.03], [-0.06, 0.0], [-0.03, 0.1], [-0.05, -0.01], [-0.04, 0.05], [-0.05, -0.01], [-0.07, 0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.08], [-0.07, 0.02], [-0.08, 0.04], [-0.04, 0.0], [-0.02, 0.11], [-0.06, 0.0], [-0.06, 0.0], [-0.06, 0.01], [-0.04, 0.08], [-0.07, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.04, 0.05], [-0.04, 0.07]], [[-0.03, 0.04], [-0.05, -0.01], [-0.03, 0.02], [-0.07, 0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.06, -0.0], [-0.05, -0.0], [-0.03, 0.04], [-0.05, -0.01], [-0.08, 0.04], [-0.07, 0.02], [-0.07, 0.02], [-0.04, -0.0], [-0.08, 0.03], [-0.07, 0.03], [-0.07, 0.01], [-0.07, 0.02], [-0.06, 0.01], [-0.04, 0.07], [-0.05, -0.01], [-0.06, 0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.1], [-0.05, -0.01]], [[-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.04, 0.05], [-0.07, 0.01], [-0.07, 0.03], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.04, -0.0], [-0.05, -0.0], [-0.04, -0.0], [-0.04, -0.0], [-0.07, 0.01], [-0.07, 0.03], [-0.05, -0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.04, -0.0], [-0.03, 0.02], [-0.05, -0.0], [-0.04, -0.0], [-0.04, 0.0], [-0.07, 0.01], [-0.08, 0.03], [-0.09, 0.06], [-0.04, 0.05], [-0.04, 0.01], [-0.06, 0.0], [-0.04, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.03], [-0.03, 0.03]], [[-0.07, 0.02], [-0.05, -0.01], [-0.03, 0.03], [-0.04, -0.0], [-0.07, 0.02], [-0.04, 0.07], [-0.03, 0.03], [-0.06, 0.0], [-0.04, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.03], [-0.04, -0.0], [-0.03, 0.03], [-0.04, 0.0], [-0.06, -0.0], [-0.03, 0.04], [-0.06, -0.0], [-0.07, 0.03], [-0.05, -0.01], [-0.03, 0.1], [-0.04, 0.0], [-0.07, 0.02], [-0.04, 0.07], [-0.05, -0.01], [-0.06, -0.0], [-0.07, 0.01], [-0.09, 0.06], [-0.04, -0.0], [-0.05, -0.0], [-0.08, 0.04], [-0.06, 0.01], [-0.07, 0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.03], [-0.03, 0.01], [-0.08, 0.03], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.03], [-0.07, 0.01]], [[-0.05, -0.01], [-0.05, -0.0], [-0.04, 0.01], [-0.08, 0.04], [-0.06, 0.0], [-0.04, 0.05], [-0.06, 0.0], [-0.04, -0.0], [-0.04, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.04, 0.05], [-0.04, -0.0], [-0.03, 0.03], [-0.03, 0.03], [-0.05, -0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.04, 0.05], [-0.03, 0.02], [-0.06, 0.01], [-0.05, -0.01], [-0.03, 0.09], [-0.03, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.09, 0.07], [-0.05, -0.01], [-0.07, 0.03], [-0.05, -0.01], [-0.03, 0.02], [-0.08, 0.06], [-0.09, 0.08], [-0.07, 0.02], [-0.03, 0.04], [-0.05, -0.01], [-0.03, 0.02], [-0.06, 0.0], [-0.04, 0.05], [-0.07, 0.03], [-0.04, 0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.04, 0.07], [-0.07, 0.02], [-0.03, 0.04], [-0.05, -0.0], [-0.03, 0.02], [-0.07, 0.01]], [[-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.03, 0.03], [-0.05, -0.02], [-0.06, 0.01], [-0.03, 0.02], [-0.08, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.01], [-0.04, 0.05], [-0.04, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.06], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.05], [-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.03], [-0.05, -0.01], [-0.09, 0.07], [-0.07, 0.03], [-0.06, -0.0], [-0.07, 0.01], [-0.07, 0.03], [-0.05, -0.01]], [[-0.04, 0.01], [-0.07, 0.03], [-0.05, -0.01], [-0.03, 0.04], [-0.04, 0.0], [-0.07, 0.02], [-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.03], [-0.03, 0.1], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.06, 0.0], [-0.03, 0.03], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.04], [-0.03, 0.03], [-0.04, 0.07], [-0.08, 0.05], [-0.08, 0.03], [-0.08, 0.04], [-0.05, -0.0], [-0.03, 0.03], [-0.07, 0.02], [-0.04, 0.01], [-0.04, 0.01], [-0.03, 0.02], [-0.06, 0.01], [-0.06, -0.0], [-0.06, 0.0], [-0.04, -0.0], [-0.04, -0.0], [-0.06, -0.0], [-0.07, 0.01], [-0.08, 0.03], [-0.06, 0.01], [-0.07, 0.03], [-0.06, 0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.04, 0.0], [-0.03, 0.04], [-0.04, 0.08], [-0.01, 0.13], [-0.03, 0.03]], [[-0.04, 0.06], [-0.07, 0.01], [-0.06, 0.01], [-0.04, 0.07], [-0.07, 0.02], [-0.03, 0.02], [-0.04, 0.05], [-0.03, 0.1], [-0.07, 0.01], [-0.06, -0.0], [-0.05, -0.01], [-0.06, -0.0], [-0.08, 0.04], [-0.05, -0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.03], [-0.04, 0.01], [-0.05, -0.0], [-0.07, 0.02], [-0.04, 0.01], [-0.07, 0.02], [-0.03, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.08], [-0.06, 0.01], [-0.07, 0.02], [-0.04, 0.06], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.0], [-0.05, -0.01], [-0.04, 0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.08, 0.04], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.04, -0.0], [-0.03, 0.03], [-0.04, 0.0], [-0.04, -0.0]], [[-0.05, -0.01], [-0.06, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.0], [-0.04, -0.0], [-0.07, 0.01], [-0.06, 0.0], [-0.03, 0.04], [-0.05, -0.01], [-0.04, -0.0], [-0.04, 0.0], [-0.08, 0.05], [-0.03, 0.02], [-0.04, 0.0], [-0.05, -0.01], [-0.04, 0.05], [-0.03, 0.03], [-0.04, 0.07], [-0.03, 0.03], [-0.04, 0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.06, -0.0], [-0.06, 0.0], [-0.03, 0.03], [-0.08, 0.04], [-0.06, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.05], [-0.04, 0.0], [-0.06, 0.0], [-0.04, 0.0], [-0.06, 0.01], [-0.07, 0.03], [-0.05, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.04, -0.0], [-0.04, 0.05], [-0.06, 0.0], [-0.07, 0.01]], [[-0.07, 0.02], [-0.04, 0.08], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.06, 0.0], [-0.04, 0.0], [-0.07, 0.02], [-0.04, -0.0], [-0.07, 0.01], [-0.09, 0.07], [-0.03, 0.02], [-0.07, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.03, 0.03], [-0.07, 0.01], [-0.03, 0.04], [-0.05, -0.0], [-0.03, 0.04], [-0.04, 0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.02, 0.11], [-0.05, -0.0], [-0.06, 0.0], [-0.04, -0.0], [-0.06, 0.0], [-0.04, 0.0], [-0.06, 0.01], [-0.06, 0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.04, -0.0], [-0.08, 0.04], [-0.05, -0.01], [-0.06, 0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.03, 0.09], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.03, 0.03]], [[-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.09, 0.07], [-0.03, 0.03], [-0.03, 0.03], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.06, 0.01], [-0.09, 0.07], [-0.03, 0.04], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.02], [-0.03, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.06], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.0], [-0.03, 0.03], [-0.02, 0.11], [-0.05, -0.01], [-0.06, -0.0], [-0.04, -0.0], [-0.07, 0.01], [-0.03, 0.03], [-0.04, 0.01], [-0.07, 0.01], [-0.05, -0.0], [-0.06, 0.0], [-0.05, -0.01]], [[-0.05, -0.02], [-0.05, -0.01], [-0.03, 0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.07, 0.01], [-0.05, -0.0], [-0.06, -0.0], [-0.04, 0.0], [-0.04, 0.05], [-0.07, 0.01], [-0.08, 0.03], [-0.04, 0.06], [-0.09, 0.08], [-0.04, -0.0], [-0.03, 0.04], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.04], [-0.07, 0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.06, 0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.04, 0.09], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.05], [-0.08, 0.04], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.04, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.06, 0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.04, 0.01]], [[-0.07, 0.01], [-0.03, 0.03], [-0.06, 0.01], [-0.07, 0.03], [-0.07, 0.01], [-0.08, 0.03], [-0.04, 0.0], [-0.07, 0.02], [-0.07, 0.03], [-0.06, 0.01], [-0.06, -0.0], [-0.08, 0.05], [-0.07, 0.03], [-0.03, 0.02], [-0.04, -0.0], [-0.03, 0.02], [-0.06, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.04, 0.0], [-0.03, 0.03], [-0.07, 0.03], [-0.08, 0.05], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.04, 0.06], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.09], [-0.07, 0.02], [-0.06, 0.0], [-0.03, 0.02], [-0.06, 0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.07, 0.03], [-0.06, 0.0], [-0.06, -0.0], [-0.04, 0.08], [-0.06, -0.0], [-0.03, 0.04], [-0.03, 0.03], [-0.03, 0.04], [-0.03, 0.04], [-0.05, -0.01], [-0.03, 0.02], [-0.08, 0.06]], [[-0.03, 0.04], [-0.06, 0.0], [-0.04, 0.01], [-0.04, 0.0], [-0.05, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.0], [-0.07, 0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.04, -0.0], [-0.07, 0.02], [-0.03, 0.01], [-0.03, 0.1], [-0.04, -0.0], [-0.08, 0.05], [-0.04, 0.05], [-0.05, -0.01], [-0.07, 0.02], [-0.01, 0.13], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.01], [-0.03, 0.03], [-0.05, -0.0], [-0.05, -0.02], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.0], [-0.07, 0.02], [-0.03, 0.04], [-0.04, 0.0], [-0.07, 0.01], [-0.03, 0.04]], [[-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.06, -0.0], [-0.03, 0.03], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.03], [-0.05, -0.01], [-0.06, 0.0], [-0.06, -0.0], [-0.07, 0.01], [-0.04, 0.05], [-0.04, 0.05], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.06], [-0.07, 0.02], [-0.07, 0.03], [-0.04, 0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.03, 0.02], [-0.03, 0.03], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.03], [-0.05, -0.0], [-0.07, 0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.07, 0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.04, 0.08], [-0.04, 0.07], [-0.06, 0.01], [-0.07, 0.02]], [[-0.05, -0.01], [-0.04, 0.0], [-0.04, 0.0], [-0.03, 0.03], [-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.07, 0.01], [-0.07, 0.03], [-0.07, 0.02], [-0.04, 0.01], [-0.03, 0.03], [-0.03, 0.02], [-0.03, 0.03], [-0.04, -0.0], [-0.06, 0.01], [-0.03, 0.02], [-0.04, 0.06], [-0.03, 0.03], [-0.06, 0.0], [-0.03, 0.03], [-0.09, 0.06], [-0.03, 0.01], [-0.03, 0.02], [-0.05, -0.0], [-0.03, 0.02], [-0.06, 0.01], [-0.04, 0.05], [-0.03, 0.03], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.07], [-0.03, 0.02], [-0.04, 0.07], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.04, -0.0], [-0.06, -0.0], [-0.06, 0.01], [-0.04, 0.0], [-0.06, 0.01], [-0.07, 0.01], [-0.04, 0.01]], [[-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.07, 0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.04, 0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.08, 0.05], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.06, 0.01], [-0.04, -0.0], [-0.04, 0.0], [-0.06, 0.0], [-0.03, 0.03], [-0.05, -0.0], [-0.03, 0.04], [-0.05, -0.01], [-0.04, 0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.0], [-0.03, 0.1], [-0.08, 0.05], [-0.07, 0.02], [-0.07, 0.01], [-0.03, 0.09], [-0.05, -0.01], [-0.03, 0.03], [-0.04, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.07, 0.01], [-0.07, 0.01], [-0.03, 0.04], [-0.06, 0.01], [-0.05, -0.01], [-0.03, 0.01]], [[-0.07, 0.02], [-0.05, -0.01], [-0.02, 0.11], [-0.05, -0.01], [-0.03, 0.03], [-0.04, 0.05], [-0.03, 0.01], [-0.03, 0.1], [-0.08, 0.04], [-0.03, 0.03], [-0.03, 0.03], [-0.04, -0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.04, -0.0], [-0.07, 0.01], [-0.04, -0.0], [-0.05, -0.0], [-0.03, 0.04], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.09], [-0.06, 0.0], [-0.09, 0.07], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.0], [-0.08, 0.03], [-0.07, 0.02], [-0.04, -0.0], [-0.07, 0.03], [-0.06, 0.0], [-0.04, 0.05], [-0.03, 0.03], [-0.04, -0.0], [-0.07, 0.01], [-0.03, 0.03], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.0], [-0.03, 0.1], [-0.03, 0.03], [-0.08, 0.04], [-0.06, 0.0], [-0.04, 0.07], [-0.06, -0.0], [-0.06, 0.0], [-0.04, -0.0], [-0.05, -0.0], [-0.07, 0.02]], [[-0.04, 0.0], [-0.03, 0.02], [-0.07, 0.01], [-0.07, 0.02], [-0.04, 0.07], [-0.05, -0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.03], [-0.07, 0.01], [-0.07, 0.01], [-0.04, 0.0], [-0.03, 0.02], [-0.06, 0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.07, 0.01], [-0.08, 0.06], [-0.06, 0.01], [-0.04, 0.0], [-0.06, 0.01], [-0.04, 0.0], [-0.06, -0.0], [-0.01, 0.12], [-0.01, 0.12], [-0.06, 0.0], [-0.04, 0.01], [-0.04, 0.04], [-0.04, 0.05], [-0.07, 0.02], [-0.05, -0.01], [-0.08, 0.05], [-0.06, 0.0], [-0.03, 0.03], [-0.04, 0.05], [-0.05, -0.0], [-0.06, 0.0], [-0.02, 0.11], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.01], [-0.04, 0.08], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.06, 0.01]], [[-0.03, 0.02], [-0.07, 0.02], [-0.07, 0.02], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.09], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.04, -0.0], [-0.08, 0.04], [-0.03, 0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.06, -0.0], [-0.06, 0.0], [-0.04, -0.0], [-0.05, -0.0], [-0.04, 0.0], [-0.05, -0.01], [-0.07, 0.03], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.04], [-0.03, 0.03], [-0.07, 0.02], [-0.07, 0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.06, 0.01], [-0.07, 0.02], [-0.07, 0.01], [-0.05, -0.01]], [[-0.04, -0.0], [-0.06, -0.0], [-0.05, -0.01], [-0.08, 0.04], [-0.06, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.07], [-0.05, -0.0], [-0.05, -0.01], [-0.08, 0.04], [-0.03, 0.02], [-0.07, 0.02], [-0.05, -0.0], [-0.06, 0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.0], [-0.08, 0.04], [-0.05, -0.01], [-0.05, -0.0], [-0.06, 0.0], [-0.03, 0.02], [-0.04, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.03, 0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.02, 0.12], [-0.05, -0.02], [-0.03, 0.03], [-0.06, 0.01], [-0.07, 0.03], [-0.04, -0.0], [-0.04, 0.01], [-0.07, 0.02]], [[-0.07, 0.01], [-0.04, -0.0], [-0.03, 0.04], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.07, 0.01], [-0.03, 0.04], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.03, 0.02], [-0.07, 0.03], [-0.06, -0.0], [-0.05, -0.01], [-0.03, 0.04], [-0.04, 0.0], [-0.06, -0.0], [-0.04, -0.0], [-0.04, 0.08], [-0.06, -0.0], [-0.04, 0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.08, 0.04], [-0.05, -0.0], [-0.03, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.04, -0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.05], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.06, -0.0], [-0.04, 0.08], [-0.07, 0.02]], [[-0.04, 0.01], [-0.04, 0.08], [-0.04, 0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.01], [-0.04, 0.08], [-0.06, 0.0], [-0.07, 0.02], [-0.03, 0.04], [-0.07, 0.02], [-0.06, 0.01], [-0.07, 0.01], [-0.03, 0.02], [-0.07, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.07, 0.02], [-0.04, 0.05], [-0.03, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.0], [-0.04, 0.05], [-0.06, -0.0], [-0.06, 0.0], [-0.04, 0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.08, 0.04], [-0.03, 0.03], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.04, 0.05]], [[-0.03, 0.02], [-0.06, 0.01], [-0.05, -0.0], [-0.07, 0.01], [-0.04, 0.0], [-0.06, 0.0], [-0.04, 0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.04, -0.0], [-0.03, 0.04], [-0.03, 0.03], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.07], [-0.06, 0.01], [-0.06, -0.0], [-0.06, 0.0], [-0.08, 0.03], [-0.04, -0.0], [-0.05, -0.01], [-0.03, 0.04], [-0.05, -0.0], [-0.07, 0.02], [-0.03, 0.03], [-0.05, -0.01], [-0.08, 0.04], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.04, 0.06], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.04, 0.06], [-0.04, 0.06], [-0.05, -0.01], [-0.08, 0.03], [-0.04, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.0], [-0.07, 0.02], [-0.04, 0.05], [-0.08, 0.03], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.01]], [[-0.05, -0.01], [-0.06, 0.0], [-0.08, 0.03], [-0.03, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.04], [-0.07, 0.02], [-0.03, 0.03], [-0.03, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.08, 0.03], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.0], [-0.06, -0.0], [-0.08, 0.04], [-0.06, 0.0], [-0.06, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.04, 0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.04, 0.05], [-0.04, -0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.02, 0.11], [-0.05, -0.0], [-0.08, 0.05], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.03], [-0.06, 0.0], [-0.07, 0.02], [-0.03, 0.01], [-0.03, 0.04]], [[-0.05, -0.0], [-0.07, 0.01], [-0.08, 0.03], [-0.04, -0.0], [-0.03, 0.02], [-0.05, -0.0], [-0.06, 0.0], [-0.02, 0.11], [-0.04, 0.07], [-0.04, -0.0], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.03], [-0.04, -0.0], [-0.07, 0.02], [-0.07, 0.03], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.08, 0.04], [-0.04, 0.0], [-0.06, 0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.06, -0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.04, -0.0], [-0.03, 0.04], [-0.04, -0.0], [-0.06, 0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.08, 0.04], [-0.06, 0.01], [-0.03, 0.04], [-0.07, 0.03], [-0.03, 0.03], [-0.06, -0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.03, 0.1], [-0.04, 0.04]], [[-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.08], [-0.05, -0.0], [-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.03], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.01], [-0.06, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.04, 0.0], [-0.07, 0.02], [-0.03, 0.03], [-0.05, -0.0], [-0.04, 0.06], [-0.03, 0.04], [-0.07, 0.01], [-0.05, -0.0], [-0.06, 0.0], [-0.04, -0.0], [-0.04, -0.0], [-0.04, 0.06], [-0.07, 0.02], [-0.07, 0.01], [-0.04, 0.07], [-0.07, 0.02], [-0.05, -0.0], [-0.05, -0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.05], [-0.07, 0.02], [-0.04, 0.06], [-0.03, 0.02], [-0.06, 0.0], [-0.06, 0.01], [-0.06, -0.0]], [[-0.03, 0.02], [-0.07, 0.01], [-0.06, 0.0], [-0.03, 0.02], [-0.04, 0.06], [-0.06, 0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.04], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.08], [-0.09, 0.06], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.0], [-0.04, -0.0], [-0.04, -0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.04, 0.08], [-0.09, 0.06], [-0.04, 0.08], [-0.05, -0.01], [-0.07, 0.03], [-0.05, -0.0], [-0.07, 0.01], [-0.03, 0.03], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.08], [-0.07, 0.02], [-0.07, 0.02], [-0.07, 0.03], [-0.03, 0.04], [-0.04, 0.06], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.03], [-0.06, 0.0], [-0.07, 0.02], [-0.04, 0.0]], [[-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.02], [-0.04, 0.06], [-0.03, 0.03], [-0.06, 0.0], [-0.07, 0.03], [-0.07, 0.02], [-0.06, 0.01], [-0.08, 0.04], [-0.06, -0.0], [-0.06, 0.01], [-0.05, -0.0], [-0.04, -0.0], [-0.04, 0.07], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.03], [-0.07, 0.01], [-0.12, 0.12], [-0.05, -0.01], [-0.05, -0.01], [-0.06, -0.0], [-0.03, 0.02], [-0.05, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.1], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.03], [-0.04, 0.06], [-0.06, 0.0], [-0.03, 0.02], [-0.04, 0.0], [-0.04, 0.01], [-0.04, -0.0], [-0.04, 0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.04, -0.0], [-0.04, -0.0], [-0.05, -0.0], [-0.06, 0.0]], [[-0.06, 0.01], [-0.04, 0.05], [-0.04, -0.0], [-0.04, -0.0], [-0.06, 0.0], [-0.07, 0.03], [-0.07, 0.03], [-0.04, 0.07], [-0.07, 0.01], [-0.07, 0.01], [-0.03, 0.04], [-0.07, 0.03], [-0.03, 0.02], [-0.06, 0.0], [-0.04, 0.07], [-0.05, -0.0], [-0.07, 0.02], [-0.05, -0.0], [-0.07, 0.03], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.1], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.0], [-0.04, 0.01], [-0.05, -0.01], [-0.07, 0.03], [-0.04, -0.0], [-0.05, -0.0], [-0.07, 0.02], [-0.05, -0.0], [-0.07, 0.03], [-0.04, 0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.04, -0.0], [-0.06, -0.0], [-0.03, 0.04], [-0.03, 0.03], [-0.05, -0.01], [-0.03, 0.03], [-0.04, 0.0], [-0.05, -0.01]], [[-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.08, 0.04], [-0.05, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.04, 0.0], [-0.07, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.06, 0.01], [-0.04, -0.0], [-0.08, 0.03], [-0.03, 0.02], [-0.05, -0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.03, 0.02], [-0.05, -0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.07, 0.01], [-0.05, -0.0], [0.01, 0.15], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.0], [-0.07, 0.03], [-0.04, 0.0], [-0.03, 0.03], [-0.04, 0.06], [-0.08, 0.03], [-0.06, 0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.04, 0.07], [-0.05, -0.01], [-0.04, 0.07], [-0.07, 0.02]], [[-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.02], [-0.05, -0.01], [-0.08, 0.04], [-0.05, -0.01], [-0.08, 0.04], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.03], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.03], [-0.02, 0.12], [-0.05, -0.01], [-0.04, -0.0], [-0.07, 0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.02], [-0.08, 0.04], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.04, -0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.03, 0.02], [-0.06, 0.01], [-0.02, 0.11], [-0.07, 0.02], [-0.05, -0.01], [-0.08, 0.04], [-0.06, 0.0], [-0.04, 0.08], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.07, 0.02]], [[-0.07, 0.01], [-0.03, 0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.08, 0.04], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.03, 0.04], [-0.07, 0.01], [-0.04, -0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.03, 0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.07, 0.01], [-0.07, 0.02], [-0.04, 0.08], [-0.05, -0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.01], [-0.02, 0.11], [-0.03, 0.04], [-0.04, 0.05], [-0.06, 0.0], [-0.08, 0.03], [-0.03, 0.02], [-0.07, 0.01], [-0.04, 0.05], [-0.04, 0.07], [-0.02, 0.11], [-0.07, 0.03], [-0.07, 0.01], [-0.03, 0.04], [-0.05, -0.01], [-0.05, -0.02]], [[-0.03, 0.02], [-0.06, 0.0], [-0.03, 0.09], [-0.05, -0.01], [-0.03, 0.02], [-0.07, 0.02], [-0.04, 0.09], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.02, 0.11], [-0.03, 0.03], [-0.05, -0.01], [-0.04, 0.01], [-0.03, 0.03], [-0.04, 0.0], [-0.04, 0.0], [-0.04, 0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.04, 0.0], [-0.07, 0.02], [-0.04, 0.0], [-0.05, -0.0], [-0.07, 0.02], [-0.04, 0.07], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.03, 0.02], [-0.07, 0.03], [-0.05, -0.01], [-0.04, -0.0], [-0.04, -0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.08, 0.04], [-0.04, 0.08], [-0.05, -0.01], [-0.04, 0.0], [-0.07, 0.02], [-0.07, 0.02], [-0.04, 0.07], [-0.05, -0.01], [-0.03, 0.02]], [[-0.07, 0.03], [-0.03, 0.03], [-0.06, 0.01], [-0.06, -0.0], [-0.06, 0.0], [-0.07, 0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.08, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.06, 0.0], [-0.01, 0.13], [-0.04, 0.06], [-0.07, 0.02], [-0.08, 0.04], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.07], [-0.06, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.04, 0.0], [-0.05, -0.0], [-0.05, -0.0], [-0.06, 0.01], [-0.07, 0.02], [-0.07, 0.01], [-0.03, 0.03], [-0.04, 0.09], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.06, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01]], [[0.0, 0.14], [-0.05, -0.01], [-0.08, 0.04], [-0.03, 0.03], [-0.07, 0.02], [-0.03, 0.04], [-0.05, -0.01], [-0.07, 0.03], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.02], [-0.08, 0.03], [-0.05, -0.01], [-0.04, 0.0], [-0.03, 0.09], [-0.04, 0.0], [-0.03, 0.02], [-0.05, -0.0], [-0.06, 0.0], [-0.04, 0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.06, 0.0], [-0.03, 0.04], [-0.08, 0.04], [-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.01], [-0.07, 0.02], [-0.08, 0.05], [-0.03, 0.03], [-0.05, -0.0], [-0.04, -0.0], [-0.03, 0.03], [-0.05, -0.0], [-0.06, 0.0], [-0.03, 0.03], [-0.03, 0.03], [-0.06, 0.0], [-0.01, 0.13], [-0.06, 0.0], [-0.04, 0.0], [-0.04, 0.06], [-0.06, 0.0], [-0.05, -0.01], [-0.08, 0.04], [-0.06, 0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.04, 0.06]], [[-0.07, 0.02], [-0.06, 0.0], [-0.07, 0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.07, 0.03], [-0.02, 0.11], [-0.06, 0.01], [-0.06, 0.01], [-0.04, -0.0], [-0.04, 0.01], [-0.04, 0.05], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.04], [-0.06, -0.0], [-0.07, 0.03], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.0], [-0.06, 0.0], [-0.04, 0.07], [-0.06, -0.0], [-0.06, 0.01], [-0.06, 0.01], [-0.03, 0.09], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.09], [-0.04, -0.0], [-0.04, 0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.0], [0.02, 0.17], [-0.06, 0.0], [-0.07, 0.03], [-0.05, -0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.01], [-0.07, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.05]], [[-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.03], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.06, 0.01], [-0.06, 0.0], [-0.03, 0.03], [-0.04, 0.06], [-0.05, -0.01], [-0.04, 0.01], [-0.06, 0.0], [-0.04, 0.04], [-0.04, 0.06], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.04, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.07, 0.03], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.08, 0.04], [-0.07, 0.03], [-0.07, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.01], [-0.06, 0.01], [-0.04, 0.06], [-0.07, 0.02], [-0.04, 0.05], [-0.03, 0.02]], [[-0.05, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.01], [-0.05, -0.0], [-0.07, 0.03], [-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.03, 0.03], [-0.05, -0.0], [-0.07, 0.01], [-0.07, 0.03], [-0.06, 0.0], [-0.04, 0.01], [-0.05, -0.0], [-0.07, 0.02], [-0.04, 0.05], [-0.05, -0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.07, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.08, 0.03], [-0.03, 0.01], [-0.06, 0.0], [-0.04, 0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.0], [-0.04, 0.05], [-0.05, -0.01], [-0.07, 0.03], [-0.03, 0.04], [-0.03, 0.01], [-0.06, 0.01], [-0.03, 0.03], [-0.09, 0.06], [-0.04, 0.01], [-0.03, 0.1], [-0.04, 0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.07, 0.02]], [[-0.04, 0.08], [-0.04, 0.08], [-0.05, -0.0], [-0.03, 0.03], [-0.06, -0.0], [-0.04, 0.06], [-0.05, -0.01], [-0.04, 0.06], [-0.05, -0.02], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.04, 0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.02], [-0.04, 0.0], [-0.07, 0.01], [-0.05, -0.0], [-0.04, -0.0], [-0.04, -0.0], [-0.04, 0.06], [-0.04, -0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.04, -0.0], [-0.06, -0.0], [-0.03, 0.04], [-0.07, 0.03], [-0.04, -0.0], [-0.04, 0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.01], [-0.03, 0.04], [-0.04, 0.04], [-0.07, 0.03], [-0.03, 0.02], [-0.03, 0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.06, 0.01]], [[-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.03], [-0.05, -0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.04, 0.01], [-0.06, 0.0], [-0.04, 0.07], [-0.06, 0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.1], [-0.06, -0.0], [-0.04, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.03, 0.01], [-0.07, 0.01], [-0.04, 0.07], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.04, 0.06], [-0.07, 0.02], [-0.06, 0.0], [-0.08, 0.04], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.01, 0.12], [-0.07, 0.01], [-0.04, 0.07], [-0.06, 0.0], [-0.06, -0.0], [-0.04, 0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.04, -0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.02], [-0.03, 0.02], [-0.06, 0.0], [-0.02, 0.11]], [[-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.07, 0.03], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.03], [-0.04, 0.0], [-0.04, -0.0], [-0.07, 0.02], [-0.05, -0.0], [-0.03, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.01], [-0.06, 0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.03], [-0.08, 0.06], [-0.06, 0.0], [-0.09, 0.06], [-0.08, 0.05], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.0], [-0.08, 0.03], [-0.08, 0.04], [-0.06, 0.0], [-0.04, -0.0], [-0.06, 0.01]], [[-0.06, 0.0], [-0.08, 0.04], [-0.04, 0.0], [-0.04, 0.07], [-0.04, 0.05], [-0.04, 0.0], [-0.04, 0.0], [-0.01, 0.13], [-0.03, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.01], [-0.08, 0.04], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.02, 0.11], [-0.07, 0.02], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.04, 0.01], [-0.04, 0.08], [-0.07, 0.02], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.04, 0.07], [-0.03, 0.02], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.06, -0.0], [-0.03, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.03], [-0.05, -0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.04, 0.05], [-0.05, -0.01], [-0.08, 0.05], [-0.05, -0.01], [-0.03, 0.09], [-0.07, 0.02], [-0.07, 0.02], [-0.03, 0.04]], [[-0.04, -0.0], [-0.03, 0.02], [-0.06, 0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.07, 0.03], [-0.06, 0.01], [-0.08, 0.03], [-0.04, 0.08], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.04, -0.0], [-0.05, -0.01], [-0.06, -0.0], [-0.04, 0.05], [-0.03, 0.03], [-0.05, -0.01], [-0.07, 0.01], [-0.07, 0.02], [-0.06, 0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.07, 0.03], [-0.07, 0.02], [-0.05, -0.01], [-0.0, 0.13], [-0.07, 0.01], [-0.08, 0.04], [-0.05, -0.01], [-0.06, -0.0], [-0.09, 0.07], [-0.06, 0.0], [-0.04, -0.0], [-0.06, 0.0], [-0.03, 0.03], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.08, 0.03], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.06, 0.0]], [[-0.04, 0.06], [-0.07, 0.02], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.01], [-0.04, 0.06], [-0.07, 0.01], [-0.04, 0.05], [-0.04, 0.01], [-0.03, 0.02], [-0.05, -0.0], [-0.04, 0.07], [-0.06, 0.0], [-0.07, 0.02], [-0.07, 0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.07, 0.02], [-0.07, 0.03], [-0.06, 0.0], [-0.07, 0.01], [-0.04, 0.08], [-0.04, -0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.04, -0.0], [-0.03, 0.03], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.01], [-0.06, 0.0], [-0.03, 0.04], [-0.04, 0.08], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.01], [-0.06, 0.0], [-0.04, -0.0], [-0.07, 0.03], [-0.05, -0.01], [-0.03, 0.1], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.09], [-0.05, -0.0], [-0.04, 0.01], [-0.04, -0.0]], [[-0.04, 0.05], [-0.04, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.03, 0.02], [-0.03, 0.04], [-0.03, 0.03], [-0.05, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.03, 0.03], [-0.02, 0.11], [-0.05, -0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.04, 0.06], [-0.06, 0.0], [-0.06, -0.0], [-0.03, 0.04], [-0.05, -0.01], [0.0, 0.14], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.01], [-0.07, 0.02], [-0.03, 0.09], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.03, 0.02], [-0.03, 0.04], [-0.06, 0.0], [-0.06, 0.01], [-0.06, 0.0], [-0.08, 0.04], [-0.04, 0.06], [-0.05, -0.0], [-0.04, -0.0], [-0.06, 0.01]], [[-0.07, 0.02], [-0.06, -0.0], [-0.07, 0.02], [-0.05, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.06], [-0.04, -0.0], [-0.05, -0.01], [-0.04, 0.06], [-0.08, 0.03], [-0.05, -0.0], [-0.06, 0.0], [-0.07, 0.03], [-0.06, 0.01], [-0.04, 0.05], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.03], [-0.06, 0.01], [-0.08, 0.06], [-0.09, 0.07], [-0.03, 0.04], [-0.04, 0.07], [-0.07, 0.01], [-0.07, 0.03], [-0.04, 0.07], [-0.05, -0.0], [-0.07, 0.02], [-0.03, 0.02], [-0.04, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.04, -0.0], [-0.05, -0.0], [-0.03, 0.02], [-0.07, 0.02], [-0.03, 0.04], [-0.03, 0.01], [-0.07, 0.01], [-0.06, 0.0], [-0.04, 0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.04, 0.05], [-0.04, 0.0], [-0.07, 0.02]], [[-0.05, -0.0], [-0.04, 0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.06, 0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.04, 0.04], [-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.04], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.02], [-0.04, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.06, 0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.06, 0.0], [-0.06, 0.0], [-0.08, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.08], [-0.05, -0.01], [-0.03, 0.02], [-0.04, -0.0], [-0.03, 0.04], [-0.06, 0.0], [-0.03, 0.04], [-0.03, 0.03], [-0.03, 0.02], [-0.05, -0.01], [-0.04, 0.07]], [[-0.06, 0.0], [-0.06, 0.0], [-0.03, 0.04], [-0.06, 0.0], [-0.03, 0.04], [-0.06, 0.01], [-0.04, -0.0], [-0.04, 0.0], [-0.04, 0.05], [-0.05, -0.0], [-0.06, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.01], [-0.06, 0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.02, 0.12], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.03, 0.02], [-0.05, -0.0], [-0.07, 0.02], [-0.03, 0.03], [-0.07, 0.02], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.02, 0.11], [-0.03, 0.04], [-0.05, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.01], [-0.04, 0.05], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.03], [-0.07, 0.01], [-0.05, -0.01], [-0.09, 0.07], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.04], [-0.06, 0.01], [-0.04, 0.06], [-0.05, -0.0], [-0.05, -0.01]], [[-0.04, -0.0], [-0.06, 0.0], [-0.04, -0.0], [-0.07, 0.03], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.0], [-0.03, 0.09], [-0.05, -0.01], [-0.03, 0.04], [-0.03, 0.03], [-0.02, 0.11], [-0.03, 0.03], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.08, 0.04], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.08], [-0.06, 0.01], [-0.08, 0.05], [-0.06, 0.01], [-0.08, 0.05], [-0.05, -0.0], [-0.05, -0.0], [-0.03, 0.03], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.02], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.08, 0.03], [-0.04, 0.05], [-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.03, 0.02], [-0.06, -0.0]], [[-0.08, 0.05], [-0.04, 0.09], [-0.06, 0.0], [-0.03, 0.04], [-0.07, 0.02], [-0.1, 0.1], [-0.06, 0.0], [-0.06, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.04, -0.0], [-0.04, 0.0], [-0.08, 0.05], [-0.05, -0.0], [-0.03, 0.04], [-0.04, 0.01], [-0.08, 0.04], [-0.03, 0.03], [-0.07, 0.02], [-0.04, -0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.04, -0.0], [-0.03, 0.09], [-0.04, -0.0], [-0.07, 0.02], [-0.04, 0.06], [-0.04, 0.06], [-0.05, -0.01], [-0.04, 0.08], [-0.04, -0.0], [-0.05, -0.01], [-0.06, -0.0], [-0.08, 0.06], [-0.07, 0.02], [-0.06, -0.0], [-0.05, -0.0], [-0.07, 0.02], [-0.04, 0.01], [-0.07, 0.02], [-0.06, -0.0], [-0.08, 0.03], [-0.05, -0.0], [-0.03, 0.02], [-0.04, -0.0], [-0.06, -0.0], [-0.03, 0.02], [-0.05, -0.0]], [[-0.03, 0.03], [-0.03, 0.09], [-0.04, -0.0], [-0.04, -0.0], [-0.05, -0.0], [-0.04, 0.04], [-0.07, 0.02], [-0.03, 0.02], [-0.05, -0.01], [-0.04, 0.06], [-0.05, -0.0], [-0.08, 0.04], [-0.06, 0.01], [-0.07, 0.02], [-0.07, 0.03], [-0.04, 0.05], [-0.03, 0.03], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.09], [-0.06, 0.0], [-0.03, 0.02], [-0.04, 0.05], [-0.04, 0.06], [-0.07, 0.02], [-0.06, 0.0], [-0.04, -0.0], [-0.06, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.05], [-0.03, 0.02], [-0.03, 0.03], [-0.04, -0.0], [-0.05, -0.01], [-0.04, 0.08], [-0.07, 0.02], [-0.05, -0.01], [-0.03, 0.03], [-0.07, 0.02], [-0.06, 0.01], [-0.07, 0.03], [-0.06, 0.01], [-0.03, 0.02], [-0.04, 0.0], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.04, -0.0]], [[-0.03, 0.02], [-0.05, -0.01], [-0.06, 0.01], [-0.07, 0.03], [-0.05, -0.01], [-0.06, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.02], [-0.06, 0.0], [-0.04, -0.0], [-0.03, 0.03], [-0.04, 0.01], [-0.04, -0.0], [-0.07, 0.02], [-0.09, 0.06], [-0.09, 0.06], [-0.04, 0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.03, 0.03], [-0.06, 0.0], [-0.04, 0.06], [-0.04, -0.0], [-0.07, 0.03], [-0.04, 0.0], [-0.06, 0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.04, -0.0], [-0.04, -0.0], [-0.06, 0.01], [-0.03, 0.04], [-0.05, -0.02], [-0.05, -0.01], [-0.02, 0.11], [-0.07, 0.02], [-0.04, -0.0], [-0.07, 0.02], [-0.04, -0.0], [-0.04, 0.06], [-0.05, -0.0], [-0.03, 0.02], [-0.06, 0.0], [-0.06, 0.01], [-0.04, -0.0], [-0.03, 0.01], [-0.04, 0.0], [-0.04, 0.01]], [[-0.06, 0.0], [-0.05, -0.0], [-0.04, 0.0], [-0.06, 0.01], [-0.04, -0.0], [-0.07, 0.02], [-0.04, 0.0], [-0.04, 0.05], [-0.03, 0.04], [-0.07, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.01], [-0.03, 0.02], [-0.06, 0.01], [-0.09, 0.07], [-0.07, 0.01], [-0.06, 0.0], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.02], [-0.05, -0.01], [-0.06, -0.0], [-0.05, -0.01], [-0.04, 0.06], [-0.07, 0.02], [-0.07, 0.01], [-0.07, 0.01], [-0.03, 0.04], [-0.04, -0.0], [-0.07, 0.01], [-0.07, 0.01], [-0.07, 0.01], [-0.04, 0.08], [-0.04, 0.05], [-0.04, -0.0], [-0.08, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, -0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.0], [-0.07, 0.01], [-0.05, -0.0], [-0.06, -0.0]], [[-0.06, 0.0], [-0.04, 0.0], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.06, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.05], [-0.07, 0.02], [-0.04, 0.07], [-0.06, 0.0], [-0.06, 0.01], [-0.08, 0.04], [-0.07, 0.01], [-0.04, 0.07], [-0.04, 0.06], [-0.07, 0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.04, 0.07], [-0.07, 0.02], [-0.04, -0.0], [-0.07, 0.02], [-0.07, 0.03], [-0.04, 0.0], [-0.07, 0.03], [-0.04, -0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.07, 0.03], [-0.04, 0.06], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.07], [-0.03, 0.04], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.03], [-0.05, -0.01], [-0.04, 0.0], [-0.03, 0.04], [-0.08, 0.03], [-0.05, -0.01], [-0.07, 0.01]], [[-0.07, 0.03], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.07, 0.01], [-0.03, 0.04], [-0.07, 0.01], [-0.03, 0.09], [-0.06, 0.01], [-0.05, -0.0], [-0.06, -0.0], [-0.05, -0.01], [-0.04, 0.08], [-0.05, -0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.04, 0.07], [-0.04, -0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.04, 0.01], [-0.04, 0.05], [-0.05, -0.0], [-0.04, 0.05], [-0.04, 0.05], [-0.06, 0.0], [-0.03, 0.09], [-0.05, -0.01], [-0.04, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.05], [-0.06, 0.01], [-0.04, 0.01], [-0.03, 0.02], [-0.04, -0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.03], [-0.03, 0.04], [-0.03, 0.04], [-0.05, -0.01], [-0.03, 0.04], [-0.07, 0.02]], [[-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.0], [-0.04, -0.0], [-0.03, 0.03], [-0.05, -0.0], [-0.08, 0.04], [-0.05, -0.01], [-0.04, 0.0], [-0.04, 0.06], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.06, -0.0], [-0.06, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.03], [-0.09, 0.06], [-0.05, -0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.04, -0.0], [-0.07, 0.01], [-0.03, 0.02], [-0.04, 0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.05, -0.02], [-0.05, -0.01], [-0.08, 0.04], [-0.07, 0.01], [-0.05, -0.0], [-0.04, 0.01], [-0.06, 0.0], [-0.04, 0.0], [-0.08, 0.04], [-0.03, 0.01], [-0.05, -0.0], [-0.04, 0.05], [-0.05, -0.0], [-0.03, 0.03]], [[-0.04, 0.08], [-0.07, 0.01], [-0.05, -0.0], [-0.05, -0.0], [-0.08, 0.03], [-0.07, 0.02], [-0.08, 0.05], [-0.03, 0.04], [-0.06, 0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.07, 0.03], [-0.04, 0.0], [-0.07, 0.02], [-0.06, 0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.0], [-0.04, 0.04], [-0.05, -0.0], [-0.04, -0.0], [-0.05, -0.0], [-0.04, 0.08], [-0.03, 0.04], [-0.04, -0.0], [-0.04, 0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.06], [-0.07, 0.03], [-0.04, -0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.03, 0.04], [-0.04, -0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.04, 0.08], [-0.05, -0.01], [-0.03, 0.02], [-0.07, 0.01], [-0.06, 0.0]], [[-0.07, 0.02], [-0.03, 0.02], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.0], [-0.03, 0.02], [-0.03, 0.02], [-0.09, 0.07], [-0.06, 0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.03, 0.09], [-0.04, -0.0], [-0.03, 0.01], [-0.07, 0.01], [-0.03, 0.03], [-0.04, 0.07], [-0.03, 0.01], [-0.09, 0.07], [-0.04, 0.06], [-0.04, 0.09], [-0.03, 0.04], [-0.05, -0.01], [-0.04, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.07], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.0], [-0.04, 0.0], [-0.04, 0.08], [-0.07, 0.02], [-0.05, -0.0], [-0.07, 0.02], [-0.04, 0.01], [-0.07, 0.03], [-0.03, 0.01], [-0.06, -0.0], [-0.03, 0.01], [-0.04, -0.0], [-0.04, 0.01], [-0.03, 0.03]], [[-0.06, 0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.04, 0.09], [-0.04, 0.08], [-0.06, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.04, -0.0], [-0.03, 0.02], [-0.06, 0.01], [-0.07, 0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.06, 0.01], [-0.08, 0.03], [-0.06, 0.01], [-0.03, 0.02], [-0.03, 0.04], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.06, -0.0], [-0.04, 0.06], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.04, -0.0], [-0.06, -0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.06, 0.01], [-0.03, 0.01], [-0.07, 0.03], [-0.06, 0.0], [-0.07, 0.02], [-0.06, -0.0], [-0.05, -0.0], [-0.04, 0.0], [-0.03, 0.04]], [[-0.05, -0.0], [-0.04, 0.07], [-0.06, 0.0], [-0.07, 0.01], [-0.07, 0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.04], [-0.03, 0.02], [-0.07, 0.01], [-0.06, 0.01], [-0.04, -0.0], [-0.03, 0.04], [-0.06, -0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.01], [-0.03, 0.02], [-0.03, 0.09], [-0.08, 0.04], [-0.06, -0.0], [-0.06, 0.01], [-0.03, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.05], [-0.06, -0.0], [-0.07, 0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.01], [-0.04, -0.0], [-0.04, 0.04], [-0.05, -0.01], [-0.04, 0.04], [-0.04, 0.06], [-0.03, 0.1], [-0.07, 0.01], [-0.03, 0.03], [-0.03, 0.03], [-0.03, 0.04], [-0.07, 0.02]], [[-0.07, 0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.04, -0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.04, 0.0], [-0.05, -0.0], [-0.07, 0.01], [-0.06, 0.0], [-0.04, 0.01], [-0.05, -0.0], [-0.04, 0.07], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.04, 0.08], [-0.07, 0.01], [-0.04, -0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.02], [-0.07, 0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.04], [-0.04, -0.0], [-0.04, 0.05], [-0.03, 0.1], [-0.06, 0.0], [-0.03, 0.03], [-0.07, 0.01], [-0.06, -0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.03, 0.02], [-0.04, 0.0], [-0.07, 0.03], [-0.05, -0.0], [-0.07, 0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.04]], [[-0.05, -0.0], [-0.07, 0.02], [-0.08, 0.05], [-0.07, 0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.03, 0.01], [0.01, 0.15], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.01], [-0.04, 0.0], [-0.05, -0.0], [-0.08, 0.05], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.04, -0.0], [-0.03, 0.02], [-0.07, 0.01], [-0.04, -0.0], [-0.03, 0.01], [-0.08, 0.04], [-0.05, -0.01], [-0.07, 0.01], [-0.02, 0.11], [-0.03, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.08, 0.04], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.03], [-0.07, 0.02], [-0.04, 0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.04, 0.07], [-0.07, 0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.04, 0.06], [-0.05, -0.01], [-0.04, 0.09], [-0.05, -0.01]], [[-0.04, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.0], [-0.07, 0.02], [-0.03, 0.03], [-0.06, 0.0], [-0.07, 0.03], [-0.03, 0.03], [-0.07, 0.02], [-0.03, 0.03], [-0.04, -0.0], [-0.04, -0.0], [-0.06, 0.01], [-0.03, 0.02], [-0.03, 0.04], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.02], [-0.07, 0.02], [-0.04, -0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.04, 0.05], [-0.07, 0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.06, -0.0], [-0.06, -0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.01], [-0.05, -0.0], [-0.04, -0.0], [-0.04, -0.0], [-0.04, 0.0], [-0.06, -0.0], [-0.05, -0.01], [-0.03, 0.04], [-0.04, -0.0], [-0.07, 0.02]], [[-0.03, 0.03], [-0.06, 0.0], [-0.06, 0.01], [-0.07, 0.02], [-0.04, -0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.04, -0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.06, 0.01], [-0.07, 0.02], [-0.05, -0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.07, 0.03], [-0.03, 0.01], [-0.07, 0.03], [-0.08, 0.04], [-0.07, 0.02], [-0.05, -0.01], [-0.08, 0.04], [-0.04, 0.0], [-0.03, 0.03], [-0.07, 0.02], [-0.03, 0.02], [-0.07, 0.02], [-0.07, 0.02], [-0.03, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.01], [-0.08, 0.03], [-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.04, -0.0], [-0.06, 0.0], [-0.06, 0.01], [-0.05, -0.0], [-0.04, -0.0]], [[-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.04], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.0], [-0.04, -0.0], [-0.03, 0.01], [-0.07, 0.02], [-0.06, -0.0], [-0.03, 0.04], [-0.07, 0.02], [-0.07, 0.02], [-0.04, 0.01], [-0.03, 0.1], [-0.05, -0.01], [-0.08, 0.04], [-0.03, 0.04], [-0.07, 0.02], [-0.04, 0.01], [-0.07, 0.01], [-0.04, -0.0], [-0.04, 0.05], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.01], [-0.04, 0.0], [-0.03, 0.04], [-0.05, -0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.04, 0.04], [-0.06, 0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.04, 0.0], [-0.07, 0.01], [-0.04, -0.0], [-0.07, 0.01], [-0.05, -0.02]], [[-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.01], [-0.07, 0.01], [-0.08, 0.03], [-0.06, 0.01], [-0.05, -0.0], [-0.06, 0.0], [-0.07, 0.01], [-0.03, 0.04], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.04, -0.0], [-0.04, -0.0], [-0.05, -0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.04, 0.06], [-0.03, 0.01], [-0.05, -0.01], [-0.04, 0.05], [-0.04, -0.0], [-0.03, 0.04], [-0.07, 0.01], [-0.06, 0.0], [-0.03, 0.03], [-0.05, -0.0], [-0.03, 0.02], [-0.04, 0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.06, -0.0], [-0.03, 0.03], [-0.06, 0.01], [-0.05, -0.0], [-0.03, 0.02], [-0.06, 0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.04, -0.0], [0.04, 0.18], [-0.06, 0.0]], [[-0.06, 0.01], [-0.06, 0.01], [-0.03, 0.02], [-0.07, 0.03], [-0.05, -0.02], [-0.07, 0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.07, 0.01], [-0.06, 0.0], [-0.03, 0.04], [-0.05, -0.0], [-0.07, 0.02], [-0.04, 0.04], [-0.05, -0.01], [-0.04, -0.0], [-0.08, 0.03], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.07, 0.01], [-0.06, 0.01], [-0.05, -0.0], [-0.05, -0.02], [-0.04, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.03, 0.04], [-0.05, -0.0], [-0.06, 0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.06, 0.01], [-0.04, 0.0], [-0.08, 0.04], [-0.03, 0.03], [-0.06, 0.0], [-0.08, 0.03], [-0.05, -0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.01], [-0.07, 0.01]], [[-0.06, 0.0], [-0.07, 0.02], [-0.03, 0.03], [-0.04, -0.0], [-0.03, 0.02], [-0.07, 0.03], [-0.03, 0.02], [-0.05, -0.01], [-0.07, 0.01], [-0.04, 0.08], [-0.06, 0.01], [-0.04, 0.01], [-0.06, -0.0], [-0.05, -0.01], [-0.04, 0.07], [-0.05, -0.0], [-0.07, 0.01], [-0.06, 0.01], [-0.05, -0.0], [-0.03, 0.04], [-0.02, 0.11], [-0.05, -0.0], [-0.06, 0.01], [-0.07, 0.03], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.04, 0.06], [-0.07, 0.03], [-0.03, 0.02], [-0.06, 0.01], [-0.04, 0.07], [-0.05, -0.01], [-0.07, 0.02], [-0.08, 0.03], [-0.06, 0.01], [-0.06, -0.0], [-0.06, -0.0], [-0.05, -0.01], [-0.03, 0.01], [-0.04, 0.04], [-0.05, -0.01], [-0.05, -0.02], [-0.06, 0.0], [-0.03, 0.02], [-0.05, -0.01]], [[-0.06, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.0], [-0.04, 0.01], [-0.08, 0.05], [-0.04, -0.0], [-0.07, 0.01], [-0.08, 0.03], [-0.05, -0.01], [-0.04, 0.08], [-0.05, -0.0], [-0.06, 0.01], [-0.06, 0.0], [-0.03, 0.01], [-0.06, 0.0], [-0.04, 0.07], [-0.04, 0.0], [-0.03, 0.09], [-0.06, 0.0], [-0.04, 0.09], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.07, 0.01], [-0.03, 0.01], [-0.03, 0.09], [-0.04, 0.0], [-0.04, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.0], [-0.03, 0.1], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.06, -0.0], [0.0, 0.14], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.04, -0.0], [-0.08, 0.05], [-0.06, 0.0], [-0.07, 0.02], [0.0, 0.14], [-0.06, 0.01]], [[-0.07, 0.02], [-0.05, -0.0], [-0.05, -0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.01], [-0.08, 0.04], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.04], [-0.05, -0.0], [-0.04, 0.0], [-0.04, 0.05], [-0.04, -0.0], [-0.03, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.04, 0.05], [-0.06, 0.01], [-0.04, 0.05], [-0.05, -0.0], [-0.03, 0.03], [-0.06, 0.0], [-0.07, 0.03], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.04, 0.0], [-0.04, 0.06], [-0.03, 0.04], [-0.03, 0.1], [-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.03], [-0.03, 0.03], [-0.08, 0.03], [-0.05, -0.01], [-0.04, 0.07], [-0.03, 0.01], [-0.05, -0.0], [-0.06, -0.0]], [[-0.07, 0.02], [-0.04, 0.09], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.04], [-0.04, 0.04], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.04, -0.0], [-0.04, -0.0], [-0.04, 0.01], [-0.06, 0.01], [-0.06, 0.01], [-0.04, 0.0], [-0.07, 0.03], [-0.05, -0.01], [-0.08, 0.04], [-0.07, 0.01], [-0.07, 0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.06, -0.0], [-0.04, -0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.03, 0.03], [-0.03, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.03, 0.04], [-0.07, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.03, 0.09], [-0.05, -0.0], [-0.03, 0.02]], [[-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.04, 0.08], [-0.06, 0.01], [-0.03, 0.09], [-0.05, -0.0], [-0.08, 0.03], [-0.03, 0.02], [-0.04, 0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.04, 0.0], [-0.08, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.06, -0.0], [-0.03, 0.02], [-0.04, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.07, 0.01], [-0.08, 0.04], [-0.07, 0.02], [-0.03, 0.02], [-0.07, 0.02], [-0.04, -0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.09], [-0.03, 0.03], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.01, 0.13], [-0.03, 0.04], [-0.05, -0.01], [-0.09, 0.06], [-0.07, 0.02], [-0.04, 0.07]], [[-0.04, -0.0], [-0.04, 0.07], [-0.07, 0.02], [-0.04, -0.0], [-0.05, -0.01], [-0.03, 0.04], [-0.04, -0.0], [-0.06, -0.0], [-0.05, -0.01], [-0.04, 0.08], [-0.03, 0.02], [-0.04, 0.07], [-0.05, -0.01], [-0.06, 0.01], [-0.04, -0.0], [-0.04, 0.08], [-0.06, 0.0], [-0.05, -0.0], [-0.03, 0.02], [-0.04, 0.0], [-0.04, 0.05], [-0.04, -0.0], [-0.07, 0.03], [-0.05, -0.02], [-0.03, 0.02], [-0.01, 0.13], [-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.03], [-0.08, 0.05], [-0.07, 0.02], [-0.07, 0.01], [-0.06, 0.01], [-0.04, 0.0], [-0.04, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.04, -0.0], [-0.07, 0.01], [-0.04, 0.08], [-0.06, 0.0], [-0.06, 0.0], [-0.07, 0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.01], [-0.04, 0.0], [-0.04, 0.07]], [[-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.03], [-0.07, 0.01], [-0.06, 0.0], [-0.07, 0.03], [-0.06, 0.01], [-0.07, 0.02], [-0.05, -0.0], [-0.03, 0.02], [-0.07, 0.02], [-0.07, 0.01], [-0.03, 0.1], [-0.04, 0.07], [-0.04, 0.0], [-0.07, 0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.02, 0.12], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.04, 0.04], [-0.03, 0.04], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.04, -0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.0], [-0.07, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.04, 0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.0]], [[-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.03], [-0.04, 0.01], [-0.04, -0.0], [-0.08, 0.04], [-0.05, -0.01], [-0.04, 0.0], [-0.08, 0.04], [-0.06, 0.0], [-0.05, -0.02], [-0.07, 0.02], [-0.06, 0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.06, 0.01], [-0.04, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.04, 0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.02], [-0.04, 0.0], [-0.06, 0.0], [-0.07, 0.03], [-0.06, 0.01], [-0.08, 0.04], [-0.04, -0.0], [-0.03, 0.1], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.04, -0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.03], [-0.07, 0.02], [-0.03, 0.02], [-0.04, 0.06], [-0.06, 0.0]], [[-0.04, 0.08], [-0.05, -0.0], [-0.08, 0.05], [-0.03, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.03, 0.03], [-0.05, -0.01], [-0.03, 0.04], [-0.05, -0.01], [-0.04, 0.0], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.03], [-0.07, 0.01], [-0.05, -0.0], [-0.05, -0.0], [-0.06, -0.0], [-0.05, -0.0], [-0.04, 0.01], [-0.06, 0.0], [-0.04, 0.01], [-0.06, 0.0], [-0.04, 0.0], [-0.04, 0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.06, -0.0], [-0.04, 0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.0], [-0.06, 0.0], [-0.04, -0.0], [-0.07, 0.03], [-0.05, -0.01], [-0.03, 0.1]], [[-0.07, 0.02], [-0.07, 0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.04, 0.0], [-0.04, 0.01], [-0.04, 0.05], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.03], [-0.03, 0.02], [-0.05, -0.0], [-0.05, -0.01], [-0.04, 0.09], [-0.03, 0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.03, 0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.03, 0.04], [-0.03, 0.02], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.06, 0.01], [-0.07, 0.01], [-0.03, 0.03], [-0.06, 0.0], [-0.04, 0.0], [-0.07, 0.02], [-0.04, -0.0], [-0.08, 0.05], [-0.05, -0.01], [-0.03, 0.04], [-0.07, 0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.06, -0.0], [-0.06, 0.0], [-0.1, 0.08], [-0.04, -0.0], [-0.03, 0.03], [-0.06, 0.0], [-0.07, 0.01]], [[-0.05, -0.01], [-0.03, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.06], [-0.06, 0.0], [-0.04, -0.0], [-0.04, -0.0], [-0.08, 0.05], [-0.06, 0.0], [-0.07, 0.02], [-0.06, 0.01], [-0.07, 0.02], [-0.06, 0.01], [-0.03, 0.02], [-0.07, 0.02], [-0.08, 0.04], [-0.07, 0.01], [-0.03, 0.1], [-0.05, -0.0], [-0.06, 0.0], [-0.07, 0.01], [-0.04, -0.0], [-0.04, -0.0], [-0.05, -0.0], [-0.05, -0.0], [-0.08, 0.04], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.02], [-0.04, -0.0], [-0.05, -0.01], [-0.03, 0.1], [-0.04, 0.0], [-0.06, 0.01], [-0.05, -0.0], [-0.05, -0.0]], [[-0.04, 0.05], [-0.04, 0.05], [-0.05, -0.01], [-0.04, 0.07], [-0.05, -0.01], [-0.06, 0.01], [-0.08, 0.04], [-0.08, 0.05], [-0.04, 0.01], [-0.05, -0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.04, 0.0], [-0.03, 0.03], [-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.07, 0.02], [-0.05, -0.01], [-0.01, 0.12], [-0.05, -0.0], [-0.08, 0.04], [-0.03, 0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.06, -0.0], [-0.07, 0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.07, 0.01], [-0.03, 0.01], [-0.01, 0.12], [-0.04, -0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.07, 0.02], [-0.07, 0.03], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01]], [[-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.05], [-0.05, -0.01], [-0.08, 0.05], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.03], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.01], [-0.04, 0.05], [-0.08, 0.05], [-0.06, 0.0], [-0.03, 0.03], [-0.07, 0.02], [-0.06, 0.01], [-0.05, -0.01], [-0.08, 0.04], [-0.04, -0.0], [-0.06, 0.0], [-0.04, 0.0], [-0.04, -0.0], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.04, 0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.04, -0.0], [-0.06, 0.0], [-0.04, 0.01], [-0.05, -0.0], [-0.07, 0.02], [-0.04, -0.0], [-0.07, 0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0]], [[-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.07, 0.03], [-0.04, 0.06], [-0.04, -0.0], [-0.08, 0.05], [-0.04, -0.0], [-0.07, 0.03], [-0.06, 0.01], [-0.06, 0.01], [-0.04, 0.0], [-0.04, -0.0], [-0.04, -0.0], [-0.07, 0.02], [-0.05, -0.0], [-0.05, -0.01], [-0.06, -0.0], [-0.08, 0.04], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.0], [-0.06, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.06, 0.01], [-0.04, 0.0], [-0.03, 0.02], [-0.07, 0.01], [-0.04, 0.05], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.08], [-0.07, 0.02], [-0.07, 0.01], [-0.06, 0.0], [-0.06, 0.01], [-0.04, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.06, -0.0], [-0.06, 0.0]], [[-0.05, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.01], [-0.03, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.03], [-0.03, 0.03], [-0.07, 0.03], [-0.05, -0.01], [-0.05, -0.0], [-0.08, 0.04], [-0.06, 0.01], [-0.03, 0.02], [-0.07, 0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.06, -0.0], [-0.05, -0.01], [-0.04, 0.01], [-0.04, 0.0], [-0.02, 0.11], [-0.05, -0.0], [-0.04, 0.07], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.01, 0.13], [-0.05, -0.02], [-0.06, 0.01], [-0.03, 0.03], [-0.07, 0.02], [-0.06, -0.0], [-0.07, 0.03], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.0], [-0.06, 0.0], [-0.05, -0.01]], [[-0.05, -0.0], [-0.07, 0.02], [-0.08, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.02], [-0.06, 0.01], [-0.04, 0.0], [-0.07, 0.03], [-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.04, 0.06], [-0.04, 0.05], [-0.05, -0.01], [-0.04, 0.07], [-0.03, 0.01], [-0.07, 0.03], [-0.04, 0.06], [-0.04, -0.0], [-0.07, 0.01], [-0.07, 0.02], [-0.05, -0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.04, 0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.08, 0.03], [-0.07, 0.02], [-0.07, 0.03], [-0.05, -0.01], [-0.03, 0.03], [-0.04, 0.08], [-0.06, 0.0], [-0.06, 0.0], [-0.06, -0.0], [-0.06, 0.01], [-0.07, 0.03], [-0.05, -0.01], [-0.05, -0.01]], [[-0.04, 0.0], [-0.04, -0.0], [-0.06, -0.0], [-0.03, 0.03], [-0.04, -0.0], [-0.05, -0.0], [-0.06, -0.0], [-0.04, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.01], [-0.04, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.07], [-0.07, 0.03], [-0.06, 0.0], [-0.03, 0.04], [-0.08, 0.05], [-0.03, 0.04], [-0.02, 0.11], [-0.04, -0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.07, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.03, 0.04], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.06, 0.01], [-0.04, 0.09], [-0.03, 0.02], [-0.07, 0.01], [-0.07, 0.03], [-0.07, 0.01], [-0.04, -0.0], [-0.03, 0.03], [-0.04, -0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.06, 0.01], [-0.06, 0.0]], [[-0.06, 0.0], [-0.03, 0.09], [-0.07, 0.02], [-0.06, -0.0], [-0.06, 0.01], [-0.03, 0.02], [-0.06, -0.0], [-0.03, 0.02], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.04, -0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.07, 0.01], [-0.08, 0.04], [-0.04, 0.07], [-0.05, -0.01], [-0.08, 0.04], [-0.06, 0.0], [-0.06, 0.01], [-0.06, 0.0], [-0.03, 0.01], [-0.02, 0.11], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.03, 0.02], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.03, 0.02], [-0.04, 0.06], [-0.04, 0.08], [-0.06, 0.0], [-0.03, 0.04], [-0.04, -0.0], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.1, 0.08], [-0.05, -0.02], [-0.05, -0.01], [-0.04, 0.06]], [[-0.04, 0.05], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.06, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.07], [-0.04, 0.01], [-0.04, -0.0], [-0.07, 0.03], [-0.06, 0.01], [-0.09, 0.06], [-0.03, 0.02], [-0.06, 0.0], [-0.03, 0.03], [-0.06, -0.0], [-0.06, 0.0], [-0.06, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.09, 0.06], [-0.05, -0.0], [-0.06, -0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.08, 0.04], [-0.03, 0.03], [-0.05, -0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.09, 0.06], [-0.04, 0.0], [-0.05, -0.01], [-0.04, 0.07], [-0.03, 0.03], [-0.03, 0.02], [-0.04, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.08, 0.04]], [[-0.07, 0.03], [-0.06, 0.01], [-0.03, 0.02], [-0.07, 0.02], [-0.04, 0.0], [-0.06, 0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.05], [-0.05, -0.01], [-0.06, 0.01], [-0.06, -0.0], [-0.08, 0.06], [-0.08, 0.05], [-0.03, 0.01], [-0.07, 0.03], [-0.04, -0.0], [-0.04, -0.0], [-0.06, 0.01], [-0.05, -0.0], [-0.07, 0.01], [-0.04, 0.09], [-0.03, 0.03], [-0.03, 0.03], [-0.06, 0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.04, 0.07], [-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.04, 0.08], [-0.04, 0.0], [-0.03, 0.1], [-0.03, 0.02], [-0.04, 0.01], [-0.04, 0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.0], [-0.04, 0.05], [-0.04, 0.08], [-0.07, 0.02], [-0.04, -0.0], [-0.06, 0.0]], [[-0.03, 0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.05, -0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.04, 0.08], [-0.05, -0.01], [-0.06, -0.0], [-0.06, -0.0], [-0.04, 0.06], [-0.06, 0.0], [-0.07, 0.03], [-0.06, 0.01], [-0.04, 0.0], [-0.04, -0.0], [-0.07, 0.01], [-0.07, 0.02], [-0.1, 0.08], [-0.07, 0.02], [-0.06, 0.01], [-0.07, 0.01], [-0.07, 0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.04, 0.01], [-0.05, -0.02], [-0.05, -0.01], [-0.04, 0.06], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.06, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.08, 0.03], [-0.06, 0.0], [-0.04, 0.01], [-0.04, -0.0], [-0.06, 0.01], [-0.06, 0.0], [-0.07, 0.03], [-0.08, 0.04], [-0.05, -0.01], [-0.05, -0.01]], [[-0.04, 0.07], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.02], [-0.03, 0.03], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.08], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.06, 0.0], [-0.06, -0.0], [-0.07, 0.02], [-0.05, -0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.06, -0.0], [-0.04, 0.0], [-0.04, 0.08], [-0.06, 0.0], [-0.07, 0.02], [-0.07, 0.01], [-0.07, 0.03], [-0.04, 0.06], [-0.05, -0.01], [-0.07, 0.01], [-0.04, 0.04], [-0.08, 0.03], [-0.04, -0.0], [-0.06, -0.0], [-0.07, 0.02], [-0.08, 0.03], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.06, -0.0], [-0.08, 0.04], [-0.04, 0.0], [-0.04, 0.06], [-0.06, 0.0], [-0.06, -0.0], [-0.04, 0.0], [-0.05, -0.01], [-0.04, 0.01], [-0.04, 0.04], [-0.07, 0.02]], [[-0.07, 0.01], [-0.06, 0.0], [-0.03, 0.01], [-0.04, -0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.07, 0.01], [-0.06, 0.0], [-0.04, 0.05], [-0.03, 0.02], [-0.05, -0.01], [-0.03, 0.04], [-0.03, 0.04], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.02], [-0.06, 0.0], [-0.06, 0.0], [0.02, 0.16], [-0.04, 0.0], [-0.08, 0.04], [-0.05, -0.01], [-0.07, 0.01], [-0.07, 0.02], [-0.04, 0.05], [-0.04, 0.0], [-0.07, 0.01], [-0.06, -0.0], [-0.07, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.05], [-0.05, -0.01], [-0.08, 0.05], [-0.07, 0.01], [-0.06, 0.01], [-0.04, 0.06], [-0.04, 0.0], [-0.06, 0.01], [-0.07, 0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.01]], [[-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.03, 0.02], [-0.07, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.01], [-0.04, 0.0], [-0.04, 0.05], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.03], [-0.05, -0.0], [-0.04, 0.07], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.01], [-0.04, -0.0], [-0.05, -0.0], [-0.03, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.04, -0.0]], [[-0.06, 0.0], [0.01, 0.15], [-0.07, 0.02], [-0.06, 0.01], [-0.03, 0.03], [-0.03, 0.02], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.05], [-0.04, 0.01], [-0.05, -0.0], [-0.07, 0.03], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.03], [-0.04, 0.05], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.02], [-0.04, -0.0], [-0.05, -0.02], [-0.07, 0.02], [-0.07, 0.01], [-0.06, 0.0], [-0.04, -0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.08, 0.04], [-0.05, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.07], [-0.05, -0.01], [-0.08, 0.05], [-0.08, 0.04], [-0.08, 0.05], [-0.04, -0.0], [-0.08, 0.04]], [[-0.07, 0.03], [-0.08, 0.05], [-0.04, 0.0], [-0.03, 0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.07, 0.02], [-0.07, 0.03], [-0.04, 0.05], [-0.06, 0.01], [-0.04, 0.07], [-0.08, 0.04], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.06], [-0.07, 0.02], [-0.03, 0.02], [-0.04, 0.01], [-0.03, 0.1], [-0.06, 0.0], [-0.06, -0.0], [-0.05, -0.0], [-0.04, 0.01], [-0.07, 0.02], [-0.08, 0.04], [-0.03, 0.02], [-0.05, -0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.04, -0.0], [-0.04, 0.05], [-0.05, -0.0], [-0.06, 0.01], [-0.0, 0.13], [-0.06, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.07, 0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.04, 0.01], [-0.06, 0.0], [-0.03, 0.03], [-0.03, 0.01]], [[-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.02], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.07, 0.02], [-0.06, 0.01], [-0.03, 0.03], [-0.05, -0.0], [-0.07, 0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.0], [-0.03, 0.03], [-0.04, 0.0], [-0.05, -0.01], [-0.06, -0.0], [-0.07, 0.03], [-0.06, 0.01], [-0.06, -0.0], [-0.06, 0.01], [-0.06, 0.0], [-0.04, 0.05], [-0.04, 0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.03, 0.03], [-0.04, -0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.06, 0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.0], [-0.08, 0.04], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.09, 0.06], [-0.07, 0.02], [-0.07, 0.02], [-0.08, 0.04], [-0.06, 0.0], [-0.03, 0.02], [-0.07, 0.02]], [[-0.05, -0.01], [-0.06, 0.0], [-0.08, 0.04], [-0.04, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.03], [-0.04, 0.0], [-0.06, 0.01], [-0.07, 0.03], [-0.04, 0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.03], [-0.04, 0.09], [-0.07, 0.01], [-0.06, -0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.04, -0.0], [-0.06, -0.0], [-0.04, 0.0], [-0.06, -0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.04, 0.09], [-0.05, -0.01], [-0.07, 0.02], [-0.08, 0.04], [-0.04, 0.01], [-0.07, 0.01], [-0.04, -0.0], [-0.06, 0.01], [-0.03, 0.01], [-0.04, 0.07], [-0.07, 0.02], [-0.05, -0.0], [-0.04, -0.0]], [[-0.03, 0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.08, 0.03], [-0.07, 0.02], [-0.03, 0.03], [-0.03, 0.02], [-0.07, 0.02], [-0.06, 0.01], [-0.04, -0.0], [-0.06, 0.01], [-0.08, 0.05], [-0.07, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.0], [-0.06, 0.0], [-0.04, 0.06], [-0.06, 0.01], [-0.03, 0.03], [-0.06, 0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.07, 0.02], [-0.07, 0.01], [-0.07, 0.02], [-0.06, 0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.04, 0.07], [-0.06, 0.0], [-0.07, 0.02], [-0.06, -0.0], [-0.07, 0.02], [-0.02, 0.11], [-0.04, -0.0], [-0.04, 0.08], [-0.06, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.01], [-0.04, 0.05], [-0.05, -0.01], [-0.07, 0.03], [-0.06, 0.0], [-0.07, 0.03]], [[-0.01, 0.12], [-0.03, 0.03], [-0.07, 0.02], [-0.07, 0.02], [-0.06, 0.0], [-0.04, -0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.07, 0.02], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.07, 0.02], [-0.04, -0.0], [-0.07, 0.02], [-0.07, 0.03], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.08, 0.03], [-0.06, 0.01], [-0.05, -0.01], [-0.04, 0.07], [-0.04, -0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.04, 0.07], [-0.04, 0.06], [-0.03, 0.01], [-0.05, -0.02], [-0.07, 0.02], [-0.08, 0.04], [-0.05, -0.01], [-0.07, 0.03], [-0.05, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.06, -0.0], [-0.06, 0.0], [-0.06, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0]], [[-0.05, -0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.07, 0.03], [-0.06, 0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.0], [-0.06, 0.0], [-0.07, 0.01], [-0.03, 0.01], [-0.07, 0.02], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.04, 0.01], [-0.03, 0.04], [-0.05, -0.0], [-0.06, 0.01], [-0.03, 0.1], [-0.07, 0.03], [-0.08, 0.04], [-0.03, 0.09], [-0.03, 0.03], [-0.06, 0.0], [-0.03, 0.03], [-0.07, 0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.03, 0.1], [-0.04, -0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.04, 0.08], [-0.05, -0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.08, 0.04], [-0.05, -0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.06, 0.01], [-0.05, -0.01]], [[-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.05], [-0.07, 0.01], [-0.08, 0.03], [-0.08, 0.04], [-0.05, -0.0], [-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.04], [-0.04, 0.01], [-0.07, 0.01], [-0.03, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.08, 0.05], [-0.04, 0.05], [-0.05, -0.01], [-0.03, 0.02], [-0.07, 0.02], [-0.03, 0.02], [-0.05, -0.01], [-0.06, -0.0], [-0.04, -0.0], [-0.04, -0.0], [-0.06, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.02, 0.12], [-0.03, 0.02], [-0.06, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.03, 0.01], [-0.06, 0.01], [-0.07, 0.03], [-0.04, -0.0], [-0.03, 0.01], [-0.03, 0.03], [-0.05, -0.0], [-0.05, -0.02], [-0.03, 0.03], [-0.05, -0.02], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.02]], [[-0.05, -0.01], [-0.04, -0.0], [-0.07, 0.02], [-0.04, 0.0], [-0.05, -0.01], [-0.08, 0.06], [-0.04, 0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.06, -0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.03, 0.02], [-0.03, 0.03], [-0.06, 0.0], [-0.05, -0.0], [-0.03, 0.09], [-0.07, 0.02], [-0.04, 0.05], [-0.05, -0.01], [-0.04, 0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.04, 0.01], [-0.05, -0.0], [-0.05, -0.0], [-0.03, 0.01], [-0.03, 0.02], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.08], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.09, 0.06], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.07], [-0.07, 0.03], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.01]], [[-0.08, 0.04], [-0.04, 0.06], [-0.07, 0.02], [-0.08, 0.04], [-0.03, 0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.01], [-0.03, 0.03], [-0.06, 0.0], [-0.05, -0.0], [-0.03, 0.04], [-0.06, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.04], [-0.06, 0.0], [-0.04, 0.07], [-0.08, 0.05], [-0.03, 0.1], [-0.05, -0.01], [-0.03, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.06], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.04, 0.0], [-0.04, 0.05], [-0.03, 0.02], [-0.05, -0.01], [-0.02, 0.11], [-0.04, 0.07], [-0.01, 0.12], [-0.04, 0.0], [-0.03, 0.03], [-0.08, 0.04], [-0.06, 0.0], [-0.06, 0.0]], [[-0.06, 0.01], [-0.05, -0.01], [-0.04, 0.08], [-0.05, -0.01], [-0.03, 0.02], [-0.06, 0.01], [-0.07, 0.02], [-0.06, -0.0], [-0.03, 0.02], [-0.04, 0.0], [-0.04, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.04, -0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.03, 0.03], [-0.04, 0.01], [-0.03, 0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.04, 0.07], [-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.03, 0.09], [-0.03, 0.02], [-0.06, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.0], [-0.07, 0.02], [-0.0, 0.13], [-0.03, 0.04], [-0.04, 0.06], [-0.06, 0.0], [-0.04, 0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.04, -0.0], [-0.04, 0.01], [-0.06, 0.0], [-0.07, 0.02]], [[-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.01], [-0.04, 0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.03, 0.03], [-0.04, 0.05], [-0.08, 0.04], [-0.06, 0.0], [-0.08, 0.04], [-0.09, 0.06], [-0.04, 0.06], [-0.04, 0.06], [-0.04, 0.07], [-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.09], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.0], [-0.04, 0.07], [-0.05, -0.01], [-0.07, 0.01], [-0.04, 0.06], [-0.07, 0.02], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.01], [-0.04, 0.0], [-0.06, -0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.03, 0.04], [-0.04, 0.06], [-0.05, -0.0], [-0.04, 0.04], [-0.07, 0.01], [-0.06, 0.0], [-0.03, 0.09], [-0.07, 0.02], [-0.05, -0.0], [-0.08, 0.03], [-0.05, -0.01]], [[-0.04, 0.0], [-0.03, 0.04], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.04], [-0.07, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.03], [-0.03, 0.02], [-0.03, 0.02], [-0.07, 0.03], [-0.06, 0.0], [-0.05, -0.0], [-0.03, 0.02], [-0.07, 0.01], [-0.05, -0.0], [-0.03, 0.03], [-0.07, 0.02], [-0.03, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.04, 0.05], [-0.06, -0.0], [-0.07, 0.02], [-0.05, -0.0], [-0.06, 0.01], [-0.08, 0.04], [-0.03, 0.01], [-0.04, 0.04], [-0.07, 0.01], [-0.03, 0.02], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.04, 0.0], [-0.05, -0.0], [-0.05, -0.0], [-0.06, 0.01], [-0.04, 0.0], [-0.07, 0.02]], [[-0.04, -0.0], [-0.08, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.06, 0.0], [-0.03, 0.03], [-0.04, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.03, 0.03], [-0.04, -0.0], [-0.05, -0.01], [-0.04, 0.05], [-0.04, 0.0], [-0.04, 0.05], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.0], [-0.03, 0.04], [-0.04, -0.0], [-0.07, 0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.03, 0.03], [-0.06, 0.0], [-0.13, 0.15], [-0.03, 0.02], [-0.06, 0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.0], [-0.04, 0.0], [-0.06, 0.01], [-0.03, 0.02], [-0.03, 0.02], [-0.03, 0.04], [-0.03, 0.04]], [[-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.01], [-0.06, 0.01], [-0.06, -0.0], [-0.04, 0.06], [-0.05, -0.0], [-0.06, 0.0], [-0.08, 0.05], [-0.05, -0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.06, 0.01], [-0.07, 0.02], [-0.04, 0.06], [-0.03, 0.04], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.01], [-0.07, 0.01], [-0.04, 0.07], [-0.01, 0.12], [-0.06, 0.0], [-0.06, 0.0], [-0.03, 0.04], [-0.03, 0.03], [-0.05, -0.01], [-0.03, 0.03], [-0.07, 0.02], [-0.08, 0.04], [-0.08, 0.04], [-0.05, -0.01], [-0.05, -0.0], [-0.04, 0.06], [-0.07, 0.02], [-0.08, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.03, 0.03], [-0.04, -0.0], [-0.06, -0.0], [-0.03, 0.02], [-0.03, 0.01], [-0.05, -0.01], [-0.05, -0.01]], [[-0.06, 0.0], [-0.04, 0.0], [-0.07, 0.01], [-0.07, 0.01], [-0.07, 0.02], [-0.08, 0.05], [-0.05, -0.01], [-0.03, 0.04], [-0.03, 0.03], [-0.04, 0.08], [-0.03, 0.04], [-0.05, -0.01], [-0.04, 0.01], [-0.04, 0.0], [-0.03, 0.02], [-0.06, 0.01], [-0.06, 0.01], [-0.07, 0.02], [-0.03, 0.04], [-0.04, -0.0], [-0.07, 0.02], [-0.04, 0.08], [-0.04, 0.07], [-0.07, 0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.04, 0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.05, -0.0], [-0.08, 0.03], [-0.07, 0.02], [-0.03, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.04, -0.0], [-0.07, 0.02], [-0.03, 0.01], [-0.03, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.03]], [[-0.04, 0.05], [-0.07, 0.03], [-0.05, -0.01], [-0.05, -0.0], [-0.03, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.04, -0.0], [-0.06, 0.01], [-0.03, 0.02], [-0.08, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.08, 0.03], [-0.04, 0.08], [-0.05, -0.01], [-0.07, 0.03], [-0.04, 0.01], [-0.07, 0.01], [-0.06, 0.01], [-0.03, 0.03], [-0.07, 0.02], [-0.08, 0.03], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.06, 0.01], [-0.06, 0.01], [-0.03, 0.02]], [[-0.09, 0.07], [-0.07, 0.02], [-0.07, 0.01], [-0.04, 0.05], [-0.06, -0.0], [-0.08, 0.04], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.03, 0.03], [-0.03, 0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.04, 0.0], [-0.03, 0.1], [-0.07, 0.02], [-0.05, -0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.06, 0.01], [-0.08, 0.05], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.06, 0.01], [-0.04, 0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.04, -0.0], [-0.05, -0.0], [-0.04, -0.0], [-0.04, 0.0], [-0.07, 0.03], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01]], [[-0.06, 0.0], [-0.05, -0.0], [-0.04, 0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.04, 0.01], [-0.04, -0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.01, 0.12], [-0.04, -0.0], [-0.06, 0.0], [-0.03, 0.02], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.08], [-0.02, 0.11], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.0], [-0.03, 0.03], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.0], [-0.05, -0.0], [-0.07, 0.02], [-0.03, 0.04], [-0.07, 0.03], [-0.05, -0.01], [-0.06, -0.0], [-0.03, 0.02], [-0.04, 0.01], [-0.03, 0.02], [-0.04, 0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.08, 0.05], [-0.05, -0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01]], [[-0.03, 0.02], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.07], [-0.07, 0.01], [-0.04, -0.0], [-0.07, 0.02], [-0.04, 0.08], [-0.07, 0.01], [-0.04, 0.05], [-0.04, 0.05], [-0.06, 0.0], [-0.06, 0.01], [-0.05, -0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.03, 0.04], [-0.05, -0.01], [-0.04, -0.0], [-0.07, 0.03], [-0.06, 0.01], [-0.06, 0.0], [-0.03, 0.02], [-0.04, -0.0], [-0.03, 0.09], [-0.05, -0.01], [-0.07, 0.01], [-0.07, 0.02], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.08, 0.05], [-0.06, 0.0], [-0.07, 0.01], [-0.06, 0.01], [-0.08, 0.04], [-0.03, 0.03], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.07, 0.01], [-0.06, 0.01], [-0.07, 0.01], [-0.07, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.03], [-0.05, -0.01], [-0.06, 0.0]], [[-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.07, 0.02], [-0.07, 0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.06, -0.0], [-0.06, 0.0], [-0.08, 0.03], [-0.07, 0.03], [-0.08, 0.04], [-0.06, 0.0], [-0.02, 0.11], [-0.06, 0.01], [-0.03, 0.04], [-0.06, 0.01], [-0.04, 0.0], [-0.04, 0.08], [-0.05, -0.0], [-0.03, 0.02], [-0.04, -0.0], [-0.07, 0.02], [-0.07, 0.03], [-0.07, 0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.02, 0.12], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.06, 0.01], [-0.04, -0.0], [-0.04, -0.0], [-0.07, 0.02], [-0.04, 0.0], [-0.05, -0.01], [-0.07, 0.03], [-0.05, -0.0], [-0.06, 0.0]], [[-0.04, 0.0], [-0.04, 0.0], [-0.07, 0.03], [-0.07, 0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.04, 0.0], [-0.04, 0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.03], [-0.07, 0.03], [-0.06, 0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.03, 0.04], [-0.05, -0.01], [-0.05, -0.0], [-0.06, 0.0], [-0.04, 0.07], [-0.03, 0.09], [-0.06, 0.0], [-0.06, 0.0], [-0.04, -0.0], [-0.04, 0.07], [-0.08, 0.06], [-0.03, 0.02], [-0.04, -0.0], [-0.04, 0.0], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.0], [-0.08, 0.04], [-0.06, 0.01], [-0.07, 0.01], [-0.05, -0.02], [-0.03, 0.01], [-0.03, 0.02], [-0.05, -0.0], [-0.07, 0.02], [-0.04, 0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.07, 0.02]], [[-0.03, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.06, 0.0], [-0.04, 0.07], [-0.05, -0.01], [-0.04, 0.0], [-0.06, 0.01], [-0.03, 0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.08, 0.05], [-0.08, 0.04], [-0.04, 0.05], [-0.03, 0.1], [-0.04, 0.07], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.03, 0.03], [-0.04, 0.0], [-0.06, 0.01], [-0.03, 0.04], [-0.09, 0.06], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.08, 0.03], [-0.05, -0.01], [-0.07, 0.01], [-0.0, 0.13], [-0.06, 0.0], [-0.05, -0.0], [-0.07, 0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.07, 0.01], [-0.07, 0.01]], [[-0.03, 0.03], [-0.03, 0.03], [-0.06, -0.0], [-0.07, 0.03], [-0.07, 0.02], [-0.06, 0.0], [-0.09, 0.06], [-0.05, -0.01], [-0.06, -0.0], [-0.08, 0.03], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.06, 0.01], [-0.03, 0.03], [-0.03, 0.03], [-0.05, -0.01], [-0.04, -0.0], [-0.07, 0.01], [-0.07, 0.02], [-0.03, 0.09], [-0.07, 0.01], [-0.05, -0.01], [-0.04, 0.04], [-0.04, 0.06], [-0.06, 0.0], [-0.05, -0.01], [-0.06, -0.0], [-0.07, 0.03], [-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.04, -0.0], [-0.08, 0.03], [-0.04, 0.0], [-0.05, -0.01], [-0.04, 0.08], [-0.05, -0.01], [-0.07, 0.03], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.01], [-0.02, 0.11], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.04]], [[-0.06, 0.0], [-0.08, 0.03], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.03, 0.03], [-0.06, 0.01], [-0.05, -0.01], [-0.04, 0.05], [-0.03, 0.03], [-0.03, 0.04], [-0.04, 0.0], [-0.04, 0.01], [-0.07, 0.01], [-0.08, 0.04], [-0.02, 0.1], [-0.06, 0.0], [-0.05, -0.0], [-0.07, 0.01], [-0.07, 0.03], [-0.05, -0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.04, 0.09], [-0.05, -0.01], [-0.03, 0.02], [-0.07, 0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.04, 0.0], [-0.03, 0.02], [-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.07, 0.02], [-0.06, 0.01], [-0.03, 0.1], [-0.03, 0.02], [-0.04, 0.05], [-0.03, 0.02], [-0.05, -0.01], [-0.07, 0.01], [-0.06, 0.0], [-0.03, 0.02], [-0.05, -0.0]], [[-0.04, -0.0], [-0.03, 0.03], [-0.08, 0.05], [-0.06, 0.01], [-0.03, 0.1], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.03, 0.03], [-0.07, 0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.07, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.06, -0.0], [-0.07, 0.03], [-0.04, 0.01], [-0.06, 0.01], [-0.06, 0.01], [-0.07, 0.02], [-0.04, 0.06], [-0.06, 0.01], [-0.06, 0.0], [-0.04, 0.07], [-0.04, 0.08], [-0.04, 0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.09, 0.06], [-0.04, 0.07], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.07, 0.03], [-0.03, 0.1], [-0.06, 0.01], [-0.03, 0.04], [-0.03, 0.03], [-0.05, -0.0], [-0.03, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.06, -0.0], [-0.05, -0.01], [-0.06, -0.0], [-0.03, 0.03], [-0.07, 0.02], [-0.06, 0.0]], [[-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.05, -0.0], [-0.04, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.01, 0.12], [-0.03, 0.02], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.0], [-0.07, 0.01], [-0.03, 0.03], [-0.04, -0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.04, -0.0], [-0.04, 0.09], [-0.03, 0.1], [-0.07, 0.02], [-0.05, -0.0], [-0.06, 0.0], [-0.04, 0.0], [-0.07, 0.03], [-0.04, 0.06], [-0.08, 0.05], [-0.05, -0.01], [-0.06, 0.0], [-0.06, -0.0], [-0.03, 0.02], [-0.06, 0.0], [-0.08, 0.03], [-0.07, 0.01], [-0.07, 0.02], [-0.04, 0.07]], [[-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.0], [-0.07, 0.02], [-0.06, -0.0], [-0.04, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.04, 0.06], [-0.07, 0.01], [-0.03, 0.02], [-0.04, 0.08], [-0.05, -0.0], [-0.03, 0.04], [-0.06, 0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.04, 0.09], [-0.04, 0.05], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.04, 0.05], [-0.06, 0.0], [-0.05, -0.0], [-0.06, -0.0], [-0.02, 0.11], [-0.03, 0.03], [-0.05, -0.0], [-0.04, 0.0], [-0.03, 0.03], [-0.05, -0.0], [-0.04, -0.0], [-0.1, 0.09], [-0.05, -0.0], [-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.03, 0.01], [-0.05, -0.0], [-0.07, 0.01], [-0.04, -0.0], [-0.05, -0.0], [-0.05, -0.01]], [[-0.05, -0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.04, 0.07], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.03], [-0.05, -0.01], [-0.06, 0.0], [-0.06, -0.0], [-0.07, 0.01], [-0.03, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.03, 0.02], [-0.07, 0.02], [-0.06, 0.0], [-0.04, 0.07], [-0.05, -0.0], [-0.07, 0.02], [-0.03, 0.02], [-0.04, -0.0], [-0.07, 0.01], [-0.05, -0.0], [-0.07, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.05], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.04], [-0.08, 0.04], [-0.07, 0.02], [-0.06, 0.01], [-0.06, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.03], [-0.04, 0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.03, 0.04], [-0.05, -0.01], [-0.08, 0.03], [-0.07, 0.01], [-0.04, 0.05], [-0.04, 0.01]], [[-0.04, -0.0], [-0.03, 0.04], [-0.07, 0.02], [-0.06, -0.0], [-0.07, 0.03], [-0.04, 0.07], [-0.03, 0.03], [-0.04, 0.01], [-0.04, 0.0], [-0.04, -0.0], [-0.03, 0.02], [-0.06, 0.0], [-0.04, 0.0], [-0.08, 0.04], [-0.04, 0.08], [-0.03, 0.04], [-0.05, -0.01], [-0.04, 0.01], [-0.04, 0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.04, 0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.04, 0.08], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.01], [-0.04, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.09], [-0.07, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.04, 0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.08, 0.05], [-0.06, 0.0], [-0.03, 0.02], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.02], [-0.02, 0.1], [-0.05, -0.0]], [[-0.04, 0.07], [-0.08, 0.04], [-0.06, 0.0], [-0.06, -0.0], [-0.04, 0.08], [-0.07, 0.01], [-0.03, 0.03], [-0.07, 0.01], [-0.06, 0.01], [-0.06, 0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.08, 0.03], [-0.07, 0.02], [-0.04, 0.01], [-0.08, 0.03], [-0.06, 0.0], [-0.06, 0.01], [-0.07, 0.02], [-0.08, 0.04], [-0.04, 0.06], [-0.03, 0.01], [-0.05, -0.0], [-0.07, 0.01], [-0.04, -0.0], [-0.04, 0.09], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.06, 0.0], [-0.06, 0.0], [-0.04, 0.09], [-0.04, 0.06], [-0.04, -0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.06, -0.0], [-0.06, 0.01], [-0.04, 0.06], [-0.06, 0.0]], [[-0.07, 0.02], [-0.06, -0.0], [-0.08, 0.04], [-0.04, 0.06], [-0.04, 0.05], [-0.04, -0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.04], [-0.04, 0.0], [-0.07, 0.02], [-0.05, -0.02], [-0.03, 0.01], [-0.06, 0.0], [-0.08, 0.04], [-0.03, 0.02], [-0.06, 0.0], [-0.03, 0.02], [-0.06, 0.0], [-0.07, 0.01], [-0.03, 0.03], [-0.03, 0.04], [-0.05, -0.02], [-0.06, 0.01], [-0.04, -0.0], [-0.01, 0.13], [-0.06, 0.0], [-0.08, 0.03], [-0.07, 0.01], [-0.05, -0.01], [-0.04, 0.08], [-0.07, 0.02], [-0.07, 0.02], [-0.09, 0.07], [-0.03, 0.03], [-0.07, 0.01], [-0.07, 0.01], [-0.08, 0.03], [-0.04, -0.0], [-0.06, 0.01], [-0.04, -0.0], [-0.05, -0.0], [-0.03, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.05], [-0.07, 0.02]], [[-0.07, 0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.04, 0.05], [-0.05, -0.01], [-0.07, 0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.09, 0.06], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.04], [-0.05, -0.01], [-0.08, 0.04], [-0.05, -0.01], [-0.06, -0.0], [-0.02, 0.11], [-0.08, 0.05], [-0.04, 0.05], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.06, 0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.04, 0.05], [-0.05, -0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.03, 0.1], [-0.07, 0.02], [-0.04, 0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.03], [-0.04, 0.08], [-0.05, -0.0], [-0.0, 0.13], [-0.08, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02]], [[-0.04, -0.0], [-0.07, 0.02], [-0.05, -0.0], [-0.06, -0.0], [-0.05, -0.0], [-0.05, -0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.03, 0.02], [-0.04, 0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.09, 0.07], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.06, -0.0], [-0.03, 0.04], [-0.03, 0.01], [-0.09, 0.06], [-0.03, 0.04], [-0.04, 0.01], [-0.09, 0.07], [-0.07, 0.02], [-0.08, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.01], [-0.08, 0.05], [-0.04, 0.08], [-0.04, 0.01], [-0.06, 0.01], [-0.03, 0.03], [-0.03, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.04, 0.01], [-0.09, 0.07], [-0.04, 0.05]], [[-0.04, 0.06], [-0.07, 0.02], [-0.04, 0.07], [-0.05, -0.01], [-0.06, 0.0], [-0.02, 0.11], [-0.06, 0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.06], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.04, 0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.04, 0.09], [-0.04, 0.0], [-0.07, 0.03], [-0.04, 0.06], [-0.05, -0.01], [-0.04, 0.07], [-0.07, 0.03], [-0.07, 0.03], [-0.03, 0.02], [-0.04, 0.01], [-0.04, -0.0], [-0.07, 0.03], [-0.04, 0.0], [-0.04, -0.0], [-0.04, 0.05], [-0.08, 0.03], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.07], [-0.08, 0.04], [-0.04, 0.01], [-0.04, 0.05], [-0.04, -0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.07, 0.02]], [[-0.04, 0.0], [-0.05, -0.0], [-0.06, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.05], [-0.06, -0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.01], [-0.03, 0.03], [-0.07, 0.02], [-0.04, 0.07], [-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.06], [-0.06, 0.0], [-0.06, 0.0], [-0.06, 0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.01], [-0.03, 0.04], [-0.05, -0.01], [-0.07, 0.02], [-0.06, -0.0], [-0.05, -0.02], [-0.07, 0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.04, 0.04], [-0.04, -0.0], [-0.07, 0.01], [-0.04, -0.0], [-0.03, 0.03], [-0.04, -0.0], [-0.06, -0.0], [-0.04, 0.07], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.05]], [[-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.06, 0.01], [-0.04, 0.06], [-0.07, 0.02], [-0.03, 0.02], [-0.07, 0.02], [-0.03, 0.03], [-0.03, 0.02], [-0.05, -0.01], [-0.04, 0.05], [-0.06, -0.0], [-0.07, 0.03], [-0.05, -0.01], [-0.06, 0.01], [-0.03, 0.03], [-0.03, 0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.03], [-0.07, 0.02], [-0.04, 0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.0], [-0.08, 0.03], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.07, 0.02], [-0.05, -0.02], [-0.05, -0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.07, 0.01], [-0.03, 0.04], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.03, 0.04], [-0.03, 0.04], [-0.05, -0.0], [-0.06, 0.01]], [[-0.06, 0.0], [-0.06, 0.0], [-0.08, 0.04], [-0.07, 0.02], [-0.04, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.07, 0.02], [-0.08, 0.04], [-0.06, 0.01], [-0.06, -0.0], [-0.07, 0.02], [-0.03, 0.02], [-0.05, -0.01], [-0.01, 0.13], [-0.07, 0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.04, -0.0], [-0.03, 0.03], [-0.05, -0.0], [-0.04, -0.0], [-0.04, 0.01], [-0.04, 0.0], [-0.04, -0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.02], [-0.05, -0.01], [-0.03, 0.09], [-0.06, 0.0], [-0.05, -0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.02], [-0.06, 0.01], [-0.04, 0.09], [-0.07, 0.01]], [[-0.03, 0.01], [-0.04, 0.0], [-0.05, -0.0], [-0.05, -0.0], [-0.03, 0.03], [-0.06, 0.0], [-0.09, 0.06], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.09, 0.06], [-0.05, -0.01], [-0.07, 0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.04, -0.0], [-0.06, 0.0], [-0.06, -0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.06, 0.0], [-0.08, 0.04], [-0.07, 0.01], [-0.06, 0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.03, 0.01], [-0.06, 0.0], [-0.04, -0.0], [-0.04, 0.05], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.05, -0.0], [-0.04, 0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.02], [-0.07, 0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.04, -0.0], [-0.07, 0.02]], [[-0.04, 0.0], [-0.07, 0.01], [-0.07, 0.01], [-0.06, 0.01], [-0.07, 0.02], [-0.04, 0.05], [-0.05, -0.0], [-0.06, 0.0], [-0.07, 0.01], [-0.04, 0.09], [-0.07, 0.03], [-0.05, -0.0], [-0.06, 0.0], [-0.04, 0.07], [-0.05, -0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.06, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.08, 0.03], [-0.06, 0.0], [-0.08, 0.04], [-0.06, 0.0], [-0.07, 0.03], [-0.08, 0.03], [-0.03, 0.02], [-0.05, -0.01], [-0.04, -0.0], [-0.04, 0.04], [-0.04, 0.05], [-0.06, 0.0], [-0.08, 0.05], [-0.06, 0.01], [-0.05, -0.01], [-0.08, 0.03], [-0.05, -0.01], [-0.03, 0.02], [-0.07, 0.03], [-0.04, 0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.0]], [[-0.06, 0.0], [-0.04, 0.0], [-0.08, 0.05], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.03], [-0.08, 0.03], [-0.07, 0.02], [-0.04, 0.01], [-0.07, 0.03], [-0.07, 0.01], [-0.06, 0.0], [-0.05, -0.02], [-0.05, -0.01], [-0.06, -0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.04, 0.01], [-0.07, 0.02], [-0.08, 0.04], [-0.07, 0.02], [-0.08, 0.04], [-0.07, 0.03], [-0.07, 0.03], [-0.04, 0.0], [-0.08, 0.04], [-0.07, 0.02], [-0.05, -0.01], [-0.08, 0.04], [-0.01, 0.12], [-0.05, -0.01], [-0.07, 0.01], [-0.03, 0.04], [-0.03, 0.02], [-0.07, 0.02], [-0.04, 0.07], [-0.04, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.04, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.06, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.04, -0.0], [-0.03, 0.03]], [[-0.03, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.06, 0.01], [-0.04, 0.05], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.0], [-0.04, -0.0], [-0.03, 0.02], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.04, 0.06], [-0.06, 0.01], [-0.04, -0.0], [-0.04, 0.05], [-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.02], [-0.07, 0.02], [-0.05, -0.0], [-0.03, 0.09], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.03], [-0.04, -0.0], [-0.03, 0.03], [-0.02, 0.11], [-0.05, -0.01], [-0.03, 0.02], [-0.07, 0.02], [-0.03, 0.02], [-0.08, 0.05], [-0.05, -0.02], [-0.04, -0.0], [-0.06, 0.01], [-0.05, -0.0], [-0.04, 0.05], [-0.07, 0.01], [-0.07, 0.02], [-0.03, 0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.02]], [[-0.06, 0.0], [-0.04, 0.0], [-0.07, 0.03], [-0.06, 0.0], [-0.03, 0.04], [-0.06, 0.0], [-0.07, 0.01], [-0.04, 0.07], [-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.06, -0.0], [-0.03, 0.04], [-0.05, -0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.02, 0.11], [-0.06, 0.0], [-0.07, 0.03], [-0.04, -0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.04], [-0.11, 0.1], [-0.04, -0.0], [-0.04, 0.01], [-0.04, -0.0], [-0.05, -0.0], [-0.07, 0.03], [-0.03, 0.02], [-0.03, 0.03], [-0.02, 0.11], [-0.08, 0.05], [-0.07, 0.03], [-0.02, 0.1], [-0.07, 0.02], [-0.05, -0.01], [-0.03, 0.02], [-0.07, 0.03], [-0.06, 0.01], [-0.08, 0.04], [-0.05, -0.01], [-0.04, 0.07], [-0.08, 0.05], [-0.04, 0.05], [-0.05, -0.01], [-0.04, -0.0]], [[-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.04], [-0.05, -0.01], [-0.06, -0.0], [-0.03, 0.01], [-0.06, 0.0], [-0.04, 0.01], [-0.06, 0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.07, 0.03], [-0.03, 0.04], [-0.06, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.03], [-0.06, 0.0], [-0.05, -0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.05], [-0.07, 0.01], [-0.04, 0.01], [-0.06, 0.0], [-0.08, 0.04], [-0.04, 0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.06, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.05], [-0.06, 0.0], [-0.03, 0.03], [-0.05, -0.0], [-0.03, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.03], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.06], [-0.04, 0.05]], [[-0.05, -0.01], [-0.07, 0.01], [-0.06, 0.01], [-0.04, 0.0], [-0.04, -0.0], [-0.05, -0.0], [-0.07, 0.03], [-0.03, 0.03], [-0.07, 0.01], [-0.06, 0.01], [-0.07, 0.01], [-0.03, 0.03], [-0.08, 0.05], [-0.07, 0.02], [-0.04, 0.07], [-0.07, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.03, 0.02], [-0.03, 0.04], [-0.04, -0.0], [-0.03, 0.03], [-0.04, 0.0], [-0.06, 0.0], [-0.03, 0.03], [-0.03, 0.03], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.04], [-0.04, 0.09], [-0.03, 0.03], [-0.06, 0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.08, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.04, -0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.07, 0.03], [-0.05, -0.01], [-0.04, -0.0], [-0.04, 0.0]], [[-0.04, 0.01], [-0.06, 0.0], [-0.08, 0.04], [-0.04, 0.05], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.0], [-0.03, 0.04], [-0.08, 0.04], [-0.06, 0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.07, 0.02], [-0.04, 0.0], [-0.06, 0.01], [-0.04, 0.05], [-0.04, 0.01], [-0.04, 0.05], [-0.05, -0.01], [-0.03, 0.01], [-0.06, 0.0], [-0.08, 0.03], [-0.04, -0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.04, 0.07], [-0.03, 0.04], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.0], [0.0, 0.14], [-0.07, 0.02], [-0.03, 0.04], [-0.06, 0.0], [-0.04, 0.06], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.03], [-0.04, 0.01], [-0.06, 0.0], [-0.04, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.0]], [[-0.07, 0.03], [-0.04, 0.0], [-0.04, 0.0], [-0.05, -0.02], [-0.04, -0.0], [-0.03, 0.02], [-0.07, 0.03], [-0.07, 0.03], [-0.07, 0.02], [-0.07, 0.03], [-0.04, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.06], [-0.04, -0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.04, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.03], [-0.08, 0.04], [-0.07, 0.01], [-0.07, 0.03], [-0.06, 0.01], [-0.04, 0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.07, 0.01], [-0.04, 0.07], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.02], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.0], [-0.06, 0.01], [-0.08, 0.04], [-0.04, 0.0], [-0.03, 0.1], [-0.06, -0.0]], [[-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.04, 0.05], [-0.05, -0.01], [-0.06, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.04, -0.0], [-0.04, 0.0], [-0.05, -0.0], [-0.04, -0.0], [-0.03, 0.02], [-0.06, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.03, 0.01], [-0.04, 0.07], [-0.04, -0.0], [-0.02, 0.11], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.03], [-0.06, 0.0], [-0.07, 0.02], [-0.08, 0.04], [-0.06, 0.0], [-0.07, 0.02], [-0.04, -0.0], [-0.07, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.06, -0.0], [-0.07, 0.01], [-0.06, 0.01], [-0.05, -0.0], [-0.04, 0.07], [-0.05, -0.0], [-0.04, -0.0], [-0.06, 0.0]], [[-0.08, 0.04], [-0.04, 0.08], [-0.05, -0.01], [-0.07, 0.03], [-0.03, 0.02], [-0.05, -0.01], [-0.04, 0.05], [-0.04, 0.06], [-0.07, 0.02], [-0.03, 0.03], [-0.03, 0.03], [-0.08, 0.03], [-0.06, -0.0], [-0.06, 0.0], [-0.03, 0.04], [-0.07, 0.01], [-0.04, -0.0], [-0.05, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.07, 0.02], [-0.07, 0.02], [-0.06, 0.01], [-0.04, 0.01], [-0.07, 0.01], [-0.03, 0.04], [-0.04, 0.09], [-0.04, -0.0], [-0.05, -0.01], [-0.04, 0.01], [-0.03, 0.04], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.04, 0.06], [-0.07, 0.02], [-0.04, -0.0], [-0.04, -0.0], [-0.06, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.03], [-0.04, 0.08]], [[-0.04, 0.0], [-0.02, 0.11], [-0.07, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.04, -0.0], [-0.05, -0.01], [-0.04, 0.07], [-0.04, -0.0], [-0.04, 0.0], [-0.06, -0.0], [-0.0, 0.14], [-0.04, 0.04], [-0.07, 0.01], [-0.03, 0.03], [-0.03, 0.1], [-0.05, -0.0], [-0.03, 0.03], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.03], [-0.03, 0.04], [-0.04, -0.0], [-0.06, 0.0], [-0.04, 0.0], [-0.07, 0.01], [-0.03, 0.01], [-0.06, 0.0], [-0.03, 0.04], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.01], [-0.07, 0.01], [-0.05, -0.0], [-0.03, 0.02], [-0.04, 0.08], [-0.08, 0.04], [-0.05, -0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.07, 0.03], [-0.05, -0.0], [-0.05, -0.01]], [[-0.03, 0.02], [-0.04, -0.0], [-0.03, 0.04], [-0.03, 0.02], [-0.06, -0.0], [-0.04, -0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.06, 0.0], [-0.06, 0.01], [-0.06, 0.0], [-0.06, 0.01], [-0.03, 0.02], [-0.05, -0.0], [-0.07, 0.02], [-0.03, 0.03], [-0.03, 0.03], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.07, 0.02], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.08, 0.04], [-0.03, 0.03], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.0], [-0.05, -0.01], [-0.06, -0.0], [-0.06, 0.01], [-0.03, 0.04], [-0.06, 0.0], [-0.07, 0.01], [-0.04, 0.0], [-0.03, 0.04], [-0.06, 0.01], [-0.04, 0.07], [-0.04, 0.0], [-0.07, 0.01], [-0.06, 0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01]], [[-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.06, 0.0], [-0.04, 0.09], [-0.06, 0.01], [-0.02, 0.1], [-0.05, -0.0], [-0.06, 0.0], [-0.03, 0.02], [-0.04, 0.08], [-0.05, -0.02], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.0], [-0.08, 0.03], [-0.07, 0.02], [-0.04, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.07, 0.01], [-0.07, 0.02], [-0.04, 0.05], [-0.05, -0.0], [-0.05, -0.02], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.06], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.03, 0.03], [-0.03, 0.03], [-0.07, 0.03], [-0.05, -0.02], [-0.06, 0.0], [-0.06, 0.01], [-0.01, 0.12], [-0.04, 0.0], [-0.04, -0.0], [-0.05, -0.0], [-0.04, 0.05], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.03, 0.02], [-0.07, 0.02]], [[-0.04, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.03], [-0.07, 0.02], [-0.08, 0.04], [-0.04, 0.07], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.04, -0.0], [-0.02, 0.11], [-0.06, 0.01], [-0.01, 0.13], [-0.03, 0.01], [-0.08, 0.03], [-0.04, -0.0], [-0.05, -0.01], [-0.03, 0.09], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.0], [-0.06, 0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.09], [-0.07, 0.02], [-0.03, 0.09], [-0.07, 0.02], [-0.03, 0.04], [-0.06, 0.01], [-0.07, 0.02], [-0.04, -0.0], [-0.05, -0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.06, -0.0], [-0.06, 0.0], [-0.01, 0.13], [-0.04, -0.0], [-0.04, -0.0]], [[-0.04, -0.0], [-0.06, -0.0], [-0.03, 0.03], [-0.04, 0.05], [-0.0, 0.14], [-0.07, 0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.06, 0.01], [-0.05, -0.0], [-0.07, 0.01], [-0.04, -0.0], [-0.04, -0.0], [-0.04, -0.0], [-0.06, -0.0], [-0.07, 0.02], [-0.03, 0.03], [-0.04, 0.05], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.08], [-0.05, -0.01], [-0.08, 0.04], [-0.07, 0.02], [-0.03, 0.03], [-0.04, 0.0], [-0.05, -0.0], [-0.04, 0.05], [-0.05, -0.01], [-0.07, 0.02], [-0.08, 0.03], [-0.03, 0.02], [-0.04, -0.0], [-0.04, 0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.03, 0.01], [-0.03, 0.03], [-0.05, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.02], [-0.06, 0.0], [-0.04, 0.06], [-0.04, -0.0], [-0.04, 0.0], [-0.03, 0.04]], [[-0.08, 0.03], [-0.04, -0.0], [-0.07, 0.02], [-0.03, 0.02], [-0.04, -0.0], [-0.04, 0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.07, 0.02], [-0.04, 0.08], [-0.06, 0.0], [-0.06, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.01], [-0.08, 0.04], [-0.08, 0.04], [-0.03, 0.02], [-0.06, -0.0], [-0.04, 0.07], [-0.04, -0.0], [-0.04, 0.07], [-0.07, 0.01], [-0.04, 0.05], [-0.03, 0.02], [-0.06, 0.0], [-0.04, -0.0], [-0.08, 0.04], [-0.05, -0.0], [-0.07, 0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.03], [-0.01, 0.13], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.06, -0.0], [-0.05, -0.0]], [[-0.04, -0.0], [-0.04, -0.0], [-0.08, 0.04], [-0.04, 0.08], [-0.05, -0.01], [-0.04, -0.0], [-0.07, 0.02], [-0.05, -0.02], [-0.05, -0.01], [-0.04, 0.09], [-0.05, -0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.06, 0.01], [-0.03, 0.02], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.08], [-0.06, 0.0], [-0.07, 0.01], [-0.05, -0.0], [-0.06, 0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.06, 0.01], [-0.03, 0.1], [-0.04, 0.0], [-0.07, 0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.03, 0.09], [-0.05, -0.02], [-0.06, 0.01], [-0.04, 0.0], [-0.08, 0.03], [-0.07, 0.02], [-0.04, 0.07], [-0.07, 0.02], [-0.07, 0.01], [-0.05, -0.0], [-0.03, 0.01], [-0.07, 0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.04, 0.05], [-0.04, 0.0], [-0.07, 0.02], [-0.04, -0.0]], [[-0.08, 0.04], [-0.06, 0.0], [-0.06, 0.0], [-0.04, 0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.04, 0.05], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.0], [-0.05, -0.0], [-0.07, 0.02], [-0.03, 0.03], [-0.04, 0.05], [-0.06, 0.01], [-0.05, -0.0], [-0.04, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.1], [-0.07, 0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.08, 0.04], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.02], [-0.07, 0.01], [-0.03, 0.03], [-0.07, 0.02], [-0.03, 0.04], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.04, 0.0], [-0.03, 0.03], [-0.07, 0.01], [-0.07, 0.03], [-0.04, 0.05], [-0.05, -0.01], [-0.04, 0.08], [-0.04, 0.06], [-0.06, 0.0], [-0.06, 0.01], [-0.03, 0.04], [-0.03, 0.04]], [[-0.06, -0.0], [-0.06, -0.0], [-0.04, 0.0], [-0.05, -0.0], [-0.06, 0.01], [-0.04, 0.0], [-0.07, 0.02], [-0.03, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.07, 0.01], [-0.03, 0.04], [-0.07, 0.02], [-0.05, -0.0], [-0.05, -0.02], [-0.06, 0.0], [-0.04, 0.06], [-0.07, 0.02], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.04, -0.0], [-0.04, -0.0], [-0.07, 0.02], [-0.06, 0.01], [-0.07, 0.02], [-0.06, 0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.03, 0.03], [-0.03, 0.03], [0.0, 0.14], [-0.04, 0.05], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.0], [-0.04, 0.01], [-0.03, 0.1], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.05, -0.01]], [[-0.03, 0.02], [-0.03, 0.04], [-0.07, 0.02], [-0.06, 0.0], [-0.01, 0.12], [0.0, 0.14], [-0.07, 0.03], [-0.06, 0.01], [-0.03, 0.03], [-0.03, 0.02], [-0.04, 0.07], [-0.04, 0.06], [-0.03, 0.03], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.07, 0.01], [-0.07, 0.03], [-0.02, 0.11], [-0.07, 0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.03, 0.02], [-0.04, -0.0], [-0.04, 0.07], [-0.04, -0.0], [-0.04, 0.0], [-0.06, 0.0], [-0.08, 0.04], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.01], [-0.08, 0.03], [-0.06, 0.0], [-0.06, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.04], [-0.06, 0.0], [-0.04, 0.08], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01]], [[-0.03, 0.03], [-0.06, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.03, 0.02], [-0.07, 0.01], [-0.06, 0.0], [-0.07, 0.03], [-0.03, 0.02], [-0.06, 0.0], [-0.08, 0.04], [-0.08, 0.04], [-0.05, -0.0], [-0.04, -0.0], [-0.04, 0.0], [-0.07, 0.02], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.02], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.0], [-0.05, -0.0], [-0.04, 0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.04, 0.05], [-0.05, -0.02], [-0.05, -0.01], [-0.04, 0.01], [-0.05, -0.0], [-0.04, 0.0], [-0.08, 0.03], [-0.04, 0.0], [-0.07, 0.01], [-0.06, 0.0], [-0.04, -0.0], [-0.05, -0.0], [-0.04, 0.01], [-0.03, 0.04], [-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.0]], [[-0.04, -0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.04, -0.0], [-0.04, 0.06], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.03], [-0.04, 0.06], [-0.05, -0.0], [-0.07, 0.03], [-0.03, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.03, 0.09], [-0.04, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.03, 0.03], [-0.03, 0.02], [-0.03, 0.02], [-0.06, 0.0], [-0.03, 0.09], [-0.07, 0.02], [-0.06, 0.0], [-0.06, 0.0], [-0.04, 0.01], [-0.03, 0.02], [-0.05, -0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.06, 0.0], [-0.08, 0.04], [-0.07, 0.02], [-0.03, 0.02], [-0.05, -0.0], [-0.04, 0.07], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.06, 0.0]], [[-0.07, 0.02], [-0.07, 0.02], [-0.01, 0.12], [-0.04, 0.08], [-0.04, -0.0], [-0.03, 0.04], [-0.03, 0.02], [-0.04, 0.05], [-0.03, 0.04], [-0.03, 0.02], [-0.05, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.01], [-0.07, 0.01], [-0.07, 0.01], [-0.05, -0.0], [-0.04, 0.01], [-0.04, 0.06], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.02], [-0.05, -0.01], [-0.07, 0.03], [-0.05, -0.01], [-0.06, 0.0], [-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.04, 0.0], [-0.04, -0.0], [-0.04, -0.0], [-0.04, 0.05], [-0.07, 0.03], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.04, 0.05], [-0.05, -0.01], [-0.03, 0.01], [-0.05, -0.01], [-0.02, 0.11]], [[-0.04, 0.0], [-0.07, 0.02], [-0.04, 0.05], [-0.06, 0.01], [-0.03, 0.04], [-0.08, 0.04], [-0.07, 0.02], [-0.04, 0.0], [-0.06, 0.0], [-0.04, 0.0], [-0.04, -0.0], [-0.03, 0.04], [-0.07, 0.01], [-0.03, 0.02], [-0.04, -0.0], [-0.06, 0.0], [-0.06, 0.01], [-0.07, 0.02], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.05], [-0.03, 0.02], [-0.04, 0.07], [-0.04, -0.0], [-0.07, 0.03], [-0.05, -0.0], [-0.03, 0.04], [-0.03, 0.04], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.05], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.0], [-0.06, 0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.0], [-0.04, -0.0], [-0.06, -0.0], [-0.05, -0.01], [-0.06, -0.0], [-0.06, 0.01], [-0.05, -0.0], [-0.03, 0.02], [-0.06, 0.0]], [[-0.07, 0.02], [-0.04, 0.05], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.07], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.0], [-0.04, 0.05], [-0.06, 0.0], [-0.03, 0.04], [-0.05, -0.01], [-0.03, 0.03], [-0.06, 0.01], [-0.04, -0.0], [-0.06, 0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.04, 0.07], [-0.07, 0.03], [-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.04], [-0.08, 0.03], [-0.03, 0.1], [-0.04, 0.08], [-0.05, -0.01], [-0.03, 0.1], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.04, 0.01], [-0.06, 0.0], [-0.03, 0.09], [-0.05, -0.01], [-0.06, 0.01]], [[-0.05, -0.01], [-0.03, 0.03], [-0.07, 0.01], [-0.07, 0.02], [-0.05, -0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.03, 0.1], [-0.04, 0.05], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.03, 0.04], [-0.05, -0.01], [-0.07, 0.01], [-0.07, 0.01], [-0.05, -0.0], [-0.07, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.05], [-0.03, 0.03], [-0.07, 0.01], [-0.04, 0.07], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.04, 0.06], [-0.06, 0.01], [-0.03, 0.03], [-0.04, 0.09], [-0.05, -0.0], [-0.03, 0.04], [-0.09, 0.06], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.08, 0.05], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.01]], [[-0.06, -0.0], [-0.07, 0.01], [-0.07, 0.01], [-0.03, 0.03], [-0.03, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.07, 0.03], [-0.03, 0.02], [-0.04, -0.0], [-0.06, 0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.01], [-0.06, 0.0], [-0.07, 0.03], [-0.08, 0.05], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.05], [-0.06, -0.0], [-0.03, 0.01], [-0.03, 0.04], [-0.03, 0.02], [-0.07, 0.03], [-0.06, 0.01], [-0.03, 0.02], [-0.07, 0.01], [-0.03, 0.01], [-0.04, 0.04], [-0.03, 0.04], [-0.02, 0.11], [-0.06, -0.0], [-0.07, 0.02], [-0.07, 0.01], [-0.07, 0.03], [-0.05, -0.01], [-0.07, 0.01], [-0.06, 0.0], [-0.04, 0.06], [-0.04, -0.0], [-0.07, 0.03], [-0.05, -0.01], [-0.04, 0.0]], [[-0.08, 0.03], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.0], [-0.04, 0.0], [-0.03, 0.02], [-0.04, 0.0], [-0.03, 0.02], [-0.06, -0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.01], [-0.04, 0.08], [-0.08, 0.04], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.0], [-0.05, -0.0], [-0.07, 0.02], [-0.07, 0.01], [-0.07, 0.02], [-0.04, 0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.07, 0.01], [-0.04, 0.09], [-0.06, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.03], [-0.05, -0.0], [-0.04, 0.08], [-0.04, 0.05], [-0.07, 0.02], [-0.07, 0.01], [-0.07, 0.03], [-0.05, -0.0], [-0.06, 0.0], [-0.03, 0.02], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.06, 0.01], [-0.09, 0.06], [-0.04, -0.0], [-0.04, -0.0], [-0.04, -0.0]], [[-0.03, 0.04], [-0.03, 0.03], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.04, 0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.04, 0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.06, 0.01], [-0.07, 0.01], [-0.03, 0.03], [-0.01, 0.12], [-0.03, 0.1], [-0.05, -0.0], [-0.03, 0.02], [-0.05, -0.0], [-0.05, -0.02], [-0.09, 0.06], [-0.04, 0.0], [-0.04, -0.0], [-0.04, 0.07], [-0.04, 0.08], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.04, 0.04], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.02], [-0.05, -0.0], [-0.04, 0.05], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0]], [[-0.09, 0.06], [-0.07, 0.03], [-0.06, 0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.05], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.08], [-0.05, -0.02], [-0.06, 0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.03, 0.03], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.03], [-0.03, 0.02], [-0.06, 0.0], [-0.08, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.05, -0.01], [-0.05, -0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.04, -0.0], [-0.04, 0.05], [-0.08, 0.05], [-0.07, 0.01], [-0.08, 0.05], [-0.05, -0.01], [-0.03, 0.04], [-0.04, 0.05], [-0.05, -0.0], [-0.06, 0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.02]], [[-0.07, 0.02], [-0.05, -0.01], [-0.06, -0.0], [-0.07, 0.02], [-0.04, 0.05], [-0.1, 0.08], [-0.03, 0.01], [-0.03, 0.01], [-0.04, -0.0], [-0.07, 0.02], [-0.03, 0.1], [-0.04, 0.01], [-0.03, 0.04], [-0.03, 0.02], [-0.05, -0.01], [-0.04, 0.0], [-0.03, 0.04], [-0.06, 0.0], [-0.07, 0.02], [-0.03, 0.02], [-0.07, 0.01], [-0.04, -0.0], [-0.04, 0.0], [-0.04, 0.0], [-0.03, 0.01], [-0.04, 0.07], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.07], [-0.04, 0.08], [-0.04, -0.0], [-0.07, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.07], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.03, 0.02], [-0.05, -0.01], [-0.06, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.06, 0.0]], [[-0.07, 0.02], [-0.07, 0.02], [-0.04, 0.06], [-0.06, 0.0], [-0.04, 0.06], [-0.03, 0.03], [-0.05, -0.0], [-0.06, 0.0], [-0.07, 0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.03, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.03], [-0.05, -0.01], [-0.05, -0.02], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.04, 0.08], [-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.03], [-0.04, -0.0], [-0.05, -0.0], [-0.03, 0.01], [-0.05, -0.01], [-0.06, -0.0], [-0.07, 0.02], [-0.04, 0.0], [-0.06, 0.0], [-0.08, 0.04], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.04, -0.0], [-0.05, -0.0], [-0.03, 0.04], [-0.05, -0.01]], [[-0.06, 0.0], [-0.03, 0.01], [-0.06, 0.0], [-0.04, -0.0], [-0.05, -0.0], [-0.04, 0.0], [-0.06, 0.01], [-0.07, 0.02], [-0.08, 0.04], [-0.05, -0.01], [-0.07, 0.03], [-0.03, 0.04], [-0.06, 0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.02], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.0], [-0.04, 0.01], [-0.03, 0.03], [-0.08, 0.04], [-0.05, -0.01], [-0.04, 0.06], [-0.04, 0.01], [-0.04, 0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.04], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.02], [-0.05, -0.0], [-0.04, 0.0], [-0.05, -0.02], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.06, 0.0], [-0.04, 0.0], [-0.07, 0.01], [-0.05, -0.02], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.03], [-0.04, -0.0], [-0.06, 0.0], [-0.06, -0.0]], [[-0.06, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.04, -0.0], [-0.05, -0.0], [-0.04, -0.0], [-0.04, 0.0], [-0.04, -0.0], [-0.08, 0.04], [-0.05, -0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.09, 0.06], [-0.03, 0.04], [-0.05, -0.01], [-0.04, 0.05], [-0.07, 0.03], [-0.06, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.08, 0.05], [-0.04, 0.04], [-0.04, -0.0], [-0.07, 0.01], [0.0, 0.14], [-0.07, 0.03], [-0.05, -0.01], [-0.09, 0.08], [-0.07, 0.01], [-0.02, 0.11], [-0.05, -0.01], [-0.04, 0.01], [-0.06, 0.0], [-0.04, 0.08], [-0.07, 0.01], [-0.05, -0.01], [-0.08, 0.04], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.02], [-0.06, 0.0], [-0.04, -0.0], [-0.04, -0.0]], [[-0.06, 0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.06, 0.0], [-0.08, 0.03], [-0.06, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.07, 0.02], [-0.06, 0.01], [-0.04, -0.0], [-0.05, -0.0], [-0.04, 0.06], [-0.06, 0.0], [-0.04, 0.07], [-0.05, -0.0], [-0.03, 0.09], [-0.06, 0.01], [-0.05, -0.01], [-0.08, 0.04], [-0.06, 0.0], [-0.03, 0.04], [-0.05, -0.01], [-0.04, -0.0], [-0.07, 0.01], [-0.06, 0.0], [-0.08, 0.04], [-0.07, 0.02], [-0.06, 0.0], [-0.07, 0.01], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.02], [-0.03, 0.02], [-0.06, 0.0], [-0.08, 0.04], [-0.04, 0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.03], [-0.06, 0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.03, 0.02], [-0.08, 0.04]], [[-0.03, 0.03], [-0.04, 0.06], [-0.05, -0.01], [-0.02, 0.11], [-0.04, -0.0], [-0.07, 0.02], [-0.07, 0.01], [-0.03, 0.04], [-0.07, 0.02], [-0.03, 0.03], [-0.07, 0.02], [-0.06, 0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.0], [-0.03, 0.03], [-0.07, 0.01], [-0.03, 0.09], [-0.04, 0.01], [-0.07, 0.02], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.04], [-0.04, 0.0], [-0.03, 0.04], [-0.04, 0.06], [-0.06, 0.01], [-0.04, 0.01], [-0.03, 0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.03, 0.02], [-0.05, -0.0], [-0.08, 0.04], [-0.05, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.07, 0.02], [-0.04, 0.0], [-0.08, 0.05], [-0.05, -0.01]], [[-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.08], [-0.04, -0.0], [-0.05, -0.01], [-0.03, 0.02], [-0.06, 0.01], [-0.07, 0.01], [-0.04, -0.0], [-0.04, 0.06], [-0.04, 0.01], [-0.07, 0.01], [-0.07, 0.03], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.03], [-0.07, 0.01], [-0.03, 0.03], [-0.03, 0.02], [-0.07, 0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.07, 0.01], [-0.06, 0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.06, -0.0], [-0.06, 0.0], [-0.06, 0.01], [-0.05, -0.0], [-0.05, -0.0], [-0.04, -0.0], [-0.03, 0.02], [-0.03, 0.09], [-0.06, 0.0], [-0.06, 0.0], [-0.07, 0.01], [-0.07, 0.03], [-0.04, -0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.01], [-0.03, 0.04]], [[-0.05, -0.0], [-0.05, -0.01], [-0.08, 0.03], [-0.06, -0.0], [-0.06, 0.0], [-0.03, 0.01], [-0.03, 0.1], [-0.05, -0.0], [-0.03, 0.02], [-0.04, 0.0], [-0.06, 0.01], [-0.06, 0.0], [-0.03, 0.03], [-0.06, 0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.04, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.06, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.05], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.06], [-0.05, -0.01], [-0.07, 0.03], [-0.05, -0.0], [-0.04, 0.04], [-0.04, 0.0], [-0.04, -0.0], [-0.08, 0.04], [-0.04, -0.0], [-0.08, 0.06], [-0.05, -0.01], [-0.08, 0.03], [-0.05, -0.0]], [[-0.04, -0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.06, 0.01], [-0.06, 0.0], [-0.07, 0.01], [-0.07, 0.01], [-0.04, 0.09], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.01], [-0.04, 0.0], [-0.07, 0.03], [-0.07, 0.02], [-0.07, 0.03], [-0.04, 0.09], [-0.06, 0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.04, 0.0], [-0.07, 0.02], [-0.03, 0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.04, 0.05], [-0.05, -0.01], [-0.03, 0.09], [-0.05, -0.01], [-0.04, 0.05], [-0.05, -0.01], [-0.07, 0.03], [-0.06, -0.0], [-0.07, 0.02], [-0.05, -0.02], [-0.03, 0.03], [-0.06, 0.0], [-0.1, 0.09], [-0.06, 0.0], [-0.03, 0.02], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01]], [[-0.06, -0.0], [-0.04, -0.0], [-0.03, 0.03], [-0.07, 0.03], [-0.04, 0.0], [-0.06, -0.0], [-0.04, 0.05], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.03], [-0.05, -0.0], [-0.03, 0.03], [-0.07, 0.02], [-0.03, 0.1], [-0.04, 0.0], [-0.06, 0.0], [-0.03, 0.03], [-0.07, 0.02], [-0.06, 0.01], [-0.09, 0.06], [-0.05, -0.01], [-0.03, 0.1], [-0.05, -0.0], [-0.04, 0.01], [-0.06, 0.0], [-0.04, -0.0], [-0.07, 0.02], [-0.04, 0.07], [-0.03, 0.02], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.05], [-0.04, 0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.01], [-0.06, 0.0], [-0.04, 0.0], [-0.04, 0.0], [-0.07, 0.02], [-0.04, 0.09], [-0.08, 0.04]], [[-0.04, 0.0], [-0.03, 0.03], [-0.07, 0.02], [-0.07, 0.02], [-0.04, 0.0], [-0.08, 0.04], [-0.05, -0.01], [-0.04, -0.0], [-0.07, 0.03], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.07, 0.01], [-0.06, 0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.03], [-0.03, 0.04], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.01], [-0.04, 0.06], [-0.05, -0.01], [-0.07, 0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.04, 0.05], [-0.04, -0.0], [-0.04, 0.07], [-0.06, 0.0], [-0.07, 0.01], [-0.03, 0.04], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.08], [-0.06, 0.0], [-0.03, 0.03], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01]], [[-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.08, 0.04], [-0.06, 0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.1, 0.08], [-0.09, 0.07], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.01], [-0.08, 0.06], [-0.05, -0.0], [-0.07, 0.03], [-0.06, -0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.01], [-0.06, 0.0], [-0.06, 0.01], [-0.04, 0.01], [-0.04, 0.07], [-0.04, -0.0], [-0.02, 0.11], [-0.03, 0.03], [-0.05, -0.0], [-0.05, -0.0], [-0.06, 0.0], [-0.04, 0.01], [-0.05, -0.01], [-0.04, 0.01], [-0.05, -0.01], [-0.04, 0.05], [-0.03, 0.01], [-0.05, -0.01], [-0.07, 0.03], [-0.08, 0.03], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.09], [-0.03, 0.03], [-0.06, 0.01]], [[-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.08, 0.04], [-0.03, 0.02], [-0.07, 0.01], [-0.03, 0.04], [-0.05, -0.01], [-0.07, 0.02], [-0.08, 0.05], [-0.05, -0.01], [-0.05, -0.02], [-0.09, 0.06], [-0.07, 0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.07], [-0.05, -0.0], [-0.04, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.08, 0.03], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.0], [-0.08, 0.04], [-0.06, 0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.07, 0.02], [-0.05, -0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.08, 0.04], [-0.03, 0.02], [-0.04, 0.04], [-0.03, 0.02], [-0.03, 0.03], [-0.05, -0.01], [-0.07, 0.03]], [[-0.04, -0.0], [-0.05, -0.0], [-0.07, 0.01], [-0.03, 0.02], [-0.06, 0.0], [-0.04, -0.0], [-0.04, -0.0], [-0.06, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.01], [-0.07, 0.02], [-0.04, -0.0], [-0.04, 0.08], [-0.06, 0.01], [-0.04, 0.01], [-0.03, 0.1], [-0.04, -0.0], [-0.07, 0.03], [-0.04, -0.0], [-0.07, 0.01], [-0.06, 0.0], [-0.04, -0.0], [-0.08, 0.03], [-0.03, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.03, 0.02], [-0.07, 0.02], [-0.07, 0.01], [-0.05, -0.0], [-0.03, 0.02], [-0.03, 0.04], [-0.08, 0.03], [-0.05, -0.01], [-0.04, 0.0], [-0.07, 0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.06, 0.0], [-0.04, 0.06], [-0.05, -0.01], [-0.07, 0.02]], [[-0.04, 0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.09], [-0.07, 0.02], [-0.04, 0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.05, -0.0], [-0.06, 0.01], [-0.04, 0.07], [-0.05, -0.01], [-0.04, 0.06], [-0.05, -0.0], [-0.04, 0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.08, 0.05], [-0.03, 0.03], [-0.05, -0.0], [-0.03, 0.03], [-0.05, -0.02], [-0.07, 0.01], [-0.07, 0.01], [-0.04, 0.01], [-0.08, 0.03], [-0.06, 0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.06, -0.0], [-0.03, 0.02], [-0.04, 0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.08, 0.03], [-0.03, 0.02], [-0.04, -0.0], [-0.06, -0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.06, 0.0]], [[-0.04, 0.08], [-0.07, 0.02], [-0.05, -0.01], [-0.08, 0.04], [-0.04, -0.0], [-0.05, -0.01], [-0.01, 0.13], [-0.07, 0.02], [-0.04, 0.05], [-0.06, 0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.08, 0.04], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.06, 0.0], [-0.01, 0.12], [-0.07, 0.03], [-0.03, 0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.04, -0.0], [-0.07, 0.03], [-0.04, 0.05], [-0.04, 0.07], [-0.04, 0.08], [-0.04, 0.08], [-0.06, 0.0], [-0.03, 0.02], [-0.06, -0.0], [-0.06, 0.0], [-0.04, 0.06], [-0.05, -0.0], [-0.06, 0.0], [-0.07, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.08, 0.05], [-0.05, -0.0], [-0.06, 0.0]], [[-0.03, 0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.03, 0.1], [-0.06, 0.0], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.0], [-0.05, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.04, 0.05], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.03], [-0.07, 0.03], [-0.06, 0.0], [-0.07, 0.02], [-0.04, 0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.03], [-0.05, -0.0], [-0.04, 0.0], [-0.03, 0.03], [-0.03, 0.02], [-0.08, 0.04], [-0.03, 0.02], [-0.06, 0.0], [-0.09, 0.07], [-0.05, -0.0], [-0.04, -0.0], [-0.03, 0.03], [-0.06, 0.0], [-0.04, 0.0], [-0.06, 0.01], [-0.03, 0.03], [-0.04, 0.05], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.03], [-0.05, -0.01], [-0.05, -0.0], [-0.06, 0.0], [-0.04, 0.07], [-0.06, 0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01]], [[-0.06, 0.0], [-0.03, 0.03], [-0.06, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.05], [-0.05, -0.01], [-0.04, -0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.07, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.07, 0.03], [-0.06, 0.0], [-0.06, 0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.0], [-0.04, -0.0], [-0.06, 0.01], [-0.06, 0.01], [-0.03, 0.02], [-0.07, 0.03], [-0.07, 0.01], [-0.07, 0.01], [-0.06, -0.0], [-0.03, 0.02], [-0.05, -0.01], [-0.07, 0.02], [-0.02, 0.11], [-0.04, -0.0], [-0.05, -0.01], [-0.04, -0.0], [-0.07, 0.02], [-0.05, -0.0], [-0.04, 0.01], [-0.08, 0.04], [-0.08, 0.05], [-0.06, 0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.08, 0.04], [-0.05, -0.01], [-0.04, -0.0], [-0.04, -0.0]], [[-0.04, 0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.06, 0.0], [-0.05, -0.02], [-0.05, -0.0], [-0.04, 0.0], [-0.06, -0.0], [-0.03, 0.02], [-0.04, -0.0], [-0.03, 0.09], [-0.03, 0.02], [-0.03, 0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.0], [-0.06, 0.01], [-0.05, -0.0], [-0.08, 0.04], [-0.07, 0.02], [-0.06, 0.01], [-0.03, 0.03], [-0.03, 0.02], [-0.05, -0.0], [-0.04, 0.06], [-0.08, 0.05], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.07, 0.02], [-0.04, 0.08], [-0.05, -0.01], [-0.03, 0.01], [-0.06, -0.0], [-0.04, -0.0], [-0.03, 0.04], [-0.08, 0.04], [-0.04, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.04, -0.0], [-0.04, 0.06], [-0.04, 0.05], [-0.06, 0.0], [-0.03, 0.04], [-0.03, 0.03]], [[-0.05, -0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.02], [-0.03, 0.03], [-0.07, 0.03], [-0.04, -0.0], [-0.04, -0.0], [-0.06, 0.0], [-0.06, 0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.08, 0.03], [-0.05, -0.01], [-0.07, 0.01], [-0.03, 0.03], [-0.07, 0.03], [0.01, 0.14], [-0.08, 0.03], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.01], [-0.03, 0.01], [-0.06, 0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.06, 0.0], [-0.04, -0.0], [-0.02, 0.11], [-0.04, 0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.04, 0.07], [-0.05, -0.0], [-0.05, -0.01], [-0.04, 0.05], [-0.07, 0.01], [-0.04, 0.05], [-0.03, 0.03], [-0.04, -0.0], [-0.04, -0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.06, 0.0]], [[-0.07, 0.02], [-0.07, 0.03], [-0.04, 0.01], [-0.03, 0.03], [-0.07, 0.02], [-0.06, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.02, 0.11], [-0.04, -0.0], [-0.07, 0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.08, 0.04], [-0.04, 0.08], [-0.07, 0.02], [-0.03, 0.04], [-0.07, 0.01], [-0.04, -0.0], [-0.06, -0.0], [-0.04, 0.06], [-0.03, 0.04], [-0.07, 0.03], [-0.03, 0.02], [-0.05, -0.01], [-0.03, 0.02], [-0.07, 0.02], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.07, 0.01], [-0.05, -0.0], [-0.07, 0.02], [-0.04, 0.01], [-0.03, 0.02], [-0.06, 0.0], [-0.08, 0.05], [-0.04, 0.08], [-0.04, 0.04], [-0.07, 0.03], [-0.07, 0.03], [-0.06, 0.01], [-0.05, -0.01], [-0.04, 0.05], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.04, 0.0]], [[-0.05, -0.01], [-0.03, 0.02], [-0.07, 0.01], [-0.08, 0.03], [-0.08, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.03, 0.02], [-0.06, 0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.04, 0.01], [-0.04, 0.08], [-0.08, 0.04], [-0.07, 0.02], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.08, 0.04], [-0.04, -0.0], [-0.04, 0.06], [-0.05, -0.01], [-0.06, 0.01], [-0.02, 0.11], [-0.04, 0.05], [-0.03, 0.03], [-0.06, 0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.03], [-0.04, 0.06], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.08, 0.03], [0.02, 0.17], [-0.05, -0.01], [-0.04, 0.07], [-0.1, 0.08], [-0.05, -0.0], [-0.03, 0.1], [-0.07, 0.02], [-0.06, 0.01], [-0.04, -0.0], [-0.06, 0.01], [-0.04, -0.0]], [[-0.06, 0.0], [-0.06, 0.0], [-0.04, 0.06], [-0.07, 0.02], [-0.04, 0.07], [-0.05, -0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.03, 0.01], [-0.07, 0.02], [-0.07, 0.02], [-0.03, 0.02], [-0.05, -0.01], [-0.03, 0.04], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.04, 0.01], [-0.05, -0.0], [-0.06, -0.0], [-0.06, 0.01], [-0.03, 0.04], [-0.04, 0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.02, 0.11], [-0.03, 0.03], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.08, 0.04], [-0.03, 0.02], [-0.07, 0.03], [-0.05, -0.02], [-0.04, 0.07], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.0], [-0.04, -0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.03, 0.04], [-0.07, 0.01], [-0.07, 0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01]], [[-0.04, 0.0], [-0.08, 0.05], [-0.06, 0.0], [-0.03, 0.04], [-0.04, 0.05], [-0.04, 0.09], [-0.08, 0.04], [-0.05, -0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.08, 0.05], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.03, 0.03], [-0.03, 0.03], [-0.04, -0.0], [-0.03, 0.04], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.08, 0.03], [-0.07, 0.02], [-0.07, 0.02], [-0.06, 0.0], [-0.07, 0.02], [-0.07, 0.02], [-0.07, 0.02], [-0.05, -0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.01], [-0.05, -0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.03, 0.02], [-0.06, 0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.05, -0.01], [-0.03, 0.02], [-0.07, 0.02], [-0.06, 0.0]], [[-0.03, 0.04], [-0.06, 0.0], [-0.04, 0.0], [-0.04, 0.0], [-0.02, 0.12], [-0.04, 0.07], [-0.05, -0.02], [-0.07, 0.02], [-0.07, 0.02], [-0.06, 0.0], [-0.04, -0.0], [-0.06, 0.01], [-0.03, 0.01], [-0.06, 0.0], [-0.04, -0.0], [-0.07, 0.01], [-0.04, 0.0], [-0.04, -0.0], [-0.04, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.04], [-0.04, -0.0], [-0.04, 0.0], [-0.04, -0.0], [-0.04, 0.06], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.04, 0.0], [-0.06, 0.0], [-0.06, -0.0], [-0.06, 0.0], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.05], [-0.07, 0.02], [-0.06, 0.0], [-0.08, 0.04], [-0.03, 0.02], [-0.07, 0.02], [-0.04, 0.09], [-0.07, 0.02], [-0.08, 0.03]], [[-0.03, 0.02], [-0.07, 0.01], [-0.07, 0.01], [-0.05, -0.02], [-0.07, 0.01], [-0.06, 0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.03, 0.02], [-0.05, -0.0], [-0.04, 0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.03, 0.1], [-0.03, 0.04], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.03, 0.03], [-0.06, 0.01], [-0.04, 0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.08], [-0.05, -0.01], [-0.05, -0.0], [-0.05, -0.01], [-0.05, -0.0], [-0.08, 0.05], [-0.05, -0.01], [-0.05, -0.01], [-0.04, 0.0], [-0.03, 0.02], [-0.06, 0.0], [-0.03, 0.03], [-0.04, -0.0], [-0.05, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.03, 0.09], [-0.07, 0.02], [-0.08, 0.05], [-0.05, -0.01]], [[-0.07, 0.02], [-0.06, 0.0], [-0.03, 0.02], [-0.03, 0.03], [-0.07, 0.01], [-0.05, -0.01], [-0.03, 0.04], [-0.08, 0.05], [-0.09, 0.07], [-0.03, 0.02], [-0.05, -0.01], [-0.04, 0.0], [-0.06, 0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.04, 0.09], [-0.05, -0.01], [-0.07, 0.02], [-0.03, 0.02], [-0.03, 0.02], [-0.05, -0.01], [-0.06, -0.0], [-0.03, 0.03], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.04, 0.05], [-0.06, 0.01], [-0.05, -0.01], [-0.04, -0.0], [-0.05, -0.01], [-0.05, -0.01], [-0.05, -0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.01], [-0.04, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.03, 0.04], [-0.07, 0.02], [-0.06, 0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.08, 0.03]], [[-0.06, 0.0], [-0.08, 0.04], [-0.03, 0.02], [-0.05, -0.01], [-0.04, 0.08], [-0.05, -0.01], [-0.1, 0.09], [-0.04, 0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.04, 0.04], [-0.08, 0.04], [-0.03, 0.03], [-0.04, 0.05], [-0.04, -0.0], [-0.05, -0.01], [-0.09, 0.06], [-0.05, -0.01], [-0.08, 0.04], [-0.02, 0.11], [-0.06, 0.0], [-0.01, 0.12], [-0.07, 0.03], [-0.03, 0.02], [-0.03, 0.02], [-0.05, -0.01], [-0.04, -0.0], [-0.08, 0.04], [-0.06, 0.01], [-0.06, 0.0], [-0.07, 0.02], [-0.06, 0.0], [-0.05, -0.0], [-0.03, 0.02], [-0.05, -0.0], [-0.06, 0.0], [-0.05, -0.0], [-0.04, 0.0], [-0.07, 0.02], [-0.03, 0.1], [-0.07, 0.02], [-0.07, 0.01], [-0.07, 0.01], [-0.06, 0.01], [-0.05, -0.01], [-0.07, 0.02], [-0.08, 0.03], [-0.07, 0.03], [-0.05, -0.01], [-0.05, -0.0]], [[-0.05, -0.01], [-0.04, 0.09], [-0.04, 0.0], [-0.05, -0.01], [-0.07, 0.01], [-0.08, 0.04], [-0.05, -0.0], [-0.04, -0.0], [-0.04, -0.0], [-0.08, 0.03], [-0.04, -0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.03, 0.03], [-0.02, 0.12], [-0.06, 0.01], [-0.04, 0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.04, -0.0], [-0.05, -0.01], [-0.04, 0.05], [-0.05, -0.01], [-0.06, -0.0], [-0.08, 0.04], [-0.01, 0.12], [-0.06, -0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.06, 0.0], [-0.05, -0.0], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.07, 0.02], [-0.05, -0.01], [-0.04, 0.0], [-0.07, 0.01], [-0.06, 0.01], [-0.06, 0.0], [-0.06, 0.0], [-0.06, 0.0], [-0.05, -0.01], [-0.04, 0.0], [-0.03, 0.01], [-0.06, 0.0], [-0.04, 0.01]]]
+        "pointsTrajectory": "UFZUUgEBAQH0AQAAMgAAAAIAAAB7FK5H4XqEPwAAAAD5/vcA+QP3//f/+v/5/vkF9//6Afj/+gH4//sI+f73//oB+gH4//j++f73//f/+f75A/f/9wD5//j/9//6APj++gH3//n++gb6//oA+gH5/fn++P/5/voG+P75/vsH+P73//n+AAQCAwL8AwECBAACAwIDAgQAAP8EAQH/AwEA9wECBQIB/wAAAgICAwICBgMDAgMHAP4GBAUBAwMCAgQAAgECAwAAAwIDAgD6/wL/BAAAAgMBAwQHAwMCAgMBBAX/+gQJBAEDAgL9Avz/AQH/Af3/AgEC/vkAAAEAAQMAAP0DAQgAAP/+/QQB/gIGAAABAP8E/wH/+/8D/vz//gAE/wECBf0B/wAA/wH+//8B/wL+/wEC/wUNAf8B/v7//vgAAP8FAf7++v4D/AP+Av8BAwH+A/8DAP4AAAMKAQH/AfwAAAAE/vz9AgAAAQYH/wH++QH//gAAAAP+AP8D+wAAAAH9+wL+/vsEAQEAAwIBAf8B/gL/Af8C/QL68/8A/P8B/wH//wEB/AAAAf4DAwT+Af8AAP3/BAAB/QME//7+9f8AAwMA/v4B//4D+/wDAgL/9wH/Af/9AwME/voAAAEIBA4AAP4BAf8CCQAA/vwA///+////AgL+AgYD+f4FAf8B/wMDAQgAAf8B/f0BAf8B//kA/wIA/wH/A//+AwMA+/0B/gIBAP77BAADCP8BAAEE/f3+/v0BBgAAAv7//P8D/QIA+f72/wIB//8CAPr/AQEBAf/+Af4DAAABAQH8Af8E+AEG/gP7Af37AP8FCgMD//8DA/8C//8BAwMHAP/+AAAH/QEAAgH//AQAAPwC/foAAf4D//8AAAAA/f0AAAIA//8E/wP+AAAAAf8BAAAD/gD+AgD9A/4EAf4D/gAB///8/wAAAQH++wL9BvwC/gAA/fT//AEB/f0C/wEB//7++AME/wH//QAB/wEDBAL9AAAE/gH9/gQA//8C/wMCAwL9AQr//wIC/AD9Av///P4AAAMC/wD9/wABAvwA/wID/gEB/f0GAf8CCgAGAwT/Af39/wEAAAABAAD+AAEA/gD/AAAGAgj9/QL+/voAAAUF/fwA/wAA/AEAAQL7Af4AAAMF//7/AQH7/QP8AQH+Av3/AQAABAEAAAD/AwL//gEG/wL9/v8CAgAD+gIA/vcA+v38/wECAAD//AcCAgEDAQACAwABAgT/+f75/wECBQMCAP8A+/8CAAABAgL+Af4BAP8CAf//9/4BAAD++wT9AAEAAP4CAf8DAv/9/v4AAPz/AgT9/QH+/wIDBAAH/wEBAgIE/gADAwP//gH/AQP6/f7+/P8A/P8DAAAAAgMDAgT8/wEAAAL+//wDBAH/BA3+Af4C/gMB/wEA/gMB/wH/AQEACAH+AwIEAf4E//sABQD//gMB//39Av0B/gMFAPkB/AEA/f4A/v4E/v3//wIDAAH/AgMD/gIDCgAA/AH++//9/P///wAC/P4AAf//APoAAfvxBAIC/gH9Af3+AAMHAP8AAP8AAfwCBP79/f8C/AABAgf9Bf0HAgcB/wEBAf//+P8A/vwA/wMD/v0D+wD//gP/+wH+Af///QAB/vUC/QL9/wEBAQH//gL/+AL+AP8AAf4AAAD/AfsAAAAAAP4FAAEA9wAAAQgA/wD//vsCBAAAAAH/AP30AvwD+QD5/wH/AAAB/gMA/wAAAQn8/v8B/wEHEQL9/wEAAP8BAAAC/v8BAQEA//8C/AAC/wAA/wECBAEBAAADAwD/AAEC/QIEAAEC/AMBAQL+Av/4AAD//QAB/wIA/wEHAf//AAEAAv3+Af8D/gMAAAH+AAD+AgH6/wMBAAAB+/ICC/8CAAAAAf4BAAD+BP4B/gMB/wL+/QIB/wAB/wT+AQD///4AAf8AAwL//QH+AAD7AgAAAv4AAQEHAAADAQAAAAD9+wAAAgX/AQAAAv8C/AQBAQUB//8CAf///gL8/wADA/3+/vUA/wAAAvz/AQAAAv0CCAQB/wIAAAT/AgEB/v75Af79BgD//gIEAP3+//8BAQEBBAL//v0F/wAA+v0D/wYAAwH/AwQCBAABAwj+A/wFAAD9/AH9AAEB/gH//QIAAAH//vsB//4DAv4DAwEBAwb/AP8C/vf+/QT//wH+/v7/AQIB//8CBPsABQL9/AH/AgIE//////76/gAF/gIG//8B/gD9//cAAf/5/AD/+fv7Av0EAQAAAgf8AQEG/gL/AQQAAQD+BP4C/wIEAQAA/vwBA/75AQAA/gIHAAACCv8BAAD+BQEB/QUC/wAAAPz+AwL9Af4A//0GAAADAv4E//7/+QAA/wD/+QABAP8AAP8A/gIC/AAA/P4AAAD6/wL9/AACAgD8//4CAvwD//8A/vwBAQEC/vwCBf8ABAn++v8B/vgD/wIEBPv9/gP7/////wAIAP8BAf8B/f4D+v8BAAAD+wAH/gMBAQL//gT+AgAA/wEC/gH/Af8CBQX+/QUBAQP6Av0C/f/+Av4AAAAA/QID//4D//8BAgID/f0DAv32Av8AAf78/AP+/P//BAsAAP8BAAD+9wL+/AMBAP8C/wIDBPwB/wEA/gL9//8BAQH/AwP/AQIIAwMCAAIC/vv9/wL8/P8A/wAAAP8BA/8BAf8CBAAAAAcB/gIK/f39/wMF/v0DBP//AwEBBQT9/wL/Av30AAADCf8BAgcCAwAAAwAAAP8B/vsA/wII/vsAAAAB//7+A//6Af/9+v38/wD/BQEB/wH/AgAC/wL9Bf8BAAQCAAL//vwD/v76AwL//f8DAwMA+AEBAAD+A/7+//r//gQKAf79Bf8BAPkCAAH7/AAD/f//Av0A//8BBAj++f8DAAAA/wAABPwCBQEBA/7/AQD/AP/7BwP+Av4D/QEABAEB///6//8AAP8BAAAC///+/voB/f/8AAf9Af39A//+Af8CAQL99AAAAvwB///+/gH+/QQAAQD+AAABAv8CAPv6/wAD/QAA/wEAAP4A/P0BAv0CAf/9BQH/BPj+AAEA///+A/z//gIBAf8CAAUDAgAB//8BAwIFAgn+AQD+AAH/Av/+AAEDA////wH+BAH/AgP///8BAQj+/gAAAf8AAAD//QIC/AH//QEAAAH/AAACAQEA/v0EAAMEA/v7//4DAgD///8CA/0B/gQDAAYCCP/7/v3///8B/vz/+v/3/gP/+gL+Av0BBwH+//z+BAIFAf7/AfsC/wEAAAAAAP/9AgILAP8AAAAAAf8CBQAA/wL+AwEIAAcC/wAA/v3++/8CAv4B/v///wL/Af8ABAH//P76//b/AP8B/wECAP8BAQH+AgH+AQH+A/8A/fsB/wAAAP7/+gMI/wMB/QH/A/4B/AAAAf7/9v8BAAAC/QID/vwBAAH+AP/8/f/3/wD+BAABAgUB/gD/AAEAAP8CA/4AAP79AAAB/wAAAgACBQL///4BAAEDAv0C/f0BAf4DCQMFAgT9AwH//wEA+AT//wICAgAAAAACAwEA/gACB/4CAgT+/QMJAv8CBAL+BPwAAAEABP/+Avz+AgUB/wAAAQkA/v//AgEA////AAEBAfsHAPv//wEKAQD7AQAAAgMC/wH//fj/+f78AwQB/wMDAAH//gH+///9Av3+AAgCAgIA/foEAfz+/wH89wAF/f0AAAED/gP+AP79AAAB/v77/wEB/v74AAIAAP8H/QT/AgIC/AUG+/0C/gL9+gAAAf4BBv/+AP8A//8AAAABB/75AAD9/fz//QEDBv0DAv3/Af72/f4EDgL+/AD/BAH/BAL/+gH//gT9/f4FAwP+AwP+AgH/AQIA/wEDAQL8/wICAwT9Agf9/wH+/v4C/QL+Av3+AAL9//r9AvwHAAEDBP4D+wEBAP8CAf8AAAABAPkA/wABAv7/AAIA+vIBAQUJA/oCBP8CAQYAAAD+AwMD+f/+BAD8BQEA/wL9AgMDAAEBBgD//fT///74Af8B/QD/BhD/Af4CAf8AAAIEAwYF+gD///sEAAP5AQAAAP8BAv4B/v8AA/8A/wAAAwQBAwIG/gH+9QAA/P7/+vz/AQEC/v78/wEAAP79A/r7AwABAv37AfwAAPsB/wD/AAEAAQEAAgX9BvrwAwEEAQID/gMAAP/3AAcBAQAA/f8BAP4AAf4DCQIFAAAA/wAHAQgCAwD+AP/8/gH++wf+AgL//wED+/4AAAEAAQAB//4BAQEBBf8B/v8CA/sD/gED/gMCCwD//wABA/38BQUBBv8G/v3+/QT//AD/Af/3//8A/wMDAQABAAAA//f++wEAAAH++P/4/f7+/f/+AvwAAQP5A//+AgAA/wEAAAIBAQAC/QAA/QL/AP78Af4B/gEB/QL9/QL9/fj/AgL+/vwBAP71/vz++QEG/QcAAwD+Af8BAgAAAAH8/v0CAP//Af4BAgMA/wD/Af8CBAD/AAD8BAAB/wD/Av4AAf4CAAIAAAH+/v///wICAv0HAQD9BQIDAQb//wL9/wL+BP8BAf8AAP4DAf/+AgIEAf8B/gX8AP4B//4DAAEBAQEAAf4B/v4D/gUB/v///wEAAf8B/vz/Av8BBPwCAP8CAv0DBAII/gABAv8A/wEAAAL//f8F9v0CA/v9/v/6AQEBAQH+AvwB/gD/AAAAAP4CAwD9/QAA/P/+/f3+AQD+BP///gD9AwH/Af8B/wT7AAD//wH/AgMB/wEBAAACAAEB/QAC/f8B/fz/9wAA/AABAAMDAQH//wMD+g3/Av8BAgACBQAF/AX+BP8C/wH9BQAAAP//AwED/wIBCgAAAQEB//8ABfoA/wIGAvwAAP4DAf77BgABAQD+A/39AQH+AAL+AQP+/wL+/wIDAwIAAQEB/wL9AAD9/f0D/wH8/gj3AP8DBP//AP/++wT7A/wB/gP/A/v+AgQDBAH9/AL9APgB/gAAAQECAQAAAAAA+gEG/QQC/QAAAvz/AQABAv3/AgAAAwQAAP78AgQAAAIH/v3//wABAAABAQH+AAAA/wIEAv7+/AP8/vz/AfsBAAEAAf8BAgv+AQEG/wIAAPz9AgYB/v0BAggDDP4BAQIBBP8B/QH/+gH//wEBAQH+Av/8BP4DAwP+APz+/gMBBv78AgQA+AEHAQH+/wABAAAAAQMEAAH/+/8BAAH+BP4BAgEAAAMB//4B//z3AgT/+gP9/vwEBP/5/wEDBv36/PT+Avz/AP8AAAAA/wIA/wIA/wAAAAEEBf4B/wH8/gQC/gYKAf8BAP78/gD++f//AgD+AgIL/gP++gMEAAADAfwGBQgD///+Bf79/v8BAP//A//6/gL+AwD/APn+A/8CAP4C/f8AAv4EAf79AwMAAf8BAQD+Af0DAgAA/v78AwP+/gH9/wD88vz+/gACBAAA/wH/Av0DAv37+AL9AQgA+QEB/AAD+/v3/QP+Av79AgH/AgEBA/sAAAH/BP8CBP4AAf8A//76AAD/AgD//P8BBAAA/wIAAAD/AAAAAf4B/AAAAAD+AAAC/gIFAgQC/gIF/vwDAwL+Av8B/QAAAvwBBgD//wAAAAL/Av8FCQL8Av7+BP0BAf4ACP4D/wEB//3/AQgDAv4C/wMB/wAAAv0BAAL9//z9/QP7AAD/AgH/Avz+AgQB/wL+/v8BAAD/+v79/wD9/QAA/P//Av//AAABAQEBAP8B/v4C///+AQAA/fUBAQEBAvwC/f4DAPgA/wMEAAADA//5/v0D/AT8AgL+A/0EAQb/Af8A/gT/AQL9Af/+AwIAA/wAAAAAAgEDAgIE/Af/AAIFAv0CAwMGAf4BAv8BAQkBBAH//wIA/wAAAAH///0E////AAAAAQgC/f0BAv4A/f8C/wIA/wAABA4AAPwAAv0E/QH+Af8DAwT8/wH+AgIHAv0BAwID/v0B/vwB/f79/QL8AAH++wAA/v3/9/wIAQEEAfz5/fz8//39AwT+AwL9AgUB/gIC/gMBCgH9/gUB//8B/v4C//38//7+Avvz/gH/AwEK/QL7//8C//0AAQH/BAP++AD//P4AAAIEAAEB/gEAAwIB/wIFAAAAAAIEAAAC+wAA/f8AAf8CAf0A///6AP8AAQD+A/7+/gL8/vf9/AL7AgQB//8BAAADBAECAAECBv4DA/v/9QQAAQAB/v8A/v8CCQD+Af8AAAQC/f8AAP8AAQD/Af8DAf79/AABAAD//gAB/wL//gH+A/0EAgIAAf/+AwMF/gL8AQAH/gP+AwIAAgADAwH+AAADCf4BAPr//QQAAAAAAAAA/gT//gL8/wIA/wH///X//v4D/wIAAQD//fwAAP8AAgf/+/8BAf4DAv8BAQEBAAP7AAD+Av8A/vwBAgAAA/4B/QL9AwEB/AL9Av39Av0B/vwAAAAA/fgAAP8AAAX6Bf38AvwAAAP+/gD/AQH+/gIBAf8C/AMEAgD//wEB/wMEAAEB//74AQD/AQMEAP4AAP79AAAAAf4AAv4A/wEA//4CAP///vz+A/3+/AD/Af4DAv0HDf0E/v0CAwIEAP8AAP/6BPkAAAH//gL//wIHAgD+AwAA/gD/AQAC//wCAP/6AgX8/v8B/wL/AvsIAv/7/wABAAABAQAJ/wD+A/4DAQH+Af4AAAAAAP8BAv0HDAQBAf8DBwAB+PcJDAIE/v7/+gH//wH/AQMMAAEBAQAA/wH/+P4AAwcC/gIF/wIB/f/////+BP38Av0B//8BAf8F/QIKBAP//gAA/QEA//0GAf8C/QEDAP//AgAG/wEDAv8B/PIA//8BAPcA/gL7+vAAAAICAgP9BQD/Af/6+AAA//8B/wAA/wEDBPz6/wL9/gABA/4CBf4CAvwBAP4CAf8D/v8B//sA+AD6AQEAAQL+/vgG/QD//gP+/AMCAAAA+wIB/P//AgEE/f0DBP//AAH/Av0F//3/Bf79BAMBAP0EBAEDAwECAgAAAAIH/vsC/gH/AvwC/f0B//z/Av8CAP8BAAAA/AUA/wMLAP/+APwBAP8AAAAA//0C/gH+AAD8AQH+//7//gH/Af///f8C//z/AQEBAv4D+/0C//gBAf/4/gIFAAD7AAH8A/4AAf/9+/4D/wH/AAIEAwMC/v//A/wDAwIEAf8A/wP6Av789f8EAAEB/gIA/QX/Av4BAw0AAAABA/0DAgEB/wEB//8AAAAAAAECAf/9AgD/AQoC/QAA////AQH+/vz//wABAAACAQIFAv0C/v8DAf/8/v77AgMAAAAA/P79/f4C/gMAAP8BAgAB/wD/AAH+AAT8A/4B/v/4AAEBAP8A/f8EDf8CAAEB//0AA/7/AgAAA/7/Af35/wH/Av0FAf//AgEJ/wIB+gH///78/v8CAQUD+v4EAf8AAPz//wECBAH//wIEAQL9AAADBP0DAP4AAQH+AwQBAgABAQr/BAL//QL+AgL/+fUC/f8AAgAB//4A//sBBwEJAgAC/QH/AwED+wAAAv0EBf8B/v0B/f4DAv4CBf78/gMC/AEAAAADAAAB/P8B/gP+AAEBAf8B/vwD/f79Af/8B/z+/f4ABv/2//f9AgH+AwX+AAMEAQL/A/0CAf//Av4D//n99/0D/QUBAv79AAEAAP8B+/IC/QAB/wL/AgD//fwAAAAAAQH/AAEB/AMC/wQCAAD///z+AQMB/wAA/QEBAv0FBPoD/gEAAfwBBgAAAv4B/wD5AAH9+wD/A/0C/QAAAv3/BP8BAf8C/QT8/QABBv4BAgX/AgID/gQBAAL9A/wBAQL8Af4EAQAAAQD//wT8/gD++wABAAAC/v3+AAACBAAB//4D+wD/AAT/AP39/f0BAf8AAQH+AAAAAf/8Bv8ABA0AAAEBBf0B//4CAAD9AwP/+wEC/gD+Af4AAQT//gH/AQAA/gD+A/0E/v0AAP4BAAD9Af8B/wECCf4DAP//AAAA/vwB/gEB/wEAAP/7Af8BAAMC/QEB/wEDAAAB/gAAAfsA//r2/wEAAP78AgMEAQAAA/7+AAT5AgX//gMB/f38/wAAAwr/AAH/Av4D/P8B//8B/wAAA/8B/wAB/PkA/wEBBAP9BQEFAf/+AQAA/gIBBwIF/wD/+/8DAgL8AAMEAAACAQABAgoD/gAAAAUA///+/f4AAP4AAgD9Bf77/QP9AP8BAwT/AP33AAD/AQIFAP8DAf8CAAACBP0CAwIA/wL9Av7+AAAABPz9/v8B/wAAAAAC//n/AQH//wEB/f0AAvz+/AID//4EAfz5/gEDAv78AgQAAAAAAgoB////AAH/AgAAAwEB/wACBAL/AQMEAf8AAAID/f4AAAAA/wQA//8FAf/+AwEIAwH7AP//AvwB/wP/Av8D/QAA/vv+Av8DAAH/AP8C/wH+/f4C/vwEAAD//AAAAP7+/QIAAf71AQYAAAH9AgYC/PwAAf//+P3+Af/8/gEBAAD+/wH/Af4DAv/4Av4B/AECAf79+///Af//Af4D/wL///////8CBAH/AAED/QL9AQAB/gIGAQIB/wAA/f4DAwABAAAA/wAAAgb+BAD7/gMC/f/4AgMC/gABAQH/AAMCAv79AgAA/gICA/wI/AD+AgEI/P/7BgIAAv0ABgH9AAAC/v8CAAEBAv8CAP8BAQQC/QH+AgMCAAD/+f7/AAAAAAMD/wIC/AD/AQcDBf36Avz//gH+/wECBfwAAQD9BP0BAwD//QD/AP///AH+/AAD+QL9A///+f8CBQH9AgEI/fwFDAAAAP8C/AAA/QEA//79AQT9/AAAAAH8//8B/gP/AQEA/wL9/v/6/gQB//37/foC/v8BAAAB/wABAP8B/v//AvwC/gEC/AP+AwQDAQIDAwME/wP+BP0BAQAD+/74Af//+f8B/fUB//4DAgP+AgQBAf8AAfz+/gQD/wABBAD/AQD//wP9BAMDAgUBAQL8/gMC/gQB/gMAAQAAAgQB/v39Af/+AwAA/QT8/gL9BAj8/v8E/P8A/wL9AvwAAf//AAAB//8CAQAC/v7//QQEAP79AP/8AAIDAP8B/wX+//8C/P3+AAAC/QUABAH9/AD7/QL+AwL+/wH+/QP+Af4AAP8C/gMBAAEBAP8DAwP8AwMB//z4AAD9/AD///r/AQAAAv3+AwIC/gIC/QEDAf7+BAL9/f7+AgABAvz/Bf4EAAD9/gEBAQkDAgP//wH9/AH+AgAA/wL9Af/+AgABBA0AB/0G/gMABAT/AAD+AQP//vwBAfwA/QUC/gD/A/4FCgAAAP8AAf0EAf76BgMFAQD8//8CAvwDAvwI/wMA//4C/P4B/gIH/wP9A//3/f//AAEA/wL9/f0BAQEBAQH+AvwCAP30//gE+wMC/vf+/gEAAv/9A/8C/gAD/AT8/wAB//wF/Pb/AQMEAgID/AIBBQD/+v8AAv3/AQAA/f8G+AL9/wMEAwAAAv/8/QQBAP4BCQH+/QT/AP8DAf8B//7+//8BAgABAAcAAAEB/QH/+/8BAAD//wAIAP8DAgEA/QUABQH//wEA/wMAAf///P79AQEAAwD+/wAA/wAAAf7/AwMI/gAB/wT9//wB/f0CAvv9/AME//f+AwP8Af8C+wAAAwMAAQID/gABAQD+/QL//wL+AQIC/gEBAAD/+AL+AP8BAAAB//v/Av8DAvz+/gAA/gEAAP8AAAL9/AMCAgX/AQABAf4AAQH/AQYBAv8ABAH/AgIA/wL9/v8BAP/+Af4DAwT+A/78AQX//wMD/gEA/gP+/gQDDP//AAAAB/8CAP8CA/79/QEE+gD/Af4AAAH/AQH/AgH+/wEA///5BAP+/f/9/wMCCAL//vX9Bf/5/v0BBPz+Av3//wP+BQgB/wMAAv4D/v8DA/7+A//6AQL9/P4E/f3//wH9/PX/AAEB+wAC/wEB/f3+BAMH///+AwAABAQAAP8AAwICAwIA/gMAAP8C/wH+/wP9/vj8BP4DAvz/Av8B/AD/AwH+/gL///30AAABAf4CAQH/+f0CBQn9BQD/AQAB/AP/AQIAAQMCAQAAAAT5AAABCgEAAP/++AAB/wEAAQD+/wECA/78/v3+AP8DAQH++v8CAgH//wL/Af0A/wH//wEDCQP7Av0DDAABAQH/Av8B/f4D//wA/gIA//v3A/sA//4BAQD+AP4AAwL+/AEA/gD/AP0C+/n/AAD/Af8CBAUAAgP++v8DAAcBAf4DAQAC+wED/wID/v7/AgL6CQP/AwYBAQAA/vUCBAAA//gC/v8AAAACAAII/AQB/wQCAAAAAQAA/v4AAQAAAAACB/78Agb//wH/Af8C/QT9Af8EAwAB//z9/v78/wIC/Pz5//8EAf0F/wL/BQQI/AYCBgABBfb+AP75//8C/QAA/vz+A/78AAD/AQL//AUA/wH/Af8AAAAAA/3/AQEIA/4A/wIA/PwBAQD+AAD+AwEGAQH+AQID/fwCAv//Af/+AgH/AAEC/AAA/P8C+wP+/vj8+AH8/vr//v8BAQAAAP4CAAD8B/8CAAH+A/4CAv/+AAP6/fv/AQMM/vsAAP4AAwH++gAGAgABAgL8/gH///8BA/79/f//AgT//gMK/v39Bf4CAf8C/wD//Af/AQL+AQAABf8CAP8D/gEAAQECAP4DAf8C/v4CBgMAAAP6AAAB/gAAAggAAP4EBf779wABBAEAAPwBAP/++v///v0CAP8C/v8AAfwFAf7/AQD8///89wEBA/sB/v8BAAUAAAP7/wIBAAD//f0DAwQD//8BAf7+/gAC/AEBAAH/A//4/wIAAAP+AwH+AAD5/gMC/P/+AAD+Af3+AAEDBP4E/wH+AwEB//8C/AIHAgQA/wAAAAD8BAIFA//9AgIFAgQC/gD8AQYDAwQCAw3+AgQA//r++/8B//7/Af8B/gMBAgIEAf39AAL8/wH//////gP+AAH/AAD+AAH+Av4AAAMC/fsE/AQAAAD+AAEB/gMA+f38AAD/AgMEAP8A/v8ABQn9/P3+Awz9AQD7/vv8/fr1/wIAAAEI/wEB/wAAAgAAAQD//wYABgL+Av8DDAAA/gMAAQACAAAB/gL9AAAB//4CAAAAAQEA/QL+/wP/AgD//wD//QIAAQP7Av3++wQE/wQCAv71AAEEAv71Af4BBAIKAv8AAQL+//7/+AAA/QX/Af4AAv0AAgAA/ff+AwD///gCAAL9/v8D+gL/AgQCAwII/wIHDf4F//3/AAH+AAD///0DAAEDBAMGAv0AAQEBAQf++P/6AAIBAwH//wQABQMC/vv//gD/Av3/Af8A/gMCCQH/AAECBf8BAvwB+gAAA/4CA//+/QMBAQIIAgMBAv3+AAD9+QH++/EC/P7/Av8B/wEBAP8EBv4C/P7/+P0E/wABAwD6/wL+Af77/f3+AgH6/vsA/wEBAP4AAP8AAv0CAQL9/fgB/QIH/f0AAAIFAAIB/v////7+/wD//AP8/fwA/wT/AP3/A///AgAAAf4DBP4DAgQA/wEB+/sC/QH//gED/AAB/v0AAAH/Av7+AwMCAP/+/QIA+wP//wH+AQEB/wAB//8CBAABAgX/9wAAAf/+/P78/wIAAP4AAgEAAAH/AvsAAP38Av4C/wAFAf4BAf8B/vwA/vz+/QH9AwYHAQcB/wL+AAEB/v8A/gEA//0GAv0AAgQCAAH//wX//wL+/P0CAQH/AP///P4D/v77/wEAAAAA/gMCA/8BAgQCBfwDAf4B/gEA/wEEAQAA//8B/wEB/gABAP4BAAEC/gL+AwL+/P76/wAAAAEFAwwDCf8B/QYD+gIE/vv9/QIBAQYAAQL/AQgA//0CAwkCCwP//QL/AgIBAAD+BAP9/f0C/f/9/fwD+wIBAwIBAAH/AAD/AQEB//z9AgH/AgQC/wP+AQECAv/6/voDCgQC/wEB/vz1/fcAAAL9AAD//QIEAf/9//39/vv9Afz8BAMD/v34//b//wL9Av4A/wMDA/3//wMDAQEDDAL+/wEABv3+/QID/v79/wP9AfwDBAAAAAAA/gH//wED/f/+AwAA//YAAQAAAP7/Af8DA/4A//4C//8ABgIEAf8C/gIDAAEE/f77AAAC/wAA/gL/AQEA/QIB/f0BAAD//f8A+fgBAQMDAfoB/wL9/QECAgL8Av4D/P3+AAD++wMF/wH8/wEAAv7/AP///f3/AgMNAAEC/AEDAv4ECQIFAPr+/QIFAAD9/gL+AAACA/0BAAH+AAL+/gX8BAL+/f8D/wAA///+AgL8/AQAAf7+/gMAAAMF/P8AAQABAQEDBAEBAAAB/gIIAv0BAAIEAf8BAf8BAv378f8CAQf//QEGAPcDCf79AgP8/gIDAf8A//0B/AABAAD/AgABAQX9Af7+AgD//QL+BP0FBQoAAAL8/vv/AQQCAAD9/AL+AgQCAwEB/P3+AAAB/P79+f4E/gD8/wAA/gAEAf4D/QUC/P76AAAA//0A+fT/AAD/AP/7AAIE/wEC/gQA/wIAAP4A/gH9/gQBAv0DAwMDAvwD+//2AgAAAP8C/wH++/8BAv7+Av77AP7+/gH/Af8AAAAAAwcC/AIBAf0B/gH//v0EAgL8AgABAAEEAgYC/wQC/wH9/gQCBP7+/AIA/gL6BQL8/QECCAH+Af7+/AAA/f0BBf4C/gP9/gAFAf8B/gABAQEBAAIEAAIBAf7+AAECAAAA/gEEAv74AgUABwMEAAECAgD//vv+A///AQD9/fv3/QH//gEAAwr+/P7//gP+AQP/BPn/AQL+/Pz+AwAB/gIAAP8D/vUC/v8BAwT++wABAAEEAAAAAgL9/AD/AQICBf8BAQP/AQH//P4AAf8CAP3//P8B+wIBCP0EAQABB////wH/AQL+/QD/APv7AAD/AgL8Av/8BP8A/wIAAQT8Av0AAAL+AQEC/P8BAgMC/vz+/wICAgIC/v3//wACAf8D/v7+/vsB/v78/wIAAAH+Av8AAP/7AQIBAAX//voC/f8A/voBAQP+A/3/AQL+A/8B/QABAwcAAQEKBf4DAQH+AP8BCgMM/wH+AgAA/wEB//8EAwkB/wQA/f78AAID/wH+/AEG/QICBP0F/gP+AwH/AQACAP0B/fv+AvsDAP/+/f4DAf8C/gIG/gH9AgEAAAD+A/4AAP/9Bf73AgX99gAA/AABAAEB+/r89f8BAv4ABgEA/gT/+vz4AwH8AQIFAf7+/gAB/QP9/QD//P4E/AL+Av0B/gIC//8C/gABAAAD+gEJ/QYD+/4C/wD/+QMBBAL///8DA/78CAQCAf0B//77AQD8AQABAQD//wP7Af8C/v8B//kBBAP9AgIE//z/AAD/+gMD/gEAAAL+BAEEAgH+AAD+AQAA/gL9/gAA/wEB/wL9AAAA+AQEAAAB//8C/gL9//78/wIC/AAIBv7+/AL9/QX+AwD/Af0EAv4AAQH/Af8B/gP/Av4C//z9AvwA/f8D/wQA/gL//QL+AwL/AP39//3/Af0CAf8BAQL+AgAAAf8BAP8CBP8B/gD+9wAAAgAD/AL/AwIDDAMC/gP/9/37AQH/AgH+AP8AAAH//P4B//wDAgUDAgL9AAED//8AAv0C/f8B///9/QH/AAH+BPz+AwYAAf4AAv4C/f4D/QECBP///gEBAAH//vwAAAAAAAEAAf/+AAH/Af78/PQA/wAAAQEC/f0BAwIDAwH//wH+Av8BAgUD/AAC/wIA/wL8//8DAwEB/wIDAP4DAwIB/wD/AP8C//37AwH/AgEBAQkD/QQA/vz+AwACAv8AAf4DAwIB/wMAAQABBwD/Af4BCQMEAAEFCv0BAAEB//3+//sDAgMCAv4E/fz+AAD++v3//gQCAgEB/v0ABAD///4DA/z//wL+AQQC/gMC/fsCAf7//wH7Agr9//8BAAEC+/4AAAD+BAAAAgT+/v///vwAAAID/vn++/39/fMAAv0GAwMB/v8A/wf//v4D/gAB/vwHAP8EAAH+/wb9Av8B/vwBAAAB//oD/wH/Awn++wH+AgQD+wMDAAD9/v32AAABAAH+AAEAAP0FBPr+/f8F/gT/Af8BAAD9/wH+AAH+BQILBP8D+/78AAEAAQEA/AUB/v8CAgAF+gIBAAAB/wD5Av0B/gAAAgMA/gAA//8A//32AQYB//z/AQj9/v8BAwEB/wH//wADAQAAAf8A//8B/gT9+gL8/wEAAAIE/wD/AfwGAvv99/79/wD/Af8A/wL+9gP6Af8A//0C/gAA//78AQH//wEB/gMB//39AgUCBf4DAgQDAv77AAAC/QH7AP8B/wACAwwBAQME/P8BAf8BAvwB/wD/BAEAAAP/BAH9/QL+/wMF+wEAAP8AAAAAAf8B/wH9/gT+Av8CAAEDBQAAAQIEDv//AAABAgD//wIBAP78//wD/v78//7/Af8AAAAAAv4DAgX7AP30AAH9/P8D/wAB/wH/AQAC/f39AgT+APz//wIAAQQAAP/9BQIAAAH+BAAA/wEAAAL8A/8A/wP+//gCAP79+vQBAf4E//4C/v8B/gEBAv0B+wYCBf0BAwQAAQAAAP8AAf39BPwA//wE/wID+wIE/gIAAQEBAQIDBP77AwMC/gQBAP/+/P4AA/r9AwAABAECBAIAAQACA/0CAf///wABAAcDDAL//gEE/v4B/gIEAAQBAQEEAgT6/vsBAP/6Af4AAPsCAAEAAP4AAQkD+wL9AQEA/gMEAgL8Af7//f0AAv39AP/9/gEBAAADA/4DAvwA//39/f0BAv4BBA0ECP4CAAD/Af76/vUBAP8B/f8B/gL+AwwAAgAA//0A//4CAv//AgAAAQUC+wP6AgX/AgD6/gH9BQED+wMA/AABAP8DAf8AAP8B/wEJAAD9AgAA/vwB/gEBAAADAwMCAgoEAvrx/PcBAAABAf8CBQEDAQIAAAH/AAD+Avvx//3+/QED/gMC/f0CAf7/AgD8AwQAAQACAf7//wH/Avz9/QH8//7//QMH/AEC/wIL/wL9+gD/BAH/Af8C/wH///4CAf4AAPv0/f3+AQH/AwMA//8A//r+/P8FAAEBBgIEAAL/AQEDAAD9/QH+AgT/Av8BAf7////8/gL9+QAAAgICAP8CAAAB/wIKAQL/9wL+AP/+9QH+BAICAf78AQAC/wABAgUB//sB//4DBP8B/wQBAP38AgT/Af0EAQL9+wT//fz+/AD/Af/++wEIAf8DBP79Bf7/Av4EAAD9AgH+A///AfsC/wAA//8BAwP//Pz//gP/AAAAAQIBCP/8//8BCQD/AQIB/v8FAf8F/v//AP4C/gL7/gIAAP78AAEB/wEBAAD/AwP//gMC/QIFAQEA/wIF/P4AAPoFAf8B/f4DAf4AAf//Af8D/AEHAAED///9/vsC/gT/Af//Av/+//j9AgEA/Pv+AvwAAgn+9/8B//4BCP3+AAAAAAABAf8BAQP+Af78/wP//f3//wP+AQX8/v//APr//AH+/wID+QH+/wEE/wIA/wL/AQH//wD/+QL+/AUAAAAAAQn///8B/wEAAQEHAv3//wACAwYB/v73/AgB//0CAAEDAgAA/wEEAP8C/QL9AQD/Af8BCQL9AQH+AQD9Av3+A/0B/AUDAf8B/wH+AgL//f/9AgL8AQABAQIA/gP+AQX+/AYBAAD+/wABAAL9AQH9/AEJAQID+v36AwQAAAP6/gIDA//4AAIAAAL+/AD/AAQBAv7/AQEA//z/AQEJAgQBCQEJAv0B/wX//AAE/wL/AAEBCQEAAv0AAf8A/////wL8AwD/BAL6/gMB/AD/AQD/Af0BAf8A+AEC/wEC/gD/AwMB//4FAAIBAfz+AAAAAQL8Av7//f8BAAD8Bv76AAAA+f/6/vX/9/8CAAD8/gH//f8BAAQB/fgBBv8B/QMCAAAAAAACBP7//vr/AgP9/f4BB/4AAwEAAAH+/gH+/AIAAgX9/f39/wEF//z8/QED/v4C/wH/AQD///8BAAL/BfoBAAIA/AAAAAAAAAADCAH//wIB/wMEAQT9/v0H/fz/AQQB/QIBAQAA+wACAP8BAv0AAAMB/P4BAP3/Af/9BQL//gP9Av38Af8DAwQB//oE/QH+/gAAAQH+/wEAAQEB/wD+AQAA/gH9AgP+/wEBAf8B/Pn+AgP7AAD9/P78Af4H+wH+Av7/+wAB/gEAAQH//wAAAP4E///+/gH+/wEB/wIFBPz9AgQBBQkCAP8C/v38/v8C/wAB/wMCAf7/AQH//gL/AAMDAv4AAP8DAv4BCgH/AAACBQH/Av4AAP0EAAAAAAEB/f4BAAAAAAEEAQIFAQAC/f4CAAAA/wAAAAAB/gMBAAD/+fwDBAD7Af30AQMB/gEEAv7+BP0EAAD///4EAf8B/wME/gL+/f8B/gAAAQEABAUAAP4B/vwB/v0EAAAD/AH/AgL9AQMJAQABAf4C/vsB/QAH/wIEAQQBAv0AAP8BAgH/Bf8BAQED/f3+Af8BBf79AQkB/v8BA/kC/AID/v8F//4DAAECBgH//wECAAAAAvv+APnyAQH/AAH+AQIC/f4C/QX/Af/+Af/+9f///QIC/QID/f3++gD//v39/f8BAAECBfsFAPkB//0DAP8B/wQA//sA/wH7/AAAAf4EAQD+/f8C/vz/AgIK/vX/AAMC/wAAAQH//wP/Af4A/wMAAAAE/gQC/gQEAAAACP8D/wECBQL9/gP8//8C/wEAAP8B/wMAAQID/vsFAP4A/gIDBP4EAAD+/AEB/gL8/gD/Av8AAAEA/gMD/gEBA/sA+f4AAwT7Av8AAf8AAAD/BAEB/wP8AAH++wH//wH/9wMK/vgD/QIA/P8BCAL9AwYB/gP//wP/AgP9AAD+/f4DAf3/A/8D/vkC/QEH/gL9AgL+AQAD////AP///wD//QIBAf4D/v0BAP/6Af4AAAEA/gIB///9AQH/AP8AAf8C/AH/AAAA+f8CAAcAAQL8APkBAv/4/wH//gL9AP8BAwL/AgQFAP/9Av0EAQABAQD/+QEABAD+BAIG/gH+AwL+AgQC/gL9/wcB/wEGAQYAAQL8Af///wL+AgT9Av//AwL+Bf4CAAH/AgEB/vsB/gD5AQH+A/sG//7/AQP/AAEA/wQC//0AAP77/v3//wAA/vsDAf0C/QUA//wBAP8B/QMDA/4AAPz+AgICAwD/Af7/+v38/wH/Af8BAAH/Af38AAD/Av79Af0C/wEFAP////8CAgABBP8DAv0E+gAA/wIAAP8AAAD++v///QECBP8AAgQA/wAA/wQD/wP8Af8C/AL9/vz7AAAI/gIAAP7+/v3/+f0EAP8A/wH+AggDAwD//wMEAgL9/wEBAQQAAP/++wH/AQEAAf4A/vsAAAIC/wECBAL+/QMCBgAA/gP+AgQC//0B//78AQICAQD6///8BgIEAQH/AQEBA/v/9wL/A/8AAP8CAQAE/f4DAAH9BQH7//7/Av8B/vwBBwL+///9/wEB/wIAAQABAf4B/wEB/f7+/gL///0BAQQG//kCBAL+BAD+/QAB/gMAAP7/AQD//wD/BPn+/P//AgUBAQAAAAD/AP4A/wH/AQAA/gAGCv8CBf79/f/+/wH/AgAAAPr+AQABAP/9AwH+Awr9AAEBAAAAAAL8/gT//wEC/QD99wAB/vwCBP8GAP77BgAA/QYDAgAJAgQBCAIE/gMDDP38AP//Av4CAf//AwIGBAD9AgH//fQE/P8G/wMAAAP+A/oAAf//AAIA/wH/BAcCB/31AAAACAID//8AAAT/AAD8AAABAf8AAP8B/f38/AQOBPgB/gH9/f7/+vz//vn+/AH+/vUAAP//AP8AAP8CAwT/+f3/Af//Af4B/QEA+AD//gT//wH/AP//AQD+/wEBAfv6/vr+AgL+AP//AwIF/wECCgIF/wIDA/8CAQcCAP8CAf/+/gAAAAAEAgH/AAH/AwIAAAH/AwEEAAD+AAH/Af8CAP75AAAC/wH+AgAC/wL/AQEAAAMFAQH+Av8C/wMBAP8B/gAF/wD/AAEAAQEC/vz/AgH/+fj9/QL9APsB/wH9/gEC/QME/vUBAQMB/f3/Af/6Afz9AgICAv3++wP//wH+AgIAAAAB//4C/QMAAPwE/QEBB/79Av3++AECAv4CBAL8Af4C//8DAAb+BAL+AAD/+AIGAAEAAAQCAf8B/gEDAP/++/8AAgP++v4DAAD+/gH+AAEBAQQBAf4AAgD/AgP/AAL+Av/9AQEC/wIB/wH+/gMD+wP//fv/A/4DAf/+/QIFAPv+AgABAAAC/AABA/sAAP4CAQP++f/4AQH/+f4CAgX9/f8CAAAC//79AQAEAgIM/gT/AgD//wD9/gAA/P4BAf7+AAD/AgEFAwf+/AH/AwMB/gP+Agv//wL9AgMC/v8BAAD8/f//AAIA/wD/AAH/9vwI/gIDBv78AwEBBQECAAEB//39AAAAAP8B/gIBB/8A//z89AL8Af4CAP0EBQwCAAL9//8CAv4CAf79/QD+/wIBCP/9AAABAv71AAD/Af/7AQACAP4CAv4DDQAA/wICBQEF/QIE+AL9Afr+A/7+/v0A/wIE/wEA/wAAAgD/AQMDAPoB//4AAf8AAP4E/gAE/Pz0/gD+BP8B/v0B/gABAv78/gH+APgABgAB//4AAQAA/wIBAQAA/gAC/gAB/PQB/QIDAP79/gD//gP/Av8FAvz/AQAA/v8A/v8B/gUB/gD/Av79/f0CAAAAAP4D/AcC/AH/AAD+AgAABAYDAQAA/wL9A/8AAf7+A/0BAfz+Av///gEAAAAA/gH//wAA/gP+Af8CAQD/+/79AwQC/gL9Af4A+f8BBg4B/wEA/v0EBQH9AAH+Af0HAf4D/gEBAwQB/wP6AAEAAP//AAD/Af72/QD/AQH+Af8DAgL9Av0D//8FAvz+AgL+AAEA/wL/AgT/AgH+AwYD/gID/gQCA//4AAACA/4C/QMCCfvx/gL9Af0G/foC/gAAAwkE+gH/AQL/APz+Af4AAQEA/gL/AQAAAf//AgH+AwIBAAAB/f7+AwEB/gAAAAABAAL/Av4CAv4AAAD/Av7/AgD5/gH9/gP9+wQBAf4E/v3/AgUIAP4AAAL9A/8AAAAA/gIBCP/8/wABBv/+AgQC/f0E/wD//wAAAf8B/gMCAwMAAQACAP8D/gH/Av7/AAH//vkCBAL8AP8B/gABAQP+/QD/Af///wD/Af7+AAL6/gAA/gAABQH99P/4AAD/Av0CBf4D/v8C+AX++gID//oAAP/9AgUE/gAB/wIC/gEBAf/+/P38AgL8/gID//7/AfwG/wD/Af8C/f0AAf8CAQAA///9/wH9Bf8B/wIB//8BAf8B/wIIAf//Af8D/gIBAf8CAwIDA/78/AMC/AfzAf/9/v4DAAD+//z+//4EAv8AAAEABf8BAQj/AQACBAH8AAAA/wEC/f4FAAAC/AIAAP8DAwAA/gP8AwAAAf0C/QH+AgQCAP8B/gP/9wIAAwIA+QL//gEC/wD///oBAQL9AAD/Av0GAgUAAAAAAf8B/vwIAP0C/v8A//r/Av/5/Qj9/f/+AP/9BQH/AP4B/QH//QYABwAA/f0CAQMHAv0DAgQDAQEBBv8C//8CAAL+/wL///z//QL+AQIEAAX9/gECAQQDCgH/Af4EAP37A/4BBAAAAf8F/gABAAACAP0FAf4CAwf7Av///gEABPwECwcMAAAAAAT8/voAAQYK/AEB+AIH/v3//P////r/+gICAAD+Av8CAgQBAAAAAf8B/v/7Af4ABv38/vYCBAEB//sEAv///vwCBAIE/f39/gAAAQID+wH//v7//P4B/wIDAv4A/PX78gH+AgT9AQD/AP/88/8CAAIA+v8BAQoCAwICAAD8Av8AAf4A/v8CAf4AAAAA/vwBCAEI//gB/wD//wIAAQAA/P7/Af4B//3+/AL9AAAAAP79/wEAAAAAAQIA/wD//v0CAP8DAQEB//z/AAEDAv8BAAAEBP39AP8DBP32/P/+/v4DA/3+Af4EAv4BBf8BAwUCCf0F/foAAgAB/gMBAQD7//4CBP8EAAAEAgAG/gT/Af4EAAACBP8CAAEA///+AAAB/wEA/gEC/AEEAAAA/wT///4AAf4C//cCAAEC/f0CCAL+/gQB/v//A/8FAPwH/vX/Af37/fkB/gP+APj/AAP/AAcBCv4DAP8B/QH/AAf9/AD+AgAD+wAA/AAB/wD//QUBBAQLAAAAAAH+AgP++wABAf/8Af//Af8B//8B/QL//gH+APgBAQT/AwoCA/wE/vsE+f4DAAEC/QQHAv0AAP8A/QcBAf/4/fcC/v78A/4AAfn/A/4B/wAG/gP+BAQA/wIAAAL8/vz7+AEJAQL+Av79/wIBBv4DA/7/AgIEAAABAAME/gD+BP0BAQL9//71/v4EAQABAgQC/gAAAAD7+wID/gAAAAT4/P8BAgAAAgL+AgAFAgoE9///Agf/+QH/A/39/QMD/gIAAP8BA/0B+/3+Av7/AQL/Af4FAAAAAf77AAIHAAD9/f8DBAEDAP/+AP8CAwIDAPv/APz+/wAB/gEBBPz8AAMCAP/+AwAC//4CB/79AwD/+vz3AQD/Af/5/wL+A/wF/wIA+gMHAf8B/v///vwDAwEBAf/+AP77/f7+AQAAAP8B/AD/AP8DAf77/v8BAwH/AAj+/P0BAgUAAQMDAwP9Av0CAf///v4DAwYC/AIF//f+AgD/AQEAAAEF/wP+AQD/BPwB/QL9/gH++P8BAQH+AgEB/P4BAf8BAf8AAQL/Af4BAgH///0AAAD///v/AgAA/vz/AgEBAAAD//38Af/8//z+Af8C/QH+//8B/gH7AAD/AQECA/8BCgAIAf8AAQP9BAL/AQAHA/4CBAD/AAD9Bv0DAAD9AgL+/QADAwABAQABBAIEAQEFCQEEAgUAAAEBAwH/AgD/AgT79/4C/AUC/wH+Av0AAAH+AAD9BQEGAf7/BQEC//v9Af///vYB+/8C/f39Av78Av4B+/0CAAEAAQABBfoC/AABAP/+AgUM+wICAv///f3+/P3+/fT++/78BAL/APwBAAABCQH/Af4C/gH8AQD/Av8BAAD/Af4CAv39/P4D//f9AQEAAf4CBP0F/f0C/QQB/wIBAQEBAAEC/fv/Av8CBgAHAgoEAQMEBAH98wP6/f4BAgIE/gMB/wAB/QX/AAD+/gIEBwD//vn++wAAAQkAAP//Av//AQQCAf8BAAH//wIEA/8B/wL+AAIH/f0C+wH/AQL++gL8AQL9A/39AAAE/f4AAPn/+QD5/vwA+wAA/QL/Av8D/gD9/gH/AQkCAwX/AAD8AgAA/PcAAf8CAAAB//75Av4BAv0CAf///f4D/wD+AgP8/P0B/wX+Af//+AIAAf8BBgD/AgUB//79Af0AAAEI/gD/AgABAP//Bf8B/wD+/gL9AP8B/gH+AP8B/wH6/vz+/QEAAf0C/QP/Av0B/gABAAD+AwAB/AMD/gAA/QIDBQQCAf/+AgQBAAH+/v4EAgP9AQEI//r8AwD//QUAAAH/AQAA/gMEAv39AAAB/vkBAAAA/gIAAQH/AP/+AwAAAP//A/4DAAD/AAAAAQkACQAAAf8CA/8CBAQA/wQEAQP/AgL9/fr/Bf8CAf/+/gIEAgP/AfwAAv7++f4CA/3+/gT8/gP/AQEA//r9/AEBAwAA/wIGAP//AQL8/wD+AwUMAv3/AQEIAPwC/gAAAQAAAAH5/vcAAAEB+wAA/wD4AQEA+P39Af7+AwL+//cC/AIA/gP9/f3+BP0D/v8CAwMEAwD/AQD8BAL9/wH//wEBAgUBAwD/AAD++/8BAwEBB/8CBAD5+gAAA/wA+f0AAP8AAAAAAf/+/gMDAAH8BQT9AAD+AfwFAAcBAAAAAP8BAQEG/wL//gH+Av8B/wEB/QIB/v39/vv/Av0BAf0CBQME/wEBAgH//wT/AAEHBQwCAQAHAf4DAwAABfsAAP8C/QID/wAA/AcA//4EAQj8/wD/BAP9AQIAAf4B/QD//wH/AgL+/gAA+wMC/gP/AP8AAP/+/QMD/QX/AgEBAv8C/gL+/fz9/gIG/wf+/AD5/wH9+/v0/AL+9vz//vv+/fwA/gQECgQC//8AAAL6/wID/f/4/wL/AQD4Av7/AAAABAAB/f8BAv0CBQIF/QH+/AL+Av79BAIFAQj8/gH+BP//AAEK/gIBAf4GAv38/v/2AP8AAAMBBAICBgP8AAEC/gEA/wIEAQQB/PX++wIEAAAC/gIG/gD+AwAAAwL//wECAQD+A/79+wEC/f8B/vv9/AH/AAAAAAEBA/z8/f/4A/wEAf7/AgP7+QL+//8F/gAABf7/AgID//8A/wD/APr/AgD//gIBAAD///7+/AH//gP9/v4D/wH9+wH/AwMEAfwAAQL9AgAAA/7+BAQB/gL/AwABAAECAQEF/wEAAAMLA///AgAA/P8BAP8FAQAAAAAB/vv+A/8DAP///gEB/AH7Af/+AwIAAAAA//8CBf8A/wD/AQQAAP8B//8CAf7/Af38Af0B/v7/A/0AB/4BAP7/+gABAv0A/v8D/gD//AMJ/QL99f0C/wIBAQD/AQL9+gH9/wEA//8BAvz/+gH/AAb+AAL+Av3/Af78AAAAAAEB/P8BAAAA/wL9/gH+Af4AAP8B/wIC/v3+/gX/Av0D//gDAwL+AQj/AQEAAAEFBQD/AQn99wQC/wAC/QL7//8DBv3+Av0BAAIA/gMCAAECAAEBBv/5AAEBBv8DAAD+A/4CAf4BAgT8//8AAAH+Af8AAv4CA/4BAP8CAgMAAAP6A/4FCP8C/wECBQD9A/38AwEB//cBAP/3/wL8/v4EBA3/AwIE/voAAQIEAP8AAAL+AAD9AP8B//oAAAH///kEAAMDA/4C/gIA/v3+AP4EAAECB/4D/QX/Av4AAwID+/3+/wEAAAAA/vYDAgAB/wL+/P8AA/wAAP//AQD+AgL9Av4A//v1/gL+/AIA/wH/AgAB/AT+AwAHAAEB/gID/gMBAP4DAP/9/vwE/gL9A/4E/wED/gL//fsAAAX+BQH/Af3+/wH/AgACAgT//wD//P/++v76Af8AAP0F/gECA/4AA/7/Av4BBP0B/gT+AAD+/wAA//oBBwH9Af0B/QQAAgQAAAL+/gAD/vz/AwMD+wL+Af0A/wQB/gD9AQP+AwT9/fz+AwADAgH+Af4E//8FAAH//wD/AwT/Av8B/wID+wIH/P8B/v8A/gIEAvwEAAH9Af4DAQAB/v4D/vkDBAAA/P3//v39/f7/AAH/AAAEAv77/gMAAAH/Av7+/QH+Af8BAf38AgAB/vwD/v0BAgIB/f//+AIK/gIC//z/A/4CAAL9/wH8/AH+AAH/AAP8/wID+/wHAwUEAAEA/QcAAAH//fz+BAMG/QIAAQABAf//AQAA/wIBAQMGAAD/Af8A/wEBAgAAAAEB////AAAEBQEA///+AAH+/wH/9gL+/gMA//4AAAD/AQIAAAD/AQAAAwQAAP/7AQEE+P76/v0AAAP5BAEAAAL+A/v/+AQAAP//AQAA/gT+AAAE////9wAAAf8CAAAAAQEDAgABBAoAAAIA//b+AP8CAf/+AgH+/QL/AQH9BAH/Av0CAwP+AQP7Av7/Afv//gL+AgECAQEB/v4CAQICAPz+/QT/AQIEAgP///8DAf4AAAT8AwL9+QIFAAAAAP8B/QIB/wAA/v3+/Pr5/gL+AAAAAQD+BAAAAwb/AQD/AgAAAP3+Av0C/QAAAv//Av4EAgUFAAABAv3+/QAAAAAC/v79/QMFCgP8AAD9/QABAAcA/wMJAgMBA/7+BAL9/AEC/wIDAQL9/gIAAAAA/gMD+wQJAQAAAQAAAvsBBv37AgAC/v//Af8B/v4D/wH/AvwEAP8EAP3+/AAB/gEBAAEAAP0EAQH/AQL8/vUBAgH/AgD8///3Av38+QAC/v0CA/z+Awr//gMD/v4CAwAB/v3/AQQCAP/99gEJAQABAQMB/voC/f///wH9BAIE/wIEAQH//vsF/QME/f4C/QP9AgAAAAICAAAD/f0C/wIBAgAJ/QEAAP0BAwQCBAIDAv3//AD///4C/v32/gL++wIL/f4B/v4E/gX8/f8CAf/++P/////8Af8BAAAAAP8DAf7+/AL///3+AgIA/v/7AAH+AAD9Av4B/QIAAP8A/QQB/gAA/QH/9gAAAQEC/gD6/P/+/QID//8BAQD/AAABAAP/BQ///AEA/QYDBAL7BAICAAEBAAAAAQAAAf4C//4DAQEC/f4FAgQBAwECBAP+AP0GA/sAAAIBA/8B/v8BAAEA/wP7AAAC/QMFAAAC/QAH/wIBAQH+AgQAAP4C/wD/AAEAAAAAAPvxAPoCAgL8/vkB//39/wD+AAH/AQD+AgIAAP8DBf4AAP8D+v78/vz//gD+AgUC+/4CAAAAA/wD/wIE/fwAAQIAAP8CAQH8/QEGAQn/+AH+/v8AAAAA/v0C/gEA/wAAAP4B///+BP//+AgD/gMDAQH/Af8BAgD/AAAIBAIBAv4D/foDBAABAf/+AwIF/gH+/QADAP8C/gAB/P4C/f8A////Av/+Agv/Af8ABAX9/P75AAD/AQD//wL9/f4DAQn///8B//8DBf0GAvwBCAT5/gH9/f0BAv0C////Af/++PsC/v0AAAQI/fwA//4DAAD7/wAAAgT/9wEA/gMBAQL9Af4C/wAAAP8CBf32Af/+Af/2Awb/AP8BAf/+AgH+Af7/AwH5/wH/BP8BAPoD+gAA/vkE/wD/AAAC/wIF//8AAAEB/wIC+v0GAP/8+P0H/wED/gMFA/wA///9AQEA/wD/////Av8BAP8CAgT8/vv+BAL+BAL+AwD5AwD/Af4D/wQAAAIEA/r//wH/Af0DAgAA/gMCBP8C//7/AgH//wD/Av4CAAAAAQH+Af8D+gP/Av4D+f8CAQQA+QAAAgABAf0C/gMB/wEA/wEB//4DAAMAAf4CA/wA//79Av0BA/0BA/8B/gP6AAD9/gEGAAb/AgH+/wP/AAH/AAYEAQEKAv4CBQAA/f7+BQAA/AT+BAAA/gP+AP4D/wEB//77///9BP///wUC/QH//wH//wL+/gMC/v77AP8DAAEA/wL/AAAAAP8C/QECAAH+AwIBAf8A+/77AwP/Af77/gH/Av33/P4A+AAA/P4CAQL8BQD+AgH9A/sBAQQBAAEC/AL+Af4DDP8BBP7/Af37AAADAQQBAAABAAAAAP8AAP4A//8BBP8BAgUAAf79/wH+/QD/A/4A/wABAQP/Afz/AwQBAAABAvwCBQP//v4EDAD///4CBP/5AwcC/QAAAQn+/AD/AQIBAf8B/fUAAf/+/wIAAQEB/v79/wAB//8ECP8B/gP/Af4C/fz/Af39AgIAAAIAAgMAAP///QEDC/sBAv4DBv39AgEEAP8CAPz//wEG/fUAAQEB//0AAAH7AAD+Av73AAAAAAEC/AUB//8AAf4CBQH+A//9AgEAAgf+Av4C/vUCAAL+Av8B/gAAAv3/Av///wH/APwAAf8CBAMG+/cE/AD+//YD/v79+wMA/wAG/wH/+f7/Af8AAP//AgsA/wIFAv4A/wEBAAAAAAP7/gIAAf4C/fwAAQAAAv0AAf35AAAC/wAA/gACAwEHAAH/Af8CAf7//gH/AgIC/f4CAAEA/wQA////AwEB/wD+BAX+/wL/+AH//wECAAH+AAABAgD5/f4A/wAAAQL9AgH//P//AAP/AP8B/wEAAAAAAAAA/QIB/wP+/QMAAQIA//3/+f8BAQAEAQL9/gMCA/79/wEAAf77APr//v8BAgUBAv8AAAD+/AME/wIBAQAA/QL/Av///v/9/f8D/f0AAQD/A/4A/wQCAf/+AP4EAAD+AgD///4AAQQAAwP9AgL9AP/8BQAAAQAC/QL/AP8CBQL9/v4BBgAA/wMAAAEC/QH/AQH9/v0CAAD/AAD++wD///8CAAH/AAD+AgAAAf//AQEAAAAAAAEEAQL//QD/AAAD+wH/A/4FDAEJAQD8//79AP//AQEBAvsBAv4AAgP///z/+///Av0EAfwDAQP6AAD8AAABBAL9/QAA/wAAAP8BAf0DBAAA/AMC//wIAf//AgEBAvz/AAD/AAf8/gAG/QIAAgIBAAEAAQAA+/QA+f4AAwcA/wAAAf//AAH///4ECwABAQgC/wH/Af8D+////v7/AgEBA/7/AvsBAf/+AwD/Av//AQIL/vr+AwT9AAkF9wMDA/7///4DAf8BAf/5Av7++gL9AP8A/wIBAP/+AP4F/v//Av74AAAD/wAAAAABAf4A+/b9/f/4AP8A/wEA/gT/AAEI/wL///0DAvwAAAAAAf7+BAIEAAH8+AABAf/9Af73/wD9/f0B/wIAAQIEAAD/AP4CAgX+BP4E/gD+/gABAf8B/f8CAAH/AP4E/QIAAAD//QEAAQL+AwIAAAAABAn//wP9AgT/+AMBAAD/AgMDAf0AAAMDA/7++wP+AAAAAAMIBAMDBAAAAgAAAf8AAvz+/f///wEC/f/6AP8A/wIA/wH+Af0FAv0D/gH9Af8A/gAAAf8CCwH/Af4AAf3/AAAAAP32/gP////8/gIAAQAAAf39/QAC/wH+/f0A/wH//wEAAQH/9//8/fwAAP4BA/4B/wMC/wAA/wH//wH/AQP+Av78BAIAAAED+wAA/QECAAMKAAEDBf8C/Pn/AgIEAP8AAAIDAgUDAgL9AAD//gH//vv+AwH+/wIEAAIA/gMD/wAAAQoA/wEE/////wIAAAEA//4A/wL9/gIG/gQB//8C/wL//wAAA/v9AgH+AQH/AgL+/gH/9gAA//kB/gT/Af7//QIDAf79/v/9/v0AAAICAQICAAEAAP//AwQB/wP/AAL8AAAB//74/gT++wAA/gP/AAH+AAH/AgAAAAD++wL+/wIEAQQBAAABBQEBA/4B////AP8AAQH+/QH/Av8A/gP/BgEA/gD+/QABAgD9AQMLAQf8AQAA/gH/AAL/AP/+/P37/gICAwAAAgQB/wH9AAACCgP+AP/+BAD/BP8EAf8B/wEBAAMDAgn+/f4CAPv9Av4A/gMAAf8CAgMAAAL+Af8B/wQB/vn+AgAAAAAA/wABAAD89gH8AAD+Af8BAAAA/wQIAgoC/wP+AAEAAP3+AQAB/wAA/vb///8BAvwDAvwB/P4C/gQH/gD/BPzz/gIB//wDA/4DAwL9/QYEAQABAAD+AgD/AgT+/AH+BAICBgEC/wEA/wP+/wP//gH+AP8EAgIAChT89/z5AQf+Af78/QP/AP4AAwQBAQEIAAAAAP4C+wEA/wH/AAD99wMC//cAAP4EAQAB//0C//0BAQL6/v39/AABBAEC/fz/AAAAAPz//vr9AQABAAD/AAL8/AT/AwMK/vsBA/j3AQD/AgAAAwEBAQMCAv4B/vsAAQT++QAA/gMC/wT9/wP/AQAAAQD9/v8BAQoF+v4BAP//AwAB////Av8AAgQA///+AAAC/v8BAAEC/AMCAv0C/wEDAP8AAAL9Af3+9v4D//399gH+Bf79+/79/QIBBQAAAAED+wD+/wEBAf8DAAAAAAL8Av//AQIB/Qf/Avv9/gAC/gMEBf79AgAAAAACBAH+AQIAAAICAP8DAwEBAgT+/f8C+wf8//8BAAAB/wH//gEC/QAHAggAAP7+Av0AAAL+//3/AfwHAQH+/gH///8B/f0E//8BAP4DAgX9/wT4AAAG/AIAAAD++/3+A/0CBQD/APwACPwDAQMAAgIDAAD+AP8B/wEC/wb8/wIFDP4D/wABAQMEAwwDBf35AAD+AwAAAAEBAP/4/gUC/f//AgIBAAAAA/wB/v4DAP8B/gEEBAv/Af8B/AD8Bf4CAAAB/gED/wQAAQAA//YD+/79/v3+/QABAP/+/AIHAAb+/AH+/vgD/v8C///9/v77+/UC/gEBAP8AAAEGAAACCwP6AP/+AvsC/gL+AwEBAwYB/wAAAv/+9v/4AAAD+wH+BPwD/wH//gMAAPz8Awb9Av//AAD+AQIDAwz++wAAAAD/+f37/gMEAQAA/gAAAf8BAP79/AL/AAD9AgP+AAH8/gAA/Pn/AgL9AAAC/AL9Av79A//3/wH+A////wH/A/0HAQMB///+/QMDDAH/AAAEAv/3/wL/AQEBAwD8/vz1/gIDA/8C/wEEAQL+/P7++/0IA/3+AwL+Af78BAEG/wL//wIEAvz+AQD+/wAAAAAAAgD/AgEAAwQBAQQBAf4AAAH/AAIB/f/+/wL/AQD//PUB/v8F/fz+AwABAf8BCv/+Af8B/wL+/P8DBgD//AEBBQP/AgQF+AAHA/z9B/8BBf7/+gT9AQn9/AAAAwEBAAEA/wEFCv0D/wD+AAUHAQP8AAAB/gP+Av/3Af7+BAH+AgUB/v8C/wL++AD/AAAGBgEB/vb+BAMK/wL/AQQBAPj/AQP9/f3/AP/9/gAA+f8BA/kAAP8G/wH9Af/3AgX9Bv79/wADAwUN/PUEAQH/AQD78v39BAH/AgAAAv4AAAH+A/0BAQD7Af8B/gD/Af8EAQQC/vX//wIBAf3//QIFAgf//f0CAwb//wH+AP///wABAQQB/wEBA/8B/AAAA/4AAP78BPn9BQAC/fz88gH//vsCAAEAAAAB//77BAH/BAAAAQEBAP8A/QL9AQAAAAEAAAEB/v3/Av4AAAD+/f8C//gA+v37AQMC/f75AQEB/wAA/wEC//z+/wH+AP8A/vsB//wD/gMB/gEBBAQB/QMEAQEAAQEI//8BBAAAAQH+AgD/A/n+Av/+/wEBBAL9Av7/AQD//wEBBAIF/vsAAf0GAgQC/AEBAAED/vz/AAACAQEC/gMCBP4G/AUEAQH/AAECAf4DAgsD/AL+AQH//wD4AgD9/QAH/gH9+wAAAAD9Av8AAAEA//4DAv7/Av8AAf8CBAIEAwICAAH//vv/Av8BAP8B/P3+AQf///4A/gAAAP4D/v/9/gH+/vwEAQQA+wL9BQIEAgsB/v/9AgUCA///AQEEDgABAP//+QL+AAABAf38Av3+AgH//f8D/v8BAwIC/vz//vz8/vwA/QH+BP4CAPoAAAAAAv4CAAH+AQIDAgAAAP8EAP8CAf//Av4DAP78AAAAAvz/+vv0/wL/+P77/wQAAP0B+/H//gEA/QMAAP4E//8B/wAABAACBv8B/wAB///+AQYD/wAABAEEAQEAAv0EAgAFAv7/Af4D///9/f0C/P8AAAL+//4C/gEBAv3/AgD7BPsAAf8BAAAB/wQA/gP/Av/4/wEEAgABAAAA/wT9AAAHBQAAAAABAQAAAPkC/QAAAQH8BP/6/AQAAAAA/vwCBAH+AP/+/AAAAAAC/v8BAAAB/QH+/wIBAf//AgT/AAAABf/+AAAAAfsD//4D/wEAAgH/AgcAAQH//vz/AAEHAQH9AgIE/fT+A/4DAQP9/gAF/gP/AQECAAD/AQL7AAD8AQAA//v/AfwAAgQBBQEA/gEB/wAAAwMB/gP+AAUAAf77AgMCA/78/wEAAP8D/AQB/wH///wB///3/wECAwAAAAAA//4AAP///f8BAwMC/v78AwIA+wH/Af7//gP7AgYB//4DA/3+AwEG/QgC/QD7APwDAgACAQH/A/z/AAL///77AP/+Av78/f79BQP//gEEAQP7/gQEDQAAAAD/Av0F/f8AAQMCAPsCBgH//QMB///6AgICBPz/AQQB/v4CAQIBAv/6AQEEAAAG/wL9+wX4AQH+Af7///0A/gAAA/0EAAD//gMAAAEBAAEAAQIAAAH//wH+/vwBAQX9+vX/AP8AAwEF+gH+AP///gAAAf4DAgT+AAD/Af7+/vwB//39AQEC//79//7/AP///AAB/QP7AQD9AwAHAwn+A/0C/wL8BP///f4BAQQHAwIABQP+AQABBAX8AAD/AgH/AAH8AQACAP8B//3+/gD/Af8B///9Af77/P//CAAAAAAA/wAA/wEB/wEC/wABBwEBAQD/AgL9/f0CBAMB/wEA+f/2BP0ECAL+Av0BAgAA/QEA+/8EAf7///0C/vz7BP8BAP8AAAEBBAADBAEB/wIAAQMBAf8DAgIDAv7/Af8C//YAAAABAgT/AQQBAQcAAgIA//n+AQD/AgUCAv8B/f3+/QQD//8ABv4A/vUB/wH///4CAAQD/P//+fz+/QUECP0FBf7/AgIA/wD+/QD+/vn9AwD/AgYAAAEK/AEAAf8CAAAC/f4DAAEAAP39AwH+/f36/f0ACAABAP//Avz+AAIEAwH/AgP9+gIE/P8BAP0GAP8AAP8B/gEBBwT//QUC/wP8/fYE+//9Av39AgIA/gP+/gIIBAH/Avz9/v78+gME/f4B/gIHAf8EAAD/Af4CB/7+AgQDAP8B/fn+AgIBAgcD+/78/P4AAfsBAAD+/AQDAQEB/f4DAAD+BAMC/fT+/QT8/wD9BAH//wAAAP4CBP/9AgT//gMA+P77AAAFAP8BA/3/+AH/AQb9/AAAAAAAAP4CAfwBAf78/AT/AwACBAD+AP/3/wH/AgQB/gEC/QAA/gP9+v/+Av0DAwIBAf/9/QAA/wIBBAH/BPwCAwIBAAAC/v8E/wIACQP//gECC/8CAP8CBQD/AAADC/39Af0BAf3/AAAC/v78AAABCQL7AvwC/P3+AAAAAP8CAwMA/wACAQAFCgL+A/4CBAAAAPv9/wH9AQABBwMJ/fwBAQAHAAD/Bv/+Agr++wL8/ff8BAH+//YFAP3+//oDDf4E/fQB/gIAAAYB/gAAAAAAAAED//cCAP8A/wEB/wH+/gIC/f39/wQB/gD+/vX/AAEC/vz/Av//Af8B//8B/f38+P8CAQT9+//+Af0AAf34/wECBf8CAP79Bf4A/P8C//4C/fIA/v8BAgUAAPz9AAABB/4CAAH+/AID/wAC/wEA/wL/AQEAAAAA///6AP//AvwEAAD8/wIDAgQAAAIEAQj/AgP9AAEE//sAAv3/AAD/AQEAAAQB/f0E/wH/BAP+AwL9AQIAAQEIAf//AgD8AQQD/AEBAPoBAAD/AAD9//4CAgT/AP4EAf8B/gAAAwL+AgIA/wED+wH//wP9/v78AAD8/gD+BP7//wP9/v4E/AAA/wH/BAAAAv//BQQC+wID/v36A/wBAP79Av39+wEAAP/+//z9AgT+AfwD/gQAAP8C/wEC/f77Af8A/wEBAgMCAv3/BAD//wEAAQEBCQL8/gQC//4DBAIB//wBAgUBAf8C/QMCBf8B/vn+Af8AAf0A/wP7/QIB//4C/gD+BAAAAwAA/wH/AAAEAv39/wEC/QT7/gMB/gQBAQn+A/0FA/sBCvz//f8A/wABAAAC/////foDAwP7+wYB/v39/P0D/v39/v8A/wP9/fwC/QYOAwP+AQD///0CAgQCAwID//0GAP4AAP7/AAD/AgEAAAYAAAL9Af///wAA/gT+/QD4AAEF/wIF//YAAf8CBAsAAQIE/gABBgH//P8AAAT5Af8CAAL+AQIA/wD/AQD//gEAAQH78fz/AwT8/v4B/AH8/v/+/wAD+gP//gMAAAECAAD+Af73Af//AQAAAQoC/QL8/QQAAAL8/v0A/vwEAf4D/v31/vwA/wH/AwcC/wH//wH9BgEBAAACA/3+AAACA/4CAAICA/8A/QUC/AD7AQD/AgMDAv3+AAEAAAEABQD/AAD8AgAAAv/9AwEBAQABB//2AQEAAAP7/AQCBQEA/v0D+wMB/AT+AQD/AAIBAfv1/QMA//8CAf7/AP///v0B/wABAAAB/wD//vwBAAL8AAAAAAH+AwL++wAB/gQCCwMC/vsAAAIAAf8C/gIDBQD+Af8A//n+BP8AAAH/AQAA/fz+AAEBAAD+/gQCAv79Bv38/QMDAgL8BQ0C/AH9/wH/AQAAAAAB/wAA/wEAAP0FAQIAAP4D/gEAAP/6AQABAQL8+/f9/QIAA//+AAP+/gL//vz+Af4CAAEJA/4A/wIC/gMB/v8D/wIBAv4D/gP8/gAAA/oAAQL8AAD/Af71/wMCAP8CAQAAAAIEAAD9/gL9/wH/Av3/Af8EAgH+/gT/AgD///4CAQP+/gX+Af4AAf/+AQH+/QAB//4C//8B+/7/Agv//v8DAf4AAAAB//4EAAH+A/sAAAABAf4AAP/9AgD+/QH/AAAC/P0DAgX//gEIAAABAf8CAvsFCwAAAAD+A/4E/wECA/8BAQP//wT7/gMAAAAAAf4B/wQB/gMC/v8C/f7/Av32AAAD+gMDAP8D/f8A//4DAwAAAgUAAP8C/QQAAP0B/wH+A/4A/gIB//38/v/9+/4E/wAEAAL+/fUCA/38/wMG+gL9/f4CAP77/wIBAgH/AgUBAQEGAgT8/wH//gL/Av8CA/7/AQAAAgX+/AL9//4A/wAB/f3+Av38/gMC/wT+/wAD/wH/Af0DAQH//wL/A/8CAf4B/wIC/AD/AQD//AH+AwX//v4BAgMC/QIAAf8A/AD+A//7/wD8//78AAEC/QH/A/0A/wEEAf/////6AgP/AgECAQH9AQMDBAEB/wH9///+AAICAQT+Av0G/v//AgH+AP8C/QH+Avz+/QH+AAD9AgH9BQH+/P0FAQn//gL9AP8D/wL9AvwA/wAAA/wAAP8DAgT/AQEDBAL7AAMEAQf+A/3/AP/+AP0CAwb++//+AQEAAf4DAv///v78AwQE+QEAAv0B/wH+AAEAAP4E/gMAAQEAAf4AAf/9/wAD/Pr8AQEBBgIEAAABBgAA/wEA//4DAAAB/fz/AwD+/P8BBP0A//76Af4C/wH//gQB/v/4AAH+AAEEAf8D//0C///+AgD8/wEABgILAf4B/wAA/gMA/wAAAgYA//8CAP/+//8B/gIF+v7//vz/Bv0BAPsC/QEAAQEC/P4CAv0C/QEDAAAB/fwE/f0AAAIB/QEAAAL8AgD9BAEBAAAA/gD/AAAB/gAAAAAA//8C//kA+AABAgP9BAMGAf4D/wH7AQcEAQEAAf8B/wT/AQQBAAD//vcB/wAHAAEBB/wE/wEC/v8BAAD8/v8B/f4B/gH/Af8BAQEA/wEAAP4ABAQAAAAA/f4BAQECAAD/AQL9/AMDBQEC//7/AQABAvwBAgH////8Af76/vz/AAEBAAD+/v77AAAB//4EAwL++QMM/PwB/QMCAQcDAgEHAf4DAgEAAvz/Af0E/v0A//4DAf//AQH7/QIDAv4D///9/QAAAf/+AwP8/vr+/wAAAAD8/wMK/vUAAAD/Av0B/wIDAf8ABf4F/gMCBP//AQEFAP3/AwP+9QP8Af/9/v37/v3++gAA/AD8BwABAf8C/v4EAQAEAv8CAv7+/AP+/v4FAAABAf8DA/4DAAAAAAH+AwH//wIGAAD7+wEHAAD+A/8AAgX9/wEBAf4D+gL+/v0BCAAI/P7+BPz+/gACBP8DAgAAAgAAAf8CAAD/BPkCAQICAAAA/wEA/vz/AQABAQn+AAD/AAEA//wI/f0EAAL9/wH8B/7+/wH++QP/Af0AAAIEAf8DAv78AP8BCvz+/wH+Af8A/vkB+gAAA/oAAgH+/vwA//4AAvz/Af0G//8AAQD//v79/wIAAv3///4CBAAA/wAAAgD/Af/8AQED+QAAAAD9BAMBBPoCBQEAAAD//wH/Af3/AwD//v0AAP8D//YAAP4DAv7/AwAAAAAB/gAAAP4CBAAAAAD/Av8BAgEF/gAAAP8CBAEBAwT7BQIEAgUAAP3+AgP/9wAB/wL//wAHAwMAAAAIA/z/AwIC/vsCAgAAAgQA//z///kAAAAA/gIC/AAAA/8AAgABAvz/AvwAAgH+AwL+/vsAAAL9BAcDA/7//vwAAP4G/vz+Af/8BgT9/v76Av0BAAABAAD9AAH+AQH/+AAAAgH99gAB//v8//0FAAADBP39AAAC/f4EAAH/Af8C/gT///4AAvv9BP0FAf8DBAAHA/8AAAIFAAD+AwD5+wEBAP8B/gMD+QEG/gL//vz3AP/+BAAAAP/+/AEB/wMB//0BAgX8/v/+AAD/AQIFAv4B/gAA+QUA/wIG/wEAAAH+/wEA/wL9/gMB//4EBQAF/gH+Afz9+f7/AAD9/gIDAf/7AQP7/gMCAQL+/wL+/AT9/wMB//8CAAAB/wAA/gP//wH9/gMDBAD+Av4A//8BAf4A/wAAAAD/BAX2AgUA+gIA/Qf+AwL+Av4A/wP+/gMB/gAA/wcCBf3+AAAAAQAAAf7/AwH+BP0AAQL8AP/9BAH+AgUBBAIAAf8AAAL9/wIBAgP+AQEC/wL9/f0AAP4CAgUAAP4DAP8BAQL+/f3/AQH8AQT8BAX1A/4AAAH+AgL/AAH/Af/8/gEB/P8AAAL+Af8AAAAAAPsAAP///gL+A/4AA/sCAAH9AP7//QEBAv0AAP8B////AP4A/wD+BAL9AAIC/v78A/8D/v7+/wACAgL8Af8AAf38Av0BBgIL/gL+Av3//gIC/wH+Bgr+9gH9/gMAAf8B/QcCAgAHAQEBAQP+A/4B/wAA/wD//f3+AgQBBP8CAwwC/gAAAQH/AgH/AP7/Af78Agr/AgED/wACAgEA/f4BAQAA/v0CCAH+AAL99AL+Av7/AgH+////Afr2AP8B/wL+/wEB/gX8/f/9+wAGAQL9Av0BAAACCwEG//8AAP79/vsB//r5/wABAP7/Av0BCQL+Af8CBP72/wH/A/8B/v0BCv0IAAD/AgAA/fkCAv/4AQcCAwABAv4AAAEGAgkEAP4DAAADA/8BAAD9/v8BAv7/+f/+Av0D/wIF/Pj++wAAAwQCBAIEAQYB/f8C/gEAAQAAAfoBAf4D/vsBAQP+/voC/wAA//8E9/4AAf0BAQEA//8A//76//4CBAEAAf8B/f/2/f4EAgIK/vsC/QEGAf//A/8B/gQBAwEHAQoA/gL9/wECBQD//AD9/f/5AAAECAH+AP/+BAAA/QEA/wID///+AAAAAAX/Af73/wIB//8C//8AAP4AAQICAP0C/fz+AAAB/f7+BAIA//z/+PwIAgX9/f8CAf4A/wQA/v3++/71/v0BBgUI/P78/wD/Af/+BAAB/fYAAf8CAwT//gABAAH8Af4DAAECAAD8/gT/AQH+/gQCAP0FAf8CBwEEAQoC/QAAAAEBAP8BAf39Av0C/AMC+/39AwMC/wP+/wIBCAIEAP8BBgAAAQX99QUJAf8A/wIEA/0EAAIAAgEC/f36/QMDAwL9AP8C/QMCAAX9AAL8Av7/AQD+/QMD+wEGAPn+/P71AAADAwAA/QEEAwMCAf4B/wP7Af8DAQH/AQP9AgL9/PX+/AH/Af8BAgD4/Aj89QAABAL//f///P8BA/7+AgUB/wD/Af7/AQP+AQL9/QH+Af8B//0FAwoAAQP9AgMB/QAA/wEBBv4D//0CBgQJAQf8AP4FAf4CAwD/AAH++/39Av0AAAIAAP//Af8BAQgAAAT4Af8B/v/9/wADDAAC/vz9BQD/AQAB/wEIAwL+AP0AAgEA/gH+AQYC/P33Af4AAP3+/vwABgD/Af4D/v0B/Pz/9/71AAAC/P4C//4AAf78/wEBAAILAQL+AAEHAf/8/v72/v0CBQIDAgv///0F/fQAAP0GAf39/f4B/wH99P3+AQAD//7//AD/Av39AAEB/wIAAAEB/wAA/fsCAP3+/gAAAQP8//7+AAH/Af4EAf//AwEBBgMD/wD99v7/Af8B/QIEAf8BAf4D/P3+/QD6AQED+/8CAf0D+v8DAwMEAwP+/wECBP4C/QIB/wH//wEC/f4DAgP/AP4A/gMAAAMIAAAA/wH/Af7/Av4DAAADAP4DAAH/Af7+/f4A/wIJAgAECv8C/f3+/QT/AQQB/gL+AQH++/4A/gIGDQAAAAAC/P79//z+Af8C//sD/gP+/gMDCgQAAQIE/P3+AP8DAwQBAQEA/v4AAf8AAAMDAgAB/v8D+wQEAf/9AAD/AAD///4A/AAE//cB/gMCAP/8Af38AAAAAAAIAAD/AgL+/PIB/wAAAAD+Av/+AwEEAv4C/gD+AAP+/fb8Av/+/gD/AgAAAAX6A/0B/foB/wAA/gP//f/+AwQE/gP6/vz+AQH//gX/Af4A/f3/+/0AAAD+/QAAAf//AQAAAgX/9/4DBAIAAP0BAAAAAf4FAf8AAv3///wC/gEAAgD/AAABAvwAAAEAAf4AAPv8BfoD/wMGAgMCAwL+AAACBPz9//8BBwAAAgcBAQQABf8B/wH+AQYB/v8B/gL+AgH+AAADA//8/wED/gD+/wED//0E/gIF/gL//gL/Af4AAAABAP//AgL/Av8BAAEA/gL//gMA//8A/QIB/PwAAP/9BP/+//0EAvwD/voBBv74/gD9/P8E/wH/Av77/gQB/wMEAAD+AwP//P8BAgAA/gD//gD/AAED/AD//vz//wQCA/7/AQAAAQMBAf79AvwEDAICAAIAAQD/A/v7CgUJ//0C/v7/Af3/Av0C//0D/AAA//v/A/8DAv7++wH/Af7+BAD/AAAB//8CA/7/AAH//v0DAwH/////AgAEAAAC/gIL/gP8/gAABAEBAf78+wYAAAEB/fP9/wAAAQEBAAAABfX89QECAP/+AgMFAQAB/v0D/gQB/wAAAf0DAgMMAf4AAAH/AvwEAf4D+wAD/f//AQAB/gEBAP//AQABAf7++wAAAAH+9gL9AwX8BP3+/gH+AgL8AAEBA/8BAP/9BP8EAf7+A/4DAf/9/gAAAf4B/QD/Af//AQL8AAD/AQAA/fz89gAAAAEAAAEA/vwC/QUAAQD/Af/+/wH+AAAAAwEBBgH/Af/+A/4CAgT9Bf75Bf0AAQH+AQAEAv4B/AD/AgH/A/sB/AAAAv3/AgEGAgH+AwAA/f7/AQABA/v9Bf8BAf7/Av8CAP/+AwD//wECBAAA/gP9/AEDAf//AgQLAAD9/v7/AfwCBf4DAv0C/f38A/v/Af7+Af4CBAH+/P0D/wMDAP//Av8B+wH/AgAABPwAAQEDBAICAAD/AwMBB/8BAv3+AwAAAv0C/QIAAf4AAP8C//z/AQH//wH//QABAf/79wH/Af/+Av7+AP8C/v8B/wECAP8CAv79Bf4D/f3+AwQBAAX/+QEAAwEAAAH+Av//AQEC//kA/v/8AAb/AgAG//gB/wH+BAT/AQEBAf4BCQAAAAAC/gAB/wICBQH/AAgCAgEBAv3/AQILAwYBBf78AgQBAAIA//8DAf8BAAAC/gH/AAD/BAH9/wIC//7+AAEC/v8AAf8AAAIC/f7//wH+BAH+9wEB/wECBf/4Af7/AP4F//cCAQEBAAD//QL9//kAAP/3/v0BBAAB/wL////3APsAAP39AQj/AP4C/f8BAAL8AgMAAAL9//n//gH+/AQBBAD/AAD9AwAA/wb//wABAQL++v/9AP/+AAMC/f0BB/4DAgIB/f0B//4BBAD/AAEBAvwHAQAAAP0E/vwA/wQB//f/Af4BAAAA//z7AP8AAQH//wAB/wD/AAD+AwAA/AX/AQT9Af4BAP8BA/wAAAD4AQIA///+/wP+AAABAgH+/gD///oB//8DAf8FCv8B//z+BAIC/QEC+/8A/gQC/f4C/Qb+/AAAAAAC/wAABAsB/v4EAf7/AQIFAQH9/wEBAf8CAwP7AwT9Af8E/wACBv8BAgP9A/3+AgAAAf8BAgEBCP/+AQD/Av8BAAD/+/8B/PUAAQAAAwT/AAAAAv4AAAL8/wP9BwT7AP8CAv8DAQQBAfz1Af8A//8CAP8BBf0BAwEBAgAA/f//AP/8Av39/AIA//kBAP3/Af79Bv0D/gIC/f0A/vgCC///AP8A//4EAQADBAABAf7+AQH7//8D/gAAAf//AQD/Bvj9Af4E/AADAwD+//8AAAEAAAEEAQH//fYAAP7+/v0A/wD/AwMCC/4EAv3//wABAQX/AQH9BfoEAAAA/wIC/gEAAPkAAAQCAf8EA////P0DAgIDAwH/A/4D/QL+AwABAAAC/f/+AAED/wL9//n8AP8CAQAA//8A/vwBAQEAAv7+AwIFAf/+BP39+/cC/f8BAgX/AAAEAv3+BAAB/f0A/wH/AgUBAP3+/wL9/gABAPkBAQL/+wD9/v79//sEAAL9AP8A/wAA/gT+AwH+//7/AQABAv3/AgID/wIF/gAA//8A/wEBAf3++wABAf4B/wL+AP8CAP8EAgD/9v4CAv7//gAABAj/AAD9AQP/AAMDAf//AAEDAAUCAwL9AgACAwIDAAf+Av8FAAEAAQMCAv0AAf4E/wH/AAIKAvz+/AH//v4CBAAAAAAAAAIF/gL/AQL9/wH/AAIC/QL8/QAA/wIEAQD//AcAAQD6/wIAA/79A//9/QEAAAD++wAD//0BAAEK/v38/v72A/8C+gEHBAr++/4CAwIC/AABAgD/9/4E/gQA//0F/vwCBAEBAAD/+gL+Af4AAP8B/wL//wH/AvsAAAMC/v7+AwT5AP/+/AH//wL/AQIL/QX//wH/Agb++AAJAgT/9gIDAf8A//8AAAAA+f30/wMAAPz+AAEC/f4A//8B/QD+AAAD+wAA/vz/AAAAAgsAAAECAgMC/gP+/gAC/wH//gH8/wD/Af8AAAH//gMB///6Af7++gT5AAACA/8BAf//9v39///8AAMC/wEA//8B///8BwL8Av4AAAICAgX/A/0EAwEBAP8CAgT+AwIFAgoBAf32AAH9AQABAgv//wAB/wABAf8BAv0CBAD/AAD+AwAAAP8BCAAA/f0AAAIE/v39/gAAAgX/AAABAv38AP8CAgMD/wAABvwBCP8BBAL8//77Av0C/v7+AwIDAvz+AAD++wD4/v4AAAIEAf/9/v71AgUB/v8A//8B/gIE/P8AAAIF/wEEAP0FAfn+AwL9/gT+/AICA/3+AvsBAv4CAwIEAAAAAAABAQQCA/sBAf0AAfsAAf8BB/8BAf7/Av/9//0DBQL9/gP9/gIEAwP//AIEAgUBBv38/wEDBAEI/wP+/AP/AgD//QL9/P8C/PwAA//+BAP9AAD+/gEDBAIB/f4D/vz9/QL+Av0AAP38/f8B//38AwEC/QAA//kDCAAAAv8AAf0D/voAAAL+Af///gD//wAB/f37//r/AQAA/fwA+QP9/wH//vwDAQAB/wABAgYGC/4AAP7+AP4DAQH9/v78A/4B/gAA/wICBAAA/P4BAAD/Af4DBP79AwIB//4C/vYCBAEDAP8D/QMD/wEBAAAA/QAAAQD//v0EAwEBAv4CAAAA/gD/AAH//wIAAP0AAAEAAPwA+vb/AAL+/wEA//4BAAADDAAA/wH/AQMD/P0AAAL+AAAAAQIB/P7/Af/+/wEDBv8B/P///gAH/QL+/AIA/gACBQL+/wP/AQEB/vsAAP8BAQL/Av8C/wAAAf8BBQADAv4CAwcD+QMDAQAAAAH/Av8A/wD/+vn+AAQCAf/9/QP/AgMBAv0EAP/9AQQAAAH+AP8C/voB/wL9//4A+QL9AgP//wIA/P4AAP/5AgH+Af8B/gEAAf79Av0C/QAA/gEC/fz+/f0A///2/gP++wMDAQECBQD/Af8CAAX9AAD9/QEBBAEAAP79//8FAP8CAAH+/QD/AwIE/wD//wH+AwID/QIBAfwAAAD/AAL9/wEBAfwDAwH/AQH/Av8BAQABAAACAAH/AQYC/v8CBAECBQL9AAD8/v///vv/AQEGAQQAA/4DAf////39AAAAAf4C/vsDAwL9AQgAAPz//f//AQH//wP9/wH///8D/gABAP8AAAMD//8D+/3+Af/+A/////8CAQAAAQr/AwAB/gMFCfwA/f3/AQH/Af7/Av4DAAD/+/38//0B/gAB/wEAAP4AAP8DAwEG/f0BBgH7/wIAAP4EAv4AAAYFAAAA//0FAAH8Bv0F/gL/A/4D/gMB/wIABAACBf4C/AH+Av/2Avz++gUK+/YEAAIAAgcAAP8BAv8C/f8CAP8AAAEIAQAA/wMEAgABAAAA/fz/+gQBAf0AAQP+BAED+wAA/wL6+QL/AAAB/gECBfoAAgP/+wAD/gH+AgT+APwA/vwB/wH+A///AP4DAf/89QQCAgr//gH9AAADBQAA/wEAAAABAwP7/AH+/gL9/P8A/wAAAAQC/wEA//39/f0BAv3+AAD/AQL/BP39Af8BAv39/f4AAvr9AggGAQL/Av79AQAC/QAAAwICAAEC/wEAAP4CAP8AAPv1AAD9/AAAAPv9AQP/Af7+Av39AP8AAAQC/wEAAAAB/QcA/wH//AD/AgAA//8DAQABAAD//wAJAf8C/gEBAAD/AQMJAv779QABAf8A//4CAQgBAP79/gAAAgH+Af8AAQMD/f0AAAEB/wP+A//+/wP+AAMEBAD/AgX+AAH9/gL+AP8DAgP6/f4CAwL9BP8AAf/+/QACAgME/wL+9wH/AgL8BAH/BAP+9gIBBAr9/QH+/gP/BPz8//8BAQH//P0AAP8B/wL+/AIF/wEBBAH+A/4AAAQAAwL9/AAC/wH9/gAAAf4AAAECAP//AQH//P8AAP7+/wH9BwD//f7//QD/AwkBAv//Af78CP39AQH9//v2AAAAAAQCAvsEAgAA/gAAAQH//gIAAAP8AAD/+gAA/fwC/wMNAAD/+/3+AgD8/QP8/gMBCP8C/wH+//wAAwICBAMFAgP+AwT/A/kAAQIAAQMB//34/QH9AgL+A/oDAv0C/wIBAAMCAAD++wMA//oBAQAAAQD/AQQCAv0BAQEB/wIAAP8B///88v8CAAAB/wAABAEAAAL+/vgB/wMD/wIA//39AAD6A/3+Bgv/Bf0H/wEAAfz+/gMB/gMDAwQA/wH+/wUC/gP+Af7/B/8BAQH9//8AAAAEDAEDAwX//f4DAAD//wMDAf4DBQIE/gICAP8CAP////3+/wEB/gME/wH8AAL9Av4BAP3+BwEAAP30/voD+gD///4B//8CAQH/+v38AgT+Av36AgEABQAA/vgB////AAEB/wAA/PX9/QH+AAcD/v7/AAH++/8BAQT+/AEA//4DAf4E/wECAAMEAQH+/P8BAf0AAAEBAQEDAfz4/wIABP8C/gL/AwEB/wED+/wEAAAB/v3+Af8EAAABAf8AAP8CAgQAAAH+AAAABQMC/wL9/P76AAYCAAIKAAEDB/33/gMDAwEG//4AAAIH///9/P0C/gIAAQME/gP+Af/9/v0AAAL9+wEC/gH+Af39AgYL/gQC/P8BAwIB/gIA/f7/BP38AAD/AP78/QYCAgAAAPz++wP+Af8B/gD//QH//QD///cB/gL9/P4B/wEDAv3/+f0FAf8B/gH+Af39/QQCAv8BB/4DAP8AAAP6AP8AAP8DBP/9+QP+AAEAAPsC/gIACf4F/vsCAAAAA/wAAAH+/v8BAf4A/wL+AP8BAgMA+wH//vr/AQIFAgUBAQAA/fz/A/4EAQAD+/8BAf8B/wAAAv/++wAAAf8C/gL+AgMBAAAAAgAB/v7+Afz//gMCAwIEAQH///YC+/8AAAUAAAEIAQEB/v8AAQEB/v8BAf//Avz//QEB/wH/AgD8/v8BAQIAAf8BAPoC/f4AAQH/AgIEAAACAf///wH/AP77/gEAAP7+/gP/AQEKAv0BBv79/gL9/v3+//oCCP4D/gQD/wIG/wH++f4BAgf/AfwBAAAC/gEBAwMDBgQDAAACAv0BAv0A+/79AvwAAf//AgIB////Av3+/AEB/QEAAAAA/wD+AwL+AAD/AAP+/wH+9f8B//sCBQL+/gP/Av4DAPj/AQH//QH79wABAgcB/v75AAEB/gAAAAD+AAEF//j++wAB/v0EAgEG/QH+BAABAv3+A//+AAEBAQEB/gL9AwL+/wIB//8BAf7/AQAAAf///gAAAQEDAgAA//wBAQH9/wH+BAAFBP4B/QMAAv0A///4AAAC/wH+AAEAAP4CAf/8+QIE/gMA/wIE//39/QMGBAD/AAEBAf7///8A/gD//wL/Avz/AAMCAQEEAgIAAAACBf8B/gQC/gEK//7+AgAH//8B/wH+AAAA+////gT+AP4CAgAAAAEBAQMDAf4C/wIC/gAAAAD8/gL9AAH//vwEAf4A/v39AgAAAAEAAAACBQIAAgQCAwAAAgD+/AAA/wIBAgAB/vsDCQT//wH+9fsHAv39/AAAAwL/BQAC/QICBAP7AwEB/wAF/gQAAf/9/v4EBP8BAgUAAQT/AAAAAAD//gAF/wH+/vwDAvwD//8A//8B/vz///78/f3/AgAFAQH///77/wQAAAAA/vb9/gIAAAAE+AEBAvz+A/wAA/oG+gL9/fwAAP8D/wH/+gD///79AwAA+wAAAf38/gH8AQL+AQL+BAH+AAEBAv8B/P8D/P4D/gQDCgD/AAABAQAAAwL++///AAD/AgH+AwIBCP0G/gP8BAABAgT9AgECA/8EAP8B/f7/AQIAAQH++wAA/QQB//4EAf7+AwL7A/0DBAMHBgoCBAAFAP7/Av8D/QIEAAMEAgsA/wH9/vUAAP0F/wAAAf78/wEAAAEBBAH//f79/fsE/AH/Bf3/AP78Av3//gAH/f//AQIG/wL9Av8AAf8DAAL9/wEC/P4DAf4C/f4A//wB+/3z//3/+QH/Af//+AH/AAH/+v72Av8CAP4CAAAFAAD/Av8BAf8EAgMAAP78AAQCAwMFAQID/v7+/wL+A/8B/wEB+/4DAf7/+QH+AwMBAP8BAP8AAQABAAEC/AH//gMAAAAA/wL+AP0B/gMCCP8AAAEB/v78AAACAv8AAAAAAQIA/P38CAEC/QED+v3+/QECBP38AAH/+QABAAEAAAQBBQkBAAAA//0C/AIA/wIAAAD7//8AAQAA/gMC/P8BAwIAAAQHAAD///77AAAEAgL9/vgDBAD/AAD/Af4D+gUDAwEDAv7//wL+Avr+/QAB/wEAAAL+//0BAPoDAgT++/0BAgMAAf30AP8AAP4B/wL//wH+AgYBAgAAAf8BAwYHAAAA///+/gIA+gIB/gIBAAAA/vwA/wH/AP3/Af4D/wEC/gP5//3/Av4B/QQBB/4HAQEEAgAAAQAAAAEE/wAG/P77/wIAAP3+/vwAAAEBAgn/AQL9AAEAAP/5+wP9BQAA/vz99AAAAwQAAAL+/f39AAEA/gL/AgEC/gMCBP0A/wMA//8CAQD/Av0D/vwB/wAC/f0G+gAAAP4AAAD/AAD+/AP/AAD+BP4EAv0CAAD/AQf////2Awf+A/8AAgP/AgT7A/v/Af4E/wH/Af8E/gACBQMDBAMDAwL9BAD8BQQD/f0CAAP9Av8B////A/4C/f8AAwMD+gL8/v39Af/+Af8AAQEB/gIBAQAHA/0AAAEG///+AwMHAAAAAP35AP8DA/7+Af3//wEBAf4C/AAAAwT/9wH/AP/+/fz+AAABAfz/Bf7//AH///7/AAD/Af4CBP0CAP8AAv78/wH/Af4CAwQABQAAAgL//gL9/v78+AECAf3/+gEHAAD69gEBAAAEAAL+AP8CA/8CAAD///0EAAH/Af/8AAABAfz+/wEB/v8EAAcBAPz+//8BAQEBAgP+AgH//P8AAP4CAAD+AwIBAwMEAQH+APv/AgAAAQgCBP8BBAH6BAT/AgP/+gQAAf4ABQIE/v3/Af79/wQDAgEI/wED/AD/BAH//wAA/gAD/wD/AAEA+P76/wAD/wAA//8BBPz+AAH+AwH/Av0C/wL8BAH//v/9//7+/PwFAP/9/v/5/f4AAf/9Bfr9/wABAAAAAgH+APv9/gAAAAABAQED+wP9+/8BAgoAAAABAQEAAAAA/QL/Af8AAQQAAAL+AQD+AwAAAQcC/gQBAwMDAAIL/QQCBAAAAQH9Av4AAQEB/AIAAQACBQD/Af4ACf4A/Qf9/f4C/vz9BP0CAv/+BAAAAAUA+QT7AP8EAvz5AAD//QEKAgT+BAH+AwYB//38Av8AAfwBA/4CA/v2/gP/BP/7/QD+9QP7/vz//QEDAP//AQAABAH+AP8A/fz/Af0H/vgCAAP6AgAB/gQMBwkB/gABAwECBf39/vz8BQH/AAADAwAB/gABAf39Af4B//36AggB//4A/gEB/wEC/AAAAQH+/fsA/wIIAAAAAAAB/////QL+Av79A/79Af8AAQH/BAID+QH+/QL/Af//AgD5+P71AwP//v78/vsD/gABBPsB//wA/f3/AAH///kDAwAA/gIC/gD4/wL/AgAAAf7//gH+Av3+BAH//wH/9gEIAAEA//0FAQL+AwABAf0BAQAAAwIAAP79/QUAAAL+Af4CAwABAvz+/v78/wIB/wAB/gACAf0C/wEC/AL9AgD+Av77/P8FCgL9AgT+Af8CA/4DAP4D/QECAAIFAvwB/gAB/wH/+P8A/wED/Pz/BAIA/wAA/QECA/wA/wEA/wUAAQH/AAIA/wb+/wIA/gP/Af4DAAEDAAH//f8D/gH//gIBAQEDAv4AAP8D/fMAAf39AP8C/f4AAAcAAAMAAAj//AH//wIB/wABAAAAAP8BAP8AAfz9AQkAAAABAAIA/wAB/gIA/v0BAAD//wD4/wIABQQCAf8D+wEAAAEAAAEAAAX/AQH/AAH+/AEB/QUF/gEBAAD/AQAAAP8CAP/3AwMBAf75/wD+AgL//wACAAAA/wED/wIFBAEB///3AgcB//38Af7+AgP//v0EAwEA/gMBAwL9/P/9/AAAAQEABv/+AAAAAAABAgYB//wCAQH+AAP7/v3/AP4DAwT+AwAAAAAAAP38/v0A//0DBAD///8CAAP+AwQCAQL8/v78/gP+A/75Af8AAP4EAv3+Af8B/vv+AQP+AP8AAAL8Af8AAP0C/voABQEBAgL/+f37AAAD/AAABAsAAf0FAP8B/v/6AQD/Af0CAgIEAwAB/wEAAP//AgMC/v78BQn/BP/+AAD+AwP8BAEB/wD//gME/P8C/wIAAAAAAv////sCAQEAAf4CAAAD/gAA//oBA//+AgUD//8BAQH///r5/wEF//4EAwP/AQD+Af8EAgAJ/wD+AgL+BAX/AP/+/wAB//30/fwAAAL9Av0AAP39AgL/AQP8/gAB/gP9/wICBAAAAQcFAP0BAf8B/wEBAAACBv4D/P4AB/z+/wAB/v//AAAFAAMB/vsC/PsC/wIDBQID/fz99/78BAD+Av74AgIABgAA/wH+AwL8AAACBQEBAAD/Av8H/Qb+A/8CAf8AAAP+//3/AP38/wT+BQEIAf/9A/8A/fsEAQH///gDBv4C/gT+BAIF/wL9/gAA/wEE+wL9APoAAQAA/wECAP79AAECAP79//kAAAH+AwQCBP4A/P/9Av8C/wL++AP7Av4D/gEI///9Av0D/wH7Cv/3BPn++AIDAv3+AgL+/vwB/wIL//cB/gQBAwP9/AH8AgABAgIAAAACBP////0CAAL+/gD/AgMDAAABAf8B/wP+BQAB/P7/AQQBAAEDAQL8AgcB//4C/wD9/P8BAv0C/AP/B/MAAAEBAwr+/QD/AAAAAQECAAD8+QEBAQD8///6/wP///4A/QEAAP4AAAECBP//AQMBAAH/Af7/+gAA/AQBAAL9Avz++gP/Av7++wL8/v0CAAD5/gMC/QD/Av0AAQEB/QQBAgAA/wL+AAD4AAH+AwH+/gH//wYQAf3///4BAv7+AwP9AQICBv8B/gAAAf77/P4BCP78AAf+AwAAAAH//wP7AP4A//0FAf78BP8BAAAAAP8B/QP//wD/AgQDDQD/Av/9AQT9/v0AAQMCAf/8AAIC/wIDAgL+AP/78QIAAgQC/gICAf4CC/z///kAAQAAAgf/AQL+/voAAP36AAD+AgIB/gIAAAABAQEAAAAAAvz/AgAA/wECAAL8AgQC/QAB+/UBAQEDAv4BAQEB/wD+/AEBAP/8AAQE/v0BAf8B///9AgD+AwwAAgIE/PX/AQIDAf0CBQD/BAv+BP8AAgUC/gL8BAH9/wQIAAACA/0CBAX+AwH/Av4AAAH/AAAAAAEIAgT++wMAAQP//QEB/wD//wABAQH9AgP/Av79+gEI//8AAP4DAv0AAfv4/vsA+wIABf/+/f8DAAP/+P71AP8AAf8DAAACBPwBAwP9+P8B/f4A/wH5Av39BAD/AAABAQAAAAD99P79/wEDDP8D/QL8BP/+/gIB/v//AwX+AAD/Av0A+QEBAQAC/v8C/AAA/gIEAAn///79AAAC/f/3/wH+AAL9BAH/+AAA/v0HC/78/gMDA/8CBAP+/f4EA/wAAf4D/AP//wEBAgoBAAMC/PP++gP+A/sCAwH/AgX9Bf/4AgACAv4D/AUBAwAAAQADAgL+Af8AAAH6/wEEDv8BAv8BBwAAAf/9Bf39/wIAAAEH+fT/AQH9/P8B/vz/AwwB/v8CAQAD/wQC/wH//wD7/gD8Af4C/wL//wEB/f4CB/38Av3/AgEJ/v4AAAQE//0BAQED/vz/AQEABQ79/f8D/PICAP////kB/wECAf8B/wH+AAD8/wL9/wIEAgL9AAAC/P71AAAA/wEDAAX/+gIB/wH/AAIGAf0C/QQBAQL//wH//vkCAAH+AAD+9gABAv0A9/0D///+/P4CAf4CA/nvAf8B/f0F/QP+Av4DAAD9AAH+AQf+AwEGBf0AAQAA/vwBAgEA/gT/AAH+AwMAAP/6/gL9AgAAAP3/+v8CAQb+/P4A/wH/AQAA/QMAAAH+/wEA//0EAQEB/QEB/gIC/v4C/v0BBQAA/wMFAAT+AQAEAfwHAwADCQD6Av0A+/wAAQgDBgABAQL/AAMDAP8BB/77/vz+AQL/AP4B//0AAQAEAP/6AAH/AQIA/wEBAAP9AQEBBwIAAQED/P7+AAAA/wH/AgUAAgEAAPv/AQL9/vv+//8AAAEF/v0CAPgBAQAAAAAB///4//f+A/79Af/++wAAAPv/AgEIAQAAAAL+AAAECf4A//4AAP8AAf7+AAQA/gEAB////fz+AAAG/gP/Af4E/gEB//38Bgn9AQAHAAD/AAEB/wEC/v/8APwB/v79/v0CA/4ABAr/AAAAAvwBAP4DAf7+Av7/Af//+QD//wD+A/4E/vX/Av0DAQECAP8CAQAAAwL+//gAAAH+AgH/+QH+AAEC/QMBAAADA/z0Av79/P4GAAD7Bv4EAAD///8AAf/9BP0G/f4CAPz2AAD9BQEBAAcDAwEBA/8FDQID/gIB/wAAA///AQABAv0C/f//AgsAAAD///wAAAECAQn/Av//AAABAAIGAwH+/f4C/vz/AAIDAf0D+f8DBPoC+/8BAQYA//0FA/wFBf8C/QIDAwIABf7+Af75/vsAAP///PL9/wH+/gQAAfwCBAQA//8CAP/+A/71Av3/AQAFAgT//v35AAD/AQEB/wD9/PwAAAAHDP4C/gT+/QAA/AgB/QEAAAADA/77AAAC+/0E/vYB/gAA/fwABvwAAf8B/wH/AQEBB/4CAgQCAQT/Af8EBP74/gP/AP8BAv79Av4EAAD9/P8FAQEB/wH+Af8AAAMDAP8C/f4C+vMEAwQE/wEB/wX6AAAAAP8D/vwDCgEBAf8D/AEKAQAD/wIAAP8D/wD/AAAAAQABAf4EAv/7/QH+/QIDAgQB/wP+Af8B/wAAAwQB/QAABAP/9wQOAAAB/wAA/QH8/wQHAQEC/gH//fz/9wH/AAAA/wAA/wAE/wIF/fb+Af8B/QUA/QAAAP/+Af39/v/+AwAB/wD+/f8C//0A/wME/QT+/fz1/gT+AQIFAAD/Af/5AgADA/39/Qf3+QMEAQj+AQACAwX+9/0CAgMBAQAAAAD+AgEB/wADAv4CAAIA/f8BAP8CAAP7APoBBQAA/wEC/gIBA/4A/wIA/gP++v//AQH++wL9/gICBAL8Av8B/wAAAv8A/wAA/v0B/gL6Bvv++/76BAIC/P/5AP8EAf3+/gD+BAAAAv7//wD//v0DBv77AAED/wME/gACBQEDAf3//wMF/wD+/wEE/wEBBAH/AgABAQAFAf8AAAL9//sBAv4A/f0AAAIMAAH//wICAgMBAPwAAgT/Af78AQEA/wMMAAEBAAAAA/sCAgEGAAAAAP4D/fv+Av79+wf++wH/+wD9/v8EAAH/+AIAAAD//P8D/fz/Af8AAQn/+gIEAwMDDAIE//4AAAH+/gP+9QAA/wH9/v7+/QQC/f39Awb/AvwF/wL6+v78AAADAwEB/v79/AD/AAAC/gD/Af/9BAX+AQH/AQP7Af7/+gIC/wH8BQIJ/gAEAf8C/Qj/AP33AAH++/78+/f//QEB/gUAAQQCAAD9BQMD/wIBAAP7AQECAAEBAv8B/QIFBAEA/wEI//3///8B/wX+BP8BAAAAAAIBAf/++/wDAQACAwEB/wAAAAEABf4BAAIA//wC/gb6/wIDAgD/AQcAAf8C/gH9AgH+AQUA/wD/A/v+/AQH/gACAwAFAAb8+f4AA/7++v/5AAAA/QECAgQCAAP5Awb/AgD/BAH9AQH//wMC/gIC//79Av8C/v0BAAD//vb+Af0DAP/+/AL+/v3/Af/4/wAE/AMCA/8D/f39+gP7BgEBAAD9+AMD/f4AAQD6AAECAP4AAwIAAAEBAPv9/wAB//4AAAIDAAABAfz/A/4CBQL9AwH9/v4BA/4E/wEBAAH9/gABAv8B/gEB/wIBAAEGAwT+AwAA///8//0AAQIB/wABAvv+AAEBAf7+/QH+//n+AAL8AAb/Avz//gIBBAAA/wD8/f4DAQn++gP+/AQC/f////n/AAAAAf//AP8A/AD/AP7/AAABAP0C/wH//wL9/gD/+/77Av4CBf4DAwUB//3//gMC+gMGAgb9AQIEAP8BCf4DAgD+A/39A/4AAgP//f3//wQCAAIDBf/3/vsABwUA/wEAAAAA/wIAAQAAA/8CBP8CAP//Af8D//8AAAH+AAD/Av8BAgT+AgIK/vwC/v75Af8CBwP7A//++QABA//8//8B//kEAf//A/8DAv8AAwIABQD/Agr+/AP9/fwAAAIF/vr//QMCAQECAwL9/vz+BAEEAAAD/AIFAAEB/f4DAv3/AgABAv8EAv78/wP+9gL/AQYB/wAA//f+A///AAD++f//Af4B//8A/AD8B////vsAAP/6Af4CAPz4AgMAAAL+/wH/+QH+/AP8//8A////AQEB/wEA/f78AQb+/AQBAggA/wABAv79A/0C+wICBAL9/wH+AAH8AAD+BAEBAAD/AgH/AgAAAP8CAAACAAMBBPoBAAEAAQgCBf/9AAABAP79///9Bv8DAQL/AQL8BAMBAAEBAf/+AAH+/wcA/wH9/gH9/f36BAEA//4CAv0C/gX9AP79BgAA/wH+/f8BAf0BCQP+AwD+AgEDAQgE//wIAAYABQIE//8BAP36/vv+Af0BAf4AAAEIBfwC/P8AAgACCPz+/wD8AAEC/wME//74AgL//gMAAwMB/gABAAADBwII/wD+/f3+BfkDAgEA/gICAAAA/fj8A/0ABAEAAf75/f8E+P/5/vf/AgAA//8AAP8B/wEC/wIDAAAA+f3+AgQA//0C//gB/v8AAf8BAAAA/f//Av3//wAA/wABAQD/BP8B/fj9+QEAAAD/AgEEAAD/AAEAAAADBAD/A/wC//wA/vsAAQMCAgr9BQAA/vsCAgAAAv0AAAMD/wD8/wAB////Av79/gMC/f4BAgACBAH+/wMDAwMKAP8DAwIDAQT8/v4B//gAAQH/A/8CAgAAAf79/P/+Av//AP4A//0BAAEI/gAC/gAAAf4AAP//Af0CAP8A/v7+AwD//wH/+gIABAMBAAEGBAj/AAQB/gIB////Af8CAwD8/f3+9gAA//3+/P/8BAIC//4D/gT/Af//AAAAAAMBBw//AAD/Av4DAQD/AAD8/gH//wD+AwEBAAD9+QP/AQH/AwAAAP8DDQQDAAD///z9/AT/+vz4AwP8/wP/AAAAAf78/wX9AQH+AP8BAAAGAAAACf77AQEC/QL7AAH+A/7+/gMAAvnx/gMCBP4DAAIAAAEAAvwCAwMEAv3/APwAAAEAAP7+BPwBBgAA/fQAAP8B/wEB/wL8AAAD/vz/Av0AAAH//wACAv/5A/8C/wEBAP//+QIFAPf+AwEC/wEAAQAAA/4AAAH+//0B/wQA//0C/QAA/gH9AgH//f78/v4EAgEAAf8C/QIAAPwEAPsEAv4DAP7/Av8CAwH/AgAA/gH/Af4C///+AwAB/AH/AP////8BAgIA/wH9/f8AA/7+/AAAAf4C/fwE/gIB//4AAgT+/P4AAQH//QMAAAD/AAMEAAAA//8ABAcD+/8CAgUB/gAB/P4D/v8DAv0AAPwAA/4CBQH/A/wD//8BAP8B/gMCAAABAQAA/f8AAP8BAv/+Af/+AAD/AgAA/wIB/f8B/wIBAP39/gIDBP4B///9/wP+AgD+/AL+Af4ABQD3AAAEAf/8BAL9AAH/AQP/+wIDA/4D/////fwCA/8C/wADAgEA/wH9/v8B//8AAQH///8B/wAACxH/Av8CAf8CA/8CAv0B/gD//gH/AQH/AAAB//4DAgT//wAA/QMA//8CAPr8Af8B/fz+Af78Av0CAP78/wD9/gEE/wD/AgAB/vwB/wD///4AAAIA/wIEAv8B/QMAAP8B/wL///Xv/wEA//8BAAED/QIEAAIDAgL+AAACCP39AQEB/v/7AQj/AAH+/wIC/gEEBQkBAAEA/wIA//4E/gACAwH/Af8A/wEG/wIDAf8CAQcAAP0C/gL+AQL8/f0B/wX+AQQB/wL8/wEEAQL+AAEB/v78AQL+/gP++wMBAQAA/PsB/gAHAQD/Av75AgEB/wIGAQAABfz1AQkB/gT/AAAA/wMBAAcBAQEB/P//+QL9AAgB/v37/wEC/QL9Bg3/AQH/AAD9AAD8/Qb/Av8CAwz/Av8BAQAAAf3/AP///gH9AAH/AwT9AAD/9/0EAf8CAP8EAgAB/f///vYDAwD8/wL/AwABBAL9//z6/wD//wL9/gIA//z3/wEC/gIAAQcDBP38Av4BAQIEAwL8AwP6AgcE//vyAP8AAAEJAP8B/v8BAgUDAv4AA/v///4CAQEE/AEB/gH+/AAA/P8AAP0F/P79/AMC//r/AP/9AAEC/AEA/wIAAAQBAgQEAf8CAP8BBP37/P7+9QAA/////v3+A/wAAAH7AAgAAAMCAf//9gABAQkAAQAF//z+AgIDAQEB//8A/////gH+AwIAAP8BAAAD+wP/Af8A/wECAf/+AAMCAAD9Af4D/gMAAPz///4A/wAA/P4ECAQBAgMAAAAA//4DAQQOAgX+/fr9/gL/BQL/AQj+AgD4Af4A+wEAAv3+/QAIAwIBBwAA/wIBAf8F/gAD/AIDAQEABQIA/AH//QIDBQ3//f8BAv4B//8D/AAA//4BA/8BAgAA/vb//fz/AQn/Af8B/P/+9v77AAAG+wP+AAD///75AAH9Af8B/P/+Af8CAAEB+vwA/foCCwIGAAD9+QABAP/+/QAAAgf//wH9/wL/Av73////Av8BAvwB/AL9A/8C//0C/v8AAAAB/QEB///3AwICAAAA/vwCAwAB///////5AAD/AgQAAwACAP8BAf4D/v0E/f4C/AAB/fYB/P//AQACAAAAAAD9A/3zAAABAAIA/v3++/4CAvwCAP8BAAL/AvwEAAAECAH/Av0AAAP/AwIAAP79/gAAAQAA/AH+AgECAQf/AAEJAv77AgEB//8C/P4DAQMD+wMEAAED/gIA/vwAAAD//QEBAQAAAvz+AgAA/gP9AQH/AAEB/wACAAEAAAP+AP8E/AAB/fcAAP4D/wH////+/wEBAQH/AP8AAQH9A/78Af/5Awr9+v4BAvv9/v8BAgAD//8CAQH++/4EAQL/AAAAAQoDAQL9/QECAgIEAv4CBQT/Av7+AQD//wEA/wEDAAH9AAMD/gAA//8BAQH/AwH+AgX9AQAA/gD+AwH//wD8CAAABAD/Afz3Av0EAwH/Af8B/wED/QH/+gAG/wED/f/+/QX/Af35/QD+AwEAAAH8//0F/P0ACAABAf/+AgP/AQH+/AH//wP9/QH//QID/gAAA/oAAAD9Av4BAAH/AvwCAAH/BwIAAP3+AQAC/wEG/wEAAAEIAAD9/v8C/QYA+wEA/QL+AAX9Af8B/wD/A/4DAv7+Av0F/wAB/vUEDAEA/wMBAf//AgP/AAH9AAAAAQD/AQEDDAEB/wL+/gIF/gL+BAAB/gAAAPz4/gD/AQD/AP//+v/6AQb/+P0GAf4D+wL7AQIAAAL9/wL8/wEG/gQAAAED/P//AQAA+wED/v8B/fQBAAT8/v4AAPz/AAAD//8BAP8EAv//+/QAAQH//gP//AD/BAAAAAH/AAAC/gH+Av0AAAEB/wEAAAD7/gQEAQEB/QYCAPwA/wH/AgP+A/8A+wH9AQD+/AH+/gP+AwP7/gEBAP4A/wD//wIDAAAB/wIAAQIAAAEG/vz9AgIA//4A/wAAAAgAAfz+/wH/AgEB/wAAAQEB/wH+AAEAAAH//wH9//kAAQX///8C/P8BAv/+AP////8AAAIDAgT/AwP7Av79BQAAAgL/AQD/AgP9/gAAAgAAAAEJAv8AAgAABAH/AAAAAgMGC//2Af8EAv8CAP/9AwAA/gP/AAAAAf8AAP4C/QUB/wAA//79/QD//wID/v0DAQAAAAIDAv3//f39Af0BBwEFA/sCBgD/AAIBB//+/wH+A////gH99AEBAPkAAPz+/gEAAPsB+vX+BQH+AAADBgAAAf0AAAH//gMB/wAAAQAD/gL8AgQBAQABAP8BAwH+/QIB/gEA/gP+/QEI/QMAAAME/P8B/wMMAPn8AAL8/vr9AgACAv0A/wIA/wH+/wEEAAAAAAL+AAEC/gMHBP/+AvwA/fkCAAMDAgADAgL8/wL/Af4AAQn/Av39/gECAgAAAQEAAQL9Af8AAAH+/wH9+wD+/gT/AwP6+wD89f4BAf8CAgQLAv0A/wAAAAABAwMCAf/8/QAAAv//Af4CAwEA/f8GAf8EAQP/AAD+/P//+QUA/wH+AgYCBf72Af7/AgD//f8AAP79AP8AAAEHAAECAP8DAf/+BQX+/vkCBAL8AAAA/wH//v75+wABAf4AAP4C/P7+/f0FBAIA//8AAf8A//3+//n7/gIA/vsABwEDAgMBAQX3/wIAAPz+/f7/AgMCAAACAAAAAAEAAAAAAQb/+P4A/gD/A/4EBvv8AQIA//0AAQEA/wEBCgIEBv3/AQMCAAADBgL+AAAF/v8FAQIDCgIDAwACAAABBPn//wAA/fv+/P7+AAUBCf8CAQEC/AT+Af/+/QH//QEB/gMDAAD/Av77AQkB/gAAAvoEAf3/AAD+AQAAAv/+AQAB+v/8//3+/wD8/wEB//j+AQEC/vz/9wAG/vX9/v7//gD+AgAA/QT/AQP/AQH/Af77/fv/Av//Af//BgEAAAD/AQQBAgT++/8BAgcB///3AAEAAAAA/fwBAAL9AP/+AP8AAf8D/gYAAf7/AQAAAAIABgAAAAAAA/0FAQH++v4D/gMB/wAAAf7/AQABAgAABf4AAP8CAAL8BP0BBf4D/fr+AAICA/4AAP78/gIAAAD9AgMAAAIEAwQB/wAAAgL/AAAACBABAP4E///9+f8CAwMD/wD+/vr+BAL+//sEAv///gUA/wL+AQcCAAAB/wEC/f4A/voB/wIA/gAAAf0B/vwC/QQBAf/+//4A/f7/AQL+AAH9/P79/wH9/P77/wEAAAAA/wH/Avnv/QEE/AEGAv4C/f77AQMC/wIHAvz/Af4D/vwAAAL7Av8B/v77//8C/wABAf7/AQIAAAEBAQH//wAC/QEAAQH9/gYQ/gIAAQMDAwIBAQH+Av7/AQH/AgUBAgEAAAH+/QEAAv0AAQL+////+v0FAAAB//79/gMA/gAA/wIEAAL/AP//Av4B/wEC//4C////AgABAf///wEH/v79Bv4E/QYBAPwE/wP39gP+AwD8//wA/QL+BAEGAAEBCPz//QH+AgL8AAACBf4DAgIBAgIL/wEC/AABAQL+Av8BAf0AAQD//v39AgECAwMC/wABBA0BAAAAAf7+Av8BAgP/+P8BA/sE/QL7AQMF/QL8Avz//v//Av0A/wAAAf4B/gH//foB/gAAAv4CBAEB//kB/vwB/gD99gABAAABBQD/Av0F/gABAQAC/gEBAf/9Av77AgIB/vvyAv8AAf8CAf4B//79/Af/Av4C/AMAAAD//AEAAAD//QYAAAAAAf8A/wH+/vz+AgP/Av0AAQEA/f79AwEB/wEC/P8B/wMCCP8B/vv//wID/f/+/P//AgQAAAD/A/4AAPz/AAACAwAJAP8B/v4EAgH+AgX6Af8E/wQD/wL+/gP+AgIAAQL8///+AwH/Af/9BP4DBAEBAv4DAf4AAAAA/wL9AQABAAAD/gH9AP0BAAMD/wL+/QMB/gP+Avz//gEBAP//AgcB//4D/f79+QMMA/4EBP7/Av7+AAMA/wT/+AAB/wD9AwILAwL/Av4DAf4BAQAAAf8AAP3+/v0B//8BAAD/AQH+Av4D/gAA//8AAP76/gL9/gH+AQj//gL9A/8DBQIFAgEA//37/gQC/f8DAv799P4A/vgAAP8BAAH9///6/gQC/AH/Av388//9Av0B//8D/gEAAAAAAv4A//4CAwAAAAECAv0C/AAA/QEBAgIFAQAAAQUH/wL9BQECAQP/AQED/fr9/P3/AgwD/gP7AgQDBQAAAAACAAH/Af8B//8A/gQAAQL8AQH/AgD//wH9AgAAAgQA/v4C/gQC/gEAAAAC/gADA//8/wID/wEAAP8EAAT++wIC/wEA+AL8Avz/9//9AAD8/wL+BQoDAv33/QIAAAD+/vn+AwEBAQECBAABAP8EAgP6/wEAAP//AP/+AwH/A/7+AwD7Av4AAwT8AQD//wAA/gP9/AD/Av78/wMCAgQC+//7Agr8AAMD/v0BAgMC//8AAQEAAv4CAv/2//4B/gL9AAD/B/8BAvz+Af3/+gMA/wAB/vwBCf8C/wH+AwH/Af/9BQAGAAD8BAICAvr/AP0CAAACAQQBAAD/AAIFAQD8AP78Af8A//z5Av3/+v0F/v//Bf0GAQkA/wIE/v7+/f4AAQf+A/4D//cB/v4DAv8CBQb8AAADDAEIAwUD/QMD/wL/AQD/Av3/+QMGA/sAAQAB/gIB/gIDAP///f8CAP/++wH/A/7/AgAA/wEC/QIEAgQE/QMB/vkB/P/9AQH9/AAAAAEDCQH8Af8C/f4DAQAAAAQNAf//BP8B/vX/+Pr2/QL//QT9AAD/Av8AAAD9+gAA//8C/wL+AAAAAQAF/AQB/v0F/AcBBgAGAgYAAAIAAgr9/fz/////BgH/AAAA//0CAwMAAAD///j//gD//gMB/gD/Af759AAAAAABAAAE/gIB/gQH/QL///4DAv0D/wIFAf4AAAED/QH+AgH//vz9/gX+AwIB/wP6//oB/P36AAEBA/z5AwIC/f8A//j/AQH///oDA/39/gMAAf4A/AQDAQMC/wECAwEAAv7+/P/6/wD//AH/AgD+9wL+/wEE/f4DAAD7/wH/AAD8/QH/BAEBAQAAAf3//v79A/0AAAD//AAB/wID//0C/f8DAQECBQAAAAEBAAIEAPv/AQD/AP8A/wP7/v7+/QQC/f74DwID/wAAAAAAAAABAAAA/wECAgMBAQQEAv//Av3/AQAAAv7/Avz+/gH/AQIG/wD/AfwFAQAAAQH+AAH8/wAGAgX/+v0C/vz+AgIGBAz9/P4ABAMEAgAAAwP+A/0F/gP+/AEACff8AP4EAP8B/wEAAgMAAAD/AAAA//77/vv/AQIA/wH+Av4D/wMC/gMDAwMAAgIEAf8E/AEAAgIAAQAAAAAB/v/8/gMDBgIGAAD/+P73AgAB///8/f0AAP78A/4D/AD//gMCAv76Av0D/AEBAAD/AP/9/QIDAQAC/v4AAP4EAgX9AwL+Av8E/wP6AAD8/f79//f++wEBAQH///79AwIC/wL9/P3+AAL9/vkA+QEAAgP7Af//AAD+AAH/AgT9BAAIAP8BAAP//P8AAQIE/gL8A/8BAP/9AQP+/v79/f8C/wIE//sCAP/+AgEF/f/9Bf8CAv4A//4DAAAAAP3+AgQCAv78/QEBAQQJ/wIAAQAA//8B/v3+Bf4AAAABAQD/Af79Av78/f4DAvz//gABAP/9/gP+Af8AAAEBAv8AAAEB/wIB/gD//v0D+QL+AwD/+v8BBPwA/wECAQED/gAAAwwCAP39AAEAAQL+///+9QMGAwsB/v4CAAEDA/wAAAD+AgAAAQD+AgMDAf4C/f8BAgMD/wMCAv///wAAAf///wEA/AX//gL8AAAB/wAAAwL+Av7/AAADBv0BAgD9AQAI/QEBBv35/gAAAf7+AQAAAAIFAAAA+Pv4/wIB/wIC//0EBwAAAP/+AgAAAv3+/P8C/wH/Af3//AMAAf///gMAAP4C/wL9AQH8/gQAAP4EAAD/AfwAAv0AAP4C/fsAAAAAAv3++AH//P79/v4EAP8DC/4BAgX9/QEBAAgC/QMBAgD8AP0D/PgAAAEABQoA/wAAAP8D+v8CAv4A/wH9//3/AQH+Af4BAAL/A/8AAQP+AAAAAAABAAAD/gEB/wMAAAL9A/8AAAEBAf//AgP8AvwA//8D/PUAAP77Af8BBP/3AAD9/gAHBAcB/QH/AQECBvr6AgMBAQEB/gMAAAAB/gQBAP0BAf4DAQMCAf/9AgAAAv7//wAAAvwBAP8CAQH//wH9Av4CA/4AAAf//wEBAf8CAgEBAv0C/AH/Af7+A/8A/fwAAP0F/gQA/gABAgcB//8A//gF/AABAAD+AQQC/gT/AAH+Af4C/v4E+wL+/f4BBwv+AAAA/gL/Af8B/QEA/wACAgQAAP4E/AAAAPv/AAD+AP4C/f////8C/gP/AgIEBAEB/wIA/gIB/QUF/fz+9QD9AQf/AAAA/f78AP8AAf4A/gT6Af8B/gEB/QQD/gP8AQkC/vn2Af/+AgQABAsB/wH/BAP9/fsAAf8A/wL9AwMD+wAAAgUFAAMEAQED/wD//gMBB/39AAH9AQACAv3/9wH/AQr/+wH8/wEAAAMCA/0CAgEB/f4A/wAAAAD//wP8AQT+A/75AgsE/wEGBAD+/vv2/wEDAv78AgAFAP0GAf8CC/79Af7+AgH+/P78/v4A/QAB/wP7/fUAAP4DAwAB/v8C/QICBv74/wH/BQMHAQH+/QEC+gQABwH/AgMAAP8DAgv/AgAABAEB/wD6/v3/+v3+AAAB/wMD/AD/AP///f0B/AH///f+AgAAAv4A/wYLBAABAAL+Af8CAwEBAf8C/f0BAf4B/gH///r/AAMDAPn/9wECAAD+/QL7APkBCgAI/gMC/f32Av/8//8D/QX++/8B/wEDAv8B/gP8/gAAAgcAAAMDAv7+AgD/AAD/AQEB/v788/8E/gECAwEJ/v4BBP8BAP8D/gEKAQb/AQD/Av/+/P0BAQb9/gAB/wEFCgED//f/9gQBAAACAPoJAv0A+gL7AAD/AgAAAP8BAAH+A/8C/v/4AAD//QAAAf8BAgL9Agf9AgD//gT/+QH//f79+QIB/P4B/wID/QL+9wACAv7+AwICAQEAAP/7/wMA/wH//vr9/QD/AAT7Af4C/gEE9wD/////AwEBAAAAAAADAP//Av0BAQUBAgEBAQT+AwD//AEBCAH8A/8BAQP9AgMAAAIA/wP/BwQCAAD//wP+AwL/+AEAAf78AAAIAv7+AgL8/wIBBf/6Af8AAAEFAf8C/QH+AwQBAQIDAvz8BQH+AwL+/AAAAf8EAQIF//8AB/sAAf4AAAMF/foAAP0A/gH+Af7+Af/8AwH+APn7//8B/gD9AvsCAQcBAQEAAP8A+AEKAf4AAAMC/vz/AQEKAQf/9wL8AQEAAP78/QH9/v4CA/oB/wAA/gIAAAH+/f/+/P8A/fsC/P4EAgYA/QP//vwBAAAAAf4A//0FBP0AAP/9Bf4AAP4DBAAC/AH8/f/+AQQCAQT/9QABAQECCgAA/gP9+P/5AAj+A/0C/AgCAwAA/wH/AgEB/wL//gL+AgP/AgH+AP//AgD/Af8E/P/5/vv//wEBAgQB/v4C/wED/P//Av38CP7+Af8AAP79/gT+/QAABQr7Av8BAAH/AP///PICAAL+AAH/AQD9Av4EAQT4AAcAAQMAA/3///8CAAgAAAML/wIAAP/6AAAD//4D/wD/AQEAAAH/AP77/wEC/wMCAQD+AgAAAAEAAP8BAvwAAQL8AgUDAfn7Bf8A/PwIAAH9BQAA////AQL9/wL/+gID/vz+A/z3/wMABwEB/wIEAAH6AP/68wL8AQL8CAMDAAYAAAEHAf//AAML/wEAAQH//wD/BP//AAH/AQT4AAECAQEAAP//Av38/wgF+vz/AAUE+AMFAf/+BAIDA/8BAQABAQH//QEG/wEB/wP6AP/8AwIA/wL//gEBAf8AAP0BA/n9/QD6Av7++v4DAf/99P4EAP/+AgH//voBAgQB/wIBCAEA/v8A//4DAwQAAP73/gEB/f76/gL/+AH9Af4AAv/+/QIB/f/+/QH/+gT9Af8BBQD5Af0A/wH+AAD+AAEI/wEC/QH/AwP///8AAf4EAP8CAQcB/QMCAAECBAMC//7/AgH+/fz//wABAgQE//76AAAB//8C/wICAQL+/wIBAP4C/P4AAAL9AwP+BAL9AP/+AAAAAf79AQQD/QL+/P//AwP/+AQDAgUAAf78/wEAAP0F/AAC//76Av0AAQAA+wH9//8B/f0DAgL8BA7/AP78//8B/wAA/gIE/wL9/gAAAAAAAQAFAAL+AQEBAv/9A/7/Av4EAf4AAAAHAf/++gL9AAD/Af78AAH8/v39AQn/AAMBAgAD/AL+AQMAAPwH/f0B/gP7/QUB/wD/AAEAAPzyBAEBAf4A/wH/AgH//f79Bf8A/wL/Af4AAP7/AAAAAAT///0CAAAD/gAB/wH8+AEAAQMAAAEBAwL+Av8BAf4A/wD3AAH///0B/gH/Afz/AgUE+gAA/wEBCgL9AAEB//8EAAH/Av79//8CAAAAAv0B/wH/AvwC/gD/Av3+A/3//gT+AP3+/QQEAAH/AAABBQIFAf/9Bf4AAAD8A/79BAH/AgIAAAH//wH+/gAD//8EAf4AAP3+/QP/AgMA/foA/v8AAf7/+P8AAf4BAQEC/QL+BP4D/QX+BP8DAQH+BP4DA/z+BAcIAf8A/gUBAAD+AwAHAPz/+gAABPv/AQAAAv0AAf79Af3//wAAAQEDAwMC//8C+/8BAf4B/QL+AwP//gT/Av8CAAIE/wEAAAAB/gAABQH/BPwDAwP7A/0E//0CA/wEBwEBA/v69wEBBAIBB/79BAD9+wEC/QYB/gAAAf8AAQIF/gH+AwMBAQEA////AP/9/gEB/wMAAAMEAAD/AAACAQH9/gD//gAAAgEAAQD/AAQL/vr/AgAA/fwAAP4B/v0D/gIE+AEAAAECA/3/APwA//cCBAEJ/wP8AQYF/gT//wMB/gP+/P8DAv3/BvwFAgUAAP/+Af/+AAMBAf/9/AMBAf8A+v4AAwMAAP8DAAD/Af4CAf/99AEAAAD+AAL/AQEB/v4DAAX8/Qf3/gD8AwAB/wEC/P3+/f399AQAAf3/+QL+AgL+/QL8AP8D+/4DAfwC+//6AQcABQAA/wH+/QEBAgD+//8DAQL/Af3+/gIEAPsB/wEDBf4CAAD/AAH9AwICBAAAAgQD/v77BAIBAgH/Af3//v8BAgUCCQMD/wH++/8C+wEA//7+AQEBAQIAAAAC/fz+/wMAAAD6APsBAgH//gMABf///gID/QAB/wMAAAQC/vwE+wL9AfsAAQEBAAECBf///wH//wD+/gD+A//9/vwCBAMGAgUAAP77/vcDC/8CAwQB/gQCAQEAAP0B///9AwEC/wEDAAL8/gP///8A/QICAAT8//kBAQQA/QP8/wH+/wL//gAA//8AAPwAAwQAAAMC//oAAP/6AAD7Av4EAf79A/8C//79+v77AP8BAQH//fUA//8DAf/++v//AAEC/QAAAP///gIA/gD9BQP+Agv/AAL8AQP/AP4E/gD+/QL9AwIC/QH9//7/AQAAAgMD/gD6/wD//QID/v8AAP8BAv4E/AH/AP8DAAAGA/8DDAH////+BP39AAH8/f8B/wIBAf4B/wIAAAH+/gL+AQH/BAP/AP/2AAD9Bf8FAP8AAQMCAAABBQAB/gMDAwIE/gP/Af3+AQT9AQEA/wD+/gH/AQEB/wL//QL/AgH//wD9+gEE/v4CAAAAA/4DBAL9Bf4B/wME/QID/wIA/wEB/wH//wEA/wD5AP/9AwIIBPwCA/4EAvz+/QAA/vv/+QAA//3+/AQEAgACAP38Bw0ABP4BAgMCC/8AAgT+AAH+Av0B/v7/AAIAAAD3/gABAf0AAP3/AQACAAD/+gD//QH/AAMCAQn+BAL9AQH///4EAv3/9wEC/vUEAQID/wEBAf8C/wEB/v4B/wH++gEC/wD/Av31Af8C/v/9/vX+Af78Af8AAf4DAQEB/wD/+wABAwH//QIC//7+AAD9/QIF/wAAAAP/AgT9/wD/BPz+Av4AAgQC/P8BAAD+/f0C/P79/gIJ/gEFCAEAAAADAQIIAf38AP8AAv77APz/AQH/AAAAAAD+Av4DAgQC/v/+AAEC/QH+/wMBAQL9/gL/AQMDAwL8/wH+Af/+AQIIAv8A+f8AAwQB/wAAAAADAf4DAQIAAAL9/wP9+f4D/v3+AgH//v3++AECBQkAAQQNBf7/AQAAAP8CCgL+Av4AAP/6/wD/Av4CAAEB//77//8AAAMH/wIABvz/BAH/A/8CAv/89AEC////AP/6/wH9/QQO//4D/gD/Af4CBAMCBwwB/f37Af4AAAEBAAH/APv2Av/98///Av39AgIE//wAAP8BAv0BCQH//gQAAAIDAv8B/wEGAAD9+f8BAPkD/v/9Af4C/gEBAgP+/gAAAAACAwAAAgb98wAAAQT8AwIA/P8B/fzyA/8B/wH/AQH9AgIH/wAB/////gD//wIBAv3+/f38/QX+BAID/vgBCAT8AwX8/gAFAgL++wEB/wID/fz//gH//gIDAP/+/vwABA0AAAAA//7/Af/5/wD+AP78BP0AAP8C/wb//wAA/wEA////Awf/+AAA/wL/AgMC/gL//gAAAQgB/wH9A/z9/gIA//gBA/76BAkA+/z/AAH//wUFAP4BAAL//QT8AAEI/gMA/vzzAgL/AQAAAv4BBgEA/wIBAPwE/gAC/AD5/wH/AAMDAAH+A//2AQABAAAAAwL/AwEAAAEBAf74Af8B/wIK/wH/AAAA+wEB/v72/QIAAAMC/gMA+/4EAP//AAX/Av0A+QQBAAD+A/8EAv4ACAEH/vv+AQQCAQQC/AAAAgD//wABAQD9/QIFAv0AAP8AAP8A///9/vv/AAIE/QIBAAD/AAD//AABAQAAAAP7AAACBAP+A//8/wH//P4B//8BAP8AAQIEAQMDCwMEAvwB/gABAPkBBAH/Af4AAP77AwIDBP0C/wAFCwQOAAH9/QIEAgMBBwEHBAIAAAH/Av/++wH+/wD+A/8DAgUA/wAAAAD+A/8BAP4AAAAHA/4C/wH+/gMC/v4D/P77AP39+vL9/QAA/f0CBP7///4AAAAA/f0AAAAB/fwB/gH//PP68wT//wD9/fwBAfv++vsB/AQAAQEAAQH/Av8CAf8C+/30AAD/AAABA/8B///+/wD++f////8AAQQBAP8C/QMAA/0CAP4DA/7+AgAA//wBAAD5AgUBAQD/AAH//QH/AwIBAQEH/wH+/QAB/wMDA/7+/wMF/gH+AP8BCQAAAv0C/f8CAAH+AgL+/wD/AAECAgMBAv8AAwn+A/8BAP8A/AIEAAH//gEA//8FAP4A/wP/AgECAAAABv38//8DA/8A/QL+AwIKAAgA+gQCAgMDAwQBAfwAAAD//v0C/v4C/Pj9AQABAQIDBAAAAAECAwH//wP+/P3+//4AAP72AP8CAAIAAP//A/4DAAD9Av8B/P4B/wL8A//+/QICAP4B/wIC/vwECwP+AAD9+f75AQT7APwAAPv9/P/+AQAEAv4CAgID/wH/AQD+Av4A//kAAAAA/wMCAwMEAQH/A/8AAwQCBQAB/QL//wAF//oA/wABAf4DAgL+/wIBAAD//wH+/f77/wL+/wID/PX9AgMDAf4B/v77BAMC/f//AAAAAf///P0C//8D/gADBAH+BAEAAAEB/wIB/v77/v7/+f4AAf0A///8/wMAAQL+AAAB//0EBAgBCAH/AAgAAAD/AAD/AAH/AgMCAQD/Agn+/QABAv0B/vz+/gMAAf75AAECCwIF//7/AgL+AgMB/wH//P3+Av79/wD+AAH+Af8CBQID/gECBwH/AAD///75AvwBAP8B/wIC/gD5AAEAAQD6/AcB//8AAAD/AfsD/v8B/wD6AAAB/v8B/P4AAAQBAgIAAAD///cA+wAAAwH+BAD///z/AgL/Av4A/wAB/wH/Af4E/AD8/wL+AP7/AQICAgUDAv4E/gEDAv37AwD/AQH7Awv9/AL8/gL/AwD//wEC+wIGAQH8AAAAAQH+AwL+BAH+/f/+AwIBAQEB/gABAf79Af0A/wAI/gP/AP4DAAEC/gAB/wEA/wT8Af7/Af38Agn9AP38/v0B/f8C/v4DB/8E/f78/fv4AQAB/gQBAv0AAAL+AQD++/sGA/0BAQAABQECBP3/AP/////+AAD9/gEA//8BAv8C/AH++QH9AwMGCgIKAAAEAAL/Avz7BQIAAgADBgD/AP8B//8BAf8D/QD/APz/+gH+Av0C/QEFAf/9/v8AAAACBP8AAf4G/v/////+APoC/AAA//4CAAD9AgAFAf8A/wEJ//0B/gQBAf4EAv39+vb+9QD//AECAv8CAf7/////Af3/9wEA/wH/Av8BAAABBvwB/gL+BQABAgQAAAABAAH/Av4D/P4B/wAA/vv+AwAA/wIC/AL8AAAAAQEG/QYB/AICAQH9+gIMAgEAAQID/vwCAAQC/wH+AwT//P8CAAT8AQECAv8DAAAA/wEAAv4AAP////oEAgMHBPv+BP77//oA/wIGAv0B/gABAgMAAP8BAv4AAAH+AAD+AwIGAf4AAQf7/v/9//0BAAD8+AEA/vv8AP4E///++gAAAv7+/QL+/wD/AP///v79+gEJAAABAAIDAgAAAQIC//j++P0CA/3/Af0FAAD/+f4DAf8C/f3+AAECAAAAAgUB/wH+BP/++gIA//r//f8B/wL/AwL9AAEAA/8CAf8C/AD/AAH/Av8AAAEBAgID/QQAAAEHAwAA+f8C///9/QEEAP/+/wD/AQAD/v/+AQAD+/4C/wAD/v4CAP8B//4C/QMBAP38/wEAAf3/Af////8BAAAB/wP+BPwBAf8B/vwA//8B/AcCBgAAAwP/A/8B//78/wP7/wH8/wADAP//AAUP/wP++/wJ/gEDDQD/AAH/AgEI/gIC/v4EAQMC/gACAAEC/QL7/gACAAIAAAABAAAAAAEA//wD/wH9Av///QIB/v4CAAED/gT6/wL/AQACAv0DCP8CAv39BQAABf//+wAAAAD68v8B/gMD+AAA//gAAP/9AwL++P8DAQIF/v78AAD9A/8A/wIAAQMCAQL8BAMCAQYAAAMLAgAB//8ABAL+AwQBAAAB//8A//8CAv/6AwP9+gIJ//j/AQIDA/sB//8AAQEBBAMFAAEE/QT/AgAC/vz//gIAAf79AAAB/QEB/v79BQABA/0B//8A/gP//vsDA/v8///5/wH+/QAAAv0EAf39AP///QMEAgAAAP4E/v0AAP78AAL8+AECBAD8//8BAAH9/v4A/P3++wL///79//4A/wIC/gL/AQECAwMJAf/9/v4BAf8BAP8A/wEB/wAA//8B/AIFAv4AAP4D/vj+AAICAAgB/wQBAAD++/7/BAIB/gAAAgL+AwL8AQD+/P3+Av4B/wEAAv0B/wQBAv/+AAAAAAAB//8BAP8BBf///v3//QH//wMC/wMBAAACAP4EAgD/BAAA/wL+/AEAAAAFAAABAAD8APz3AQn+/f0C/wACAPwA/wH+BP8HAf7/AgH+/wICAP4DAgL+AP4DAQH+/f//Af//Af8CAQYC/QIK//oBBgAA/f3/AQD/AP4B//4A+gkC/AECA/oAAAP8AP/+AAEBAAD/AgIAAf8DBP/2AAAAAQL/AQMA/wQIA/3+9wMD/wH/Av0F//8ECP7/AgEB/gAA/gMBCAIDAAAC/v/6AAD+9gAAAAABAQD+Af8AAAAB/vz/AgP4AAD//gEA/gMBCv0FAgABA/z/AP8AAP4E//oBAf4EAvz/AP78A/799v0BAAAAAAL9Af4C/QIF/fYA///+AgH//wL+/fr/BAH//gH/Av8B/wEBBgD7AAcB//4CBAL+AwAAAwYB/wMD/wD//wL9/fgD+/0C/f0C/QH+/AQC/P8B/gD9BfwIAf/+A///AgH/BQEA/AD/AQAAA/3++wH//gMAAP/+/gL/AAEAAPsBCAP/BAoDAwEA//v+AAD6Af8DAP77AwMCAv/3/wP7AAD//wECCgQC/wIC/QABAAACAAAAAwL/AQMEBfcC+/0GAv0A//sFAfsA/wH9AAD/Af//AQgAAQP+/wEAAP8CAf8A///+//j9Av31+wH/AAEAAf///gIE/QEAAP78/f//Af8BBf8BBQMCAPr+/P8CAQEB//4CAQIC/P/+A//9/AABAv0D+gIC/gQF+gMH/wICAQMKAgD+BAD5/gH+AAIA/QQFAQAAAf8AAAABBAD+AgH9AQABAgIF/QT+/AP+/gIA//8CAf8D/P79/f79/v8DAAAA/wAAAgIC/v79Agn9AgAAAf/+Av4EAAD+/gP+/wD++QIG//7//P8AA/7+AQH//gUBAwP9AP8A//4C/gIBAfsBAf4B//8A//7++wL9AgMAAAH//wL/AQIDAQD/AQH+Af//+QIFAf4ACPwAAAD9BQD3Av0DDf4DAwMB/f8CAAD8BAD//wH/+P4C//kA//0B/wEAAAcH/AACAf39AAED/wP//QIEAgIHAggCCP4AAgMAAP3+AAYBAAH+Af7+/f//AQAB//4D/Qb+/AAAAfkD/gAABQb+AP4D+vUC/v/7AQAB/gEGA/v+AwQB/gQB//4DAQIEAAL9Af/59wL9//8DAwID/AQBAgH9+wL/+QD4AfsAAP/+AAEDAwD//wAB/wACAAAAAf8AAQgB/gP6/gEB//3/AQP/Af71AAADAwL9AQD/AP4C/gL/+v4DAAH9/QH9AAEC/f/+/f8AAAAAA/0BAP4B/f4AAAH//P//AQP5AgL///z/BAsAAAH+//39/QEAAQL/Af0G/wEBAP/4/gQAAAP/AQECAP78/wH/AQH+//sBAf4AAwID/gQIAgME/wP9Af8AAf8BAAABAQAAAAH9Bf4C/gEDAgMB/v4DA/8EA/8B//7+/gMDBv30AQH/AQAABAL9BAD/A/sC+/8BAQABBwQB/wEBBAED/wABAQL+Af4CBf4DAAACAP3+/gH+9/79AAL8AwAA/wAEAf4EBQ7+AgD/AvwC/QMA/f0AAQD//voE+wILAQEBAAL9//cBAf7+Af/9Av8DA/z//wEG/wEDAwEDAPoA+wAB/vv9/f4C/QMBAgIF/P8B/f////8ECwL//gH/Afz/AAEBCQABAAEA/vvyAv0BBwME/gQAAQH/AP/+AwEA///79v0B/wD+AwECAQL/Af0GAwYA/f4D/gT+/AL+AAD+/P//AAAB/v8CAgAC/QT//QD7AP8CAf8AAP8C//f+AQAAAf8D/wQE/PwAAP78Av79Av4EAPr/AgL8/f8DDP8DBAH/AAAAAv4EAgEGAAD//v79AgAD+v36/P8JDgL8Agb7Cf/7Agv+A/4BAQEAAAAA/wH9/gMFAf8EAwAA/gIB/gD//wEAAQID//4B/AT8Av0A/wIDA/8D/P4A/vsCBQL//fT9/AEIAwP+AwAA/v3/+f8CAgP+BP/+AQgC/QH/+e4AAQD5A/r/AAD6AP//AP//Av///wIA/gX++gQCAP4BCv8DAAD9AAH+AAD7AwAAAP7//wIEAgT//gEDAP8CAAH+/f3//wAABAH99P78/wH+A/4C/wEB/vwAAP8AAP/4AAAB/wAB/wD+AAQAAAAA/wL+Av4CA/0C/wEBBAL7AgD//AIHAP4D+v4D/wEAAAP+AvwCAv3+AQH8/v/9AAD//QAA////AQH+AAABAQACAQEBAQT9AwQC/QH/A/4EAQL9AQL/Af8BAP/+AgH/AgX8AAAA+wECA/4D/wcAAP4DAP7/Af0B//779f75AQIC/QAAAf///wL/AAEBAAAAAQD//wEKAQMAAAAAAAD+AwIE/gH//f0C/////wACAAAAAf///v39Bv//Af8CAAMCAf4CBAD7Av4BAAP7//4EB/35/wMD/PwAAf8EAQIFAAAB/wEE/Qb+BQIDAAAAAP3/AP///wD/AQr+9fz+AgMCAwH/Af4AAAH+/v8B/gEG/wL/9wEBAP8AAAD/Avv/Af8B/wD+/QMB//3/AAD//wACBf0C/fcB/gL7/QQB/v4EAAD+/AMHAAD5BQT7Bfn+/QEF/AQDAgEGAQEB//v9AAD/AgEJ/f4EDf8DAP8CAwH/AgD8/wAA/wH9Av8BAAECAwEAAAABAAEA/gMACf0C/gH+AgAB/vsAAP4D/wMB/wP9Af8EBf/+AAD9+f0FBfcAAAAA/QQA/AP8/vwB/gIM/wIF+gAAAvz99QIA/PMDAv79/f79BQMMAvwB/gIAAv4B//8A/v4A//8CAP/9AgL9//YA/wEAAf8A//8BAv0E/QT+/wEBAQ=="
     },
     "wganEasy": {
         "targetMean": [4, 4],
@@ -52,4 +52,14 @@ export const optimizers = {
         "mean":[[0.91, 0.81], [4.39, 4.72], [5.29, 5.3], [3.59, 3.59], [3.62, 3.72], [4.29, 4.35], [3.54, 3.76], [3.78, 3.8], [3.94, 3.98], [3.98, 4.01], [4.11, 4.09], [4.07, 4.04], [4.08, 4.14], [4.09, 4.12], [4.1, 4.07], [3.94, 3.91], [3.95, 4.03], [3.85, 3.82], [3.97, 3.96], [3.94, 3.94], [4.04, 4.01], [4.06, 4.01], [3.94, 3.92], [3.91, 3.92], [3.97, 3.91], [4.09, 4.05], [4.04, 3.97], [3.96, 3.94], [3.96, 3.93], [4.02, 4.02], [3.95, 3.97], [4.03, 4.05], [4.03, 4.01], [3.87, 3.89], [3.98, 3.97], [3.93, 3.91], [3.96, 3.97], [4.03, 4.02], [3.95, 3.96], [3.97, 3.96], [3.97, 3.97], [3.99, 4.0], [3.97, 3.97], [3.99, 3.96], [3.96, 3.96], [3.99, 3.96], [3.97, 3.97], [3.96, 3.96], [3.97, 3.98], [3.98, 3.99], [3.96, 4.01], [3.97, 4.0], [3.96, 4.01], [3.99, 4.0], [3.97, 3.99], [3.94, 3.97], [3.97, 3.97], [3.96, 3.96], [3.98, 3.95], [3.98, 4.01], [3.97, 3.98], [3.97, 3.98], [3.95, 3.99], [3.95, 3.96], [3.98, 3.97], [3.96, 3.98], [3.96, 4.0], [3.95, 3.98], [3.96, 3.98], [3.95, 3.99], [3.97, 3.99], [3.95, 3.97], [3.99, 3.96], [3.96, 3.99], [3.99, 3.97], [3.97, 3.97], [3.95, 3.97], [3.97, 3.97], [3.98, 3.96], [3.97, 3.98], [3.98, 3.96], [3.98, 3.96], [3.97, 3.96], [3.97, 3.97], [3.96, 3.97], [3.97, 3.97], [3.96, 3.97], [3.98, 3.97], [3.95, 3.98], [3.97, 3.97], [3.98, 3.97], [3.95, 3.99], [3.98, 3.97], [3.97, 3.98], [3.97, 3.97], [3.97, 3.96], [3.97, 3.98], [3.96, 3.98], [3.99, 3.97], [3.96, 4.0], [3.96, 3.98], [3.98, 3.96], [3.96, 3.97], [3.98, 3.96], [3.99, 3.95], [3.98, 3.98], [3.97, 3.98], [3.97, 3.99], [3.97, 3.97], [3.97, 3.97], [3.96, 3.98], [3.98, 3.99], [3.97, 3.98], [3.97, 3.97], [3.99, 3.97], [3.97, 3.97], [3.96, 3.99], [3.98, 3.99], [3.96, 3.99], [3.96, 3.97], [3.97, 3.96], [3.97, 3.97], [3.97, 3.97], [3.97, 3.98], [3.97, 3.98], [3.97, 3.97], [3.98, 3.97], [3.98, 3.97], [3.99, 3.97], [3.97, 3.98], [3.97, 3.96], [3.97, 3.98], [3.98, 3.98], [3.98, 3.96], [3.96, 3.98], [3.97, 3.97], [3.96, 3.99], [3.99, 3.96], [3.97, 3.98], [3.97, 3.96], [3.97, 3.97], [3.96, 3.98], [3.96, 3.98], [3.99, 3.97], [3.97, 3.98], [3.97, 3.98], [3.97, 3.97], [3.97, 3.96], [3.98, 3.96], [3.98, 3.96], [3.98, 3.97], [3.98, 3.97], [3.96, 3.99], [3.97, 3.97], [3.96, 3.98], [3.96, 3.99], [3.95, 4.0], [3.98, 3.97], [3.96, 4.0], [3.97, 3.99], [3.96, 3.98], [3.96, 4.0], [3.97, 3.97], [3.97, 3.97], [3.98, 3.96], [3.96, 3.99], [3.96, 3.98], [3.97, 4.0], [3.98, 3.98], [3.96, 3.99], [3.96, 3.97], [3.97, 3.98], [3.96, 3.99], [3.96, 3.97], [3.97, 3.98], [3.96, 3.98], [3.97, 3.98], [3.97, 3.99], [3.98, 3.97], [3.95, 3.99], [3.98, 3.97], [3.96, 3.98], [3.98, 3.97], [3.95, 3.99], [3.95, 3.99], [4.0, 3.97], [3.98, 3.98], [3.98, 3.96], [3.98, 3.97], [3.97, 3.98], [3.98, 3.97], [3.96, 3.99], [3.97, 3.99], [3.95, 4.0], [3.96, 3.98], [3.97, 3.99], [3.98, 3.97], [3.97, 3.99], [3.99, 3.97], [3.97, 3.98]],
         "cov":[[[0.07, 0.06], [0.06, 0.05]], [[1.76, 1.28], [1.28, 2.88]], [[1.39, 0.5], [0.5, 1.71]], [[0.83, -0.03], [-0.03, 0.7]], [[0.74, -0.06], [-0.06, 0.65]], [[0.72, -0.18], [-0.18, 0.73]], [[0.57, -0.29], [-0.29, 0.56]], [[0.57, -0.28], [-0.28, 0.52]], [[0.58, -0.3], [-0.3, 0.49]], [[0.47, -0.32], [-0.32, 0.52]], [[0.46, -0.31], [-0.31, 0.46]], [[0.48, -0.3], [-0.3, 0.49]], [[0.48, -0.29], [-0.29, 0.5]], [[0.54, -0.3], [-0.3, 0.52]], [[0.54, -0.3], [-0.3, 0.55]], [[0.58, -0.29], [-0.29, 0.48]], [[0.46, -0.32], [-0.32, 0.5]], [[0.45, -0.3], [-0.3, 0.48]], [[0.46, -0.32], [-0.32, 0.56]], [[0.45, -0.31], [-0.31, 0.48]], [[0.48, -0.31], [-0.31, 0.5]], [[0.5, -0.33], [-0.33, 0.52]], [[0.48, -0.33], [-0.33, 0.51]], [[0.49, -0.31], [-0.31, 0.53]], [[0.48, -0.32], [-0.32, 0.59]], [[0.47, -0.32], [-0.32, 0.55]], [[0.42, -0.32], [-0.32, 0.57]], [[0.48, -0.33], [-0.33, 0.51]], [[0.55, -0.34], [-0.34, 0.49]], [[0.56, -0.31], [-0.31, 0.45]], [[0.54, -0.31], [-0.31, 0.5]], [[0.53, -0.31], [-0.31, 0.52]], [[0.49, -0.32], [-0.32, 0.53]], [[0.52, -0.33], [-0.33, 0.48]], [[0.52, -0.33], [-0.33, 0.51]], [[0.52, -0.32], [-0.32, 0.49]], [[0.53, -0.3], [-0.3, 0.49]], [[0.56, -0.33], [-0.33, 0.51]], [[0.52, -0.31], [-0.31, 0.5]], [[0.52, -0.31], [-0.31, 0.49]], [[0.53, -0.33], [-0.33, 0.54]], [[0.52, -0.31], [-0.31, 0.5]], [[0.53, -0.31], [-0.31, 0.5]], [[0.53, -0.31], [-0.31, 0.51]], [[0.52, -0.31], [-0.31, 0.5]], [[0.54, -0.32], [-0.32, 0.51]], [[0.53, -0.32], [-0.32, 0.49]], [[0.55, -0.33], [-0.33, 0.49]], [[0.57, -0.31], [-0.31, 0.49]], [[0.56, -0.32], [-0.32, 0.48]], [[0.56, -0.33], [-0.33, 0.5]], [[0.57, -0.31], [-0.31, 0.47]], [[0.55, -0.32], [-0.32, 0.5]], [[0.53, -0.32], [-0.32, 0.5]], [[0.54, -0.31], [-0.31, 0.51]], [[0.52, -0.32], [-0.32, 0.51]], [[0.51, -0.3], [-0.3, 0.5]], [[0.52, -0.32], [-0.32, 0.51]], [[0.52, -0.3], [-0.3, 0.49]], [[0.52, -0.31], [-0.31, 0.51]], [[0.52, -0.3], [-0.3, 0.49]], [[0.51, -0.3], [-0.3, 0.52]], [[0.51, -0.31], [-0.31, 0.53]], [[0.49, -0.29], [-0.29, 0.5]], [[0.51, -0.31], [-0.31, 0.53]], [[0.5, -0.29], [-0.29, 0.5]], [[0.52, -0.31], [-0.31, 0.52]], [[0.51, -0.31], [-0.31, 0.51]], [[0.5, -0.3], [-0.3, 0.5]], [[0.51, -0.31], [-0.31, 0.52]], [[0.5, -0.3], [-0.3, 0.51]], [[0.49, -0.3], [-0.3, 0.48]], [[0.49, -0.29], [-0.29, 0.5]], [[0.52, -0.32], [-0.32, 0.52]], [[0.52, -0.31], [-0.31, 0.51]], [[0.52, -0.31], [-0.31, 0.5]], [[0.52, -0.32], [-0.32, 0.51]], [[0.51, -0.31], [-0.31, 0.51]], [[0.52, -0.3], [-0.3, 0.51]], [[0.53, -0.3], [-0.3, 0.5]], [[0.51, -0.3], [-0.3, 0.5]], [[0.5, -0.31], [-0.31, 0.5]], [[0.52, -0.32], [-0.32, 0.51]], [[0.53, -0.33], [-0.33, 0.52]], [[0.52, -0.3], [-0.3, 0.52]], [[0.53, -0.31], [-0.31, 0.5]], [[0.51, -0.31], [-0.31, 0.51]], [[0.53, -0.33], [-0.33, 0.53]], [[0.52, -0.31], [-0.31, 0.52]], [[0.49, -0.3], [-0.3, 0.5]], [[0.52, -0.31], [-0.31, 0.52]], [[0.51, -0.3], [-0.3, 0.5]], [[0.5, -0.3], [-0.3, 0.5]], [[0.53, -0.31], [-0.31, 0.51]], [[0.51, -0.3], [-0.3, 0.5]], [[0.53, -0.32], [-0.32, 0.53]], [[0.52, -0.3], [-0.3, 0.52]], [[0.51, -0.32], [-0.32, 0.52]], [[0.51, -0.3], [-0.3, 0.5]], [[0.52, -0.3], [-0.3, 0.5]], [[0.51, -0.3], [-0.3, 0.49]], [[0.51, -0.31], [-0.31, 0.51]], [[0.49, -0.31], [-0.31, 0.52]], [[0.51, -0.31], [-0.31, 0.51]], [[0.5, -0.31], [-0.31, 0.51]], [[0.51, -0.29], [-0.29, 0.5]], [[0.53, -0.32], [-0.32, 0.53]], [[0.51, -0.3], [-0.3, 0.5]], [[0.51, -0.3], [-0.3, 0.5]], [[0.53, -0.32], [-0.32, 0.52]], [[0.51, -0.31], [-0.31, 0.51]], [[0.49, -0.29], [-0.29, 0.51]], [[0.51, -0.29], [-0.29, 0.49]], [[0.51, -0.32], [-0.32, 0.51]], [[0.52, -0.32], [-0.32, 0.53]], [[0.51, -0.32], [-0.32, 0.52]], [[0.52, -0.31], [-0.31, 0.51]], [[0.53, -0.3], [-0.3, 0.52]], [[0.51, -0.31], [-0.31, 0.54]], [[0.53, -0.33], [-0.33, 0.52]], [[0.53, -0.32], [-0.32, 0.51]], [[0.51, -0.31], [-0.31, 0.52]], [[0.52, -0.31], [-0.31, 0.51]], [[0.52, -0.3], [-0.3, 0.5]], [[0.51, -0.31], [-0.31, 0.5]], [[0.49, -0.29], [-0.29, 0.5]], [[0.51, -0.31], [-0.31, 0.51]], [[0.52, -0.32], [-0.32, 0.52]], [[0.53, -0.3], [-0.3, 0.5]], [[0.51, -0.3], [-0.3, 0.49]], [[0.5, -0.3], [-0.3, 0.5]], [[0.51, -0.3], [-0.3, 0.5]], [[0.52, -0.31], [-0.31, 0.52]], [[0.5, -0.29], [-0.29, 0.49]], [[0.51, -0.31], [-0.31, 0.52]], [[0.52, -0.32], [-0.32, 0.52]], [[0.51, -0.31], [-0.31, 0.5]], [[0.51, -0.31], [-0.31, 0.52]], [[0.5, -0.3], [-0.3, 0.52]], [[0.52, -0.31], [-0.31, 0.51]], [[0.51, -0.31], [-0.31, 0.52]], [[0.5, -0.3], [-0.3, 0.5]], [[0.53, -0.31], [-0.31, 0.52]], [[0.5, -0.3], [-0.3, 0.5]], [[0.5, -0.29], [-0.29, 0.5]], [[0.5, -0.31], [-0.31, 0.53]], [[0.51, -0.3], [-0.3, 0.5]], [[0.51, -0.3], [-0.3, 0.51]], [[0.52, -0.31], [-0.31, 0.51]], [[0.51, -0.31], [-0.31, 0.51]], [[0.51, -0.3], [-0.3, 0.5]], [[0.5, -0.3], [-0.3, 0.51]], [[0.52, -0.31], [-0.31, 0.53]], [[0.5, -0.3], [-0.3, 0.51]], [[0.52, -0.31], [-0.31, 0.5]], [[0.5, -0.3], [-0.3, 0.51]], [[0.52, -0.31], [-0.31, 0.52]], [[0.51, -0.31], [-0.31, 0.5]], [[0.51, -0.3], [-0.3, 0.51]], [[0.51, -0.3], [-0.3, 0.51]], [[0.53, -0.31], [-0.31, 0.53]], [[0.5, -0.3], [-0.3, 0.5]], [[0.49, -0.3], [-0.3, 0.5]], [[0.53, -0.32], [-0.32, 0.53]], [[0.5, -0.3], [-0.3, 0.51]], [[0.51, -0.3], [-0.3, 0.52]], [[0.51, -0.32], [-0.32, 0.52]], [[0.53, -0.31], [-0.31, 0.52]], [[0.51, -0.29], [-0.29, 0.5]], [[0.51, -0.3], [-0.3, 0.51]], [[0.51, -0.3], [-0.3, 0.51]], [[0.53, -0.32], [-0.32, 0.52]], [[0.53, -0.32], [-0.32, 0.53]], [[0.5, -0.3], [-0.3, 0.51]], [[0.51, -0.3], [-0.3, 0.51]], [[0.51, -0.31], [-0.31, 0.5]], [[0.51, -0.31], [-0.31, 0.52]], [[0.52, -0.31], [-0.31, 0.52]], [[0.51, -0.31], [-0.31, 0.5]], [[0.49, -0.3], [-0.3, 0.52]], [[0.52, -0.31], [-0.31, 0.51]], [[0.51, -0.31], [-0.31, 0.52]], [[0.53, -0.31], [-0.31, 0.53]], [[0.51, -0.31], [-0.31, 0.51]], [[0.5, -0.3], [-0.3, 0.5]], [[0.51, -0.3], [-0.3, 0.51]], [[0.52, -0.3], [-0.3, 0.51]], [[0.53, -0.33], [-0.33, 0.52]], [[0.51, -0.31], [-0.31, 0.52]], [[0.52, -0.31], [-0.31, 0.51]], [[0.5, -0.3], [-0.3, 0.5]], [[0.49, -0.29], [-0.29, 0.52]], [[0.5, -0.3], [-0.3, 0.51]], [[0.5, -0.3], [-0.3, 0.51]], [[0.53, -0.32], [-0.32, 0.52]], [[0.51, -0.31], [-0.31, 0.52]], [[0.51, -0.31], [-0.31, 0.52]], [[0.52, -0.32], [-0.32, 0.52]], [[0.52, -0.31], [-0.31, 0.51]], [[0.52, -0.31], [-0.31, 0.51]]],
     }
+}
+
+export const divergenceTables = {
+    "names": ["chisqr1.leftHistBins", "chisqr1.rightHistBins", "chisqr2.leftHistBins", "chisqr2.centerHistBins", "chisqr2.rightHistBins", "entropyExs.highEntropy", "entropyExs.medEntropy", "entropyExs.lowEntropy", "xEntropyExs.q", "simpleHist.hist"],
+    "entropy": [2.7201, 2.7569, 2.6095, 2.7826, 2.971, 2.9878, 2.6894, 2.4037, 2.7767, 0.9457],
+    "cross_entropy": [[2.7201, 2.7845, Infinity, 3.4226, 3.0826, 3.0023, 2.7953, 3.5521, 3.3293, Infinity], [2.8234, 2.7569, Infinity, 3.2672, 3.0051, 2.9771, 2.8379, 3.5734, 3.4058, Infinity], [3.3244, 3.0341, 2.6095, 2.9965, 2.9395, 3.0037, 3.1595, 3.5914, 3.255, Infinity], [3.5915, 3.399, Infinity, 2.7826, 2.8918, 3.03, 3.5472, 3.6422, 3.3598, Infinity], [3.3632, 3.2565, Infinity, 3.0807, 2.971, 3.0117, 3.3555, 3.5266, 3.2837, Infinity], [3.286, 3.2365, Infinity, 3.2397, 3.0294, 2.9878, 3.3518, 3.3755, 3.2408, Infinity], [2.7741, 2.7659, Infinity, 3.3508, 3.0294, 3.0265, 2.6894, 3.6068, 3.1991, Infinity], [3.3759, 3.407, Infinity, 3.5941, 3.1548, 2.8783, 3.5492, 2.4037, 2.6606, Infinity], [3.3019, 3.2939, Infinity, 3.3697, 3.0744, 2.9878, 3.2823, 3.0515, 2.7767, Infinity], [4.4594, 4.2213, 2.9732, 3.3602, 3.1092, 3.1155, 4.4437, 3.8074, 3.4877, 0.9457]],
+    "kl": [[0.0, 0.0643, Infinity, 0.7024, 0.3625, 0.2822, 0.0751, 0.832, 0.6092, Infinity], [0.0665, 0.0, Infinity, 0.5103, 0.2482, 0.2203, 0.0811, 0.8165, 0.6489, Infinity], [0.7149, 0.4246, 0.0, 0.387, 0.33, 0.3942, 0.55, 0.9819, 0.6455, Infinity], [0.8089, 0.6164, Infinity, 0.0, 0.1092, 0.2474, 0.7646, 0.8596, 0.5772, Infinity], [0.3922, 0.2856, Infinity, 0.1097, 0.0, 0.0408, 0.3846, 0.5557, 0.3127, Infinity], [0.2982, 0.2487, Infinity, 0.2519, 0.0417, 0.0, 0.364, 0.3877, 0.253, Infinity], [0.0847, 0.0765, Infinity, 0.6614, 0.3401, 0.3371, 0.0, 0.9174, 0.5097, Infinity], [0.9722, 1.0033, Infinity, 1.1904, 0.7511, 0.4746, 1.1455, 0.0, 0.2569, Infinity], [0.5252, 0.5171, Infinity, 0.593, 0.2977, 0.211, 0.5056, 0.2748, 0.0, Infinity], [3.5138, 3.2757, 2.0275, 2.4145, 2.1636, 2.1698, 3.4981, 2.8617, 2.5421, 0.0]],
+    "jsd": [[0.0, 0.0162, 0.1527, 0.1723, 0.0903, 0.0705, 0.0198, 0.2074, 0.1333, 0.7766], [0.0162, 0.0, 0.0999, 0.1308, 0.0643, 0.0571, 0.0195, 0.2077, 0.1337, 0.732], [0.1527, 0.0999, 0.0, 0.129, 0.1006, 0.109, 0.1276, 0.2538, 0.1559, 0.4901], [0.1723, 0.1308, 0.129, 0.0, 0.0271, 0.0609, 0.1633, 0.2256, 0.1374, 0.5652], [0.0903, 0.0643, 0.1006, 0.0271, 0.0, 0.0103, 0.0866, 0.1513, 0.073, 0.5652], [0.0705, 0.0571, 0.109, 0.0609, 0.0103, 0.0, 0.0846, 0.1033, 0.0556, 0.5768], [0.0198, 0.0195, 0.1276, 0.1633, 0.0866, 0.0846, 0.0, 0.2325, 0.1198, 0.7592], [0.2074, 0.2077, 0.2538, 0.2256, 0.1513, 0.1033, 0.2325, 0.0, 0.0648, 0.6929], [0.1333, 0.1337, 0.1559, 0.1374, 0.073, 0.0556, 0.1198, 0.0648, 0.0, 0.6333], [0.7766, 0.732, 0.4901, 0.5652, 0.5652, 0.5768, 0.7592, 0.6929, 0.6333, 0.0]],
+    "chi_square": [[0.0, 1.95, Infinity, 21.5333, 13.5, 8.3333, 2.9286, 50.5714, 23.7048, Infinity], [2.75, 0.0, Infinity, 15.825, 10.5, 6.6667, 3.1071, 58.5714, 34.8548, Infinity], [54.5, 21.9667, 0.0, 8.0, 13.5, 13.5833, 25.3571, 84.5714, 30.3548, Infinity], [102.5, 69.9667, Infinity, 0.0, 18.8333, 18.9167, 73.3571, 132.5714, 46.3548, Infinity], [12.9167, 9.3833, Infinity, 7.6333, 0.0, 2.25, 12.6071, 22.5714, 9.8714, Infinity], [15.75, 12.2167, Infinity, 9.7, 3.8333, 0.0, 15.3214, 34.2857, 12.8357, Infinity], [6.5, 4.05, Infinity, 26.4083, 22.3333, 15.0, 0.0, 94.5714, 27.2048, Infinity], [22.5, 23.95, Infinity, 32.5333, 19.3333, 12.5, 27.7857, 0.0, 8.2833, Infinity], [24.75, 21.55, Infinity, 23.9083, 17.5, 7.1667, 21.3929, 32.0, 0.0, Infinity], [65.0, 59.0, 30.5, 38.5, 27.8333, 25.6667, 63.0, 57.0, 33.8333, 0.0]],
+    "w1": [[0.0, 0.3561, 0.8322, 1.385, 0.8182, 0.6818, 0.2468, 1.0455, 0.6119, 1.8636], [0.3561, 0.0, 0.5449, 1.0441, 0.6, 0.5833, 0.2143, 1.3333, 0.8718, 1.9621], [0.8322, 0.5449, 0.0, 0.7149, 0.3615, 0.7308, 0.7473, 1.6868, 1.1154, 1.8916], [1.385, 1.0441, 0.7149, 0.0, 0.7765, 1.2149, 1.2437, 2.2479, 1.6765, 2.4947], [0.8182, 0.6, 0.3615, 0.7765, 0.0, 0.4385, 0.8143, 1.5286, 0.9462, 1.8455], [0.6818, 0.5833, 0.7308, 1.2149, 0.4385, 0.0, 0.7143, 1.1209, 0.5385, 1.5455], [0.2468, 0.2143, 0.7473, 1.2437, 0.8143, 0.7143, 0.0, 1.2143, 0.7527, 2.0584], [1.0455, 1.3333, 1.6868, 2.2479, 1.5286, 1.1209, 1.2143, 0.0, 0.5824, 1.1558], [0.6119, 0.8718, 1.1154, 1.6765, 0.9462, 0.5385, 0.7527, 0.5824, 0.0, 1.4266], [1.8636, 1.9621, 1.8916, 2.4947, 1.8455, 1.5455, 2.0584, 1.1558, 1.4266, 0.0]]
 }
\ No newline at end of file
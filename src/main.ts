@@ -8,6 +8,7 @@ import matModel = require("./model/heatmap");
 import d3 = require("d3");
 import model = require("./model/model");
 import { Gaussian2D, Line2D } from "./model/gaussian";
+import { playbackFrames } from "./model/trajectory";
 import { SVGGaussian2D, SVGAnimatedGaussian, SVGAnimatedPoints } from "./view/gaussian";
 import { optimizers } from "./data";
 
@@ -91,7 +92,7 @@ export function main() {
 
     let mean = optimizers["wganManifold"]["targetMean"];
     let slope = optimizers["wganManifold"]["targetSlope"];
-    let points = optimizers["wganManifold"]["points"];
+    let points = playbackFrames(optimizers["wganManifold"]["pointsTrajectory"]);
     let target = new Line2D(slope, mean);
 
     let svgpts = new SVGAnimatedPoints("points", "#points", 20, points, target, [[-2, 4], [-2, 4]], conf);
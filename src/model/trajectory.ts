@@ -0,0 +1,154 @@
+/**
+ * Decoder for the binary point trajectories written by optimizers/trajectory.py. See that file for the layout.
+ * Trajectories are embedded in data.ts as base64 strings.
+ */
+
+const HEADER_SIZE = 32;
+const FLOAT16 = 0;
+const DELTA = 1;
+const HAS_ITERATIONS = 1;
+
+function intArray(buffer: ArrayBuffer, width: number, offset: number, length: number): Int8Array | Int16Array | Int32Array {
+    switch(width) {
+        case(1):
+            return new Int8Array(buffer, offset, length);
+        case(2):
+            return new Int16Array(buffer, offset, length);
+        case(4):
+            return new Int32Array(buffer, offset, length);
+    }
+    throw RangeError("Unsupported value width: " + width);
+}
+
+function halfToFloat(h: number): number {
+    let sign = (h & 0x8000) ? -1 : 1;
+    let exp = (h >> 10) & 0x1f;
+    let frac = h & 0x3ff;
+    if(exp == 0) {
+        return sign * Math.pow(2, -14) * (frac / 1024);
+    }
+    if(exp == 0x1f) {
+        return frac ? NaN : sign * Infinity;
+    }
+    return sign * Math.pow(2, exp - 15) * (1 + frac / 1024);
+}
+
+export function base64ToBuffer(data: string): ArrayBuffer {
+    let raw = atob(data);
+    let bytes = new Uint8Array(raw.length);
+    for(let i = 0; i < raw.length; i++) {
+        bytes[i] = raw.charCodeAt(i);
+    }
+    return bytes.buffer;
+}
+
+/**
+ * Decode a trajectory into an array of frames, each an array of points.
+ * @param data trajectory bytes, or a base64 string of them
+ */
+export function decodeTrajectory(data: ArrayBuffer | string): number[][][] {
+    let buffer = (typeof data === "string") ? base64ToBuffer(data) : data;
+    let view = new DataView(buffer);
+    let magic = String.fromCharCode(view.getUint8(0), view.getUint8(1), view.getUint8(2), view.getUint8(3));
+    if(magic != "PVTR") {
+        throw RangeError("Not a trajectory");
+    }
+    let encoding = view.getUint8(5);
+    let wFirst = view.getUint8(6);
+    let wDelta = view.getUint8(7);
+    let n = view.getUint32(8, true);
+    let points = view.getUint32(12, true);
+    let dims = view.getUint16(16, true);
+    let quantum = view.getFloat64(20, true);
+    if(n == 0) {
+        throw RangeError("Trajectory has no frames");
+    }
+
+    let size = points * dims;
+    let firstBytes = size * wFirst;
+    let restOffset = HEADER_SIZE + firstBytes + ((4 - firstBytes % 4) % 4);
+
+    let values = new Float64Array(n * size);
+    if(encoding == FLOAT16) {
+        let first = new Uint16Array(buffer, HEADER_SIZE, size);
+        let rest = new Uint16Array(buffer, restOffset, (n - 1) * size);
+        first.forEach((h, i) => values[i] = halfToFloat(h));
+        rest.forEach((h, i) => values[size + i] = halfToFloat(h));
+    }
+    else if(encoding == DELTA) {
+        let first = intArray(buffer, wFirst, HEADER_SIZE, size);
+        let deltas = intArray(buffer, wDelta, restOffset, (n - 1) * size);
+        let acc = Array.from(first);
+        acc.forEach((v, i) => values[i] = v * quantum);
+        for(let i = 0; i < deltas.length; i++) {
+            acc[i % size] += deltas[i];
+            values[size + i] = acc[i % size] * quantum;
+        }
+    }
+    else {
+        throw RangeError("Unsupported trajectory encoding: " + encoding);
+    }
+
+    let frames: number[][][] = [];
+    for(let f = 0; f < n; f++) {
+        let frame: number[][] = [];
+        for(let p = 0; p < points; p++) {
+            let start = (f * points + p) * dims;
+            frame.push(Array.from(values.subarray(start, start + dims)));
+        }
+        frames.push(frame);
+    }
+    return frames;
+}
+
+/**
+ * Training iteration of every frame, for trajectories of adaptively captured keyframes.
+ * @returns the iteration indices, or null when the trajectory has none
+ */
+export function decodeIterations(data: ArrayBuffer | string): number[] | null {
+    let buffer = (typeof data === "string") ? base64ToBuffer(data) : data;
+    let view = new DataView(buffer);
+    if(!(view.getUint16(18, true) & HAS_ITERATIONS)) {
+        return null;
+    }
+    let wFirst = view.getUint8(6);
+    let wDelta = view.getUint8(7);
+    let n = view.getUint32(8, true);
+    let size = view.getUint32(12, true) * view.getUint16(16, true);
+    let firstBytes = size * wFirst;
+    let restBytes = (n - 1) * size * wDelta;
+    let offset = HEADER_SIZE + firstBytes + ((4 - firstBytes % 4) % 4) + restBytes + ((4 - restBytes % 4) % 4);
+    let iterations: number[] = [];
+    for(let i = 0; i < n; i++) {
+        iterations.push(view.getUint32(offset + 4 * i, true));
+    }
+    return iterations;
+}
+
+/**
+ * Frames for playback at a constant rate. Keyframes captured at irregular iterations are linearly interpolated
+ * onto one frame every `step` iterations; trajectories without iteration indices are returned as they are.
+ * @param data trajectory bytes, or a base64 string of them
+ * @param step iterations between played frames
+ */
+export function playbackFrames(data: ArrayBuffer | string, step: number = 20): number[][][] {
+    let buffer = (typeof data === "string") ? base64ToBuffer(data) : data;
+    let frames = decodeTrajectory(buffer);
+    let iterations = decodeIterations(buffer);
+    if(iterations === null || frames.length < 2) {
+        return frames;
+    }
+    let out: number[][][] = [];
+    let k = 0;
+    let last = iterations[iterations.length - 1];
+    for(let it = iterations[0]; it <= last; it += step) {
+        while(iterations[k + 1] < it) {
+            k++;
+        }
+        // keyframes sharing an iteration play the later one
+        let span = iterations[k + 1] - iterations[k];
+        let t = span > 0 ? (it - iterations[k]) / span : 1;
+        out.push(frames[k].map((p, i) => p.map((v, d) => v + t * (frames[k + 1][i][d] - v))));
+    }
+    return out;
+}
@@ -0,0 +1,24 @@
+import { HeatMap } from "./heatmap";
+
+/**
+ * Client of the local transport plan service (python -m optimizers.serve), to preview the optimal plan of edited
+ * histograms while authoring. The published article only uses the plans precomputed into data.ts.
+ */
+
+export const PLAN_SERVICE_URL = "http://localhost:8765/plan";
+
+/**
+ * Resolve to the optimal plan from a to b, with rows for the bins of a. Both histograms need the same
+ * total mass, and the same length for the plan to be a HeatMap.
+ */
+export function fetchPlan(a: number[], b: number[], method: string = "exact", url: string = PLAN_SERVICE_URL): Promise<HeatMap> {
+    let request = {method: "POST", headers: {"Content-Type": "application/json"}, body: JSON.stringify({a: a, b: b, method: method})};
+    return fetch(url, request)
+        .then((response) => response.json())
+        .then((body) => {
+            if(body.error) {
+                throw Error(body.error);
+            }
+            return HeatMap.fromCSVStr(body.csv);
+        });
+}